@@ -0,0 +1,29 @@
+package migrations
+
+import (
+	"github.com/pocketbase/pocketbase/core"
+	m "github.com/pocketbase/pocketbase/migrations"
+)
+
+func init() {
+	m.Register(func(app core.App) error {
+		settings := app.Settings()
+
+		// the temporal workers write segments, chunks and topics through /api/batch
+		settings.Batch.Enabled = true
+		settings.Batch.MaxRequests = 200
+		settings.Batch.Timeout = 30
+		settings.Batch.MaxBodySize = 128 << 20
+
+		return app.Save(settings)
+	}, func(app core.App) error {
+		settings := app.Settings()
+
+		settings.Batch.Enabled = false
+		settings.Batch.MaxRequests = 50
+		settings.Batch.Timeout = 3
+		settings.Batch.MaxBodySize = 0
+
+		return app.Save(settings)
+	})
+}
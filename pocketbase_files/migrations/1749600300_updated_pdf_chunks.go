@@ -0,0 +1,45 @@
+package migrations
+
+import (
+	"encoding/json"
+
+	"github.com/pocketbase/pocketbase/core"
+	m "github.com/pocketbase/pocketbase/migrations"
+)
+
+func init() {
+	m.Register(func(app core.App) error {
+		collection, err := app.FindCollectionByNameOrId("pbc_1600805026")
+		if err != nil {
+			return err
+		}
+
+		// update collection data
+		if err := json.Unmarshal([]byte(`{
+			"indexes": [
+				"CREATE INDEX ` + "`" + `idx_34kNhYibOn` + "`" + ` ON ` + "`" + `pdf_chunks` + "`" + ` (` + "`" + `source_pdf` + "`" + `)",
+				"CREATE INDEX ` + "`" + `idx_Rq8mWc3TsA` + "`" + ` ON ` + "`" + `pdf_chunks` + "`" + ` (` + "`" + `segment` + "`" + `)"
+			]
+		}`), &collection); err != nil {
+			return err
+		}
+
+		return app.Save(collection)
+	}, func(app core.App) error {
+		collection, err := app.FindCollectionByNameOrId("pbc_1600805026")
+		if err != nil {
+			return err
+		}
+
+		// update collection data
+		if err := json.Unmarshal([]byte(`{
+			"indexes": [
+				"CREATE INDEX ` + "`" + `idx_34kNhYibOn` + "`" + ` ON ` + "`" + `pdf_chunks` + "`" + ` (` + "`" + `source_pdf` + "`" + `)"
+			]
+		}`), &collection); err != nil {
+			return err
+		}
+
+		return app.Save(collection)
+	})
+}
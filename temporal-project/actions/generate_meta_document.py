@@ -15,7 +15,7 @@ from database.vector_database_utils import (
 )
 
 from database.database_utils import (
-    get_record,
+    get_records_by_ids,
     get_first_matching_record
 )
 
@@ -92,16 +92,16 @@ async def map_from_context_topic(context_topic: list[VectorMetadata]) -> TopicSu
         raise Exception("got empty context topic")
 
     topic_summary = context_topic[0]['summary_text']
-    segments_checked = set()
-    segments = []
-    for c in context_topic:
-        segment_id = c['segment_id']
-        if segment_id not in segments_checked:
-            record: PdfSegmentsRecord = await get_record(PDF_SEGMENTS, segment_id)
-            segments.append(types.SegmentRaw(
-                segment_type=types.SegmentType(record['segment_type']), 
-                segment_text=record['segment_text']))
-            segments_checked.add(segment_id)
+
+    # One query for every segment the topic touches, in the order they appear
+    segment_ids = list(dict.fromkeys(c['segment_id'] for c in context_topic))
+    records: list[PdfSegmentsRecord] = await get_records_by_ids(PDF_SEGMENTS, segment_ids)
+    segments = [
+        types.SegmentRaw(
+            segment_type=types.SegmentType(record['segment_type']),
+            segment_text=record['segment_text'])
+        for record in records
+    ]
 
     return TopicSummaryWithSegments(topic_summary=topic_summary, segments=segments)
 
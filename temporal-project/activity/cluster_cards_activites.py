@@ -6,7 +6,7 @@ import numpy as np
 
 from database.database_utils import (
     get_all_records,
-    update_record
+    update_records
 )
 
 from database.vector_database_utils import (
@@ -30,7 +30,7 @@ BinVecWithId = tuple[np.typing.NDArray, str]
 async def card_to_binary_vector_with_record_id(card: FlashcardsStoreRecord) -> BinVecWithId:
     embed_str = f"{card['front']} - {card['back']}"
     embeds = await text_to_vec([embed_str], "CLUSTERING")
-    float_vec = np.array(embeds[0].values)
+    float_vec = np.array(embeds[0])
     bin_vec = (float_vec >= 0).astype(int)
 
     return (bin_vec, card['id'])
@@ -69,11 +69,11 @@ async def cluster_generated_cards(relatedIds: RelatedIds):
 
     record_ids: list[str] = list(map(lambda elem: elem[1], bin_vecs_with_ids))
 
-    cluster_update_handles = []
-    for record_id, cluster_label in zip(record_ids, labels):
-        handle = update_record(FLASHCARDS_STORE, record_id, {
-            'cluster_label': int(cluster_label)
-        })
-        cluster_update_handles.append(handle)
-    
-    await gather(*cluster_update_handles)
+    cluster_updates = [
+        (record_id, {'cluster_label': int(cluster_label)})
+        for record_id, cluster_label in zip(record_ids, labels)
+    ]
+
+    for result in await update_records(FLASHCARDS_STORE, cluster_updates):
+        if not result.ok:
+            activity.logger.error(f"Error updating cluster label - {cluster_updates[result.index]} - {result.body}")
@@ -6,9 +6,8 @@ from qdrant_client import models
 import uuid
 
 from database.database_utils import (
-    get_record,
     get_all_records,
-    get_first_matching_record
+    iter_records
 )
 
 from database.vector_database_utils import (
@@ -19,7 +18,7 @@ from database.vector_database_utils import (
 from database.database_models import (
     VECTORS_FOR_PB_DATA,
     VectorMetadata,
-    PDF_CHUNKS, PDF_SEGMENTS, PDF_TOPICS, JOB_REQUESTS,
+    PDF_CHUNKS, PDF_SEGMENTS, PDF_TOPICS,
     PdfChunksRecord, PdfSegmentsRecord, PdfTopicsRecord, JobRequestsRecord
 )
 
@@ -27,31 +26,43 @@ from utils import (
     save_json, read_json, remove_file
 )
 
+from bisect import bisect_right
+from dataclasses import dataclass
+
 
 # --- HELPFUL TYPES ---
 ChunkId = str
-ChunkIdsBatchFilePath = str
+SegmentId = str
+VectorMetadataBatchFilePath = str
 # 100 is the max the current embedding API can handle in one call
 MAX_BATCH_SIZE_FOR_EMBEDDING = 100 
 BATCH_SIZE = 250
 
 
+@dataclass
+class TopicIntervals:
+    """Topics sorted by start_indx, so the topic holding a segment is found with bisect."""
+    starts: list[int]
+    topics: list[PdfTopicsRecord]
+
+    @staticmethod
+    def from_topics(topics: list[PdfTopicsRecord]) -> 'TopicIntervals':
+        topics = sorted(topics, key=lambda t: t['start_indx'])
+        return TopicIntervals([t['start_indx'] for t in topics], topics)
+
+    def find(self, segment_index: int) -> PdfTopicsRecord | None:
+        # Neighbouring topics share their boundary segment, it belongs to the topic that starts there
+        position = bisect_right(self.starts, segment_index) - 1
+        if position < 0 or self.topics[position]['end_indx'] < segment_index:
+            return None
+        return self.topics[position]
+
+
 # --- Helper Functions ---
-async def prepare_vector_metadata_for_chunk(chunk_id: str) -> VectorMetadata:
-    chunk: PdfChunksRecord = await get_record(PDF_CHUNKS, chunk_id)
-    parent_segment: PdfSegmentsRecord = await get_record(PDF_SEGMENTS, chunk['segment'])
-    parent_topic: PdfTopicsRecord | None = await get_first_matching_record(PDF_TOPICS, options={
-        "filter": f"""
-        source_pdf='{chunk['source_pdf']}' && 
-        start_indx<={parent_segment['segment_index_in_document']} &&
-        end_indx>={parent_segment['segment_index_in_document']}
-        """
-    })
-
-    if parent_topic is None:
-        raise Exception(f"Failed to get parent topic for chunk - {chunk_id}")
-    
-    vec_metadata: VectorMetadata = {
+def build_vector_metadata(chunk: PdfChunksRecord,
+                          parent_segment: PdfSegmentsRecord,
+                          parent_topic: PdfTopicsRecord) -> VectorMetadata:
+    return {
         "source_pdf": chunk['source_pdf'],
         "chunk_id": chunk['id'],
         "segment_id": parent_segment['id'],
@@ -64,19 +75,26 @@ async def prepare_vector_metadata_for_chunk(chunk_id: str) -> VectorMetadata:
         "segment_type": parent_segment['segment_type']
     }
 
-    return vec_metadata
 
+async def load_segments_and_topics(source_pdf_id: str) -> tuple[dict[SegmentId, PdfSegmentsRecord], TopicIntervals]:
+    segments, topics = await asyncio.gather(
+        get_all_records(PDF_SEGMENTS, options={
+            "filter": f"source_pdf='{source_pdf_id}'",
+            "fields": "id,segment_index_in_document,segment_type"
+        }),
+        get_all_records(PDF_TOPICS, options={
+            "filter": f"source_pdf='{source_pdf_id}'",
+            "fields": "id,topic_number,start_indx,end_indx,context_summary",
+            "sort": "start_indx"
+        })
+    )
 
-async def construct_context_vector_and_save(chunk_ids: list[ChunkId]):
-    activity.logger.info(f"Starting vector creation and save for chunk batch - {chunk_ids[0]}")
+    segments_by_id: dict[SegmentId, PdfSegmentsRecord] = {segment['id']: segment for segment in segments}
+    return segments_by_id, TopicIntervals.from_topics(topics)
 
-    # Create the vector metadata for each chunk
-    vector_metadata_generate_handles = []
-    for chunk_id in chunk_ids:
-        handle = prepare_vector_metadata_for_chunk(chunk_id)
-        vector_metadata_generate_handles.append(handle)
-    
-    vector_metadata_lst: list[VectorMetadata] = await asyncio.tasks.gather(*vector_metadata_generate_handles)
+
+async def construct_context_vector_and_save(vector_metadata_lst: list[VectorMetadata]):
+    activity.logger.info(f"Starting vector creation and save for chunk batch - {vector_metadata_lst[0]['chunk_id']}")
 
     text_lst = []
     for metadata_elem in vector_metadata_lst:
@@ -86,14 +104,14 @@ async def construct_context_vector_and_save(chunk_ids: list[ChunkId]):
 
     if embeddings is None:
         raise Exception(
-            f"Failed to generate vector for chunk & topic - {chunk_ids[0]}")
+            f"Failed to generate vector for chunk & topic - {vector_metadata_lst[0]['chunk_id']}")
 
     # Pair together vector and metadata
     points = []
     for vec, vec_metadata in zip(embeddings, vector_metadata_lst):
         point = models.PointStruct(
             id=str(uuid.uuid4()), 
-            vector=vec.values, # type: ignore
+            vector=vec,
             payload=vec_metadata # type: ignore
         )
         points.append(point)
@@ -107,41 +125,61 @@ async def construct_context_vector_and_save(chunk_ids: list[ChunkId]):
     )
 
     if operation.status != 'completed':
-        raise Exception(f'Failed to save vector to DB - {chunk_id}')
+        raise Exception(f"Failed to save vector to DB - {vector_metadata_lst[0]['chunk_id']}")
 
 
 # --- Activites ---
 @activity.defn
-async def fetch_chunk_ids_and_save_batch(job_record: JobRequestsRecord) -> list[ChunkIdsBatchFilePath]:
+async def fetch_chunk_ids_and_save_batch(job_record: JobRequestsRecord) -> list[VectorMetadataBatchFilePath]:
     source_pdf_id = job_record['source_pdf']
-    chunks: list[PdfChunksRecord] = await get_all_records(PDF_CHUNKS, options={
-        "filter": f"source_pdf='{source_pdf_id}'",
-        "fields": "id"
-    })
-
-    batch_file_paths: list[ChunkIdsBatchFilePath] = []
+    batch_file_paths: list[VectorMetadataBatchFilePath] = []
     base_job_temp_dir = f"/tmp/{job_record['id']}"
     await asyncio.to_thread(os.makedirs, base_job_temp_dir, exist_ok=True)
 
-    for idx in range(0, len(chunks), BATCH_SIZE):
-        current_batch: list[ChunkId] = [chunk['id'] 
-                                        for chunk in chunks[idx:idx+BATCH_SIZE]]
+    # Segments and topics for the whole PDF are loaded once and joined with the chunks in memory
+    segments_by_id, topic_intervals = await load_segments_and_topics(source_pdf_id)
+
+    async def save_batch(idx: int, current_batch: list[VectorMetadata]):
         filename_suffix = f"vector_chunk_{idx}_{idx + BATCH_SIZE}.json"
         tmp_file_path = os.path.join(base_job_temp_dir, filename_suffix)
         await asyncio.to_thread(save_json, tmp_file_path, current_batch)
         batch_file_paths.append(tmp_file_path)
-    
+
+    # Write each batch as soon as it is filled instead of holding every chunk in memory
+    idx = 0
+    current_batch: list[VectorMetadata] = []
+    async for chunk in iter_records(PDF_CHUNKS, options={
+        "filter": f"source_pdf='{source_pdf_id}'",
+        "fields": "id,segment,source_pdf,chunk_index_in_segment,chunk_text"
+    }, keyset_field="id"):
+        parent_segment = segments_by_id.get(chunk['segment'])
+        if parent_segment is None:
+            raise Exception(f"Failed to get parent segment for chunk - {chunk['id']}")
+
+        parent_topic = topic_intervals.find(parent_segment['segment_index_in_document'])
+        if parent_topic is None:
+            raise Exception(f"Failed to get parent topic for chunk - {chunk['id']}")
+
+        current_batch.append(build_vector_metadata(chunk, parent_segment, parent_topic))
+        if len(current_batch) == BATCH_SIZE:
+            await save_batch(idx, current_batch)
+            idx += BATCH_SIZE
+            current_batch = []
+
+    if len(current_batch) != 0:
+        await save_batch(idx, current_batch)
+
     return batch_file_paths
 
 
 @activity.defn
-async def process_chunk_batch(chunk_ids_batch_path: ChunkIdsBatchFilePath):
-    chunk_ids: list[ChunkId] = await asyncio.to_thread(read_json, chunk_ids_batch_path)
+async def process_chunk_batch(vector_metadata_batch_path: VectorMetadataBatchFilePath):
+    vector_metadata_lst: list[VectorMetadata] = await asyncio.to_thread(read_json, vector_metadata_batch_path)
     
     context_vector_batch_handles = []
-    for idx in range(0, len(chunk_ids), MAX_BATCH_SIZE_FOR_EMBEDDING):
-        current_batch_of_chunk_ids = chunk_ids[idx: idx + MAX_BATCH_SIZE_FOR_EMBEDDING]
-        handle = construct_context_vector_and_save(current_batch_of_chunk_ids)
+    for idx in range(0, len(vector_metadata_lst), MAX_BATCH_SIZE_FOR_EMBEDDING):
+        current_batch = vector_metadata_lst[idx: idx + MAX_BATCH_SIZE_FOR_EMBEDDING]
+        handle = construct_context_vector_and_save(current_batch)
         context_vector_batch_handles.append(handle)
 
     await gather(*context_vector_batch_handles)
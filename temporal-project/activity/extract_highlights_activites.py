@@ -10,13 +10,13 @@ from database.database_models import (
 
 from database.database_utils import (
     get_record, 
-    construct_file_url, 
-    download_file,
-    save_record,
+    update_record,
+    save_records,
     get_all_records,
     get_first_matching_record,
-    delete_record
+    delete_records
 )
+from database.file_cache import fetch_pdf, use_pdf
 
 # --- Helpful Types ---
 UserPdfId = str
@@ -35,33 +35,31 @@ class ExtractedHighlight:
 
 
 
+# --- Helpful Functions ---
+async def fingerprint_pdf(record: UserPdfRecord) -> str:
+    """Hashes the PDF on its first download and stores the hash on the record. The file stays cached for extraction."""
+    pdf_file = await fetch_pdf(record)
+    await update_record(USER_PDFS, record['id'], {'content_sha256': pdf_file.sha256})
+    return pdf_file.sha256
+
+
 # --- Activites ---
 @activity.defn
 async def check_if_pdf_already_processed(pdf_record_id: str) -> UserPdfId | None:
     user_pdf_record: UserPdfRecord = await get_record(USER_PDFS, pdf_record_id)
-    file_name_when_uploaded = user_pdf_record['original_filename']
+    content_sha256 = user_pdf_record.get('content_sha256') or await fingerprint_pdf(user_pdf_record)
 
-    matching_records: list[UserPdfRecord] = await get_all_records(USER_PDFS, options={
-        'filter': f"original_filename='{file_name_when_uploaded}'"
+    # One indexed lookup - a different upload of the same bytes that already had cards generated for it
+    finished_job: JobRequestsRecord | None = await get_first_matching_record(JOB_REQUESTS, options={
+        'filter': f"source_pdf.content_sha256='{content_sha256}' && source_pdf!='{pdf_record_id}' && status='Finished'",
+        'fields': 'source_pdf'
     })
 
-    # We didn't find any other pdfs with the same name
-    if len(matching_records) == 0:
+    if finished_job is None:
         return None
-    
-    matched_record_ids = [r['id'] for r in matching_records]
-    for record_id in matched_record_ids:
-        job_request_status = await get_first_matching_record(JOB_REQUESTS, options={
-            'filter': f"source_pdf='{record_id}' && status='Finished'"
-        })
-
-        # We found a record where a PDF with the same name already had cards generated for it
-        if job_request_status is not None:
-            # TODO delete duplicate PDF
-            return record_id
-    
-    # We found a matching pdf name but that pdf didn't make it all the way through to card generation
-    return None
+
+    # TODO delete duplicate PDF
+    return finished_job['source_pdf']
 
 
 @activity.defn
@@ -71,12 +69,9 @@ async def delete_all_old_highlights(pdf_record_id: str):
         'fields': 'id'
     })
 
-    highlight_delete_handles = []
-    for r in records:
-        handle = delete_record(PDF_HIGHLIGHTS, r['id'])
-        highlight_delete_handles.append(handle)
-    
-    await gather(*highlight_delete_handles)
+    for result in await delete_records(PDF_HIGHLIGHTS, [r['id'] for r in records]):
+        if not result.ok:
+            activity.logger.error(f"Error deleting highlight - {records[result.index]['id']} - {result.body}")
     
 
 @activity.defn
@@ -93,36 +88,40 @@ async def extract_and_save_highlights(pdf_id_pair: UploadedPdfIdAndProcessedPdfI
     record: UserPdfRecord = await get_record(USER_PDFS, pdf_id_to_extract_from)
     activity.logger.info(f"PDF file record: {record}")
 
-    # Fetch file URL
-    file_url = construct_file_url(record, record['pdf_document'])
-    activity.logger.info(f"Requesting PDF from URL: {file_url}")
-
-    # Download file
-    pdf_bytes = await download_file(file_url)
-    activity.logger.info(f"Downloaded {file_url} ~ {len(pdf_bytes) / 1e6} MB")
-
-    # Convert to PDF and extract highlights
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    highlights = []
-
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        annots = page.annots()
-
-        if annots:
-            for annot in annots:
-                if annot.type[0] == 8: # Highlight annotation type
-                    highlight_text = page.get_textbox(annot.rect)
-                    if len(highlight_text.strip()) != 0:
-                        highlights.append(ExtractedHighlight(highlight_text.strip(), page_num))
-
-    for highlight in highlights:
-        try:
-            saved_record: PdfHighlightsRecord = await save_record(PDF_HIGHLIGHTS, {
-                "user_pdf": pdf_id_to_save_on,
-                "text": highlight.text,
-                "page_number": highlight.page_number
-            })
-            activity.logger.info(f"Saved highlight - {saved_record['id']} - {highlight.text[:20]}")
-        except Exception as e:
-            activity.logger.error(f"Error saving highlight - {pdf_id_to_save_on} - {e}")
+    # Download file, or reuse the copy cached on this worker
+    async with use_pdf(record, expected_sha256=record.get('content_sha256') or None) as pdf_file:
+        activity.logger.info(f"PDF at {pdf_file.path} ~ {pdf_file.size / 1e6} MB")
+
+        # Open from disk and extract highlights
+        doc = fitz.open(pdf_file.path)
+        highlights = []
+
+        for page_num in range(doc.page_count):
+            page = doc[page_num]
+            annots = page.annots()
+
+            if annots:
+                for annot in annots:
+                    if annot.type[0] == 8: # Highlight annotation type
+                        highlight_text = page.get_textbox(annot.rect)
+                        if len(highlight_text.strip()) != 0:
+                            highlights.append(ExtractedHighlight(highlight_text.strip(), page_num))
+
+        # Release the file handle on the cached PDF
+        doc.close()
+
+    highlight_records = [
+        {
+            "user_pdf": pdf_id_to_save_on,
+            "text": highlight.text,
+            "page_number": highlight.page_number
+        }
+        for highlight in highlights
+    ]
+
+    for result in await save_records(PDF_HIGHLIGHTS, highlight_records):
+        highlight = highlights[result.index]
+        if result.ok:
+            activity.logger.info(f"Saved highlight - {result.body['id']} - {highlight.text[:20]}")
+        else:
+            activity.logger.error(f"Error saving highlight - {pdf_id_to_save_on} - {result.body}")
@@ -3,17 +3,19 @@ from temporalio import activity
 from asyncio.tasks import gather
 from qdrant_client import models
 from functools import reduce, partial
+from typing import TypedDict
 
 from database.tps_utils import rate_limit
 from database.database_utils import (
-    get_record,
+    get_records_by_ids,
     get_all_records,
-    save_record
+    save_records
 )
 
 from database.vector_database_utils import (
     DocumentCoordinate,
     perform_vector_search_within_document,
+    perform_batch_vector_search_within_document,
     traverse_document_to_coordinate
 )
 
@@ -39,7 +41,17 @@ HighlightRecordId = str
 Highlight = str
 
 
-class MetadataWithHighlight(VectorMetadata):
+class HighlightMatch(TypedDict):
+    """A chunk a highlight matched, without its text, so a batch of matches stays small in Temporal's history."""
+    point_id: str
+    score: float
+    source_pdf: str
+    segment_index_in_document: int
+    chunk_index_in_segment: int
+    topic_number: int
+
+
+class MetadataWithHighlight(HighlightMatch):
     highlight_text: str
 
 
@@ -47,6 +59,9 @@ SourceJobId = str
 SourcePdfId = str
 UserId = str
 HighlightWithSourcePdfId = tuple[Highlight, SourcePdfId]
+HighlightsWithSourcePdfId = tuple[list[Highlight], SourcePdfId]
+# Matches are ids, scores and coordinates, under 1KB per highlight (~75KB a batch), well under Temporal's 2MB limit
+HIGHLIGHT_SEARCH_BATCH_SIZE = 100
 RelatedIdsWithGroup = tuple[tuple[SourceJobId,
                                   SourcePdfId, UserId], list[MetadataWithHighlight]]
 
@@ -83,9 +98,27 @@ def group_by_topic(l: tuple[int, list[list[VectorMetadata]]],
     return (r['topic_number'], groups)
 
 
-def transform_matches_into_groups(matches_for_highlights: list[list[MetadataWithHighlight]]) -> list[list[MetadataWithHighlight]]:
+def to_highlight_match(point: models.ScoredPoint) -> HighlightMatch:
+    payload: VectorMetadata = point.payload  # type: ignore
+    return {
+        "point_id": str(point.id),
+        "score": point.score,
+        "source_pdf": payload['source_pdf'],
+        "segment_index_in_document": payload['segment_index_in_document'],
+        "chunk_index_in_segment": payload['chunk_index_in_segment'],
+        "topic_number": payload['topic_number']
+    }
+
+
+def transform_matches_into_groups(highlights: list[Highlight],
+                                  matches_for_highlights: list[list[HighlightMatch]]) -> list[list[MetadataWithHighlight]]:
+    # Matches come back without the highlight, pair them up again by position
+    matches_with_highlights: list[list[MetadataWithHighlight]] = [
+        [{**match, "highlight_text": highlight} for match in matches]  # type: ignore
+        for highlight, matches in zip(highlights, matches_for_highlights, strict=True)
+    ]
     flattend_matches = reduce(
-        flatten_match_results_for_all_highlights, matches_for_highlights, [])
+        flatten_match_results_for_all_highlights, matches_with_highlights, [])
 
     flattend_matches.sort(key=lambda x: DocumentCoordinate(
         x['segment_index_in_document'],
@@ -101,16 +134,16 @@ async def map_from_context_topic(context_topic: list[VectorMetadata]) -> types.T
         raise Exception("got empty context topic")
 
     topic_summary = context_topic[0]['summary_text']
-    segments_checked = set()
-    segments = []
-    for c in context_topic:
-        segment_id = c['segment_id']
-        if segment_id not in segments_checked:
-            record: PdfSegmentsRecord = await get_record(PDF_SEGMENTS, segment_id)
-            segments.append(types.SegmentRaw(
-                segment_type=types.SegmentType(record['segment_type']), 
-                segment_text=record['segment_text']))
-            segments_checked.add(segment_id)
+
+    # One query for every segment the topic touches, in the order they appear
+    segment_ids = list(dict.fromkeys(c['segment_id'] for c in context_topic))
+    records: list[PdfSegmentsRecord] = await get_records_by_ids(PDF_SEGMENTS, segment_ids)
+    segments = [
+        types.SegmentRaw(
+            segment_type=types.SegmentType(record['segment_type']),
+            segment_text=record['segment_text'])
+        for record in records
+    ]
 
     return types.TopicSummaryWithSegments(topicSummary=topic_summary, segments=segments)
 
@@ -136,6 +169,16 @@ async def get_matches_for_highlight(highlightWithSourcePdfId: HighlightWithSourc
     ))
 
 
+@activity.defn
+async def get_matches_for_highlights(highlightsWithSourcePdfId: HighlightsWithSourcePdfId) -> list[list[HighlightMatch]]:
+    """Matches for each highlight, in the same order. The chunk text is read later by the document walk."""
+    highlights, source_pdf_id = highlightsWithSourcePdfId
+    points_per_highlight = await perform_batch_vector_search_within_document(
+        VECTORS_FOR_PB_DATA, highlights, source_pdf_id, limit=4)
+
+    return [[to_highlight_match(p) for p in points] for points in points_per_highlight]
+
+
 @activity.defn
 async def generate_and_save_flashcards_from_group(group_data: RelatedIdsWithGroup):
     related_ids, selected_group = group_data
@@ -179,7 +222,7 @@ async def generate_and_save_flashcards_from_group(group_data: RelatedIdsWithGrou
     flashcards = await generate_flashcards(types.StudyInput(topics=topic_summaries_with_segments, highlights=highlights))
 
     # Save to store
-    flashcard_save_handle = []
+    records_to_save: list[FlashcardsStoreRecord] = []
     for card in flashcards:
         record_to_save: FlashcardsStoreRecord = {
             "front": card.front,
@@ -194,8 +237,8 @@ async def generate_and_save_flashcards_from_group(group_data: RelatedIdsWithGrou
                 "highlights": highlights
             }
         }  # type: ignore
+        records_to_save.append(record_to_save)
 
-        handle = save_record(FLASHCARDS_STORE, record_to_save)
-        flashcard_save_handle.append(handle)
-
-    await gather(*flashcard_save_handle)
+    for result in await save_records(FLASHCARDS_STORE, records_to_save):
+        if not result.ok:
+            activity.logger.error(f"Error saving flashcard - {records_to_save[result.index]} - {result.body}")
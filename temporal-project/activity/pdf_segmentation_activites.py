@@ -1,24 +1,24 @@
-import base64
-import fitz
 from temporalio import activity
-from PIL import Image as PILImage
-import io
+from async_lru import alru_cache
+import base64
 import datetime
+import json
 import os
 import asyncio
 
 from baml_client.config import set_log_level
 from baml_client.async_client import types, b
+from baml_client.inlinedbaml import file_map as baml_file_map
 from baml_py import Image as BamlImage
 
 from database.database_utils import (
     get_record,
-    construct_file_url,
-    download_file,
-    save_record
+    save_records
 )
+from database.file_cache import use_pdf
 
 from database.baml_funcs import segment_page_image
+from database.cache_utils import CacheKey, PersistentCache, make_cache_key, close_cache_singleton
 
 from utils import (
     save_json,
@@ -26,6 +26,25 @@ from utils import (
     remove_file
 )
 
+from spool import (
+    open_spool,
+    remove_spool,
+    job_spool_dir
+)
+
+from page_rendering import (
+    PageRenderSettings,
+    render_pdf_page_pairs
+)
+
+from config import (
+    RENDER_PROCESSES,
+    SEGMENTATION_CACHE_ENABLED,
+    SEGMENTATION_CACHE_PATH,
+    SEGMENTATION_CACHE_MAX_BYTES,
+    SEGMENTATION_CACHE_MEMORY_ITEMS
+)
+
 from database.database_models import (
     PdfSegmentsRecord, UserPdfRecord, JobRequestsRecord,
     JOB_REQUESTS, PDF_SEGMENTS,  USER_PDFS)
@@ -33,10 +52,13 @@ from database.database_models import (
 # --- CONFIG ---
 set_log_level("OFF")
 
+# Editing the segmentation prompt, its types or the model clients changes this, so old cache entries stop matching
+SEGMENTATION_PROMPT_VERSION = make_cache_key(baml_file_map["segmentation.baml"], baml_file_map["clients.baml"])
+
 # --- HELPFUL TYPES ---
-ImageStr = str
-ImageStrWithPageRange = tuple[ImageStr, float]
+# Spool path of a rendered page pair, the header carries the mime type and page range
 ImageStrWithPageRangeFilePath = str
+JobRecordWithRenderSettings = tuple[JobRequestsRecord, PageRenderSettings]
 
 SegmentsWithPageRange = tuple[list[types.Segment], float]
 SegmentsWithPageRangeFilePath = str
@@ -46,44 +68,57 @@ JobRecordWithSegmentFilePaths = tuple[JobRequestsRecord,
 
 
 # --- HELPER FUNCTIONS ---
-def get_page_image_from_pdf(document: fitz.Document, page_idx: int) -> ImageStr:
-    page = document.load_page(page_idx)
-    pix = page.get_pixmap()  # type: ignore
-    img_bytes = pix.tobytes("png")
-    base64_encoded_string = base64.b64encode(img_bytes).decode('utf-8')
-    return base64_encoded_string
+def recreate_file_path(file_type_prefix: str, segment_record: PdfSegmentsRecord, job_record: JobRequestsRecord, extension: str = ".json") -> str:
+    job_id = job_record['id']
+    page_range = "_".join(str(segment_record['page_range']).split("."))
 
+    return f"{job_spool_dir(job_id)}/{file_type_prefix}_{page_range}{extension}"
 
-def combine_page_images(img_str_left: str, img_str_right: str) -> ImageStr:
-    img_strs = [img_str_left, img_str_right]
-    img_bytes = [base64.b64decode(img_str) for img_str in img_strs]
-    img1, img2 = [PILImage.open(io.BytesIO(img_byte)).convert('RGB')
-                  for img_byte in img_bytes]
 
-    max_width = max(img1.width, img2.width)
-    total_height = img1.height + img2.height
-    combined_img = PILImage.new(
-        'RGB', (max_width, total_height), color='white')
-    combined_img.paste(img1, (0, 0))
-    combined_img.paste(img2, (0, img1.height))
+@alru_cache(maxsize=1)
+async def get_segmentation_cache() -> PersistentCache:
+    return PersistentCache("segmentation", SEGMENTATION_CACHE_PATH, SEGMENTATION_CACHE_MAX_BYTES, SEGMENTATION_CACHE_MEMORY_ITEMS)
 
-    buffer = io.BytesIO()
-    combined_img.save(buffer, format="PNG")
-    buffer.seek(0)
 
-    combined_bytes = buffer.getvalue()
-    combined_base64 = base64.b64encode(combined_bytes).decode('utf-8')
+async def close_segmentation_cache():
+    await close_cache_singleton(get_segmentation_cache)
 
-    return combined_base64
 
+def segmentation_cache_key(image_bytes: bytes | memoryview) -> CacheKey:
+    return make_cache_key("SegmentPageImage", SEGMENTATION_PROMPT_VERSION, image_bytes)
 
-def recreate_file_path(file_type_prefix: str, segment_record: PdfSegmentsRecord, job_record: JobRequestsRecord) -> str:
-    job_id = job_record['id']
-    page_range = "_".join(str(segment_record['page_range']).split("."))
-    print(f"job id - {job_id}")
-    print(f"page range - {page_range}")
 
-    return f"/tmp/{job_id}/{file_type_prefix}_{page_range}.json"
+def read_page_image_key(page_path: ImageStrWithPageRangeFilePath) -> tuple[dict, CacheKey]:
+    with open_spool(page_path) as (header, image_bytes):
+        return header, segmentation_cache_key(image_bytes)
+
+
+def read_page_image_base64(page_path: ImageStrWithPageRangeFilePath) -> str:
+    with open_spool(page_path) as (_, image_bytes):
+        return base64.b64encode(image_bytes).decode('ascii')
+
+
+async def segment_page_image_cached(page_path: ImageStrWithPageRangeFilePath) -> tuple[dict, list[dict]]:
+    """Returns the page's spool header and its segments, from the segmentation cache when the same image was seen before."""
+    header, cache_key = await asyncio.to_thread(read_page_image_key, page_path)
+    cache = await get_segmentation_cache() if SEGMENTATION_CACHE_ENABLED else None
+
+    if cache is not None and (cached := await cache.get(cache_key)) is not None:
+        segments = json.loads(cached)
+    else:
+        image_str = await asyncio.to_thread(read_page_image_base64, page_path)
+        segments = [
+            segment.model_dump()
+            for segment in await segment_page_image(BamlImage.from_base64(header['mime_type'], image_str))
+        ]
+        if cache is not None:
+            await cache.set(cache_key, json.dumps(segments, separators=(",", ":")).encode())
+
+    if cache is not None:
+        stats = cache.stats()
+        activity.logger.info(f"Segmentation cache - {stats.hits} hits - {stats.misses} misses - hit rate {stats.hit_rate:.2f}")
+
+    return header, segments
 
 
 # --- Activites ---
@@ -102,63 +137,32 @@ async def fetch_job_record(job_record_id: str) -> JobRequestsRecord:
 
 
 @activity.defn
-async def fetch_pdf_and_split_into_image_strs(job_record: JobRequestsRecord) -> list[ImageStrWithPageRangeFilePath]:
+async def fetch_pdf_and_split_into_image_strs(job_record_with_settings: JobRecordWithRenderSettings) -> list[ImageStrWithPageRangeFilePath]:
+    job_record, render_settings = job_record_with_settings
     pdf_record: UserPdfRecord = await get_record(USER_PDFS, job_record['source_pdf'])
 
-    # Fetch file URL
-    file_url = construct_file_url(pdf_record, pdf_record['pdf_document'])
-
-    # Download file
-    pdf_bytes = await download_file(file_url)
-
-    # Turn to PDF
-    document = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-    # Split into image strings and save them
-    image_str_paths: list[ImageStrWithPageRangeFilePath] = []
-
-    base_job_temp_dir = f"/tmp/{job_record['id']}"
+    base_job_temp_dir = job_spool_dir(job_record['id'])
     await asyncio.to_thread(os.makedirs, base_job_temp_dir, exist_ok=True)
 
-    num_pages = document.page_count
+    def report_progress(done: int, total: int):
+        activity.heartbeat(f"Rendered {done}/{total} page pairs")
 
-    for page_indx in range(0, num_pages, 2):
-        curr_page_idx, next_page_idx = page_indx, page_indx + 1
-        if next_page_idx < num_pages:
-            page_img_curr = get_page_image_from_pdf(document, curr_page_idx)
-            page_img_next = get_page_image_from_pdf(document, next_page_idx)
-            combined_page_image = combine_page_images(page_img_curr, page_img_next)
-        else:
-            # When the number of pages is even
-            page_img_curr = get_page_image_from_pdf(document, curr_page_idx)
-            combined_page_image = page_img_curr
-
-        filename_suffix = f"page_{curr_page_idx}_{next_page_idx}.json"
-        tmp_file_path = os.path.join(base_job_temp_dir, filename_suffix)
-        item: ImageStrWithPageRange = (
-            combined_page_image, float(f"{curr_page_idx}.{next_page_idx}"))
-        await asyncio.to_thread(save_json, tmp_file_path, item)
-        image_str_paths.append(tmp_file_path)
-
-    document.close()
-    return image_str_paths
+    # Download file, usually already cached by extract_and_save_highlights.
+    # Render processes open the cached PDF themselves, so it stays pinned until they're done
+    async with use_pdf(pdf_record, expected_sha256=pdf_record.get('content_sha256') or None) as pdf_file:
+        return await render_pdf_page_pairs(
+            pdf_file.path, base_job_temp_dir, render_settings, RENDER_PROCESSES, on_progress=report_progress)
 
 
 @activity.defn
 async def get_segments_given_page_image(page_path: ImageStrWithPageRangeFilePath) -> SegmentsWithPageRangeFilePath:
-    page_path_head = "/".join(page_path.split('/')[:-1])
-    curr_page_idx, next_page_idx = page_path[:-5].split('/')[-1].split('_')[1:]
-
-    page_content = await asyncio.to_thread(read_json, page_path)
-    page: ImageStrWithPageRange = tuple(page_content)
-    
-    segments = await segment_page_image(BamlImage.from_base64("image/png", page[0]))
-    
+    page_path_head = os.path.dirname(page_path)
+
+    header, segments = await segment_page_image_cached(page_path)
+    curr_page_idx, next_page_idx = header['pages']
+
     tmp_file_path: SegmentsWithPageRangeFilePath = f"{page_path_head}/segment_{curr_page_idx}_{next_page_idx}.json"
-    item = (
-        [segment.model_dump() for segment in segments],
-        float(f"{curr_page_idx}.{next_page_idx}")
-    )
+    item = (segments, header['page_range'])
 
     await asyncio.to_thread(save_json, tmp_file_path, item)
     return tmp_file_path
@@ -184,15 +188,13 @@ async def save_segments_to_db(job_record_with_segment_paths: JobRecordWithSegmen
 
     segments_per_page.sort(key=lambda x: x[1])  # sort by page range
     segment_indx = 0
+    segment_records: list[PdfSegmentsRecord] = []
 
     for segment_page in segments_per_page:
         segments, page_range = segment_page
 
         for segment in segments:
             segment_record: PdfSegmentsRecord = {
-                "id": None,
-                "created": None,
-                "updated": None,
                 "segment_text": segment.segment_text,
                 "segment_type": segment.segment_type,
                 "page_range": page_range,
@@ -200,20 +202,31 @@ async def save_segments_to_db(job_record_with_segment_paths: JobRecordWithSegmen
                 "source_pdf": pdf_id
             } # type: ignore
 
-            try:
-                # save to DB
-                record: PdfSegmentsRecord = await save_record(PDF_SEGMENTS, segment_record)
-                activity.logger.info(f"Saved segment - {record['id']}")
-
-                # delete from temp storage
-                img_page_file_path = recreate_file_path("page", segment_record, job_record)
-                segment_file_path = recreate_file_path("segment", segment_record, job_record)
-                await asyncio.to_thread(remove_file, img_page_file_path)
-                await asyncio.to_thread(remove_file, segment_file_path)
-
-            except Exception as e:
-                activity.logger.error(
-                    f"Error processing segment - {segment_record} - {job_record['id']} - {e}")
-                
-            finally:
-                segment_indx += 1
+            segment_records.append(segment_record)
+            segment_indx += 1
+
+    # save to DB
+    save_results = await save_records(PDF_SEGMENTS, segment_records)
+
+    page_ranges_with_failures = set()
+    for result in save_results:
+        segment_record = segment_records[result.index]
+        if result.ok:
+            activity.logger.info(f"Saved segment - {result.body['id']}")
+        else:
+            page_ranges_with_failures.add(segment_record['page_range'])
+            activity.logger.error(
+                f"Error processing segment - {segment_record} - {job_record['id']} - {result.body}")
+
+    # delete from temp storage, keep the files of pages that had a failed segment
+    cleaned_page_ranges = set()
+    for segment_record in segment_records:
+        page_range = segment_record['page_range']
+        if page_range in page_ranges_with_failures or page_range in cleaned_page_ranges:
+            continue
+
+        img_page_file_path = recreate_file_path("page", segment_record, job_record, extension="")
+        segment_file_path = recreate_file_path("segment", segment_record, job_record)
+        await asyncio.to_thread(remove_spool, img_page_file_path)
+        await asyncio.to_thread(remove_file, segment_file_path)
+        cleaned_page_ranges.add(page_range)
@@ -5,6 +5,7 @@ import os
 from baml_client.config import set_log_level
 from baml_client import types
 from baml_client.async_client import b
+from baml_py.errors import BamlValidationError
 from prompts.chunks_prompt import CHUNKING_PROMPT
 
 from utils import (
@@ -12,9 +13,12 @@ from utils import (
 )
 
 from database.database_utils import (
-    get_record,
+    RECORDS_BY_IDS_CHUNK_SIZE,
+    get_records_by_ids,
     get_all_records,
-    save_record
+    iter_records,
+    save_records,
+    delete_records
 )
 
 from database.database_models import (
@@ -22,7 +26,18 @@ from database.database_models import (
     PDF_SEGMENTS, PDF_CHUNKS, JOB_REQUESTS
 )
 
-from database.baml_funcs import chunk_segment
+from database.baml_funcs import chunk_segment, chunk_segments_batch
+from local_chunker import chunk_locally
+
+from config import (
+    CHUNKING_BATCHED,
+    CHUNKING_BATCH_TOKEN_BUDGET,
+    CHUNKING_BATCH_MAX_SEGMENTS,
+    CHUNKING_LOCAL_RULES,
+    CHUNKING_WORKERS,
+    CHUNKING_FETCH_GROUP_SIZE,
+    CHUNKING_SAVE_BATCH_SIZE
+)
 
 # --- CONFIG ---
 set_log_level("OFF")
@@ -32,25 +47,127 @@ BATCH_SIZE = 200
 # --- Helpful Types ---
 SegmentId = str
 SegmentBatchFilePath = str
+Chunks = list[str]
 
 
 # --- Helpful Functions ---
-async def chunk_segment_and_save(segment_id: SegmentId):
-    # Fetch segment
-    pdf_segment_record: PdfSegmentsRecord = await get_record(PDF_SEGMENTS, segment_id)
-    
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token is close enough for packing
+    return len(text) // 4 + 1
+
+
+class SegmentPacker:
+    """Groups consecutive segments up to the token budget as they stream in, a segment over the budget gets a pack of its own."""
+
+    def __init__(self,
+                 token_budget: int = CHUNKING_BATCH_TOKEN_BUDGET,
+                 max_segments: int = CHUNKING_BATCH_MAX_SEGMENTS):
+        self.token_budget = token_budget
+        self.max_segments = max_segments
+        self.pack: list[PdfSegmentsRecord] = []
+        self.pack_tokens = 0
+
+    def add(self, record: PdfSegmentsRecord) -> list[PdfSegmentsRecord] | None:
+        """Returns the previous pack when this segment doesn't fit in it."""
+        full_pack = None
+        tokens = estimate_tokens(record['segment_text'])
+        if len(self.pack) != 0 and (self.pack_tokens + tokens > self.token_budget or len(self.pack) == self.max_segments):
+            full_pack = self.flush()
+
+        self.pack.append(record)
+        self.pack_tokens += tokens
+        return full_pack
+
+    def flush(self) -> list[PdfSegmentsRecord] | None:
+        pack = self.pack if len(self.pack) != 0 else None
+        self.pack = []
+        self.pack_tokens = 0
+        return pack
+
+
+def pack_segments(pdf_segment_records: list[PdfSegmentsRecord],
+                  token_budget: int = CHUNKING_BATCH_TOKEN_BUDGET,
+                  max_segments: int = CHUNKING_BATCH_MAX_SEGMENTS) -> list[list[PdfSegmentsRecord]]:
+    packer = SegmentPacker(token_budget, max_segments)
+    packs = [pack for record in pdf_segment_records if (pack := packer.add(record)) is not None]
+    if (last_pack := packer.flush()) is not None:
+        packs.append(last_pack)
+    return packs
+
+
+def chunking_instructions() -> tuple[str, list[types.DemoExampleV2]]:
+    instructions = CHUNKING_PROMPT['chunker']['signature']['instructions']
+    demo_examples = [types.DemoExampleV2(**d) for d in CHUNKING_PROMPT['chunker']['demos']]
+    return instructions, demo_examples
+
+
+async def chunk_single_segment(pdf_segment_record: PdfSegmentsRecord) -> Chunks:
     segment_baml = types.SegmentRaw(
         segment_text=pdf_segment_record['segment_text'],
         segment_type=types.SegmentType(pdf_segment_record['segment_type'])
     )
 
-    # Chunk segment
-    instructions = CHUNKING_PROMPT['chunker']['signature']['instructions']
-    demo_examples = [types.DemoExampleV2(**d) for d in CHUNKING_PROMPT['chunker']['demos']]
+    instructions, demo_examples = chunking_instructions()
+    return await chunk_segment(instructions, demo_examples, segment_baml)
+
+
+def valid_batch_chunks(results: list[types.SegmentChunks], pack_size: int) -> dict[int, Chunks]:
+    """Keeps the entries that belong to exactly one input segment and have at least one non-empty chunk."""
+    chunks_by_index: dict[int, Chunks] = {}
+    repeated: set[int] = set()
+
+    for result in results:
+        if not 0 <= result.segment_index < pack_size:
+            continue
+        if result.segment_index in chunks_by_index:
+            repeated.add(result.segment_index)
+
+        chunks = [chunk for chunk in result.chunks if len(chunk.strip()) != 0]
+        if len(chunks) != 0:
+            chunks_by_index[result.segment_index] = chunks
+
+    for idx in repeated:
+        chunks_by_index.pop(idx, None)
+
+    return chunks_by_index
+
+
+async def chunk_segment_pack(pack: list[PdfSegmentsRecord]) -> list[Chunks]:
+    """
+    Chunks a pack of segments with one ChunkSegmentsBatch call, returns the chunks in pack order.
+    Segments the batched output doesn't cover cleanly are chunked one by one with ChunkSegmentV2.
+    """
+    if len(pack) == 1:
+        return [await chunk_single_segment(pack[0])]
+
+    input_segments = [
+        types.SegmentInBatch(
+            segment_index=idx,
+            segment_type=types.SegmentType(record['segment_type']),
+            segment_text=record['segment_text']
+        )
+        for idx, record in enumerate(pack)
+    ]
+
+    instructions, demo_examples = chunking_instructions()
+    try:
+        results = await chunk_segments_batch(instructions, demo_examples, input_segments)
+        chunks_by_index = valid_batch_chunks(results, len(pack))
+    except BamlValidationError as e:
+        activity.logger.warning(f"Batched chunking output didn't parse, chunking {len(pack)} segments one by one - {e}")
+        chunks_by_index = {}
 
-    chunks: list[str] = await chunk_segment(instructions, demo_examples, segment_baml)
+    missing = [idx for idx in range(len(pack)) if idx not in chunks_by_index]
+    if len(missing) != 0:
+        activity.logger.info(f"Batched chunking missed {len(missing)}/{len(pack)} segments, chunking them one by one")
+        fallback_chunks = await gather(*[chunk_single_segment(pack[idx]) for idx in missing])
+        chunks_by_index.update(zip(missing, fallback_chunks))
 
-    # Save chunks
+    return [chunks_by_index[idx] for idx in range(len(pack))]
+
+
+def build_chunk_records(pdf_segment_record: PdfSegmentsRecord, chunks: Chunks) -> list[PdfChunksRecord]:
+    chunk_records: list[PdfChunksRecord] = []
     for indx, chunk in enumerate(chunks):
         chunk_record: PdfChunksRecord = {
             "segment": pdf_segment_record['id'],
@@ -58,12 +175,36 @@ async def chunk_segment_and_save(segment_id: SegmentId):
             "chunk_index_in_segment": indx,
             "chunk_text": chunk
         } # type: ignore
+        chunk_records.append(chunk_record)
+    return chunk_records
+
+
+async def save_chunk_records(chunk_records: list[PdfChunksRecord]):
+    for result in await save_records(PDF_CHUNKS, chunk_records):
+        if result.ok:
+            activity.logger.info(f"Saved chunk record - {result.body['id']}")
+        else:
+            activity.logger.error(f"Error saving chunk - {chunk_records[result.index]} - {result.body}")
+
+
+async def delete_chunks_of_segments(segment_ids: list[SegmentId]) -> int:
+    """Removes chunks an earlier attempt saved for these segments, so a retried batch doesn't duplicate them."""
+    chunk_ids: list[str] = []
+    for idx in range(0, len(segment_ids), RECORDS_BY_IDS_CHUNK_SIZE):
+        id_filter = " || ".join(f"segment='{segment_id}'" for segment_id in segment_ids[idx: idx + RECORDS_BY_IDS_CHUNK_SIZE])
+        chunk_records: list[PdfChunksRecord] = await get_all_records(PDF_CHUNKS, options={
+            "filter": id_filter,
+            "fields": "id"
+        })
+        chunk_ids.extend(record['id'] for record in chunk_records)
+
+    if len(chunk_ids) == 0:
+        return 0
 
-        try:
-            saved_record: PdfChunksRecord = await save_record(PDF_CHUNKS, chunk_record)
-            activity.logger.info(f"Saved chunk record - {saved_record['id']}")
-        except Exception as e:
-            activity.logger.error(f"Error saving chunk - {chunk_record} - {e}")
+    for result in await delete_records(PDF_CHUNKS, chunk_ids):
+        if not result.ok:
+            raise Exception(f"Error deleting chunk from an earlier attempt - {chunk_ids[result.index]} - {result.body}")
+    return len(chunk_ids)
 
 
 # --- Activites ---
@@ -71,34 +212,118 @@ async def chunk_segment_and_save(segment_id: SegmentId):
 async def fetch_segment_ids_and_save_batch(job_record: JobRequestsRecord) -> list[SegmentBatchFilePath]:
     source_pdf_id = job_record['source_pdf']
 
-    records: list[PdfSegmentsRecord] = await get_all_records(PDF_SEGMENTS, options={
-        "filter": f"source_pdf='{source_pdf_id}'",
-        "fields": "id"
-    })
-
     segment_batch_file_paths = []
     base_job_temp_dir = f"/tmp/{job_record['id']}"
     await asyncio.to_thread(os.makedirs, base_job_temp_dir, exist_ok=True)
-    
-    segment_ids = [record['id'] for record in records]
-    for idx in range(0, len(segment_ids), BATCH_SIZE):
-        segement_batch = segment_ids[idx: idx + BATCH_SIZE]
+
+    async def save_batch(idx: int, segment_batch: list[SegmentId]):
         filename_suffix = f"segment_{idx}_{idx + BATCH_SIZE}.json"
         tmp_file_path = os.path.join(base_job_temp_dir, filename_suffix)
-        await asyncio.to_thread(save_json, tmp_file_path, segement_batch)
+        await asyncio.to_thread(save_json, tmp_file_path, segment_batch)
         segment_batch_file_paths.append(tmp_file_path)
-    
+
+    # Write each batch as soon as it is filled instead of holding every id in memory
+    idx = 0
+    segment_batch: list[SegmentId] = []
+    async for record in iter_records(PDF_SEGMENTS, options={
+        "filter": f"source_pdf='{source_pdf_id}'",
+        "fields": "id,segment_index_in_document"
+    }, keyset_field="segment_index_in_document"):
+        segment_batch.append(record['id'])
+        if len(segment_batch) == BATCH_SIZE:
+            await save_batch(idx, segment_batch)
+            idx += BATCH_SIZE
+            segment_batch = []
+
+    if len(segment_batch) != 0:
+        await save_batch(idx, segment_batch)
+
     return segment_batch_file_paths
 
 
 @activity.defn
 async def fetch_segment_batch_and_chunk(segment_batch_path: SegmentBatchFilePath) -> list[SegmentId]:
+    """
+    Runs the batch as a pipeline so one slow LLM call doesn't hold up the rest:
+    a producer fetches segments and chunks the trivial ones locally, a pool of workers chunks the
+    packs that need the LLM, and a consumer bulk saves the chunks as they come in.
+    """
     segment_ids_for_batch: list[SegmentId] = await asyncio.to_thread(read_json, segment_batch_path)
+    total_segments = len(segment_ids_for_batch)
+
+    # Chunks are saved as they come in, so a retry after a timeout or failure starts from a clean slate
+    deleted = await delete_chunks_of_segments(segment_ids_for_batch)
+    if deleted != 0:
+        activity.logger.info(f"Deleted {deleted} chunks saved by an earlier attempt at this batch")
+
+    # Bounded, so fetching never runs far ahead of the LLM
+    pack_queue: asyncio.Queue[list[PdfSegmentsRecord] | None] = asyncio.Queue(maxsize=CHUNKING_WORKERS * 2)
+    save_queue: asyncio.Queue[tuple[int, list[PdfChunksRecord]] | None] = asyncio.Queue()
+    counts = {"local": 0, "llm": 0, "calls": 0}
+
+    async def produce():
+        packer = SegmentPacker(max_segments=CHUNKING_BATCH_MAX_SEGMENTS if CHUNKING_BATCHED else 1)
+
+        for idx in range(0, total_segments, CHUNKING_FETCH_GROUP_SIZE):
+            pdf_segment_records: list[PdfSegmentsRecord] = await get_records_by_ids(
+                PDF_SEGMENTS, segment_ids_for_batch[idx: idx + CHUNKING_FETCH_GROUP_SIZE])
+
+            for record in pdf_segment_records:
+                local_chunks = chunk_locally(record['segment_type'], record['segment_text']) if CHUNKING_LOCAL_RULES else None
+                if local_chunks is not None:
+                    counts["local"] += 1
+                    await save_queue.put((1, build_chunk_records(record, local_chunks)))
+                elif (pack := packer.add(record)) is not None:
+                    await pack_queue.put(pack)
+
+        if (pack := packer.flush()) is not None:
+            await pack_queue.put(pack)
+        for _ in range(CHUNKING_WORKERS):
+            await pack_queue.put(None)
+
+    async def chunk_worker():
+        while (pack := await pack_queue.get()) is not None:
+            pack_chunks = await chunk_segment_pack(pack)
+            counts["llm"] += len(pack)
+            counts["calls"] += 1
+
+            chunk_records = [
+                chunk_record
+                for record, chunks in zip(pack, pack_chunks)
+                for chunk_record in build_chunk_records(record, chunks)
+            ]
+            await save_queue.put((len(pack), chunk_records))
+        await save_queue.put(None)
+
+    async def save_chunks():
+        finished_workers = 0
+        segments_done = 0
+        pending: list[PdfChunksRecord] = []
+
+        # Local chunks are queued before the producer's sentinels, so every worker's None comes after them
+        while finished_workers < CHUNKING_WORKERS:
+            item = await save_queue.get()
+            if item is None:
+                finished_workers += 1
+                continue
+
+            segment_count, chunk_records = item
+            segments_done += segment_count
+            pending.extend(chunk_records)
+            if len(pending) >= CHUNKING_SAVE_BATCH_SIZE:
+                await save_chunk_records(pending)
+                pending = []
+            activity.heartbeat(f"Chunked {segments_done}/{total_segments} segments")
+
+        if len(pending) != 0:
+            await save_chunk_records(pending)
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(produce())
+        for _ in range(CHUNKING_WORKERS):
+            tg.create_task(chunk_worker())
+        tg.create_task(save_chunks())
 
-    chunking_hundles = []
-    for segment_id in segment_ids_for_batch:
-        handle = chunk_segment_and_save(segment_id)
-        chunking_hundles.append(handle)
-    
-    await gather(*chunking_hundles)
-    return segment_ids_for_batch
\ No newline at end of file
+    activity.logger.info(
+        f"Chunked {counts['local']} segments locally and {counts['llm']} with the LLM in {counts['calls']} calls")
+    return segment_ids_for_batch
@@ -1,30 +1,36 @@
 from temporalio import activity
 from baml_client.config import set_log_level
 from baml_client import types
-from baml_client.async_client import b
 from baml_py.errors import BamlClientError
 
+from dataclasses import dataclass
 import asyncio
-from asyncio.tasks import gather
-import os
+import json
 
-from utils import (
-    save_json, read_json, remove_file
+from spool import (
+    open_spool,
+    spool_path,
+    write_spool
 )
 
 from database.database_models import (
     PdfSegmentsRecord, PdfTopicsRecord, JobRequestsRecord,
-    PDF_SEGMENTS, PDF_TOPICS, JOB_REQUESTS
+    PDF_SEGMENTS, PDF_TOPICS
 )
 
 from database.database_utils import (
-    get_all_records,
-    get_record,
-    save_record,
+    iter_records,
+    save_records,
     get_first_matching_record
 )
 
 from database.baml_funcs import identify_topic_bounds
+from database.tps_utils import is_throttle_error
+from database.vector_database_utils import text_to_vec
+
+from topic_segmentation import TopicSegmentationSettings, texttiling_boundaries
+
+import numpy as np
 
 # --- CONFIG ---
 set_log_level("OFF")
@@ -35,77 +41,144 @@ SLIDE_SIZE = 30
 SegmentId = str
 SegmentIndx = int
 IsLastSegment = bool
-SegmentInfo = tuple[SegmentId, SegmentIndx]
-SegmentBatch = list[SegmentInfo]
-FilePathForSegmentBatch = str
 TopicBoundary = int
 TopicBoundsWithSourcePDF = tuple[list[TopicBoundary], str]
 
+# Spool with one compact JSON line per segment, in document order, see write_segment_store
+SegmentStorePath = str
+# (segment index in document, segment type, segment text)
+StoredSegment = tuple[SegmentIndx, str, str]
+# (store, first position, position after the last) - positions in the store, not segment indices
+SegmentWindow = tuple[SegmentStorePath, int, int]
+SegmentStoreWithWindows = tuple[SegmentStorePath, list[SegmentWindow]]
+
+
+@dataclass
+class TopicWindowSettings:
+    """How segments are windowed for IdentifyMultipleTopicBoundaries, set per job."""
+    window_size: int = BATCH_SIZE
+    slide_size: int = SLIDE_SIZE
+
+    def __post_init__(self):
+        if self.window_size < 2:
+            raise ValueError(f"Window size must be at least 2 - {self.window_size}")
+        if not 1 <= self.slide_size <= self.window_size:
+            raise ValueError(f"Slide size must be between 1 and the window size - {self.slide_size}")
+
+
+JobRecordWithTopicWindowSettings = tuple[JobRequestsRecord, TopicWindowSettings]
+SegmentStoreWithSegmentationSettings = tuple[SegmentStorePath, TopicSegmentationSettings]
+
+
+# --- Helpful Functions ---
+def write_segment_store(path: SegmentStorePath, segments: list[StoredSegment]) -> SegmentStorePath:
+    """The header keeps each line's byte offset, so a window only parses its own segments."""
+    offsets = [0]
+    lines = []
+    for segment in segments:
+        line = json.dumps(segment, separators=(",", ":")).encode() + b"\n"
+        lines.append(line)
+        offsets.append(offsets[-1] + len(line))
+
+    return write_spool(path, b"".join(lines), {"offsets": offsets})
+
+
+def read_segment_store(path: SegmentStorePath, start: int = 0, end: int | None = None) -> list[StoredSegment]:
+    with open_spool(path) as (header, payload):
+        offsets = header["offsets"]
+        end = len(offsets) - 1 if end is None else end
+        window = bytes(payload[offsets[start]: offsets[end]])
+
+    return [tuple(json.loads(line)) for line in window.splitlines()]  # type: ignore
+
+
+def segment_windows(segment_count: int, settings: TopicWindowSettings) -> list[tuple[int, int]]:
+    """Sliding (start, end) windows over the segments, stopping at the first one that reaches the end."""
+    windows = []
+    start = 0
+    while start < segment_count:
+        end = min(start + settings.window_size, segment_count)
+        windows.append((start, end))
+        if end == segment_count:
+            break
+        start += settings.slide_size
+    return windows
+
+
 # --- Activites ---
 @activity.defn
-async def fetch_segment_info_and_save_batch(job_record: JobRequestsRecord) -> list[FilePathForSegmentBatch]:
+async def fetch_segment_info_and_save_batch(job_record_with_settings: JobRecordWithTopicWindowSettings) -> SegmentStoreWithWindows:
+    """Loads every segment of the document once into a local store, windows for the LLM are slices of it."""
+    job_record, window_settings = job_record_with_settings
     source_pdf_id = job_record['source_pdf']
-    records: list[PdfSegmentsRecord] = await get_all_records(PDF_SEGMENTS, options={
-        "filter": f"source_pdf='{source_pdf_id}'",
-        "fields": "id,segment_index_in_document",
-        "sort": "segment_index_in_document"
-    })
 
-    segment_infos: list[SegmentInfo] = [
-        (record['id'], record['segment_index_in_document'])
-        for record in records
+    segments: list[StoredSegment] = [
+        (record['segment_index_in_document'], record['segment_type'], record['segment_text'])
+        async for record in iter_records(PDF_SEGMENTS, options={
+            "filter": f"source_pdf='{source_pdf_id}'",
+            "fields": "segment_index_in_document,segment_type,segment_text"
+        }, keyset_field="segment_index_in_document")
     ]
 
-    base_job_temp_dir = f"/tmp/{job_record['id']}"
-    await asyncio.to_thread(os.makedirs, base_job_temp_dir, exist_ok=True)
-    
-    # Turn the ids into batches by sliding over them using a window, (slide by 20 & collect 40)
-    file_paths_for_segment_batches: list[FilePathForSegmentBatch] = []
-    for i in range(0, len(segment_infos), SLIDE_SIZE):
-        segment_info_batch = segment_infos[i: i + BATCH_SIZE]
-        filename_suffix = f"topic_bounds_{i}_{i + BATCH_SIZE}.json"
-        tmp_file_path = os.path.join(base_job_temp_dir, filename_suffix)
-        await asyncio.to_thread(save_json, tmp_file_path, segment_info_batch)
-        file_paths_for_segment_batches.append(tmp_file_path)
+    store_path = await asyncio.to_thread(
+        write_segment_store, spool_path(job_record['id'], "topic_segments"), segments)
 
-    return file_paths_for_segment_batches
+    return store_path, [(store_path, start, end) for start, end in segment_windows(len(segments), window_settings)]
 
 
 @activity.defn
-async def get_topic_bounds_for_batch(segment_batch_file_path: FilePathForSegmentBatch) -> list[TopicBoundary]:
-    segment_batch = await asyncio.to_thread(read_json, segment_batch_file_path)
-    
-    # Fetch segments
-    pdf_segment_fetch_handles = []
-    for segment_id, _ in segment_batch:
-        handle = get_record(PDF_SEGMENTS, segment_id)
-        pdf_segment_fetch_handles.append(handle)
+async def get_topic_bounds_for_batch(segment_window: SegmentWindow) -> list[TopicBoundary]:
+    store_path, start, end = segment_window
+    segments = await asyncio.to_thread(read_segment_store, store_path, start, end)
 
-    pdf_segment_records: list[PdfSegmentsRecord] = await gather(*pdf_segment_fetch_handles)
-    pdf_segment_records.sort(key=lambda x: x['segment_index_in_document'])
+    # Topic bounds come back relative to the window, offset them by the index of its first segment
+    segment_index = segments[0][0]
 
     # Find topic bounds
     segments_baml = []
-    for idx, record in enumerate(pdf_segment_records):
+    for idx, (_, segment_type, segment_text) in enumerate(segments):
         segments_baml.append(
             types.Segment(
                 segment_number=idx,
-                segment_text=record['segment_text'],
-                segment_type=types.SegmentType(record["segment_type"])
+                segment_text=segment_text,
+                segment_type=types.SegmentType(segment_type)
             )
         )
 
     try:
         topic_bounds = await identify_topic_bounds(segments_baml)
-        # Calculate topic bounds with offset using the index of the first segment
-        segment_index = pdf_segment_records[0]["segment_index_in_document"]
         return list(map(lambda bound: bound + segment_index, topic_bounds))
     except BamlClientError as e:
+        # Throttling outlasted the limiter's retries, let the activity retry instead of
+        # settling for a whole-window topic
+        if is_throttle_error(e):
+            raise
         # TODO add more robust default option
         # when API call fails
+        activity.logger.warning(f"Topic bounds call failed, using the whole window as one topic - {e}")
         return list(map(lambda bound: bound + segment_index, [0, len(segments_baml)]))
 
 
+@activity.defn
+async def get_topic_bounds_by_embedding(store_with_settings: SegmentStoreWithSegmentationSettings) -> list[TopicBoundary]:
+    """Topic bounds for the whole document from segment embeddings, one vectorized pass instead of a call per window."""
+    store_path, segmentation_settings = store_with_settings
+    segments = await asyncio.to_thread(read_segment_store, store_path)
+    if len(segments) == 0:
+        return []
+
+    # Empty segments still need a vector to keep positions aligned
+    vectors = await text_to_vec(
+        [segment_text if len(segment_text.strip()) != 0 else segment_type for _, segment_type, segment_text in segments],
+        "CLUSTERING")
+
+    positions = texttiling_boundaries(
+        np.array(vectors), [segment_type for _, segment_type, _ in segments], segmentation_settings)
+    activity.logger.info(f"Embedding topic bounds - {len(positions) + 1} topics over {len(segments)} segments")
+
+    return [segments[0][0]] + [segments[position][0] for position in positions]
+
+
 @activity.defn
 async def get_last_segment_index_of_document(source_pdf_id) -> int:
     pdf_segment_record: PdfSegmentsRecord | None = await get_first_matching_record(PDF_SEGMENTS, options={
@@ -124,7 +197,7 @@ async def get_last_segment_index_of_document(source_pdf_id) -> int:
 async def reduced_topic_bounds_and_save(topic_bounds_with_pdf_id: TopicBoundsWithSourcePDF):
     all_unique_topic_bounds, source_pdf_id = topic_bounds_with_pdf_id
 
-    pdf_topic_insert_handles = []
+    topic_records: list[PdfTopicsRecord] = []
     topic_number = 0
     for start_indx, end_indx in zip(all_unique_topic_bounds, all_unique_topic_bounds[1:]):
         topic_record: PdfTopicsRecord = {
@@ -134,9 +207,10 @@ async def reduced_topic_bounds_and_save(topic_bounds_with_pdf_id: TopicBoundsWit
             "topic_number": topic_number
         }  # type: ignore
 
-        handle = save_record(PDF_TOPICS, topic_record)
-        pdf_topic_insert_handles.append(handle)
+        topic_records.append(topic_record)
         topic_number += 1
 
-    activity.logger.info(f"Trying to save all topic records - {len(pdf_topic_insert_handles)}")
-    await gather(*pdf_topic_insert_handles)
+    activity.logger.info(f"Trying to save all topic records - {len(topic_records)}")
+    for result in await save_records(PDF_TOPICS, topic_records):
+        if not result.ok:
+            activity.logger.error(f"Error saving topic - {topic_records[result.index]} - {result.body}")
@@ -9,7 +9,10 @@ from database.database_models import (
     JOB_REQUESTS, JobRequestsRecord
 )
 
+from spool import cleanup_job_spool
+
 from typing import Literal
+import asyncio
 
 # --- Helpful Types ---
 JobRequestStates = Literal["Queued", 
@@ -33,3 +36,8 @@ async def set_job_request_status(record_with_status: JobRecordWithStatus):
         "status": status
     })
 
+
+
+@activity.defn
+async def cleanup_job_files(job_record_id: str):
+    await asyncio.to_thread(cleanup_job_spool, job_record_id)
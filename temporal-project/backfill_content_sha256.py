@@ -0,0 +1,40 @@
+import asyncio
+
+from activity.extract_highlights_activites import fingerprint_pdf
+from database.database_models import USER_PDFS, UserPdfRecord
+from database.database_utils import iter_records
+from database.pocketbase_client import init_pocketbase_client, close_pocketbase_client
+
+# PDFs hashed at once, each one is a full download
+BACKFILL_CONCURRENCY = 4
+
+
+async def backfill_content_sha256():
+    """
+    Hashes PDFs that finished processing before content_sha256 existed, so new uploads of the same bytes
+    can reuse their cards. Safe to run again, PDFs that already have a hash are skipped.
+    """
+    print("Starting content_sha256 backfill...")
+    await init_pocketbase_client()
+    semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+    async def fingerprint(record: UserPdfRecord):
+        async with semaphore:
+            content_sha256 = await fingerprint_pdf(record)
+            print(f"Hashed {record['id']} - {content_sha256}")
+
+    try:
+        records: list[UserPdfRecord] = [record async for record in iter_records(USER_PDFS, options={
+            # Only PDFs a later upload could be matched against
+            'filter': "content_sha256='' && job_requests_via_source_pdf.status?='Finished'",
+            'fields': 'id,collectionId,pdf_document'
+        }, keyset_field="id")]
+
+        print(f"Found {len(records)} processed PDFs without content_sha256")
+        await asyncio.gather(*[fingerprint(record) for record in records])
+    finally:
+        await close_pocketbase_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_content_sha256())
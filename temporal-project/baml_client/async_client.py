@@ -181,6 +181,33 @@ class BamlAsyncClient:
       )
       return cast(List[str], raw.cast_to(types, types, partial_types, False))
     
+    async def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> List[types.SegmentChunks]:
+      options: BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
+
+      __tb__ = options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = options.get("client_registry", None)
+      collector = options.get("collector", None)
+      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
+      raw = await self.__runtime.call_function(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,"demos": demos,"input_segments": input_segments,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        collectors,
+      )
+      return cast(List[types.SegmentChunks], raw.cast_to(types, types, partial_types, False))
+    
     async def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
@@ -486,6 +513,41 @@ class BamlStreamClient:
         self.__ctx_manager.get(),
       )
     
+    def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[List[partial_types.SegmentChunks], List[types.SegmentChunks]]:
+      options: BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
+      __tb__ = options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = options.get("client_registry", None)
+      collector = options.get("collector", None)
+      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
+      raw = self.__runtime.stream_function(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,
+          "demos": demos,
+          "input_segments": input_segments,
+        },
+        None,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        collectors,
+      )
+
+      return baml_py.BamlStream[List[partial_types.SegmentChunks], List[types.SegmentChunks]](
+        raw,
+        lambda x: cast(List[partial_types.SegmentChunks], x.cast_to(types, types, partial_types, True)),
+        lambda x: cast(List[types.SegmentChunks], x.cast_to(types, types, partial_types, False)),
+        self.__ctx_manager.get(),
+      )
+    
     def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
@@ -111,6 +111,31 @@ class AsyncHttpRequest:
         False,
       )
     
+    async def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      return await self.__runtime.build_request(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,
+          "demos": demos,
+          "input_segments": input_segments,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        False,
+      )
+    
     async def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
@@ -359,6 +384,31 @@ class AsyncHttpStreamRequest:
         True,
       )
     
+    async def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      return await self.__runtime.build_request(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,
+          "demos": demos,
+          "input_segments": input_segments,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        True,
+      )
+    
     async def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
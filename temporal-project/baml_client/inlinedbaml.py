@@ -16,12 +16,12 @@
 
 file_map = {
     
-    "clients.baml": "client<llm> Gemma3 {\n  provider ollama\n  options {\n    base_url \"http://localhost:11434/v1\"\n    model \"gemma3:12b\"\n  }\n}\n\nclient<llm> GeminiPro2_5 {\n  provider google-ai\n  retry_policy Exponential\n  options {\n    model \"gemini-2.5-pro-preview-03-25\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash2 {\n  provider google-ai\n  retry_policy Exponential\n  options {\n    generationConfig {\n      temperature 0.7\n    }\n    model \"gemini-2.0-flash\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash2_5 {\n  provider google-ai\n  options {\n    model \"gemini-2.5-flash-preview-04-17\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlashLLite2 {\n  provider google-ai\n  options {\n    model \"gemini-2.0-flash-lite\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash1_5 {\n  provider google-ai\n  options {\n    model \"gemini-1.5-flash\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nretry_policy Constant {\n  max_retries 3\n  strategy {\n    type constant_delay\n    delay_ms 200\n  }\n}\n\nretry_policy Exponential {\n  max_retries 2\n  strategy {\n    type exponential_backoff\n    delay_ms 300\n    mutliplier 1.5\n    max_delay_ms 10000\n  }\n}",
+    "clients.baml": "client<llm> Gemma3 {\n  provider ollama\n  options {\n    base_url \"http://localhost:11434/v1\"\n    model \"gemma3:12b\"\n  }\n}\n\nclient<llm> GeminiPro2_5 {\n  provider google-ai\n  options {\n    model \"gemini-2.5-pro-preview-03-25\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash2 {\n  provider google-ai\n  options {\n    generationConfig {\n      temperature 0.7\n    }\n    model \"gemini-2.0-flash\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash2_5 {\n  provider google-ai\n  options {\n    model \"gemini-2.5-flash-preview-04-17\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlashLLite2 {\n  provider google-ai\n  options {\n    model \"gemini-2.0-flash-lite\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nclient<llm> GeminiFlash1_5 {\n  provider google-ai\n  options {\n    model \"gemini-1.5-flash\"\n    api_key env.GEMINI_API_KEY\n  }\n}\n\nretry_policy Constant {\n  max_retries 3\n  strategy {\n    type constant_delay\n    delay_ms 200\n  }\n}\n\n// Not set on the Gemini clients: database/baml_funcs.py rate limits them, has to see every 429\n// and retries throttled calls itself after cutting the rate (THROTTLE_RETRIES)\nretry_policy Exponential {\n  max_retries 2\n  strategy {\n    type exponential_backoff\n    delay_ms 300\n    mutliplier 1.5\n    max_delay_ms 10000\n  }\n}",
     "document_summarization.baml": "function GenerateDocumentSummary(topic_summaries: string[]) -> string {\n    client GeminiFlash2\n    \n    prompt #\"\n    **Task:** Generate a holistic, high-level overview of an entire document by synthesizing the sequence of topic summaries.\n    **Purpose:** To create a concise summary that captures the document's core subject matter, essential structure, and potentially its underlying themes, purpose, or unique characteristics, suitable for understanding the document's essence at a glance.\n    **Role:** Act as an expert Abstract Writer or Senior Editor, skilled at discerning the fundamental nature and flow of a document from its structural components (represented here by topic summaries).\n\n    **Instructions:**\n    1.  **Analyze Input Sequence:** The input `topic summaries` is a single string containing an ordered sequence of short summaries. Each summary represents the core idea of a consecutive section or topic within the original document. Treat this sequence as a structured outline or skeleton of the full document.\n    2.  **Identify Core Subject & Key Concepts:** Read through the entire sequence to determine the primary subject(s) the document addresses. Identify any recurring or central concepts, terms, or ideas mentioned across multiple topic summaries.\n    3.  **Determine Overall Structure & Flow:** Based on the *order* and *nature* of the topic summaries, infer the document's high-level organization. Is it chronological, thematic, comparative, problem-solution, foundational-to-advanced, narrative-driven, etc.? Describe this flow conceptually.\n    4.  **Infer Purpose & Themes (Where Possible):** Examine the collective message of the summaries. Can you infer the likely purpose of the document (e.g., to inform, persuade, guide, entertain)? Are there underlying themes (e.g., innovation, conflict, methodology, analysis) suggested by the topics covered?\n    5.  **Note Unique Characteristics (Where Evident):** Do the topic summaries suggest any unique features of the document, such as a specific methodology being detailed, a recurring element (like case studies or specific named tips), or a central project being developed?\n    6.  **Synthesize Overview Paragraph:** Combine these insights into a single, coherent paragraph (aiming for 75-175 words). This paragraph should:\n        *   Clearly state the main subject matter.\n        *   Briefly describe the document's structure or progression of ideas.\n        *   Touch upon key concepts or themes identified.\n        *   Mention any inferred purpose or unique characteristics if strongly suggested by the input.\n    7.  **Focus on Synthesis, Not Listing:** Do *not* simply enumerate the individual topic summaries. Weave the insights into a narrative that describes the *document as a whole*.\n    8.  **Maintain Generality:** Apply this analysis process regardless of whether the original document seems to be fiction, non-fiction, technical, or narrative. Base the summary *strictly* on the provided topic summaries.\n    \n    `topic summaries`: {{ topic_summaries }}\n\n    {{ ctx.output_format }}\n    \"#\n}",
     "flashcard_creator.baml": "class TopicSummaryWithSegments {\n    topicSummary string\n    segments SegmentRaw[]\n}\n\nclass StudyInput {\n    topics TopicSummaryWithSegments[]\n    highlights string[]\n}\n\nclass Flashcard {\n    type FlashcardType\n    front string\n    back string\n}\n\nenum FlashcardType {\n    BASIC_FACT\n    EXPLANATION\n    APPLICATION\n    CONTEXT\n}\n\nfunction GenerateFlashcardsDetailed(input: StudyInput) -> Flashcard[] {\n    client GeminiFlash2\n\n    prompt #\"\n        Your task is to generate highly focused flashcards from highlighted content.\n        \n        **Goal:** For each highlight, identify 1 key concept. STRICTLY generate 1 flashcard per highlight.\n        **Important:** Highlights may contain extraction errors - use segments for accurate content and wording.\n\n        Structured Content (Source of Truth for Answers):\n        ---\n        {% for topic_item in input.topics %}\n        Topic Summary: {{ topic_item.topicSummary }}\n        Segments for this topic: {{ topic_item.segments }}\n        {% endfor %}\n        ---\n\n        Highlighted Sections (may contain extraction errors):\n        {{input.highlights}}\n\n        **Process:**\n        1. For each highlight, identify what concept it's pointing to (even if malformed)\n        2. Find the corresponding well-formed content in the structured segments\n        3. Identify 1 key testable concept per highlight\n        4. STRICTLY generate 1 flashcard per highlight using clean segment content\n        5. Skip highlights that are too fragmented to interpret\n\n        **Flashcard Types:**\n\n        BASIC_FACT: For definitions, facts, data points\n        - Front: What is [specific concept]?\n        - Back: [precise definition from segments]\n\n        EXPLANATION: For mechanisms, processes, reasoning\n        - Front: Why/How does [phenomenon] work?\n        - Back: [mechanism from segments]\n\n        APPLICATION: For practical usage\n        - Front: How is [concept] applied in [context]?\n        - Back: [application steps from segments]\n\n        CONTEXT: For relationships between concepts\n        - Front: How does [concept A] relate to [concept B]?\n        - Back: [relationship from segments]\n\n        **Guidelines:**\n        - Each card tests exactly one piece of knowledge\n        - All answers MUST come from structured content, not highlights\n        - Questions are specific and unambiguous\n        - Answers don't repeat question phrasing\n        - Skip overly obvious information\n        - No cards requiring long lists\n\n        {{ ctx.output_format }}\n\n        JSON:\n    \"#\n}\n\nfunction GenerateFlashcardsSimple(input: StudyInput) -> Flashcard[] {\n    client GeminiFlash2\n\n    prompt #\"\n        Create focused flashcards from highlighted sections using structured content as the source of truth.\n        \n        **Constraints:** Maximum 2 cards per highlight. Only create cards for key concepts worth memorizing.\n        **Important:** Highlights may have extraction errors - use segment text for accurate wording.\n\n        Structured Content (Source of Truth for Answers):\n        ---\n        {% for topic_item in input.topics %}\n        Topic Summary: {{ topic_item.topicSummary }}\n        Segments for this topic:\n            {% for segment in topic_item.segments %}\n            - Segment Text: {{ segment.segment_text }}\n            {% endfor %}\n        --- End of Topic: {{ topic_item.topicSummary }} ---\n        {% endfor %}\n        ---\n\n        Highlighted Sections (may contain extraction errors):\n        {% for highlight in input.highlights %}\n        Highlight {{ loop.index }}:\n        ---\n        {{ highlight }}\n        ---\n        {% endfor %}\n\n        **Process:**\n        1. For each highlight, identify what key concept it points to\n        2. Find the accurate content in structured segments\n        3. Create 1-2 simple question-answer pairs using segment content\n        4. Skip highlights that are too unclear to interpret\n\n        **Guidelines:**\n        - Each card focuses on one specific concept from a highlight\n        - All answers must come from structured content, not raw highlights\n        - Avoid repeating question phrasing in answers\n        - Keep cards straightforward and testable\n        - Don't reference \"the author\" - treat content as factual\n        - Skip obvious or trivial information\n\n        {{ ctx.output_format }}\n\n        JSON:\n    \"#\n}\n\ntest GenerateExactlyTwoFlashcards {\n  functions [GenerateFlashcardsDetailed]\n  args {\n    input {\n      topics [\n        {\n          topicSummary \"Basic Science Concepts\"\n          segments [\n            {\n              segment_type \"TEXT_BLOCK\" // Using string type as in your example\n              segment_text \"The sky appears blue due to a phenomenon called Rayleigh scattering. This scattering affects light with shorter wavelengths more strongly.\"\n            },\n            {\n              segment_type \"TEXT_BLOCK\"\n              segment_text \"Rayleigh scattering is the elastic scattering of electromagnetic radiation (of which light is a form) by particles of a much smaller wavelength, such as individual atoms or molecules.\"\n            },\n            {\n              segment_type \"HEADING\"\n              segment_text \"Photosynthesis Basics\"\n            },\n            {\n              segment_type \"TEXT_BLOCK\"\n              segment_text \"Photosynthesis is a crucial process by which green plants, algae, and some bacteria convert light energy into chemical energy, stored in the form of glucose or other organic compounds.\"\n            },\n            {\n              segment_type \"TEXT_BLOCK\"\n              segment_text \"The primary inputs for photosynthesis are carbon dioxide, water, and light, while the outputs are glucose and oxygen.\"\n            }\n          ]\n        }\n      ]\n      highlights [\n        \"explain why the sky is blue\",\n        \"what is photosynthesis and its main components\"\n      ]\n    }\n  }\n}\n\n",
     "generators.baml": "// This helps use auto generate libraries you can use in the language of\n// your choice. You can have multiple generators if you use multiple languages.\n// Just ensure that the output_dir is different for each generator.\ngenerator target {\n    // Valid values: \"python/pydantic\", \"typescript\", \"ruby/sorbet\", \"rest/openapi\"\n    output_type \"python/pydantic\"\n\n    // Where the generated code will be saved (relative to baml_src/)\n    output_dir \"../\"\n\n    // The version of the BAML package you have installed (e.g. same version as your baml-py or @boundaryml/baml).\n    // The BAML VSCode extension version should also match this version.\n    version \"0.89.0\"\n\n    // Valid values: \"sync\", \"async\"\n    // This controls what `b.FunctionName()` will be (sync or async).\n    default_client_mode sync\n}\n",
     "segmentation.baml": "enum SegmentType {\n  TEXT_BLOCK\n  HEADING\n  CODE_BLOCK\n  IMAGE_DESCRIPTION\n  FIGURE_CAPTION\n  FOOTER\n  LIST_ITEM\n  TABLE\n  OTHER\n}\n\nclass Segment {\n  segment_number int @description(\"Sequential number of the segment on the page, starting from 1\")\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n}\n\nfunction SegmentPageImage(page_image: image) -> Segment[] {\n  client GeminiFlash2\n\n  prompt #\"\n    Analyze the visual layout and semantic content of the provided page image: {{ page_image }}\n\n    Segment the content into meaningful semantic blocks based on visual flow and topic. Merge closely related content (like adjacent paragraphs on the same sub-topic or a heading with its immediately following text) into single segments where appropriate.\n\n    Output a JSON list where each item is an object representing a segment with the following keys:\n    - \"segment_number\": An integer starting from 1, indicating the visual order.\n    - \"segment_type\": Type of the segment\n    - \"segment_text\": The full, accurate text content for the segment, extracted directly from the image. Normalize excessive whitespace for readability. For segments identified as images, provide a brief description as the text.\n\n    Ensure segments cover all significant content in visual order. Clearly distinguish image descriptions from figure captions.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest TestSegmentation {\n  functions [SegmentPageImage]\n  args {\n    page_image {\n        base64 \"iVBORw0KGgoAAAANSUhEUgAABPsAAAzkCAIAAACm6dxJAAEAAElEQVR4nOzdeVxV1f4//s1wGANBENBQUFIyM4YcUEmUTMUJjDQpDTVLm+T20dRKuw0a1LXkaiaoV8ULYuKEaDimgSAqIjLlwJgog8gsHIbD+T0+ru9n/fZjn4Fz9hmAw+v5hw/c49prr7X2fp+991p6YrGYAQAAAAAAANA5+l2dAAAAAAAAAACNQMQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuQsQLAAAAAAAAugkRLwAAAAAAAOgmRLwAAAAAAACgmxDxAgAAAAAAgG5CxAsAAAAAAAC6CREvAAAAAAAA6CZEvAAAAAAAAKCbEPECAAAAAACAbkLECwAAAAAAALoJES8AAAAAAADoJsOuTgBo3JYtW+Lj4+l/+/bte/To0S5NEXSxBQsWlJeX0//6+fmtXbuW6X6ePHkyc+ZM9pRVq1bNnj2b6a5Q13pbEYUeB5WU2L59e1xcXE/PB40eBVohZdXU1MydO7cHXbKhV0HEq/uqqqqKi4sZhrl//35HR4e9vX1Xpwi6WOlTra2tZWVlDMM4Ozsz3VJHRwcpug0NDdXV1QzDBAUFMd0Y6lpvK6Jqt3///pCQkOeff/7UqVN9+/ZV78br6upmz55969atzZs3v/fee0yvhEpKVFdX60A+aPQoem0rxJtIJOpZl2zoVfTEYnFXpwG0xMHBoaKiwt7env2zJchy584dklGjRo0yNzfvki3w09LSkpaWxjCMra3tiBEjZC1269Ytd3d3hmGCg4P37dvHdGORkZErVqxgGCYiImL58uVayyLeUNfUogcVUfWWHIZhwsPDQ0JC1FtoaT3q06dPbW0t07t1n0qq6eaop+SDlo9C9y6UOnzJBlAdnvECSBcaGhoVFcUwTGZmppubW5dsgZ/y8vJJkyYxDOPv73/8+HGt7bcHQRZB9zRixAgS8Q4fPlzthfaFF14gf0huHLoQmqMugWwH6FUQ8QIAAHQLx48fP3DgwNChQ319fdW+8VdeeSU5OTk7O3vBggVq3zgAAEC3hYgXAACgW7CwsNDoS4DeT2lu+wAAAN0QRicCAAAAAAAA3YRnvL1XUVHR4cOHCwsLhULhoEGD/P39PT095a/S0NBw5syZtLS0yspKU1PTgQMH+vr6jhs3Tk9Pj18a6uvrExISbty4UVVVpa+v379/f3d3d19f3379+qmehszMzJaWFvrffv36DRkyhGGYK1eunDx58v79+xYWFmPHjp03b56pqSldrK2tLSMjg2GYR48ekSlZWVlCoZAuMHDgwAEDBsg5KH5baGpqOn/+fEpKSkVFhUAgGDBggK+vr7e3t4GBAaOwoqKiyspK0rEk6cfy6tWrdK6ent6YMWPkrC4/ZzRdGMg2jx07dv369bq6OgcHh/Hjx8+cOVMgEMhfKy8vLzk5OS8vr7q6WiAQ2Nvbe3l5TZ8+3djYWPUsamxsvHTp0s2bN0tKSoRCoaWl5fDhw6dOnerq6qq5usZ7p+np6RcuXMjPz29qarK0tHR1dfXy8hozZoy+vr5GzyM7D6nnnnvOxsaG/re0tPTBgwcDBgwYOHAgnSgWi69du8Zey8TERM5H7xoqolVVVQUFBewpHh4eRkZGQqHw8OHDN2/erKystLCwcHV19ff3l+yyNSsr6/Tp04WFhU1NTTY2Nh4eHtOnT7ezs2OUIau9Ur1eyzlA1Rtk+RTJGXJ0nBWNjY1Jd0FSCwnpDpC2jWqppAzDCIXCW7dusaeMHDnSzMyM/jc9PV0kEtH/Dhs2zNraWpvNkSrlLSMjIz4+/u+//zYxMRkyZMi8efNU7HxYqWyXVQLr6+tjYmKys7ObmpoGDx4cEBAgv88LtRxF97xQqiuL5FD8NkPtiVG9mgOoSgy9Bum4397evr29ffXq1ZKF4fXXX6+pqZG1+tatW62srBiGMTAwcHJyoveybm5uaWlpPNLzyy+/kB6M9fX1BwwYQC/Yenp6Pj4+Fy9eVDENTk5O7KMLDg4WCoWBgYGco3Z0dMzOzqZrddrTY1hYmPzj4rGFyMhIW1tbkhWOjo50iAVXV9ezZ88qnqXy34c0NjZmL5yZmalUzvA+EQo6cuQIyQQ2FxeXrKysiIgI8t+IiAj2KlFRUS4uLmSWoaGhk5MTLUW2trbR0dGqZFFlZWVgYCCNt/v27evs7EyDhDlz5lRUVKi9rvHeaUlJycSJE8liFhYWTk5OdK1+/fqFhIS0trZq7jxKzcyDBw+yl/Hz82MY5tVXX2VPZP8SRLi6umq/iEp2wVpcXJyamio52El4eDh7xYKCgqlTp5JZ1tbWTk5O5NwZGRl99tlnUvNcFsn2il+9lkrqAareIMuheM5IPTonJyc5hYRhmNraWnVVUjrl9u3bnL1kZmayV+nTpw977vHjx7XWHCmbq2zV1dWvv/665PbXrl0rEokk86FTPLJdagk8f/48J0sZhgkJCdH0UXTPC6XqWSSfUrcZKiZG8pKtSjUHUAtEvL0IvSR8/vnnFhYWoaGh2dnZxcXFiYmJPj4+pH0ZNWpUY2Oj5Lp08MZPP/20urqaTExPT/fw8CCPZc6cOaNUYn799VdyL/XTTz/RPT569OjTTz+V1Ywqm4aYmJiIiIgvvviCXq6CgoJsbW0/++yznTt3hoaG0gEJhg4dSu8VmpqaIp7y8vIic7/44osIlps3b8o/NGW38OGHH5LFVqxYUV5eTibevn17ypQp5OK0e/duBXM1KSkpIiJi06ZNZIMvvfQSe7+7du2SdSEPCgqysrL65JNPtm7d+tVXXw0bNkwyZ3ifCEXExsaS37zNzc3DwsJycnJIyXz11VdtbGw2bNjAuXwS/v7+5M4vJiamra2NTCwoKKBjAEZGRvLOIpo/gYGBhYWFZGJLS0tsbCx55OXq6lpXV6feusZvpw0NDYMHD2YYZvTo0RkZGWSiSCQ6c+bM0KFDZd06qPE8RkRE/Pjjj2Rrzz77LMnM/Px8ukBtbS25P9bX13/06BGd3t7eThZ2cnIyNTXdsWMHO07WWhHNz8/f9xRZgGGY33//3cTEZMSIEevXr9+yZQstUeyINzMzk9xBDh48mAaEDQ0NYWFhpDBPnTqVFstOSbZX/Oq1VHfu3CELv/TSS1IjXh4NshxK5Qw5urFjx5IdBQUFRURExMTESBYS0tf0xo0bIyIiWlpa1FVJ6ZSamhpO082JePfs2RMRETFz5kypEa9GmyPe5a2xsXHUqFFk+5MnT05MTCwuLs7Ozg4LC7OwsPjyyy95RLw8sl2yBJ44ccLIyGjq1Knh4eERERHvvvuuoeH/e+swKipKo0fRPS+UKmaRfMreZqiYGMmIV5VqDqAWiHh7EXJJMDQ0NDU1TU9PZ88SiUSzZs0iLdHKlSs5K27bto3M+uijjzizampq+vfvT37DrqysVDAlbW1t5MfORYsWSc4lw7hxbrB4p4FerpydnV1dXdkLCIVC+kbNiRMnOCsGBwdLvelRnCJb2L59O1lm6dKlnFktLS2jR48mPw9fvnxZ8f2SIeDJoAtyFmPnjIuLy8OHD+ms5uZm9nVOo4WBPJ985plnGIYRCAScX747OjreeOMN+kKg1Ig3MTFRcpsBAQEMw5iZmbHjK6WyiOTP+PHj29vbObMyMjLIe8Jr1qxRb13jt9MtW7aQDdK7Tyo/P588uONEvJo4j+QnJH19fcknPGSYLkLyF5zHjx8bGhq+8cYbXV5ESYliGGbIkCErV64UiUR01j/+8Q92xFtXV0d+ZTA3Ny8qKuJs54cffiDb+frrrzvLNumHzI54larX8tEDZEe8PBpkOfjlzIkTJ8j01157TepmHz9+bGxs7OHhod5KKjVGkt90f/3113IiXg01R7zL2yeffEI33tHRwZ6Vnp5uampK4hYeES+/bKclcPDgwVu3bmXP+u2338gszlnW0FF02wslvyySQ5XbDH6JkfVaVnx8PI9qDqAWiHh7EfoSi9R7l+LiYvK9hIGBwYMHD+j0uro6CwsL8pMk/Z1S6t32l19+qWBK8vLyyCrffvut5Nz09HROIlVJA71cMQxz/vx5ztxdu3aRWatWrdJ+xEuPy8jISOrbdxcuXCBb8PT01NyFnGGY06dPc+bu3LlTMmc0URjoLTXDMMuXL5ecS744knr5fO+998aOHSt1m5cvXyar/PLLL/yyKC8vz8nJifNqLvXqq6+SWxbO7ZcqdY33TufNm0cCbHaERpFHUuyIV0PnkUYCnNNE00BMmzaNM/c///kPwzC//fZblxdRens3YsQIzt389evX3dzc6EOJr776iiwp9c6+tbWVPI4zMzNT6sW8Lol4lW2Q5eOXM+3t7fQD73v37kmuuHnzZoZhOM/fVK+kaox4Ndoc8cvV0tJS0tQYGhrev39fcsWVK1eSzSoVK6qS7bQETpgwQXLus88+S+bW19dr+ii67YWSRxbJoeJtBr/EyIp429vbHR0dla3mAGqBvpp7o7feektyopOTExm1QiQSRUdH0+nR0dENDQ0Mw0yZMkWylw6GYWbPnk3+2LNnj4IJoF0RnDx5kt0RCOHu7p6ZmblmzRr1psHOzk5yiMuXX36Z/MHppEE76HFNnDhRar8jkyZNIi+JZWRkpKWlaSgZ/fr1o9+Gyc8ZTRSG9vZ2Wt7efvttyQXs7OzILZSknTt3ysoW+r4Z73wbPnx4cXHxm2++KWf7VVVVRUVF6qprvHdKKlR7e3tiYqLkWpGRkZmZmeSmR3PnkWGYN954g/wRFxfHnl5XV3f27Nm5c+eSQn7hwoWamhr2AnFxcSYmJuyouMuL6LvvvsvpMWXUqFGZmZnkhIrF4h07dpDpUk+WQCCYNm0a6Srm0KFDTPembIMsB++cMTAweP/998nf9HaZvdmIiAhLS0v6hrAaK6m6aK454p2r0dHR5IS+8sorNNJgk9rkdkot2S5117RLP/a6GjoKZWm/FVI8i7Rwm6GWxChSzS0sLDjVHEAtEPH2Onp6erL61qP9E9IfpMlzUfIH/bSJw8XFhbx0WlZWpmCr5+LiQl6iu3bt2uTJk//880/2XAMDAzc3N3ZvxmpJg5ubm2TviA4ODuSP+vp6RuvocdEvlDj09fXph4X0h1i1c3d3l8wZ8toVJ2c0URhu3brV2NgoPx9oJshRV1dXVFR05//Q3+8l+4fkob29vays7O7du3T7NM1ytq9sXeO9U3o65s+f//333z9+/Jg999lnn3Vzc2N316yJ80ieiz7//PMMw1y8eLGqqopOT0hIaGtrCwoKIh3PtLe301dYGYapqak5f/68n58fefu6mxRR8qafLDk5OaQndiMjI/plBMeLL75I/khOTma6N2UbZA3lzLJly8i7qXv37mV3W01av/z8/HfeeUdOIeFXSTVEvc0R71ylf8vqfFjqZVEpvLNd6oFIvSJr4SgUof1WSPEs0sJthloSQ6o5+YlNVjVftGiRnGoOwBtGJ+p1LC0tpQ6TQD5dI3/cuXOHTqQvvOXk5Pz73/+WuqKRkRFpuXJycsi3RvIZGBhs3bqV/GSYnJw8adIkJyenuXPnBgQESO0oXy1pkOwHmLx0RP6QfLKhBX/99Rf5Q874CrQH19zcXA0lQ/Gc0URhuHv3LvnD3t5e1hgPcgbeyMnJ2bJlS2JiIh1qgoNzTVVKW1vb7t279+/fn5GR0draquz2la1rvHe6YsWK3bt35+TkNDU1ffnll//85z+nTJkSEBAwZ84cekPGponzSLzxxhsbN27s6OiIj49/9913ycRDhw6ZmJjMmDHDxsaG/K4fFxdHXxyNj49vb28nL2Z3nyIqf6wXuhczMzP6wR4HGaKM7IXp3pRtkDWUMw4ODv7+/keOHKmuro6Li1u4cCGdRTrWop8/qLGSqpeGmiPeuUpbV1nl3NjY2MLCgscPvqpnu+KVWnNHoRTtt0JquWlR122Guu6g+vfv7+/vf/ToUVnV/IMPPlBwUwBKQcTb68i6BWcYhvQeRJ660InV1dXkj4NPyd84+8GOfG+99VafPn1WrVpF7vhLSkrCn7Kzs1u6dOlnn33Wt29f9aZBcvBJ8usm03XocdGcl0RfRuU8uFMjxXNGE4Whtra200ygl1WO7du3h4SEiEQiAwOD6dOne3h4WFpakp/hm5qavv32W0YFFRUV06ZNI+NzDho0yM/Pz9HRkX5RfOLEidTUVPXWNd47NTY2Tk5OXrt27Z49e9qfOv3UBx98MHny5DVr1pA3HjVdqclD5o0bN5KYlkS8ZDjKmTNnmpub+/j42NraVlVVnT17tq6ujgx0cejQIWNjY9qbVzcponLOHXsvtbW1pEcrfnvpPpRqkDWXMx9++OGRI0fIvS+9FX748OGJEydeeeUV2ru+GiupGmmuOeKdqwq2rsrGimrJdsUrtYaOQlnab4XUctOirtsMNd5BffDBB0ePHpVazSdMmEDfVgBQL0S88P+jv9LRSxf7702bNsn50I6g3RgoYubMmTNmzEhKSjpw4MCRI0dIU1tZWRkWFrZ79+6TJ0/Sjuw1l4auRTv3l/P7qNST0lU0cSIUyQSpkpKSPv74Y4ZhrKys/vjjD86bz3V1dSpGvEFBQeSWbtmyZTt27KDpJMrKylS5mZZ1Wnnv1MrKKjIycuPGjb/99tvBgwdTUlLIZ1F/PBUcHLxnzx56d6K5CjVy5MihQ4feu3ePfKxrbW2dkJDQ2to6f/588ixx7ty5u3btamtrS0hIWLhwYW1tLXmlmf2ZsSq001bQvTg6Op48eVL+wko9I+1CijfImssZX1/fYcOG3b1798qVK1lZWaQj3F27dolEIjq8itYqqSwdHR1abo545yrv1lU+LWe7ho5Cc7rVHUs3vM149dVXn3vuufz8fMlqjge8oDmIeHudpqYmWbPq6urIH+yf821tbR8+fEj+kPVRIm96eno+T23fvv3ChQs7d+4kv/xVVVUFBAQUFBSYmZlpOg1diB4XzXlJdJbUd4q0TBMnghY2OZnw5MkTyYm0u8u1a9cq8qGvUrKysi5evMgwTJ8+fbZu3cq5pdNQXVN9p/369fv4qdLS0piYmF9++aW0tJSMl+jm5kbHVtVohZo3b973339PPtYNDg4mj3Dpbd+8efNIB+nkfbb4+Pi2tjYSD6uFdtoKWhnb29t1qUVSsEHWaM588MEHpKDueEokEu3cubNfv37kI3C1V1L5pAYJzc3NWm6OeOdq3759yfvVyraucmgh27VwFBrVre5YuuFthp6e3ooVK1avXs2p5jY2NrT7QwC1Q89VvU5jY6Osl3/o1zJ0iDl2V4SFhYWaS5WhoeG0adOOHDmSkpJCXmEtLy8/e/asNtOgffS48vPzZS1De4CU35WOdmjiRNDCVlNTQ9+/4njw4IGc79ZIv8cc/zv2mgroxl9++WWpXxcrsn1l65padko4OjquXbs2Pz+ffh+7b98+OlejFYru8dChQ42NjadPn54+fTp9hDt58mQS5J85c6ahoeHQoUMCgYD2XKo67bQVdC8VFRVyftfoueQ3yBrNmeDgYLJH0sdsQkLCw4cPly5dKvlSpRrrCweN4qQegvabI965SpuXe/fuSV2gvr5e2VhRc9muzaPQqG51x9I9bzMWL15MajS7mi9ZskT+5yQAqkDE2xtdvXpV6nTaRSd7MBj6cIa8JylVUlKSg4ODs7Oz1B+/JeXm5gYEBCQkJEjOGj9+/LJly8jftPMPTaRBcapfv2VtYcaMGfI77BUKhWQwTDKKqbr2y5smTsTQoUPpgBNJSUlSl5E6ZALtFkXqi1hyfs9WJIvkb1zx7StV13jvdP369VKHQTI2NqaDmrC70tFohXJ3d3dxcWEY5ty5c9HR0S0tLexeqQwNDQMCAsjBxsTEnDt3burUqZaWloyaaKetGDhwIPmmVCwWyxnPY/bs2Q4ODv/6178YtVJ7vVa2QdZozlhbW5NhbxobG2NiYn799Vc9Pb3ly5drrpJKsrKyIn+QVyQ4rly5ouXmiHeu0uaF0/92pw2UHJrLdlk0cRQ97kLJm6ZvM/ixsbEh1wVazRmGkVrNAdQFEW9vRN4q5EhNTSV9PFpaWrLH2QsICCD9yqakpEj2K0vs2LGjoqLCy8tLVl+7HFVVVfHx8cePH5c6l97+0vEwNJGGTtH399ra2ujEWbNmubu7X7t2TS1bmDt3Luk+MSMjIysrS3ILcXFx5HIYEBDw3HPPqZLyU6dOubu7L1myhFGBhk4Evc5FRkZKzs3NzZV6i0m7O6ZXa7ZLly6pkkV045mZmZJvNnZ0dCg45IxSdY33Ti9fvhwbGyv17tzc3Jx818ceXUbTFYq8mdbW1rZu3TojIyPOI1z6DvO6devU+0qzNtsK8koewzC7d++WusCdO3dOnjxZWVkpv1MuxWmuXivbIGs6Z+gnu6GhoefOnZs+fbrUzmzVVUklDR8+XFaQkJiYKHU4GY02R7xz9c033ySnLysrS+pla+fOnYySNJftsmjiKHrihZIfDd1mqI5TzV977TVt7h16IzH0Gvb29qSVt7S0jIqKYs+qrKx0dXUlRWLHjh2cFZOSkkifN+PGjWtqauLM/e9//0t6Srx9+7aCKSGXf1NT07/++oszq6mpifTUZ2Vl1dDQoHoaMjMzyXEFBwdLpoR2Aunj48OZtXnzZjLr2LFjZEp9fT15D6e0tFSRw1RkCxcvXqTHJRQK2as/fPiQ3GL27dv3/v37YoV1dHSQXhlfeuklOvHzzz9nGObdd99VMWfUXhjEYnFjYyMdOIFT/Gpqajw8POigfxEREXQWHfXB0dHx4cOH7LUePnxInxtLnllFskgoFJL6wjDMxo0bOauT7oiJS5cuqauu8d6pj48PwzBLliyRTEl0dDRZZdOmTZo+jxT7pn/WrFmcua2trdbW1mSuoaFhTU2NrO1ov4j6+/uTbRYXF8s/xo6OjqlTp5KFjx49ypnb2NhIXsWUelLkkHPICtZr+aQeII8GWdM5w/4U9sSJE1KXUUsltbe3l5z1999/kxXNzc1v3LhBp9+8edPe3p6+t3z8+HHtNEeq5Cp5ekbC+KqqKvasqKgoS0tLEvhJzQdNZLv8KhYSEiJ1XbUfRXe+UPLLIjlUuc3glxgyCh3nki2J3S2zZKkGUC9EvLovKioq+CnycZS9vT1pbWfPnh0ZGRkbG7t+/Xp6AVu6dGlHR4fkRg4ePEhCteHDh0dHRxcWFpaWll66dOmdd97R09MTCARxcXGKJ4n+4G1vb79t27bc3NzKyso7d+7ExcWRz0gMDQ1plMg7DT/99FNwcDB9vuTi4kLygVx+jh8/HhwcHBQURFNC5tIr0J07d8jAEt7e3nl5efn5+aQb/cmTJyt4mApuITo6mrwe5unpGR8fX1paWlRUtHfvXtKFo62t7dWrV8VKIkNrki6LSktLExISSIzx559/qp4z6i0MRGZmJo2CZs2atXPnztjY2A0bNvTv33/kyJG0VxgvLy+SmLq6upaWlnHjxpHpVlZW33///dmzZ1NSUjZv3mxvb+/n5ycr/YpkkVgsjo+PJ6ePYRg/P78DBw5cuXLl+PHjgYGBFhYWEyZMILOmTZsWHBwcFhamlrrGY6c04iXf0J47d660tPThw4fXrl1bu3Yt+SzK29ubc6OjofNI0Z8w9u/fLzl38eLF9Bilrq7lIlpQUEC2MHDgQLLNwMBAMuXy5cuyjrGmpmbixImkd9yPP/44LS2trKwsKytr165dZHxLb2/vxsZGBXNs1apVUg85Oztb8UIry+XLl6Ue4Hfffce7QZZD9ZyhT+0GDhzY3t4uazHVK6mJiQn574EDB9hbpk/5DAwMfHx8goKCJkyYQN6v/vrrr8msyZMnBwcHL1u2TCwWa7o54p2rHR0dS5cuJRt3cHDYsGFDbGxsZGTknDlzGIaJiYkhLRLNB84vdOrKdllVjGY7mUufrnOaOE0cRXe7UKqYRfIpe5vBLzFff/01me7l5cW5ZEuG/WKxePv27WSx/v37t7W1KXIgALwh4tV9nE8jyI+gR44c6d+/P3u6paXlzz//LBKJZG0nMzNz2rRp9DpHTZo0KT09XakkNTU1/ec//5k0aZLUbh4nTpwoK8ZTKg2yvkipra0Vi8X0roWD/VPltm3bON2luLm5/f3334ofqYJbuHnz5muvvcZJiUAgWLRokVJPd6mysjJPT0/O1jZv3qyunFFjYaDu3r07efJk9tb09fXnz59fW1tLfzCmysvLxWJxQ0PD8uXLOZ+TmZubb9q0SXKQQ86P0PKziDh37tywYcM425kwYUJWVhb9bZv9A79a6pqyOxWLxbdu3frwww+ljnLRt2/fDRs2NDc3S92XJs4jQV7CFAgEUh/hnjp1iuxoz549UlfXchGV823kvn375BxmS0vL5s2bJTs4tbGx+eabbyR/ZZCDBC2STp8+rVShlYrdbxnb2LFjVWmQNZczjY2NpLczyaeIHCpWUiokJIS9WaFQuGTJEnb5MTY2XrduXUdHB6f4GRsbk1U03RzxzlWRSBQeHs75Wn7AgAHkVwz6GxyxfPly+RnOL9tlVTGa7VLnsh+cauIoutWFUvUskk+p2wx+iaE/+sjKNI76+npzc3OGYb766isFjwKANz21f7IPPYVIJEpNTS0uLhYKhU5OTj4+Por0kvfo0aO0tDQSb9jb248aNUqV0eSePHmSnZ2dn59fX18vEAgcHBw8PT073aB60yBfVVVVcnJyeXm5kZHRCy+84OXlJXn1UtcWKisryXEJBIIBAwZMmDBBzpDxnRKLxdevX8/NzW1ubrazs5s4caKdnR2jVpo4Effu3btx40Ztba2Dg8OYMWMU+XSwuro6NTX1wYMHAoFg0KBB3t7e5OmNWrKI3LVkZ2c3Njb27dt39OjRpFsmjdY13jstLCwkD+iEQqGlpaWrq6uHh0enQyxqs0JpmXYOraOjIz09PT8/v6amxsLCwtXV1dPTU0MjW2q0XvNrkLs8Z9RSSaUqLS1NTU19/Phx//79x40bxwmrtN8cqZKrLS0tf/75Z0lJiYmJyeDBg8ePH08H6O5u2a7lo+iJF0re1HuboToPD4+srKySkhL65j+AhiDiBQAAAAAA7cnNzX3xxRfnzJkTHx/f1WkB3Ye+mgEAAAAAQHvI5/q002YAjcIzXgAAAAAA0JT4p3bv3k1eRK+rqxs0aJCNjU1BQYGyH4sB8IBnvAAAAAAAoCmZmZl79+49d+4c+e/nn39eX1+/evVqhLugHVI6ZgQAAAAAAFCjOXPmeHt7l5eX5+XleXl5vf/++12dIugt8IwXAAAAAAA0xdvbe/bs2YMGDcrOzjYwMPj888/PnDkjdUQ0AE3Ad7wAAAAAAACgm/CMFwAAAAAAAHQTIl4AAAAAAADQTYh4AQAAAAAAQDch4gUAAAAAAADdhIgXAAAAAAAAdBO6BYf/Z8GCBeXl5fS/fn5+a9eu7dIU6YgtW7bEx8fT//bt2/fo0aNdmiIAPrZv3x4XF9cNS/KZM2dCQ0PZU3777Td7e/uuSxFAD7tM3Lx589ChQ7m5uc3Nzf369XN2dp4yZYq3t7eRkRHvbeKmomt12xYboEsg4oX/p/Sp1tbWsrIyhmGcnZ27OkU6oqqqqri4mGGY+/fvd3R04EYceqjq6mq1l+R79+4tWrSI9+pJSUlGRkaNjY0kYZWVlc3NzQzDCIVCxTdSV1c3e/bsW7dubd68+b333uOdmO6wF+ihuvYyERISsnXrVoZh7OzsnJycMjMzq6qqQkNDw8PDQ0JCeG8WNxXdvMVGowS9ixh6B6FQeOmpnJwcOYtlZmaSghEcHKzF1PUK5Hpjb28vOev27dvk7DQ2NnZF0oBnfemd5JRkZdEGhx+hUMjemr+/P5leXFyseBoiIiLIWn369FH9iLp2L9DTqbFyKWjHjh2kZIaGhpIpra2t77zzDsMw4eHhclbETUVPL1RolKBXwXe8vUV5efmkp7788suuTgtwhYaGkrOTn5/f1WmB/4X6ok2zZs0SSli4cCGZ+91330nOHTp0qLr2/sILL5A/hg8frq5tdtVeAJT1008/MQwzaNCgdevWkSkCgeCf//xnpyuikezp0ChBr4K3mgEAoCsZGBgYGxtLTiR/CAQCybn6+mr7ufaVV15JTk7Ozs5esGCBurbZVXsBUMqjR4/Iz6xubm7s6UOGDCkvL7ewsOi6pIHGoVGCXgURLwAA9GreT+nGXgAUV1lZSf7o06cPZxa6nOgN0ChB74GIFwAAuoaNjc3y5cvd3d2VXfHNN9+sqKigz4EBgIf29nbyB6oSAOg2RLy6r6ioqLKyknSWSLrvu3r1Kp2rp6c3ZswYOatfuXLl5MmT9+/ft7CwGDt27Lx580xNTWUt3NDQcObMmbS0tMrKSlNT04EDB/r6+o4bN05PT0+pNGdmZra0tND/9uvXb8iQIQzD5OXlHT16tLi4WCQSOTg4jB49+vXXX1c9DfX19QkJCTdu3KiqqtLX1+/fv7+7u7uvr2+/fv3oMkKh8NatW+y1Ro4caWZmRv+bnp4uEonof4cNG2ZtbS3/MNva2jIyMsirZWRKVlYWu5vZgQMHDhgwgL1Kenr6hQsX8vPzm5qaLC0tXV1dvby8xowZw+Mlz7y8vOTk5Ly8vOrqaoFAYG9v7+XlNX36dMk3SFU8I+S4Tp8+XVhY2NTUZGNj4+HhMX36dDs7u25YKhSpL7wLQ1VVVUFBAXtFDw8PIyMjoVB4+PDhmzdvVlZWWlhYuLq6+vv7Ozs7yzpkpWol7/zPyMiIj4//+++/TUxMhgwZMm/ePLX3turo6Eh7T1HKN9980+ky9fX1MTEx2dnZTU1NgwcPDggI4Ly6Ket0cLajYqVTcC+KtEIKamxsvHTp0s2bN0tKSoRCoaWl5fDhw6dOnerq6qrsprRQ8UmN46xobGxMfwcRi8XXrl3jLDBq1ChOkKZgIVe2DvI+QWo8C4pramo6f/58SkpKRUWFQCAYMGCAr6+vt7e3ZEBLzuzdu3fJfx89esRu6Nzc3ExMTHTmpoJTxgQCgaenJ5l++PDhwsJCoVA4aNAgf39/Mr0Lr5iqFBvFW2wFGyU528zIyGhra6OL2dnZWVhYSN1mbW1tVFRUTk6Oqanpiy+++Pbbb5ubm9NlCgoKDh48mJ+fb2JiMmbMmDfffJN9JQVQp67uOgs0bvny5XIKgLGxsaxuFYVCYWBgIGd5R0fH7OxsqTvaunWrlZUV+bXYycnJxsaGrOLm5paWlqZUmp2cnNg7DQ4Obm1tXbp0KScxkh0M8kjDL7/8QtpffX39AQMG0DskPT09Hx+fixcvksVu377N2XtmZiZ7O5y3wo4fP95pf4nssQqlCgsLowuXlJRMnDiRTLewsHBycqLXp379+oWEhLS2tiqYvVFRUS4uLmRdQ0NDJycnetS2trbR0dFqPCMFBQVTp04lc62trZ2cnAQCAcMwRkZGn332meJp1lqpUKS+8C4M+/bt46xYXFycmpoq+QIh6SVV8pCVrZX88r+6ulpqALN27VqRSKSd7mSDg4Mla4F87L6az58/L/miZkhICHt5qaeDvYBaKl2ne1G8FepUZWVlYGAgOcVkBE5nZ2ea5jlz5lRUVIiVoYWKL7XGOTk50QWkjjVVW1vLY1886iCPE6TKWVClckVGRtra2pJEOjo60iNydXU9e/as/DPLcfv2bV26qeAk2N7evr29ffXq1ZKJf/3112tqarrkiqlKsVG2xVakUVJkm9Ty5culbvP8+fOWlpbsiTY2NklJSWQX3377Lee3GEdHx7y8PMXPLIDiEPHqvqSkpIiIiE2bNpEG5aWXXopg2bVrl6yLU1BQkJWV1SeffLJ169avvvpq2LBhZNbQoUMl7/PoYG6ffvppdXU1mZienu7h4cEwjImJyZkzZxRP8+HDh/ft2/ftt9/SxAQHBxsZGS1atOjnn3/+5ptvBg0aJHmbxSMNv/76K7lr+emnn+jIQI8ePfr00085t8g1NTUkx7y8vKQGOXv27ImIiJg5c6biEW9TUxNnm1988QX77Ny8eZMs2dDQMHjwYIZhRo8enZGRQSaKRKIzZ87QTmvZt4CKBAbW1tYxMTFtbW1kYkFBQVBQENlUZGSkWs5IZmYmuQMbPHgwvSlsaGgICwsjv9BPnTqVJqCblApF6gvvwpCfn7/vKbJ3hmF+//13ExOTESNGrF+/fsuWLfQUkLvtmJiYiIiIL774gl0rbW1tP/vss507d4aGho4YMUJOreSX/42NjaNGjSKbnTx5cmJiYnFxcXZ2dlhYmIWFxZdfftn9I94TJ04YGRlNnDgxLCwsPDx84cKF9L4qKiqKLn/nzh1yHl966SV6i0bnqqvSyd+LUq1Qp2gDHhgYWFhYSCa2tLTExsaSR5Gurq51dXUKbk07FZ/UuLFjx5JdBAUFRURExMTE0K21t7eTDCRdy27cuDEiIqKlpYXHvnjUQR4nSJWzwLtyffjhh2SnK1asKC8vJxNv3749ZcoUEgPv3r2bvTynbfHy8mI3dJJRX4++qSAJjoiIIH1x2dvbf/755xYWFqGhodnZ2cXFxYmJiT4+PmR3o0aN4gwTqJ0rJu9iw6PF7rRRUnCbFhYWZDtJSUmSNSshIcHY2Hj69OmbN2/+17/+5evrS6ZbWFg8ePAgPDzcwMBg4cKF4eHhGzdufPHFF8nc4cOHK35XAKA4RLy9BRmInGEYf39/OYvRNtfZ2dnFxeXhw4d0VnNzM20cT5w4wV5r27ZtZPpHH33E2WBNTU3//v3JT6GVlZVKpZkmZvDgwfb29rm5uXTWgwcPzMzM2FcLHmloa2sjvxkvWrRIcu8rVqyQeq9Jb8Q5QQ7x9ddfKx7xKrhNsVi8ZcsWsgC9EFL5+fnk4YOyEW9iYqLkrICAAIZhzMzMHj16pOIZqaurIwGDubl5UVERZ1M//PAD2dTXX3+tYLJ5pIF3yVSwvvAuDDQ2GzJkyMqVK0UiEZ31j3/8g/N8iV0rXV1d2akVCoX05U9OreSd/5988gk99o6ODvas9PR0U1NTQ0PDbh7xDh48+Mcff2TPOnDgAJnl4eEhZ0X2bZ96K52svfBrhWQhRWX8+PHt7e2cWRkZGeQ17DVr1iieZq1V/BMnTpDpr732mtQ0PH782NjYmHP6VGlkFKyDPE6QKmeBX8S7fft2cixLly7lzGppaRk9ejR5THr58mU1DpbbE28qSPYaGhqampqmp6ezZ4lEolmzZpGdrly5UvtXTN7FRpUWW9YY5mrZ5uDBg3/99Vf2rCVLlpBZ7777rrW1NfvliJaWFhpjnzp1SnKzACpCxNtbKHtxYhjm9OnTnLk7d+4ks1atWkUn1tXVkd9NTUxM6A+xbPTG8csvv1QqzezE/Pbbb5y5S5cu9fb2ViUNeXl5ZOK3334ruUp6enr3iXjnzZtHrtPs2zKKPEtU/Ob7vffeGzt2rNRZly9fJin55ZdfVDkjYrH4q6++IktKvUi3traSJzNmZmZKhQ2aLhVajnhHjBjBub+5fv26m5sb+xkX+5DPnz/P2dSuXbskayXv/C8tLSWPQw0NDe/fvy+54sqVK8lmu3PE6+XlJTmXfhJfX1+vyG2feiudrL3wa4VkycvLc3JyOnjwoNS5r776KokTOLewndJCxW9vbx84cCBZ8d69e5Irbt68mWEYzvNDVRoZBesgjxOkylngEfHShs7IyEjqi68XLlwgh+Dp6dmFEW93uKmg7+JKrVPFxcWk9TMwMHjw4IGWr5j8io2KLbbURkld23zllVc4s9gfBH3yySecuTExMVKvZQBqgYi3t1D24tSvXz/J6/GNGzfI3ICAAMlfl2fNmiV1m2S4P4Zh+vfvr1SaaWKsra3lv+XCLw137twhE8eMGSP5q2p7e3tmZib7steFES8dLu/kyZOSc0tLSzMzM6XelyuLdu+xcOFCVc5IR0cH7dDlxo0bUpd5++23yQI7d+7sPqVCyxHvzz//LFb4kO3s7CRrJen8jFMreed/WFgYmTh58mSpa9EuarpzxLt9+3bJufQBzq1btxS57VN7pZO6F36tED8ffPAB2VdBQYFSK2qn4n/33Xey7nc7Ojqee+45S0tL9uumKjYyCtZBtZ8g+WeBR8RLG7opU6ZIXUAkEtGMunLlSldFvN3hpoJGvFevXpW6AH23+YcfftDmFZN3sVGxxZbaKKlrmzt27ODM6ujooL2UcYqiWCz+66+/FClRAPwo3b8r9BLu7u6SfSGSV4nIQxI68fz58+QP+k0jh4uLC+nMsKysrKioiEdiPDw8yCs0svBLg4uLC3ld7dq1a5MnT/7zzz/ZqxgYGLi5uXG6Su4q9Ljmz5///fffP378mD332WefdXNz49FdM8MwdXV1RUVFd/4PvYmR7D1VqTOSk5NDOqA2MjKSNfYM/W4nOTm5+5QKLSMvHCrIzc1NslY6ODhI1kre+U//ltXbqtQ0dDf0Q7JOm68uqXRsmmuF2tvby8rK7t69S2t3Y2OjIrW7qyr+smXLyMb37t3L7ueWYRjSV/Y777zD7uVVXY2M/Dqo4gnSxFmQ1dDRl0I59PX1aY2gz3t7802Fnp4ep9t2irZ79OGtdq6YvIuNJlpsdW1Tslbq6enRMSwkTwHtmayhoUGpBAMoAqMTgXTkZTAOOlwBe+QV+tJXTk7Ov//9b6lbMzIyIncwOTk55LMrpXQ6jAq/NBgYGGzdupU8BEhOTp40aZKTk9PcuXMDAgKkDufQhVasWLF79+6cnJympqYvv/zyn//855QpUwICAubMmUPvGJSSk5OzZcuWxMREOsIEB+eOk/cZMTMzo19kcdCHkzk5OYqlmmcaNFcyVafUEE08aqWy+U9HK5GVG8bGxhYWFgoGjV1F8YzSZqWTSu2tUFtb2+7du/fv35+RkdHa2sqjdndVxXdwcPD39z9y5Eh1dXVcXNzChQvpLNJ3FPloVi37Uvyg+J0gjZ4FDvpkTM7gYbTr4NzcXIbp7TcVlpaWUocUIh91kz/os33tXDF5FxtNtNjq2iaNYNlIZ9SmT3Fm0Y6pFWyiAZSCiBekkzoym9QHGtXV1eSPg0/J32xVVRWPxMi6OKmehrfeeqtPnz6rVq0il7eSkpLwp+zs7JYuXfrZZ5/17duX6QaMjY2Tk5PXrl27Z8+e9qdOP/XBBx9Mnjx5zZo106ZNU3xr27dvDwkJEYlEBgYG06dP9/DwsLS0JD/ZNjU10e4l5adHwTNSW1tLuoHpQaVCmzo9ChVrpbL5X1tbS/545plnZC1vYmLSzSNexTNKa5VODjW2QhUVFdOmTSODRQ8aNMjPz8/R0ZGOd3LixInU1FRVkqrpiv/hhx8eOXKEhLg04n348OGJEydeeeUV2jO5Wval+EEpe4I0fRY4aD7IqbPks1iGYTivKvTOmwo5Z5zmYU1NjTavmLyLjSZabHVtU+oZ73QWgIYg4gVV0RZ506ZNdDgWWZ599tnuloaZM2fOmDEjKSnpwIEDR44cITcElZWVYWFhu3fvPnnyJB02QxEdHR2MZlhZWUVGRm7cuPG33347ePBgSkoKGU/7j6eCg4P37NmjyD19UlLSxx9/TDb4xx9/cN7/rKurU+T6rfgZcXR0PHnypPyFNfQ4vctLpuYKg+byn756h1/Z1VjpOqWuVigoKIjcMS9btmzHjh2cFynLysrUG2upveL7+voOGzbs7t27V65cycrKIh357tq1SyQS0dF31LUvzZ0gLZ8FReosnUUzrTvrwqZbMqO0c8XkXWw00WLjKgA6CREvqMrW1vbhw4fkD1nfxnTzNOjp6fk8tX379gsXLuzcufPo0aPkx+OAgICCggIzMzPJtaReDJqbmxlN6tev38dPlZaWxsTE/PLLL6WlpWSUUTc3Nzo+pBy0l8u1a9dK/dxRvS+wtbe399BSoZQuKQyayP++ffuS1/bq6upkLfPkyROmN1G90mmuFWLLysq6ePEiGeRz69atSn032H0q/gcffECydMdTIpFo586d/fr1e/3119W+L02cIO2fBdrQyamzdJbUV4u7G0033U1NTZ1mFH1ur50rJu9io4kWG1cB0EnouQpU9fLLL5M/CgsLe3oaDA0Np02bduTIkZSUFPJ9UXl5+dmzZznLyLlqPnjwgNEKR0fHtWvX5ufnkzFUGIbZt2+fIivSD9u8vb0l5/5vB+5qPSMVFRVybi96esnsJoVBjflPh8e8d++e1AXq6+t77b0O70qn9lZIftV++eWXJb+RU2Pt1mjFDw4OJkcdHR3d0NCQkJDw8OHDpUuXSr4G2VWNjPwTpP2zQPOB9mAsqaCggEdXeV1F0013Y2OjrDdy6SestCXUzhWTd7HRRIuNqwDoJES8vY7aL7f0pSPyyp9USUlJDg4Ozs7OGnrqxS8Nubm5AQEBCQkJkguPHz9+2bJl5G9OTxVWVlbkD/Kch+PKlSuaODvr169/6623JKcbGxvv2LFDajplof1eSH29Tc5vukoZOHAg+ehOLBanpaXJWmz27NkODg7/+te/GA1QS8mUX180Whi6JP/JqI8Mw3D6pKXouBQ6T42VTg5+rRCPqq3G2q3Rim9tbf3mm2+SsCQmJubXX3/V09Nbvny5JvaliROk/bMwY8YM+d0LC4VCMm4wwzDq+vi8p99UyGrHaLtHW0LtXDF5FxtNtNi4CoBOQsTbW9A34tra2ujEU6dOubu7L1myRJUtBwQEkO4NU1JSON0bUjt27KioqPDy8pL646Xq+KWhqqoqPj7++PHjUpe3tLQkf3BGnhg+fLis24vExER+g9xIPTuzZs1yd3e/du0a2VdsbKzUsMrc3Jx8oqbgECa0L0p6D8R26dIlRk1Wr15N/ti9e7fUBe7cuXPy5MnKyko6UKp6qVIyFawvmigMXZv/b775Jin5WVlZpOxx7Ny5U85O4+LiPvroo99//53p+dRY6eTg1wrJr9pkoGDO3I6ODn7DgGm/4tNPdkNDQ8+dOzd9+nRZfcZqoZFR9gRp/yzMnTuX9NKckZGRlZUluUBcXBwJCwMCAp577jl17bdH31Ts2rVLcmJqairp09vS0pL87KK1KybvYqNii621bQJ0OUS8vYWtrS3pdo/9pmVKSsqtW7dU7NLDwMBg3759+vr6YrF4yZIlkj+4RkdHHzx40MTE5JtvvlFlRxpKQ2xs7O3btzkTm5ubT5w4QR7i0d87ialTp5I/9u3bR99EIheqJUuWSH3xqVMuLi7kD3p2Ghoazp07d+vWLXa3HF999ZXkukeOHCEXyPnz5yuyrwULFpA/wsLCOA+OysrK1q9fz6hJcHAwyavY2Nhjx45x5j558oQkePHixTRu7D6lQsH6oonC0LX5/8wzz4SFhZG/Fy9ezOnZdf/+/WfPnpX1QWlCQsL8+fN//fXXmTNnynrc1OOopdJ1StlWSKqJEyfa29uTt3zpSaRCQ0O18+GJ6hV/zJgx5IPJv//+m3zZq7l9qf0Eaf8sGBgY7N27l/SgtmLFCs7oNWVlZevWrSMfZ8oaw6m33VSYmZmdOXNm//797ImPHj1aunQp+fuHH36gIz9r54rJu9io0mLLooltAnQ9MfQaZERB0uFKaWlpQkICGQr8zz//FIvFP/30U3Bw8OzZs8kyLi4uwU81NTWJxeLjx48HBwcHBQWRufb29mTu7du3ycYPHjxIvrMaPnx4dHR0YWFhaWnppUuX3nnnHT09PYFAEBcXp3hSZSVm1apVctZSNg3011l7e/tt27bl5uZWVlbeuXMnLi6OfOxkaGh47NgxyR3RH7ANDAx8fHyCgoImTJhAXr37+uuvyazJkycHBwcvW7YsKiqKJJ588WViYkL+e+DAAbrBO3fukKEOvL298/Ly8vPzycgckydPJgv4+PiQzc6bN+/cuXOlpaUPHz68du3a2rVrybAH3t7eQqFQkbxtaWkZN24c2ZqVldX3339/9uzZlJSUzZs329vb+/n5ST3F/M5ITU3NxIkTSUZ9/PHHaWlpZWVlWVlZu3btIuNDent7NzY2dqtSoWB94VcYCgoKSJoHDhxIZgUGBpIply9fVvyQFayV/PK/o6OD3vk5ODhs2LAhNjY2MjJyzpw5DMPExMSQOzNakqOiosiKX3zxBb2ybN68WcxLXFwc2Sz9GcjT01NOFonFYlm5SqsYmUtjnmnTpgUHB4eFhV2+fFnqit99950aK538vfBuhaSKj48nLQnDMH5+fgcOHLhy5crx48cDAwMtLCwmTJjAyYFON9hVFZ8+RBo4cGB7e7sa96VsHeRxgnicBUUuE/JFR0eTF2I9PT3j4+NLS0uLior27t1LfjO1tbW9evUqe/lVq1ZJPbPBwcEFBQW6d1NBkLbL3t7+v//9L3njPTIyMjY2dv369WQWwzBLly7t6OjQ/hWTd+Xl0WLLb5QU36a9vb2C7XBGRgaZS35KEAgE7EonqzBkZ2cre4oBZEHE24uUlZV5enrSW1LS6NAbU1mf99TW1orFYnrvznHp0iW6/czMzGnTptEmm5o0aVJ6erpSSZWVGCcnJ/krKpWGpqam//znP5MmTZLaL+LEiRM5twiUUChcsmQJey/Gxsbr1q3r6OjgZJSxsbHUL9AYhgkJCWFvc9u2bZyuWdzc3P7++28y99atWx9++KHUYRj69u27YcOG5uZmxbO3oaFh+fLlnO+FzM3NN23aJDm2ITnFvM9IS0vL5s2bJTsItbGx+eabbxSM0rVZKhSsL/wKg5yvDfft26f4ISteK/nlv0gkCg8Pp29sEgMGDCB39vTWkFi+fDlZKy0tjVQlU1PTv/76S8zL2rVrlcoiOd9w0iomda6Pj4+sfqfGjh2rxkonfy+8WyFZzp07N2zYMM52JkyYkJWVFRISwsmBTrfWVRW/sbGRDCG7cePGThOp1L6UrYP8TpCyZ0HBy4R8N2/efO211zhbEAgEixYtun//Pmdh8nOAVGlpabp3U0Gw47QjR47079+fvVlLS8uff/5ZJBJ11RWTd+VVtsWW3ygpsk07OzsSDCvYDsv6LoBUOlmF4fTp0zzOMoBUelrovBG6D7FYfP369dzc3ObmZjs7u4kTJ5JmS40ePXqUlpZWXl5O2tlRo0ZpaAxeNabhyZMn2dnZ+fn59fX1AoHAwcHB09Oz02SXlpampqY+fvy4f//+48aN41xUeKiqqkpOTi4vLzcyMnrhhRe8vLwkr/SFhYXkIYNQKLS0tHR1dfXw8OA3xGJ1dXVqauqDBw8EAsGgQYO8vb3J4wVN6OjoSE9Pz8/Pr6mpsbCwcHV19fT01PLIkDxKpuL1Re2FoTvkf0tLy59//llSUmJiYjJ48ODx48d3OvZsXl7elStXJk2aRJ/Q6gA1Vjq1t0JSkVAhOzu7sbGxb9++o0eP7qrToc2Kr+l9KXuCuuosVFZWkoZOIBAMGDBgwoQJ5N1jDelZNxUODg4VFRX29vbl5eVkVLnU1NTi4mKhUOjk5OTj40Ne3+jCK6YqxYZHi817m88888yTJ09cXV0l3/YH6J4Q8QIAAACAjuNEvMBPbW0teX39tddeU2TgNIDuAD1XAQAAAADA/0pJSVm8eHFJSYmsueSPSZMmaTddAPwh4gUAAAAAgP+Vn58fFRVF+veStGXLFtIzxbvvvqv1pAHwJKUnBgAAAAAAHVBdXd3Q0EA+3CX/kqeXlpaW5O1ckOq7775zc3OjPU4zDNPU1LRmzZoLFy4wDBMeHt7deqwAkAPf8QIAAACAblqxYkVkZKTk9JCQkPDw8K5IUXd37NixwMBAEiCMGDFi5MiRVlZW5eXlSUlJ1dXVxsbG4eHhK1as6OpkAigBES8AAAAA6KZTp06lp6dLTvfy8pI1jBCUlpaePHny8uXLf/31V2VlZXNzc58+fZydnX19fZctW4anu9DjIOIFAAAAAAAA3YSeqwAAAAAAAEA3IeIFAAAAAAAA3YSIFwAAAAAAAHQTIl4AAAAAAADQTYh4AQAAAAAAQDch4gUAAAAAAADdZNjVCYCeZ8GCBeXl5fS/fn5+a9eu7dIUdaUnT57MnDmTPWXVqlWzZ8/uuhT1AFu2bImPj6f/7du379GjR7s0Rd0CapZUZ86cCQ0NZU/57bffMBqkfDU1NXPnzmVPQbukA9BEaA1qEICOQcQLSit9qrW1taysjGEYZ2dnphfr6OgoLi5mGKahoaG6upphmKCgIKaHq6urmz179q1btzZv3vzee++pfftVVVUk0+7fv9/R0YHohUDNkqqxsZGUlsrKyubmZoZhhEJhVyequxOJRF3YLu3fvz8kJOT5558/depU3759mW7v/Pnz69evl5xuZGSUlJTEmfjkyZMpU6aIxeJp06Z98803nLmtra0TJ07kTHznnXc+/PBD1TMHTYTWoAYB6Bi81QxKu3z5cnFxcWJiYlcnpFuwsLAofur7779X75ZbWlr+fCo3N5fRroMHDyYnJ9fX13/22Wea2P6mTZtIpvXr108T2++FNUv10tKF5e3OnTtk10+ePJGcGxgYSErL1KlTtZywnsvW1lYT7ZKChWTNmjW1tbVpaWn//e9/mZ6gtbW1trb28ePHV/9PZWVl7VOSC1+8eDEtLe3q1au7d++WujWyYmFh4dWrVx88eFBbW8v+jUZO5nSavbj4ag1qEICOwTNegG6qvLx80qRJDMP4+/sfP35cm7t+4YUXyB/Dhw/X5n6hC0tLF5a30NDQqKgohmEyMzPd3Ny0uWvQRCEZMWJERUVFD2pAZjwlFov79+9PUh4eHj5nzhypC9OA8+HDhzk5OS+++CJ7rpGR0e3btxmGWbFiRWRk5LVr1/r3769g5nRhHQTt0NUaBND94RkvAHC98sorycnJv/766++//97VaQGAHub48eMREREXLlzoWY/l9fT0pk2bRv6W8xz1zJkz9G85i50+fdrNzY0T7vbczAFtQiEBUDs84wUAKbyf6upUAEDPY2FhsXz5cqYH8vPz279/v5xQtuApGxubx48fk8Wkfvpx9+7dkpKSBQsW6FLmgNagkACoHZ7xAgAAADCvvfaanp4ewzAlJSV37tyRXOD06dMMw9AOqy5fvtzY2ChrMT8/P6anqaurO3HiRERERGxsbEFBAZnY1tbW8lRXpw4AgCc849V9V69elZz43HPP2djY0P+WlpY+ePBgwIABAwcOpBPFYvG1a9fYa5mYmMj5yu7KlSsnT568f/++hYXF2LFj582bZ2pqKmvhhoaGM2fOpKWlVVZWmpqaDhw40NfXd9y4ceRug62qqopedwkPDw8jIyOhUHj48OGbN29WVlZaWFi4urr6+/tL9l2ZlZV1+vTpwsLCpqYmGxsbDw+P6dOn29nZMXw1NDQcO3bs+vXrdXV1Dg4O48ePnzlzpkAgkL9WY2PjpUuXbt68WVJSIhQKLS0thw8fPnXqVFdXV8mFi4qKKisrSW+cDMNUV1ezT6Kent6YMWN4b1w+WbnNWSw9Pf3ChQv5+flNTU2Wlpaurq5eXl5jxozR11fpR7SioqLDhw8XFhYKhcJBgwb5+/t7enpKLpaZmcm+9+rXr9+QIUMYhsnLyzt69GhxcbFIJHJwcBg9evTrr7/OWbepqen8+fMpKSkVFRUCgWDAgAG+vr7e3t4GBgacJfPz88ljHMLa2nrYsGH0v+Xl5SUlJfS/ZmZmI0eOVLy0VFZWFhUVsZf09PSUVYrk1yxlS4skflu4fft2YmJifn5+fX29jY3Niy++OGPGjAEDBjAKa2try8jIYBjm0aNHZEpWVha7j5+BAwfK2WB9fX1MTEx2dnZTU9PgwYMDAgLkfwOseJujoLy8vOTk5Ly8vOrqaoFAYG9v7+XlNX36dGNjY8VrluJHoZZqTvOcw8XFxdbWlvx9//79hw8fsuc6ODh0dHQoUkhk1U055aeurs7c3NzJycnd3X3SpElmZmZSl9dQm8NhY2MzZswYcminT5+WzNvExESBQLB48eLt27f/9ddfbW1tf/zxh+QXv4mJic8888z48ePZE+Vkjoq1WKmLrywtLS3r16/funVra2srnTh37tw9e/YsWLCAvMtdXl6uxq71e2INoieLM9HY2Njd3V3WvRMpWo8fP1ZjDWJfy8j2hw8f/sorr8g6HPXWIGX3ruVzDSCFGHSdrM542cuQn6JfffVV9kTJIUBcXV3p3MzMTDIxODhYKBQGBgZyFnZ0dMzOzpaapK1bt1pZWTEMY2Bg4OTkRGNvNze3tLQ0zsL79u3jbLm4uDg1NVXyuhseHs5esaCggH4DY21t7eTkRCIKIyOjzz77rLW1lUdmHjlyhN4XUi4uLllZWREREeS/ERER7FUqKysDAwNpMNO3b19nZ2caQ86ZM6eiooKzF/mvMxkbG6uycfmk5jZ7gZKSEjr2hoWFhZOTE91dv379QkJClMpYchLt7e3b29tXr14tebCvv/56TU0NZy0nJyf2MsHBwa2trUuXLuWs26dPH86KkZGR5PTp6+s7OjrSIuTq6nr27FnOwm+++SZ7a/7+/uy54eHh7Llubm78SgtVXl7Or2YpXlpkUXYLxcXFs2bNInMtLCycnZ1NTExIdf7ggw8aGhrEimGPLCpVWFgYe3l/f38yvbi4+Pz583369OEsHxISImtfSrU5nYqKinJxcSFbMDQ0dHJyoj+i2draRkdHK1izFDwKVao5p12Slef79u2jq0gO8RoSEqJgIZGsm5JJKioqouXnmWeecXJyMjT8fz++GxsbL1iwgHPhUG+b06mvv/6abHzatGmcWUKh0MzMzNfXVywWf/rpp2SxFStWcBZrbm42MTEJCAjgTJeTOUrVQVUuvrK0tbWxn0jr6enR8jZ27FhfX19OM6WinluDZJ0sJycnuorU4dOWLFmirhpEUkUuLnp6es8++yz7AcawYcN+/vnnjo4OzdUgpfau5XMNIAsiXt0XERHx448/ktbh2WefjXgqPz+fLlBbW0uuBPr6+o8ePaLT29vbycJOTk6mpqY7duxgx8nsi25QUJCVldUnn3yydevWr776ij4KGzp0qGRLSsd3/fTTT6urq8nE9PR0Dw8P8hj5zJkz7OXz8/P3PUUWYBjm999/NzExGTFixPr167ds2UJHyWNHvJmZmaRFHjx48MWLF8nEhoaGsLAw8khn6tSpbW1tSuVkbGwsWdfc3DwsLCwnJ4cMFPHqq6/a2Nhs2LBBasRLMyowMLCwsJBMbGlpiY2NJWPzuLq61tXVsVdJSkqKiIjYtGkTWfGll16KYNm1a5cqG5fvzp07ZC8vvfQSvdLQuQ0NDYMHD2YYZvTo0RkZGWSiSCQ6c+bM0KFDyfK1tbU8It7PP//cwsIiNDQ0Ozub5KqPjw/Z4KhRoxobG9lrHT58eN++fd9++y0tgcHBwUZGRosWLfr555+/+eabQYMGSUa8dDzMFStW0Pu227dvT5kyhRT+3bt3s5c/d+4c+yxwIl4StdKbIcmIV8HSEhQURLbT1NTEr2YpXlpkUWoLWVlZ5Kw5Ojr+/vvvIpGI3OHt3LmTPJ3z8PCoqqpS4OSLm5qayC68vLzIrr/44gv2rm/evCk14j1x4oSRkdHEiRPDwsLCw8MXLlxIH9FHRUVJ7kjZNqdTJCXW1tYxMTG0GSkoKKBtUWRkZKc1ixzF1KlTw8PDIyIi3n33XRr4cY5ClWrOuV8neb5x40Yy0cLCYseOHREREXfu3KGrpKWlRURErFmzhkQ7ERERKSkpChaSmJiYiIiIL774gpZhTnoyMzPJ/e6zzz578uRJUn7a29vPnz9POz1eu3at5tqcTqWlpZHNGhsb01pJnD9/nmGYf/3rX2Kx+OzZs5KhDkEeh0qWATmZo1Qd5H3xlSMsLIysaGdnFxcXR9a9efMm6c2Bvgehroi359YgerLGjh3LbsNjYmIk753IqAcbN24k3VCppQaxQ+7333+/rKyMTHz06NHatWvpA1uhUKihGqTU3rV/rgFkQcTbW4wYMYLc1kv+lknGBSE4N/1isfjx48eGhoZvvPEGZzq9hDg7O7u4uDx8+JDOam5uZrdT7LW2bdtGpn/00UecDdbU1JBuLW1tbSsrKyUPgd7vDhkyZOXKleRWifjHP/7Bjnjr6upIE29ubl5UVMTZzg8//EC28/XXX4sVVlJS8swzzzAMIxAIOA+FOjo63njjDfpyjtSId/z48e3t7ZxtZmRkkCvEmjVrJPdYXFwsNdZSy8Y7xX6eRidu2bKFTKQ3DVR+fr65uTm/iNfQ0NDU1DQ9PZ09SyQS0QdBK1eulFyXlsDBgwfb29vn5ubSWQ8ePDAzM2NHvNu3bycLL126lLOdlpaW0aNHk6d/ly9fVvYsSI14eZcW3jVLkdIinyJbqKurI6/YmZqasmMk4tixY2QLfn5+7N/4OxUcHExWzMzMVKRMDh48+Mcff2TPOnDgAJnl4eHBWUuVNkd+ShITEyVnBQQEkLfc2b8eyjqKrVu3smf99ttvUo9ClWou690T+gNiamqq1BXJOxf8ihk7JGNPpy2zqanp7du3ZZ0OdsSr9janUyKRqG/fvmSnp0+fZs9atWoVwzDk8alQKKRvDnOOhVyPOG/HdJo5PLJXqSZCjsbGRtJe6enpXb9+nT3ryZMnzz//PL1DUG/E26NrUHx8PJn+2muvSV3x8ePHxsbGnJSoWIPYDdqSJUskV6S3NzTmVG8NUnbv2j/XALIg4u0t6JtaknfYM2fOpNczyfe4/vOf/zAM89tvv8lqkSVvC8Ri8c6dO8msVatW0Yl1dXUWFhbkoQp90sJGm+Yvv/xSTts3YsQIznXr+vXrbm5u9EfWr776iiwp9RrW2tpKHv+amZkp3tCvWLGCbHP58uWSc8lHoVJzOC8vz8nJifMaOfXqq6+SG27JCEGRSyPvjfOLeOfNm0cCVPbPDZyCxCPilfVuUnFxMXl2Z2Bg8ODBAzklULJ8Ll261Nvbm1PwjIyMpL69duHCBbIdT09PZc+C1IiXd2nhV7O0FvHSZkTWu2S0f++EhATNRbxeXl6Sc+kXv/X19epqc2R57733xo4dK3XW5cuXyQZ/+eUX+UcxYcIEybnPPvus5FGoUs1l3a/TgrRw4ULJtYRCoY2NjaOjI6elVfF+nbbMssoPuWNmR7xqb3MUQftY5vzWNmLEiAEDBtD/0teAt2zZwl7s+eefHz58uKyNqzHiVaqJkCMmJoas8vrrr8uZq8aIVwdqUHt7u6OjI5l17949yRU3b97MMAzn+bzqvxnJv5YJhULy6i+NOdVYg3jsXfvnGkAW9NXcW7zxxhvkj7i4OPb0urq6s2fPzp07l7xpduHChZqaGvYCcXFxJiYm7KiYo1+/fpJDxr388svkD3b3A9HR0Q0NDQzDTJkyxdraWnJTs2fPJn/s2bNHzrG8++67nH6GRo0alZmZ+dZbb5FP03fs2EGmcz7FJAQCARl0samp6dChQ4wC2tvbo6Ojyd9vv/225AJ2dnbkqilp+PDhxcXFUlNCPnoh/TRw+jFSkEY3Lolke3t7u9ShOyIjIzMzM8kVUVnk3HE4OTmRCEokEtH8l2RtbS3ZQ9V//vOf5ORkTsGbOHGi1E7LJk2aRN5ty8jIoO808qZKaeFXs7RDLBb/+uuv5O/58+dLXYaGCvRRgCYsWrRIciLt5Ixd2tXV5nDs3LlTVjmhr5V2WpCklg2pR6GJav7WW2+Rqnro0CF2D21EXFzc48ePly9fLtmjG2+dtswMw0yfPr1Pnz7sXpc01+bIQUNZ0uUyUVpampubO336dMnF2Gn7+++/b9++zV5Mc9TVRPz555/kD8kuuEgdUW/3YLpRgwwMDN5//33yt2S/DCRUtrCwoO/uqgVt0Hx8fKRey4yNjf38/Njfu6qxBvHYu/bPNYAsiHh7ixEjRpB3ky5evFhVVUWnJyQktLW1BQUFkZihvb39xIkTdG5NTc358+f9/PzIqy9Subu7S3Z2Sl5OI7+90YnkIyjyiEbqplxcXMjbnmVlZXKaMPIOqiw5OTmk61cjIyPadyIH/WCMBkXy3bp1iw5BMWrUKKnL0LcE5Whvby8rK7t79+6d/0M3K9n3o7I0unHOiZs/f/7333/PuVF+9tln3dzceNwb6enpyepxkfZQSn8MluTh4UE/6ZGKFjxZ505fX5+ePvq8lzd1lRbFa5Z25OTkkIKkp6cntQ9t9t12cnJyW1ubhlIiNfc02ubIUVdXV1RURCsdfYbTaaWT2jo5ODhIHoUmqrm5ufnChQsZhmltbZXsJ2bHjh0GBgbvvvsuoz60ZdbT05NV/l966aXa2tp//vOfmm5z5CM/iZJhdWmpIF/nsrt3omHtn3/+2dTUJGsxzVFXE5GdnU3+kNrhPOmdjtGYHlqDGIZZtmwZiSf37t3LGbqJ9Iq8aNEiOfdOPNAGjba0kmJjY2tra+mHM2qsQTz23rXnGoANoxP1Im+88cbGjRs7Ojri4+PprcyhQ4dMTExmzJhhY2NDfqeMi4ujLxnGx8e3t7eTt2JkkeyNlrxDSP4QiUR0Yl5eHvkjJyfn3//+t9StGRkZkStHTk4O+eJLkvyxhehezMzMZD1oouNz5OTkMAq4e/cu+cPe3l7WqA9yUtXW1rZ79+79+/dnZGSwB35g4z3UoUY3zrFixYrdu3fn5OQ0NTV9+eWX//znP6dMmRIQEDBnzhx6m8WDpaWlrAskHZhB6tiYRKdjTf3111/kDzn3bbSHzNzcXEY1KpYWHjVLO2g22tnZ0WTIysbm5ubi4mLaM4p6ab/NkZSTk7Nly5bExEQ63IiylU6p86uJav7hhx+Sh647duz4n//5Hxo7ZWdnp6amBgYGqlKp+ZUfrbU58tnb27u7u5M3S8+cOUM+UkhMTNTX1ycd3RFDhw4dMmRIYWFhS0vLn3/+SaLcxMREU1PTV155hdE8dTURNAqSlaX9+/cvLCxk1EoHalD//v39/f2PHj1aXV0dFxdHfkIiyOswH3zwAaNWilzLNFeDeOy9S841gFSIeHuR+fPnky464+LiSMRLBqicOXOmubm5j4+Pra1tVVXV2bNn6+rqyHsphw4dMjY2ph0ISSU5WCt5aCY5sbq6mvxx8Cn5qWU/iOaQFR1x9lJbW0t6EOG3F7ba2lryB+neQypZ93AVFRXTpk27desWwzCDBg3y8/NzdHSkn3GeOHEiNTVVkTRof+OSjI2Nk5OT165du2fPnvanTj/1wQcfTJ48ec2aNfTZiLKblTWLZjjnZXsFV+cUCTmnj77WJfmGp7JUKS38apZ2KJWNJCc1FPFqv83h2L59e0hIiEgkMjAwmD59uoeHh6WlJYkYm5qaaC/i6joKDVXzF198cfz48ampqQUFBefPn3/ttdc0erOuSPnRWpvTqenTp5OINzExccWKFSKR6Pz58+PGjSNjXLEXI9n1+++/+/n5kU6nJ02apHhIrwp1NRH0IaestpTH6L69oQaRanL06FFSa2jE+/DhwxMnTkyYMIG+TdaFlUiNNYhfFdbyuQaQBRFvLzJy5MihQ4feu3ePfKxrbW2dkJDQ2tpKPskzMDCYO3furl272traEhISFi5cWFtbS15pVtdXUvQCs2nTJjkfBhO0TwLee3F0dDx58qT8hRX8So2+NMvjp8SgoCByoV22bNmOHTs479+WlZWpEpRqdONSWVlZRUZGbty48bfffjt48GBKSgr5ZumPp4KDg/fs2aPG6xDNcHpaeVDk9KllR4rvridSKhvVkpPds81JSkr6+OOPSV34448/OC/o1tXVKXgP1x2q+QcffEDW/fXXX0nE29jYGB0d/dxzz9EhWNWFd73QcptDzJgxgwzYc+HChdbW1vT09Lq6Osl3lf38/EjES774vXLlSkNDw4wZM5gehQa0sh61NTc3q3F3ulSDXn311eeeey4/P//KlStZWVmko+xdu3aJRCK1/2bEuxKpqwbx2Lv2zzWALPiBpHch7yfTj3XJI1x6I0jfXia9W8XHx7e1tcnqooYH+l6Kra2tW2ekvsSi1F7a29s73YuCP8HSwSrq6upkLfPkyRPJiVlZWRcvXiRjw27dulX+56bK0ujG5evXr9/HH398+fLl+/fvh4WF0S4ro6KiZL07Kgf9BE4SzXB6ClQpEnJOH50lq+BJvcZLvRHkXVq6OaWyUU5OapMm2hzavfPatWsV+R67O1fzefPmkeJ64sSJBw8eMAwTExPT2Nj4wQcfSH4gqiKavfw+ulNvm9OpcePGkZ96nzx5kpKSQnr9keyPavLkyeRXlfz8/IKCAlmLdXO0yaqoqJC6gKzp/OhSDdLT06M985NvBEQi0c6dO21sbGh3od2kEqleg3jsXcvnGkAORLy9C41pDx061NjYePr06enTp9NHuJMnTyZXvjNnzjQ0NBw6dEggENC+TFVHeztQ+xdBUvdSUVEhJ5RSCh3hsKamhr7Yw0HuF2V9MPzyyy9LfTGMDm/Dg0Y3riBHR8e1a9fm5+fToiXZC06nGhsbZV1B6Tex9BSoUiTy8/NlLUP7NeX0i0Zvj6SWJaknnXdp6eZoNtY8JT8bbWxsBg0axHQ1TbQ5tN7RoZg0Wuk0Ws2NjY2XLFnCMExHR8fu3bvJw15jY2PalYMmzkV1dbWcH0200+Z0ytDQkH6ym5iYePr0aVtbW8kO28zNzeknu+Rl0cGDBz/33HNMjzJixAg5HVs8efJEvX3h6lINYhhm8eLF5J1b0pVxQkLCw4cPlyxZ0unnNhq6lmmuBvHYu5bPNYAciHh7F3d3dxcXF4Zhzp07Fx0d3dLSwu6VytDQkAwI3tLSEhMTc+7cualTp1paWqpr7/RhMnmpRqqkpCQHBwdnZ2fer1ENHDiQXL/FYrGcLu9nz57t4ODwr3/9S5FtDh06lP4gmpSUJHUZqfuiL4nJesNTkTs/WVcFtWxcKevXr5c6jJCxsTEdd0RW1xTyXb16Vf6wGYoM5yMLfclQVofPQqEwPT2d/M35qIl+tldaWiq5otR34XiXFrVQ/R5C1hYGDhz4wgsvyK/CtPNzPz8/Hg8J1X4DpIk2R369U3ul03Q1p0+odu7cmZycnJWVNW/ePBsbG7WfKXb5kfUS6alTp5ydnT08POj2NdfmdIq+w3zo0KEbN25MmzZNapGmi+3bt+/mzZtq6aVZy5EAjUakfgd0+vRp9X6goWM1yMbGhtxHNTY2xsTEkLfcly9frolTTK9lcl7DnjJlirOzMw1i1ViDeOxdy+caQA5EvL0OedOmra1t3bp1RkZGnEe49B3mdevWqfeVZoZhAgICSNe7KSkpsrre3bFjR0VFhZeXlypdZaxevZr8QZ5aSLpz587JkycrKyvld8rFRi9gkZGRknNzc3OvXLkip6vhzMxMyZuGjo4OOcMjmZmZkT/Yo7ycOnXK3d2dPJZRZeP8XL58OTY2VmrsZ25uTj6KHjBgAI8t79q1S3JiamoqeeZgaWkpayhFRcydO5f0LZmRkZGVlSW5QFxcHIl2AgICOM9nzM3Nyeed9+7dI2OrUGKxePv27WosLarotLSoZQurVq0if+zdu1dyCyKR6L///S9nSd67njVrlru7+7Vr15hu1ubQekd/JWG7dOmSKgmWszsNVfPnnnuOPMx8+PAhGej4ww8/1FAxo6UiKipK6gL79u0rKSnx9PSksSWPNqe8vHzdunUbNmyQ092dIujLySUlJWKxWFYoSxcj5UGVj3hVr8X8BAYGkgeShw8fpiMVEa2trd99952cdZ88efLDU5Jj0vaSGsSuMqGhoefOnXvttddkPedX8RTTa9n169dpz8lseXl5Fy5cuH///uTJk9V+1eaxdy2fawA5EPH2OvShbl1dneQjXF9fX2trazLX0NBQ6nj0vBkYGOzbt09fX18sFi9ZskTyiUp0dPTBgwdNTEy++eYbVXYUHBw8depUMjTcsWPHOHOfPHlCIvnFixcPHz5cwW1++umnpK0/ffo059JeW1u7aNEiOjQc28SJE+3t7ckr1qQfFLbQ0FA5L1va2tqSHhHZb8CmpKTcunWLXKVU2bgqvvrqK8mJR44cITcTPH4lMTMzO3PmzP79+9kTHz16tHTpUvL3Dz/8oMqohgYGBnv37iU9c6xYsYLTO0tZWdm6devIx2xSh7Mid7RisXj16tXt7e1kYltb2yeffCK1A0nepUUVnZYWtWxh8eLFJDo6evRoQkICZwvff/89edttzZo1sobCloq8eMLedUNDw7lz527dusW7BzvNtTkLFiwgf4SFhXGejZSVla1fv55RKy1Uc9rFTklJyciRI8eNG6ehYkbLz6FDh8gnr2wJCQmHDx82MTH5/PPPVWlzZsyY8cMPP2zcuFH+uHpKPZRmGIZcUyS9+OKLNGAwMjKaNGlSF9ZifqysrMiPESKRaMaMGefOnSNPIAsLC/39/UmfT7JUVlaueyomJqbX1qDx48eTPkH+/vtv+f2cq3iKOdcyzpjnbW1t5KK5ZMkSOlCcGq/aPPau5XMNII8Yeh86ltr+/fsl5y5evJjM9fPzk7r6Tz/9FBwcTB8Ou7i4BD/V1NQkFouPHz8eHBwcFBRE5trb25O5t2/fJqsfPHiQxAnDhw+Pjo4uLCwsLS29dOnSO++8o6enJxAI4uLi2LsrKCggWxg4cCDZZmBgIJly+fJlWcdYU1MzceJE0kZ//PHHaWlpZWVlWVlZu3btIm2xt7d3Y2OjUvmWmZlJfg4gD6B27twZGxu7YcOG/v37jxw5kvbQ4OXlRZJXV1cnFovj4+Pp8wo/P78DBw5cuXLl+PHjgYGBFhYWEyZMILOmTZsWHBwcFhbG3uPbb79N5kZFRZWWliYkJJAE/Pnnn2QBVTYu1eXLl6Xm9nfffScWi318fMjEefPmnTt3rrS09OHDh9euXVu7di15RODt7S0UCjvdS1RUFNkLGcPD3t6ePBucPXt2ZGRkbGzs+vXryT0KwzBLly7t6OhQpASuWrVKzk6jo6PJi1Wenp7x8fGlpaVFRUV79+4lMZWtre3Vq1elrnj37l36RZajo2NgYODrr79ub2/fp08f+ju3tbU1ScOpU6eUKi0RERHqqlmdlpZOKbKF6upqUq4MDQ2/+OKLrKys8vLytLQ0+uXnkiVL2traxMq4c+cOKcbe3t55eXn5+flknI/JkyfLaQEOHDhAVidz6a9XkqVd2TZHvpaWFhoTWllZff/992fPnk1JSdm8ebO9vT19Esg5QaocBY9qXldXRzbo5eXFaZdIcWJra2ujI3P++uuvqhSSVatWSS3D2dnZnPIjEAi+/PLLrKyssrKyK1eu/M///I9AINDX14+OjmbvTtk2hz3Uqrm5uVg1//M//0M29fLLL8tZjP429+qrr8pZrNPM6TR7VWwi5GhubmaPIWxubk67KfLw8KBhfHl5OWdF+rrKkiVLxL21BrHf9+nfv7/8BlDFGsS+lo0aNSo+Pv7+/ft3796Ni4sbOXIkmVhfX08XVtdVm9/etX+uAWRBxNsbkZd+BQJBTU2N5NxTp06RRmTPnj1SV5c1elttba1YLP7666+lzr106RLdQmZmptRvoiZNmpSens7ZnZwvHvft2yfnMFtaWjZv3izZ/6qNjc0333yjVBNP3b17l76uQ+jr68+fP7+2tlbynS56c3Du3Llhw4Zx5k6YMCErKyskJIQ90cfHh727srIyTl8pAoFg8+bN7GV4b1wqWT1YjB07ViwW37p168MPP5T62K1v374bNmxobm5WJBs53zjZ29uLxeIjR47Q227C0tLy559/FolECpZAJycn+fu9efMmHXSUnaWLFi26f/++nBUvXLhAL73EyJEjs7KyJL/FYl905ZQW+gFVZGSkumqWIqVFPgW3IBQKf/zxR8lPPV1cXGJiYsS8bNu2jfPA3M3N7e+//5bTAoSEhJB1pc7llHal2pxONTQ0LF++nPNlmrm5+aZNmyQH9SUnSMWjULaal5eXS90gLU4cGzZsIIfAvlvlUUg4T5ao06dPd1p+Ro4c+ccff3B2x6PNod+qBAcHi1Vz7tw5sqkvv/xSzmJkdAOGYeRXN0UyR372qn7xlaOhoeG9997j1JFp06ZVVlbS/UpGvLSb36NHjyqyF12tQfX19eRFpK+++krTNUjWtczExGTlypWcn/LVddXmt/cuOdcAUumhqzToKo8ePUpLSyNXUHt7+1GjRqn4BqNUHR0d6enp+fn5NTU1FhYWrq6unp6eKo4Ueu/evRs3btTW1jo4OIwZM0aRb2DIPXd2dnZjY2Pfvn1Hjx5N3+TsdMXr16/n5uY2Nzfb2dlNnDjRzs5OXRvnrbCwMDc3t7KyUigUWlpaurq6enh4qD7+qkgkSk1NLS4uFgqFTk5OPj4+mujusrKykhQ8gUAwYMCACRMmkNfM5Gtra7ty5Qp5a/f5558fP368KqXlp59+Ij88HTx4UJVPlHmUFnVtoaOj4/r16wUFBXV1dTY2NiOeUiXxVVVVycnJ5eXlRkZGL7zwgpeXl9oHyFFvm1NdXZ2amvrgwQOBQDBo0CBvb2/yzoKGaLSanzhxwt/f//3335f65bnaixm7/NTW1lpZWbm7u7NfIValzWlrazt69KiRkZG/v7/ax+nVArVkL29lZWXnzp0rKyuzsrLy8vJyc3MjX3acOXOGRLz07Rti7Nix165dc3R0LC4uVvbVa12qQeRheFZWVklJCe25UNOnmF7L9PT0nJycvLy85HQ1qvartlJ71/K5BpCEiBcAQNv+8Y9/kGcjqampcj6bBNCON95448iRIzdv3lTqA2zoJWRFvHv27Hn33XcZhjlw4AB9m7p3ys3NffHFF+fMmRMfH9/VaQEAKXrez58AAN3f6tWr6ft+ksg4SWZmZnSEQ4CuUllZGR8fP3bsWIS7oLgjR46QLprWrVvXy8NdMriX/H7OAaBrIeIFAFC/w4cPb9iw4cmTJ5KzLl++fOPGDYZh3nvvPVm9PQNozuLFi9lPorZv397e3i6ng1kASY8ePdLT09u6dWtoaCjTy8THx5MuFcl/6+rq9u3bN3jwYFkdegNAl0PECwCgEQ0NDfPnz+cMCnr16lUyFMTQoUNVHIULgJ+oqKgff/yRDExy7969LVu2PPvss3hMB0pZsWLFgwcPPvnkE6b3yczM3Lt3L+3Y7PPPP6+vr1+9erXaux4AAHUxVNuWAADg/1hZWZWUlPz++++Ojo4+Pj6Ojo7t7e1ZWVnk6e748eMPHTrUp0+frk4m9FKpqamurq7Ozs5Xrlxpbm6Ojo7G6wagLMkOt3uVOXPmeHt7l5eX5+XleXl5vf/++12dIgCQCT1XAQCon0gkunjx4vnz52/evFlYWFhfX6+vr9+vX79Ro0YFBgbOnDmzqxMIvddHH3107dq1hw8fGhoavvDCC5999pmvr29XJwq6r8jISDL2+HfffWdhYdHVyel6Fy5c+Pe///3XX3/V1dU5ODjMmjVr3bp1cnoqBoAuh4gXAAAAAAAAdBO+4wUAAAAAAADdhIgXAAAAAAAAdBMiXgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN2E8Xh135YtW+Lj4+l/+/bte/To0S5NEXSxBQsWlJeX0//6+fmtXbuW6X6ePHnCGcVn1apVs2fP7roUAQAAAEAPg4hX91VVVRUXFzMMc//+/Y6ODnt7+65OEXSx0qdaW1vLysoYhnF2dma6pY6ODlJ0GxoaqqurGYYJCgrq6kQBAAAAQE+CiFf3bXqKYRgHB4eKioquTk6PcefOHfIgdNSoUebm5l2yBX5aWlrS0tIYhrG1tR0xYoTkApcvX2YY5tatW+7u7kw3ZmFhQSLeyMjIFStWaDOLAAAAAEA3IOIFkC40NDQqKophmMzMTDc3ty7ZAj/l5eWTJk1iGMbf3//48eNa228PgiwCAAAA6CXQcxUAAAAAAADoJkS8AAAAAAAAoJsQ8QIAAAAAAIBuwne8vVdRUdHhw4cLCwuFQuGgQYP8/f09PT3lr9LQ0HDmzJm0tLTKykpTU9OBAwf6+vqOGzdOT0+PXxrq6+sTEhJu3LhRVVWlr6/fv39/d3d3X1/ffv36qZ6GzMzMlpYW+t9+/foNGTKEYZgrV66cPHny/v37FhYWY8eOnTdvnqmpKV2sra0tIyODYZhHjx6RKVlZWUKhkC4wcODAAQMGyDkofltoamo6f/58SkpKRUWFQCAYMGCAr6+vt7e3gYEBo7CioqLKykrSAzPDMNXV1VevXqVz9fT0xowZI2d1+Tmj6cJAtnns2LHr16/X1dU5ODiMHz9+5syZAoFA/lp5eXnJycl5eXnV1dUCgcDe3t7Ly2v69OnGxsaqZ1FjY+OlS5du3rxZUlIiFAotLS2HDx8+depUV1dX3ocJAAAAANojhl6DjEtkb2/f3t6+evVqycLw+uuv19TUyFp969atVlZWDMMYGBg4OTnZ2NiQtdzc3NLS0nik55dffiE9GOvr6w8YMMDOzo5sUE9Pz8fH5+LFiyqmwcnJiX10wcHBQqEwMDCQc9SOjo7Z2dl0LfZAtVKFhYXJPy4eW4iMjLS1tSVZ4ejoSEeQcnV1PXv2rOJZunz5cjn7NTY2Zi+cmZmpVM7wPhEKOnLkCMkENhcXl6ysrIiICPLfiIgI9ipRUVEuLi5klqGhoZOTEy1Ftra20dHRqmRRZWVlYGAgjbf79u3r7OxsZGRE/jtnzpyKigp+RwoAAAAAWoOItzdGvJ9//rmFhUVoaGh2dnZxcXFiYqKPjw+5jx81alRjY6Pkuu+99x5Z4NNPP62uriYT09PTPTw8GIYxMTE5c+aMUon59ddfSXD7008/0T0+evTo008/JTsKCQlRMQ0xMTERERFffPEFjeuCgoJsbW0/++yznTt3hoaG0mFphg4d2traStZqamqKeMrLy4vM/eKLLyJYbt68Kf/QlN3Chx9+SBZbsWJFeXk5mXj79u0pU6aQGHj37t0K5mpSUlJERAQZjIphmJdeeom93127dsmKeIOCgqysrD755JOtW7d+9dVXw4YNk8wZ3idCEbGxseThsLm5eVhYWE5ODimZr776qo2NzYYNG6RGvP7+/gzDWFtbx8TEtLW1kYkFBQV02N7IyEjeWUTzJzAwsLCwkExsaWmJjY0l7yC4urrW1dUpe6QAAAAAoE2IeHtdxGtoaGhqapqens6eJRKJZs2aRe7vV65cyVlx27ZtZNZHH33EmVVTU9O/f3/ySK2yslLBlLS1tZGngosWLZKcS0Ze5US8vNNA4xZnZ2dXV1f2AkKhkA5Ie+LECc6KwcHBZFZmZqaCx8VjC9u3byfLLF26lDOrpaVl9OjR5Dnq5cuXFd8vGcOWDL0jZzF2zri4uDx8+JDOam5ufumll6TmjNoLg1gsLikpeeaZZxiGEQgEnEfEHR0db7zxBn0/WWrEm5iYKLnNgIAAhmHMzMwePXrEL4tI/owfP769vZ0zKyMjQ1//fztBWLNmjeKHCQAAAADah56rep329vb333//5ZdfZk/U19f/5ZdfyCej27dvf/jwIZ1VX19PHpOamJh89913nK1ZWVmtWbOGYZiqqqp///vfCqbh3r17jx8/Jo8QJecuW7aMM0UtaSguLt6+fTv7C2FjY+OPPvqI/P3nn38yWldfX79u3TqGYYyMjEJDQzlzjYyMwsLCGIYRiUQrV67UXDJIzpBglTAxMfn4448lc0YThYEMXNzY2EjC/rFjx7Jn6enpbd++vaOjQ+qKdnZ2Y8eOnT59uuQs8t5+U1PTb7/9xvBiZGTk5OS0cuVKyU+pPTw8Jk+ezDDMnj17/veHQwAAAADorhDx9kZvvfWW5EQnJydvb28SX0VHR9Pp0dHRDQ0NDMNMmTLF2tpacsXZs2eTP/bs2aNgAmgIcfLkSZFIxJnr7u6emZlJYic1psHOzs7X15czkUb+BQUFjNbR45o4cSL9AJVt0qRJJETPyMhIS0vTUDL69es3depURXJGE4Whvb2dlre3335bcgE7O7tXX31V6ro7d+6UlS30xWze+TZ8+PDi4uI333xTzvarqqqKior4bR8AAAAAtAARb6+jp6fn5uYmdRbtpfby5ct04vnz58kf9KtUDhcXF/LSaVlZmYJ3/y4uLuSt5mvXrk2ePJnzfNXAwMDNzY3dm7Fa0uDm5ibZjbCDgwP5o76+ntE6elyjRo2SuoC+vj75OJZhmAsXLmgoGe7u7pI5Qx/5snNGE4Xh1q1b5AGvnHygmSBHXV1dUVHRnf9D31uurKxkVNbe3l5WVnb37l26fZpmtWwfAAAAADQEoxP1OpaWllJHbWEYhgzewzDMnTt36MS8vDzyR05OjqxXVY2MjMg4QDk5OYMHD+40DQYGBlu3biUP9JKTkydNmuTk5DR37tyAgACp4/GoJQ2S/QCTt3PJH5KPmrXgr7/+In84OzvLWob2OJ2bm6uhZCieM5ooDHfv3iV/2NvbyxoMSeoDcJqSLVu2JCYm0gGHONgjVCmrra1t9+7d+/fvz8jIaG1tVfv2AQAAAEDTEPH2OrLCXYZhSO9BDMPU1NTQidXV1eSPg0/J33hVVZWCyXjrrbf69OmzatUqEl2XlJSEP2VnZ7d06dLPPvusb9++6k0DHVeGjfQ/1FXocdGcl2RhYUH+IF8+a4LiOaOJwlBbW9tpJtDwm2P79u0hISEikcjAwGD69OkeHh6WlpbkeXVTU9O3337LqKCiomLatGm3bt1iGGbQoEF+fn6Ojo50sKITJ06kpqaqsn0AAAAA0AJEvPD/o0/z6G09++9NmzbNnDlT/haeffZZxXc3c+bMGTNmJCUlHThw4MiRIySiq6ysDAsL271798mTJ2knRppLQ9cyNDTs9Amz1JPSVTRxIhTJBKmSkpJI91pWVlZ//PEH583nuro6FSPeoKAgEu4uW7Zsx44dNJ1EWVkZIl4AAACA7g8Rb6/T1NQka1ZdXR35g/181dbWlnTdbGtrK+sDYN709PR8ntq+ffuFCxd27tx59OhR8ngwICCgoKDAzMxM02noQvS4aM5LorOkvnusZZo4EbSwycmEJ0+eSE7csmUL+WPt2rWKfOirlKysrIsXLzIM06dPn61bt3LCXQAAAADoKdBzVa/T2Ngoq5cm+kUlHYuV3WdvYWGh5lJlaGg4bdq0I0eOpKSkkFdYy8vLz549q800aB89rvz8fFnL0K6Sydi8XUsTJ4IWtpqaGvrWNMeDBw8kJ2ZkZJA/SB/jHCoOGkQ3/vLLL0v9uhiDEgEAAAD0CIh4e6OrV69KnU77TGYPBkNfXk1JSZG1waSkJAcHB2dn5+bmZkUSkJubGxAQkJCQIDlr/PjxdDxe2heRJtKgONVjG1lbmDFjhmTn2GxCoTA9PZ38PW3aNHXtlzdNnIihQ4c6OjrSdaUuI3WEIdpllNT3veU8MVYki+RvXPHtAwAAAEDXQsTbG+3atUtyYmpqak5ODunMmT0GaUBAAOnDOSUlhd2HM9uOHTsqKiq8vLxk9bXLUVVVFR8ff/z4calzLS0tyR90gCJNpKFT5IVq0mEvnThr1ix3d/dr166pZQtz584lvTRnZGRkZWVJbiEuLo7EjQEBAc8995wqKT916pS7u/uSJUsYFWjoRCxfvpz8ERkZKTk3Nzf3ypUrcroWpz8KsF26dEmVLKIbz8zMlPzAuKOjIzk5Wc724+LiPvroo99//13OMgAAAACgBYh4ex0zM7MzZ87s37+fPfHRo0dLly4lf//www/m5uZ0loGBwb59+/T19cVi8ZIlSyQf3EVHRx88eNDExOSbb75RKiWxsbG3b9/mTGxubj5x4gTpjog+atZcGuRwcXHhvFLb0NBw7ty5W7duKdgnU6dbMDAw2Lt3L+kVecWKFZxxbsrKytatW0e+dN22bZviKbe1tSX9HrNfBk5JSbl165bkyE9K0dCJ+PTTT0nkf/r06YiICPas2traRYsW0WGT2RYsWED+CAsL4wxNVFZWtn79elWyaOLEifb29qTH5rCwMM7qoaGhct7rTkhImD9//q+//jpz5kxZT+8BAAAAQEvEoOuioqKCnyLfx9rb2//3v/9lGGb27NmRkZGxsbHr168nN/cMwyxdurSjo0NyIwcPHiRj2AwfPjw6OrqwsLC0tPTSpUvvvPOOnp6eQCCIi4tTPEn0+Zu9vf22bdtyc3MrKyvv3LkTFxdHvlY1NDQ8duyYimn46aefgoODZ8+eTfbl4uJC8qGpqUksFh8/fjw4ODgoKIimhMy9ffs2Wf3OnTtknBtvb++8vLz8/PyFCxcyDDN58mQFD1PBLURHR5NXZz09PePj40tLS4uKivbu3UuiYltb26tXr4qVRMY6ZhgmKiqqtLQ0ISHB2tqavLiues6otzAQmZmZJIXkMfjOnTtjY2M3bNjQv3//kSNH0k6qvLy8SGLq6upaWlrGjRtHpltZWX3//fdnz55NSUnZvHmzvb29n5+frPQrkkVisTg+Pp6cPoZh/Pz8Dhw4cOXKlePHjwcGBlpYWEyYMIHMmjZtWnBwcFhYGN3yF198QRvYzZs3K5sVAAAAAKBGiHh1H31llAYAYrH4yJEj/fv3Z0+3tLT8+eefRSKRrO1kZmZOmzaNxgDUpEmT0tPTlUpSU1PTf/7zn0mTJkntAnfixImyYjyl0iDrw9fa2lqxWPz1119LnXvp0iW6hW3btnHGqnVzc/v7778VP1IFt3Dz5s3XXnuNkxKBQLBo0aL79++LlVdWVubp6cnZGo2+VM8ZNRYG6u7du5MnT2ZvTV9ff/78+bW1tZwHv6RjM7FY3NDQsHz5cs6ntubm5ps2bZIcDZid/k6ziDh37tywYcM425kwYUJWVlZISAh7oo+PD10rLS2NFGxTU9O//vqLX24AAAAAgFroocfRXkskEqWmphYXFwuFQicnJx8fH2Nj407XevToUVpaGok37O3tR40apcr4t0+ePMnOzs7Pz6+vrxcIBA4ODp6enp1uUL1pkK+qqio5Obm8vNzIyOiFF17w8vKSDPPUtYXKykpyXAKBYMCAARMmTCBv3vIjFouvX7+em5vb3NxsZ2c3ceJEOzs7Rq00cSLu3bt348aN2tpaBweHMWPG0G+55aiurk5NTX3w4IFAIBg0aJC3tzd5nUEtWUTC++zs7MbGxr59+44ePZq+rC5HXl7elStXJk2apMjCAAAAAKA5iHgBAAAAAABAN6HnKgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN2EiBcAAAAAAAB0EyJeAAAAAAAA0E2IeAEAAAAAAEA3IeIFAAAAAAAA3YSIFwAAAAAAAHQTIl4AAAAAAADQTYh4AQAAAAAAQDch4gUAAAAAAADdhIgXAAAAAAAAdBMiXgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN2EiBcAAAAAAAB0EyJeAAAAAAAA0E2IeAEAAAAAAEA3IeIFAAAAAAAA3YSIFwAAAAAAAHQTIl4AAAAAAADQTYh4AQAAAAAAQDch4gUAAAAAAADdhIgXAAAAAAAAdBMiXgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN2EiBcAAAAAAAB0EyJeAAAAAAAA0E2IeAEAAAAAAEA3IeIFAAAAAAAA3YSIFwAAAAAAAHQTIl4AAAAAAADQTYh4AQAAAAAAQDch4gUAAAAAAADdhIgXAAAAAAAAdBMiXgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN2EiBcAAAAAAAB0EyJeAAAAAAAA0E2IeAEAAAAAAEA3IeIFAAAAAAAA3WTY1QmAHuDMmTOhoaHsKb/99pu9vT2jK548eTJz5kz2lFWrVs2ePbvrUgTdy82bNw8dOpSbm9vc3NyvXz9nZ+cpU6Z4e3sbGRl1ddJ0hM43MgBaU1NTM3fuXPYUXNFAQVu2bImPj6f/7du379GjR5nuAZcJUAUiXh137969RYsW8V49KSnJyMiosbGxuLiYYZjKysrm5maGYYRCIaNDOjo6yAE2NDRUV1czDBMUFNTViYLuIiQkZOvWrQzD2NnZOTk5ZWZmVlVVhYaGhoeHh4SEdG3a6urqZs+efevWrc2bN7/33ntMj6XzjQyo3f79+0NCQp5//vlTp0717du3l+xaESKRCFc04KeqqooUnvv373d0dHSreBKXCVCJGHRaZmamKsVDKBSyt+bv70+mFxcXi3VRREQEOcCIiAhxTyMUCi89lZOT09Vp0R07duwgRSI0NJRMaW1tfeeddxiGCQ8P7z4ltk+fPuLu7fbt26R8NjY2yllM5xsZUBd6L67GmqhgK6qJXWtCj76igeLNpiaQQm5vb6/NneIyAZqD73h7hVmzZgklLFy4kMz97rvvJOcOHTq0q1MNyikvL5/01JdfftnVadEdP/30E8MwgwYNWrduHZkiEAj++c9/Mt3DCy+8QP4YPnw4072FhoaS8pmfn9/VaQFdMGLECLUXfgVbUU3sGkBSb2s2e9vxgjbhreZewcDAwNjYWHIi+UMgEEjO1dfHryHQ2z169Ihcd93c3NjThwwZUl5ebmFhwXS1V155JTk5OTs7e8GCBV2dFgCtOn78+IEDB4YOHerr69t7dg0AADwg4gUAkK6yspL80adPH86s7vN1k/dTXZ0KAG2zsLBYvnx5b9s1AADwgIhXx9nY2Cxfvtzd3V3ZFd98882Kigr6HBigF2pvbyd/oCIAAAAA9FCIeHWco6Mj7btCKd98802ny9TX18fExGRnZzc1NQ0ePDggIIDz8idHVlbW6dOnCwsLm5qabGxsPDw8pk+fbmdnx7vXvkuXLt28ebOkpEQoFFpaWg4fPnzq1Kmurq6drtvQ0HDs2LHr16/X1dU5ODiMHz9+5syZAoGAs1hRURF9ykcZGxvTXxDEYvG1a9c4C4waNYoGSEolsqqqqqCggD3Fw8PDyMio03wm6SwrKyP/ra6uvnr1Kp2rp6c3ZswYdWVdRkZGfHz833//bWJiMmTIkHnz5jk7O5PpbW1tdDE7O7vBgwezV2xoaDhz5kxaWlplZaWpqenAgQN9fX3HjRunp6cna1/19fUJCQk3btyoqqrS19fv37+/u7u7r69vv379GF5u376dmJiYn59fX19vY2Pz4osvzpgxY8CAAZJLZmZmtrS03L17l/z30aNH7Cx1c3MzMTGRuguhUHjr1i32lJEjR5qZmdH/pqeni0Qi+t9hw4ZZW1vzOHBZpYWdfjqrX79+Q4YMYRjmypUrJ0+evH//voWFxdixY+fNm2dqaqr2c83W1taWkZFB8pBMycrKYnewOXDgQKmnoDs0MsqWQLXU99ra2qioqJycHFNT0xdffPHtt982NzenyxQUFBw8eDA/P9/ExGTMmDFvvvkmu3Rx8Kh06s0QhmGamprOnz+fkpJSUVFBfoQdPnz4K6+8ws4TWVkhFAoPHz588+bNyspKCwsLV1dXf39/Z2dnWcVbstEWCASenp5k+uHDhwsLC4VC4aBBg/z9/cl0ZVtRObtWS6WTdW2qrKwsKipiL+np6Sl5zVJWXl5ecnJyXl5edXW1QCCwt7f38vKaPn265IdO2j9AS0vL+vp6+l9ra+thw4bR/5aXl5eUlND/mpmZjRw5UsUDVNeJUL0V4tdssuuaQCAYMGCAr6+vt7e3Wn6x7bQGqXLN1fJlAnopDfaKBd1bcHAwKQNhYWEKrsLuH+/8+fOSr3qGhIRIXbGgoGDq1KlkGWtraycnJ3KFMDIy+uyzz1pbW5VKeWVlZWBgIL3G9O3b19nZmd7rz5kzp6KiQs7qR44csbW15aTcxcUlKyuL07Ol1PfWnJyc6Kak9oxfW1vLL5H79u3jbErBfJb/fp2xsbFasq66uvr111+X3P7atWtFIhHnLd/ly5ez1926dauVlRV5WOrk5GRjY0MWc3NzS0tLk7q7X375hdzo6+vrDxgwgN4u6Onp+fj4XLx4UayM4uLiWbNmkS1YWFg4OzuTkNXAwOCDDz5oaGjgLO/k5CQnS2/fvi1rR7dv3+YsnJmZyV6AczaPHz/O78CllhZZ6Q8ODhYKhYGBgZxVHB0ds7Oz1XuuOcrLy+XkpGT7000aGWVLoBrru6WlJXuijY1NUlISWeXbb7/l3Lw6Ojrm5eVJTT+PSqfGDCEiIiJIY6unp/fss8/SNJDfen7++eeOjg5ZWZGamir57QDpG1myeMtqDO3t7dvb21evXi1Z8F5//fWamhpZK8pqReXsWsVKp+C1iSovL1elr+aoqCgXFxcy19DQ0MnJiZ5QW1vb6Ohoya1p+QBpU0D/y95UeHg4e66bm5vqB6j6iVBXK6RssykWiyMjI0ma9fX1HR0dad1xdXU9e/asWIW+mhWsQapcc7V2mYDeDBFv76VKxHvixAkjI6OJEyeGhYWFh4cvXLiQ3odFRUVx1srMzCQN8eDBg+ldUUNDQ1hYGHnUMHXq1La2Nh5DLgUGBhYWFpKJLS0tsbGx5FGDq6trXV2d1HVjY2PJTs3NzcPCwnJycoqLixMTE1999VUbG5sNGzaw7w+SkpIiIiLGjh1LJgYFBUVERMTExNCttbe3RzxFuszduHFjRERES0sLv0TeuXOHbO2ll15i5/PUqVPDw8MjIiLeffddQ0NDyXwm6dy0aROZ9dJLL0Ww7Nq1S/Wsa2xsHDVqFFl38uTJiYmJxcXF2dnZYWFhFhYWX375Jbk6WlhYkJ3Se3SxWEzHif3000+rq6vJxPT0dA8PD4ZhTExMzpw5w9ndr7/+Su6Sf/rpJzpKwaNHjz799FMe17OsrCySPEdHx99//10kEpFfK3bu3Emej3l4eFRVVbFXiYmJiYiI+OKLL8juvLy82Fkq5zJfU1NDlvHy8pIa8e7ZsyciImLmzJlSI17FD1yytLAjXk76g4ODg4KCbG1tP/vss507d4aGhtLOZocOHcq5D1PlXEtqamriZMgXX3zBzsybN292w0ZG2RLIo2bl5+fve4pUBIZhEhISjI2Np0+fvnnz5n/961+0VyQLC4sHDx6Eh4cbGBgsXLgwPDx848aNL774Ipk7fPhwyUPjUenUmyHsGPL9998vKyujq6xdu5b2jEgGwJPMit9//93ExGTEiBHr16/fsmULHU6WRLySxZvTGEZERJCO5ezt7T///HMLC4vQ0NDs7GzS2vv4+JAVR40aRY9FwVZUzq5VqXSKX5vIZSgiIqKpqUmViJdUNGtr65iYGFp+CgoKaFZHRkZyVtHyAZ48eZJ9RjgRLwk+6QFKRrw8DlDFE6HGVkjZZvPDDz8ki61YsYJG4Ldv354yZQqJgXfv3i3mG/EqWINUueZq5zIBvRwi3t5LlYh38ODBP/74I3vWgQMHyCwPDw/29Lq6OvLGo7m5eVFREWeDP/zwA1nr66+/Vjzl5OZy/Pjx7e3tnFkZGRnkXmrNmjWSK5aUlDzzzDPkVTfOU46Ojo433niDvunEvj84ceIEmfjaa69JTc/jx4+NjY05B847kZx83rp1K3vWb7/9JjWfyU+qUu8M1JKqTz75hG6cPJah0tPTTU1NSSguOXbftm3byIofffQRZ1ZNTU3//v3JL+6VlZV0eltbG3kWtGjRIsmUrFixQqmIt66ujrx6Z2pqeufOHc7cY8eOkeT5+flxjosdxrDva5WtX5yIl/j6668lI15+By5nZEKafmdnZ1dXV3YmC4VC+nL+iRMn1HKuVcmQbtXI8DgR6qrvv/76K3vWkiVLyKx3333X2tqa/Ry1paWF/jBx6tQpFSud2jOEpmHJkiWSq9CTImvI9yFDhqxcuZLcKBP/+Mc/OOPfyq+e5Ibb0NDQ1NQ0PT2dPUskEtGnTytXrlS2FZW/a36Vjt+1SfWINzExUXKtgIAA8p7wo0eP5By7dg6w0zMiP+JV9gB5p1MTtzoKNpvbt28nyyxdupQzq6WlZfTo0eTJ6uXLl5XaNb8apOI1V3OXCQBEvL2XKhGvl5eX5Fz6lUV9fT2d+NVXX5GJUu/2WltbyW+iZmZm5GVgReTl5Tk5OR08eFDq3FdffZXcz0k2puTOTNZ7mOTTF8mLWXt7+8CBA8n0e/fuSa64efNmhmHYj1JVSSQ7nydMmCA599lnn5XMZwXv1filqrS0lPxuamhoeP/+fckVV65cSXbNiYLq6urIkxYTExP6oIlty5YtZMUvv/ySnUgy8dtvv5VcJT09XamIl8aWslahHR0nJCR0bcTL78AViXgZhjl//jxn7q5du8isVatWqX6uO6XsrUwXNjI8ToRa6vsrr7wi5yX5Tz75hDM3JiZG8gzyq3TqzRCaBiMjI6kfSgiFQvIioqyId8SIEZzfDq5fv+7m5sZ+xUaRiFdWxS8uLibl3MDA4MGDB5qIeBWvdLyvTapEvO+9997YsWOlrnX58mWy1i+//CI5V8sHyDvi5XeAvNOpiVsdRZrNTuvahQsXyBY8PT0V3y/vGqTiNVdzlwkAjLkKfCxatEhyIu3GgPbrIBaLd+zYQf5+8803JVcRCATTpk0jPS4cOnRIwb0PHz68uLhY6gbJ52GkKxRO9xLt7e3R0dHk77fffltyRTs7O3JjymFgYPD++++TvyW/4SF3FZaWlvRdKVUSySE1nZL5rDh+qYqOjiadLb3yyiuOjo4KppOs2NDQwDDMlClTJPtnYhhm9uzZ5I89e/bQifStpJMnT7I7eSLc3d0zMzPXrFnDKIC+jckwzPz586UuQ0eypU+luooaD5zDzs5OcuDQl19+mfzB7jSI97nWpUaGx4lQS31/6623JFeknQBJzqW5QUaNVqXSqTdDaBp8fHykdthjbGzs5+cn+fUd9e6773K+WB41alRmZqZkJnRK6ipOTk7ktlskEtHrgnopXul4X5tUsXPnzrS0NKmzaAdRshbQ1QPknU4N3eoogta1iRMnSq1rkyZNIh9WZGRkyD+haqlBWr7mKniZAPjf1/u7OgHQI9GvrdjIy3LkdzXyR05ODul5z8jISNYISfRrtOTkZB4paW9vLysru3v37p3/09jYSGZxulm+desWnUXfBlTkuBiGWbZsGXmTc+/evezOKhmGuXDhQn5+/jvvvMPuT5V3IjmkZpqDgwP5g92PJQ+Kp4qeGk6fz5Sbm5vU3l/Pnz9P/qAf53C4uLiQl8TKysroxcnFxYW8Qnnt2rXJkyf/+eef7FUMDAzc3NzkdNvIlpOTQ45FT09PVseS9BYtOTmZ3QWx9qnxwBU5QVILEu9zrUuNjIonQo31XU9Pj0atkr2P0o6gyC2vKpVOvRlC00Arl6TY2Nja2lpZXeaSVzFVp6enJ6vXVlrC6RM/9VK80qlybVKLurq6oqIiWlzpY1X5xVX3DpB3OrVwqyMLrWuyEqyvr0/TTJ/3aq4Gafmaq+BlAgCjEwFPkt0YkpfoyB/0IQB9F87MzEzWj3mkS3rSUCqegLa2tt27d+/fvz8jI6O1tVXqMpzQlI40Y29vL2vsBFnjBzg4OPj7+x85cqS6ujouLm7hwoV0Fvk5k74KpWIi+eWzUlTJOlmD0BgbG1tYWEheXWgByMnJ+fe//y11XSMjI7K7nJwcsn0DA4OtW7eSn9iTk5MnTZrk5OQ0d+7cgIAAZQda+Ouvv8gfdnZ2ssYToh2QNjc3FxcXDx06lOkiajxw3gWJ97nWpUaG34lQvb6zuzKmyFuUpk9xZtG+oNlnkF+lU2+G0HpHhrPigfeAUhyWlpaygmo6qtCdO3cYDeBR6Xhcm1SRk5OzZcuWxMREOiaThi5PPeUAeadTc7c6nVKkrtFrXG5urqZrkJavuZq4RwJdhYgX+KB3Wmy0+02qurqa/FFbW0v6HZGjqqpKwb1XVFRMmzaNjHo6aNAgPz8/R0dH+nXNiRMnUlNTJdeqra0lf5B+KaSS1UAzDPPhhx8eOXKEhLg04n348OGJEydeeeUV2kelionkl8+K02jWSUZBtAAcfErxAvDWW2/16dNn1apV5FJaUlIS/pSdnd3SpUs/++yzvn37KnK8NAFyUk4+giIeP37chRGvGg+cd0Hifa51rJFR9kRorr53OktdlU6NGaJIvZOv0+FSVd8OTVtNTQ2jAWqvdGpNHbN9+/aQkBCRSGRgYDB9+nQPDw9LS0vyzLapqenbb7/thQfIO50aaoXUfo17/PixpmuQlq+5ar9HAh2GiBc0iN7wOTo6njx5Uv7Cij/CCgoKIneWy5Yt27FjBx2whygrK5N6c0kX4/ezn6+v77Bhw+7evXvlypWsrCwyJMyuXbtEIhEdGED1RGqalrOOFoBNmzbR8XhkoT1yETNnzpwxY0ZSUtKBAweOHDlCLtWVlZVhYWG7d+8+efIkHTVKDkVSzp5FE6xpHR0dsmap5cB5U7Ga6Ewjo+yJ6D71XZVKp64M6RGliKZNa7VeFu1nV1JS0scff8wwjJWV1R9//MF5NbSurk6RiFf3DlD1K53aWyH1XuPUW9SlbrbbXnMBEPGCBtEXTtrb22V9CqKsrKysixcvMgzTp0+frVu3cu4s5aCPIOrq6mQt8+TJEzlb+OCDD8jgkzueEolEO3fu7Nev3+uvv66uRGqUKllH3gpTNutsbW0fPnxI/uBRAPT09Hye2r59+4ULF3bu3Hn06FHyG3lAQEBBQQEZ2U+REign5exZUl+RUpHUC39zc7NGD5w33udalxoZZU9Et6rvKlY6tWQITUOXf0fX1NQkaxYt4fzem1Aj1a9NyqL9da9du1ajH9Cq8QCVakj5HSDvdGq0FZKP1jVFrnE8LnDK1qDucM0FkAqP/kGDaP8EFRUVctpNpdCPYV5++WWpX9rQ4Qo4yFNZ8gYOffGG48GDB3J2HRwcTN5oIr0jJiQkPHz4cOnSpZLv1fBOpEapnnX37t2TukB9fb3U+wBaAAoLCxkVGBoaTps27ciRIykpKeQUlJeXnz17ttMVaQJqnpK6DO1T1MbGZtCgQaqkk5Nm8ofUki+/pKl+4LzxPte61MgoeyK6VX1XV6VTJUNoGtidSHeJxsZGWVE3/WiTlvmuovq1SVm0xNJxYjRaXFU5QH4NKb8D5J1O7bRCUilS1+g1jkeHcMrWoC685gLIh4gXNGjgwIHkA1exWCynW/zZs2c7ODj861//UmSbtKsJWS/DyPplcejQoXS0laSkJKnLyO+739ramgw80NjYGBMT8+uvv+rp6S1fvlyNiVQLWZdz3qmi4zFw+milrl69KnU6fakyJSVFVmqTkpIcHBycnZ3pr/W5ubkBAQEJCQmSC48fP37ZsmXkb1mdkbANHDjwhRdekJ8G2nOmn5+fGnshtrKyIn+UlpZKzr1y5YrkRDUeOG+8z7Xi1Hs/rYlGRtkT0bX1XS2VTr0ZMmPGDPKHnHe5p0yZ4uzsvG/fPkbDZJVYWsJljTfDaIvq1yZlyS+xai+uqhyg/IZUVgHjd4C806mJVkjBAknrmqwux4VCIRkxm2EYMkKSRmuQuq65XfJUAHQbIl7QrNWrV5M/du/eLXWBO3funDx5srKyctasWYpskHYPmJmZKfmaU0dHh5yu/2l0GhkZKTk3NzdXahzCRj/ZDQ0NPXfu3PTp06X2dKpKInmjb7qyu/s/deqUu7v7kiVLVEnVm2++aWlpSd7evHbtmuQCO3fulLpiQEAA2WlKSoqsDlF37NhRUVHh5eVFH45VVVXFx8cfP35c6vIkJQzDKDhOz6pVq8gfe/fulZwrEon++9//cpZUi+HDh8u6EUlMTJQ6Kox6D5wf3ueaX/mcNWuWu7u71B11YSOj7InokvouC79Kp94MmTt3Luk59vr167TvVra8vLwLFy7cv39/8uTJjIbt2rVLcmJqairpMtfS0pI9gGqnraiGqH5tUgotsTQWYrt06RLTbQ7Q3NycfG1+7949MgIQJRaLt2/frt4D5J1OtbdCCjabtK5lZGRkZWVJbiEuLo78sBUQEPDcc88xGq5BKl5zNXeZAEDEC5oVHBw8depUMvrisWPHOHOfPHlCxihfvHgxjRDkmzhxor29PXl9KCwsjDM3NDRUzrt8n376Kbk2nD59OiIigj2rtrZ20aJFdCxBWcaMGUM+Cvr777/Jl71qTyRvtra2pHdE9mtXKSkpt27dIl1l8E7VM888Q5dfvHgxp7/H/fv3nz17VuqXpQYGBvv27dPX1xeLxUuWLJF8oBQdHX3w4EETE5NvvvmGMys2Nvb27ducic3NzSdOnCA//Et9MiNp8eLFU6ZMYRjm6NGjkg+pvv/+e/Iy2Jo1a2SNo8gPKfYMw+zbt4++YkeCoiVLlkh91069B84P73PdKRcXF/IHLZ8NDQ3nzp27deuWUv0naaGRUfZEdEl9l0WVSqeuDDEwMNi7dy/pMXXFihWcITfb2tqWLl3KMMySJUvoOCUaYmZmdubMmf3797MnPnr0iCSAYZgffviBPZR6p62ohqh+bVLKggULyB9hYWGcd0bKysrWr1/PdKcDnD59OolvV69e3d7eTia2tbV98sknsvow532AvNOpoVao02aTU9c44y2VlZWtW7eOfGora9gk9dYgFa+5mrtMAPxvIwK9SlxcXPBTtGXx9PQkUy5fvix1lYKCArLAwIEDySqBgYHBwcEHDhwgC5C5tB2fNm1acHBwWFgYmVtTUzNx4kTSNH/88cdpaWllZWVZWVm7du0itzve3t6NjY2KH0J8fDx9E8bPz+/AgQNXrlw5fvx4YGCghYXFhAkTpCaDyMzMtLa2JgvMmjVr586dsbGxGzZs6N+//8iRI2l3F15eXuSg6urqOHunz7gGDhzY3t6uxkSqmM9isZgMmMkwTFRUVGlpaUJCAjnYP//8U8Ws6+jooFc4BweHDRs2xMbGRkZGzpkzh2GYmJgYcsdvb28vmRUHDx4k9yXDhw+Pjo4uLCwsLS29dOnSO++8o6enJxAI4uLi2MvTH+Dt7e23bduWm5tbWVl5586duLg48hmSoaHhsWPHFC8w1dXV5NAMDQ2/+OKLrKys8vLytLS04OBgsqMlS5a0tbWxV1m1alVwcPDs2bPJAi4uLiTzg4ODCwoKFNwvfShkYGDg4+MTFBQ0YcIE8ib8119/TWZNnjw5ODh42bJlyh745cuXpZaW7777TiwW//TTT1LT39TUJBaLjx8/HhwcHBQURHdH5t6+fVvFcy3HnTt3SNnz9vbOy8vLz88no3xNnjy5uzUyPEqg2ut7RkYGmUvuJgUCAbuVlnUGs7Oz+VU6tWeIWCyOjo4m75SOGjUqPj7+/v37d+/ejYuLGzlyJJlYX19PlpSVFbKuSrKqJz18sVhMSyl5oDR79uzIyMjY2Nj169eTWQzDLF26tKOjg7Nx+a2onF2rUukUvzZFRER0er7q6urIxr28vDhXNJKYlpaWcePGkVlWVlbff//92bNnU1JSNm/ebG9v7+fnJzWRXXWAd+/epWPkODo6BgYGvv766/b29n369KFvEFhbW5PdnTp1ivcBqphOtd/qdNpsStY1T0/P+Pj40tLSoqKivXv3kijR1tb26tWrCu4xKiqK5An5Pp9HDeJ3zVXkeFW/R4LeDBFvr7N27VpGhn379kldRdZ3KSEhIWQBqXN9fHzoFlpaWjZv3izZKZ+Njc0333wjFAqVPYpz584NGzaMs7UJEyZkZWWFhITISgZx9+5dzqt0+vr68+fPr62t5fymS7pj4aze2NhIRpPbuHGjehOpej6XlZV5enqy5woEgs2bN6sl60QiUXh4OH2DkRgwYAC507WzsyMBktSsyMzMnDZtmuQXO5MmTUpPT+cs3NTU9J///GfSpElS+7ydOHGi4hdvSigU/vjjjzY2Npytubi4xMTESC4v59FTWlqa4jtdsmQJ+6iNjY3XrVvX0dFBI146XdkDl/UB5NixY8VisazvtWpra8ViMWfv1KVLl1Q/13Js27aN80zGzc3t77//7m6NDL8SqN76LusVYtJKyzqDp0+f5lfpNJEhYrH45s2br732Gmd5ExOTlStXsm/95Xz6KPWqJKt6sg+f/bvMkSNH+vfvz17S0tLy559/FolEkhuX34rK2bWKlU7+tWnHjh1kSmRkZKfnq7y8XFZ+ksSIxeKGhobly5dzPnM1NzfftGmT5ICxJJFdeIAXLlygQQ4xcuTIrKwsyZaBhjc8DlD1dKr9Vkd+s9lpXRMIBIsWLbp//77iu+N0TcKjBvG75mrnMgG9mR6+Dget6ejoSE9Pz8/Pr6mpsbCwcHV19fT05D0aG7mly87Obmxs7Nu37+jRo+lTa0Xcu3fvxo0btbW1Dg4OY8aM0dC3kSomkt8er1+/npub29zcbGdnN3HiRBKfqCtVLS0tf/75Z0lJiYmJyeDBg8ePH0/ep3rmmWeePHni6uoq+d4j9ejRo7S0NPIjgr29/ahRo+S/p/TkyZPs7Oz8/Pz6+nqBQODg4ODp6anKq00dHR3Xr18vKCioq6uzsbEZ8RSjYaWlpampqY8fP+7fv/+4cePor+PaPHB+VDnXslRVVSUnJ5eXlxsZGb3wwgteXl5q7C1M7Y2MsidC+/W9U8pWOk2UzMrKSpIGPT09JycnLy8vzo8pmuDg4FBRUWFvb0/CP5FIlJqaWlxcLBQKnZycfHx86GNDfq2o5ki9Nv3000/kS9GDBw9yPptURXV1dWpq6oMHDwQCwaBBg7y9vcmTvW54gG1tbVeuXCEvxD7//PPjx4/X9AHyPhHqbYWUajZpXRMIBAMGDJgwYQJ5S191StUgFa+5mr5MQO+EiBcAVFVbW0teA3vttdc0OnYOdDmca+gROBFvT/ePf/zj3//+N+kxiL6vq0t6ygH2lHQCAAd6rgKAzqWkpCxevLikpETWXPLHpEmTtJsuUD+cawDtW716NQmlpCJdvpuZmdHxTnucnnKAPSWdAKAURLwA0Ln8/PyoqCg6qAAH6czD2Nj43Xff1XrSQM1wrgG07/Dhwxs2bHjy5InkrMuXL9+4cYNhmPfee09W78TdX085wJ6STgBQCiJeAFDUd999xxlsoKmp6eOPP75w4QLDMOHh4Yp8pAo9As419ETV1dUlT5GBkUUiEflvTU0N0+01NDTMnz+fk9SrV6+SgW2GDh2q7IBS3U1POcCekk4AUBy+4wWAzh07diwwMJA0FyNGjBg5cqSVlVV5eXlSUlJ1dbWxsXF4ePiKFSu6OpmgBjjX0HOtWLEiMjJScnpISEh4eDjTjbm7u9+6dYu8Mevj4+Po6Nje3p6VlUUeKo4fP/7QoUM9ekjSnnKAPSWdAKAURLwAoJDS0tKTJ09evnz5r7/+qqysbG5u7tOnj7Ozs6+v77Jly/DET5fgXEMPderUqfT0dMnpXl5esgbX6SZEItHFixfPnz9/8+bNwsLC+vp6fX39fv36jRo1KjAwcObMmUwP11MOsKekEwCUgogXAAAAAAAAdBO+4wUAAAAAAADdhIgXAAAAAAAAdBMiXgAAAAAAANBNiHgBAAAAAABANyHiBQAAAAAAAN1k2NUJAI3bsmVLfHw8/W/fvn2PHj3ahempqamZO3cue8qqVatmz57d6YpPnjzhDAyg4Irdim4cRU+3YMGC8vJy+l8/P7+1a9cy3U+PKy3drbUBDpwgfrZv3x4XF0f/i3zTnDNnzoSGhrKn/Pbbb101IprOJ6anNwg9Pf2gTYh4dV9VVVVxcTHDMPfv3+/o6NBmY11XVzd79uxbt25t3rz5vffeIxNFIhFJT0NDQ3V1NcMwQUFBimyto6OD34rdim4cRU9X+lRra2tZWRnDMM7Ozky31ONKSxe2NqAInCB+qquru3++7d+/PyQk5Pnnnz916lTfvn2ZnqmxsZFkNRkJnGEYoVDYQxOj3jOiiZzp6Q1CT08/aJUYeg3SFtjb22ttjxEREaSY9enTR87ciIgIfptVdsVuRTeOonsSCoWXnsrJyZGzWGZmJjkFwcHB4l5WWhTMoh7U2oBScIJ0L9/o7X54eLi4G7t9+zZpfBobG+Us5u/vTw6nuLhYi6lTZ2I0dEY0kTPduWD3hvSDFuA7XtCgF154gfwxfPjwrk4L9CLl5eWTnvryyy+7Oi3dFLIIQMeMGDGiR1xwQ0NDSeOTn5/P6LSeckYAegO81Qwa9MorryQnJ2dnZy9YsKCr0wIAAKCzjh8/fuDAgaFDh/r6+nZ1WuB/4YwAdB+IeEGzvJ/q6lQAAADoMgsLi+XLl3d1KuD/hzMC0H3grWYAAAAAAADQTXjG23sVFRUdPny4sLBQKBQOGjTI39/f09OTs0x+fv7jx4/pf62trYcNG0b/W15eXlJSQv9rZmY2cuRI8ndVVVVBQQF7Ux4eHkZGRkqlsKGh4dixY9evX6+rq3NwcBg/fvzMmTMFAgGjgry8vOTk5Ly8vOrqaoFAYG9v7+XlNX36dGNjY8mFMzMzW1pa6H/79es3ZMgQhmGuXLly8uTJ+/fvW1hYjB07dt68eaampto8ClnbrKysLCoqYi9paWlZX1/P4wxK7vHMmTNpaWmVlZWmpqYDBw709fUdN26cnp6egpmWl5d39OjR4uJikUjk4OAwevTo2bNnZ2RkSO7LxcXF1taW/H3//v2HDx+y5zo4ODg5OcnKmaKiosrKStIDM+lh9erVq3Sunp7emDFjZK3L48wqmCeK41dalCrVymZRY2PjpUuXbt68WVJSIhQKLS0thw8fPnXqVFdXV/W2NmrZaXp6+oULF/Lz85uamiwtLV1dXb28vMaMGaOvL/Pn3aysrNOnTxcWFjY1NdnY2Hh4eEyfPt3Ozo7RjIyMjPj4+L///tvExGTIkCHz5s0jXYVnZGS0tbXRxezs7AYPHsxesamp6fz58ykpKRUVFQKBYMCAAb6+vt7e3gYGBqqnStkTpHjWkfLGWdHY2Njd3Z38LRaLr127xllg1KhRnOO6fft2YmJifn5+fX29jY3Niy++OGPGjAEDBnBWlHXpqa+vj4mJyc7ObmpqGjx4cEBAgJubG4/TpBTeF1Cqvr4+ISHhxo0bVVVV+vr6/fv3d3d39/X17devnyKtrqavYpJXHE9PT1ntVVtbG2nwHz16RKZkZWWxexseOHCg5AllZ4VSZ1AT7bPiiZFzRtTVICieGHXRZn3XcrMMvYI2useCbtaXXXt7++rVqyULw+uvv15TU8Ne5c0332Qv4O/vz54bHh7Onuvm5kZn7du3j7NxyU4F5Xc/e+TIERr2UC4uLllZWfz6rY2KinJxcSErGhoaOjk50dbT1tY2OjpachVOZBUcHCwUCgMDAzmpcnR0zM7OlrpTtR+FgttknzJ+Z5Bt69atVlZWDMMYGBg4OTnZ2NjQ5dPS0jrNtNbW1qVLl3IS1qdPH/aIuGz79v1/7L15WBRH17jdiCxChl0HFQREJW4BjApRIkhcowiKmphocEsUk8iTuJC4PSZxIYmJxEQZ0KgkIBpEBTXuiWFXEZFN0QEhsovswrAM812v533r1193TzPT08Na9x9cQ1d39ek61afqdFWdOo5yo2+T6+fnx1I47FPIdHR05MVqVlazSpWJgnCoLRxqteJFVF5e7u3tjfqvJiYm1tbW6LvVvHnzysrKeLQ2Kt60oKBgypQpcJpAILCyskJX9e/f38/Pr7m5mXJJbm7ujBkz4BxjY2MrKyu4r7a29qZNm+jnq0hlZeWCBQvoReHv7y+VSin7aqxZs4Z8bXBwMNSNPn36WFhYoJPt7OyuXr3KQRjOClK26Bjrm5WVFTqBcYeV6upqdEJ+fv7cuXORZq2trXV1deHV8/X1raurIwvG2PRcv37d0NBQQUuiiJoUDAnLuQEFfvnlF319fVD6oEGD0KutoaHh6ur6999/s1jdDm7FEKWlpfJKQ57BRwQEBMiLSKyUBtVhn5UVhkUjqhsEVUpGHuwVuyPfd25mGcdqxrQL9nh7EcgifPnllwKBYO/evRkZGfn5+ZcuXXJ1dQX7Mn78ePKGAdeuXROJRLt372ZssKHBQ20eucHOycmBpNdeew2ZZoo8LC5fREQEfIjV19cPCAjIzMwEOd966y1TU9Pt27fLu5AFaCSMjY3Dw8NbWlrgYG5uLtrgNDg4mHJJeHi4SCTasmULarSWLFliZma2adOmkJCQvXv3okiMw4cPpxtidTyFgnkuWbIEyv/ChQvcNIhAGyl/9tlnlZWVcDAlJcXR0ZEgCF1d3StXrpDPP3369PHjx7/++mtUaD4+Ptra2suWLfvxxx+/+uqrIUOGgMfb0NAgEol27doFZwoEgqCgIJFIlJOTg3JLTk4WiUSbN28mCMLJyUkkEiUkJLCUT2xsLPl5X3vtNRGJw4cPy/N4lyxZYmRk9Omnnx44cGDHjh1oKIZRs8qWiSJwqy0carXiRYTKx9vbOy8vDw42NTVFRETAEJOdnV1NTQ1f1kaVm9bV1cEAyIQJE1JTU+GgVCq9cuXK8OHD6Z0quBH0421sbJDzUFdXFxAQAIqYMWMGKlLVqa+vHz9+PEgyderUS5cu5efnZ2RkBAQECASCrVu3QokJBAJQRGxsLLp23bp1cOHatWuRR/Hw4cNp06aBO3TkyBFl5eGsIGWLDuqbk5MT2TSFh4ej3FpbW+GRIbb/rl27RCJRU1MTpKanp4OoFhYWf/75p1QqhU5zSEiInp4eDOFWVFSwND0xMTHa2tozZswIDAwUiUSrVq3q2/d/Z7eFhoZyU5OCHWvODahMJjt06BA4tz/88APSwrNnzz777DO6V0Nvqjq4FUMtTkNDg7zSAIMvEomcnZ3hqi1btpCNz71798jnI78ONDhlypSAgIDAwMClS5ei8UC6BtVkn5UVhkUjqhsEziXDAkvF7sj3nbNZxh4vpl2wx9uLAIvQt2/ffv36paSkkJOkUin6iL5+/XrKhbDBN73BRrD4Sywbx8nzeAsKCl555RWCILS0tCifY9va2hYuXIjmanLweC9dukRP8vLygkllz549o6eiLri1tbWdnV15eTlKkkgkaK5OTEyMup+Cc56cNfjzzz9D0scff0xJqqqqGjhwIIwlksuEUmg2NjZCoTArKwslFRUV6enpkbdoho4IQRCJiYmM4sEYFKWEWWj3eSlCWltb29raFhcXo6TGxkZyj5mXMlGHZjnXakWKCMpn0qRJra2tlKTU1FSYJ7x582Z+rQ23m+7fvx8yRE4yQiwWw0AZ2eOtqakBD1lfX//JkyeUS7799lvIbefOnTKe+PTTT1GBt7W1kZNSUlL69esHbhi9x3bw4EG4cOXKlZSkpqamCRMmwEBWfHy8UvJwVhC3oouOjobj06dPZ5Tn+fPnOjo6jo6OlHvBXNB+/fqRP4QBZ8+ehTxnz55NKVJy02NjY3PgwAFy0qlTpyCJcjtV1MQCB/Pb0tICw5LLli2jn7927VrGcTyWDca7Tismk8l8fHzgqrS0NJbTyBr87rvvyEknTpyQp0F12GfOwrBoRJWaxk0YduR5jNze95iYGG7vO2ezjD1eTLtgj7cXgSbJMM54yc/Ph6+DmpqaRUVFKjbYqni80JzT5/UBsIaNQyv74YcfOjk5MSbFx8dDhr/88gs9FTVaBEFcv36dknr48GFI2rBhg7qfgnOe3DRYU1MjEAjgozj6Us7oZmzdupWl0E6dOkVJXblypYuLC/o3JCQEzly6dCn9LhKJxNTU1MLCgu4C8eXxEgRx+fJlSiqSiqxZVcpEHZrlXKsVKaLs7GwrK6uTJ08ypr711lvQd6Q7G6pYG243XbRoEfhvMAZIYc6cORSPd8eOHSAeo8fe3NwM4wx6enqUkWFuFBYWwvP27dv36dOn9BPWr18P8lB6bKi+aWtrM07nvnHjBlw4btw4pUTirCBuRdfa2mphYQEXPn78mH7hvn37CIKgzMLYuXMni5AymQxtBHD+/Hl5Tc/kyZPpFw4ePBhSa2trVVcTOxzMb3Z2Nhz8+uuv6eenpKRw9ng7vRXj4PE6OzvTU9GKX7IG1WSfuQnDohEVaxo3YdiR5zFyft8tLS2Vfd9VMcvY48W0C47V3Bt577336AetrKyg9yCVSsPCwohOorW1Fd39/fffp58wYMAA6PUqS0hISHJyMmMSmsIq7wR0a/queq+//jr8IIdLUcdTqK9k5BEWFlZXV0cQxLRp04yNjekneHh4wI+jR4/Ky8TY2Ji+VOnXX3+Ni4tD/7733nvQTfnjjz/IgV6AyMjI58+fr1mzhpcIPYz0798fLRxi1ywvZcKjZlWv1SyMHDkyPz+fshaRkn9FRQUldI2K1obbTaFutLa2Xrp0iX5VcHBwWloa1DGIXhEUFAS/GW+kpaU1c+ZMCBb1xx9/ECoTFhYmlUphi3Lk+JFh1Du5vk2ZMoUxaoubmxtM9k5NTeWmaKUUxLnoNDU1P/roI/hNX/wJH0AFAgGajQ8HYWYvQRCLFy9mFB7t9I5G9hQsWxSXi1yROKuJd5Ctu3DhAohExsHBIS0tDdZ6KEvntmLcWLZsmeIa5N0+cxaGBb5qGi/CsKDW993AwIDyvnewWcb0NrDH2+vQ0NCQF8cPxWhFo0Mdz/379+vr6+E3WuVCAU2C5UxNTc2TJ09y/g/0DZ4eY5CMvb09Pcyjubk5/CCHRFbHU3RMyZC5fv06/EDLrijY2trCrLaSkhJ5jaujoyNaNScPfX39pUuXEgTR3NxMDzwTFBSkqam5atUqQm04ODjQNQvz3yia5aVM1KRZbrVaQVpbW0tKSh49eoTyRzKz5K+itVH8pkgdixcv3rNnD+W7yeDBg+3t7VG45szMTIgWq62tjeZzUhgzZgz8IH+a4QzKRF6ocEbbQq5v8ipGnz59UN1A472Ko6yCVCm61atXgyN37NgxchhbkFwsFi9btgzmn6N7gZY1NDTkBY5GrlpcXBw5sC0ZRjkZ7TZnNfGOra0tzGq+ffv21KlT//nnH3Kqpqamvb09S1jjLtuKcYPxLh1mnzkLwwJfNY0XYVhQ8X2Hpl/e+/7BBx9Q3vcONsuY3gbenajXYWBgwLhnCUEQKHp+Tk4O0Uk8evQIfgiFQnmbJXCOUJ+Zmbl///5Lly6hrVkoUOwyBXq8Spg9BT/IX+LV8RRqLRlG0My6zMzMn376ifEcbW1tKLTMzEzGvRMUFGndunXwfTcoKOjzzz9HjX1GRkZiYqK3tzdqxdWB4prlpUz41ayKtZqdlpaWI0eO/Pbbb6mpqc3Nzcrmz83acLjp2rVrjxw5kpmZ2dDQsHXr1v/+97/Tpk3z8vKaN28eveYgJerp6ckbG0T7ZmVmZhIqg1Qsrz7o6OgIBAJ6D/XBgwfwg2VrHBQVNisrS1nBlFWQKkU3cOBAT0/PM2fOVFZWRkZGwkcuAMZyfX19GZ99wIAB6GWU9+yNjY35+fkoSpmKdltZNfGOpqbmgQMHYKAvLi7Ozc3Nyspq/vz5Xl5eKu5H1bmtWHe0z5yFYYGvmsaLMCyo8r6bm5t7enpGRUXJe9/RnHnV74XBKAL2eHsd8vo3BEFAjAqCIKqqqohOorq6miIMHXm9H3YOHjzo5+cnlUo1NTVnzZrl6OhoYGAAnlVDQwOKLcwC437CjPt8quMp1Fcy8qisrIQfJ1/CfnJFRYWy9Y3MmDFjJk2alJiYmJube/369enTp7N0hXlHcc3yUiY8alb1Ws1CWVnZzJkz79+/TxDEkCFDZs+ebWFhgVbuxcTEJCYm8m5tuN1UR0cnLi7O39//6NGjrS+5/BJfX9+pU6du3rwZpsNRlFhdXf2f//yHFyXyomJ6BxeJynIhmq1NXxHQLsoqSMWi8/X1PXPmDLzXqAdcXFwcExMzefJkNIDD4dnh8Rk9Xt7tdgd4vDDb3NDQcMOGDfDFoaCgIPAlAwYMWLly5aZNm0xMTDhk27mtWHe0z5yFYYGvmsaLMCyo+L6vW7cuKiqK8X1/8803UZBwXu6FwbQL9ngx/w/0RVDeDvIdAJoBq/rnSTKxsbGffPIJQRBGRkZ//fUXZS5QTU2Nir5BBzyFmkqGBVQNdu/eDbF/WECRYDjj6+sLzsyhQ4fA462vrw8LCxs2bBh94VlnoY4y4axZddfqJUuWgOe5evXqoKAgyuz0kpKSdj1eDtaG802NjIyCg4N37dp16tSpkydPJiQkwNqwv17i4+Nz9OhR6AuiO1pYWFy4cIFdTl5Wj3NWsSIXqsluM2arYtG99dZbw4YNE4vFSUlJ6enpEA798OHDUqmU/lVLqWfn5fE73sayM2fOnLfffjs2NvbEiRNRUVHwRaO8vDwgIODIkSMXLlxAe8Cog65WGl2wzerxZavi++7u7j5ixIhHjx7R33e04xpf98Jg2gV7vL2OhoYGeUk1NTXwQ97HY0br3NjYyJ90/+/WSBg6L168UDZbFKHR39+/A5YeqeMpeMlTKQ2amZkVFxfDD3mL/Xhk0aJFfn5+lZWVMTExRUVFgwcPDg8Pr6+v9/X17Zi1c4qgjjLhrFm11ur09PS///4bdk4+cOBAu4uxebE2qt+0f//+n7yksLAwPDz8l19+KSwshN0p7e3tYS9TNBWwtbW1Ayo2PCPMOVdWxai+sVyIkhinOPKrIBWLTkNDY+3atbDZWNBLpFJpSEiIqanpwoULKSejeyny7Nweny81KQiHBlRDQ8P1JQcPHrxx40ZISAgMkldUVHh5eeXm5sKmxOpATW2xWungNqvL1jS+UN1U+vr6gtUlv+/9+/enx7PseLOM6W3gyFW9jvr6enlTZdDaErQTKYD6nYzdo6KiIh7FQ7euqqpCs1xUvyNa/oF2syCD9ofoyk+hSp7cNIiiwuTl5RHqR0dHZ8WKFQRBtLW1HTlyBAZ7dXR00FYWXQF1lAlnzaq1VqPMX3/9dcZVfIrkr6y14eWmgIWFhb+/v1gsho2LCIJAQdGQEsvKylhcPh5Bz/j48WPGE2praxk7uEhUsVgsL3MUXxf25lUKZRWketEtX74cpmJCWN3z588XFxevWLGCPr8a3avqJezPbmpqOmTIEKKT1MQOLw1o3759Z86cGRUVlZCQAHOJS0tLr169SqgNNbXFaqWD26yuVtN4R/X33cfHB6or+X1fuXIlfT52x5tlTG8De7y9kVu3bjEeRwEhKVsOGBkZwQ8YLaGgysxGOsOHD0fB+mNjYxnP4bAJB4pzwzjzjeU7a9d5ClXy5KZBNCsMJogyEhsba25ubm1tzctQPwplERISEhcXl56evmjRIohZyg3ev2Woo0w4a5aXWi2viNgzVzx/pawN55tu27aNcZcdHR0dtOMFiuxlaWkJS8hkMhnLa+jh4WFubv79998TKoOekRJ0t91Sevvtt9kjWkskEtidlSAI8lplxVFKQaoXnampKXyDqK+vDw8Ph4X6a9asoZ9paWk5atQo9tcNhWydPXu26jNBOKuJHQ7mNysry8vL6/z58/SkSZMmrV69Gn7LC1bXldvibmef1YGaahrvqP6+Gxsbw1ZD6H3X0NCQ9753sFnG9Dawx9sbQdvNk0lMTITwdwYGBpTN0PT19WHFy+PHjyF8PEImkx08eJBf8ZA1DA4OpqdmZWUlJSUpmyeKO4p6h2Ru3rxJ8I06noJzntw06OXlBeWWkJAgL3x3UFBQWVmZs7OzvGCeSjFs2LBp06ZBcAvYaZC+2kcR0Ew/8oYlFy9edHBwgGFkzqipTLhpVpVa3W4RoczT0tLoszHb2toU3B9CKWvD+abx8fERERGMHoW+vj4s+iLv5gITawmCgNkEdHJyci5cuFBeXj537lxK0osXL759CX2fSXm88847BgYGMG379u3b9BNCQkIYL5w/fz5EaU5NTU1PT6efEBkZCR13Ly+vYcOGEepvDlQpOgC91Hv37r127dr06dPlSb5hwwb4cezYMXqqVCr9/fffKWeqAmc1scPB/FZUVERHR587d44xQxCSUqXVgTpaMXnGZ+7cuQ4ODozFrjgd32Z1qZqmDnh/32fNmiUvQrXq98Jg2JBheg1CoRAaGwMDg9DQUHJSeXm5nZ0dVImgoCD6tWg31A8++KClpQUONjc3f/zxx2hGpb29Pf1CT09PSM3Pz6ckof6iSCQiH6+vr0dbcVCEqaqqcnR0RJsHUi5kAW1UYGFhUVxcTE4qLi5GX7JdXV3p16alpUGqj48PPRUFXaRcq46nUCVPbhqMjY2FYD9vvPFGQ0MDJRW6m7q6ug8fPlSq0FiA0I7A2LFjZZxoa2uDGJivvfYaOvjll18SBLFq1SoVNcu5THjXrCq1ut0ikkgkYDEIgti1axfl8l27diE13bx5ky9rw/mmrq6uBEGsWLGCLklYWBhcsnv3bvLjz5gxA46fOXOGckl9fT1MO2TMEE2YdHFxkSkMDGYSBDFy5MiKigpyUmhoqIGBAbgBQqGQcuHff/+N6ptEIiEnFRcXg89jYmLy9OnTjmkOVCk6BDksMz0ThFQqhU9gEKabkooCs23evFmppkcmk/n5+TFWJM5qYkdZ8wufq/r16/fgwQNKVg0NDVB6RkZGdXV15CQWg9Z1WjGZTLZv3z646uzZs3CktrYWprkWFhaqqEF12GfOwrAUuyo1jZswihgE+u14ed/JYSboLzIv95InPwaDwB5vzyc0NNTnJbCaQigUgtH38PAIDg6OiIjYtm0b6mWuXLmyra2NnsmjR4/QOisLCwtvb+8FCxYIhUJDQ0O0a6KxsTHc6OLFi/Hx8fDb0tISUr29vX18fL755puamhpIQnvEOzs7wxHUPqWlpRkbG0Pq3LlzQ0JCIiIitm/fPnDgwLFjx6KAPejCmpoa9kJoamp644034CojI6M9e/ZcvXo1ISFh3759QqFw9uzZkCQUCiFDaA5/+OEHHx8fDw8PSLW1tSXLee7cOR8fnyVLljBeq46nUDxPev9DWQ2iC0+ePAl9kZEjR4aFheXl5RUWFt68efODDz7Q0NDQ0tKKjIwk30heoW3YsKHdp5PJZC0tLWgD1UOHDsm4AltZQsiiwsLC8+fPQ7n9888/qmtW2TJRBA61hVutVrCIZDJZdHQ0mik6e/bsEydOJCUlnTt3ztvbWyAQTJ48GZJmzpzp4+MTEBDAi7XhcFPk8UL8s2vXrhUWFhYXF9++fdvf3x+qvYuLC8VdrKqqmjJlCoT9/OSTT5KTk0tKStLT0w8fPgy7vLq4uNTX19M1hca12Dt5FNra2lauXAkXmpubb9++PSIiIjg4eN68eQRBhIeHs/TYwsLCYJr3uHHjoqOjCwsLnzx5cuzYMRg5NDMzu3XrVkc2B5yLDoEGNgcOHIg8QEYqKytB6X379t2yZUt6enppaWlycjJa3r9ixQpyDrm5uYxNz4kTJ+AESB05ciRjRVJQTbq6upAP5WOBPJQ1v2iChlAo/Pnnn7OyssrLy3NyciIjI2G1dt++fZG7KJPJNmzYwGjQMjIyOqYVU8rjzcnJgXfcxcUlOztbLBbD1jVTp05VXYP82mfOwrBohLNBUL1k2jUIqGKjPHl539GQtaWlZWtrK8uZyt5LEfkxGAB7vD0fypIJMKBRUVHIrwAMDAx+/PFHqVQqL58bN24gOwuMHTs2PT2dvhQnICAABYmh4OTkVFpaypgE+7Ch2z169Gjq1Knk1D59+ixevLi6upo+mbC0tLTdcqirq1uzZg1lfaC+vv7u3bvpe7vBx1F56+JAzp07dzKmkj+s8v4UCubJ2P9QSoPkC9PS0mbOnElfJufm5paSkkK5i7xCs7KyUuTpZDLZ9u3bQTW1tbUyrpSUlIwbN44sgJaW1r59+9iFVFyzSpWJgnCoLRxqtYJFBFy7dm3EiBGUfCZPnpyeno5GEsijQ7xYG2VvKpPJ7t+/v27dOsbtRkxMTLZv397Y2Ei/UVNT0759++gxfk1NTb/66iuKh0wfWmcZnGREKpUGBgaiKanAoEGDwHUZMGAA9H0Zr7137x7apJqsr2XLlik1ustXc8Ct6BC1tbX6+voEQezYsaNdmSUSyXfffUdfz29raxseHk45Wd4KQD8/PziBMZU8tsmuJvQ5AFizZo1MMZQyvw0NDb/++qubmxtjuPIpU6ZQvnGAM0Dn8uXLam3F0CL54OBgmTL8/PPPlNhF9vb2//77Ly8a5NE+cxaGRSOcDQIvJUOBcUktOU9e3vf6+nrYOps+c4eOUvdSUH4MRiaTafAeOQDTXZBKpYmJifn5+RKJxMrKytXVlR4tk0JLS0tSUhJEDX311VcnTZqkbiEfP3589+7d6upqc3PziRMnqr5sqbKyMjExsaioSEtLa8iQIS4uLvBpsHs9hbw8g4ODIfiTSCRibAlU0eCzZ8+Sk5PB0RIKhePHj1fTfoYxMTGenp4fffQR4+IxxZHJZHfu3MnKympsbBwwYMCUKVOgD8Ej6igTDrWFc61WpIig+5iRkVFfX29iYjJhwgRbW1t1WxvON83Ly4MBMYlEYmBgYGdn5+joyL5Ta1tbW0pKilgsrqqqEggEdnZ248aNY7nEycnp9u3bFhYW+fn5HLaFbGpq+ueffwoKCnR1dW1sbCZNmgSTMF955ZUXL17Y2dk9fPhQ3rXl5eVQ37S0tAYNGjR58mSYmt4pzQGHoiPj6OiYnp5eUFCApt+3e687d+7k5ubW1NSYmpqOfgmhNuSpSRU4mN8XL15kZGSIxeLa2lotLS1zc/Nx48Z1ykayjHbphx9+gLWXJ0+epKz3bpeKioq4uLjS0lJtbe1Ro0Y5Ozvzvgtdh7VZqqCKQehgVHnfu/K9ML0E7PFiMD2Hdj3ebsHChQujoqLu3bvn4ODQ2bJgMP8/jh49CmsyT5w4geaCqk51dTXMHZ0+fbpat5zpImRlZY0ZM2bevHnR0dGdLQuGO//5z39gykNiYiJaYYFRnd5mEDCYDgDHasZgMF2I8vLy6OhoJycn7O5iuhpRUVG+vr4EQXzxxRfKursJCQnLly8vKCiQlwo/3NzciF4ArOvjFokd05Fs3LgRTeOnA5tm6enpoc1UMQqCDQIG08FgjxeDwXQmy5cvJ4/zHDx4sLW1FfwKDKZL8ezZMw0NjQMHDuzdu1fZa8VicWhoKNpNhwJEANLR0UFBfXsS0dHREAQL/q2pqTl+/LiNjQ2Ky4rpspw+fXr79u0vXrygJ8XHx9+9e5cgiA8//JCyKBfTLr3ZIGAwnQL2eDGYbo9MJit4yfPnz+HI8+fP4QjqZXZZQkNDv/vuO9h89fHjx/v37x88eDCP80UxGL5Yu3ZtUVHRp59+yjmHb7755vz58+QjDQ0Nn3zyyY0bNwiCCAwMpARG6hmkpaUdO3bs2rVr8O+XX35ZW1u7ceNG3tdtYtRBXV3d4sWLq6qqyAdv3bq1ePFigiCGDx/+1VdfdZ503ZveaRAwmE4Br+PFYLo9NTU1RkZGjEmlpaVdvMmEXq+tra21tXVSUlJjY+O5c+dghwYMpsdw9uxZb29vaHBHjx49duxYIyOj0tLS2NjYyspKHR2dwMBAWITf8/jqq6927typra3t4uJSWlqanZ3t7OwcFxfHGIgY06VwcHC4f/8+TF12dXW1sLBobW1NT0+H0d1Jkyb98ccfXTAcVNenNxsEDKZTwB4vBtPtaWpqCggIYEzauHEj7ALSZfn4449v375dXFzct2/fUaNGbdq0yd3dvbOFwmD4p7Cw8MKFC/Hx8Q8ePCgvL29sbDQ0NLS2tnZ3d1+9enUX/zKlCjdu3Pjpp58ePHhQU1Njbm4+d+7cL774grIpC6ZrIpVK//777+vXr9+7dy8vL6+2trZPnz79+/cfP368t7f3nDlzOlvAbkyvNQgYTKeAPV4MBoPBYDAYDAaDwfRM8DpeDAaDwWAwGAwGg8H0TLDHi8FgMBgMBoPBYDCYngn2eDEYDAaDwWAwGAwG0zPBHi8Gg8FgMBgMBoPBYHom2OPFYDAYDAaDwWAwGEzPBHu8GAwGg8FgMBgMBoPpmeD93zHMVFVVzZ8/n3xkw4YNHh4eRO/gypUre/fuJR85deoU3h+vJ/HixQvKZpLqruEHDx6MjIxE/5qYmJw5c6bdq/bv3x8dHa3sVd2XhoaGkydP3rx5s7S0VFdX19zcfPz48TNnzrSysiK6Ktw0i+kN9PKWtIuAG3QMBoM9XgwzUqk0Pz+fIIi6urrKykqCIJYsWUJ0K2pqajw8PO7fv79v374PP/xQqWvr6+vh8WFfeIIgJBKJ2iTFdIKu29raOriGV1ZWwh2fPn3a1tamYH+roqKCw1XdlPv378+dO7ewsFBLS8vOzo4giIsXLx4+fNjQ0LC6uproqnDTLEbd/Pbbb35+fq+++urFixdNTEx6Z0uqSjvYRdi8eXNsbCy3az/44IN169bhBh2DwRAyDIYVkUgEVUUkEsm6p+SGhob01IcPH958SX19PUsmnp6ekEl+fr46hcWoUdddrYaDRyQUCjvgqm6ERCIZMmQIQRAjRox48uQJHExNTdXT0+Og1k6Bdx0paKYwjKBPD4GBgZ0ti1rsjCLVQxXb2EVArTAH/P39GbPCDToG09vA63gxPZZRo0bBj5EjR9JT9+7d6/YSsVjc4aJhOlTXmG5BVFTUv//+SxDEF198YW1tDQcdHR0XLFhA9FawmVKF0aNH92yzoEj16DG28datW5L/Pzk5OZCkra1NSZJIJL/99ltni4zBYLoQeFYzpsfy5ptvxsXFZWRkvPvuu50tC0a9YF33AOLi4uCHg4MD+XhQUNAPP/zQSUJhujHnzp07ceLE8OHD3d3did5Kj7GNOi+hHIEfGhoalCRwgztQOgwG09XBHi+mJ+Pyks6WAtMRYF13d549ewY/DA0NycdfeUknCYXpxggEgjVr1nS2FJ0Pto0YDAaDPV4MBoPBcOTevXuZmZmNjY3W1tZubm7a2toymay5uZkgCE1Nzb59lWhiWltb4Yempqba5MVgMN2MWbNmmZubm5qaKnWVra3tmjVrnJ2d1SYXBoPpTmCPt3eRnZ0dFxeXnZ1dWVmppaUlFAqdnZ1nzZpFnxGkFKmpqdHR0f/++6+uru7QoUMXLVoEy/BSU1NbWlrQaQMGDLCxsSFf2NDQcP369YSEhLKyMi0trUGDBrm7u7u4uNC7vGlpaU1NTejf/v37Dx06FJ7ozJkz+fn5UqnU3Nx8woQJCxYsqKioyM3NJV/u6OgIc5xaWlpSU1PJA0rp6enksI2WlpaDBg2S96S1tbXh4eEZGRkNDQ02NjZeXl729vbkE+Tdurq6OjQ0NDMzs1+/fmPGjHn//ff19fXRObm5uSdPnhSLxbq6uhMnTnznnXf09PQYBUhJSblx44ZYLG5oaDAwMLCzs3N2dp44cWKfPgqtyX/y5El5eTn6V0tLa9y4cXD89OnTeXl5ED3I09MTjnMrf/p9Hz58eOnSJbFYXFtba2pqOmbMmLfffptSzhTZAB0dHTTHVSaT3b59m3KCtbU1BOGk65pCXV3d2bNn79y5U1NTY25uPmnSpDlz5mhpaSlQbP9TSS5fvpyXl9fQ0GBqauro6Dhr1qwBAwZwey94oV2VoapOwdbW1szMDH4/ffq0uLiYnGpubq7gPkC3bt1avXp1ZmYmOmJmZhYcHDx48GDoZa5ZswZFzWEBvTIQyRa86NLSUvhtamo6bNgwbkZD3ssokUhOnz5979698vJygUBgZ2fn6emplGo4aLa+vv7mzZv37t0rKCiQSCQGBgYjR46cMWMGhKSmwMFM8WXb1W3BlJJTnjDt2mF59koVGygWi58/f47+NTY2HjFiBPq3tLS0oKAA/aunpzd27FhCGRQvGQWrB0s7yM1Es5dtUlLShQsXnj59KhAInJycFi1a1K9fP4IP1q5dy+Gq8S9hP6fdikShrq7uypUrycnJ5eXl/fr1s7S0dHd3f+ONNzQ0NDhIiMFgOpTODp2F6SBCQ0NtbW1B6X379rWyskL9dTMzs7CwMG4RJisrKxk9HH9/f6lUStmlY82aNeRrg4ODoefdp08fCwsLdLKdnd3Vq1cpN6L0wn18fJqbm1euXEm5L4SjPH78OOU4CsyIetLyCAgIkBfa8fr165T5lgRB+Pn5kc9nvPX169cNDAzIB01NTWNjY+GSr7/+mtJZt7CwyM7OppRAQUHBlClT4ASBQGBlZYX6Lv379/fz82tubm63GlDm+AmFwtbW1o0bN9LLYcGCBVVVVdzKn0x+fv7cuXOR2NbW1rq6ujCO5+vrW1dXJ082wMrKCp3AuJ/EoUOH6AVOf/CoqCjk5iFsbW3T09PZa3hubu6MGTPgBGNjYysrK3CStbW1N23aJK/MFXkvOMdqVlBl8qr68ePH0Tn+/v7s9Vkef//9N7nrTO6Uf/nll4zvuzzorwyZd955h7PRYHwZExMT6bsHKR7Ll4Nmy8vLvb290bcVExMTa2trVHrz5s0rKyuj3EUpM8XZtiuoDr4sGAc55QnTrh2m2yvVbeA777xDTvX09CTfMTAwkJxqb29PeRYWO6NsyShYPVjaQW4mWl7ZSiQSb29vyr0sLCwyMjJk6gR969TR0VHwEmUbdDIHDhwwMjKCkrGyskJjzvb29snJyfw9FgaDUQvY4+0tgKE3NjYODw9vaWmBg7m5uWhvwODgYMYLWdrp+vp69A116tSply5dys/Pz8jICAgIEAgEW7duhf6fQCAQvQT1kGQy2bp16+DCtWvXlpaWwsGHDx9OmzYNurNHjhwh3+v06dPHjx//+uuvUSvr4+Ojra29bNmyH3/88auvvoJ9TcDjysnJgTu+9tprlJa+oaEBktBkpy1btohI3Lt3j15uBEHExMRoa2tPmTIlICAgMDBw6dKlqJMXGhqKzheLxcdf4ujoCKnnz5/X0dGZNWvWvn37vv/+exRDRSAQFBUVBQYGampqLl26NDAwcNeuXWPGjIHUkSNHIjXJZLK6ujoYHp8wYUJqaioclEqlV65cGT58OFxSXV3dbjWIjY2FxxQIBNDb+/LLLwUCwd69ezMyMvLz8y9duuTq6goZjh8/Hm16oVT5I9LT06EOWFhY/Pnnn1KpFBzXkJAQGAJydHSsqKggy+bk5AS3WLJkiUgkCg8PR7m1traC8BB9dNeuXSKRKDMzU56uEREREfANXl9fPyAgIDMzE570rbfeMjU13b59u7wanpaWBv6VjY3N33//jXQREBAAGc6YMYOsJqXeC84er4Iqg6q+a9cuVN+CgoJEIlFOTg7KMzk5WSQSbd68mSAIJycnkUiUkJDQriQ1NTWoR7506VLYSai2tvann37S0dFBwx0Kerz0t3X37t3ofbx27Rpno0F/Gf/8809dXd3Ro0dv27Zt//79yPop6PFy02xaWhpc4u3tnZeXBwebmpoiIiL69+8P7npNTQ35EqXMFGfbzoiaLBg3Oel1A+zwjBkzAgMDRSLRqlWr0Mx5sh0ODw8XiURbtmxB9kp1G3jt2jWRSLR7925Gjxe+naHmUimPV9mSUbB6sLSD3Ey0vLJdsmSJmZnZpk2bQkJC9u7di0JkDx8+XJHvsJ3i8SrYoCPQVsafffZZZWUlHExJSYHXRFdX98qVK7w+HAaD4Rns8fYWwNBfunSJnuTl5QWzsJ49e0ZPZWmnP/30U9T2t7W1kZNSUlL69esHfRF6z/7gwYNw4cqVKylJTU1NEyZMgM+o8fHxlFTUd7SxsREKhVlZWSipqKiIvm8ny+Z7Pj4+kJSWlkZ/anoONjY23333HTnpxIkTkOTo6Mh+4aFDh8hJK1asgKRVq1YZGxsjVwoeH3WpL168iI7v378fDqIeM0IsFsP0QkU8XgT0cvr27duvX7+UlBRyklQqRZ/8169fz7n8a2pqYLZbv379yF4WcPbsWchq9uzZ5MoTExMDx6dPn84o+fPnz3V0dOhlLk/XBQUFEPdIS0uL8iW+ra1t4cKFaHySUsNramrgK4O+vj7aHhbx7bffwlU7d+7k671Qh8pkMhlyXRITExlzhgGumJgYBSVBHz7mzZtHSTp27BgkKe7xKrhVJmejQc556NCh69evh2498J///Edxj5ebZuGtmTRpUmtrKyXD1NRUWI+wefNmxjsqYqY423Z2+LVgKspJFubAgQPkpFOnTsmzw8hekT1eFV8o5GVRPF4EZ4+XQ8ko24pR3ixuJppSttbW1nZ2duXl5ShJIpGgpSiKW5UO9niVatB//vlnSPr4448pSVVVVQMHDoTReHIhYDCYrgb2eHsLH374oZOTE2NSfHw8WPNffvmFniqvnS4sLIRvon379n369Cn9wvXr18OFlP5fTU0NfFzX1tamT+eTyWQ3btyAC8eNGyevlSUI4tSpU5TUlStXuri4qMnjdXZ2pqeiZU61tbXyLnzzzTcpSQ8fPkRP8emnn1JSw8PDIWnDhg3o4KJFi6CoyZ11xJw5c7h5vPImceXn54NyNTU1i4qKuJX/zp07WW4hk8lQ+NDz58+jg62trZaWlnD88ePH9Kv27dtHEMThw4cpx+XpGq0BY3TAYC0oYw3fsWMHHGf0Rpqbm2H4V09Pj1zynN8LNalMJpOFhITAhUuXLqVfKJFITE1NLSws6P6YPNDCWvqsxba2NrS4kUePVxWjQc559OjRlMe8c+eOvb09eSqBPDhrNjs728rK6uTJk4zZvvXWW9BdpjsVCpopzradHX4tmIpyImEmT55MTx08eDCjHVbE41X2hVKHx8u5ZFT0eLmZaHpbcP36dUrq4cOHGetA1/F4FW/QkfHR1dVFo7tk0PforVu3qvA0GAxGvSgU7QbTAwgJCUlOTmZMQj1UeScwEhYWJpVKoT9kYWFBP+H999+Xd2FdXR1BEFOmTGGM/ePm5gaT/VJTU+WJZGxsTF9N9+uvv6ItPXln2bJl9IMotMmTJ0/kXfjee+9RjowYMQKF9KCnojzFYjE6CH2v1tbWS5cu0W8RHByclpYGrbKy0AWA1bPQ15FKpWFhYRzKXyaToRW2ixcvZrw12h8SfUGHJ/3oo4/gNz3uEXQcDQwM0Hw/dlpbW5H8jBVywIAB4HLQbxQUFAS/Kev3AC0trZkzZ0IgpT/++EP190J9Knvvvfegbvzxxx/k0DtAZGTk8+fP16xZo2CE5NLSUqiZVlZWaAorQkNDY968eQTf8GI0YEyS8pjjx49PS0tjLFK6DNw0O3LkyPz8fMZahMxvRUUFiw3pYNuuDgvGl5yMhayIHebdBvKIujXICGcTTWHAgAH07Y5ff/11+EEJndV1ULxBR8Zn2rRpxsbG9Ks8PDzgx9GjR9UmLwaDURXs8fZGampqnjx5kvN/oA+l9Ei5LCDfZuLEiYwn2NvbMwYwvH79OvyQF0exT58+aB4mGrqh4OjoqNTGJ6qDRCID05ngk7C8C9H8LoSGhgZqOOmRIVE8DGhlAbRea/HixXv27KH4LYMHD7a3t1cwXDNFEnmhKZFa0SCDUuWfmZkJ1UlDQ4MS8pTeK4qLiyPH9F69ejVkfuzYMXJQUKgPYrH4gw8+IMeJZeH+/fv19fXs9Y1Rs5mZmRAHVVtbm65BAPl75O8snN8L9alMX19/6dKlBEE0NzfTg9kEBQVpamquWrVKQQEyMjLgh7xQtOzBTrnBi9GAZfCcZeBFs62trSUlJY8ePULmF9VPpcyvWm27OiwYX3Iyvozm5ubt2mHebaCaUIcGeTfR7VZ7VTTS1Rp0ZHzkbXRka2sLS2NKSko4f7fCYDDqBu9O1IvIzMzcv3//pUuXSkpKGE+geBfsPHr0CH5QNhxC6OjoCAQCeoP34MED+MGynweKBpmVlcV4Qrsbw/AOPdIvTHOCHzD4wwjjLoIwk7bfSyhJKIgrOc+1a9ceOXIkMzOzoaFh69at//3vf6dNm+bl5TVv3jzUSHPAwMBA3uYlaDOPnJwcDuWPtDxgwABUSvK03NjYmJ+fj0JwmZube3p6RkVFVVZWRkZGgrcGwKCE4ptVoFoqFArlbZXB+CzZ2dnwQ09PT974Btr7h7xDD+f3Qq0qW7duHQxZBwUFff7556iHmpGRkZiY6O3trXgtQl9b5F2iSoWUBy9GQ0W7oYpmW1pajhw58ttvv6WmpsJmxSqaX7XadnVYML7k5GyHebeB/KJWDfJuotWqkY5BcbFRW5CZmfnTTz8x5qatrQ0KyszMlGcfMBhM54I93t7CwYMH/fz8pFKppqbmrFmzHB0dDQwMoOPb0NCAQtEoTnV1NfyAsECM6Orq0vt/aNdNlgvRBF36JExAxQ2EOcC4jaEiw6ry9j9kT6Kgo6MTFxfn7+9/9OjR1pdcfomvr+/UqVM3b94MM2yVhaUYkXaqqqqUupCDlkHR5O7UunXroqKiwMVFHm9xcXFMTMybb76JYoHyVUtZ5K+urobgRixUVFQoe0fOHi83lY0ZM2bSpEmJiYm5ubnXr1+fPn06+QuCr6+v4gKgMUl5kvC1CSfvRkNFu8FZs2VlZTNnzrx//z5BEEOGDJk9e7aFhQVaPR4TE5OYmNilbLs6LBhfcnK2w7zbQB5RtwbVYaLVp5GOQXGxUUGdfInibQEGg+lSYI+3VxAbG/vJJ58QBGFkZPTXX39R5vPU1NRwaFPRpFZlP+IqciFKQv1CjJGRUXBw8K5du06dOnXy5MmEhARYi/XXS3x8fI4ePcpjP0NFFSilZfpd3N3dR4wY8ejRo6SkpPT0dNhd4/Dhw1KpFG1Rw5cYjCB5LCwsLly4wH4yeWko5zuqW2W+vr7gWR06dAg83vr6+rCwsGHDhtGX4bGAHFp5g06NjY0E33QFo8FZs0uWLAF3d/Xq1UFBQZTlACUlJap4vOqw7eqgu8jZ8c1QZ5WMiia694AefPfu3RAkkgUURA2DwXQ1sMfbK0CxBP39/RmXr3DAxMQE5l/V1NTIO+fFixf0g2ZmZsXFxewXoiTGqUe9mf79+3/yksLCwvDw8F9++aWwsBC2ELS3t//ss8+Uyq2hoaFdFZiYmHCQEylOES0zKtrX1xceJ+glUqk0JCSkf//+9IhZLCDhOdRS+NHa2qrUwlTO74W6VbZo0SI/P7/KysqYmJiioqLBgweHh4fX19f7+voqta4YZV5WVsZ4grzjqtAVjAY3zaanp//999+wVfWBAwd4jz6gDtuuDrqsnJxfKEZHkcPnns4qGdVNdC8BGR8zMzN1BCnAYDAdQ1efeYLhBbTgEG02QAZtqKAUaFP7x48fM55QW1vL2LNHwTAokTzJoACPqkSa6dlYWFj4+/uLxWLYuIggCHpQonapr6+XN70WrVpEilYKpOWql7Br2dTUdMiQIZRUHx8fmG8MoTLPnz9fXFy8cuVKpSZSIuGrqqrQ5DQKRUVFLPKXlZWx9Il5fC/UrTIdHR3YRrWtre3IkSMw2Kujo4M2OFEQNKWcvHqZMbQVj3QFo8FNs8j2vv7664zzvbmZX7XadnXQZeVU9oVC3ywYzQKjMemaJaO6ie4loILKy8vrbFkwGAx3sMfbK0DzDxknJrF84mUB7enyzz//MJ5w69YtxuNvv/02ewBMiUSSkpICv7ktT1WKrtMpZGHbtm2MW2jo6OigTXTkhTxhR56akFoZN+9pF0tLy1GjRsFvmIDNEvx29uzZ9GFGY2Nj2NClvr4+PDz80KFDGhoaa9asUUqM4cOHo41kYmNjGc9h3PbD0tISXDuZTMayL4iHh4e5ufn333+v+nvRASpDEb9CQkLi4uLS09MXLVrEGJeIhSFDhsDMvby8PPK+rIjz588TfNMVjAY3zbLbXsXNrzwzpQ7brg66spxKvVBGRkbwAybXUOAwQZ2XkuHQiqluonsJaCazvFKCxsXc3Nza2lodazowGAwvYI+3V4BiTqJOIZmbN29yyPOdd94xMDCAaXu3b9+mnxASEsJ44fz58yHgampqanp6Ov2EyMhIaDa8vLyGDRtGqAc9PT34Qd50Ye7cuQ4ODoyP07nEx8dHREQw9rH09fVhHemgQYM45Hz48GH6wcTERBjBMzAwkLePaLts2LABfhw7doyeKpVKf//9d8qZFNCS3b179167dm3WrFkcwmAiJzk4OJiempWVlZSUxHjhxo0b4QeMiNLJycm5cOFCeXn53LlzVX8vOkBlw4YNmzZtGsQAg+0olVoUTd8TdceOHZSkP/74gyVUMme6gtHgpllke9PS0ujzYNva2ti3EG/XTKnDtquDriynUi+Uvr4+fPF5/PgxbGCGkMlkBw8e7MiSUbEVU91EcyAyMvLjjz/+888/iW6Cl5cX6CghIUFe1O6goKCysjJnZ2d1xO3DYDC8gD3eXgHaRz4gIIAyElhSUrJt2zYOeb7yyisBAQHwe/ny5ZT4qL/99tvVq1dRe0xGU1Pz2LFjEGNp7dq1lPg3JSUlX3zxBSydYtn1XnVsbW0p89Dq6uquXbt2//79Lht8gu5gEAQRFRUFPenFixcrm6Gent6VK1d+++038sFnz56tXLkSfn/77bcK7nxLZ/ny5eBfnTlzhj7ut2fPHpihunnzZnkb3k6cOBEWtv3777/KhhRGfPbZZ+AsXb58WSQSkZOqq6uXLVuGto6k4OPjM2PGDIIgIiIizp49S0l98eIFFPjy5ctHjhyp+nvRMSpDZVhQUDB27Ng33niDgwwbN26EkS7ovEJ40paWltDQUCQGv3QFo8FNs1OmTBEKhTA9Hl2O2Lt3L/tUyXbNlDpsuzrosnJyeKFmzZoF/u3GjRtbW1vhYEtLy6effqrUmgvVS0bFVkx1E60s58+fX7x48aFDh+bMmdORuxyrgqam5vHjx/v06SOTyVasWEEfxQ0LCzt58qSuru5XX33VSTJiMBgFkGF6AU1NTahra2RktGfPnqtXryYkJOzbt08oFM6ePRuShEKhz0sePnxYU1MDv9Gu687OznCkoaEBsm1ra0PdAnNz8+3bt0dERAQHB8+bN48giPDwcOjqCYVCukhhYWEwiWvcuHHR0dGFhYVPnjw5duwYtNNmZma3bt0in//DDz/4+Ph4eHjA7WxtbUGYDRs20DOPj4+HVEtLSzjf29vbx8fnm2++Qefk5OTANC0XF5fs7GyxWAy74EydOlUmk+Xm5jLmcOLECbgcUpGrM3PmTB8fn4CAAPYLU1NTIRW6UFpaWvBvfHy8TCY7d+6cj4/PkiVLKOrIyMhwdXWFg4sWLbp27VphYWFxcfHt27f9/f1hdw0XFxeJRKJ4lUCqga/4Hh4ewcHBERER27ZtgySCIFauXNnW1sah/BGVlZWTJ0+GxW9btmxJT08vLS1NTk5Ga0dXrFjR0tLCkgMaN7O0tGxtbeWm67S0NGNjY0idO3duSEhIRETE9u3bBw4cOHbsWBQ5BtXwmpoauLCqqmrKlCnQ6fnkk0+Sk5NLSkrS09MPHz4MO1W6uLjU19dTRFLwvdDV1YXbhYaGspRAaGgonAarmhVXGSMtLS1ov9xDhw7JuBITE4MiVGtoaAiFQrTLCxoOWrNmjSJZydOgj4/PDz/8oIrRkPcyojdOWbhpNjo6Gs0InT179okTJ5KSks6dO+ft7S0QCOAFIdsQ8h3ZzRQ3287+jGqyYNzk5GyHN2zYwGivMjIyONtAxKNHj1Btt7Cw8Pb2XrBggVAoNDQ0RJvcGhsbwx0jIyPZW1JVNMhePRSxjRxMtLy2AB5HXh0Asbds2QLHCYLYt2+fjBMtLS2Qp7e3N2TVp08f9vaIc0VCOZw8eRI+Z4wcOTIsLCwvL6+wsPDmzZsffPCBhoaGlpZWZGQkt8fBYDAdA/Z4ewt1dXVr1qyhrBTS19ffvXs3fQe5mzdvlpaWEnKorq5G2Uql0sDAQJjshxg0aNDZs2dlMtmAAQOga8go0r1799C+oAgtLa1ly5Y9ffqUcrK8tXlWVlb0nOXFcHJyciKf9vPPP1M+ydvb2//7778sSzf9/PzgWsZUV1dX9gvPnTvHmHr8+HGZTLZz507G1MuXL9+/f3/dunWMn+1NTEy2b9/e2NioVH0gf4yIiopCXhBgYGDw448/SqVSbuVPRiKRfPfdd/TFora2tuHh4e3KWV9fD3tC7tq1i/EEBXX96NGjqVOnkk/o06fP4sWLq6urKQO/BEGUlpaiC5uamvbt20ePU2pqavrVV1/J+8rA/l6g/rQiniFl6bLiKpPH9u3b4d2vra2VqcDVq1fB7SfL8Pvvv6NXQEGPlyXi2syZM1UxGiwLsOGN4wA3zV67dm3EiBEUGSZPnpyenu7n50c+6OrqSrkji5niZtvZH1BNFoybnJztMKVmUiThZgPJ3LhxA/lOwNixY9PT0+kibd26td2WVBUNslQPBW2jsiZaXlsAjyOvDiCFQuivfv36PXjwQMYJiUQir0jltUecKxI5k7S0tJkzZ9LXM7u5uaWkpHB7FgwG02FodIuwPRi+qKysTExMLCoq0tLSGjJkiIuLCwwcqUhTU9M///xTUFCgq6trY2MzadIkmH/4yiuvvHjxws7OjjHCDVBeXp6cnFxaWqqlpTVo0KDJkye/8sorREdRUVERFxdXWlqqra09atQoZ2fnLh6fIy8vLysrq7y8XCKRGBgY2NnZOTo6ctgp0dzcvKysTCgUwqcNqVSamJiYn58vkUisrKxcXV3RIAYvtLW13blzJzc3t6amxtTUdPRLiA7n8ePHd+/era6uNjc3nzhxouIrn9va2lJSUsRicVVVlUAgsLOzGzduXLvFLu+94AXOKouJifH09Pzoo48YFzYrK0NsbGxWVlZjY6ONjc3s2bP19fVv3boFw1lr1qyhf03ghc41Gtw0Cz3mjIyM+vp6ExOTCRMmoCmpvJgpNdl23uk6cqpoA1taWpKSkmDe76uvvjpp0qTOKhleWrEOM9HZ2dlJSUlubm6K1/8uxbNnz8D4wEeT8ePHd9llUBgMhgz2eDHqorq6GqaSTp8+/erVq50tDoatt4fpPSxcuDAqKurevXt8rc2j0AEeLwajOtgGYjAYTO8BR67CcCchIWH58uUFBQXyUuGHm5tbx8qFwWCYKS8vj46OdnJyUpO7i8FgMBgMBtPVwB4vhjtisTg0NBRtYEABAgLp6OisWrWqw0XDYDD/w/Lly6Ojo9G/Bw8ebG1t5Rb1GoPBYDAYDKY78j8hBDAYVfjmm2/s7e1R5EaCIBoaGjZv3nzjxg2CIAIDAynRXDCdSGVlZV1dHSxag78wRG9gYICiGWN6EqGhoY8fP547d66mpubjx4/3798/ePBgFEkVg+ltYBuIwWAwvRDs8WK4Y2BgoKGh0dzcPG/evNGjR48dO9bIyKi0tDQ2NrayslJHRycwMHDt2rWdLSbm/7FlyxZyvKKKigrYq9bPzy8wMLBTRcOoi8TERDs7O2tr66SkpMbGxrCwMA67hmIwPQNsAzEYDKYXgj1eDHfmz5//77//XrhwIT4+/sGDB/Hx8Y2NjYaGhg4ODu7u7qtXr8aju10NDw8PyiYcANorEtPDWLdu3e3bt4uLix8/fjxlypRNmza5u7ur9Y7m5uaw4w7aaRaD6TpgG4jBYDC9EByrGYPBYDAYDAaDwWAwPRMcuQqDwWAwGAwGg8FgMD0T7PFiMBgMBoPBYDAYDKZngj1eDAaDwWAwGAwGg8H0TLDHi8FgMBgMBoPBYDCYngn2eDEYDAaDwWAwGAwG0zPBuxNhMJiOo6qqav78+eQjGzZs8PDwUDHb/fv3R0dHo39NTEzOnDlDdA3efffd0tJS9O/s2bP9/f07VSIMpkvTlV9njJpsO1a64rx48WLOnDkcirpLNUZdShhMbwB7vBhMO/z2229+fn6vvvrqxYsXTUxMOluc7o1UKs3PzycIoq6urrKykiCIJUuWqJ5tRUUFZPv06dO2trYutRF04Uuam5tLSkoIgrC2tu5siXoF77zzTkFBAf343Llzt23bRj6SlZW1atUqymn+/v6U7jumw+jKrzNGTbYdK11x2trauBW1io0Rv30h3DJiOhg8qxmDaYfNmzdXV1cnJyf//vvvnS1Lt8fMzCz/JXv27OEx2927d0O2/fv3JzqWpqamf16SlZXFeEJ8fHx+fv6lS5c6WLBeTm1tbXV1dVZW1q3/o6qqqrq6+sWLF5QzW1tbq1+SkZFx69atkpKS6urq5ubmThIc05mvcy8hJycHrBb9degs246VrjgCgYBbUavYGPHbF8ItI6aDwWO8GEw7jB49uqysjCCIkSNHdrYsmC5HaWmpm5sbQRCenp7nzp3rbHEw/wt0pM6dO4eGardu3frBBx/Qz7S3t3/48GFhYeGrr746ZsyYe/fu9e2LW0ZMT2bv3r2hoaEEQaSlpdnb23e2OJjuAe4LYbo1eIwXg2mHc+fOiUSiGzduzJgxo7NlwWAwSuDl5TVv3jz4/fnnn8MMQEbWr1//4sWL4OBg7O5iMBgMHdwXwnRrsMeLwbSDQCBYs2aNu7t7ZwuCwWCU5ueff9bT0yMI4vnz5/Iio1y8ePHs2bOrV6+eNGlShwuIwWAw3QDcF8J0a7DHi8FgMJgey5AhQ7766iv4feTIkcTERMoJDQ0NH3/8sZmZ2bffftsZAmIwGAwGg1EvePpW7yIlJeXGjRtisbihocHAwMDOzs7Z2XnixIl9+vzPt4+WlpbU1FT6Vba2tmZmZvD76dOnxcXF5FRzc/OqqqqmpiZ0pH///kOHDiUIIikp6cKFC0+fPhUIBE5OTosWLerXrx+LeOnp6ZcvX87Ly2toaDA1NXV0dJw1a9aAAQMop1VUVOTm5pKPODo6amtrSySS06dP37t3r7y8XCAQ2NnZeXp60gMApqamRkdH//vvv7q6ukOHDl20aBGck5qa2tLSgk4bMGBATU0N43PRqauru3LlSnJycnl5eb9+/SwtLd3d3d944w0NDQ15D1tbW3v+/Pm7d+9WVFT06dNn4MCBDg4O7u7uCsbtKCoqKiwspBzU1dWlLMq6desWQRATJ04kS0JX4rBhw0xNTSm5PXz48NKlS2KxuLa21tTUdMyYMW+//fagQYP4VQcZeTVw1KhRAoGAUJ4nT56cPn06Ly9PIpEMGTLE09Nz3Lhx7Jc0NDRcv349ISGhrKxMS0tr0KBB7u7uLi4umpqa9MzLy8shziRBEJWVlVDagIaGxsSJE1lupOzb0TGqz87OjouLy87Orqys1NLSEgqFzs7Os2bN0tHRYXx8ykEdHR0HBwf4LZPJbt++TTlh/PjxqCTZzRGP/Oc///n999/T09MJglizZg1lpe7XX39dUFDw22+/0aOPKl4ZxGLx8+fP0b/GxsYjRoxA/5aWlpIDR+vp6Y0dO1bZpyALQxCEqanpyJEj33zzTTs7O8bzFVcly1tcW1sbHh6ekZHR0NBgY2Pj5eXFbdmnUsIoCIf6o7hCWVBd19yMv4LtoyIG9tmzZyhPiUSCTrC0tKRYeNUV19LScvHixcTExNLSUkNDwwkTJsyfP5+bPVelKHi0Nh3/ZtXV1Z09e/bOnTs1NTXm5uaTJk2aM2eOlpYWwRPtNkZpaWkK9oUU71/Z2NhwEwaD4YgM0zsoKCiYMmUKKF0gEFhZWWlra8O//fv39/Pza25uJu+NRub48eMoH/q0QD8/PysrK/IRHx8fiUTi7e1NOdPCwiIjI4NRvNzcXLQyxNjY2MrKCqy5trb2pk2bmpubyScfP36cknN+fn5iYiJ9P4PAwEDyhZWVlQsWLKA/oL+/v1QqpVy+Zs0a+nMxCn/gwAEjIyOCIDQ1Na2srJD/YG9vn5yczHjJL7/8oq+v/z+zLPr0GTRoEGqqNTQ0XF1d//7773YVunPnTvqD2NnZkc9B/kZ8fDz5OF2JJ0+eJJ+Qn58/d+5cSBIIBNbW1rq6uvCAvr6+dXV1qqtDJBLBQZFIhA7Kq4E3b96UKQbcVCgUtra2bty4kZ7VggULqqqq5F0eHBwMH3f69OljYWGBHsHOzu7q1auUk9esWUPIR0dHh3xyWloa57ejY1QfGhpqa2sLB/v27WtlZYWqpZmZWVhYmCKPb2VlhU4g96QR1dXVCpojGa8kJSUhGb7//nt0PDMzs2/fvq6uripWhnfeeYf8mJ6enuTUwMBAcqq9vb2y8otEIhBGQ0Nj8ODB5I8UI0aM+PHHH9va2tDJyqpS3lt8/fp1Q0NDynE/Pz+lJOcgDP11phznVn+UUigLKuqag/FXqn1kQZ6BRQQEBKiuOLJtv3//Pt2xMTMzi4qKUlbpnIuCR2vTKW9WVFQUGnJA2NrapqenMzaj7cKhMVKkL6Rs/4qzMBgMN7DH2yuoq6uDVmfChAmpqalwUCqVXrlyZfjw4WBWqqurGxoaRCLRrl27UNsQFBQkEolycnJQVsnJySKRaPPmzQRBODk5iUSihISE8PBwkUi0ZcsWZLmWLFliZma2adOmkJCQvXv3jh49GpKGDx9Ob13S0tLAoNvY2KD2vq6uLiAgAIanZsyY0dLSgs4Xi8XHX+Lo6AjZ/vnnn7q6uqNHj962bdv+/fvR3nRkF6u+vn78+PFwfOrUqZcuXcrPz8/IyAgICBAIBFu3bgWLLBAIRC+JjY2lPxe9bD/88ENI/eyzzyorK+FgSkoKyKarq3vlyhXKJYcOHYL+zQ8//FBfXw8Hnz179tlnn7G3fGRSUlJEItGbb76J2g+RSERxXDdt2sSYISjx448/Jghi0aJFIpFILBaj1PT0dCgKCwuLP//8UyqVgvcSEhIC6yEdHR0rKipUVAdjUw01cPfu3dra2n369Nm2bRvoori4WKYYqLf05ZdfCgSCvXv3ZmRkwBYIrq6ucMfx48ejYiezbt06OGHt2rWlpaVw8OHDh9OmTYPu6ZEjR8jnx8bGgrRw1WuvvSYicfjwYfLJ5HZ9yZIlRkZGn3766YEDB3bs2IEGiBjfjg5TvaenJ3Qiw8PD0euWm5uL1BccHEx/fCcnJ0hdsmSJSCQKDw9HJ7S2tkJRjBo1iiCIXbt2iUSipqYmBc2RjG8++ugjyFxPT6+goEAmk7W1tbm4uGhpaT148EDFynDt2jVyZaB4QdA3RXVeWY8XfVz46KOPSkpK4OCzZ8/8/f3RCJVEIkHnK6tKmUyWk5MDEr722mtwTkxMjLa29owZMwIDA0Ui0apVq9DAeGhoqOLCcxCG3fnhVn+UVSgLquiag/FXtn1kAQysSCRydnaG223ZsoVste7du6e64tCzb9++3cTExN3d/c8//4TWds+ePdCIaGhoUEyWIh4vh6Lg19p0/JsVEREBj6avrx8QEJCZmQnN2VtvvWVqarp9+3Z6M9ouHBqjdvtCHPpXnIXBYLiBPd5ewf79+8Fw5OXlUZLEYjF8byYbfeS6JCYmMmYIo2cxMTHkg8hyWVtb29nZlZeXoySJRILmOlKuqqmpgQZJX1//yZMnlBuhlXU7d+6U1/wQBDF06ND169eDbwb85z//obhYn376KeqgkMdDwIXo168ftDr0hpZskSlJP//8MyR9/PHHlKSqqqqBAwfCp19yUbS0tMD4zLJly+hPtHbtWqVGUU6fPi1PAJlMhqYQDx48mPLIMpkM+lhZWVnkgzU1NTBbqV+/fuQvHcDZs2chw9mzZ9MzVEod8j5OFxYWjho1Sltb+8yZMzLlgWa1b9++/fr1S0lJISdJpVI0cL1+/XrKhQcPHoSklStXUpKampomTJgAQ9yUIVMYD2fs+FIgvx22trZkH76xsZHcGeos1YP6Ll26RM/Ny8sLHMVnz55RkqKjo+FG06dPZ5Tz+fPnOjo6jo6OnM0RX1RVVaEBGQ8PD5lMdvToUYIgtm3b1mGVgdELYgcZmRUrVtBTkYWke7zKqpJ8LTgVBw4cICedOnUKksjabBdVhGF0fjjUH84KZYGDrjkYf1XaRxZ8fHzgwrS0NN4Vh2y7jo7OwoULKfYnISEBmtpXXnnl33//Vdzj5VYU/FqbDn6zCgoKXnnlFYIgtLS0KPPF2traFi5ciOZRc/N4lW2MWPpCqvev+GoZMRh5YI+3V7Bo0SJwA8hOCGLOnDkUox8SEgJWZunSpfTzJRKJqamphYVFa2sro+UiCOL69euUqw4fPgxJGzZsIB/fsWMHHN+8eTP9Xs3NzfBNV09Pj94soSZk9OjRFGHu3Lljb2+PRpwKCwthpVbfvn2fPn1Kv9H69eshK8U93pqaGliMpKuri0Z3GdvarVu3ooPZ2dlw8Ouvv6ZfkpKSopTH++LFC1jiYm5uTm9mkDoIgqDPr7a0tKRMhSXPmJUng4uLC5xw/vx5zuqQ5/E+evRoyJAh+vr6N27ckHECTZ1ilD8/Px+qgaamZlFREV2V2traZWVl9Atv3LgB2Y4bN07Zji/97bh8+TIlFb1xlLejI1X/4YcfOjk5Md4rPj4esvrll18oSa2trRYWFpD6+PFj+rX79u0jCII84q2sOeKR8PBwVCy//vqriYnJ0KFDGxsbyeeotTIo6/G2K4xEIoHpkWSPl5sqKW/x5MmT6amDBw+G1NraWgUfQRVhGJ0fZeuPKgplgYOuORh/VdpHFT1ezopDtl1ega9evRpO8PX1Vdzj5VYU/FqbDn6z4CMIeQ4wGViLTm9G24VzYySvL8RL/4qvlhGDkQf2eHsF7777LliNCxcu0FMLCwvT0tLI7UF9fT3qIpDnrwK///47QRDffPONPMs1YMAA+rASikjk5eWFDra1taFYHXfv3mUU/v3334cTQkJC5DUhP/74I3sJBAQEwJlTp05lPAHFHFLc40XjBnPnzmXMUywWwwkDBw5EB3NycuDgxIkTKW4h+A9paWlkZ6xd0LoXygAFzDz39fVlbDDgeSmjW21tbWgQLCEhgfF2v/zyC5wwY8YMzupg9HhTU1P79+9vYmJy+/ZtGVeQx3vr1i3GE9Dc5m+//ZauymnTpjFeJZVKUUVNSkpSxePt378//e24e/cu/e3oSNWzgyJUMX4C+/rrr+V1Stra2oYNGyYQCMjTyJU1R/zy1ltvoQ4WQRD0RQdqrQzKerxIGHlD6FCehoaGZI+XsyrJb/GhQ4foqR4eHpB6//59BR9BFWEYnR9l648qCmWBg66VNf4qto8qerycFYds+6xZsxgvv3nzJpwgEAjo87EZlc65KDrM2vD+ZrW0tMAAL0EQaA4whVmzZqni8SrbGMnrC/HSv+KxZcRgGMG7E/UK0KKdxYsX79mzhxxnEuY92tvbkyMW6uvrL126lCCI5uZmetyFoKAgTU3NVatWybudvb09PUaxubk5/KitrUUHMzMzIWiktrY2mvZMYcyYMfAjLi5O3h1hWhoL6Fp54XMZZWbn+vXrlOKlYGtrC5OOSkpKnjx5gg7CxLbbt29PnTr1n3/+IV+iqalpb29Pj4fMwuLFi+FHZGQk+fjp06dfffXVHTt2wHOhSbDAH3/8Qb4WyMzMhGZbQ0NDXkzj119/HX7ExcWRQy8qpQ46//zzj6urq4aGRlxcHIfLKWhoaMiLe4kqAPokT1YlWolEoU+fPmiqPxoR4oaDgwO9psEEeMrb0ZGqp1BTU/PkyZOc/wN17unBmQmCWL16NXzgP3bsGDmeJ5SVWCxetmwZzB7kZo74JSgoCE0FXLx4MYqC0ymVoV2QMOi9oxMREVFdXS0vdq5SqiTDaJAZzbjicBaGjLL1p+soVFnjz1f7qDrcFCevEUEWvq6uLiMjQxEBOBeF+qyNut+s+/fv19fXs1ddVG87tzHipX/FY8uIwTCCdyfqFaxdu/bIkSOZmZkNDQ1bt27973//O23aNC8vr3nz5iGDQmHdunVBQUHQQfz888+RJcrIyEhMTPT29pZ3IaxcpR+EYL8EQUilUnQQzfLS09NDy9UooMHhzMxMeXdsd4eGR48ewQ95AfF1dHQEAoFSVhUJn5mZ+dNPPzGeo62tDT5AZmYm3FpTU/PAgQPwNTouLs7Nzc3Kymr+/PleXl7KbpIBzJkzR1dXF7YC2r9/P2jq3r17eXl527dvNzc3nzx5cnx8fEFBwd27d1G/+fTp08OHD6dsm/HgwQP4MWDAAKQvCihmY2NjY35+Pgr+QUapDTNgic7ixYubmpqkUimHEqBjYGAgzwFAeyqg8Rbyg7NsnoQePCsrSxXZFH87OlL1QGZm5v79+y9duoS2XKJAcWiBgQMHenp6njlzprKyMjIyEj6WARCnB402czZHPDJ8+PDp06dfuHCBIAh3d3f6CR1ZGdpFEWEY4aZKNVVU1YVRpf50HYUqa/z5ah85o6Li5DUEenp6AwYMAM8wJydHEbeNc1Hwbm067M1CnRahUChvex5lm1pukrQLL/0rHg0OBsMI9nh7BTo6OnFxcf7+/kePHm19yeWX+Pr6Tp06dfPmzTNnzqRcMmbMmEmTJiUmJubm5l6/fn369OksXVgKKPQ/GcbPqJWVlfCjuroaghuxUFFRwfKA7NdWV1fDDzRNiI6urq5SHi8S/uRLFBf+vffeMzQ03LBhAzhdBQUFgS8ZMGDAypUrN23aRN8XlAV9ff3Zs2efPXu2qKjo9u3bEDsXxvFgCdOiRYtgPDMyMhLcnjt37hQUFKC4i/QnYikl8j6Kz58/Z/R4ldpj848//rh586ahoWFTU1NDQ8O7775769YtxiqkOCwCoEerqqri9uCUUQJlUfzt6EjVEwRx8OBBPz8/+Ogwa9YsR0dHAwMD8KIbGhrQ1GVGfH19z5w5A/YBebzFxcUxMTGTJ09GYy+czRG/sH9V6cjK0C6KCMOvKnmvqLwIo0r96VIKVcr489U+ckN1xbHbYfB4yXaYBc5Fwa+16cg3S8FOi+LCc5akXXjpX/HYMmIwjGCPt7dgZGQUHBy8a9euU6dOnTx5MiEhAXZj/uslPj4+R48epRgXX1/fxMRE6MWCx1tfXx8WFjZs2DDGsREOoLgLFhYWMOrCgiqjfyj6P49fCpHwu3fvhgAYLKC4FMCcOXPefvvt2NjYEydOREVFQTervLw8ICDgyJEjFy5cQJu+KMKiRYsginJkZCRcSB7H8/b29vPzg1RYb0N2ipQtJXISKgFV+Ouvv9zd3U+fPj1z5sw7d+6kpaV98cUXP/74I6EekPxk4ZV6cF6emi/4Un1sbOwnn3wChuKvv/6ijLrU1NSwd+beeuutYcOGicXipKSk9PR0CLB5+PBhqVTK+HWMgznqMLpUZeBguFRUJb+oSRil6k+XUqhSxr/D2seOr0XKFrgqRcGXtengN0sdnRY10Y1ExfRm8OeT3kX//v0/+eST+Pj4p0+fBgQEoCCroaGh9Hm5ixYtgu/NMTExRUVFBEGEh4fX19f7+voqu+S13Xksra2t9u1BGSlSCvThvKamRt45L1684Ca8mZlZu8LTZ+xoaGi4uroGBweXlpZevnwZbd1eUVHh5eXV0NCguCRz586Fr+mwYvP+/ftisRh5NYMHD37jjTdgewaIEnH69OmhQ4fSVxMhIVlKiZzEOA1JWd5+++0///zT2Nj45MmTMNICc8ZUyZOl9JD85LEUpR6cl6fmC75Uj+KK+/v7c1gbpqGhgcKKwmoIqVQaEhJiamq6cOFCXsxRh8FLZWDs+TU2NnIWRvHpJyqqkl/UKoyC9UfdbzcHXSto/DusfVST4pS1wyyoXhSqW5sOfrPU0WlRE91IVExvBnu8vRQLCwt/3PbhSQABAABJREFUf39y55geoUpHR2fFihUEQbS1tR05cgQGe3V0dFCYR9VBawvLysqU8vGUBe3q9vjxY8YTamtrlbXISPi8vDxVZOvbt+/MmTOjoqISEhJgklJpaenVq1cVz0EgEMDUrIKCgpSUFHpoInKIo5SUlPz8fPooH/mJql7CeK/c3Fz4YWpqOmTIEEJl5s2bBz7b0KFDUZBPHx+f0tJSznnW19fL8xDQiiNUJcgPjsJrszy46oG1eIQv1aMlcGj3KTIo8CwLy5cvh2lpYWFhdXV158+fLy4uXrFihSJT3BUxRx2GKpUBjXUwWjP4bsi7MLyrkkc6Rhj2+qOmt5sXXbMb/w5rH9WkuMLCQsbjz58/R/NgyXaYBR6LgrO16eA3C5VMVVUVmtStuknpLv0rDIZ3sMfbK9i2bdt7771HP66jowMDMhBPmH4CGrcJCQmJi4tLT09ftGgRRJvkBUtLy9GjR0NrkZycLO80Dw8Pc3Pz77//nvON0JYklPCYCBQ9X3HQTGaYJcVIbGysubm5tbU1+uSflZXl5eV1/vx5+smTJk1CGxXKi4ohD9R4//HHH6dPn7a1tSUHK0bb2ERGRsqb1wrqGDVqFPtDoaiMs2fP5muoH/Hee+/B95Rnz5598MEHqvQh5CkUVQDyLjVvv/02PYAzGYlEgja5lbfuq4N9CX5Vj6KtME4yZPlyjzA1NYWc6+vrw8PDYcH/mjVreDRHHYMqlcHIyIilrw+LRLgJw3LttGnTrK2tUa9ddVXyiDqEUbb+8PJ20+Gga2WNfwe0j/KsFi+KkyczMsIWFhbDhg1TJCvORcGjtengN2v48OFoIDo2NpbxHJai6EjU0b/CYHgHe7y9gvj4+IiICMaGWV9fHxa9MO6IM2zYsGnTpkEQmmXLlkEMZ35l27hxI/yAYWQ6OTk5Fy5cKC8vnzt3Lue7vPPOOwYGBgRBpKen3759m34C2uhccby8vCDwb0JCAjnwL5mgoKCysjJnZ2cUa7GioiI6OvrcuXOM54OQ8tTBwrx582CELSQk5NGjRxSvxtLSEtaGPX78OCQkxNraWt5mJxs2bIAfx44do6dKpVLYjZl8Jr8cPHgQomFdu3ZNldW8hw8fph9MTEyEMJ4GBgbvvPMOOj5//nyI45qampqenk6/MDIyEr5ZeHl5Ubpoenp68IO8V9PFixcdHBxgioS64UX1KIQ16vqTQftnsoOMw969e69duzZ9+nTG7iwHc1RaWvrFF19s375dwTg3qqBKZdDX14cV+48fP4bNVBDkjWE5CHPnzh0Uc5hMdnb2jRs3nj59OnXqVB5VyRfqEEbZ+qOKQlngoGsOxl9N7SOj1Zo7d66DgwO0j7woLikpiTH2NXI10Sd1ReBWFJw7P3Q6/s1CXwyDg4PpqVlZWUlJSUQXQB39KwyGf5i36cX0LFxdXQmCWLFiBT0pLCwMasLu3bsZr42KikK1ZezYsSx3kbc7OYBmMbm6upKPt7W1oS0xz5w5Q7mqvr4eJswwCo+2dM/Pz5e1Bww6EQQxcuTIiooKclJoaKiBgQF0Alh2SKc/V2xsLES8eOONNxoaGiip4Bzq6uo+fPgQHYR2sV+/fg8ePKCc39DQAAuQjIyM6urqZEpCjp519+5dSuq+fftQ6saNG+VlIpVK4RsHrN+mpKLIHJs3b1ZRHWgCs0gkoiTdvXsXPqL37ds3JSVFpgxCoRD6cwYGBqGhoeSk8vJyOzs7uGlQUBDlwr///hupUiKRkJOKi4uhS2RiYvL06VPKhW1tbRCg8rXXXkMHv/zyS4IgVq1apeLb0WGqRyvZLCwsiouLKY+PhhraFY+8go7+OnM2R2jV3FtvvSVTGVRR6XVPxcogk8nQRuUffPBBS0sLHGxubv7444/RZEh7e3vFpUXCTJkypbm5mZzU3NwMnzPINU1FVbK/xRAIDfr3igivojDwOlNsMof6o4pCWVBW1xyMvyrtIwvIJpw9exaO1NbWwoezwsJCFRWHbLu5ubmjo2NVVRU59cCBA5BqbW394sULBZXOuShU6fxQ6Pg3q76+Hm2pRWmzqqqqHB0d0S6+8kwZI5wbI5YL1dG/Ur1lxGDIYI+3VwBGHyY0Xrt2rbCwsLi4+Pbt2/7+/rDKzsXFhdIPQLS0tKBt6w4dOsR4zg8//ODj4+Ph4QGn2dra+rwEnMBz5875+PgsWbIEUoVCIaQiP7CqqmrKlCkQYvGTTz5JTk4uKSlJT08/fPgwbJPo4uJSX1+Pbpebmws5WFpaQp7e3t5wJD4+Xl4htLW1rVy5ErXE27dvj4iICA4OnjdvHgTloje0GzZsYHyujIwMdM7JkyehozBy5MiwsLC8vLzCwsKbN29+8MEHGhoaWlpakZGRZDHQl2ChUPjzzz9nZWWVl5fn5ORERkbCErK+ffuiXohShIaGQs42Njb01Pz8fEglCOL27dss+VRWVk6ePBkk2bJlS3p6emlpaXJyMlq/vWLFCtS946AOX19fHx8fZ2dnONnZ2dnHx8fX1xdSv/jiCx8fH7RCeMiQIZBVSUkJ+7PDabAWTigUwucGDw+P4ODgiIiIbdu2gX4Jgli5cmVbWxs9k7CwMPC0x40bFx0dXVhY+OTJk2PHjsFIjpmZ2a1btxjvDhtsQhCUwsLC8+fPGxsbwxQv1d+OjlF9U1MTxLiCPveePXuuXr2akJCwb98+oVA4e/ZsBcVDQ1sDBw4kVxJVzFFzczOSX19fX8YVVElQRYW65+Pjk5qayldlePToEVq6bGFh4e3tvWDBAqFQaGhoiAZpjY2N4b4XL15URHIkzPjx46Ojo58+ffro0aPIyEiIyD1+/Pja2loVVSnvLT5x4gRkC6kjR46E1JkzZ/r4+AQEBLBLzk0Yyuusq6sL/4Iw3JozzgplQVldczP+yraPipCTkwNrUlxcXLKzs8ViMWwqNnXqVM6Kq6mpgd/Itu/fv3/MmDEDBw7ctm1bRERESEgI+jZnZGR07949skjsSudcFKp0fih0ypuVlpYGrQkMwoeEhERERGzfvn3gwIFjx45FwbSQKaupqWF5BM6NUbt9IQ79qw5oGTEYMtjj7RXcv39/3bp1lA1yABMTk+3btzc2NrJcvn37duhrkvtVZOStfaqurpbJZDt37mRMJX/LbGpq2rdvHz1Opqmp6VdffUVpkFjWrhw/fpzlQaRSaWBgIJo8BgwaNAg6GbCZu7m5OTofGlE6ly9fJmeblpY2c+ZM+qJWNzc3+hBlQ0PDr7/+6ubmhgKfkJkyZQqHjhdQVVUFeW7atInxhPHjx4MP2W5WEonku+++oy/YtrW1DQ8Pp5ysrDoMDQ3pZxoaGkIqGoalwN7OUdaLQrMaFRWFPtYABgYGP/74o1QqlZfPvXv30NbTCC0trWXLlrGM/5SUlIwbN45yyb59+/h6OzpG9XV1dWvWrKEsUdPX19+9ezd9q0954tXW1urr6xMEsWPHDh7NEZqmyDgOoCCMi4qBc+fO8VUZZDLZjRs3UO8WGDt2bHp6On3NZLseI7swurq669evp3s7HFQp7y328/ODPBlTFRl44SCMPE2BMJybM84K5UvXnI2/Uu2jgvz888+UHVDt7e3//fdfzoqjxxoUiURVVVULFy6kNI5ubm45OTkUediVzrkoVOz8dIU369GjR2jNAtCnT5/FixdXV1ej4XREaWkpi/ycGyNF+kLK9q86oGXEYMhodFa0FUynkJeXB9+VJRKJgYGBnZ2do6NjuxvixcTEeHp6fvTRR4yLSXikra0tJSVFLBZXVVUJBAI7O7tx48bxvkFiU1PTP//8U1BQoKura2NjM2nSJJjw9sorr7x48cLOzu7hw4ccsn327FlycjK0N0KhcPz48YytLOLFixcZGRlisbi2tlZLS8vc3HzcuHHsl3QwbW1td+7cyc3NrampMTU1Hf0SolshlUoTExPz8/MlEomVlZWrq6sioYPLy8tBlVpaWoMGDZo8eTLMW2ZBJpPduXMnKyursbFxwIABU6ZMgQa+21FZWZmYmFhUVKSlpTVkyBAXFxcYclEcR0fH9PT0goICNM1PdXPU0tJy5swZbW1tT0/PDt6nl0NlAIGTkpIgOPCrr746adIkfoXR0NCwsrJydnam9C/5VSWPqEMYbs0ZN4Xyq2tuxp/39rGioiIuLq60tFRbW3vUqFHOzs7077a8KK6oqOjOnTulpaVGRkavv/46RGpQBQ5Fwa22dJ036/Hjx3fv3q2urjY3N584caKykT46DDX1rzAY1cEeL6Z9Fi5cGBUVde/ePfo2nj2G6upqmDs0ffp0pXYGwmAwiKysrDFjxsybNy86OrqzZcFgMBhM54P7V5iuAI7VjGmH8vLy6OhoJyen7u7uJiQkLF++vKCgQF4q/HBzc+tYuTCYngPE5OQ9ojsGg8Fguiy4f4Xp+mCPF0Nl+fLl5PGZgwcPtra2+vr6Et0csVgcGhqKNtehABEgdHR0UPhNDAbDTnR0NIQBg39ramqOHz9uY2ODQqpiMBgMpseD+1eYrg/2eDFUQkNDv/vuO6lUCktH9u/fP3jwYBQxr7vzzTffnD9/nnykoaHhk08+uXHjBkEQgYGBKKIvBoNhJy0t7dixY9euXYN/v/zyy9ra2o0bN9JXA2IwGAymZ4P7V5iuDEPAQAwmMTHRzs7O2to6KSmpsbExLCyMEtSxO2JgYKChodHc3Dxv3rzRo0ePHTvWyMiotLQ0Nja2srJSR0cnMDBw7dq1nS0mBtPNmDdvnouLS2lpaXZ2trOz80cffdTZEmEwGAym48D9K0zXB0euwlD5+OOPb9++XVxc3Ldv31GjRm3atMnd3Z3oERQWFl64cCE+Pv7Bgwfl5eWNjY2GhobW1tbu7u6rV6/GXx8xGKW4cePGTz/99ODBg5qaGnNz87lz537xxRcs0YMxGAwG0yPB/StMFwd7vBgMBoPBYDAYDAaD6ZngdbwYDAaDwWAwGAwGg+mZYI8Xg8FgMBgMBoPBYDA9E+zxYjAYDAaDwWAwGAymZ4I9XgwGg8FgMBgMBoPB9Eywx4vBYDAYDAaDwWAwmJ4J9ngxGAwGg8FgMBgMBtMz6dvZAmDUzv79+6Ojo9G/JiYmZ86cIXq3/C9evJgzZw75yIYNGzw8PIiuSlVV1fz587uRwBgMBoNBYBvey+Hc6+h23RUMpmuCPd6eT0VFRX5+PkEQT58+bWtr63b7gKtD/ra2Nsizrq6usrKSIIglS5YQXRipVNq9BMZgOFBTU+Ph4XH//v19+/Z9+OGHnS0OBtNDbPhvv/3m5+f36quvXrx40cTEhOgmrFq1KisrizHp3Llz5ubmRPeBc6+j3QtVN5vY8GJ6A3hWc89n9+7d+S/p378/0Q1Rh/wCgQDy3LNnD8ErTU1N/7xEXjvNDTMzMzUJjOmOqKmadTonT56Mi4urra3dtGlTZ8uCwRBd34YraAo2b95cXV2dnJz8+++/E92H+vr66pfcvXv31ktKSkrgSFtbG9Gt4NzraPdCdrOZk5MDNeTFixfd3fD21IYP0zHgMV4Mhk9KS0vd3NwIgvD09Dx37lxni4PpmfTUajZq1Cj4MXLkyM6WBYPpOaZg9OjRZWVl3e7NOnXqFPywtrYuKCggCOKPP/5wcnLqbLm6k9ncu3dvaGgoQRBpaWn29vYccug69NSGD9MxYI8Xg8FgMF2CN998My4uLiMj49133+1sWTCYnsO5c+dOnDgxfPhwd3f3zpYF0+XMJja8mN4A9ngxGAwG01VweUlnS4HB9CgEAsGaNWs6WwpM1zWb2PBiejx4HS8Gg8FgMBgMBoPBYHomeIwX8/8jPT398uXLeXl5DQ0Npqamjo6Os2bNGjBgAPmcJ0+elJeXUy7U0dFxcHCA3zKZ7Pbt25QTxo8fr6mpif6tq6u7cuVKcnJyeXl5v379LC0t3d3d33jjDQ0NDXU8V11d3dmzZ+/cuVNTU2Nubj5p0qQ5c+ZoaWmxX1VfX3/z5s179+4VFBRIJBIDA4ORI0fOmDHDzs6OfjIUS0lJCfxbWVl569YtlKqhoTFx4kTOmcujpaXl4sWLiYmJpaWlhoaGEyZMmD9/vkAgYLkkOzs7Li4uOzu7srJSS0tLKBQ6OzvPmjVLR0eH5ara2trz58/fvXu3oqKiT58+AwcOdHBwcHd3ZwknpiYVP3z48NKlS2KxuLa21tTUdMyYMW+//fagQYMop1FqqZaW1rhx4+D46dOn8/LyJBLJkCFDPD094bjqT5GWltbU1IT+7d+//9ChQ6HAz5w5k5+fL5VKzc3NJ0yYsGDBAs4aUbaaKVVoFRUVubm55COOjo7a2toSieT06dP37t0rLy8XCAR2dnaenp7W1tbkM1NSUm7cuCEWixsaGgwMDOzs7JydnSdOnNinj0LfVeXdmiWptrY2PDw8IyOjoaHBxsbGy8tL3io1Ci0tLampqfTjtra2ZmZm8Pvp06fFxcXkVHNzcysrKw6lKhaLnz9/jv41NjYeMWIE+re0tBQWKAJ6enpjx45VXR3sNDQ0XL9+PSEhoaysTEtLa9CgQe7u7i4uLmQTTRBEUVFRYWEh5VpdXV1KOUMNnDhxIvmloBfgsGHDTE1N5b0mSUlJFy5cePr0qUAgcHJyWrRoUb9+/QglUcqo8lKvuJlTCtyaVFNT0+fPn7drCuQVOHutgPxHjhz55ptvymuSODQK6kCtNUoVFXPrdSh1IYvZRFbu2bNnkJSeni6RSNCZlpaWgwYNYsmB93aEs8VWd8OH6S3IML0G2NdHKBQypubm5s6YMQNqhbGxsZWVFVhYbW3tTZs2NTc3ozMZJ0dZWVmhE8hWFVFdXY1OOHDggJGREUEQmpqaVlZWpqamcI69vX1ycjI3+VmIiopCHVmEra1tenq6SCSCf0UiEfmS8vJyb29v1MaYmJhYW1ujZmDevHllZWWUu7DPGdPR0VElcwRZ4Pv379vY2FBuZGZmFhUVxXhtaGiora0tnNa3b18rKyv0LcPMzCwsLEzeTX/55Rd9ff3/mRPSp8+gQYPQVRoaGq6urn///Tf9Em4qZic/P3/u3LmQj0AgsLa21tXVhVv4+vrW1dWxqEMoFLa2tm7cuJGumgULFlRVVTHeUamnoLhDPj4+zc3NK1eupNzO0NBQFY0oXs04FNrx48cpGebn5ycmJtK3BAsMDERXFRQUTJkyBd3CysoKVeb+/fv7+fmRrYc8GG/NknT9+nVDQ0PKcT8/v3ZvJJPJSktLGUvv+PHj6Bx/f3+WzJUq1XfeeYecj6enJzk1MDCQnGpvb6+iOtolODgY7GGfPn0sLCxQbnZ2dlevXiWfuXPnTnop2dnZkc9Bnlh8fDz5OL0AT548yfiaSCQSb29vyskWFhYZGRmKPxQHo6piveJsTumNDrcmdcWKFYQCpoBe4PKkglqhoaExePBgZOsIghgxYsSPP/7Y1tamYqOgCugpFDG8vNQoVVTMrdfB4UIWsynPyiECAgLYc+C3HVHFYqu74cP0ErDH24tg8RjT0tLAyNrY2KC2qq6uLiAgAD7bz5gxo6WlBY7HxsaKRCIUL3HJkiUikSg8PBzl1traKnoJBADctWuXSCRqamqCVLTb22effVZZWQkHU1JSHB0dYQDhypUrysrPQkREBDyCvr5+QEBAZmZmfn7+pUuX3nrrLVNT0+3bt1OaEFQgcNzb2zsvLw8ONjU1RUREwAdsOzu7mpoa8iVQLLt374YLX3vtNRGJw4cPq5I5ArV527dvNzExcXd3//PPP/Pz8zMyMvbs2aOnpwd9DuhcUvD09ITPGeHh4Uibubm5aHO/4OBg+lWHDh2CPH/44Yf6+no4+OzZs88++0xeo8VZxSykp6dDBbCwsPjzzz+lUil0BENCQuCpHR0dKyoqKOoQiUQw4i0UCr/88kuBQLB3796MjAyoA66uriDn+PHj0aNxforTp08fP37866+/hqt8XqKtrb1s2bIff/zxq6++GjJkCMXj5aARxasZh0ITi8XHXwLPSBDEn3/+qaurO3r06G3btu3fvx8Jhlysuro6+OwyYcKE1NRUOCiVSq9cuTJ8+HD61y555OTkwCO89tprlI4XPSkmJkZbW3vGjBmBgYEikWjVqlV9+/7vfKXQ0NB279XQ0CASiXbt2oX6Q0FBQSKRKCcnB52TnJwsEok2b95MEISTk5NIJEpISOBWqteuXSOrjOLxQkcWvddkj5eDOtpl3bp1cMnatWtLS0vh4MOHD6dNmwbey5EjR9DJKSkpIpHozTffhEvWrFkjEokotgVtZ0KxA1CAH3/8MUEQixYtEolEYrFYJpOFh4eLRKItW7ag12TJkiVmZmabNm0KCQnZu3fv6NGjIWn48OGKfCvhbFRVrFfczCmjx8utSb1x44YipoBe4CzuxEcffVRSUgIHnz175u/vj+ZoSCQSVRoF9Xm8aqpRqqiYW6+Dw4UsZhOsnEgkcnZ2hqQtW7aQa8i9e/fYc0Aoa/F4t9jqbvgwvQTs8fYi5HmMNTU10GfV19d/8uQJJfXbb78FE7Nz507y8ZiYGDg+ffp0xts9f/5cR0fH0dGRfPDnn3+Gqz7++GPK+VVVVQMHDoSvp+Xl5YrLz0JBQcErr7wCk1opLWVbW9vChQvRxCRGj3fSpEmtra2UPFNTU6ETsHnzZvodYad4er+Wl8zJvSUdHZ2FCxdSvrsnJCRAQ/LKK6/8+++/jO33pUuX6Nl6eXnBjMpnz56Rj7e0tMDH/mXLltGvWrt2Lb1zo4qK5VFTUwMT1fr160d2S4CzZ8/CHWfPnk0pEFRt+vbt269fv5SUFHKSVCpFn4HXr1/Py1OgnreNjY1QKMzKykJJRUVFenp6dI9XKY0oXs1UKTQQjCCIoUOHrl+/HnoMwH/+8x+yi7V//344E7kZCLFYDKNAini89FvTO14oycbG5sCBA+QktIsJxeCwgzzJxMRExhNgUkBMTIzqpdquyugeLwd1sHPw4EHIZ+XKlZSkpqamCRMmwBgIZbT29OnT8t4FmUyGZlMPHjyYXpHABSK/BZTXxNra2s7OjvweSSQSNJuXXPLsqGJUudUrzi+vvCG+6OhoDk2qIqaAXOB0jxfZuhUrVtAvRB0A5PFyaBTU6vGqqUZxVjHnXgfnC9nNpo+PDySlpaW1+7D0HHhpR/iy2Opu+DA9G+zx9iLkeYw7duwAE8DYIWhubobhXz09PXLPtbW11dLSEi58/Pgx/cJ9+/YRBEH+9lZTUwMDbrq6umjQjAzqPW/dulVx+VmA1hdGJ+ipsIaNsQnJzs62srJiHCmVyWRvvfUWODx0i6mIReacObm3pK2tzTj5efXq1XCCr68vJenDDz90cnJivGl8fDxc9csvv1BEheNff/01/aqUlBRK50ZFFcsDza6U15FCQSbPnz9PSUKTNhmvzc/Ph7WLmpqaRUVFqj8F6njBZpKU1JUrV7q4uKiiEcWrmSqFhnoqo0ePprgQd+7csbe3RwNQixYtgg8KZDcMMWfOHHV4vJMnT6ZfOHjwYEitra1V8F4hISFwydKlS+mpEonE1NTUwsKCXAKcS5UXj7dddbCAarU803Hjxg24y7hx48jHX7x4AQsgzc3NKUYJLACC7o1YWlpSZkHTX5Pr169TUg8fPgxJGzZskCmGKkaVW73i/PLK83hbW1stLCyUalJV93jbrRUSiQQmoyKPV9lGoYM9Xr5qFGcVc+51cL5QrR4vL+0IXxZb3Q0fpmeDPd5eBKPH2NbWhuJM3L17l/HC999/H04ICQkhH//mm2/ktSJtbW3Dhg0zMDAgTxZFIwxz585lvJFYLIYTBg4cqKD8LLS0tMAXU4IgYmNjGc+ZNWuWvCaEBV9fX7gqNzeXkqRg/4Nb5uTe0qxZsxgvv3nzJpwgEAjQRKx2QXFTKF3/nJwcOD5x4kT64Elra2taWhpyFFVXMSNtbW1o9RSaWUrhl19+gRNmzJghz+O9desW47VobvO3336r+lOgjpexsbHi5a+4RhSsZioWGuqp/Pjjj+xyov0bL1y4QE8tLCxMS0tjdIZV8XgPHTpEv9DDwwNS79+/r+C96uvrUXefPsnt999/Jwjim2++4aVUefF421UHC6hWT5s2jfEEqVSK2oKkpCRyEloVSRn+hVnfyGRRGgIILbNt2zb6vdBrMmDAALoXiuKKeXl5yfiA3ajyXq/YX16WZZxoTYS8JlUgEFDWX6jo8aJaIW9gGd5xQ0ND5PEq2yh0sMfbMTVKnoo59zpU7K6oyePlqx3h681Sd8OH6dng3Yl6O5mZmRDKT1tbG838oTBmzBj4ERcXRz6+evVqmEN77NgxcrBEgiAgausHH3wA0xqB69evww+0sISCra0tzNspKSl58uSJio92//79+vp6+D1+/HjGc9C0RhZaW1tLSkoePXqU83+gbOkBNpWFc+byIgzD1ESI95iRkSHv8pqamidPnqCbooaEclNbW1uYwHb79u2pU6f+888/5FRNTU17e3ty5EN1qDgzMxOk0tDQkPfUr7/+OvyIi4traWmhn6ChoSEvLCSK8Yg+2/PyFI6OjmipkiIoqBEF4aXQyNVJHqiIFi9evGfPHnJQYpjpam9vr2C4ZsVhtFTm5ubwo7a2VsF89PX1ly5dShBEc3MzPdpKUFCQpqbmqlWreC9VzrSrDhZQrZZnDPv06YPsIRrvBRYvXgw/IiMjycdPnz796quv7tixAxYfovnPwB9//EG+lhF7e3t62HMOquTFqHKuV3y9vKtXr4YpJ/Ka1GXLlpGbVNVBtQLVWzoRERHV1dVoSq2yjUIHo44apbiKOfc6+Oqu8AtfFo8vi91hAmN6JHh3ot4OmqGkp6eH1vNQQN9HMzMzycfNzc09PT2joqIqKysjIyOh7whAZAs0S4dyr8zMzJ9++onxXtra2tDSZ2Zm0gMRK8WjR4/gh1AolLctAWXjJTItLS1Hjhz57bffUlNTm5ubGc+hdEoUR/XM5Umup6c3YMAAMPo5OTmUNjIzM3P//v2XLl1CUf7Zb6qpqXngwAEY5I+Li3Nzc7Oyspo/f76Xlxd9LxM1qfjBgwfokSHcIh00AtDY2Jifn49iJiEMDAzkbSaB9upAYxe8PAVL1VJFIwrCS6Ep8hRr1649cuRIZmZmQ0PD1q1b//vf/06bNs3Ly2vevHmw2lkd0GOZwhR0+CGVShXPat26dUFBQeDffv7556ivnJGRkZiY6O3tTX4KvkqVMwpWKkaQ8Cz7GCHhs7KyyMfnzJmjq6sLuyLt378fSunevXt5eXnbt283NzefPHlyfHx8QUHB3bt3UYfy9OnTw4cPR5stqVuVqhtVZYXh/eUdOHCgp6fnmTNn5DWpaLCaLxSpFRSUbRQ6GB5rFAcVc+51qNhdURN8WTx+ldIBAmN6JNjj7e1UVlbCj+rqagiCwkJFRQXlyLp166KioqA9Rs1zcXFxTEzMm2++iWIkUu518iXK3ktZqqur4QeaLERHnk0sKyubOXPm/fv3CYIYMmTI7NmzLSws0CqamJiYxMREzoLxkjnLZoCvvPIKeLxVVVXk4wcPHvTz85NKpZqamrNmzXJ0dDQwMIDOa0NDA5pQR+G9994zNDTcsGEDOIQFBQWBLxkwYMDKlSs3bdpkYmKiVhWjPFn0SN6C+Pnz5/Q2jL244AcqLl6eQpENOblppMMKTZGn0NHRiYuL8/f3P3r0aOtLLr/E19d36tSpmzdvnjlzJsE3jNtFchtJHjNmzKRJkxITE3Nzc69fvz59+nQWB4OvUuWMUru8UlBKeMpYvb6+/uzZs8+ePVtUVHT79m2IKgxDuLCQe9GiRTBFIjIyEjzeO3fuFBQUoAi66lYlL0ZVKWHU9PL6+vqeOXOGsUmdPHkymm/FF4rUChUbhQ6GR+PAQcWcex2qdFfUB18Wj0elsNPpJhrTlcEeb28H9QksLCwuXLjAfjL98627u/uIESMePXqUlJSUnp4OwegPHz4slUrRNhj0e+3evRtC2rCAohpwBs0p5fAFccmSJdB5Wr16dVBQEGV6aklJiSoer1ozJz8vec/62NjYTz75hCAIIyOjv/76izL2W1NTw9JFmzNnzttvvx0bG3vixImoqCjoDZeXlwcEBBw5cuTChQtoXw11qFgRPZKTyE/Nrbg6pqKqopFOLzQyRkZGwcHBu3btOnXq1MmTJxMSEmCn979e4uPjc/ToUXV0bvjC19cX3rhDhw6Bx1tfXx8WFjZs2DB3d/fOKlXeUUp4uuSLFi2CMKeRkZHwvpOHcL29vf38/CA1ICCA4g93AOo2qh328r711lvDhg0Ti8X0JpX3AV5VWknFG4VuCjcVcy5PVbor6qPbWbxuJzCmI8Eeb28HzTZpbW2Vt9CRHV9fX9iCIuglUqk0JCSkf//+CxYsoN+ruLgYfnC7l1Kgz8w1NTXyznnx4gX9YHp6+t9//w1bpx44cECp1ZjtwlfmDQ0N8pLQ85I/tKPwwv7+/hyWA2loaLi+5ODBgzdu3AgJCYGBiIqKCi8vr9zcXNjmTh0qRlWURY/kJMYJVEoVV8dUVBU10gGFphT9+/f/5CWFhYXh4eG//PJLYWEhbLdob2+PNursgixatMjPz6+ysjImJqaoqGjw4MHh4eH19fW+vr6UBYG8lCpjV6yxsZFQM6hWKyI8XfK5c+fq6Og0NTWdPn1637599+/fF4vFaAh38ODBb7zxRlJSUl5eXlpamoODw+nTp4cOHSovNgS/qNVid/DLq6GhsXbtWtgWi9ykmpqaLly4kFBbreCwllLBRqGbwk3FnHsdnC9UKx3fjvQ2gTEdSdf97o7pGNCaq7KyMhavgAUfHx+YbBMWFlZXV3f+/Pni4uKVK1fS57Gge+Xl5RHqB+1+XlVVhea6UCgqKmJZt/z6668zrqhBgVU5wFfm4E7Qef78OZofhUqAfF8Ump/DTeEb6syZM6OiohISEkDvpaWlV69eVZ+KUZ5VL2E8Jzc3F36YmpoOGTKEfkJ9fb28Lh1aQIWKq2MqKl8aUV+hccPCwsLf318sFqPxPXpQqC6Fjo7OihUrCIJoa2s7cuQIDPbq6OigGKe8lCpywxjNLKMh4hckPIo0ziI8PUSWQCCACeoFBQUpKSn0qFTk6FYpKSn5+fkdNsCrVovd8S/v8uXLofUkN6krVqxQZU67KrVCxUahm8JNxZx7HZwvVCud2I70EoExHQn2eHs7lpaWsNpWJpMlJyfLO83Dw8Pc3Pz777+nJxkbG7/zzjvgVISHhx86dEhDQ2PNmjX0M9EEUZj3yEhsbKy5ubm1tbXqgx7Dhw9H2xvGxsYynsP4yCgWhbwZLyyfD9ttEXnJXJ7kBEGgyJkWFhbDhg1T8L7ybpqVleXl5XX+/Hl60qRJk9DevyiqhzpUbGlpOWrUKPZsURTx2bNn0wN1ArBXCkuJwaadHVZRuWlEwWrGV6G1y7Zt29577z36cR0dHYgIRa4eXRYUYy8kJCQuLi49PX3RokUQkJavUjUyMmL5VsXvnFtG3n77bUpMcgoSiQTtr8u4+hp5sH/88cfp06dtbW3JMyDQDkaRkZEdPKWZL6PK1x1VvJ2pqSkUHWpSYY9W9qu4udmoVrDUwGnTpllbW6PvVso2Ct0Ubirm3OvgfKHicKghHdaOKEunN3yY7gj2eDEETKAiCALGN+jk5ORcuHChvLx87ty5jCegJbt79+69du3arFmzGKPXenl5QVzchIQEFBeXQlBQUFlZmbOzs7xwhUqBegnBwcH01KysrKSkJJbgvbCVKCW1ra2NsksTGTSPixz1/uLFiw4ODjCOpErmZJKSkijxVAHkZlACZaP7ok4tGbSLL4WKioro6Ohz584xphoYGMAPtBeFmlS8YcMG+HHs2DF6qlQqha1TyWfSOXz4MP1gYmIiRCA3MDCADzcdVlG5aUTBasZXobVLfHx8REQEoxenr68PK/87casSBRk2bNi0adMgRNCyZcvINo0C51LV19eHJd+PHz+GDeEQ5G1R1cf8+fMhHm9qamp6ejr9hMjISPh84+XlRf5Yhpg3bx6MPYaEhDx69Iji0FpaWsLSzcePH4eEhFhbW7NseMMvfBnVjnl5FYHSpE6fPp1RIwqaAkVqxZ07d1CcWzLZ2dk3btx4+vTp1KlTuTUKQGRk5Mcff/znn38S3QTOKubW61DlQnYYa8jcuXMdHBxu377d7uUd044oSNdp+DDdks7eEBjTcQiFQoh9Tzne1tY2Y8YMqA9nzpyhpNbX18N8mxUrVrBkTl7oEhMTI++02NhYiGHzxhtvNDQ0UFLBEunq6j58+FBx+Vmor69Hmy4EBQWRk6qqqhwdHdGOcOQt3SUSCdyLIIhdu3ZR8ty1axd60ps3b1JS29raIEjga6+9hg5++eWXBEGsWrVKxcxlMplIJIJUc3NzR0fHqqoqcuqBAwcg1dra+sWLF+QktMuOhYVFcXExOam4uBh9XXZ1dSUnQbver1+/Bw8eUCRpaGiAwKFGRkZ1dXW8qFgeUqkUHBLG2oUiiGzevJl+LZS2np6egYFBaGgoOam8vNzOzo6xenB+irS0NMjQx8eH/aG4aUTBaqZioXl6ekJqfn4++1O4urrKMw5hYWGQye7du9kzUfDW7FJB5CR5L067QMx5YOzYsfJOU6VU0da+H3zwQUtLCxxsbm7++OOP0cxJe3t7VdTBzt9//41qtUQiIScVFxeDi2JiYvL06VN5OZADud29e5eSum/fPpS6ceNGFknYXxO0LoOx8tNR0ahyqFeqvLzIhpMbHTrksMz0dlkpU8Be4KhWTJkypbm5mZzU3NwMXzHIWXFoFGJiYtCzxMXFyZQH7SiTnJzcATVKFRVz63WociF7HUZv5dmzZ+FIbW0tfLoqLCxsNwf1tSMcLLa6Gz5MzwZ7vD2f0NBQn5fAAhtdXV3498SJE+icqqqqKVOmQDTmTz75JDk5uaSkJD09/fDhw9DSuLi41NfXs9wlJCQE7IilpWVrayvLmSdPngRrO3LkyLCwsLy8vMLCwps3b37wwQcaGhpaWlqRkZHKys9CWlqasbExyDZ37tyQkJCIiIjt27cPHDhw7NixKDqFs7MzZFtTUyOTyaKjo9F0l9mzZ584cSIpKencuXPe3t4CgWDy5MmQNHPmTB8fn4CAAPIdYaNCiNlTWFh4/vx5EOCff/6BEzhkXlNTA+I5OztD6v79+8eMGTNw4MBt27ZFRESEhISgzqiRkdG9e/co5dDU1PTGG2+gE/bs2XP16tWEhIR9+/YJhcLZs2dDklAohBuBL4e+ZAuFwp9//jkrK6u8vDwnJycyMhJW+vXt2xe1o5xVrAiVlZVQMn379t2yZUt6enppaWlycjJabLlixQrkRTB+KAE31cPDIzg4OCIiYtu2baiXvHLlyra2NhWf4ocffvDx8fHw8IA8bW1toSQ3bNjA+ETcNKJ4NeNQaLm5uXAvS0tLOMHb2xuOxMfHs3i8MIX12rVrhYWFxcXFt2/f9vf3h2WHLi4uFOeKkfj4eMZbf/PNN/KkQhYAUkeOHMnyVrZLS0sL2nr30KFD6qiKjx49QksxLSwsvL29FyxYIBQKDQ0N0fCasbExPM7Fixc5qKNdwsLCYJbmuHHjoqOjCwsLnzx5cuzYMRh/NjMzu3XrFsvloaGhIImNjQ09NT8/H1IJgrh9+zZjDvJeE/iudO7cOR8fnyVLlrBXfjocjKoq9YrDy0u34ajRoX9TIw/7Dxw4kLE6KWgKNmzYwFjgGRkZ9Foxfvz46Ojop0+fPnr0KDIyEgJxjx8/vra2Fp3MoVEgb1K1b98+mcJ88803IK2+vj5c/vbbb8ORiooKtdYoVewzt14HhwuvXLkiz2wiYXJycuDVcHFxyc7OFovFsOvV1KlT2Q0v7+0ILxZbHQ0fppeAPd6ej7z1P35+fuTTmpqa9u3bR49cZ2pq+tVXX7XbZ62vr4ddzuif2OmkpaXNnDmTvoLCzc0tJSWFm/wsPHr0CM3IAvr06bN48eLq6mr0uR1RWloKV127dm3EiBGU1MmTJ6enp6Nvk4xfeUtKSsaNG0c+QUtLi9LMK5t5aWkp5WSRSFRVVbVw4UJKMbq5ueXk5DCWQ11d3Zo1ayirkvT19Xfv3k3fVBY+uzY0NPz6669ubm6M4U+nTJkir3+slIoVRCKRfPfdd/TVlba2tuHh4fKuIk8NiIqKQl4NYGBg8OOPP0qlUtWfQt7Gs1ZWVvJk46ARpaqZsoXGsk7s+PHjjI9w//79devWMW7RZGJisn379sbGRpkCyItu5eTkJE8qZAEYUxUfzEFs374dyp/cv+exKspkshs3bqBeIDB27Nj09HT6UwQEBHBQhyLcu3cPbTuM0NLSWrZsGcvoLlBVVQWmYNOmTYwnjB8/HnbElZeDvNekurpaJpPt3LmTMVWRUSBljaqK9UrZl5duwynPTqG2thbcvB07drA/OLspQKOjFC5fvtxurdDV1V2/fj3lYzeHRiE5ORlOZhwZZoFliyM0bKi+GqWKfebW61D2QjQQTcHJyYkszM8//0yJJGpvb//vv/+yG17e2xFeLLY6Gj5ML0GD9xiGmG5NW1tbSkqKWCyuqqoSCAR2dnbjxo1T05Zlz549S05OBlsvFArHjx+v+h68LDx+/Pju3bvV1dXm5uYTJ05UZG0h+DwZGRn19fUmJiYTJkywtbVV5F4ymezOnTtZWVmNjY0DBgyYMmXKgAED+MqcQlFR0Z07d0pLS42MjF5//fV2t1OvrKxMTEwsKirS0tIaMmSIi4uLIvvav3jxIiMjQywW19bWamlpmZubjxs3rl19qUPFbW1td+7cyc3NrampMTU1Hf0SlvPNzc3LysqEQiH0OKVSaWJiYn5+vkQisbKycnV1bTcCqrorKjeNKFjNuBUaB/Ly8mC0RyKRGBgY2NnZOTo6dq/dDmNiYjw9PT/66CPGdXR8lWpLS0tSUhKExn311VcnTZpEdAbl5eVQq7W0tAYNGjR58mSYLtit4cuodsDLqwiOjo7p6ekFBQVoDq3qpkDBWqGhoWFlZeXs7IzW5arYKGRnZyclJbm5ualbI11KxRx6HSpeKI+Kioq4uLjS0lJtbe1Ro0Y5OztzCNrUAe1It2v4MN0I7PFiMJieDMXjxWDksXDhwqioqHv37nXMLrIYDAtZWVljxoyZN29edHR0Z8uCwWAw3R4cqxmDwWAwvZ3y8vLo6GgnJyfs7mK6AhAaQ17McAwGg8EoBfZ4MRgMBtPrWL58OXn07ODBg62trb6+vp0qFKaXEh0dDfHz4N+amprjx4/b2NigbRQwGAwGowrY48VgMD2QysrKgpfA/pxSqRT+raqq6mzRMF2C0NDQ7777DqrH48eP9+/fP3jwYBTTFYPpSNLS0o4dO3bt2jX498svv6ytrd24cSOHxZYYDAaDocMQag+DwWC6O1u2bCHHH6qoqICtDv38/AIDAztVNExXITEx0c7OztraOikpqbGxMSwsjBLRFIPpSObNm+fi4lJaWpqdne3s7PzRRx91tkQYDAbTQ8AeLwaD6YF4eHhQNiIC0GaYmF7OunXrbt++XVxc/Pjx4ylTpmzatMnd3b2zhcL0UlxcXDw8PB48eJCRkWFubv7ll19+8cUXjNv/YDAYDIYDOFYzBoPBYDAYDAaDwWB6JngdLwaDwWAwGAwGg8FgeibY48VgMBgMBoPBYDAYTM8Ee7wYDAaDwWAwGAwGg+mZYI8Xg8FgMBgMBoPBYDA9E+zxYjAYDAaDwWAwGAymZ4Jj32P+l3fffbe0tBT9O3v2bH9//06VqCdz8ODByMhI9K+JicmZM2eILkMXFw+jOljFGIy6uXLlyt69e8lHTp06JRQKiW7O/v37o6Oj0b/YeqgDbKIxGH7BHi/mfyl8SXNzc0lJCUEQ1tbWnS1RT6aysjI/P58giKdPn7a1tXW1PlAXFw/47bff/Pz8Xn311YsXL5qYmHS2ON2MbqFiDKZbU19fD29ZeXl5Y2MjQRASiYTo/lRUVLBbj5qaGg8Pj/v37+/bt+/DDz/sJDG7N9hEYzD8gvfj7S00NTUlJycTBGFmZjZ69Gh5p92/f9/BwYEgCB8fn+PHjxM97gG7Gubm5mVlZUKhkDzA3nXoyuKBbARBBAYG+vn5dbY43RXeVZyTkwNZjR8/Xl9fn+iqdBc5e5jF6514eXnBoGh+fr6VlRXR061HcHDw2rVrCYIwNDSsrq5W5Ra4nnflVhiD6UbgMd7eQmlpqZubG0EQnp6e586dI3ocPf4BMRRGjx4NHu/IkSM7WxbM/2Pv3r2hoaEEQaSlpdnb2xNdle4ipzywxcN0WUaNGgU/VDfOuJ5jMBhewB4vBoPplpw7d+7EiRPDhw93d3fvbFkwGAwG87+8+eabcXFxGRkZ7777bmfLgsFgMP8D9ngxGEy3RCAQrFmzprOlwGAwGAwVl5d0thQYDAbzv+DdiTAYDAaDwWAwGAwG0zPBY7w9nydPnpSXl0MEZggAeOvWLZSqoaExceJElsuTkpIuXLjw9OlTgUDg5OS0aNGifv36yTu5rq7uypUrycnJ5eXl/fr1s7S0dHd3f+ONNzQ0NLgJX1tbe/78+bt371ZUVPTp02fgwIEODg7u7u79+/fn/ID19fU3b968d+9eQUGBRCIxMDAYOXLkjBkz7Ozs6AJUVFTk5uaSjzg6Ompra9fW1oaHh2dkZDQ0NNjY2Hh5ebEvBUxNTY2Ojv733391dXWHDh26aNGidqNhKyUnLEdsampC//bv33/o0KEEQWRnZ585cyY/P18qlZqbm0+YMGHBggWqi0cHFIH+1dLSGjduHBw/ffp0Xl6eRCIZMmSIp6cnHG+3kCUSyenTp+/du1deXi4QCOzs7Dw9Pa2treU9KUtW1dXVoaGhmZmZ/fr1GzNmzPvvv08OVpSbm3vy5EmxWKyrqztx4sR33nlHT0+P8Rmzs7Pj4uKys7MrKyu1tLSEQqGzs/OsWbN0dHToJyv+XG+//XZlZSU9B1tbWzMzM/j99OnT4uJicqq5ubniUXDUXQNbWlpSU1MJgnj27BkcSU9PJ0emtbS0HDRoEOfCVJCUlJQbN26IxeKGhgYDAwM7OztnZ+eJEyf26dNHKTmVrZNisfj58+foZGNj4xEjRqB/S0tLCwoK0L96enpjx45llP/hw4eXLl0Si8U1NTX6+vpWVlYODg5ubm7kCqmIxZNIJPfv3yfnPHbsWHImKSkpUqkU/TtixAhjY2MOLyNF/vT09MuXL+fl5TU0NJiamjo6Os6aNWvAgAGEakZeQRTJii9NNTQ0XL9+PSEhAaIJmJqajhw58s0335RnnylyKtV8yIPzG9Tua8IZefWnA1p2HisSX42vUt0nXlphFmFu3rx56dKl8vLyIUOGzJkzh1x6Uqk0MjIyOTm5qqpqyJAh8+fPp7TR3EqGc5egY+oqptchw/R02Gd+6ujokE9OS0uD4z4+PhKJxNvbm3K+hYVFRkYG440OHDhgZGREEISmpqaVlZWpqSlcYm9vn5yczEHyX375BdySPn36DBo0CHWbNDQ0XF1d//77b2UfsLy83NvbW0tLC5JMTEysra1RYzxv3ryysjKKDPSA1fn5+devXzc0NKQc9/PzY3yKyspKuodJEIS/v79UKoUtB4RCIfkSDnLKZDKK8+Pj49Pc3Lxy5UrKfQ0NDVUUTx4URQiFwtbW1o0bN9IzX7BgQVVVFXshJyYm0vdjCAwMZHzSdvVlYGBAPmhqahobGwuXfP3115qamuRUCwuL7OxsytOFhoba2trCCX379rWyskIV0szMLCwsjF4gij/XN998Qy8lgiCOHz+OcqPvjy2vynVKDWw3jmhAQIAqhdkuBQUFU6ZMgUwEAoGVlRUSuH///n5+fs3NzYrLqWydfOedd8gHPT09ybIFBgaSU+3t7enyP3nyZO7cuXDCK6+8YmVl1bfv/36S1tHReffdd5HhVcTiPXz4kHI8LS2NfDuKBTt37hwcV/bBEbm5uTNmzIAkY2NjKysrqD/a2tqbNm2Cwuds5BVBwaxU15RMJhOJRPApSkNDY/Dgwaixg28HP/74Y1tbG/l8T09Pbs2HPDi/QQq+JgpCtx6M9UfdLTuPFYmvxlep7hOPrbA8Yej5L1mypLW1VSaT5eXlkT/6AJ999pnqJcO5S6COuorBYI+35xMbGysSiXbv3g2W4rXXXhOROHz4sDyPd8mSJUZGRp9++umBAwd27NiBbOLw4cPphgbtuffZZ59VVlbCwZSUFEdHR4IgdHV1r1y5opTYhw4dgubqhx9+qK+vh4PPnj377LPPKF0ExR8QPZ23t3deXh4cbGpqioiIgM/AdnZ2NTU1ZDFycnIgn9deew2ujYmJ0dbWnjFjRmBgoEgkWrVqFeqYhoaGUp6ivr5+/PjxkDp16tRLly7l5+dnZGQEBAQIBIKtW7cyNmYc5JTJZKdPnz5+/PjXX3+NNOjj46Otrb1s2bIff/zxq6++GjJkCMXj5SaePEARIpFIIBDAVV9++aVAINi7d29GRkZ+fv6lS5dcXV3hduPHj0dqFYvFx18CtYUgiD///FNXV3f06NHbtm3bv3//kiVLyJ3s8PBwkUi0ZcsW9KRIBnpW58+f19HRmTVr1r59+77//nsU5kogEBQVFQUGBmpqai5dujQwMHDXrl1jxoyB1JEjR7a0tND7rMbGxuHh4SgpNzcXyRYcHEwpEMWf67vvvhOJRLt27UKyBQUFiUSinJwclFtycrJIJNq8eTNBEE5OTiKRKCEhoV2ldFgNbGhoAO07OzvDtVu2bCG/iffu3VOlMNmpq6uzsbEhCGLChAmpqalwUCqVXrlyZfjw4ZBndXW14nIqWyevXbtGtkIUPyo9PR0yl+dHpaWlQR998ODBFy5ckEqlMpmstbX1+vXrqE76+/srbvGqqqooj0nxeI8ePSoSiebMmUPxeJV9cCQ/eIA2NjbIu6irqwsICIAJPjNmzKC8UEoZ+XZRPCsVNUXux3/00UclJSXoXv7+/mjcSSKRMHq80HxMmTIlICAgMDBw6dKl6HMbvflggdsbpPhroiB060FvMSkerzpadh4rErfGl94kLVmyxMzMbNOmTSEhIXv37kX7KtG7T/y2wow9gffee2/AgAEbN248cODA559/DrM5CILYsGFDTU3NkCFDRowYsWPHjp9++mnlypXIpz1x4oSKJcO5S6COuorBYI+3twBbmdMbeArIqFlbW9va2hYXF6OkxsZGstdHvurnn3+G4x9//DElw6qqqoEDB8KH5/LycgWlbWlpga/my5Yto6fCRn+UNkyRB4SnmzRpEnzaJJOamgqdlc2bNzNei7osNjY2Bw4cICedOnUKkhwdHSlXffrpp0gqylf/lJSUfv36gbfM6G9wkxNp0MbGRigUZmVloaSioiI9PT2yx8tNvHaBFrpv3779+vVLSUkhJ0mlUjSQtX79enmFPHTo0PXr10O/H/jPf/5D72SjFp1dX4cOHSInrVixApJWrVplbGxM/vzf1NSEOh8XL16kZ3jp0iX6vby8vGAC5LNnzxgLRPHnQm5GYmIiY1bwgZzyArLQ8TXQx8eH0cXiqzAZ2b9/P9wUdcUQYrEYBn8o3SNF5FS2TrZrhRj9qJqaGujb9evX7+HDh/JMKPJ4FbyXIo+5c+dOisfL4cGR/Pr6+k+ePKHk8+2330I+O3fuVNHId2R7wagpcmO3YsUK+lXoYeV5vDY2Nt999x056cSJE/KaDxa4vUEcXhN2WJwx8rC2WjXFY0Xiq/G1tra2s7Mjd3gkEomDgwNj90lNrTC5JzBy5MiKigqUlJOTA/Pe9fX1V61aNWfOnKamJpR65swZuHD8+PF8lQyHLgHvdRWDwR5vb0FZj5cgiMuXL1NSQ0JCIGnDhg3oYE1NDXzA09XVRaO7ZJDl2rp1q4LSZmdnwyVff/01PTUlJYWbx5udnW1lZXXy5EnG1Lfeegs8c0qrQ2m/J0+eTE8dPHgwpNbW1qKDhYWF8P2+b9++T58+pV+1fv16uIrSmKkiJ1mDp06doqSuXLnSxcVFRfHaBU2AZOxn5Ofnw301NTWLiooYC3n06NGUZvXOnTv29vbh4eHKerxvvvkmJYk84fPTTz+lpIaHh9MrOcxicHJyYnze+Ph4uOSXX35hPEHx50Kv2NKlS+n5SCQSU1NTCwsLep+DkU6pgYp4kqoUJiOLFi2CxyQ7ZggYyVTR41WkTnLzo3bs2MHyviA/qrM83nYfHMnP2N9tbm6G4V89PT2yCjgY+Y5sLxg1hRo7bW1txtmtEokEZizL83idnZ3pV6H17eTmgx1ubxCH14Rfj1cdmuKxIvHY+F6/fp2SevjwYXrLor5WmCzMX3/9RUlFc/u1tbXRPAXEsGHD6BVSlZLh0CXgva5iMHjlN4aZ/v37o0VZiNdffx1+kENThIWF1dXVEQQxbdo0NFuGjIeHB/w4evSogndHE71ggh8l1cHBIS0tDaZ3KsXIkSPz8/Mp67gQMG27oqLiyZMnLJm8//779IMo7gL52rCwMBD+zTfftLCwUDArvuQ0NjamL9359ddf4+LiVBRPcd577z36QSsrK9i1QiqVhoWFMV64atUqytra8ePHp6WlMWaorAwjRoxA4UPoqUiVYrGYfDwkJCQ5OZnxFmjCv7wTFH+u9957D7rUf/zxBzm+DhAZGfn8+fM1a9ZQMpFH59ZAFngpTDJQIK2trZcuXaKnBgcHp6WlQcFyhsc6SUYmkwUFBcFveQU+a9YsQ0NDlpg3aoX9wduVX0tLa+bMmRDq6Y8//lCHkVdTe0EHNXaurq6M4bh0dHRmz55NX6aLWLZsmYLNhzreoA54TTpeU/zmyYvpGzBgAH2XeHndJ3W3wkKh0M3NTV6Vc3NzMzc3l5eal5fHb8ko3iXo9LqK6XlgjxfDjIODAz3AMkyugy9/6OD169fhB1owRsHW1ham0JSUlCjYotva2sI8pdu3b0+dOvWff/4hp2pqatrb21PivipLa2trSUnJo0ePcv6P+vp6SCJHF6SD5iaRQW0GuWSQbykvGra9vX27Uaw5y+no6IgWGDPCi3gsaGhoyAtAiu6IhiMoTJgwgeAJur40NDTQpxm6hCgIDXRtGampqXny5AnSCBqFYNeIIs+lr6+/dOlSgiCam5vpMWCCgoI0NTVXrVpFKEbn1kAF4VyYZJDxWbx48Z49eygfCwYPHmxvb69ibE8e6ySZzMxMiBqtoaGB5rRTeO2116qrq//73/8SnQH7gyP5tbW1GW0jQRBoKTKqkPwa+Q5oLyiNHfJe6ERERFRXV8uLlsyoYsaGVR1vUAe8Jh2vKfVpn7PpY7Sr6usksMOYg4mJCfxgfGfbbQS5lYxSXYJOr6uYngfenQjDDNoThYyuri78IH9JRXOKMjMzf/rpJ8bctLW1IVx+ZmYmrPhiR1NT88CBA/B1My4uzs3NzcrKav78+V5eXi4uLgoOcDHS0tJy5MiR3377LTU1tbm5mfEccmR/VUrm0aNH8EPeI+vo6AgEAsZejupysu8IoqJ4imBgYCCv24c2E8rJyeEmvOKQw6giIDhHv5dQklA0SPpwQWZm5v79+y9duoQ2zFBKIwo+17p162DQLCgo6PPPP0edlYyMjMTERG9vb9Q/bpfOrYHsqF6YZNauXXvkyJHMzMyGhoatW7f+97//nTZtmpeX17x58xQvLnZ4rJNkHjx4gPJHZqRLwf7gyP7r6emhNa4UYDsoULo6jLz62gt5yuK2bYxSzYc63qAOeE06XlO859ldOgmqt4DyRJXXCKpYMkp1CTq9rmJ6HtjjxTBD30AP4v7TD6J9RE++hD3biooKBQV47733DA0NN2zYABawoKAg8CUDBgxYuXLlpk2b0EdKxSkrK5s5cyZsUzlkyJDZs2dbWFgg0x8TE5OYmMhjyVRXV8OPV155RV5uurq69MaMFznb3ZKRs3gKwiIAumNVVZWy1yoLo77aTaJz8OBBPz8/qVSqqak5a9YsR0dHAwMDcEcbGhpQYEx2FHmuMWPGTJo0KTExMTc39/r169OnT4fjEI/U19dXcZk7twaquzDJ6OjoxMXF+fv7Hz16tPUll1/i6+s7derUzZs3w8RaVeCxTjLaTxYddS7sD47kr66uhohWitt/Ho28OtoLdShL8eZDHW9QB7wmnaIpHvPsLp0ExWFv5hRvBFUvGaW6BF2hrmJ6GNjjxagKMnm7d+9Ge13IA0V4UoQ5c+a8/fbbsbGxJ06ciIqKgmkt5eXlAQEBR44cuXDhgpOTk1KiLlmyBOz16tWrg4KCKJN+S0pKVOzHU0D5K/XlvsPk5Cye6qA7osrTxYmNjf3kk08IgjAyMvrrr78oUxNramo4OGks+Pr6gooPHToEHm99fX1YWNiwYcPoy8O6XQ1UU2EaGRkFBwfv2rXr1KlTJ0+eTEhIgFWmf73Ex8fn6NGjXXAWXCe+hgRBtLW1qZgDeoUtLCwuXLjAfjJ9wI1HI897e9HVlMXLG9QVXhN1aIqvPLtLJ6HjUWvJMHYJukJdxfQkcF3BqAqaFWNmZmbfHoxTaFiA7eODg4NLS0svX76MQjFVVFR4eXk1NDQonlV6evrff/8NG9IeOHCAfY0rL6DvyjU1NfLOefHiRWfJyU08xWHRDrojLwMvHQCKN+7v7y9vsSWPLFq0CEomJiamqKiIIIjw8PD6+npfX1+l1nR1zRqo1sLs37//J598Eh8f//Tp04CAABQMJjQ0VN6aC3XA2H9tbGykH0QmUZVhHH5FUgokf2tra7v2Hy3oVZOR55CVUsXSYcpS9xvU6a8Jj0rnMc/u0knoeHgpGW5dgk6vq5geA/Z4MaqCYniQw/rxTt++fWfOnBkVFZWQkADrYUpLS69evap4Dmgt2euvv84Y9RTtSMEXaPvix48fM55QW1tLb8w6TE5u4ilOfX29vH4hWryEZOjiIKVASEl11xwdHR3YNLitre3IkSMw2Kujo4N2munWNbBjCtPCwsLf318sFsMuFwRB0COB8Q7qCDL27eDjhTz7WVlZydLr7UiRlALJX1ZWxs1R4dHIK54Vt2JBD0sJ5N7B8PgGdcproialq55nd+kkdDy8lIyKXYJOr6uY7g72eHsdvJtsNJMZ5pwwEhsba25ubm1treCQQlZWlpeX1/nz5+lJkyZNWr16NfxmjNgh7wFRQAV5M2l5727CDnUEQVCiRyJu3brViXJyE08p5OWA7ohk6OKwK0UdjsratWvhR0hISFxcXHp6+qJFixhjkHTZGsjtTeRWmNu2bWPc90JHRwftnSMvwA+PJtHIyAh+FBYW0lMZZ/1ZWlqOGjWK5QSCIC5evGhtbe3o6MgoKrv87CIlJSURqmFpaTl69GgQg2VDKQ8PD3Nz8++//54XI0+BQ1YcNEUQxNtvv81+AuzSZ21trda+OOc3SJXXhBfU0bLzWJG6Syeh4+GrZBTvEnR6XcX0PLDH21vQ09ODHy0tLejgxYsXHRwcYDSJM15eXhBnLyEhQV7o3aCgoLKyMmdnZwW3lKyoqIiOjj537hxjqoGBAfwgbznQ7gOiYIBpaWn0mWxtbW3knTN44Z133gFR09PTb9++TT8hJCSEfrDD5OQmnlIcPnyYfjAxMRFCthoYGMjb3K+rgZSSkpJCT7158ybvdxw2bNi0adMIgiguLoY9PNetW9ctaiDjmzh37lwHBweQQR2FGR8fHxERwei96Ovrw/JRyg4l7crJAX19fQhV8PjxY9izByGTyQ4ePMh41YYNG+BHaGgo4wnHjx8vKCgYN24ceU67giZ95MiR8nYCu3TpEucdlcls3LgRfsB8BDo5OTkXLlwoLy+fO3euKkZeHhyy4qap+fPnQ5TmO3fuoLjNZLKzs2/cuPH06dOpU6cSaoPzG8ThNeEXdbTsPFak7tJJ6Hj4KhnFuwQc6uqLFy++fYlIJFL4yTC9COzx9hbMzMwgGh55vlZCQsL9+/dV3LxBU1Pz+PHjffr0kclkK1asoI/ihoWFnTx5UldX96uvvlIq54iIiIcPH1IONjY2xsTEwEd68ghhuw84ZcoUoVAIs+8CAgIo2e7du5f3WdmvvPIKutHy5cspG8r99ttvV69eRc05osPk5Cae4ujp6V25cuW3334jH3z27NnKlSvh97fffquvr090B9599134ERAQQPmuXFJSsm3bNnXcFIVlLigoGDt27BtvvNEtaqCtrS38QG9iXV3dtWvX7t+/Dz6G+gpzx44d9INRUVHQRVu8eLFScnJj1qxZ4DVt3LixtbUVDra0tHz66afywqIuX74cvm788ccfly5doqSeP3/+9OnTurq6X375JQeTPmPGDPhx/PhxNDUReq4rVqxgnBarLD4+PnCXiIiIs2fPUlJfvHgBJb98+XLkfnMz8uwomxUHTWlqah47dgyC5axdu5bsg8G1YNxWrFhhZWVFqA0V3yClXhN1wG/LziFPeXSXTkLHw0vJcOgSKFVXy8vLv3hJeHi4Mg+H6TXIML0G2LAORhIKCwvPnz9vbGwM80lkMtkPP/zg4+Pj4eEB59ja2vq8pKGhQSaTnTt3zsfHZ8mSJZAqFAoh9eHDh5D5yZMnoZcwcuTIsLCwvLy8wsLCmzdvfvDBBxoaGlpaWpGRkYqLir5SC4XCn3/+OSsrq7y8PCcnJzIycsKECbBQ5+zZs0o9oEwmi46ORoMks2fPPnHiRFJS0rlz57y9vQUCweTJkyFp5syZPj4+AQEBMpksNzcXntTS0hJSvb29fXx8Tpw4AXlCKurJka+VyWRtbW3Impubm2/fvj0iIiI4OHjevHkQjghaEV1dXcgnNDSUm5wsGtywYYO8cuYmXrvAVUKh8Pfff4cJjcHBwREREdu2bYMkgiBWrlzZ1tYG58srZB8fn/j4eHr+GzZsYHzSjIwMdn2lpqZCKjSrWlpa5LvIq+QZGRlNTU3I4TQyMtqzZ8/Vq1cTEhL27dsnFApnz57N+F4o+1wUWlpa0MaDhw4dknGiI2sgkJOTA9e6uLhkZ2eLxeKlS5cSBDF16lQ4gVthsuPq6gpXLVq06Nq1a4WFhcXFxbdv3/b394ctMVxcXCQSieJyctbdo0eP0CYcFhYW3t7eCxYsEAqFhoaGaFTQ2NgYsrp48SJcVVlZCaWqpaW1devW9PT0kpKSpKSkzz//XEtLq0+fPmFhYfR7tWvxADTkq6mp6erqumTJksmTJ2toaKxZs2bnzp2QNHXqVB8fn9WrV3N78KqqqilTpsAtPvnkk+Tk5JKSkvT09MOHD4Pv5+LiUl9fr7qRZ4RbVtw0JZPJwsLCYG7n+PHjo6Ojnz59+ujRo8jIyLFjx8LB2tpaOFPF5kMenN8gDq8JI6GhoZAzrJJF1uPEiRPx8fGMj/zNN9+oqWXnsSLx3vgq0n3ivRVmF2b79u0+Pj7oQSZMmEDuJDBWSNCdKo2Csl0CbnUVrdFYsWKFgurG9Cqwx9uLKCkpGTduHEFCS0tr3759kCpvc7Pq6mqZTIY6RhRu3ryJ8k9LS5s5cyY9lqybm1tKSopSojY0NPz6669ubm6MIQGnTJly69YtZR8QuHbt2ogRIygZTp48OT093c/Pj3zQ1dWVZWWan58fZMiYCtcCUqk0MDAQza0CBg0aBG0wMvfAmjVruMnJokErKyuWouYmHjuoeZPJZFFRUZT94g0MDH788UepVIrOZ1n+d/z4cXr+8sZPLl++zK4veTPf4C7yKvnly5dlMlldXd2aNWsoq5j09fV3795N32Ua3gtln4vO9u3b4S6oD82BDquBiJ9//pkySmZvb//vv/+iEzgUJjv3799ft24d49isiYnJ9u3bGxsb6VexyKmK7m7cuIG6+8DYsWPT09Pp5oLcL5RIJN999x19qfbYsWP/+usvxhspYvEg5xUrVpAts46OzhdffNHW1kap8zo6OpwfvKmpad++ffRo/Kampl999RXdj+Jm5BnhnBU3Tclksnv37qGNshG6urrr168nO/aqNx/y4PYGcXtN6KxZs0bec8lbwOzk5KSmlp3HisR746tg94nfVphdGHt7e5ZOAovuVGkUlO0ScKurKHTzmTNnlNI4ppegwXscI0xXRiaT3blzJysrq7GxccCAAVOmTBkwYAC/t3j27FlycnJpaSmYufHjx6syRfDFixcZGRlisbi2tlZLS8vc3HzcuHEsGSrygOCcZ2Rk1NfXm5iYTJgwAc1vVB9NTU3//PNPQUGBrq6ujY3NpEmT2t1HriPl5CAeC+bm5mVlZUKhsLS0FPb/SExMzM/Pl0gkVlZWrq6uLDvRd3EqKysTExOLioq0tLSGDBni4uICoxxqIiYmxtPT86OPPgoODu5eNbCioiIuLq60tFRbW3vUqFHOzs70b2HqKMy8vDwY5JFIJAYGBnZ2do6OjizbPisiJwdaWlqSkpIgou+rr746adIkBS9sa2u7c+dObm5udXW1kZGRg4MDimulokkvLCxMTEx8/vz5wIED33jjDUo3mi/a2tpSUlLEYnFVVZVAILCzsxs3bhz7ttvKGnl+s+KsKZhFCY2dhoaGlZWVs7MzxWlRN5zfIGVfE95RR8vOY0XqLp2EjodbyajSJVC8rjo5Od2+fdvCwiI/P1/FxXqYHgn2eDEYDM9QmjcMZxYuXBgVFXXv3j0HB4fOlgWDwWAwmK7YJTh69OiqVasIgjhx4gSaQI7BkOlyH5AwGAwGAyNI0dHRTk5O2N3FYDAYDIaRqKgoCPT4xRdfYHcXIw/s8WIwGEyXYPny5dHR0ejfgwcPtra2oojNGAwGg8FgKDx79kxDQ+PAgQN79+7tbFkwXRc8qxmDwfBDZWVlXV0dRCutqKgwMzOD7SINDAwgtCaGHQ0NjUmTJsXGxmpqaj5+/Pj11183MDDIy8uTt1cKBoPBYDBdk47sEjx//pwe9g+DIYM9XgwGww9r165lDLDk5+cXGBjYGRJ1MyBmkq2trbW1dVJSUmNj47lz52CPCgwGg8FguhG4S4DpUjAEc8dgMBgOeHh4UHYdAJydnTtDnO7HunXrbt++XVxc/Pjx4ylTpmzatMnd3b2zhcJgMBgMRmlwlwDTpcBjvBgMBoPBYDAYDAaD6ZngyFUYDAaDwWAwGAwGg+mZYI8Xg8FgMBgMBoPBYDA9E+zxYjAYDAaDwWAwGAymZ4I9XgwGg8FgMBgMBoPB9Eywx4vBYDAYDAaDwWAwmJ4J9ngxGAwGg8FgMBgMBtMzwfvx9iIWLFhQWVlJEMTNmzf5zdPExOTMmTPk4y9evJgzZw5BEA4ODj1pq/H9+/dHR0ejf+kP3rlcuXJl79695COnTp0SCoVE76aqqmr+/PnkIxs2bPDw8OgZSsdgMBgMBoPBsIA93l5EYmJiWVmZOvKk+1Stra3//PMP0eOoqKjIz88nCOLp06dtbW1dzZmsr68H8crLyxsbGwmCkEgknS1U5yOVSqFY6urq4KPPkiVLeozSMRgMBoPBYDAs4FnNGIwS7N69O/8l/fv3J7oe3t7eIN6MGTOI7klOTs4/L3nx4gVfeZqZmUGx7Nmzp+cpHYPBYDAYDAbDAvZ4MRhMF2Lv3r1uLxGLxZ0tCwaDwWAwGAym24NnNWO6Db/99ltiYqKlpeXWrVs7WxYMBoPBYDAYDAbTDcBjvJhuw19//RUcHBwZGdnZgmAwGAwGg8FgMJjuAR7jxfwv1dXVTU1NBEFoa2sbGxvTT3j48GFcXFxFRUX//v3d3NyGDRumVP4ZGRmJiYlVVVXm5uZvvfWWpaUlf7JjMBgMBoPBYDAYDAPY48X8D1euXPHy8pJIJIaGhpcvX3Z2dian/vvvvx9++OHVq1fJB5cuXRocHKxI5s+ePVu2bNmVK1fIB99///1ffvnFyMiI6Gyys7Pj4uKys7MrKyu1tLSEQqGzs/OsWbN0dHQ455mSknLjxg2xWNzQ0GBgYGBnZ+fs7Dxx4sQ+feTOqmhoaLh+/XpCQkJZWZmWltagQYPc3d1dXFw0NTUJlamtrQ0PD8/IyGhoaLCxsfHy8rK3t2c8s76+/ubNm/fu3SsoKJBIJAYGBiNHjpwxY4adnV27tzh//vzdu3crKir69OkzcOBABwcHd3d3BaM9tbS0pKamQm2BI+np6eRA05aWloMGDeJXcS0tLRcvXkxMTCwtLTU0NJwwYcL8+fMFAgGhAunp6ZcvX87Ly2toaDA1NXV0/P/YO++4KI63ge8Bd/ReRaqoxApYsQQQjYotGOzRYIlRYxJirK8liYmFn9FIrKDGqKGoqFGxd0UQFekYUaqCVIEDpF55PzBkstm9O+727kDh+X7449jZmZ2d/uw88zwuY8eONTMzU2xrAQAAAAAAAKRFCHQYsFcVyvWzZ8+y2WyCIIyNjePi4iihr169Iu/HGhsb6+vro98+Pj5oKW9ubk6JVV5eju4ZMmRIv3790G8TExM9PT2c1MCBAysrK6XPv6+vL0EQTk5OQgVx9OhRBwcHlBk1NTVbW1ssmZiYmAQHB7dYmPQXz8nJcXNzQ4no6ura2tpyOBz0r6mpqZ+fX319PT21oKAgExOTxmMGKipWVla4phwdHa9du8bg1T7++GOUQnZ29o0bN3CVYfz8/ChRioqKfHx8UEtAXmft7Oxw5idNmlRYWCjucXv27NHW1kb5t7S0xMXIYrHc3d1v377dYoYLCgokj1T+/v7yV1xgYCC6LTAwMDEx0d7envIUExOT06dPy1rpiIyMDGwi29DQ0NbWFhUmh8NZuXKlyHpn1loAAAAAAAAA6QGJt6NLvMePH0e7iObm5ikpKfRYeBE/dOjQ1NRUdPHBgwc9evTAcoIEiRcxcuTI58+fo6DIyEisEU2Xu1pT4kVioaGhYUhISENDA7qYkZGBnbUGBQXJJPxUVlYiIWrgwIH42wGfz7969Wq3bt1QmuXl5ZSkvvzySxS0ePHigoICdPHZs2ejRo1CMuShQ4eYvRpBEOfPn+dwOG5ubv7+/gEBAbNnz8abxkePHiVHSUhIQNd9fHwyMzPRxbq6urCwMLRP6+joyOVy6c/at28fEm537NhRVVWFLhYXFy9btkz6Wq6urg5sAusXrF27NpBEfHy8/BWHJd4NGzYYGRl5enpeunQpOzs7OTl5y5YtWlpa6EWOHz8uq8SbkJCAvlnY29tjCb+ystLf35/FYhEEMXr0aJxVeVoLAAAAAAAAIBMg8XZoiffIkSNIc9LKygpLpGTu3r2LotjY2FCknby8PLxzKFni7dmzZ01NDTk0MzNTQ0ODIAhVVdX8/Py2lXgvX75MD/L29iYIQktLq7i4WHrhZ+fOneiVscSISU9PR7ugFBlm7969KMr8+fMpUerq6gYOHIhK6f79+wxeDQlg27ZtIweFhoaiIBcXF7rEO3ToUB6PR0ktLi4OtZNVq1ZRghoaGoyNjQmCmDNnDj0bixcvZvZdgyCIhIQEhVcclnjV1dWnTJkiEAjIoVFRUWpqjQc9dHR0Xr58Kb3Ey+Vykeyqra2dlZVFCf3f//6HHvrjjz/K2VoAAAAAAAAAWYFzYh2XwMDAuXPnCgSCLl263L9/H28rkfnzzz/Rj+XLl5MVkgmCsLS0XLJkiTQPWrduHZJvMfb29p999hlBEHw+PywsjGgjzMzMBg8ePHbsWHrQihUr0NnaEydOSJ9gdHQ01rOlBDk4OHh4eFAuVlRUrFmzBim+bt26lRLK4XD8/f1RKX3zzTcEI8zNzVeuXEm+MnPmTHQgNj4+vrKykvw4W1vbb775hn5y2MXFZcSIEQRBHD58uPE7GYkXL168efOGIAiR7efzzz8n3smKQ98a0O4rZujQoXPnzkWHmenVIYEdO3ZkZWURBLF06VI7OztK6LJly9D277Zt27hcLuPWAgAAAAAAADAAJN4Oys6dO5G8+sEHH0RGRtLX3Ij79++jH+PHj6eHov20FhEZd+LEiZRHINDepkj4fD5BEAKBQNwNAoGAkIUDBw7ExMSIDOrevTv6Ie4GkSBZkcfjXb58mR4aFBSUkJBANowUHByMZE43NzeRxo08PDyQRnFcXJxMOcHMmTOHfhGfrEZyGqJHjx7Z2dnTp0+XUCAlJSXkKPiVCYK4cOECqiAyzs7OCQkJq1atIhSK/BXn6ekpssBnz56NfgQHB/N4PGkyIxQK9+/fj36LLD02mz1mzBgkh588eZJxawEAAAAAAAAYABJvR2Tz5s3fffcd+h0QEEAxgYvh8XjPnz8nCEJDQ6NLly70G3r37t3is2xsbOhmkwiC6NWrF/qRkpJCvp6UlKQhhuDgYOTlSNwNeEeaAVwuNysrK+0fsrOz0fWioiLpE8FnUKdNm7Zlyxa0+Ynp3Lmzk5MT2QDvjRs30I8BAwaITFBFRcXFxQX9vnnzJiE7ODqZTp06oR8VFRUiY/F4vPz8/OfPn+MCqaqqElkgDg4OSKv50aNHI0aMwGrwCFVVVScnJ3ENTCEwqzgs81NAauQEQVRWViYnJ0uTgZSUFGRfmsPhODs7i7wH95TIyEjGrQUAAAAAAABgAHgn6oisX78e/166dGlCQoKOjg79Ni6Xi3ZNTU1NKfqfCO0m3r59K+FZ+PAwBbzDVlpaSrQdKSkpO3fuvHz5cn5+vsgbkI9iKVm8ePGhQ4dSUlKqq6vXrVv3ww8/jBo1ytvbe9KkSVjIJPP333+jH3RVWAzefk9NTSVkB+nTUsBK5pRd2YaGhkOHDh07diwuLq6+vl6aAlFVVd21a9enn36KxDkPDw9bW9vJkyd7e3sryrWSMipOnLsgLS0tMzMzJC2npaWJ/F5A4enTpzju7t27Rd6DHC9Rvu/I2loAAAAAAAAABoDE20EZPXq0urp6RERERkbGkiVLRO6O1tTUoB8SHJxqampKlnjFxdXU1EQ/qqurydc7d+4cEBAgMkpISMjjx48tLS3FackOGjSIkIW9e/f6+fnx+XxVVdWxY8e6uLjo6ekh2b66uvqnn36SKTX0spGRkatXrz58+DCviStNLFmyZMSIEatWrULarRgs7Yv84oDAeq2UPUApwd5uyIjcOSwsLBwzZkxiYiLamffy8rKyssLOis6fP4/OndKZNWuWvr7+8uXL09LSCILIyckJaMLMzGz+/PkrV640MjIiFIr8FSehSevo6CCJt6ysTJrM4EosLy//9ttvJd9cUlLCuLUAAAAAAAAADACJtyPi4+MTGhpaVVXVp0+f169fBwcHjx49mn7gE4thErbLsFQsjtraWskRKScVTUxM/Pz8REaJj49//Pgx8lNKyM29e/e++uorgiAMDAxu3bpF2c3jcrkMJF6UWlBQ0KZNm06cOHH8+PGoqCh01PNWE76+vocPH8YCJ7IMTN9rJYODsPCpJGbOnInE3c8//3z//v04b4j8/HxxEi86qj1u3Lh79+6FhoaePn0aCedFRUX+/v6HDh26cOHC4MGDFZVPJVUc4wLHt1lZWV24cEHyzZRNb5laCwAAAAAAAMAAWEt1RE6cOMHhcIyMjP7880+0M7ZkyZIXL15QbtPV1UWr+cLCQpFGoSorKyVv8BIEUVBQIPm6SLXbVgD7hlm9erU0yqsyYWpq+tVXX92/f//Vq1f+/v5WVlbo+tGjR3/77Td8G353sglfCjhIqQWVlJR0+/ZtgiD09fV37dpFEXelgcViubu7BwUFFRQUXLly5ZNPPkHXS0pKvL29KTv5bV5xEvKDC1zKrWlcLzwez6klRB59l7K1AAAAAAAAAAwAibcjgjeaPD09keuat2/fTp8+nXJ0U1VVtWfPngRB1NfX0+VhJCa1+Kzc3FyR6rjYLFDfvn2JtgAfrRw+fDg9lOKDhzFWVlarV69OT0+fOnUqunLkyBEc2r9/f/QjPT1dXAoZGRkUo0pKLY3+/ftjhXNmBaKmpjZmzJjTp09HRUWhA8MFBQXXrl17pyouNzdX5PU3b95gV9JStkxciYWFhXIK9pJbCwAAAAAAAMAAkHg7Ops2bUJL9vj4+NWrV1NC3d3d0Y9z587R454+fVqaR4iMe/bsWcojWhmsqi1SeVXCpqsE1q9fP2vWLPp1dXV17MCGbGlp3LhxIl00YWpra2NjY9FvpZ7qlFwaEgokNTXV29s7IiKCHjR06FDsj1ecfSkJiJNdFVJx4nwXYVvTVlZWXbt2lSYpa2trZHhcKBRKcIk0ceJECwuLX375hXFrAQAAAAAAABgAEm9Hh81mh4WFaWlpIU9Fly5dIof6+vqiH7/++ivZ6A7aewwKCpLmEZs3b0ZeZzFPnz4NDQ1FRoOnTZtGtAXY3xIWKcncuXOHQZr3798PCwsTuX+ora2NttbJrnomT56MrDTHxcWJ3DAPDw9HB569vb2lFMDkLI2EhAT6oWKBQEB2q0OmpKTk3Llz+PsFBT09PfRDegdFqCkiw9H44oQJE5ydnR89eqSoinvw4IFI29dY1Fy8eLGUGSYIYsWKFejHoUOHRN6QlpZ24cKFoqKiCRMmMG4tiPDw8KVLl1L6KQAAAAAAACAOkHgBolu3btiriq+vL3lbqV+/fkjBsrCw0NPTMzo6WiAQ8Pn8y5cvjxw5srq6WqTXIjIsFiszM3PkyJGPHj0SCoU8Hi8iImL06NFInlmzZo2hoSHRFsyYMQP98Pf3p+yk5efnkx04ycr3339Pv3j69GkkSZIlfFVV1T/++AOZJlq8eDHFQlh+fv6aNWvQgVJxbm8UhZubG/IjVVhY6O/vTwndunVrZmamhOhhYWHPnj2jXKypqTl//jyyzzRy5Egpc+Lg4IB+5OXloR+VlZXXr19PTEzs3LmzoirOwsJizpw5WIEZsXv3buQh2c7ObtmyZVJmGPWa0aNHo3L466+/KKFv375FlT537twePXowbi0EQUREREybNm3fvn3jx48XpxcAAAAAAAAA/Ach0GHArnFFhvr4+KDQESNG8Pl8fL2kpIS8TFdTU8PGYxcsWIDSNDc3p6SGZYlhw4a5ubnR4xIE8dFHH9XV1Umff7Th7OTkJFQEdXV1Q4YMQTkxMDDYsmXLtWvXoqKitm/fbm5u7uXlhYLMzc19m3j27JlQKDx69Cj6F51Q1dDQQP+GhoYKhUKsoT116tTr16/n5ua+fv360aNHq1evRu5whg8fXltbS8lJcHAwUtDt16/fuXPncnNzs7Ky/vjjDyTgmZiYPHz4UMqXysjIQPmxtrZGOfHx8cHZQ2Xo6+uLK3TMmDG+vr7+/v5CofDcuXP4+4WXl1doaOiDBw/Onj3r4+Ojq6s7bNgwehShUIj3VM3NzXfv3p2amlpUVJSWlhYeHo4OHqupqf3111/S10taWhrKxvDhw58+fZqenj579mzULBlXHJfLRb9dXV1R6M6dO3v37t2pU6f169eHhYUdOHBg/PjxOM34+HhyliRXOqKsrAy1c1VV1a+++iomJiY/Pz8pKengwYPIo/Lw4cOrqqrIyTJoLWvXrsXdZ/v27dKXKgAAAAAAQIcFJN4OhGSJt7S0FBuJ3bJlCzmouLh4xowZ5O1cNpu9YsWKhoaGFiVed3f3ioqKWbNmkaNzOJxly5ZVV1fLlH/FSrxCobCysnLRokWU46Da2tqbN2+mqHAjdVmhULho0SJCFH5+fkKhMDEx8csvv0SSKgUjI6MNGzbU1NSIzEl8fPxHH31EicJms+fMmfPq1Svp30jcOVKUPXEnY93d3VHo9evXu3fvTgkdNmxYUlISxSMUjlJdXf377797eHiINO/s5uYmvbiO2b17N8WNsJOT08uXLxlXHN1geGBgYFlZ2ZQpUyhKCh4eHmlpaZT8SK50TF1d3fbt2+kmtY2NjTdu3Ej/0sGgtcTExKBy1tTU/Pvvv2UtWAAAAAAAgA4IS1E2aYF2T35+flRUVElJiZmZmZubm6zOcnJych4+fFhWVtapUyd3d3d9fX3i3aC0tDQ6OjovL4/NZtvY2AwfPhxt5clDZmYm2u2sra3V09NzdHR0cXFp0b9rUVFRTExMQUEBm822tLQcNmwYdoncagiFwoSEhOTk5KqqKiMjo4EDB2I1Y8m8ffs2OTk5PT29oqKCzWZbWFj069dPpDgnDSUlJZGRkQUFBRwOp2fPnq6urnT9eYVUXF5e3uPHjwsKCgwMDPr379+tWzdCPgQCQWxsbHp6ellZma6urqOjY79+/SRXvUyt5enTpw8ePPDw8JCyXgAAAAAAADo4IPECAAAAAAAAAAAA7ROwXAUAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2CUi8AAAAAAAAAAAAQPsEJF4AAAAAAAAAAACgfQISLwAAAAAAAAAAANA+AYkXAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2CUi8AAAAAAAAAAAAQPsEJF4AAAAAAAAAAACgfQISLwAAAAAAAAAAANA+AYkXAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2CUi8AAAAAAAAAAAAQPsEJF4AAAAAAAAAAACgfQISLwAAAAAAAAAAANA+AYkXAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2CUi8AAAAAAAAAAAAQPsEJF4AAAAAAAAAAACgfQISLwAAAAAAAAAAANA+AYkXAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2CUi8AAAAAAAAAAAAQPsEJF4AAAAAAAAAAACgfQISLwAAAAAAAAAAANA+AYkXAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7RO1ts4AADRSXV19/PjxO3fuFBQUaGhoWFhYDBgwYMyYMba2tsS7zdWrV7du3Uq+cuLECXNz8zbJzM6dO8+dO4f/NTIyOnPmTJvkBGi1moVKb8fEx8efPHkyNTW1pqbG1NTUzs5u1KhRw4cP53A4bZ014pNPPiktLSUI4s6dO4pNk96G3759O378eIIgnJ2dAwICFPU4AJAJ3A4xy5cvnzhxIvEOExERsWPHDpFZ3bt3b3h4OEEQv/32m5OTU9vlEQBaA5B4OwQLFixITU2VcAOLxdLR0bG2th48eLCPj4+JiUkr5o5ITEycMGFCbm4um812dHQkCOLixYsHDx7U19cvLy8n3m2qqqqys7MJgigqKqqpqSEIora2tq0yU1JSgjLz6tUrgUDATPA+duyYn5/fBx98cPHiRSMjIyVkE1BkzUpT6VCn4niXS8bPz2/Xrl0EQZiZmdna2iYkJJSUlGzdujUgIMDPz6+tc0dER0cXFhYqI016G+bxeHfv3iXebbhc7sSJExMTE7dv375w4cKO2WjbNwKBAA22lZWV6HPPzJkzFZX4uHHjUJp//vlnt27dRN4TEBBw/PhxgiB0dHT+/PPPTp06tZjs69evUd+hZ/XFixco6F1eaEFrBxSGEOgATJs2zbEJNbXmbxw2NjboiqOjY5cuXXR0dHCTUFdX3759e6vlrba21sbGhiCI7t27Z2VloYtxcXFaWlr6+vrCd4Bnz57daaKqqkrCbR9//DEqwOzsbGFbg5aM5ubmjOOiyVXYMZCyit8FJNRsi0Edqk6lRBklo5DmtH//fpSxrVu3oiv19fWfffbZu1OJuOgUnia9DeMVubu7u/BdJTAwEGVS2TOXhEZbW1uL2l5KSopS89DBwXUdGBio8GpNSEgQecO+ffvQDRoaGrdv35Y/q/jD2Z07d4TvKjB5AYoCzvF2CE6cOPGsic6dO6MrJ0+eRFeePXuWkZFRWVmZnJw8ffp0giDq6upWrFiB9hZagdOnT798+ZIgiDVr1tjZ2aGLLi4un3zyCfFusHXrVo8m0tPTiQ5Ar1690I8ePXoQHYN2X8UdsE7bsGQU0pyQIqKNjc2aNWvQFTab/cMPPygqk4DC6dmzZ+v0MgmNtqCgALW9devWKTUPQCvz559/fvnll2gcOHPmjIeHB9ExgMkLUBSg1Qw007t37+PHj9fU1Jw/f54giPXr1y9cuFBTU1PZz42MjEQ/nJ2dydf379+P1nxAK3P27NnQ0NBu3bp5enq2dV4AxQB1+n6VTHFxMZKWKYfrunTpUlBQoKur23ZZaz8cO3YsOjra2tpaUcLhhx9+GBkZmZycPGPGDKLjNVpAeZw5c2bu3LmNxmZVVI4fP+7l5UW8k5SWlq5du5YgiCVLlijqYDC0dkBRgMQL/Ievv/4aSbyVlZXR0dEjR45U9hOLi4vRD319ffJ1nSaU/XSAjq6u7qJFi9o6F4AigTp9v0qmqKhI5KiINH7bIkftkFu3bh09etTJyUmB26HDmyA6ZKMFlMSVK1dmzJghEAgIgjh69Oi7o/5Gp7KyMigoiCAILy8vRUm80NoBRQESL/AfyPYScnNzW+GJPB4P/VBVVW2FxwEAALzjtINRsby8vK6ujiAIDodjaGhIv+HZs2eRkZElJSWmpqYeHh5du3aVKf3k5OTo6OiysjILC4uRI0daW1srLu8A8K5w9+7dyZMnNzQ0oIO4s2fPlnBzTU3N9evXkXpI9+7dR48eLZNR9+rq6suXL2dmZqqrq/fo0WPEiBHY8gsAtAOgNQP/Aa1REHisbGhoiIuLo9/s4OCArTq/evXq9evX5FALCwsJvoVKSkoyMjKQGgy6Eh8fX1BQgH4bGxuTF0BPnz6NjIx8+vRpaWkpm802Nzd3dXUdO3asuro6PeWEhATyW5iamnbp0gUlcubMmezsbD6fb2FhMXDgQMnfSvFb413opKQksh1ma2trS0tLcdErKipCQkKSk5Orq6vt7e29vb0lf/KsrKy8evVqTExMUVGRpqamtbW1p6fnkCFDWCwWITdZWVmnTp3KzMxEdsI+/vjjfv36SV909Kz+9ddfjx8/5nK5FhYWQ4cOHT9+PJvNLioqysrKIt/Zr18/NputkIgMCic2NvbmzZvp6enV1dV6enqOjo6urq6DBg1SUVFRSBVTqKioiIiIePLkSUlJiYqKSqdOnZydnT09PU1NTduk0lusU9wHMS4uLhwOR6amy7hOKWRlZeGNTXRWDTVRKZsu5tmzZ5cvX05PT6+oqDA2Nu7du/e4ceNEVqKEkhEX9ODBgwsXLrx69UpXV3fw4MFTp04ln/tQSHNCj37+/Dn6t7i4+OHDhzjUyclJQ0MD/1tdXX3jxo2oqKjCwkI2m21paenp6Tl8+HC6nCyurmtra0+dOhUfH19UVKSrq+vo6Pjxxx9jewqMuXr1qre3d21trb6+/pUrV1xdXcmhL1++XLhw4bVr18gXZ8+ejXaHWqS4uHjOnDlXr14lX/z000/37NljYGBAtAXiilf+IUL6Rot6UH5+Pvq3tLSU3HJYLNagQYMUmxmZklJUB2c8ZiYlJV25ciUzM7O6utrY2NjFxWXs2LFmZmaSY4kb34hW4dGjRxMmTEBjyPbt2yVvdR44cGDlypUVFRX4irm5eXBwsJTPCg4OXrp0KTl6p06dgoKC2tD3kpQLkhYnegBoRmE2sID3ASyCxsTEiLzh2LFj/zQNIiMjA13EgiiFI0eO4IirV6+mhPr5+UnIyZEjRwjxTJ8+Hd129OhRBwcHdFFNTc3W1hZPUSYmJsHBwRLeEeHr61tfXz9//nzKI1o0pynurTH+/v7ibDXfuHGDro4ooUB27dqF1mqqqqq2trbGxsYoipOTk7iaktLkKY/HW7FiBT3zn3zySVlZWYtFR0/59OnTdOdVDg4OSUlJ2CYkpqCgQP6IDAonJyfHzc0N3aarq2tra4tXn6ampn5+fvX19QyqWAJ79uzR1tZG56wsLS1xK2WxWO7u7iLtajKrdFltNUuoU3oflLXpMq5TOpTFnKxNVygUZmdnT5gwAVe6nZ0dEg5VVVWXLFlSWVlJuV9CydCDamtrfXx8KDmxsrJKTk7GsRTSnCR7IH/27Bm+MygoCBW+ioqKlZUV1nZ2dHS8du0aJVmRdR0dHU3XkZbeIKo4W81nz55FIoGxsXFcXBwl9NWrV+T9WGNjY9zefHx8UMeRYKt5yJAhWCIyMTHR09PDSQ0cOJBeyxLw9fVF3U0oNyKLV/4hgo6ERitZHFJXV1d4ZmRKSv4OznjMzMjIGD16NLrT0NDQ1tYWtU8Oh7Ny5Uo0FzAe35RnqzkxMRF/wdm4caPkuD/99BPOIYfDsbCwQJ+92Gw2dpQlwVbzV199hdsJjosqMSwsTPpXQK6b0OFbody0uCCRcqIHAARIvB0LyRJvSUkJ3ln97LPP8PXq6urAwMBNmzbhkWX//v2BgYFpaWn4npiYmMDAwFWrVhEEMXjw4MDAwKioKAk5SUtLC2yib9++KNnNmzejK4GBgdevXyeLkYaGhiEhIQ0NDehiRkYG9iwXFBRESfnUqVNHjhzBE4BvExwOZ86cOb/++uvGjRuRM6QWJV701oGBgXiDYu3atTiHgYGB8fHxIiXe8+fPczgcNzc3f3//gICA2bNn4/nj6NGj9AfhCWnZsmWlpaXoYmxsrIuLC/JDcPXqVaGMYOHn//7v/3R1dbdu3ZqcnJydnX358mV3d3f0uAEDBlC8p4SEhAQGBiLLEyInmLCwMPQpXVtb29/fPyUlBaU5cuRIY2PjDRs2oIgzZ85ERVRdXS1nRAaFU1lZaW9vj1bAeMHN5/OvXr2KlfbLy8sZVLE4kNMIFou1Y8cOXKTFxcXLli0TJzEyrnRZJV4JdUrvg6jpjh49OiAgIDAwcMGCBVirjd50GdepSO7du4duQ2aZZG26SUlJ6PWtrKwuXbrE5/ORp5YDBw5oaWmhPbeSkhIpS4YeNHPmTBMTk5UrVx44cGDr1q3YfGi3bt3wokohzYnyaFdXV3IKWBJAVlsJgli8eDH+lPDs2bNRo0Yh2ePQoUPkZNPT0480gRoYQRCXLl3S0NDo1avX+vXrd+7ciUdUOSXe48ePo+HO3NxcpIMcLHsMHTo0NTUVXXzw4AHZEKsEiRcxcuTI58+fo6DIyEg8bUn+zKo8iZfelSgSL4MhQiQSGi3qQZs3b0ZBffv2JbecgwcPKjwzMiUlZwdnPGYmJCQgqdXe3h6L35WVlf7+/mj4Gj16NF5aMBjflCTxpqWl4R3yFStWSI4YFRWF7mSz2bt3766pqREKhVwu9/vvvyf3GgkSL0EQmpqaBw4cqKurEwqFZWVl2ES8trZ2bm5um0i8khck0k/0AIAAibeDSrzHjx/H3omSkpKuX7++ceNGNOCyWKyFCxeiQZMCXi1FR0eLTB99sj1//rz0WZLsxhaFXr58mR7k7e1NEISWllZxcTE9NCEhASVrb29vbm6Ol1ZCoTAvL08mZ79oYSTBSx7lRezt7bdt20YOCg0NRUEuLi6UWLt370ZBS5cupQSVlZUh//ImJiZFRUVCWUBVqaampqmpGRsbSw7i8/l4K+ybb76RUHSUCSYnJwfZEmOz2ZQvJgKBYMqUKVjJnDKzMo7IrHB27tyJYmVmZlJipaeno+0IykQoZRWLpKGhAW01zJkzhx66ePFi+gpSnkpn5o9XXJ3Sm+6uXbvIQSdOnBDZdBnXqTKaLpfLRdpumpqa5M9wiL/++gtF8fLyEggE0pcMDrKzs3N0dCRXR21tLbYtTx/u5GlOLeZKKBTu3bsXhc6fP58SVFdXN3DgQLQJdv/+fQl13aVLl2+++QZ9GkB8++23ckq8R44cQZqEVlZWWCIlc/fuXRTFxsaGy+WSg/Ly8vBmr2SJt2fPnpTpKTMzE+/n5+fnt77EK3k6YzBEMG4eWOT4+OOPRcZVYGaYJcVsbmI2ZnK5XCQUaWtrZ2VlUSL+73//Q2n++OOPlCDljW/SdKizZ89aWVmh30OHDm0xIvZU9Ntvv1GCyLvokiXeY8eOUULxtvyXX37ZJhKv5NbOYKIHOjgg8XYsJKvMqampTZo0KSkpSVz0AwcOoDtnz55ND62trTU2NraysuLxeIqSeBcuXDh48GCREe/fv48i7tmzR8IoidwRU0Lnz58/fPhwJUm8rq6u9FB8fq+iogJf5HK56IO3hoYG/mgtckxft26dkNHcKXLtkp2djfZhVFVV8/LypJxg0AqGIIhFixbR00QnCUXOrMwiMi6cqVOnosZMXs1jxo8fr1iJ9+nTpyjuTz/9RA+NjY2l1IKcla5UiXfYsGH0UOzEm9x0GTcGZTTdH3/8UUIUoVCIzedGREQwkHgJgrhx4wYl9ODBgyho+fLlrSnx4vbD4XAKCwvpcW/evIni9uvXT0Jd9+rVizJQP3782MnJKSQkhJnEu3//fvRvly5dRA7mQqHw888/F7c0FwqFeFtJssQrModffPEFCv3111/fNYlX1iFCqRKvAjPDLCkGHZzxmIk3OVetWkWPVV9fj7Z/tbS0KDOC8sY3CeCSIbsfY7FYktXlsIVRU1NTuhJveXk5PvkvQeLt3r07/WtgXl4e2uU2NDQUuQ3ethIvg4ke6ODAwe4OypIlS/z/YevWrRs2bPjss88sLCzOnz8/cODAuXPnUsxQIWbNmoXG4pMnT75584YSGh4e/ubNm0WLFinQvuiBAwdiYmJEBnXv3h39EHcDwtDQkG6h6vfff8d+gBXOnDlz6Bfx2TOyOZ/g4ODKykqCIEaNGiXSnCk2GnH48GFmmZk1axb9oq2tLZIB+Hy+lJYteDwevvPTTz+l32BmZibSlxXjiIwLBzU/Ho93+fJleqygoKCEhAQFejTFrf3ChQt8Pp8S6uzsnJCQgLT9W63SGSOyguhNl3GdKqPpYtVKgiCmTZsmMinsHxXvFMmEmZkZ3RVk//790Q+KySJlg9uPm5ubSLs7Hh4eSB8yLi5Owti4YMECykA9YMCAhIQEkcXeIjt37lyyZAlBEB988EFkZKS4T6v4MyVaj1JAajstIjIu7jX4EQi07y0S1FsFAoG4G5A/mNYfIpSKAjMjZ1LSz03MxkzyV5jp06fTY7HZ7DFjxiALcCdPnsTXW2d8kwB6WWRADn2aqa6uFnczVmkePXo03aSWvr4+1hWXwPjx4+mmvywtLZFaX1lZ2bNnz8hBDQ0N4noNuqG+vl5kaH19PaEgWnmiB9oBIPF2UHx9fVf/w5o1a3766aejR4/m5OTs3Lmzrq7u6NGjLi4u+AsuRltbGxnHr6+vp9vq2L9/v6qq6oIFC5SUZy6Xm5WVlfYP+Gsi2QIkHRcXl1a2sI91v8kgtSu0UYYv3rhxA/2g2DLFODg4IO2p/Px8iuVbaWCxWOKs7GK7nZQFojgSExOrqqrQ7wEDBkj/4owjMi4cfP+0adO2bNlC+TTTuXNnJycnBVpxdHBwQKp9jx49GjFiBNbbRKiqqjo5OZEt9Cq70uUBa+qSsbCwoDRdxnWqjKabkpKCRgAWiyXOyiuWTiMjI5GfD5lwcnKiLwfpxdI64PYjruRVVFRw4eP9XjpI+VkhbN68+bvvvkO/AwICxNmj5vF4yAa1hoaGSJurvXv3bvFZNjY2dMtqaMsa/UhJSSFfT0pK0hADkmqSk5PF3fDnn38SbTFEKBUFZkaepGSam5iNmSkpKchqOofDETmykZsc+Qt4K4xvLeLj45OSkoI+66enp9Mtg2JwgxfXffr06dPi4/D5cym71dSpU0V2GUdHR3TDtGnTRN6ANyrkp5UneqAdAN6JgH9RUVH59ttvkRGOoqKiqVOnJicnU4aML7/8En033b9//3fffYcXgsg7oo+PDxbtFEVKSsrOnTsvX76M/S5QINuvp9Oi+wGFQ7fuiBZ56Af5Wzj+ppCSkvLbb7+JTI3D4aAXTElJQUeSpEdPT0+kAyekeYh+pKWlSZMUdpdibm5O9sjSYlEzjsi4cBYvXnzo0KGUlJTq6up169b98MMPo0aN8vb2njRpksIbJ1rY7dq1C20FREZGenh42NraTp482dvbW6SfGGVXeis0XcZ1qoym+/fff+Mnkj33kMFbjjU1NdnZ2WSv44rt0a0Afl8JPoTw+6amprbCwLh+/Xr8e+nSpQkJCegMJAUul4t2TU1NTUX6ktFu4u3btxKeRTcuTXkd7O7u3UHWIeJ9yYw8Sck0NzEbM3EsLS0tccod2O0iWaJrhfFNMqNHjw4NDeVwOIcPH0Y73nv27Pnkk09GjBhBvxk3eHFdA3+ba2fdqpUneqAdABIvQGXx4sXI8v7Tp09v3rz50UcfkUN79+49dOjQ6OjojIyMGzdu4FCkWIgU2xTI3r17/fz8+Hy+qqrq2LFjXVxc9PT00GqpurqabJFfHOKmVeUh0ue7yG+NeBY53oTkZEtKSmTNiYR3x0vSsrIyaZLC5+hErmURIuUNxhEZF466unpkZOTq1asPHz7Ma+JKE0uWLBkxYsSqVauQJpsCmTVrlr6+/vLly9ESLScnJ6AJMzOz+fPnr1y50sjISP73eneaLuM6VUbTxeUpITNk3bY3b97IKvFK36NbAZnel372REkD4+jRo9XV1SMiIjIyMpYsWSJyd7SmpqbFR2tqakqWeMXFxZIJRf+zc+fOAQEBIqOEhIQ8fvzY0tJSnOYtxYFtqw0RykaBmWGclExzE7MxE8cqLy9HVtmkidU645tk/P390ZgzbNiwpUuXIkt1c+fOTUlJoavpttitxAnt8nSrzz//XKT4/ebNm59//hkZ1RO5b0x2JyYnrT/RA+87IPECVPr06cNisRrNmjVpK1EkXiTWRkdHIykXhVZVVQUHB3ft2pV+2k0e7t27h9zEGRgY3Lp1i6JHxOVypZF432XwqZvNmzeLPJxGBhsQUgh4Y4p+8kckWDNc1h0txhHlKRwDA4OgoKBNmzadOHHi+PHj6KSTUCi81YSvr+/hw4cVK7GMHz9+3Lhx9+7dCw0NPX36NJI0ioqK/P39Dx06dOHChcGDB8v/Xu8IjOtUGU1XmsyQg6Rs8O8sMr1v67ysj49PaGhoVVVVnz59Xr9+HRwcPHr0aLo5Ayw/SNDKwct3cdTW1kqOSBEJTExMyAZpycTHxz9+/Bj57SSUj/RDxPuVGYW/F731MhszcSwrK6sLFy5IjkXekW7b8Y3yNc3f3z8iIuJlE9999x02mCd9t2qxTzHoVtikNoWcnBwk8U6aNAlbcVMerT/RA+81IPECVFRUVDQ1NdEnPYoXRMTUqVP9/PxKS0vPnz+fl5fXuXPnkJCQqqqqJUuWiNRVYww2wLh69WplH5tpE0xMTJCFMBMTE3GHmuRBgrkLLpeLfkj5OR/fhiPSEbk5wzii/IVjamr6VRO5ubkhISF79uxBZi2PHj3q5OSEPUYqChaL5d7E3r17b968eeDAgTNnzqDdA29v74yMDOQYVtmV3gowrlNlNF2sciwhM+QgkSrK7xG4/Ujzvq3zsidOnFBVVTUyMvrzzz9HjRolFAqXLFni6upK2UvX1dVls9kNDQ2FhYUCgYC+Eq2srGyx2RQUFEi+/i7Xr5RDxHuXGQZJyTQ3MRszcUvg8XgyjbStML5Jj46OzqFDh5AX60OHDn3yySdeXl7kG7DbXnHHvkRaIW1P3aqVJ3rg/QU+fgBU6urq8GwkcphTV1efN28esnJ56NAhtNmrrq6OfXIoCnzGBjsXIYN2od9rsEGdzMxMZaRfVVUlzqwOPqokzmQFBXxbWVmZuCM9eXl5CoyowMKxsrJavXp1eno68mdAEATd7poCUVNTGzNmzOnTp6OiopDyW0FBwbVr11qn0lsBxnWqjKaLy7OsCZFRsDllY2NjGxsb4n0Gv296erq4e/D7KtA8lTT7Y56enitXrkTywPTp0yl2WVVVVXv27IkMH7548YKeTlJSUovPys3NFamqnZycLNOA1rZIHiLe38xIn5RMcxOzMRPHKiwslCBgt8n4JhMfffTR3Llz0e8FCxZQ9iGwYSpx3ScxMbHFR8THx4u8/n51q1ae6IH3DpB4ASqPHz/Gv8XtrGJvdQcOHIiMjExKSpo6dSoy26hAsJaOSN08Cd9flYTCZWysoIUdDNC5d++ehYWFnZ2dNLpJdB4+fCjyOrarKaWXhW7dullZWeEsibxHpCsUxhEZF8769etF+r1QV1fHzirEfQ5nUMWpqane3t4RERH0oKFDh2IHpPiJrVDpyoZxnSqj6VpbWyM5SkKRYkOsXl5eitVDkYwyvsqNGzdOspX12tpa5AqVIIjWP8m2adMmJGnEx8fTDcxiRynnzp2jxz19+rQ0jxAZ9+zZs5RHvDvIOkQote0pMDNyJiX93MRszLS2tkamhoVCoYThaOLEiRYWFr/88ksrj28ysXPnTmSAKj8//+uvvyYHDRs2DH1yunbtGl05uaSkRNwrkImIiKCrcGdnZyMpulOnTl27diXeMeSZ6IGOCUi8ABU89Hfu3Fnc6qFr166jRo1CCjPovNaXX36p8Jxgm414AUfmzp07RKuANbLIfk0mTJjg7Oz86NEjeVL29vZG7xgVFSXOZvL+/fsLCwtdXV2lsT9Bh37shyCI6OhoZJpST09PpKNCkSxatAj9CAoKooempqY+ePBAgREZF879+/fDwsKQXhMFbW1ttDig+MyQp4pLSkrOnTuHF9ziDHXgJ7ZCpbcCjBuDMpru8uXL0Y8//viDHoXP52NDSvjO93TEIAhi8uTJyEpzXFycyF2d8PBwtOj39vZu/XUqm80OCwtDJRAQEHDp0iVyKNYD+vXXXylW2TIyMkS2JTqbN29GDksxT58+DQ0NRfaExPlkbkNkHSIU3vYuXrzo7OyMNLMUmBk5k5K+gzMeM1esWIF+IGU0OmlpaRcuXCgqKqIcTJVnfAsPD1+6dCml5cuJgYEBluKCg4PJZW5iYoL0nMvKynbs2EGJuH79emn8seXk5NDfdN26dejHnDlzWvNDoZQwmOiBjo4Q6EhgrxUxMTH00MLCwvnz56MbVFVVIyIiJCRF/h7fp08fxlnC5g2ys7MpQdgPgZWV1evXr8lBr1+/xl9h3d3d6ckmJCSgUF9fX6F8bN++HSX1119/oSsVFRXIlGJubq40LyIUCrFxlDt37pCv37t3D51nGzJkSHV1NSUWWqlraGg8e/ZMpjwjZwNaWlp6enpHjx4lBxUVFWGnefv375e+6KqqqrBDFErEsrIyFxcX7AUhMDBQIRGZFQ76TDNv3jz6qyEPnGjRzKCKRYK+vGhqav7999+UoOrqauQj0cDAoLKyUs73Itesubm5TEGSuwODpsu4TpXRdPl8PvoARxDE+fPnKQli+3arVq2SqWQkFxrWLaSPP/I0J2keffv2bdx+amtryUGvX79GizwjI6NXr17JWtcygT2a0IN+//138glMchBWOOzTp09UVBSfz+fxeJcuXUJzE1pY09swLm10w8CBAx8+fCgQCBoaGs6fP4+NFf3444/S5x+J305OTkLFIbJ4GQwRjJuHQCBApoz69u2LL/7f//0fUohVbGaYJcVsbmI2ZgoEAnQCliCIM2fOUGJVVVUhZV36ZMF4fDt//jxeF0VGRgoZdaiEhASRN+C+Y2pqWlxcjK8nJSUhAU9FRWXjxo1v3rwRCoW5ubnI8CcWVulDMR7bWSyWmpqav79/WVmZUCh8+fLlwoULUZCRkRFKUBqys7NRrLNnzwoVhLjWzmCiBzo4IPF2CH7++WffJrS1tdFAMG7cOHTF19f3s88+8/HxGThwIDZRaG1tfeHCBclpNjQ0YKdn+/btkzVL9+/fR0+3trZGifj4+KArO3bsQPfU1dUNGTIEhRoYGGzZsuXatWtRUVHbt283NzfH9hvMzc1RRDTb7dixw9fXd+LEiSjUwcEBhS5fvpxZ6aWlpaE5Y/jw4U+fPk1PT589ezZBECNGjBAKhRkZGSJfJDQ0FEVHoT169EChY8aM8fX19ff3x+kfP34crYZ79OgRHBycmZmZm5t7586dzz77jMVisdns8PBwKbN69OhR9Dh0hsrc3BwtBSZOnBgUFBQWFrZ+/Xo8rc6fP18gEJCjL1++XGTRJScnoxsSEhIMDQ1R6IQJEw4cOBAWFrZhw4ZOnTr16dMHWxqjz6yMIzIoHKyYMHXq1OvXr+fm5r5+/frRo0erV69GPhiGDx9OkRMkV7FksK6Bubn57t27U1NTi4qK0tLSwsPD0SlKNTU1LPkwfi9KzWpoaKB/Q0NDJQRJrlM5my7jOpUMlttlarqlpaXDhg1Dpb127dqkpKSCgoKYmBi8qThv3ryGhgZyFAklI24MQUvts2fP+vr6zpw5U+T4I2dzEpcrX1/fjIwMfFtwcDA669GvX79z587l5uZmZWX98ccfSPYzMTF5+PAhOVlxde3r63v//n2ZKohSU+K+m/v4+KDQESNG8Pl8fL2kpAS3KFRf2ITVggULxH21wRLvsGHD3Nzc6HHRcce6uro2kXjFTWc///wz4yFCJC0O0UKhEDnIRZZ7cnNzIyIiUD+9e/euYjPDLClmHZzxRFlWVoYajKqq6ldffRUTE5Ofn5+UlHTw4EH0kWX48OFVVVX0iFKOb66urqgKuFyuUChcu3YtbpDbt2+Xphill3gLCwuxVS0fHx9yEHIPSfc2pKWlhcVaCRLvmjVr6HGRysbVq1elfwXFSrySWzuDiR7o4IDE2yFo0T2ApqamqanpgAED5s6de/r06ZqaGmmS3bBhA1IgqaiokDVLEiwKjBkzBt9WWVm5aNEiyjlebW3tzZs3012Voj0ocUfXbG1thUzZvXs3xSenk5PTy5cvJRwQ8vPzQ3FFhlL2hRISEsaMGUNXHPLw8IiNjZU+n1gXC4EWjqdPn6Y4ZNfT0/v111/Jy1CKCgCFK1eu4HueP39OccSnoqIybdq08vJyrHYVFBREzxvjiLIWTmJi4pdffinSr4+RkdGGDRtENm8JVSyZ6urq33//3cPDA38wIuPm5kaRPZi9F6VmMX5+fhKCJNep/E2XcZ1KgCzzSN90hUJhbW3ttm3b6NYEHBwcQkJC6PdLKBlxY0h5eblQKPzxxx9FhpL3wBk3J3G5oivmxMfH013HsdnsOXPm0Hd3JRw7PHLkiFAJEm9paSlWw9myZQs5qLi4eMaMGeSWz2azV6xY0dDQ0KLE6+7uXlFRMWvWLHJ0DoezbNky+tZfq0m84qazwYMHyzNE0JFmiM7Pz+/Xrx+lVWDpS4GZYZYU4w7OeKKsq6vbvn073QynsbHxxo0bJQhFEsa3wMBASmoFBQWoo6HSELn1LafES969JAgiLCyMHHTq1CmKEm+PHj2ePHmCsypB4r1z587FixcpddGjRw9ZP4cpVuKV3NqZTfRAR6bZ7SoAMOD8+fMff/zxF198IeX5K8aUlpZGR0fn5eWx2WwbG5vhw4cr1f+7SEpKSiIjIwsKCjgcTs+ePV1dXRV+sqW4uDgmJgZNnObm5gMGDFCUO1Y+nx8dHZ2dnV1bW2tra+vu7i7O47yUvHjx4smTJ+Xl5RYWFoMGDUIT7Y4dO9C5qePHj4s7Hsw4IoPCyczMRNsOtbW1enp6jo6OLi4uEjyUylnFb9++TU5OTk9Pr6ioYLPZFhYW/fr1azGTyqv0VoNxnYrEwsKisLDQ3NwcOcaQtekKBILHjx9nZGRwuVxjY+NeTRBtQSuMGMjxKWo/bDbb0tJy2LBh2D/nO05+fn5UVFRJSYmZmZmbm5us7k9ycnIePnxYVlbWqVMnd3d3fX194p2H2RDBAKFQ+Pjx49TU1JqaGlS8ZmZmysuMTEnJ2cEZj5kCgSA2NjY9Pb2srExXV9fR0bFfv37SOKwWOb5J4OnTpw8ePPDw8HBwcCBaF4FAEB0djQyhf/DBB1hFTkp4PN69e/cyMjI0NDR69epF+W7yziLrRA90WEDiBZgzZcqU06dPx8fHOzs7t3VegLbn22+/RUevo6OjZZprGUcE3lkY1yllQQwAQHsCOjgAAG0C2GoGGFJUVHTu3LnBgweDuNtxWLFiBTYnRge5S9HS0sKOEOWPCLyzQJ0CAAAAAPBeABIvIC1z584lO0Lcu3cvj8dbsmRJm2YKaFVOnTq1YcOGt2/f0oPu37//5MkTgiAWLlxIOcEoT0TgnQXqFAAAAACA9wKQeAFpOXr06LZt25Cb8hcvXuzcubNz587YYCnQQaisrJw2bVpZWRn54sOHD5EbzG7dum3cuFGxEYF3FgXWaWlpaU4TaITh8/noX0riAAC8j0AHBwCgbYFzvIC0ILMrDg4OdnZ2Dx48qKmpOXv27KRJk9o6X0Dr4ezsnJiYiLRV3d3drayseDxeUlIS2tAbOnToyZMnRRoRYRwReGdRbJ0uXrxYpAE8Pz+/gIAARecdAIBWBTo4AABtC0i8gLQsXbr00aNHr1+/VlNT69mz58qVKz09Pds6U0Crwufzb9++fePGjfj4+MzMzIqKChUVFeTXysfHZ/z48QqPCLyzKLZOL168GBsbS7/u6uoqzlcQAADvC9DBAQBoW0DiBQAAAAAAAAAAANoncI4XAAAAAAAAAAAAaJ+AxAsAAAAAAAAAAAC0T0DiBQAAAAAAAAAAANonIPECAAAAAAAAAAAA7ROQeAEAAAAAAAAAAID2iVpbZwAAWmDnzp3nzp3D/xoZGZ05c6ZNcwS0W/bu3RseHq7YxqaMNJVHWVnZ5MmTyVeWL18+ceLEtstR+2TGjBkFBQX4Xy8vr9WrV7d+Nq5evbp161bylRMnTpibm7d+TgBmQA22yeoCliUA8N4BEi/wrlNSUpKdnU0QxKtXrwQCAczlyuPYsWN+fn4ffPDBxYsXjYyMiI5HaWmpwhubMtJUHnw+H+W2srKytLSUIIiZM2e2dabaIblN1NfX5+fnEwRhZ2cnfVwulztx4sTExMTt27cvXLhQnmxUVVWh6i4qKqqpqSEIora2Vp4EgVYGalDZqwuR0yIsSwDgvQP88QLvDRYWFoWFhebm5uS9EUDhJUwQREBAgJ+fX9tmJi0tDVX0gAEDtLW120FjU3iaSi2ioKCgxYsXEwQRGBi4aNEixSYOIBITE52dnQmC8PX1PXLkiKxVo6+vX15erpCceHt7oz2r7OxsW1tbhaQJtGY3b+UabNvxWeFIGJwlT4uwLJGfurq6mJgYgiBMTEx69erV1tkB2i1wjhcAgGbwZNOjR4+2zguxdetWjybS09PbOi/vKFBEHZOePXu+O/0U6Jjd/N3MVbufFtslBQUFqC2tW7eurfMCtGdAqxkAgGbOnj0bGhrarVs3T0/Pts4LAACi+fDDDyMjI5OTk2fMmNHWeQGAdg5MiwDQPgCJFwCAZnR1dUF/FQDefYY30da5AID2D0yLANA+AK1mAAAAAAAAAAAAoH0Ce7wdi6dPn0ZGRj59+rS0tJTNZpubm7u6uo4dO1ZdXV2eZKurq2/cuBEVFYUMPBgbG/fo0ePDDz90dHSUJgqbzba0tPT09Bw+fLiqqqr0z62trU1MTCRf6dOnj5aWFv43NjaWz+fjf7t3725oaIgMLWZkZJAjuri4cDic8vLyo0ePpqSkaGpq9u7d+9NPPyXb5MjIyDh+/Hh6erqGhsagQYOmT59Ofpa4NCsqKkJCQpKTk6urq+3t7b29vZ2cnAimPHv27PLly+np6RUVFcbGxr179x43bpylpSXlNnGZqa2tPXXqVHx8fFFRka6urqOj48cff2xnZ5eQkFBXV4dvNjU17dKli8gMVFZWXr16NSYmpqioSFNT09ra2tPTc8iQISwWS8o8SC6QhoaGuLg4giCKi4vRlaSkJLL1UWtra/r7Sp8rCnFxcefOnXv58qWGhkaXLl2mTp0qk9VcRaVZVVV1586d+Pj4nJyc2tpaPT29Hj16jB49WmQPYlBE8nf8hoaGixcvRkdHFxQU6OvrDxw4cPLkybq6uhKiMH5obGzszZs309PTq6ur9fT0HB0dXV1dBw0apKIi9hNtUlLSlStXMjMzq6urjY2NXVxcxo4da2ZmRiiIhw8f0i927drV2NgY/5ubm5uXl2dpaWltbY0vCoXCR48ekWNpaGhIGAEePHhw4cKFV69e6erqDh48eOrUqZqami32KcljBZfL1dbWtrW1dXZ29vDwII9a4pBn1FLG6KqQ/i5TgxQ3JEquIDIVFRURERFPnjwpKSlRUVHp1KmTs7Ozp6enqakpIQXMRkIGNajswacVJnSF1Bcd6adFCllZWUVFRZSLqGCVMXCJy+edO3cuX75cVFRkY2Mzfvz4QYMG4Xv4fH54eHhMTExZWZmNjc3kyZP79esn4REMFmzStH9UUMhePfJrQB5pWSwWOc8AIC9CoGNw9OhRBwcHVOlqamq2trZ4VDUxMQkODmaccmBgoImJCRqeOnfuTF4Cdu/e/ddffxUIBJQoQUFBKIqKioqVlRW27O/o6Hjt2jVxD0K3mZub4yvPnj2jtOeEhARyFH19fXLo2bNn0XW6WdTs7OwbN27o6emRLxobG9+7dw9F+emnnyiDu5WV1dOnT/GzxKVJyQNBEH5+fgzKOTs7e8KECSgFXV1dOzs7DQ0NgiBUVVWXLFlSWVlJvllkZqKjo+lOFAICAoRCIcW2p6+vr8g87Nq1y8DAAD3U1tYW17WTk1NMTAzlZmYF0qLFS39/f3lyhSktLf3kk0/o6a9evZrP59MbmzQwSLOoqMjHx4fNZqM7jYyM7OzssAwzadKkwsJCylNkKiLGHT8wMBDdFhgYmJiYaG9vT3mKiYnJ6dOnRcZl/NCcnBw3Nzd0p66urq2tLS4KU1NTPz+/+vp6SpSMjIzRo0ejewwNDW1tbVFhcjiclStX0u9nhshyPn78OPkeLy8vgiBGjhxJvkh3FePo6IhDExIS0EVfX9/a2lofHx/KzVZWVsnJyZL7FD23WVlZeKzQ0dGxtbVVU2v+uq2urj5jxgxymoiPP/5YUaOWMkZXOfs7gwZJHxKlqSDMnj17kDyvoqJiaWmJH8disdzd3W/fvt1iMco6EjKoQWUPPrLCeEKXv75EDs7STIsiI4rUgnZ3d1fSwCXy3ekz0cyZM3k8nlAozMzM7N69OyV02bJl4tJnsGCTsv1LVhdXV1eXvhAAoEVA4u0ooOnQ0NAwJCSkoaEBXczIyMDONoOCghgkiwesL774Ij8/H10sLi5evXo13pCpra0lR/nyyy/R9cWLFxcUFKCLz549GzVqFBofDx06JPJZ9KmlrKwssAlXV1eRE+Thw4cDAwPHjx9PmSDT09OPNOHi4oKCIiIi1NXVx44du3379l9++QXbqNDV1c3LywsICFBVVZ09e3ZAQMCmTZt69+6NQnv06IELMy0tDWWmb9++KPT8+fMcDmf06NEBAQGBgYELFizA686jR4/KVM5JSUno9a2srC5dusTn89Fi+sCBA+gTuIuLS0lJCb6f/oKXLl3S0NDo1avX+vXrd+7ciesdSbwhISGBgYFr166VMLVjz5/Lli0rLS1FF2NjY9EjNDQ0rl69Sr6fWYFUV1dT6nTt2rWBJOLj4+XJFaKqqmrAgAEo4ogRIy5fvpydnZ2cnOzv76+rq7tu3ToGEi+zNLHM4+Pjk5mZiS7W1dWFhYWhb+GOjo5cLpccRaYiYtzxscS7YcMGIyMjT0/PS5cuoTfasmULanUsFosi9cnz0MrKSiRXDxw4MC4uDl3k8/lXr17t1q0bilheXk4pPbQUs7e3x6uoyspKf39/tN03evRonAF5CAwM3LZtG8pD586dUTmnp6fjG8rLy9GCVUVFpbi4GF/n8XjoZltbW01Nzf3795NLjCzxzpw508DA4Ouvv961a9f333+Pl6TdunXDy196n6JLvAkJCWh92blz5wsXLqCxgsfj3bhxAw9cq1evpsTC8hLqpG5ubv7+/gEBAbNnz8ayqJSjljJGVzn7O4MGSR8SZ86caWJisnLlygMHDmzduhWb8CVXEGLfvn2od+zYsaOqqgpdLC4uXrZsmfSfD2QdCRnUoLIHH1lhPKHLWV/iBFdppkWREe/duxcYGOjh4YG8N6GXOn/+vJIGrlOnTh05cuSnn37C+Zw1a5aZmdmKFSt27dr13Xff4Z3w5cuXc7lcGxub7t27f//997/99tv8+fPxJ4/Q0FB64gwWbNK3f1RQmzdvRtf79u1LbksHDx6UsgQAQBpA4u0ooOnw8uXL9CBvb2+CILS0tMgLNWnYvXs3GqfmzZtHD/3f//5Hl3j37t2LLs6fP59yf11d3cCBA9GX+/v379MTlCCE+Pr6ipwgET/++CN9gqSsEuzt7fft20cOmjdvHgpasGCBoaEh+at8XV0dlm0uXrwoIc1du3aRg06cOIGCXFxchFLD5XKRkpKmpmZaWhol9K+//kJpenl50bfTcWa6dOnyzTffoOUv4ttvv8USL339La6uly5dSgkqKyvr1KkT2i0pKiqi559ZgUiuUzlz9fXXX6OIH3/8MaXQYmNjNTU1kSguk8TLLE1U5kOHDkVf38nExcWhz0arVq0S+URpiohxx8cSr7q6+pQpUyhvFBUVhV5HR0fn5cuXCnnozp070RPx4huTnp6OdgzIEi+Xy0USsra2dlZWlrjx58cffxQqCLRoVlFRoe99HT16FD2OIAj6EvDNmzdqampTpkyhXMc9zs7OzsHB4fXr1ziopqaG/KmIEpG8oUe+jstEU1Pz2bNn4jqFBInX3t5+27Zt5KDQ0FAGo5YyRlfG/Z1xLyBXkKOjIznl2tpa5EuZUkENDQ1o23nOnDn0BJEjZZnUfKTp5sxqUNmDD2MYT+gM6qvF1YWEaVFCxF9//RV9+qSoXylv4ML5tLe379GjB/kLeFpaGlLd19bWXrBgwfjx4+vq6nDomTNnUMQBAwZQ0mSwYGPQ/rOzs/HUKdMrA4BMgMTbUVi4cOHgwYNFBt2/fx8NN3v27JE+QS6Xi07xcTgc+voPTTBIBwlLvC1GuXnzJspJv379Wlni/fDDDyVoWH399deU0JCQEBS0fPlycWkOGzaMnpnOnTuj0IqKCqF04PyLWydhq60RERHiMtOrVy/Ksubx48dOTk4hISEtTu244jQ0NPC+ikhZZd26dfRQZgXS4oqKca5yc3PRpoeamtqrV6/oEb/55hsUUXqJl3GaT58+tbW1FblTKhQKR44ciRbx9G8ZUi46GXd8LPGK662ff/45umHJkiUKeejUqVNRAZK/y2DQxg5Z4v3+++9RUiIX5fX19WgXRUtLi7IzzBjcEwMDA0VmDzFmzBhK6O+//04QxIkTJyjXcY8jCOLKlSuU0AMHDrQ4yFAkXlwm4sYKtJ6WIPG6urrSY+GTmdKPWgofXeUZhRj3AnIF3bhxgxJ68OBBej6fPn2KLv7000/0BGNjY5Ut8Upfg8oefNpQ4pW+vpQh8aJtYW9vb4qCm1IHLvK737p1ixI6ffp0PJ5jdTxM165d6c2D2YKNQfsHiRdoHcBWc0fhwIEDMTExIoOw+py4G0QSHBxcWVmJTqeINLSgrq7u5eVFPniDo7i5uYmM4uHhgZSp4uLiZMqM/MyaNYtypXv37tjEBT0Um3lIT08Xl+ann35Kv4gjZmVlSZMxrCNEEMS0adNE3oPdcuI9EDoLFiygnJQbMGBAQkIC/dXo4IobNWoU1o8iM3HiRPTj8OHDEtJRSIHIn6vg4GBk/uTDDz+0srKSMp8tZoZZmj169MjOzsbLEZF9s6SkRNbCUWDH9/T0FNlbZ8+ejX4EBwfzeDz5H4raJ4/Hu3z5Mj1iUFBQQkICtpUlFAr379+PfossPTabPWbMGGRz5eTJk4QimDJlCvoRHh5Ovs7lcq9duzZ58mRUUDdv3iwrKyPfEB4erqGhQZaKKZiamuJDfZj+/fujHxRDUOJosUwIghg7dqy+vr4E4z1z5sxRYCdV4Ogqzygkfy8wMzOju2MVWUF4mEUq5ZQozs7OCQkJq1atIpSG9DWo7MGnDZG+vhSLQCBYtGjRli1b5s6de+rUKbpRtFYYuMzNzZFCtcgG4OHhYWFhIS40MzNTzgVbm7d/ABAHSLwdES6Xm5WVlfYP+AMb3bqgBG7cuEGZReiEhYWVl5fjQR9HwUprFFRUVPDRL/z5sHXA+k4YFouF11V0K5fYXAqaEqRMkyAIPNlUVFRIk7GUlBRULywWS5w1RVwFkZGRDQ0NIu9BCkjMwBWHj1dRcHBwQLWcn58vYXmkkAKRP1eRkZHohzg7kE5OTi0aeaagkDR5PF5+fv7z589x36yqqmLQNxXb8cW1OtyiKisrk5OT5X8orsdp06Zt2bLlzZs35NDOnTs7OTlh6wApKSnIWiyHwxHZrgiCwCdCce3ISa9evT744AOCIG7fvl1SUoKvR0RENDQ0zJw5E1mL4fF458+fx6FlZWU3btzw8vIimyam4OzsTG8eSE1XprEClQmLxcIDKYW+ffuWl5f/8MMP4hIRGVHWnChjdFXUKMSsF4jsvyLHLgcHB5T/R48ejRgx4u7du+QoqqqqTk5OjK0ZSwOzGlT24NPKSF9fCqS+vn769OkHDhz4+uuvDx8+LNKOcSsMXCLf3cjICP0Q+VDJPU6mBVubt38AEAd4J+pApKSk7Ny58/Lly9gWPAWygfsW+fvvv9EP6b25SBMFWx1MTU0lWhGyiWkMsuig2QQlCBu0pH/FxCDdJArIwLLkiCILzczMDMcVV2g1NTXZ2dnYzA8ZeTy1YD2llJSU3377TeQ9HA4HtZ+UlBS6XV8FFoj8uXr+/Dn6IS6f6urqurq6Mq2K5EmzoaHh0KFDx44di4uLq6+vl79vKrbji2s5WlpaZmZmaDWclpZGWWczeOjixYsPHTqUkpJSXV29bt26H374YdSoUd7e3pMmTcLrdXrta2lpiVNtQG5UUGYIBTFlypRNmzYJBIJz584tWLAAXTx58qSGhsa4ceOMjY2RNnh4eDjWzDx37hyPx0M6220+VrSIYjupAkdXOUchOXuB9MWiqqq6a9cupNMRGRnp4eFha2s7efJkb29vWd3vtUINKnvwaSuU0Ywl8/btW29vbyQlVldXi/u+2QoDl4TuJq5kRPY4Zgu2Nm//ACAOkHg7Cnv37vXz8+Pz+aqqqmPHjnVxcdHT00ODcnV1NbbyJz2lpaXoh46OjgKjYK1Fyg6PshHn01JyEIM0JfgUlb/QULmJlHjlcbmM83C8Cck3k/e+lFEg8ueqvLy8xSLV0NCQSeJlnGZhYeGYMWOQF0obGxsvLy8rKyu8Ojl//nx0dDTRph1fQsvR0dFBEi9FiZfZQ9XV1SMjI1evXn348GFeE1eaWLJkyYgRI1atWoWU/Si1X15ejmywMWuTsjJt2rRNmzYhmRZJvMg37Pjx47W1td3d3U1MTEpKSq5du8blctGZjpMnT6qrq2N3QW07VrSIYjuphDRbDFLgKCR/L5CpWGbNmqWvr798+fK0tDSCIHJycgKaMDMzmz9//sqVK/GGmzKQPqvKHnzaEGU0YwnU1tZ6enrGxsbq6upWVlb+/vvvY8aMEfmRqxUGLsl9ikGPk3XB1rbtHwDEARJvh+DevXtfffUVQRAGBga3bt2i7MZwuVwGEi/2KyP951JpouAgPO/Kj0AgIN5bZCo0xZYbPc3NmzdLOIuIwJaolA3jXDFoui3COM2ZM2eiFefnn3++f/9+nA4iPz9fnkWnMjp+i71VnocaGBgEBQVt2rTpxIkTx48fj4qKQiffbjXh6+t7+PBhtGzFT7Sysrpw4YLkfCpwY6FPnz7dunV78eIFOqxraGgYERFRX1+PztirqqpOnjz54MGDDQ0NERERs2fPLi8vRyrN5M9SSkIZDfvdgXF/V3YvEMn48ePHjRt379690NDQ06dPI3mgqKjI39//0KFDFy5cGDx4MNHWKHXwUR7v4ITO5XITEhLOnDnDYrGQCbGFCxcOGjSI4im3DQcuBsizYHsv2j/Q0QCJt0OAjViuXr1a3PkuWTExMXn9+rVMR2JwFC6XK+4eHCRS96ZFRA7NNTU1xHsLLgdpCo1xuUlZcSYmJvRDd20F41wZGRkhzUYJRfr27VuZMsMszaSkpNu3bxMEoa+vv2vXLsqK8x3p+NXV1eKC8MuSv9nL/1BTU9OvmsjNzQ0JCdmzZ09ubi7yJurk5IScOuJ2zuPxWrlNTp06dcuWLeiwrq+vL9rCxTLY1KlTkUnY8PDw2bNnnzt3rqGhQZzNOcWCy0RJxxTf0/6ujOlPGlgslnsTe/fuvXnz5oEDB5AbmJKSEm9v74yMDOTUuq1Q9uCjEN6XCZ3NZl++fBnZyvryyy/37dvH5XJnzZp17949itTahgOXrMi5YHvH2z/QAQHLVR0CfCwEu7Eh0+ilSnawtSQJxooZRMFGFGWytIRna5Gr87y8POK9BRdaWROSC83Y2NjGxkZ5eSAbcmxzGOcKuzl98eKFyBsqKipklXiZpYk7Zv/+/UWaz2XWNxXb8ZG0SefNmzdYlxu/vmJHGysrq9WrV6enp2P9wCNHjlBqv7CwUIJMrgxwZk6ePFlVVXXlypWxY8fiLdwRI0Yg+f/q1auVlZUnT55ks9nYjLBSwWVSWloqYZH6nsK4vytj+pMJNTW1MWPGnD59OioqCh0lLSgouHbtGtGmKHvwkYf3bkI3MjLCpqF37NjRp08fgiCio6Pp6gNtOHDJiqIWbO9m+wc6ICDxdgiw5QmRKq/M1kbjxo1DPyQoPo0aNcrOzg4vUnEU7AKRQm1tLXLXhnxaSp8ZAwMDCavzBw8eEO8t1tbWPXv2RL+RkicdbNHRy8tLViPD0oD3r8RlAKkOWlhY2NnZKfwDvLiFF+NcIT+TBEFQzEhiHj58KGsmmaUpuWNK3zfFFZFCOr44ry34Ta2srLA7R3keun79epG+stTV1bE/D2x2yNraulevXujdJfiVmThxooWFxS+//EIoDmdnZwcHB4Igrl+/HhwcXFdXRz6wp6am5u3tjcohJCTk+vXro0eP1tPTI1p3rBA3LF+8eNHOzs7FxaUN5RlmMO7vypj+JJCamurt7R0REUEPGjp0KPZiLc6AlgQUW2XKHnzk4b2e0DU0NE6cOIE+ImzatIlib7kNBy5ZYbZgk6f9v3eDEvB+ARJvh6BLly7oBx6eyNy5c4dBmpMnT0YW/B4/foxt+pF5+vTpzZs3X716NWLECEqUuLi4pKQkepTw8HC0UvH29iavoVukR48e4obmy5cvv4/uBMksX74c/fjjjz/ooXw+/88//6TcqVi8vb1RE4qKikK2KOjs37+/sLDQ1dVVgqtPmcAqT2R/SxMmTHB2dn706JE8uZo+fTqSQJKSklBSFA4cOCBrbpmliTtmQkICXX9PIBBI9k7RYhEppOM/ePBApOF0LIUuXrxY5EvJ+tD79++HhYWJXONqa2sj5UCyW4sVK1agH4cOHRKZYFpa2oULF4qKiuhWo65evfq/JphZQ0WOeRsaGtasWcPhcChbuFiHec2aNa2m0kwZAY4ePSryhiNHjuTk5PTr108Zn8aUCuP+rozpTwIlJSXnzp07e/asyFD87UN6By0tdnNmKHvwkaejve8Teo8ePZA5cYFAMGvWLIpyljwDV2vCbMHGoP2LbEsXL150dnaeN2+eQt8J6NCAxNshmDFjBvrh7+9P+bSWn5+/fv16Bmmqqqr+8ccfyIrM4sWLKW5gGxoa5s+fTxDEvHnzsPEGShSKz4P8/Pw1a9YgBSFxVvvFMXr0aPTjyJEjWFkLzeXz5s0Tqcz2HjF37txRo0YRBHHmzBn6p9MtW7YgpaNVq1aJ8+8nJ6qqqkeOHFFRUREKhfPmzaPv4gYHBx8/flxDQ2Pjxo2KeijaRiPrsFVWVl6/fj0xMRGZpWGcKx0dHX9/f/R77ty5FKvgx44du3btmqxHjJil6ebmZm5ujjTccHTM1q1bJStwtlhECun4FhYWc+bMwQrMiN27dyM/HHZ2duhgLUbOh37//ff0i6dPn0aLcrL06Ovrizp+WFjYX3/9RYny9u1bdPPcuXPxAhoTEhKypglmvkbxpi6Xy6Vv4Xp6eiJns1wuV01NbdKkSUSrjxUnT568fPkyJTQiIuLUqVMaGhr/93//R7xvMO7vypj+WiQsLOzZs2eUizU1NchRs4GBAdYKaZEWuzkzlD34yNPR2sGEvnDhQvRdLDc3F7sxk3/gak3kWbDJ1P5NTEyQOWiyvnpUVFRiYiJ4MwIUiRDoANTV1Q0ZMgTVuIGBwZYtW65duxYVFbV9+3Zzc3MvLy8UZG5u7tvEs2fPpEw5ODgY6UQNGDDg3Llzr169ev78eXh4ODrHMmDAgIqKCnFR+vXrd+7cudzc3KysrD/++ANNkyYmJg8fPiTff/ToUZQrdAJEQ0MD/RsaGkq+DX8LVFVVdXd3nzlz5rBhw1gs1qJFi3788UcUNGLECF9f388//zwjIwMlYm1tjYJ8fHxwmnFxcShUW1sbKX2hf+/fvy8UCs+ePevr6ztz5kxKoV26dElCmkKhEIXiOWzMmDG+vr7+/v7SlHNpaemwYcOQzuTatWuTkpIKCgpiYmKwz8958+Y1NDTg+8W9IH4LCsuXL/f19cVbVQ4ODujm5ORkfM/x48eRY4MePXoEBwdnZmbm5ubeuXPns88+Y7FYbDY7PDycnKbkQm6xQNLS0tA21PDhw58+fZqenj579mxUieSnyJorhEAgQF9kkES3YcOGsLCwoKAgJJyEhISgtSBubEePHm2xjpilee7cObzb5uXlFRoa+uDBg7Nnz/r4+Ojq6qJKF9daWiwiBh2fy+Wi366urih0586dvXv37tSp0/r168PCwg4cOID1Sw0MDOLj4xU12ri7u6OgqVOnXr9+PTc39/Xr148ePVq9ejXykDR8+PDa2lrys8rKytzc3FCv/+qrr2JiYvLz85OSkg4ePIg+tA0fPryqqopeWXhJ/fLlSyEjsI/KY8eO0UPnzp2L61Rk9B07dojscdXV1RIGmdDQUJF96ueff6aPFWw2e926dUlJSfn5+Q8ePPjuu+/YbLaKikpwcLCiOqlIlDG64oGIQX9n1iCZVdCzZ8/wprG5ufnu3btTU1OLiorS0tLCw8PRWUc1NbW//vpL+pYmuZvLU4NKHXzk7GgyTeiM68vf31/C6kLCtHjt2jWREa9duyYUCh8+fOjr60v+1DVp0iRfX9/9+/fLOXCJRPK7b9iwwdfXF9fmwIEDfX19ly9fLqF5kMcTWRdszNo/8t+LlFNyc3MjIiLQR8O7d+/K1GwAQAIg8XYUKisrFy1aRDmxo62tvXnzZrrPtzt37kifcnx8/EcffURJQUND45tvvhE3ZIuMwmaz58yZ8+rVK8rNixYtIkTh5+dHvq22tnbevHlkVT11dfU1a9YIBAI8QeLr4s7PoDTFKeQcOXJEKBRSUsMEBARIzqfIUHd3dynLuba2dtu2bXTn8g4ODiEhIZSbJRwQQm9Bge5EAXHlyhXybQkJCWPGjKHrQ3p4eMTGxkqZB+kLZPfu3RTngU5OTvSVk0y5wvD5/ICAAMrunKWlJZqMkXSKWbRokTR1xCzN69evd+/enZL5YcOGJSUl+fn5iSscKYtI1o5fUFBAuRgYGFhWVjZlyhRKCXt4eKSlpSlwtElMTPzyyy9FblsZGRlt2LChpqaG/qy6urrt27fTLYUaGxtv3LiRIiEjeDwe6kd9+vQRMgWpJrLZ7LKyMnroxYsXUTYOHz4sMro4OwXl5eUSBhm0qUJn8ODB0owVffr0uXXrlmI7KR1ljK7kgYhBf2fQIJlV0J07d6qrq3///XcPDw+R1o/d3NwoEoI0SOjmctagUgcfeTqaTBM64/oSp3+BSk/CtChuug8ICEDfZUSGTp8+XZ6BSxyS312kRWhbW1sJzYMynsi0YGPW/vPz8/v160dJf/v27TK2GgCQBAtOincoSktLo6Oj8/Ly2Gy2jY3N8OHD0RdK+SkqKoqJiSkoKGCxWLa2tq6uri0aa8FR2Gy2paXlsGHDJDg6l5Lc3Nzo6Og3b9506tRpyJAhFBmjHSAQCB4/fpyRkcHlco2NjXs10cp5KC4uRhWHpLgBAwYozwdvSUlJZGRkQUEBh8Pp2bOnq6uruPOHzHJVV1d39+7dnJwcDQ0Ne3v7oUOHIiUueWCQJlrHJycnV1VVGRkZDRw4ECsNKqSIFNLx8/LyHj9+XFBQYGBg0L9//27dukm+n/FDMzMz0c5AbW2tnp6eo6Oji4uLZEfTAoEgNjY2PT29rKxMV1fX0dGxX79+4qJcuXIF7ewFBQV98cUXRDsFjxXl5eUGBgbOzs7YrlU7gEF/V970J5K3b98mJyenp6dXVFSw2WwLC4t+/foxHiqlHwllRXmDj/wdrSNM6NIPXG2LrAs2Wdu/UCh8/PhxampqTU2NmZmZm5ubmZmZcl4F6KCAxAsAAAB0FGpra/v27fvixYvevXvHxsYifWkAABQLdDQAAN4pwHIVAAAA0CGorKz08vJ68eJFp06dzp8/D6twAFAG0NEAAHjXAIkXAAAA6BDU1dWVlJQMGjTo4cOH9vb2bZ0dAGifQEcDAOBdA7SaAQAAgI4Cl8vV0dEBpxcAoFSgowEA8E4BEi8AAAAAAAAAAADQPgGtZgAAAAAAAAAAAKB9AhIvAAAAAAAAAAAA0D4BiRcAAAAAAAAAAABon4DECwAAAAAAAAAAALRPQOIFAAAAAAAAAAAA2icg8QIAAAAAAAAAAADtE7W2zgAAAAAAAAAAvMcIBTzBmzuCymSCX9PWeXnnELJUVTRtVI1HsDQs2jovQAcF/PECAAAAAAAAAEOEDRUNGduI6sy2zsg7jZBQU7Nfomo4pK0zAnREYI+3o7N3797w8HD8r5GR0ZkzZ4h3lbKyssmTJ5OvLF++fOLEiW2Xo47CjBkzCgoK8L9eXl6rV69u0xwB7w3x8fEnT55MTU2tqakxNTW1s7MbNWrU8OHDORxO+x6vgI4DtEwpuXr16tatW8lXTpw4YW5uTrzPCAU8XsYvdHE38OSL0zde4n8N9Tgnt39IdGBYBI+XtY+lpqei26ut8wJ0OEDi7eiUlpZmZ2cTBPHq1SuBQPCOTzx8Ph/ltrKysrS0lCCImTNntnWmOgS5TdTX1+fn5xMEYWdn19Y5At4P/Pz8du3aRRCEmZmZra1tQkJCSUnJ1q1bAwIC/Pz82vd4BXQcoGVKSVVVFSqooqKimppG7d/a2lriPYeff1JYnUG/XlpRl/36beMEWlgtEAjNjDSI9xxuVcMn395Nel7uv8xlwWQHBimwCD4vax+71y8sVS0lZBAAxAKWqzo6GzZsyG7C1NRUsSmnpaXdbeLt28YRXyGYmJig3G7ZskVRaQLScP/+/ezs7MuXL7d1RoD3icDAQCTubt26tbCw8NGjR69fv/7ss886yHgFkKmrq0MlnJqaSrQ75GmZ7axkJHclHx8fVFCjR48m2gWCmlx+4SWRQWs/7/3iwqQXFyaZGKgr9qHPcyruPSm696TobQ2PaEVOXs25H19c8bbh/wLimafCK+Pnn1JktgBACkDiBZTF1q1bPZpIT09v67wAANAG7NixgyAIGxubNWvWoCtsNvuHH34g3j1gvFI2BQUFqITXrVvX1nl5t2hnJdPRupKg8DyLELTyQ7cdfvrRFzc/+uJmxquq1nxujy766McH9s0/mMEvuiFsKFNQpgBAKkCrGQAAAFA8xcXFaMnr5OREvt6lS5eCggJdXd22yxoAAIACEPKq+GUPWURHYbiL6a3fR6Wkl08bbStPOiyCJyh9oGo+TnFZA4AWAIkXAAAAUDxFRUXoh74+dTcATjkCANAOEJQ/YgkbiI7EMGfTYc4KOFTCf3MLJF6gNQGtZgAAAEDx8HjNB8xUVVXbOi8AAACKR8CV4zhrB6f2tbD2XwcQAKBsYI+3wxEXF3fu3LmXL19qaGh06dJl6tSpLdrdraqqunPnTnx8fE5OTm1trZ6eXo8ePUaPHu3o6Ei/uaGhIS4uDuk0oitJSUlkY4zW1taWlpbkKE+fPo2MjHz69GlpaSmbzTY3N3d1dR07dqy6urTGHhoaGi5evBgdHV1QUKCvrz9w4MDJkydLVptk9tCKioqIiIgnT56UlJSoqKh06tTJ2dnZ09NTsrWSpKSkK1euZGZmVldXGxsbu7i4jB071szMTEKU2NjYmzdvpqenV1dX6+npOTo6urq6Dho0SEVFqq9UDx8+pF/s2rWrsbEx/jc3NzcvL8/S0tLa2hpfFAqFjx49IsfS0NCgaKWSefDgwYULF169eqWrqzt48OCpU6dqamrKXxQlJSUZGf8xfeni4sLhcGpra0+dOhUfH19UVKSrq+vo6Pjxxx/TG3BlZeXVq1djYmKKioo0NTWtra09PT2HDBnCYsmgfSZnHp49e3b58uX09PSKigpjY+PevXuPGzeO0vIJgsjLy8vNzaVcpJc5qtBBgwaRX+HVq1evX7+WUMVytiIK1dXVN27ciIqKKiwsZLPZlpaWnp6ew4cPpwu0CQkJdXV1z58/R/8WFxeTG6STk5OGhkZHHq/oyJSmnC2TwXAk55CYlZVVVFSEzLwjs8bk9sBisQYNGkRPWcoehNsb/tfU1LRLly6oVM+cOZOdnc3n8y0sLAYOHPjJJ58oaqxg0DLpKLtkpMlwXFxcQ8O/u5RmZmb29vYMiohBVyJTUVEREhKSnJxcXV1tb2/v7e0tYd6RqeLkaR6SEQoFgopk8vPin5VF3Ml9VVCtoa5i31nHZ5SNraW25ESqqnn3nhQmpJW9zK+urePrabM/sNcbNcSiu60e/eYGniD+WePx1+Ky5jdKflFeW8/HN1iba3Uy/c8U/Hcm93588d+Z3LKKeraaipmRxuA+xqOHWqpzZJsFSsrrMnP/c2bY2dGQw25OJDGtrK7h38PMpobq9p11CIKISSq5FPk6t/CtrhZ7YG9jn49sNNX/nS8EVX+raljIlA0AYI4Q6DCUlpaKHNBXr17N5/ORnqG5uTk5SlFRkY+PD5vNRncaGRnZ2dlhL5qTJk0qLCykPIXstVUk/v7++OajR486ODQbuFdTU7O1tcULLxMTk+DgYHHvEhgYiG4LDAxMTEykzNAo+unTp0XGZfzQPXv2aGs3zl4qKiqWlpY4FovFcnd3v337Nj1KRkYGtkhpaGhoa2uLCpPD4axcubK+vp4eJScnx83NDUXR1dW1tbXFBW5qaurn5ycyFgWRJX/8+HHyPV5eXgRBjBw5knyR7ijC0dERhyYkJKCLvr6+tbW1Pj4+lJutrKySk5NFZkmmojhy5Agl5ezs7OjoaLo2bEBAAOVBu3btMjAwQFuLtra2WAJ0cnKKiYlpsejkz0N2dvaECRNwDdrZ2SEBT1VVdcmSJZWVleSbf/zxR3pNkcuc/A3i/v375Ot0l8i4ihXSisgEBQWZmJigxm9lZYULwdHR8dq1a5SbbW0lHfF69uxZRxuvJMAgTcYtk8FwJBkph8RFixZJKGF1dXVKsjL1IHp78/X1ra+vnz9/PuVB+vr6ChkrGLRMcSi7ZKTPMGbRokXMikimriQUCj/++GN0PTs7+8aNG/SzD35+fuLKTaaKY9w8WoRfnVP3ZCb6K7jt4+3577djzIq5PWsez0B+icyMNPD9dU9m5t74ZPJIa7Zas9BopMextdTGMuQE98651yeT7697MvPV9cmSC3nz10745t83unax0mkeW1RZNp20Tf9xj2RioH5k0xBK4pL/Dm10pTzrxYVJONSm038E+zkT7CseTJ88klognc214k6Ow7EasoNkLXMAYAxIvB2FqqqqAQMGoEFnxIgRly9fzs7OTk5O9vf319XVXbdunch5Gks4Pj4+mZmZ6GJdXV1YWBj6hO/o6MjlcslRqqurA5twdW0eH9euXRtIIj4+njLnGRoahoSENDQ0oIsZGRnYy25QUJBkiXfDhg1GRkaenp6XLl1Cb7RlyxYtrUY/bywWiyLjyfPQffv2oTR37NhRVVWFLhYXFy9btkzc9JyQkICEBHt7e7z4q6ys9Pf3R9+hR48ejTOAQ5H0PnDgwLi4OHSRz+dfvXq1W7du6EHl5eUiy4RSPtu2bWueYzp3RiWfnp6ObygvL0eLXRUVleLiYnydx+Ohm21tbTU1Nffv308uQ7LEO3PmTAMDg6+//nrXrl3ff/999+7dUVC3bt3oS2dZiyI9Pf1IEy4uLijZS5cuaWho9OrVa/369Tt37sSVRVnTL1y4EF1ftmxZaWkpuhgbG4vS0dDQuHr1aoulJ08ekpKSUFeysrK6dOkSn89H3xEOHDiAmqWLi0tJSQm+PzY2NjAw8MMPP0RJLVq0KDAwkNJuV65cKbKNxcTEBAYGLl26lCCIqVOn4ipWVCvCfPnllyjW4sWLCwoK0MVnz56NGjUKNaFDhw6R7w8JCQkMDFy7di2K5erqSh4BysrKOtp4JQEGaTJrmQyGI8lIPyTeu3cvMDBw8+bN6Hrfvn3JJXzw4EFysrL2IKFQeOrUqSNHjvz00094dPL19eVwOHPmzPn11183btxoY2NDF2mYjRXMWqY4lF0y0mdYV1cXPfTevXvMikimrkSWeM+fP8/hcNzc3Pz9/QMCAmbPno3VRo4ePUovNFkrjlnzkAZe6QMkuZXen9q/pxFK332AecRujxcXJsWdHLf5ayddLfaaBb1ESryPwxo/OhMEMXmkddr5iehiZcz0P7cMNTVsVO7obqtXfG8KOUp59LQ9awfuWTtwcB+T5s8W83uhK+jvUehYfPNED6vGsUWPc3Tz0LePZqCLz85PnD62+RPA3nUDpZd4U85MQI/o082ALvEe3Tx0z9qBq+f3QkFzJthPH2trYqD+3Wc99q0ftOlrp54OzV80utroVj2cjmLVP90ga5kDAGNA4u0ofP3112i4+fjjjwUCATkoNjZWU1NTTU1N3Apy6NChPB6PkmBcXBzSjVy1apXIJ/r6+qInJiQkiMsVmvMuX75MD/L29iYIQktLiyyP0SVedXX1KVOmUN4oKioKvY6Ojs7Lly/lf2hDQwP6ijxnzhx6rMWLF9OlES6Xi6QObW3trKwsSpT//e9/KP8//vgj+frOnTvRdbxex6Snp6PtFOlllV69GqcfFRUV+tbW0aNH0YMIgqCIK0Kh8M2bN2pqalOmTKFcxxKFnZ2dg4PD69evcVBNTU3fvn3xCkb+oqCsirp06fLNN9+gRR7i22+/pazpd+/ejW5eunQpJZ2ysrJOnTqhfbOioiKJxcY8D1wuF+nLaWpqpqWlUdL566+/UDpeXl6UFnvq1ClxORcKhVhbsnPnzpSIQqEQCRipqalKakV79+5Fqc2fP58SVFdXN3DgQLTTQtl/pnwfEXbs8UoC8qQpU8tk3AdFwmBIzM7OxnUqLlnGPYjc3uzt7c3Nzck9Ii8vT0tLiyzSMB4rmLVMySi1ZBhnmHERSdOVyK3X3t5+27Zt5KDQ0FAU5OLioqhcydQ8pISXfxZJbl/OaP7gO9HDqjb2P4Lig+AxmuqqaqoscRLvECeT6sfN4ij+exg6VkWlMcpy3x4i5c85E5r12h6HeYmTUZHEG7Hbgx40qSlIS0M17+YnMu304mQpEi9Fhre11O5uq5d749/EKx5Md3I0RKFndro1X0/6WtYyBwDGgOWqDkFeXh76Hq+mprZnzx7KQZf+/fsvXLgQm5khw+FwbG1tv/nmG/pRPRcXlxEjRhAEcfjwYXFqtC1iZmY2ePDgsWPH0oNWrFiBjg6eOHFCQgpoRU55o6FDh86dOxed6Nu6dav8D33x4sWbN2/QBiY91ueff06/uGPHjqysLDQx0893LVu2DO23bNu2jcvl4uvR0dFYuZESxcHBwcPDg5CFqVOnNh6VEQjweghz8uRJ/Ds8PJwSevbsWR6Ph6KLJDs7e+/evWh5gdDQ0Pjqq6/Q77t378pfFBQ0NTV//fVX8gHUTz/91MnJCR8XrKioQJuKGhoaP//8MyW6gYHBqlWr0BnI3377jWBEi3nYuXNnZmYmQRBffPEF3vTGeHt7Dx8+HIk3Fy9eJAd5eXmh889IFZ8c9OTJE7wgzsvLo5yyJgji1KlTjo6OPXv2VEYrqqioQK50ORwOvStxOBx/f/9Gq5t8/jfffEMoiHY8XikpzRZbpkL6oJxDojQw7kFksrKydu3aRe4RlpaWM2bM6NOnj5xjBeOWKT/MSoZxhlthOMWYm5tjNRbEzJkz0Ynf+Pj4yspKxeaqxeYhPcKGxs7yuqgm6OQLpDn826r+lHPE/XoYzZ/swOOLGHM4bBWbTtpLZziqNgm3ZJwdDd0HNJ4ROHouk+lwRZgZqg/qbTx66L/TNGbZZx80ji21/FPXXhJKIOf1211rBqCdaoQ6R2XxtOax4t6TZjP+Ql65Mp4OACIBibdDEBwczOc32jb48MMPrayav8+R+fTTT0VG7NGjR3Z29vTp00WGonm3pKQEraUYcODAgZiYGAmJN1o+EHMDwtPTU6TNldmzZ6MfwcHBlBmdwUPxAvrChQuoJMk4OzsnJCSguRYhFAr379+PfossPTabPWbMGLScJQuf6EE8Hu/y5cv0WEFBQQkJCdI7Mp0yZYpImZbL5V67dm3y5Mmo6G7evFlW9h9f8OHh4RoaGuPHjxeXsqmpKT4QiOnfvz/6QTarw7goKCxYsIAixgwYMCAhIWHWrFno3+DgYLQ2GjVqlKFh87dkMhMnTkQ/Dh8+TDBCch6wnidBENOmTROZwowZM9APvFOB0NLSGjeu0U9DQUEBklcxqEyWLFkisiofPXr06tUryrcJBbYiXKpubm4iO5qHhwcSq+Li4iR3Velpx+OVktJssWUqpA/KMyRKgzw9iIyhoSH92Orvv/8eGRkp51jBuGXKCeOSYZzhVhhOMXPmzKFf7NevH/pB7q0KyVWLzUMGeI2ZCb2UxRc0SqXDXMw6mzeql1OYOU60SbMP7PVeXJg0dXSjTjWd7jaNlqtKyuuyX//HXpT07Fs/KPIodZpGdGtKvNEmYnIJoQRMjTQ8BlLNCvTr0az4jS1gsYRK+TwEACIBibdDgIdykYYfkb2HFk1T8ni8/Pz858+fp/1DVVUVxfGmPHC53KysLJw43teSnDieFykgZUtk0TE5OVnOhzo4OCAVvkePHo0YMYKyh6mqqurk5ES2QpmSkoLsVXI4HGdnZ5GP7t27N/pBnmjxCahp06Zt2bIF7aJgOnfu7OTkJL2h3V69en3wQeOn3Nu3b5eU/DuxRURENDQ0zJw5E038PB7v/PnzOLSsrOzGjRteXl5I/VUkzs7O9AaDt3wrKirkLwpxFSqOGzduUMqQgoODA7J8m5+fz0zmkZyHlJQU1GxYLJa4Zok/CkRGRpLto5IXshSZ9tSpUx988MH333+PChzrPyOQfEJZBCuwFeFSxUcBKaioqODTpDdv3iQUQTser5SUZostUyF9UJ4hURrk7EEYFxcXpKmr8LFCIS2TAYxLhnGGW2E4xeABpMXZRCG5arF5yACr8bvP/fhm29QDe/9rJ59M326GLTYKHl9YUFLzIqfyeU4F+quqaa7EolKqOUkGcKsasvOqcOI5r98qMHE6fbsZ0F/ZwrjZblbF247lwRh4RwDvRB0C7CaEbtMYoa6urqurS55aMA0NDYcOHTp27FhcXFx9fb3I6GTT/7KSkpKyc+fOy5cvYw8NMiUuzqmGlpaWmZkZWiWkpaVR5lRZH6qqqrpr1y70OTwyMtLDw8PW1nby5MlIl4yuQvn06VOcDXF7EciRA8oMvrh48eJDhw6lpKRUV1evW7fuhx9+GDVqlLe396RJk8gqxNIzZcqUTZs2CQSCc+fOLViwAF08efKkhobGuHHjjI2N0Yno8PBwfPjq3LlzklWa0UEp+kXscoa858O4KCi06D0FPyglJUWcShuHw0E1m5KSIq4vSEByHv7++298mzjvO1jNuKamJjs7m6wROn78eA0NDeRgZufOnWgZGh8fn5mZuWHDBgsLi2HDht2/fz8nJ+fJkyd4dXvq1Klu3bpR9PEU2IrwS0nwvIJfKjU1lVAE7Xi8UlKaklumovqgPEOiNMjZg1phrJCnZcoD45JhnOFWGE7lmU3kyRVjR1wiUGvUlHnxslnv2k6MIyJ1joquFlukmNfAExw+mxFyITv+WWk9ybsPmbp60delITWDuyvk2ZWo/IKSGpE3iHuonJiQ9Jkx6pzmYUHQtCXeqLygIq2bOgCQH5B4OwTl5c2HJXR0mk3V09HQ0KBPe4WFhWPGjElMTCQIwsbGxsvLy8rKCjv/OH/+PEUDU1b27t3r5+fH5/NVVVXHjh3r4uKip6eH1vrV1dXYuKIEJPjA1NHRQRIvRWWX2UNnzZqlr6+/fPnytLS0xmMqOTkBTZiZmc2fP3/lypVGRs0aO8itIvpRXl6OTMhIgLz7qq6uHhkZuXr16sOHD/OauNLEkiVLRowYsWrVKqR8KD3Tpk3btGkTkmmRxIvcGI4fP15bW9vd3d3ExKSkpOTatWtcLhf5hzh58qS6ujr2gSES7PGFjMhtQ8ZFQaFFZ6f4QcebYPwgCUjOA86AhF5G1iV+8+YNeb2ura3t5eX1119/ocO6gwcPxlu46OvD1KlT79+/j6oSSbyPHz/OycnBJpGV0YpkeinKZjJj2vF4paQ0pWyZcvZBeYZEaZCzB7XCWMG4ZcoJ45JhnOFWGE7lmU3kyZU8frMpsNiNmtXcyuYvazpaYlfU6uqqBE3iLSqtHb/0dtLzxjqyttAaO8yys5kWW615b/TCvbwHiXIVbODJF9/98oQvEKqqsEYP7eTsaKinw0apV9fyNx+U6tsWMzj/uFwig2xx/Qc1ET6HAUBJgMTbIcA6PPQDV5KZOXMmWj5+/vnn+/fvp+gC5efny7OCvHfvHrJ1ZGBgcOvWLco2LJfLZbaCxOCXxUteOR86fvz4cePG3bt3LzQ09PTp02h9X1RU5O/vf+jQoQsXLiAphfxEKyurCxcuSM4nZT/EwMAgKCho06ZNJ06cOH78eFRUFDrHdasJX1/fw4cPS6/Y3KdPn27dur148QId1jU0NIyIiKivr0d6sKqqqpMnTz548GBDQ0NERMTs2bPLy8uRSrP0p4UlI09RMHvQ5s2bJZxARnTu3Jloi15GDiI3S8TUqVORjbHw8HDUlshbuD4+Pn5+figU2Ysiy8MUFNWKZHop+hsxo+OMV8oeA5XdB6UfElunByl7rGDcMuWEcckwznCbD6fvRa5Y6o1HVVVVmwdSvijzVBKY/X/RSNyd7+2we+1AZM8Zk19SK4/EGxlX5Pe/2MaxRZdzNcjT+R87yQhuVYNSJV4pUWGL1gMHAGUAEm+HwMjICOnLSbDD+fZt87kOTFJS0u3bt5Gful27dins6Ms/YB8qq1evFnmSRxqqq6vFBeGXJW81yPlQFovl3sTevXtv3rx54MCBM2fOoM/J3t7eGRkZyC8iVtPi8XhOTk6yv1ajaaivmsjNzQ0JCdmzZ09ubi7yT+jk5IQ9XkrD1KlTt2zZgg7r+vr6oi1cvFyYOnXqwYMHkRw1e/bsc+fONTQ0iDOOwgD5i0L6B71+/Rr9UOqDJGQA/ZDQy8hBdF2+CRMmqKur19XVnTp1avv27YmJienp6XgLt3PnzkOGDHnw4EFmZmZCQoKzs/OpU6e6dOki7mSmQloRLlVpXkqkdiID2vF41QpptnIflHJIbJ0epOyxglnLlB/GJcM4w20+nIrkXcsVS6tRk9xIn4N0hiuqxB5Pra6hmmhKflF+N7awcbzSYf+6qj9F3JWfXSFpzSbf5/agiLvvDqgAAaB1AMtVHQLsKPXFi0Yb+nQqKiro0x4+2dW/f3/kOoUCYycflPSRWwVmiaMVPJ03b95ghS78+op6KPp2PmbMmNOnT0dFRaETRwUFBdeuXUOh+JhlYWGhBJlcGqysrFavXp2eno638o4cOSJTCjjiyZMnq6qqrly5MnbsWLyFO2LECPRF4OrVq5WVlSdPnmSz2djipfwosCikfBDy4dH64AyUNSHyHmzF2tjY2MaGaqJTV1cX6Rvn5OTExsbSrVKRrVvFxsZmZ2dLPm4tfyvCL5Weni7uHvxSLVoXk5J2PF61Qppt1QclD4mt04OUPVYwa5nyw7hkGGe4zYdTkbxruWJxTAg1gz7dDNC/L17960iJTMXbhrc0iTf+WbOGtksPI011VYV3f5z+UGdThSeuKFR0Gi1rAkDrABJvh2DkyJHoB8WiJubhw4cSzKWIUx6T0nOjuLFVcvpSJi7Obwd+Uysrq65du8r50NTUVG9v74iICHrQ0KFDsfNJbHjG2tq6V69e6N0leBaZOHGihYXFL7/8gq+sX78eu9sho66ujv2LiDNvIw5nZ2cHBweCIK5fvx4cHFxXV0cWk9TU1Ly9vVHJhISEXL9+ffTo0Xp6Cjtdw7goZAXvWiMNXpHcu3fPwsLCzs6upka0GQ95sLa2xj4exeUBm0718vISaSKV/Hni1KlTDg4O5K0MHx8f9CM8PFyCSrMCWxHymdRoj7TpCDGd2tra2NhG3TmCIGQ9ZN4Bx6tWSLN1+qCsQ6I0JayQHqTUsYJZy5QehZcM4wwrZDhVuFjV5oM8HRW9viP+ccMT+Y+bWQqPU95IsEfFFnXkVfKOsVTjlcT0pUxcqQiFBEvHsa1zAXQgQOLtEEyfPh3JMElJSY8ePaLfcODAAfrFLl26oB8JCQn0U0ACgUCyHwuszEb2ITFhwgRnZ2eUB5w+XjGTuXPnjhRvRjx48ECkhVi8sl+8eLHIl5LpoSUlJefOnTt79qzIUCwfkr1xrFixAv04dOiQyFhpaWkXLlwoKioi24i6f/9+WFiYyI1rbW1tdMROVp8f2DFvQ0PDmjVrOBwOZQsX7xyuWbNGsSrN8hSFrHh7e6PKjYqKQqZ06Ozfv7+wsNDV1VXkHqD8LF++HP34448/6KF8Pv/PP/+k3Elh0qRJyI7LgQMHnj9/ThFora2t0cHIFy9eHDhwwM7ODm96kFFgK5o8eTKy0hwXF5eUlES/ITw8HK0svb29yZ+W5KEdj1fi8qzANFunDzIYEkWW8MWLF52dnefNm6eoHqTUsYJZy2wR5ZUM4wzLM5y22JXe5UH+6tWr/2tCSqPlKvouU0fb6mk3frFKflH+OFWEcHvojAgFmS5WzbbEEtPKkDtfMgKBEDs9EomWRvOpjQbev3G9/e4OnHkZ5QGnH/e0ebOXzF0xwnlroqLTk8VuNJYJAK0DSLwdAh0dHWTqhiCIuXPnUkyqHjt27Nq1a/TTVm5ububmjR8vCwsLcXTM1q1bJWsWoX1FgiDy8vLQj8rKyuvXrycmJiKTEjNmzEDX/f39KVsB+fn569evl+bVLCws5syZgxWYEbt370aO++zs7CiHFeV5aFhY2LNnzygXa2pqkDNbAwMD/EGdIAhfX9/Roxudv4eFhSFzRGTevn2LBMu5c+f26NGDEvr999/Tn3769Gm0jmcgkWLBicvl0rdwPT09DQ2bbE5yuWpqapMmTSIUijxFIT2qqqpHjhxRUVERCoXz5s2jf+APDg4+fvy4hobGxo0bCeUwd+7cUaNGEQRx5swZ+vbXli1bkG7wqlWrxB2+1dPT++ijj/D+Hn0Ll1yV6EOGOBTSilRVVf/44w9k42rx4sUUNzn5+flr1qxBxwXFub1hQDserygoI83W7IMyDYkmJibIYjAuYSS6JCYmYnNZ8vcgpY4VzFpmiyivZBhnWJ7htMWu9C4P8iEhIWuakNKxNku/v46e0aZvmjVxPv8h5g33P4Nk8IWsGw8KtDSoesvDXczMjBqV/4tKa3/5o9nrEmbbH0+z8pr9h4uki3WzQPu6uPmcQmV1w82HBUnPyzubNlbotDHNR2S3HXlKcU1UUFLzwz4Rny9bGRXTEW2dBaCDIQQ6BgKBYP78+ajSLSwsNmzYEBYWFhQUhMSbkJAQtFjU0NDwbeLo0aNCofDcuXNYP8rLyys0NPTBgwdnz5718fHR1dUdNmwYChozZoyvr6+/vz/5iWlpaSju8OHDnz59mp6ePnv2bHRwFN1QV1c3ZMgQlIKBgcGWLVuuXbsWFRW1fft2c3NzLy8vFGRubo6y9OzZMy6Xi35jB/Q7d+7s3bt3p06d1q9fHxYWduDAAaz4ZGBgEB8fTykHBg8VCoV4s8Xc3Hz37t2pqalFRUVpaWnh4eHo7KKamtpff/1FeVZZWZmbmxuap7/66quYmJj8/PykpKSDBw8i34nDhw+vqqoiR3F3d0cPmjp16vXr13Nzc1+/fv3o0aPVq1cjnwrDhw+vra1l0ACwP9Vjx47RQ+fOnYtrWWT0HTt2+Pr64s1hBwcHVD7V1dVCofDs2bO+vr4zZ84UWXoMiiIjIwOlYG1tjdL08fFBV+7fvy/hNY8fP472SHv06BEcHJyZmZmbm3vnzp3PPvuMxWKx2ezw8HApS4xZHkpLS1G/UFNTW7t2bVJSUkFBQUxMDHZ3PG/evIaGBgnPPXr0KLrT3t6eHpqdnY1H70ePHolMQeGtKDg4GKnd9uvX79y5c7m5uVlZWX/88Qdav5qYmDx8+JB8//Lly0W2Fl9f34yMjI4zXrX4mszSZNYyGQxHEmA2JCL/vch2Wm5ubkREBPrWdvfuXXl6kLjRafny5QofK5i1zBZRUslIn2Fzc3NFFZHkriSu9YaGhqLoKBR/eaH3VllzJVPzQB+GCIJ4+fKlNBUnFAob8k7Uxs6c+3Gzvoa5scbaz3v/uWXo3nUDJ7g3jpBHNw9Fwq0GR3XOBPs5E+x/3+ha92Tm6V/dsGL+mGGdjm0eeu/IR6d2fDh5pLWuFnuoU/P524+GdJozwX7z1051T2biv5QzE1DcYc6miafG/31u4qxxjVO8+wBzdENlzHTXvs0GzAx0OT9/5XRp34g7hz/63zIXMyONMcOaHbObGWmgLCWfGU9On/53+/AodKeVefMnkskjredMsP9xSd+6JzO3LXOZM8F+vFvzF40uVjro5vLoaXVPZp7a8eGcCfbTxzYL4WZGGrMnOfp+NkeaQRIAFAVIvB0IPp8fEBBA2d+ztLRE6xI07WEWLVqEYl2/fr179+7koMZBdtiwpKQk5CsF4+7uTnni7t27Ka72nJycyBNJZWXlokWLKGfYtLW1N2/eTHemd+fOnYKCAsrFwMDAsrKyKVOmUM50eXh4pKWliSwHWR8qFAqrq6t///13Dw8PkQZg3dzcKCt+TF1d3fbt2+k2RY2NjTdu3EiXOhITE7/88kuRH8KNjIw2bNhQU1PDrPaRWiObzS4rK6OHXrx4ET3l8OHDIqOLO6JZXl4uFAp//PFHkaGo9BgUhYTThkeOHJH8pgkJCWPGjKGf8fPw8IiNjZW+xBjnoba2dtu2bcbGVL8LDg4OISEhLT63rKwMNbOVK1eKvGHAgAHI36y4FJTRiuLj49HmMxk2mz1nzpxXr15RbkYSlEhiYmI6znglzWsySJNxy5R1OJIAsyExPz+/X79+5DvZbPb27dvl7EHiRidbW1tljBXMWqZklFQy0mTYzMwMCcMKLCIJXUlc6/Xz80NxRYZSeqtMuZK+efB4PFS2ffr0EUqNoKGiLuHzmsczdqzoh9SbMZ1MNcN3fFj3ZCaSeDELfboiMfLyvhHdbKmOAIc6mT454fXVzP+ccXXrb0YRQQNW9eew/6On2be7Qcalj/ENbyKnLvTpSjnHq62p9tPSvq9vfUJ56PUDIyVLvIc2Nm8zUBjU27juycyPhjSL0BSK7k6pezJzw6JGB3t0pBwkAUAhsN4Ri21Aq1FXV3f37t2cnBwNDQ17e/uhQ4e26JYTTTDJyclVVVVGRkYDBw7EakstUlJSEhkZWVBQwOFwevbs6erqSp+lSktLo6Oj8/Ly2Gy2jY3N8OHDkalPmcjLy3v8+HFBQYGBgUH//v27desm+X5mD3379m1ycnJ6enpFRQWbzbawsOjXr1+LmloCgSA2NjY9Pb2srExXV9fR0bFfv36SnUlmZmaibZPa2lo9PT1HR0cXFxdF+TttQxgUBTOKi4tjYmIKCgrQGnTAgAGt5jQSIRAIHj9+nJGRweVyjY2NezXRmhlQRisqKipCpcpmsy0tLYcNG4a0MZVHex2vWiHN1umDsg6JQqHw8ePHqampNTU1ZmZmbm5uSOJqwx7EbKxg0DIlo+ySEZdhHR2dt2/fOjo60hXU5SkiabrSuzbIX7lyBSlWBAUFffHFF9JH5L+5y88JQvaiIuOKcvLfanBU7TprD+lroqLSwlsLhUTi87KUF+VVNTwjPc6AXsb4CG6LlJTXRcUXF7yp4aip9OiiP7iPCb2MSyvqYxKL84pq2GoqNhZaQ11MNTjM/d4rBq0ubMefFd4eAEAyIPECAAAAAAB0OMrLy5H69EcffSSTK6n2R21tbd++fV+8eNG7d+/Y2Fh0AER6eC9/F5TcVFru2hFsQ7bjTywOVU8BAJQNWK4CAAAAAABoh0RFRc2dOzcnJ0dcKPrh4eFBdGAqKyu9vLxevHjRqVOn8+fPyyruNh6Pt56nYjYOtpBaQMOS3XUtiLtAmyDiBA4AAAAAAADwvpOenn706NGuXbuKNP29c+dO5Kl7wYIFRAemrq6upKRk0KBBp06dwia1ZILFUlGzmq1i7C58+1wJGWwPsNT0WfouLFZb61QDHRWQeAEAAAAAANotP//8s5OTE9kTe3V19apVq27ebFTEDQgIoBjc6miYmJjcv39fR0cHu4NihoqmNaHJRGAGAEDZgMQLAAAAAADQDtHT02OxWPX19ZMmTerVq1efPn0MDAwKCgru3btXWlqqrq4eEBCwePHits5m26Ovr9/WWQAAQImA5SoAAAAAAID2SW5u7oULF+7fv//3338XFRXV1NTo6+vb2dl5enp+/vnnHXx3FwCADgJIvAAAAAAAAAAAAED7BGw1AwAAAAAAAAAAAO0TkHgBAAAAAAAAAACA9glIvAAAAAAAAAAAAED7BGw1dziEQj5RVygU1LZ1RgAAAAiCUGVxjFhqunKm0miToi4fRjYAAOSHpaLF0rBo61wAAKAwQOLtWAi4CbyXvxMNb9o6IwAAAM0ICZaqsZuq1RyWqhazFASVqbycQ0R9oaKzBgBAB0Wo3olts0BFt2dbZwQAAAUAtpo7EJPHf/im4DmLRVw/MFJRaU5bEVlWUW+oxzm5/UPy9bc1PG+/uwRB9O1uuGNFP0U9Dnivwa0C8+3sD8a7dW4x4q6QtIi7ufhfentrl5RV1E9bEcmguN5XNGzYjt8zEHr5pdG87H0sQkC888z+v6jCN//uQo8Z2mnF3PdmPd3hGiTwPs8aCkFIqKjZL1U1HNI6jwMAQHnAHm9HQVD1PDomtqhUwSp/DxJLikprzYw0KNd5fOG9J0XEuw23quGTb+8mPS/3X+ayYLJDW2en/SMQCrNfvyUIouptQ2lFfeMXkzG20kQsKa9DEXMLqwUCIb29tUv4AobF9b5S+7Ihczen22rpYyxYsCA1OU5Qm8uS5dPttDG2X89yJNqCvMKa3KLq+gZBQUkNQRC2nbSJ94cO1yBFAbPG+zJrIIIvZC3fHudop3d2l7uRHkfWp7MIAS87kKXRWUXTRta4AAC8U4DE2yEQCuobcgLbOhfvHCev5tyPLyYI4v8C4t+dtUtdveBhcglBECYG6j0d9Il2hK4W+8WFSQRBHDyd/tWWx9JH/Glp35+W9iUIwvqjvxT+1eadxcRAnVlxvcdUJvLLHki/o1JVVVlW/JIQ8jJzK3l8aYXeQX1MiDbi9uFRBEEkPS8fOPMy8b7RERskDZg13pdZA/F/vyWUV9Y/TC4JvZj11Uwm37lYwgZezgHOB5sYxAUA4N0BJN4OgaD0PquuoK1z8c7Ro0vzyuAD+3doiVD4puajL24SBDHRw+rUjvavuwsAZHivw1UMBrFYqtLcHBr4HT+rcRbrNuH8y/zGjaBzu9z79TASd/+VqNcLf3yo0PwCHQuYNd4vejroo4+kctVXdaag/ImKQX9F5gwAgNYFJN4OAa/wMot47wm+kBWTVGJlrrVmQS+FJDjcxfTW76NS0sunje5wunkA8G7CqisQlj9hGQ6S5mZBwSXKFSN9dQlK74a6Mqs1AgAZmDXeL079+uHxyzndbHQ9BprLkw6/6BJIvADwXgMSb/tHUJXGqssj3n/uPC7880JW3+4GipJ4CYIY5mw6zNlUUakBACA/vJLbHCkkXkHNS2FNeqvkCAD+BWaN9whdLfZCn67ypyOs+ltYk8vStFJEpgAAaANA4m3/CMqlOvpSXllf39Bo7JStpmIoysBDWnbF/fjiN+V1Jobq7v3NHKxl85+Zkl7+ILGkvLLe3FjDc5CFlTlDNyQAALRvhJVJQl4VS02nhdvKY2VN2bWvyYU9Hjbvlb0oAADeBQTcOFWQeAHgvQUk3vaPoCKhxXuuP8if8l1kbT1fX4cdscdj8H8tu7wqqF7888MbMf85CTxrnN3edVJpHhaX1c3b8OD6g3zyxZledgGr+xu0kZJhSXldZm4V+YqzoyGHrUK5reJtw8V7eXF/l74pr1NhsSxMNJ0cDT0Gmpsaqsv6RGmSys6rKiqrQ0ZcG32BcOsepfzrOZnFIgb2MqannJZdcTUqP+NVZcXbBiN99V5d9b2GWXYy1aTfmZhWVtf0UQNhaqhu37lRqPg7k3v2Vm5O/ls+X2hurDGgl5G3pzUlbmV1w/XogofJJcVltZrqalbmWh4DzV37mrAkqstXVjecu5Ub+7S0oqre3FhziJOJ13BLthq1nBmTnVd15uarrLyq2jqBtYXWRA8rlw8MKTcUldVRYqmzVZwcm28TConHqVT31P17GqmqSHsOAJc/t6pBW1PNppOWk6OhW39zLQ2xJ1Gra/m3HhZEJxYXvallq6l0MtX0GGg+zMVU+ocSBJHxqvINt9FyKcJQl9PN9t+PUIVvanOazrUitDRUe3c1kNz4yyvrgy9kpaZzNTRUeznoz/Sy09b8d4LIzK06eTUn41WVhrrKgF7GU0fbkl9QXJoVbxvCLmenvuBW1/LsOutM8rDq2705GxJgEUJhZQrL0FXybYKKREI6aur4xaW1utpsUyONj4Z0EndbVTXv3pPChLSyl/nVtXV8PW32B/Z6o4ZYdLfVa/ER5DptVK42UP/AXm+4i6k0cQmCiEkquRT5Orfwra4We2BvY5+PbDTVpTrJrJAGKf0YoowGKW5cuvek6ErU6+LSOmsLLa8PLcmjH18gPH395cPkN+WV9dYWWh+PsKZ0fHFpylPOUs4aT56W3n5UkPGqqrqWp6fD7m6rN6iP8cBexiqy9G7pk1LqrCHulWvr+WduvEpIK2vsVlrs7na6E92tbC2pH5KSX5Rfi87PymvMv5G+urOj4ZihnUxbsrSvqFlDXBtgPF4JyuNULRptaAEA8D4CEm87R8irImpfS74n4k7uzNVRDTyBsb76pf0jnP8RBhB5hdUe86/nFlajf4311Xl8AbeqIfRSdk1dy9ZR6xsEE7+6Hf+sDJmRrG8QVLxtIAgi7HL2i5cVVwNH6mi1QSO8fP/15z/EkK+8uDCJsvMTePLF2l0Jb2t4Kiosc2MNHl9Y3GQAg8UiPuxntmFRH7f+ZlI+Tsqkth/9++Dpf7U078cXf+h7Df+rzlGpeDCdnOzL/Ld+/3tyKbJRZV1Xi21kwCksqa2t56uqsD7/pOsWP2dK2U5ZHoms+yDmTLDfv2HQV1seHzmXSb5NX4dNkXj3HX++MTC5vLJeVYXV2VzrbTXvDbeO2E/07W6wd92gQb1FrKgIgjh769XSzY9Lyv8jcHax0glXhGEVvkC4blfCzj+fkS9uPpji7Wkd9P0g/CWFUqQIm07ayPgnap/kQkYU3Z2ir8NuMQ85r99+u625/HW01Iz01V8XVSOLweoclY9HWK9Z0KsXzW7qoTPpP+xNKimvU1FhdTLVbGgQFJXWbj6Y0t1WL2B1/5GDLaQsgR/2JYVfe4n/pVisCb+Ws3x7HP63b3eDx2FeEhp/xquqaSsiUd9EfL8n6eSOD4e7NGpvbjmUsikohS9o7u4HTqVvDEy+tHfEB/Z6ktOcvjKSW/Vvmj8HJX8101EaB92Ct89VJEq8QkGD4G2GlDLEjQf5U5ZHSnh0cVnd11sfX7ib18BrXCIb6XF0ddj5xTVI7WWCe+fA9YMkrNQPnk7/cV9jnbJYRCdTzbo6QWMHaaKbre4XPt2+nuUo7ttQXb3Ad330Xzdf4SuB4S++35cUsduD3ngU3iBlHUOU0SDp49LedYM+Wxd99ta/ZbL5YMr0sbZ//DxEVYWVnVc14es7L3IqcejWQ6nffOr4y3f/Vq7INOUs5xZnjVcF1fM2PIiMa3TLp6vFNtTnFJQ0NyFTQ/XpY+38v3WWUnKTPimlzhoiX/l1cc3U5ZF0m/lkS8hZeVVfbXmMvpIb6nF0tRt7UwNPwGGrfDXT8aelfcWVgwJnDXobOLTRVZ7xSlCdKRTypTSqBwDAuwZIvO0cYXWG5BvCr730XRfNb/JxejXQk+7Y4IufHiJxd4iTyf71g5ClyofJJV9sfEhePYgjJqnRZcKIQeZ7/m9gV5vGT/5RCcULf3yY8aoyNrX0h31J0ix/FY5rH5M9awcSBBEU/iL5RTn9hqBTL/z+F8tiEduWuXzu0xVtdpWU1/3vcOqukLR7T4rO3c6VUuKVPqkZXnZOjoal3Lrv9yYRBNGnm8Giqd1wOqqq/1kyp6SXey25XVRa29lca/+6QR8NsVBRYdXVC4IvZq3Y/iTo1IuHySWX9o8w1v93D3nbMpeqGt6rgrcb9yejK0t+fnTias6n4+2cHY0qqxv+OJvxqqD50wbmy02Pfv+rsRV986nj2s97I433uL9Ll/z8KCGt7KOFN0/vdBvlSpXTTl7N+WxdtFBIaGuqrf2817gPO+toqT3Lqvj1z79Hf3GL/F7M+HFf0qHTGZu+dhr3YWfdppR/OfL03pOis7devSp4e/3ASFTOqEiPnc9E+x7Tx9p+2M9MV/tfaVZNjYVawt7jz//O5G78sq+xgbo02z5Jz8vHLb1dXFpraaa5b92gMUM7qaiw+ALhvdii5dufpGZwT17NsemkvflrJ3IsP//YwPAXjd1qStcNi/ogG0vPcyr8/vfk1sOCCV/d2bdu4DxvqVyezPd2cB9gjlsLBY+B5ui96P48hjmbopXfntC0hLTGT1Ep6eUzVt13H2A+crCFUNho0PjO48I33Drvb+4mnxl/+sbLTUGN8kb/nkZV1byTV3NSM7h5hdXTV0Y+OTFOralZ0jtU8ovGNN36m3kNt1TnqD55WvpnRCaPL9wTlubygeHsCfaS305YldnCDTXZLOLfDRw5yS+uQaPZ5JHW/n7Odk17QfUNgrO3Xn33y5MLd/M8s29G/Tlaj9RyMF9teYxEjs8/6fr94j7mxo11WlJet/PPZ78e+/tFTuXKX+MWTe2mzhG9xF+4Meb2o8IvZ3TvZq1bUl538lrOi5zKvMLqaSsiE8LHSb+1xaBBMhhDlNEg6ePSFxtjohKKl835wMZCOzv/7bHzmWUV9Seu5HQy0Vz3Re9RX9zUUFddt7C3sYF60vOykIvZDTzBrpC0AT2Np49ttib181dOlW8bXhVU/+9wKi7nyCdF333Wo6uNbim3LvRS9tOmZix9OUueNaqqeaO+uJmdVzWgl9HedYPQh2OBQHjrUaHf/2LTX1buCUv7fnEffZ2WHyRTUkqdNehjxd+ZFdNWRHax1lnwiYOxvvrj1DcnruRQ8p/0vNxrya2S8jq7zjoHfxiMZreqal7gyefr9yT+euzvpOdl53Z5oKFDebMGvQ1gmI1XLIInrM1jgWNeAHg/AYm3nSOsK5QQ+ueFrC82PhQIhJ3Nta4FeiKJlExkXBH6TGttoXV+twde8A3uY3Jlv6fTlIvkD6Li6NFF/+xv7hqcZilimLPppb0eTlMu1dbz9594vmpeT7RGbE262eoijbur0fn0tQuPL9y4r3HtNWucnd/sD/B1EwP1X77rV1vHP3BKWns5MiU13MV0uIvpy/y3aO1i11lHnMmNircNU75r/Mquqa56db8n1h5U56gsmOxgaqg+dXlkQlrZvA0Pzv3mgTeXJo9s3LlNel6OVpaR8cXVNbxHoWOxv4353g49vSPID9p/4jkSdxdP60beQunXw+hqkKfTlEsFJTW+66ITTo0nq2e/KqhesumRUNh4JvxKoCfeBLbppP3RkE6z1tzfcewpIQel3LrdoWm3fh+F/dDYdNIe5Wrh813kpci8J09LN+xJ/HVlf1yknUw0fb671yiHlNVRilRVhbXQp2tpRf3y7U+cHQ2lNIpW8bZh6orIYlT+gZ5Yc1VVhTVikPmt30ehkqHECgx/gcTduR932f1/jestRHdbvXO/uY9YcD02tXTp5seO9npDnVq2i+M52MJzcOOOjUgBo3dXA6Q1ShcwuljpdLFqlOjO3c5Fq9hlv8T9srzfoinNC8plcz74YuPDo+czK6sbNgYmn7316kqgJ/6+891nPTzmX3/ytPRZVsWNmPyxwyxFdqjvtsf971uXL2d0R7EW+hCjXC0+XRNFEMTu0LSWJV6JA5eEGx4mlXAr/9WtRcT93fiaLTLEySTEfxjWLeewVaaNse1upzdk9tXnORX+v6du+caZEmX/iedI3PWd1GXvun/r1MRAffPXTkZ6nLW7JB0quRdXpKrCSjw1zsKkWaF01fyewz+7lvyiPP1l5bXo/PFunZXUIJmNIcpokPRxSYOjknhqHJa7Fn7Stf+MS3X1goOn07lVDb27Gpzc/iFWJx73YedpKyIJgvgt5BmWeGc0/Uh6Xo6knXtxRepsVfIw9c2sDz6cey0xrUz6cpY8a/xxNiM7r1FRNmTrMPTFhCAIFRXWKFeLiN0eA2ZcflvDa7kQZU9KqbMGfazw+1/sgk8cti/vhzWrzYw0doemkZ8ydUVkSXmdtqbatUBPrOqso6W2Ym5PFou1dlfCjZgC/99T13/Rm5w9hc8alDZAhvF4Jax5RYDECwDvJwo7UAe8mwgbRGxgIg6cSv/8hxiBQGjfWefO76Po4m6ju8uL2ejHsjk9KPsbnUw1v/hniSyZNQt6YXEXYddZB00hfIGQ/oW4zUl/WYmUEkWWiZRbcApPisyukLSspiXRgk+6kg/LISZ5WCFTolej8i/fF2umOzuvaueq/ljcRXU6bYwtPl9X8bZhw57GVZQGR/XHJX0p0Q10OSt8e6DtrD1haf/ZtPkjtaq6cU029+MuFJ1nFovYtXqAQL7NOR5fuOCTrhS3qyoqrN9W90fiSuDJF/nF/67vvT607NxkKe3mw4KMV/8qQ2KOnc+sqxcsmibtHkLAn8/QknTBJ13pBzUNdDnfzPpXwQ9R8bZh/a7Gc6cctsqmr/6z8Ysubv66UZriC4TfbXtCtC5WZppY3EWsmNsDL75njrMjqzNw2CrffNr87eb2I7FyqaWJJl4+IqZ8ZGNp1ijXJaSVVVa38KVMyBdRTf9BzMi2YkfchK/uUP62HEqRnBiHrWLTSXvpDEf6UWpnR0P3AY2vf/RcpvC/pzhwB2mqPmqdIj1PyerxOa/f7lozAIu7qK8tmd5cbveeNCq1KqlBKmQMUQbZeVW71gwgbyx3s9Wd5NFoMehtDS/kYlbQ94PJp2c/HmGFzCg+eVoqrl2hciZ/lVPnqCz+p79LX84SeJDYqM2kpsqi20XrYqUj/REYxSal8BrX1FD9hSTuIpMcfbsbmBhqUJri4mnd6Cd7v/nU0cSgsRZ2HH1K+Vyu7FlDMtKOV+IXVAAAvOOAxNveETNA7wpJ+3pr47d2Rzu927+PEme8NCqhGP3wGt64k0Nh0gip7BaKjDvezZLyCIRQ2HiwTeQfOkYoEIi9QfDPOUM5waveS/de47OLGCdHw8dhXkjYa82kMEJh424h+j3lI9Hfm6eNad7r2Hv8ubh0DPU4dAtVQd8PvvX7KPQ79FI2muk9B1uINN+NN0bIJ4F5fGHopeYPJTO87OixTI00RgySyzViU8oinGHadNIe1nTulC/4Nw+oFj7/pPnjAn1/XihsvKirxZ7+T6FJpun+5vKfOlp0+Y8e2klfh03WjsaFObyfmcgToW79zdCKPP5Z2cPkxiVvqzF9LLWautno4cyjrRIy2EpQxn+tv5CZMU5EYbp80PyRIjvv3/N1ImERAiGfqmBPRtggWiSe5GG10Kcr5Y+udU/hA3u9FxcmiavN7jaNMmRJeV326/+8L67TD8XUqTpHZcwwSwlCr6mh+ihXqiUt/CmHYlxHgQ1SUWOIMjAz0nDrby6u5bj1N6PrBOEGmZUrul2ZGmnQ3bHKWs6SQfrDPL7wavR/bDQi9q0b9DjMS1e6Q9EKTAqjqBqf97ED5atQ/55Gj8O80Cjx36YoYgRgq6kg03HVtfxT11+28qwhAWnHKyFfeXkAAECpgFZzO0fIpxqqJQjC//fUH/Y1K57tWNFPnE1OHl/44mXjslKDo4qNHJKRxuCHtYWWyAVfz3+2FlMz/iOTJ78oHzjzsoQEU9LL9YacEBl0aKPrnJa0JaWhi7WOsb76G27d49Q3o7+4+cOSvuTP6qoqLGnszSo8KUxqRjk2fOXS4z9mxjD4elR8cQNPIPKUmpOjIf0kFZlbD5utcw/uI9o2VRcrHXWOSl29oKCkJjuvCingJT0vQ5/q0WJIZERnR8NrohZzUsJiEX27iX7xAb2M0Y5NVELxctKnhPneDsj20rHzmT8tdSIfqmyyhlq5eGo3smniFsq/yf4zi0U4/9dCLKZPN4Oiu1NEFmb//25NY1RUWE6OhugQwe1HhRR76UrFyZHaCFkswkCPU9O0T963O/Udjf7Zf6skWbqipkmLRRCExT+yCtlEFkPEtNyV83rSTalF3MmlmJqXAI8vLCmrrXzLExLNn6iqappzW1RaSx4JcZ1S1A3I/LllqIRn9e1uSFcY7mQiWykxaJCKGkOUQd/uBvQyMdRv/uKGrayTwRvC4vZ4+3YTkaYiW2PTIHnyaqO+0qzV99cs6PW5T1fyNrWlmSbaMGzlpBRe4/17GUnTFDlsFScxU1uvrs1Tf1R80YLJzR8iW2HWkIzSxysAANoakHjbOSy2Ln3fE4u7jVpG/rGPw7xEGuTkVtWjXVMTQ3WR57i0NdW0NdUkH08Sd0YXb4mUkRxavCOoqrB+XdXfd100Mn350Rc3bTppfzzCqlHvS0YXMgpMCvMsqwL9MDXUoKiLY2z/2bSvqePnvH4rUqcamU2SwN+ZzQ9KzeBS9JYxHDXVuvpGbbPUDC6SeLENVTMjDXEmoFp8tGT0tNni7ABhgeR5TnPmERYmmhM9rM7eelVaUX/6xstZ4/7dRmg2JSW1WRRpyl9CLLqmH73WnmZyiVZEpGkitN7VVFelVyLWKZWgVYF0Fymo/5MUv2Ur7wQh2Saqoi2mNvAEh89mhFzIjn9Wiozi0kFNXaY6lYyJKD9n6v80KimVVhg0SEWNIcrAWFTLwdKXyHbF/qdBimtXCilnySz06Xb4r4zUDG51Lf/7vUk/BSZ7DraY5GE10b0zWWu9lZNS/Kzxj/ay5ClDS0Nt3wnRG8Xx/xyqT03/d5RrhVlDMgoYrwAAeLcBibedw1ITvUwZ5WqhzlG9eC8vM7fq662P//h5CP2e2lo+ZWVAR1NdVbLEq84WHRfPatW1/4luaaYpznpz2OXs2NTSTqaa4tSARToeZMaMsbb6OuxVv8Yjwell/tvdoWm7Q9NMjTTmTurynW8PI1FavspOClH6zzcCCY5DdLT+3Vd/w63rSohoBuo0T5IUyiqaFQROXs1Bew4SwP4kyqtazp6EFiUNHPHR8UPLK6hfUhZN6Yr8nQSFv8ASb35xzYW7eUOdTKX3BCNN+YuIVSFFrf1zVP7Nf51zKBu6T1FpghikqSKNBaQmhCw2S0Wdwcgmkt7dDHas6CdyexBRVFo7funtpOeN+ibWFlpjh1l2NtNiqzXn9sK9PHS0kkGdSoYjahtNVsetDBqkosYQZSCyTORskAopZ8moc1Ru/T5q3a7EI+cyeHwhjy+8Fp1/LTr/662P3QeYr/DtIcERtPKSUvysIeZTY/NT/pkyyivryc6oREJ2QdQKs4ZixisV2SZrAADeHUDibe9wROhGTh5pfWzz0KoaXr9pl/KLa0IvZY9y7fTpeOrhGe1/5p66erFnV2rqWjjWUismLo5InmXRp1ayWz8yCc/KYlNLTQ3F3qBYvIZbjh1mGRlXdOJKzl83XyEDVMWltb8cefrH2Yy/fnMX54dWqUkhhzroB/1gMIYcxFgdUe2fiD8t7es1vAVbpljRTk31n/0WBR2rlgn8UJx5zIhBFg7WuhmvKmOSSpJflPfp1qh09/tfGXyB8Iupoq2bMi5/EbH+USCXsF2Ag1pNg/SdhcVuQdufJWpkE4d9Zx3Jg8bs/4tG4u58b4fdawdStP3zS2pFSrzS1GkrwKBBttoY0qEw0OXsXTfwxy/7nrqWc/Lqy+jERhMVQiFx53HhnceFcybYH/hhsJRitgKTas0ax7E6m2udDXCXfDPZc1LbzhrSw+K0bEUfAIB3E5B42zksdREmW5AHDiM258jPQ8YuuSUUEl9vfTy4jzFFi0lXm81WU2ngCYpKawUCIX1+raxuaNHjQsEbqp96ROE/10Xqm70jsFiNhlLc+pv9tmbA7UcFh85koE3CkvK6Kd/de3Z+kpaGausnhfWvKsS7hiIHidTXkvJByOKxsYG69OeN8Za1hOxRNvZlpUZ8dPxQ+s45i9XoBXf1zvgm+1Uvdv/fQL5AeOhMurG++icjZXA4gcuzUgrXXPTClKbWGFSZSKGrxQ9S79fA9R/UFWbGJvlF+d3YRqPT+jrsX1f1l3y4XWSdSjjP3AowaJCtMIa0swYpPaaG6kumd18yvXteYXXY5ex9J1/kNTm0//NCVt/uht986tgmSbXOrIFj8XgCmUxUtMKsoRBYmlRbjwAAvC/Ah9t2DkvLXkirZXx81GOg+XefNWoIv63hfbominJ6TVWF1aNLo5HS+gZBuiifLnSfhHTyCqvRliaFlPTmuGir7R1HTZX10ZBOJ34ZfufwR+gQVOGb2hsx+W2SFDaTU1ZRX0bT3UVk5jbXl7G+urUFw0OG+EFZLVnWJYMrtKyiHqt9UsgrkmSGt0WqqnniTIng47si29WcifZIew1Z2b14Ly+/uOazSfaSVfXEFUtpRb00/qgpsUR2JUqtDZBaPx/vjYhcDr6Wr5zbEHXvvbMAAQAASURBVBWd/3gKocPSsBaqMDnXx61qwDZyEPHPStEPlx5GIs8QCileiUTUqQKM/TKGQYNU3hjSXhskAzqba62Y2/PvsxN9RjV/UDsWkdlWSbXOrIGfUlRaW/3Pqah3ZNaQH6GKJkudoWsoAADaHJB42zksFY6KliSTPBu/7ItmqYS0srW7EiihH/ZrHt8j7ohw0PfXzcZdyhYRGff87VzKI94dnmZwpyyPvHhPRLaHOJnM+8e8ZH5JjVKTErfOtjLXwk50HzRpu9G5H998fcywTlKfnRTrVurBfz1IkYmMK7L+6K9uE87j3ZuuNrrI+W1jNuJEO7p8lPyGkI/HKaJTiPzHteaIQSI2CY311dGSsaqaF3YpJ/Bko82qhT4yqDRTyj9GlLIrQRCX77/uNuH8oFlXcB2OHdZcmNFiCrO2nv/kabPo9dGQlnY4/0Ffly1hOShSF/e9gKXdksTLYrG0ezAQd83cT41YcF2kPSpxmpzi9p1wncYkie0gY5fc6jbhPGNRR0kNUnljSHttkC3yw76kz5osFFJQ56jsXjsA/S6QYsqQM6m2nTWszLV6NhlEEAqJR+JdrE3+9p71R3/9euxvfKV1Zg05UdHt2bYZAABAHkDibf+oGLhICGWrqfy5ZShSqd0dmnYl6jU5dM7ELuhHQPAzsp0J5MPw0Gmqa1OR+P+eSnEa8Xcm9/iVRktIGhxVcb4B25CS8rqIO7nn7zTL5BT0/jEvZCmF2UwGSWlqNJ81aOD9u+V++f7rgTMvL/zxIfr329kfoB9Hz2fRk+ULhCEXsyl3MmDSCCtk+jg6sZhi+hhz4FR6UWnt4D7G5M2xhZ80y5AHRbWQpxncmCR5F76/n8mgX3yQWJKa0Wj/U0+bLc4x6aJ/bDJv+yP15sOCkYMbD/fK+nRcqn9eEC3JHIvIfJn/1uWDf33PfOxphSz6xj8rE6kccfr6K/TVYJKHlfRZ0tZUQyeo019WIr8g//HA2STSv/sUvqldtzvxx/1JaPdJqKLB0mm53aoaOCvk6V2smu17J6aV0Y8RCgRCLAlQwHUam1qKbeGS+TuTe/tRYW5htccAJboSZdYglTSGtI8GyYDohOITV3KQ1jEFbU01pFclzhGg/Em9O7PGsjnNcQ+fzRCnhnMpMq+4rHbch/+xDdEKs4acqOiLtqkJAMB7AUi87R8Vg0FiPvs209VGd+eq5i/HC76PIX88dvnAEO2JFZXWjll060FiiUAg5AuEV6Pyxyy+VV3Lb/FLMItFZOVVjV1863HqG6Gw0dflxXt545beRhPzynk9DWW0VNxqnLiSk5ZNXcXW1PEv3G0UXw10OSJ3EeVPysRAHdmrfF30b0VEJxQnPS/Hpj4+m2jvObgxytlbr+gbyP87nJrRpDq73LeHBPu0LaKqwjq00VVFhSUUEgt/fEg/gxd6Kfvk1RwNjur3i/uQr3/zqSOSBK5F5x849Z/lS3ll/bwND8T5rJISLQ3V6w/ygy/8Z91WXFb3xcbmtd3mb5zFOdcd4mSCzDK/KqgmC8Aygcv/1PWXV6OoGukX7+WdufFKg6O6al7P/xTmj42FSRDEV1seU/zcFJTUrNvdqGFhpMcJWNVfpsyMGdq40ygUEmsC4nn/HJ5s4Am+3RbL2NJyKzPp6zvbjzzdeih15ur7jWVlOJSlIsKJNwUVg4H0IxsMGO5ihhyfFJXW/vLHU0rotj+eZuWJVlqm1ClZ2EBVgBqk76QuNv/4fVESDBqk8saQdtAgGbMxMJl+8a+br9CXFJk+78qU1Lsza8yZ0GWUa+NTTlzJOff/7J0HVBTHG8D3gIMDpJcDpIqC2ABFRUXBilhRYyHRYC+Jkfi3JbZEE5UYC7EiGiNGbNhFERVFsKCgIE1AqoBUgaPeAXf3f8eYyWavcLd3R53f8/mOnZ3d2W++Kd+Ubx4Th3pr65u+3PSsOTE9elvx9ky1WqshJVxMEVm8CESHhiJsDQyiM9GYvodbk2g2/npJ8xn0rNde/PfM2/gUrFJ2daLfOz4a+qn6xGCNWfIQzmAoKVI43M8HGC7ytL4TWVBSzjTUpeU9mMG/ehDDsOH2BoqKlKjmdUr4uBiGjR1qdOMPV/H7QEt/im722KEdc8FDOnnwJi1PN08SPo7hzcAA/9XdVJWszTR+XNo38nXJ+OXh4ADAzUv7ug2m6+vQKqsaEt9X7j+bEptcrqRIubDXZZqbaYsvIveohVtfXAjlDbf/ucN5zBCj+LTyxdujK6oaHp4cCxeBV1Q1zPw+8vnbUiVFyjrvPnPczQ11aTkfawOC3//dbAp6T+txbOsQvBueP86lJr6vLK9qAN2dHqbdRjjwPE/qaav8tlboQoDg+x8Wb3/R0MjpbaX5w5K+wwboK1MVM/KqA29lBd3JVlJUOLtr+MxxRH8eCemVE1aEgym7SSO7T3HtrqGm9C6r6vSNTH1tlYXTe6zfzzu7Ymh/fRsL3nzmgY2D4Iw3P+dCsiNieL6Fgu9/YDawDXVpv611XLTtxeRR3SeNNNFUp6ZkMf68lgnUe+H0Hv7bhooYi/EPfu/jGwsO6c28O118T0V4oPypSgrrvO1mTzA30KHlfKy5+jDv2MV0Nod7eqezlwfR//mF0JxlP79sbOI49tbZurz/QDvdxibOk9fFPx1L+FhSr6+tcuOQKzxkq6q28X97XzfPilS/bF4iCMV1ePNgOKme8aF64Ny7wITuTlcb0k+Py+V1dlkN7KjACQNm3cEwTEdTecoo3ozKFxPMbS01dwUk8Sv/+GHGcydaxKdVHDnPO3v5WnhebX0TVUlh3kQLnhPjmdbD7Q1uR+TffJzf0MS51LxGw1CX5j6cd1DK7AkWwfdzhT0TFF7eWvTkT6AmGT/M2EiP1ttKc/3CPo1NnG5DL4FvUVdVKn86W8l2h4K6WCMRO9ZNzkx/B1MLDgAXcYoJh8PNL67jr0NCnhR8sS4SNIbuI4y/mmRl2V295BMz6G7OwxdF/XtpA2e5+GTz5+mgPrqbl/Zz7K1Tz2InpFfuOpmUlFE5qI9u2IkxGv94pBdWBkGGChPvxsV9bCw0Za6QktYhclLItOwqETLZcTwxr6g2M68GZIFTX107Ky1YZQnUK2szDTWaoszlLLrVGL88PLJ5S8WsceZLZ1r3ttJSUMDyi+uvP8o7fD6V1cAZ4WAQenyMOC4DyD1KHq1GdkGNwLoCVggC019Z3fDF/6Ki3pQoKlCWz+715SRLC2P10grmq6RPe04lfyisHeFgcPuIG/+gpGxbjU0H4z5Vsvh1YO3Xdmo0RRF1oGC9MrHoO9hz06ZNLWYfAoFonyCLt0vAqXrblPGbaIu3oqph0LxQsJLql9X2+NmAskrW2r2vg+/nQmWhKims9rL59TsHq4k3RFu8owYZXvMbtXpXzKWwf6MrUxVWzum181t7YWfNy9vi/TskGzRpBIb004sKnFDPYl+6lxt0J/t5fCmco4CMHGi453sHMc/+Jfeo4k/M6Wsi4lIr4BWqksKv39kTFpuxGjhHL6btO/OO4Bush2m3n1YNAIYKnimrIx68EOAiy9xY/X3INBFfkZBeuflQ/MPoQkJtMWqQ4W9rHaG3EgIZH6q/2RUDvOACFBQoM8eaHds65HJY7urdMfib8x7MAPNsAlm9Owa/1A3o241HeT6/vcYvSdBUp25b0X+1l43oczuq6xotJtyorW/asqwfYXZaIoTJv19P7QMbBroKWcj6Nq3ixz/iw18W4S9SlRTmuJv/8q093MwGphzNxl8X+JCSJ19odfu3qxcRU7zkp2jQdYNpCNw1rF9PbZVBF/ARd31nP8qJPtL7Pv8zV3vZ7l8/8HZE/hfrovhDT+1wXjDF6teApF9OCJh62r9+oMDjN8EzeVsQ/5sMwKhBhg8CxoJ9fXejeL3SBVOs/jywlNprMyYezoMdXsa+xSREYB3y6GXRmt9i3+f+x6/YcHuDw5ud/rqRdeRCGn+yRecpTVlxyUzrX1bb43v2wsogyFBh4n0QMHbUIEN5KKREdYicFDIitkSETAZ7hYKDowRWWQL1akg/PS0NZZnLWXSrkfi+8tTVjFtP8vGzrABdTeWVc2w2LekDXBW2CLlHyaPVeJX0SWBdASsEYZ/Q0Mg5din9979SCJuh9LRUvvWyWe/dR5jlL8NWo9eUWx8KBfhcDDnipqWhLKIOFKZXrq6uERERwl6HQCDaOcji7So0ZPyGVUncNcRTVFb/PL6srJJlqKviMtBQ0tMLPhTWvkr6VFHVYKyvOnKQIb571G6prW9KyqjMzKupqm2kKikY6dEce+vCg2fl+iguF4tN+ZSSyahnsQ11aCMHGhgIado5HG5sSnlWfg2jpkFPS6VPDy3gO0TmlFawXiWWFX1icrlcui5tUB89cUSR8aH6zbvyyupGI33a4L56Yu5kExM2h/vibVnux1pmA9vCWH3kQEMxvS4P+fJe4vvKjJBpeAuTHFD+ldUN2hrK9jba0EOMCErLmS8TPxV9qqcqKZgYqA6zNwCLEknT2MSJTijLbHYabGupOcxeguNq25zGJs6NR/nKVIUprmYqfXYpqFlKEDf7MLfihUySweVib9Mrkt5X1tQ36WoqO/XVg1t8xQHmKYVCsTBWH9JfT8QElPwgoZDyqEM6tEJKQ3ZBTUomo6ScyWrgaKhTbSw1HGx1yB1vK+mj2lurweFwX78rz8yrqaxq6KamZGOp6dhbLFHItdUggYLOCCWrb9s2DQgEQkqQxdtV4DZWNKb8gLGFnoyCQHQRUjIZjnPuTnHtfvXAqLZOC+I/KBjNUDKZLVEUblNN47sfscY29uOKQCA6J1R9qt1uipIEg18IBKId0sndSCAgFKqOUs/1XIU2HitFINqcU9d4C6RXkvJZhZAfCroukpq7vJpNqZtSzw2YosQOtxEIBKIFFDWUeq5H5i4C0QlAc7xdCy6rmP3xCqe20x4RgUAQuPUo83ZE1omfxyoo8Ab4GNUNPSf8qatFSw1dSCF9VDFCtiiqKRqMV9BzI50j3IZP7MKrnGqip2UEAoEgBUVBs6+i0QyKslg+OxAIRDtHqp1jiA4HRYWOtqMguhTJV3ecvR7y5YoD7u7uGIb99M03VTUNe347qNL/m7ZOGkJmUJT1lCyWt3UqEAgEAoFAtEeQxYtAIDo/06ZNc3FxKSoqSklJcXZ2Xr4cWUcIBAKBQCAQXQK0jxeBQHRmXFxcpk6dam5unpiYqKio+OOPP4aFhSkpocE+BAKBQCAQiC4B2seLQCAQCAQCgUAgEIjOCZrjRSAQCAQCgUAgEAhE5wRZvAgEAoFAIBAIBAKB6JwgixeBQCAQCAQCgUAgEJ0TZPEiEAgEAoFAIBAIBKJzghyWdi24nCbOpwhOdSLGrm/rtCAQCAQCgUDwoaihoOWgoDucQlFs66QgEIjOAPLV3IXgNlY1Zu7F6rLaOiEIBAKBQCAQoqB0s1OyXkdRVGvrhCAQiA4Psni7ClxOU1P6Dm5dZlsnBIFAtMyhoLTbT/Lhnzqaypf3jcTaB/N/fFb8iQn/dB9uvH5hnzZNEQIhG/wvv7/68EP7LHeyora+ydPnCf7K9/N7Tx7VXbZvqahqmLM+Svq3UDT6KvX8kUKR1xa8ioqKGTNm4K+sW7du6tSp4PfBgwdv3rwJg3R1da9duyanlCAQCLmCVjV3FdiFlzuHucuoaZz5/ZOE9ErftY5LZli3dXIQCLlQVsnK+ViLYVh+cR2HwzXUpWHthoLi+vySuoZGTlEZb3OEhbG6rJ6MSjeibSmvar/lTlZwuFzwjTW1jeVVDRiGzXG3INxzLiR73b43tpaaNw656moqk3gLm9PyW8SBW53MKQ5RNJqGyQc2m52Tk4NhWHV1dXl5OYZhXl5eMLSsrAyE5uXlcTgcOp2OtVfOnj3r4+PTu3fvO3fu6OrqtnVyEIh2B/Jc1SXg1Oezi+9i7Z703KrI1yWRr0tq65uE3XM5LPdpXGlVbeOPfnGtmzoEovXY+e2A9yHT3odM09dWaeVXsxo4oBimZDIE3vD49Lj3IdNuH3aT+atR6Ua0LZuX9murctdqaKhRwTfuXG0v7J4f/4ivrG54mVh2/k42ubfoa6u0+BYxaSq8xm2owOSDvr5+TjO7d+/mD921axcINTAwwNo3GzdurKysjI6O/vvvv9s6LQhEewRZvF0CTvEtCsbB2j17T6eMXx4+fnl4Zl6NsHvsemiBH72tPv9AIBAypPhTPSiG248ltPKrUelGINoDfazbUUmkcBvYJXfaOhXtnb59+4IfdnZ2bZ0WBKI9glY1d364TTXsipcUrJPg4mjw6M9xSRmVcyaQWSKFQCDaLah0IxDtgSsHRl4Mze1lruE2uF2s42WXPVE0mUNRILO+uotw48aN8+fP9+rVa8yYMW2dFgSiPYIs3s4Pp/IVhduIdSJGOBiMcGjvS4wQCAQJUOlGINocDTXqslk9sXYDhVPLZcRRdIa2dULaLxoaGitWrGjrVCAQ7Re0qrnzw2GgHXEIBAKBQCA6Kpyqt22dBAQC0YFBc7ydHC6Xw6lKxC9prmOyH70sev62tKT5fBFdbZXeVpoujgY2FprCHoKPQlVSMDZQdRtMH+FooKhAXCtdVsnKyv/PFlwHWx1lqkJVbeOF0Jzk94w6ZpNl927T3EwH2GjDexqbOHGpPL8UpRUscCXxfSWzgQ1vMKOrGRuoCns4f4Kr6xpvPsqPTSmvqmmg66kOs9f3cDGhKimUljOzm71HQjTVqVW1/06A62go97LQgH8Wf2LmFv57vxpNsV9PbWlExGxgJ6RX4q/066mtRlOEf75OKWdz/j0wrJe5hg6fn8yq2sY7kQVv3pV/qmQpUChG+qr2tjpug+kGOuK6WnmbVsFq/Hdft4GOilX3bhiGRb4uuffsY2k5y8xIzWOkyeC+evAeNod79cGHl4mfKqsbzIzUpo82c+ytI+IVie8r7z8vzC6oqWM26WqpONjquA83NhDk+LQVEpOWUxX2rDAzr7qqtlFXS6VvTy2PESbGBqqE24QpGLOBfe1hXnxaRWk5U0ONamOpMdXVlMvllvyjrhAVqoK97eeUcLlYTPInwg2D+ujylxqJyCmouRael11Qw2RxzIzUprqZiv52iSSQU1BTUsECHph553YwWK+S/v0ECgXD5wI/0Qlld6M+5hfXaqhRB/fTmzXeXFXlX90WjYjSTa5WEQfwvfBPqpICEGaLQhamtO+yGDce5ecW1rLZXLoezamvrucYM9LVqYiIYlbd1XWND54XvUwsK61gqqoomdLV3AbTnQfoU0S+6nVK+eNXRZl5vMKr2Y1qY6E5pL/e4L56CoJSKH11BKmpa4p8XRyfVvGhsI7JYmuqU3tbaY4bZiTsA4XlgkR6GJdacTsiP6+ojqaiYNW926xx5hYm0voel3eLKSnCGkSJpCrbTIeNPgG7HpoaalTpLd6UlJSoqKiUlJTy8nIqlUqn052dnSdOnKiiIkeHZKmpqaGhoRkZGVVVVXp6ev369Zs0aZKJiQnhtpcvX/LH7dmzp57ev7Vrfn5+QUGBiYmJmdm/FQiXy3316hU+Fo1Gs7e3j4+PZ7H+rccMDAx69OgBfpeVlWVm/ueQDkdHR2Vl5aqqqqCgoMTExLq6OisrK09PT3t7UQ7G3rx5c/PmzQ8fPtBotB49esyePdvS0hJcb2z8twdlaGhoZWUlhqgQiDYAncfbyeHUf2h69wP88+TVjJ+PJZRVsigUzNhAlcXifGJ8rih7WWgsn9Xruy9tCZ2hU9cyfjrKi6KgQDE2UG1s5JSU8/pbNhaafpsGjR1qhL/575DspT9F46+8D5mWmVczd0MUo+Y/K6tXe9nuXz8Q/C4pZ5qNvy7iK3Z9Z79+YR+BDzfnOxnlxqO8b3fFlFX+xxrpYdoteP/IF2/LVu+OwV+f6mZ6O+LfU0+nuple2f/v6YtHLqSt2/cG/jnARjvmggd/8sQXUXpuVf+Z//HAEXPBA9+VMXS9ghfUlf0jp7qZ4u/3v/x+86H42vomBQUKXY/WxOaWNr+LQsFGDjTctqL/qEGGWEv0mnLrA86SXzDF6uiWIV9veX7jUR7+trkTLf76ZZiiAiWnoGbKdxHvc6vxoWu+sv39f59zEE92Qc3q3TEPo4vAaZYa6tTC0vrGJo4yVWG1l+3ObwcQelpyTcyHwlqf317fjSoA6/R0tZWLy5jMBraiAmXpzJ67fRy6qf076idQwT6W1s9eFwUyFLJ//cDU7KqTVzMIrzM3Vn8f8vkUDVYDR3PYJcINJU++0OomuD8nDLPx10vKmYa6tJwwzy2H4g/+nUq4wXOM2YntQ7Q1BO9wk0gCq3fH8H8UREVZoerFXPhnQnrlYK9QmGXeW59fD/9PlnWnq90+7Nb3Hxc4ohFRusnVKuJA+F7xhcyvtMe3DVm9O+bMzSx8LK1u1JInX5CuTvGQqLqPXUzf4Z9YWd2gqEDpTlerrWsCUQbYaB/dMmRIPwGDF3lFdYu2vYh6UwK0RUdLuaisvqHZ/jHQUZk70dL3ewd8+ZVJdQTGOr/bExPypKCxifcuXU1ljW68egO8eoprd/+tQ/jHywRWHeLrYUVVw8pfXhHqGQzD1i/s88u3Ayzcb4Byl/fgP4e1tkgrtJgSIU6DeGTzYLiGmV+qp3Y44+NKmuknr2bwv0VYo/8gYKwInaH296dQhY7vAM6ePbtz505g5ikpKXXv3r2+vr6khKfS+vr6fn5+X331lcCIJ06cWLlyJe8D/f35lwcbGRkVFxfT6fSiIl7TRiA3N3f16tUhISFgdbGenl5RURGTyVRUVFy+fPnevXu7dft31IAiaMDp4sWLc+f+W7tOmjQpNDR07NixDx8+hBdZLBaN9p9SYGtrm5qaamlpmZubCy96e3ufOXMG/A4MDFy4cCE+Sk5OTkZGxqxZsxiM/7ji9/Hx8fPz409YRUXF0qVL+U8h3rRp0+7du01MTIqLi+HFFStW+Pv78z8EgWgPoDneTg6X+ZG/e7d0Zs/tK/vT9XhVZ1kl6+DfqQfOvnufW73hwJsVs3upKP/bofHxjfUPfo9h2PIvem5b0R8cTpieW+Xz2+tHL4umrI44tmXwIs9/j8107q9/ZPNgXuMR/D7xPW8yM/F95byNT0cNMvRwMVFRVnydUv737awmNvfIhTTH3jrzp/CGAzXUqSDW37ezXyaW8SrTxX3NjNTgY0HnjP/h/FwOy/16y3MuF1NXVdq8tO+kkd27qSmlZlcd+PvdhOWPVszuBW6bO9Fi5EBes2pKV3MfblzOYG0/KsAtrdtgOngjwU7GI5GIDHVphC8l8Pu6gQ2NnDuRBaFP/804yIkr731+i6VQsL1rHZfO6qmuyiu/ZZWs304nHwpKi3xdcvNxvjhdzL1rHWvqm/KKanccTwRXlu+IfhZfunZBb3Mj9ZzC2rO3siqqGi7dyzXWV92yvN+45eE0FcUty/rpaaskpFcE3clpbOIcCkpz6qM3d+J/PAwlpFd6rHpUVsmy7N7t5E9DQWJq6pr8L6dvPfL2wNl3CekVNw+5KSlSWiExSRmVHqsel5Qzu9PVjm8ZMn6YkYIChdXAOXcne/2+1yeuvH+ZWHb3+Gg9rc+j/iMcDEDf7sj5tPg03vzDu6yqOeujeph1WzLTWk9LJSb506V7nzsW8zws7W11zt7KArOgQKM01P+1ZpWUKCCvj15Mf5fF2PHNAD1tFfHnPPn5+VjCqauZv35nP2lkd41mrf79TErk65Ibj/LyimofBIwF+iCNBMBHweLQv5c2LDIYhinico3Ash3Rj18VfzPPppeZRlkl6/L93Pe51QXFdXPWR8UHTxI2m4RHROkmV6uIA/he3lksfvHVdY3iC5lfaVf98upSWO5Xky0dbHWr6xr/upGZV1RHeJ2k1ak0Vfc3v7768zqv07/mK9vNS/uBpSJv3pWv+uVVfFrF+GXhVw+OGuf8H+urpq5p3PLwnIIap766R7cMcWiWDIfDffSq2Oe32IwP1UcupG1f2V+rm4JsqyMMwwpL64GZOmOsma+Pg2XzpGJDI+fGo7z//f465EnBmJzwZ39P0MSVLwzDflltX13bmFdU99vpZHBl2Y7oqNcl//varqe5RjmDdf5uTkomQ6Ae1tY3Tf728esU3vmrrk709d52va00q+uaQqMKfP9MwVdQEtE6Lab4iNkgipYqHlllOmj0yxmsXwOSmtjcTYv7dDfktfg2uDVW/HCZeRTqZ4/Ewrh27VpmZqaOjs6RI0fmzJmjpMRLYVZW1tatWy9cuDB//vza2trly5djsiMxMXH8+PHFxcWmpqYBAQHu7u4KCgosFuvs2bPff//98ePHo6OjHzx4AKdw/f39q6qqNm7cyBuO6d5927ZtGIY5OTnBBzIYDGDoPn78uKysTF9fH1xXUlIC9uSePXtKSkoOHDigo8MrpLt3766urv7w4QP/AUvDhg0DUY4dO5aQwKvVExISvvjiCzc3t0mTJtFotJiYmMDAwKampj/++GPgwIFff/01Pnptbe2ECRNiY2MxDBs9evTGjRvt7Oyqq6vv3Lmza9cuIFtg5P/+++88F999+shQsAiEbEFzvJ0cdtFN9kfeRNPxS+nf733NG/+b1iPgJ6L7h/2B7zYfiuetVnoxF3ab/IPf+/jyarqF03uc2P6fKA2NnNFLHsQmlysqUB6eGjvcnuhp5ot1UWDu1LJ7N58vbb+ZZwODrjz48NUPz8DyrZfnJ+JjLf0p+u+QbP6ZT2EPJ8zx5hXVOcy+U1PXRFVSePTnOPwkBpeLffnD0zuRBawGDmGwGcyD9Zpyi3+OF6Iy6ILAOV7SIhL9pb8GJP1yIpEwx9vE5pqPv/6JwfpqsuXpncMIUb7bExNwJUOieQA4R2fZvRtNmScxaPm8z60eNO8uq4Gjrqo0x92iqKz+8r6RcAH5zcf5c9ZHgTW6z/92hw+sqm0c7HUvp6BGXVUp7vIkwuJAqGPbVvTfurxfKyRmiNe97IIaVRXFmAse+MXqGIbdisifvY4Xy32E8c0/3Ahj7lDBrLp3mzTSZN+6gXA95/r9bw6fT9u/fuBqL1sMw0KeFMz6XySGYWOHGt09NppfyOVVDZbu1+2stAiqLukcr5IiBWj1QDtdGMThcGf9LwrM3347z+bAhkH4iKQl0GJxIGSZhYm6ogLl8Z/jjPQ/L5NmNrBdvr4PevDXDo6aPKq7+N8rrHSTrlXkJ2S80tbVN90/MQaerlRYWt/H8zZVSQHO8ZKuK0hU3TDKyjm9/tj0b08aw7DK6gb7L+4WldXra6vEX5mMX4Z6+Hza+v28JS1pt6YCmxOSlV/jNC+0tr4JLlKQbXUEJDnMXj/81DjC0t/4tIph88M4HO46b7vdaxxE66EKVfHRn+PgR7EaOCMX3n/bPHpF0MO1v78+djEdKHnwvpF4/X/zrnzMkoeNTZwmNleiOd7WbzFFQ7pBJKzggHO85DJd4BwvhmEfS+onffs4M6/63J4R00f/ZymTMBTNFisajBN9j6en582bN0NDQydOJMpqxowZN27cUFNTy83NhWaklHO8VVVVjo6OWVlZqqqq8fHxNjY2BP/JM2bw9MfDw+POnTv42d1+/folJycrKCgUFhYaGv5njODs2bPe3t7g96lTp5YsWYIPLS8vp9Ppnp6ewcHB+Otv3751cHAgzPESxMJr1Kys1q5d+91338Ggy5cvg+llR0fHN2/+XdTGGy9bs+bw4cMYhk2fPv369ev49L9+/XrkyJGNjY1NTU3Cpr4RiHYF8lzVyeE28hauVNU2bjvCG95Tpirs+k7Abo3VXraExZZVtY1bD/G2zShTFX7lO0G++Tm8upXN4f6vuWslDBN9VXzjzWvax5ubGPJ6xvFpFWBeRVbs/Su5pq4JdDgIa/YoFOzQJieOTM8klpWIxCTjQzVYlNjTXMAouMCpITHJKag59IMTtDDBOslpzZZ2bX1T0J3sE9uH4vdLTx9tam3GS8PrlHJ8Dvr9nZpTwNuTtnJOL/69cGu+stXX5r1if2AKYcGePBJzKCgtuzkxS2b2JBh7GIZNczMFDoHDnhWGPuUZMwJRpSn+jjN3MQzz8rAcYKOtr/N5aZnHSJPudN7URPjLosy8/yy0Bpy9lcVq4KyYI2AuRSKa2NwlM3viLTFe9a1A+WPTIGAh+F9+X1j6ef+tDCUgDrkfaw/94ATNXd7uMmXFVXM/l/rI17z1hLJFTrUKCSEDcgpqDm4cBM1dDOMtPJ7jbgG3/ZOuK8hV3SAKTVnx51UDCPdrayiv9+Yd11lWyTpyIQ0f9OItb9WJkiKFf6tID9NuhIk72VZHylQFc2P1b+fZ8u90dbDVcXXivTrwZpbo8Xmgh3gbXkVZYeU/RQ+vhx9L6k9c5s3EKilS/tg4iDDgNdBOd/EM6ya2ZJMB7bDFlHmDKMNMz/hQPWrR/Q+FtbcPu4lp7vJgE9dN8GNoaDh06FB+c5c3Xrl+PW+XdV3dpUvE/SakOXjwYFYWby/D8uXLCeYusDNdXFwwDAsNDb1z5z8bmmbPnt08oMa5fp24uvvy5cvwN8GsBVZ0U1MTiE4CExMTvLmLYdicOXO6d+cNBsXFxVVX/9uKFRQUHDt2DMwtHzlyhLAYe9CgQcuWLWtq4ikYAtEhQBZvZ6eJV3+dv5sDWsqRAw0Feg9SUVZwH2GC7znBKC5CoowaZAj6FnGpFQIX6ALmTRJwrqZj7899ypyC//iRkoYmNvf83ZzPL/Xg+VQgYKBLGz1ElkcLykpEYgL7gncjP+K9WwHsbXViLniAvqykGOrSRg2iC8ujUYMMwSrK/4Z+duSTnf85B7lcLODK+89tuaDDVKlKCuOHGQO3LlcefJB3YsDaQtBfFPiiOe6fE3m0eapHIIumWxO64IP66MZc8Jj3z/Lp5t2wn/t5AVeIO2CbZZKhoUad+8+7pGGeh4CHmBurj3DkGa5szr/6L0MJiIOBjso4Z17O4oF2I8Exj0yQX60ikZAhOprK/B6qTmwf+ujPcVLWFdJU3WOGGvH7vcMwDE51EnYdg1XrTWxu2PNC/ljHtgyJueCh8c+ub9lWR72tNN+HTJs9QbCi2pjztm6WVbJyPorSJQNdGv/hsQL18PzdbJDmEY6GYMSKgNckAS2IaNpbiymPBlFWmR6fVuG2+EFtXdP9E2Nlft5vQEBAdPR/tkZDoEUq7AZJ4XK5wCYEdqPAe+bNmwd+gMlSyBdffCHQpmUwGPfv358xYwaY+A0PD6+o+I+Lr+DgYBqNNnnyZHJpFriNeeDAz9Py2dm8pWeAc+fOsdk8B6IjR440NRUwKiFsRzQC0T5BFm9nh8LbN/jo5ecFJ4TpCzx/7x5e8uQLuC4ORhkkJIqCAgW6pX386l/XBQTsbQQ4kjX6x2jB+0mWkoT0CjCeDcwSgfeAnWmyQlYiEpMeZt3AzGdM8qcJy8MJU2eKCpQBNtr83nfFYYCNNr8rDR2tz31l+Al44BwsnHNIzqwErraVqQr2Qlak9+35eRLsWVyJ3BPzjzMVRzvBmQ6vP4srBf5y+BnUV2h5gSz2/GwVg+lcfFCzw9vqryZb8u+wlRQKBRvQS/CHOP3jP/lZfCm8KCsJiMMAGx3+LDPWl30Zl3etIqmQ/02PrY7onZ+k6wppqu6h/QU71u5h2g3cXFRWDxZlEO7/ctPT304nQ89YABND1QE22nC9g/yqoyY2t6is/n1udXpuFfhXU/85QwkO5AgM6CWg6hCoFU/jPmfiYEHuu5ofJUClRdPeWkx5NIgyyfTI1yXjloZjFMqjP8c5iVHBSgODwcjOzk77h5ycz0MAwJGV9CQlJYFHUSgUaDQSGDTo8z6IqKgovFvjvn379u7dG27Whddv377d2Njo5eU1c+ZMXnFoarp1i7fHBFBRUfHw4UMPDw91dZIexcHKZwJGRp+39FdVVcGLUVFRnx2pDBki8FH29vYCvXAhEO0T5Lmqs6PEW32Umv25FhP/3AVxolj8s/gtJes/Tv/wgIWsBFT+8d/DlnDlmAig815DXZow/0DAj4iskJWIxERRgXJg4yDvLc9Bj2388nBzY/Xpo015y1PFONpEBHqC8gh6eRGYg9R/1hXDHHyX9VkaajSlY5cEzxnGvfs8Vp2cwZBrYmDWGOjQaMqKorOmnsXO/VgrcJ2e4T+rl0VgpK861c30xqO88qqGqw8/fImbHfrsw0aQexhJ0VSn4v0S4YFnh6Tn/ttZkZUExEFf0JEkKv+8lMM3FyQ9YtYqFVUNvwYk8d/Zv5f2wumfT++QRsjiVyyk6woSVTcsicmZDMK6ZYiykiIYnUnOZMAtu8tm9Tp9PTM5k1HHZG8/mrDTP3HMUKNpbqZTXbvjl6zLqTpqbOKcvpEZFJITl1oOXDTzQxhRIq2H7z98biwshUhVRVlBQ+0/B9e1txbz0r1c/MlhkPXedsDmlEeDKH2mhzwp+PKHp6wGDpvDEeEJTzhiRUlKSjp48GBoaGhhoYDVCsDpMSYL3r17B34YGhoSvChDLCw+T9rX19fn5OT06vVvc/DFF1/8+uuvHA7n5s2bcLPu5cuXaTTapEmT9PT0gNOp4OBguK335s2b0ixpBg6r+S/CxINJXUB6+ud2XNiBQyoqKhoaGngjGYFozyCLt5NDofIGccurGsCf+JNIRCNOlG7/eM789N+TD/AIPC9XQQ7jgpU1LScY9n5kgqxEJD7zJlpodaNuPBAHut0fCmsPn087fD7NQJe2cFqP/3nb6QpaxNgiyiJd6QrMQX7Kqz5/YGV1A/5IJ4EQjsqQfWIYYmQN7tTHTwxWT0yAvSfM/iGw4oue4IyTE8HvocVbWFof8qRguL2BmMfziEZZuOrCb6z8RyFlKAGx0iYoywSe3SorxKxVqmsbBZp8U91MBVq8kgoZotKSWpKuK0hU3RX/lMTLYbmXw/49s6TFkqjS7DFuy6G3Z25mNrG5TWzu/eeF958XfrcnBngzBrsS5FEdlZQzJ3/7GJxVbmakNnGESXdDNarS5wwNiSwAe4xlpYeMajEaCxVFTBKLt5VbzAcvCoHvQwLe03oAi1dODaI0mX7lwYfI1yVa3aishoY6Jnv+j8+fBk4Qs0r/TEtHE/H2aBw96uPjw2azFRUVJ06c6OjoqKmpCaYi6+rqdu7cicmO8vLyz0LGHT5EQEPj33r106dPeIt3zpw5v/76K7BpgcVbXV0dFhY2efJkdXV1V1dXfX39srKy+/fvMxgMLS1eO3L58mUVFZUpU6aQTrOysoAMUlAQkAuVlZUtfh2NRkMWL6KjgCzeTg5FhbdJBq64E39OVZwoMEic00fkjZLiPxN9cphTamURiZgW83AxmTjCJOpNyaV7udfD88DKw9Jy5u9nUv66kXn9D1eBx2y2AvADu9PVbvi5ir6Z1Oi+BCj901cWoQz4ICkVePQQI2szjcy86uiEssT3lf178RZ1/3k9k83hLp/9Hw+o8gB+iBLuK1pZAu0TZaqCQJfvwmb2JBVyK9QVZKruf6Lv/HaAh0sLXrKBSySItoby0S2Df/5mwJX7uZfDPjx/y1v9y+ViETHFETHFC6ZYBfw0FG9Dyqo6mv/jc2DuLva0Prx5MGGJeGEZUxyLV3wUYWMhu0VGrdximhmpC9RtOJ0rvwaRdKZHxBS7DaZf3OsyZfXj2OTyt2kVWw7HCzxHXRgUWgv6HBkZuXr1ap4ma2s/evTI0dERH8pgMGRr8cLjefBTowTwQVTqf5zM9e/fv1evXu/fvwebdXV0dG7fvt3Q0AC2BCsqKs6YMePkyZONjY23b9+eP39+ZWUlWNKMt6Llhzhfh0B0IJDF28mhqPFW1OhrqwAXo9ViD1rDKFXC3erCIIELsVoZOLQsIsF1zBb8CgrsrNSz2PITkcDuiLA3AigUnhOUUYMM//jB6fGrolPXMsEEY1kl64v/RabemqZGk+VUtpjAD2xq4og4WaqVEyNO1kivwBQK7/jNTQfjmv1XvT/842A2h3vqWoaelsrMsYKd8UhKvXDVhR+Cn11pZQm0T4z0VQnHiclWyOJDuq6QpurW01YhVxINdFRWzbVZNdemoLjuQmjOscvvC4p5PnL/DskeYKOz5iveuVwyrI4S31c+ieXta9XqRj2wcRDps3DFR1dLuaisheyoq5fMCW0rt5g/rer/06r+8m4QhUEu0yeOMLm8b6SKssK5PSMGz7tXXdd4KCht3FBj9xFEv3cC4XIxCq0Fr84HDx4EPzZt2kQwd+UBXCHMYAhdpo4P4l9RPHv27N27d4PNut7e3mAKF3qlmj179smTJ8Ek8Pz582/evNnY2CjMRZbM0dXVBcvCRXxdba3MnI8iEPKmE47rI/BQlPUxJW3o9SQjT1y/qbgoAs5cAWTlVxPcurQhYGINbN6DC8wIFJQIPtsADocL7AF8FBJLGhHBeRiJ3siXbMr4YcaXfneJOD0e7NUs/sR8GC1455K8gdIoKWfWMdt4SBgmpqKqoUKIMsCs0dNSMTMi6QUEsmCqFVieB1y23oksKCyt/3qalZjrolukpq5J2K5CuLMUFoE2kUAnQFIhiw/pukKaqjtbak/43elq6xf2eXdj6qxxnwduzt7+j3tnmVRHcamfl4Y62ukK3HHKFX0qkeTATHwvJDuqahtrJbR421uLKU2DKD4SZfoU1+6gPrTq3u3IlsHg4pKfXhR/EuWQDEKhmVIUW9h4DI+TBWcCyVuRoFeqimYE3pOZmQl+6OnpmZsTB0DhjtzLly/X1NTcu3dv4sSJcAp39OjRuro8vQoLC6uurr58+TKVSp06dSrWKgwY8Plss/fvP7v9J1BVVYUsXkQHAlm8nR8FzQETR5iA39EJAhyNAiauetRryi3YoYFRngvyTYphGLOB/Trlc09l/LDPjv5kBYmWqae5Bjxn4ukbwZ4YXyUKcPXBm1vQoIroAQhbUCeNiOBpImDyhEC0oHSmZDK+WBd1J1LA0anD7PUXzfh8Rk5h89xF62NKV+vTvGGVy8VeCT97Y8b3kWbjrx84+07eiYGHo75oXpnJD/TX6j7CWPp95XpaKsAqqKlrunA317/5tM9ls2S5pDlGkKMankfNfzymjh5iJFsJyLyD2P6RSMjiQ7quIFF1e7h8jvJCyLt4n/OmxGz89V5TbuGXk/x0LOHrZqdEBFSUFQ5vdgK/wdSobKsj6I9K2FpfEbOU5Bj9z4k4MFvFVAMRtG2LKdsGURgyzPR5Ey0WTOH5QyqtYC3a9kKcmkZBi3i4tAiXVIT1wwARc5XkMDMz69OnD/j97NkzgfdAj8ceHh78no0dHBysrXlye/Dgwblz51gsFt4rlZKSkqenJ/iuoKCgBw8eTJgwQVOz5c3MMmHs2LHgx5MnTwTe8PLly9ZJCQIhE5DF2/lR0HKcPsYUOJCMTS6HLiXxvMtiPH5VnF9c5+b0uSsAo8SlViS+/+zAAM/VB3mgtzTNzdTaTDa7StRon5fZNzb92wB6+jwZ7BUak9xy27xs5mcD4+TVDIGtdXSCYEtMXVUJ7GfL+FANjtj5z7mmzdYLP9KIqLeVprDDTsKeFeKPDIGUVbJuR+TfisgXmBjNf3yimPB5VW011i7gnbWAYdjpG59HtQmk51bdjSoorWBOGtnCdizp+X7+58QE3hLg34XN4QbdySHcKSUr/vHJvPev5PCXRWOH8jb3wtDa+qZ9Z1L2nUnhP7ZXTP68JkCqL96WJWfyunGa6lTCcaakJaD6bzH81zVu6NOPg71Cl/3cybs4kgpZTEjXFSSq7mmjTYFn6edvSwV6lgZnR5eUM4f218PPqT6PL710L1fgGJy6qhLwxAvPnpFhddTD9LNfnLdpFfy7PDgcLhyakRWzJ1iAFCa+rxTYspy6JnEhbZMWU04NojBk2wb98YMT8A8f/rLoj6BU/hsevCgEdSYofQpanydURdCjx2ePdLGxsfyhERERmKxZt24d+PHXX3/xh7LZ7L///ptwJwFwMG9jY+MPP/ygrKxMmMKFa5h/+OGH1lzSjGHY3LlzgXWdkJDw6tUr/hsCAgJaLTEIhPQgi7fzQ9EapKisdepnZ+BxZPXuGMLZm41NnOU7eB1Z72k9zP85PkFRgYKPQjgWoqisfsvheLBZyG9jy+2QmPQw+9z1+Vj6uddVXdcY/rIoIb2yu8Hn4WoRrPnKFvQ57j8vJNgVldUNi7a9oP9zqiE/7sN5I/RcLvaDX1zTP7t5G5s43++NFeZMUhoRQa+nf9/Ojkv9dzXU27SKpT9Hj3AwEJbOS/dy03KIvdh6FjvkCa8Xoq2hTG4OSiYsmNJjnDPv7Zfu5d58TOwV1dY3fbmJNwr+9dQe0OCXH19PtRozlJeYG4/y+CclfjudnNm8+HCdt53AM35JMMxeH7hlziuqwxvAgNJy5pbDb7ccfnsx9LOdKRFqNMUHLwrP/dc7a2kFC5RcDMN2rXEgnPpLWgL62irAv+vHkn/nap7HlyakV8rb5VjbQkLIYkK6riBEFLfq3sGLwuViy35+ye8U4PzdnMthuTRlxe0rBWwE3eGfyH/xengesEW/GG8u8+rIxdEQHJNTUs78/a8UQujev1KyBY0ASkM3NaVf19iD30t/iiacPHwuJPvhiyJJvSG0SYspvwZRBLJqg9RVlc7tGQEm9rccin/z7vMEOORCaA6oM0vLmVxlQwUNuxafOW/ePPDD19eXcDRRYWHh1q1bMVmzcOHCcePGYRh27dq127dvE0J3796dkcGT/MaNGwUehItf2MxgMPincMeMGaOjw6ufGQyGkpLStGnTsNaiW7duvr6+4PfChQs/ffrP2NDZs2fv37+vptZyxwyBaCdQuuC6tS5I08fLnKIbF0Jzlv38srGJM6iP7ual/Rx769Sz2AnplbtOJiVlVA7qoxt2YowG7sAS0OSAKI69dbYu7z/QTrexifPkdfFPxxI+ltTra6vcOOQ6GLclKbugZlfzAZiPY3jTDrxVrGPNuqkqjR9mPHciz4fW0p+iwfn1YL5i/DBjIz1abyvN9Qt5S4Pe51b3nxXC5WIjHAyObR2iTFX45UTi+bs5rk70+yfGPH9berp5BobwcGszjR+X9gUJSEivnLAiHGxcnDSy+xTX7hpqSu+yqk7fyNTXVlk4vcf6/bx9Pkc2DyasOM34UD1w7l3QTelOVxvST4/L5fXyWQ3sqMAJA2bdwTBMR1N5yije5OQXE8zhGjZJRQRZvuNl4C3eQkRFBcoIRwNjA9W8wroXCaVLZ/Y00lf95QSv3+nqRDc3UqMqKRzfNiTydcn45eHgEMXNS/u6Dabr69AqqxoS31fuP5sSm1yupEi5sNdlmptpy4Pr51IT31eWVzUAQ6iHaTdgYx/ePFhVRXHH8cS8otrMvBrgqdWpr66dlZaetspvax2F5SDMgsrqhi/+FxX1pkRRgbJ8dq8vJ1laGKuXVjBfJX3acyr5Q2HtCAeD20fc8GaD/BJTUdUw8/vI529LlRQp67z7zHE3N9Sl5XysDQh+Dw728J7W49jWIdBTjjDt5bmQnWk93F7oMATEP/i9jy9vbsFIXzXz7nS8D56XiWWjFj4ALw34aWiLjzoXkh0Rw3PnE3z/A7OBbahL+22t46JtLyaP6j5ppImmOjUli/HntcySct4WuIXTe/hvG8q/MllSCUAWbn1xodky/3OH85ghRvFp5Yu3R1dUNTw8OXbkQEPRWXY7Iv/m4/yGJs6le7yjcQx1ae7DeeM7Gxf3sbEQOtIhonTP87CQplYRB7Px10vKmeILWZgEoGYKhHRdQaLqDr7/YfH2Fw2NnN5Wmj8s6TtsgL4yVTEjrzrwVlbQnWwlRYWzu4bPHGeGjzJ+eXhk8yrfWePMl8607m2lpaCA5RfXX3+Ud/h8KquBM8LBIPT4GLAVU4bVETim9Yt1kaAz4j7C+KtJVpbd1Us+MYPu5jx8UdS/lzYo/oSclUYPuVxs5S8vz9zk1cB0PdqSGT3temhW1TaGPv0Y8qQgcNfwDfvflJQzacqKYFbfbTB9fvMqXNG0covZImI2iEP769tY8KZbD2wctCsg6VMli1+qa7+2+1TJkijT1+yJrWM2pedWv2ze5wLeokZTOvQjb5H81sNvi8rqI2KLwRChmZEaWKewa40DMMUnf/v4YXQRbyvs3ekWg1YpGrq3+L0NDQ1ubm4vXrwA7po3btzo5OSkrq7+4sWL33//feDAgaGhobwcp9MnTpyIYdiPP/5obGy8Zs0aDMPS0tKio3nSdnZ2trXluWc7fvx4cHDwo0ePeHb+pUtMJpNGo82dO5enpe7uXl5e4KUVFRVTp0599uyZkpLSxo0b582bZ2homJOTc/z48cDAQAzDFi1aFBAQAF0f82NlZZWTw6tvz549u2DBAkLookWLzpw5A9ZF3717lz/6+vXry8rKysvLgcltbW0NtjGvX79eTU0NuKd+9OhRXh7Pu9isWbO6desG079w4ULe+vZXr8DZwu7u7kZGRnZ2dps2bQIbW5YuXXr69Gleo2ZktGzZsj59+lRVVd25c+fWrVtBQUH/+9//iouL6XR6UREvpxCI9gyyeLsE3KbqxuT/Yezat2kVP/4RH/7yP3UTTVlxyUzrX1bbC5y+EBiFqqQwx938l2/t4U4hwKukTyO97/M/ZLWX7f71vEMIVAZd4A8dNcjwQcDnHSPHL6VvPBjX0PjvAPkAG+3rfq6mdLW/Q7JB809gSD+9qMAJ8M+MD9Xf7IoBzj8BCgqUmWPNjm0dcule7nd7YnhH9m0ZvPSfFV+QiJjiJT9Fg24HoF9P7cBdw/r11CYke9d39vgOh0QigrAaON/tiTl7OwsWQRVlhTVf9v5ltf2uk0nA4oXXq17MrWexL93LDbqT/Ty+FM5CQ0YONNzzvYPA7jI/U1ZHPHghwLlIyZMvtLpRB3uFgpNC8Jgbq78PmSYsB/FZ0NDIOXYp/fe/UgiH7uppqXzrZbPeuw/BmZNcE8Nq4By9mLbvzDvCNE4P024/rRowr7lP2aL28lY57nAGu85EU13XaDHhRm1905Zl/QgTaEcvpv/v99c8DyX7Rk4f3bIZsHp3DH4toqEuLe/BjBuP8nx+ew33UoKVhNtW9F/tZSPs/FuJJAAp/sScviYCv/qAqqTw63f2YP2z6Cz7NeA/2gt5EDB21CBDYd8ronTv3zBIylpFfItXTCELkwDUTGGQqyuERRRddSekV24+FP8wupDQyI8aZPjbWkfoaQmS+L7y1NWMW0/y8XP7AF1N5ZVzbDYt6QO8E4E5PVlVR4BHL4vW/Bb7Pvc/bp+G2xsc3uz0140s/LnKMGel1EMOh3vsUvqO44l4d2XGBqqHfnCa5mYKVAJeXzar55HNn50tiaaVW8wWEdEgXg7LXb2b1yBC8h7MGPH1/Q+FAtwRhRxxcxloKFGmG7peYfDtwdbqRi15wlvH23/mHYGr7hOvTbax0GRzuGbjrn9isPr11H59bT61736Kglhu0mtqatavX3/69OnGxn9fra6uvnnz5hUrVhC8JUdERPTu3dvISPCkdGVl5aZNm06cOMEf5OPj4+fnB/9ksViHDh367bffCBOh1tbWO3fu/PLLL0WnecOGDfv27aNSqSUlJdraRN94d+/eBd6bT58+vWjRIv7olpaWubkCTt6+d++etra2s7OziPTzby3mDbW7usIV4BwO5/Dhw9u3b8efu2tiYnL06FFPT086nV5SUmJkZESYUUcg2iHI4u0qsD89Yed+rrhLy5kvEz8VfaqnUCgWxupD+uvBHTjCgFGoSgomBqrD7A1EnGsvJWWVrGdxpUWf6pWVFOx6aA3tr0/CsVDGh+o378orqxuN9GmD++qB7Wd+51LBETLn9owQuB+vsYkTnVCW2ewW1dZSc5g98SwBmYuooLjuRULZJwbLWF/VeYA+WN0nmtr6pqSMysy8mqraRqqSgpEezbG3LuFczTaHw+G+fleemVdTWdXQTU3JxlLTsbdOWx36yuFwY1PKs/JrGDUNeloqfXpoASdb8mDIl/cS31dmhEwjdG1dvr4fk/ypO13tfcg0sCWSHGwO98XbstyPtcwGtoWx+siBhuK4gyYhAS4Xi035lJLJqGexDXVoIwcaGIihnB0UvMVLWsjiQ7o6JVN1V7BeJZYVfWJyuVy6Lm1QH70W64rsgpqUTEZJOZPVwNFQp9pYajjYCi28MqyOuFzsbXpF0vvKmvomXU1lp756cIuv/GA1cKLelOQW1tKUFS27qw8boC9s8EgiWrPFJN0gkqYV2qD7zwunfsczuo5uGbxy/TEF7c++08SkvLz8+fPnBQUFVCrV3NzcxcWFRpN79cXhcGJiYjIzMxkMhp6eXt9msE4Bi8V68uRJbm4ujUazsrIaPny4ggKvQujWrVttba2trW1qqoCd2AhEuwJZvF2Ipg9/csp4S5K6LOv2vQFzBU/+Gu88QAJrFoEQh5RMhuOcu1Ncu189MAp//czNrBU7efstz+4aDhYrItqzxYtAINoQZgN70NzQjA/Vfa21Xj04rGZFXOiLaA9UVlaCPcbjx4+/f1/w8igEov2APFd1IRTNFikYTurcQxybDsbh178RAOdGqNEU+Vf0IRDSA1y8rvyvz6rr4XlgLf2GhX2QuYtAIBAiqK5rnLo6IuNDtZG+6o1ze5C524Y8e/Zs4cKFApdM4w9kcnNza910IRBkaMtlNohWhkJRUDKdr6Dnyq1Nxzop1598VV7xYcnqnd3UiUuYnkUnvXnH2xO19OvpqtbL2iiBiM7DrbvPb4U9DziwTqHZ8xOjqvbvkJtW5kbus7dQcAsjP1FCKJSXf+z+5ttlvJMVEe0QiuI9DGNSFFUVzZe0dVoQiC5N0ydGed3rIQN7X7l83sxaqB84RCuQkZERGBjYs2dPgW6uDx48yNtqrqKyZAmqNhEdAGTxdjkUVM0w1f+46OxUKNCqa4q//ObYuXPnwHobwMuXL+ct/w3DsF69eu3ce1pRS17bOBFdh4Tsp2fO35v39ffu7jwnolu3f1NVU7fnt9+VDHmHVUC+WT927qKtenoSePFBtA7l5eXV1TxXSWwuzyETm6uYX8tzaKepqYmvPRAIRKtB18eevhjbrVs3RUXJDohCyIlffvnF3t4ef1BwXV3dxo0bw8N5u+T8/Pzo9M+HgSMQ7Rlk8SI6Fdra2rm5uXfv3jU1NXV1dTU1NW1qakpISHj9mucmd/jw4ZcvX9ZC5i5CdkybNs3FxaWoqCglJcXZ2Xn58uX89yBzt32yefNmvCPWsrIyS0tLfkesCASiNUFtdDtBU1OTQqE0NDRMmzatb9++/fv319bWLioqioyMLC8vV1FR8fPzW7lyZVsnE4EQC+S5CtGpYLPZjx8/fvjwYVxcXFZWVlVVlYKCgoGBgZOT06xZs4CLfwRCJoSHh//xxx/v3r1jMBhGRkZTpkz54YcfNDWFHjmLaG/cuXMnNpZ3fjIBZ2dnMG+PQCAQXZn8/PyQkJCnT5++e/eupKSkvr5eS0vL0tJyzJgxS5cuRbO7iA4EsngRCAQCgUAgEAgEAtE5Qb6aEQgEAoFAIBAIBALROUEWLwKBQCAQCAQCgUAgOifI4kUgEAgEAoFAIBAIROcEWbwIBAKBQCAQCAQCgeicIIsXgUAgEAgEAoFAIBCdE3QeLwKBQCBEcfDgwZs3b8I/dXV1r1271qYpQhCpqKiYMWMG/sq6deumTp3adinqYNTV1V28eDEiIqKoqIhGoxkZGTk5Obm7u1tYWLR10toLtbW1hBP+OqiOhYWF7dmzB3/l0qVL6KAdBKJzgyxeBKKdwmAwpk6d+vbt23379i1btqytk4PoupSVleXk5GAYlpeXx+FwUNewHcJms0EeVVdXl5eXYxjm5eXV1onqMLx9+3bKlCn5+flUKtXW1hac1Xzy5EktLa3Kysq2Tl17gcPhtB8dk6Z9rKmpAR8CDpjFMIzJZMotpQgEol2AVjUjEIJJS0t70kxtbW2bPPzixYtRUVFVVVUbNmyQeQIQCPHZtWtXTjMGBgZtnZaOAYvFAgU8OTm5dd6or68P8mj37t2t88ZOA4vFmjZtWn5+vo2NTXp6emIzsbGxampqbZ209oWGhkb70THR7aPoFnbWrFngQyZMmNAqiUUgEG0PsngRCMHs2bPHrZmMjIw2eXifPn3ADzs7O5knAIFAyI+ioiJQwLds2dLWaUG0wNWrVz98+IBh2A8//GBpaQkuOjo6zpw5s62ThsDItY9ybb4RCERHBK1qRiDaKSNHjoyKikpMTJw3b15bpwWBQCA6J1FRUeCHg4MD/vrx48f379/fRolCtABqHxEIhEQgixeBaL+4NNPWqUAgEIhOS2lpKfihpaWFv96tmTZKFKJlUPuIQCDEB61qRiAQCAQC0UVpamoCPxQVFds6LQgEAoGQC2iOt8tRV1f38OHDZ8+eFRcXYximp6dnZ2c3cuRI4KCyxShUKtXExGTMmDEuLi78/YOysrLMzEz8FUdHR2Vl5crKysDAwKSkJFVV1X79+n311Vfq6urwnszMzIsXL2ZkZNBotCFDhsydOxfvMiQ7O7ukpAT+SaVSBw4cCK5fuXIlKyuLyWSam5tPnz4dXAcwmcy3b9/iU9K/f3/8Y2NjY9lsNvzTxsZGR0cHw7DGxsY3b97gB/4TEhLwjhzNzMxMTEzwT05JSYmKikpJSSkvL6dSqXQ63dnZeeLEiSoqKgT5iPlwYWLEBJGamhoaGpqRkVFVVaWnp9evX79JkyYRUgiIj49nsVjwTwMDgx49emAY9uLFi5CQkLy8PA0NjaFDh86ePVtVVVXgu2JjY8PDwzMyMurq6jQ1NW1tbZ2dnYcMGaKgIPHYmfhCI6fDwmTIZDKvXLkSFxdXUlKioaFha2s7ffp0uHmPhFQhVVVVt2/ffv36dVlZmYKCgrGxsYODw5gxY4R5e5KhMOVdrkVAuqDJo64Q9syqqqqgoKDExMS6ujorKytPT097e3thXyRlvoD6qrCwEPxZXl7+8uVLGEqhUIYMGcIfi4S+iUljY+OdO3eeP39eVFSkpaU1ePDgGTNmaGhoiI5VXV0dFhYWHR1dUlKiqqpqZmY2ZsyYYcOGUSgU8V9NruqWJjHCqriUlJRr167l5OSw2WwjI6PBgwfPnDkTagtwO4xhWFxcXFFREfitp6fXs2dP2baDwiofYcmOiIgIDQ0tKSkxNzefPHkyXnPYbHZwcHB0dHRFRYW5ufmMGTNEyzAhIeHevXtZWVl1dXV6enqOjo4TJ040NDQUEQVI/vr16zExMQwGw8jIaPjw4ZMnT6ZSqZgkFBQU5OfnEy7SaDRCGQTFZMiQIfhszcvL+/jxI/62nj17crlcYe0jieYbj0QVBQKB6GBwEV0Jf39/fX190PHq3r27np4e1AQbG5sDBw5wOBxClBMnToAoCgoKpqam8GASW1vb+/fvE24+c+YMQcFycnIePnyoqamJv6inpxcZGQmi7Ny5k9BjMDU1TUlJgc9csWIFPpROpzc1Na1fv55fmWfOnFlRUQFipaamEkLj4+PxSSUsYLtx4wa4Dns8wvD19YUPCQwMtLa2BteVlJQsLCxgH0JfX//cuXME+Yj5cIFi5M/NnJycKVOmgBs0NDQsLS1pNBqYqVi1alV1dTXhfsLBkt7e3kwmc9asWYR3mZqaJiYmEuLm5uaOGjUKvsvCwgJa4AYGBj4+Pg0NDVzxkFRo5HRYoAyfP3/Of7KOn5+fNFIFHDlyBBhmCgoKJiYm8IsoFIqrq+vjx4/lJEyJZEK6XEPAbXQ6HV4hXdDkUVcIeyYhDRiG+fj48H+dTPKFUF8RUFFRIdxPTt9E4O/vD57m7+//9u1bKysrQhr09fWvXr0q4gmHDh3S1tYGabCwsIDqZG9vHx0dLX5KyFXd0iSGv4praGhYvHgx4XVaWloCtQXP3LlzZdsOiqh8BNbM/H6zvLy8mpqauFxuVlaWjY0NIXTt2rUCBZiZmQk9Euvo6FhYWACTVVlZecOGDSJU+urVq+CT8VhbWyckJOB1rEU1+Pnnn/nFa2tri7/n1atX4PrTp0/x1zdt2kSIePHiRRHto0TNN5fLnT59OomKAoFAdESQxduFgP2P5cuXFxYWgoulpaWbNm2C0xdMJhMf5ZtvvgHXV65cWVRUBC6mpqaOGzcOtP2nTp3C35+RkXGmGUdHRxDx9u3bKioqEydO3Ldv3++//z5mzBhwXUNDo6CgwM/PT1FRcf78+X5+fr/++mu/fv1AqJ2dXWNjI3hmZGSkfzNgXoJOp//4448aGhp79uxJTEzMyckJDQ11dXUFEZ2cnGpqarhcbkVFBYjl7OwssCN++vRpf3//yZMnEzridXV1hIibN2/2xxEXF0doL3V0dIKCgmCCMzMz4SmFJ06cwL9UzIenpaWBPwcMGEBo0SEJCQmg/2Rqanr37l02m83lcplMZkBAAJj1cnR0LCsrw0cJCgry9/ffvHkzeKa3t7eXl5e+vv6GDRsCAgL27NnTt29fENSrVy98T6i6uhr0mwcPHvzmzRtwkc1mh4WF9erVC0SprKwUUw8lFRo5HeZXxbt379JotL59+27duvXgwYPwdXiLl4RUuVzusWPHgLW5f/9+oH4gVWvXruXvNslWmK1TrkVYvKQLmjzqCv6Cc+vWLWVl5QkTJvj5+fn7+y9ZskRJ6fPKpsDAQHw6ZZUvoL7atWsXiDJgwAB8AT958iT+ZnL6JhpojWzbtk1XV3fMmDF3797NyclJTEzcvXs3eCyFQrl48aLA6PBo07Vr15aXl4OLsbGxIJtoNFpYWJiYKSFXdUuTmCtXrpw5c2bnzp2wivP29lZWVl6wYMGBAwd27Nhhbm4OLV5+bdm1axfMqQcPHsiwHRRd+fAn+8svvzQ0NFy/fv2hQ4f+97//gWURGIatW7eOwWCYm5vb2Nhs3779jz/+WLx4MZx0PX/+PEGA8fHxwGq1srKC427V1dW+vr5gKnXChAmw+OC5cOECuEFdXd3X1zcpKQnk19ixY/X09LZt2ya+xRsbG+vv7z9y5EgQZcWKFf7+/gT1gycMESzM6Ohof3//b7/9FsOw2bNn+/v7Z2RkiGgfJWq+8RYvqChGjRrl6+vr5+c3f/58OLhGqCgQCEQHBVm8XYXDhw+D6nvRokX8ob/99ht/z/jo0aPg4uLFiwn3s1iswYMHg3F3wqAsoSGxsrI6duwYPmjRokUgaMmSJTo6OvjpLxaL5eTkBELv3LlDeCboGiopKamqqsbGxuKD2Gw2nCdZs2YNPsjb21tgR5ww/Aw74mJGxH9maGgof5CnpyeGYWpqaqWlpfyh4jycMAKNv85gMMCyN1VV1bS0NEKs69evg1geHh78k3vx8fEg1NLS0tbWtqSkBAYxmUzorfTWrVvw+sGDB8HFrKwswtMyMjLA3KakFi8JoZHQYbwMe/TosWbNGmBUAL7//nu8xUtOqo2NjWDeacGCBfypWrlyJaEbJ1thtnK55rd4pS9o8qgr8M88dOgQPujSpUsgyNHREX9dtvmSk5MDnjZ9+nRh90hTisWxeFVUVL744gtC3GfPngGbv1u3bh8+fBCmTt9++y0hqKKiwtjYGEwR4ysNcSBXdZNODKzirKys6HR6cnIyDCooKFBTUwMWb4vVrAzbwRYrH0Ky7ezs8CMdaWlpYLuHurr6kiVLJk+ezGKxYOi1a9dARCcnJ/zbGQwGGMRRV1fPzs4WVjn8/PPPhKDc3FzgsotKpRIm0jkczhdffAH3nohj8QKuXLkiLDe5XC7cV9K9e3d+bQdDh/h8bDHjJG1hrays9u7diw86f/68wIoCgUB0UJDF2yVgMBhglF1ZWbm4uJj/BiaTCdbzwJ5xi1HCw8NBezBw4EARDcnIkSMJQfhlkN999x0hNCgoCAStW7eOEASXhAlcaJSTkwMGZRUVFQsKClrH4l22bNnQoUMFBj19+hREP3LkiMwtXphsYWuuoAfL27dvE4JgvwrDsIcPHxJCT548yS//2bNngw4rvscGAdN34hsD5IRGQocJMuzbty9YEwiJiYmxt7cPCgqSRqopKSng4s6dO/mjxMbGEh4oQ2G2frmWq8Urw7oCPnPEiBH8ienevTsIraqqkpOSi2PxSlOKxbF4hWXx0qVLwQ2rVq3CX4e6QaPR4ISqwEGBLVu2iJ8eclW3NInBV3GXLl0ihC5evNjFxUVMw0lW7WCLlQ8h2Y8ePSI8au7cuTBb4VIOCNxyjFfp7du3g4sbN27kT1tDQwOY/lVTUyMoNhinA/Ox/BHBNmZJLd7a2lrgHsLIyIhg04JKEsK/WN3MzIywClrmFq+zszN/KNzxi5cqAoHooCBfzV2Cc+fOVVdXYxjm6uoq0FmFioqKh4cHfhMLjDJq1CiBUdzc3IBLnjdv3kRHRwt79Zdffkm4YmNjAx0j8YdC9xsiDo7nj4VhmIWFBeggstnsc+fOYa1CQECAsG+H+6xECIcccBkthmFz5swReA88ohDOk/BjaGgIF45CBg0aBH7gXYOA/mhTU1NoaCj/c06cOBEfH9+iLxwphUZChwksWbKEsAvUyckpPj4eqBNpqcJnhoSE4F00ARwcHOLj4zdu3CgPYbZhuZYH8qgrvvrqK/6LMGJ2draclLzVSrEIxowZIzCL58+fD36cO3cOuinG68a4cePgMlo8U6dOBT9Onz5NIj0SVd0ySYyOjg7/btg///wTHsDbIrIqL6IrHwJ0Ot3NzU2Y0rq5uRkZGQkLzcrKAj+4XO7x48fBb2gt46FSqe7u7sAj1+XLl+H1pqYmmAsCi4+hoeHYsWMxCVFTU5s0aRKGYUVFRc+fP8cHgbevWrUK/BkcHIwPffXqVV5eHhiQkh8LFiwQs6JAIBAdFGTxdgkePnxIsGf4uXDhQmVlJVytBKPApYMEFBQU4CYlOM7ND1wlC6FQKLAHw+8IETomAf0MfigUijD3idCVJZwqbE0YDEZ2dnbaP8BJHry3UpmQlJQEnkmhUIT554QZHRUV1djYKPAee3t7fmensC9VVVUFL8I9UXPmzNm9e/enT5/wUbp3725vb0/Ow7D4QiOhwwTA+kOZS9Xa2hoo7atXr0aPHv3kyRN8FEVFRXt7e7x3UBkKsw3LtTyQeV0h8Jmtr+RyLcUiEPZYWBCqq6sTExPhdagbUBQErK2tgSIVFhaSsAEkqrplkhhHR0e4bZscsiovoisfcWpmXV1dESrNXxaSkpKAv2JlZWWBUTAMg5vh8UMAb9++rampEf3V8JMlAo7sEGzaK1eu9O7de/v27eCr4fpnvD0sbFRIVgj8IrBynlBRIBCIDgo6nahL8O7dO/CD/xQWaaJAD5PJycnC7sG7jYWANVGqzRCCoHNU/ukygKampjCTBmyKwzAsLS0Nay2SkpIOHjwYGhoKzyMhgD92QibArDE0NARuXUVkTX19fU5ODnS9g4ffDydYQ8gv/5UrV546dSopKamurm7Lli0//fTTuHHjPD09p02bBvsE8hYaCR0mIPooDtJSVVRUPHToEJgMiYqKcnNzs7CwmDFjhqenp8CTS2QozDYs1/JA5nVF2yp565RiEgqvpqZmaGgI7O20tDTY14fr85OSkv744w+BcZWVlUHZTEpK4vcCLRqJqm6ZJKbF03darbxIlBIRBUGYSvOXBShANTU1YWsEwEE+QIDwYnp6OvhBp9OFHVNHTrCTJ0+m0WjgiKaDBw8C+zYuLi4rK2vbtm1GRkYjRox4+vRpbm7u69ev4XDPlStXevXq1b9/f0yeiF9RIBCIDgqyeLsE8LxB4I5CVlHgGj/CfAgeYafIig4SgYjzWmFSKyoqsFbh6NGjPj4+bDZbUVFx4sSJjo6OmpqaoCGvq6uDvjdli0RZA3JHYF9ZoPwFzmKpqKhERUVt2rTp9OnTTc3ca2bVqlWjR4/euHEjWB0nV6GR0GH+r5CTVL/88kstLa1169aB/npubq5fM4aGhosXL96wYQOcn5GtMNuwXMsDmdcVbajkrVaKSVeVwOLFV5UwSRebEf3wsrIyuVbdMkmMOId7t055kSglorVdzLIAU15ZWQm8ZIkpwMrKyhY/WdgYjWjU1dU9PDyuX79eUFDw6tWroUOHwilcsGh59uzZYJI/ODgYWLwxMTG5ubnwfAH5IX5FgUAgOijI4u0SwJVd4g9VihMFBkl6JL2cIJEeDodD+nWRkZGrV6/GMExbW/vRo0eEZVEMBkNOFq9EWSOr3NHW1j5x4sSvv/566dKlixcvPnv2DGwVe9SMt7f36dOnxekfkBYaCR1uTalOnjx50qRJkZGR58+fv3r1Kuj7lpSU+Pr6njp1KiQkBHTvZCvMDlSupSlorYas8qXdlmL+J+MfC3/v2rULniYlDOj9S07pacPEdPR2kJAYU1PTkJAQ0Tfjl6LItaadPXs2cEIeHBwMqkT8FO6sWbN8fHxAqK+vL8EeRiAQCGlAFm+XQF9f/+PHjxJtR4FRGAyGsHtgkMAVQXKirq6uxfTgp9QgAtvv+vp60imBzkI3bdpEbl8TOaC0xcka2eaOgYHB6mby8/ODgoKOHDmSn58PTiy0t7eHx8/KQ2gkdLiVpUqhUFybOXr0aHh4eEBAADg1pKyszNPTMzMzExyFKkNhts9yLfOC1spIny/tpBRLWlVC3dDX1xe24VYaJEqPvBPT0dvBFoGJaWpqkkiAMAtEfHJtbS25VE2ZMkVFRYXFYl25cmXfvn1v377NyMiAU7jdu3cfNmzYixcvsrKy4uPjHRwcrly50qNHD2H7kBEIBEJ80JqNLgHcEiPCqSmJKNCdr0RuOaSkpqZGWP8ebkCCB9PjR6wF9rcKCgpIpwRugoKHiODhnf0lH2DWVDQjOmv09PTMzc1lngZTU9NNmzZlZGTA0fczZ87IVWgkdLitpKqkpOTu7n716tVnz56B5X9FRUX379+XuTDbVbmWX0FrK0jnSzspxcBQ5+fTp09w5Sq+qoRJgv5+27DqlndiOno7KH7Ki4uLRYw18AOzoKKiAi6NllVx1tDQALsDcnNzY2Nj+b1S4b1bxcbG5uTkoAleBAIhE5DF2yUApwJgGEY4FQDPuHHjLC0tYZcORhHm95jJZMJj9GS7w61FXr58KfA6dJOLPztBW1tbRP/vxYsXLb5OmBkGvSsJXMwmYoBcnIeLwMzMrE+fPuA3WHjJD/S96eHhwe/2U1K2bt0q8BQNFRUVeACGMB9UshIaCR1uHakmJyd7enrevn2b//7hw4fDs0+hfGQozHZVrqUvaG2LDPNFnALeCqVY2GE5sJ40NTWF57iClfmi0wN2JRgZGVlaWpKbtBe/6m6FxIhDe24HRWNmZta3b1+ggSKOTZo6daqRkdHvv/8Or/Tq1cvU1BT8joyMFBhLmnPLoAV7+fLlK1euWFtb46egZ82aBX4EBwfLZEmz/IaeEQhExwJZvF2CGTNmAFeTMTEx0PkknpSUlPDw8Ly8vNGjRxOivHnzJiEhgT9KcHAw6Gd4enriu02twMmTJ/kvPn/+HDic1NTUxB8/aGdnJ6zLEhoaKuKMDbgGFX8uyJQpUxwcHF69eoX3Lwp7PHgiIiJEfEKLDxfNunXrwI+//vqLP5TNZv/999+EO6Xh6dOnFy5cEGjJqKurgz1g+AN4REBaaCR0WFLISbWsrOzmzZs3btwQ+ExNTU3wA8pHhsJsV+WadEFrJ8gwX4QV8Dt37jg4OCxatKh1SvGLFy8Eeg+GBvzKlSvx1z09PUHxfPbsmTB398ePHy8uLnZ2dhbmxVdWVXcrJEYc2nM72CLr168HP06dOiXwhrS0tJCQkJKSkilTpuCvr1ixAvw4ceIEf6zk5GRpBrCmTZsG3EQFBASkp6cTDFozMzOwv/f9+/cBAQGWlpYijl6TXwuLQCA6H8ji7RIoKir+9ddfwOfKypUrCUc7NjY2Ll68GMOwRYsWwYMWCFEIp8UUFhb+8MMPYM+PsJMP5ISamlpYWNjZs2fxF0tLS8EnYBj222+/qaurw6AJEyaAH2fOnIFLajEMi4+PX7RokcC1tQBra2vCCq7q6uoHDx68ffsWOEqZN28euO7r60uY/CksLNy6dauIr2jx4aJZuHDhuHHjMAy7du0a/+zi7t27wRq8jRs3ynAH1Pbt2/kvXr16FezbFPO8RNJCI6HDkiKNVC9cuJCamkq4WF9ff+vWLTD/iV93ICthtqtyTbqgtStkki9gFyVwdYtf//ns2bO3b99CL0HyLsVGRkYLFiyAC5gBhw8fBmfMWlpaEvYkKyoqnjlzRkFBgcvlLlq0iH/i9Ny5cxcvXqTRaDt27JB31S3vxIhJu20HxcHb2xuUygsXLgB/UXhqa2uBPi9cuBAOVwHWrl0L7Px79+75+/vjgyorKxcsWABPtCaBpqbm+PHj4Yoe/ilceIXBYHzxxRfk3iJlC4tAIDohXESX4dy5c2ApqZOT082bN/Py8tLT04ODg4GbRCcnp6qqKmFRBg4cePPmzfz8/Ozs7L/++gu0Gfr6+i9fvsTfn5mZ6d2MmZkZULBZs2Z5e3ufP3+ey+W+efMGhIJuDZVKBX8+ffqUy+XeuHHD29vby8sLRKTT6SA0MTERPJxOp4PrYOpj6tSpJ06cuHDhwtatW0EQhmGLFy/mcDiEr4CTKoqKiq6url5eXiNGjKBQKCtWrPj5559B0OjRo729vZcuXQpjpaWlgZWELi4uKSkpGRkZ8+fPB3eCG1gs1rBhw0B0bW3t3bt3379//9mzZ/v27aPT6R4eHoQPSU1NFfPhT58+FSjGX375BT6hvLx8xIgRYP/k5s2bExISioqKoqOjvb29QZRFixY1Njbi5bB//35vb++pU6eCG6ytrcFb6urqRMg/NTXV1dUVXJw9e/aDBw/y8/M/fvz46tWrTZs2gVM3XFxcmEymOEoojdAk0mFhqgj1TSAkpArnpel0+uHDh5OTk0tKStLS0oKDg8G+PiUlpevXr8P7ZShMSWVCulwHBgYC0YFtyTQaDfwJyjW5giaPuuLu3bsinsnlckEo7N+7u7t7e3v7+vrKI1/AEc3A5VV+fv7t27d1dHTACl5p9E0YDAYDfJ2zszOIe/DgwX79+hkbG2/duvXChQsBAQFwqbC2tnZcXJzA51y8eBFMwdnZ2Z07dy4rKys/Pz8iIuLrr7+mUChUKjU4OJgrIaSrbkkTI6yKW7duHX+qhFWz3t7e+/fvl0c7KKzyEV0zb9u2zdvbG+gJ2C2M/yKBKg1bioqKilGjRoEiuXr16ujo6MLCwoSEhJMnT4JRMBcXl5qaGv4kxcfHA3UFU6MBAQEXLlzYtm2bsbFx//79oQNCZ2dnkAAGgyG2OvDqExDdysqKPzQnJwd2UF+9eiV+xuHbR9EtrOjKR3RFgUAgOijI4u1axMXFgeFVPDQabc2aNQKbPWFRqFTqggUL8vLyCDcL297j4+MD+qkCQ8+cOcPlcmGfmMC9e/cI3SYul3v16lVjY2P8bZqamgcOHGCz2fyfwGQyFy1ahN8Ip6Ki8sMPP3A4HMJLVVRU8BEPHz5MOKbP3t7+w4cP8Ibq6uoVK1YQtqSqq6vv2rWL/4jIiIgIMR8ubCfq0KFDCd+1d+9ePT09wm3W1tZBQUH8chC2zayyslKE/CMiIt6+ffvNN98IHBrX1dXdtm1bfX29GNonA6GJr8MidpoBfROGpFKtq6v7888/3dzcoOsmPKNGjSL0hmUrTIlkQrpcw1WOAss1uYImj7rCz89PdDoFhrq6usojXwoLCwcOHIh/DpVK3bdvn5T6JoyioiLCE/z9/SsqKr744gvCHmA3N7e0tDQRj4qPj3d3d+ffOezm5hYbG8uVHNJVt6SJEVbFWVhY8D9ZxIZ/d3d3ebSDwiof0TWzQE/L8ItabClYLNa+ffv4/Ujr6ent2LFDxCBOeno6YYeIgoLCnDlzKisrCRO/wDkfV2wqKipAbblhwwaBNzg5OWEYZm5uLjBUzPZRRAsruvIRXVEgEIgOCgVt6++ClJSUREdHFxUVUSgUCwsLZ2dnuNuwxShUKtXExGTEiBEijqeXE0ZGRsXFxXQ6HfTt2Gz28+fPc3JymEymhYWFq6srmIoRRn5+/vPnzz99+mRsbDxs2DA4tyCasrKyqKiooqIiZWXlPn36ODs78/e9ysvLnz9/XlBQQKVSzc3NXVxcwFSYTB7eIhwOJyYmJjMzk8Fg6Onp9W0Gkw9ZWVlgDpPJZGpqatra2jo6OpI7hZK00EjrsLylWltbm5iYmJGRUVVVRaVSjYyMBg4cKGIFnQyF2a7KNbmC1n6QYb5wudyYmJjk5OT6+npDQ8NRo0YZGhq2fikuKCiIiYkpKirS1tYeNGhQr169xIlVWloKdAOYrE5OTqSXg0pZdcs2MdLQHtpBcnA4nNjY2IyMjIqKCg0NDVtb24EDB4qj1e/fv3/9+nVlZaWRkdGQIUPE38reHpBJC4tAIDoHyOJFdBgI3SYEAoFAtH9Q1Y1AIBCItgV5rkIgEAgEAoFAIBAIROcEWbwIBAKBQCAQCAQCgeicCHC1gkC0K8rLy6urq8HuL/B/bm4u8HcCnUkiEAgEol2Bqm4EAoFAtBPQHC+ivbN582bLZoAj37KyMvCnXI9hRCAQCIQ0oKobgUAgEO0ENMeLaO9MnTqVcJoFAB47iUAgEIj2Bqq6EQgEAtFOQL6aEQgEAoFAIBAIBALROUGrmhEIBAKBQCAQCAQC0TlBFi8CgUAgEAgEAoFAIDonyOJFIBAIBAKBQCAQCETnBFm8CAQCgUAgEAgEAoHonCCLF4FAIBAIBAKBQCAQnRNk8SIQCAQCgUAgEAgEonOCzuNFIMRl3rx5RUVF8E8PD49Nmza1aYoQ0nL06NHg4GD4p66u7rVr17COQFhY2J49e/BXLl26RKfTsU5H1/nS1ufgwYM3b97siPovgri4uMuXLycnJ9fX1xsYGFhaWo4bN87FxUVZWbmtk4ZAIBCItgFZvIguwdmzZ318fHr37n3nzh1dXV1yD8lvpqGhobCwEMMwS0tL8eMyGIypU6e+fft23759y5YtI5cAhMwpLy/PycnBMCwvL4/D4cjEjnr48OHWrVv5rysrK0dGRhIu1tbWjhs3jsvluru779ixgxDa0NAwatQowsWvv/76m2++qampASkvKSmpr6/HMIzJZGKdka7zpa1PWVmZzPW/bfHx8Tl06BCGYYaGhhYWFvHx8WVlZXv27PHz8/Px8Wnr1CEQHanPg0B0JtCqZoSMSUtLe9JMbW0t1m7YuHFjZWVldHT033//TfohT58+zcnJCQ0NJRH34sWLUVFRVVVVGzZsIJ0AhMzZtm1bTjMGBgayemZDQ0NlZeWnT59e/kNJSUllM/w3P378ODo6+uXLl6dOnRL4NBAxKyvr5cuXBQUFlZWVwN6bNWsWSPmECROwTl1pdKYvbW/s2rVLtP6zWCyQNcnJyVi7x9/fH5i7e/bsKS4ufvXq1cePH7/++uu2Tld7pGPlLELSjJNJnweB6EwgixchY/bs2ePWTEZGBtZu6Nu3L/hhZ2fXJgno06dP2yYA0WpMmjQpNTU1PT0dzpj5+fmlpqYmJCTw3wwHUD5+/JiUlEQIVVZWTm1m5syZGIa9evUqNTX1f//7H9a5aJ+VBgLDsKKiIpA1W7Zswdo9+/fvxzDM3Nz8hx9+AFeoVOpPP/3U1ulqj3SsnEVImnFt3udBINobaFUzoktw48aN8+fP9+rVa8yYMW2SgJEjR0ZFRSUmJs6bN69NEoBoZSgUiru7+9mzZ4FZO23aNIG3hYWFwd+hoaH9+vUTeNu9e/fs7e2NjY3lll4EomNTWloKRkzs7e3x13v06FFUVKShodF2SUMgulyfB4Fob6A5XkSXQENDY8WKFW1b9bu4uKxatUpHR6cN04BoTTw8PMAPYSvhM5vR09MTfVt6enpubu7EiRPlllIEosNTUlICfmhpaRGC6HS6mppaWyQKgei6fR4Eol2BLF4EAoGQC+PHj6dQKBiG5ebmpqWl8d9w7949DMOgw6qnT5/W1NQIuw3azwgEgp+mpibwQ1FRsa3TgkAgEIj2BVrV3LVISUmJiopKSUkpLy+nUql0Ot3Z2XnixIkqKioiYlVVVd2+ffv169dlZWUKCgrGxsYODg5jxozBOztpbGx88+YNWFoGriQkJOBdqpqZmZmYmBCeXFdX9/Dhw2fPnhUXF1OpVBMTkzFjxri4uPB3WeLj41ksFvzTwMCgR48eGIa9ePEiJCQkLy9PQ0Nj6NChs2fPVlVVFSeipB8oAtFpKCsry8zMxN/v6OgIz8kg/V143rx5c/PmzQ8fPtBotB49esyePRv4kX7z5k1jYyO8zdDQ0MrKSpwvEkcg2dnZcFIF7JcbOHAguH7lypWsrCwmk2lubj59+nRwXRgJCQn37t3Lysqqq6vT09NzdHScOHGioaFhi4kkF1GYrOSBnp7ekCFDXr58CaxWW1tbwg2hoaFUKnXhwoVHjx599+5dY2Pjo0eP+Nc/h4aGduvWbfjw4eK8tKqqKigoKDExsa6uzsrKytPTk7DIk0B1dXVYWFh0dHRJSYmqqqqZmdmYMWOGDRsGbHU8MtFVPOQqjVb4UhEIK85MJvPKlStxcXElJSUaGhq2trbTp0/nVy0SSitOYczIyPj06RP8U0dHx8bGBv5ZVFSUm5sL/1RTU+vfv3+LXwoKOPBLD7yaA00GUCiUIUOGSJpOiUhNTQ0NDc3IyKiqqtLT0+vXr9+kSZME6gPQzPT0dPBnaWkpPqn29vY0Gq3F19XU1ERERMTFxeXm5jKZTE1NTTs7uwkTJvAXW9EQKkaAioqKg4MD+M3lcl+9ekW4wcnJCd/qkdZVfJMKqiA7O7uRI0fiv0LSnJUoO6QsIGJ+mujeQuu3TcLqxpSUlGvXruXk5LDZbCMjo8GDBwOPDOS6ZGJmnDh9HnJFTIaVPwLRBnARXYPAwEBra2uQ6UpKShYWFrDi1tfXP3funLCIR44cUVdX560HUFAwMTGBsSgUiqur6+PHj8Ft+INqBeLr60t48okTJ/T19cGTTU1NoZsfW1vb+/fvE262sLDAP83b25vJZM6aNYvwFlNT08TERNERyX0gJD4+XqI0nDlzhnBDTk6O9N8FKC8vJ7SggE2bNrHZbMJZIytWrBCWyyQEsmLFCvzD6XR6U1PT+vXr+RMzc+bMiooK/hdlZmZC77s6OjoWFhZUKhW4a9qwYUNDQ4OwFJKLKI6s6HQ6V6b8/PPP4C3u7u6EICaTqaamNmbMGC6Xu3btWnDbypUrCbfV19fTaDRPT09hr5g+fTrUq4cPH/Iv6fTx8REW99ChQ9ra2mBazMLCAq6vtre3j46OJtwspa7yI2ml0WpfKgKBxfn58+f85/r4+flJr7RiFsa5c+fiXz19+nT8Q/z8/PCh9vb2/C/i139CASegoqJCIp1ikpOTM2XKFPAEDQ0NS0tLYLIqKiquWrWqurpatGYSSE1NFf26kpKSWbNmgewAhxJbWlrCQclp06YVFxeLn3iBcrOwsIA3CDxbq7KyUnpd9ff3B00qhULp3r07jIhhmI2NzYEDBzgcjqQ5K2l2kC4gopGot9D6bRN/3djQ0LB48WLC67S0tKTpkomZcS32eaQvYtJX/ghE64Ms3q4C6Czq6OgEBQU1NjaCi5mZmV5eXqCqOnHiBH+sY8eOgeZz//79NTU14GJpaSnsoMMuZl1dnX8zzs7OIGjz5s3+OOLi4vBP/uabb8BtK1euLCoqAhdTU1PHjRsHWrVTp07h7w8KCvL399+8eTOscL28vPT19Tds2BAQELBnzx7ombBXr174Bok/IrkPFGjxenl5aWtrf/fdd4cOHdq+fTucV8GnIS0tDUhgwIAB/BYv6e/icrk1NTVOTk4gdPTo0aGhoTk5OYmJib6+vhoaGlu2bAHdAg0NDZCAyMjIFvVEfIFERkaCxwKXMHQ6/ccff9TQ0NizZ09iYiI4xsnV1RXEcnJygk+DYgQ9GCsrK9ghrq6u9vX1BfMYEyZMgIoqfUQxZSVzizc6Ohp2R+rq6vBBDx8+xDDs999/53K59+/f5+8ZA4BrK4HFk2AH3rp1S1lZedSoUb6+vn5+fvPnz4ezH4GBgfwR4bnQa9euLS8vBxdjY2MdHR0xDKPRaGFhYfj7pdFVgUhaabTal4ogIyPjTDMgLoZhd+/epdFoffv23bp168GDB2GNiu/Qk1Na8QvjgwcP/P39d+3aJdDiTUhIAPKUyOIFBRw+c8CAAfisOXnyJIl0ikNCQgJIjKmp6d27d9lsNrASAwICwF5cR0fHsrIyEZrp7OyMT6pAk0ZglT5r1qysrCxwkcViXbhwAUxQ29raMhgMMdMP5DZ06FDwTC8vL39//6CgIHhDU1MTSBhw4P/rr7/6+/uzWCwpdRWaQ8uXLy8sLAQXS0tLN23apKDwef8ak8mUKGdJZAe5AiIaSXsLrd82Xbly5cyZMzt37oR1o7e3t7Ky8oIFCw4cOLBjxw5zc3OCxUuiSyZmxonu88ikiElf+SMQrQ+yeLsKoHoNDQ3lD/L09ARL3UpLS/HXGxsbwSDxggUL+GOtXLlSYFfG29sbVHzx8fHCEnP06FFwz+LFiwlBLBZr8ODBYKzx6dOnwromlpaWtra2JSUlMIjJZMJlY7du3RIWEV/7k/tAfBqsra0/fvwIg+rr66FZy58G/AyVTL7ru+++gx1cMHgPiY2NVVVVVVJSksiKIycQ0HYqKSmpqqrGxsbig9hsNhxIXrNmDbzOYDDA+mp1dfXs7GzCA3/77TcQ5eeffyYEkY4oc1mJCZvN1tXVBa++d+8ePmjdunUYhoERcSaTCReDEaakvv/+e4E6w69XVlZWe/fuxQedP38eBDk6OhJiHT58GAR9++23hKCKigrgFFpfXx+vilKWQRGIU2m0/peKBiamR48ea9asAb1GfJbBDj05pSVRGHNycqCSC0yzRBavmM8kV2kIg8FggNWSqqqqaWlphNDr16+DxHh4eBBKsbBKXhxAxOHDhzc1NRGC3rx5A8zFjRs3SvTMW7dugcSMHz9e4A2fPn1SUVEhqCtpXYURFy1axP8uqGPA4hUzZ6XMDvELiGhI9xZauW3Ca6CVlRWdTk9OToZBBQUFampq/BavRF0y8TNORHGQSRGTYeWPQLQayOLtKixbtmzo0KECg54+fQrqqSNHjuCvp6SkgOs7d+7kjxUbG0vO4mUwGGDkVVlZWeBqsfDwcPCEgQMHCqtwMQx7+PAhIfTkyZMgaN26deLU/uQ+EJ8Ggg3D5XIDAgKEpUEci1f878rPzwfzWkpKSnl5efzpX7NmDYglvhVHTiBwgZnAfm1OTg5Ip6KiYkFBAbi4fft2EEVgP7KhoQEMsaupqeEX+5GOKA9ZiQ88jwrfr+JyuX379jUxMYF/QsdUBw8exN/Wu3dvOzs7Ec+HeuXs7MwfCjdlVVVV8ZdBGo0G55HwHDx4EMTasmWLrMqgDC3e1vlS0cDE9O3bl2ApxcTE2Nvbw2k9ckpLojC2icVLrtJocReAsCguLi7ghtu3b8vK4k1JSbGwsLh48aLA0LFjxwI7k98AEEFTU5OZmRlIz/v37/lv2LdvH4Zh+AlV0rraYpPKZDLBFgBJLV5pskP8AiICaXoLrdw2EerGS5cuEUIXL17s4uIiTZdM/IwTURxkUsRkWPkjEK0GsngRvF1MoJ6aP38+/jr0LjtkyBD+we+mpqb4+HjYTojfeYVDtuPGjRN4A5vNhs5OXrx4IbDCNTQ05O9/AC84GIbxb3oUWPuT+0D4KAMDA/40vH79WlgaxLF4xf8uX19fcHH06NFcQUCfFuJbceQEAnsVL1++FPhYuH7st99+43K5HA4H5u/r168FRvnqq6/ADQEBAfAi6YjykJX4BAYGgofb2NjAi3l5eYRZi0OHDoHbJkyYAC8Ch0Nr164V8XyoV0ePHuUPhfMYb9++5S+DU6ZMEfhMcK4phmHGxsaEINJlUIYWb+t8qWhgYg4cOCDiNtJKS6IwtonFS67SEAiHw4FbGZ89eybwniNHjvAXEyktXtGsWrUKPDYzM1OiiL/88oswA4DD4fTs2VNTUxO/npa0rsKIwuaTwbiblpaWRBavlNkhZgERjTS9hdZsmwgaqKOjI3BLjpRdMuktXlkVMRlW/ghEq4FOJ+qKMBiM7OzstH+AFSjBw6S1tTVYrvbq1avRo0c/efIEH6qoqGhvby/Ck6owwPZFsH9G4A0KCgpwCxAcwSVgb2/P77XSyMgI/KiqqhInJVJ+oIODA38awMIz8dNA+ruioqLAD4F+NYU9Sn4CoVAowjzlwhSCoeukpCTgm1dZWRmugyLQr18/wmdKE1EeshIfd3d38CM9PT07Oxv8Brtz8QcOweN2nzx5UldXJ+w2EcBS06JCwjIIN9ASsLa2Bs5CCwsLYZrlUQbJ0cpfKhqwrlIYpJVWTtWvzJFhOpOSkkAbRKFQhDnRHTRoEPgRFRWFd0QvK5qamgoLC9PT02H7CA8M4/fALJqlS5eCvRJ//fUX3s8taNcyMjK+/vpr4O5LSl2FEaFw+Llw4UJlZaXoQxnklB2iC0gr9BZaoW0i4OjoCLJetl0y6ZFVnrZh5Y9AkAadTtSFSEpKOnjwYGhoKPRuT4DQKisqKh46dAiMaEZFRbm5uVlYWMyYMcPT01PgkQBi8u7dO/BDxMkE0DFgcnKywBvAyiIC8AgKNpstTkqk/ECZpIH0M+FRHMIOHFJRUdHQ0JCo7ZFGIJqamsK6U/BoBDAdBJdBqqmpwe1nBOBocVJSErxIOqI8ZCU+dDrdwcEBjI6HhYWBnY2hoaEKCgrA8wqgV69ePXr0yMrKYrFYT548AVZuaGioqqrqyJEjZas8UJJJSUl//PGHwKcpKyuDCiEpKUmg3OSh/2LSyl8qGtFnC5FWWjlVvzJHhumETYOhoaGw84Rg01BfX5+Tk9OrVy9ZfATvoKxTp06dPXv2zZs3DQ0N4rSPLWJkZDR9+vSrV6+Wl5cHBwfPnz8fBgFfX6AqkF5XxWlSSSCr7BDnqDm59hZaoW0i98mSdsnaT562YeWPQJAGWbxdhaNHj/r4+LDZbEVFxYkTJzo6OmpqaoJRurq6OuhjkMCXX36ppaW1bt060B7k5ub6NWNoaLh48eINGzZArzziU15eDn5069ZN2D1g6w6GYfhDJvHAoyPwQI+U4iPNB8oqDeSeWVlZ2aIYaTSapFYcaYGImD2AKayoqMArQGVlJXBhIoKysjL4m3REOclKfCZOnAgs3tDQ0JUrV7LZ7IcPHw4bNgycQYK/DXSF79696+Hh0dTU9PDhQzc3N3FOE5VIeaAkLzYjviTJvU7mtPKXikb0vBlppZVT9SsPZJVOiZoG0DrIxOItLi52d3d/+/YthmHm5uYeHh6mpqbwsKJbt249f/6c3JO/+eabq1evAhMXWrwfP368devWyJEjoXtbKXVVHLmRQFbZIdHEsjx6C63QNon/Rim7ZO0kT9uw8kcgSIMs3i5BZGTk6tWrMQzT1tZ+9OgRYU0gg8EQUb1Onjx50qRJkZGR58+fv3r1KmhUSkpKfH19T506FRISAo9hEBO42kfEQCAMgt0O+SHzD2wdxBFjOxEIITdhnpqamoaEhIiOi58jIh1RfrISk0mTJoG9xOHh4Q0NDbGxsQwGg3+tsoeHB7B47927B7alVVdXT5o0SebpgZLctWvX5MmTRd/cvXt3rMPS5l9KWmk7Vu0kk3RK1DTIsHXw8vIC5u7SpUuPHz9OWI9aWFhI2uIdM2aMjY1Nenr6ixcvEhISgCf/kydPstlseOKO9Loqp/qtrbKDdBpIJEBWbVNrdsk6ep4iEG0Fsni7BNDH46ZNmwRugRMNhUJxbebo0aPh4eEBAQHXrl0DY5yenp6ZmZngDDcx0dfX//jxI6jWhd0DgwQunpE5sv3A1kFXVxcshRIhxtra2lYTCNx6yg9MIZjqgXna1NQkbHuVQEhHlKusxGHYsGEaGhrV1dW1tbXPnj179OgRfuMuZPTo0VQqtbGxMSMjIzMzMzQ0VOBt0gPLoL6+vkSS7HC0+ZeSVlppCqPA7mx9fT2pL5BjOoXJSpymQVatQ0JCwuPHj8FZqYcOHZJo+6U4rFq1CpxLfLwZNpsdEBBgYGAwc+ZMWekqjCjbVSptkh3y6C20QtvUyl2yDp2nCERbgRYhdAngzhPodx4P9OHZIkpKSu7u7levXn327BlYaVlUVHT//n2JEgP9IkDPk/xkZmZK7/SCBDL5wNYBHvz7/v17gTdUVVVJb8WJL5Camhph/S24jRakGSpAcXGxiL4IP6Qjto6sRKCkpAS37IaGht67d09fX5/fcYi6ujrcsnuvGSsrq549e8o8PVCSWVlZWKemzb+UtNKSKIzQWhP4ooKCAmneLsN0tiirimZENw16enrm5uYybBwHDRoEz8Qm1z4KxNvbGwjh3Llz1dXVt2/f/vjx4+LFi/nXhZLWVXGaVBK0SXbIo7fQCm1TW3XJOmKeIhBtBbJ4uwTQ/4HANSrCRvuSk5M9PT1v377NHzR8+PClS5eC38KcLgirteEqTXjoHAEmkwlOccT7uZUHUn5g2wJOiQSufQXeAE/caTWBCHsjTCFIs5mZGdjAxuVyo6OjhSVm6tSpRkZGv//+O7xCOqI8ZCUpcA3z5cuXX79+7e7uLtA7NLztzJkzcXFxYnpplhS4ZvLZs2fC7omMjDQyMrK0tJT33KBcu3pt/qWklZZEYYTbwvPz8/ljkV6aKzprZFiLmpmZ9enTR3R+QQe5Hh4eMvGvLrpxFD0bJg46Ojpz584FdldQUNCxY8coFMqKFStkqKuwSRWRxePGjbO0tDxz5oz4Odsm2SGn3oK826bW6ZJJX1u2hzxFINoKZPF2CaBDQtg24ImIiBAYq6ys7ObNmzdu3BAYqqmpCX4QTp6AS9fwfu2nTJni4ODw6tUrDMNmzJgB/C6+efMmISGB/8nBwcGgOff09JTHBJeUH9hOmDt3LkhhQkICECyBgICAVhYIPIAez/Pnz4FPS01NTdDzwzBs/fr14MepU6cEPiotLS0kJKSkpAQesipNRCllFRwc/O233969exeTArg4OTc3l8vlCjNl4W2gqMpjEy8oWaBOePbsGTxPlcDx48eLi4udnZ0FTnzJlhYrjQ79peSUlkRhVFdXB9s7379/Dw5ZgeCPNpU+a+7cuePg4LBo0SKZ16Lr1q0DP/766y/+UDab/ffffxPulFXjGB8fz78anMPhiDiERkzglt09e/Y8ePBg4sSJAl2Ck9ZV2KTGxMRAZ7x4UlJSwsPD8/LyRo8eLX7Otkl2EJBVb6EV2qZW6JKJn3EiaPM8RSDajNY7+hfRdsCjDkxNTT9+/IgP+vjxo6mpKQh1dXXFB4FqV1VV9d27d4QH1tXVgVPptLW1q6ur8UH79u0DT7t+/Tq4UlVVBVZw5efngyuPHz8Gbv2GDRvGZDIJ6QF9I11d3by8PHEOVYdAl7yEDxEWkdwHkk7D9OnTQVBOTo5Mvgt4OcIwzM7OrqysDB8UGBioqakJmkY6nc4VD3ICodPpoBnW1NQMDAzEB5WUlNja2oJEHj9+HF7ncDgTJkwA169du0Z4V01NDVhjtmjRIkIQ6YikZXXr1i1YW0ZFRXGlAA6uA6c+wm6DtoGysnJNTU2LjxWhV1wu18fHB4RGRETgr0dGRsIyWFdXR4gFOj00Gi01NZUQRFr/RSBOpdH6Xyoa0YmRXmnJFcYlS5aAF3399deNjY3gYkNDw7fffgvXT9rb2/MnEpRifv3ncDjAreuAAQPgxR9//BHDsCVLlpBOpzDYbDZc/3/r1i1CKHTns3HjRv64ojVTGEwmE3w7hmG//vorIfTXX3+FZZagVxKB36vJ/13S6ypsUkeNGtXQ0IAPamhoAG7DQH6Jn7NSZof4BUQ0pHsLrdw2SaSB5Lpk4meciMTIr4iRq/wRiFYDWbxdAhaLNWzYMFAZaWtr7969+/79+8+ePdu3bx+dTofTTXQ63bsZ0KDCgUY6nX748OHk5OSSkpK0tLTg4GCwYUZJSQn2UCFpaWlgJYyLi0tKSkpGRgY4lWH06NH4286dOwfW8wwcOPDmzZv5+fnZ2dl//fUXmKPQ19d/+fIl/v79+/d7e3tPnToVJMna2hokFXQLbty44e3t7eXlxf8h69atExgxMTFR0g8kl4bz58+DH2ZmZiBo1qxZ3t7ev/zyizTfBVq+xYsXgyAjI6Nt27ZduHDhxIkT06ZNwzAsKChIWC9WGORyHL4FdMimTp164sSJCxcubN26FXYlFy9ezOFw8LEqKipGjRoFPF6uXr06Ojq6sLAwISHh5MmT4DxAFxcXgfYeuYhiyopGowEJw+7R5s2bYVd13759XCn43//+B54zaNAgEbfBdI4dO1bEbZmZmQL16vz58+AGEGpnZwdC3d3dvb29fX194RMuXrwIrEo7O7tz585lZWXl5+dHRER8/fXXFAqFSqUGBwfj3yiNropGdKXR+l9KQuze3t5Pnz4VFouE0pIrjOnp6fBkFFNT01mzZs2cOZNOp2tpacHZPx0dHZDgO3fuBAYGgt9grynUfyhbLpcLztrFMCwwMDA/P//27ds6OjpgRSjpdIqgvLx8xIgRIOLmzZsTEhKKioqio6O9vb3BixYtWgSNeYCwSt7b2zszM7PFN968eROu3vTw8Dh//vyLFy9u3Lgxa9YsDQ0NkBiBeiU+cBWJmZlZU1OTiDtJ6ypsUp2cnG7evJmXl5eenh4cHNy/f39wsaqqihBFdM6Syw5yBUQ0kvYWWr9tElY3rlu3ToZdMjEzTkSfh1yeyrXyRyBaDWTxdhWqq6tXrFhB2DSirq6+a9cu/mPlwGB2XV3dn3/+6ebmJtB95ahRo4Q1M4cPHya45bC3t//w4QPhtri4uPHjxxMeS6VSFyxYwD9eK2yLTmVlJZfL/fnnnwWGRkREwOPUCdy7d0/SDySXhh9++EHg9aFDh0rzXSBJbDbbz88PLh0EmJiYgC6moaEhMPDEVBJyOY63q69evWpsbIyPpampeeDAATabzR+RxWLt27eP3xuknp7ejh07CMP50kcULSvYAQKsWLECxIqOjgbSEDiLJREPHjwAD9+yZYuI24KDg8UxsIVtM/Px8QE3CAwljL7Hx8cL3FHs5uYWGxtLeKOUuioaEZVG638pCbGDrdciIkqqtKSr3/DwcGhsAPr375+QkMAvKF9fX4EbSvGy5XK5hYWFBC9rVCoVKifpdIqAyWTu3btXT0+P8DRra+ugoCD++4VV8hiGRUdHi/PGBw8e2NjYEOKOGDEiISEBrh2QZv6qpqYGHHPKP43MD2ldFdik0mi0NWvWCBw9FJ2z5LKDdAERjUS9hdZvm4TVjRYWFjLskomZcSL6PKSLmFwrfwSidaDIzykcoh1SXl7+/PnzgoICKpVqbm7u4uIChvZFU1tbm5iYmJGRUVVVRaVSjYyMBg4cKPrsyrKysqioqKKiImVl5T59+jg7OwtzgVBSUhIdHV1UVESlUk1MTEaMGCHibHQ5QeID2xUsFuvJkye5ubk0Gs3Kymr48OFgGVi3bt1qa2ttbW1TU1PlJxAjI6Pi4mI6nV5UVAQ2Aj1//jwnJ4fJZFpYWLi6usJJJ4FwOJzY2NiMjIyKigoNDQ1bW9uBAweKcwwguYjCZCWClJSUFy9euLm5WVtbY52R0tJSUAZBH9HJyalNlF/8SqPjfikJpSVROzU2Nr548QK4t+3du/fw4cOlTDaXy42JiUlOTq6vrzc0NBw1ahQYTZMynaLhcDgxMTGZmZkMBkNPT69vM5jcAKZmYmJiTU2Nrq7u4MGD27a8k9ZV2KRSKBQLCwtnZ2fCMJ+kOdsm2SGT3kJbtU3y7pJJlHEiaA95ikC0GsjiRSA6J5WVlWCl0/jx4+V6wBKhV4FAIBAIRJuD2iYEAgFBvpoRiI7Ks2fPFi5cmJubKywU/HBzc2vddCEQCAQCgUAgEO0FZPEiEB2VjIyMwMBAeJYAgYMHD2IYpqKiAt23IhAIBAKBQCAQXQ0BriYQCEQH4pdffrG3t4dOFDEMq6ur27hxY3h4OIZhfn5+BJ9MsqK8vLy6uhpsjgL/g9lmTU1NsJoagUAgEIhWBrVNCASCH7SPF4HoqFy/fn3WrFmgCPft27d///7a2tpFRUWRkZHl5eUqKip+fn4rV66U09tXrlx54sQJ/us+Pj5+fn5yeikCgUAgECJAbRMCgeAHzfEiEB2VGTNmfPjwISQk5OnTp+/evXv69Gl9fb2WlpaDg8OYMWOWLl0qp9ldwNSpUwmHPQCcnZ3l91IEAoFAIESA2iYEAsEPmuNFIBAIBAKBQCAQCETnBHmuQiAQCAQCgUAgEAhE5wRZvAgEAoFAIBAIBAKB6JwgixeBQCAQCAQCgUAgEJ0TZPEiEAgEAoFAIBAIBKJzgixeBAKBQCAQCAQCgUB0TtDpRIgOT1hY2J49e/BXLl26JNeDeRB4amtrJ0+ejL+ybt26qVOnYp0FpGAIQF1d3cWLFyMiIoqKimg0mpGRkZOTk7u7u4WFBelnzps3r6ioCP7p4eGxadMmGaUXgUBIS0VFxYwZM4Q1cAcPHrx58yYM0tXVvXbtWhdseo4ePRocHCwnOSAQMgFZvIgOT01NTU5ODoZhJSUl9fX1GIYxmcy2TlQXgsPhAPlXV1eXl5djGObl5YV1ItqhgjEYjKlTp759+3bfvn3Lli1r28R0Ed6+fTtlypT8/HwqlWpra4th2J07d06ePKmlpVVZWUn6sfnNNDQ0FBYWYhhmaWkp01QjEDKja1Y7bDZbRANXVlYGQvPy8jgcjmzN0XbY9AijvLxcfnJAIGQCOo8X0QFIS0sD0yBOTk7q6urCbvP09ASjrTk5OdLMuiDIceLEiZUrV2IY5u/vv2LFCqzj0OEUDIpaSnOrQ4i9PcBisWxsbD58+GBjYxMWFgbs0ri4OBcXFyqVKiILWCxWdHQ0hmH6+vp9+/YVdtvbt28dHBwwDPP29j5z5ozcvqOTIKZUEbItjJ2j2pFTA2dkZFRcXEyn0/FLNjpf09Mi5OTQOZoJRDsH7eNFdAD27Nnj1kxGRkZbpwXRCelwCtanTx/ww87ODuuwdCCxX7169cOHDxiG/fDDD3Aa1tHRcebMmaIjFhUVgW/csmVLq6S0S4Ck2iaFsXNUO+2KDlQHthVIRAhZgVY1IxAIRAdj5MiRUVFRiYmJ8+bNa+u0dAmioqLADzATCzl+/Pj+/fvbKFEIRKuCqh0EAtFxQRYvAoFAdDxcmmnrVHQVSktLwQ8tLS389W7NtFGiEIjWBlU7CASig4JWNSMQCAQCIYqmpibwQ1FRsa3TgkAgEAgEQjLQHG/XIiUlJSoqKiUlpby8nEql0ul0Z2fniRMnqqio8N8cHx/PYrHgnwYGBj169AAPuXbtWk5ODpvNNjIyGjx4sMDNbAkJCffu3cvKyqqrq9PT03N0dJw4caKhoaH4qW1sbHzz5g1+giUhIQHvq9DMzMzExERY9KqqqqCgoMTExLq6OisrK09PT3t7exGvEz/BwiTz4sWLkJCQvLw8DQ2NoUOHzp49W1VVVZwvZTKZb9++xV/p37+/mpoa/DM2NpbNZsM/bWxsdHR0+L/39u3br1+/LisrU1BQMDY2dnBwGDNmjIGBgbD3VldXh4WFRUdHl5SUqKqqmpmZjRkzZtiwYRQKRURqq6urr1+/HhMTw2AwjIyMhg8fPnnyZCqVirWWZkrzyW2oYOSkTaCsrCwzMxN/xdHRUVlZWRrNzM7OLikpgX9SqdSBAweC61euXMnKymIymebm5tOnTwfXIRkZGZ8+fYJ/6ujo2NjYwD+Liopyc3Phn2pqav379ycn9tjY2PDw8IyMjLq6Ok1NTVtbW2dn5yFDhigokBm0raure/jw4bNnz4qLi6lUqomJyZgxY1xcXPitWSht4KMVeKuCHln09PR69uwp7C1AqsADM3jCy5cvYSiFQhkyZIiIREpamUhf38qqZhNTzxsaGuLi4vijA32uq6tLTEwkBDk5OX348EEaqUqjDKSLicwbmhabYPGrUzELo+hqh0BqampoaGhGRkZVVZWenl6/fv0mTZoksCKVeUsq7xZHVnTEpofAmzdvbt68+eHDBxqN1qNHj9mzZ4vjZ17mmknu4YguChfRNQgMDLS2tgaZrqSkZGFhAZtYfX39c+fO8UchuAT09vZuaGhYvHgxQYW0tLQIETMzMydMmABCdXR0LCwsgDmkrKy8YcOGhoYGMdPcoq8/X19f/P3Tp08H13Nych4+fEhYf4hhmI+Pj8AXSZpgfskwmcxZs2YRXmdqapqYmCjOl6amphLixsfH428gfMuNGzcITzhy5AhwY6igoGBiYgIzl0KhuLq6Pn78mP+lhw4d0tbWBtNWFhYWenp6IIq9vX10dLSwpF69elVfX5+QWmtr64SEBH9/f/Cnv78/V56aSfqT20rBSEubH35Hvjk5OVJqJsHvKJ1Ob2pqWr9+Pb9AZs6cWVFRASPOnTsXHzp9+nR8Uv38/PCh9vb2JMSem5s7atQocF1DQ8PCwgL2sw0MDHx8fMSvTwAnTpwACqygoGBqagpP0bC1tb1//36L0sYzd+5cES8S7a5cRUUFf3N8fDzpykRW9a1Majbx9RycZcIP0GcoEDyVlZUSSVW2ykC6mMiwoWmxCZa0OhWzMIqudvB5OmXKFHCDhoaGpaUljUYDyrBq1arq6mp5t6RybXFEN3BAeeh0ujhp6IhND6S8vFzgJMemTZvYbLYwOchJM8k9HNE1QRZvVwHUmDo6OkFBQY2NjeBiZmYmPFnuxIkThChXrlw5c+bMzp07YWvk7e2trKy8YMGCAwcO7Nixw9zcnN/ijY+PB30IKysraHVUV1f7+vqCAcUJEybABIimrq7OvxlnZ2eQhs2bN/vjiIuL4/9GDMNu3bqlrKw8atQoX19fPz+/+fPnwwH7wMBAwltIJDgoKMjf33/z5s1QMl5eXvr6+hs2bAgICNizZw88MKNXr17i9DgrKioIX0qweE+fPu3v7z958mSBFu+xY8eApbd///6amhpwsbS0dO3atcKaQ3ia4tq1a8vLy8HF2NhYR0dHDMNoNFpYWBh/Oi9cuABkoq6u7uvrm5SUlJOTExoaOnbsWD09vW3btpGweEloJrlPbisFIy1tgaSlpYG0DRgwAPaBpNTMyMhI8EwNDQ3QWfnxxx81NDT27NmTmJgIstjV1RVEdHJyggJ/8OCBv7//rl27BFq8YBAEdhOhxSu+2Kurq62srDAMGzx48Js3b8BFNpsdFhbWq1cvELeyslJM0XG53G+++QbEWrlyZVFREbiYmpo6btw4YPacOnVKtLR37doF0/ngwQMR7wJShcIZMGAA/htPnjwpzOL18vLS1tb+7rvvDh06tH37djhtLrAykWF9K33NJpGeV1dX+/v7Hz16FHbfvby8/P39gV1UVlbm7++/YcMGvOhYLJZEUpWtMpAuJqRzikQTLGl1KmZhFF3tABISEoC1Y2pqevfuXTabzeVymUxmQEAAWK/k6OhYVlYm15ZUfi2ObC3ejtj0AGpqapycnMAzR48eHRoampOTk5iY6Ovrq6GhsWXLFmFykJNmkns4omuCLN6uAqgRQkND+YM8PT3BmsPS0lL+UNgVs7KyotPpycnJMKigoEBNTQ3f3DIYDNBDVVdXz87OJjzqt99+A4/6+eefJUq8t7e3QDtQ4DeCpO7duxcfdP78eRDk6OiIvy5NgqFkLC0tbW1tS0pKYBCTyYQ+XW/duiWrL/3555/5Ld7GxkYwartgwQL+KOD8QIL5d/jwYfCcb7/9lnB/RUWFsbExGBnFfxGYbQNOeqhUKmFsmMPhfPHFF3DtEAmLVyLNJPHJbaVgpKXdIvhRf1lpJuisKCkpqaqqxsbG4oPYbDacvVmzZo3AyTqCxQshWLzii/3gwYPghqysLEJQRkYGmOEX3+I9evQoeNrixYsJQSwWa/DgwWAa5OnTpxJJWzQtCoc/y6ytrT9+/AiD6uvroZlByDI51bfk9Ie0nl++fBlENDIywpf0xsbGoUOHqqmppaamkpOqnJSBRDGRSUMjThNMuqGXtA4kFAQGgwEWJKuqqqalpRFiXb9+HcTy8PDgcDit0JK2+AkkRCRDi7fjNj3fffcdLHqErIyNjVVVVVVSUhJh8cpJM0k/HNGlQBZvV2HZsmVDhw4VGPT06VNQoRw5coQ/FL+67NKlS4TQxYsXu7i4wD+3b98O7ty4cSP/oxoaGsAgt5qamkQzM5K2Cs7OzvyhcMtHVVWVTBKMl8zDhw8JoSdPngRB69atk6vFm5KSAi7u3LmTP0psbCzB/GMwGGCOgkajwUFfgWbGli1b+C1JDMNWrFjBHwvsghPRIZChZkr6yW2oYKSlLROLV1LNhKs6BUovJycHzCcoKioWFBTgr8M+kMCkkrZ4Z8+eDUwLMF9EACx5ELMmgRmhrKxcXFzMf0N4eDhIzMCBA9vQ4sUw7N69e4TQgIAAgVkmp/qWhP5IqedLliwBoZMmTYIXf/zxRwzDCBOtMrF4pVQGEsVEVg1Ni00w6YZeSosXtk3CKl7o4fn27dut0JKKgLSI2oPF27ZNT35+PtBtJSWlvLw8/hvWrFkDnskvB7lqJumHI7oUyFdzVyEgICA6OlpgEFw1J+wGgI6ODv/mjT///BOeVMnlco8fPw5+Ezb4AahUqru7O3AWAsf15cGCBQv4L0JvItnZ2bJNsKGh4ZgxYwgXBw0aBH4QHH7IHLioKSQkBO/dCuDg4BAfH79x40Z45dy5c9XV1RiGjRs3jt/9FYZhU6dOBT9Onz4NLzY1NZ07dw78/uqrr/hjGRoajh07tnU0U9JPbisFIy1tWUFaM7/88kv+ixYWFqDbymazoTLIFZDRTU1NoaGh/KEnTpyIj48HvboWgRkxatQogV6C3NzcgMOzN2/eiK4J5YqBgQHc6ik6y1qhvhVff6TU80OHDtna2mIYdvfu3UOHDmEY9ujRI19f39mzZ0NjWIbIShnELCayyqkWm2CZNPQkgNtMMAybM2eOwHvgEb5w4rGtWtI2EVHnaHrOnTsHGtyRI0eampry3yCwb9AKYu/QeYpoNZDF2xVhMBjZ2dlp/wDHy/GOKPlxdHQE61WEkZSUBLzqKSsrw5VIBPr16wd+4BtpmQP2qBAAa3jAOKhsE2xvb8/v89DIyIjwOjlhbW0Nlvi+evVq9OjRT548wYcqKira29vjXRo+fPgQ/IDbY/gfCNYnFxYWwhb07du3NTU14DfcxiOO2OWhmZJ+clspGGlpywpymkmhUIR5/oSOcOHAuVyBQpszZ87u3bvxfqExDOvevbu9vb2Y7pphRgjTXgUFBZitcIqv9XFwcODPMoGq1Qr1rfj6I6Weq6mpXbp0Cfgk27Bhw4MHD+bPn29mZgYnt2WLTJRB/GIiq5xqsQmWSUNPgqSkJPBMCoUizE81NFyjoqIaGxvbSUvaaiLqHE0PVE5hHtEF5mAri73D5Smi1UCnE3UhkpKSDh48GBoaCo92IIA/J4CfFg+6gGtN1dTUhI3jAnfzIDGY3OB3JgzW9oAfcFZQVgkW83VyQlFR8dChQ2BsNSoqys3NzcLCYsaMGZ6engLP2IBfnZSU9Mcffwh8prKyMlCGpKQksP0sPT0dBNHpdGEHRUh6FAppzZT0k2WO+DlOTtqtn048mpqawo5zAFv1MAxLS0vD5M/KlStPnTqVlJRUV1e3ZcuWn376ady4cZ6entOmTYOdPDF59+4d+CHiCA3oOTY5ORlrI0iolvzq29bUc3t7+717937//fcNDQ0TJkxQUFCIjIwEPmZljkyUQfxiIqucErOClbKhl0aehoaGUD2EybO+vj4nJwd6nmuTlrT1RSQr2rbpgd0AYTerqKhoaGgIG5uQq9g7bp4iWg1k8XYVjh496uPjw2azFRUVJ06c6OjoqKmpCUbj6urqoDdIEbR4phk8srKysvL7778XfXNZWRkmNwSeE8g/FySrBIv5Ovnx5ZdfamlprVu3DnSwcnNz/ZoxNDRcvHjxhg0bdHV1+b/6YjNifnVlZSX4AZxXCURYX0ceminRJ8sc8XOcnLRlBTnNFFHSYe5XVFRg8kdFRSUqKmrTpk2nT59uauZeM6tWrRo9evTGjRvBWlBxgBkhQoHhAmnCZHJrQkK15FfftrKe+/j43L9//+7du2DZ5IgRIzD5IBNlEL+YyCqnxDlWVPqGXt7yBCIVaPG2TkvaJiLqHE2PmN0AgRavXMXeofMU0Wogi7dLEBkZuXr1agzDtLW1Hz16RFgYw2AwZFIjQMdFpqamISEhom9uhYm4zpdgDocjLGjy5MmTJk2KjIw8f/781atXQS+tpKTE19f31KlTISEhQ4cOJXz1rl274HFHwujevTv4AVfTyXbKWhrNFP+T2xBy0m63wNyH3yVvtLW1T5w48euvv166dOnixYvPnj0D+wYfNePt7X369Glx+sTiKHDrf12nqb5kpecTJ04EFu+TJ0+CgoJEbAuUBnkrAyFuq+VU6zT0UsqzbctXW4moczQ9pLsBchV718lThJQgi7dLAJ3ybdq0SfrNli2ut2lqahK2wald0Z4TLLBFqa+vFxGFQqG4NnP06NHw8PCAgIBr166B4VtPT8/MzExwKKK+vv7Hjx/BD/G/Gk6ZMhgMYffU1tZirauZYn5yG0JO2m1LXV2dsCCY+wKn0EkorZgYGBisbiY/Pz8oKOjIkSP5+fngCEp7e3t4CLM4GSFCgWGQwKWD7Y12VX3JRM/fvXu3adOmXr16ZWRkAOfwzs7O1tbWsk6sbJRB/GLSajnVOg09P/ADxZFn25avthJR52h6dHV1wZphSbsBchV718lThJQgz1VdArhHCJ4QgAceHyIl0DVFcXGxiN5A+6EdJhiOoQpMT0FBgZgPcXd3v3r16rNnz8BK46Kiovv37xO+OisrS/yEwRNBKyoq4HIpcsmTh2aK/uQ2hJy025aamhphG7HgPi6oD7JSWjExNTXdtGlTRkYGOLgIw7AzZ85IlBEZGRnC7oHOYMFxrO2cdlV9Sa/nLBZr3rx5SkpKYWFhmzdvBno4b948YV6OpEEmyiB+MWm1nGqdhp4f+IEVzYiWp56enrm5OdZGtJWIOkfTA6v99+/fC7yhqqpKoMUrV7F3nTxFSAmyeLsEcMu+wNVEIobrJMLMzKxv376gihHhCH7q1KlGRka///47iVfItvJqhQRLCvTUAqawCLx48YL/YnJysqen5+3bt/mDhg8fvnTpUvAbunOAC5zAAlGBREZGGhkZWVpawgm6Xr16wdMIIiMjBcYi4f2fnGZK+sniI/PWkZy025yXL18KvA7dYuNPohKttM+fPyct9q1btwo8AEZFRQUe9yJmLk+aNEm0l2kmkwlOcsYwTPztwW2oWu2q+pJezzds2JCQkBAQEGBlZbVjx47hw4djGBYbG7t161aZS1VWyiBmMWm1nJJJQ09CpGZmZn369BGtANDNr4eHhzjufDt0X4gEHaLpgdU+4XyEFkuEXDWz3eYpor2BLN4uAXQdCVtxPBEREbJ60fr168GPU6dOCbwhLS0tJCSkpKRkypQp4j8Wrk3Fj/dPmTLFwcHh1atX7TDBpLGzsxPWFQsNDRV4hEBZWdnNmzdv3Lgh8IGamprgBzytx9PTE+jDs2fPhHncPX78eHFxsbOzM94t84oVK8CPEydO8EdJTk4WaJDLQzMl/eQ2VDDS0m5bTp48yX/x+fPnwJGspqYm/lhRdXV1sA3s/fv34BQWCJfLPXr0KGmxP3369MKFCwINaXV1dbDjUcxcnjFjBnDM++bNm4SEBP4bgoODQbfP09OzZ8+emIwQ+I137txxcHBYtGiRlA9vP9WXlHoeEhJy+PDhRYsWgVNbFRUVz58/r6WlhWHY3r17Hzx4IFupykoZxC8mrZNT0jT0UtaB69atAz/++usv/lA2m/33338T7pSesLCw35oR3xV5q/WFOmXTM3fuXNC8JiQkCEyesOPE5KqZ7S1PEe0XLqILAH3Tm5qafvz4ER/08eNHOHfn6urKHzc+Ph6Eent7t/giDoczYcIEcP+1a9cIoTU1NWBVzKJFiyRK/759+8Azr1+/Dq5UVVUBp4X5+fnwtunTp4PbcnJy+B/i4+MDQiMiImSSYNGSgV4NBUpVGB8+fACx1NXVX79+Da/HxcXR6XS4aOfGjRswCFToqqqq7969Izytrq4OHPOora1dXV0Nr0dGRgJnP8OGDaurqyPEAl0TGo2WmppKkAY8zOP48eP4oIqKCkdHR3hwor+/v1w1k8Qnt5WCkZZ2i4hIDGnNpNPpoIehqakZGBiIDyopKbG1tRWY+1wud8mSJSDo66+/bmxsBBcbGhq+/fZbqLT29vaSit3V1VVY6Tt37hyIu2vXLvEExn38+DHMCCaTiQ/6+PEjsJx1dXXz8vL444rOehFwOBzg13TAgAHw4o8//ohh2JIlS6TMMjnVt+QSQ1rPCwoK9PT0bG1ta2tr8devXLkCXkSn00tKSkhIVU7KQKKYyK+hkVVDL2UdyGazx40bB4Ju3bpFeDh0HbRx40ZJP1BEfbVgwQIQFB4ezhUPaUTk7+8vooEDWkGn07mS0OGanmPHjoF32dnZlZWV4YMCAwM1NTWBgUqQg1w1U5qHI7oUyOLtErBYrGHDhoFir62tvXv37vv37z979mzfvn10Ot3DwwN2LLybATXg/v37vb29p06dCkKtra1B6Lp160S8q6KiYtSoUWCcfvXq1dHR0YWFhQkJCSdPngQn8rm4uNTU1EiU/rS0NLAOysXFJSUlJSMjY/78+RiGjR49msvlZmZmgoSZmZmBpM6aNcvb2/v8+fMgOgiF06fu7u7e3t6+vr6kEyxMMqBRuXHjhre3t5eXl0Cptgico1BUVHR1dfXy8hoxYgSFQlmxYsXPP/8MgkaPHu3t7b106VJo/oEXHT58ODk5uaSkJC0tLTg4GOxAU1JSgk0F5OLFi6DNsLOzO3fuXFZWVn5+fkRExNdff02hUKhUanBwMH/a4uPjdXR0wOumTJkSEBBw4cKFbdu2GRsb9+/fHzqQcHZ2Bp/MYDDkoZnkPrmtFIy0tAXy9OlTgYn55ZdfpNdM2GkDnaGpU6eeOHHiwoULW7duBUEYhi1evJjD4RBSlZ6eDo9OMTU1nTVr1syZM+l0upaWFjyrU0dHB7zuzp074ogdWrwYhs2ePfvBgwf5+fkfP3589erVpk2bwOtcXFwI5opozp07B1a+DRw48ObNm/n5+dnZ2X/99ReYo9bX13/58qU40vb29t6/f7+YL4UOhwMDA/Pz82/fvg0K0ZMnT6TPMtnWt1ImRlI937Ztm7e3NxiiGj58uLe3N5S/r6+vt7c3mObFMMzBwYFQpkRLVR7KACFXTGTY0AhrgslVp+IURtHVDqC8vBwcKKWkpLR58+aEhISioqLo6Ghvb28QZdGiRXA4TCb6BgcRPnz4IGamkxARg8EAv52dnQkNXF1dXWBgIPgN/EfQaDTwJ2wdOk3TA+BwOIsXLwavMzIy2rZt24ULF06cODFt2jQMw4KCgkARgHIAQ0Ly00wpH47oUiCLt6tQXV29YsUKwj4HdXX1Xbt28R/FBkYKhe1fsrCwEP0uFou1b98+fn+Menp6O3bskKiHCjl8+DDhJDp7e3vQzgnbGeXj4wPiCgzFD/hJmmBhkqmsrORyudAuFSjVFmEymYsWLcLvdFJRUfnhhx84HA7hySoqKmBW888//3Rzc4MOhPCMGjVKWL8tPj7e3d2df0uVm5tbbGyssOSlp6ePHj0af7+CgsKcOXMqKyvhEDikqKhIHppJ+pPbSsFIS5sfYY6ahg4dKr1m4qcprl69amxsjL9NU1PzwIEDbDZbYMLCw8NhtwzQv3//hIQEfvngO2QixM7lct++ffvNN98IPDlDV1d327Zt9fX1kmZ0XFzc+PHjCU+jUqkLFizgn9AT4RbL3d1dzDcWFhYOHDiQ8Lp9+/bJqjKRYX0rfWIk0nN+F7IXL14kDHYIK1OipSoPZYCQLiayamhENMEkqlNxCqPoagfCZDL37t2rp6dHuM3a2jooKEi2+tbU1ARe1L9/f5GZLK2IioqKBCYDpBNu9hHWOnSapgfCZrP9/Pzg7iGAiYkJGGWGgz6AFStWkBO7mCKS/uGIrgMF+THrUpSXlz9//rygoIBKpZqbm7u4uICBSXnA4XBiY2MzMjIqKio0NDRsbW0HDhwozUF8ZWVlUVFRRUVFysrKffr0cXZ2lq0DDJknWBry8/OfP3/+6dMnY2PjYcOGEVoRgdTW1iYmJmZkZFRVVVGpVCMjo4EDB7Z4zl5paWl0dDQwTel0upOTkzhH871///7169eVlZVGRkZDhgwRf8esbDWT3Ce3lYKRlnarYWRkVFxcTKfTQSePzWY/f/48JyeHyWRaWFi4urrCiVyBNDY2vnjxAvi/7d27N3A+JBOxZ2VlgZl8JpOpqalpa2vr6OgoTdksKSkBGUGlUk1MTEaMGAFWycoJLpcbExOTnJxcX19vaGg4atQoQ0ND2b6iXVVfraPnspKqpMogZTFphZwi3dDLpA7kcDgxMTGZmZkMBkNPT69vM5isuXfvHpi+O3HixPLly9tzX6hTNj0sFuvJkye5ubk0Gs3Kymr48OHinIsuV81sV3mKaIcgixeBQCAQArryCASCH1RM2hwmkzlgwID379/369cvNjZW9BADAoFAIF/NCAQCgUAgEIiOQXV1tYeHx/v3742NjW/duoXMXQQCIQ7I4kUgEAgEAoFAdABYLFZZWdmQIUNevnxpZWXV1slBIBAdAwF+XxAIBALRdSgvL6+urgY7EsH/ubm5wAcPdM2NQHRxUDFpJ+jr6z99+rRbt27gRG4EAoEQBzTHi0AgEF2azZs3WzYD3FqWlZWBP3fs2NHWSUMg2guomLQftLS0kLmLQCAkAs3xIhAIRJdm6tSphBNWAPD8SQQCgYoJAoFAdFyQr2YEAoFAIBAIBAKBQHRO0KpmBAKBQCAQCAQCgUB0TpDFi0AgEAgEAoFAIBCIzgmyeBEIBAKBQCAQCAQC0TlBFi8CgUAgEAgEAoFAIDonyOJFIBAIBAKBQCAQCETnBFm8CAQCgUAgEAgEAoHonKDzeBFdjqNHjwYHB8M/dXV1r127hnVY5s2bV1RUBP/08PDYtGkT1v5gsVilpaUMBkNDQ8PAwEBVVbWtU4RAdGzCwsL27NmDv3Lp0iU6nd52KerAHDx48ObNm52mXUDIkE7WZ0AguibI4kV0OcrLy3NycjAMy8vL43A4knYQz5496+Pj07t37zt37ujq6mJtTX4zDQ0NhYWFGIZZWlpi7YmEhIQzZ86Ehoampqbir/fo0WPQoEHu7u4TJ07s3r07Pig6Ovr7778X8UwFBQVNTU0rKys3NzdPT08VFRUY1NDQMGrUKIGxjI2Nr1+/TrgYFxe3atUq/pvXrl07d+5c+Oe4ceNqamqWLVu2ZMmSlr4YgWglampqQFVWUlJSX1+PYRiTyWzrRHVUysrKpGkXEJ0YKfsMCASiPUDhcrltnQZEeyQtLQ3MHDo5Oamrq2OdESMjo+LiYjqdjp8jFTMWhmF+fn4+Pj6YnGGxWNHR0RiG6evr9+3bV9htb9++dXBwwDDM29v7zJkzWDugtLT0+++/P3/+PLA2PTw8LCwsVFVVy8vLExMTHz16BProGIa5ubktW7bsyy+/BH8+ffp06dKlGIYxGAyQNWpqamZmZiCUy+VWV1cD8x7DMAMDg6NHj86ePRv82dDQMGDAAAzDGhsbs7KywEVbW1sMw7p37x4eHk5IZExMzIIFCzAMq6qqKiws1NHRMTQ0xDBs8+bNX3/9NbxNW1ubwWD8/PPPP/30k5zFhkBIjKenJ5ifzMnJsbCwaOvkdMV2AdEVQLqBQHRc0BwvQjB79uwJDAzEMCw+Pt7e3r6tk9OO6Nu3L7B47ezsWuF1RUVFbm5uGIZNnz79xo0bWAfh3bt3kyZNysnJ0dXV/eOPP7766isKhYK/oaqqavfu3Xv37uVyuREREe/evYMWr4uLC5gQDgwMXLhwIYZhI0eOvHfvHj56YWHh/mZKS0vnzJlz9OjRb775BsMwZWVlEDc3NxdMd6uoqBCml/EMHjwYhF66dGnevHnLly/39fWVm1QQCAQCgUAgEK0N8lyFQEjGjRs3/P39w8PDJ0yY0NZpaacUFBSMGjUqJydHR0fnyZMn8+fPJ5i7GIZpamr6+voeP36c3CuMjY337du3e/du8KePj096errUCUcgEAgEAoFAdDaQxYtASIaGhsaKFSvGjBnT1glpp7DZ7Dlz5pSVlQGHH/369RNx84oVKzw8PEi/a926dXp6ehiGNTU1kTaeEQgEAoFAIBCdGGTxIhAIWXL58uXnz59jGGZvb+/l5dXi/Rs2bCD9LmVl5WHDhoHfkZGRpJ+DQCAQCAQCgeisoH28XYvY2Njw8PCMjIy6ujpNTU1bW1tnZ+chQ4YoKHwe+2hsbHzz5g1wOwSuJCQk4P1/mpmZmZiYEB5bV1f38OHDZ8+eFRcXU6lUExOTMWPGuLi4KCoqEu4sKyvLzMzEX3F0dFRWVmYymVeuXImLiyspKdHQ0LC1tZ0+fTq/2+GEhIR79+5lZWXV1dXp6ek5OjpOnDgRuBoSwZs3b27evPnhwwcajdajR4/Zs2eTc2gcHx/PYrHgnwYGBj169BAd9OLFi5CQkLy8PA0NjaFDh86ePVv8U3mys7NLSkqgi6by8vKXL1/CUAqFMmTIEBHRJXp1dXV1WFhYdHR0SUmJqqqqmZnZmDFjhg0bxr8auUXgSuP58+eLc/+oUaM0NTUxshgYGIAfUGPbZ8kSjbByUVlZGRgYmJSUpKqq2q9fv6+++grvRi4zM/PixYsZGRk0Gm3IkCFz585VU1OTPouFKXNERERoaGhJSYm5ufnkyZPx6sdms4ODg6OjoysqKszNzWfMmDFw4EAR3yt+jSEsMSkpKdeuXcvJyWGz2UZGRoMHD3Z0dCwpKSFEV1FRAR7dgM+zV69eEW5wcnLif6k4ycYwTE9Pz87ObuTIkcA1Gj8pKSlRUVEpKSnl5eVUKpVOpzs7O0+cOBHvXVwYqampoaGhGRkZDAZDXV3dwsLCwcHBzc1NRBZDqqqqgoKCEhMT6+rqrKysPD09RftiIFevtqGs5FHfCiM7O/vKlStZWVlMJtPc3Hz69OmidVu21SmgpqYmIiIiLi4uNzeXyWRqamra2dlNmDBBmDClyQhyUchpkaTVJolqtm37DAgEoh3BRXQNcnNz4aktGhoaFhYWysrK4E8DAwMfH5+GhgYul9uiB0JfX1/Ck0+cOKGvrw/OjDE1NYWO+21tbe/fv0+4md+NcE5OzvPnz/nd/fv5+eEjZmZmwn2zOjo6FhYWVCoVzPJt2LABJJ6f8vLymTNn8n/Fpk2b2Gw2eCmdThdThgQnqN7e3iKCmEzmrFmzCO81NTVNTEwU83UrVqwQkREqKir4m+Pj40m/+tChQ9ra2hiGKSoqWlhYgHXCYJI2OjqaKwl4H1HifymLxWIymfzXoba4u7sLiwu9NPft2xd/HRwmwS8oYVy8eBEohsBQLS0tDMN+/vln0iVLNALLxcOHDwljAXp6epGRkSDKzp07CaaaqalpSkqK9FksUJn5y5GXl1dTUxOXy83KyrKxsSGErl27VtjHSlRj8CemoaFh8eLFhNdpaWkJLC8WFhbwUQJP7qmsrOSKh7+/P0g2hULp3r07lCGGYTY2NgcOHOBwOPDmwMBAa2trEKqkpGRhYQE72fr6+ufOnRPxouzs7ClTpoCbu3XrZmFhoaT0eWxaRUVl3rx5/CVr+vTpeLUB6orHx8dH4LvI1attLit51LcQ2C40NTWtX7+eX2dmzpxZUVEhLLoMq1Mul1tSUjJr1iyQKeAkWEtLS1jDTJs2rbi4WFYZQToKCS2StNokUc22hz4DAoFoPyCLt0tQXV1tZWUFPNO+efMGXGSz2WFhYb169cL3/Orq6vybcXZ2Btc3b97sjyMuLg7/ZOAgF8OwlStXFhUVgYupqanjxo0DPdpTp07h78/IyDjTjKOjI4h49+5dGo3Wt2/frVu3Hjx4EK6DxVu88fHxoA22srJ6/Pgx/ChfX18waj5hwoTGxkbCV9fU1Dg5OYGnjR49OjQ0NCcnJzEx0dfXV0NDY8uWLZK2XkFBQf7+/ps3b4bdLBFBXl5e+vr6GzZsCAgI2LNnDzxYqFevXmL2IyMjI/39/Xft2gUiDhgwAJ8RJ0+eFGbxenl5aWtrf/fdd4cOHdq+fTu0RgS+etmyZSB07dq15eXl4GJsbCzIIBqNFhYWJqZ8uFwu3EyrpKREursskcULFBtMKcvP4v3yyy+nT59+8eJF0iVLNPzl4vbt2yoqKhMnTty3b9/vv/8O941raGgUFBT4+fkpKirOnz/fz8/v119/hZul7ezs+AuCpFl85cqVM2fO7Ny58//snXdYVEfb8A+9Sa8qVaIEG2BQUVGxoVgxRCMmZiOaWJLIYywktmhiIXkwYl/QqCQgGmyAisYOqKgEV1pEASEiTQQWEJay7He93t8713nPObvsnt2lzu8PruVMOVPuuWfmzMw9SKIWLlxoYWGxdu3affv2ffvtt8bGxuC0Zs0aPp9va2s7YMCALVu27N27NyAgAI3OT548Sc+prBqDnhgOh6Opqblo0aJff/1127Zttra2MOOF9jJy5Ejw6e/vz+Vyo6KiUFQtLS3QdgYOHEgQxPbt27lcbmNjo0yfn7788suSkhJ4+Pr166CgILS+RP5qA1NQY2PjqKgoVCN5eXlIv4WFhTG+iMfjwXyvb9++Fy9eFAqFkPLr16+jWqZLKZrxxsXFaWpqjhs3Ljg4ODQ09NNPP0WfRSIiIujvYqFXO0NZKUPfIlC/8P333+vr6+/atSsjI6OgoCAhIWH8+PEQrbu7e11dHT2sYtUpWbH7+fnl5+fDw8bGxujoaNje4uTkxOfzFVIR7IKwkCJZ1SYLNdtJxgwYDKbzgGe8PYI9e/aAEkddJiI3Nxf2SVI6DA6HA0F4PJ64aA8ePAh+AgICKE6NjY3Dhw+H79zJycn0sGiI1q9fv1WrVsHADvjPf/5DnvHy+Xzo7fT09F68eEGJ5+eff4Z46Otv33zzDTjNmTOH8lk6NTVVR0cHVk5k7b3Ic0txTvb29k5OTuXl5chJIBCg3ZVxcXHSvw7N3ObMmSNNquzt7R0dHYuLi5FTQ0MDXFFLf/X+/fvh+VdffUWJsKqqqnfv3rDMQs6IZJYvXw4ROjo6iuSmzRnvuXPnwANBEDdu3FDejFeBLUsyqF04ODgcOnSI7LR48WJwWrJkibGxMRrGQXNDA7VLly4ppIqRRDk4ODg7O1dUVCCnnJwc2Guqp6e3ZMmSGTNmkOeNqFLc3d0VpTHIibG0tMzKykJOr1690tXVNTQ0hH/hWlqCIKZMmcJYwm/evNHS0nJzcxNJDSrDxYsX012RCqLP4hISEuj+fX194Yrp169fU5yQrtPR0Xn69Km4+pIw43VwcIAbvxBwITbsk2d8l6x6tZOUlZL0LZrxqqur6+jopKamkp2EQiFafl+1apW4vCtKnaI8jh49GvZTkElLS4NZ6Pr16xVSESyCsJMiWdWmrP4725gBg8F0BvCMt0cAOz/V1dXJE0vEjBkzWMx4+Xy+vr4+7BFi3Fh148YNiGHYsGF0VzREGzRoEKUvf/TokYuLC1qc2bJlC/hk7NebmprgU66uri45C0VFRbC4oa6u/vLlS3rAVatWQbTKmPESBHH9+nWK65EjR8BpzZo1ypvxEgRx5coVimt4eDj91agGtbW10XIEGTTO2Lhxo5Sp/eijjxiH18qY8cbGxqLdm/S6aJ8ZL4uWJRnULsaOHSthx/g333xDcY2KilJsFZMl6ubNmxTXjz/+GJw0NTXRWhDivffeA9eamhqFaAxyYk6fPk1xDQgI8PT0hN8tLS3W1tbg8/nz5/S3hISEEARB2SIhgTaTLRAIQA7JM4Evvvhi5MiRjBEmJydD8g4cOEBxQrpO3CZkGKxLmPF6eHjQQyHLC+TqYKdXO09ZKUnfohmvuFooKCiAnkVNTe3Vq1dKVacikSg7O9vOzo6+uwSYNGkSzKIp0zMWFcGu7thJkaxqU1b/nW3MgMFgOgPYVnOPAPR4S0tLQkIC3TUsLIzH40FvJz2RkZG1tbVgeYjRDoSXlxdsu0pLS0tJSREXz5IlSyjHEd3d3Xk83sKFC+GcOdooiwbZZDQ0NKZOnQrGNv78809y8oRCIcwc0AiYzCeffEIoDQsLC/r1RR988AH8oNgoUizm5ub0i4IZX41qcPLkyWifKplZs2bBj2PHjkn59urqavhBNrAkP1lZWcv/l2XLli1YsGDAgAFz5szh8/kEQaxcufLo0aNEd2lZAMg/mQEDBiAzPHRXZE0nNzdXsVVsaWnp5eUl7nVeXl5WVlbiXPPz8xWrMYyNjemn7H777bekpCT4raam9uWXX8JvLpdL8QnHFPX19aWxIk5J9vjx4xmTraWl5ePjQzk6Gx4eLi4L6JQBxUObuo4giGnTphkaGkqwxrRo0SL6Q1QdL168kPJd4vRqJymr9tG39FYGJ8M9PT3BWltkZKRS1SmcUygoKBAnD1A+FRUVqGZZVwSLIKylSFa1KZP/LjpmwGAwygbPeHsE6FDu/Pnzd+7c+ebNG7Jr3759XVxcpDQqi7h+/Tr8QNspKaiqqqJDiWj1hg5sZRRHZmYm2ODV1NREu9QooONtaNRL/i3OoLGLiwtry5ltwhg5mhjU1NQo6b0EQbi6utJfDRvqKK9GNYjEg4KjoyNsXi0pKaGMqMTRq1cv+MFoJYg1RUVFYf9LeHj46dOnX7586ezsvGzZsrS0tIMHDyLTPt2gZQF0aVdRUUEjabrpXWRgBoatCqxiRmE2MTERl842EyOPxnBzc2uzrpcuXQpD5OPHj5Mt+kK0ubm5ixYtkv6LDEo2mkHRiY6Orq6uFmeBmc/nv3jxIud/QbsPKJalka5TUVFB5UBh6NCh1dXVP/zwg7iUMAakN3/WerWTlFU76FsVFRVxBq5Rn4KWoJWkTim0tLSUlJQ8e/YMlU9dXR1j+bCoCBZBWEuRrGpTJv9ddMyAwWCUDb6dqEewfPnyo0ePZmZm1tfXb9y48Ycffpg8ebKvr+/s2bPRYEhW/vnnH/ghwWo/sqiZlZUlzo/kewKys7Phh66uLjplRAGuU4KuDj189uwZ/ECWjShoaWnp6+srafIJm6YoaGtrww/4kKwkpH81KtvMzMy9e/cyxqapqQlzhszMTHElyfh28lRHfiZPnnzx4kX0r6qqKjKP1Cb/c3hDcd7aoWUBZBOpCMi1zjsoTshyqcKrWEJKxMkbY2IUojGkuTKnd+/ec+bMOXfuXGVlZUxMDPmWrEOHDhEEsWLFijYjkSnZjGRmZu7ZsychIQFdMEaBMhtHL7KwsEANVknNn7Ve7SRl1Q761sDAQNy0HF1Kl5OTo1R1CjQ3Nx89evT3339PS0tramqSSZakrwgWQVhLkaxqUyb/XXTMgMFglA2e8fYItLS0kpKSgoKCjh071vKOK+9YsWLFhAkT1q9fD5t8ZKKyspKyrEcHbTSifJSlpE2at1RXV4NFKwlUVFTQt9dKSJ62traSei804ifDbq1Pea9GZXvqHdKXrQTQAc6ioiKRSKSoL+JqamrSXGFKBvkHS61tpqS+vh4mkx3esiTUY5tOyqhiya9jkRh5NIaUYrBixQowoHXo0CE04y0uLo6LixszZgxa4VFUsukcPHgwMDBQKBSqqalNmzbNzc3NwMAAhLC+vh6Znpb/ReyaP2u92knKqh30rQRJQ7mrqqpSqjolCKKsrGzq1KlPnjwhCMLW1tbHx8fa2hp9b4qLi7t3755CKkKeILJKkaxqUyb/XXTMgMFglA2e8fYUjIyMwsLCtm/ffvr06VOnTt29exfWtW6+g8PhHDt2TKYhAtpbKOELOnKSfkWOAgpobW1NXuVjhHweWJrk9XBQ2e7YsQOMf0igb9++0sQJllQIgnj79u2///5LuTazPSEfA6urq2vzMC0sSrM4c6vwltXJq5g17aMxgEmTJr333nu5ubn3799PT08HW+VHjhwRCoUyLfCy0ySJiYlff/01yMbNmzcpO435fD7jLK49VRZrvdpJyqpjYZRSJbU1f39/mO4uXbr08OHDlC39JSUljDNeFhXBIog8UiSr2pTePx4zYDAYRvCMt2dhbm7+9TuKioqioqIOHDhQVFQEVzW6uLisXr1a+qjMzMyKi4thUCLOD3Ji3HUm5VvgR0tLi7hTVYyYmJjABjkJyXv79i3Rg0E1aGZmJlPZSmDYsGFWVlalpaUEQdy6devzzz9vM0hra2tzczMMPhR4HFdPT09HR6ehoQFM14g70IUAg0+sBVWBLauTV7H8iVGqxgBUVFSWL1++du1agiAOv0MoFIaHh5uamiJz4rImW/q1HWSVNygoSNyJXMYXwY92WERirVc7SVm1A7DpQ7KUotPsSmpr6enpt27dguum9+3bJ716ZFER7ILIKUWyqk1p/OMxAwaDYQRbruqhWFtbBwUF5ebmgt1/giDQTTBSguxbkG3DUkBGMiWbp5LmLWVlZRKGIHTQDbTPnz9n9FBTU9PDey9UtmSDunKiqqr63Xffwe82t/YBwcHB2u+Ij48nFAqSAXRqSwLgBwXpwJbVyauYNe2jMRCff/45bHYFI7Tx8fHFxcWLFy+WdXu8NMmmgOQNjPpKeWIcvaiyslLCmFshsNarnaSs2oG6ujpxcz904JOsLpTR1lDhfPDBB4wHLtqUJekrQp4g8kuRrGpTgn88ZsBgMIzgGW+PYNOmTYwXLWhpaSE7/uJMhojrU6dPn063V0lGIBCkpqbCb9anGW1sbAYNGgTJkHBBxaxZs6ysrP773//St9feuXOHMciDBw+ILoXCB39o6x3sEGMkMTHRysrK3t4eFkulYfny5WD75OrVq5LvFAEhAQm0traeOXMmoVDGjBkDP9q8XqWoqOj+/fv6+voDBw5st5bVDiipitnRPhoDYWpqCqPhurq6qKgosFm1bNky1slm3D4KTJ482d7eHo25kRkhxr3Z4mazNjY2SPzEvevSpUv29vZw2bWM+VCMXu0kZdU+iOsjUJ+CehkltTXJhSOhfFhUBIsgrKVIVrUpk388ZsBgMIzgGW+PIDk5OTo6Gvb/UNDT04OjLH369CE/19XVhR+w4xSYOXOmq6vrw4cPCYKYO3cuTGzS0tLS09PpMcfExEC/7uvriwwasQC2JhIEIe7O1ZycnIsXL5aXl5OnTB9//LGBgQFsDIMEUwgPDye6AowVcenSJVdX18WLF8sTs6+vLxgdvXv3LtnoKJnDhw+XlZV5eHhIb9JJS0vrwoULkOwlS5YgcyCMBAUFgVju3r1bzqObdNCe6qvvEOdNJBKtXr1aJBItWLBAejtMrFtWe6KkKmZHu2kMxMqVK+HHrl27rl27NmXKFBbRomQ/evQI2bMlk52dfePGjZcvX06YMIFiyxdN4Mncvn1b3LvWrFkDPyIiIhg9nDhxorCwcNiwYfLbhGOnVztPWbUDR44coT+8d+8eGPg1MDAgX/eqjLaGCofH49EPl7a2toq7OIpFRbAIwlqKZFWbsvrv4WMGDAbDjAjTAxg/fjxBEIsXL6Y7RUZGgiTs2LGD/DwkJASenz9/Hp7U1NTAfADM8IpEolu3boGtiFGjRgkEAnLw4uJi6IFMTExevnxJf++cOXMg/oKCAsmJb21t9fb2Bs/nzp2juNbV1cFmJHruYFWHIAhnZ+eKigqyU0REhIGBAczKLC0tRbLA4/EgWg6HI72TSCRCc7/x48dL/7rW1lYwHTl06FD08Pvvv4f5pJyvTkxMRDVYX19PCfXHH3+AdcqnT5+KZCQ+Ph5GdR988EFOTg7dQ0NDQ2BgIKTq66+/ZowELSZMnTpVxIpFixZBDNra2ocOHWpsbKR4KCgogIOd+vr6L168aIeWJRnJ7QIsgRkaGrZDFUuWKFQ1oaGhdFdUs7dv3yY/Z60xJCdGAmSzzHTtISUo2ePGjQPT34impqaRI0dSGiO6nMba2rq4uJjsv7i42NraWpweEAqFkydPhnPIly9fprjGxcVBZT1//lwmsWGsDtZ6tZOUlZL0rUgksrS0hE+NBgYGERERZKfy8nInJyeI9vDhw5SAClenAoEAEkMQxPbt2ymu27dvR7JNaWgsKoJdEHZSJKvalNV/ZxszYDCYzgCe8fYIoMMgCGLevHnXrl0rKioqLi5++PBhUFAQnGrz9PSkDEBzcnJgGcHT0zM7Ozs3Nxcu+ZgwYQLZW2RkJCzNDRs2LDY2tqio6MWLF8ePHwdblGZmZg8ePCD7z8vL47zDxsYGkuTn5wdPkpOTxaW/qqpq3LhxYNzo66+/TklJKSkpSU9PP3LkCMwBPD096+rqKKFaW1sDAgLgLVZWVps3b46Ojg4LC5s9ezZBEFFRUTCY0NbWhgRQBjd01qxZw+FwZs2aBXE6OjpCwIyMjN27dzM6wbjnwoULHA7H398fXC0tLcFVyqHPJ598AgEjIiKKiori4+ONjY1h85VIJJLz1adOnYIPGc7OzpGRkfn5+UVFRbdv3/7ss89UVFQ0NDRiYmJErEhLS3N0dIS7Q+bPnx8REXHr1q0HDx7ExcV9//33ICGqqqqbN29ubW0lB8zIyIBEom3Jffr0gSfSFxpQU1MDUwhAX19/ypQpn3/++YoVKxYuXOjq6gpC3qtXL/oEQ0ktixFx7eLkyZNQkuCqp6cHWxzJTUZcFWdkZLCrYskStXnzZnLVDB8+nMPhrFmzBsKCT2dnZ3CdOnUqh8P56aefWGsMcYlBb5TMwYMHIWDv3r2bm5tFbEHJdnd3j42Nffny5bNnz2JiYoYMGQIPa2pqkOfGxsZRo0bBe42MjHbu3PnXX3/dvXs3JCTE0tLSx8dHgh6orKyEstXQ0Ni4cWN6enpJScn9+/e//fZbDQ0NVVXVyMhIKcVGXHUEBwfLo1c7Q1kpQ99GRESAN7jI19LSEuaos2bNCgsLi46O3rRpE5p/BgQEULSWktRpbGwsWs/38fE5efLk/fv3L1y44Ofnp6+vj5ohpWZZVATrICykSFa1yULNdpIxAwaD6TzgGW+P4MmTJytXrmS8EcHExGTz5s0NDQ30UPv376ds8nRxcfn3338p3h4/fjxlyhRKtBoaGosWLaKv1Ug4V3PixAkJWWhsbAwJCaFbcDU1Nd22bZu4SYVQKAwNDYWtSog+ffrAwjUavgDLli2TXIzi7tq5cuWKuGOH1dXVIpFo69atjK70D/OMlJSUDBs2jFK8ISEh4Cr/q3k83tSpU+n7JL28vFJTU0Vy0NTUFBYWxmgwU1tbe8GCBenp6fRQV65cYUyzTIWGEAqFR48ehREbHV1d3S+++CI3N7c9WxYdce0iMDAQRvASmoy4Kr5y5Qq7KpYsUYy1aWdnB2EZA44cOZK1xhCXGPRGydTU1MBngi1btojkgzHZ2traq1atog+da2trly1bRtmor6ent2PHDvpdrBSRFggEv/zyi6mpKcXbkCFDbt68Kb3YiKsO8ponO73a4WWlDH1LOeMN63hnz57t3bs3+bmBgcGvv/4qFArFxaNwdXrt2rUBAwZQYhszZkx6ejpavRe3mi1TRbAOIqsUyao22anZzjBmwGAwnQeVDrSFiGl/8vPzs7KyysvLBQKBgYGBk5OTm5ubhPOTFRUVSUlJpaWlmpqaAwcO9PDwEHd+rLy8PCUlpbS0VENDo0+fPmPGjJH+InvpaW1tTU1Nzc3Nraqq0tfXd3JyGjZsWJvnPxsbG+/cuVNYWKitre3g4DB69OiOuh+VNSKR6NGjR1lZWQ0NDRYWFuPGjbOwsFDsK16/fg01CP26u7u7Ai9oLS4ufvLkSVlZWUNDg6Gh4XvvvTd06FBYS2k3Kioq/v7774qKCj6fr6WlZWho2L9//8GDB0t/3agCW1aHoNQqlpX20RgEQbi5uaWnpxcWFqItsgpJtoqKip2dnYeHB2VwTKaysvLevXuvXr3S0NCwtbX19PSUXuZbW1sfPXqUl5dXXV1tZGTk6uoqq1k1ZevVzlNWSkUoFN67d6+goEAgENjZ2Y0fP14ac9+KbWswkc7IyKirqzMxMRk+fDhsn1FGRbAOwkKKZFWbLNRsjx0zYDAYCnjGi8FgMJjuSVZW1uDBg2fPnh0bG9vRacFgMBgMBtMx4K9WGAwGg+megHlVZLQZg8FgMBhMDwSv8WIwGAymOxD7jqNHj8IWRD6fb2tra2pqmpeXJ/91PhgMBoPBYLooeI0Xg8FgMN0BHo93/Pjxa9euwb/ff/99TU3N2rVr8XQXg8FgMJiejHpHJwCDwWAwGIUxe/ZsT0/P0tLS7OxsDw+PL7/8sqNThMFgMBgMpiPBa7wYDAaD6Q54enrOmjXL1tY2IyNDTU3t+++/v3r1qro6/rCLwWAwGEyPBp/jxWAwGAwGg8FgMBhM9wSv8WIwGAwGg8FgMBgMpnuCZ7wYDAaDwWAwGAwGg+me4BkvBoPBYDAYDAaDwWC6J3jGi8FgMBgMBoPBYDCY7gme8WIwGAwGg8FgMBgMpnuCr23A9Fzevn07Y8YM8pM1a9bMmjWL6IJUVVXNnTu3e+SFBVevXt21axf5yenTpy0tLTsuRRhJHDx4MCYmBv1rYmJy7ty5Dk0RpiuxYMGC0tJS9K+Pj09QUBDRHem6mq2Hd0kygcsKg2kH8Iy3p8Dn82fNmvXkyZOQkJAvvviio5PTKWhtbS0oKCAIora2trKykiAIf3//LlpoQqFQcl46P/KUdl1dHWS/vLy8oaGBIAiBQKC0lGLkpbKyEurr5cuXra2t9BF8F2p6mPan6B1NTU0lJSUEQdjb2ysq5s4meF1Xs3WDLkmpNDQ0TJ48WSgUBgUFjR07FpcVBqN0RJieAZfLhRo3NDTs6LR03sLhcrnKLjSBQHD7HZmZmaJ2zEvnR3JpP336FMqtrq5OQiRz5syBSAoKCkSdFWXLQBcC5rqWlpZdVF/hquxAeDweCAmHw1FUnO0veN1Js3WzLkmpXLhwAYrlxYsX6CEuKwxGeeA13p7CwIED4Yezs3NHp6VHF1ppaamXlxdBEHPmzEF9HqbN0t61a1dERARBEDwez8XFhejKYBnoNvoKV2U3o/0FrztpNoz0wDkOFxcXBe5QwGAwEsAz3p7C2LFjk5KSMjIyFixY0NFp6TLgQmtPcGljEFgYMB0CFjxMO9DS0hIfH08QxIcfftjRacFgegp4xtuD8HxHR6eii4ELrT3BpY1BYGHAdAhY8DDKJikpqaqqiiAIisEqDAajPPDtRBgMBoPBYDAYTPttaXZwcBgyZEhHpwWD6SngNd7uT0VFRV5eHvmJm5ubpqYm/ObxeI2NjcjJ3Ny8X79+BEHcvn07ISGhvLzc1tZ2xowZI0aMQH6EQmFMTExKSkpVVZWtre3cuXOHDRtGjl8ZcVJIT0+/cuVKfn5+fX29qampm5vbtGnTLCwsJBdFbW3t+fPnHz16xOfzraysRo8ePWPGDA0NDVkLDVFXV3f79u3Hjx8XFhYKBAIDAwNnZ2dvb28nJyd6nC9evCgvLwfjomCu9sGDB8hVRUWFXCBy5pT+XspDLS0tV1dX+C0SiR4+fEjx4O7urqamxhjhq1evioqKKA+1tbUph9AgdyNGjFBRUUEPX758WVxcTPb23nvviUQicaXd3NyclpZGEMTr16/BKT09nWyt1MbGpk+fPuLyXlNTExUVlZGRUV9f7+Dg4OvrK/mk3NOnTxMSEnJzc2tqakxNTQcPHjx9+nR6/AKB4MmTJ+QnQ4YM0dXVRf+mpqYKhUL074ABA4yNjVnLgDSSKWtOWcsVu4BpaWmxsbH//vuvtrZ2v3795s2bJ+70Gjt9df/+/YsXL758+VJfX3/kyJHz5s3T0dGRNTFpaWnNzc3Im4WFhYODg7hI2FWllAImPampqTdu3MjNza2vrzcwMHBycvLw8BgxYoSqqqoCazA7OzspKSk7O7uyslJDQ8PS0tLDw2PatGlaWlrS16BAIDhz5szjx4/Ly8v19fWdnJzmzJlDFwNURHw+X09Pz87OztXV1cvLi9y+xCGTGEiZbAU2OjLtrNnk70cob4+Pj//7778rKipUVVV79+7t6uo6ceJEc3NzdhFK2S4U3vWYmpqSn9TW1l69ejUlJaW8vFxHR8fGxmbixImjRo0ix6MQIYcz/7Iu8Mo03pCgLbOzs8+dO1dQUCAUCq2srIYPH07fXM1aSUpfhvIkD4NhgxKtYmE6BydOnKBUOtnYo52dHdmJw+EIBAK6fvH3929paRGJRPn5+QMGDKC4rl69mvxGZcSJyMvL8/b2Bj/GxsZ2dnYwZdXU1Fy3bl1TU5O4cjh79qyZmRnlLY6Ojunp6XQDiZILTSQSlZeX+/n5odmyiYmJvb09GpfPnj27rKyMkoBly5YR4tHS0lJITul5YXyvnZ0dCsJ43UV1dbW4kty6dSvdv5OTE9kPmkInJyeTn9OvzTx16pSE0ibfuslIcHCwOIum169fNzQ0pPgPDAxkzFRBQcHMmTPBj76+vr29vba2NkEQampqK1asqK2tJXt++vQpJVoej0f2QHnvhQsXJNSFBBmgw1hWMuWUdQtiF7CyspJxvBIUFCQUCum2mlnoKz8/P0oQa2vrjIwMdolBLFu2TEJFyFqVMgmYNBQWFo4bNw5FaGdnh/SPubl5YGAgvUZY1GBERISjoyMEUVdXt7OzQ9MkMzOzyMhIehDGGrx37x79DqrQ0FBywBcvXqAi6tWrl52dnbr6//8or6WltWDBAkqdkm01yyQGjEgQPPkbHZ1202ys27s4Dhw4oKen9z9bBFVV+/Tpg+RBRUVl/Pjxt27doviXbH9Ypnah8K6H7GHfvn1GRkbwajs7OzQZdnFxSUlJUZSQi0Si1NRUcEpKSpKyrFiMNxi1ZVNTU0BAACWFFLPk8ihJmcqQXfIwGNbgGW/3Jycnh/uOoUOHItWMXM+cOXPixIkff/wRKZ2FCxdaWFisXbt237593377LaxNwZXofD7f1tZ2wIABW7Zs2bt3b0BAAFLBJ0+eVGqcAI/Hg1mrg4MD6llra2uDg4PhC6K3t3dzczO9EKKjo8GDnp5ecHBwZmZmQUFBQkLCpEmTTE1NN2/eTOlmJBcaebDl5+eXn58PDxsbG6Ojo+E7t5OTE5/PJwdJTEzkcrk7duyAgEOHDuWSOHLkiEJySu8y4b0jR46E5/7+/lwuNyoqCgVpaWmBNICd0u3bt3O53MbGRnESlZqayuVyx44di/o8LpdLGT2sW7eOcRyWkpLC5XK/+uorgiDmzZvH5XJzc3MllHZ9fT04eXh4gNOGDRvI5fb48WPGcWFcXJympua4ceOCg4NDQ0M//fRTtGQdERFByVF6ejp05NbW1pcvXxYKhfAhIDw8HFaW3NzcKioqkP+qqipKqigz3mPHjnG53BkzZlBmvDLJACP0soKcent7h4aGcrncJUuWoHkCPaes5YpdwLq6Ond3d0jMhAkTEhISCgoKMjIygoOD9fX1N27cSJ/xSm56UVFRXC53w4YNSLf4+/ubmZmtW7cuPDx8165dgwYNAqf+/ftTRvNSJkZfXx8SkJiYKKEiZKpKWQWsTWpra2FpZfjw4WlpafBQKBRevXq1f//+jB+t2NUgNChjY+OoqCjkmpeXh+4LDQsLowTJzc098Q43Nzfwc/nyZW1t7UGDBm3atGnPnj0oLHkywOPxYO7Ut2/fixcvQhG1tLRcv3598ODB4D8oKIiSI7IYGBkZffPNN/v27duyZQv6hEoXA3FIEDw5Gx0j7aPZWLd3cRw6dAgmt7t370bXKb1+/Xr16tWMCl/yjFfWdqHwrge5oruXV69eXVlZiV4HMqytrX316lX5hRwA9WVubg75laasWIw3GEdiHA5HU1Nz0aJFv/7667Zt22xtbSlTSnmUpKxlyCJ5GIw84BlvD0LChX5Inzo4ODg7O5P7mJycHNi6pqent2TJkhkzZpDnQnAcBTbBKjtOPp8Pgzw9PT3yFXbAzz//DKG2bt1KcSosLOzVqxdBEBoaGpQPja2trR999BHam0fvksUVGuRu9OjRsExNJi0tDbYUrl+/nvGTNkQ4Z84cuqucOZXQZcbGxsLzKVOmML70zZs3Wlpabm5uIuk4c+YMRPjVV1/RXdE+rr59+7a2tlJcYXiUlZUlvYhyOBzGuaW4GBwcHH755Rey08mTJ8GJkkc+nw+bqXR0dHJycigRnj9/HkL5+PjQMyI5VWhFAs14pZeBNiHndN++fWSn06dPi8spO7liHfCbb75BOaWUXmpqqo6ODswT6PfxSqmv7O3tnZycysvLkZNAIEDb9ePi4hSVGHFI2ZxZC5g49uzZA6HQ8BeRm5sLS3DkGS/rGoRaSEhIoKfB19eXIAhdXd3Xr18zJhLVYL9+/VatWkUe3//nP/8hTwZQ8nR0dJ4+fUqJp6qqqnfv3hJmvPb29o6OjsXFxcipoaGBPDsVyYIEwWPR6NpEqZqNdT/CSHNzM6zaLVq0iO66fPlymWa8rNuFwrue/fv3i4sQyZ6ZmRlZz7AQcgR8WV66dCk9NskzXhbjDcpIzNLSkpz3V69e6erqkqeUrJUk6zKUKXkYjDzgGW8PQpoRJEEQN2/epLh+/PHH4KSpqVlSUkJxfe+998C1pqZGqXFu2bIFHjJq9qamJviYraurS1ncgJ5Y3DbFsrIytKos/Yw3Ozvbzs6O8nUZMWnSJNDv9B5XmiEy65xK6DJbWlqsra3B6fnz5/RoQ0JCCIKQZpkRePv2LZyRs7KyoneNqOoJgqBvZ7KxsaFsRVP4jNfDw4Puig6GkeUKzUvFbQtEhlvj4+M74Yx3zJgxdNe+ffsqsAWxC1hUVASrT+rq6i9fvqQHXLVqFUTLesZLEMT169cprkeOHAGnNWvWKCox4pCmKuURMHHMmzcP8kJfJhKJRLC5gFwXrKv+iy++GDlyJGMakpOTIc4DBw4wekA1OGjQIMpI/dGjRy4uLminCUqeuCKC6Zm4GS9BEFeuXKEECQ8Pp4uBoma80je6NlGeZpOnH2EkOzsbIvzxxx/prqD2pZ/xsm4Xiu16+Hy+vr4+LEKilUnGr0sbN26UR8iBZ8+egf9Lly7RYxNXVqzHG5Rmcvr0aYprQECAp6ennEpSnjKUPnkYjJxgW82Y/4OlpaWXlxflITIi5eXlZWVlJc41Pz9feXGKRKLDhw/DbzRbJqOhoTF16lSCIOrr6//880/0vKWlJTIyEn5/8skn9IAWFhbQYciEs7NzQUEBY0rAUhEYt3jx4oWsMbPOqWTU1NS+/PJL+I26VfJLuVyuvr4+2ovVJrq6utOnTycIorS09N69e2QnSNWKFSvg35iYGLLrw4cPX758CUN25bFo0SL6QyRXqF7QPj2CIObPn88YFbqZE33G7lQwSjVjTtnJFeuAkZGRYL5r7Nix6GtLmymXCQsLi4kTJ1IefvDBB/CDbFqmHRLDiJIEDAamLS0tCQkJdNewsDAejwdjUDlVSnh4eEpKCmMa0M5hcR4QS5YsoZjBc3d35/F4CxculCZ5BEFMmzbN0NBQnBkqc3NzdFRVshi0c6PrWM2m8H4EVSJsO6e4urq68ni89evXK7tdKLbriYyMrK2tJQhi8uTJ6LwVmVmzZsGPY8eOsRZyBKxd9+rVS6ZRh0LGG8bGxvQDur/99ltSUpKcSlIhZdhm8jAYOcEzXsz/wcXFhW5Sz8TEBH6g7YJkkHECUHlKijMzMxNsWmpqajIGIQgCHfciq8gnT57U1dXBb3RAhQI6isOOlpaWkpKSZ8+e5fwv6I10I8ltwjqnbbJ06VLoko8fP062kUgQBJh7XbRoEeyHlBI0UqEMLM6cOfP+++9v2bIF6h1tQiMPSsSNchQFY53C3ipYCYEfmZmZUEcqKirizIOjoXNSUhLZTGUngVFI0Fckck7ZyRXrgOi3OAPUjJpBJhhjoOe9fRLDiJIEDB3+nD9//s6dO9+8eUN27du3r4uLCzLXrCiVwufzX7x4gbQcWt9uU8sNHz5cgitKnoqKijhVPHTo0Orq6h9++IHR1dXVlV539Mbe/o2uYzWbwvsRR0dH6JofPnw4YcKEO3fukF3V1NRcXFykNDwuZ7tQYNdz/fp1Spui5xrOPZWUlEiYUkoWcsqMd/r06Yx2zpU63nBzc0OnzRlhrSQVUoZtJg+DkRMsXpj/A8VYP4A2/dJtHUOHCj/oH30VGCfaT6WrqytuJQQue4DeFD1Em4gsLS3FLRGwu6Shubn56NGjv//+e1paWlNTE6MfysRSGljntE169+49Z86cc+fOVVZWxsTEfPrpp8gJPrejT+NSMmPGDG1tbbiPYc+ePdAXPn78OD8/f/PmzVZWVmPGjElOTi4sLPz777/R8OXMmTP9+/dX9j2EjHIFVkDJcvXPP//ADwsLC+RKAZmUbGhoKCgoQJaBOglS5pS1XMnf9MTd8aOlpaWvry/P9EDKvLdPYhhRkoAtX7786NGjmZmZ9fX1Gzdu/OGHHyZPnuzr6zt79mw0+VGUSsnMzNyzZ09CQgK6iklWLSdZwUpTRIoSA0XR/m+U9dXK6EfU1NT27dsHC31JSUleXl52dnZz58719fX19PQUd5udMtqFArseVFCZmZl79+5lTImmpiYIeWZmpjgFIs0ooqSkBDZEyHovkULGG22mkLWSVEgZsr4rC4OREjzjxfwf6FfOSu+q1DgrKyvhR3V1NRiEkEBFRQX6XV1dDT/AeBUjLIZZZWVlU6dOhUtZbW1tfXx8rK2t0TQ+Li6OsttKeljnVBpWrFgBhsEOHTqEZrzFxcVxcXFjxoxBn/ylRE9Pz8fH5/z5869evXr48CGYg4bv6LBzbN68eXDYLyYmBoYdjx49KiwsRLZ2lQejXNEvKUWlLUE80O5QgiDevHnT2Wa8suZUVrlSdtOTZ5IpZd7bJzGMKEnAtLS0kpKSgoKCjh071vKOK+9YsWLFhAkT1q9fDxtW5VcpBw8eDAwMFAqFampq06ZNc3NzMzAwgAlGfX09srPaZmrlLCJFiYGiaP83yvpqJfUjCxcuNDQ0XLNmTU5ODkEQhYWFoe+wsLAICAhYt24d2r2l1HahwK4HpeTUO1gXlDRrtmA/UkNDA3Zlt/N4o80UslaSCilD1oveGIyU4BkvpmuAlLu1tfXFixcleyZ/bEb7ZBT73d3f3x+6n6VLlx4+fJiyG6ekpIT1jJd1TqVh0qRJ7733Xm5u7v3799PT08Gc6ZEjR4RCoawLvMC8efNgm1ZMTAwMO8jf0f38/AIDA8E1ODiYMijpDEgjHmQnVDvS0NraSnQaWMtVZ2t67OioxChPwIyMjMLCwrZv33769OlTp07dvXsXjkfefAeHwzl27BhMhFjXYGJi4tdffw3vunnzJmU/LZ/Pl3LGK5lOJSfdBuX1IzNmzJg+fXpiYuLJkyfPnj0LO+rLy8uDg4OPHj168eJFdBOeUtuForoeFPOOHTvQfXLiQMbJ2AEJnjRpkoGBQScZbyikJbZnGWIwrMEzXkzXAG3lamlpcXFxkT4g+uTM5/PF+Xn79q1MiUlPT7916xbcFLdv3z7FHj5hnVNpUFFRWb58+dq1awmCOPwOoVAYHh5uamr60UcfsYhw5syZWlpajY2NZ86cCQkJefLkSW5uLvqO3rdv31GjRt2/fz8/P5/H47m6up45c6Zfv37izpW1P6i0JYgH2YlxS6G4IUJDQwPRaWAtV/I0PdgHq8Cmx5qOSoyiBEwc5ubmX7+jqKgoKirqwIEDRUVFcDWri4sL3MXCugaRhdWgoCA5jR1IACVPqcdfexrK7kfGv+PgwYM3btwIDw+HrUMVFRW+vr55eXlwm65S24Wiuh4zM7Pi4mL4ofCComTn5s2bLLY0K3W8oRAl2W5liMHIA7ZchekaoKM4ZWVl9fX10gdEtzJWVVWhvTcUXr16JVNi0PGnDz74gPFs8P9c/NXuOZWSzz//HPbFgX3F+Pj44uLixYsXs9tTpK+vD/snCwsLU1NT6aZByCZGUlNTCwoKOs8CL7m0q97B6AfZejU1NbW1tSU7ocEHY03JKldKhbVcyd/0nj9/zuihpqam3Wa8HZUYOQVMeqytrYOCgnJzc1H7OnHihJw1iBQduidGUVqODEpeZWWlhKE2plP1I4C6uvrUqVPPnj179+5dOBxUWlr6119/tUO7UFTXg1Ii7rIJRXHp0qWWlhYVFRV0oVFnGG8oREm2WxliMPKAZ7yYroGNjc2gQYNAuUu4DGPWrFlWVlb//e9/0ZP+/fsjO/uJiYmModq8XUOcfQhxWxClGbeJ66VY51RKTE1NoeOvq6uLiooCm1XLli0j2IKGEX/++eeZM2ccHR3JX3n9/PzgR0xMjEK2NCuqdwdsbGwGDhwIv2FfqAQLlj4+PhRLlUZGRvADFtYo3L9/vz3zIhnWcsU6ILp+g2LTFfHgwQOivVB2YiQ0Z3kETBybNm2i3HoCaGlpoTtpkKEp1jUoWdEpanZKLiJxmzMvXbpkb2/v5ubWnk2mnVG4ZlN4P5KVleXr6xsfH093Gj169NKlS+G3OAtnCm8XCul60C5cccmAkYOVlZW9vb0823ZgS/OoUaMsLS3bf7yhVCXZbmWIwcgDnvFiugywF5cgiKNHjzJ6yMnJuXjxYnl5+cyZM8nP0XQuLCyMHiorK6vNmQmFfv36wQ8ej0ffztra2irhsge03Yt83cKlS5dcXV0XL14sZ06lZOXKlfBj165d165dmzJlynvvvUewZfbs2bBoHB4e/uzZM8qowsbGBg5ZPX/+PDw83N7eHn0PlgnGcps5c6arq+vDhw9ZJ54giDVr1sCP48eP012FQuEff/xB8YlwdnaGH2AlhUxCQoK4axikkQFlwFqu2AX8+OOP4bhaeno6Yx2Fh4cT7YWSEiNNVcojYOJITk6Ojo5m/M6ip6cHxzLJ98Swq0Gk6FJTU+lBbt++TSgIlPGIiAhGDydOnCgsLBw2bJgybpDqWJSn2RTej1RUVMTGxl64cIHRFZ1NlfKCIvnbhUK6Hl9fX5Dzu3fvgjkuOocPHy4rK/Pw8BB33UObNDY2wtXZLKw0yzPeaB8l2T5liMHICZ7xYroMHA7H29ubIIjo6Gj4XErm7du3sIvp888/R/MQYPXq1fb29gRBXLlyhcvlkp2qq6sXLVqE7lGUknHjxsFn2rKyMrCKQWbXrl0S9vaYmZmBIUTylte7d+8+efIEmQ9hnVMpGT16NJhl/vfff1lcSkTBwMBgypQp6Esz/Ts6esLn89mdFoYL/eAHKrfa2tpr1649efJETksYn3/++eTJkwmCOHfuHH35YufOnbm5uQRBrF+/nn4GDKoJRuRo7xkMTRYvXsy4F1RKGVAGrOWKXcBevXqh1vH5559T7oz9/fff//rrrzbP+ykKJSVGmqqUR8Aks2XLFvrDs2fPwrCYvMOTXQ0uWLAAfgQHB1MW7kpKSjZt2kQoCFREf/75J0wMyMTHx585c0ZbW/v7778nuh3K02xK6keio6OfPn1KedjQ0BAXFwfbXtBSoWTkbxcK6XrU1NROnDihqqoqEokWL15MX4GMjIw8deqUtrb2tm3bCLZcu3YN9gOzmPHKM95oHyXZPmWIwciLCNPdSU5O5rzDxsYGKt3Pz4/D4fz0008ikWj37t0cDmfWrFng5OjoCJ7r6+tFItHmzZs5HM6YMWPAdfjw4RwOZ82aNRAz+ESd5dSpUyFaZcQJrlVVVePGjQMN+/XXX6ekpJSUlKSnpx85cgTu7vP09Kyrq6MXAo/HMzY2hjhnzpwZHh4eHR29efPm3r17DxkyBBlo8fDwgARcvXpVQqGJRKLY2Fi02uDj43Py5Mn79+9fuHDBz89PX18f5Q7SHxwcTE4M3GcICxpFRUXx8fGQtjt37iA/suaUz+dDgtEV8CgvUOwUDh48CN569+7d3Nwsp4yhlRkHBwe6a0FBAVI4Dx8+lFVEgZycHChwT0/P7Ozs3NxcuF1pwoQJIpEoLy+PMYaTJ09KkCtUL5WVlVBl6urqGzZsSE9PLy0tTUlJ4XA44H/x4sXiSgkt5ampqY0fP97f33/MmDEqKirLli3bunUrOE2YMIHD4SxdulQmGWBEzpyybkHsAra2tgYEBEBKrKysNm/eHB0dHRYWNnv2bIIgoqKiYCSnra0NyY6IiJBHX124cIHD4fj7+4OrpaUluD59+lT6xFhaWopkQZqqlEfAGBk/fjwEnDdv3rVr14qKioqLix8+fBgUFAQH8j09PQUCgZw12NjYOGrUKHiRkZHRzp07//rrr7t374aEhFhaWvr4+DCWszgR5XA4ycnJ4nKEikhDQ2Pjxo3p6eklJSX379//9ttvNTQ0VFVVIyMjkWd5xEAcEgRPzkYnGaVqNtbtnRG0qm9pabl///6srKzy8vKcnJyYmJjhw4eDeJ8/f176Lkn+diFn14M4deoULBc7OztHRkbm5+cXFRXdvn37s88+U1FR0dDQiImJIfuXVchB8wwePJjx7W2WFbvxhrhmgoZbdORRkrKWIYvkYTDygGe83R9kv4TCyJEjRSIR+dpGMtXV1SKRiNHsnp2dHcQsLlplxImy09jYGBISQrfcaGpqum3bNsogj8yzZ88mTJhADqKqqjp//vzq6mrKwi9BEOJuUSen5Nq1awMGDKB4GDNmTHp6OtyLgBg/fjw5JSUlJcOGDSN70NDQCAkJoSRYppyWlpYyJhgVO4Wamho9PT1YJhLJTVVVFdhwWrduHaMHd3d3uEiQhYgi9u/fT7mL0sXF5d9//5VwUC0wMBDCMrqS60UgEPzyyy+mpqYUP46OjlFRURLyLhAIFi9eTN5sqaWl9d1337W2tqIZL3ouqwzQkT+nrFsQu4BCoTA0NJRyG0efPn1gZEw50rZs2TJ59BWlwBG3b9+WJjEWFhYwzhPJgpRVyVrAGHny5MnKlSsZ1wBNTEw2b97c0NCgkBqsra1dtmwZ5QChnp7ejh076PdqQjlLODV64sQJCZkSV0RDhgy5efMm2aecYsCIBMGTv9FJRqmajXV7p1NfX//bb795eXkxmgseN27cgwcPZO2S5GwXcnY9ZHg83tSpU+nb5r28vFJTUymeZRJyoVAI5b9p0ybGV0tTVizGG+KaCRpuMSKPkpSpDNklD4NhjUo3tgOB6ca0trampqbm5uZWVVXp6+s7OTkNGzZMmqssnz9//vfff1dXV1tZWY0YMULKE0fiABWfkZFRV1dnYmIyfPhwtEWtzYCPHj3KyspqaGiwsLAYN24cdCQKzGmbuLm5paenFxYWIstenZ+KioqkpKTS0lJNTc2BAwd6eHgo9lxfa2vro0eP8vLy+Hy+qanpoHdIE7CoqOjevXtv3rzp3bu3lLZJpJcBZcBartgFbGxsvHPnTmFhoba2toODw+jRo+Gq2A5BXGJ69er19u1bJycn+qZNBTZndgImjvz8fFhqEwgEBgYGTk5Obm5ukquDRQ1WVlbeu3fv1atXGhoatra2np6eYJhXGaAiqq6uNjIycnV1RSaOujHtoNkU2I+8ffs2IyMjNze3pqZGQ0PDyspq2LBh8uzBVni7YM3r169TUlJKS0vhe5y7u7v898cmJibCpoy0tDR5bvliPd5oZyWpjDLEYOQHz3gxmJ5IVlbW4MGDZ8+eHRsb29FpwWA6nurqatiNPGXKFGmuV8FgMBhpWL16dWhoqK2tbWFhIdGVwUoS06XBlqswmJ4IGF1ERpsxmG7P3bt3P//8c3GDTnSvhpeXV/umC4PBdGdSUlIsLS0ZrxPrbGAlienG4BkvBtP9iY2NDQgIaG1thX/5fP6JEyccHByQqWEMptuTm5sbERGBrjyhAObrtLS0lixZ0u5Jw2Aw3Zb79++Xlpbu2rWL6PRgJYnpxuAZLwbT/eHxeMePH7927Rr8+/3339fU1Kxdu7b7XW6JwUjmp59+olyFUl9f//XXX9+4cYMgiNDQUGnOYGMwGEx3BStJTLeEweAeBoPplsyePdvT07O0tDQ7O9vDw+PLL7/s6BRhMO2HgYGBiopKU1PT7NmzBw0aNGTIECMjo9LS0sTExMrKSi0trdDQ0OXLl3d0MjEYDKZjwEoS043BlqswmO7PjRs39u7d+88///D5fCsrq5kzZ3733XeU6wcwmG5PUVHRxYsXk5OT//nnn/Ly8oaGBkNDQ3t7+4kTJy5duhQvXGAwmB4OVpKY7gqe8WIwGAwGg8FgMBgMpnuCz/FiMBgMBoPBYDAYDKZ7gme8GAwGg8FgMBgMBoPpnuAZLwaDwWAwGAwGg8Fguid4xovBYDAYDAaDwWAwmO4JnvFiMBgMBoPBYDAYDKZ7gme8GAwGg8FgMBgMBoPpnqh3dAIwPZ2rV6/u2rWL/OT06dP4zjeMQliwYEFpaSn618fHJygoiOgK7NmzJzY2Fv1rYmJy7ty5Dk0RRjG8fft2xowZ5Cdr1qyZNWuW5FBVVVVz586VNRQGg+l+4N6hndUvpnuAZ7yYDqaurq6goIAgCLjrnCAIgUDQ0YnCdBOK3tHU1FRSUkIQhL29PdFFqKiogHbx8uXL1tZW/A2o29Da2go1W1tbW1lZSRCEv79/m6GEQiGLUBgMpvuBe4d2Vr+Y7gHe1YzpYPz8/Are4e3t3dFpwXQxGhsb77wjKyuL0UNycnJBQUFCQgLR1dixYwe0C3Nz845OS9eo666Cvr4+1OzOnTulD2VmZsYiVM8kJycHROXt27cdnRZMh9FtNEZ37R06pILYqV9M9wCv8WIwmK5KaWmpl5cXQRBz5sy5cOFCRycHo0RwXWOkZNeuXREREQRB8Hg8FxeXjk4OpmPAGqOTgysI087gNV4MBoPBYDAYDAaDwXRP8IwXg8FgMBgMBoPBYDDdEzzjxWAwGAwGg8FgMBhM9wSf4+1x1NfXX79+/e7du2VlZQRBmJqaOjs7jx071snJidF/dnZ2UlJSdnZ2ZWWlhoaGpaWlh4fHtGnTtLS0FP4uMjU1NVFRURkZGfX19Q4ODr6+vpJPZNXW1l69ejUlJaW8vFxHR8fGxmbixImjRo1SUVGR8Ir4+Pi///67oqJCVVW1d+/erq6uEydOZG0N4unTpwkJCbm5uTU1NaampoMHD54+fXqfPn3oPnk8XmNjI/rX3Ny8X79+UNrnzp0rKCgQCoVWVlbDhw//8MMPZUpDenr6lStX8vPz6+vrTU1N3dzcpk2bZmFhQfbz4sWL8vJySkAtLS1XV1f4LRKJHj58SPHg7u6upqbGosArKiry8vLIT9zc3DQ1NWWtYnoWwAIzQRCVlZUPHjxArioqKiNGjJAQ/P79+xcvXnz58qW+vv7IkSPnzZuno6MjZ6lKT0cJHrmIEO+9956pqSn6t6io6NWrV3369LGxsUEP6fKgra1NrywltUE561oehaYQ0a2trT1//vyjR4/4fL6VldXo0aNnzJihoaFBKAeFZFAgEJw5c+bx48fl5eX6+vpOTk5z5syhmDoXl6/y8vIXL16QfQ4bNoycXxZyQhBEamrqjRs3cnNz6+vrDQwMnJycPDw8RowYoar6/z/cNzc3p6WlEQTx+vVreJKenk62/G9jY8OojaXRzLdv305ISCgvL7e1tZ0xYwZZ5IRCYUxMTEpKSlVVla2t7dy5c4cNG6YQZdIOiZFSdcgkJyKRSP7+pf01hjKKgn47ADvhlwfphyXyDN7q6upu3779+PHjwsJCgUBgYGDg7Ozs7e3N6J9dBbHrhdtZ/WI6NSJMT4LL5ZqZmYFO6du3L3mkO2DAgF9//bW1tRV5joiIcHR0BFd1dXU7OzukXMzMzCIjIxX4LpFINGfOHHAtKCi4fv26oaEhRVYDAwPFvWvfvn1GRkYEQaipqdnZ2aF3ubi4pKSkMAY5cOCAnp7e/+xzUFXt06cPypqKisr48eNv3bolU8EWFBTMnDkTYtDX17e3t9fW1ob0rFixora2luLfzs6OnDUOh9PU1BQQEEDJsqGhofRpyMvLQ/aujY2N7ezsQK1ramquW7euqakJ+Vy2bBldFdjZ2SEPjBdEVVdXsyvwEydOUKJiUcUUGLOA0NLSInvm8XionAUCgZ+fH8W/tbV1RkaGnKUqJbIKHtw8YWlpKb/gMZbVqVOnyH58fHwIgpg0aRL5IV0enJyc2q0NylTXEmCh0OQX3bNnz4IaJOPo6Jiens7lcuFfLpcrZRZAr4oLpagM3rt3j37fSWhoqKz5QpSWlsojJ4WFhePGjQNv+vr6dnZ2mpqa8K+5uXlgYCA0Q/LN24wEBwe3Wbx0zSwQCOifHf39/VtaWkQiUX5+/oABAyiuq1evVogyUWpiZFIdMsmJ/P2LOJSkMZRXFJQXsRB+ySiwd2A9eCsvL/fz80NzSBMTE3t7e9RCZ8+eXVZWRolf1gpi3QsrXP1iujR4xtuDQFrmyy+/LCkpgYevX78OCgpCn8kFAgFlCmpsbBwVFdXc3AwP8/Ly0PVlYWFhinoXecYbFxenqak5bty44ODg0NDQTz/9FH36jYiIoL/riy++ANfVq1dXVlbCw9TUVDc3N1iMunr1KiXIoUOHQJvv3r27rq4OJW/16tWyTr1EIlF6ejp0PNbW1pcvXxYKhdCph4eH6+rqwjfgiooKcpAzZ86cOHHixx9/hNdx3qGpqblo0aJff/1127Zttra2Ms14eTweaHYHBwfU8dfW1gYHB8PHY29vb1SJiYmJXC535MiR8HZ/f38ulxsVFYVia2lp4b5j4MCBBEFs376dy+U2NjayK/CcnByIbejQoeQq9vb2Dg0N5XK5S5YsUVdXl1DFdCALO3bsgFBDhw7lkjhy5AilcFA5+/v7GxkZffPNN/v27duyZQsaIPbv35/eccpUqtLAQvAkjGlkFTwul/vLL7/Ai/r27QtllZubizxUV1fDSEJVVfX169d0ebCzs9PR0Tl8+DBlnqzUNihTXUuAhUKTU3Sjo6NBTvT09IKDgzMzM+GurEmTJpmamm7evJnFkEvCQI1FBnNzc0+8A2qKIIjLly9ra2sPGjRo06ZNe/bsQWHJw3cp8wWKhcvl1tfXs5aT2tpaBwcHgiCGDx+elpYGD4VC4dWrV/v370+eLNXX18PrPDw84PmGDRvIovL48eM2i5eumRcuXGhhYbF27dp9+/Z9++23xsbG4LRmzRo+n29raztgwIAtW7bs3bs3ICAAjftPnjwpvzJRXmJkVR0yyYmc/Ys4lKQxlFoU5BexEP42UWDvwHrwhrpXPz+//Px8eNjY2BgdHQ0L705OTnw+X57um10vrAz1i+nS4BlvT2H//v3QvBcvXkx3/fnnn+mKDMZPCQkJdP++vr4EQejq6pKHxfK8izzjdXBw+OWXX8hOJ0+eBCc3Nzdx7/rqq68oTlVVVb1794b1jfLycvS8ubkZvlkuWrSInrzly5fLNOPl8/mw00xHRycnJ4fiev78eUiej48PZU2b3FU4ODhYWlpmZWUhp1evXunq6ko54+Xz+TAo1NPTe/HihbgC37p1K/l5XFwcPJ8yZQpjtG/evNHS0qKUOYsCZ6ziffv2kZ1Onz4troolAFfJw/UGEryhcra3t3d0dCwuLkZODQ0N5MmM/KUqAXaCJ25Mw1rwBg0aBHNa+qd3uNMFOHr0KMX1zZs36urqH330UYe0QSnrWgKsFRo70S0sLOzVqxdBEBoaGpQFnNbW1o8++ghtM1bsjFfODPbr12/VqlUwPgb+85//kIfvrPPFTnXs2bMHQqHBNCI3NxdW/CjLgxwOB4LweDwRK8ia2dnZmTwxyMnJgQzq6ektWbJkxowZ5KnauXPnIKC7u7uilIkyEsO6z5JeTmJjY1n0L+JQksZon6KQs9+UgMJ7BxaDN5DP0aNHw0YDMmlpaTBJXr9+PT02KSuIXcNRkvrFdGnwjLdHwOfz9fX1YRMIfZgLX/5gnx5ZkX3xxRcjR45kjDA5ORmUxYEDBxTyLnL/4eHhQQ+Fjp3U1NTQ36WtrY0+mjKOljZu3IgeZmdnw8Mff/yRHiQ1NVWmGe/WrVshNnFBPD09wUN8fLy4oQxBEKdPn6a4BgQEeHp6SpOGLVu2QCSM/UpTUxN8ItXV1SUPDVtaWtBZzefPn9MDhoSEEARB/uDKrsDpVTxmzBi6a9++felVrNgZL0EQV65cobiGh4eD05o1a+QvVQmwEzxxYxrWgocC0nv6GTNmoIKaOnUqxfW3336jC2q7tUH5Z7zsFBpr0YVROEEQy5YtowcpKytDS3CKmvEqJIODBg2ijFwfPXrk4uKC1ujY5Yu16pg3bx5s0ibPKCgSq7wZL0EQN2/epLh+/PHH4KSpqYkWwRDvvfceXRjkUSYKT4w8fZb0ctLS0mJtbS1T/yIBJWmM9ikKOftNCSi2d2A3eMvOzrazs6Ps+kFMmjQJJvP0TwbSVBDrhqMk9Yvp0uAZb4/g4MGDkr+2ikSiBQsWGBoaUmah4kB2KT799FNFvQv1HwcPHqQHQcdRnjx5Qn/XzJkzGV+Um5sLHnr37o0e5uTkwMMRI0bQv0q2tLTweLxXr16JpKC1tRUdJbp79y6jnwMHDoAHb29vcUMZY2NjmTbHUtKAjHb8/fffjH4++eQT8BAeHk5+/tNPPzFO9iDa9957z8DAAO0fY13g9Co+dOgQ3XXWrFn0KlbsjNfc3Jze7/7999/g6uvrq5BSFQc7wWMc08gjeJmZmfCcclgXtjTPnTsXYlZXV6cMzqZNm6atrU2Wh/Zsg/LPeNkpNHai29zcDCsMBEEkJiYyxjlt2jQWQy52x8+kz+Cvv/4qIR7W+WKtOhYsWADPL168SA9VVFTE4/Eok2EFzngtLS3pGgOtLNFVukgkmj9/PuXtcioThSdGnj5LSjkB0H5scf2Lvr4+RZ+IQxkao92KQs5+UwKK7R0UPlAUiUQrVqyAOPPy8ihO0lQQu4ajPPWL6dLg24l6BNevX4cfH3zwgTg/0dHR1dXV4iww8/n8Fy9e5PwvSFXRTTLK/y50PIYMbPuBb9X0d6GDWxQcHR3hLSUlJch8qKOjI+yPevjw4YQJE+7cuUMOoqam5uLi0qYlQyAzMxNKQEVFRZxJTFQOSUlJzc3NjH7c3NzQaUBZyczMBNukmpqayBgmhcGDB6M0kJ8vXboU3nv8+HGyUVCCIMAs6meffQb7BuUpcDqM6bSysqJXsWJxdXWlm8RkFC15SlUcnUTwBg0a9P777xMEcevWrYqKCvQ8Pj6+ubnZ398fTOO0tLSgfe8EQVRVVV2/ft3Hx4csD52hDbJDeoXGTnSfPHlSV1cHv93d3aVXdB2eweHDh0twZZ0v1qoD+Z8/f/7OnTvfvHlDDtW3b18XFxd0vFDhuLi40DWGiYmJBGFAZn5qa2sVq0wUlRiF9FmS5QRYunQp2OAQ178sWrSIok/EoQyN0W5Foah+U9n5kn/w1tLSUlJS8uzZM6R5kLpoU/MwZoRdw+lw9YvpnODbiXoE//zzD/yg28qXTGZm5p49exISEpAdeQqUbkyedyHotvVgOxD8EAqF6CHa6ZSZmbl3717G2DQ1NSGRmZmZcCBETU1t37598GkwKSnJy8vLzs5u7ty5vr6+np6e0lyQQM+shYUFSiEFZG+zoaGhoKAAWVshw/qeG3Ih6OrqokM4FODSDigE8nMrK6s5c+acPXu2srIyJibm008/RU5gJgRtDZKnwOWpYsXCQrRYlKo4Oo/gffTRR9u3b29tbY2NjV2yZAk8/PPPP7W1tadPn25qagoLiTExMWi5LDY2tqWlBbaYkunwNqhshcZOhJ49ewY/LC0txV18JU+rV14GJaeKdb5Yq47ly5cfPXo0MzOzvr5+48aNP/zww+TJk319fWfPno2+VSkPspVaBNoPySgMyEotEgZFKROFJKY9+6zevXvPmTPn3Llz4voXtADYJsrQGO1WFIrqN5WdL9aDt+bm5qNHj/7+++9paWlNTU3sNA8d1g2no9QvppODZ7w9gsrKSviBdnpIw8GDBwMDA4VCoZqa2rRp09zc3AwMDOAbc319PdqwpJB3MXbSZBi/4qN3nXqH5GjJy1kLFy40NDRcs2YN7JUqLCwMfYeFhUVAQMC6devQh3PJSJNZOBgDvHnzhrHLlOZy4zbTUF1dDQYzpCwEYOXKlWfPnoUhCBqRFBcXx8XFjR07FqwcyV/grKtYsbAQLXalKo5OInjz58/fvn07zGlhxgu3RM6YMUNPT2/8+PFmZmYVFRV//fUXn8+Hg1t//vmnlpYWOlzQedqgshUaOxGqrq5us4LEDUY7NoOSdRHrfLGWEy0traSkpKCgoGPHjrW848o7VqxYMWHChPXr10+dOpVQGozVLaWrwpWJYhPTPn3WihUrwIAWvX8ZM2YMWqCTBoVrjHYrCkX1m8rOF7vBW1lZ2dSpU588eUIQhK2trY+Pj7W1NfoQExcXd+/ePTkzImvD6RD1i+n84BlvjwDtmJV+9SwxMfHrr78mCMLIyOjmzZuUHSB8Pl/c+InFu1iDtOqOHTvIRncYQdZlgBkzZkyfPj0xMfHkyZNnz56FzXLl5eXBwcFHjx69ePEiulxBAtJkluykjHvPUZzW1tYXL16U7Jn+LXzixIkDBgx49uzZ/fv309PTwXDxkSNHhELhypUrFVjgXQs5S1UCnUHwhgwZ0r9//+fPn9+4caOqqsrY2Dg+Pr6pqQlO/ampqc2dO/fIkSPNzc3x8fGffvppdXU1bGkmj5M6SRtUtkJjR3uqwfbMIOt8ySMnRkZGYWFh27dvP3369KlTp+7evUsQ/2OC5OY7OBzOsWPH2uF7WSdUJixo5z5r0qRJ7733Xm5uLr1/kX6BV0kao92Kop37Tdb5Yte6/f39Ybq7dOnSw4cPU85nlZSUsJ7xsm447a9+MV0CPOPtEZiZmRUXF8t0QhIZDwwKCpLpwAOLd7EGvcvMzMzFxUXW4HBt/fjx4w8ePHjjxo3w8HD4Gl1RUeHr65uXlwfX1klOAPzg8/ni/JCdGDeeyQmKs6WlhUUhwGd4uNLw8DuEQmF4eLi5uTmc51RggXch5C/VTi548+bN27lzJxzB2FUEAAEAAElEQVTW5XA4sISLRmPz5s07cuQILAJ/+umnsbGxzc3NyApOp2qDylZo7EDLTRIq6O3btwp8Y/tkkHW+5Fcd5ubmX7+jqKgoKirqwIEDRUVFcA2yi4sLupS1pykT1olpnz5LRUVl+fLla9eupfQvpqamH330EbsIFaUx2q0o2rnfZJ0vFoO39PT0W7duEQRhaGi4b98+1uZIFNtw2l/9YroEnfezKEaBIDsEyCRgm6DTEciKPZn/MfOtuHexBr0rPz9fnnjU1dWnTp169uzZu3fvwl6X0tLSv/76S/oEVL2D0U9eXh78MDU1tbW1lSedktNQVlZWX1/PIgYOhwO5joyMrK2tjY+PLy4uDggIoG+TU1SBd37kL9VOLnjoRO6ff/5ZV1d35cqVadOmoSXcCRMmwKDh6tWrtbW1f/75p4aGBrJI3KnaoLIVGjvQJc9VVVVobx6FV69eKfCN7ZNB1vlSoOqwtrYOCgrKzc1FMnzixAmC6OnKRNbEtFuf9fnnn0NXQu5fFi9eLM9ZHoVojHYrinbuN1nnS56B4gcffMB4YlYezcO64bS/+sV0CfCMt0cwffp0+CFhe8nkyZPt7e3R0AGZGWDcySPhyxmLd7EGLUnBPjdGEhMTrays7O3tGxoa4ElWVpavr298fDzd8+jRo5cuXQq/xZl+IWNjYzNw4EDJaUAmBH18fOiWNuXHxsYGTtuKRKKUlBRx3mbNmmVlZfXf//6X7mRsbAyXOtbV1UVFRR06dEhFRWXZsmWKKvB2QOEzFvlLlU6nEjxXV1dHR0eCIK5duxYZGdnY2Ei2SqWuru7r6wt6ICoq6tq1a97e3gYGBp2hDbKra9YKjR39+/dHl5EmJiYy+pEgV502g6zzxVp1bNq0aeHChXTPWlpahw8fltxkFK4WOo8ykScx7dxnmZqagm5B/QvckipTJMrQGO1WFO3cb7LOl8IHilJqHgkVxK7htL/6xXQJ8Iy3RzB37lwwvvfo0SNkjo9Mdnb2jRs3Xr58OWHCBHjSr18/+AF3u1O4ffu2At/FGl9fX0jn3bt30X19FA4fPlxWVubh4YE+QFZUVMTGxl64cIHRPxrWS3nVwZo1a+DH8ePH6a5CofCPP/6g+FQ4sGeMIIijR48yesjJybl48WJ5eTnd8hCAjuzu2rXr2rVr06ZNYzQXya7AlQfawEa+N+LSpUuurq6LFy/u8FKl0NkED3YVNjc3f/fdd5qampQlXLSH+bvvvhO3pbk926Ccdc1aobEGjenDwsLorllZWffv31fg69otg+zyxVp1JCcnR0dHwwZmCnp6enB4j9JkGEVl5syZrq6uDx8+JDoChSsTeWj/PovSv0yZMuW9996TKQYlaYz2KYr27zfZ5UuegSJci03x39raKuG2LWkqiHXDaWf1i+kadPSFwJh24tatW2DbY9y4cU1NTWSnpqYmsPewZMkS9BDZ0Le2ti4uLib7Ly4uRt/Pxo8fL/+7KPe5FxQU0OMMDAwE19u3b5OfJyYmwrtGjRpVX19PCQVqXVtb++nTp+ghDP50dHT++ecfiv/6+nqwHmlkZFRbWyuSAqFQOHnyZEhbXFwcxRVZi1m/fj09LI/HA1cOhyOSg9bWVm9vb4jq3LlzFNe6ujrY5LN48WIJkZDP/tEzIk+By1nFEmhtbQVjjEOHDkUPv//+e4qASS5nZNeRIswKKVUy7ATP0tISbllQoOAB5KnRzJkzKa5NTU3Gxsbgqq6uXlVVJS6e9mmDUta1OORRaOxEt66uDl3ycfjwYbL/qqoqNzc3dIsvl8sVSQ1cHEUPpdQMkmGdL3aqY/z48eJaWWRkJLxox44d5OchISHw/Pz58/CkpqYGNtYWFRWJpECyxkALXKGhoVIKgzzKROGJkUd1SC8nFMhmmekl0CZK0hjtVhTy9JsSUHjvIOvgTSAQQBoIgti+fTslNrgRQFy3Lk0FsW44SlK/mC4NnvH2ICIjI2Hnibu7e2xs7MuXL589exYTEzNkyBB4WFNTgzw3NjaOGjUKNIKRkdHOnTv/+uuvu3fvhoSEWFpa+vj4gJOlpSXnHRRNLf278vLyIAYbGxuI08/Pj8PhnDx5EjyAq7OzM7hOnTqVw+EEBwejd506dQpGM87OzpGRkfn5+UVFRbdv3/7ss89UVFQ0NDRiYmLIaUPLHZaWlvv378/KyiovL8/JyYmJiYGr5NXV1dFQSRoqKyvHjBkDATds2JCenl5aWpqSkoLuMl28eHFzczM5yO7duzkcDlpVc3R0hGyuWbNGxIqqqqpx48aBxcKvv/46JSWlpKQkPT39yJEjcPOep6dnXV2dhBjCw8MhMTY2Ni0tLRJ8ylrg8lexBOCGRjBgU1RUFB8fD/O0O3fuSChnGHNcuHCBw+H4+/uLE2b5S5W14EVEREBi4IiatrY2/IsKjZ3gUUBjgt9//53u+vnnn4Orj4+P5Ky1TxuUXNeSYafQ5BRdHo+HvhrMnDkzPDw8Ojp68+bNvXv3HjJkCLI15eHhAfHw+Xxx6efz+eDHw8ODEgqEWbEZ5HA4ycnJ4hIjZb7oQ0lZ5QTNeOHk+bVr14qKioqLix8+fBgUFAQHQT09PQUCATlITk4ObNT09PTMzs7Ozc2Fe3EmTJjQppxI1hibN2/mcDjQ6AiCGD58OFlpMwrDTz/9xFqZKC8xsqoOdnJC5uDBgxCwd+/ekpUSI8rTGO1WFCyEXxxK7R1kGiiKRKLY2Fi0L9rHx+fkyZP379+/cOGCn5+fvr4+kk/Gbl2aCmLdCytQ/WK6B3jG27N4/PjxlClTiP+Ltrb2qlWr6CqjtrZ22bJllOMZenp6O3bsoF8ZR/+AJ+W7xJ2mCAwMBA+MrpSVCh6PN3XqVPoxGy8vr9TUVErC6uvrf/vtNy8vL0a7guPGjXvw4IGsBSsQCH755RdTU1NKbI6OjlFRUXT/4u6QtLOzE7GlsbExJCSEbk/S1NR027ZtlEEhnbq6OjBcRP9SS0emAldIFYujpKRk2LBh5IAaGhohISGSy7m6ulokEm3dupXRlSzMcpYqa8ETd84NFRo7waMAe8Y0NDQYl3AvXboEsR07dqzNqNqhDUqu6zZhodDkF91nz55Rjm+oqqrOnz+/uroardYiSktLxSW+tLSU8V1ImBWbQTAHJaEwJeQLHa8NCwuTU05EItGTJ09WrlzJeGWLiYnJ5s2bGxoa6KH2799PMbzn4uLy77//itpCssZgNBiLlDZjwJEjR7JWJkpNjEyqg7WcIGpqavT09AiC2LJli0h2lKox2q0oZBV+cSi7d5BpoCgSia5duzZgwACK/zFjxqSnp6NdBozdupQVxLoXVpT6xXQPVDqJaQdMe1JeXp6SklJaWqqiomJnZ+fh4cFokwaorKy8d+/eq1evNDQ0bG1tPT09Zbq5W6Z3ycnr16/hXbDbx93dXfLVdm/fvs3IyMjNza2pqdHQ0LCysho2bJg8t+G1trY+evQoLy+Pz+ebmpoOegfr2FinITU1NTc3t6qqSl9f38nJadiwYcq4B5hFgSsJkUj06NGjrKyshoYGCwuLcePGWVhYdOZS7ZaC1z5tUP66llOhseP58+d///13dXW1lZXViBEjpDyqzY72zCBjvnbv3g1fUk6dOgUm8RSiOvLz82FlTyAQGBgYODk5ubm5SWiDFRUVSUlJpaWlmpqaAwcO9PDwUIbhwE6uojuV6nBzc0tPTy8sLER77FmgPI3RbkXRzv0m63zJNHiD+XxGRkZdXZ2Jicnw4cPBMmKbyFRB7BpOe6pfTGcGz3gxGAwGg8Eohv/85z9wqPjevXtoozWmh5OVlTV48ODZs2fHxsZ2dFowGExPBNtqxmAwGAwGIy1r165FhrLoJCcngyFWdJ0mBgN2IpDRZgwGg2ln8BovBoPBYDAYabG3t6+srCwpKYGTmWSSk5PHjh0LRwpDQ0M7KIGYDib2HUePHgXDv3w+39bW1tTUNC8vr5PsLcdgMD0NvMaLwWAwGAxGBmpra+fPn19VVUV++ODBA7i3uX///tu2beu41GE6GB6Pd/z48WvXrsG/33//fU1Nzdq1a/F0F4PBdBQMVu8wGAwGg8FgGDEyMiosLLx8+bK1tfX48eOtra1bWlrS09P//vtvgiBGjx79559/GhoadnQyMR3M7NmzPT09S0tLs7OzPTw8vvzyy45OEQaD6bngXc0YDAaDwWCkRSgU3rp16/r1648fP87Pz6+pqVFVVTU3N3d3d/fz85sxY0ZHJxDTwdy4cWPv3r3//PMPn8+3srKaOXPmd999p7xrGjAYDKZN8IwXg8FgMBgMBoPBYDDdE3yOF4PBYDAYDAaDwWAw3RM848VgMBgMBoPBYDAYTPcEz3gxGAwGg8FgMBgMBtM9wTNeDAaDwWAwGAwGg8F0T/CMF4PBYDAYDAaDwWAw3RN8Hy+mM7JgwYLS0lL0r4+PT1BQUIemqCvRmUuvqqpq7ty55Cdr1qyZNWsW0QM4ePBgTEwM+tfExOTcuXMdmqLOyNu3bynX20gpIawDYjobPbAqRSJRdXV1eXm5ioqKkZGRhYVFR6cI02H0QPnHYNoBPOPFdEaK3tHU1FRSUkIQhL29fUenqCvRmUtPKBQWFBQQBFFbW1tZWUkQhL+/P9EzqKyshLy/fPmytbXV0tJSUTEvWbIkKyuL0enChQtWVlZE16G1tZWdhLQZkM/nz5o168mTJyEhIV988QWLtMkfA0apMtDlaGxs/OOPP2JjY2/duvX27Vv0XF9ff8iQIWPHjvXx8RkzZoy6urqU7R3Q1tY2NTV1d3f39fV1dnYmOx06dOj3339nDLVly5bp06dTHq5cuTItLY3ysFevXtevX5c6lz2d33//PTAw8P3337906ZKJiUmb/nuO/GMw7Qme8WI6gMbGxpSUFIIgzMzMBg0aRPeQnJxMEMSTJ09cXV07IoGdmi5demZmZtCXh4WFLV++nOhJbH4HQRBWVlZlZWUKjLmurq66upogiLy8vJaWFoIgbG1tdXR0YPBEdCn09fXZSUibAU+dOpWUlEQQxLp16+jz1ZycHNgZ4e7urqenx/gKyTFgOlwGuhanT59et27dy5cvVVVVx48f/8EHH1hYWDQ1NRUWFiYlJd17x88//2xhYbFw4cLVq1fb2tq22d4Jgmhubi4pKWloaDh37tyGDRv8/Py4XK6ZmRm4CgQCCFtSUlJTUwM62dTUlCCIpqYmeiLRu/Lz85ubm/v376+qqioUCtuxnLo869evr66uTklJ+eOPPwIDA9v030PkH4NpZ/CMF9MBlJaWenl5EQQxZ86cCxcudHRyuhi49DAUTp8+DT/s7e0LCwsJgvjzzz9HjhzZ0enqXAwcOBB+UFa9gF27dkVERBAEwePxXFxcWMSAwUiJSCT6/vvvf/75Z4IgfH199+/fb21tTfGTlJT05ZdfPn36tLy8PDQ09P3331+2bJmU7V0oFN64cWPVqlU5OTlnz57NyspKTk6Gae237yAI4vPPPweBX7t2rYRjL2hB+P3338/JycnIyNDS0lJCkXRnBg0aBJ84sd7AYDoQbLkKg8FgMN2fsWPHJiUlHTp06PLlyx0VAwZDEMTGjRthuvvFF1+cP3+ePt0FYbt37x67OZKampq3t3dycnKfPn0Ignj69CnMcjEdwoULF7hc7o0bN7y9vTs6LRhMzwXPeDEYDAbTI/D09FyxYoWxsXEHxoDp4SQkJOzatQtW/A4dOiTBp7GxMSzDssPMzAxNdCMjI+FEKKb90dfXX7Zs2cSJEzs6IRhMjwbPeDEYDAaDwWCUTmtr6+rVq+H3zp07KSap6AwfPnzs2LGsXzdhwgT03nv37rGOB4PBYLo6+Bxvj6O+vv769et3794tKyvT0NDo06fPxIkTPT091dTUKD55PF5jYyP619zcvF+/fgRB3L9//+LFiy9fvtTX1x85cuS8efOQzYw2efHiRXl5OdgQBuu1Dx48QK4qKiojRoyQEFymV9fW1l69ejUlJaW8vFxHR8fGxmbixImjRo1SUVGRMrUEQVRUVOTl5ZGfuLm5aWpqVldXR0REZGZm6ujoDB48+JNPPiFbu8nLyzt16lRubq62tvaIESM+/vhjXV1dCW95+vRpQkJCbm5uTU2Nqanp4MGDp0+fDhvSOqr0CIJIT0+/cuVKfn5+fX29qampm5vbtGnT6NdmiCsigUBw5syZx48fl5eX6+vrOzk5zZkzR5zh6Obm5kuXLt27d6+0tNTQ0HD48OFz587V19dXlDAj6urqbt++/fjx48LCQoFAYGBg4Ozs7O3t7eTkxOhfXCvIzs4+d+5cQUGBUCi0srIaPnz4hx9+SAmblpYWGxv777//amtr9+vXb968eR1oN1sZzZlMdnZ2UlJSdnZ2ZWWlhoaGpaWlh4fHtGnT2jz1V1tbe/78+UePHvH5fCsrq9GjR8+YMUNDQ6PNN0ofUJyIguCBKdrXr1+DU3p6ukAgQD5tbGz69OkjIQbWzVlcnDU1NVFRURkZGfX19Q4ODr6+vuLOFStKBm7fvp2QkFBeXm5raztjxgyyGhEKhTExMSkpKVVVVba2tnPnzh02bJiEV0iZdwXKgJRKXlY1paT2cuHChZycHIIgDA0NKTfQiGP27NlgL40F5ubm6DeScCWRmpp648aN3Nzc+vp6AwMDJycnDw+PESNGqKpKtbICvRv6V0NDAyTtxYsXZ86cyc/PFwgEtra2c+bMoUigPCpaSomlpA3Q0tJCtiFFItHDhw8pHtzd3TMyMhjTpij5l76bxmAw/9NQMT2HsLAwsNmoqqpqbW2N7kdxcnL666+/KJ7t7OzIosLhcAQCgZ+fH0WErK2tMzIypEwAsr3BiJaWFtkzj8dj/ep9+/YZGRnBiSY7Ozsw2kEQhIuLS0pKivQlduLECcpLCwoKrl+/bmBgQH5oamqamJgIQX788UfKjMva2jo7O5sx/oKCgpkzZ4I3fX19e3t7bW1tSPaKFStqa2s7pPTy8vLQiSNjY2M7OzvofTU1NdetW9fU1NRmEd27d49++05oaCgKxeVy4SGXy33y5ImDgwPFs5mZ2dmzZxUlzCKRqLy83M/PDw0jTExM7O3t0aRl9uzZZWVl9FD0VtDU1BQQEEBJraGhITlUZWUl4+gqKChIKBRCUi0tLUWKBqWWLuTKaM5ARESEo6MjBFdXV7ezs0PjLTMzs8jISAlhz549i6zIIhwdHdPT08kSImdARhEFJ/LN1YwEBwdLjoF1cxanWwwNDSnPAwMDRYqAUQbogurv79/S0iISifLz8wcMGEBxXb16NWPkMuVdITIgk5KXVU0pqb18/PHHEPDDDz+UMohQKBQIBFAj0rd3IDs7GyX1zJkzZCcOh0OW8DaBb4ICgYDuVFhYOG7cOFT1dnZ2SK+am5sHBgZSugxGKL2bpaVlS0vL2rVrKQUORVdVVUUvBJlUtEwSy9jz2tnZIQ/kb2SI6upqetoUKP8yddMYDAbPeHsQK1euBOW4fPny0tJSePj06dPJkyfDtOHo0aNk/1FRUVwud8OGDUhZ+/v7m5mZrVu3Ljw8fNeuXehqnP79+0upXhMTE7lc7o4dOyDg0KFDuSSOHDkibs7m7+9vZGT0zTff7Nu3b8uWLWgcxvhqdHHI6tWrKysr4WFqaqqbmxvcVXj16lUpCy03N/fEOyAsQRDx8fFaWlrTpk0LCQn573//iw7n6Ovrv3r1KjQ0VE1N7dNPPw0NDd2+ffvgwYPB1dnZubm5mRJ5eno6jLesra0vX74sFAqh7wwPD4c1YTc3t4qKinYuPR6PBx2wg4PDrVu34GFtbW1wcDCsnHh7e5PzQi+iy5cva2trDxo0aNOmTXv27EF3CTLOeDdv3mxiYjJx4sTLly8XFBRkZGTs3LkTsq+ionLq1CmFCDO5QPz8/PLz8+FhY2NjdHQ0rIQ4OTnx+XxKqDNnzpw4ceLHH39EhcnhcDQ1NRctWvTrr79u27YNrgwhD6fq6urc3d3B/4QJExISEiBfwcHB+vr6Gzdu7JAZrzKaMzBnzhwYckVFRSHByMvLQ/UeFhbGGDA6OhokSk9PLzg4ODMzs6CgICEhYdKkSaampnCTE+NoT9aAOTk50EaGDh1Kma/W19eDk4eHBzht2LCB3KweP34sOQbWzZkeZ1xcnKampre3d2hoKJfLXbJkCdr1GhERIZIbujAvXLjQwsJi7dq1+/bt+/bbb9H55DVr1vD5fFtb2wEDBmzZsmXv3r0BAQHoa9HJkyflzLv8MiCrkpdVTSmpvaAJ9rZt20Ry0+aMl3z1bl5enjJmvLW1tfC9cvjw4WlpafBQKBRevXq1f//+8Irq6uo244fejcvlwtYeS0vL77//Xl9ff9euXRkZGSAV48ePhwjd3d3r6upYq2hZJRbShqxh+/v7c7ncqKgoFFtLSwskHsy5b9++ncvlNjY20qVIUfIvazeNwWDwjLencPDgQVCdAQEBFKfGxsbhw4fDp83k5GRx8wR7e3snJ6fy8nLkJBAI0K6euLg46RMDd83B/ToSvJFf7ejoWFxcjJwaGhrIw0RyqP3798Pzr776ihJhVVVV7969YemJnBHph/XQwRw6dIjstHjxYnBasmSJsbEx6n6gbNHk59KlS+RQfD4fNjjp6Ojk5ORQXnf+/HkI5ePj09ra2m6lx+fzYfiip6f34sULSpxgX5QgiK1bt0ooon79+q1atQrGEMB//vMfcTNeLS2tjz76iJLHu3fvwli/V69e//77r0KEGQpk9OjR9NWStLQ02Hq3fv16yYXp4OBgaWmZlZWFnF69eqWrq0seTn3zzTeogij5Sk1N1dHRgay184xXec0Z6j0hIYHu5OvrSxCErq7u69evKU6FhYW9evWC7YuU1La2tn700UdoOzRltMc6IFlE6fNVNAHg8XhtZpYeA+vmTNEt+/btIzuhe2jc3NxECoIszM7OzpRJOJSenp7ekiVLZsyY0djYiFzPnTuH5hsKyTvrqpRHycukphTbXsi3cEve+6CQ9t7c3Iw2AHt6elJcFTXj3bNnD8SDPiMicnNz4bCPNDNeBExE1dXVdXR0UlNTyU5CoRCtyq5atYq1imYnsXFxcfB8ypQpjCl/8+aNlpYWvamSvz4rRP7l6aYxmB4LnvH2CPh8Pnw31dTUZNy6eePGDVCRw4YNE6esCYK4fv06xfXIkSPgtGbNGunTI+ucjSCIK1euUFzDw8Ppr0Y51dbWRh/+GbvnjRs3Sp9g8jhp7NixFKenT5+idH7zzTcU16ioKMYi2rp1q+Qti56enuAhPj6+fUpPJBJt2bIFnjPO/ZqamuC7sq6uLn0Qg4po0KBBlFnlo0ePXFxcyB/F0YxXnEwuXboUPKxYsUIhwpydnW1nZydu0XjSpEkwSqZPSCiFefr0aYprQEAAGlAWFRXBnnZ1dfWXL1/So1q1ahXE07EzXgU25y+++GLkyJGMTsnJyRDhgQMHKE7Lly8Hp2XLltEDwsFsxtEe64BKnfGybs7kOMeMGUMP2LdvX3CtqakRKQKyDNy8eVPctltNTc2SkhKK63vvvUdPDOu8s6tKOZW8TGpKse0lKysLxSbTRyUW7b2iouKjjz4CV319/fT0dCXNeOfNmwfqjvztAAFnlVnMeMWJU0FBAShYNTW1V69esVDRrCW2paXFxsYGnj9//pweKiQkhCAIymYrCTNe1qpMnm4ag+mxYFvNPYLIyMja2lqCIMaNG8do0sDLyws2dqalpaWkpDBGYmFhQTev/8EHH8APilEQxWJubk6/yI7x1SinkydPZrxBZNasWfDj2LFj7BKzcOFCypMBAwYg4yV0V/SVPTc3Fz0UiUToXor58+czvmjBggXwAy1oKLv0RCLR4cOH4Tca+JLR0NCYOnUqmIz6888/xb1xyZIllJPM7u7uPB6PXjgEQUycOJFRJj/99FP4ERkZ2dLSIr8wOzs7FxQUMOYLKhHM27x48UJcvmDvLv3c42+//YZMy0RGRgqFQvgywnjN5ieffEJ0AhTYnMPDw8UpDbR/nuKhpaUlMjJSQoFYWFjANwgKrAMqFUU1Z8YcIQUiWTJZYGlp6eXlJe51Xl5eVlZW4lzz8/PlzDvrqlSUkpdJTSmkvVRXV6PfZEuH8hMcHLz8fwkICJgyZYqNjc2ZM2fguOm1a9eGDBlCKAcow5aWloSEBLprWFgYj8dr0wYhI4wVYWdnB9NRoVCI5EcmFc1aYtXU1L788kv4jb7YIuAzroGBAdoeLxnW8q+obhqD6WngGW+P4Pr16/AD7bCloKqqik43oSUyCi4uLnQDmGhIVFNTQygNV1dX+qth6xrl1Sin6FQeBUdHR9gpVFJSwm4EiXayIVRUVNDAi25VFdlTgVEakJmZCbYfVVRUxNk+RcOppKSk5uZmFkmVtfQyMzPBnqempiY9mwA6mSzBfCjsK5YScdlHkdTW1mZkZChWmFtaWkpKSp49e5bzv9TV1YET3SYnGTc3N8kXiqBiEWc3m7EdtT9Kas58Pv/FixeoVNF+BEqpPnnyBBW4uHpElaiQgEpFUc2ZsdEpT8cyyoCJiYmExNC1Geu8s65KRSl5mdSUQtoLbGEFGG0dsebChQth/8vx48dv3Lihp6fn7e19+PDh7OxsdABVGaBamD9//s6dO9+8eUN27du3r4uLi5TmmsmoqKiIM1GOVCvaQiKTipantS5duhQiP378ONkIM/Q1ubm5n332mZTfMljLv6K6aQymp4FvJ+oR/PPPP/BDwuUoaH8UeecVGbo5QdhXBj9gXUtJSP9qZJoyMzNz7969jLFpampCX5WZmUk3EdwmaMxHBnYf6byD/jp6OlGNWFhYoIyIq5GGhoaCggJkBaQdSk9XV1fcShRc5QKlJ+6NMl2NIM6zrq6uhYUFDE1ycnJQ3y+PMDc3Nx89evT3339PS0trampiDEsZx0iZWsSzZ8/ghzjR0tLS0tfXV+oXImlQbHPOzMzcs2dPQkICujpLcqmiUrK0tBR3uQtjUbMOqFQU1ZzbWcdKUGXiEkPXZqzzzroqFaXkZZIThVQNORLyB1D5uXPnDnlaq6mpKf1ntf853iaHt+XLlx89ejQzM7O+vn7jxo0//PDD5MmTfX19Z8+ejb6rssDAwEDcxWbogh+450nWapWntVpZWc2ZM+fs2bOVlZUxMTFoIxJBELBujDYqt4n88i9nN43B9DTwjLdHUFlZSf/GTAHtO6J8o0UwXj7J4tstC6R/NcrpqXdIjraiokJRiWnTSZ4agUphPeNlUXrV1dVgxIVd6bV5BauUnnv16gUz3qqqKvmFuaysbOrUqU+ePCEIwtbW1sfHx9raGo3v4+Li7t27J09qKRsXJSRPW1u7w2e8CmzOBw8eDAwMFAqFampq06ZNc3NzMzAwgAF3fX09sqHKopQUGFCpKKo5t7OOlayvpNRmrPPOuioVpeRlUlMKqRpLS0s9Pb23b98SBFFUVEQoDq13yBoEfjQ0NEjjv76+nrEctLS0kpKSgoKCjh071vKOK+9YsWLFhAkT1q9fDztsZUVyvwA/yP2CNAEV0lpXrlx59uxZmOKiGW9xcXFcXNzYsWORBe82kV/+5eymMZieBp7x9gjQJh8Jn6KRk5T3nndOUOJ37NgBNjMkgEzCdPIaabdKQW+xtra+ePGiZM+UI3DKgFEmWQuzv78/THeXLl16+PBhys63kpISaWa8bSJN8roTiYmJX3/9NUEQRkZGN2/epGzD4/P5jDNe1qXUOYu3czbnTp531lXZVZQ8HTU1tfHjx1++fJkgCPJJjQ4BTeqkXG2ura3t1asX49KxkZFRWFjY9u3bT58+ferUqbt378Ka8M13cDicY8eOKfDDjZxjFTlb68SJEwcMGPDs2bP79++np6fDrQdHjhwRCoXozjxFJaNLdNMYTFcBz3h7BGZmZsXFxTAAFecHOTFu3+pyOTUzMxN3CqgzgApZmhppt0pBb2lpaWm30oOlA8klgM4Wshbm9PT0W7duwa2M+/btk3zQSx5MTExgZ6+E5MEiT/cA2cUNCgqS/gAtqlBZS4l1wB7YnDt53llXZVdR8ozMnDkTZry3b9+WMghc9ivronSboB2z0pjdqqys5PP5Eg6SgInEr99RVFQUFRV14MABWMeOiIhwcXFZvXq1UvuF9mytK1asgOwcfodQKAwPDzc3N6dbzJKAPPLf/t00BtMNwJaregTIDAPZXDAF1O3JZM+j0+YUmRLt5OmseofkGjE1NbW1tW3PVJWVlUkYcCgWcbv73rx5g/Z9oduDWQszOtf0wQcfMB6akvIwW5ugpD5//pzRQ01NTXea8aKCRfd5SFOqqJSqqqrQJj0Kr169UmDAHticO3neWVdlV1HyjCxevBjsXRUWFj548KBN/w0NDWZmZtra2uKMG7EGTZZQE5YA+CHrYQlYW1sHBQXl5ubCxUUEQZw4cULW5NXV1Yk7+oFOwEqZHoW3Vg6HA/uNwWx4fHx8cXFxQECA9MeaFCL/7dlNYzDdADzj7RFMnz5dgm1DsBuZmpoKv9mdumGHoqYZCLTJDTZWMZKYmGhlZWVvby/l+SVlYGNjM3DgQMlJRVYWfXx8GPeSKbz0bGxs4BiSSCQSd98MXP5hZWX13//+VyEvFfeiO3fuwA9ra2t0CyhrYUaWk8RthJPwoV0m0H0SKP0UpBnmdiEkF6y4Uu3fvz+6uikxMVF6wWAdUHpYNCuFNOcuCuu8s67KrqLkGdHW1t62bRv8/uGHH9r0f+zYMdh1DGcHFMjw4cNhq0tRUVGbSun06dMEQYwaNYrutGnTJsZrhLS0tNAlOuIM2klGXKqQamV3D5n8rdXY2BiuBaqrq4uKijp06JCKisqyZctkSgZr+e+QbhqD6QbgGW+PYO7cubAfKS0tLT09ne4hJiYGRga+vr7k2YWS0NXVhR9ku/+XLl1ydXVdvHixPDH7+vqCIce7d+8yGnKEnUhlZWUeHh7iDCS2D2vWrIEfx48fp7sKhcI//viD4lPZpUcQxNq1a+HH0aNHGT3k5ORcvHixvLx85syZhCK4f/8+o3lwNFqiWL9kJ8zIvCePx6Ofm2ptbVXULQ4ff/yxgYEB7KN++PAh3UN4eLiE4DExMV999RXse+wSoIJFXxnISNi6iQaIYWFhdNesrKz79+8rNqBkGJvVzJkzXV1dGetRUc1ZHq5evfrzOzrWIivrvLOryi6k5Bn58ssv4f7Vq1evilOzwIsXLzZt2gSXzSxdulSxyTAxMUEXF69du5Z85zkFHo934sQJFRUVsmliRHJycnR0NONWHT09PThH2qdPHxYpPHLkCP3hvXv3QNoNDAzEXa7eDq0VHdndtWvXtWvXpk2bxuLeB9aqrP27aQymOyDC9Axu3boFpiNGjRolEAjITsXFxdAhmZiYvHz5khKQx+OBqHA4HHq0aN/p+PHjpU9Ma2sr2CccOnQoevj9998TBLFkyRI5X52YmIhyWl9fTwkFPZm2tvbTp0+lT7BIJJozZw68rqCggO4KlxkYGhpKn06hUDh58mRwiouLo4RC9n7Wr1/fnqXX2trq7e0NTufOnaOEqqurg71YixcvlrWIKHC5XPBsZWXl5uZWVVVFdt23bx+42tvbv337Vn5hFggElpaWEOf27dspEW7fvh2pxNu3b9NTK7kwKcA1FQRBODs7V1RUkJ0iIiIMDAxgcmVpaUkJGBcXh5KRlJQkkh10qUZKSgqjB4U3Z3Q9jLW1dXFxMdmpuLgYLWLQI6yrq0PHAg8fPkx2qqqqcnNzQ5edcrlchQSULKIhISHgdP78eXhSU1MD2xSLiorajIF1c26z4QQGBoqTzEWLFoHTjRs3RFIjWQbQBtTQ0FApE8M676yrUh4lL5OaUkb3JxKJGhoaoMRUVVV3794tFArpfh48eADNx9jY+NmzZ+zau2SysrLQ2eBJkyZlZ2dTPAiFwpMnT8Jt819//TVjJOPHjxfXI0RGRkLkO3bskD5VoKh1dXUNDAwiIiLITuXl5U5OTowCI5OKlqe1IshmC+iRSJM21vIvTzeNwfRY8Iy3BxEZGQk7D4cNGxYbG1tUVPTixYvjx4+DNUszM7MHDx6Q/e/evZvD4aDPwI6Ojpx3wAjjwoULHA7H398fXC0tLcFVypkkfOQGsxZFRUXx8fHQrd65c0f+V586dQqGqs7OzpGRkfn5+UVFRbdv3/7ss89UVFQ0NDRiYmKkLLS8vDyI3MbGBl7n5+fH4XBOnjwpEonS0tLAFS6d19DQgH+Tk5MlpDMjIwMir6ysHDNmDJht3LBhQ3p6emlpaUpKCofDgSCLFy9ubm5u59KrqqoaN24cmHn8+uuvU1JSSkpK0tPTjxw5AgMsT0/Purq6NosIlQMZPp8PTh4eHuB5z549gwcP7t2796ZNm6Kjo8PDw9GuRSMjo8ePHytEmEUiUWxsLNqf5uPjc/Lkyfv371+4cMHPz09fXx8qAjZCczic4OBgCCWuMNesWSNOZlpbWwMCAsC/lZXV5s2bo6Ojw8LCZs+eTRBEVFQUDOm0tbUhKjSq27BhAxpChYSEiKTmp59+Issh7P2GJ2jKraTm3NjYiPY6GhkZ7dy586+//rp7925ISIilpaWPj4+ECHk8HsgtrKaGh4dHR0dv3ry5d+/eQ4YMQTaxPDw8ICyfz2cX8OrVq4wi+tNPP6HE5OTkgHh4enpmZ2fn5ubCitaECRNEIlFycnKbMcjanCXrFpFIBK7Ozs6MkikSidCo999//5VGTiTLwObNmzkcDmoIw4cPJ8s5Y2JQ9lmrMtYyIKuSl0lNKbv7E4lELS0t3377Lczb33///W3btsXHxz948ODOnTvh4eEzZ84EaXRycqLHKaG9k8VDGs6ePYt2N0Bhfvzxx8uXLw8ICJg+fTqyrjRz5kz6lwXyjJcgiHnz5l27dq2oqKi4uPjhw4dBQUEwnfb09KR8l5QMqEdLS0v4cjFr1qywsLDo6OhNmzahr5YBAQGtra2sVbQ8EotAu3VsbGxaWloY/axZs4YxbWgMwFr+Ze2mMRgMnvH2LB4/fjxlyhTi/6KhobFo0SL66q64A73V1dUikWjr1q2MroxLZHRKSkqGDRtGSQYa5cv/ah6PN3XqVPoJHC8vr9TUVOlLTNw5mcDAQBj3MLqeOHFCQjqvXLmC4hcIBL/88oupqSnFj6OjY1RUVEeVXmNjY0hICN1Gpamp6bZt2yjDFwlHiaAcyJSWllL8cLncqqqqjz76iFJZXl5eOTk5ihJm4Nq1awMGDKAEGTNmTHp6Olq8oizaiCtMOzs7CWkTCoWhoaGwvRnRp08fWD9E4zZg2bJlqCThZJ2Ojs4///wjkpqRI0eKqwK0kKW85lxbW7ts2TLKOV49Pb0dO3bQb4OkRPjs2bMJEyaQPaiqqs6fP7+6uhrtAkCUlpayC4gWoimMHDmSnJj9+/dTbM+4uLjAZFKc6R1KDDI1Z8m6RdxxYiSZLS0t8KIhQ4ZIKSeSZYDR7iuS8zazz06VySMDMil5mdSUsrs/xD///PPpp59SFAXg7Oy8d+/exsZGmdq7rKvN8K0nICCAPO8l4+Licvz4cTS9pPPkyZOVK1cy3gJlYmKyefPmhoYGmdKDZrwwIe/duzc5TgMDg19//ZW8Ks5ORcsjsUBdXR3c8ETfNERfhJcwBmAt/zJ10xgMRkXhxm8wnZ/y8vKUlJTS0lINDY0+ffqMGTNGwh3oykMkEj169CgrK6uhocHCwmLcuHHovgRF8fr1a8gp9KPu7u6d6npGRGtr66NHj/Ly8vh8vqmp6aB3dHjptba2pqam5ubmVlVV6evrOzk5DRs2THlXib569erRo0elpaVGRkYffPBB//79lSHMMFDOyMioq6szMTEZPny4o6MjoRwaGxvv3LlTWFiora3t4OAwevToNi+lzM7Ovn//vpeXl/JSpSQqKyvv3bv36tUrDQ0NW1tbT09PMGcqDc+fP//777+rq6utrKxGjBgh/ak/1gHFUVFRkZSUVFpaqqmpOXDgQA8PDxZWplg0ZxZcuXIFltDDwsK+/PJLonPAOu+sq7KrKHkJtLS0pKamvnz58vXr19ra2hYWFi4uLmgtun0QCoWZmZnPnz/n8/mNjY2Ghobm5ubDhg2T/iat/Pz8rKys8vJygUBgYGDg5OTk5ubGor+wsrIqKyuztLSEz6NCofDevXsFBQUCgcDOzm78+PGKvaWpfVqr8uS/nbtpDKbrgme8GAwGg8F0JQQCwdChQ58/fz548ODU1FTFzgEwmA6EMuPFYDAYhYBtNWMwGAwG02Wora318fF5/vx579694+Li8HQXg8FgMBjJ4BkvBoPBYDBdhsbGxoqKihEjRjx48IDFnSgYDAaDwfQ0/sdKCgaDwWAwmC6BmZlZcnJyr1694LJTDKYbUFlZWVtbCwd34W9hYSGYqkLWjDEYDIY1+BwvBoPBYDAYDKbDWL58eVhYGP15YGBgaGhoR6QIg8F0K/AaLwaDwWAwGAymw5g1axblIiIA3dyOwWAw8oDXeDEYDAaDwWAwGAwG0z3BlqswGAwGg8FgMBgMBtM9wTNeDAaDwWAwGAwGg8F0T/CMF4PBYDAYDAaDwWAw3RM848VgMBgMBoPBYDAYTPcEz3gxGAwGg8FgMBgMBtM9wTNeDAaDwWAwGAwGg8F0T/B9vBgMhg319fWnTp26fft2aWmptra2lZWVu7v71KlT7ezsOjppmC5JVVXV3LlzyU/WrFkza9asjksRBoPBdADx8fG7d+9m1IEHDx6MiYkhCGLv3r0uLi4dl0YMpouBZ7wYjCLh8/mzZs168uRJSEjIF198QXRTnjx5MnPmzKKiIg0NDScnJ4IgLl26dOTIEUNDw+rq6o5OHaZLIhQKCwoKCIKora2trKwkCMLf37+jE4XBYBRPt+kop0+fDsrqjz/+6N+/P6Of0NDQU6dOEQTRq1evP/74o3fv3m1GW1xcfOfOHUYd+Pz5c3DCXS0GIxN4xovpeHJyckpLSwmCcHd319PTI7oyp06dSkpKIghi3bp1CuzIO1URNTY2zp49u6ioaMCAAVevXrW3tycI4vHjx56enkTPo7GxMSUlhSAIMzOzQYMGdXRyujBmZmYw4w0LC1u+fDnRBcHC0CU0GKa7dpTtT1paWllZGWx6YvRw+PDh1atXEwShra2dkJAgzXQXg8EoA3yOF9Px7Nq1y+sdubm5RBdn4MCB8MPZ2bm7FtHZs2f//fdfgiC+++47mO4SBOHm5vbhhx8SPY/S0lKomo0bN3Z0WjAdDBaGLqHBMN21o+xs/PHHHytXriQIQkND49y5c15eXh2dIgym54JnvBiMIhk7dmxSUtKhQ4cuX75MdFPg2zxBEK6uruTnhw8ffvbsWQclCoPBYDBdg57QUZ47d+7zzz//n3G2quqpU6d8fHyITkllZeXydzx58qSj04LBKBG8qxmDUTCe7yC6L69fv4YfhoaG5Oe93tFBicJgMBhMl6F7d5RXrlxZsGBBa2srQRARERGdeQNUbW1tWFgYQRA+Pj7YFBamG4NnvBgMRjZaWlrgh5qaWkenBYPBYDCYTsSdO3fmzp3b3NxMEASXy/30008leG5oaLh27Rrs9h8wYIC3t7empqb076qvr09ISMjPz9fS0nJ2dp4wYYK6Oh7YYzAM4IbR46ivr79+/frdu3fB3IKpqamzs/PYsWPB4i6Qm5v75s0b9K+xsfGAAQPQv6WlpYWFhehfXV3dIUOG0F+Umpp648aN3Nzc+vp6AwMDJycnDw+PESNGqKr+/730zc3NaWlp5DXD9PR0gUCAYrCxsenTp4+E9GtoaPTp02fixImenp702RePx2tsbET/mpub9+vXjyCI27dvJyQklJeX29razpgxY8SIEciPUCiMiYlJSUmpqqqytbWdO3fusGHDpCzYioqKvLw88hM3NzfUdYlLzP379y9evPjy5Ut9ff2RI0fOmzdPR0cHeWNXRLW1tVevXk1JSSkvL9fR0bGxsZk4ceKoUaNUVFSkLKLs7Oxz584VFBQIhUIrK6vhw4d/+OGHKINgmhKsVYE1GhCk9957D0WVnZ2dlJSUnZ1dWVmpoaFhaWnp4eExbdo0LS0thYgo6yzLJKKSefHiRXl5eUlJCfxbWVn54MED5KqiokIWLcTTp08TEhJyc3NrampMTU0HDx48ffp0eiVKSV1d3e3btx8/flxYWCgQCAwMDJydnb29vSWUlTzlTE4/n8/X09Ozs7NzdXX18vLS1dUVFyQ9Pf3KlSv5+fn19fWmpqZubm7Tpk2zsLBgl2VZ45RJyMkBZZJhdsIgZ8kg/UDB0dHRzMwMfr98+bK4uJjsamVlRblCjHUy2hQGZSt5cVpXIBCcOXPm8ePH5eXl+vr6Tk5Oc+bMQUYHGIEaRP9qaGiA8n/x4sWZM2fy8/MFAoGtre2cOXMonQJrAZMpp11CSdbU1MTHx//9998VFRWqqqq9e/d2dXWdOHGiubm5UjtKek7Pnz//6NEjPp9vZWU1evToGTNmaGholJeXv3jxguxz2LBhGhoahEJ5+PDhzJkzQchDQkKWLVsmwXN4ePi6detqamrQE0tLy8jISCnfFRkZ+dVXX5GD9+7dOywsDF/qhsEwIML0JLhcLoyEVFRU+vbta2pqiiRhwIABv/76a2trq0gk+vjjj8lCMmfOHHIkoaGhZFcXFxfKWwoLC8eNGweu+vr6dnZ2qD8zNzcPDAxsamoSiURosiSO4OBgSsxhYWGQflVVVWtra0tLS/Dp5OT0119/UTxTRnUcDkcgENDHHP7+/i0tLSKRKD8/nzyxB1avXi1l2Z44cYIStqCgQHJi/Pz8KEGsra0zMjJQKBZFtG/fPiMjI1iAtbOzQ1Xs4uKSkpLSZhE1NTUFBARQ3mJoaMiYQTIff/wxxBkREeHo6AgP1dXV7ezs0NDZzMwsMjJSISLKOssyiahkJA9ltLS0KP4LCgpmzpyJXmpvb6+trQ3JXrFiRW1trUgWysvL/fz80HDNxMTE3t4e5WL27NllZWWKLecXL16g9Pfq1cvOzg4tJmhpaS1YsIAsukBeXp63tzf4MTY2trOzgwRramquW7dOXCFzuVwIwuVy6a6yximTkLOWYVmFgV3JUBCnH06cOIH8BAUFUVwDAwPlT4aUwqBsJc+ode/du4dCIUJDQyUXJqUGLS0tW1pa1q5dS0/zhx9+WFVVJY+Aschp51eSBw4cACvcqqqqffr0QU1GRUVl/Pjxt27dklBlcnaUZM6ePYs+9yAcHR3T09ORYkGUlpaK5APVGo/HE4lET548gXImCGLbtm2Sw/74448oJZqamlZWVvClQ0NDA9mvpuvAwMBAcPr666/hh5aWFgoLBR4dHS19FsBCPkEQFy5cYFUGGEzXAM94exCoR//yyy9LSkrg4evXr4OCgtD3WoFAIBKJrl27xuVyd+zYwTjjhZ4DdR6UGW9tba2DgwNBEMOHD09LS4OHQqHw6tWr6La66upqkUhUX18P8Xh4eMDzDRs2cEk8fvyYHDPYPCQIYvny5aijevr06eTJk6GXPXr0KNn/mTNnTpw4gToVDoezcOFCCwuLtWvX7tu379tvvzU2NganNWvW8Pl8W1vbAQMGbNmyZe/evQEBAWgucfLkSWmKNycnB5I9dOhQekceFRXF5XI3bNiAEuPv729mZrZu3brw8PBdu3ahu0z69++PRhKyFhHqJlevXl1ZWQkPU1NT3dzc4HaEq1evSi4iDoejqam5aNGiX3/9ddu2bba2tmisRs/gjh07UEquXbsGcc6ZMwdGz1FRUc3NzfAwLy8P3SsYFhYmv4iyzrJMIiqZxMREcjMZOnQouWqOHDlC9pyeng5jI2tr68uXLwuFQpFIJBAIwsPDYUHMzc2toqJCJDU8Hg/e6+fnl5+fDw8bGxujo6NhRcXJyYnP5yuqnHk8Hgxh+/bte/HiRUh/S0vL9evXBw8eDEGCgoIoQWDo6eDggMa7tbW1wcHBsKzk7e2NJETKGS+LOGUSctYyLJMwsC4ZCqAftm/fDi/V19c/fPgwl8vNyclBflJSUrhc7vr16wmCGDlyJJfLvXv3rpzJkF4YlK3kc3NzT7wD2jtBEJcvX9bW1h40aNCmTZv27NmDqqzNGS/UIJfL1dfXhxnv999/r6+vv2vXroyMjIKCgoSEhPHjx0Ns7u7udXV1rAWMRU47uZI8dOgQzLV2796NSub169dwMQ/5O4syOkpEdHQ0iK6enl5wcHBmZiZU3KRJk0xNTTdv3gxh/f39IQ319fUixc14c3Jy0Gr22rVrJQe8e/cu+NTQ0Ni/f39DQ4NIJOLz+Vu2bIHnbc54CYLQ0dEJDw9vbGwUiURVVVXfffcdPNfT0ysqKpIyC3jGi+kh4BlvT2H//v2g1BYvXkx3/fnnn+k9JdKDlBkvgnHGu2fPHniORuGI3Nxc+AZMmU5wOBzUZ4hL/8GDB8FPQEAAxamxsXH48OHw9To5OVncxMDBwcHZ2Zk8qcjJyYENinp6ekuWLJkxYwb0HMC5c+fQ4EYkCzBcpnTklMTY29s7OTmVl5cjJ4FAgEwfx8XFUQJKU0Soir/66iuKU1VVFVwDaGZmRn4pJVUODg6WlpZZWVnI6dWrV7q6upSxmoQMIteEhAS6k6+vL2yDf/36tUJElF2WWYioBNpsJjCOgb15Ojo65NkIcP78eYjBx8eHvjgjDqi10aNHww4FMmlpaTD2Xb9+vULKmc/nw/BXR0fn6dOn4oqaPONFQfT09F68eCHuLVu3bpV+xitPnDIJOWsZllIYWOdCHGi+d+/ePUYPsFYZHx8vfzJYCIOylTxZKfXr12/VqlUwCQf+85//SDPjpcxh1NXVdXR0UlNTyU5CoRCtbK9atYq1gLHOaedUks3NzbBovGjRInqq4G5t8s4CJXWUhYWFYDpRQ0ODsnDd2tr60UcfofMIjJtH5JzxXrhwwdraGn6PHj26zYDopqK9e/dSnMg7CyTPeH///XdxH0RWrlwpZRbwjBfTQ8Az3h4Bn8+H79aampqMex0FAgHY3ZV/xjtv3jwYLpDHHIgZM2awmPG2mf4bN25ADMOGDRPXdxIEcfPmTYor2r+tqamJvpcj0MHUmpoakdRI05ETBHH9+nWK65EjR8BpzZo1FCfpi0hbWxt9xWccwWzcuFFCqk6fPk1xDQgI8PT0lDKDsJ4wcuRIxkQmJydDwAMHDsgvoqyzzEJEJSDNJGfr1q3ghz7sA5DNUvKcRDLZ2dl2dnanTp1idJ00aRIMZClTaHaqAC07iEs/DLXJkxwUhHHW3dTUBKuLurq69KIWN+OVJ06ZhJydDEspDPLkQhzh4eEQ56effkp3FQgEpqamNjY2ZIFnnQwWwqBsJU9WSoMGDaJ8A3r06JGLi0tUVJRIxjkMYwYLCgpg+6iamtqrV69YCBjrnHZaJZmdnQ2R/Pjjj3TPqamprGe8MnWUMLUmCGLZsmX0ZMBJaUbFIg9IWqCcARUVFbSTgpGioiLwaW5uTl+prq6uhgMvkme8AwYMoH8hffXqFaxyGxsbS7NPBM94MT0HfB9vjyAyMrK2tpYgiPHjxzPaI9HS0vLx8aFcNsMOGA20tLQkJCTQXcPCwng8HrlvkCn948aNY0y/l5cX7CZKS0tLSUlhjMTS0pJ+/zuyQeLl5WVlZSXONT8/n1AoFhYWEydOpDz84IMP4AfFsIdMRTR58mS0W5sMMmVx7NgxcZEYGxvTzzn/9ttv6AJeaQgPDxdXBeiYNN0DCxFlnWVliKgE0JY/giDmz5/P6GfBggXwAy3ItImzs3NBQQHlyD2lqCsqKiiWWliUs0gkOnz4MPwW97pp06YZGhoiWzJtBtHQ0Jg6dSoY4Pnzzz+lya+i4pRGyNnJcHvmgsLChQsNDAwIgvjzzz/JRgeBmJiYN2/eLFu2DO16ZZ0MFsLQnkqeIIglS5ZQzD65u7vzeLyFCxfKlB4oVfpDOzs7+D4lFAoZLQy1KWCsc9pplSQqcNjiTvHs6urK4/FgX73yOsqWlhZUHZ988gljVPAdUElAOYN1NPjEU19fL84z2tLs7e1NN51laGiI9s9LYMaMGXSrY3369IEdH1VVVU+fPiU7NTc3N4oBPDQ1NTG6NjU1SV0MGEznBc94ewTXr1+ndBV0oqOjq6urpTGlKxl0Xmv+/Pk7d+6kDL/69u3r4uIipS1cevrd3d0ZPaiqqqJ9fegDOQUXFxd692BiYgI/0EYpMsi8B3RmCoQxMWjKTTa9KGsRofKn4OjoCJVbUlJCmQUh3NzcFHuxAZ/Pf/HiRc7/gr4lk22ishZR1llWhohKIDMzE/KroqIizvQ3ynVSUhLcaSETLS0tJSUlz549Q0VdV1fHWNQsyjkzMxMM7aqoqKBWRmHo0KHV1dU//PADJYimpiZjyyIIAh34lPJ7iqLilFXIpZdhaVBGycDO5EWLFsGYlW4Z6PDhw+rq6kuWLJE/GSyEoT2VPJw7JRSBioqKuLtJkdlttOAvk4CxzmmnVZKOjo7QVz58+HDChAl37twhe1ZTU3NxcWFnjl76jvLJkydI6YkrWHESqyj8/PwyMzPho1hubi7daBwiMzOT0sooMN5/QQEdhKaAjjqjtwDz5s3TZgLZ954/fz6jB7pFTwymK4JvJ+oR/PPPP/BD8vUMCmH58uVHjx7NzMysr6/fuHHjDz/8MHnyZF9f39mzZ8ORISWlH9l4zMrKYvRANmiJQJ9X6dYdYTgIP+jfreWE8XVoIxOL16F9ZZmZmXv37mX0o6mpCV9zMzMz4SQeBTkvjEFkZmbu2bMnISEBXdZCgXz/BGsRZZ1lZYioBFDWLCwsUBWLk96GhoaCggJkG0Yyzc3NR48e/f3339PS0sR9hqcUNYtylib94qpGV1dX3Ko1ulaHMixTdpxSCjkLGe6okgFWrFgBp0MPHz787bffonlCRkbGvXv3PvroI/IeFtbJYCEM7ankFajEDAwMxH3/hTP5BEHk5OSwSADrnHZaJammprZv3z5YWU1KSvLy8rKzs5s7d66vr680Ny0ppKN89uwZ/LC0tBS3v0BRssGIt7f3yZMnNTU1jx07BrsADhw48OGHH06YMIHuGd3wRzcqDtB3nNERFxZlE70Fg8HgGW9PASk+sOugVLS0tJKSkoKCgo4dO9byjivvWLFixYQJE9avXw+b5RSefrTDir6pD5B8q7tMd77LD+Pr5FlXREV06h2SPVdUVDA+l3+FnyCIgwcPBgYGCoVCNTW1adOmubm5GRgYwPi7vr6efB+DnCLKOsvKEFFFSS8IsDQz3rKysqlTpz558oQgCFtbWx8fH2tra/QFJy4u7t69e+wSo8Ag1dXVYDeIhTQqKU5phJydDHdUyQCDBg3y9PRMTk7Oy8u7fv36lClT4DnsqEeWgeVMhvK6EoUoeUUpMcnxoBRWVVWxSADrnHZmJblw4UJDQ8M1a9bAV4DCwsLQd1hYWAQEBKxbtw5tp1JSR1ldXd1m4Sj2Gw2F4OBgSO2YMWO++uor+Pz0+eefZ2Zm0s/INDQ0SJYWaQ4FtBmWsq166dKljNPvN2/e/PTTT2BHjXHdGE5MYDBdHTzj7RGgTVYKX6tkxMjIKCwsbPv27adPnz516hQcWRGJRDffweFwjh07JtPsTpr0IyeFXyjfJUC53rFjB5gVkUDfvn2VlIzExES4JNDIyOjmzZuUXWR8Pl/cbIGFiMqTZYWLqKKkV3oB9vf3h+nu0qVLYdsq2bWkpIRxxsuinOWpGmtr64sXL0r2LOUSkDLiVKwMd3guVq5cCftsDx06BDPeurq6yMhIJycnykiXdTKU15V0ISUvZzJY57STK8kZM2ZMnz49MTHx5MmTZ8+ehbl6eXl5cHDw0aNHL168OHLkSKK7DHLokIsiODg4Pj7+33d8++23yNQWAk3LxW0VQVNiCQgEAslhKTNtZGacQmFhIcx4Z8+ejcyJYTDdDzzj7RGYmZkVFxezOyAqrgtpUyObm5t//Y6ioqKoqKgDBw6AfcKIiAgXFxd0TZ9M6efz+eL8ICfGfVDdHlREZmZm4o6ftQPI8mdQUJBMh6ZYiKj8WVagiEpOJ/yQRnqlFOD09PRbt26BjZN9+/ZJfzCVXTnDDxZBWlpaFCWNyohTsTLc4bnw8/MzMzOrqKiIi4t79epV3759o6Ki6urqVqxYoahksBCGLqrkJZgdQslgt27JOqedX0mqqKiMf8fBgwdv3LgRHh4Ol/xVVFT4+vrm5eXB3ePKANWFhFJ9+/Yt0S706tXr6NGj3t7eBEEcPXr0ww8/9PHxIXtA1/aKOzQBtSaZ0tJSyc975lgIgxEHtlzVI0CGLnJzc6UPhYbRjH3/q1evpIzH2to6KCgoNzcXLjwgCIJuW0X+9COzjYqyXNK1QEWkcLPSMoHO/qHrdsigG60UIqIKzLL8IipNOqveIVl6TU1NbW1tpS/nDz74gHH/m7iilqecKysrJYwmGYOUlZVJmDnIhDLiVKwMd3guNDU1AwICCIJobW09evQoLPZqa2t/9tlnikoGC2Hookq+rq5O3MQSHRkVZzpISTntQkpSXV196tSpZ8+evXv3LuwlLi0t/euvvwilgeqiqqpK3PlV6Qct8jNlypTPP/8cfi9ZsgRtuqYYpkpPT2cMDvt3JPP48WPG5xkZGfLIJwbTXcEz3h7B9OnT4QfjRkdg8uTJ9vb25D7MyMgIfqC748iIi2rTpk2MlzpoaWmhay3EfdcUN5pE6We0jQnbe+DSP4IgFHsIs7MhrojQjjV07QGdxMREKysre3t7aXZMsQPt0WLc7ydhiMxCRFlnWR4RZVE1NjY2AwcOlJxUZA7Xx8eHbptU1nKWUNQsypmcfnGhLl26ZG9v7+bmBoVgY2MD9kJFIpGEi2RmzZplZWX13//+l5ACZcSpWBmWUhiUmovly5eD/ISHhyclJaWnpy9YsIB+LQ3rZLAQhq6r5B88eMD4HNkiZnfbDeucdlolmZWV5evrGx8fT/c/evTopUuXUvwrg/79+1tbW8PvxMRERj/sbhRjzZ49e8AAVUlJyTfffEN2GjNmDBwW+Ouvv+ibkysqKsRlgUx8fDx9/11BQQHMonv37v3ee+8pIh8YTDcBz3h7BHPnzgXrjo8ePUL2HslkZ2ffuHHj5cuX5ONeenp6cLDn+fPncCMFQiQSgWEGOsnJydHR0YyTZD09PdDylIsK0E4n8r0sM2fOdHV1ffjwITn9aWlpjN9EY2JioLf29fXtllq+zSLy9fUFC6J3795ltCAKRlzLyso8PDxkvSpTepAVUzRiI3P79m0FiijrLLMQUVmr5tKlS66urosXL4Z/16xZAz+OHz9Oj0EoFP7xxx8Un1KWM4/How96WltbxV1sw04VoFRFREQwRnvixInCwsJhw4ah6fratWvhByw20snJybl48WJ5ebm402V0lBGnAmVYSmFQai4cHBxgjlRcXAz3FVFsViFYJ4OFMHRRJU8/fgmzTTBebWBgIO5GYsmwzmmnVZIVFRWxsbEXLlxgjB/ZPWJ3QZH0LFu2DH6EhYXRXbOysu7fvy8ubExMzFdffXX58mUFpsfIyAh9HYiMjCSXj5mZGexzrqqq2r17NyXgpk2bpLmjrrCwkJ7TjRs3wo9FixZJ8/EUg+lBiDA9g1u3boFlhXHjxjU1NZGdmpqawKTEkiVLKKHQFY6fffZZc3Mz8v/VV1+hLX8uLi7kIHBz+uLFi+lpQBfE79ixg/w8JCQEnp8/fx6e1NTUgNnDoqIiSvpHjRolEAjIwYuLi6ErNTExefnyJeWlPB4PIudwOPQkoW/hoaGhdNfAwEBwvX37tkhqkO2HgoICmRKDNj6NHz+e4iRNESUmJqIiqq+vp8QAcyptbe2nT5/KlCqZMoguwLC2ti4uLiY7FRcXo2/w9AyyE1F2WWYhohJobW0FMyRDhw5FD7///ntyaoVC4eTJkyHmuLg4SgzIEtL69eulfKlAIEBXU2zfvp3iun37dqTh6aLLopxR+lVUVC5fvkyJMC4uDsr5+fPn5GKBY2wEQZw7d44SpK6uDnbcMdYCl8uFgFwul/xcnjilF3J5ZFgaYZAnF9IQGxuLah8WWhlhnQwWwqBsJS9ZKckKtCxdXV0DA4OIiAiyU3l5Obq89PDhw6y1KOucdk4lCZ+BdHR0/vnnH4rn+vp6uHLWyMiotrZWqR1lXV0dureJUjtVVVVubm7oyh+KYgGhBZKSkkSygPQwj8dj9IA2gZubm79+/Ro9T09Phw8Hqqqq27Zte/PmjUgkKioqArN5aLJKSSp5WKKioqKurh4cHFxVVSUSif79998vvvgCnExMTCBCaUB3jF+4cEGmvGMwXQs84+1BREZGwj49d3f32NjYly9fPnv2LCYmBo6UuLu719TUUII8e/YMWcC3trb28/P78MMPLS0tDQ0N0TdmY2NjzjsuXbqEekq47vzatWtFRUXFxcUPHz4MCgqCqDw9PSl9fE5ODuh3T0/P7Ozs3NzcTz/9lCCICRMmMKZ/2LBhsbGxRUVFL168OH78OCxEm5mZPXjwgOx/9+7dHA5n1qxZkB5HR0dIJ/T6mzdv5nA4Y8aMAdfhw4dzOJw1a9ZAWPDp7OwMrlOnTuVwOD/99JOE4k1OToZQNjY2EMrPzw+FkpyYCxcucDgcf39/cLW0tARXNAqRsohOnToFg0hnZ+fIyMj8/PyioqLbt29/9tlnKioqGhoaMTEx0hQRKgdpMsjhcHbv3g1+GhsbR40aBa5GRkY7d+7866+/7t69GxISYmlpiax30DPIWkRlzTI7EZUMXEQJq15FRUXx8fGwj/TOnTvIT2VlJQiburr6hg0b0tPTS0tLU1JSOBwOhF28eDH6qCQNsbGxaFTk4+Nz8uTJ+/fvX7hwwc/PT19fHwk2iG5wcLCc5YzSr6GhsXHjxvT09JKSkvv373/77bcaGhqqqqqRkZGUIFVVVePGjQNjv19//XVKSkpJSUl6evqRI0fgulFPT8+6ujrkn8/ng1R4eHhA4j08PMjNhEWcsgq5/DIsjTCwyIX0tLS0oGn5kSNHJPhknQwWwqAkJZ+XlydOKSUnJ7MrQJjDWFpawmxw1qxZYWFh0dHRmzZtQtObgICA1tZWdgLGLqedWUmijQ+Wlpb79+/PysoqLy/PycmJiYmBc8jq6uroS4dSO0oej4f28M+cOTM8PDw6Onrz5s29e/ceMmQIMkpHmUZu2LABzXhDQkIUO+MtKytDVrX8/PzITnBzGAKNtXR1ddG0VsKM97vvvqOHhVZ59epV6bOAZ7yYHgKe8fYsHj9+jO5pRGhra69atUrcAOvGjRuoZwKGDBmSnp5OP44Fo+onT56sXLmS8f4bExOTzZs3NzQ00N+yf/9+ys17Li4u//77rzTp19DQWLRoEf1zuLizXtXV1SKRiNFwpZ2dHYRlDDhy5EgJZSvOjAeEkpyYrVu3MrqSF+ikLCIejzd16lT6diYvL6/U1FQpiwiVgzQZhGkV8lZbW7ts2TLKGUg9Pb0dO3bQ7xelr0CyEFGZssxaRCVQUlIybNgwcjwaGhr0kZNAIPjll19MTU0pL3V0dIyKihLJzrVr1wYMGECJbcyYMenp6WhUJG5BkkU5i0v/kCFDbt68yRiksbExJCSEbjLU1NR027ZtlM8K4kyPombCIk5ZhVx+GZZSGGTNhUzAXSMGBgZtTptZJ4OFMChDyUs4mXnixAmRfDNekUh09uzZ3r17k6M1MDD49ddfhUKhPALGIqedWUnW19f/9ttvXl5ejEbjx40bR569K7ujfPbsGeUuLlVV1fnz51dXV6M9xmFhYeTMpqSkQMoZl6nlnPGSV8UJgoiOjiY7nTlzhrLZ29nZ+e+//xa3z4Wy9ezSpUsU+XR2dpb1Ww+e8WJ6CCpyWp7EdEXKy8tTUlJKS0tVVFTs7Ow8PDwk3zDe3Nx8//59sA/5/vvvjx49Wpq35Ofnw7degUBgYGDg5OTk5uYm4QLDioqKpKSk0tJSTU3NgQMHenh4iDuFgtKvoaHRp0+fMWPGSLh0vjshfRG9fv0aigi6ZHd3d+XdwctIZWXlvXv3Xr16paGhYWtr6+npCRY7lSSi7LIsq4hKQCQSPXr0KCsrq6GhwcLCYty4cRYWFow+W1tbHz16lJeXx+fzTU1NB72DxRvRe3k8XkZGRl1dnYmJyfDhwx0dHZVazij91dXVRkZGrq6uyJSRhCCpqam5ublVVVX6+vpOTk7Dhg2T80pVZcSpKBmWSRiUnQtpYJ0MWYWhSyh5KyursrIyS0tL+AQjFArv3btXUFAgEAjs7OzGjx9PXk+TH9Y57YRK8u3btxkZGbm5uTU1NRoaGlZWVsOGDWvnrgd4/vz533//XV1dbWVlNWLECJhV7t69G46vnzp1inIGOzs7+/79+15eXjLpT4XQ2tp6796958+fw/gKbTCRkpaWlsTExLy8PG1t7UGDBlE+t2EwGASe8WIwGAwGg8EwzHgx3Yb//Oc/cEr/3r17sk4sMRhMVwfbasZgMBgMBoPBdG3Wrl2LLM/RgeugdHV10TXFGAym58Bw6AKDwWAwGAwGg+lCnDlzprKycunSpXp6ehSn5OTkv//+myCIL774gnKeHIPB9ATwGi8Gg8FgMJgeTWVlZeE74IJroVAI/1ZVVXV00jAyUFtbO3/+fEqtPXjwYP78+QRB9O/ff9u2bR2XOgwG02Hgc7wYDAaDwWB6NMuXLw8LC6M/DwwMDA0N7YgUYWTG1dX1yZMnsHV5/Pjx1tbWLS0t6enpsLo7evToP//8s0MsaWEwmA4Hz3gxGAwGg8H0aC5dupSamkp/7uHhIe7KHExnQygU3rp16/r1648fP87Pz6+pqVFVVTU3N3d3d/fz85sxY0ZHJxCDwXQYeMaLwWAwGAwGg8FgMJjuCT7Hi8FgMBgMBoPBYDCY7gme8WIwGAwGg8FgMBgMpnuCZ7wYDAaDwWAwGAwGg+me4BkvBoPBYDAYDAaDwWC6J3jGi8FgMBgMBoPBYDCY7ol6RycA07XZs2dPbGws+tfExOTcuXNE1+Tx48d//vlnVlZWQ0ODubm5vb395MmTPT09NTU1ZYqnqqpq7ty55Cdr1qyZNWuWZKcO4eDBgzExMd2j+jDtKeRkFixYUFpaiv718fEJCgpSUHoxGAwGKxkMBiMveMaLkYuKioqCggKCIF6+fNna2mppaUl0TQIDA/ft20cQhIWFhZ2dHY/Hq6io2LVrV2hoaGBgoExRCYVCKJPa2trKykqCIPz9/dt06hAqKyu7R/Vh2lnIyRS9o6mpqaSkhCAIe3t7haYaIxu///57YGDg+++/f+nSJRMTE2W/js/nz5o168mTJyEhIV988QXRuelaqcUoRMngSsdgMHhXcw+isbHxzjuysrIUGO2OHTsK3mFubk50WbhcLswEdu3aVVZW9vDhw+Li4s8++4xdbGZmZlAmO3fulN6pQ9i8eXM3qL6cnByQ7bdv33Z0WrqhkLepOpKTkwsKChISEpSQaozMOnz9+vXV1dUpKSl//PFHO6Tq1KlTSUlJNTU169atIzq9Hug8qe0S/XvnQR4l010rHYPByASe8fYUSktLvd6xcePGjk5Lp2P37t0EQdja2n733XfwREND44cffujodGGkYteuXSDbubm5HZ2WbijkWHV0EqSsiEGDBsEPZ2fndkjVwIED2/N1cuqBzpNaxYIbqQS6a6VjMBiZwLuaMT2d169fwwjJxcWF/Lxfv36lpaX6+vodlzQMRjFgIe85XLhw4eTJk/379584cWI7vG7s2LFJSUkZGRkLFiwgOj1dK7UYhYArHYPB4BkvBkOUl5fDD0NDQ4oTPteK6R5gIe856OvrL1u2rD3f6PkOoovQtVKLUQi40jEYDN7VjOnptLS0wA81NbWOTgsGoxSwkGMwGAwGg+mx4DXe7s+LFy/Ky8vBwiGY533w4AFyVVFRGTFiBNl/XV3d7du3Hz9+XFhYKBAIDAwMnJ2dvb29nZyc2L2a8hAipDysra29evVqSkpKeXm5jo6OjY3NxIkTR40apaKiIi7ympqa+Pj4v//+u6KiQlVVtXfv3q6urhMnTpTeCBOPx2tsbHz27Bn8+/r1a3LJODk55eTkkP0PGTJEV1cX/ZuamioUCtG/AwYMMDY2JpSPPBWUlpYWGxv777//amtr9+vXb968eYxGLxkrTktLy9XVFX6LRKKHDx9SPLi7u6MJVXZ2dlJSUnZ2dmVlpYaGhqWlpYeHx7Rp07S0tOivq6ioyMvLIz9xc3PT1NSsqamJiorKyMior693cHDw9fUlb8ptbm5OS0uDioMn6enpAoEAebCxsenTpw85WplSJWXRpaWlNTc3I28WFhYODg7kgOnp6VeuXMnPz6+vrzc1NXVzc5s2bZqFhQUhB/X19devX797925ZWZmGhkafPn0mTpzo6elJn9BKFnIXFxdtbW1FqQ4K9+/fv3jx4suXL/X19UeOHDlv3jwdHR1xnlloAGiDN27cyM3Nra+vNzAwcHJy8vDwGDFihKqq2I+5yqiOp0+fJiQk5Obm1tTUmJqaDh48ePr06RTZI0sswsHBwcLCorm5+dKlS/fu3SstLTU0NBw+fPjcuXPJW82lrAioa/Tc3Ny8X79+kptYdXV1REREZmamjo7O4MGDP/nkEz09PeQnLy/v1KlTubm52traI0aM+Pjjj8kKUFyc8Lu2tjY7O1ua0hsxYgSllmVScVLqAcmpZVeh7BSX/DIsfyOVMoPt0CWRVRlBEKamps7OzmPHjpVyvCFZychU6dJoBvl7RunfhcFgFIwI092RvMNNS0sL+SwvL/fz89PQ0AAnExMTe3t71D3Mnj27rKxM3Ftgb6SlpWWbrx4/fjwl7L59+4yMjGABys7OztTUFHy6uLikpKQwvu7AgQMwMlNVVe3Tpw/qKlRUVMaPH3/r1i1pSsbOzk5CydDNQvJ4PHJwygbRCxcuUOLncrngxOVypXeSgDwVVFlZ+eGHH9KzGRQUJBQKKdXHWHF2dnYoNvKAElFdXS0SiSIiIhwdHeGJurq6nZ0dqh0zM7PIyEh62k6cOEGJqqCg4Pr16/QtuIGBgSgU+XpGRoKDg5FnFqmSqegQy5YtQwHz8vK8vb3hubGxsZ2dHdSdpqbmunXrmpqaRKwICwszMzMD4be2tkYJcHJy+uuvv2QS8qdPnypEdYhEIh6PB885HI5AIPDz86P4t7a2zsjIYHwRCw1QWFg4btw48Kavr29nZ4cagrm5eWBgIL14lVEdBQUFM2fORMmwt7eHLwhqamorVqyora0le6ZLLJfLffLkCeUTCcjk2bNnZa0ISl1zOJw2m5iBgQH5oampaWJiIgT58ccfKcN0a2vr7OxsyXEi19u3bxPSIRAI5FFxUuoByallV6HsFJc8MixnI5U1g0rtkqAfBFWmoqLSt29f1PDhC/Kvv/7a2toqj5KRstKl1wzy9IyyvguDwSgWPOPt/iQmJnK53B07doCSHTp0KJfEkSNH6N2Jn59ffn4+PGxsbIyOjoaFUycnJz6fL/2MF17t5eUFnznhjXFxcWQ/6H681atXV1ZWwsPU1FQ3NzeCILS1ta9evUp516FDh6CP3L17d11dHTx8/fr16tWrJQwv6ERFRXG53A0bNkAoDw8PcskUFBTADw8PD8YZ77Fjx7hc7owZM9ptxsu6gurq6tzd3SHshAkTEhISCgoKMjIygoOD9fX1N27cSKk+qLiRI0dCEH9/fy6XGxUVhSJsaWmBwgEzmNu3b+dyuY2NjSKRaM6cOdCXR0VFNTc3g/+8vDx083BYWBgleTk5ORDb0KFDwU9cXJympqa3t3doaCiXy12yZIm6+v/fkBIREQGh6uvrKRW0YcMGcg0+fvwYvYJFqmQqOn19fXgpmjDweDwYzDk4OKBPMLW1tcHBwbCi5e3tjVIiPStXroTELF++vLS0FB4+ffp08uTJMAc+evSo9EJeVVWlENVBGYz6+/sbGRl98803+/bt27Jly4ABA8Cpf//+9CEdCw1QW1sLs8Thw4enpaXBQ6FQePXq1f79+9NHmUqqjvT0dKh9a2vry5cvC4VCGPKGh4fDWqibm1tFRQXyjyQWSd3mzZtNTEwmTpx4+fJlkKudO3dCWBUVlVOnTslUEZS6Js94c3NzT7wDSpUgiPj4eC0trWnTpoWEhPz3v/9FZq709fVfvXoVGhqqpqb26aefhoaGbt++ffDgweDq7OyMSonebOkz3s8++4xL4/Dhw2g5cdq0aXKqOCn1gOTUsqtQdoqLtQzL30hlzWCbyDNmQLPHL7/8sqSkBB6+fv06KCgIrW+Tv4awUDLSVLpMmkGenlF5nQIGg5EGPOPtKRQUFICOnjNnjjg/0J2MHj26paWF4pSWlgad0Pr166Wf8YpEol9//RWmCowfj/fv3w+p+uqrryhOVVVVvXv3huWO8vJy9Ly5uRm+BC9atIge4fLly6Wf8dI7UUYPHA6HccYLbN26tZ1nvCwq6JtvvkG1T/lqnpqaqqOjA8MySvXFxcVBqClTpjCm582bN1paWm5ubuSHMLdMSEig+/f19SUIQldX9/Xr14wRQlgYEOzbt4/sdPr0aXCivK7NCpIzVeyKjs/nw3BWT0/vxYsXlDh//vlniHPr1q0iWTh48CAEDAgIoDg1NjYOHz4c1mqSk5NlFXI5VQf5Ffb29o6OjsXFxcipoaGBPCWQUwOIRKI9e/ZAKDTIRuTm5sLuD/JsQRnVwefzYc+wjo5OTk4OxfX8+fMQp4+PD0VsyM1fS0vro48+oni4e/cuCFWvXr3+/fdf1hXBWNfkJnbo0CGy0+LFi8FpyZIlxsbG5J0yjY2N6LvPpUuXxMVJn/GeOHGCnoa9e/eCfxsbmzdv3iiqD5JGD4hLrZwVykJxySrDkpFGNuTJoDhY1xdq+IsXL6a7oiYpbsYrk5KRXOksNAO7nlFJnQIGg5ESPOPtKUjTI2ZnZ9vZ2aGFBQqTJk2C0Sdjd8g444XVBl9fX0q/BfD5fDirpq2tjdZ2GMcEGzduJCcSHv7444/0IKmpqd14xsuugoqKimB3orq6+suXL+kBV61aBYmhVF9LS4uNjQ04PX/+nB4wJCSEIAjKMsIXX3wxcuRIxhQmJydDbAcOHGD0gMYlY8aMobv27dsXXGtqamQd6bJLFeui27JlCzxnHO01NTXBl35dXV3pB7WovWhqajLuFbxx4/+xdx5QURxvAN8Djt6kq1SJEGwUUVFRSoiIFYINozmxRM1fQ4wFE0s0sZBEo8GogMYWEBULiAZ7oYmKSleUKiBF2tHLlf+DMZPN3t5xt3cHKPN7Pt+xs7M79dv5Zr755jZ4qZ2dXQ9qvBiGXbt2jRAaEhICgtauXSumBOByubNnzwaVAhapCACzC3zBSqM6YMfnJ22gb9jo6Gh+3Z9fVS5duhTcsHLlSilpvBMmTCAEvXjxAtbg6tWrCaFhYWG8NUhB433w4AHQ5+l0+sOHDyX4DRJT4xWnQikILlHbsGCEaRviZJAf1OqrS1HW0tICLMP5abzCCxnBlU5NMlD7MkpDCiEQCOFBvpoR/2JlZVVQUDB37lzSUGA1VFlZmZ+f3+WjOBzO8uXLd+3atWjRovPnz5N6BgoNDa2vr8cwzM3NjdTn0/Tp08GPY8eOwYtwa9mVK1fwjqMANjY2KSkpGzZswD5EqFVQaGgoKKgJEyYYGhryRvz8889JHygrK/vll1+C33CMDgEDd3V1dWiiCQgJCUlKShKQQgzD+N0gOEl2dnbghzAtkAC1VFErOi6Xe/jwYfCbtLLodLq7uzvw2nLu3DkhswD7y8SJE0l9nDg7OwNLwqdPn3ZZwtJDV1cXblSDjBw5EvzAO5KhJgGgEGCxWLyb7YGBekpKCvT8JI3qgHsrMAybM2cO6T3w8E+4nMWLq6sraVUuWLAA/AgNDYV+tiXL/PnzCVcsLCyg1x/eUNj7wMHOXWJnZ5eUlAQ3fQCqqqpmz54NcvTbb7/xOlWS4DdIJCRVocILLpHacO/JoKQ+SaDjOzk5kbZ/BQUFDw8P3u3QFISMAChLBgpfRil9FBAIhPAgjRdBDovFKi0tffnyZfY/NDQ0gCBeX4UE2tra5s6dGxISsnr16mPHjvE7EOXWrVvgB9x/RcDc3ByoyqWlpfCTaW5uDqyaHz165OLicv/+fXwUWVlZa2tryj4nP8gKiouLAz/4eda1trbm5xF36dKlYEHm+PHjeDewGIYB/6JffPEF3rkrASaTmZ+fD1MIFyK6bELQ9SUeAwMD8KOurg4TA+FTRa3oMjIygNtYeXl50oxgGAY3RsJXdAnsL9C+lICMjAzcpQnXe7sfGxsb3jIB9smEuqMmAfD3z5kzZ9euXVVVVfhYAwcOtLa2hlsBpVEdGRkZoLXQaDSoz/Abf8fFxeG9eePhFxcYqAOPx+np6ZgU4C0KGo0G5x14fQtDr0JAV+kS4DsXLFsBuFzu559/XlxcDCpu1apV0vsGiYqkKlR4wSVSG+49GZRIfcGOD9/IS3h4eG1tLT8v+sILGQGIIxlE/TJK6aOAQCCEB51OhPgP7e3tR48ePXXq1NOnT9va2kjvIch3Ao2NjZ6enuCT1tTUJOBwEWifnJGRAXd2EZCXlwevy8jIAHtgZGVlAwMDwVR6XFycs7OziYmJl5eXp6cn6eksHxgUKgieTMPrEhagoKCgpqZGOkowMDCYOXPmhQsXqqurIyIi4NIThmFgxQBsnCaQkZGxb9++mJgYeGaG4BTygh8oQ+A5Orxr+8JAIVXUig42bGVlZX6rJfCUmoyMDCHT//z5c/CD9EApAPTWm5mZifUQwtcdNQkAWt3Ro0czMjKampo2bdr0ww8/uLm5eXp6zpgxA456pVodsC709PT4He8E66K5ubmgoAC6I8LD7zwSZWVlPT09oCdkZ2fDiQwJgveLCwFuY5U6IQRBB7zUeh/w4nP9+nWw9Pfnn39K7xtEAUlVqPCNX6Q23HsyKJH6EkaUdcMHQhzJIOqXUUofBQQCITxI40X8S3l5ubu7e2pqKoZhxsbGHh4ehoaG8OCBy5cvJyYmCn5CS0uLq6trcnKymppafX39n3/+6e7uDjYs8VJdXQ1+nOlE8JMrKyvh7/nz52toaKxduxacl1tYWLi/Ez09vcWLF69fv15LSwv7EKFWQbW1teCHqqoqvycrKirymxf/6quvLly4AD7k8Lv+5s2by5cvT5gwYejQoYT7Dx486Ofnx2azZWVlJ0+ebGtrq66uDiY+mpqafvzxR2FySnpkojgrHtRSRa3oYMOura395ptvhG/YgoGPFZAYaAZJWDLqToSvO8oSQEFBIS4uzt/f/9ixY6xOrnWycuVKFxeXDRs2APtA6VWHSHUBqoNUfxBwELSqqirQeGtqajApwO9UUsFBlLl9+/YPP/wA1OkLFy7wKzfxv0HUkFSFCt/4RWrDvSeDEqkvYRLTDR8IMSWDSF9GKX0UEAiE8CCNF/EvPj4+4NO1dOnSw4cPw2MVAKWlpV2ONphMZkpKysWLF2k0GvAVsWzZstGjR5MeCgq/izt37iRs9+IFOv8ATJ06dcqUKbGxsadPn75w4QIY31dUVAQEBBw9evTKlSvw/ABpw+FwenkFwduoLc64urpaWFi8fPnywYMHaWlpwB/mkSNH2Gw2PCkHEhsbC4wVNTU179y5Q1ibYjKZQmq8koVyqqgVHWzYhoaGV65cEXyz8FYJwiQGBsE09GbEkQCamprBwcE7duw4e/bsmTNnEhISgN3snU4YDMaxY8fACFga1SFSXVCrjverKgVTUlIyb968DleZnTtUofWmNL5B1OiGCuVF+DbcazPYI58kSSGmZBDpyyiljwICgRAepPEi3pGWlnb37l0MwzQ0NAIDAwmfLiGh0+kxMTHgaMevvvrq0KFDTCZz/vz5sbGxvEJcR0fnzZs34AfvtrEuodFoTp0cPHjw9u3bISEhFy9eBPOjnp6eubm54IBBCUL6eW5ubsZ6dwVpaWkBO14mk8nvnsbGRgFPWLlyJTjr+HAnbDY7JCREV1f3s88+I9wJnev6+/tLwxSTGpRTRa3ooMUdi8Wi0LD5AfuLgMTAIFKrv96GmBIAOLBZ1UlxcXFYWNgff/wBtomePHnS2toaNFppVAd8pjB1IaA6mpqauoz+vlussFisOXPmgGWrZcuWLVy4UKrfoJ6tUCm14d6ZQcr1BTu+mB4ZxER8ySD8l1FKHwUEAiE8yHMVgriHZOTIkbybuMDcc5cP0dLSAuouhmF79+4dPnw4hmGJiYmka2jQa0VeXp44KZeTk3N3d79w4UJCQgLYyVNWVnbjxg1xnkl4voDhaUlJCda7KwieUvjq1SvSG+rq6gRrvAwGAxQs8LEZHR395s2bxYsX85qWwUTCgy6ESaG0oZwqakUHG3Z5ebkAlUZU4GMFOMuFTkqh66PejKQkAFg58ff3z8nJgXsoTpw4Ib3qgM+s6URwXWhraxsbG5PeA3QbXqqqqqBFPWyE7yn+/v5goc/W1lawE2CJfIN6tkKl1IZ7ZwYp15cwoqwbEF8yCP9llNJHAYFACA/SePsc/D5C0LcEP3MmAXPDpCgqKp49exZ8CHfs2MHrfhDaMQJrLlJiY2MNDAxMTU3hUmpmZqanp2d0dDTvzePGjYPnWPLzTkQBTU1NAcPTBw8eYN0C5QoChyJiGEbwaw15+PCh4Ff369cPHKjQ0NAQFhZ26NAhGo22fPlyURMpahPqnrYtIFXUis7IyAhs4uJyuQJOCZo+fbqBgcGvv/6KCceUKVPAD3iAMIGWlhZwHjWGYZLdBCglfYOaBMAwbPPmzbzH54C9kfAIECgBpFEdRkZGQ4YMEZx4KPE8PDz4OfDjlx7Y3gwNDT/66KNeMnNEgUuXLv32229gGZD3mLqMjIxvvvkG+umR1DeIQvlIqkKFR6Q2LDz88i6NDFKuLyjKBNiou7m5mZqaSlDn50V8ySD8l1FKHwUEAiE8SOPtK0ATX/ypA1evXrWxsfH19cUwbNCgQeBiSkoKr/kuh8Oh4DHfysoKuGDlcDjz588nTC17enqClyYkJAAfVLwcPny4vLzcwcEBTiFXVlZGRUVFRkaS3q+urg5+SPCAIisrK36aRkxMjMRPhuQH5QqaO3cuKJa0tLRHjx7x3hASEtLl2+HGpN27d9+8eXPy5Mmk7othIqHqhefevXtYd7XtadOm2djYgPxSThXlolu3bh34cfToUdIbsrOzr1y5UlFRMW3aNEw4vLy8gGvTp0+fpqWl8d4QEREB1EJPT09eNUl6ooMy1CQA6Inh4eGkM1AqKipgAwVeAkijOtauXQt+HD9+nDeUzWb/9ddfhDt5efDgAalXbajz4D2+Sq8ipERubu6iRYvA75MnT8JuiL/h999/h0uLYn6DupQD3VChwiNqGxaMMG1D4hmkXF9QlD1+/Bj6bcaTlZV1+/btoqIiFxcXTJqILxmE/DJKSQohEAjhQRpvX0FHRwf4RcRb4SYkJKSmpoKP68SJE/X19YHVTUBAACH67t27qVkeLlu2bNasWWCBdMmSJfggWVnZEydOyMjIcLlcX19f3g2xoaGhZ86cUVRU3L59OyEoPDz8xYsXhIvNzc2XL18Gq7JwdU584En3J06cgHZc4DPv6+tLaigrDShXkKqqKrx/0aJFBC++p06dunHjRpd7nkePHg12wL5+/RrsXyK9bd68eeBHQEAAYYGitLR08+bNmBQwNzcHP2Dbrq+vv3nzZmpqKnB3RDlVlIuOwWCAZhMeHn7p0iVCaGNj45w5c8Az4XxKl8jKyh4/fhx4slmxYgXhwI/S0tKNGzeCnQWCbUclLjooI44EwDBs69atvBcvXLgABt+ghKVXHYsWLXJzc8Mw7OLFi7wmJ7t27QIWmxs2bOB3/CY442ThwoXQgBlw4MABcLqbqakpfhun9CpCGrS0tHh7e4ONmuvWrQOODAUj5jeoSznQDRUqKsK3YcEI0zYknkHK9UUQZYSzf9vb2xcvXoxhmK+vL6nPSwkivmQQ8ssoJSmEQCBEgIvoM4AzbMF0e3FxcXR0dL9+/YAFHbghKioK2jJ5eHicPn36wYMHkZGR3t7eampq48ePB0Hu7u4MBiMgIIDL5d64cYPRCdjNoqioCP68ceMGl8t9+PAhg8GYMWMGbG8zZsxgMBiHDx+GqTpz5gzY9GJlZRUaGpqXl1dcXHzv3r0vvviCRqPR6fSIiAh8LuCKnL6+/oEDBzIzMysqKrKzsyMiIsDeRTk5uUuXLglTIGvXrmUwGNOnTwcPNDc3B4lnMBi5ubn4O+E0uaysrJOTk4+Pz/jx44H90rZt20CQi4sLg8FYunQpk8kED3FwcABBDg4O4EpZWRm/oKampi4TTKGCABwOB4whwCB7y5Yt4eHhwcHBoGrCwsLAwAVW38mTJ3nfDtczjYyMWCwWaQpbW1vHjh0LbtPU1Ny1a9eNGzcSEhL27Nmjr6/v4eEB6w686MWLF1wuNzc3F/xpZGQEbvD29mYwGKdPnwaPBaFwHEDIYHZ2NigWR0fHrKysnJwccFaEi4uLOKkSqej09fUJRVFTUzNx4kTQZlatWpWUlFRaWpqWlnbkyBEwjHN0dGxoaOCKSGhoKLAhtLOzi4qKKi4uzs/PP378OBjT6+joPHz4kFojpyw69u7dS/oK0KQjIyMZDIaPjw+/QhZVAnC5XCcnJ/C02bNn37x5s7i4+M2bN48ePfL39wd2s46Oji0tLdKujurqatDp5OTkvv/++7S0tLKysqSkJAaDAZLn6+vb3t7OGzEoKAjcsG/fvmHDhvXv33/z5s3h4eEhISHQ0ltTU/PZs2ciVQS/uk5PTxfcxZ4+fQpCVVRUgJEq+DM+Pl5ADZ46dYr0mT/99BOXy129ejW4SKPR5s+fzyADrOBFRkaKL+K6lAPx8fECUkutQsURXBTasJjfd3FaLD/EqS8oyuzt7aOiooqKil6+fBkREQHcf9jb29fV1cGbqQmZ06dPd1np4ksGYb6MknoXAoGgDNJ4+xClpaV2dnYYDjqdvmfPHvw9N2/etLCwwN+DYdj48ePT0tL8/PzwF52cnLhc7v79+zEy9u/fD8aypKFz587FvzQlJcXd3Z1345Czs3NycjIhF01NTX/++aezszOpZ8iJEycSRvwCEDB/nJSUhL+zpaXF19cXn0IFBYWNGzdyOByo8cLrZWVl/B778uVLfkG1tbXCpFnUCoKw2ez9+/dDq2/AgAEDwOwAUNsgy5cv5311Q0MDOLBxx44dAlJYX1+/fPlyws4uFRWVnTt38h4zeO/ePQH7mvz8/MAzSUPxGTxw4ADBWYi1tfXr16/FSZWQRaenpweUYd6iaG1t3bNnD6/XU21t7e3bt4s0nMXz7NmzTz/9lPBMOp2+cOHCoqIiyo2csujgt2cYNGlCByEtZJEkAJfLTU1N/eqrr0gX7rS0tLZs2dLc3Nw91dHS0vLLL79oa2sTnmlubh4WFsYvFtR4g4KCampqZs2aRci7s7Nzdna2qBXBr66vXbsmuIvx2yRy4sQJATXIz/Z1zJgxeI2uS/AarzgiTrAc4LcjFKSWWoWKI7iotWExv++UW6wAxKkvUlGmqKj49ddfExQ/akIGmL10WeliSgYhv4wSeRcCgaAM7T3ygYEQHy6X+/jx48zMzObmZj09vYkTJ4LxOuGelJSU9PT0hoYGLS2tUaNGQWsxqfL27dukpKSysjKggNnb2ws2RWtsbExPT8/Jyamrq6PT6QYGBnZ2dsJYr1GmuLg4MTGxqqqqf//+Y8eOJWiJ3YY4FdTa2nr//v3CwkJFRUUzM7Nx48ZJ6rxHAtXV1YmJiSUlJXQ63djY2NHREVgBSI/Kysq4uLiysjJ5efkhQ4Y4ODjwalDipIpf0amqqjY2NlpaWvKa2QM4HE5ycnJOTk5NTY2ampqlpaWdnZ3453lWVFSA/kKn0wcMGDB+/Hhg1tiDoqObJQBw8gysPFpaWtTV1S0tLW1tbQWXrTSqg8PhPH78ODc3l8lkamtrD+1EwP3BwcFgg25QUBDwc1NSUvL48eOysjJNTc2RI0cOHjy4ByuixxFHxAkjByReoeJAoQ2L3zYkm0ExxwxQlNFoNBMTEwcHB8L0YvcgJUHd4+9CIBAApPEiEAgERWpra4Hp4KeffirBA7EQHza8Gi8CgUAgEAjpgTxXIRAIBF8SEhIWLVpUWFjILxT8cHZ27t50IRAIBAKBQCCEAmm8CAQCwZecnJyTJ0/CczsI7Nu3D2zeJvghRyAQCAQCgUD0EpDGi0AgEF3w008/Ec7zaGpqWrVq1e3bt4Gftp7a1I14j+BwOIWdwGOuqqqqwBW0vQiBQCAQCOmB9vEiEAgEXy5duuTt7Q3k5NChQ4cPH66pqVlWVhYbG1tdXa2goLB//36wJxOBEEx5ebmBgQFpUG1trYaGRrenCIFAIBCIPgHSeBEIBEIQxcXFV65ciY+Pf/78eUVFRXNzs4aGhqmpqaur69KlS9HqLkJIGhsb9+zZQxq0ceNGcAorAoFAIBAIiYM0XgQCgUAgEAgEAoFAfJigfbwIBAKBQCAQCAQCgfgwQRovAoFAIBAIBAKBQCA+TJDGi0AgEAgEAoFAIBCIDxOk8SIQCAQCgUAgEAgE4sMEabwIBAKBQCAQCAQCgfgwQRovAoFAIBAIBAKBQCA+TOR6OgEIRK9m3759UVFR8E8tLa2LFy9iHxxNTU1nzpy5d+9eWVmZoqKigYGBvb29u7u7iYlJTycNIV24XG5paSmTycQwTENDw8DAQEYGzYRKgMbGxqlTp+KvrF27dvr06T2XIgQ5NTU1Xl5e+CuophCS5eDBgxERET01kEDfdwQCabyIHobJZE6fPj01NXXPnj3Lli3Deh+VlZUFBQUYhhUVFXE4HH19feyDIzU1ddq0acXFxXQ63dLSEsOwq1evHjlyRENDo7a2tqdTh5AKXC73zJkzJ06cSExMbGhogNfl5eUHDx48evTo8ePHT5o0ycjIqAcTeerUKT8/v48//vjq1ataWlrYewWHwwGio76+vrq6GsMwHx8f7D2n90tsCrDZ7A+vpqTNe903u5/q6uqeGkig7zsCAaBxudx3PxEIiZKdnV1WVoZhmL29vYqKCuk9wcHBK1asAItLvVz4GhgYlJeX6+vrg0x9MLS2tlpYWLx+/drCwuL69eumpqYYhj179szR0ZFOp/fySkFQo6KiYubMmUlJSRiGDRkyxNXV1cjIiEajVVRUJCcnx8bGcjgccGdgYODq1at7ttNhGLZ//34/Pz/s/QRKuaCgoOXLl4v/wNbWVlB3Ojo6Q4cOxbqR90hi94aa+oDp8b7Zg73gPRpIoO87AgFBa7wIabF79+6TJ09iGJaSkmJtbU16z5AhQ8APKyur7k0d4h0XLlx4/fo1hmEbN24En0MMw2xtbT/77LPo6OieTh1C8rBYrEmTJqWmptLp9OPHj3/++eeEG169ejV79uzU1FRgDof1HEOHDgWjaiQf8JSVlTk7O2MYNnPmzMjIyO58NZLYiF7SN3uwF7xHoO87AgFB+7UQPcmECRPi4uIOHTr0999/93Ra+ihxcXHgh42NDf764cOHX7582UOJQkiR48ePA21248aNvOouhmGDBw+OiYlRU1PDeprIyMigoKDbt29PmjSpp9OC6ABJbAQA9c33AvR9RyAgaI0X0cM4dtLTqei7vH37FvzQ0NDAX1ftpIcShZAily5dAj9mz57N757+/ft//vnnQUFBWI+ipqaGjEt7G0hiI1DffF9A33cEAoLWeBGIPg2LxQI/ZGVlezotiO4gPz8f/FBWVhZwG7AYRCAQCMR7Cvq+IxAQtMbb52hqarp161ZCQkJ5eTmdTh8wYICrq6ujoyNBILa3tz99+hR/xczMTE9Pr729/erVq4mJiWVlZRoaGqNGjfLy8sIbQMKIcHIxLS2tpaUF3mBkZDRgwIDKysrc3Fz8821tbeXl5cHvlJSU1tZWGKSrqzto0CAMw+7duxcTE1NRUWFsbDx16tTRo0fDe9hsdkRERFJSUk1NjbGxsZeXl52dHWkJNDQ03Lt379mzZ4WFhS0tLerq6lZWVpMmTQJuDCVFfn5+RUUF/JNOp4P05Ofnnz9/Pi8vr6WlxdjYeObMmfzSCUhLS7t27VpeXl5TU5O2tratre3kyZP19PR47+RXaFlZWRcvXiwoKGCz2QYGBqNGjfrss89g+QPfpMCbBfSloa2t/dFHH1FoNqImo1fVNb82WVdXFxYWlp6e3tTUZGZm5unpyW9fOm9ZgcK0srKaMGGCgAZWX19//fr1pKSkiooKJSUlIyMjV1fXsWPH0mg0TGpkZWWZm5vzC53biZilyitGAObm5jo6OuB3UVHRmzdv8KEGBgY1NTWkrUJS1VRfX3/p0qXHjx8zmUwDA4Nx48ZNnTqVTqdXVFTAGQGAnZ0dnU7n9xxhnik4lkhNFEiV0tJS8Gd1dfXDhw9hKI1Gw3cTyco6ARJbUh1HMC9evIiJicnJyWEymSoqKiYmJjY2Ns7OzgImbmCUuro6bW3tYcOGTZkyZcCAAcK/tKWlBWwBgAwfPhz/xuTkZDabDf+0sLDo168f+C0NycbvmQ8ePLhy5UpRUZGamtqYMWNmz56tpKREmqO6urro6OgnT55UVlbKyMj079/fxsbG1dVVV1dXyDLhl4ZuS56ovUDUL6lEus/Tp0+joqJev36tqKg4aNCg2bNnw220lBH+Kyzq9500LqE7t7S0nD9//tmzZxUVFWpqapaWljNnzuTNlJCJLCkpKS4uJsRVVFQkiAhQs6NHj8Z/Cnk/GR999JG2tjb8Mzk5+fbt2zk5OU1NTerq6paWlg4ODqNHj0YH7/V1uIi+RHBwMBhoysjIGBoaQhf5lpaWN27cwN/J60gwKCgoNTXVzMyMcF1HR+fChQsCIhIICAjgcrknTpwgXC8oKIAPIRwTx2AwWlpagIKEx8fHh8VicbncvLw8CwsLQuiaNWsI2a+oqPD29oZjUC0tLVNTU6hmz5gxo7y8nF/RgbLS19cXsqgJFl/6+vosFmvdunW8BfLZZ5/V1NTwPiE3NxdukerXr5+JiQlIuby8/Pr169va2gj38xZaW1vb4sWLCa/T0NAgLX88c+fOpdZsRE1Gr6pr0jZ569Ytgj0YhmF+fn786j0oKAiUFY1GGzhwIP4zbGFh8dtvv3E4HEKUwMBATU1NMA1vYmICo1hbWyclJXElzZQpU8Dz7ezseFuRYEQtVX7S4MSJE/Aef39/3uLlbRUSrKYLFy5AfRtibm6elpbGa8hdVlYmTMkI88ygoCBxCpNXqhBQUFAQ5+GCESCxJdJxBJCfnz9t2jTwBFVVVRMTEzm5d5P1CgoK8+bNS09PJ0QpKCiAUdTU1ExNTRUVFUEXW7lyZX19PemLeGvqxYsXhCykpKTgoxDyGBkZCYOkIdlIn+nt7U2IZWhoyFsmXC73jz/+AOcmyMjIDBgwAOp7NBrNycnp7t27wlSHgL7ZPckTvhdQ+5KK2X2qq6t5axnDMH9/fzabLepAgtpXWKTve5dxCwoKEhMTeU9U2r9/P+VEbtu2jTdhlpaW+HsePXoErsfHx+Ov834yzpw5A4IKCwsnTpwILqqpqZmYmMBa09XV9fPzE/WTh/iQQBpvH+Krr74CPX/FihVwGPfixQs3NzcgoY4ePQpvbmpqCuoEnky4ZcsWLS0tV1fXv//+u6CgID09fdeuXWC2m0ajQYkDIzo4OICI33//fRCOZ8+ecbnc7Oxs8OeIESOgVIVvP3/+/IkTJ3788UcQxGAw5s+fr6ent27dusDAwG+//RbOo69du5bJZBobG1tYWGzduvX3339fvHgx/FCdPn0aXwIpKSngure3d15eHrjY2toaHh4OppAtLS2ZTCZp6Yn6oYqNjQUZBAvg+vr63333nZqa2u7du9PT0wsKCmJiYpycnEB67O3tGxoaCEkFXw4zMzP4pa+vrw8ICACTnZMmTWpvb8dH4S00BoMhLy+/cOHC3377bfv27cbGxlDV5C3/nTt3wjq6efMmtWYjajJ6VV3zlsnly5fl5eUnTZq0f//+oKCgJUuWwKH2yZMneSsdDsW+/PLL0tJScPHt27f+/v5wdrmlpQUfBR5qumbNmurqanAxOTnZ1tYWzHlfv36dK1EOHToEBwr29vZCDnOplSqQBjt27IBDkMOHDwcFBWVnZ8N7kpKSgoKCNmzYgGHYmDFjgoKCEhISwsLCgoKCvv/+e9gqJFVN4eHhoAepqKgEBARkZGSAzvjJJ59oa2tv2bIFRPTx8QFvaWpq6rJYhHwmQeOl0ESBVNm5cyeIOGLECLxoPXLkiDgPF4wAiS1+xxFASkoK0HwGDhx45coVNpvN5XJZLNatW7eGDRsGnunv74+PkpaWBsS1oaHh33//DaK0tLSEhISAD5atrW1lZaUwGm9NTQ3hc0bQeI8dOxYUFDR16lRejVcako23X/j4+Ojo6Kxfvz4kJGT37t3wnJ7BgwcTBveg49NotL1798LPzdu3b9esWSPSfISAvtk9yRO+F1D7korTfRoaGuzt7UFcFxeXmJgYMFgKCAhQU1PbtGkTNY1X1K+w8N93XnJyck50Ar5BGIb9/fffioqKQ4cO3bx58759++CYkKDxipTI5OTkoKCgCRMmgCjLly8PCgqCw0jA+vXrSVsm+GT873//A94ogoKCcnJyQLWCJZlRo0Y9ffoU3Mxms69fvz548GDwqNraWpFKHvEhgTTevsLBgwdBh1+8eDEhqLW1ddSoUWD+mzCXhh8EKCgozJo1i7BClZCQAIYyqqqqr1+/xgcxGAzSIQKBmTNnEsZPvF8dMzMzKysr/BglOztbQUEBDDGXLFkyderU1tZWGHrx4kUQ0d7enveB48aNA3PqeJ4+fQp0kg0bNpCmk/LULIgoJyenpKSUnJyMD2Kz2XAh4uuvv4bXmUwmENwqKir5+fmEB/78888gyrZt23hfhy80fX39zMxMGFRSUqKsrAxVzS7LX5xmI2oyelVdwzIxMzMLDAzEB509exYE2draEmIdOHAABPn6+vI+E9YaXuOFUf73v/8R7q+pqenfvz+woaioqOBKjqamJoJVnpWV1bZt21JTU7uMS7lU4eApMTGR9MnA/CE6Opr3dYRRtTjVVFhYCPy10Ol0wvo5h8OZNWsWaGm82qkAKD+TcmEWFBSAB86cOZNfqsRp/4IRIDGodRwBQEmopKT04sULfn0Er/EymUxgSaukpISfWAFAt20eHh681hb8VuO7/JzBBSu8xislyYZ/pqmpqaWlJV4+tLS0QK+8ly9fhtfb29uB8cjChQt50w9OIRZpBV5A3+ye5AnTCyh/SSl3H3h6+cyZMwkNLDk5WUlJCYyXRBpIUP4Kd/l9FwyMO2jQoK+//hrMHAG++eYbgsZLLZHnz5/n9wXkcrnQZHrgwIG8vRVMheCHFvv27QP3w0kKSE5ODjAfQBpvXwZpvH0CJpMJVhrl5eVJrXFu374NJIWdnR2/QQC/uEuXLgU3rFy5UkoaL4Zhd+7cIYTCTYby8vJwPQ0Ct6nU1dXBi1lZWSYmJoR5RMgnn3wCFAxe2Sq+xstvPFFQUAD2t8jKypaUlICLW7duBVFIv6ltbW1g0lpZWZlXfOML7ezZs4TQxYsXOzo6Cln+4jQbUZPRq+oalsn48eN5QwcOHMj7ui7LqqWlBRhAQo0XRlFUVISru3jg93vTpk1ciVJYWAjn/vEYGRmtXLny7t27+MENHsqlGhISAl6xYMEC3ogtLS3a2tpGRkaE9wqp8QpfTWDoDJYUeKOAjWeiaryUn0m5MIUZ64vT/sXXeIWvEcFASchPGQNKC17jhconvyjQ0TRhekXaGq+kJBvhmbdu3SLEOnLkCAhau3YtvJiVlQUu/vjjj7zpT05OlobGK9XkCdMLKH9JqXWf4uJi8DWXk5MrKirijfj111+D9Ag/kBDnKywpjXfo0KEEzf/x48fW1tZhYWFiJrKxsRHs6DYwMOCdIMB/m3g3+BgZGRGsoMHpA3JycqTfL2CIgTTevgzaxt0nCA0Nra+vxzBs4sSJpK4anJ2dga3O06dPk5KSSB/i6upKGnfBggXwLdAxoGTR19fn9RwLXXo4OzsbGBjwC83Ly4MXraysCgoK+PnjAXuoKisrCa5rJMX8+fN5L5qYmIARGJvNDg0NBVvrDx8+DEJJk0qn093d3YGLiHPnzvF7Xb9+/Xh3E/3555/wgL7uaTaiJqNX1TXpcbXwdfi4sKycnJxIy0pBQcHDwwO/6w9GcXNzg/aNeKZPnw5+HDt2DJMoxsbGT548OXDgAGHfXVFR0eHDh11cXMzNzYODgzkcDiEi5VKdP3++uro6hmHnzp2rqqoihEZERFRVVS1fvpyaZxEhq4nFYoEuxi+Knp4eGMsKjzjPlKo46llZJ3zHEUCXkhDDsMmTJ2toaEA3SHij/Tlz5pBGmTdvHvgBLSy6B0lJNjx6enqurq6EiyNHjgQ/8P6HoN8gYBlOiGJjY5OSkgJ2FkiQnk2eOF9Sat0nNDQUJH7ChAmGhoZC9otu+AqLyZIlSwh+p+zt7VNSUuCQhnIilZWVgV+JsrKyxMREfBRQIytXrgR/RkRE4EMfPXpUVFREOGAPJJLFYsXExPCmITg4OCUlpTecM4/oKZDG2ye4desW+AF3mBCQkZGBZodwNo4AP3e4wF4FuCpNT0/HpIC1tTWv01otLS3So9UB0P0PEMS8sFis0tLSly9fZv9DQ0MDCML7WJYUNBqNn59S6FgyPj4ew7CMjAzg5lpeXp40axiGwQ1sAtRXW1tbuHeuB5uNqMnoVXVN+jo4MK2rq+MtKzie4yU8PLy2thbauMIocIsgAXNzc3BzaWmpxDUTOTm5VatW5efnx8bGrl69muBys6CgYMWKFU5OTtDVp5ilqqKisnDhQgzD2traeD2jHD58WE5ObsmSJdTyImQ1paamwhTya9KwPQuJpJ4pVXHUzbJOpI4jACgJaTQavzIcMWJEbW3tDz/8AKOAHNFoNH4fLNhD4+Li2tvbse5CGpKN9Jmk5Wxubg6e9ujRIxcXl/v37+OjyMrKWltbi+TFWhh6NnmS+pIK333gQ0idRfMrkG74CosJHONJI5FwZoqg054/f/7jjz/eunUrKDFo/4zXhwmzWvBLOmfOnF27dhGmVgcOHGhtbY3cNfdl0OlEfYLnz5+DHwL848PVnszMTNIb+PnxV1ZW1tPTA6I/Oztb1CGjMOAd3kKgrSCvi1TwkQM/CBPG7e3tR48ePXXq1NOnT9va2khfhz9fQVKoq6tDVYcAPNohOzsbnBkD/lRWVua3CgFPfMnIyOD3RsHnLvR4s3kv6pr0dcDpK+F1wpQVAVjRGRkZv//+O+k98vLyIIUZGRm8btLFh0ajTegkMDAwMzPz0qVLYWFh0D9tfHy8j4/P9evXJVKqK1euBHu9Dh8+/O2338KRX3p6emJi4qxZs3jXuIREyGp6+fIl+KGvr8/vcBRRm6uYz5SqOOopWSdSxxEA7FN6enowrvhRoMhqbm4uKCiALm2kjQQlG4VylpWVDQwMBGuMcXFxzs7OJiYmXl5enp6epMfbSISeTZ6YX1IK3QdKA36yWkFBQU1NTcgZHwl+hcWkS6koTiKnTp2qqKgIjj7at28f+C48e/YsLy9vy5YtBgYG48ePj4+PLywsfPLkCZyuOn/+/ODBg4cPH45/1IoVK44ePZqRkdHU1LRp06YffvjBzc3N09NzxowZYMM/oo+DNN4+AVyoAR5WSIHGHrw2hwB+Cht4LNB4a2pqMCkAP/wUQvGUl5e7u7uD8xWNjY09PDwMDQ3hmOPy5csEuxoJIrj0wA9QerCyamtrgX8IAVRWVlJ4Yy9pNr2/rklfRzpJLExZ8YtyphPKFS0phnayefPmGzdurFq16tWrVxiG3bhxIzExcdy4ceKX6tChQx0dHePj43Nzc2/duvXpp5+C68AMFfr5pICQ1VRbW9tlHQmpWUnkmVIVRz0o60TqOAIQp08JI7KA1Oo2jVdSko1yOc+fP19DQ2Pt2rVgarWwsHB/J3p6eosXL16/fj1ccJYUPZs8cb6k1LqPkNJAJI1XIl9hMenyIy5OIlVUVDw8PC5dulRSUvLo0aMxY8bAJVxgtDx79mxg/hYREQE03sePHxcWFkKX4Ph0xsXF+fv7Hzt2jNXJtU5Wrlzp4uKyYcMGYMSO6LMgjbdPAM1KBUyuwyAo1oVHnLjdiY+PD/iGLV26FBhS4kNLS0ulOgoUsvRgGRoaGl65ckVwXCnNzXdPs/mQ6lqYsiIAS2znzp3wdBN+QK8/3cCkSZNiY2MtLCyALeXNmzehxitmqX711Vdg7HLo0CGg8TY0NISGhlpaWrq4uEg5W1TqSKrPlGoT7Z2yTtplK5LIkqDU4t3x3juZOnXqlClTYmNjT58+feHCBaB7VFRUBAQEHD169MqVK0Df+DCSJ86XlFr36SkJ0+NfYTETOXv2bOBEPSIiAlQxfgnX29vbz88PhAYEBBD0YQKamprBwcE7duw4e/bsmTNnEhISwI7uO50wGIxjx44hw+Y+C9J4+wQ6Ojpv3rzBMIzJZPK7BwaRWiIB7w5dxpX4JLEESUtLu3v3LjgJNjAwUMw9rqIifOnB8mexWPy2/r5HzaaP1DUsK+Hn72EUHR2d7qzorKyskpKScePGgdMaSDEwMJg7d+7Ro0cxDCspKZFUqXp7e+vo6FRWVl6+fLmkpGTgwIFhYWENDQ3QPYlUgdJJQHtubGzsnmdKtYn2rKyTFFCkiNSnwA9hRBY1qUU6pm9ubsbeE2g0mlMnBw8evH37dkhICDgGqbKy0tPTMzc3FxxZ/AEkj/KXlHL30dLSKi0tlayEeS++wmImctq0aQoKCq2trefPn9+zZ09qampOTg5cwh04cODYsWMfPHiQl5eXkpJiY2Nz/vz5QYMG8dubjWGYrq7uqk6Ki4vDwsL++OOP4uJicBi4tbU1POEZ0ddAUx19Arj5IScnh9890HEiPy8FQGTwUlVVBY15SI886SXAHTsjR44k3XHXcVqX1GhoaOA3boObf0DpwcoqLy8XoCe/L82mj9S1MGXFLwo/R6xSIjAwcNKkSfgTREgxNzcHP+AQU/xSlZeXX7x4MVgTA+r0oUOHFBUVv/jiC0z6QOlUU1PDzyMXVO+l/UypNtGelXWSAnaQ6upqASNp0ig1nQgWWdra2sbGxkImBqo9pDJZ1GbTG5CTk3N3d79w4UJCQgIwvC8rK7tx4wb2oSSP8peUcveB0gBsCeGlrq5OVI33vfgKi5lINTU1YG9cWFiYnJzM65UK790qOTm5oKCAdIGXF0NDQ39//5ycHHg/r99ERN8Babx9AuD/HXoD5qWlpQWefsZvqwM/x/fQraKhoSE8P7AXjq6gkwl+lj9CDqoo8/DhQ8EFCE4xMTIyGjp0KCg3AYcNTJ8+3cDA4Ndff+3lzaaP1DUsKwHGom5ubqampvCLCy2ZgeUVKbGxsQYGBqamphJfRHry5ImQG9ug6iuRUl2xYgXwTRISEhIXF5eWljZv3jzSw5kkzuDBg+GRIbGxsaT3iHq8B+VnSqQw+YnWHpd1EsHIyGjIkCGCu9XVq1dNTU1tbW1BUeCj8OtW0KGuh4eH8I5zNTU1Bcz8PnjwAOvdZGZmenp6RkdH8waNGzdu6dKl4DdYony/ksevF1D+klLuPvAcMoKv6S7HAO/7V1j8REKN9Ny5c+fPnzc3N8cvy3t7e4MfERERAkyaN2/eTHoGpIKCAjynqqdaOKI3gDTePoGXlxfwoff06dO0tDTeGyIiIsCQ2tPTk1RrBR91Uk+AUJSsWLECfx0uDeFPgJg2bZqNjc2jR4+wbge6RE5JSeG1TONwOMIfVEuNI0eO8F5MTEwEXiLV1dXh6X/r1q0DP8A6GC/Z2dlXrlypqKiYNm1aL282PUL31zUsq8ePH0PHlXiysrJu375dVFQEN6x6enqCdCYkJABnLbwcPny4vLzcwcGBd6khIiLif//7399//00twcHBwQL2XLW3t0dFRQEjQ6iZS6RUzczMwIjnzZs34LwicXxWicry5cvBj+DgYN7QzMxMCqoLtWeKU5ikovXq1as2Nja+vr69QdZJirVr14IfJ0+eJL3hxIkThYWFdnZ2UHeFUY4fP857P5vN/uuvvwh3CoOVlRW/MX1MTIyUjjWWIJWVlVFRUZGRkaSh4KxsDMMkfkCR9JLXZS+g/CWl3H3mzp0LkpqWlkY6yAkJCcE+xK+w+ImcMWMG8HMWEhLy8uVLgkJrZGQE9ve+evUqJCTE1NSU9BTA+Pj48PBw0jkpFRUVsFW7p1o4ojeANN4+gays7PHjx8F+/RUrVhBc6peWlm7cuBHsQuHnxB9s7Vu4cCE0YAYcOHAAHMVmampK2B0Bl4agxVd9ff3NmzdTU1O70w0PZOLEifr6+sDGCfg/wLN7926pGpcqKytfv3791KlT+Itv374FRp4Yhv38889wXyWDwZg0aRI4wRV4dMDT2NgIjHwWLVoEx2G9ttn0CN1f14SyIpzz2d7eDira19cXHtIgKyt74sQJGRkZLpfr6+vLu4obGhp65swZRUXF7du3E4Kio6PnzJlz6NChqVOn8ptWF0xWVtbixYtJD6dpbW1dvnw5sE9bsmQJHP9JqlThrt3CwkJbW9vutMRbs2YNGJldu3YtKCgIH1RbW7tw4UIKJyRRe6Y4hamjowN8ouKNaRMSElJTU8GormdlnQRZtGiRm5sbWPmJiYkhhEZHR58/f15RUfG7777jjXLx4kXeNcNdu3aBhr1hwwYB+wB5AQIZ6NjQ6hUoRb6+vo6Ojtj7QHh4ODx7DNLc3Hz58mWwjg1XKXt/8rrsBZS/pJS7j6qqKrx/0aJFBKfEp06dunHjhqjbpN+Lr7D4iVRXVwe+DMH6Oe8SLrzCZDJnzZolIDFbt27lvXjhwgUweUE4whfRt+Ai+gyhoaHASsfOzi4qKqq4uDg/P//48eNA/9TR0Xn48CFvLDiG27dv37Bhw/r377958+bw8PCQkBC4+KOpqfns2TNCxOzsbDDv7ujomJWVlZOTs2DBAgzDXFxcuFxufHw8oxMjIyPwEG9vbwaD8dNPP3G53L179zIYjOnTp4Mgc3NzcHNTUxOXy92yZQuDwRg/fjwIHTVqFIPBWLt2LXgvuBN+wNzd3eFjo6Ki4FKAh4fH6dOnHzx4EBkZ6e3traamBh8IogQEBHC53JMnT4IHgq1EioqK4M/Tp08LWezg26mvrw/WFqZPnx4cHBweHr5582YQhGHY4sWLORwOPlZNTc3EiRPBt2TVqlVJSUmlpaVpaWlHjhwBKpOjo2NDQwM+Cr9CgyWDh1/5MxiMvXv3itNsREpGr6rr3Nxc0jKBdU36OhCXUFb29vZRUVFFRUUvX76MiIgAPift7e3r6uoI2T9z5gyY27aysgoNDc3LyysuLr53794XX3xBo9HodHpERARvoeEPZtizZw9XFPBrqsbGxps2bbp8+XJSJ5cvX968eTPUyadNm9bS0oKPS6FUeWGxWNAS+MiRI6T3rF27lrRVpKeni1lNKSkp0Ih62rRpISEh4eHhW7Zs6d+///Dhw/ft2weCgoKChC9SIZ/p4OAA0sZkMsUsTHByKVj8LC4ujo6OBgm4f/++BGsKjwCJLX7HEUB1dTVILZ1O37RpU1paWmlp6YMHD7799ls6nS4jIxMaGsovipyc3Pfff5+WllZWVpaUlMRgMEACfH1929vb4f1MJhOk0MHBgVBTQAoB4MqhrKysk5OTj4/P+PHjaTTa8uXLt23bBoJcXFwYDMbSpUulJNkEPzMyMpLBYPj4+IBQfX19EPrixYt79+7BiwcOHMjMzKyoqMjOzo6IiABTTnJycpcuXRKmRgT0zW5OXpe9gNqXVJzuw+Fw4Cy2gYHBli1bwsPDg4ODZ8yYgWFYWFgY+OjDgcTJkyeFKXNRv8LCf9954dedGQxGfHy8BBNJANpxmJmZ8YYWFBTAz9ajR49In+Dk5ARumD179s2bN4uLi9+8efPo0SN/f39wwJKjoyPhi4boUyCNt2/x7NkzeAwmhE6nL1y4sKioiDQK1HiDgoJqampmzZpF2Pvk7OycnZ1NGvfAgQOEE/msra1fv37N5XL5+Q8YM2YMl8vltx2ltraWy+WS+l00MTEBLxXwWC6Xe/PmTQsLC0Lo+PHj09LSgAd8iJOTE5fLhSaLBPz8/ETVeLlc7oULFwgnoaurq//2229sNps3Ymtr6549e3gdG2pra2/fvp1XcPMrNFgyeAT4b3B3dxen2YiUjF5V1/z2esG6Jg0FcQWXlaKi4tdff807rgKkpKS4u7vzbil0dnZOTk4mjZKUlARc6SgpKT1//pwrCu3t7Tdu3Fi+fPnHH39MmiNQhryKBLVSJeWnn34CjZ9fmUCtm8C1a9fEr6aXL18SDkOSkZGZM2dObW0t3KMRHBwsUqkKeCZh4Rf44BGzMEtLS+3s7PA30Ol0wtyHRGoKIkBiS6TjCKClpeWXX37R1tYmPGH48OF37twRKYq5uXlYWBjh5rKyMtIUQikEn+nr64vvpwoKChs3buRwOFDjhdelJNkEP5OQDMi9e/eampr+/PNPZ2dnUs/DEydOFKyNCNk3uzl5wvQCCl9SMbsPm83ev38/tMQGDBgwAGjscJobsHz5ciGLXaSvsEjfdwIC9jyfOHFCgokkUFNTA2p//fr1pDfY29uDWVp+T0hNTf3qq69ITQi1tLS2bNnS3NwsOA2IDxtaL/EqhOhOKioqkpKSysrK6HT6gAEDxo8fL+Dc8ODgYLBBNygoCKh/JSUljx8/Lisr09TUHDly5ODBgwW8q7KyMi4urqysTF5efsiQIQ4ODsI7C5ESQMdIT09vaGjQ0tIaNWoUNMCWBgYGBuXl5fr6+mBcxWazExMTCwoKWlpaTExMnJycBB/vzuFwkpOTc3Jyampq1NTULC0t7ezseuTYPZGaTS+hm+uat6xoNJqJiYmDgwNhAMTL27dvQRQwKrK3txds/J+VlfXgwQNnZ2dxclRTU5OdnV1QUFBXV8disdTU1AYMGGBtbS34lIueKlXJ8urVqydPntTW1hoYGIwePRrs79q7dy/Y+3fmzBm4r17MZwqGcmFyudzHjx9nZmY2Nzfr6elNnDhRT09PUg/vhXA4nMePH+fm5tbW1mpqatrY2EAnVV1GYTKZ2traQzsRMxnFxcWJiYlVVVX9+/cfO3YsQYHp/TQ2Nqanp+fk5NTV1dHpdAMDAzs7ux7ZZySR5AnTCyh/ScXpPq2trffv3y8sLFRUVDQzMxs3bpxEjoF9L77CPZ7IvLw8YCbQ0tKirq5uaWlpa2vbU4cVI3oPSONFdAGvxosQR+NFIBC9lm+++eb3338HLuXGjh3b08lBIBAIBAIhAZDnKgQCgUD0FdatWwd0WlKAGzBlZWVSX6AIBAKBQCDeR0i2TCAQCAQC8UFy/vz56urqpUuXQtfokPj4eHBM8bJlywgOCBAIBAKBQLy/II0XQQ6HwykqKsIwDHrYr6qqKiwsBJ4Denwvbu+nurq6vr4ebNwF/4PSU1dXh25dEQhE91NfXz9nzpzQ0FB8T3z48CE4uGLw4MG8x0EhEAgEAoF4f0H7eBHklJeX8zuasra2VkNDo9tT9J6xYsWK4OBg3ut+fn779+/viRQhEAjMxsYmNTUVmC47OTkZGhqyWKy0tDSwujtu3Lhz5871Hkc+CAQCgUAgxAet8SLIUVVV5XeWADiZFiGY6dOnEw4iAsAjHxEIRPfz5MmTu3fv3rp169mzZ8C1soyMjK6urq+vr7e3NzxjHIFAIBAIxAcDWuNFIBAIBAKBQCAQCMSHCfLVjEAgEAgEAoFAIBCIDxOk8SIQCAQCgUAgEAgE4sMEabwIBAKBQCAQCAQCgfgwQRovAoFAIBAIBAKBQCA+TJDGi0AgEAgEAoFAIBCIDxN0OhGCnJqaGi8vL/yVtWvXTp8+Hfug87Vv376oqCgYpKWldfHixW5PI+I/zJs3r6ysDP7p4eHh7++PvSd8qP2ol4OKvS9w8ODBiIgI+CcS18KACk1Unj17du7cuczMzObmZl1dXVNTUzc3N0dHR3l5+Z5OGgKBEAGk8SLIYbPZBQUFGIbV19dXV1djGObj44N96PmqrKwEoUVFRRwOR19fv0cTi+iguJO2trbS0lIMw0xNTbH3hw+1H/VyULH3BaqrqymLayaTOX369NTU1D179ixbtgzrM4hTaH0QPz+/wMBADMP09PRMTExSUlIqKyt37969f/9+Pz+/nk4dAoEQAWTVjCBHR0enoJNdu3ZhfSZfO3fuBKG6uro9kToECfHx8QUFBTExMdh7yIfaj0QiOzv7fieNjY3d80ZU7H2BLVu2UBbXZ86ciYuLq6urW79+PdaXEKfQ+oLowBMUFATU3d27d5eXlz969OjNmzdffPFF96cEgUCID9J4EQgEAiFFdu/e7dxJTk5OT6cFgehgyJAh4IeVlVVPpwXRS0XH3r17MQwzNjbeuHEjuEKn03/44YfuTwkCgRAfZNWMQCAQCASiDzFhwoS4uLj09PR58+b1dFoQvZG3b98CNdva2hp/fdCgQWVlZWpqaj2XNAQCQQWk8SIQCAQCgehbOHbS06lA9FIqKirADw0NDUIQ2vyMQLyPIKtmBAKBQCAQCATiHSwWC/yQlZXt6bQgEAgJgNZ4+xZZWVlxcXFZWVnV1dV0Ol1fX9/BwWHy5MkKCgqUn5mcnHz79u2cnJympiZ1dXVLS0sHB4fRo0fLyPCdT3nx4kVMTExOTk5dXZ22tvawYcOmTJkyYMCAXpWvLhEyFw8fPuSN+9FHH2lra8M/i4uLS0pKBgwYYGRkBC9yudxHjx7hYykqKuItrOrq6qKjo588eVJZWSkjI9O/f38bGxtXV1fKLknS0tKuXbuWl5fX1NSkra1ta2s7efJkPT09AVEaGhru3bv37NmzwsLClpYWdXV1KyurSZMmWVpadvm6pqamW7duJSQklJeXYximra1tZWU1YcIEYeJiGPbgwYMrV64UFRWpqamNGTNm9uzZSkpKmHhVyWQyVVRUTExMbGxsnJ2dlZWVpdeGW1paUlNT8VeGDx+Of2NycjKbzYZ/WlhY9OvXD/xOSUlpbW2FQbq6uoMGDcIw7N69ezExMRUVFcbGxlOnTh09ejS8h81mR0REJCUl1dTUGBsbe3l52dnZ4d/O75mUy7m9vf3p06fAPhBcSUtLa2lpgTcYGRnxlhi+VdDp9AEDBri6ujo6Okpk3Nne3n716tXExMSysjINDY1Ro0Z5eXl1aaBIoV/wUllZmZubi79ia2srLy9fW1t78uTJjIwMJSWlYcOGff755yoqKvCe3NzcM2fO5OTkKCoqjh49eu7cufzapPAyENYLxMzMTE9Pr8vCoRyRQH19/fXr15OSkioqKpSUlIyMjFxdXceOHUuj0QSX4dOnT6Oiol6/fq2oqDho0KDZs2dT8NzOryKk1AvEkZYSSYxECo1yJ83JyamqqoJ/9uvXz8LCAv5ZVlZWWFgI/1RWVh4+fDhl0SEY4SU2KPaXL1+CP9++fYv/iFtbWysqKvJ7izQkM2Vx1A2JEbVUeROTlZV18eLFgoICNpttYGAwatQoW1tbuMAOUVBQsLGx4Tc0wjDM3t4ezU0guoCL6BucPHnS3NwcVLqcnJyJiQkUkTo6OqGhofwiBgUFgduCgoIIQYWFhRMnTgShampqJiYmcNygq6vr5+fX1tZGiFJQUDBt2jQYxdTUFHw8ZGVlV65cWV9f3xvyxeVygdmSvr4+aVyRckHa786cOYO/x8PDA8OwTz75BH8R/4EHWFpawtA//vgDjIxlZGQGDBgAc02j0ZycnO7evStKKXJzc3MnTZoEntCvXz8TExM6nY5hmLy8/Pr163nrkcvlVlRUeHt7g9vAuY6mpqawAcyYMaO8vFzAG4OCgnR0dECCBw4ciNf/LSwsfvvtNw6Hg78/JSUFhDIYjJaWFm9vb0LhGBoapqeni5RrLpebn58Pq1JVVdXExERO7t08oIKCwrx583ifSa0N87a3Fy9eELKQkpKCj0KwpouMjIRBJiYm+CBQJp999hnhgT4+PiwWi8vl5uXl4QeagDVr1uBfR/pMccoZf4oyKQEBAYQowcHBoFXIyMgYGhpC60FLS8sbN24I81IBxZ6ammpmZkZIg46OzoULFyTYL/hx4sQJwqsLCgpu3bqlrq6Ov6itrR0bGwui/Pjjj4QxnKGhYVZWlpgykLdehCwcyhHxBAYGampqgv5iYmICO761tXVSUhK/0quuruZt3hiG+fv7s9lsweJamIqQXi8QR1qKmRgJFhrlTjp37lz8q2fOnIkP3b9/Pz7U2tqasugQgKgSm1DsBF68eCHgXdKQzJTFkVQTI2apMhiMtra2xYsXE16noaGxfPly3mI3MTERMDTCMKy2tlZgK0AguEjj7SvMnDkTSMmwsLD29nZwMTc3Fx5TGRwcLJJmWF9fDwY6o0aNevr0KbjIZrOvX78+ePBgUhmUlpYGvo6GhoZ///03m80GwiskJAQsXNja2lZWVvZsvgACRgOi5iIoKOiXX34B7xo4cGBQJzk5OfCG2tpa8N2SkZF5+/YtvM5iscDNJiYmSkpKhw8fhnryoUOHgK64d+/ehoYGcPHt27dr1qwBL/Lz8xO+DFNSUsAIxszMDKrK9fX1AQEBYNVl0qRJsGzxscC7vL298/LywMXW1tbw8HCwyGxpaclkMknfCD9pX375ZWlpKUy/v78/NA1oaWkhfR2DwfDx8dHU1Fy9enVgYODWrVvhR3rw4MEiKSEpKSlANxg4cOCVK1dAVbJYrFu3bg0bNgw809/fXyJtmLe91dTUgPp1cHAg1XiPHTsWFBQ0depUXo33/PnzJ06c+PHHH2GZzJ8/X09Pb926dYGBgd9++y1cDV67di2TyTQ2NrawsNi6devvv/++ePFiOPI+ffo0fGZYWFhQUND333+PL2cdHZ3169eHhITs3r176NChIpVzU1MTIYPff/99EI5nz57h7//qq6/AbStWrCgrKwMXX7x44ebmBnrH0aNHha5bYrFv2bJFS0vL1dX177//LigoSE9P37VrF6gyGo1GmIESp1/wIycn50Qntra2IEnR0dEKCgqTJ0/es2fPr7/+6urqCq6rqamVlJTs379fVlZ2wYIF+/fv37FjB2yQVlZWhJeKKgNhvcAbhCwcyhEh8OTbNWvWVFdXg4vJycmgTBQVFa9fv85bdA0NDfb29iCii4tLTEwMeFdAQICamtqmTZtEUt6ys7NBLkaMGMGr8Uq8F4gjLcVJjGQLjXInvXnzZlBQ0M6dO0k13rS0NFAXBI1XVNEhAAoSm1DsDg4O+FfX1NQIeJ00JDNlcSS9xFAoVd7EMBgMeXn5hQsX/vbbb9u3bzc2NgYab2xsbFBQ0JgxY8CdPj4+QUFBYWFhvEMj4HF9x44dQUFBra2tQjYJRJ8Fabx9BTAqiomJ4Q3y9PQEBkV4datLzXDfvn3gOvx+Q3JycsDyI17jZTKZwIhFSUkpOzubEOXSpUvgaR4eHoTFvW7OF4DfaIByLsDQREZGhncu/+TJkyAWhmG8Y/qqqio5OblZs2bBK+3t7WBhZOHChbwpX7FihUgaL5PJBDMXKioq+fn5hNCff/4ZJGzbtm2kY7hx48aB6WE8T58+BYrrhg0beN944MAB8ExfX1/eUPhGfhqvqampubn5mzdvYFBzczMcvF6+fFnUjCspKfFO29fU1PTv35+g8YrThgW0NwaDQarxArZt28ar8RLKxMzMzMrKCj/CyM7OBuasKioqS5YsmTp1Kn5AcPHiRRDR3t6e3zNNTU0tLS0rKipgUEtLC7QrE76cu8wg4ODBg+CexYsXE4JaW1tHjRoFVg/i4+OFfy++2BUUFGbNmkWol4SEBLCkr6qq+vr1a4n0CyFFFqi1Q4cO4YN8fX1B0JIlS/r164e31GhtbYUKzNWrVyUrA0UtHGoRYcf/3//+x6+76ejo4JscYPXq1VBfIrwrOTlZSUkJvE5U5Q1WBF7jlVIvoCwtKSdGGoVGuZMWFBTAxJA+maDxiiQ6BCCOxMbPsYr6XolLZnHEkTQSI36pmpmZ6evrZ2ZmwqCSkhJlZWUNDQ3wZ1RUFLjz008/JS3kqqoqBQUFW1tb0lAEghek8fYVli1bNmbMGNKg+Ph4IFn++OMP3lB+I/XZs2cDIzowvUcALEzhNV44cOenjEG3mdHR0T2YL8EaL+VcwIi8r4OLeBiGubu7E0L//PNPDMPOnj0Lr2RlZYGbf/zxR94EJCcni6Txbt26FTyNdLzV1tYG5pWVlZUJK/ZZWVkmJiaki2NcLveTTz4B41fCN4/JZIINfvLy8qSGfC0tLcCal5/Gi2HYtWvXCLFCQkJA0Nq1a0XNOL+yAsMIvMYrThuWqsaLYdidO3f42RPKy8vDhXTIRx99BELr6ur4PfPWrVuEWEeOHBG1nIUZtnbZKm7fvg2eYGdnJ/x78cXO78lLly4FN6xcuVIi/UJ4RWvChAmEILyh++rVqwmhYWFhpIUvvgwUtXAoRIRVrKioCFd3SadQN23ahL9eXFwMTLvl5OSKiop4I3799dcgojQ0Xkn1AmrSknJipFFo4nTSntJ4xZHYEtF4JSWZxRFHEk+MREqVMKoBLF682NHREfxmsViGhobgzlevXvG+Zc+ePRiGHTlyhDQNCAQvyFdzXyEkJCQpKYk0CBqF8ruBFPBBZbFYMTExvKHBwcEpKSnQeQk0xMUwbM6cOaQPhOciwqWAHsmXAMTJxaxZs8CPiIgI/HUmk3njxg0vLy9gXnv79u2amhr8DREREYqKinitGG7tA4a4hATY2NikpKRs2LBByBwdPnwY/CZsuALQ6XR3d3fgquTcuXP4ICsrq4KCAtJYsPArKyvz8/Px10NDQ+vr6zEMc3JyInW2oaCg4OHhwXsgBERXVxfuZYKMHDkS/CD4pKGccQzDJk+erKGhAV3CSK8Ni4++vr6zszPhIvQ44uzsbGBgwC80Ly+P9Jl6enrQzpZyOQsJbBUTJ04kbRXOzs7A+PPp06fUurOrqyvpkxcsWADTAL2zitMvhGf+/PmEKxYWFrC98YbCKgPHhEpQBopUONQiwip2c3ODtpR4pk+fDn4cO3YMfz00NBRIuQkTJsARMJ7PP/8ckxqS6gXUpCXlxEij0Lqhk0qW3iCxJSKZJSWOJJUYiZRqv379eHcU//nnn3FxceC3rKzsl19+CX7DKTYImHdTU1ODOywQiC5BGm9fhMlk5ufnZ/8DnH/l9Y8nALjBZs6cObt27cL7YwQbI62treGezIyMDPBwGo3Gz/Uf/HLHxcW1t7f3VL4EIE4uhg4d+vHHH2MYdvfu3crKSng9Ojq6vb3dx8cHSH8Wi3X58mUYWlNTc+vWLQ8PD7z7VnNzc2DV/OjRIxcXl/v37+MTICsra21tLaQfy4yMDOAMU15eHlrHEYAbCOGniBcWi1VaWvry5UtY+A0NDaSFf+vWLUJB8RIeHl5bW8vPz7aNjQ2vT1dgEgmmojFRMk6j0eC+SgIjRoyora394YcfurMNU8Pa2pq3TLS0tMAP0pqFHoPAKFbIZ8IhkZDlLCSwVUDDXQIyMjKwmuBSkkjwqzJgignKIT09XbL9QjC8T6bRaFAbxHtlF7LKKMtAkQqHWkRYxfDDQcDc3Bx0+dLSUrziB4sX71G2y4YqKaTRC4SXlpQTI41C64ZOKll6g8SWiGSWlDiSVGIkUqq2trbQSSQ/li5dCub3jx8/jvfzDBpYTk7OwoUL8UMjBEIw6HSiPkRGRsa+fftiYmJKS0tJbyDIFMGsWLHi6NGjGRkZTU1NmzZt+uGHH9zc3Dw9PWfMmAHVD8jz58/BDz09PX6e/aErv+bm5oKCAuj+qpvzJQAxczFr1qwdO3ZwOJyoqKglS5aAi+fOnVNUVJwyZYq2tjaYyIyIiICmXFFRUSwWCxiQQ2RlZQMDA8EkfVxcnLOzs4mJiZeXl6enp6iHuEADaWVlZX7TsfA8koyMDEJQe3v70aNHT5069fTp07a2NmEKH5Yh5RMygPkWAVgdvIvelKuyO9uwmOA9XUOg3xHSEoN+YvmVmETKWUiEaRWwbDMzMym8gt9hQsrKynp6emAMl52dDYbsYvYL8WtNqRPhq0xMGShS4VCLCIs0IyPj999/J40lLy8P0pmRkQH9P8NDYng9QgMUFBTU1NQkOwUjjV5AQVpSTow0Cq0bOqlk6Q0SWyKSWVLiSCKJkVSpCnO6W//+/WfOnHnx4sXq6uqIiAhoOYJhGFhnXrlyZZcPQSAgSOPtKxw8eNDPz4/NZsvKyk6ePNnW1lZdXR1M+DU1NUEHesKjoKAQFxfn7+9/7NgxVifXOlm5cqWLi8uGDRuAmQ2guroa/FBVVeX3QPz5jVVVVUJ+eySeLwGImYs5c+bs2LED6LRA4wXnUk6dOlVFRcXJyUlHR6eysvLGjRtMJhOY9Z47d05BQQGeAQCZP3++hobG2rVrs7OzMQwrLCzc34ment7ixYvXr18PJ26FzFFtbe0333wj+Gb80jSGYeXl5e7u7uBEWWNjYw8PD0NDQ/j5vHz5cmJiIrUyFAz8BuMRcPgzKRSSIb02LD6kZSJkqFTLWRplSzAnERIBR3OrqqoC3QxuKBCnXwiPgHoRqcrEl4EiFQ61iLBIz3QifJHW1tbCB/K7X1FRUUoar6R6ATVpSTkx0ii0buikkqU3SGyJSGZJiSPJJkbMUhUgOvCsXLkSONA6dOgQ1HjfvHlz+fLl8ePHw5VtBEIYkMbbJ4iNjV21ahWGYZqamnfu3CFM1TOZTGqaoaamZnBw8I4dO86ePXvmzJmEhASwv+JOJwwG49ixY+B7DM1XBEyK44PgUKBH8sUPMXMxfPjwwYMHv3r1CmzW7devX3R0dFtbG9gMIysr6+XldeTIkfb29ujo6AULFtTW1gKTZvz3AzJ16tQpU6bExsaePn36woULYIRRUVEREBBw9OjRK1euQOf+AoApNDQ0vHLliuCbCavHPj4+YAC3dOnSw4cPEyyUSktLScdwwpRhN0AhGVJqw13C4XCwDx2RylZSBSvgyeL0i25G2jKQcrETIsLoO3fuxHslIGXgwIG9TWKICTVpSRlpFFrPdlIK9JTElji9Shx1c6l+8sknH330UU5OzoMHD9LS0sChDEeOHGGz2WiBFyEqSOPtE0A3mP7+/vx2LVJGV1d3VSfFxcVhYWF//PFHcXExhmEnT560trYGJ8RCgxkmk8nvOfggUgObbs4XL+LnYvbs2bt27QKbdRkMBljCheO/2bNnA8ebwIAnKiqqvb2dn3MIsJHGqZODBw/evn07JCQEzIZWVlZ6enrm5uaCk/GEyRGLxeLdNyiAtLS0u3fvgtPzAgMDu9yQg3/jmzdvJL4RVFRgxoVPhpTaMB7SMURzczP2oQNbhTBlS6FgwWpnl0+GlhGU+0X3IxEZKFLhUIsIq1hHR0ekItXS0gKm2gLaRmNjI9aLoSwtKSONQpNIJ+1OEdcNErt76FXiqJtLlUajrVixYt26dRiGHe6EzWaHhIRoa2tDb6AIhJAgz1V9ArjHA3qNxwPPBhATQ0NDf3//nJwcuO/0xIkTBE8GNZ2QRoeuJrW1tcFZ5L0kXxDxcwFL5ty5cw0NDdeuXZs8eTJcwnVxcQGjw+vXr9fX1587d45Op0MXpgKQk5Nzd3e/cOFCQkIC2FpTVlZ248YN4XNUXl4uYPAqoORHjhzJu+FQQOHDNxL8zXYzMBnV1dUCvtykUSTbhvGz5qRVUFJSgn3oCNMqYNlCr0giAabheKmqqoImoPBUZ8r9ovuRiAwUqXCoRYRFys83OD/ge1+9ekV6Q11dXS/XeClLS8pIo9DE6aQ9IuKkJ7G7mV4ljrq/VBctWgQsroG38Ojo6Ddv3vj6+gppF41AQJDG2yeA/jBILUyEHPET2Lx5M+/5GWB7BvSkD92oGBkZDRkyBPwGxs+8QB+DHh4eQrqRlEa+BCB+LmxsbMzNzTEMu3nzZmhoaGtrK94rlZycnKenJ8hXWFjYzZs3J02apK6uTnhIZmamp6dndHQ079vHjRsHT8Lk58OGkKOhQ4eCIZeA8ySmT59uYGDw66+/ClnyAgp/ypQp4IcAKz43NzdTU1M4XSIN8FXJLyVXr141NTUFB9xLrw0De1QB+sODBw+wDwV+I3vYKuD5sQRaWlrAQdPgzGoKr+bXvKGrc0NDQ3j4JOV+0f1IRAaKVDjUIkJLFn59B1hoGxgYmJqa4hf9wFm1+GcSePjwIda7oSwtKSONQhOnkwoWccJYdFOYFJCexO5mepU46v5S1dbWBsOkhoaGsLAw4LNq+fLlYj4W0QdBGm+fYNCgQeAH/CDhuXfvHoVnxsfHh4eHk37AVFRUwGYS/Bk5a9euBT+OHz/OG4XNZv/111+EO3skX4IRPxfAFKe9vX3jxo3y8vKEJVxow7xx40Z+Js2VlZVRUVGRkZGkz4caspAHFAF7IQzDjh49SnpDdnb2lStXKioq8A60YMmnpKTwGqpxOBx+ZyR4eXkBV5+PHz+GXh/xZGVl3b59u6ioyMXFBZMmsIJOnjxJesOJEycKCwvt7OzgN1sabRic1clvKBkTEyP4iM73Amhdjz+pYtq0aTY2No8ePcK3iqdPn6alpfE+ISIiAmhBnp6epKpXlzx48IDUfyycnluxYoX4/aL7kYgMFLVwKET09PQESU1ISAD+9khjlZeXOzg44BdC586dC2RaWloaaC0EQkJCsN4NZWlJGWkUmjidVEVFBezNfvXqFThoB8Llcg8ePEhZdAhGShK7++lV4qj7S/Wrr74CP3bv3n3z5s1PP/2U2lcA0cdBGm+fAB4IHhAQQFj6Ky0t3bx5M+Unb926lffihQsXwHcdr7AtWrTIzc0Nw7CLFy/yrk/u2rUL2Ept2LCB34lz3ZkvfoifC7ioy2QyeZdwXV1dwYGcTCZTTk5uxowZ/FISHh7+4sULwsXm5mZwnK+mpiac5hcMg8GYNGkSeOClS5cIoY2NjaASFy1aBBUzDMMmTpyor68P7KwCAgIIsXbv3s3PdlFWVvb48ePAn9mKFSsIh/W1t7cvXrwYwzBfX194woGUgFV57ty5mJgYQmh0dPT58+cVFRW/++47qbZhDMNA+QMdGxpAgvGxr68vqbXq+wWwa8CbL9bX19+8eTM1NRWMgwmtgnBGS2lp6caNG8HuRH6Hc3SJgYHBwoULoakt4MCBA+CUUVNTU+BxQMx+0f1IRAaKWjgUIsrKyp44cUJGRobL5fr6+vJu3QwNDT1z5oyiouL27dvx11VVVaGEWbRoEcEJ8KlTp27cuNGlw4KehbK0pIw0Ck3MTjp58mSg365bt47FYoGL7e3tq1evFuAluEvRIRgpSezup1eJo+4v1XHjxgG3zK9fv0aHEiGow0X0AVpbW8eOHQtqXFNTc9euXTdu3EhISNizZ4++vr6HhwcI0tfXZ3Ty4sULJpMJfjs4OIBQBwcHcKWpqYnL5To5OYHrs2fPvnnzZnFx8Zs3bx49euTv7w/2Vzg6Ora0tOCTUV1dPX78eGC++/3336elpZWVlSUlJcHjZ319fdvb23swXydPngS/wW5YRUVF8Ofp06clmAt4nuGpU6d4QxctWgRCPTw8SKPDdRt9ff0DBw5kZmZWVFRkZ2dHRESA3VNycnKXLl0SvhhramomTpwIxjSrVq1KSkoqLS1NS0s7cuQIUDsdHR0bGhoIsaKiouDip4eHx+nTpx88eBAZGent7a2mpgaKCJi3MRiMgIAAfNzQ0FBg4Gdvbx8VFVVUVPTy5cuIiIjhw4eDi3V1dfDmvXv3MhgMuBhubm6Ob4eRkZEMBsPHx4e3rrvMOKxKOp2+adOmtLS00tLSBw8efPvtt3Q6XUZGJjQ0lF8UIWu/y34E8PX1BaGysrJOTk4+Pj7jx4+n0WjLly/ftm0bCHJxcWEwGEuXLu2yTLZs2cJgMGAVjBo1isFgrF27FrwL3AkHRqCCfvrpJ+mVc3Z2Nmgqjo6OWVlZOTk54JwJFxcX0lZhZ2cXFRVVXFycn59//PhxMLTV0dF5+PBhl+/iV+z79u0bNmxY//79N2/eHB4eHhISAu1sNTU1nz17Jql+wY/c3FyQJCMjI/Beb29vKFuePn0KQlVUVECDBH/Gx8cLKPz09HQKMhAmCRwATqFwKEc8c+YMUG+srKxCQ0Pz8vKKi4vv3bv3xRdf0Gg0Op0eERHBW3QcDgdMhAEde8uWLeHh4cHBwWBCMCwsDOiTUFyfPHlSQEXEx8eTVsRPP/0kPWlDTVqKkxjJFpr4nfTly5dw46WhoaG3t/dnn32mr6+voaEBjX369esHEnP16lWRRIcAKHyv165dS1rsDAYjNzdX8OukIZkpiyPpJYZCqfJLDHyjYKAhQP/+/UUaJSIQEKTx9hXq6+uXL19O2EekoqKyc+dO3gPc7t27V1ZWhvGhtraWy+WmpqZ+9dVXpPOsWlpaW7ZsaW5u5k1GS0vLL7/8wnsSurm5eVhYWI/ni9/mED8/PwnmAlgo0en0mpoa3tCrV6+Cpx07dow0elNT059//uns7Ezq83PixInCKwaQ1tbWPXv28LpV1NbW3r59O2HmAnLz5k0LCwtClPHjx6elpfn5+eEvOjk5EeI+e/bs008/JcRVVFT8+uuvCZ9tfvs2QTuECiGBe/fuCZNxflU5fPjwO3fuiBSFtPa77Efwmb6+vvgtTwoKChs3buRwOIQMKigodFkmpP48TUxMwLtII44ZM0aq5XzgwAHCSo61tfXr16+FaRV0On3hwoVFRUXCvIhfsQcFBdXU1MyaNYuwr8zZ2Tk7O1uy/YIUfhvwgGzht0nhxIkTAgr/2rVrFGQgr+IqauFQjsjlclNSUtzd3Xl39zk7OycnJ/MrPTabvX//foJFzIABA8DUHlDeIMuXLxdQEfwcBIwZM0aq0oaCtBQzMRIsNIl00tu3b8NZBsDw4cPT0tJ4hRJ+hlRI0SEAUb/XAsyLkpKSBL9LGpKZsjiSamJELVV+iYFvFExdXR2YDdy6dasw9yMQvNAk7iQQ0Zuprq5OTEwsKSmh0+nGxsaOjo5gMVMc8vLywDJjS0uLurq6paWlra2t4EPYOBzO48ePc3NzmUymtrb20E56W766ROK5EJXGxsb09PScnJy6ujo6nW5gYGBnZyeMrRc/OBxOcnJyTk5OTU2NmpqapaWlnZ2d4KoEQ9j09PSGhgYtLa1Ro0ZBOzRhqKioSEpKKisro9FoJiYmDg4OvJ66ugFYlbW1tZqamjY2NtA5R3fWfnFxcWJiYlVVVf/+/ceOHUsYkr7vVFZWxsXFlZWVycvLDxkyxMHBgZ9TE9gq6HT6gAEDxo8fr6qqKqlklJSUPH78uKysTFNTc+TIkYMHD5ZGv+h+KMjA4OBgsM82KCgITPYJWTiUI0Levn0LqhioXvb29sIIrtbW1vv37xcWFioqKpqZmY0bNw4Y2b4viCktqSGlQqPWSdvb2x88eACsXj/++ONx48ZJVnT05u+1pOhV4qg7S9XW1jYtLa2wsNDQ0FBKr0B82CCNF4FAIBCIPgev4irtiAgEAkGBzMzMYcOGzZgxIyoqqqfTgnhfeZ/mRxEIBAKBQCAQCETfAXgXh06bEQgKII0XgUAgEAgEAoFA9DxRUVGLFy/mcDjgTyaTeeLECTMzM3iuAQJBAaTxIhAIBALRV+BwOIWdwENrqqqqwBXBu5woR0QgEAjhSUlJOX78+M2bN8Gf3333XV1d3bp16yjs30YgIGgfLwKBQCAQfYXy8nIDAwPSoNraWg0NDYlHRCAQCOHZvn37tm3b5OXlHR0dy8rKsrKyHBwc4uLiSM+nQCCEBLUeBAKBQCD6CqqqqvwOthHs3plyRAQCgRAeR0fH6dOnP3/+PD093cDA4Lvvvtu4cSNSdxFigtZ4EQgEAoFAIBAIBALxYYL28SIQCAQCgUAgEAgE4sMEabwIBAKBQCAQCAQCgfgwQRovAoFAIBAIBAKBQCA+TJDGi0AgEAgEAoFAIBCIDxOk8SIQCAQCgUAgEAgE4sMEabwIBAKBQCAQCAQCgfgwQcdbIURm3rx5ZWVl8E8PDw9/f/8eTVEfpbGxcerUqfgra9eunT59uvTeePDgwYiICPinlpbWxYsXMelz/fr13bt346+cPXtWX1+/G179AdD97aQvgNpkr22oz549O3fuXGZmZnNzs66urqmpqZubm6Ojo7y8PPa+sW/fvqioKFKRKyDofRTyHxI1NTVeXl74K0jkIhA9DtJ4ESJT3ElbW1tpaSmGYaampj2doj4Kh8MpKCjAMKy+vr66uhrDMB8fH6m+sbq6GryxqKiIw+F02/i+oaEBvLeioqK5uRnDsJaWlu559QdA97cTwZw6dcrPz+/jjz++evWqlpYW9n6C2mTvbKh+fn6BgYEYhunp6ZmYmKSkpFRWVu7evXv//v1+fn7Y+0ZlZSU/kSsg6H0U8h8SbDa7V4lcBAKBrJoRVIiPjy8oKIiJienphPR11NTUCjrZtWtX97xxy5Yt4I26urqSfXJ2dvb9ThobG3lDvb29wXsnTZok2ff2Bbq/nQhmw4YNtbW1SUlJf/31F9aLQW3yvWuoQUFBQN3dvXt3eXn5o0eP3rx588UXX2DvLTt37uQncgUEvY9CXnq0traC92ZmZnbPG3V0dHqVyEUgEEjjRSAQvYLdu3c7d5KTk9PTaUFIl6FDh4IfVlZWWC8Gtcn3jr1792IYZmxsvHHjRnCFTqf/8MMPPZ0uRE92qLKyMvDeTZs2ded7EQhErwJZNSMQCASi+4iMjDx9+vTgwYNdXV17Oi2ID4e3b98CVcra2hp/fdCgQWVlZWpqaj2XNAQCgUD0MEjjRSAQCET3oaamtnz58p5OBeJDo6KiAvzQ0NAgBKHNqAgEAtHHQVbNCAQCgUAg3m9YLBb4ISsr29NpQSAQCETvAq3xfvg8fPiQ9+JHH32kra0N/ywuLi4pKRkwYICRkRG8yOVyHz16hI+lqKhIMBjD8+DBgytXrhQVFampqY0ZM2b27NlKSkr8bq6vr79+/XpSUlJFRYWSkpKRkZGrq+vYsWNpNBrhzsrKytzcXPwVW1tbeXn5urq6sLCw9PT0pqYmMzMzT09PAWmT0jOFzwWBtLS0a9eu5eXlNTU1aWtr29raTp48WU9PT3Cs+vr6S5cuPX78mMlkGhgYjBs3burUqXQ6vcv8Uk7n06dPo6KiXr9+raioOGjQoNmzZ0vWNXd7e/vTp0+BRSK4kpaWhvd5a2RkNGDAAH7RBddXS0tLamoq/v7hw4crKyvDP5OTk9lsNvzTwsKiX79+vK+Ijo5+8uRJZWWljIxM//79bWxsXF1dhXfrkpKS0traCv/U1dUdNGgQhmFZWVkXL14sKChgs9kGBgajRo367LPPJFJxwrcTiRQRhmFNTU23bt1KSEgoLy/HMExbW9vKymrChAmWlpbCFIWkuiS/jFdUVOTn5+PvtLOz49dxpNomJdg3+7JAIwDa1cuXL8Gfb9++xX/1rK2tFRUV8fe/ePEiJiYmJyenrq5OW1t72LBhU6ZM4a1TfqXa0tJy/vz5Z8+eVVRUqKmpWVpazpw5U3jBmJWVFRcXl5WVVV1dTafT9fX1HRwcJk+erKCggPUEFIR8Q0PDvXv3nj17VlhY2NLSoq6ubmVlNWnSJEJ/p9yhJFVE+fn5FRUV4FAJ4IYa3zBoNNro0aN5YwnZPCjQ3t5+9erVxMTEsrIyDQ2NUaNGeXl5dWlvLxERgUAgOrQaxIcNab2fOXMGf4+HhweGYZ988gn+Iu9hG5aWljA0JSUFXGQwGC0tLd7e3oSbDQ0N09PTSZMUGBioqakJJuNNTEyg7m1tbZ2UlES4+cSJE4QnFxQU3Lp1i9d0zc/PT8gykcgzRcoFJDc3Fzp37devn4mJCRjhycvLr1+/vq2tjV/ECxcu6OjoEJJnbm6elpYWFBQE/gwKCpJUOqurq3kVMAzD/P392Ww2sBLU19fnigf+YGdSAgIC8PfPnDlT+Pp68eIFITQlJQX/NEL0yMhIQvL++OMPFRWVDmMYGZkBAwbAETyNRnNycrp7964weTQxMcG/hcFgtLW1LV68mJA2DQ0NiVScSO1E/CLicrlBQUHgjTQabeDAgfipNAsLi99++43D4fArCgl2SWEyDikrK+uRNimRKu7jAo0XQrsi8OLFC3hnQUHBtGnTwHU1NTVTU1OgDMvKyq5cubK+vr7LUk1MTOS1kd6/f78w6Tx58qS5uTmIIicnZ2JiAkWKjo5OaGiogLgCRC5laUxByFdUVHh7e8NZCS0tLVNTU3jQ8YwZM8rLy8XpUOIUES+Cd08oKCgQ7hepeQgDviWnpqaamZkR0qCjo3PhwgUBT5CUiEAgEEjj/fAJCgr65ZdfgJQcOHBgUCc5OTnwhtraWvABk5GRefv2LbzOYrHAzSYmJkpKSocPH8bryXiN18fHR1NTc/Xq1YGBgVu3brWwsABBgwcP5h3xLFu2DISuWbOmuroaXExOTra1tQXLyNevX8ffn52dDZIxYsQIEPHy5cvy8vKTJk3av39/UFDQkiVL5OTeWSucPHlSmDIR/5mi5gIWGhjkmZmZQX2pvr4+ICAAzNdOmjSpvb2dN2J4eDi4QUVFJSAgICMjAxwQ9cknn2hra2/ZsgV+ViWSzoaGBnt7exDRxcUlJiamoKAgPT09ICBATU1t06ZNktJ4m5qaQEU4ODiA133//fdBOJ49e0aqXYD6mjhxYkBAwP79+xcsWABNGWF91dTUEB5OUOeOHTsWFBQ0depUUnXu0KFDQIvbu3dvQ0MDuPj27ds1a9aINMNy/vz5EydO/Pjjj7C/MBgMeXn5hQsX/vbbb9u3bzc2NubVeKlVnKjtRMwiwo8pv/zyy9LSUlhK/v7+MjLvds20tLSA62FhYUFBQd9//z0sCkl1SSEz7uPjA97S1NTUI21S/Cru4wKNFEK7cnBwwNdXTU0NuC0tLQ0ILkNDw7///pvNZoOJ3ZCQEGDXYGtrW1lZCR+bk5NzohNQCBiG/f3334qKikOHDt28efO+ffvgIatCarygqfTr1y8sLAwWS25uLnxOcHBwt2m81IQ8/O57e3vn5eWBi62treHh4cDsxdLSkslkUu5Q4hQRL7GxsUFBQTt37gRxR4wYgX/vkSNH8DeL2jxE0ni3bNmipaXl6ur6999/g3LetWsXeCyNRiOsQEhDRCAQCKTx9hXAiSAyMjK8U7AnT54EUhXDsKNHjxJCq6qq5OTkZs2aRbgOv3ympqbm5uZv3ryBQc3NzfiBFz7WgQMHwPX//e9/hAfW1NT0798fzHpWVFTwZgGOLM3MzAIDA/FBZ8+eBUG2trailArFZ1LLBZPJBFO8Kioq+fn5hIg///wzeOa2bdsIQYWFhaqqquCkDcK0LofDmTVrFrT1IgwQKZf26tWrQcSZM2fCBTpAcnKykpISGD2Lr/FCGAwGqcYloL5++eUXfNDp06f51Zfgh2/bto1XnWtvbwez6QsXLuSNsmLFCpFsCvD9xczMTF9fPzMzEwaVlJQoKyvjNV5qFUe5nVArInw6fX19eWPBJg01XkJR4DVecbqkOBnvqTYpjiTsswJNMILbFZPJBCb0SkpK2dnZhNBLly6BuB4eHgSJhy/VQYMGff3110AXAnzzzTeiarwxMTG8QZ6enhiGKSsr4yedparxUhPyoJDHjRvHYrEID3z69CmY5NqwYQPlDiVOEfGjoKAA5pTfPeI0D2E0XgUFhVmzZhHiJiQkgEJWVVV9/fp194gIBKLPgjTevgIcs/KOIeACDoZh7u7uhNA///wTw7CzZ8/yG15gGHbt2jVCaEhICAhau3YtvMhkMsGWFUVFRThhiWffvn0g1qZNm3hD4bBj/PjxvKEDBw4EoXV1dV0VhljPpJyLrVu3guukA4K2tjawWqKsrFxbW8urX2EYtnz5ct6I5eXl0MYMX7mU01lcXAzWpuTk5IqKingjfv311yBiD2q8Dg4OvKFwqxWhDVBQ57KyssDFH3/8kTdKcnIyZY2XtDctXrzY0dFRzIqj1k4oFxFMp7y8PO88GlgeAVa11DRe4bukOBnvkTYppiTsmwKtSwS3K9iG+XVbR0dHcEN0dDS/Uh06dChB03v8+LG1tXVYWJgwKVy2bNmYMWNIg+Lj48Er/vjjj27QeCkL+aysLBMTE35rkp988glQw0jVQmE6lDhFJI7GK07zEEbj5Sckly5dCm5YuXIl/rr0RAQC0WdBvpr7CrNmzQI/IiIi8NeZTOaNGze8vLzAbpnbt2/X1NTgb4iIiFBUVMRrxQR0dXXhPi7IyJEjwQ+854/Q0ND6+noMw9zc3Ej930yfPh38OHbsmIC8fP7557wX7ezswA+CixohEf6Z1HLB5XIPHz4Mfs+dO5c3Fp1Od3d3B06Azp07B6+zWKzQ0FABidTT0wPjDAKUSzs0NBQ4K5owYYKhoSFvRNJkdDMLFy6UeBvAA+1Rr1y5gnfdBLCxsUlJSdmwYQOFJ/fr149379yff/4ZFxcnTsVRbieUgel0cnIi9VGkoKDg4eHBu5VUsl2y+zMufpuUlCTsUwJNHOAmBQzD5syZQ3rPvHnzwA+4tsbLkiVLCI6g7e3tU1JS5s+fL0wyQkJCkpKSSIPgViB+N0gWykLeysqqoKCAtMZhLiorKylL4B4pIkk1DwG4urqSCskFCxaAH6GhodDZePeICASir4E03r7C0KFDP/74YwzD7t69W1lZCa9HR0e3t7f7+PiAUTiLxbp8+TIMrampuXXrloeHB/DfQ4qNjQ2vz0BgcgMWE+DFW7dugR9wPw8Bc3NzYM9WWloq4JNpY2PDe9HAwID3jcIj/DOp5SIjIwN4qpSXlyd9F4Zhw4YNAz+g8oNhWGpqakNDA/gNt10RgNvM8FAubfh2Uj+WwGdGj3uJJM0yaaujhrm5ObBqfvTokYuLy/379/GhsrKy1tbW1Lx32trawh2VpFCrOMrthDIwnXB6i5fw8PDa2lpqTmiF7JLdn3Hx26SkJGGfEmjikJGRAU7rpdFoUO0nAJtxXFxce3s76T2jRo2SVJKYTGZ+fn72P8B1SHiqsFSRiJBnsVilpaUvX76EuYA1K5FcdFsRSap5CIDfY2GLqq+vT09P704RgUD0NdDpRH2IWbNm7dixg8PhREVFLVmyBFw8d+6coqLilClTtLW1gQVOREQEtD6KiopisVizZ88W8Fhef5vAFAf8wK+PQUvRjIyM33//nfRp8vLy4PySjIwMXseGor5ReKSdCxhLWVmZ3yQxOMIBxIIX4ZEb+vr6/E57Ip08plza8I38yl9BQUFNTU18rVIcpNEG8MjKygYGBoKFjri4OGdnZxMTEy8vL09PT0dHR3EO/OzyyBZqFUe5nVDm+fPn4IdkD6wStYq7P+O9RxL2KYEmkbaqp6dHOKkIAh0+Nzc3FxQUDB48WBoJy8jI2LdvX0xMDDwyhwD++C7pIY6Qb29vP3r06KlTp54+fdrW1ibxXHR/EUmqeQiAX8tRVlbW09MD+nZ2djac6+kGEYFA9DWQxtuHmDNnzo4dO4BOCzRecM7b1KlTVVRUnJycdHR0Kisrb9y4wWQygS3iuXPnFBQUoL9+UuDJBHigm1Y81dXV4MeZTgSnFr8QTfmNwiPtXMBYtbW1wNmJMLHA/eAH8PVCCulHmnJpC/nGntV4pdEGCMyfP19DQ2Pt2rXZ2dkYhhUWFu7vRE9Pb/HixevXr9fS0qLw2C4XPKlVHOV2QhmYTgFv7IYq7v6M9x5J2KcEmrTbKv5Y1KqqKlKVRswjcw8ePOjn58dms2VlZSdPnmxra6uurg6WUpuamqA7926AspAvLy93d3cHh3gbGxt7eHgYGhrCfdeXL19OTEx874pIUs1DAAJajqqqKtB48RvKukFEIBB9DaTx9iGGDx8+ePDgV69egc26/fr1i46ObmtrAxtXZGVlvby8jhw50t7eHh0dvWDBgtraWmDS3OUJ6UICv4s7d+4UsDEYAJ2s9Dao5QLGMjQ0vHLliuBY+CVEaAEr6rol5dKm/Mb3FA6Hwy9o6tSpU6ZMiY2NPX369IULF6qqqoBNXUBAwNGjR69cuTJmzBiJp4daxUm11kiLqJe0k16SjPdXEr4vAk0chHkpPgjmToLExsauWrUKwzBNTc07d+4QLLeZTGZ3aryUa8HHxweou0uXLj18+DBhg0Zpaak4Gm9PFVHPNg/4ZPxje5WIQCA+DJDG27eYPXv2rl27wGZdBoMBlnChPJ09e/aRI0fAIvCCBQuioqLa29v5OXKggI6Ozps3b8APa2tr7P2EWi6gkSGLxRIp73Ahkclk8runsbFRUukEbwTmZKK+sfdDOqBpbm4WEIVGozl1cvDgwdu3b4eEhFy8eBFMq3t6eubm5oIzFSUItYqj3E4oFxFMZ8+u9ksq491Jr5KE74tAEweYWgEvxQeR2oSLCXSu6+/v3z0byyUu5NPS0u7evQsODw8MDBTsj+A9KqJuaB5NTU1dPhlvNNSrRAQC8WGAPFf1LeCO3HPnzjU0NFy7dm3y5MlwCdfFxQXI3OvXr9fX1587d45Op0OXgOIDfT/k5eVh7y3UcgFjlZeXC/j48QJPNq6pqYGWTgRKSkoklU78G1+9ekV6Q11dXW9TIQQDR2akJU9aeqQPcXd3v3DhQkJCArC6LCsru3HjhqQTS7HiKLcTykUE05mTk4P1HGJmvEfoVZLwfRFo4gBTW9MJ6T3wWAFtbW1jY2PJJgC/qxmec4On46zIboSakIdZGDlyJOkebDFz0VNF1A3No7i4mPR6VVUVtDCHldLbRAQC8WGANN6+hY2Njbm5OYZhN2/eDA0NbW1txXulkpOTA4e8t7a2hoWF3bx5c9KkSerq6pJ6O1xMTkhI4HdPbGysgYGBqamp4JW3HoRaLoyMjIYOHQo+2wIOV5g+fbqBgcGvv/4KrwwePBieHhEbG0sai/SBlEsbHg1CcFAMefjwISY1pDGs0dTUFDDsePDgAe/FzMxMT0/P6Oho3qBx48bBQxT5+VYRB2oVR7mdUC6iKVOmgB8C7Bjd3NxMTU1PnDiBSQ0xM94jbbJXScL3RaCJg5GR0ZAhQwRnE7ov9vDwkIYveuhvidQmVsDqojSgJuQFZ0H4XPDrUNIuIn7v7Ybmwa9Jw/I3NDT86KOPeqeIQCA+DJDG20cP5m1vb9+4caO8vDxhCRfaMG/cuFGyJs0Yhnl6eg4aNAgIceANiJfDhw+Xl5c7ODjwc+PZ41DOxbp168CPo0ePksbKzs6+cuVKRUUFwVXY8uXLwY/g4GDeWJmZmaQKCeV0zp07F0xzpKWlPXr0iDdWSEiIAEO4nzsBfr+FB9oG4w9+mDZtmo2NDWkaRMLKygr8iI+PJwTFxMSQHu1QWVkZFRUVGRlJ+kA4DUTtgCLBUK44au2EchF5eXkBL82PHz+Gzk7xZGVl3b59u6ioyMXFBZMm4mS8R9pkr5KE74tAE5O1a9eCH8ePH+cNZbPZf/31F+FOyQIKGcOw5ORk3tB79+5h3Qg1IQ+zkJKSwrv9gcPh4I+hotChpFREpO+9evWqjY2Nr69v9zSPBw8eZGZm8l6Hh1qvWLGi14oIBOIDgYvoY+C/JdOmTSOEtrW1wePO5eTkampq+D0nJSUF3MZgMHhDoaGOk5MT/npsbCzwFzp27NimpiZCLPBRUVRUfPHiBe8zZ86cCZ5ZUFDAG+rn5wdC792711UZiPtMarngcDiTJk0CD7x48SIhVkNDAzBq8vX15Q2CB8AcPnwYH1RTU2NrawuP2QwKChI/nVwu99ChQ+CBVlZWlZWV+KCTJ0+qq6uDMYS+vj4hIjTBcnR05IrCnj17QMRLly6BK3V1dcDfbHFxsZj19fr1a3BdRUXlyZMn8PqzZ8/09fWhBV1kZCQMAqMrJSWl58+fE97S1NQEDhrV1NSsr68XMoOC+wsBahVHuZ1QKyIul3v37l2QzokTJ7a1teGD2tragFuvJUuWiFQUFKpYnIz3VJsURxL2WYEmGMHtis1mu7m5gRsuX75MCIUukTZs2CBqqQoJPGPG0NDwzZs3+KA3b97AdW/CFxOir69PKnIFBwmAgpBvaWkB78IwbMeOHYQHgpMgBHyFu+xQYhYRPzgcDnDCPGLECHjxu+++w0sncZqHAODMr4GBga2tLWFAFRgYCEJNTU0bGxsJcaUkIhCIPgvSePsicLRx6tQp3tBFixaBUA8PD9Loe/fuZTAYcHHY3Nyc0QkQypGRkQwGw8fHB4Tq6+uDUCiXz5w5Az5yVlZWoaGheXl5xcXF9+7d++KLL2g0Gp1Oj4iIwL8uNzcXPMHIyAg809vbm8FgnD59GtwAQuEilbu7O4PBCAgIEFAC4j9T1FwAampqJk6cCJyXrlq1KikpqbS0NC0t7ciRI+C4P0dHx4aGBt6IKSkpcCZi2rRpISEh4eHhW7Zs6d+///Dhw6HDDwcHB5ByJpMpTjo5HM7ixYvhp3rLli3h4eHBwcEzZszAMCwsLAyMexQVFcHrTp48CSLCxRneYa5gsrOzgamYo6NjVlZWTk7OggULwN5yidQXnMuXlZV1cnLy8fEZP348jUZbvnz5tm3bQJCLiwuDwVi6dCnUeEEDPnDgQGZmZkVFRXZ2dkRExKhRo8B8EBy3CYZff1m7dq2AWNQqjnI7oVBEgNDQUGCCaG9vHxUVVVRU9PLly4iIiOHDh4OLdXV18Oa1a9eSFkV6erqYVSxkxkXSoKTdJqlVcR8XaKTwa1cMBiM3NxfeVl1dPX78eNB5v//++7S0tLKysqSkJHj+vK+vb3t7e5elymAw4uPjuSLS2to6duxY8BxNTc1du3bduHEjISFhz549+vr6Hh4epF/MkydPgj+B7wAock+fPi0gSJj0UBPyUVFR0KbXw8Pj9OnTDx48iIyM9Pb2VlNTA8XL7yssuENRLiJhACerYxh28uTJ4uLi6Oho0Pzu379PuXkIgMlkghQ6ODiAuPv27Rs2bFj//v03b94cHh4eEhIC7ZY1NTWfPXtG+hwJiggEAoE03r4IsEaj0+mkS7hXr14FgvjYsWOk0d3d3TEyamtruVwuHBwTwE/6pqSkuLu7826GcXZ2Tk5OJryO3wYYPz8/cANpqOBpYIk8U6RcQFpbW/fs2cPr7FFbW3v79u0tLS38Ir58+ZJgHSojIzNnzpza2lpeE+KysjIx08lms/fv30/YxT1gwACg5sGZfsDy5ctBLDhJz7vm0yUHDhwgHCJqbW39+vVridRXS0uLr68vvhAUFBQ2btzI4XAILVZBQQEs5P7555/Ozs6k/kgnTpz48OFDIfPFr7+YmJgIjkit4ii3E1GLCPLs2bNPP/2U8GRFRcWvv/6aoO0ALYiXa9euiV/FAjIOTQeDg4O5vaZNUq7iPi7QeOHXrsD+SfydLS0tv/zyi7a2NuE2c3PzsLAwIUsVw7ATJ05wRae+vn758uWETaoqKio7d+7kPVIVfDGhBTgBPz8/AUFCpoeakL9586aFhQXhpePHj09LS4NGBPy+wgI6FOUiEobS0lI7Ozt8XDqdvmfPHsJtIjUPAZSVlRGeEBQUVFNTM2vWLEL/cnZ2zs7OFvAoSYkIBAJB62YPgQgE5O3bt0lJSWAoo6+vb29v/z4eK0ctFxwOJzk5OScnp6amRk1NzdLS0s7OTphT/l69evXkyZPa2loDA4PRo0cLv4+UWjpbW1vv379fWFioqKhoZmY2btw4YGfFjzFjxjx69MjQ0LCgoAB/CKeQVFZWxsXFlZWVycvLDxkyxMHBQbIuZIqLixMTE6uqqvr37z927FjCkI6UxsbG9PT0nJycuro6Op1uYGBgZ2fXnQ2VWsVRbicUighQUVEB0kmj0UxMTBwcHCTo9E54SDO+d+9eMM135syZuXPn9qo22dsk4fsi0MSBw+E8fvw4NzeXyWRqa2sP7QTrLqqrqxMTE0tKSuh0urGxsaOjI1ik7SlEFfJgN1xKSkp6enpDQ4OWltaoUaOAR0xJdShpFBGXy338+HFmZmZzc7Oent7EiRP19PS6v3mUlJQ8fvy4rKxMU1Nz5MiRgwcPfu9EBALxnoI0XgQCIRmOHTu2ZMkSDMNOnz4NzdoRiB7nm2++AdYHiYmJ0GwSgUAgEAhEHwH5akYgEBLgwoULK1euBF6+kbqL6GbWrVsHLep5AQ6olZWV4SmXCAQCgUAg+g4kW9QQCARCVN6+fUuj0QIDA1evXt3TaUH0Oc6fP19dXb106VIVFRVCUHx8/JMnTzAMW7ZsGWEPIQKBQCAQiL4AsmpGIBCSoaqqitfnBwLRDZiamhYWFk6ZMiU0NBQ6AcYw7OHDh15eXqWlpYMHD378+LGGhkaPJhOBQCAQCEQPgDReBAKBQLzf2NjYpKamAtNlJycnQ0NDFouVlpYGVnfHjRt37tw55OsFgUAgEIi+CdJ4EQgEAvF+w2az7969e+vWrWfPnuXl5dXV1cnIyOjq6trb23t7e8OjLxEIBAKBQPRBkMaLQCAQCAQCgUAgEIgPE+SrGYFAIBAIBAKBQCAQHyZI40UgEAgEAoFAIBAIxIcJ0ngRCAQCgUAgEAgEAvFhgs7jRSAQCARfuJxWbutbjNvW0wlBIBAIBKIDmowSpmBAo9F6OiGI9wak8SIQCASCHHb5VVbpRRqnuacTgkAgEAgEDnldOSNfGQ2bnk4H4v0A+Wr+8Nm3b19UVBT8U0tL6+LFi1iv5ODBgxEREd2W1MbGRsKxJWvXrp0+fTrWJ6mpqfHy8sJf6cul0YP0nopgvT7GqbwlaqyaurY56+LwV75Z8PHUie/Owg0My46+XwyD+qnLn9szAXvfCDr36sKt1+97Lt4vrsaW7A99gWHYFzMGLZxmJtln4psooYr3rhs5wkJTIq9DvI+kZNecv/E6K4/Z3MrW7adg0l/lkzEG42x05eloV2AHjc0sT7/7+Cu8vUl6cDGanPFSWR2X7nkd4r0GrfF++FRWVhYUFGAYVlRUxOFw9PX1sd5KdXV1dyaVw+GA19XX11dXV2MY5uPjI6V3MZnM6dOnp6am7tmzZ9myZVjvg81md1tpIHp/RbArrhPU3ed5zC+3P8QwzM2h/w8rh/ONyOEWvGnEMKyhsb26rsMWeo67CQytrG0FocXlTRwOV09LEXsPqa77EHIhDsyG9s++uZ/2sjZgje0SL/NueOObt82xTyowDHOy15f4M/FNFPDqdT0Iqq1H9vx9l29/fXLwzEsMw3S1FE36K6dl11TWtv5yPGvvOrtVPpY9nbpeAYcrSOB3SeiV/LV7nlqaqkcGOmmpy4v6dhrGZb3+k6ZkKKMyWNS4iL4GmqP68Nm5c2dBJ7q6uljvZsuWLd2ZVDU1NfC6Xbt2SftdZ86ciYuLq6urW79+PdYr0dHR6bI0srOz73fS2NjxhUP0VEVIG25bFevNWcLFPy/lPsqoepRRFXj6RWMzi19cHU2FV1dmvLoy48dV1ryhP/5vBAjV0VTA3lu+XzpMSrl4WVgX+6Qi9kmFgBLuDZy7Xhj/7G1dY/t3+5/1dFoQCKkQcj4HqLs7VlsX3/RKOOVecN1zgYTsCz4Y1JTpAgR+l3z3e0ptfdvD9MrTV/OpJYCGcdoLgrlcDrXoiL4D0ngRiO5gyJAh4IeVlRX23rJ7927nTnJycno6LQgpwi6PpnFa8FfaWZzwvztWnjvm8ptYF28X9VDSPnB+OZb16Ze3P/3ydm5RA9aLsRqkAX58bPbuBwLxgQEs3o0MlNcvevf5psvJbP5yWE+n64NiiLkEJAmt9Q2nOkFyiUJ8mCCrZgSiO5gwYUJcXFx6evq8efN6Oi0IhCC4rHp25T2CB8yrsSWVta3wzxORuZLaS4l4H3G01b3zp1tGTu2cSSJYMPZlquvatv6RimHYl7MGo43BvZ+3Na25RfUYho2w6Ie/bjZQteiml6oyveeS9kFx/rcJZ2IKBxurOY8Sa7cCu+KqrDZypoAQBNJ4EYhuwrGTnk4FAtEFnJokGs9ZRMciczt2tX1h9dup5xiGxT97m/O6/iNjtR5KI6LnGW+jO96mt++U6T00NLYfudBhGuM+rj/SeHs/b6vfGbloqBKV2z64b196qCnTl3l/JIEHNb/mNLySUUW7eRF8QRovAoFAIP6FU/OAcKX0bfPNB2VDzTW2fzXiRGQucE9yIipvx2oqG7cQCInDYnOrme9sEPqpy9PliDu2mlvZt5PKwKrdYBM1N4f+IvnabWphX094k1/SoCAv+7GZupO9vpwsOgj0Q4bFfneOiawMquj3A05tMtJ4EQJAGi/iP7x48SImJiYnJ6eurk5bW3vYsGFTpkwZMGCAgChZWVlxcXFZWVnV1dV0Ol1fX9/BwWHy5MkKCl37dHn69GlUVNTr168VFRUHDRo0e/ZsU1NTYdKZlpZ27dq1vLy8pqYmbW1tW1vbyZMn6+npCY5VX19/6dKlx48fM5lMAwODcePGTZ06lU6nbp5UV1cXHR395MmTyspKGRmZ/v3729jYuLq64j1vVVZW5uZ2rI9BbG1t5eXf+SRMSUlpbf3XWFRXV3fQoEEYht27dy8mJqaiosLY2Hjq1KmjR4+G97DZ7IiIiKSkpJqaGmNjYy8vLzs7Oxja0tKSmtphOwcZPny4srIy/DM5OZnNZsM/LSws+vX7j9UWL+3t7U+fPu2Y9n77FlxJS0trafl3n6eRkRGhkYjUKvgVUV1dXVhYWHp6elNTk5mZmaenp7W1tcRbhfDNPicnp6qqCv7Zr18/CwsL+GdZWVlhYSH8U1lZefhwEofGycnJt2/fzsnJaWpqUldXt7S0dHBwGD16tIxM1+Pv/Pz8iooO/7F4FBQUbGzeHUjI5XIfPXpEuMHe3l5WVrbLh797AruJU/+C9t8x3l9X8jkc7mIvc3m6jM8UU+DN5a8r+dv/N6J7hoMtbey0l7X4K8M+0lRW/DdTT7Kq2Zx/T9obbKzWr9PtZzuL8+xFDT6i2QAVXS3FdhYnJv7Ng9TK8qpmdVV5+yFaM10N1fhbKj57URN9r7iorElRQcZsoKq3m7HJAJUuk/08jxn/7O3zPGZNXRtdTkZPS3HMcO1J4wYoyBPrGqbzbc07aZD+qral7d9+aqSv3F9XiRCrvqn9ZmLZw/TKtzUtSgpyhvrKzqP0HUboEKqPwJOs6ruPynKLGppaWOqqdAsT9dHDtUcN1ZYRriora1vziv+zx9jGsh/UHlOza1rb/3Uho9tPwWygKoZhSWmVf8e9KS5vVFOmjxqm7f2psZKCsG2yS1ra2HPWxV1PKMUwbN5kk2M/jSXccPRiznf7U+oa2+EVPS3FkzuIt/Hj9N8FfgHJ+OgGOkqHNo3qtiNYBNDQxIp9Up6SXfO6tKmlla2uQv/YTN1trIGFiTrp/fwq6HkeM/JOcWFpI5vN1ddWtB+q5elqJJH2RqCgpKHin0YOdsbaftzxASooabh4uyi/pKGllWNkoDzd2RBc54fwiRE1y+D+V4UdkyOgSz7K+Ffsj7DQVJT/t+k2tbDvPCxLTH1bUdVCl5Ppr6vkPEp/vK0ur2Dk13Fa2tgXbxWlZNe8rW5RU6ZbmKpNdzI0GaDCL9mxTyquJbx5W91qZKDsMWHAqKHa8B42h3vh5uuH6VW19W1GBsozXYwEl2H6q9obiaX5JR2iQEtDwcayn/u4/rpdrWDXN7VH3SlOzqqua2jT11Yaa63j4TiAd46pS/hlUEBZ1TW2h8cUZL5iNrWwTAeqznA2xJtLcJjPMEN0wASCL0jjRbyjsLBw1apVV65cAU6MtbW1y8rKWlpaZGVlv/zyy19++UVV9Z0wgpw6derHH38EuoqcnNzAgQObm5vBiFxHR2f//v2ff/45v9fV1NQsXbqUcNzuhg0b/P39BbuozcvLW7ly5Y0bN4DKoa6u/ubNm/b2dnl5eT8/v507d/LTYC9evLh8+fLKykr8RXNz80uXLmGUOHjwoL+/f2Njo4yMjIGBAYvFAnmn0WgTJ07ctm2bs7NzxwbIq1cXLVqEj1hQUGBi8m7zm6enJ15NYjAYwcHB8+fPx5fMjz/+6OPj89dff8nKyubn50+ePPnlyw6VA7Bjx441a9b89ttv4M/CwkIHBwf861JSUvCKopubG5PJhH9GRkbOnDlTcE6rq6sJz/ziiy/wfwYEBPj7+1NuFaRFlJOT4+3tjU/qtm3b/Pz89u/fL8FWIVKz37x589mz/3ownjlzZmRkJPzz7Nmz33zzDfzT2to6JSUF/67Xr18vXLgwNjYWvEtLS6u0tLStrWO9VFdXd/78+b/++qvg+Zeff/45ODiYcNHExAScZoRhWFtbG6GmOo5Xqa3V0BDWKQi3MZd3yHg8Mpcu16HrYhi22MscaLxllc03Eks9HAVNh0mK16WNExgdlQt5HO6BH+t4rLzDbPhXITm/d8J0Z0NwODAh4h/fj3IYoTNrbVxByX9GVP77FA5uGsU7yq+pa1vx06PIO//x1PXd7ynrFg356X8j+CU49Er+ziMZYNAmJ0sboKfc3MoGdpI6mgp71tn5ePxnao83nYu3/melfedq63X/uM8BHDrzcntQem19m6wMbaC+cmMTq4rZih3uGJEf3DR69LB/x8GQorIm3y0P4p52dEY1ZXo/Dfmyyua2zkGnbj+FuZNNA76x6XLkGhP/ZukPSfgrr67MMO7/Tv+ftTbudem/jtwXTjM7uGk0Y3PiJZyrs6CIV1sPpUUfcB76j9MacWhsZnl9E3s/uRzDMF9P80ObRhFU911HM7YfTge/5eky/dTlK2taK6pbZnx9/4vpXe9Fv3i76PDZjgavIC+jqdYRl83hllU2e38be2rnOJEOYpEsb2taV+9+fOV+STurowa11OXVVOmlb99V6DSngUGbR/NqL7wVdHjL6FW7Hp+IysPfpqFKJ/QFCu2NlD0nnwPrboCelmLBdc9NgSn7/upwEwXZeSTD09UoeOtoTTWSE2tESoyoWSbcfy3hzbWEN/DP9ItT4WzC0Ys5PxxMq6xtlZGh9ddVam/nVFS37DySYWGivt9/5CdjDLrsOG/eNs9eG1fxjwU1ZJWPJWlX+mJTIl4W7TySMXeyyfGfxsrK0ApKGqatvgcV9Q5Pk0czv/7c8tdv/50Qh+SXNKza9fhWUhmwiVBT6Wg57SyOPF1mlY/lj/8bwU8ORN4p+t/Ox3ifDhiGDTJUjdgr8h5a3gwe3e4goKxyixrmro/Dy/mfgtNX+VjuXfcug9yWYi67mSZLnBlEIABI40V0kJ6e/umnn5aXlxsaGoaEhLi7u8vIyLS2tp46deqbb745fPhwUlLSzZs3tbX/8yG5ePFibm5uv379/vjjjzlz5sjJdTSnvLy8zZs3h4eHL1iwoLGx8csvv+R9XWNj46RJk5KTkzEMc3Fx2bBhg5WVVX19/dWrV3fu3AmeQ0pqaqqbm1tlZaWZmdmxY8eAStnQ0HDw4MHvvvvu119/TU1NvXr1Ku8Tzpw5M3/+fC6Xq6KismXLlmnTpqmqqj5//nzPnj0uLi5fffWVqCV2+PDhVatW0Wi0vXv3Ll++XEWlY8BXWVm5a9euffv23b9/PzIyEiRv7NixQUFBHR/pQ4fS0tIIz9m7d29DQ8Pr16+3bt0KrixevDg+Pn7dunXGxsYFBQXHjx+vqakJDw8fMGDA1q1bnZ2dFRUVt27dqq2tnZqa+tdff7W3t+/bt2/UqFHg1FZ9fX3wuhMnTiQl/eebAdi3b19bW1t0dPTVq1eFzKy6ujrhmd9//72xsTG8YcyYMeK0Ct4iSktLmzVrlrOz85QpUxQVFR8/fnzy5EkWi/X777/b2dkR9G3KrULUZr906VIXF5eqqqpNmzbxlpKrqyvIxYoVK3hDGxoanJ2d8/PzR40aFRwcbGtrC06EvnXr1qpVq169evX7779v375dsGr6+eef29raHj9+/OHDjnNxfXx8nJyc1NT+3UwrJycH0hAYGJiVlbVjxw4dHR0lJRFGANzG/yy2YxgW97Qir7jB281YW6NjfX7YR5ojh2g9yeo4KPh4ZG73aLx6Wop/fD+qY2E5Ov9h+n8mrQC/rrVra+dcjS2Jif93bNqh16nQQcS4pxVnr3VMLb2paJ705e0Rlv0C/e2tBqnXN7GuxpbsPppRWds6b0P8X7vGz570b8NubGZN/d9dkFkne/11DKuPzTqixMSVBPyZJcCuNfJucV5xQz91+f3+9rM+NQZ35pc0/HAo7ey1wkWbHzQ2s5Z+9hFvOmEG/RcPNTL41zSDMIj/asejPy911NTXn1t+v3QYWNB++rx65U+PUrJrPl12+8K+iW4O/xlwNzSx3L68XVDSYD9U6+Cm0TaWHYs/HA73zqNyv5+Tc17X/xGevXXFcA3VLjReh+E6IKnBEa/SX/1n4b1jDLrKur6xvais6edjmeDKsu1JcU8qvv3C6iNjtWpm6+m/C7JymSXlTXPWxaVETKGwNISnrrF9xup7D1I7SuyreRa/rRtJmK95kFoJ1F26nMyv39r6epkrysvWNbbv/+vFziMZoAwFc/jsSyUF2b3rRy6cZiZPl6mtb9tz4vmvJ7K4XGzFT48cbfUG6PXMCLv0bTOYR/D6xCjAz8a0c32srZ0Teafo21+fXLlf4lpwO+GvSeoq/5lE+2WNbUMzq6isEc4CrPzp0dnrhZ9PNbWx1Kpvaj8emVtU1kR4F4X2xo95HqbWnW3vu/0p9U0d2su2Q2lHL+TuWG09ZcJANWW5F/l1v57Iin1SEXmnqKis8WbIJypKcuIkRtQsE9rwmOE6C3EzI3ATr19AclDEq05XZB9tWT4cXH9ZWOf385M7D8umrbp3aNMoX89/j6oeb6MLNLo/TmenZHcYdDzPq5uzLm6QkeqSz8y1NRQeZ1YBGcUv2V9uT0pIebtm4cfGBioFpY2nLufV1LWdvVbYX0dp05fD3L68raggu2nZMG1NhbSXNWFXC9pZnMCwbPsh2nMn/2deJu1lrcfKO5W1raYDVY/8MGbiyA4zqIYmVtC5l5v/SP3t1PO0lzVRgc688u3c9cIvNiVyuZiKktz3S4dOmTBQtbO+fvvr+aQv7yyfLZpFMa+sECBk0l/VztsQP3GknofjAAV52SdZ1X9F57HY3D/Cs20/7geOjKLRMG7za5oqOicZQQ7SeBEdprmenp7l5eVKSkq3b9+GhpoKCgrLli3T1dX18vJ69uzZwoULr169SuNZADp9+vTkyZPhn4MGDTp9+nRzc3NkZOSaNWs+++wzHR0dQpTvvvsOqLszZ868dOkSfOawYcPc3NwmTJjQ3t5Omk4vL6/KykoVFZU7d+5A+2dVVVV/f38ajebv73/jxo2dO3f+8MMP+IivX79etmwZl8ul0+m3b9+G6pmJiYm7u/ucOXN++eUXkUqMxWJt2bIFw7AFCxZ8++238LqOjs5vv/3W3NwMtA6ARScd05YxMbwar7e3N9DZgMYbGxurqKiYlZUFtazly5ePGDGitbU1KCiotrZ2+PDhFy9ehEbR06ZN++yzzzAM++2334DGq6mpuXz58o6h3oMHpBqvr68vMMEVXuNVUlIiPHPOnDmCDYxFahW8ReTn57dnz57Vq1fDQpg0adLcuXM7TozYvx+v8VJuFRSavVsnhYWFpBrv8E74abxHjx7Nz+84b/Ds2bNmZu/GTzIyMpMmTYqJibG2thbmiOMJnfTv3x8sy1dWVoJ6gcjKyi5fvry6utrPz8/W1pY0nYLhthGtpsFKyGKvf4duvp7mQAm8GlvytqZVt5/UT9bVVJMH3k0eplWSaryMGR17AcqrWggar5KCLHSLAkaTe09lTZ048HSAI5RkQ801JtjpuS27xWJzV/z0cKy1jqH+O1Vz8x+pIKfTnQ0j9kzAR3EdY+C65BZYXuPHqZ3jJo3rD/80G6h6aue45hb25XvF6/c+9XQ1gsf5wnTCDM761Jiff6PDZ1+CEf+KOYPxCzh2VlrXg12tZ/1dVtnM2JSYcn4qvmqOR+aCZe2w3eOBdtTZAmluDgbRB5zt58UIeQLwYBO1wSYdkyzXE0t5Nd55nWPrtJe1YBQb+7RCgS6LT8nX8z+esOhGanZNzuv6G4ml4hgG19S1wfmI9YuGkO4q33rw3RaPn9fYrpz7ro+rq9C3rhje1MIirCvy4+Cm0Z9PfSdYNNXkd6y2rq1vO3Ihp7GZ9fOxzN832mM9x1hrnbCA8dCGVp4uM8fdxMJUfeyC6y8L6wL+zNz19bstDwCvTzqWMdNe1gI9Ku7Z26Zm1qPTk+FxU4s9zYd4Rovf3vjhaKvraNux6+fHoPT6pvZqZuuB09l3/nSzs9ICNxj3V3FzMPD+Nu7vuJInWdVb/kj9bf1IcRIjapYJbdjCRI3XtVJQxCug7i6aOejAdx26GcDCRD3qdyeXJTeTM6v/t/OxpZn6OOt3W5wGGaoOMuzod1F3i4HG6/dz8pLPzPestYNWCXpaigdOZ/NLtqK8TOr5KWDmsWMu6bOPRs77u7WNc+RCDrOhfdhHmuf2TID7C6ZMGDhnXRyGYb+HvcBrvHWN7bPXxVXWtqooyd0IcoW7M1SV5dYtGkKj0b4PTLmVVBbwZybhHKaisqaVOx5xuR2TR9eCXOEcnHF/lU/H9p+/MX7vqSxMFAjlLFjIfLvn6c/f2H41710XXuaNuTkYfL6x40SiA6ez4SHJ3ObXGNJ4EXxA5/EiOhb98vI6BrVffvklfl8iwNPTE3gYjomJIehIenp6Y8aMwSs2kHXr1nVscWlqwluBAkpKSg4dOgTWo/744w+CCj1y5Mhly5axWCRjr7179wKd4X//+x/vdt81a9YAJeqXX37Bm8KCU2QbGjqGeosXL8avRgIL5IMHD3I4op1d/urVK7Cfc/BgkknNpUuXYlTJz88/ePAgfi3dwsLC09MTLIz/9ddfR48ehepux0fRy+ujjzo+xsnJyfX1/5oz9SDUWgWBAQMGQHUXMGfOnIEDOwbHz549w+eUcqug3OypkZiYCNo8NGiHmJubg3VpIZk6daqhYYfJ7s2bN0kPRj5+/HhraysFy4WORT/Wf1pRfVP7hZuvDfWVXUf/e3TE3MkmYBMmi82Fh/S+L3C5WKC/PWHibqy1zhfTO3TmhibWL8fejdveVDQHn+sY1MrJ0n7fQFw8tLPSWuxlDt3bENDrpzB6mDZe3YWs+eJjsP3v/I3XFNJf19i+5Y+OWSFFedltK4lm1Zpq8usYHSd+V9a2/hH+bugMAAuhcrI0aIEMGWSoCtZ5JE7hm8bAjfZ4RUhBXmbFnHdiM/YJcXpFeN7WtLotuw3U3W0rR5Cqu28qmsErdPspfDmLqLR8t3QYfkMmPwabqM3vtOfHs2nZMNAezl4v5NcGpI08Xca4v8r/5lnybhm1seznZN9RoSej8rgCU1dQ0rBvw0io+2EY1l9XaY67ybCPNMVsb0LCYnOXfPYRVHcBMjK03/1HgnwFnXtV+rZZgonpMstdUtfYvjmwYyZFni6zYxWx4cnTZXau7phlYHO43/7yRMBzlBRlf8Wpux1mOx6mIyw0dfqR7KQtKGkI3GgP1V3QMmd07t1obGaFXc0P3joG74xtpouhuVGH0vgkqxqspQP2//UCzHytmDOY1xnB159bgmm4vSez8PbDHd/Q45kNTR0Ds0UzBxFMTmi0DqEq4jBKNAboKEF1FzDrU2NgXpGSXQMzyG0nzsEhEBCk8fZ1uFwu0D+BUkF6DzxC9sCBA/jrISEhpKuIQE8DP3hvCA0NBZ6TJkyYAAbuBEh3/3K53MOHD4PfYK2PAJ1Od3d3BwrVuXPn4HUWixUaGirgyXp6ep988gkmCtAP0JUrV/BeoAA2NjYpKSkbNmzAREdfX59X+YGOqZydnQ0MDPiFAv2tx6HWKgiQ1hTMKVBxxWkV4jR7aoA2w2KxYmJieEODg4NTUlLw9smCHwXNwvHWBAAulxsUFKSmpgbW/EWF9t8Rw7nrr5tb2YwZg/DDMnUV+mduRvhTi94jnEfpk7pmAbuUgZsioMOc/jsfeMMab6s38J9VX9IovBzaPDru5CTSoMHG7zYBki5Wd8npvwvA8M51jAGw5yQAV00J2xRlO20UWWzu9cRSkgRvGv043ENNWcJmX7pairzHbEL1huCcRnhK3zZ/svRWRk5HW/31W7vvlg4lvS0x9Z2nPTeH/rzm0xqq9AlC6PkejgN4d7b311UCZuE1dW3ZBXX4oHYWp7WN/B+4oY3PDWD/rfB8bKb+6soMvBE+HovOZlZZ21rwRlAh91OX5927Hrx1zJ0/3cRsb8Izz4NkL7Rxf5XxnUvBbA739D/TahJJTJdZ7hKYDEc7PVJhMnGkHpjlefaiRkA3951pTpitGDlE63G4B1j8JKCnpThxJLEr2X78ritNHKmnr01MCXRblV/8zoCIy8VCznfM4mEYNpvsJG26nMynY/u/m5K7+e+UHIv9by3M+68PAoCulqILblZU4sybQpJamP2Ckn8spDj/2WCMQOBBGm9fJyMjA/pbwrv8xTNy5Dubori4OFJ7YwzDmExmfn5+9j9AVzq8rmXj4uLe7UzD+R/GY21tzWs7nZGRARwFy8vLQ8+0BIYNG0Z4BTAYBgu8wGktaUSwqVJ4zM3NwTLso0ePXFxc7t+/jw+VlZW1trYW7OCaH6R519J6J9ZJMw4XhHvJGi+1VkGANKdQ26+rqxOzVUiq2QsPdCg1Z86cXbt24X0+Yxg2cOBAa2trYdw1A5YuXQpUaLCciw8CjqAXLlwI9paLCpf9n6ed6FRoF83sWP/EA/enPc9jPs78T156OXCQRMD+H5en9U3tQJWKf/ZOXxrFxyvPiMH9hPFSy2xoLyhpeFlYB/4Vvnk3OON1VyMMdx52OJvp3F5InqpBhqrAF3RZZTPeOxe8f75//M/HMjs8/eAYoKc0wkJTSHfNwjNisCZvERn8MzTHez8WnoKSBpclt4CeOXqY9tef8zVizMx5Z9Yx9CPy7fHD+FzHM3ww+dLfkH/cbmV2thaIj3+C+tizvP+GfXbln/Inv2Go17sbKMBidzjTelVYD5tZ2PKMBgABAABJREFUQ3O7MM3M2rKf4GOWKLc3IaHROvqR4C6ZkPJWgonpMstdApMx8r9L0xAZGRrYq4xh2N1HHT7VSBk5lDw6KSMsSLpSP413aj98HR64IAyXQDNza4E3eHm6jDWfTROwsyQ8+/cznfayBizwArWcNCKYA5IS1hYkDyeRJBziSfIIBATt4+3rPH/+HPzQ09NTVCT3Sg/tMJubmwsKCvCmvBkZGfv27YuJiSktJVk3wDCMMBzvcO3wj59huJuRgIKCgpqaGtRqAFlZ70wNlZWV+a25gRN0QKp4X6evr8/PhY8wB9jgkZWVDQwMBOuQcXFxzs7OJiYmXl5ewBRW+JNgeCH4BgNA/728O6KBsgd+8K429xQUWgUB0pzC9glzSrlViNnsKbBixYqjR49mZGQ0NTVt2rTphx9+cHNz8/T0nDFjRv/+JLavggFbeS9evFhdXR0REbFgwQIYBNauV65cSS2dNLoq95/KeZ7HfJRR5TJan9cOdoKdnrmRGjjd9ERkHv6EjF6Onhb5VkNlRVldLUXgTvllQZ2NZb9Xr99NIZnyOYhIQV5GTZnOT23LzGUGhr24llBaVvnOJpOAqGt6gOd57wRjZi6Tn+mmvJwsWFHMzGXCLbvLvAcfu5SbmctsamFvPZj2Y1C66xiDGc6G050GGuhIy/eSDtnGToV/bIk5uAOlhOevK+9MPDrmHDOqjlzI4d1mCaiuayV4GyIgTMb1tcjv0f3H9BQcT90jtLM4xyJzw64UPHtRza85wbVlUviVjPjtTUjUVei8h3UB4Fk1LwvrJJiYLrPcJS/y3yVDwBFlJv/IzKy8/+ym+U9KyKyX+aH9z55/PNByQYc09B8jZ/Y/hvewAJUV5Q51eiDn5dnzGsKEUcdOrn9cQOtpKfI7V0z8ghUAaQYV/kkJzCAmgxw1I/iCNN6+TnV1NfT0w+8evLFlVVUVHPofPHjQz8+PzWbLyspOnjzZ1tZWXV0dLFE2NTX9+OOPpE+rra3t8o2KiooEjRems7a2Fn8GDCn4I4iEfB0mIvPnz9fQ0Fi7dm12dsd3t7CwcH8nenp6ixcvXr9+PVyYFQn8Hl1RQ3sJ1FqFMDnlXQKl3CrEafbUUFBQiIuL8/f3P3bsGKuTa52sXLkSuCsH1tfCs3LlSnCE1aFDh6DG++bNm8uXL48fPx6ubIuM3L+5Pt5pGWht0Y90v+WooVpA4z17rfDXtXb403F7M/J0vulUVZIDa0k19R06DLPzf+DThV+UjiEXmcYbdO7Vt78+YXO4sjK0SeP621j2U1elgxWaphb2ziP/Tr6ISs0/Wty564Xnrv/r2ZUU/CEiCvIyd/502xSYeiIql8XmstjcG4mlNxJLV+9+DNxQA2tGySJP5opZ/JVkRXnZLcuH/XAojcXmrtvzdJyNLulBRy2tbIKOTXyOEGcC89PHlP5p8M0t/5lqXOw5yLlzDy2Bqtq2XUc76n3RzEGk68Zq/3Wq3CUV1S1T/3cXnFNtZKA8efyAgXrKdLl3ZXsltgTs3BaMAm7np2Tbm5DI899KDftd7T9zChJJTJdZ7hI4xyFAMqj+U5tV/MuEX9MSviv9GypcpuAcUG1929o97+aChSnA2gYhhKEQu+IpQ5pBGZ5Vb5qs1N0oIt5fkMbb14FHtghYIcQHwfXG2NjYVatWAefAd+7cIRgGM5lMfrqNMG/kBb7X0NAQnJ4qAPwqK7XXCcPUqVOnTJkSGxt7+vTpCxcuADvVioqKgICAo0ePXrlyheAlq1chqrMuIaHcKqgh1VZB2uzFQVNTMzg4eMeOHWfPnj1z5kxCQoefSS6Xe6cTBoNx7Ngx4Q2bP/nkk48++ignJ+fBgwdpaWkjRnT4cTly5Aibzaa8wNsxYpDTALPl7SzO6asdi2n7Q1/sDxXk0ra+qf3S7SLozLYHobZmCAG7duHKiawscYVESOKeVvj93OGLXlNN/nqwK8HYj9nQLo7GK/fPwPfH/43wcOzC0THh4BxNNfmDm0Zt+2rE+RuF566/BttcuVzs3uPye4/LF04zC/lhjMQNmyWOqrLcpf1OwNXWpgOpLW3szzcmPAh15116gqfatLaRd3OoEgughU9cqOgSdIApE8gr5XVpI9B4p00cCA6LFpMF3yUCdXexp/mB70cRLHVLK1uE0Xil2t7EBPZHmIYeTAweWNQCJAMMEvP8LckCEzNQXzlyv5Pgm8HOf4AcFIbiyVipI//OMzYCwQvSePs60HyU4MkWDz4I3r9v3z7ww9/fX6R9sFpaWsDYVcAbeU9qge9lsViCz8XhfR34IdLrhIRGozl1cvDgwdu3b4eEhIBlt8rKSk9Pz9zcXGVlEoc33QypUtfcTG5pKSaUWwU1KLcKys1e/ILV1dVd1UlxcXFYWNgff/xRXFzc4VX15Elra+s1a9YImQUajbZixQrg/vpwJ2w2OyQkRFtbe9asWUI+hOSxiu/2n8fEv3lb0zrNaSCvlxfI4bMvgbPcE1G53azxkg68moVQYJpb+J7BU/ePb1KtTqc4WhrywCAZXueliexEn8Cwd/aW6xZZSXxvm46mAnBdq62pwO/4IsHo9lNYOddi5VyLkvKm8JiCQ+delZR3HEb615X8ERb9BGyL7SWs8rEE6u63X1hdTyyNfVLxPI+5bs/Tg5v+PSSGYHjMz7D8zT9OgAVQVkm+D7a8qkWAvaW0SX9Vez+5Y4Oohir9tw0jxdyYKtX2Jqn+2A2JERKYDAGSAQb1SPPgB0wMi8URqQBhFQgShvyrstugKfH9WiEQvWjyCdEjQPc8NZ2Q3pOb+84dq7a2trGxMWF7JDjEhQCX/5EIYDEKnPFDekNdXR2vCgrTWV5e3tT072HxXQJfV1NTA21ZCZSUlGDiIScn5+7ufuHChYSEBGAjXVZWduPGDTEfK2aSwA/S4hI/y6RQbhXUoNwqKDd7CRasoaGhv79/Tk7O7NmzwZUTJ04In4UO88hFi4D5d2hoaH19fXR09Js3b3x9fRUUqI+xaCrvXFId6zz0csvy4QunmfH79/XnH8NjZoCFs7SBizyko6s3FV23gWI+91QxW2v/MWMGRqfQ9PQVn6zVNbaTnmH77MU7OTPORlfivQA6Os6H7kmpMlBfed2iIc8jp3u7vWvep6J7hb93IdepZGRoJ3eMAz57j17MuXiriJ9jKt5zgwFpL8n7Ph5wdCovwL2ZANdWUgW2MVsrLdJ9lZISthJsb6Q0NLH47YSH23dhCUs7MUICk5HDX+jlFdcT/G/1BmDKK6pbmv5rjS8YWAU1dW38Nq6XCCF+pQoXk6UpUj/fG/HBgzTevo6RkdGQIUPAb2BmyQt0cuvh4QE9CUPnQ6QGnwKWzuBRQAQXx5CHDx+SpnPo0I4jKLhcroCzbaZPn25gYPDrr7/CK4MHD4ZnIMXGxpLG6vKwHAKZmZmenp7R0f+eWQ8ZN24cPI+Xn9+m7kFT890nCiwhEnjw4IE4D+c3nKLcKqhBuVVQbvZdFiw4d5eXzZs3z58/n/e6goICPGBJ1Aajra0NtOWGhoawsDDgs2r58uWYGNCUTLk0elll8/XE0uGDNQUvUXq6Gmqovqvok5f/9SckPeDrwLIkgaT0rr1GP+JzT9w/e5UH6iuDcyxd/jlWBwYReJxRJdhXEKlBo4BFEmG6mIfju0X4B/84sOUl7mmF0aeXBk+7jF/0/uFQ2hebSBqngrzMge/tBa+F9loG6CkFb323eWTFTw9fl/5HERprowtOf7mVVMZrnFxZ2xr/lG8ZQq7GlvAaFBS+aQRatIGOEmgt3YzgNiZ8M+sSyu1NePj1I9jvXEYbdFtihGHy+HfJSOSTjJY2NjB+wTDs07HEAwV7EEN9ZeBjnMvFHvE/Nsnrm1ijTy/9duqdf0cMwz4yVoMntMU/rRBJtHYbMiqWNBkJ7D9CfKggjReBrV27Fvw4fvw4byibzf7rr78Id3YcAzDo3YElyckdO9YI3Lt3j9/r5s6dq67ecVRgWlrao0ePeG8ICQkhjQgMODum848eJb0hOzv7ypUrFRUV06ZNw1+HOkBwcDBvrMzMTFHVv8rKyqioqMjISNJQkLuO0RilA4okhZWVFfgRHx9PCIqJiYFH2ooENNLGn9Yzbdo0GxsbUJWUWwVlKLcKas2+Y3OgisrAgR0Tya9evQJnI0G4XO7BgwdJkxEfHx8eHk6qJKuoqIA9xhQazFdffQV+7N69++bNm59++ulHH/3rt7asrGzjxo1btmzht47NC02GLqNhF3oln8PhwiOI+KEoLzvH/Z1H61PRed2wxetjM3XCgSWQ6wmlwhyOkpRWmZVLMvMSfD4H/PjyH8e/syeZqHe6n0l/VUt6AtPRi++iEBhk+M4d2tN/Rr147vPRnwHKiu8sCNpZ/xamp9/9UT4xIA0zXAyBD9vE1LdwEYxAyPmciuqWMcO18at/iSlvz14rJJ0pUFGSA5phf933z9PpTBfDxZ0NldnQvvD7RHCWMkBHU8G9UzmpqWvb/xdxL/q2Q2ntrK7dGbwubTxygVjRWw+mgh+fTzUV5oQqiQPbWGp2DW+/43C48GwtMaHc3oTnz4skZ3o/SK3M7Oyn6ip0eOZwNyRGGGa6GgIvzc9e1JCaD1y4WQT07RnOhj0yISKANQs/FnyU+svCur/jSt7WtBB2pC/77J1g5O0OHS6pc5lJaRLYNy4OMppS30iFeK9BGi+iwzbSza3j7PWLFy/yrlvu2rUrJ6dDwG3YsAF/5Om8efPAj4CAAMLaVGlp6ebNm/m9TlVVNSAgAL6acDDpqVOnbty4Qbr9lcFgTJo0CcOw8PDwS5cuEUIbGxvnzJkDngmVPcCaNWtMTTs2GV67di0oKAgfVFtbu3DhQnjQq0iEh4e/eEEcRTU3N1++fBmsBMLV7B4BlBWwlYXGxh1Geikpvr6+pFbHXWJubk6w3a2vr79582ZqaipQAim3CspQbhXUmj1g8uTJQL9dt24di/XOrrW9vX316tWC/Wlv3bqV9+KFCxfAlmCQVJEYN24ccMv8+vVr3kOJpkyZ8vPPP+/YsQMaTguDrNb441F5dDmZeR7vtFkBLJr5rkmUvm2+9eDdMZXSA/oT/is6/9mLf9X41OyapduSxpNZERPQ11b03fIAGjADDp15Cc7YNBmgAk21VZXldnz9bnP40h+SCAfYhl7Jv/WgjNRDNZwF+OVEFmHVtKyy+YdDaQKSN8jonSbz5u071bS+qf32w7K0l7UDdTukoqwM7eh2BxkZGpeLLdv2kHch6/TfBeeuFyrKy25dMZz3+duD0nkvXrpdBLSmWZ/+a73/HrF3/UgLk46pkKS0yh//m8GfVo0Ayvz2oPSdRzKAQeabiuZvfnly5EKOMMoqjYat/fXJnhNZoM0Ulzd9tePRmWsdjoK11OXXLXpnKtLNONrqgcNgKqpbfj3+7pA2yC/Hs/JFPxqXFDHbW5coK8refFAaijtxCsOwtzWtX/6fvfuAjqJq2Dg+aZtGegVCCgFCh9CbEBDpVVTAhmIBbHwogi9iL2DnRZGAiKAgIqDSpIiI9CaEhE4CCUkgjfSyqfudcHnHZUvYbBoM/9/xeMLMzu6dtjvP3Dv3vnOjqdcHL7WXeyCr6cKYqLwYb5cXo/yp8g+P6Iz/lJRW8PqXEeLwmDfjxuMzt4/HhjXu3638gmf11rj1f+negc0rKHl4Znmjp8eHN5ZvLwovPRIicv72/VcX/+/+oJCZU/TkGwd8/jc6bp3QaCRL1xttVQCDLKr9yTrcbr7//vudO3eWf8GtXq1Wq+3s7MaOHStJ0sCBA8ePHy9ek5GRMXz48H379llbW8+YMWPcuHHe3t6xsbELFy5cvny5JElPPvnk4sWL5ScYyweTLCoKCwsTtaOurq4zZszo1KmTo6PjgQMHPvnkkw4dOmzZskWMgiviwX/+85+QkBt9omg0mqeffnrp0qXlrcJ8fZ955pmWLVtmZ2dv3rx5w4YNK1eufPnll5OTk+Wi9uvX7/HHHxcBdeTIkbt377ayspoyZcqjjz4aEBCQmpp66NCh999/Py4urlevXlu3bnV01B0l78SJE3379hU1XcOGDRsxYoSTk9Pp06eXLFni6ek5ceJE0WNQt27dRCHnz58vV9Xq+/vvv8PCwsTazZ49u1+/fl5eXhkZGZGRkR9//PGRI0esra3XrFkzatQo0Wj2m2++KR+2fufO+PjyJ83GjBlTr169Jk2azJ49+/PPP4+MjExPTxehKzg4WGTRhQsX2tvbv/nmm5cvX46OjhYtbzt37tyyZUtPT89PP/1UZLbypkSHD4vRZQcOHOjr6yveVpRz4sSJogLTysqqV69eDRo0uHz58v79+5999tn69eu//fbb5Q3G+vb19/e3sbH57LPPXnrpJVEpKloIy1tDFEYMbty8eXONRtOrV6/FixerVKq33357xYoVffv2FceYeUfFxYsXRR/OOptIPkQNrmmLFi1mzpxZlaPCjMNeuHDhQps2bUQTbj8/v65du2o0mn379qnV6oMHD4po7ebmNmLECJFjhwwZEhYWJprxP/jgg88++2yLFi0sLS0TEhLWrVs3b968wsLCXr167dixw9bWNjs7+5Y7QtvXX3/9/PPPi0F6L1++LJe2uLhYjt+Ojo65ube+Ao6Pj3/jjTdyc3PWrfvFw8V2yD3l9WOvP9taHhhT2+5/Ur7fcFEjST9tiRUVa82DnDu38qjnaJN7/cG883E5h643nOvaxrNZQHlFx5ezOq/74/KuI+U97qzZflldVGqnshIVOPd1rz920K0Ddnkd7DuHlm8of9zUytKiZ6hXfS/7+Kv5ByJTn76/ia+n/XuLygNPn04+/r4ONtaWC9/oIpb6Zl30Cx8ekSTp01c6fPdbzLWsoidHNW7Z2CUnv2TjroQte6+Iroy3L+rXTqsht0ZT3lZ22fVRmnw87J4a3aRFY+fsvOIte69s+jtx+Qc9Xv3sWEq6Wl6LsM4+jw4LKiouu+/ZP0WNh6uT6pUJLTq2dHewsz4UlfbZ8jOhLdy27Su/GeTtbjewR3mAnzGxpQhsYtzLNmM2aTRSz/ZeX8/uorKxfG9R1I+/x/bp5LN9UT+5YGu2X5745oGi4rLmQc6vPdWqe1tPlY1VdHzO8g0XV26+ZG1l+f0HPe7vf1MnLvc9+6cYZWpMf/+n7w9uHuRiaSklJBf8ujP+yx/PFhaV9WzvtWVhv1uOmLL/ROrS65Vyfx1JTrheYzz63kb17K2DGzn95+lW/11xNupCZnp20ebd5TfFGvvVE7chvpzV2d7WauOuhPV/JRSVlK2+nhgNbgFj5D34xqQ2s5/VHXwr4lxGr8e3F5eUWVhIWxf2C/tfi/TrtfcXXprzb5MTW5WliCgOdlYTRzcRw7p+NauzzqC+r3x6TMx69YmWnyw7rbOsaE7823/7iPBgistX85oOK78Zuvaze6qlr+ZNfyc+8MpucQU3sGf9R4YEBTZ0TLmmXvl77I4DSW2auoq+uO/rXt/Xw655kLMI58Z2kIer7UfTjFaRmXG83VKj+35NSVd7u9t9NC30yTcODO3dcMg9DZwdbU5fzPr2l5iU6yNjPzGycfgbXXVuTFS2MJVd5ZlfHL+WWaj/ep0vw1VbYp95+1BxSVloc7fZz7bp0MK9uKTs73+S3/o68kpKgaer7W/z+2gPVH4pMfeDxSf1T5zyX+r7g3u0071bV/Gp9M7CqPikvJj4XLGXO7VybxHkIq/R02+V/3AcOXVNDB0sjgFxhoqA+sDLe/YcS7GytHj2waYPDwkMqO+YmqE+fPLanCWnLl/N69nea+NXYfKNBlnk+cwBk/7MuH7baMg9DYf1aejkYH3mYvbS32I8XW2fGNl4+mfHtL/wP5/RUTSTMcjYdp72eAsHOyuD20r+mdBfQR/fBq27PiguCQCDSLzKN3nyZIOteadOnTpv3jz5n4WFhfPnz//oo490Kl2Dg4Pfffddg48g5ubmTp8+fenSpdptXB0dHWfNmjVp0iSd7m137drVp8+/veGXlZV9+eWXb775pva4uw0aNFiwYMGoUaN8fX2Tk8svi4VJkybJdbNFRUVffvnl3LlztYdXFc80vvTSSzNnzjTWbc+FCxcmTZr0119/yVMsLS0feOCBxYsX//TTT5MnT9Z+cVJSko/Pv9dMOgoKClatWvXDDz/s3btXruKT9e7d+5NPPunS5cal9vLly0Vg09G1a9eDBw8OGjRo27Zt+nMzMzNdXFzat29/4sSN5nOygICA2NhY0VuvsbcVfxcWFk6ZMmXZsmXyaW5raztt2rQPP/zw3XffFYlXnh4XF2esrlsURvz91VdfvfLKK0VF/1aRtWvXbuPGjY0aNTL7qDh06FC3bt0qOEQNrmmfPn3kZtJmHxVmHPbCzp07n3jiCZHPhTZt2qxcubJNmzY6pZ07d+7MmTMjIyMXLVq0fv16/a6t3N3dn3/++VmzZok+z5KTk03ZEbKcnJz69evn5eW9+eab77zzjvas4cOHi0GbJkyYYEq3WCdOnNCv0N6zfECX1h4VJBAdDX0cDDadLa+P+vuB1+dHGGwU98L4kM+mdzDxCcYX5xz5fuNF+bfLVmX50sPN33uh3QffnBSJV56efWCsTmm/mtX5wQH+U94//Ouf8dq/fr07en/9epem1y/UtJWVab5eff6dhVHa/evU97Kf/1qnEWF+4qpdnv7MmCZfzSrvMTg3v+S1eceXrb+o3W7W0d565sSWT49p0qBfeY/usj8W3ys6HxYWrj4/44vjRcX/Lti2meuv8/r4/e85OiHyfOas+RE7Dl7V+Q3v3dH7o2mhchc1sqgLmUvWRW/4O+FKiu7Duu7OqskPNZv5VEs7E0bU/GHTJXG5qaNLa489ywcMe2HXHwcMPI6e8vcDLvVs3l980w4ytgXMSLzlHcX/cPa1ecfFs7X/rB6s3Ufur3/GT/vkH9G/rtA8yHnZ+z2OnromHxXGEu8fi+/NV5dMevewdnV98yDnhW900U8ptZl4y7+FDiW99NHRC3E39Z/Uo53Xl7M6fffbRVF+oXdH7z8Wl7c5MraD/Os7XthUfofOmMoeb6Yn3vg/Rv+2M37qR/9ob2FnR5s3JrV5YXwzg8NlVaowlV3lpsM26DwQbuzL8MS5jP/8N+LP681DZDbWlg8N9H/v+Xbyg6/C4ZPX7plguDPLJe90e2xYkM7Eik+lzuO3iLGpDK6RbcdVxs5Q8XdRcdnXq89/8t1pnVGLPVxsnx/fbPqElsbufEVfznnugyOin3DB0tLi/nsbfT27y8/b4nR+EeL/GC1aIhhkbDtv+irMxUllcFvJPxMGV1D7kgDQR+LFTcrKyo4cORITE5OVleXh4dHquooXSU9P379/f2Jioo2Njb+/f69evcSFuykKCwv//vvvuLg4Ozu7oKCgHj16mDgeaVlZ2dGjR6OjozMyMpycnEJCQjp06GDKoKkXLlz4559/MjMzfX19u3TpUsVHbfPy8qKioqKjo7Ozs21sbHx9fTt06CDa994+EhIS9u/ff+3atfr163fv3r2CJG+itLS0PXv2JCUlqVSqli1bduvWTT+RVuWoMJvZR4UZh72oRD1w4IBo/Ny8efMePXqYUsiLFy+eOnUqJSVFrVY7OzuHhISEhoZWcbzf0NDQyMjIuLg4uZM2uYS//PKLSqUaOXKk6SP9ltdtlhUVn54pFf17WXO7SUzOPxCZdi2rsL6nfbe2nhVcV+knXpFtrqQUHD19LSlN7epk06GFexP/ih63Kywq23MsJe5qnp3KKrChY/e2nqaMW5ueXXTwRGpiSoGNtaW/r0OPUC9TIqXoVGnf8dSkawUqa8sWjV26tvE01v42NaPwcFRa0jW1RqPxcbfr2NLjlsOQXkrMPR2TlZKuLiwqc3K0aRbo1D7E7bYaNbQmlJVpDkSmRV8uD4chgc7d2hoYb6wCJaWavcdSYhJy7VRWLYNdQptX86BTZtNopBPnM05eyMwtKHF3VnVq5SE/4lsTzDjeTEm8YryxAyfS4q7kqYtKA+o73tPB+5bNDaqxMFWRmq4+FHUt6Vr5ad7Ay757Oy+dIZpvW2Vlmn/OpMfE52ZmF9VzsG4W6Bza3KSvgujLOcfOpGfmFPt62nVu5VH3z/87h6qavFrHZcBtj8QLAHewU6dOtW7desSIEevXr6/Gty3LOVN84UMLqab6O61l+okXQB3SSbyAmaydbVrMtbCps/GZcadQ+G1dAFA20be53GlzdbF0amHt/4RGqouOaAEAuBWNpaN18HTiLkxxZzS9AABIkrT+uiVLlohWyllZWcuWLQsKCpK75q5GVp73Wtg1LElaL6nrcmTp6mH1v2ftrOpJqls8Mgqgxllcr3GxsOR8hDk0GkunFlb1R1vYVvVBLdwlSLwAcMeIiIj47rvvxo4dO3DgQNHZdXZ29pw5cwx27lV1lvWaq5rcGK3nTlRWViZ6F8uyWylJ5b3WZdn1v+r0SHkvL/7+NbTRABiTnp6ek1P+NHWZxUpJyi+zcLjqVD5QgrOzs5vb7fJ0NADl4TleALhjvPPOO2+//bZKperVq1dSUtLp06e7deu2Z88e/SGUYEbH1wBuh8EjAKB6cZEEAHeMXr16DR8+/MyZM1FRUb6+vv/5z39ee+014q4x9erV0x6FS1stdB4OQMfw4cPr1y8fhFmHwQHqAKC6UMcLAAAAAFAm+moGAAAAACgTiRcAAAAAoEwkXgAAAACAMpF4AQAAAADKRA+fdxdNWUnZtV1lOVFSaUFdlwW4FStHS+e2lu73WFjyTQUAAABz0FfzXURTnF0c87GUf7GuCwJUgoVDsHXwqxY2znVdEAAAANx5SLx3C01ZScn5dzT5MdLdLSO76KHpe7Sn/N+jzYf2bijVtUf/sy/5mlr+58Ae9ac/0VJStLyCklFT/zZlX1g4NLFu9mZt1vSOGzcuKSlJ/ufgwYNnzpxZa5+Ou8q2bdvmzJmjPWX16tU+Pj51V6I7Xl5e3tChQ7WnvPLKK8OHD6/s+xw/fvznn38+depUQUGBl5dXYGBg//79e/XqpVKpqrW8AICaRVvBu0Xp1Z/rPO6u2HTplU+PhQQ6/za/j7tz3VwxlJZpYq/kSZKUm1ecnl0kSdJDAwOk20BickFCSn5RcVlSWnmD84D6jpLSlWlM3Rea/OjSq2utG44z5W1nzJixe/du84r0+OOPP/fcc5IkJVxXVFR09epVSZICAwNNf5OsrKzhw4efOHHi008/feaZZ8wrCe4eubm5sbGxkiSlpKQUFJSf/mr1vze/YIaysjKxSXNyctLT0yVJGj9+fGXfZOrUqfPnz5ckydvbOyAgICIiIi0tbc6cOfPmzZs6dWrNFBwAUCNIvHeFsoKE0uTfLeq6GP/5b0RmTtGhqLQfN196YXxInZTB09X2wqYRkiR9sy76hQ+P1NrnFhaVHYpKEwVoGeyi/4K/lvaXJCnyfGbn8Vuku4OTg43p+6I0ebOVZ18L21tXfJ0/f/7QoUPmFSksLEz8sXfvXkmSTpw40b59+8q+yU8//bRnT3k7gldffZXEC0mSzp07J5oMdOrUydFR92bWmOskSRo1atT69evrqIyK4uTkJBLvokWLJk+ebMY7hIeHi7g7Z86c1157TZKk4uLip59++vvvv6+B8gIAahZ9Nd8VypI3WEhldV0KSU56zYMMRD5lS75WcN+zf9737J9vfh1Z12W5I1lIpaVJG0x//aFDh9Q3O3funJilUql0ZqnV6mq8kG3Z8kZz9BYtWlTXe+KONmfOnLDroqOj67osMMlnn30mSZK/v7+Iu5Ik2djYvPXWW3VdLgCAOajjVT5NSW5pxqE6r+CVJGnt5/f8tCWuqb9TWGceUUOllabvtWr4sIW1Se29ba/TmSL+sLCw0JklYnB1lfOee+7Zs2dPVFTUuHEmNcMGcFtJTU0V9ybatWunPb1x48ZJSUlOTk51VzQAgDlIvMpXlnnYQlMs3QacHGyeGdOkrkuBO5WFprgs87CVZ1/pttfrurouBQBzpKSkiD9cXHSbI9GjGADciUi8yleWdbyuiwBUj7LsiFsm3kGDBvn6+np4eFTqnYODgydNmtStW7eqFRDAHa+kpET8YWVlVddlAQBUAxKvwmk0ZWXZUXKT5jMXs/YeTz1zMSsju8jG2tLb3a5rG48BPRrYqsx/ovuf0+l/HU6Kic/NV5c417NpFuDcpY1H51Yelpb/tqQ+cS6jsPjfB4m93GyDGtYTf6dlFl5MyNV+w/Yhbioby+y84lVbYk9dyMpXlwQ2rDcizK9tM9cKinH8bMbGXQnxSfl2tpZBDeuN6e8f0KC8+evxsxnFJf9+tLebbeD/PvqWcvKL/9ifdCgqLTVDbW9r7efjENbZp1tbT4vKtBGPTcxNySgUPTCXD4+UVXj45DV5roWF1LlVRdnsYGTa73uuJCTnOTnYdG7tMeY+f3vbmy7CjG3bMxezftuZEHc1r7RU4+Nh16mV+6h+jaq+grn5Jbv/SY44l3H5ar66sNTZ0aZ5kHP/7r7NAm49Xm5OfvH6nQlHT6dn5xb5eNh3b+c5uFcDG+tKHHtl2Sc1Go1FhTvAvI5qOl13y5cdOHBg06ZN8fHxTk5OXbt2ffDBB+3t7eW5aWlpMTE39YgeGhqq3146Ozt748aN//zzT1pamqWlZf369du3b9+vXz8vLy8TSxsREVFYWCj/08vLq3HjxpIknT59+pdffomNjS0tLfX19e3cufP999+vs2xOTs62bdsOHjyYkpJib2/fqFGjfv36de/eXX+rGludzMzM5cuXnzx50t7evnXr1o888oh2b0wxMTE//fRTdHS0nZ1dly5dxo4d6+DgYGxF8vPzd+zYsW/fvuTkZBsbmwYNGvTr169Xr17aSaO4uPjYsWP6ywYHB3t6eoq/4+Pjr1y5oj3X19c3ICDAvBWvrj0llzw1NVVMiYyM1O6HuVGjRg0aNKjg01euXBkVFZWfnx8UFDRq1CidRrY6zFhBfcZ2eq0VJjIycuvWrRcvXszPz/fw8AgNDR00aJC3t3fFS+Xk5Pz6669HjhzJysry9fXt0aPH0KFDbWxspEoSZ9b58+fFP1NTU7W7wWvXrp2dnZ3268+ePbtly5bo6Ojs7GwPD4/WrVsPGTJEf58a26pqtXrt2rXHjx9PSUlxcnIKCQkZOXKk6T3Dnz59es+ePadPn05PT7exsfHx8enWrdugQYP0n9owb89W16lXjZuids5iU76XhOjo6GvX/v1Bd3Nza9asmfzPpKSkuLg4+Z8ODg5t2rSp+ne49oGXlZXl6OgYEBDQvn37sLCwCr5szTuzAOXQQNFK8+MK/xlf+M/4b9/p1tjvRtKztrLwr+/o5X7jl9vT1XbZ+93Fyyr1X/Tmkfd0uPF16eRg41/fUWVzI714udm+MD4k99BY8Ur/m8faeWxYkPwmS97RrVW7sGnE1oX9XOrpXqy8MD7EYDGS/hqjn+UkSZr+RMuCI+O8/7eawjNjmoilvprVWUz5alZng2/7xasdXZ3Ks4qVZfnm8nC5cQ3RtpnrnuUDTN9KFTfktlVZar/4yKrB8ibKPjB29L2669XQx+HYz0O0F9HftrmHxj4xsvy3U5tLPZsqrmDCjvtH39tIDqjuzqqABv/u8WF9Gib8MbqC7bD6k16errrXYY396v2zevAt94X2f2UFV807F0TfreKBXhMXiYiIEItMmDBBrVaLDnW1+fn5RUVFya9ftmyZzgtiY2N13vOrr74S+dDS0rJBgwbyBYeFhUWfPn3++usvUwqmc0E5YcKEoqKiiRMn6u50FxedBefPn+/qWn7nyMrKKiAgQK4Jb9eu3cGDB3VebHB1duzY4ex8090NDw+P3bt3i0XeffddnYtCPz+/06dPG1yLRYsWietmS0tLPz8/ub1oSEjI9u3b5ZdpD4ysbdmyZfJr9EdLnjp1qtkrXl17yljJZXPnztV+/ciRI7W3s36TWp2VquIKGmRsp9dCYWJiYgYMGCBe6ebmFhAQICKrSqV69dVXi4qKjC24bt06OYDJgoODIyMjw8PDxT/Dw8NNWf0KopqIGfIrY2Njhw0bJqY7OTkFBgaKMGxlZTVlypScnJxbbtX9+/frt5GeN2+eKeVcvnx5cHCwWMTa2jogIEA+Pj09PVesWFEte7ZaTj1TimHipqids9jE7yVh7Nix2mUeOXKk9tx58+Zpz23Xrl3Vv8MvXbokH3j16tULCAiwtr5Rd2Vraztu3Djtn6QqnlmAkpB4Fa4k/YDICcPD/Mq/7JxVyz/okXd4nJh4dsPwsYNufO0ueP3WYUP7v2t7HhSVpZ1auR/6cZCYWHBk3OYFfZv43+jYI+XvB8T05R/0+GpW55kTW+kn3pO/DPtqVuevZnVu0/RGFe4vX/RW2Vj27+b72fQOX83q/OSoYGurG7dvv32nm04x0vc+2LGlu5jbp5PPxi/DLmwaceznIR+82M7Jwea1p1qJxOvkYCM+5c8l/U1JvE+NvnEx8dIjIUl/jRETD6wY2D7ETZIkO5XV5gV9TdxQfy7p/9Wszu8+31a8YZumrqIk4r+Fb3QxlnjHDgpwdVI9N67ZF692fP2Z1k0DbmzVJv5O8q2Ewn/G//RxryXvdHtryo07x48NC3psWJDKxvKRoYGfvNzhzcltGvk66CdeM1ZQLtvoexud2zBcTMw5OPaHD3t4uZVH2WYBzqm7b+xxnf9++LCHuAXvaG/9wYvtjv885MKmERu/DOvbxcfDxXbW060r2Bc6/5VmHK6TxDt+/HhXV9cXX3xx/vz5b775pnwjv2nTpvIVw7lz58Kva9u2rcHE+/XXX4uLrc8++yw3N1dMTE1NnTZtmikXi7K1a9cuW7bs3XfflYs3YcIElUr12GOPff755++8846/v7/+1ZI8VNK0adPS09PFxKNHj4aGhpbvdDu7bdu2ab8+Ojp62XXiBZIkbdy40dbWdtCgQZ9++uknn3zSr18/Md3JySkxMXHevHlWVlaPPvrovHnz3n///datb+zWFi1aFBcX66yCGPdY1MknJSWJiWfPnu3fv3yYLktLyyVLloiJ+fn54eHh77//vvxZCxcuDA8PP3funPxuBw8eDA8PnzFjhiRJXbt2DQ8P37dvn9krXl17SpQ8PDxcbi0/a9ascC3Hjx83mHg3bNigUql69+49d+7cefPmPfroo/J9hOXLl+t/kBkraIz+MSwKM2DAgHnz5oWHhz/11FPyFXY1FiYiIkLEjKCgIDmH5OTkzJ07V1TfDRgwQP8o0mg0q1atEi9wdHScO3fuyZMnY2Njt2zZcu+993p4eLzxxhuVSrwrV64MDw+fNWuWWKpbt27a+ysjI0O8LDIyUgQhPz+/33//vbS0VKPRqNXqxYsXi0q20NDQtLS0Ck6l33//3c7OrlWrVrNnz/7iiy/k4YJNTLziUHFzc1u5cqW8WWJiYuT3WbRoUdX3bNVPPX1mb4raOYtN/14S/vjjj/Dw8A8++MBg4hX3XOTbLtqJ17zv8IiICBHaGzZsuGnTJnHglZSU7NixQ/6+nTlzZrWcWYDCkHgVruTqb9qJd+OXYfoRYsT1WQ52Vol/3m964v30lQ7i61UOP/J/Z9YPd7S31k68+nFO/w1FCSVJCmxY74tXO2rPWjm3p5jVPsRNZ6nnxt0IHsPD/NRHb5p1YMVAe1srkZa93e10Fqwg8c6b0fHGb95DTXVmJe8a4+tZ3orV09U2YUclNpcYeFaUs4KXyZsooIFjY796cdtGybOyDjykfVPA2IKBDet5u9tFrPm3Hjh26ygHOyvtxGveCoqP6N7OM//IjTsm8n+HfhwkGrG/MqGF/kpFbx5Zz6H8eLCxttSpPVYfHX9//0Zyo3pTEm/J1fW1n3gDAwODg4OvXLkizyooKNC+cNRZULuyTp5YXFwsKiUee+wx/c8SjbFNTLw6xQsKCvLx8Tl16pQ8KzEx0cHBQftq6csvvxQvfv7553XeJyMjo379+qJ2KCUlRf+D5NUJCgr6+uuvtWc9+eSTYtZTTz3l5uamXWdSWFgoNxTfvHmz9lILFiwQ0ydOnKjzWYWFhZ07l5+bVlZWe/fu1Z4lXyLv37/f4AaZPn26iOXaE81Y8WrfUxMmTBBliIiIqOBl2tv5448/1p71448/ilmhoaE6S1Vlz5pYmPnz52vPWr16dfUWJisrKygoSKTWS5cu6Sz40Ucfifd8++23dWbFxcXVq1d+49XGxkanlq+srOyBBx6Q2/eamHj1b3Xpz83KyhINUO3t7bWzn/Drr7+KZQcPHlxWVmZsqzZu3Pill14SiUX4v//7v8om3i1btujPGjVqlGhAm5qaWl171sRTT/+b8JarYOKmqJ2z2LzvJe0fF53EK9NPvGZ8h8unib29vXZzA53toJ14zT6zAOVhPF6F0xRniT+83Wy7tPYY0KP8C1HHtMeblz+4oi5du/2y6e984ESa3EBaZ1Zjv3q9O5r/cEgDT3s5xwoP3OffwLs8hkWcy8jJ/7ff6SspBYt+viCK8d8ZHXUe5OnQwn3i6OCS0hs/NibKzit+46vyIXPtVFZvT7kRaWSuTqrpE8oHWU3LLPxq1Y3xXWtC3JW8+a91EuFTsFNZTRl7Y7Ps/udGV6L6YhNzv5jRsUXjfxuq1feyf2hgQOsmrlVcQZWNpX99x+fHhVhpPaEttA9x69OpfI8vX3/xfz/u//r4u1O5+eU9wTwxsnGX1jc9tGxhIc2f2amsMmNFa0rypFoXGxu7YMECcT0h2NnZvfDCC+Lvv//+25Q3uXDhgnjiq2nTpvpzn376abOLd+nSpfnz58vjAJefRA0ajBs3Tn5mLDs7W1Rb2dnZvffeezqLu7q6iiqatLS0//73vxV8kJ+f35QpU7SnyG0av/3220cffTQsLEyepVKp5LqUnTt3ytOzs7PFGKcqlWrOnDk6H6FSqebOnVs+GFVp6UsvvaQ9S/5oUXWjo7Cw8LvvvmvUqNGQIUO0P8uMFa+5PWUiHx+fV199VXvK+PHjxdOhx48fz8nJkadX156tQIMGDV588UXtKQ899FDDhg2rsTCfffbZpUuXRJ7Rf3Rz2rRpopLq448/zsq68YsmzJkzJze3vBuIiRMndu3aVXuWhYXFggULyir15WKaL7744uLFi5IkPfvss9oPbQqjRo0S/bRv2bJl8+bNxt7E3t7+888/t7T89xrskUceadeunYmPiHt7e3ft2nXQoEH6s0T4zM/Pl+Nr1fesKaeen5+f9qlnultuito5i83+XqoWt/wO1z5Nnn322ZCQEJ13cHV1FXcKquXMApSHxKt0JTd+tL6e3WXP8hsPcuho6n/jqbxDUeUh1kRW1+tOS0o12/Zf1Z/79etdjqwa7HS9Zq+yxg0x8CRVaPMbTZdjE/8NPD/+fqm0rDxg9Qz1buhjoMOG8UNM7QJE6z1jRaju19XXzdnAGK1Deze88SzT+vKLnhri5Wbbv5vu7YkOLW5sBJ2+vrS5Oav0n2pe9GbXnd/2r+IKNg9yvrBpxIMDypta6Wt2/ShKyyyMvXJT2UpKNT/+fuP+97jBBnaHl7td3y63+4AfXl5e8nNQso4db1SV63TEYozcMFW0RtOZ2759+4iICHHpVllubm76vZt8++23e/bsEX+vWLFCXL/279/fza284bqO4cOHiz+WLl1awQc9/PDDOlOaNWsm992lP7dDhxstQcTopjqF6d27t8F+U8LCwsTF7rFjxw4ePKj96eIR4p9//lm7txhhzZo1165dmzRpkvals3krXnN7ykSPPfaY/kR5Y4pL2OrdsxV45JFHarQwGo1m4cKF4m+dpyIFGxubgQMHihT3888/y9NLSkpWrFhRQSG9vb3vvfdeqVrJbWVFPjT4GnkgbrlmUt9TTz2l88R7p06dIiIi9E8igxYvXqx9amiTQ7ixF5ixZx9++GExCnHFp555XVvfclPUzlls9vdStbjld/gtTxMxToGLi4v8hWz2mQUoEolX6SwM/AJl5RbHJuaej8sW/8VduZEhU9L/7UT0lrq2uVFZ9/DMvR8tPXUt699eB8tvT3rbt23mqt1ds+naNTPwk+brcaMDquy8f+t49x6/0QNq55trDmVtm7pVql/l8sqoQ0k6K6ijsV890Qo3Ka0gNtFo8qyits0MlLy+p4GNoKNdiJv82HPNrWBJqSYpreBCXI58FOUWFBs8iiLPZ4gK3vKI+L8nrnWIh4dvZ+3bt9fvC1Su8s3OzjblTYKDg0Uru8OHD/ft21enZtjKyqpdu3YV9NxbgdDQUPkBPIN27Ngh/jA2/FJwcLBo/3n16lXtK10d7du315liYWEhX4Pqd94rdy2jXV8kF8ZY59iWlpZyK8o///xTnu7o6CiiYFFRkX7/NwsXLrS2tn7qqaeqvuI1t6dMJK/+LY+36tqzFdDf6aI/3uoqzMmTJ0Vf1iqVyuBnSZIkP6MoB4DybupPnBAVvBUcSwa3ZFWcPHlSjNZrYWEhh0Nj98L27NlTXGz4u1o0ka0WWVlZly5dOvc/cgtbeVThqu9ZR0fHRx99tIJTz8rKSufUM90tN0XtnMVmfy9Vi1t+h8uniYWFhbGjum3btpmZmW+99VYVzyxAkRidSOmsb3R3JEnSqZis+SvPbt13VR4pR0eR1iA3t/TMmKZLf405FZOVry59c0Hku+FR/br6jgjzG96noXZbXDPo9+h7/dnLG9G9VKuV8oXLNy6jA68PRGRgKZWlk4NNBflQ35mLN37mT8VkGWu3rLK2Kiwq31anYrJMH+uoUjyv9wWlw1Z1YyOUXa/ZNkinb+rqXcHikrKlv8Ws3BR7/Gy6saNFLCi7EHdjH3m72+mMq2R6mW9iUQf36fR7ghVN7MQf+hUIBllZWc2fP1/Uq+zZsycsLCwgIGD06NGiGWRVRv685QgTp0+fFn+cPHnSWOtWlUolRss4efKkePRLn8FRjkW3n/bX6b+n/iY6c+aM+KOCUVjkjkxPnTqlPX3KlCniWbuFCxe+/PLL8m2IqKio/fv3P/DAA/L1elVWvOb2VLUfb9W1Z+uwMPJSDg4OxipF5TFyTp48KU+UxxDy8fHRP/aEah98RT56vb29dUYq0j96CwoKYmNjDbaqrXrBTp48+cUXX2zZsuXqVQPNrERj42r8WnvuuedEhaHBU2/MmDHaD33cDl9flT2Lq/K9VHW33AimHHg6zD6zAEUi8Sqchc2N6pfwny+8/Mk/pWUaK0uLAT3qtw9xc65nI36y8tWlH3xT6S87W5Xlzm/7vz7/xLL1MSWlmpJSzfb9V7fvv/rinCN9OvlMn9Divu5m/v7JA95oszRUV5uVUyT+EB0jGS6nrZVUmcSbkX3jKuHnbXE/b/t3JD2D0jJvcUlhNpWhUWpNqTO3NbT1qmUFU9LVQ5//K/J8Zvk4or4Og3o2aOjtYGN9o0ibdieKR7t1ZOaasI/+l+RNYWGjO5ZGLdAfU1fc8q/s+zz88MMuLi6vvPLKuXPl9xri4uLmXeft7T1x4sRXX33V3d1wNXjFDA6/qS09PV388dN1Fb84LS2tUtvhlrOMFUb0OWSQaEIpSZJOE8pWrVr16tVr7969MTExO3bsuO+++8R00dBU7me16iteQ3uq2o+36tqzdVgYeanMzEz9BxGNLSVef8sDycRsYLpKHb3iADaYeG95zlZswYIFU6dOLS0ttbKyGjRoUGhoqLOzs0ih+fn5cg/A1fi11rp16x49euzfv9/gqafzeP9t8vVVqbO4Kt9LVWf6RqigeMYWqeyZBSgSiVfhLGzLn5Dccyxl6kdHRb9E2xb102lEmpVbbEbiFe+24PXObz/Xdu32uJ+3Xd5/orz9jEYj7TqSvOtI8mPDgha/1dW8hs0msrKy1K/4rSLr/0XNd59vO7jXjSdajRH9ad1ZzF7BR/+zX8TdiaOCv5zVWaft9NU0tcHEay3vI+P10pViYXeLMt/mhg4dOmTIkN27d//444/r1q0TV04pKSlz585dsmTJpk2bdDrgqRaiGlaSpA8++GDo0KEVv1h0XVNz5MZ7FdSNy7Pkksuee+65vXv3ikttcdmdm5u7YsWKkJCQvn37VuOK18meuqP3rHmFkZfy8/PbtGlTxUtpV82ZciDV7dFr8ACuut27d4tu81xdXXfu3KnTxjUrK8vExFtZU6ZM2b9/v/6p16RJE3mgsppQO2dxFb+XapoZR7vZZxagSCRehbNwKG+EM3/ljcar059oUe3PTHq52U4Z22zK2GaJyfmrtsR+/fOFxOR8SZJ+2HSpbTO3lx7R7VGwGrm7qEQL7exco7W4+QU3HiI1kaer7dXU8vf0cLVt2+xG/8ZKYt4KRl3I/PtoshjX9/MZHSt+VFib+/86x6poH6krsY8s7HX75brjWFhY9LluwYIFf/755+LFi3/55Rdxl33UqFExMTFiSM9q5OnpeeXKFfGH/tO2tUwuTAW9g8qz9BtejhkzxtPTMy0tbcOGDYmJiQ0bNly5cmVubq7BWqYqrnjt7yll7NlKFUbexSUlJZVaBbmCroIDKS+vmrt2l0trytFrrOVwFX3xxRfij5kzZ1b7g8oVePDBB6dOnZqenq5/6ul3c1CNaucsruL3UgVxtKDA8HNklSJ/oondRlTlzAIUiZ6rFM5C5SlZux4/e6NxS4/2BkY+kAeLq6KGPg7Tn2h55rfhY/rf6M73+4012JuxJEny+LQX4v/tF0dbdl5xXiUTr9wf8iWtTqGVxLwVlA+h0BbuBh/HNXYUyfsoI7soPftGC2cdiSnlt0hMYuNhYaOc2xDW1tYDBw5ct27dvn37RPPLpKSk7du3V/sHyV3piFFV6pZcGO0OnHXI3V/r92qjUqkmTpx4/Wn2siVLlogaJzs7u8cff7zmVrzW9pQy9mylCiMvlZycnJ9v8lfB9X56xB8ZGRlyA04diYmJUrWSS5txXcVHr4eHh7+/4c7tq0J+9lIMg1RDP+j6bG1txfjb2qeera2tPNx0Damds7gq30tyBazBA7haDkK5eOnp6SaOJGT2mQUoEolX+Syd28qdCdkYejq0gsq3Crz1deTjr5c3cNJhq7L8ctaNrg6NdZFVXfp2vjGqzR4j49MeOVnph20G97rReeOBiBsdQevbcyyl0X2/Nh22oaCw0q3pau5ypEZXsOJDqIKjqIm/kzxw1N5jhnfT4ShTd5Ol87+DE95xTp06NWrUqI0bN+rP6tGjhzw+pLF+aKpCbgq4b98+Y6/ZvXu3r69vYGBgtdRIVEAetFM0TtanVquPHi1/CkOSJDF4ho7JkyeLOqXFixfv2bMnMjJy3LhxBoctMW/Fa25PVfvpf1vtWfMK06hRo1atWomNU8GgL8OHD/f19f3kk0/kKU2bNvXz85Pf1uBS1T6KTKNGjeRBU42tptzt7eDBg2ui8lPukspg29oaHVh18uTJ4g/51HvwwQcNdmhXjWrnLK7K95Kr6437sAkJCfoLiqbg1XjgGXvDzZs3BwYGhoaGiu8Zs88sQJFIvMpn6RLa2O9GVwfHThu4Ef63kbhYsf0Rqau3xokGzDoc7a2trj++W9+rZh9zfXBAgLNj+U9+1IXMI6cMpKYlvxi9WWvMiL5+Qdd7J95/IvV8nOHmQ4vXRqekq7u28TDW+bA+e7sb94CLS/7tynjL3iudx2955u1DUi0ybwXlQ+jEuQz9J3LLyjTySFH6nrm/ifjjm3UGdsfpmKyDkUb7zFi34/LUuUe37rvyv4P5xk3rO1FaWtr69et/++03g3PFSLPlz07XwLA3o0aNaty4sbhkFJ246Fu4cGFycnK3bt2MdXtbXUaPHi16Qz127FhkZKT+C9asWSMuW0eNGtWkyY2DR1tQUJC44rxy5YoYr0i/z6qqrHi17ym58bP2WDXDhg1r37794cOHJaXsWbMLM336dPGHqDnUd+7cuU2bNqWkpAwbNkx7+qRJk8QfixYt0l/q1KlTBw4ckKrbK6+8Iv747rvv9OeWlpb+8MMPOq+sXmIjS5IkBzBtu3btkmpMkyZN+vfvb8qpV41q5yyuyveSo6OjeH74woULYkAgmUajEd3LV518OC1fvtzgC5YtWxYXF9ehQwf5PovZZxagPCRe5bNw6fjg4BsP03687LROvWtSWsFbXxv4cjfRO+FR+hN//TNehKIH7qv+Bl3a6jlYv//SjadTnn7roM6YwCs2XdpxIMnBrnL9MVhZWix5p5ulpYVGIz3z9iH9Wtwff4/9eVucncrqzcmVqG/0dLUVnRVfSfl3+++PSI08n2ll8jOx1cK8FewV6i3GEEpJV3/y3Y0xD2Qff3f6kvGhiV96JCTg+vBR2/dfXbz2ptCbmVP05BsHfP432LKOzbsTH565L3zNhZEv/b0vIlWycrFwMTyo4B1k1apVZ8+e1ZlYUFCwYcMGUVdw7733VvuHWllZLVu2zNLSUqPRPPnkk/p1fStWrPjpp5/s7Ozeeeedav90/cJ89913okvYyZMn64yhcvXq1ddee008pWlsRA3tvmHj4uJCQ0ONDelZlRWvxj0VHBys074xJyfnjz/+OHHiRBV7k7rd9qx5hZkwYcKAAQPENv/11191lsrLy3vooYckSXriiSdatGihPWvatGkipWzdujU8PFx7VmZm5mOPPaYzWlW1eOKJJ0Tq++WXX/SrED/88EPRLHbGjBnGBkGtonHjxok/5s6dq9PQ4OrVq7Nnz5Zqkvap16ZNm+7du9fox9XaWVzF76VBgwaJfDt9+vSSkhvPUhUXF7/44oum92Nv4oH3888/b9myRWfuxo0b165da2dn95///KfqZxagPBZ13sYStaAg9sd+I6eKmjRXJ9UrE1p0bOnuYGd9KCrts+VnQlu4bdtX/qvp7W43sEf5kEIzJrZsFnDjDqgx9z375+7rlcNj+vs/fX9w8yAXS0spIbng153xX/54trCorGd7ry0L+9mqyn8/Zn5x/FpmYXp20ebd5Rd8jf3q9bz+RPG0x1s42Fl9sLi8p+i/jiQnXK8xHn1vo3r21vd1rz92UHm3W0+/Vd4a58ipa2cvlVdI3te9vq+HXfMg5+lPlLfw0Wikye8dWra+/PEeHw+7p0Y3adHYOTuveMveK5v+Tlz+QY9XPzuWkq72dreL/2O0eLL35Y//KR/LMS7nUFT5BunaxrNZQPmQA1/O6ixXaa7ZfnnimweKisuaBzm/9lSr7m09VTZW0fE5yzdcXLn5krWV5fcf9Li/f+W6UHpi9oFVW2IlSfr2nW79uvhGnEuf+ObBjOyiHd/ce08H7/+uOBt1IVN/E4lSbdyVsP6vhKKSstVb43T21JY9Vwwu6OFq+9E0o52amLGCm/5OfOCV3eILY2DP+o8MCQps6JhyTb3y99gdB5LaNHUVnXXr7CAh8nzmgEl/Zlx/jnfIPQ2H9Wno5GB95mL20t9iPF1tnxjZePpnx7T3xeczOjo72ry5IPKjpTeGPfxoWugrr862qn9/pba56LRDNGDLzc1dt26dGH5D1E54enp++umnBpf6/PPPIyMj09PTxRVtcHCweGRu4cKF9vb269ev//XXX4uKilatWiWGAxWXOwMHDty2bZskSTt37oyPjxfdLNWrV69JkyazZ8/++++/w8LCxOtnz57dr18/Ly+vjIyMyMjIjz/++MiRI9bW1mvWrBk1atQtV8pY8SpYI0mSVq9e/fjjjxcVFbVo0eL111/v0aOHSqWKjo5eunTpDz/8YG1t/eOPPz7wwAPy6y9evCg6fdVZnYEDB44fP/748eNibMy1a9fm5eXZ2Ng8/PDD5VX6zzzTs2dPY5to+vTprVu3liRp5cqVTz75ZHFxcYcOHd56662OHTsWFxfv2rVr9uzZiYmJnp6emzdv7tKli7F1KS0tDQwMFG0Iv/nmG7mNYrWseDXuKeH8+fPNmzfXaDS9evVavHixSqV6++23V6xY0bdv3507d1a8ncX1aHnj/8OHxZicAwcO9PX1bdGixcyZM81bwQrUVWEyMzNHjhy5e/duKyurKVOmPProowEBAampqYcOHXr//ffj4uJ69eq1detWR0fdoddPnDjRt29f8UjtsGHDRowY4eTkdPr06SVLlnh6ek6cOHHatGmSJHXr1i0kpPzO7/z58+X6PX3Tp09PS0vTP7MkSXrzzTflytWMjIzhw4fv27fP2tp6xowZ48aN8/b2jo2NXbhwoah/e/LJJxcvXiw/3mlsq8rni1QZRUVFYWFhovra1dV1xowZnTp1cnR0PHDgwCeffNKhQwcRh+ST7j//+U9ISEjV96xQUlLi7+8vkvbXX39d2XGJzN4UtXMWm/29dOHChTZt2oic7Ofn17VrV41Gs2/fPrVaffDgQZEn3dzcRowYIUnSQw89dPbsWTO+w+UDz8bGZsaMGWPHjvXy8oqNjV2zZs2XX35ZWlr6/fffiyGIq35mAUqjwV2grDg7bf8Tz4xpovMQpqO99bvPt72yUzdF/LH43sJ/xlf839GfBk9+sKnB4XncnVWznm6ddeAh+cX+9Q1/mW76KmzP8vIbkPpeGB8iljU4t3dHb/nNC46M+2x6B9G8WVbfy37NZ/cU/jPe63rNpI+HnXixyL0Gpfz9gPYKHlk1+L7u9fUfwurd0fvAioG33D76/13ePjq0+U2PGtpYW340LVTMNTZ8sSjVG5MM1yf/sfheYwv613esuDxmrOCWr/s2vZ5ItfVo5/XP6sEvjA8xtoPEf6d+Hdan043nrgVLS4sH7vNP+fuBr2bpVtDF/zG68J/xe5YPEJ1C29taRf42tqwk34yDX61WG9w+kiQFBAQYW8rg46Pi6kGj0bz99tsG54pKAH3i6ic/P//bb78NCwuTr4Nv2mK9ex86dMjElTJWvArWSIiIiBg4cKD+s4VhYWFHjx7VebGxR7+mTp2q0WiMNRdctmxZBZto69at8vsfP35cHtVTZmNj89hjj8XHx99yI7z33nuidWJubu4tX1ypFa/GPSX78ssvdap62rVrd/ny5VtuZ2N3pfv06WP2ClagDgtTWFj46aef6veC6+Hh8c4776jVamMLnj9/XmdgKktLy4ceeigzM1On4ld0VlTB6gcElN9mNejgwYPar1Sr1R9//LH+I6zBwcErV640cavK50tl5eTkTJo0Sec5XkdHxw8++EB/YNVdu3ZV154V3njjDfFx2dnZlS15VTZF7ZzFZn8v/fnnn40a3XSbuE2bNpGRkfrbdu7cuWZ/hxs78Nq0abNz587qPbMAJaGO925Reu3v0rhF6dlFB0+kJqYU2Fhb+vs69Aj1slNVdRC2S4m5p2OyUtLVhUVlTo42zQKd2oe4GevfqOYUFpXtOZYSdzXPTmUV2NCxe1tPMRSwe681eQUlzQKco365xTh+BqVmFB6OSku6Vv6T4ONu17GlR1XG4NVopKOnr52OySooLPV2s7ung5cI5HWosiuo0UgnzmecvJCZW1Di7qzq1MpDfsTXFNGXc46dSc/MKfb1tOvcyuOWT3qfuVj+lG+fTj5Ne75q5XGPpAh5eXlRUVHR0dHZ2dk2Nja+vr4dOnSo6bFStaWmph48eFBc+vv4+HTq1Kk2P11HSkqKKIyNjU2DBg169uwpKnxuhxWv3j2Vlpa2Z8+epKQklUrVsmXLbt26VXu3RrfVnjWvMGVlZUePHo2Ojs7IyHBycgoJCenQoYMpw59euHDhn3/+yczM9PX17dKlS008D2+wtEeOHImJicnKyvLw8Gh1nVRb0tPT9+/fn5iYaGNj4+/v36tXL9EFcU3bsGHDyJEjn332WYOPT9e02jmLzfteKi4uPnDggGjW3rx58x49ekg1fOBlZma6urq2b99e7teq2s8sQBlIvHeRksvflqX9Kd1NMnOKfMLKG7Le29X3969vqgTAHcTSs7+1f/mANACAuvXAAw+sW7fu+PHjNfSgMgBUO3quuotYNXrS0nuIwm5x7D+R+vRbBy9fNTy07IETN9p39enkXbvlQvXQaCRL76FWjcofMAMA1K2UlJT169d37dqVuAvgDmLg8QYolYWFpbXfo5YefTR55yWliN2//YdNO5q2CZv18k29NQjz1756fYhgm6eef9PK68aIebhzWFjWa25hVxutEwEA+p544onRo0ePHDlS/HPBggUlJSWV7bAKAOoWrZpxZ1u+fPkTTzyhUqnWrl07fPhweXp+fv6MGTPEOHgLFy6cPHlynRYTAIA7j4WFRY8ePURnvxcuXOjYsaOzs/PFixera9AdAKgF1PHizubs7GxhYVFUVDRixIhWrVq1adPG1dU1KSlp9+7d6enptra28+bNI+4CAGCe/fv3h4SEBAYGHjhwoKCgYMWKFcRdAHcW6nhxx0tISNi0adPevXvPnDmTkpJSUFDg4uISGBjYr1+/p59+2sfnphFxAACAiZ5//vnDhw9fuXLF2tq6ZcuWr776ar9+/eq6UABQOSReAAAAAIAy0VczAAAAAECZSLwAAAAAAGUi8QIAAAAAlInECwAAAABQJhIvAAAAAECZGI9X+b744ov169fL/3R3d//ll1/u2mJAkqQFCxasWbOmhvbFuHHjkpKS5H8OHjx45syZ1fXmUMZBAm3btm2bM2eO9pTVq1czrNptKy8vb+jQodpTXnnlleHDh0u3GY4rAJCReJUvLS0tNjZWkqT4+PiysrK6+sGrYjGysrKGDx9+4sSJTz/99JlnnqmxYt4V0tPTa+6QSLiuqKjo6tWrkiQFBgZW45vDPN9///3UqVObN2++efNmd3f3Oj9IoC03N1dsajGcuCRJarW6rgsFo8rKysT+ysnJSU9PlyRp/Pjx0u2H4woAZIzHexfx9fVNTk728fHRroK7U4qxaNGiyZMnS5Lk4uKSmZlZkwW8i5ixLwoLCw8ePChJkqenZ6tWrYy97MSJE+3bt5ckacKECcuWLau+IsP8HS1J0rx586ZOnXonfm/c0c6dOye2XqdOnRwdHY29bNSoUaIhTGxsbEBAQO2WEZUm/yqFh4dPmjRJul1xXCmSib/FAATqeHFnaNmypfijRYsWdV2Wu1pSUlJYWJgkSSNHjvztt9/qujgwSatWrUTi5fSpE3PmzFm+fLkkSREREe3atavr4gC44/FbDFQKiRd3hnvuuWfPnj1RUVHjxo2r67IAd5jffvvtxx9/bNq0ab9+/eq6LAAAALWKxIs7Rq/r6roUwJ3Hycnpdm51CQAAUHMYnQgAAAAAoEzU8eImZ8+e3bJlS3R0dHZ2toeHR+vWrYcMGdKgQYOKl8rPz9+xY8e+ffvEs4IeHh4tWrS45557QkJCTPzcS5cupaSk6Ex0dnZu0aJFWlpaTEyM9vTQ0FCVSiX+joiIKCwslGd5eXk1btxYkqQDBw5s2rQpPj7eycmpa9euDz74oL29vbFPP3bs2Pr16y9fvmxnZ9e4ceMHH3xQ9DB87Nix4uJi+WXe3t5BQUFS1eTm5u7atev48eNxcXFqtVqs44ABA4xtqxpdwUoR+0j0wCz68j106JA818LCokuXLhUsXnGB1Wr1iRMntF/fpk0bBwcH+Z9Hjx4tLS2V/9msWTM3Nzedjzh69Oiff/4ZHR2dn5/v7OwcEhLSrVu3Ll26WFpamnEQ2tjYdOjQQUxfu3btxYsX1Wq1v7//yJEjxXSZsUNUrVavXbv2+PHjKSkpTk5OISEhI0eO1N/yppx0xcXFx44d0y9zcHCwp6en+Ds+Pv7KlSvac319fTMyMgweP9V4kERGRm7duvXixYv5+fkeHh6hoaGDBg3y9vauYJHs7OyNGzf+888/aWlplpaW9evXb9++fb9+/by8vKSaPKGM7ans7OyVK1dGRUXl5+cHBQWNGjWq4qdttb/xbGxsGjRo0K9fv169ellZWRnca6mpqWJKZGSkdn+5jRo1quDbtbKlysnJ2bZt28GDB1NSUuzt7Rs1atSvX7/u3btbWFiY+K1y+vTpX375JTY2trS01NfXt3Pnzvfff38Fn1jZfap/GAcFBXl7excXF2/evHn//v1JSUkuLi6dO3cePXq0k5NT1de0WhbMycn59ddfjxw5kpWV5evr26NHj6FDh9rY2EhVY/qJUy2/AuYdV6dPn96zZ8/p06fT09NtbGx8fHy6des2aNAgW1vbmiun/JWYlZXl6OgYEBDQvn37sLAw7V+Eat+Yu3bt2rJlS0pKir+//9ChQ7V/zkpLS9esWXPw4MGMjAx/f//Ro0fr/ASYVxizv46q+FsM3KU0uGuI8UV8fHwMzo2NjR02bJg4KpycnAIDA+3s7CRJsrKymjJlSk5OjrG3DQ8PF9fcFhYWDRs29PDwkI+uZs2aff7552VlZbcshsEml3369NFoNPo9/cbGxsoL6vQ8OWHCBLVaPWbMGJ1F/Pz8oqKi9Aufnp5u8JJu5syZpaWlOiOyTJo0SVMFKSkpY8aMka+T3N3dAwMD5eg+YsSI5ORk/aVqYQWNHRI6Km4Wa2trq/3iiIiIShX47NmzOi+IiIjQfkMXFxftub/99pv23Li4uN69e4tZTk5OAQEB8ob18vKaOnVqUVFRZVfQx8enpKRk+vTp+it7//33Z2RkyAsaPET379+vP6LPvHnzzDvpjPWTvGzZMvk1+uMeT506Vf/4qcaDJCYmZsCAAeLFbm5uAQEB4vBWqVSvvvqqsW3+1Vdfif6KLS0tGzRoIF8IWlhY9OnT56+//tLU2AllcE/t2LFD5+gSm87Y5y5atEh841laWvr5+cl7OSQkZPv27dqvvGXv1nPnztV+/ciRI80u1fz5811dXcXBExAQIH8Pt2vX7uDBgzov1j8qioqKJk6cqPNxLi4uJu4LE/ep/gYJDw8/ceKE/p1ET0/PdevWVX1Nq77gunXr5JtKsuDg4MjIyPDwcHktNJVR2ROnir8C5h1Xy5cvDw4OFi+wtrYOCAiQd6unp+eKFSv0F6liOTUazaVLl+SvxHr16gUEBFhb36iYsbW1HTdunP6C1bIx9b8Ax48fX1JSotFoLl682KxZM52506ZNq/qeNfvrqFK/xQAEEu9dpIIr18jISDHXz8/v999/Ly0t1Wg0arV68eLF4q5qaGhoWlqa/oLyN++zzz579epVMTE1NXXmzJlyxZparb5lMXbv3h0eHi46HuzUqVP4dRs2bNBoNOfOnRP/bNu2rfyrIC+4cuXK8PDwWbNmyb9e48eP9/T0fPXVVxcvXjxnzhy51/6mTZvq/N7k5uZ26tRJzO3bt++WLVtiY2OjoqLmzp3r5OT0+uuvi6I6OTmJAuzevbsq218OgWPGjLl48aKYWFhYuGrVKlENEhISkpWVpbNULaygiYlX7KMPPvhAvGHbtm3DtXzzzTcGV1YU2NXV9cUXX5w/f/6bb74pXz1oFzgjI0O8T7du3Qwm3qVLl4aHhw8dOlQ/8ebk5Igr5s6dOx87dkxMLC0t3bZtW9OmTcXrMzMzTVzB8PBwUbnk4+Pzn//8x8nJac6cOVFRUbGxsVu2bOnTp494w06dOuXm5ooFo6Ojl10XGhoq5v7+++92dnatWrWaPXv2F198IQ/XqZ14K3XS5efnh4eHv//+++J9nJycFi5cGB4efu7cOfkNDx48GB4ePmPGDEmSunbtGh4evm/fPv3jR2etzT5IIiIiRBIICgqSI01OTs7cuXNFjdmAAQOKi4t1lvr6669FEPrss8/kDZiamjpt2jSD13bVe0Lpf5ls2LBBpVINGDBg3rx54eHhTz31lHyFvXz5cv0Pfe6558TcyZMnJyUliYlnz57t37+/yHtLliyRXyz2mvZRPWvWLO2z5vjx4waTiShV7969586dO2/evEcffVSuPTZYKnmI8mnTpqWnp4uJR48eFQeknZ3dtm3btF+/du3aZcuWvfvuu/JRMWHCBJVK9dhjj33++efvvPOOv7+/6YnX9H0qbxD5jHjjjTfc3d379ev3+++/iwPvww8/FMe/hYXFTz/9VMU1reKCq1atEgezo6Pj3LlzT548Kb4H7r33Xg8PjzfeeMOMxGvGiVOVXwGzjyuxlJub28qVK+XyxMTEyPtu0aJFOotUsZwREREiVDds2HDTpk3iK7GkpGTHjh2tW7cWC86cObOKG1P/4H/44Ye9vb2nT58+f/78l19+WW499Morr2RlZfn7+zdr1uzNN9/873//O3HiRPkW248//ljFPWv211GlfosBCCTeu4ixK9esrCzRqsfe3l77Alr49ddfxbfq4MGDdWprv/zySzHrySef1P+4jz76yPTEq9FoPv/8c3HNbaw+WftGtbFr38DAwJCQkJSUFHmWWq0WA8OKnxPtpV588UUxfeTIkTqrdvToUXt7e/FjY2IgvCVRyB49eog7x9qOHTsmbhDMmDGjgmVvhxWMjY2V3/OWKysKHBwcfOXKFXlWQUGB9g+8zoITJkwwmHiFt99+Wz/xfvHFF2KiHHtk0dHRourJlMSrc4haW1vb29sfPXpUe1ZpaalcBfHSSy8ZO0QbN2780ksviSs24f/+7/+0E6/ZJ50cqvfv32+w8KJSeuPGjcZuQOi83ryDJCsrS9xlcHR0vHTpkrFz/+2339aeXlxcLCrWHnvsMf2Si6FNK5t4zTuh5D0VFBQ0f/587VmrV68Ws0JDQ3WWWrBggZg1ceJEnVmFhYWdO3cW9Yd79+6t1FFtsFQff/yx9qwff/zRWKnk7+Hnn39eZ1ZGRkb9+vVFpZz2l4bOUREUFOTj43Pq1Cl5VmJiooODgymJ17x9KteO2traPvDAAzoH3r59+8RRV69evcuXL1d9Tc1bMC4url69euIBB51K4LKysgceeEBu2Wt64jXvxKnKr4DZx5VYasuWLfolGTVqlCRJDg4Oqamp1VVOecvY29ufPXvW2G7STrzVsjGDgoLEw1PyrHPnzok96+jo+NRTTw0dOrSwsFCe+8svv4gFO3XqZLD8ZhTGvK8jE3+LAQgk3ruIsagppwhj15pyD8nal9FZWVmiKkylUhlsjqtWq0XjHFMSr7grPGrUKJ0XVzbxSpK0Y8cOnbnffPONmPXKK6/IExMSEsTtbWtr6/j4eP2Pe+mll8RS1ZV4T58+HRAQoF9rIdx7773iqkvn4u92W8HKJl5JkrZu3aozd/HixfoFNjvxPvjgg2I1tROmTFQLm5F4jZ0RsbGxYsNaWVklJiYaPERbtWqlE8OOHDnSrl27lStXVuWk0950jz76qP5SarXaw8OjUaNGOpvCWOI1+yB58803xXSDkbKoqEjUdTg4OGhv+dOnT4ul3n33Xf2ljh49WqnEW5UTSt5TPXv21J/bsGFDMTc7O9v0b7w///xTLNWhQ4cqJt5u3brpz5Wf+DVYKjs7O7nqUpt8P+j111+v4CRdvXq1ztyJEyf26tVLcyvm7VM58RrbmE8//bR4wZQpU6q4pmYvKOK6sedZxCPclU285p04Zv8KmH1ciVrxrl27GlyLvXv3ikW++uor/bnmlVPeMsa+AURo1E681bUxd+7cqTN37Nix8vEpN16TNWnSRH+LVaUwZnwdkXiByqKv5rud3CZNkqSHHnrI4GvkIXDlO+WSJK1YsSInJ0c8bWuwfwhbW9vBgwfrP5Gio6ysbNKkSR9++OETTzyxdu1ag/1hmM7b21t/xNGOHTuKP7R7iVixYoXoCemee+7x8/PTf6tHHnlEqlYtWrSIjY2Vf0p1iLa+aWlply5dukNX0CAvLy/5uaaKC2w2kdlKSkq2bNmiP3fRokUREREV9IJTgYcfflh/YkBAgIijpaWlK1asMLjgU089pdOJUadOnSIiIsQbmn3SiSI5OztLkvTzzz9fu3ZNZ6k1a9Zcu3Zt0qRJJnbWZd5BotFoFi5cKP42eDzb2NgMHDhQ9PD0888/y9PlbSKaLOos1b59+4iICNEqu9ZOKIMrKHdLo72s/I3Xu3dvg994YWFhojX1sWPHDh48KFXBY489VtlS9e/fX78vN0mShg8fLv5YunSpsY9zc3PTf47x22+/3bNnzy2LWsV92q9fP4Mb89FHHxV/rFixoqSkpCprat6CJSUl8tlt8CDx9vYWd1VMZ/aJY/avgNnHlSRJixcvNnYYy0+mVHycm17OW24ZSZIGDRrk4uIid3lVXRvTx8dHPE5lcJuEhYX5+voam3vx4sXqLYzpX0cAKovEe7c7efKk6J/WwsLCWPeD8k/Unj175L6Ld+zYoTNX36pVqzIzMysIsUVFRWPHjl28ePGLL764dOlSnZBghnbt2un3uin/YmVnZ8sT5Ys5Y70aGnyr6lJSUnL16tXz58+f+5/c3FwxS7/P6jtxBWXt27fX/xTRPk2nwGaTH5J86KGHPvzwQ50c2LBhw3bt2pmYALVZWFgY68JU3qRyXYcO0cC12k860WROXLYWFRXpd3yycOFCa2vrp556SjKNeQfJyZMnRefDKpVKbqOoQ37uTjs1BQcHixawhw8f7tu3799//629iJWVVbt27W7ZM3z1nlAGy2/whJK/8eTHnnVYWlrKbc7l+l7zyO9zy7NGLpV8FugIDg4W38BXr141dsUcGhoqPy5YWVXcp8aOf/kMysnJiYqKqsqamrfgiRMn5EPI2B43uJsqYPaJY/avgCkFNuXbOCsr69KlS/LJJdcuVtevlbxlLCwsjG3Vtm3bZmZmvvXWW7WwMd3d3cUfBt9Z7vNM3EmpxsKY/nUEoLIYnehud+bMGfGHt7e36CdWn9y3YUFBQWxsrOgNSF7QjHFuhLy8vFGjRonLkfz8/GpJX/qdaorGbOIP7SqI8+fPiz+MDThka2vr5ORUvb8xxcXFS5Ys+f77748dO1ZUVGTwNdoDJ9xxK1iVAptt8uTJS5YsOXnyZH5+/uuvv/7WW2/1799/1KhRI0aMkC/mzODs7GzsZo08wM+5c+cMvqDisXnMPumEKVOmiAdKFy5c+PLLL8snTlRU1P79+x944AH9SgljzDtI5IasDg4OOlXQMnkQmpMnT8oTrays5s+fL+ox9uzZExYWFhAQMHr06FGjRukP7XO7nVCmfOPJe+3UqVOmrUFVSyXvi5MnT/73v/81+G4qlUpshJMnTxrc0RUfrhWr4j419tEODg7e3t4iUJ07dy40NNTsNTVvQfnU8PHxMTaUTmW3m9knTnV9qVZ2wZMnT37xxRdbtmyRB8Kp6ZOrgq/EGtqY2qNLyOT26gZXQe4QXl6FOt+zAG6JxHu3S09PF3+ILjoM0m4Reu3aNXHxbcqCFVCr1f369Tt69KiTk1NOTs633347cOBA8UBmVcg/RdoM1u9lZmbesvx2dnbVGAiTk5MHDhwoRp319/cfPHiwn5+f/Mu6YcOG/fv339ErWMUCm83W1nbPnj0zZ85cunRpyXVbr5syZUrfvn1nzJghmpOZ8bbGZsmbNCMjo7LLVuWkE1q1atWrV6+9e/fGxMTs2LHjvvvuE9NFS2m5M2FTmHeQyOXPzMwUPXJVIC0tTfufDz/8sIuLyyuvvCJuFsTFxc27ztvbe+LEia+++qpcu3K7nVCV2mv6Dc4rxYxS/XRdpfaFrIrPklRln1Z8lonEK84ys9fUvAVNPDWkyqjKiVMtX6qVWnDBggVTp04tLS21srIaNGhQaGios7OzuL+Wn58v93VcLR9nxuVEjW5ME+fWTmGq9+cSuGuReO92cmO2Cm4fas+SLyhNWbACWVlZERERv/zyi4WFhei24ZlnnunSpYvOWHk1p4rlN8P48ePF1fnTTz8tWp9qz7169aopF+i38wrWgrKyMoPTXV1dFy1a9P77769evfqnn37at2+feLZq53UTJkxYunRpNV43yJtUPh1q56STPffcc6JB9ddffy0Sb25u7ooVK0JCQvr27Vu9JdEnl8fPz2/Tpk0Vv1i/lm/o0KFDhgzZvXv3jz/+uG7dOhEOU1JS5s6du2TJkk2bNnXt2vUOPaGqeGCYQf6gDz74QB67yxi5C5xqV137tIKNafaamrdgTXx/VvHEqU27d+9+4YUXxFfrzp07dVoaZ2VlmZJ4TWfG1r6tNuZtVRgABpF473ZyK5qsrCxjr9GeJb/e09PzypUrZj9bYmNjs2XLFtGtxXPPPff1119nZWU9/PDDu3fvrp3fA3d3d9FSq4IVz8vLq66Pi4yM/Ouvv8QQl/Pnzzf7qbnbdgWrncFLn4KCggoW8fLyeuG6hISElStXfvXVVwkJCWIkw3bt2smjg5ooPz/f2Cx5k5peIVktJ51szJgxnp6eaWlpGzZsSExMbNiw4cqVK3Nzc6dMmVILB4lcnpKSEmOPOlfMwsKiz3ULFiz4888/Fy9eLMb8SEtLGzVqVExMjBiR9bY6oeRvPFP2msHWiTVaKk9PT/P2RXUxb5+afpaZvabmLSif2tX4/Vn1E6fWyP1Xz5w5s7KPK5tB3jKmX07cVhvztioMAINoLHG3kzvIybjO4GvkPhU9PDz8/f11FoyOjjbjc93d3eVeHD/77LM2bdqIIUar985xBeQhYS9cuGDwBdnZ2dUYCOVneDp27GjwqbDyscLu5BWsLnJ0MXgpnJiYaMqb+Pn5zZw5Mzo6Wm4nr9/J0y3l5uYau/ySn/GTN3LtnHQylUo1ceJEUem9ZMkSUdlrZ2f3+OOP18JBIpc/OTm5gsRiCmtr64EDB65bt27fvn2ijWhSUtL27dtvwxPKlG88ea9V3HVZTZRK7ja2zlVqn4p7UvquXbsmtysWR6nZa2regvKpkZGRIbdZNe/rqCZOnJomn1/yMGm1c3Klp6dXcIvhtt2Yt1VhABhE4r3bNWrUqGXLluJv0RZUn9y14ODBg+VucoYMGSL+qKDpYP/+/QMDA28ZNuzs7FavXi0uW99//31ThsSoOnlgCZ3ORWWHDh2qxo+Te/gw1tzRxJ/522cFq/2iR3B1da3gUvjAgQP6E2fPnm1wGCFbW1t5xAhjPa9UzNgmkjdpZYcnqeJJp23y5Mli+uLFi/fs2RMZGTlu3DiDg69U+0HSqFGjVq1aiWOgguFJhg8f7uvr+8knn8hTTp06NWrUqI0bN+q/uEePHvIQrKbsrNo/oeRvPGMddKvVajH8rCRJxh4dr/azRm6ma+xAEi1UfX19AwMDK24iYZ4q7lNjx498QPr5+YnhT81eU/MWbNq0qTxe1+7duytVeGPMPnFqX8XnV7WfXNpficauKDZv3hwYGBgaGipOottqY9ZtYWrotxhQGBIvygeCF3989913+nNLS0t/+OEHnVdKkjR69GjRZ+mRI0fkjha1nT59+s8//4yPjzflwcIWLVqIXjTLysoefvhhYxVf1Wjs2LFiXNPIyMjDhw/rv2Dx4sUVLL5t27aPrqug30WDvftGRETot9ctKyur9pxfxRU0Rm6aqD1kzubNm9u3b//kk09KVdaiRQtjuWLLli0Gh1fZu3fvqlWrDCZkR0dH0UjevDFvvvnmG/2J+/fvFzvd2dnZ2NCRNXTSaQsKChKx6sqVK2K8okr1WVXFg2T69OniD1HDrO/cuXObNm1KSUkZNmyYPDEtLW39+vW//fabwUVESUzcWbV/QsnfeMeOHYuMjNR/wZo1a0ReGjVqlAhpFZ81w4YNa9++vcHNbrpRo0aJTbFv3z5jPYcvXLgwOTm5W7duxvocrooq7tMDBw4Y7Ndavlc1efLkKq6p2QtOmjRJ/LFo0SL9RU6dOmXwBlzFzDtxap98fsk3cbTt2rWr2j9R/qJbvny5wRcsW7YsLi6uQ4cO8h3A22pj1n5hTPwtTkpKeu211954441auKwCbmsa3DV8fHzEWAs600tLS/v37y+Ohw0bNujMlZsZz5gxQ2fWX3/9JXoD6t27d1FRkfasoqIi0VXJU089ZWIxNBrNAw88ID5r9OjR+nNFB1eSJMXGxurMioiIELMmTJigv6DcOq5Pnz7a00XftiJlpaWlac9avny5s7Oz+EUxWFSRMcTAmxoTqNVqseKiHltn7vvvvy+fkrt27dJfvPZX0JiysjLRnWbbtm3lif/5z3909rV5BdZoNJcvXxazHB0d//nnH3n68ePHfXx85CZ2v/32mzyrT58+kiQ9+eST+h+0YsUK8foPPvjA9HUUe8rBwcHZ2Xn58uXas1JSUkJCQsR7Lly40PRDtLpOOm3r16+XDxtR9WFMBbvDvIOkrKxswIABYsFffvlF5z1zc3NFo1CdnSIulO3t7c+cOaOzSH5+vhiv0tXVNScnR1PDJ1TFe2rq1KkGl5W/8bp3765Wq7VnXblyRYQ6d3f3+Ph4nTf89NNPxRv++uuvYkp2drbolzUhIaGKpdq9e7dcqvz8fJ2lxK0TOzu7s2fP6syq+CQ1kXn7NDw8XHy0r69vaGhoRkaG9tz58+eLuYGBgXl5eVVfU/MWzM3NlUei0jnZMzIyQkND5WHAwsPDTdxc5p04VfxSNeO4kodx8vPzu3Llivbrr1y5Itd+63+W2eWUvxItLCx+//13naU2bNgg9tGFCxdqYWPKDdPmzZtn4harSmHMO/FN/C2WH8O+99579d8cuHuQeJVv+fLlE64Tj1TZ2dmJf/7444/ya9LT03v27CkewZo1a1ZkZGRSUtLBgwcnTJggviuffPLJ4uJi/TdfsWKFaPXUqVOn9evXx8fHnz9/fs2aNeK53E6dOmVnZ4tXbt++3WAxtm/frtFoDh06NGHChBEjRsjXqSNGjJgwYcLChQv37t0rXtmoUSMxa8yYMRMmTHjvvfc0Gs1nn302YcKE4cOHi1nBwcHixeKy5rfffpswYcL48ePFXB8fHzFXXNmUlZWJhyHFhdcbb7yxatWqRYsWiWKsXLmygnAu/7ZdvnzZxB2xfv16+eb04MGDf/zxxwMHDvz2229jxoxxcnIS21+0h5wwYcLcuXPFUrWwgvK+0El3xoixN8XN+ISEhI0bN4rGtH///XcVCyzI96etrKz69Okzfvz4nj17WlhYTJo06e233xaz+vbtO2HChKefflpOvJIkPfjgg3/88UdCQsKVK1cOHz48c+ZMMfZJr169dPJJxeT9Li6Fhw8fvmjRolWrVs2ePVtOWRMnTiwrKxOvj4mJMXiITpgwYe/evcY+xeyTTlZSUiJfen7zzTcGX/PKK68Y3B1RUVHiBWYfJBkZGb179xa76YUXXjh48ODVq1cjIyO/+eYb0eN6r169cnNztQsjVw35+Ph8+eWXp06dSklJOXfu3Jo1a8SDr9bW1nImrIkTytiekr8MxVy5oYHOyaj9jdehQ4f169cnJCRcunTpu+++E338enp6Hjp0SL+o586dE0Xt1avX6dOno6OjH330UXEYV0upfvrpJ5GfW7RosWLFiosXLyYkJOzatevxxx+3sLCwsbFZs2aNdnmMnaSvvPKKiRu/ivtUTrxffPFF69at69evP3v27FWrVi1evFhuhOzq6nr8+HGdBSu7plVcMCIiQn5SYNiwYYsXL161atUbb7xRv379Nm3ayN07devWTWzArKysW24xM04c875U//jjD7OPq8LCwu7du8s74sMPP9y+ffu+ffs+/fRTHx+fwYMHG/wCr+KXv/yVaGNj8/rrr0dGRl69evXAgQMvv/yyjY2NpaXlihUranpjvvHGGxMmTJC/PTp37qx9XhjcYuJSxIzCVP3Er/i3WNQ9iBeIm8i3PDgBBSPxKp/cNEvH1KlTtV+mVqs//vhj/dHYg4ODV65cWcH7Hz9+XB4RVGZnZ/fSSy9pf7nPmzfPYDHEPVRjwySOHTvW2GPAXbt21Wg0xp6Xy8zM1Gg0ckDSId8rLS0tnTdvntz0TmjQoIG4RPP29hYxQGeVS0pKxIZq06ZNpfbFH3/80axZM53C9OzZMzIyUr6Pq3P/u0ZXUM5vwqRJk0xZi6tXr3bo0EF7QRsbm08//bRaCiwOxSeffFL74VVbW9vXXnutrKxMZ3FbW1uNRnPixInnnnvO4Mgr7u7ub7zxRkFBQaV2k/adjnXr1tWvX1/7PZ2dnT///PPS0lL59RU8uLVs2bIKPsjsk0723nvviSLpXNXJjA33tXXrVvk1Zh8khYWFn376qX6/xB4eHu+8847+XYb8/Pxvv/02LCzMYNfKvXv3NhgXq/GEMran5C9Dg3N1KqMMfuPZ2Ng89thj+rW7si+//FJnsM127dqJ+2XVUqqIiIiBAwfqP/IdFhZ29OhRncIYO0kDAgIqtf3N3qdy4g0PD8/IyHjggQd0Sh4WFnbu3DmDn1ipNa36gufPn9d5MMfS0vKhhx7KzMyU10KWlJRkykar7Ilj3peq3HzDvOMqJydn0qRJOs/xOjo6fvDBB/ojyoov8Gr58jf4ldimTZudO3fWwsY02NOyfF5UcCliRmGqfuJX/FssyI2oq9KUA1AACx55h7aysrIjR47ExMRkZWV5eHi0us6UBVNSUg4ePJiUlGRhYREQENCtWzedC+jbWWFh4d9//x0XF2dnZxcUFNSjRw/RBK5evXp5eXkhISFnz57Vfv3WrVvFTe5FixY9++yzlfosceEVFRWVm5vr7u7euXPn4OBgqY5W0GwajebIkSOnTp0qKCjw9vbu3bu3uDtQjRISEvbv33/t2rX69et3795dJ3cZdPHiRVHFpFarnZ2dQ0JCQkNDzRgZ1dfXNzk52cfHJykpSTxVu3///tjYWLVaHRAQ0KdPH1F1XOcn3W1ykJSVlR09ejQ6OjojI8PJySkkJKRDhw4Vb/a8vLyoqKjo6Ojs7GwbGxtfX98OHTqYN1psnZxQ2t94NjY2DRo06Nmzp2hhWIG0tLQ9e/YkJSWpVKqWLVt269bNYJ9kVZGamipKJW5VdOrUqebG4K3KPl20aJF4QDc8PFzck01MTDxy5EhSUpKrq2vHjh2bNm1aQ2tq3oIXLlz4559/MjMzfX19u3TpYl6/AFU/cWpfenr6/v37ExMTbWxs/P39e/XqJVpp1Sj5KzEzM9PV1bV9+/Zyv1Z3xMaszcLc8re4uLj4l19+UalUI0eOrMZB6YE7DokXMCwzM1M0ELrvvvu0h9ZQq9Vt27a9cOFC69atjx49Wr3hB7cDncQLoHrpJ14AAGoO93tw99q3b98TTzwRFxdnbK74IywsTJ6Yk5MzePDgCxcu1K9ff8OGDcRdAAAA4HZG4sXdKzo6evny5fIwMDpEryS2trZPPfWUPLGwsDAtLa1Lly6HDh0KCgqqxcICAAAAqDQDXU0Ad5X33nuvXbt2cs+NkiTl5+fPmDHjzz//FB1raT9B6unpuXfv3nr16olRXqEk6enpOTk54sFd8X9R/+/s7Cz31wrAbGVlZfHx8ZIkXbt2TUy5du2aOMv8/f2r/almAAAEnuPF3evXX38dM2aMOAVatWrVpk0bV1fXpKSk3bt3p6en29razps3TzxshrvB5MmTFy1apD996tSpxnoaB2C65ORkeQxbHZmZmS4uLrVeIgDAXYE6Xty9Ro8effny5U2bNu3du/fMmTN79+4tKChwcXFp3759v379nn76aVP6B4ZiDB8+XGcgIqFbt251URxAaerVq2dsiJpa6AEYAHDXoo4XAAAAAKBM9FwFAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJlIvAAAAAAAZSLxAgAAAACUicQLAAAAAFAmEi8AAAAAQJms67oAAFD3NBpNZm5RVl5xUXGppYWFncrKw8XW3pZvSAAAgDsb13OQrqTlf/bTSfmfjvbW7z7VoXo/orRMc/JixpnYzLjk3Jz84qLiMgd7axdHVbNGzm2D3Rt5O0o1bMX2mMTUPO0pDTwdHhvYpIJFvt10Pi1LrTPR2sry5bGtLCwsjC31/dboq9fytae0CHQd0dNf/P3NxnPp2YXacx+5L9iv5le/9ulvvfH9G/v71JNuMwkpeftPpkTGpF+8klNYXKYz191J1czfpXNzz64tvSqbfjUaTWRMxvHz185ezkrNVOcWFJeVaRzsyg/74IZOLQNdu7XydnKwqda1AQAAgC4SL6Rf98TFJuXK/6zeq/DS0rLNBxM27r2cnlOkP3dvZLIkSW0auz0yILipn7NUY4qKSw+fSdOeYqeyevi+YCtLw9k1r6B466GEMo2BWQ/2DTSW3ErLNNsOJ6qLSrUntgx0lf+OislITLspD4/sdSMM31biknK/3Xx+1mPt7FRW5r1D1MWM+JSbbjEM69FIup1cSMhe+UdMVExGBa9Jzyk6eCr14KnUJZvOD+rScExYoIm598CplFU7Liam3rSvJUnKLSjJLShJTMvffSJ56e8X+obWf+S+xo725F4AAICaQuK9252Jy9z5z9UaevOMnMIPvj9x6eq/cdqgqIsZry/+5/FBTWouFLUMdN18IEF7irqoND4lL9DXcHY9eSnTYNyVJOnUpUxjiTc+OVcn7uok3ttfTn7xqh0X/ziSaGz1FaC4pOz7rdG/H7zpeKhYQWHpr3su/3U86f8ebNkm2L3iN1+84dzOY7c+p4qKy7YdTjx6Nu3lca2b+7uYXhgAAACYjp6r7mppWWrt9szVKye/+M1vj98y7gqlZZrvfr+w/XBiDRWmRYCB2HkhPsvY6yNj0o3NOnnRaK3g+fhsnSl2KqvA+k7SnaC0TLP1UMILXxzYdljJcTdPXfLOd8crFXdlmblF7yyL+OOI0aO0tEzzxc+nTIm7smvZhe9+d/zcZaOHIgAAAKqCxHv3SrqW//bS4xmGGhtXix+2RV+5uQXvLX2z6bzO07bVxaWeqoGng87Ec3oBVRZpvLHrqdhMjcZwIjynF6FbBLgYazh9WykuKZu+4PA3G8/nFpRIylVUXPrB9yfOxJkfLzUaKXz9ub8jkgzOXf3nxUOnU/Wne7rYdm3pFdbet0MzD/2nBgqLyz784URWbk2diQAAAHczWjXfpSIuXPvvmtPZ+cU19P6JqXl/6jWWdrC1GtTVr1WQq8rG6kpa/vbDiTFXcrRfUFamWbXj4vTxbWqiSC0CXHQS+HkjdbxpWeoKsnpOfnF8Sp7Bhs0X9CJ0yyA36U5QWqa5nFyd9xrsba0c7G76erkdkv+STeeN1aY29HTo3MIzsL6Ti6NNcUlZenZhZEzGsfPX9JupS5L09a9n/H0cg26uvU9Izfttz2WdV3q72T07PCS0mYc8paS07K9jV7/7/YJ2R1m5BSXLt0a/9EDLKq8iAAAAbkLivesUFJas2B6z9VBNtR8W9CvBHO2s507uJFe0tgx07duh/ryfT+0/maL9sqPnyjOG2R0mVaBloKtOCE9Mzc8tKK6n129Qxb0ZiYbN+ok3t6BYp1eqO+4h3mo0Z1In6TYTGZOufxemvENmZ9snhzTt0dpbZ/p9nRuKp5q36TW2LynVfLXuzCfPdbbUivFbDyWW3twc3NvN7sNnO7o52WpPtLayvK9zQ283+3eXRWhP3xeVPHFoU/2jEQAAAFVBq+a7SEFhye8H4l/44mBNx93y4Hr2po6RJUkaExao067YytLi6eHNrK1uqvorLimLSTTa2LjaH+WNTjDwWSeijT7EK5y8lGnKW6msLYMb3BkP8d4NftgWoz+xkbfjR5M76cddwcnB5tkRIc+Nbq5fPx2blLs3qryncdn+m/8pSdLkkc114q6sXRP3Li08taeUlGpueeABAACgsqjjvYs8/dE+g000q11JaVmC3rgs3Vt56b/SxVEV4FsvJvGmts2ZNfNAo4+7vbuTSmeQpPPx2e2b/tvi1GC3Va71VLkFxSWl/1bfnbqUodFodEblPavXXLZpI2cb60rcVCoqLj0Tl5WWqS4oKnWpp/LzctBpN3vLxeNT8q6k5eepS9RFpVaWFrY2Vm5OqvoeDg29HCoYQ/g2cS27MPZqTmZuUUFhaVmZxlZl5eRg08DDvqGXY6U2o0GnYzMv3tyEXjSznz2hnbuz4VAqu7djg2tZhat3XtKZvmHv5d7tfMXfWXlFWXk3PSMQ6FuvXZOKenVuFeSmM2JWaqbu+M8AAACoIhLvXUQ/7lpZWgzt7rdhX3z1flC+uuSetj7pOYUZOUXp2YV56hI7lZW3m73BF9dmM84Wga77olIq7mvqcnKuTnQJbeaRklFwSqteN7egJC5Zd2Qj/Y6aTW/SnJ1X9OOOi3sjkwsKb9pHXq52I3v5D+jSsOKHYKMTsn/dHXfswrUirUdDtdWzt+7V1mdMn0D9dDdj4ZHE1HyDfXFNnLNHzsnvPd2hcWXqq8Xbak+ZPaGdwWr2PHV504O/jiclpxcYfCs7lVW7Ju6j7vFv1sj8IXz+Om6gPfNjA5t4utiZsviYPgH7T6bojDB86Wru5eRc0b5dZW35fw+1Ss1Up2QUpGSo0zLVPdsYrjeu4Hw0tvsAAABgNhLv3cvNSfV/D7Vyq6eq9sTr7Kh6UasPnqLi0hzjXWSlZxfqTHGpp5JqRku9xHs+Pluntla/l+Z2wW4pmfbaiVdU82onXo1Gc0GvVXMr0xLvsfPX5q89bXATpWaql2w6vy8qefaE9gafbdZoNCv/uPjr7riKPyK3oGTrocS/I5JeeqBllxY3VbYXFZcZq/nX7lrJWPfUxui/bZmhIY/OxmV+tvqU/jGgTV1Ueuh06qHTqYO7+T05uImVlTn1vcfOXdOZ4mhn3Sf0Rg3tLVlZWQ7u5rd4wzndtz1/TSRee1vre9r6VKpIR87o9urs4274rhAAAADMxnO8d6mw9r7/falr61rpSVhlY+VhpCYtNVOtU29W/mill2MNlUS/0jVfXaLT3ZT+s5StG7u1DXaveFTexLT8fPVN4/pYWVqYUid56HTqRysjK7gjIEnSmbisL9edNjhr1Y5bx11ZQWHpJ6tO3j5Dv168kvPe8hMVx11tWw4mfLPpvBkflJxeoN9UvlsrL1ubSnSQdk9bH/2KdrM35sZ9l6NvbsxvZWnRvsJW0AAAADADifeu0zHE49PnO7/4QEvH26BX2N/26Ka1Jg2daq6Ot5G3Yz176wqGFCopLTsde1Ndrr+Po5uTbeMGTjpj7Zy+eVRe/XGJghs62ZrQ4/SGffHaTwgbc/BUqv5zwufjs9b9bWrcFcrKNPrPo9aJ0jLNV+tO61cvW1paODva6O8m4Y8jV/45p9sp2i3FJefqTwzxr1wbaQc764Z692Jikwy88y39/NelZVuidSb27VC/5o58AACAuxatmu8i9/cOuLdjfV+PmzpMrkOnLmVsP3JFZ2K/DvVr7hMtLCya+7scvbmB67n4rL7/+9ALCdk6GUzU7lpZWrQOctXuZ6j8Ud6k3MD/9SylH0crNS6Raz3V4G5+IY2c7W2tE1LzNu6L149SuyOSmt8c0lbtuKj/PsN7Nmrq5+xoZ52rLolJzNm077JOZ12nLmUUl5TJfUG51lPlqUs0Gk3GzS8T7d7l9t7mtSWuwKlLGXE3jwDc3N/lsUFNmjZ0Ep9VWFx65Eza91ujr91cCbz6z0sdQ27q5fiWDPYIValewf63SD2dJgnXsgrLyjTaYxRVrKi4dMGvZ/dG6vbq7O1m9/jA4MqWBwAAALdE4r2LPDLgNrqkvpyc+/GPUTrPdno42/br2KBGP7dFoKtO4tXucUq/SXPb4BsNv9s3cdfpWffkpUw58V7Q6wGrlcktxps0dJo9ob2Tw40q9yZ+zt1be7/xzbGYm/sWPhN3U+XztSy1ziPH9eytP3img/YdjdZBbqFN3acvOKI9TmxJqSY5o8Dvf9WVb08MFc/KPvLu3zoF+2pa95oYGNlgs3BJkl4Z11q7Yy1bG6tebX2aNHSa9uXhopIbTxS7ONrUc7DJU5c43lzlXrFMvTBv3uPiLo66i5SWaXILip31phuUlVc054dI/ee969lbv/54u9uhzQUAAIDykHhRBxJT8975LiK3oES3c+ChTas+Dk3F9Kte45NzCwpL7G3LzwWdDGlpaSG/vo3eo7ynLmUM69FIDHR8+eaqPwsLUxvNWlla/N9DreS4K9jaWN3fJ+CTVScrqKh0qaf69PnOcUm5sVdzY5Nz467mDuvZSL8C39+nXmB93fGfsnKL5MRbV3Q6xBaNtLu10u3f2NfDYcLgJuqi0kDfeoH1nVzNavcrB2ZtDraVDvMOhtpaG3xzfenZhW9+e+zqNd3+qJ0dbd56on2d7w4AAAClIvGitiWk5L219Lh+T0Jhob76gafaNW7gpLKx1B4GpkwjxSTmtG7sVlBYolP/1syvvJmx+LuBp4Oni21a1r8tbE9dyhQtWmMSc3R6Mg70rWdiJWTn5p71DbUzFz0AaxOj1MoNaK2tLIPqO5U3zS2vo62oO2UvVzudxKvdCXNd0Qn5kiR9supkaFP3nm182jd1d3P6t7J3UFe/Kn6WwS1jelNkmcExogz2Qa0jX13yznfH9eOut5vdGxPaN/C8XR40AAAAUB4SL2rVxSs57y6L0O+aOMDH8elhzWqhANZWlk39nHWGGjofn9W6sZtIsNrT293cd27bYPedx/4d1jVPXRKXnBtU3+l8vPkP8YYEuJgYCEV1YgXNjLXHWBIdFJ+8lHH0bNqx87oD85SW1n3ibernrD/x+IX04xfKG5Y39HJoEeDaOsi1dWM37fRrHoMNB9SFpZXqq7l8j+u1ShAV8rdccMmm8wk3j04stsB/Hm1Lb1UAAAA1isSL2nPuctb7yyPyC0sN1HQ90V6uTa1pLQNcdRLvueuP8kbGGH2I98Y/m9yUeEU1b1B9J7G4eQ/xersaHrdJZWMgpGk/jqsvr6D4XHx2dEJ2TGJ2dGKOfi26sWxcJzo08/BwttXplUqWmJqfmJq/42h5x2b+Po49Wnv3budr9nC19Qw9IpunLqls2swtMDCIlE4n3vquZRf+HZGkM7FTiMfL41pXNnIDAACgski8qCUnL2XM+SFSfzQaH3f7d58KrXo9nun0K2DPX+9pWechXjuVVZOb6yHbNtbNsVEXyx/l1a/jbW6k5tbEMGasAa1BuQXFu44n7YtKjk7INqGBbbnbIPCW17tOfbDlu8sibjk40+XkvMvJl1bvvNStpdfjg5p4u1U693q4GDi6ElLzKtucWL8DbRdHm1s+eX7gZIrOlDaN3V59uI11dXd/DQAAAH1ccqE2nIhO/2D5Cf2428jb8YNnOni6GK7nrCHN/F10nuHMzi8+E5epM/BMqyBXnUziUk8V4HvT47WnYzOvpOVn39wJk5+Xg36nvsZYWVlUpRp2X1TyC18c/O73C+fjTY275af97RB5r9eEv/VkqIujSX0UazTSgVOp0748HHFBt5H2LTXyNtAvVLRen8kVKy4pi9NLvH6G3lnHxZv73JYk6bnRzYm7AAAAtYOrLtS407GZc1dE6ndp26Sh03tPd6jN2l3BTmXVuL5uv1Brd8XqTBEj8epNvKmaN19dsv1IYlVG4q1K9Pzr+NXPV5/SfyhakiRHO+vQpu4P39f4w2c7dmvlVfVOm2pIy0DXBS93f2JwE4OhVJ+6qPSjH6MMjq9bgUbejiq9mlidQapkV9Ly5/xw4sjZNJ3+rg6fSdWvjm7S0MDTyDp0mpf7utubUU0NAAAA89CqGTXr4pWcD384oR932zR2m/lIm1p7dldHi0DX6Ju7L4643mFSBeFWaBfsvnFfvPaUP46UP2uqraXJD/FWRWqmOvy3szoTvd3s7uvUoGOIp7+Po1xLbLlfN9/eHlW8N9jbWg/v6T+8p398St6Rs2kRF66du5xVQVPnouKy9XsvV6qfM2sry9aN3XR68IpLyo1OyNZpuC7ufRw9d+3ouWuNvB0fua9x5xY37hdsO5xo4GnkEI/KPv3r5kRXVQAAALWHxIsadC278MMfThTodVXVoZnHjIfb1PTQuxVoGeiqE1x1uDja6I8PJBa0trLQzmP6TbUrVcdrtm2HEnRiYYsAlzcmtLfV68y5WO92g4mtmo0Nd1RDGnk7NvJ2vL93QGFx6YX47DNxmWfiss7EZurfLjkRrXt74pZ6tvHW77P6u98vvPd0B+0a76Rr+Xsik8Xf8Sl5c1dGdWjmMWVU87OXs3R6OxMHSQsTRl2u726vPRpWfcYiAgAAqEUkXtSUktKyj1ZEZuTo9hjcrol73cbd6+HwFqHUYJPm8qFoVFYh/i764Ufm427v4Vwb7bRPx+l2lzW2X5B+3JUkKStPr9NmvcBrMAHXQuAtKS1LSi9IvD5yT9eWN2pTbW2sWjd2a329n7CCwpIlm87vOn5TX8fpRnp4rkD31t7LtkTrtAA/eznrpz8vPnxfsDxl2+FEnRGqjp2/Nu3LQwbfc1BXPysTHsedNrZ1ZUsLAACA6kLiRaUVl5TpVGxaWVroj9Hy05+XYvT67PFxt58+rnVl425eQbFOt0wOtlamhA1jnBxs/Lwc9IdINTYSr7a2we4VJN7aqeCVJClN71lWa0NbNSOnUL/nJI1eJ1cGn+zVrxyuLufjs9btik1My0/OUIuEaaey+va1XvqjDdvbWo/uHaCTeG0NDd1UMVsbqzF9ApZtidaZvu7vuMLiskcHBItj8tGBTZoHuP66O+6CVr9WuYaG4XV2sBnWo5EpH52nLtFJ0fa2VvRcBQAAUDtIvKi0o+fSPl11UntKqyDXd5/qoD3lSlr++r2X9Zd1sLX6ZuO5it//3k4NWt/8KOzr3xzT6Uj53adCTR/z1qAWga4VJN42hh7iFdoGu63aYfRtW9VW4tUfsPfgqVSduuvS0rLFG87pPxOr307Y4D2IhNQ8ecTa0jKN6QMm3ZKHs61Ox1HqotLlW6MnjQjRf3HMzU9cm9hDsr4h3fz+jki6dFW3v+VN++P/OZc2pk9gp+aeTg42XVt6dW3pte1QwrebL1QwAPLTw5vdciRe4b1lEdr5WZKkWY+17RjiacYqAAAAoLJIvKgRa/66pFOvJVy6mqsfOXS0DnLTSbw1oWWgq36nU0IDT4cKBkwKbujsYGedry6p2zreRt6OV68VaE/ZfCDe08V2aPdGosI2JjF72Zbo07EGqqMNFr6evbVOZeanq07e084nr6Ak6mLG1AdbVvEWgzYPF7tebX32/u+JWWH74cScvKL7+wQG+NYT6Tort2hvVPKPf1zUWbxXGx8zPtTKyvKVca1fCz+qX2d79VrBV7+csbSQXJ1sXRxtCgpLUzIKKhjtqX+nBj3NKgMAAABqGYkX1S8nv3j/yRTp9lbBo7wGe2mWWVlatA5yPXwmTX+Wm5PKx72WBp7p2cZHpwwajbRsS/TqnZfqezhk5hZV8LBrWpaBWX5ejmcv3/RscHZ+8eYDCeLva5V/dLZijw8MjoxOz775wdoDp1IPnEq1tCgf+riouCzPUDJv5O3Yr2N98z60vofD64+3e3/5CYPvXKYpf0LYlIeEz13OOhOXecunwQEAAFDneJYM1e/o2bQKRpe5TXi52nm62Faq26pbPuVba02aJUnq0dq7qd7IOte7eiq9eCVHO7YF6Q0+rJNshfZNK1rra4ZCclV4uNjNfLStva2BrrbKNFJGTpHBUOrsaDN9fOuqPATbrJHLB8929POqUofJ8Sl5s7859uW604mpNzW2BwAAwO2GxIvqFxlT6cFj6oTBOjpLC6l1kJk9OdfOSLyCpaXFzEfaNLxVchvSze+jyZ10sn1UTHpBoW6eHNTVr4KhYtOydDvKqrrm/i5zJ3UK8DUwCpRBwQ2c3n+6g5+XOQ/xamvk7fjxlM4PhgXqPwtdKbuOJ73030PvL4+oiY0DAACAakHiRfW7nHxnVHwZfOY2uKGzo71NxQs28HQwOARRrT3EK7g52X48pfPwHo30uzi2tLQIber+8ZROTw1rZmVl2a2Vt/bcwuKy3SeS9fuvfv/pDgarr+1UVm5ONTLkkp+346fPdX5xTItWQa4VDBLcrJHzC/e3mDOpY8Mqx13BVmU1rn/jxa/2fHxQkyYNnSp6pY1lp+ae08e1HtLNz+AL4lPyXByN3ikAAABA3bLQ1MKYmwBqkrqo9Hx8VkJKXq66xMHW2sPFtnWQm5PDLXK7McnpBacuZWTkFllZWrjWU3m62oU0cqmF8ZNzC4ovJ+clpublF5YWFpXaqqwcbK183e0bN3C65T2IKspXl1y8kpOcXpCRW1R4feQte1srDxe7Bp4OQfXryY2oT17KWPDLmZSMm2p0X7i/Rd8OZj5XDAAAgJpG4gUAU6mLSldsj9l6KEF8cTb0dPjipa7VOG4TAAAAqheJFwAqJyE179fdcQdOprw4pmX31je1GAcAAMBthcQLAOZQF5Xa2lhaVPD8MQAAAOoaiRcAAAAAoEz01QwAAAAAUCYSLwAAAABAmUi8AAAAAABlIvECAAAAAJSJxAsAAAAAUCYSLwAAAABAmUi8AAAAAABlIvECAAAAAJSJxAsAAAAAUCbrui4AalZRUVFkZGRdlwIAAAC4HYWGhlpZWdV1KVCDSLwKV1ZWlpubW9elAAAAAG5HGo2mrouAmkWrZgAAAACAMllwV0PZSktLr127VtelAAAAAG5Hnp6elpbUAioZiRcAAAAAoEzczwAAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAykXgBAAAAAMpE4gUAAAAAKBOJFwAAAACgTCReAAAAAIAyWdd1AXCX2rZt25w5c7SnrF692sfHp+5KdBth4wC1gBMNuA1lZGSMHj1ae8orr7wyfPhw6a6Un5//008/7dq1Kykpyc7OztfXt1OnTgMHDgwICKjrogF3EhLvXW3atGkHDhyQJGnNmjWNGjWqzY/Ozc2NjY2VJCklJaWgoECSJLVaLd0Jxo4dGxcXpz/9+eeff+yxx3QmfvnllytXrpQkae3atX5+fjpzv/766++//15n4u7du6u4cbKysoYPH37ixIlPP/30mWeeMX1B4K5y534LAQr+FSgtLRUnZk5OTnp6uiRJ48ePV9IKmu7EiRPDhg1LSEiwsbEJCQmRJGnz5s3ffPONi4tLZmZmXZcOuJPQqvnulZaWtmDBgkPXLVu2rNrf/9y5c39fl5eXpz93zJgxsdcNGDBAuqNkZ2dnZmaeO3dObLrTp09nXmfwWnnZsmXiZVu3btWfq1arxbKHDx8+ceKE+LvqG+enn37as2dPdnb2q6++Wtn9gjpUWFgods2pU6fquiwKodRvodsQR+9ttTEr/hW4zXl6eooT88MPP1TkCpqosLBwxIgRCQkJzZo1O3/+fNR1R48edXBwqOuiAXceEu/da8WKFcXFxeLvpUuXajSa6n3/OXPmhF0XHR0tKciWLVvOnj0rN4YMDg4+e53+bebU1NRjx47JS+m/1csvv3z27Nldu3ZpNJoJEyaI91GpVFUsYcuWLcUfLVq0uHv2iwIkJSWJXfP666/XdVkUgqO91nD03lYbs+JfAQVQ/ApKkrRu3brLly9LkvTaa68FBgaKiaGhoffff39dFw2485B4717ffvut/HdsbOyuXbvqtDh3mEGDBok/IiIikpKSDL5m+/bt8t87duwoKSkx+LJt27ZJkjR48ODqKts999yzZ8+er7/++vfff6+u9wQA3CkU/yug+BWUJGnPnj3ij/bt22tPX7hw4fnz5+uoUMCdisR7lzpy5MjJkyeHDBki3x9dsmRJXRfqThIYGNisWTP9ZKtN1Ou6ubmJttDikWl9W7dutba27tevXzUWr1evXlOmTBEfDQC42yj+V0DxK5iamir+cHFx0Z5er149b2/vOioUcKci8d7VFbxPXyemrFu3jo4QzKvmNXiPWaPRbNu2rUOHDqNGjaqgYXNZWdn27dt79uzp5ORUw+UFbi0rK2vDhg3h4eGrVq2KiYkRE4uLiwuvq+vSAcDdQm4XZmVlVddlAe549NV8NyooKFi1apWXl9ewYcMyMzNnzpxZUlJSWFj4008/TZ48Wf/1aWlp8rWvEBoaqlKp1Gr12rVrjx8/npKS4uTkFBISMnLkyIYNG4qHV+Xbk5GRkdq9OjVq1KhBgwbGypadnb1y5cqoqKj8/PygoKBRo0a1a9dOnqtWq0+cOKH9+jZt2mj34nD06NHS0lL5n82aNZNvAEdERGhfsnt5eTVu3FiSpNOnT//yyy+xsbGlpaW+vr6dO3c28SGZIUOGzJ8/X9TxlpWVWVredP/o2LFjaWlpzz77bPv27b/77juRePX74Th69Gh6evqQIUNM+cSKN04Fe0qEFlP2i7F3uOVH64iMjNy6devFixfz8/M9PDxCQ0MHDRqkc1taLpKO4OBgT09P8Xd8fPyVK1e05/r6+lYwKsOhQ4f0JzZp0sTDw0P+Z0JCQmJiYoMGDbT7J9doNIcPH9Zeys7Orl27dlU5bPLz83fs2LFv377k5GQbG5sGDRr069evV69e+pcvly5dSklJuXr1qvhnenq69opYWFh06dLFvI1susLCwtmzZ8+fP7+oqEieOHr06KVLl44bN060vU9KSqrU4D25ubm7du06fvx4XFycWq12dnZu0aLFgAEDRKejFcjOzt64ceM///yTlpZmaWlZv3799u3b9+vXz8vLy5TPNfFor+DTq/1ovyVjR9quXbu2bNmSkpLi7+8/dOhQ7SOhtLR0zZo1Bw8ezMjI8Pf3Hz16dIcOHSr4CNMPyErtCPOOXrN/YuQHGqu+/c+ePbtly5bo6OisrCxHR8eAgID27duHhYVV0DOQ6Z9lbIceOHBg06ZN8fHxTk5OXbt2ffDBB+3t7WthY1alVDV9vldKLaxgTk7Otm3bDh48mJKSYm9v36hRo379+nXv3t3CwqIqJZePt+zsbA8Pj9atWw8ZMkT/i0heQdFPtSRJx48flx+e8vDwaNKkSbXvjsqeg2b/MppeKnEu6Ey0tbWV23jr/2pLktSpUyduEMAwDe4+P/zwg+g2SfxTHviuY8eOBl+v35NzbGzs/v379a99582bZ+yhVtncuXO133zkyJHye+7YsUOn9Y4kSVOnTpVffPbsWZ25ERER2u+ms/hvv/0mz9KJSRMmTCgqKpo4caLOG7q4uJi4GQsKCuzs7MRSBw8e1Jn7/vvvi+dw0tPT5TB89epVnZe98847YgQCgx9RqY1jbE+JWSbuF4PvYMpHy2JiYuSeb93c3AICAmxsbCRJUqlUr776alFRkfxKY0VatmyZ/JqZM2ea+LmCwTf86aeftF8jHpm+9957tSfqd7UdEhJSlcNm0aJFIrdbWlr6+fnJJ0tISMj27dt1Xjxp0iTJOFtbW7M3somKi4u1nyS3sLAQbyhJUteuXeUm90lJSSa+YUpKypgxY+Q3cXd3DwwMlK9KR4wYkZycbGzZr776ytHRUWy6Bg0ayHHCwsKiT58+f/311y0/vUa/hWpoR+gfaWq1Wv82yvjx40tKSjQazcWLF+UHK2TTpk0z9v6VOiArtSMqe/RW8SemWrb/pUuXhg0bJhasV69eQECAtfWNCgBbW9tx48ZFRUXpLFLZzzK4Q8eMGaOzRn5+ftqfVUMbs4qlqtHzvQLh4eHiHcLDw2ttBefPn+/q6ipqVgMCAuS7pe3atdP/oTdRbGysfLw5OTkFBgaKiwcrK6spU6bk5ORov7jisTPGjh1bE7ujsuegGb+MlS2VwXMhICBAfoHBATIyMzPN20dQPBLv3SgsLEzcihP/3Lx5s/xlYTB6RUdHL7suNDRUvOz333+3s7Nr1arV7Nmzv/jiC3msvHnz5uXn54df161bNzFx1qxZ4VqOHz9u8Fpzw4YNKpWqd+/ec+fOnTdv3qOPPirfqFu+fLl4cUZGhs6b6yTepUuXhoeHDx06VD/xrl27dtmyZe+++678BT1hwgSVSvXYY499/vnn77zzjr+/f6USr0ajGThwoHi3t99+W2dWz549nZ2di4uLNRpN9+7d9bOc0K1bN19fX2PvX6mNo9Fozp07J7ZP27Zt5R8tMcvE/aL/DuKjBwwYMG/evPDw8Keeekq+NNT+aCEiIkJcVQcFBckXxDk5OXPnzhV3xwcMGCC2iVwkcWtAXAcsXLgwPDz83Llz8hsePHgwPDx8xowZInqFh4fv+3/23jsuiqtt/B56kyIgRVFAVGLUIJaIioolIlYMosFo1nqjJpEYVIwlt4mNJBqNibpgA28QFCyIioreGkBARaQaUarSRNoC0nf3/Txev+e888zsDruzu9Tz/YPPMqfM6XOuU67r4UOGGuFyub/++itE2K9fP8hLdnY28lBdXQ1fXGVl5Xfv3qHnra2t4NnS0lJLS+vEiRMgJ7NrNhs2bAD/69atQ1LiixcvZsyYAa8+deoU2X9MTAyXy923bx+E+uSTT8hVc/LkSdaFLCG+vr7wahMTk7CwMJi+P3v2zNHRESQcaSXelJQUCOLm5pabmwsPm5qa4HQJCFo8Ho8e8Pjx4/DGQ4cO1dXVwcN3795t2rRJkiUPQKGjkIIqgt7Sli5damJisnnz5qNHj37//ffouIq3tzePxxswYMCQIUN+/PHHP/74Y9WqVWgeef78eXrk0jZIqSpCqtYrEqk+MbKXf0pKCkjv/fr1u379Op/PhxHg7t27w4cPhxf5+PhQgkj7ruDgYC6Xu337dlShHh4exsbGW7Zs8ff3P3DgwLBhw8Bp8ODBSGCWvTAZvgKsU6W4/s5C4lVoBpHNhU2bNlVWVsLDpKQkaJmampq3b9+WNhdpaWkgN1pYWNy8eRPaW2Njo7+/P5wmsLe3Ly8vZ8jgvn37UBuIjo5WRHVI2wdZfBmlTRX0hXHjxkEoDw8PLpcbHBxM/2qD4u69e/dyudympiZpKwjTQ8ASb48DDq44ODigJ62trehcDfNsEs0LBw4cuHHjRhi4ge+++44yHeFwOCKFUnFxWltb//rrr2Sn8+fPg5O9vT0lFHPku3fvpku8lDHX2tra1NQ0MzMTORUVFWlra0sl8R45cgRiGzduHPl5dXW1iorK559/Dv+irwJldRa2f1esWCHfwqHsWVGcWNTL0aNHyU4XLlwQ+Woej2dtbU0QhI6OTl5eHiXCX375RdzqAPrExsfHi0zM5s2bQRoRSgbMaZSVlekr2YGBgfAu0NZGca2oqFBVVV20aJEszebYsWPgedWqVZR4mpqaxo4dC0v7cXFxFNf8/HwIuGDBAnFZY13IDNTV1fXq1QvEmydPnpCd3r9//9FHH6ESk1binTBhAmxIkklOToZTD1u3bqU4tbS0wI7K8uXL6XHCnQtJJN52GIUUURGUljZ06FDKPFhDQwPeuHr16jlz5pDndpcvX4aAY8aMocTJokGyqAhJWm+bSP6JYV3+KKCWltaLFy8orlVVVebm5hSJV5a6RhVqZWVla2tbVlaGnBobG9H5TMrgJt/CpH8F2KVK7v2dncSruAz++eef8Pzrr78W1zCMjY3JsbUJj8eD475aWlrkxVzgypUr8EYXFxeBQCB5BhVXHVJN86T6MrJLVUREBLzis88+E5ngiooKDQ0NkRMhDIYMlnh7HDt37qTP9dGCqKGhIcMKGRoKhw0bRhmznjx5YmdnR15+k3auSRbCEUgUr6mpka/ESxDEhQsXKK6rVq1ydHQUSkxWVhZEpaSkRJ6bhoeHEwSB1uPRVZPevXuTyw1Ex4sXL8q3cOQr8U6cOJHu2q9fP/qrf/zxR3go8lPa3NwMmyTa2tqUc0f+/v4QcNmyZfSAjY2NRkZGFhYW9M+kOFADoM+T0P4/QRDOzs4UV9DoRm8YkjcbHo8HSsjU1dVFHuS7d+8exDNq1CiKkyTTXNaFzEBwcDDEidZoRLpKJfE+f/7c0tKScp4cMX36dJg7UiZ5z58/hxf9/PPP9FBJSUmKlngl72iKqAhKS/vvf/9LcV2yZAk4qaur069IoNt95HSya5AsKkK+QlqbnxjW5Y8CimtIIMGSJV5Z6ppcoXfv3qW4njx5Epy8vb07ROKVKlVy7+/tIPFKnkHUUzQ1NdHuLpnDhw9DqB07dkieBfQxEtfe4BwNQRCRkZGSZ1Bx1SHVNE+qCRW7VLW2tlpYWMArXr16RQ948OBB8nQLgxEH1tXcsxAIBAEBAdra2mjmBKxevRp+VFZWXrt2rc14Vq9eTdENMGbMmJSUlKVLl7JO2/Lly+kPkSKWvLw8Qq707t2bfkfu9OnTyAKeJAwZMgTUqAiFwujoaPQc1DKjM8+jR4+GDZOqqqonT56QvSkrK8PBwk5VOGS+/PJLSV4tFApPnDgBvymtC1BTU4MCqa+vv3jxItlp6dKlMNW4ePFiRUUFJWBYWFhFRYWnp6fk6igWLVqEwpKf83i8O3fuLFy4EM403rt3r6qqivIuTU1NslQsbbMJCgqqra0lCGLy5Mki9dk4OTnBCa7k5OTExERCGmQpZAb+/vtv+DF//ny667x58yha2SRh6NCh+fn5IhMJHQd0pVCaLqpiOGtKCTVy5MiUlBQ44q4gJOxoCqoIMqampnD9RGRKnJyczMzMxLnm5uaih+waZIdXBPMnhnX5txkQlPDr6+sjtUbyqmsTExO6CbrRo0fDD4rSoHZDXqli1987VQZRT5kxY4ZIi0fz5s2DH2fOnJHw7eh2AEEQixcvFunniy++gB9oh1l25FIdUk3zJJlQsf4o/Otf/4LfaAUEAcsiurq66NA1BiMOLPH2LKKjowsLC5csWQKHGBEDBw5EsyvY5mIGDsLJF3S0lQycI4JdC7m/Dt1HlYuNIrLxoVu3bn388cdIFbCysjJSeUI2ZXT79u1x48ZJYk6wnQuHDDoARgbNttGrMzIyQC+uurq6yCAEQaA7cpRlBR0dnWXLlhEE0dzcTNefceLECRUVFbQoIwnDhg2Ds7j3798vLy9HzyMjI1taWjw8PODb3NraSl7fqaqqunv3rouLC2jrYdds7t69Cz/GjBkj0oOysjKqTbS9JiGyFDID6enp8GPEiBF0V9CzQshAa2trSUnJy5cvs/6Xuro6cKKo4rSxsYG1ocePH0+dOhWJ4oCKioqdnR2DjmXZkbCjKagiyNjZ2dEVwxoaGsIPkS9FKnZg4i5Lg+zwimD+xLAufxRQSUlJZF3D1dnq6up///vfMr5LkgqlD6TtjCJSJXl/71QZRD0FXf6nYGNjA9cKSkpKJBTdMzIyIMtKSkri9Kgj8Ts2NralpYWQN6yrQ6ppnrQTKqlStWbNGpC9z549SzGSd+/evezs7OXLlzN8tTEYAFsn6lmANCtSeFi9evWDBw9ADCssLETHSESiCOvnyCANGaQMmb7PICPyyoKLiwusO966dUsoFCopKWVmZhYVFaGFW2D27NkhISHgDa71pqenl5SUrF+/vhMWDotXo2OQ2tra4taqkS2ijIwMitOGDRtgI+XEiRPff/89mqOkp6fHx8e7ubkhqUNCFi1atHfvXoFAEBERgRr8xYsXNTU1Z8+ebWRkBLUWFhaGDr5GRES0tra6u7vL0mz++ecf+MEgJSItl5mZmVJlSsZCFgfaVxdXyObm5uRtQwlpaWk5derUuXPnkpOTyRaPyFCmLyoqKkePHoVjBbGxsU5OTpaWlgsXLnR1dWU2otO1WrskkO1pIZB6KpHpRFpPyQMCuwbZ4RXB3NFYlz8qDRMTE1StzMirrjtwDGdAjqli0d87VQZRRWdkZPzxxx8iY1NXV4csZGRkwNVuZiRpb6j3NTQ05OfnDx48mJAHsleHVHMkCT2zS5W5ufmCBQsuX75cWVkZFhYG6+MAbKFLOI/C9HCwxNuDqKiouHr1qpGRUUtLC2XNHiZYqqqqcG0jMDBwx44dDFHBSqd8QdM1MiyOU0qIvLIwbdo0NTW1lpaWsrKy1NTUkSNHguVSsq0X0OQJP5KSksrLy42NjW/dukXeIu5UhcPi1chyYHV1Nei3YIC87woMHz58woQJ8fHxOTk5d+/e/eyzz2T8ni1evBi0QIeFhYHECyYW58yZo6OjM2XKFGNj4/Ly8jt37vB4PLBGc/HiRQ0NDWRDgl2zQeVAOUZBBo5wk0VNCZGxkMWBFtfF5Y6FZc63b986OzuD9ewBAwa4uLhYWFggge3atWvx8fEiAy5dulRfX9/b2xsuyRcUFBz5gImJyapVq7Zs2YL2Obtua2edEgld5dIgO7YimDsa6/KXpDTk9a7OM4YzIK9Use7vnSeDqKJDPyCXTi1V74MOKBeJVy7VIdUcSRLPsqRq/fr1oJzv+PHjSOItLi6+du3axIkT0SELDIYBLPH2IIKDg1taWioqKqZOncrs8/Tp09u3b5fR2HoHIhAI2u1dvXr1cnR0vH//Puzfjhw5MioqSktLC6mjAExMTEaNGpWcnCwUCu/cubN06dKoqCgjIyN0oqmrg75bFhYW169fZ/Ysco9o/fr18ME7fvw4SLx1dXVBQUGDBg2iX8RqkxEjRgwePPjVq1dwWbd3796RkZHNzc1wmUpFRWXhwoUnT55saWmJjIxctmxZdXU1HGkmzz9YgE52MWyPICdUaO1WyMwCrbgl/4aGBkJKPDw8YGazZs2aEydOUA68lZSUMExu5syZM3v27JiYmPPnz1+6dAnEsLKyMl9f31OnTl2/fh3Zq+goFFQRikCWBtlpK4J1+UtSGvJ6V49Clv7eSUAVvW/fPgZVDgDS3SjH3sfii9C1qkOWVE2fPn3QoEHZ2dkJCQlpaWlgt+nkyZN8Ph9v8GIkBEu8PYjTp0+rqKicOHFC3P5AUVERbO3m5eXFxMRMmTKF6PSI/JCwmKDLgouLC0i8N2/e3LhxY0xMzGeffUZf8pw1axYcfrt58+b8+fPj4uLc3d07fI1f7ofHWltb7ezsWMTg7u7u5eUFutOKior69esXHBxcV1e3fv16dosv7u7u+/fvh8u6HA4HtnDRVMbd3R00dsIpqYiIiJaWFnHKRSTH2Ni4uLgYtGSJ84OcRJ64Y45cxkIWiaGhIWhwefv2rciDzW/fvpUqwrS0NOgR+vr6R48eZXFhXklJacoHjh07du/ePX9/f1jgLy8vd3V1zcnJATuWHYWCKkIRyNggO2dFsC5/FFDyG6pdqK47Ctn7e6fqKcbGxvKqaNR4JOl9LL4IXag6ZEyVkpLSunXrwE7hiQ/w+Xx/f38jIyOkqBKDYaabzLYxbfL06dO0tLTZs2evXbuWI4bt27ejEzWnTp0iOjFouKyvr6e7FhUVtWdi0Mnk+Pj4iIiI5uZmypFmAD28ffv2vXv3WlpaRHrroqDN6rdv34qslDbR0NBYuXIlbNFD8zt+/LiGhga6Zyst6EbuxYsX6+rqbt26NWvWLLSFO3XqVDiWefv27dra2osXL6qpqSFtnLKXQ3Z2tjg/SEGotBrgZC9kkYD5YnG3EN+/fy+thlV0rXH06NEiT0T/j2U8yVBVVXV2dr506dLDhw/hIlxpaemdO3eIDkVBFaEI5NUgO1VFsC5/FLCyspJBCJHLu3oOcuzvHQiqaBY6C9qMs+oDzL3PyMhowIAB3bU6ZE/VihUrYLcGtGpHRkYWFxevXLlSEZfsMN0SLPH2FBh0VpFZtWoV/AgPD5eX9khFDK8GBgbwo7CwkO6akJBAtCMjRowAtaV8Ph82yUXeznVwcNDT04Ptkf3795Mv93YI8q2X/v37g+AkFAoZjO7MmzfPzMzst99+E+m6bt06+OHv7x8bG5uWlubu7i5ShY8kjBw50sbGBlSUBwUFNTU1kbVSqaqqurq6wlHe4ODg6OjomTNnQgXJwuzZs+FHXFycSA+NjY1gzpRsv0rCqpFLIdNBJ/BFHtq8deuWtGp10OlocYf0xAkbmZmZrq6ukZGRdKcJEyasWbMGfpeUlHSD1t4+sGuQslREO8ynWZd///79P/74Y/gt7gjljRs3rKys7O3tISMdW9ddQlZk3d87Fej4z8OHD8X5iYmJMTMzs7KykvAcGbm9iYsW6fd2cXGRy1WyzlkdsqfKyMgIvuB1dXXBwcGg48PT01MBicV0T7DE2yNobGw8f/58nz590OxHHF999RWcs21sbGxTeQMz6LQbWeH+3LlzR44c+fjxY1liBsNu4qZxUVFR7W/0D4m4eXl5AwcOBEGLgqqqKjK9+/jx49GjRytC5XUH1gucOGI4IJCVlXX9+vWysjJx2qEGDRoERVRcXAyWUTds2CBLkuC8U0tLy7Zt29TV1SlbuOgM87Zt2+RypJkgiIULF4JS3OTk5LS0NLqHsLAwmC25uroOGjSozaq5cePGyJEjYfdbLoVMx83NDZbJw8PDkaUioLm5ec+ePYSUDBw4EH6kpKTQpWWBQCDOiEt5eXlERMTVq1dFuqL1CMnt4nTm1t4+sGuQLCpCktYrR1iXv7e3N/wIDAwUGTAgIKCgoGDUqFFI/Gj/um7nwpQR1v29U+Hq6goZefjwIWhro3PixIm3b986ODhIrswPtbezZ8/SXfl8/n/+8x+Kz25ZHXJJFZoPHDhwIDo6+rPPPqN8QzEYBrDE2yO4fPkyj8dbvnx5m3oR+vbti5b5ZTzYjKQ+dMa4trY2Ojo6NTVVQq0PDKDd0YCAAHRaBgbTlStXUrRGtQPk88kMZ5XJThJqaZY7iqsXDocD9RISEnLlyhWK6/v370GkXLFiBVqwoIO0UBQUFIwYMWL8+PGyJAlt6vJ4PPoW7rRp08AYMo/HU1VVnT9/PiEzKioqZ8+ehWWjdevWUXRBlZSUbNu2Da7O0i2dGBsbg0pP8rH8hw8fpqamIo04cilkCgYGBjDZ4vP5s2fPjo6Ohp2l3NzcBQsWgK4RqZg8ebKpqSkcBPX19aW4HjhwgPncYEhIyIsXLygPGxoawHiygYHB9OnTu0drbwdkaZBSVYQkrVeOsC7/FStWwLLaxYsXyUbUgcjIyPDwcE1NzR9++EH2d7GmnQtTRmTs750EFRWVgIAAZWVloVC4cuVK+i5uUFBQaGiopqbmTz/9JHm0qL1dvnyZfmhi//79cN1g69at4qw9d4/qkEuqJkyYAGqZX79+jY0SYaRGiOnWHD16lMPhwLRv+vTpHA7n0KFD4jxv3LiRw+GMGTMGNQ8PDw8Oh3PhwgW46Nu/f3947ubmBk/i4uLExZaVlQVr5I6Ojs+fP8/Ozgad8lOnThUKhTk5OSLjPH/+PAQHVzSBcHZ25nA4vr6+KH601K2iojJlyhQPD4+JEycqKSl5enru3r0bnKZOncrhcNasWSMUCg8dOsThcNAun42NDbzC29tb9nKuqqpCOqiuX78uztubN29Q2TIUHevCiYuLExlwz5497VMvVVVVkydPhkr55ptvEhMTS0pK0tLSTp48CVYHHR0d6+rqGEqypaUFKU86fvy4UGaQGdJz587RXVesWAGuLi4uIoOzazZBQUGwujRq1KiIiIjCwsK8vLyzZ8+ClGVsbPzo0SORAcECKmxAFRYWRkZGgkz+999/Iz+yFzKdhoaGSZMmocapo6ODdKjY29s7OTnB79LSUgkjjIiIQFtkLi4u58+fT0hIuHr1qpubm66u7sSJE0W2HzAJThCEqanpn3/+mZmZWVZWlpWVFRYWBldMVVVVr1y5Inm+Onlrl6Sl1dfXC4XCXbt2cTgcVG5jx44lN0KR6ST3emkbJLuKkKT1ikRcRTB/YliXf2VlJZSkmprajh070tLSSkpKEhISvv/+ezU1NWVl5aCgINnfxVyhV69e5XA4Hh4eqJzB9cWLFzIWJvNXQMZUybe/i4PH48F7HRwcIKCDgwNKp0IzGBoaCpdFhw4dGhQUlJubW1hY+ODBg6+++kpJSUlNTS0sLEwoJai9qaqqbt++PS0trbS0NDExEamoWLlyZUtLS5s1yDx/k7E6pO2DLL6Mcmkkx44dA2/m5ubkQsNg2gRLvN2cBQsWoFksGk3EeYYVODq7du0S+Ry2WBne/ueff1L0QtvZ2b1+/ZrhQpSXlxeEFek6ZcoUFHljY+PKlSvJ9140NDS2bdsmEAiQxIueC4VCcXcmLS0t5VLUEyZMAOt/zHNcuNWjr68Ppo9FwrpwAgICRDqNGzeu3eqlqanp4MGDdJ2TRkZGP/30U2NjY5slCe1NR0enpqZGKDNwIlFNTa2qqorueuPGDUjemTNnRAZn3WyePXuGrAoj1NTUli9f/ubNG3GhSkpKRo0aRQly8OBBijfZC5lObW3t2rVrKRfJnJ2dy8rKUCFILvEKhcLo6OghQ4ZQUjhx4sS0tDQvLy+R7ae+vv706dNOTk4iNXlOnjxZ3EoBA528tbfZ0qqrq4VCoUjlsagRStLrpWqQ7CpCwtZLh+F+LPMnhnX5NzY2/vrrr3QdASNGjPjvf/8rl3cxVyjlI4V48OCBjIXJ/BWQMVXy7e/iKC0tFZkMSKeiM5iSkuLs7Ey/Uuvk5JSUlCRkhbj2ZmNjExwcLGENMs/fZKwOafsguy+j7I2kpqZGR0eHIIgff/xRwqLAYAClLqEXAdN1KS8vj42NLS0tVVdX//jjjx0cHORr5rewsDA+Pr6iosLc3Hz8+PHihHZMO9eLQCBISkrKzs6uqqrS1dW1tbUdNWqUhMYGr127tmDBgn/9619+fn5EF6esrCwxMbG0tFRNTa1v374TJ06Ew4oMCIXCJ0+eZGZmNjQ0mJiYTJ48Wdx9b1kKWRwlJSXR0dElJSUGBgYODg4gaM2aNev27dsg8UrVxWD6mJ6eXldXZ2hoOHbsWJFX3Om8f/8+PT09Ozu7pqZGTU3NzMxs1KhRrM8hd+bW3skbpLQVIXnr7QzlLxAInjx5kpOTU11dbWBgMHLkSKRnSO7vYkGHFKYssO7vnZB3795BT4HNgDFjxsh+Gwu1Nx6PZ2RkNOwDRA+rDtlTZW9vn5aWVlBQYGFhobBkYrohWOLFYDCdi0WLFl26dOnZs2fyuteEkRHWEi8Gg8FgMPIiMzNz+PDh8+fPj4iI6Oi0YLoYWHMVBoPpRJSVlUVERIwbNw6LuxgMBoPBYBD+/v6yG3HA9EywxIvBYDqSFStWkBdrjx071trainUwYjAYDAbTk4mIiFi1apVAIIB/eTxeQECAtbU1staBwUgOlngxGExHEhgY+Ouvv4KBvlevXh0+fLhfv35IlyYGg8FgMJgeSEpKytmzZ6Ojo+HfH374oaamZvPmzfJVxIDpIYhQw4jBYDDtSXx8vK2trZWVVUJCQkNDQ1BQEEW5LgaDwWAwmB7I/PnzHR0dS0tLnz9/7uDg8K9//aujU4TpkmCJF4PBdCQbNmx4/PhxcXHxq1evJk+evGXLlmnTpnV0ojD/h4ULF3700UcEQWhra3d0WjAYDAbTI3B0dJw3b94///yTnp5uZmb2ww8/bNu2TaTJNAymTbCuZgwGg8FgMBgMBoPBdE/wPV4MBoPBYDAYDAaDwXRPsMSLwWAwGAwGg8FgMJjuCZZ4MRgMBoPBYDAYDAbTPcESLwaDwWAwGAwGg8FguidY4sVgMBgMBoPBYDAYTPcES7wYDAaDwWAwGAwGg+meYKtWGAym/aiqqlq4cCH5ibe397x58zouRZjuRn19fWho6IMHD0pLSzU1Nc3MzMaMGePs7GxpadnRScN0PLdv3z5w4AD5yYULF0xNTYlOCW7MnQf88cJgujRY4sVguhXnzp3z8vL66KOPbty4YWhoSHQy+Hx+fn4+QRC1tbWVlZUEQXh4eHR0ojCdlE2bNiUkJBAEERYW1r9/f0mCpKamzp07t7CwUE1NzdbWliCIGzdunDx5Ul9fv7q6WvFJ7unweLx58+alpqYePHhw7dq1ROejrq4OhqCysrKGhgaCIBobGztnBnFj7lTgjxcG06XBp5oxmG7F1q1bq6urExMT//Of/xCdD2Nj4/wP7N+/v6PTgunUlJeXHzt27NEHAgICJAnS1NQ0f/78wsLCIUOGvHz5Mv0DSUlJ2tra4Pr3BzIzMxWf/K6EhCWTlZUF3t6/fy/OT2hoaGxsbE1NzZYtW4hOiZubGwxBM2fOZBG83TLI3JjbH0lqv0vAehzAHy8MpkuDJV4MplsxbNgw+DF06NCOTgsGw56goKCWlhb4febMGaFQ2GaQS5cuvX79miCIbdu2WVlZwUN7e/vPP/+cIIjS0lKnD+zYsUPBae9iSFgyBw4cAG/Z2dni/Hz88cfde/xptwwyN+b2R5La7xLgcQCD6ZlgiReD6VZcvXqVy+Xeu3eP3Q4GBtNJOH36NPqdn5//4MGDNoPExsbCj5EjR5Kfnzhx4uXLlwpII4bKpEmTYmNjjx8/fvPmTaI70m4ZxI0Zg8Fg5Ai+x4vBdCt0dXU9PT07OhUYjEw8efIkIyNj9uzZeXl5//zzD0EQp06dmjp1KnOod+/ewQ99fX3y814fKCgoUGSSMf8Pxw8Q3Zf2ySBzY1b02zEYDKabgfd4MRgMBtMZN3jXfACeXLp0qU1tPa2trfBDRUVF8WnEYBQIbswYDAYjR/Aeb/cnLy+vrKwM/aumpjZq1Ch4Hh4enpub29jYOGDAgAULFsBzREpKSlNTE/q3T58+AwcOJAji+fPnly9fzs/P5/P5ZmZmY8eOFXmz6MWLF1FRUdnZ2TU1NUZGRsOHD589e3bfvn2ZU5ucnBwREfH69WtNTc2BAwe6u7vDFabk5GR0qY8gCBMTE11d3ZycHHJYe3t7dXX1xsbG8PDwZ8+elZWV6erq2traLliwAN2DAl2dDx48ePbsWUFBQWNjo56e3tChQ2fOnAnKMCmUl5eLfEt1dXVgYGBGRoaWltbw4cO//PJLHR0d5CcnJyc0NDQ7O1tTU/PTTz9dsmQJRd2IuLJ98OBBVFRUWVnZgAED5syZ8+mnnyI/fD4/LCwsMTGxqqpqwIABCxculLC+GHJRU1MTHBycnp5eX19vbW3t6upqZ2cnrmpqa2uvXLny5MkTHo9nZmY2YcKEOXPmqKmplZWV5eXlkX2OGjVKTU2NkI3nz5/HxsY+f/68srJSTU3N1NTUwcFh1qxZGhoadM/tnMGPP/74+fPn5CcjRowgV3FSUhKfz0f/DhkypHfv3rJkkHU3sba2JgdMS0u7detWbm5ufX29kZGRvb39rFmzTExMGN5VU1MTGRn59OnT8vJyZWVlc3PzkSNHTps2rU+fPoRiaGhoCAkJ6dOnz9y5c6urq318fFpbW5uamkJDQ9etW8dQ+6BAlSCIZ8+elZaWwm8jIyMVFZWysrKSkhJ4UllZ+ejRIxRcSUmJ3NFYlJWMQ6Xce1xtbe3t27cTExPLysq0tLT69+8/bdq08ePHKykpifw6MJdMS0tLcnIyedcxLS2NrN+4f//+ffv2FdcH5dU9ZWn2ktBmYhgySCYpKenevXvZ2dn19fV6enq2trYODg6ffvqpsrJEGwxtNuZBgwaR/Ute1xQkDChh7TO8qKioqLCwkPJQU1OTUrzQ8D799FNyAt68eVNcXEz2NmjQICMjI3YlIElrJ6SnpaXlxo0b8fHxpaWl+vr6Y8eOXbhwoa6uLv3VlIAaGhroyLpQKHz8+DHFw5gxY/B6BwYjN4SY7g7ljKupqWlra+vmzZvpjeHzzz+vqqpCASkW/zgcTnNz86pVqyih9PX1KW/Mz8+fO3cuuOrq6lpZWWlqasJa9fr162tra0Wms7KyUuR00MfHh8/nU+wlenp60tW35ufnx8fH0y0rHjlyBF5RVlbm5uaGpoaGhoZWVlZoyjJ//vy3b99SUiXyLXfv3tXT0yM/NDIyiomJgSA///wz5StlYWHx/PlzcrT0sm1sbKRn38PDo7W1VSgU5ubmDhkyhOK6adMm5jjbzAXlvBxBEF5eXiJr59KlS8bGxhTPNjY2aWlpXC6X8ry0tLTNZolCcblcilNgYKCNjQ24qqqqWlpaIjHD2Ng4KCiIHls7ZzAuLo7yJCUlhRwb5b1Xr16VMYOsuwkKmJOTg6529+7d29LSEjqCurr6li1bmpubRb7ur7/+gqUcZWXlvn37onQqKSlNmTLl/v37QgUAasa///57+BfZwBw9erRI/8yanJcsWcJ8zl9DQ4MSobRlxXqoZIB1jzt69KiBgQGMt5aWlkg8sLOzS0xMpLxFkpJB4pY4fH19xfVBeXVP1s2egQULFkiVGIYMAgUFBZMnTwYnXV1dS0tL9HHp06ePl5eXuF7G/BYyS5YsIXuWqq7ZBZSw9hnYvXs3PZStrS3ZDxL24uLiyM99fHwoAUNDQ1mXgLTjgCQfr9TUVPryirGx8aVLl9p8taWlJfIg0kRWdXW1hEnCYDBtgiXe7k9MTAz3A7DoaGpq+sMPP+jq6h44cCA9PT0/Pz8qKmrKlCkwwo4ZM6aurg4ChoeHBwQE/Pzzz+DE+YC6uvry5ct///33n376acCAAfRpXFpaGsw/LCwsbt68yefzYTT39/eHTTB7e/vy8nJKIuvq6saMGQMvmjp1alRUVH5+fnp6uq+vr66u7o4dOyBOXV1dyEtMTEx2dnbAB+zt7SHgzZs3NTU1hw0btnPnzsOHDyNbeUjiTUlJgSdubm65ubnwsKmpCTaU4DPM4/HICaO/JTIyUkNDY9asWQcPHvztt9+mTZsGz3V1dYuKio4cOaKiorJs2bIjR47s3bt3+PDh4Dp06NCWlhYULb1sly5damJisnnz5qNHj37//fdoS9Db25vH4w0YMGDIkCE//vjjH3/8sWrVKiS0nz9/HsUZHBzM5XK3b9+O4kROWVlZUG6ffPIJuF67dk1dXX3mzJlHjhzhcrmrV69WVf1/Jz4CAwMptRMSEgLr5To6Or6+vhkZGdBspk+fbmRktGvXLgjo4eEBb6mvr5dF4oWZaO/evYODg1Gh5eTkoAr18/OjBGnnDBYXF8MPBwcHkRLvmTNnuFzunDlzREq8LDLIuptAwJSUFBCfrK2tkZhaW1vr6+sLGZ85cya5fQLHjx8H4fbQoUNoWHj37t2mTZuY5RMZcXJygg1S+PfGjRtoCpiamkr3T6/9ffv2wRMulxsdHQ1j4L59+8D1k08+Qa5cLvfkyZPk2FiUFbuhkgHWPQ5ZiN20aVNlZSU8TEpKguFLU1Pz9u3b5BdJUjL19fWU1r59+3ayt2fPnomsBSQQytg9WTd7CSVeSMzkyZN9fX2PHDmybNkytGRJTgxDBqGFgOQzduzY5ORkeMjn82/fvj148GDJBZg2GzPyKW1dswsoYe0zkJSUxOVyJ02aBME9PT25XC5FcEWmnihDSmJiIpfL/frrrwmCcHd353K52dnZrEtAqnFAko/Xrl27DA0Np02bdvPmTWiT+/fvh3mOkpISOY/w6nHjxpF7bnBwMPLQ2toKyQBl4Hv37uVyuU1NTRImCYPBtAmWeHsQMC1QVVXV0tJKSkoiO/H5fLQru3HjRrITkhKtra1NTU0zMzORU1FRkba2Nnkax+Px4DiflpZWVlYWJQFXrlyBqFxcXAQCAdnp22+/BacFCxZQnJKSkrS0tGA+ZGpqyjBxGThw4MaNG0HGBr777ju6xDthwgTYOCWTnJwMp862bt0qsvTQW6ytrY8fP052WrlyJTitXr26d+/e5I2vpqYmNFe7ceMGJU5y2Q4dOpS8EJCVlQWnW3V0dFavXj1nzhzyx+/y5csQcMyYMeLiJEu8InNx9OhRstOFCxfAyd7envy8oKAAFKWoqalRVs0FAsGiRYvQKVy67CqLxBsVFUUP5erqShCEtrb2u3fvREbbzhnkcDgiJV7K5oZIiZdFBtl1Ex6PB3NxHR2dvLw8Spy//PILxLl7927y85aWFtgwWb58OT0lcLpYERIvHOl0cHBAT1pbW9GxSeY3knft6K75+fmo9MTFwK6sWAyVDLBukH/++Sc8//rrrylxVlVVmZubw+5TWVkZi5Jps7VLUgssuqeMXwdJ0mltbf3rr7+Snc6fPy8uMeIyePjwYXiI1lIR2dnZcFBCqi075sbMuq5ZB5Sw9sURHh4u7r1CoRBdO+rXrx+lioVCISyxkTtUO7R2ST5eGhoaixYtoiT44cOH0CB79er1+vVrslNERAQE/Oyzz0TGXFFRoaGhIbLVYTAYGcESbw8CHf0SOWvMz8+HhW0VFZWioiL6NI4giAsXLlBCrVq1ytHRkT7FFzcxRSouIyMj0cPCwkJ4taqq6ps3b+ihNm7cCKGYJd5hw4ZRRNknT57Y2dmhldTnz59bWlpSVpcR06dPh28k/YtLfsukSZMoTi9evEBF9O2331Jcg4ODwcnb25viRC7b//73vxTXJUuWgJO6unpJSQnFFd3mqqmpYSHxTpw4ke7ar18/epzo5qTIs4Jv375FG87yknjXrl07btw4kaHQceK//vpLpId2ziA7iZddBll3kx9//BGei1zNaW5uhi1NbW1t8owcXVT++eef6aGSkpIUJPHu3LkTNDOTH6KTC4aGhgz7HrJLvOzKisVQyQC7Bsnj8eAUj6amJtrvIoNEsh07dnS4xCt595Tx6yBJOsnLKwi0yEIZYMVl0N3dHRJJXnJFwHEPeUm8rOtalkYio8T7/v17LS0tgiDMzMzoyxao4xAEQT+N3L9/f8op6HZo7ZJ8vNTV1ek3oYRCIdK3t379evLz1tZWCwsLcHr16hU94MGDBwmCkHy3GYPBSA7W1dwTWbp0Kf2hpaUliKN8Pj8oKIjuoXfv3vSbVKdPn0ZmA9ExSIIgFi9eLPLVX3zxBfxAC7QEQQQFBYGan0mTJqHvAZkvv/xSknytXr2acoF2zJgxKSkpKL9Dhw7Nz89HkiQFuChbXl5O0QrTZukNGTIEvuUiXZF+qezsbHFxmpqawklOkQGdnJzMzMzEuebm5hLSI7JIUZyoBFpbW1FjEBnExMQEVgrkiL+/f2JiokgndJlZnIdunEF23UQoFJ44cQJ+i2z5ampqzs7OBEHU19dfvHgRPUdd6fr162QtXMDIkSNTUlK2bt1KyBWBQBAQEKCtrU1J6urVq+FHZWXltWvXCMXAuqykHSoZYN0gg4KCamtrCYKYMWMGXU0aQRDz5s2DH2fOnCE6Ggm7pxy/DgwsX75cwsQwAP2ltbU1KiqK7urn55eSkkLRZsQa1nXdgY1EW1t79uzZcOc8Pj6e7ARdaf369fBvWFgY2fXx48dv3ryBBYXOkBEy06ZNE6nKbtmyZSidSOc2NJJ//etf8Jt+Gx9kaV1dXXS9BYPByBEs8fY4lJSUxOnDRIoK6Yp54HwXumolkoyMDNBGqKSkRFEjjBg9ejT8iI2NRdo10URQnKZEOzu7NjVPwgUqQmJaW1tLSkpevnyZ9b/U1dWBE12nIhmkXBGhpKSEPrr0skW6NOALLXkGDQ0Nxb1RwmgZEBknkqtramrgR2pqKioWdDybArrhrAh4PF5eXh6qI7Q8z1xH3TKD7LpJRkYGKFlVV1cXWSYEQaDb5mSRzMbGBtrY48ePp06d+vfff5ODqKio2NnZtal6XVqio6MLCwuXLFlCsTg6cOBAtCQEhosUAeuyknaoZIB1g7x79y78QPctKdjY2MBx6JKSEgmlOMUhYfeU49eBAZHlCcdiKYlhABX74sWL9+/fX1FRQXbt16+fnZ2dhOqa24R1XXdsI0Hr4BSZNjw8/KOPPvrxxx+hHtH5Z7I8TFlD7yStXdw8B01Famtr09PTyU5r1qyBxZGzZ8+SFbwTBAEqvpcvX062+4DBYOQFtk7U49DT0xNn/gQZs8nKyqK7MpswIQjin3/+QT5BOTMdpNS0oaEhPz8fVHq8fPkSHoozKaGhoaGrq9vmzKPNFIIhgVOnTp07dy45Obm5uVmkH8p3iALFNAIA5wy1PkBxQuo66RtlksQJB63prpJEy4DIOFGtoThR1ZiamtKzJnmxS0tGRsbhw4ejoqKQJQmp6qhbZpBdN0GHk7W1tckHK8iA9RFIFXqooqJy9OhR2ECLjY11cnKytLRcuHChq6uro6OjgmxmgDSLdnTJrF69+sGDBwRB3L59u7CwUOR2n4ywLis5NhjWDRIlPiMj448//hAZUF1dHdpVRkYGC/s9ckTC7inHr4NcEsPAunXrTp06lZGRUV9fv2PHjn//+98zZsxwdXWdP38+Ep7lBeu67thGMmfOHE1NTTAfePjwYZBvnz17lpubu2vXLjMzs4kTJ8bFxRUUFDx9+hQtjoeHhw8ePHjEiBGdsLWL6+na2tomJiawapmVlUVeUjE3N1+wYMHly5crKyvDwsLQbjBBEHBEDu11YzAY+YIl3h4Hg7VPtK9SVVUlVUAA2Q+k7M+QIR/rqqioAIm3urq6zYCampptzmnaTOHbt2+dnZ1TU1MJghgwYICLi4uFhQUSLK9du0Y5bSUSugFGSZxYxylLtNLGSd+CkLBq5Ju2Y8eOeXl58fl8FRWVWbNm2dvb6+npwfSovr4eacTtaRlk101Qr6yurgZFbgyUl5eT/126dKm+vr63tzcsgRUUFBz5gImJyapVq7Zs2YKOIciFioqKq1evGhkZtbS0ULaUYVVIVVUVLuoHBgbu2LGDkDeylBUZSSwqi4N1g0SJD/0A68S3DxJ2Tzl+HeSSGAY0NDRiY2N9fHzOnDnT+oFbH1i/fv3UqVO3bt0K5+HlAuu67thGoqOj4+LicuXKlaKiosePH4PiYtjChUPL7u7ucL4sLCwMJN4nT54UFBSga/ydJCMSzqZA4qXPptavXw+6J48fP44k3uLi4mvXrk2cOBGdIsFgMPIFS7yY/x+0mI2EQKlAB/kYFsXJTugtkgSUCx4eHiDurlmz5sSJE5SThyUlJZJIvD2KdqsaRExMzDfffEMQhIGBwX//+1/KgUMejyehxNsZMigQCOSYQXZJRb3MwsLi+vXrzJ7pO7dz5syZPXt2TEzM+fPnL126BGc1y8rKfH19T506df36dWRvQ3bAVlNFRcXUqVOZfZ4+fXr79u0ynmWVe1l1bINEid+3bx8yiyUOpCOq89P+QxBrDAwM/Pz89u7de+HChdDQ0IcPH8LlzP9+gMPhnDlzRi4Hm1nXdYc3End3dzDZEBYWBkMHeQvXzc3Ny8sLXH19fSnyMJkOz4gss6np06cPGjQoOzs7ISEhLS0NzFCdPHmSz+fjDV4MRnFgibfHUV9fL86Jx+PBD3ZbN+hsGIqH4RVk/4aGhnC2kyHg+/fvCdlIS0u7f/8+WMU8evQo64t2PQrUEhRaNWSQjk0fHx+FXqCVbwZFTscbGhrkmEF23QT1stbWVnEX+JlRUlKa8oFjx47du3fP398fNijKy8tdXV1zcnLA/qTsnD59WkVF5cSJE+IONRQVFcHWbl5eXkxMDLIiLi9kL6sObJDGxsbFxcXwo6MSrwja5+sgR/r06fPNBwoLC4ODg//666/CwkIw7WtnZ4dsWcsC67ru8EYyd+5cDQ2Npqam8PDwgwcPpqamZmdnoy3cfv36jR8/PiEhITc3NyUlZeTIkeHh4QMHDqTf+u7wjMgym1JSUlq3bt3mzZsJgjjxAT6f7+/vb2RktGjRIgUnGYPpuWDNVT2Ouro6cQfA0I0pWHSUFnTxpuoDIv2AsU04ozhgwADK6169eiUyVE1NjexzGnQBb/To0SIvyP2PtS7M/wVVTVVVFTpIRqGoqEiOb0TVhAxZKbSOZMwgWjcROfURGZB1Btl1E9Qr3759yzA/kwRVVVVnZ+dLly49fPgQDtaWlpbeuXOHkAdPnz5NS0ubPXv22rVrOWLYvn073IMA80WEvJFjWbV/g0SJZ6e8vdPSPl8HRWBhYeHj45OdnY22KAMCAuQSM+u67vBGoqurC6e7CwoKkpKS6FqpyNqtkpKS8vPz6Ru8nSEjAKxl0KmoqECn8UXOplasWAHreqB0OjIysri4eOXKlbJciMBgMMxgibcn8ujRI5HP0d05duZY+vfv//HHH8NvONBFBynedHFxQYcS0evol/eYEywVSBWQuDPbDHsIPZbBgwcjFUExMTEi/bRpKEiO1ST3OpIxgwYGBgxTn4SEBDlmkF036d+//7Bhw0CWZsjIvHnzzMzMfvvtN/QkMzPT1dU1MjKS7nnChAnI4KQ4zVty1FlFZtWqVfAjPDyc9dVNccsKrMuqMzRIdLZT3NgLEZqZmVlZWYk8fSD5ilJ7Lg62z9dBdnbu3CnS7J+GhgYyeSWvzsK6rtuzkYgDSbAXL14MDw+3sbEhb9K6ubnBj7CwMHFHmjtJRhg+DaitWlhYDBo0iO7ByMgI8lVXVxccHAw6qzw9PWVMDwaDYQBLvD2RkydP0h/Gx8eD9lE9PT1xFmvbxNvbG36cPXuW7srn8//zn/9QfILpSz09PTh4/PjxY3pAf39/QmaQJuqUlBT6GVSBQCCJtcweCPoM+/n50V0zMzNFynWyV1NSUhLdFbT1dp4MDh06VJxBr6ioKJFWMVhnkHU3geNzDPuiWVlZ169fLysrmzt3LnpYXl4eERFx9epVkUEgJQRBUAwUhYWFff311zdv3iSkobGx8fz583369AGLnQx89dVXcBOysbGxTY01FNDpa2QXjSCIGzdujBw5cuXKlbKUVWdokK6urtC0Hj58KFLZPhyhfPv2rYODA+WQiyQlI87b3LlzR44cKbJByoX2+TrITlxcXEhIiMiVLx0dHbj1LS9rXqzrWu6NhEXtz58/H7Y3/f39X758SRFo+/fvD/d7X7165e/vb2VlhbZz27m1S0JCQkJmZqbIV8OPdevWiQu7YcMG+HHgwIHo6OjPPvtMpGyMwWDkBZZ4exza2tq3b98+d+4c+eG7d+/Q5skvv/zC2hzcihUrZsyYQRDE5cuX6btD+/fvz87OJghi69at5Js5vXr1AjUVEAPFkuG5c+fu3Lkj+13ByZMnm5qawpFF9DrEgQMHutlpQHmxadMmKysrgiBu3brF5XLJTtXV1cuXL0dWNOXCF198AT98fX0pWyIlJSU7d+4kOlMGZ86cCT8CAgLQcWVYVVm5cqXIc8usM8i6m3A4HEhnSEgIqI0h8/79ezhJuGLFCiTAI0JCQl68eEF52NDQcO3aNdjiJp8HiYyMXLx48fHjx+fMmSPSprc4Ll++zOPxli9f3qbOvL59+yKdt9IebDY2NgZ9v+RTwQ8fPkxNTUVqqGQpq45tkCoqKgEBAcrKykKhcOXKlfR9raCgoNDQUE1NzZ9++olFyYCNU/iBvNXW1kZHR6empipOOVD7fB3kxY8//kh/eOnSJVhjpRiVZQ3rupalkcir9vX09D777DN0noW+hYue8Hg8cfda26G1S4KZmdny5cvRAWbgzz//BHPBVlZWDNe2J0yYAGqZX79+jY0SYTDtgRDTYwB5z9TUFDZa582b5+fnFxISsnPnTnCCQ4MCgQD8Hzp0iMPhzJs3D5xsbGzgNp23tzfDWyorKydOnAi3/rZv356WllZaWpqYmMjhcCCelStXtrS0UEIJBAIkcpuZme3atSskJMTPz2/+/PmgxBUlHgXJycmB9PTv3x8Curm5wZO4uDiRaYuIiEBHqV1cXM6fP5+QkHD16lU3NzddXV1INkEQzs7OHA7H19eX4S3nz58XCoXJycngCmsEampq5ARcvXqVw+F4eHhAQFNTU3BNT08XV7b19fVCoXDXrl0cDgelZ+zYseRiB59owg2p3bNnj7e3t8g409PTmXMhLk4oAaFQmJKS0rt3b3CaO3euv79/SEjIrl27zM3NR4wYgVQxcbncNhshj8eDdzk4OEAoBwcHct6bmprGjx8PTgYGBvv3779z587Dhw8PHjxoamrq4uJCKcwXL160WU0KzSDaFlBRUZkyZYqHh8fEiROVlJQ8PT13794NTlOnTuVwOGvWrGGdQdbdBKiqqpo8eTIk8ptvvklMTCwpKUlLSzt58iSYyHZ0dKyrqyMHQbvNpqamf/75Z2ZmZllZWVZWVlhY2NixY6GDX7lyhRyEbETk4MGDbTYGoVB49OhRDocDk+np06dzOJxDhw6J87xx40YOhzNmzBj0Fg8PDw6Hc/z4cXFDASU2MC8MaoQKCwsjIyOh3v/++29ZyordUMkA6wYZGhoKG2hDhw4NCgrKzc0tLCx88ODBV199paSkpKamFhYWJvKNkpRMVlYWjJ+Ojo7Pnz/Pzs4G2ypTp04VCoVxcXEia2HPnj0ydk/WzV4krBPDkEGhUIj0qLm7u0dHRxcWFhYXFz9+/NjHxwcuZzo6OjY2NraZPHFvoTdm1nXNLiBz7UtFYGAgZM3a2prump+fjzr448ePGeJRaGuX5ON1+PDh4cOHm5ub79y5MyQkxN/fHx23NjAwePbsGXM5HDt2DDybm5vTJ0UYDEa+YIm3B0GeFly6dMnc3Jyy8vr777/z+XzkX5z9QEtLS+YXNTY2/vrrr0ZGRpSANjY2wcHB4kLx+fwjR46g05JA3759YVYNpt7NzMyQf4aLdgEBAeLeEh0dPWTIEIr/iRMnpqWlgV0ExJQpUxje4uXlBTItQwKQwEPh1q1b4sq2urpaKBSKVD6Jil1kwHHjxsF0XOTrmHMhLk4oAeDly5cUmzHKysqLFy+urq5GJ7j8/PzabISlpaUi34XyLhQKa2trPT09Kdt9Ojo6+/bto1tWfPDgQZvVpNAMNjY2rly5kmwpR0NDY9u2bQKBgNIANDQ0WGeQdTdBNDU1HTx4EKkjRhgZGf3000/0uXh9ff3p06ednJxEajWfPHnyo0ePKEESExPBs5aW1j///NNmYxAKhQsWLKDE7OzsLM4zWpijgC4V06HEVlJSMmrUKLIHNTU1unAubVmxHioZYN0gU1JSnJ2d6aabnJyckpKSxL1OwpL5888/KZq07ezsXr9+LRQKxallGjdunOzdk3Wzp8M6MQwZFAqFqampGzZsELnbaWhouGvXroaGBkmSx6Ddit412NU164AMtS8VVVVVMFBs2bJFpAdY1RowYECbUSm0tbf58eJyuVVVVYsWLaIkwMnJKSsrq83E19TUwFr5jz/+2KZnDAYjI0pYP23PwczM7O3bt6ampjBw8/n8+Pj4/Pz8xsZGS0vLKVOmyFdPoEAgePLkSU5ODo/HMzIyGvaBNkM1NTX9/fffBQUFmpqa1tbWEyZMgGt7vXr1ev/+va2tLf2MpbTAZzI9Pb2urs7Q0HDs2LHovBaGmVevXj19+rS6utrMzOzTTz+Fa2mHDh2C24+hoaGsb4DTqaysjI+PLyoqUlNTGzBggKOjI+gH7pwZLCwsjI+Pr6ioMDc3Hz9+vDjZTF4ZZN1NBAJBUlJSdnZ2VVWVrq6ura3tqFGjmM8Sv3//Pj09PTs7u6amRk1NzczMbNSoUeLOMT5//jwhIcHJyanT9imhUPjkyZPMzMyGhgYTE5PJkyeDvCSXsuo8DfLdu3eJiYmlpaWwUjBmzJg2j55KWDLl5eWxsbGlpaXq6uoff/yxg4OD3A0jd+DXQXZyc3PhQERjY6Oenp6tra29vb1Cmw2LumYdsANrnwHFtXYJKSoqevLkSWlpqYGBwejRo5FK+Taxt7dPS0srKChA+uowGIyCwBJvz5V4uxDV1dVw6Oizzz6TlzUUjLz47rvv/vjjD1B+hs7rdie6SgZxN+khdJUG2T7gZo/pomRmZg4fPnz+/PkREREdnRYMpvuDNVdhOgUPHz5csWJFQUGBOFf44eTk1L7pwvwPmzdvhhm2SEBHkba2tkilml2CrpJB3E16CF2lQbYPuNljuiWgZhwpbcZgMAoFS7yYTkF2dnZgYCCyXUQBNLVoaGi0aa4TowjCw8N37dr1/v17ulNcXNzTp08Jgli7di3lilcXoqtkEHeTHkJXaZDtA272mG5AREQEaAaFf3k8XkBAgLW1NVL4j8FgFAqWeLs/lZWVBR8AAwl8Ph/+raqqIjoZe/bsodg0qq+v/+abb+7du0cQxJEjRyS5HolRBLW1tYsXL6a0mUePHoG9jcGDB9ONQHQtulAGcTfpCXShBtk+4GaP6dKkpKScPXs2Ojoa/v3hhx9qamo2b97cGS5CYzA9ARFKODHdjO3bt/v5+aF/y8vLwdijl5fXkSNHiM6Bnp6ekpJSc3Pz/Pnzhw0bNmLECAMDg9LS0piYmMrKSg0NjSNHjjAYc8coFAMDg4KCgps3b1pYWEyZMsXCwqK1tTUtLQ32miZMmHDx4kV9fX2iy9JVMoi7SQ+hqzTI9gE3e0y3Yf78+Y6OjqWlpc+fP3dwcPjXv/7V0SnCYHoKWHNV9+fGjRtJSUn05w4ODuKManQIhYWF169fj4uL++eff8rKyhoaGvT19a2srKZNm7ZmzRq8ft+B8Pn8+/fv371799mzZ7m5uTU1NcrKyn369BkzZoybmxuyQNh16UIZxN2kJ9CFGmT7gJs9pqtz7969P/74459//uHxeGZmZnPnzt22bRvF4BYGg1EcWOLFYDAYDAaDwWAwGEz3BN/jxWAwGAwGg8FgMBhM9wRLvBgMBoPBYDAYDAaD6Z5giReDwWAwGAwGg8FgMN0TLPFiMBgMBoPBYDAYDKZ7giVeDAaDwWAwGAwGg8F0T7A93p7OsWPHwsLC0L+GhoaXL18mughVVVULFy4kP/H29p43b17HpQgjN3DlYjqc+vr60NDQBw8elJaWampqmpmZjRkzxtnZ2dLSsqOThlE479+/pxiCwkNQ1+L27dsHDhwgP7lw4QK2ZYXB9EywxNvTqayszM/PJwjizZs3AoGga30M+Hw+JL62trayspIgCA8Pj45NEo/HmzdvXmpq6sGDB9euXUt0Ys6dO+fl5fXRRx/duHHD0NCQ6GR0wsrFdN3WzoLU1NS5c+cWFhaqqanZ2tqCbfOTJ0/q6+tXV1d3bNpWr16dmZkp0unq1atmZmY9ueLkhUAgkPsQtGnTpoSEBIIgwsLC+vfvL85bYmLid999xxCPsrKynp6etbW1k5OTq6urhoaGHJuHfJEwy4qgrq4OahBsOBME0djY2J4JwGAwnQghBvMBkHVNTU2FXRAulwvtmcvldpKU6OvrCzs3aHXjyJEjwk5M56nczsaLFy8efKCurq5DIu9CrV1aGhsbBwwYQBDEkCFD8vLy4GFycrK2tnZnyOzixYttP6Cq+v+WrQcMGABPioqK2gzejSuuMw9B7969U1NTg6h+/vlnBp+xsbFQm0g61dbWhie2trZDhgwxNzdHs7g+ffpcvHhRjs1DjkieZYWOgQsWLIA05Ofnyz0NGAymS4Dv8WIw8uTjjz+GH0OHDiU6N8OGDesqScWI5MCBA04fyM7O7pDIu1Brl5ZLly69fv2aIIht27ZZWVnBQ3t7+88//5zoBFy4cOHFB/r16wdPLl68CE/69u3bZvBuXHGdmaCgoJaWFvh95swZoVAozqejoyPUpq+vLzyZNGkSPHnx4kVWVlbxB7y9vQmCePfu3eLFi48fPy6v5tEhWe6EYyAGg+lOYIkXg5EnkyZNio2NPX78+M2bN4nOzdWrV7lc7r1792bOnNnRacF0SbpQa5eW2NhY+DFy5Ejy8xMnTrx8+ZLo4nTjiuvMnD59Gv3Oz89/8OCBLLGZm5sfPHhw//798K+Xl1cnbJnyzTIGg8GwBku8GIyccXR0XL9+fe/evYnOja6urqen57Rp0zo6IZguTFdp7dLy7t07+KGvr09+3qtXLxMTE6Lr010rrtPy5MmTjIyM2bNno331U6dOyR6tt7e3kZERQRCtra0nTpwgekCWMRgMhgVY4sVgMBgM5v/Q2toKP1RUVDo6LZjuAOx2rvkAPLl06ZLsKtDU1dXHjx8Pv2NiYogekGUMBoNhAdbV3ONITk6OiIh4/fq1pqbmwIED3d3d0S01ZtLS0m7dupWbm1tfX29kZGRvbz9r1izKdkdLS0tycjI9rI2NjbGxMfx+8+ZNcXEx2dXMzIxi7UOSd0nLixcvoqKisrOza2pqjIyMhg8fPnv2bPqlJnoWrK2tTUxMWlpabty4ER8fX1paqq+vP3bs2IULF+rq6iJv5eXlOTk55ID29vbq6urwOyUlpampCTn16dNn4MCBBEEkJCRcv379zZs3urq648aNc3d319LSEpeF2traK1euPHnyhMfjmZmZTZgwYc6cOWpqamVlZXl5eWSfo0aNQvpC6IhLDEMuqqurAwMDMzIytLS0hg8f/uWXX+ro6CA/OTk5oaGh2dnZmpqan3766ZIlS7S1tZFrXl5eWVkZ+ldNTW3UqFHwPDw8PDc3F7QELViwAJ6zoLa29vbt24mJiWVlZVpaWv379582bdr48eOVlJQoPhWRQdaJYdcqUBNF+5BpaWlkHaT9+/enNOznz5/HxsY+f/68srJSTU3N1NTUwcFh1qxZFBWvkkfO3NrZdT25dJOkpKR79+5lZ2fX19fr6enZ2to6ODh8+umnysoSLe+ifIFuXoIgnj17VlpaCr+NjIwGDRpE9l9fX3/37t2HDx++fftWTU2tb9++06ZNc3R0pMvJ4kqssbExPDz82bNnZWVlurq6tra2CxYskHBMZoGEFVdTUxMZGfn06dPy8nJlZWVzc/ORI0dOmzatT58+7davJW+0DPmqqakJDg5OT0+vr6+3trZ2dXW1s7OTdoAlZKahoSEkJKRPnz5z586trq728fFpbW1tamoKDQ1dt26djJGjSkF9tjMgbZal6iD9+vWTdgwk02aryM7OrqioQP/27t17yJAh6N/S0tKCggL0r7a29ogRI5hHsOfPn1++fDk/P5/P55uZmY0dO7aTaATAYHoQHa06C9N+VFZWihxkfXx8+Hw+g67mnJwcdNWzd+/elpaWMAlQV1ffsmVLc3Mz8ommhhQCAgKQHx8fH4qrl5cXi3dJrkszPz9/7ty54EFXV9fKykpTUxN2b9avX19bW0v2TM8Cl8tNTU21tramPDc2Nr506RIKGBAQQPFAVgtJEek5HE5jY6ObmxsliIWFRXp6usg8Xrp0Ca0aIGxsbNLS0lD2EaWlpeIbgojEMOfi7t27enp65IdGRkYxMTEQ5Oeff6bM7y0sLJ4/f47i9PT0JLuampq2trZu3ryZ8iKCID7//POqqiqpKlcoFB49etTAwAAq1NLSEs74EQRhZ2eXmJhI8ayIDLJODLtWIa6XIXx9fZHnwMBAGxsbeK6qqmppaYlWjoyNjYOCgihJkjBy5tbOruvJ2E0KCgomT56M3mVpaYkEuT59+nh5eYkbPZibB5klS5aQPfv5+UGXVFZWtrCwQMrPbW1t79y502bM+fn58fHxdINwUulORyVGb10SZpBecX/99Rcs9ygrK/ft2xc1GCUlpSlTpty/f18u/ZoBaRstQ7+mHEqnfG6kHWBZ62r+z3/+QxDE999/D/8iS+OjR49mDojy5ezsLM6Pu7s7+Bk2bJiMzUOOSJtlqTqIVGMgRVezJK1iyZIlZNcFCxaQXY8cOUJ2tbOzYxjBmpubV61aRXkd1pGOwbQ/WOLtKdTV1Y0ZMwZG26lTp0ZFReXn56enp/v6+urq6u7YsUOcxJuSkgLzAGtrazTXqa2t9fX1hT2rmTNntrS0wPP6+noul7t37154ka6u7okTJ7hcblZWFoowMTGRy+Vu3bqVIIhx48ZxudyHDx+yeBcZhhlJWloaZM3CwuLmzZt8Ph9Mj/j7+8M2nb29fXl5OfIPWeByucj04q5duwwNDadNm3bz5k0otP3790NYJSWl0NBQCJiVlQUBP/nkE/RxRdEGBwdzudzt27ejD6GHh4exsfGWLVv8/f0PHDiANCcPHjyYPjUPCQmBEtDR0fH19c3IyMjPz4+Kipo+fbqRkdGuXbsgrIeHB6Shvr6eoTHQE4OcsrOzAz5gb28PrpGRkRoaGrNmzTp48OBvv/2G7v3q6uoWFRUdOXJERUVl2bJlR44c2bt37/Dhw8F16NChqKZiYmIgVbAlbmpq+sMPP+jq6h44cCA9PR0yMmXKFAg4ZswYip0J5ukmsia6adOmyspKeJiUlATp19TUvH37Ntm/IjLIOjHsWgVqog4ODuC6fft2Lolnz55Rpnq9e/cODg5GCc7JyUHN28/Pj5wkCSNnbu3sup4s3aS2thbWpMaOHZucnAwP+Xz+7du3Bw8eDEGqq6uFbUHP1759+1Deo6Ojkc8NGzaAh3Xr1qEFphcvXsyYMQNkxVOnTjE3vJs3b2pqag4bNmznzp2HDx9GNaJQibfNigOVv0pKSocOHUI98d27d5s2baLIBjL2awakbbQi83Xt2jV1dfWZM2ceOXKEy+WuXr0ameoJDAxkN8CylnidnJxgow/+vXHjBhJ+UlNTZZR40WrssmXLOo/EK22WpeogUo2BZIkXWsXkyZN9fX2PHDmybNkytJpJbhXR0dFcLnffvn0iJV5YBEEfJrLEGx4eHhAQ8PPPP6MRjMPhqKurL1++/Pfff//pp5/A5hmWeDGY9gdLvD2Fb7/9Fo3dAoGA7JSUlKSlpQWzAYrEy+Px4Guqo6ODjFIifvnlF4hz9+7dFCf00YqPjxeZHtgKiIyMlP1dDEIRj8eDM0VaWlpkqRu4cuUKhHJxcaGUCTlODQ2NRYsWUTw8fPgQSqxXr16vX7+W0PRfSkoKOFlZWdna2paVlSGnxsZGpBX22rVr5FAFBQW9evWCc4OUiYtAIFi0aBE65ifVhAwlhizx0nNhbW19/PhxstPKlSvBafXq1b1790ZrE0KhsKmpCS2s3LhxgxInyD+qqqpaWlpJSUlkJz6fjzYDN27cKKHE++eff4LT119/TXGqqqoCk5XGxsbkclZcBlknhl2rEAqFHA4HnFJSUugZJGczKiqK7uTq6gpH8t69e0d3lSRyhtYuS9djUSCHDx+Gh7m5uZTYsrOzYcdSEom3zXwBx44dA9dVq1ZRnJqamsaOHQv72HFxcQwxDxw4cOPGjbAQAHz33XeKlniZM9jS0gKnEpYvX04PAodR6Xuk7Pp1m2lj0Wgp/fro0aNkpwsXLoCTvb19OwywCDis6+DggJ60traiM7fi9pwllHgvX74MHgiCuHfvXieReGXJslQdRNphytra+tdffyU7nT9/XmSrgCMqIiVeBF3ipYxg1tbWpqammZmZyKmoqKiT2PTGYHoaWOLtERQWFsJCpqqq6ps3b+geNm7cCAM0ReL98ccf4fnWrVvpoZqbm2FLVltbmzKb9Pf3F7fqDNNWIyOj/v37kz9mrN/FIBTt3r2b+RPr6OgIHsiyNyVOdXX1t2/f0sMibRzr16+XVuIlCOLu3bsU15MnT4KTt7c3+Tm69eTp6UlPBlwgVJzEO2nSJIrTixcvUC6+/fZbimtwcLDIXKCZsbjqyM/Ph1aqoqJSVFQkyXIGbC5pamqiDVUySArasWOHojMoS2LYtQoJZ3tr164dN26cSKe4uDgI/tdff8ld4pWl67EoEDjYqaqqSh5SEHPmzJGjxIvqWtzIcO/ePQg7atQohpiHDRvW2tpKdnry5ImdnV1wcHBHSbzPnz+Hhz///DM9SFJSEoPEK22/ZoB1oyXna+LEiXRXZJ+2pqZG0QMsYufOnaCmmPwQHWQwNDRsampiJ/FGRESgA7oih/GOknhlybJUHUTaYYoshCOQKE5uFXKReME2MsV11apVjo6ODKnFYDCKAOtq7hEEBQXx+XyY3FtYWNA9fPnll/SHQqEQWTugXGsB1NTUnJ2dQX3LxYsXyU5Lly6Fi5EXL14ka4AAwsLCKioqPD09kToZWd4lDnRCjyCIxYsXi/TzxRdfwA+0QUdn2rRpIpVmLVu2DH4EBQUhza4SYmJiQjcLNHr0aPhBVuDR2toaFBTEUE0mJibTp08nFMbSpUspT4YMGYL0BtFdkZaa7OxsyeMkCMLS0hKkID6fj7LMQFBQUG1tLUEQM2bMEGlkZd68efDjzJkzis6gXBIjeauQHH9//8TERJFOSBeLOA+skVfXk7xAQKZqbW2Nioqix+Pn55eSkkLWMycLqK4nT54scmRwcnICZULJyckMZbt69WrK/fAxY8akpKSI7B3tA0rP9evX4ZNBZuTIkSkpKXAhRXH9Wl6NVuRoiTovUvWn6AFWIBAEBARoa2tTvmurV6+GH5WVldeuXWsznszMzHX/i6en5xdffDFkyJAFCxbweDyCIDZs2NB5DP/IK8uK6CDLly+XpFXIi969e9OVp5w+fRqZ+8ZgMO0Glnh7BGh4/fTTT0V6sLOzoyuSzcjIAEWI6urq6CQhBXStkTKC6+jowKelubmZrpHixIkTqqqq6Psn47vEkZGRAapElZSUxCkLRbPn2NjYlpYWkX7EhYWzi6DhMz09nZAGkQVuZmYGP2pqatDD1NTUuro6+I3O01JAZ8gVAb06lJSUkFBHV3yKdDWBVEBHSUlJnLpU1D7RTg4Dd+/ehR/oKhcFGxsbOI5YUlLCMJWRSwblkhjJWwU7eDxeXl5e1v+CdjDIGnflgry6nuQFgop98eLF+/fvp6yy9evXz87OTkJ1zW2C6lpcf1RWVkZdEu33MgwgnQcbGxto3o8fP546derff/9NdlVRUbGzsxOnAlde/VpejVbkd4TeeBQ9wEZHRxcWFi5ZsgQOTiMGDhwIN12RFR9mCgsL/f4Xf3//CxcuvHnzZujQoZ6ensnJyceOHUO3lDsceWVZER1EZFXClRO5jLH013WeesFgeji4K/YIXr58CT/oCocBDQ0NXV1dynCPTrhpa2uL24dBhnwyMjIoTuvXr4fbbidOnPj+++/RzDU9PT0+Pn7RokVo8iH7u0Tyzz//wA8TExPQEEsHHfpqaGjIz89HSm7IiLOKpK2tbWJiAhOvrKwsqWZFdKWgcCAWfpB3V1DdmZqairPIIqPdJmaQgEcGjvlpfYDihBTk0veIAD09PZH2RWBKBD+ysrLaTBhqMxkZGX/88YdIP+rq6mArIiMjQ1zjl0sG5ZIYyVuFVGRkZBw+fDgqKqqkpESkB7I5Dbkgr64neYGsW7fu1KlTGRkZ9fX1O3bs+Pe//z1jxgxXV9f58+ej6azcc8dgQwjlLjMzU5wfhXZbdqioqBw9ehS2OmNjY52cnCwtLRcuXOjq6irS5JIi+rW8Gq2EjUfRAyyIduTlXcTq1asfPHhAEMTt27cLCwtFHr9CzJgx4/r16+hfZWVluZhNUgTyyrIiOoiCxtgu1McxmB4Llnh7BMjmO2XNlYympiZF4kUWKaurq0FjBAPl5eWUJ8OGDXN0dIyLi8vJybl79+5nn30Gz+G4I9J0Kpd3iQTFyZBr8kHHiooKkdNucdM4iBkk3qqqKkIaRFouFbkHJWHdEQpDnJFVZicGmMsTfkhSnqh+Qz/Aus3IJYNySYzkrUJyjh075uXlxefzVVRUZs2aZW9vr6enB8tP9fX1SKeofJFX15O8QDQ0NGJjY318fM6cOdP6gVsfWL9+/dSpU7du3Qp3Ito/d/Q7HeQ0E52PpUuX6uvre3t7g3RaUFBw5AMmJiarVq3asmWLoaGhQvu1vBqthI1HoQNsRUXF1atXjYyMWlpaKBvmsNamqqoKV1UDAwN37NjBEJWKikrnbDCKy7Ii8quIMZaBLlFlGEwPAUu8PQJ0rkaqJUy0hGxhYUFeXRaJyOX/DRs2wDG248ePg8RbV1cXFBRka2s7depU+b6LXa7JTiyWzFFwxS23s6u7LopU5Yn87Nu3D1QTMYA01iiITpUYRExMzDfffEMQhIGBwX//+1/KMQQej6cgibcduh4dAwMDPz+/vXv3XrhwITQ09OHDh3Cj+L8f4HA4Z86ckcvUVqrcddqNOAbmzJkze/bsmJiY8+fPX7p0CYT2srIyX1/fU6dOXb9+fdy4cVJFKFVptHOjVegAC9aVKioqKN87OqdPn96+fTv9DH+XowdmGYPBdAmwxNsjMDQ0hLNhoOVCJO/fvxd3/qe1tVXcBS1m3NzcjI2Ny8vLr127VlRU1K9fv+Dg4Lq6uvXr18v9XXRQnAy5JjuJPO8EuwptBhe37yE7KGap6q4zI6/yNDY2Li4uhh/yajOs6VSJQSAF0T4+Pgq97K2grseCPn36fPOBwsLC4ODgv/76q7CwEIxt2tnZIaOycqlrSXInx6y1J0pKSlM+cOzYsXv37vn7+4MVnPLycldX15ycHLCorIh+3c6NVqED7OnTp1VUVE6cOCHutEhRURHsc+bl5cXExCDzxV2XbpllkashDQ0NHZEWDAbDEizx9gg++eQTuE726tUrkR5qamroH3WkWubt27f19fX0KU6bqKurr1q16tdffxUIBKdOnfr3v/99/PhxTU3Nr776Su7vooPirPqASA26SN2rkZERmIanAzNmOhUVFehE3CeffEIoBhRzVVVVZWWlyCljUVER0XWoq6urqakBVd4U0J06Scpz9OjRaWlpYIKV6Gg6VWLoV9+RKSAyyLqG3JFX15MFCwsLHx+f7777bvny5WFhYQRBBAQEyEXiRXXNoI0c5a6TqKe6f//+H3/84eHhIVITPgOqqqrOH4iPj58+fXpjY2NpaemdO3fALq4i+nU7N1rFDbBPnz5NS0ubN2/e2rVrGbwFBATAd/nUqVMdJf6xbh5dN8tS7f+LXM3pWp9dDAaDdTX3CJBxBfq9GuDRo0f0h/379x82bBhMMhhMQcybN8/MzOy3334T6bpu3To4tuTv7x8bGwnmfEgAAQAASURBVJuWlvbFF1/QZ8ByeRc9zo8//hh+wxFHOkjts4uLi7jjVeLSgwrTwsJi0KBBhGIYPHgwUu8RExMjVQo7LSLbG7lIJTEHgg4Pi6tcKDEzMzMrKytFr8d3bGLEiQFIu4/I06QMm1qSRN4OXU9ydu7cKdJmiYaGBjJ7Jk4HkrTMnj2bWfNwY2MjmK4FM6pEJ+D169cRERFkQ9MiyczMdHV1jYyMpDtNmDABWSAXV5Jy6ddyabSdYYBlUOBEZtWqVfAjPDxc7rqC5ds8OnOWFbF+Z2BgwLDqHR8fL/c3YjAYxYEl3h7BkiVLYOk9LS3t8ePHdA/+/v4iA27evBl+iLP1l5WVdf369bKysrlz54r0YG1tDXO+4uJisFdE0Vklx3fR8fb2hh9nz56lu/L5/P/85z8Un3QSEhJEKlxFM+l169YRisTT0xN++Pn50V0zMzMTEhKILsXJkyfpD+Pj40ELt56eniRbDa6urqAD9uHDh+J0wJ44ceLt27cODg7itLDKiw5JDDoKQbbuM3fu3JEjR0I3RzpykQBGBpSmso68Hbqe5MTFxYWEhIicmOro6MDNf3FmdaRl4cKFoKU5OTkZNnsphIWFwaKGq6ur4tbCFEF5eXlERMTVq1dFuqL9W3ElKZd+LUuj7TwDbGNj4/nz5/v06YPWR8Tx1VdfwfXyxsbGNpXetRvv37//5QNcLrczZ1nGYYoZHR0d0Lnw6tUrsJ6IEAqFYIoCg8F0FbDE2yPo1auXr68v/F6xYgVFfei5c+fu3Lkj8iAxh8OZOXMmQRAhISFXrlyhuL5//37x4sUQ59ChQ8W9Hd3aLSgosLe3F3fMTy7vorBixYoZM2YQBHH58mX6xsX+/fvhXOLWrVvFGQEGE47Lly9HB5iBP//8E8xyWllZyeWoJAObNm2CGfatW7co84/q6urly5eT7Tx1frS1tW/fvn3u3Dnyw3fv3qGF/19++UVHR6fNeFRUVAICApSVlYVC4cqVK+kbp0FBQaGhoZqamj/99JNcc9BZEmNjY0M5X1dbWxsdHZ2amgoTtS+++AKe+/r6UvblSkpKdu7cKUvk7dD1pOXHH3+kP7x06RJcw4MBRHZUVFTOnj0LU/Z169ZRzOSUlJRs27YNLoiKM7TWyQkJCaFv9zU0NFy7dg02vkRu1cqrX8vSaDvPAHv58mUej7d8+fI2lXX17dsXHQQQt9rb/pSVlW37QHBwcGfOsozDVJvMmjUL5NvNmze3trbCw5aWlm+//ZadqQIMBtNhCDE9A4FAgGYeZmZmu3btCgkJ8fPzmz9/PuhXNDU1BTMMnA8EBgZCwKqqqsmTJ8M875tvvklMTCwpKUlLSzt58iTYnHR0dKyrq2N4dWtrKzo2dvLkSQaf0r6Lx+NBah0cHCB+BwcHeFJfXw9+KisrJ06cCHdytm/fnpaWVlpampiYyOFwIMjKlStbWlroiUFTn8OHDw8fPtzc3Hznzp0hISH+/v7oCKuBgcGzZ8/Af1xcHLy6f//+4Orm5sbhcPbs2SMUCg8dOsThcObNmwdONjY25HRevXqVw+F4eHiAq6mpKbi+ePECIk9JSUFHwefOnevv7x8SErJr1y5zc/MRI0YgXS9cLleSxuDt7S0yMenp6Tk5OSJzcf78eaFQmJycDK4wc1VTU4N/4+LiGHKRnp4O74U2ZmpqCvt78+bN8/PzCwkJ2blzJzjBgTeBQCBh5QqFwtDQUJh5DB06NCgoKDc3t7Cw8MGDB1999ZWSkpKamlpYWBg57wrNoLSJkbFVZGVlwXlgR0fH58+fZ2dnL1u2jCCIqVOngoempqbx48ejtrp///47d+48fPjw4MGDpqamLi4u4mJuM3Lm1s6667EuEHQb0N3dPTo6urCwsLi4+PHjxz4+PmAgxNHRsbGxsc2uIS5fHA7n0KFDZJ9BQUEwsx81alRERERhYWFeXt7Zs2dhnm1sbPzo0SNJGh5qXVKxZ88eckOFUd1SPGB0evfu3cwVh3ZQTU1N//zzz8zMzLKysqysrLCwMFipVFVVvXLlCiUxUvXrNmHXaJn7tVAoBFe0Wurs7MzhcHx9faUaYNEQxOPxxKX/6NGjHA4HJLHp06fTWw6ZjRs3cjicMWPGoCmZh4cHh8M5d+4cvAh6EEiJ8ITST+XbPFAMaFt75cqVbVaZXLJ84cIFFh2EeZiSsVUIhcKXL18iC0MWFhZubm6ff/65qampvr4+ssvdu3dviOfGjRviRjBvb+82ixGDwSgULPH2IPh8/pEjRyiaRfr27QszGDQ1ATw9PVHApqamgwcP0pWOGhkZ/fTTT5LMI/fs2QOn2phlY2nfVVpaSoihuroaeWtsbPz111/ho07GxsYmODhYXEqQxMvlcquqqhYtWkS5bejk5JSVlYX8BwQEiEzJuHHjhEKhuOt8kM7du3eLdH3w4AGK/+XLlxR7D8rKyosXL66urkbnq/38/NqsC6FQCMsHdG7duiXuxpqXlxeIHCJdAwICGHJx69YtysxYKBReunTJ3Nyc7E1PT+/333/n8/lSVS7MVp2dnel3QZ2cnJKSkih5V2gGpU2M7K3izz//pGw12NnZvX79Gnmora319PSk7Lro6Ojs27ePbhaYHDNz5MytnXXXY10gqampGzZsELmrY2houGvXroaGBkm6hrh8wWyY4vnZs2fIzDhCTU1t+fLlb968kbDhodYlFdLaBwJ2797NXHH19fWnT592cnJCOnvITJ48mSLGs+jXksCi0TL3a3GXPKdMmSLJAEs/2VtaWiou8QsWLGiz5VCKjg7zUX9KP5Vj80Ax/PHHH/Dw8uXLbdaXXLK8a9cudh2EYZiSvVUIhcJ79+4hgRkYMWJEWloaPbivr6+4EczS0rLNYsRgMApFSXHqOjGdk6ampr///rugoEBTU9Pa2nrChAkS2qgUCARJSUnZ2dlVVVW6urq2trajRo1SkLVJRbxLIBA8efIkJyeHx+MZGRkN+wCDfz8/P7igy+Vy4aJXUVHRkydPSktLDQwMRo8ePXjwYKLdefXq1dOnT6urq83MzD799FO4UHfo0CG4BR0aGiqjsk2FYmZm9vbtW1NTU5Bm+Xx+fHx8fn5+Y2OjpaXllClT0Go6C969e5eYmAgzUVNT0zFjxrSb2duOTUx5eXlsbGxpaam6uvrHH3/s4OBAl7crKyvj4+OLiorU1NQGDBjg6Oioqakpr8jl3vVkITc3F3YmGxsb9fT0bG1t7e3tFWoUt6ysDOpaTU2tb9++EydO7NWrF9HFef/+fXp6enZ2dk1NjZqampmZ2ahRo8S1YQX1a9aNVu4DbA9k3Lhxjx8/trCwyM/Ph2vwnRm5DFMMtLS0JCQkwEWMjz76aMKECXKMHIPBtA9Y4sVgJJV4Oy3fffcdLMnHx8ejA4GdEMrMGIPBdANwv+5mnDlzBvQtnz9/Hl0iwGAwmC4N1lyFwXQBNm/ejI6Z0QErKdra2sgOKgaDwWAw0nLp0iVQNrlt2zYs7mIwmG6DiLs6GAymsxEeHl5ZWblmzRq6stO4uLinT58SBLF27VqsPRKDwWAwrHn37p2SktLRo0e//fbbjk4LBoPByA0s8WIw/weBQPDmzRuCIJANp4qKioKCAoIgBgwYIN/bQVJRW1u7ePHioKAgpFOUIIhHjx6BzZXBgwe3gw0edlRWVtbW1sIFP/gL5amnp0fOCwaD6ULgft0tWbdunbu7O13bHAaDwXRp8D1eDOb/8PbtW3HWF6urq/X19YmOYOTIkampqXB0ecqUKRYWFq2trWlpabC7O2HChIsXL3agoiZm1q1b5+fnR3/u5eV15MiRjkgRBoORFdyvMRgMBtNVwHu8GMz/oVevXuKMoLSDplBxPH369P79+3fv3n327BloE1VWVu7Tp8/KlSvd3NyQfeDOybx58ygGSwBkaBeDwXQ5cL/GYDAYTFcB7/FiMBgMBoPBYDAYDKZ7gnU1YzAYDAaDwWAwGAyme4IlXgwGg8FgMBgMBoPBdE+wxIvBYDAYDAaDwWAwmO4JlngxGAwGg8FgMBgMBtM9wRIvBoPBYDAYDAaDwWC6J1jixWAwGAwGg8FgMBhM9wTb4+3pHDt2LCwsDP1raGh4+fJlootQVVW1cOFC8hNvb+958+YRRE+voNu3bx84cID85MKFC6ampkRnpaKi4vLly48fPy4pKWlsbOzdu7eRkdGgQYMcHBzGjBnTgZaQMWQOHz4cERHRRYcLTKfl/fv3f/7557Zt2zo6IRhMp+DZs2cXL17MzMxsaGjo06ePlZXVjBkzHB0d1dXVie5FSkpKbm7u559/3tEJwXR/sMTb06msrMzPzycI4s2bNwKBoDMLRXT4fD4kvra2trKykiAIDw8PonvBroLq6uogVFlZWUNDA0EQjY2Nkr+Ux+PNmzcvNTX14MGDa9euJRSJUCjc+4Hm5mYlJSVbW1tDQ8Pi4uK8vDxI89ChQ58/f67QNGAkpLy8vOsOFxgZ2bRpU0JCAkEQYWFh/fv3l1e0sbGxS5YsaWhoUKjE29zcPHnyZJFO5ubmV65coTx89uzZ+vXr6Z43bdq0ZMkSGRPTngNsd+LcuXNeXl4fffTRjRs3DA0NiW6Kl5fX0aNHCYIwMTGxtLRMSUkpLy8/cODAkSNHvLy8JI/n+fPnq1atIghi5syZP//8M4PPxMTE7777jsGDsrKynp6etbW1k5OTq6urhoYG2XX16tWZmZkiA169etXMzIwh5pqaGjc3t2nTpoWEhJiYmLSVJwxGBoQYzAdg8mpqairsgnC5XGjPXC5X2E1hV0ELFiyAksnPz2dRnvr6+kIFs2XLFnjXypUrS0tL0XMej+ft7U0QhK2trbDdaWxsfPCBjIyM9n9756dLDxcYFrx7905NTQ266s8//yyvaM+dO6eiotK3b9+0tDShImlqarL9wMCBA9H8B55MmzaN7v/x48fgam5uThBE79694d/AwEDZE9OeA2x3Ai2xHTlyRNhNOXHiBOTxwIED8KS5ufmrr75ikWskxPbq1auuro7BZ2xsLDRvJJ1qa2vDE1tb2yFDhkAvAPr06XPx4kVy8MWLF4NPVdX/t4s2YMAAeFJUVNRmOv38/JSUlPr16/fy5UupMojBSAWWeDHdYQqLJV75SrwxMTEQysHBQahIXr58qaz8P9oERE46hUKhnZ1dh0i8sJNJEMSCBQva/+2dny49XGBYcPjwYTTltbKyEggEssd58+ZNFRUVHR0dRYu7Iru2hoaGJP5DQ0MJgvDx8ZFjGtptgO1mTJs2Dcrt9u3bwm7KoEGDQGIkP8zJyZFW4m1ubjY2NkZ9NiAgQJJQAQEB4N/Z2ZniVFxcDGvQwLFjx+jBLS0twTUxMVHypAqFwt9++40gCGtr67dv30oVEIORHKy5CoPBUJk0aVJsbOzx48dv3ryp0BddvnxZIBAQBOHp6SnSw/Hjx3/55ReFpgGDwbTJ6dOn0e/8/PwHDx7IGGFFRcXy5cv5fP6ePXtGjBhB9CTabYDtZly9epXL5d67d2/mzJlEd+Tdu3fZ2dkEQdjZ2ZGfDxw4sLS0VKoD8JGRkeXl5SL7LzvMzc0PHjy4f/9++NfLy+vly5eEnPD29p44cWJeXp7IqwQYjFzAEi8GgxGBo6Pj+vXre/furdC3/PPPP/Bj2LBhIj1MmDABbVNjMJgO4cmTJxkZGbNnzx46dCg8OXXqlIxx/vDDDxUVFaampt988w3R82ifAbaboaur6+npiXZ6ux9lZWXwQ19fn+Jkamqqra0teVTQQ9GlodjY2FevXsmeQm9vbyMjI4IgWltb0QFs2VFSUtqzZw8sgkdFRckrWgyGDJZ4MRhMh1FdXQ0/dHR0OjotGAxGNLBBtOYD8OTSpUuo87KgrKwsMDCQIAgOh4OuB2MwPZzW1lb4oaKiIks8xcXFt2/fHj58+N69e5GKrzNnzsieQnV19fHjx8NvdDhfLkydOhXu2MMJZwxG7mBdzT2O5OTkiIiI169fa2pqDhw40N3d3crKSpKAaWlpt27dys3Nra+vNzIysre3nzVrFkW3XktLS3JyMj2sjY0NulLy5s2b4uJisquZmRm6/iH5u6TlxYsXUVFR2dnZNTU1RkZGw4cPnz17dt++fSne6FmwtrY2MTFpaWm5ceNGfHx8aWmpvr7+2LFjFy5cqKurK+51tbW1t2/fTkxMLCsr09LS6t+//7Rp08aPH6+kpKSgCpKEmpqa4ODg9PT0+vp6a2trV1dXyump8vJyuDKEsLe3p1tESEpKunfvXnZ2dn19vZ6enq2trYODw6effgqXctsEvQU0bIOJgrdv34rzr6Sk9Omnn6J/U1JSmpqa0L99+vSBL+Xz588vX76cn5/P5/PNzMzGjh1LsXkgSbLz8vLKyspKSkrg38rKykePHolLiUjEJS8hIeH69etv3rzR1dUdN26cu7u7lpYWQzwS9gJy8hCDBg2ClXigsLCwqKiob9++ZBW7oJ6HHEpTU5PSHthRV1f34MGDZ8+eFRQUNDY26unpDR06dObMmba2tnTP4ppcm21Vwo6TnJzc0tKCvOnr6/N4PHLAESNGkDdPkpKS+Hw++nfIkCH0jTipMsgunSYmJtbW1nIZUmSkoaEhJCSkT58+c+fOra6u9vHxaW1tbWpqCg0NXbduHbs4z54929zcTBCEi4sLs8/nz5/HxsY+f/68srJSTU3N1NTUwcFh1qxZFG2x7Q+7bs4wwObm5r57947yFhTty5cvq6qqmL+bZGAcozzU0NAYOXKkuO5PEMSYMWMospaEo5C4fDU2NoaHhz979qysrExXV9fW1nbBggXkL1pNTU1kZOTTp0/Ly8uVlZXNzc1Hjhw5bdq0Pn36SFLarD/0chyoGZA2Meic8Lt378gDu52dnVQm+gIDAwUCwZo1a9TV1ZctWwaanwMDA/fu3SujLA0FhRJJyJVZs2YdP378/v37WVlZkoylGIx0SHHnF9PFqaysFGn0zMfHh8/nM6iiycnJQddmevfubWlpCavy6urqW7ZsaW5uRj5LS0tFNjOy1gQfHx+Kq5eXF4t3Sa65Kj8/f+7cueBBV1fXysoKPh4qKirr16+vra0le6ZngcvlpqamUmafBEEYGxtfunRJZHqOHj1qYGAAr7C0tESyh52dHYNGB9YVJKHmqrt379LPSpELn6y4AkFReVVQUICMfOjq6lpaWiJ5uE+fPl5eXuLqiPktzFB0zFDmeRwOp7m5GcwwkCHrQZU82eJuFItMiUjoyWtsbHRzc6NEZWFhkZ6eLjIGqXqByHSGhoaS/YBcMX36dPJDusEqyZWEiWuNZWVlbm5uaNfO0NDQysoKFfX8+fPpiklENjlJ2qpUHQdBNy2TkpJCjo3y3qtXr8qYQXbp9PT0lH1IkQv/+c9/CIL4/vvv4V9kAn306NGs43R0dIRIGFTIBgYG2tjYgDdVVVVLS0skaBkbGwcFBXWs5ip23ZxhgOVwOPS2weFwwJV+uUNcd2AYxywtLZEHkfbqqqur2Y1CIvMVHx9PN2BGVr/0119/wekeZWXlvn37ovpVUlKaMmXK/fv3GUpbxg+9XAZqBmRMDIUXL15I9XYbGxs1NbXy8nKhUJiWlobiuX79OmvNVQh3d3fwM2zYMHG5YDcowVADht9ZBMdgmMESb0+hrq5uzJgxMJpMnTo1KioqPz8/PT3d19dXV1d3x44d4qawKSkpsD1rbW2NvkC1tbW+vr6wtzBz5syWlhZ4Xl9fz+Vy9+7diwb6EydOcLncrKwsFGFiYiKXy926dStBEOPGjeNyuQ8fPmTxLgkl3rS0NMiahYXFzZs3+Xw+fOz9/f1hY8fe3h4+DOQscLlcZNp3165dhoaG06ZNu3nzJhTa/v37IaySkhJFtBAKhUi9xKZNmyorK+FhUlKSvb09bKOJ1DPJuoKYQfOka9euqaurT5482dfX98iRI8uWLUNrvWR7G1lZWZD9Tz75BE1ckGttbS1I/mPHjk1OToaHfD7/9u3bgwcPps+ZxEF/y759+7iigDkQZW4aHh4eEBCADAxyPqCurr58+fLff//9p59+GjBgAFnilSrZMTExXC5337598PyTTz4hp+fkyZNt5i44OJjL5W7fvh0lz8PDw9jYeMuWLf7+/gcOHECXlgcPHkxfIJC2F3C53F9//RUi7NevH6QzOzsbeaiuroapqrKy8rt379Dz1tZW8GxpaamlpXXixAl6YxYHw3ABKXFzc8vNzYWHTU1NsEkIQjWPx2NuDNBWZ86ceeTIES6Xu3r1amT0gm4bRsKOo6urC2+5ceMG/HBwcBAp8Z45c4bL5c6ZM0ekxMsig+zSGRMTI+OQIi+cnJxgrxX+vXHjBppAp6amsojw/fv3MPiQBTBxY1fv3r2Dg4NRg8/JyUEjs5+fXwdKvOy6OcMAe//+fS6X+8UXX8BzAwODY8eOoRHg1q1bXC73448/hivQ5O+mSGAcGzduHMTm4eHB5XKDg4Pp3R/i3Lt3L5fLbWpqYjcKZWdnB3wA2iRBEDdv3tTU1Bw2bNjOnTsPHz6Mag1JvMePH4dv6KFDh9DCx7t37zZt2kQX6emlLeOHXvaBmgHZE+Pg4ED+7lRVVUn+9r///psgCHd3d/QEjTwLFy6UXeJFq//Lli2Tr8SLjte5uLiwCI7BMIMl3p7Ct99+C0PJggULKIYlkpKStLS0YE5JmcLyeDwY3XR0dPLy8ihxIiW6u3fvpjihz158fLzI9GzevBnUCcr+LgaJl8fjwTklLS0tstQNXLlyBQ2vdGMbKE4NDY1FixZRPDx8+BBKrFevXq9fv0bP//zzTwj19ddfUyKsqqoCo3bGxsZlZWVyqSDJJV5ra+tff/2V7HT+/Hlwsre3ZwhIlniRhRI010dkZ2fDar0kEi/zW8jA0SaRc1Mke1hbW5uammZmZiKnoqIibW1tJPGySLbs1olQ8qysrGxtbck13tjYiM4WXrt2jRyKdS+AyZmysjJ9jxEuTAKnTp2iuFZUVKiqqi5atEiq3DFLvBMmTGhtbaU4JScnw+nxrVu3ttlWjx49Sna6cOGCuLbKuuOgLTWKxAvs3r2bQeJlkUHW6WQ9pAgEgnPnzu3cuZPcNaQFjqqSjei0traiY5nM24xtzmsnTZrE4A3aQ1RUFN3J1dUVTIaSV3A6xDoRu27OMPQ1NTWhUPv27SM7RUZGEgSxatUqyTN77do1iOqzzz4T6aGiokJDQ4PSrWT5FqN8DRw4cOPGjSDskc3DgsTb0tIC5xSWL19OjwROy9NbFyptisQry4eedQ2KQy6JEbmJLSFgvJe8CoYmM6qqqvSBQiqJ9/Lly+hrcu/ePflKvEi5NMU4EwYjF7DE2yMoLCyENXVVVdU3b97QPWzcuBEGGsp868cff4TnIudwyOCbtrY2RWDw9/cXtwoIHxIjI6P+/fuTP4es38Ug8aJpq7iZGTpcR5a9KXGqq6uLPKmIlLisX78envB4PLjZq6mpibZiyCDRa8eOHXKpoDZB8w+Rhh/RzLWmpkaSCRkcZ1JVVSVXHAK2xdpf4iUI4sKFCxTXVatWOTo6sk62HCVegiDu3r1LcT158iQ4eXt7k5+z7gWoqdOPOaDtSpHzGFBKRC9AdhLv8+fPLS0txe0VT58+HcQzkdZcUWOYOHEi3bVfv370tipLx2En8bLLIOt0sh5ShEKhr68vOOnq6rK2crlz5076QgnaiTI0NES7gpITEhICwd3c3Bi8rV27dty4cSKd4uLiIIa//vqrk0i8UnVz5qEvKysLdgJVVFTQknFRUZGRkdGQIUMYzoHTaW1tRVf3X716Rfdw8OBBgiAoR1dk+RajfA0bNoyyKvTkyRM7OzvYZ37+/Dl4+/nnn+mvSEpKkkrileVDz7oGxSGXxLCWeGtqauCSP/ljx+Px0FXk33//nbXEGxERgS59iEyhjBKvQCBAR8/q6+tZxIDBMIB1NfcIgoKCQBfLpEmTLCws6B6+/PJL+kOhUIi0z9MvvxEEoaam5uzsDGPTxYsXyU5Lly7V09MjCOLixYsVFRWUgGFhYRUVFZ6enkhjkCzvEgc6N0UQxOLFi0X6QUfI0EYKnWnTpolUmrVs2TL4ERQUBCoWg4KCamtrCYKYMWOGSLMT8+bNE6k1kV0FScXy5cvpD0eNGgU/8vLyJIkEvkatra0i7Qf4+fmlpKQwaPNSEL1796Zfjzx9+nRsbGxnSLaJiQndnMbo0aPhB1ndiyy9YNGiRfAjLCyM/JzH4925c2fhwoXQhu/du0fRfxMWFqapqUmWimVh6NCh+fn5IhMPWqBAyQ1zexPZ2kW21XboOHLJIOt0sh5SyJpUa2tryXf5JEcgEAQEBGhra1Pyu3r1avhRWVmJdhElB+lKoF/VJuPv75+YmMhQzjCxJjoHknfzNhkyZAh8j/h8voeHB4/HEwgEy5Ytq6mpCQ0NlUqtvYqKyr/+9S/4jdZwEbCwq6enh44cy/FbvHr1aoqSpDFjxqSkpCxdupSsi/j69etkRXHAyJEjU1JS4OpTu33o5VKD8koMa0JDQxsaGlauXElWx6inp4c+EBLaFcvMzFz3v3h6en7xxRdDhgxZsGABqP3bsGGD7PbJ6CgpKaEPsdzVYmEwWOLtEaCpvzg1s3Z2dnSFnxkZGTDoqKuro7M9FIYPH055BaCjowMiVnNzM12nxYkTJ1RVVdG0ScZ3iSMjIwOUVSopKaHpsrjvWWxsLFlRKhlxYceOHQs/amtr09PTYYUYnqArghRsbGxAxWhJSQl5TsyugqQCnTMnA0ciYd9MkkhQvhYvXrx//37KWka/fv3s7OwkVNcsR+zt7dE9z06YbJF1Z2ZmRi95WXrBsGHDPvroI4Ig7t+/j86GwTZCS0uLh4cHLAq0traSRZSqqqq7d++6uLgowjpUa2trSUnJy5cvs/6Xuro6cKJrkSUjMu8iS6wdOo5cMsg6nayHFLIaZGNjY3GDGDPR0dGFhYVLlizp1asX+fnAgQPhci8yXCQV79+/hx+S61vm8Xh5eXmonNE+LXNDak8k7+aSsGrVKpCXCgoK1q5d6+vre//+/V9//VXkMM7MmjVrYHg8e/YsWTUxrH9lZ2d/9dVX5O4vr28x+j6KxMbGBk41P378eOrUqXD1FKGiomJnZydSp7HiPvRyqUF5JYY10B/pehzRkbTnz5/TdXTTKSws9Ptf/P39L1y48ObNm6FDh3p6eiYnJx87doz5m8saNCagsRSDkRfYOlGPAKm8pyscBjQ0NHR1dSljOjp3pK2tLW4xEt3IysjIoDitX7/+2LFjIN9+//336FuSnp4eHx+/aNEi9C2R/V0i+eeff+CHiYmJOM3+6BBOQ0NDfn4+0mNERpxVJG1tbRMTE/i8ZWVl2dvbo1xkZGT88ccfIkOpq6vDtCMjIwNVB7sKkgpkHYoMKhb6KrtI1q1bd+rUqYyMjPr6+h07dvz73/+eMWOGq6vr/PnzkfDc/rRptqpjky15ycvYCxYtWrR3716BQBAREYGWky5evKipqTl79mwjIyPY5AkLC0MHeiMiIlpbW5HuTbnQ0tJy6tSpc+fOJScngwUaOpSZN+sSa4eOI5cMsk4n6yGFIIhvvvnG2tr65cuXbm5uyCYni9kzeWkSsXr16gcPHsB1wcLCQpEb121KvG1OmjMyMg4fPhwVFYWshUnVkJgRp+ecnTe5DLBk/P39Hz16VFBQEPaBWbNmeXl5SRsJyGwLFiy4dOlSZWVlWFgYOppEEATsRlJMTMnrW8w8LKuoqBw9ehSONsTGxjo5OVlaWi5cuNDV1dXR0VEqCzry+tDLpQbllRh2PH/+/NGjR9OnT6drfp48efKgQYOys7OhX7dpY2/GjBnXr19H/yorK7eP3Wyk976+vr4dXofpUWCJt0dQXV0NPyhL9WQ0NTUp8y1kK7W6uhp0TjBA3lYChg0b5ujoGBcXl5OTc/fu3c8++4z8ld2wYYMc3yUSFCdDrslnWSsqKkR+exg2Inr16gUSL5wURW8M/YDkuWBXQVJBt6kLnzGpItHQ0IiNjfXx8Tlz5kzrB259YP369VOnTt26dSucdmtn2twp6thkS17yMvaCxYsXg5r0sLAwkFLAguucOXN0dHSmTJlibGxcXl5+584dHo8HB0ovXryooaGBrGjIztu3b52dnVNTU0H7iIuLi4WFBZoqXbt2LT4+Xo4l1g4dRy4ZZJ1O1kMKMOcDBCsqKiquXr1qZGTU0tJC2YIjCMLIyEhVVRUuagYGBu7YsUPymNGVQrgMIo5jx455eXnx+XwVFZVZs2bZ29vr6enByml9fT1S1c56uADtu20eAYCZd5sWWeUywJLR19cPCQmZNGkSyFrbtm1jfVphw4YNly5dgo8vkniLi4uvXbs2adIkpJFYvt/iNoflpUuX6uvre3t7Z2VlwW72kQ+YmJisWrVqy5YtEi7TyOtDL5calFdi2AFLVCNHjqR3WDhgAhJvSEjI4cOHyUbI6aioqHSIyWu06c3aBjIGIw4s8fYI0FK6VCvNaBpnYWFBXu0TichF2Q0bNoCKkePHj4PEW1dXFxQUZGtrO3XqVPm+i12uyU4sljBRcAiLYti3b1+bE02kiYd1BXUIBgYGfn5+e/fuvXDhQmho6MOHD2Eb5L8f4HA4Z86caf+Dzd0j2TL2ghEjRgwePPjVq1dwWbd3796RkZHNzc1wPFJFRWXhwoUnT55saWmJjIxctmxZdXU1HGmW4x1mDw8PkAbXrFkDlxfIriUlJZJIvJKjuI4jEAjkmEHW6WQ9pMgO2ASqqKigjNV0Tp8+vX37dsnlMSQMiNshh0vI33zzDfTc//73v5TTvDwej7XES27tdXV1bTZ+uEfd/uoJwDRa375937x5Azv2T548EbdtyMy0adOGDBny8uXLhISEtLQ0MIx08uRJPp9PWXpW0LdYHHPmzJk9e3ZMTMz58+cvXboE903Kysp8fX1PnTp1/fp1ZF2pYz/0ktOBiWlpaQF7toc+wOCztrb20qVLIlV7dDjo1AbDkgEGww4s8fYIDA0N4VQYaB1gPmlGP+TT2tpqZ2fH4r1ubm6wrXTt2rWioqJ+/foFBwfX1dWtX79e7u+ig+JkyDXZSeShJubTNSg4rEYbGxsXFxfDD6lywa6COpA+ffp884HCwsLg4OC//vqrsLAQzKXa2dkhg4qdjU6ebNl7gbu7+/79++GyLofDgS1cJCm5u7uD6lE43BgREdHS0iJOvQoL0tLS7t+/D9tTR48eVdBFL7l3HJFz04aGBjlmkHU6WQ8psnP69GkVFZUTJ06I3PsiCKKoqAi2dvPy8mJiYqZMmSJhzGC4mPluJNJB7ePjw+LyKgM6OjpaWlpQvzk5OeKuqiJgW0zc10GhfPPNN2/evLG1tc3KysrIyPD29oaLQixYv349jG8nPsDn8/39/fv06UPX+aeIbzEDSkpKUz5w7Nixe/fu+fv7g/2b8vJyV1fXnJwc5q1IOX7o5UIHJubGjRvv3r2bP38+vU4Rf/31F+jBPn36dOeUeNH1XbjmjcHIkU63FYNRBMjY/atXr0R6qKmpoc+3kH6Ft2/fsrtToa6uDhoUBAIBaPY7fvy4pqYm2IuT77vooDirPiDSD1LAaGRkNGDAAJF+QCiiU1FRgQ4rQgmjN+bm5rZDBXUGLCwsfHx8srOz0V1QuqKyTkjnTLbsvQBl5+LFi3V1dbdu3Zo1axbanpo6dSoszdy+fbu2tvbixYtqampI2a/soNt9o0ePFnkmTcIrke3TcZC8KrKoi4qK5JhB1ulkPaTIyNOnT9PS0mbPnr127VqOGLZv344OZEqluBVpWmZQx4qKGplykWNDQtWB3sIA+EFB2o3Q0NCAgIBvvvnm/v37IBcdP348IiKCXWwcDgf2h0H7d2RkZHFx8apVq+jLGYr4FkuCqqqqs7PzpUuXHj58CEktLS29c+dOu33o5UIHJgb64O7du8V1WA6Hg1Z1//77b1jK6RDu37/v6uqKrKwjqqur4VSzubk53uPFyB0s8fYIwEokDHMiPTx69Ij+sH///nDDRygUMhiBmDdvnpmZ2W+//SbSdd26dXDazd/fPzY2Ni0t7YsvvqCb2ZDLu+hxfvzxx/AbTrHSQaomXVxcxJ3KE5ceVJgWFhaDBg2CM1rMr4PTemZmZlZWVuRNJHYV1P7s3LkTbEtQ0NDQQAYtxOmY6aLJlruQxoDsvWDkyJE2NjagZTcoKKipqYmslUpVVdXV1RVOjgUHB0dHR8+cOROsiMn3QJq4o3oM+x7skKXjGBgYMCxpJSQkyDGDrNPJekiREQadVWSQStjw8HDJL0vb2trCYCtuMbHNopaxIU2cOBF+tGnorrCwMCEhQVdXF31K2oe8vDxPT89PPvnk4MGD5ubm586dg+crV65kKDQGevfuDaaG6urqgoODjx8/rqSk5OnpSfepiG8xnczMTFdX18jISLrThAkTkGJhSb4m8vrQy4WOSkxJSUlUVNQnn3zCfCDi888/RybBzp49S3QQr1+/joiIePHiBeU5attDhw7tiHRhujlY4u0RLFmyBOa1aWlpIhXT+/v7iwy4efNm5iX8rKys69evl5WViVN+Y21tDWqBiouL4RQN/eKQvN5Fx9vbm2Fw5/P5cO+F7JNOQkJCZmYm/TkSlpCuS1dX14EDB8KnDrRxiAz19u1bBwcH8h4R6wpqZ+Li4kJCQkROuXR0dOBOl4QmJTp5stFROrL1iBs3bowcOXLlypWKS6rsvQDsLra0tGzbtk1dXZ2yhYvOMG/btk2+R5rBaA38SElJoR8VFggEEtoVkxxZOg6aVIGuATJRUVEiLQazziDrdLIeUuBU6rFjxzZu3CjJTiaZxsbG8+fP9+nTZ/bs2cw+v/rqK7j93tjY2KZiLYS+vj5sheXm5opTtoyKGg5hUgA10axZsWIF/Lj9AXHehELhpk2bhELhF198Ie5otyJobW318PBoaWm5cOECaA9ycXEBJVJVVVVffvmluEvmzKAv74EDB6Kjo2fNmiVOc7givsUUysvLIyIirl69KtIVLcNJ+DWRy4deXnRIYs6dOycQCNpcotLU1ETWgAMCAjqb3hA00ZoxYwbdtbS0dNu2bbt27RK3eY7BtIEQ0zNAVtGHDh1aXl5OdgoMDNTT04MpvqmpKdlJIBDMnDkTAl6+fJkSZ11dHZz1WrlyJcOryQex7O3txXmT5V1gdoUgCC6XS37O5/PR0Hnt2jVKKKT7ZOvWrQxxmpmZ2dvbV1VVkV2PHj0KrlZWVu/fv0fPY2JiYAo4fvz4+vp6SpzwqdPU1Hzx4oVcKqhNFixYANHm5+fTXZG5iwcPHkgSEK7qiayCoKAg8L9v3z55JU8oFNra2sJmLN0pJSUFwnI4HOa3sEi2QCCAU1WffPIJevjDDz/AxpckWWNOHjoPP2XKFPn2OLKEMHfuXIprc3MzOmGhqqpKadWSY2pqSm+NjY2N8JwgiL1791KCgB5pce2NdVtl3XFev34NAXV0dJ4+fYqeP3v2zNTUFB2mvXr1qlwyyDqdrIcUNL7p6OiUlJQIJSY4OJggiO+//14Sz8jq79ixYyV/xc6dOyFUYmKiSA/IFJOFhUVxcTHZqbi4GBlDonQfyUGXGDU1NY8fP97U1ETxkJ+fD4tHurq6eXl58u3mzK0dxpnTp0+THzY1NSH7rnv27BGygrwBSP8gymUUanNIB2DNQktL659//qE41dfXg71fAwOD2tpaSUpblg896xoUh+ISw8DgwYPV1NQoA4tIyCtuN2/epLii2z3Ozs5C6UFWkcT1a/Jbdu/eTXmOlgCSk5MZWu/06dNZpA2DwRJvT0EgEKATaGZmZrt27QoJCfHz85s/fz6o5YSZnKamJtz3CAwMhIBVVVWTJ08GrYzffPNNYmJiSUlJWlrayZMnYXRzdHSsq6tjeHVrayuaoJw8eZLBp7Tv4vF4kFoHBweI38HBAZ6gqWFlZSWcYVNVVd2+fXtaWlppaWliYiIySbpy5cqWlhYGiffw4cPDhw83NzffuXNnSEiIv78/OmpoYGDw7NkzSsDQ0FDYEBg6dGhQUFBubm5hYeGDBw+++uorJSUlNTW1sLAwOVaQSHJycsBb//79IU43NzcOh3P+/HnwAK5om8vZ2ZnD4fj6+sbFxYkMCHMspJzG3d09Ojq6sLCwuLj48ePHPj4+sBfh6OjY2NgobAvmtwiFQrAZy+FwYLFfWVkZ/j116pRQKDx06BCHw0G7lzY2NuDq7e0t8nXskg22IkGvVWFhYWRkJMiKf//9N3PuxCUP2uTVq1c5HI6Hhwe4mpqagiuSWGTvcVZWVhD5uXPn6K5og8vFxUUoJYGBgZBauGiHWiNqVxEREeicnouLy/nz5xMSEq5everm5qarq4tOk6L2JktblarjiFwqQtv1KioqU6ZM8fDwmDhxIpz23L17NzhNnTqVw+GsWbOGdQZlTye7IYW8Q3v37l1J6vfo0aMcDgcOxk+fPp3D4Rw6dEic540bN3I4nDFjxqC3eHh4cDicuLi4Nl+Ul5cHYvxPP/0k0kNTU9P48ePRMLt///47d+48fPjw4MGDpqamSMymdx8JqampIe8j6erqfvbZZytWrFi/fv3SpUtHjhwJtdyrVy+6VCBLNz9//ry4oS85OZnD4SxdulRJSUlbW/urr77atm0bvOvFixccDgeNY8rKysuWLWORa3SUoH///mBZShzSjkLierG49oB26U1NTf/888/MzMyysrKsrKywsLCxY8fC9/rKlSvIv7e3t8jSTk9PZ/2hl3GgZoBFYsRlkMPh5OTkiHvR69evORyOm5sb3Apm9n///n0Oh/PVV18hFQZDhw6F72Z6ejqERSNY3759UQLazPKePXvAp46ODhriLMUDWqnoEi+sdIwePZr+CrJedx0dHeb0YDAiwRJvD4LP5x85coRyba9v377wXUF7F4CnpycK2NTUdPDgQbpSQSMjo59++kkSCWfPnj1wVIl5pi7tu0pLSwkxVFdXI2+NjY2//vorXfWfjY1NcHCwuJSQ942rqqoWLVpEuXLj5OSUlZUlMmxKSoqzszP9io6Tk1NSUpLcK4iOuPtXXl5e4EGk65QpU8QpcBo3bpxQKExNTd2wYYNIIyiGhoa7du1qaGgQSgDzW4RCoY+Pj0gPsPItznyupaWlyNexS3ZJSQnaVAHU1NQOHjzYZu7EJQ/aJBKlKJB3BWXscXAoUU1NTeQW7o0bNyC2M2fOCKVE5MU/crsSCoXR0dFINRFi4sSJaWlpaJ+WvG3Cuq1K2HFMTExgBkbPTmNj48qVK8n9VENDY9u2bQKBgFJN5FMG0mZQ9nSyG1LgLi5YLeLxeJLUL9qgQzBs9VBGJERAQIAk74IdVGtraz6fL9JDbW2tp6cn5R6vjo7Ovn376GZgRZ4aYIbP5586dWrEiBEic6Gtrb127drs7Gz5dvNt27aJfD5u3Dj6EV9bW1t4l7hT3NLmGlljop9QoCPVKMRw41dke6ivrz99+rSTk5NIheeTJ09+9OiRyM1DCrdu3WL9oZd9oGZA2sSIyyDzfinaE5bEP5rSULC0tLx165a4t0uSZUmMSNGhSLxPnjyB52itkwI6Qi/tBjgGAyi1p14WTGegqanp77//Ligo0NTUtLa2njBhgoRmSAUCQVJSUnZ2dlVVla6urq2t7ahRoxRk2k4R7xIIBE+ePMnJyeHxeEZGRsM+wODfz88PLuhyuVyY6BcVFT158qS0tNTAwGD06NFtGo5/9+5dYmJiaWkpzA7HjBkjicFM1hXUnuTm5sKqfGNjo56enq2trb29vULtHHZIsuEznJmZ2dDQYGJiMnnyZBBL2of27HHyBaZi6enpdXV1hoaGY8eOhW1DhSKu4/Tq1ev9+/e2trZ0RSlAYWFhfHx8RUWFubn5+PHjxQly8sog63SyGFLi4uJevXo1d+5cZBCo8/D69euPP/74/fv3gYGBdO39iMrKyvj4+KKiIjU1tQEDBjg6OrKzSctAeXn506dPy8vLeTyehoaGvr7+4MGDhw8fLqOx2e6Bokeh9+/fp6enZ2dn19TUqKmpmZmZjRo1ShbL0tJ+6BVKp0pMJ2fevHnXr1+fPHnygwcPRCr0amlpuXz5srq6+oIFCzrhpAjT+cESLwYjqcSLwWC6FtXV1XAW/bPPPpPE0klH0VXSKV8CAwNXrFhhbGycnJyMTsNiMJieRnBw8LJly4yMjB49etQOy6OYngleJsFgMBhMV+Xhw4crVqwoKCgQ5wo/nJyc2jddXTWd7QmHw9m/f395efmsWbNEGkDGYDDdnqioqFWrVunq6t64cQOLuxjFgSVeDAaDwXRVsrOzAwMDkcEPCocPH4ZbuG3a7VA0XSWd7cwPP/wQEhKSn5+P9FRhMJiew5MnT+bOnWtjY/PkyRN294ExGAnBEi8G838QCAQFH6ioqIAnFRUV8ARfAcBgOid79uyJjIwkP6mvr//mm2/u3btHEMSRI0ckuZ3bDnSVdLYnX3zxxcuXL9u0/YvBYLofra2tBw8eTElJAUuEGIziwPd4MZj/w9u3b83MzEQ6VVdX6+vrt3uKMBiMWK5cueLm5gYfsmHDho0YMcLAwKC0tDQmJqayslJDQ+PIkSNwIR+nE4PBYDCYngmWeDGY/8P79+8PHjwo0mnbtm1gvhWDwXQeCgsLr1+/HhcX988//5SVlTU0NOjr61tZWU2bNm3NmjWdZ9e0q6QTg8FgMJhuBpZ4MRgMBoPBYDAYDAbTPcH3eDEYDAaDwWAwGAwG0z3BEi8Gg8FgMBgMBoPBYLonWOLFYDAYDAaDwWAwGEz3BEu8GAwGg8FgMBgMBoPpnmCJF4PBYDAYDAaDwWAw3RPVjk4Apgtw+/btAwcOkJ9cuHAB29JoN+rr60NDQx88eFBaWqqpqWlmZjZmzBhnZ2dLS0tpozp8+HBERAT619DQ8PLly/C7qqpq4cKFZM/e3t7z5s0jujvv37+fM2cOi4wzFCamM4ArCIPBYDAYDJZ4uz+vXr1avnw56+AxMTHq6up1dXX5+fkEQYANSYIgGhsbJY/k3LlzXl5eH3300Y0bNwwNDVknpmeSmpo6d+7cwsJCNTU1W1tbgiBu3Lhx8uRJfX396upqaWMrLy+Hqnzz5o1AICAvW/D5fHCqra2trKwkCMLDw4PoAQgEAnYZZyhMjCzIa8TAFYQRB4/HmzdvXmpq6sGDB9euXdvRycFgMBiMYsH2eLs5qampI0eOZB28sbFRQ0MD/evq6gp7Jvn5+ZJvMJqZmb19+5YgiCNHjnh5ebFOTA+kqalpyJAhr1+/HjJkyO3bt62srAiCePbsmaOjo5qaGguJl1IppqampaWlFCc/P79169YRBMHlcj09PYkeA+uMMxQmhgVyHzFwBWHEdXZ2S4ciaWpqSkxMJAjC2Nh42LBhcomzu4LLCoPBtDP4Hm+PYO7cuY00li1bBq579uyhuw4ePFheb0ffs6FDh8orzh7CpUuXXr9+TRDEtm3bQNwlCMLe3v7zzz/v6KRhMIoCjxgYRfPxxx/LvY2VlpY6fWDHjh3yirO7gssKg8G0M/hUc49ARUWFvFWLHsIPNTU1uquystxWQ65evXr+/PnBgwdPmzZNXnH2EGJjY+EHZaP+xIkThw4d6qBEYTCKBY8YGEUzadKk2NjY9PT0L774oqPTgsFgMBiFgyVejMLR1dXtUYdj5ci7d+/gh76+Pvl5rw90UKIwGMWCRwxMO+D4gY5OBQaDwWDaAyzxdnOMjIw8PT1ZXOVdsmTJ27dv0T4wpkNobW2FH7giMBgMBoPBYDAYFmCJt5tjYWHB5XJZBPzpp5/a9FNTUxMcHJyenl5fX29tbe3q6mpnZ0f2kJKS0tTUhP7t06fPwIED6fEkJSXdu3cvOzu7vr5eT0/P1tbWwcHh008/lfBk9aNHj+gPBw0aZGRkhP4tLCwsKirq27dv//790UOhUPj48WNyKE1NTXIW6urqHjx48OzZs4KCgsbGRj09vaFDh86cORN0JjMgY47Ky8tzcnIIggDVwaCtCindMTIyGjRoENl/fX393bt3Hz58+PbtWzU1tb59+06bNs3R0VFxcvKLFy+ioqKys7NramqMjIyGDx8+e/bsvn37UrwVFRUVFhZSHlIKGdXgp59+qqSkhB6+efOmuLiYoU5Bu/Lt27cTExPLysq0tLT69+8/bdq08ePHk+OhU1tbe+XKlSdPnvB4PDMzswkTJsyZM0dNTY2QE3l5eeHh4bm5uY2NjQMGDFiwYMGoUaMoHsrKyiihNDQ00MoUvWUSBDFmzBhJKpR1o22T5OTkiIiI169fa2pqDhw40N3dHe6WJycnt7S0IG/6+vo8Ho8ccMSIEdra2ujfpKQkPp+P/h0yZEjv3r2lGjHILZDH4+no6FhaWo4cOdLJyYn8ImZE1gIUl4QxSNX1UKdG2Nvbq6urtzmKUkhLS7t161Zubm59fb2RkZG9vf2sWbNMTEwkT3NLS0tycjL5ibW1tYmJSUtLy40bN+Lj40tLS/X19ceOHbtw4UJdXV25NzMJG5KJiYm1tbXs/V3CimBugQkJCdevX3/z5o2uru64cePc3d21tLQobamkpAT+raysJH+VlJSUPv30U1mqUlyqnj9/fvny5fz8fD6fb2ZmNnbs2M8//5zSsNXU1GD8aXNcElcyjY2N4eHhz549Kysr09XVtbW1XbBgAdIrIW12OlVZ0YNjMJhuixDTU+FwONAGfH19JQyyYMECCJKfn3/37l3KUVuCILy8vMj+KfqcORwOJcKCgoLJkyeDq66urqWlJZp59OnTx8vLq7m5uc1UiWzYoaGhZD8uLi4EQUyfPp38kG5jydbWFpzKysrc3NyQFGRoaGhlZYXSNn/+/Ldv34pMjFxyFBAQwNBnlyxZQvbs5+dnbGwMV68tLCyQCRZbW9s7d+6IewV4MzU1pTuhJRIul0t3zc/Pnzt3LsqglZWVpqYm7EKvX7++traW7Hn37t309KNCBpBoFxcXR37u4+PDXKdHjx41MDCAV1taWiJh2M7OLjExUVzGL126BMVFxsbGJi0tjTnjDKDCbG1t3bx5Mz3Ln3/+eVVVFfIv8siupaUl8iDS+ld1dTVzMlg32japrKwUOTv08fHh8/kUqz9LliyheEtJSSHHRhk3rl69KvmIIRQK8/LyUAvs1auXpaWlqur/W7rV0ND44osv0tPTJWntImthypQpkheLVF2P3qklHEUROTk5M2fOBD+9e/e2tLSEulZXV9+yZYskAwtAV1jN5XJTU1Mp4iXo0b106ZIcm5lUDcnT01P2/k5HZEUwtMDGxkY3NzdKEAsLC3IzYz6Er6GhIWNV0lPV3Ny8atUqyov09fXpiZF8XBJZMvHx8XSzXkeOHGGdnU5VVhgMpueAJd6eiywS77Vr19TV1SdPnuzr63vkyJFly5ahPY3AwEDkPzg4mMvlbt++HX17yLHV1tbCHGvs2LHJycnwkM/n3759G2mKbnOWDxLar7/+Cv779evH/UB2djbyUF1dDd9IZWXld+/eoeetra3g2dLSUktL68SJE0imSklJgQjd3Nxyc3PhYVNTU0hISJ8+fWBSy+PxKCmRV46ysrIgYZ988gmE2rdvHzzhcrnR0dHI54YNG8DDunXrSktL4eGLFy9mzJgB+T116pQcJd60tDQIaGFhcfPmTT6fD+KZv78/7K3Z29uXl5cj/0lJSVwud9KkSRChp6cnl8ulCK5btmwROdFPTEzkcrlff/01QRDu7u6UOkUmNDdt2lRZWYleZ29vD9vIt2/fpmctJCQEtoN0dHR8fX0zMjLy8/OjoqKmT59uZGS0a9cucRlnBhXmDz/8oKure+DAgfT0dIh5ypQpEOeYMWPq6urAf0xMDJfLHTduHDh5eHhwudzg4GB6ywSNsnv37uVyuU1NTczJYNdo26Surm7MmDEQ89SpU6OiovLz89PT0319fXV1dXfs2AHZ19XVhTTfuHEDfjg4OIiUeM+cOcPlcufMmUOXeJlHDMgjbOz069fv+vXr0AJbW1vv3r07fPhwCOXj4yOugsgPoRacnJygdiDN165dk7BYpO169E4No+jMmTOPHDnC5XJXr16NRHfyKIoyDtK1tbX1/fv34WFtba2vry806ZkzZ7a0tEiS8vr6ekgJsju9a9cuQ0PDadOm3bx5Eyp3//790KOVlJQoHZZ1M5O2IcXExMjY30VCrwiyxEtvgR4eHsbGxlu2bPH39z9w4ABSJD548GAkbkFb2rdvHzh98sknaLjmcrknT56UsSrDw8MDAgJ+/vlnlCoOh6Ourr58+fLff//9p59+GjBgAJLiIDFcLhf25yUfl7KzswM+AKVKEMTNmzc1NTWHDRu2c+fOw4cPowZDlnilzU6nKisMBtNzwBJvz0UWidfa2vrXX38lO50/fx6c7O3tKaHQDIkyfz18+DA8R9MmRHZ2to6OjoTyIQATEWVlZfoOQ2BgILyIIAi6BFhRUaGqqrpo0SJ6midMmNDa2krxn5ycDIeTt27dSnGSb44om+p012PHjoHrqlWrKE5NTU1jx46F/RDK3ilriZfH48HxMC0traysLEqoK1euQCgXFxeBQEB2Cg8PB6evv/6a/jp0Oq5fv36UgEKhcNOmTQRBZGZmkh/++eef4iKsqqoyNzeH7amysjKyU0FBAaj7UlNTo2wKCQSCRYsWIY3l7CReVVVVLS2tpKQkshOfz0cbkhs3biQ7gWlrgiA+++wzkdFWVFRoaGjQO5Q42DXaNvn2228hnQsWLKBUUFJSkpaWFshp9LaERhiKxEvZ/ydLvMwjBo/HgxUlLS2tFy9eiKt6CSVeoVD4+++/g/RFOZvQJrJ0PfIoevToUbLThQsXRI6iKOM6Ojp5eXmUCH/55RcItXv3bqlygXq6hobGokWLKJX78OFDqNlevXq9fv1a9mbGuiGx6++yjK6oBVpZWdna2pJjbmxsRLcPKOsj+fn5KIPiXipLVaJUWVtbm5qakkfFoqIibW1tihTHblwil8zAgQM3btwI60rAd999R5Z4WWens5UVBoPp9mCJt+cii8Tr4OBAd0XXOGtqaiSZv7q7u8P3mPxBRcAWkOTyIZpA08UVtJtEEISzszPF9fTp0wRBXLhwgfzw+fPnlpaWlM0NxPTp02GORZm3yTdHzHMyHo8HS/jq6uoijxHeu3cPwo4aNUouEi8qYXGnLpHi08jISPLz9+/fw503MzMz+kwXVQ1BEPTTif3796ecgkYZ19TURLs9ItcdduzYQX6+bt06kaclAbiHKa4JMYNO/Yksmfz8fDgBoaKiUlRUhJ63trZaWFhAwFevXtEDHjx4kCAIyqYHA+waLTOFhYWQeFVV1Tdv3tA9bNy4EbLQDhLvjz/+yNwCYRIsocQL+3iurq6NjY1CaZCx66FOPXHiRLprv3796KMoyrhISbK5uRn2wbS1taUaXlBPF5eRNWvWgIf169fL2MxYNyTW/V0uEi9BEHfv3qW4njx5Epy8vb2lleJkqUpyqigfLKFQuGrVKkdHR9nHJXLJDBs2jLKu8eTJEzs7O3QghXV2OltZYTCYbo/cbK5iehTLly+nP0RqMPLy8iSJBD63ra2tUVFRdFc/P7+UlBRxelPoLFq0CH6EhYWRn/N4vDt37ixcuBAOQ967d6+qqorsISwsTFNTkywVEwQxdOjQ/Px8+o1EYMiQIaDng5JT+eaImaCgoNraWoIgJk+eLFKBh5OTExwyTE5OTkxMlPF1QqHw+PHj8Hvx4sUi/SDLlmhPBtDW1p49ezZBEKWlpfHx8WSnixcvwnxaZN09fvz4zZs3sI5Az/iMGTOQxiMy8+bNgx9nzpxBD1tbW4OCguD3l19+SQ9lYmICk3VZWLp0Kf2hpaUlrAXw+XyUBmgt//rXv+A3Xb0cCCS6urroJGGbsGu0zAQFBYGWqUmTJiH5nIzIwlQEQqHwxIkT8FtcHmfNmqWvr09WKSQSgUDg6em5f//+FStWhIeH062Rt0/XE1l09FG0zYyrqak5OzuDGi3oUNIybdo0kRlZtmwZ/AgKCkJ649k1M9YNiV1/lxcmJiZ0o9CjR4+GHxQ9T20ir6rs3bs3/Tr06dOnkf12WcYlMqtXr6boYBszZkxKSgpEqNCW2VFlhcFguitY4sWwAd3zIQOny2B3QpJI0DW/xYsX79+/v6Kiguzar18/Ozs7CZUbw2r0Rx99RBDE/fv3y8vL0fPIyMiWlhYPDw/47LW2tl67dg25VlVV3b1718XFBY4ci6S1tbWkpOTly5dZ/0tdXR04UXS9yjdHzNy9exd+oKtxFJSVlVE1oU0n1mRkZEBmlZSUKBo+6RPB2NhYss5VspBMkWnDw8M/+uijH3/8ES5lofPPAMxjKAI2yjgqbQo2NjYgw5SUlKBpd2pqKqo1cSUmslVLjpKSkjgtu0j7aFxcHPn5mjVrYEJ59uxZsn5RqLLs7Ozly5cztEwGJG+0zKB5oUgFqqA3SCpNuazJyMgA89RKSkriauqTTz6prq7+97//zRBPc3PzkiVL/P39v/322zNnzrDQZy6vrifSaJyZmRllFEUZV1dXF2dnDt1hZjePF9ej4Xg2KElOT0+XpZmxbkjs+ru8EJkqeh1JiLyq0t7eHl35VsS4RG8AIlFoy+yQssJgMN0YPBBg2EDXdgunzuAH2fQIA+vWrTt16lRGRkZ9ff2OHTv+/e9/z5gxw9XVdf78+Uh4lopFixbt3btXIBBERESsXr0aHl68eFFTU3P27NlGRkawkxYWFobOW0ZERLS2tlJ2EYGWlpZTp06dO3cuOTm5ublZ5BspUorcc8TAP//8Az/oViIQSGtlZmamvF5nYmKCKlrc6xoaGvLz85GyLoIg5syZo6mpCVYuDh8+DJPIZ8+e5ebm7tq1y8zMbOLEiXFxcQUFBU+fPkWSc3h4+ODBg0eMGEF+y/Pnz+FHRkbGH3/8ITIl6urqUDUZGRlwE+zly5fgZGpqKm4PUCoTL3T09PTE7RYiEztZWVnk5+bm5gsWLLh8+XJlZWVYWBjaUiMIAnbU0e63hLBotMygcqMr8gU0NDR0dXWlnforqAW2yfv3711dXUGIqq+vZyery6vrSTiKogavra1NOT2BQNaGMjIyCOkR1/K1tbVNTExAds3KykJiPItmxrohsevvnepLh5BXVUo1UrEYlyR8kUJbZoeUFQaD6cZgiRfDBmSLgoy0u5caGhqxsbE+Pj5nzpxp/cCtD6xfv37q1Klbt26FM0uSs3jx4r1794JMCxIv2G+cM2eOjo7OlClTjI2Ny8vL79y5w+PxwCjIxYsXNTQ0kA4PxNu3b52dnVNTUwmCGDBggIuLi4WFBbrnee3aNcrpXAXliAFkqhe0MYkEnaCm7DYr+nXwRrLEq6Oj4+LicuXKlaKiosePH4OaYtjCheUGd3d32GcICwsDiffJkycFBQVIaSo9JaEfYE422u2vrq5uM/2s5SiA4XAseinlRD3ItJcvXwYRF0m8xcXF165dmzhxItrEkAR2jZYZCcutHSReSVogM42NjdOmTUtKStLV1a2trT19+rSzs7PI1a726XoSjqLoddXV1aA3iAHy8RZ5NV2QeFHTZdfMWDckdv29U33p5F6VUp3DZzcuSfIihbbMDikrDAbTjcESL6YjMTAw8PPz27t374ULF0JDQx8+fAgXeP77AQ6Hc+bMGcmnFyNGjBg8ePCrV6/gsm7v3r0jIyObm5vhWKyKisrChQtPnjzZ0tISGRm5bNmy6upqONJMv1vr4eEBU7o1a9acOHGCciyqpKREnPAg3xwxgJLEsM+AnNB8tH1eJ/KN7u7uoM85LCwMJF7yFq6bm5uXlxe4+vr6UuRhMijmffv2UW5f00F6gCRJv+JgqIjp06cPGjQoOzs7ISEhLS0NLKacPHmSz+dLu8HLutEyoLhyEwgE7ZwSHo+XkpJy+fJlJSUl0M2zdu3aTz/9lGLAs7N1PRSDhYXF9evXmT2zOKTNDD0j7JoZ6+pj1987Jx1blXJvpQrNTmcrKwwG09XBEi+m4+nTp883HygsLAwODv7rr78KCwvBKKWdnR3Yp5EQd3f3/fv3w2VdDocDW7honuTu7g5qNuEEaUREREtLC10PU1pa2v3798Fk39GjR1ncApJjjsRhbGxcXFwM83hxfpCTyLN50r6OEifD60S+ce7cuRoaGk1NTeHh4QcPHkxNTc3OzkZbuP369Rs/fnxCQkJubm5KSsrIkSPDw8MHDhxIv8GFMm5sbCzufhodQ0PDNtP//v17Qgbq6+vFOaGXomQglJSU1q1bt3nzZoIgTnyAz+f7+/sbGRkhZWySIHujFYmhoWFJSYmM5SZSyGloaJAqJahFsd5PVlNTi4qKAkVEGzZsOH78OI/HW7p0aUxMjFQz5o7qeq2trZI3eAU1XdbNjHVDYtffOyftUJXyGpc6PDsdUlYYDKYbgzVXYToRFhYWPj4+2dnZaGcvICBAqhhQwIsXL9bV1d26dWvWrFloC3fq1Knwab99+3Ztbe3FixfV1NSQqk/67aDRo0eLvPP5P3a92itH4kCXXbOzs8X5QapEmRWQSPW6qg8wv87IyGjAgAEUV11dXTjUXVBQkJSURNdKRdZulZSUlJ+fL/LEKUpJbm6u5OmHvVNIPzovR6GoqIiQgbq6OnHCGLrEiJJBZsWKFXB4EtTSRkZGFhcXr1y5UqrzeHJstGRQgl+9eiXSQ01NjTiJF4lDIufc0pY2qvfKykoGqYkBQ0NDpHf30KFDcLggPj7+559/7hJd7+3btwzSiyzAehydiooKdBoZWgLrZsa6IbHr752TdqhKOY5LHZudDikrDAbTjcESL6bD2Llzp0irCRoaGsgsAWwLSM7IkSNtbGwIgoiOjg4KCmpqaiJLTaqqqq6urqBVJTg4ODo6eubMmXp6euJ0rog76yVuwq2IHIkD7P0wqNlsbGxE1m5lvz/cv3//jz/+GH7DUW06SGGmi4uLSJ1A5PWI8PBwGxsb8uK9m5sb/AgLCxN3pBmUYDEngyCImJgYMzMzKysrtJE4ePBgZBMlJiZGZCjZbTg9evRI5PO///4bfog0gGRkZAQ5raurCw4OBp1Vnp6eUr2adaNlBiUYZUHCLMMJfwaBKiEhgXULFHc8+8aNG1ZWVvb29m2K95qamhcuXACZbe/evVIpkm3/rjds2DAQJhma6Lx588zMzH777TcWrxAXLap0CwuLQYMGydLMWDckdv29YxHX/NqhKuU4LrWJXLLT2coKg8F0V7DEi+kw4uLiQkJCRM6GdXR04Jxh3759pY0WzoK2tLRs27ZNXV2dsoWLNhK3bdsm8kgzWYNlSkoK/UCmQCAQNz9WUI5EsnDhQlAVm5ycnJaWRvcQFhYG8z9XV1eYrcqIt7c3/Dh79izdlc/n/+c//6H4pDB//nzYzPT393/58iVFoO3fvz/c73316pW/v7+VlRVa5ifj6uoKFfTw4UNxKkZPnDjx9u1bBwcH8jYUkiH9/PzoQTIzM6WVwejAmXkK8fHxoEpUT09PnBXTDRs2wI8DBw5ER0d/9tln0lYZ60bLzJIlS2BJKC0t7fHjx3QP/v7+4sIOHTpUnGQYFRXFwpAMaleBgYEiPQQEBBQUFIwaNUoSJcxDhw4F3b8CgWDp0qXiTi50hq4Hh94Jgjh16pRID1lZWdevXy8rK6Mr4ZOEhIQEkTql0TrdunXrZGxmrBsS6/7e/mhra8MPsm22GzdujBw5cuXKle1TlfIdl9qEdXY6bVlhMJhuixDTU0EWenx9fSUMAupeCILIz8+nu4LmIYIgHjx4QH6ekpICzzkcDvn5lClTCIJYuXIlPaqgoCAIsm/fPimzJUS7K3B3lOLa3Nzcu3dvcFVVVa2qqqLH0NjYaGpqCn727t1LcQV10CJzKvccMRf4/fv3QQnW+PHjGxsbyU7FxcUgWhsaGr5584YeFjJoampKdwIbTgRBcLlc8nM+nz9jxgxwunbtGiUUOhq6detWhhyRdc88ffqU4nrw4EHkunnzZnGRxMTEoIzX19dTXEHw1tTUfPHiBfl5XV0dMidz4sQJslNVVZW9vT0ys0nJeJtAYWpra+vp6QUGBpKdysrKbG1tRb6UAlkt8+XLl6VKgCyNtk1gzxlExPLycrJTYGCgnp4eTF7pben169cQUEdHh1zXz549MzU1dXR0BNerV69SAoobMVALVFJSunnzJiUU2NnW1NR89eqV5K0dXZZeuHCh5GUiS9djMYoKBIKZM2eKaxt1dXVwKlXkyMMA6ulmZmb29vaUwfDo0aPgamVl9f79e9mbGeuGxK6/twlDRYhrgQA66T1lyhTyc4FAANqPP/nkE/Twhx9+IAhi9erVslclc6rkOC4xN1FKltllp7OVFQaD6fZgibfHAdZoORwOnP4lCGLUqFHwJC4uTmSQnJwc8NC/f38I4ubmxuFwzp8/Dx7AFW3pODs7czgcX19fb29vDoeDdlltbGzAZ3p6OpIP4fBqdHR0YWFhcXHx48ePfXx84Aajo6MjZTYpIUiwOXfuHN11xYoV4Ori4iIuhoiICLRN5OLicv78+YSEhKtXr7q5uenq6k6cOJGSUwglrxzFxcWJLHAOh3Po0CGyz6CgIDheOGrUqIiIiMLCwry8vLNnz4LOUmNj40ePHpH9BwYGQjxgiUdTUxP+PX/+PI/Hg98ODg7wUgcHB3iCZpmVlZWQd1VV1e3bt6elpZWWliYmJqLVk5UrV7a0tDBkDe3OWVtb013z8/PRjPnx48cM8YSGhsJ28dChQ4OCgnJzcwsLCx88ePDVV18pKSmpqamFhYXRQ6WkpKD1jrlz5/r7+4eEhOzatcvc3HzEiBGHDx+mZJzH4zHnhVyYpqamMPmeN2+en59fSEjIzp07kXiwatUqgUDAENuxY8fAp7m5OXMZyrfRtolAIFi1ahUSjXbt2hUSEuLn5zd//nyCIIKDgxnkSbRdo6KiMmXKFA8Pj4kTJyopKXl6eu7evRucpk6dyuFw1qxZIxQKmUcMcgtUU1PbsWNHWlpaSUlJQkLC999/r6ampqysHBQUhN5+584dka39zp07QqHw0aNHHA4HcgHMnz+fw+EwL0yw7nqsR1Fwraqqmjx5MpTkN998k5iYWFJSkpaWdvLkSdA17ejoWFdXJ2Ql8R4+fHj48OHm5uY7d+4MCQnx9/dHK1MGBgbPnj2TSzOTpSGx6+9Sja579uwRCoWHDh0S2QJhDLx69SqHw/Hw8ABXU1NTcEXC9pdffglOgYGBhYWFkZGRMOD8/fffKAEsqlJcqry9vRlyispTwnFJXBNlmBvI0jI7VVlhMJhuD5Z4exw+Pj6EGAICAkQGEXeLxsvLCzyIdJ0yZYo4sx+3bv1/7J0HWFNX+8Bv2MMgO6hMqVJcgKKiIo5aEbflc2C1qaNFW1v0s4q12k/bqrTFSm3VgKNgxT1w4h6AiErZUFFGUBQIEAiEECDj/8DJ/xhvbkJyE/b5PT4+4Z4973nvOed9r4vF4vT09C+++ILQnoS5ufnWrVvr6+vJlRGchtLV1SXcwr169SpI5ciRIwoiuXXr1sCBA3EZGzduXEZGBtyHgSUFQTRVIgXarXx9fXGeU1NTP/zwQ5w3XV3dpUuXym4xybsdGhQUVFpaKi/R6upqGAOfz//ll18sLCxwfpydnaOjo1stWlVVFVBotGHDBkIPnp6ewM5nq1GlpaX5+vrKnl+dOHFicnKyvFDPnz+fNGmStH8tLa0FCxZUV1dDAQBSWlqqIAO4ygQr9XPnzvXp00f6uYmJyW+//SYUChUXp6amxtjYGMOw77//XkwWEp1WGYRCYVhYGO7Ge9++fS9cuKB4B5XP5y9btky6jfT19Tdt2iQSiaDEC5+LxWLFM4biHjh06NC7d+9Kpx4WFkYYW1hYGBCiCF0XLlyoZLWoNPRIz6IwhoaGhtDQUFnlzxYWFtu3byfxcVD6NEdVVdV//vMf3GiaOHFibm6uBruZ4o5kbW0NhGENjnflZ9fRo0eLxWJ5967BHIjrtLIb2iUlJcOHD5d20tXVDQ0NxeVB1aaUlysHBwcFJZUemMrMSwquy8pbG5ArTiesKwQC0e2hkFPgiUBokIKCguzsbBaLxefzTUxMXFxcPDw81LdjqT5gmZWZmcnlcs3NzUeOHAk3xjtbiVgsVlJSUmlpqa6ubt++fceNGwfOjLURIpHo6dOn+fn5HA7HwsJicAtYR1BeXg4KDlZ4np6eytjkfPHixT///FNdXW1jYzNq1ChNXa4GCIXCxMREJpPJ5/MdHBwmTJigpNZlDw+PjIyMoqIiqGSrPTttqzQ0NDx48KCoqMjAwMDJyWns2LHgrKmNjU1ZWRmNRpP30aS4uDgxMbGysrJPnz5jxoyB+0sa6YHV1dWmpqbu7u5Qr1U70/5DLzk5OS8vr6qqikqluri4DB8+nNzcEh4eDi7oMhgM8Pnm9evXT58+LS0tNTU1HTFixIABA9qim8nrSL169aqrq3NxcXn27Jlmx3t7IhaLnz59mp2dXV9fb21t7ePjAyT5Nm1KQnADk/S8pCQkitN56gqBQHR7kMSLQCAQHU92dvaQIUNmz5598eJFrEvRqsSL6JzISrwdSHV1NTjU+uGHH968ebNjM9M9QAMTgUAgIEhXMwKBQHQ8QFctVNqMQHQzHj58+OmnnxYVFclzBT8mTpzYvvlCIBAIRPcHSbwIBALR3ly8eBHojAF/cjicyMhIJycnqJsUgehm5OXlRUVFQRtmOIDeOH19/RUrVrR71hAIBALRzWlWIYNAIBCI9iQtLe2vv/5auHAh0LPy7bff1tTU7Nq1SxlDsp2EqqqqmpoacD8Q/A+276hUqrm5eUfnDiEXkUj06tUrDMMqKyvBk8rKStB29vb2bd0Df/zxRzc3N2kz6Tweb+PGjXfu3AFKxTRyzbsnw2aza2trZQemiYkJ1FSPQCAQPQ10jxeBQCDam+3bt2/btk1PT8/b27u0tDQnJ8fLyys+Ph4osu4SrF279vfff5d9HhgYKKv1GtF5KCsrg6ancVRXV/fu3buN0r1w4YK/vz9YcgwePHjo0KGmpqalpaVxcXFsNltfXz8sLAzcK0aow6pVq8LDw2WfBwUFydNejkAgEN2eLrO6QiAQiG6Dt7f3rFmz/v3338zMTBsbm2+//XbTpk1dSNwFtlgJt4yAfSlEp6VXr17yrOwAw8VtxLx5816+fHnlypWEhIR///03ISGhvr6+d+/e7u7ukydPXrlyJdrd1QizZs3CGSICQEPrCAQC0QNBe7wIBAKBQCAQCAQCgeieIM1VCAQCgUAgEAgEAoHoniCJF4FAIBAIBAKBQCAQ3RMk8SIQCAQCgUAgEAgEonuCJF4EAoFAIBAIBAKBQHRPkMSLQCAQCAQCgUAgEIjuCZJ4EQgEAoFAIBAIBALRPelK5h8R6rByZV1enhD38NdfjUaORH2ADHv28C9ebIR/mptTzp+ndstENZVbwLJl+nS6vqaSWLRoUWlpKfzTz88vODhYU5EjuhZ1dXUzZsyQfrJ+/fpZs2ZpJPIbN27s2rVL+smpU6eQ/VgEoi2oqqqaN29eG41lBALRM0HSTk8hOVmQnt4s8draamlrSx7W1+OtMR892hAUxHv/fe2rV3uZm6MjAHKpqBAxmSIMw169EolEGI1G6a6Jqp9bDMNqa8VsdnNnmzRJV4NJFLfQ2NhYUlKCYZijoyPWFeBwOLNmzUpPTw8NDf3ss8+wLsXRo0eDgoLef//9q1evmpubY50GkUjEZDJbOlstm83GMCwgIEBTkXO5XBA5i8Wqr6/HMIzP52Odg6VLl7548YLQ6dq1a52qjRCdhE47igFCobDtxjICgeihiBE9Aze3agyrxLDK0lKhAm80Ght4Cwurb8fcdWFAjdFo7G6fqDowGPWgX23bxlM+FJ/Pv99CVlaWAm9paWlgNqPT6ZrIrGZypQAGgwEy3Lt3b3FXA25shoWFiTslsHoZDIbyoZ49ewaalcvlKvA2Z84cEDmTyRR3Dtzc3OS930tLSzs6d4jOSOcfxeqMZQQCgZAF7fEi3mHwYO2yMgGGYa6u/78RjEB0EKWlpRMnTsQwbM6cOTExMVh3ydWgQYPAD1dXV6yrMXjw4LKysi6aeQXs2rUrKioKw7C0tDQFMmQnxMXFBfckPT29g/KC6Bp011GMQCAQ8kASL+IdYmKox483DBigPXmyJk+fIhAIyPjx4+Pj4zMzMxctWoR1NWJiYo4fPz5gwIDJkyd3dF4QzZw6dQr3hELp1PcdEB0OGsUIBKKngSRexDtQqZTAQIOOzgUC0c3xbgHrglCp1MDAwI7OBQKBIA8axQgEoqeBVBMhEAgEAoFAIBAIBKJ7gvZ4ERLS0gQNDW//tLKi9O8vucpbUSHKz5co3QV4eGjr6VFqasTR0Q2ZmUIeT+zkpD13rq6bm6Ie9eyZMDa2KS9PyOGIjY0pDg5a7u7aEyfqGhlJzuDx+WKgUBoydKg2dAUap4VS7gMHapmZaSnO/6NHTVeuNL16JaJSKaNH68yfr2doSHzkLydHGB/flJMjZLPFuroYjabl5aUzbZquvr4KRwQLC4VnzzYWFIj4fLG9vdacOXrDh+PrRJ1iyoN0nPIat7paFBXVmJUlNDTEhgzR/vhjfWPjt7Hl5wtPnmzMyxMaGFBGjdJZuFBPOi31KSwsZLFYQAMzhmFsNvvx48fQlUKhjBo1SkHwR48eXbly5dWrV1QqdfTo0fPnzzc0NCT0yeVy79+/n5qaWlRUxOfzTUxMXF1dp06dKns3Uv1ctdR2RX5+vvQTDw8PPT098DstLa1BqhNbWVn1799fpeIkJyffuXMnLy+Px+OZmJi4uLh4eXmNGjVKS0sLVwr4p66u7vDhw8Hzs2fPFhQU8Pl8e3v7OXPmgOcQedlTUC4+n3/27NnU1FQWi0WlUl1cXObMmSOrUjsjI+P69esFBQU8Hs/CwsLDw2PatGnW1taKK7O2tvbChQtPnz7lcDg2NjZjx46dMWOGrq5q1zGamppSUlIwDCsvL4eZkdbDbGdn17dvX3nBa2pqoqOjMzMzeTyek5PT3LlzFd8BJlfSdkDjvSInJ+f8+fNMJlMoFNrY2IwcOfKjjz6STffZs2exsbF5eXk1NTUWFhZDhgyZPn26ggoHpKSkXLx48eXLlwYGBv37958/fz7oVCkpKU1NTdCbtbU1lUol1zNVmhnk9f/q6uqoqKisrCxDQ8MhQ4Z8/PHHxsbG0E9+fv7Jkyfz8vIMDAxGjRq1cOFCIyMjZer2/v37sbGxLBbL3t5+xowZ0tOOUCg8c+ZMUlJSVVWVvb39vHnz1B/FKnVyeaOSxWIVFhZK+xw+fLiqo1WWnJyc+Pj4nJwcNputq6tLo9G8vLymTZumr09gA6+dCzho0KCcnBzpJ0OHDpVu4uTkZKHUW3ngwIFmZmbqFJD0MHFycuoS0xQCoRYE2qwQPVJXs4NDFfAA/tHptdApMpIv7YRhlUym4Pbtxt69JYqd4b+gIGI1p4WFgpkza4CfXr0qHRyqdHQkQfT1Kxctqs3MbGpRlyrARZiW1vwcgksxJqZBQf75fJG/vyRR+M/WtgqkJU1UFN/ZWRJcR6c5e9bWkoQsLdnHjvGVUZssEIi++aYOlxyGVX70UU1V1Tt1rk4xcYmqH6e8xjUxece/hQU7Lq4RBPnhB562Nr5Wc3IEGtTVrPjEnb6+vjxdzXw+39/fH+ff1tY2MzMTlwSLxfL394dLLnNzc0dHRyh8zp49u6ysTJ1cERIZGYkLJa3y18HBQdpJpeIUFRX5+PgAD1Qq1cHBAZbFysoqKCiosbGRsBQ0Gk0gEHzzzTeyJfroo4+qqqoUZE9xuRITE2Ut1uJ0w+bn50+dOhU4mZmZOTg4gBbR09PbsGEDzLMs586ds7S0xEXu7OyckZGhkn5XaXvOhISEhMjT1Xz79u3evXvj/AcFBREmRLqkJCChq1mDvaKxsXH58uW4ULJqyZlM5syZM4ErlUp1dHQ0MGi+UKOtrb169era2rcvIGnYbDah5BwcHCwUCnH9LTAwkETPJDEzEKZy+/ZtExMT6YcWFhZxcXEgyA8//KAN7QS2YGtrm5OTIx0t4YQgW/yAgACBoHn6LSgoGDhwIM513bp1iuNstRTKd3JlRqVKnVPBWI6KinJ2dgauOjo6Dg4OUCSztLQ8duyYbGztXMCEhATck7S0NOnYcOnGxMSoWUDSw6RDpikEop1BEm9PoVWJNzqaz2DUb95cJyvx5uYKGIx6BqN+2DBJJJcuNejpVU6dygkLa36+YgUXSrBRUXj5MC2tCQiQ/fqxr1xpEApFYrFYIBDdvt04ZIgkwuDgOrFYXFUlBAl5eXEIxbYjR5ozOWNGjawoKJv/gIBaS0v2hg11ERH1u3bxBg+WpDVgQFVjY3MeIHPmNEdoZsaOjuY3NUmc8vMFAQG1IEh4uFxbTVD4/PbbOiq1ctcuXmZmE5MpiI1tmDBBUgpPz2ou922K6hQTl6j6ceblCSIj+ZGRfA8PSf1cvtygr185bVpNaCjv1195kydLIqRSK1+/FoaF1WtrVy5ZUhsWVv/TTzzYgq6uVbDq1Jd44+LiGAzGjh07wKt32LBhDCkOHjwoT+INCAgwNTX96quv9u7d+/3338P134ABA3BvaxjK39+/oKAAPGxoaDhx4oSVlRVQgcvhcEjnipDc3FzgediwYXDJBV2jo6MZDMbmzZuli2Npablhw4aIiIhdu3YNHjyYsDi1tbXgI/3IkSNTUlLAQ6FQeOPGjQEDBoAg1dXV0qVgMBhUKhXINt9++y2VSt21a1dmZiaTyYyNjZ0wYQII5enpCa31yGYPZiAvLy+yBQ8PD+B67do1AwODwYMHb9myZc+ePdCcprTEm5aWBpaPTk5O9+7dg2UJCQkBupemTp3a1IT/PiUWi0+cOAE8GBsbh4SEZGVlgWx/8MEHFhYWW7duVV7i5fF4oDa8vLxAqM2bN0s3a2pqKqHEe+nSJT09PR8fn5CQkLCwsCVLlkABJioqCpcK6ZKSg4TES7pXnD17NjIy8ocffoC9gk6n6+npLV269Lffftu+fbu9vb2sxJuRkQGW3ba2tteuXRMKm99KfD4/IiICbIJ5eHhUVFTgMsnlcj09PUFCkyZNio2NZTKZmZmZISEhVCr1u+++A3FSqVRQlri4OBI9k8TMIJvK5cuX9fX1p02bFhoa+uuvv0IFUVQq9fXr12FhYdra2kuWLAkLC/vpp5+GDBkCXF1dXaW7gWzdLl682Nra+ptvvtm7d+9///tfuCW4fv16Dodjb28/cODA77///vfff1++fDkU2o8fPw7jVDCKZWcn0MmnTp0aFhbGYDBWrFiho6Mjr5MrOSoDAgJAKjweTx2JF4xEMzOz6OhoWGn5+fmwQcPDw3FB2rmAb968wc0tOIn3yJEjDAZjxowZhBIviQKSHiYdMk0hEO0Mknh7Ckra401La5KVeHGSIYZVOjlV7d37jhB46pRkq9DDQ7KwBnA4Iien5u1TQ8PKZ8/w24BVVcI+fdhQ4oXQ6bWEYhtg2zaePFEQ5t/RscrFpYrFeltYPl/k7v5WYpctV2wsPjaxWDx3brOTkVFleTlxvQHhU0enuYDJye/kVigUwZ3tr78m2P0mXUwF9nhJxynduPv3v9O4y5ZJ4lyxgmtmxr53762s1dAg8vSU1OrVqwQVqI49XiaTCV7bc+bMUeANrlAdHR2dnZ3fvHkDnerr66UXN7Khxo4dC7ZHpElJSQHHgDdu3Eg6V4pRYNZVujguLi4sFgs68fl8d3d32eLs2bMHPIQLdEheXh44SAklXghY9+jo6BgaGiYnJ0s7CYVCuP/29ddfK2/9GJarf//+X3/9NZBkAGvXrpWWKzgcDpDSjY2NCwsLcfH8/PPPIJ5t27bhnIqKinr16gVO3iYlJUk7iUSi//znP/C8n0o2POl0OuGqVF4BnZycfvnlF2mn48ePAycPDw/p56RLShp17PGq2SucnJxoNFp2djZ0ev36tZGRkbTEy+FwwElaQ0PD3NxcXAYuXLgAovLz8xOJ3vmI9tVXX8Ghh3NKTk42NDQE4gqNRlOnZ5KeGXDdY//+/dJOy5YtA04rVqwwMzODEgUQp6GIcvXqVVyc0nXr6uoq/SEgNzcX9HZjY+MVK1bMmDGjoeHtJHz+/HkQ0NPTU16cikexk5PT3r17pZ2gYnBcJ2+jUdmqxBsbGysbau7cuRiGGRkZlZeXE0bbzgVUPLds27ZNgcRLooDkhkn7T1MIRDuDNFchyNC3r9ZXX72j0nnBAv1+/Zq/AqamCmtr3y65du+uLyxsvib6+ef6Li54G7+mplpr17aJamgmU7Rvn7GV1dserq9P+fJLyTvpwYNmm8MQa2ut0aO1p02TnFuT5ptvmrPH42GnTjUqSE4gaC7giBHvXNnV0qL8+acR2PjZt6/hzZt3rst2WmxttVavfqdRgoMlt0YPH25YskRv4sS3l6/09Cjr1kk83737Tq22P0wmc9++fX369IFPDAwM1qxZA34/ePBA2rOenp6Dg8PXX3+NO1sI1jqTJk3CMOzIkSPS8kOHFAdsKwH09fW//PJL2eIkJibCk2+4SJydnYH1YHkIBILPP/98xIgR0g+1tLT+/PNPUDP79u178+aNqpk3NDT87bffpO8Pf/zxx25ubrA4u3fvBtfevvzyS9mbvevWrQO7Db/88guHw5F22rVrF5fLxTBs+fLlo0ePlnaiUCj79u0TidpjoNFotA0bNkg/CQgIABdQU1NTa2tr4XPSJe1ASPeKwsLCvXv3QovTLS+LvosWLRo6dCh8smfPnoKCgpaXwueyp3Dnzp0L1JjHxsZevXoVPn/9+vX+/ftBP//zzz9xFphGjBjx2WefCQQC9XumRmYGW1vb1atXSz8JDg4GPw4fPrxkyRLpUamnp7du3Trw++7du/LiLCws3Ldvn4WFBXwycOBAIPzU1dX9/fffhw4dgqevMQybN2/ee++9B+6LSndI5enbty8UnwALFizo16+fbCdv/1FpbW09evToadOmyTqB0/g8Hk/WcFe3LyDpYdIVpykEQiWQxIsgw8cfEwiHUEVTYaFEGYNYLD5wQKIkY+FCgiAYhk2bptu7N0WeNinSWFtTJk/Gq4yCEml+/jtKniIijJOS8Dd5AAMHShY9SUmtrKUWLybQJOHgoO3t3ZyoUIgdOyalWasTs3gxvqUGDtSCmpJkiwnbPS/vnVptf6ysrOAdJAhcteN0lri6ujKZzIULFxJGBRbiFRUVOGUk7Ym1tbWstUzC4oCluUAgiI2NlY0nPDw8LS0NnFYlZPHixbIPHRwcgOAhFAqPHTumauZXrFiBExg8PT3T0tJAWi0zwwHwnLAJdHV1fX19waru9OnT8LlAIICZ+fjjj2UDWltbf/DBB1jbs3TpUtmHUEsQ7DakS9rhkOsVZmZmshcIDx8+HB8fD36LxWKwIgfSBWHS0E71H3/8AR8eO3YMqPkZP368ra2tbCjC/qBqz9TUzCBbewMHDoQK52RdYc/Jy8uTFyeNRpP9egUDTpw40cbGRp4r+MSgKoRVKtvJO2RURkREJCUlETrBzyjyPHTjApIbJl13mkIglAdJvAgyuLvjP35jGGZjI+lONTWSj99ZWcLy8ubfFArm4UGsxnnYMJ3qarP//Y9Y9yxp3Ny0cV83CXMoC4cjKiwU5uZK/jGZkg+3LJaiL7gUSnOKhE6jRkkKnpDQwVugSuLujm8pCoViZiapTNliWlhInKT39jsEd3d32UaHW741NTXyAgoEgpKSkufPn+f+P+Bzfku7v1Vg2864ubkR9WEb2eLAe2ILFizYuXNnZWWldJB+/fq5ublJb2pJQ6FQ5CkmhTpgZVWwtMrIkSMVuGZlZQHdyHp6evCcNg54uREKSxiGpaenw6aBB0FxwLuUbQphKrKdjXRJOxbSvcLDwwPehCQkKysLjCkKhYJTIyz7WSc+Ph4qlYWVI08jOuF4UbVnampmkG3rlllUcu1Wtm7hzq2CzVjCApqbm8tLUcloFUAYp+wU1OGjksPhFBYWwjaCF09anb27XwHJDZMuOk0hECqBrBMhyGBpSbB6blG02QzUt//vv5Jf1tYUAwMN7+JqJIeQrCzBnj382NimkhJisU3a9JEsJiYUeUaM+veX5CQ3t4O3QJUESrDS6OpSMExsaIjJ7sbDY3SytdrOyGrRBAebwQ9pOxCApqamQ4cOHT16NCUlpbGR+NS6tCWPTlucVatWHTp0KCsri8fjfffdd//73/+mTJkyd+7c2bNnS5/xJsTExESeoQtotiQ3N1fVzCs2ZQGNdhgZGUnv40kDjAaB1Rh8+Pz5c/CDRqPJM9HUPlY0lGwd0iXtWEj3ilYr/99//4U+YXXhgIfz6+vrmUwm0L4Gmx5nSQWir69PpVIVfNhSMocamRmkzx5DgCopwxZwTvA0suw0pUyc8jqkMtGq38k7alRmZWXt2bMnNjYWWoxTdfbufgUkN0y66DSFQKgEkngRZJC6K/QW2T0kNlsiPfbqRemcOQTs28cPCuIJhZi2dvMpaw8PbRMTyWdQHk/8ww9vjXPKQ4FtPFj2qqoO3gJVp+r+36m921ElpO+wQeTtbZaVlfn6+qanp2MYZm9v7+fnZ2trC5ePly5dApdju0Rx9PX14+Pjg4ODjxw5ImjhegurV6+eNGnSxo0bwYE0QhTYdQSaWlq6bpWqmVdsLpLNZoMf1dXVQG+QAioqKuDv6upqXN5kkSdHdUjrkC5px0K6V7RqJhRWiIIWlD6BX1lZCSReJZu+VYm31RxqZGYg7B6tOpGOU51o1e/kHTIq9+3bFxQUJBQKtbW1p02b5uHhYfL/r20ejwcVXPe0ApIbJl10mkIgVAJJvIg2BJ5u0+zun0ikSdExLq5pzRpeixotyt27VNzpaw5HpIzEqwBY9v9fMnVMMdsuzi5KQEAAWNSuXLnywIEDuKOYJSUlHS7xqoSpqWl4ePhPP/106tSpkydPPnz4ENzOutsCnU4/cuSIPOFfHnCLAy73NQWM0NbW9sqVK4o9S9+6hM1Ebs+q/SFdUtJIa1RS5pSvqqjZK5RpQWknmEq7NX03mxnagfYflXFxcUAloamp6d27d3EnijkcjpISb2coIKHKK9IFJJfV9p+mEIj2B0m8iPY4Wqzg3qxiCCft+npMg+zZIxFog4MN5F02bhUeT8HFYImTublWexazHaqu65KRkXHv3j1gJnTv3r2Kbx52IaysrNa0UFxcHB0d/eeffxYXFwPbkm5ublAfrDQ8XvPnHkKgTk54V1BTwMOEAoFA3n1RQmBOFOgLraurwzoNpEtKGj7/7Rc6YJiKBG3XK2CFKGhBaSfo39zcHJztbNOm764zQ5vS/qMS2mMLDg5uh3v7miogoRRaT/RWJl1AcsOk/acpBKL9QZqrEG3IiBGSb4FsdrNhXuUD6uhQFEiSr19r0gxASorkJQSUKuNQ0jYNlytXqn/+XBL/sGHa7VDM9qy6rgu8kjRixAjCe1kdaJRII9ja2gYHB+fl5c2fPx88iYyMJPTJ5XLlHQSFV8KgTWNNAVUTlZWVKRCuZIE5qaqqgifxcLx+/RrrNJAuKWmgMhsdHR0jIyNykbRdr4AVUtUCoR+oh9zCwsLe3h6X3IsXLwhD1dTUqC9WdfuZoS1o/1EJmwloDm/rNlKzgPC7CeEMQBiQdAHJDZP2n6YQiPYHSbyINsTOTnvQIImYl5hIrKn46tVGR8dqDw+O9CRuaioR24qLCSS0R480qfS4oUEspZxJ7g5tqzx+TJwraPv3gw/whwDbopjtWXXthsZXMFDhh7yTmcqYHOw8a98tW7YQ2pLR19eHNifk6T5p6bqPCZ9Dk78aN7xhZ2c3ePBgUIcKLIjMmjXLxsbm119/hU8GDBgATW7ExcURhmrVJEl7NivpkioGHLslJC0tDfx4//331TnV3Ea9ws7ODlrrBWfvZYHKYP38/GARYHI4w9qtZrj9Z4aeRjuMSpWaSeNtpGYBTU1NwQ9w4gbHo0ePNFhAcsOkjaYpBKJTgSReRNuyfr1EnUNUFLHGy8jIhqIi0fDh7xgTcnXVlmfRJza2sbBQkxuV/ftL0kpOJpAG799XVkQ8eJBALWRiYlNWVvMer4kJRdYicVsUsz2rrq2BO1TQQknLJ5Kr7u7uy5YtUydmqG82LS1N9qSZSCRSYICh7XJFmoSEhBMnThAup4yNjcG1q759+8oLfvDgQdmHiYmJQCeniYmJPNuk6vDNN9+AH4cOHSL0kJube+XKFRaLNXPmTOnngYGB4Ed4eLhsqOzsbMIVZKsQNuvMmTPd3d2fPHmCdURJFRAQELBp0yZoMUWaiIgI8GPcuHGYGrRdr1i/fj348ddff8m6CoXCv//+G+cTmAk1MTEBB48JWwQWvKNmhp5MG43KVpspOTlZ1vX+/ftYZyqgq6urPINesbGxhIadSReQ9DBpi2kKgehUIIkX0bZ8+qnelCnNR3pOn26MjcULvZcvN54922RggH377Tvnx6ZOlZwCioxsSEl5K7mlpQmWLasjPH5MmkWLJIJoSAi/pOQdgbCkRLRli1I3X42MsBs3mo4efUfoLS8XLV8uOT7088+Gxsb4/Za2KGZ7Vl1bY2lpCRROSp/7evjwYXp6uprKM3x8fGg0GjjEFRISgnPdtWtXQUFB++dKTb7//nvZh+fOnQML9wULFhCGMjIyunHjxtGjR6UflpeXL1++HPz++eefSV8HVQCdTp86dSqGYSdOnLhw4QLOta6uDmT4008/hetFwLp16xwdHTEMu379OoPBkHaqrq5eunQpNKepEs7OzuAHbNba2tpbt26lp6f369cP64iSKkAkEv38889OTk4bNmy4d+9eUVFRaWlpQkLCf/7zn2vXrgE/K1euJJ3nNu0Vn3766ZQpUzAMO3/+/OXLl3GuO3fuzMvLwzBs48aN0qZBe/XqBYfqp59+ijM6ffTo0Zs3b5I+xa2RmaEn00ajUh6LFi0CP0JCQnCnV0pKSrZs2YJ1pgKC4Q+ulsDjyuCryrJlywjPLZMuIOlh0hbTFALRuRAjegZubtUYVolhlaWlQkIP69fX0em1s2bVAG/OzlV0ei2dXpuZ2ZSfLwC/7eyqgKu/fw2dXnv8OB+EBa6urhJXX99m15AQHnBls4XjxnEwrFJXt/K77+oyMppKSoSPHjX99791urqVWlqVx45J4pFm2bJaEJu2duWECZyAgNpx4zgUSmVgIHfbNh5wmjSJQ6fXrlzJFYvFu3fzCPPP44nEYnFMTAOdXhsQIImTRmMD12fPBA0NojFjmrOHYZWmpuydO3k3bzY+fNgYGsqj0dh+fjWyQcRicVQUH/xpYCBx/ftvPoZVzppVEx5ef+IEf8uWOhqNDcIuX14rEjVnQ81i4hI1MKgEf8KGIBGn4sZNSWkCrsbGzU66upIUExIaFdRqZmYTrpgMRj3ws22bpFcoyccffwxmqqioqOLi4suXL5uZmYEjWy2NvptOp8+aNQv4cXZ2prfA4zWnEhMTQ6fTAwICgCuNRgOuz549E4vFFy9ehMcK/Pz8jh8//ujRo5iYGH9/fyqVCvfHfH196XR6SEiI8rlSQEJCAsiDnZ0diMHf359Op//444/qFGfChAng4fz582/dulVcXPzmzZsnT54EBwcDWyze3t58Pn6UgZU9jUYDW2qzZs0KDw8/ceLEli1bgBOGYcuXL4ddd/369YTZy8zMzM/PJywXnU5PSEiQVxtVVVU+Pj5A+eeaNWuSkpJKSkoyMjIOHjwILLJ6e3tzuc2jG0daWhqocLANGxERceLEia1bt/bp02fo0KFQ6YuXlxfIA4fTfGlCMbm5uaA/eHt75+Tk5OXlLVmyBMOwSZMmicVieQU8fvw4CA5c4VoQ121Il1QeLi4uit/sa9euFZNC1V4hr9OuX79eQSpsNhsMMR0dnc2bN2dkZJSWliYlJdHpdBDPsmXLmprw04hIJIIit42NzdatW0+cOBEeHj579mwMw6Kjo2HmYRASPZPEzKC4e6SkpABX8I1AV1dXOgPyxnVmZqbiCWHr1q10Oh3mZ+TIkdLVTtghf/zxRxKjWMlOruSoZDAYrXZCDocD0vLy8sKNZVD2hoaGMWPGACdTU9OdO3fevHnz4cOHoaGhNBrNz89PdpJUfxSrU0B4/EdbW3vChAkBAQHjxo2jUCiBgYHbtm0DTpMmTaLT6StXriRdQNLDpI2mKQSiU4Ek3p5CqxKvg4NE4MH9u369MSmpidApKEgy9xG6TpjwdpXJ54t++YVnYSGRAOG/oUOr795tlp1k4fNFy5bVUihvPevrV27aVCcSiaDYBp+LxWJfX4loivtXXd1cXlwQ+O/+/ebUa2tFgYFcXd13nIyNK3fs4FVUCAmDBAZypR/SaGyxWHzuXEOfPu+U0cSE/dtv9UIhsbirajFxico2BIk4FTduTEwDoWtkJF9BrV6/3qgpibekpGT48OHSS3ldXd3Q0FDgKs/MbHV1dUv2JCsJHPfv3wfBb926NXDgQJzruHHjMjIygoKCpB9OmDBB+VwpQJ76qNGjR6tTnPT09C+++IJwK9Lc3Hzr1q319fWymZFe95w7d65Pnz7SAU1MTH777Teh8O10ARY9sly/fl3B1a/IyEgFFdLQ0BAaGgo1hUIsLCy2b98uK6VDnj9/PmnSJOkgWlpaCxYsqK6uxu3AYBhWWlraatOIxeI//vgDZ5/Tzc3t5cuXCu62BQUFgbCErtLdhnRJCUlJSVm1ahWuyQB9+/bdt2+fmCyq9gp5ndbBwUFxQnw+/5dffrGwsMAFdHZ2jo6OlhdKKBSGhYWBc5vSRb5w4YJYLLa2tgarfOifXM9UdWZQ3D1iYmIUZEDeuL5+/briCYFQpy6sdsKAo0ePJjGKle/kCkYlVCgQHh7eaicsLS0lTAuWveWtXRsYGIi75mpsbLxjxw5Zg7Fgzu/AAvL5/GXLlklf3dLX19+0aVPLS/mdDqCvr0+6gKSHSRtNUwhEp4LSeZSvINoUd3dOenrz4cbSUlMarWNOs4tE4qdPhfn5wupqsakpxd1dB+q1kkdxsSgxsamyUtynj9aYMTptmnM2W5SYKHj9WqSrS7G31/L21jEwUFnvi1AoTkwUMJkiPl/s4KA9YYKOvn7rkbRFMduz6lolPJy/alWzBsht2wz/9z8CDagKEIvFT58+zc7Orq+vt7a29vHxAS9sjQC+3GdmZnK5XHNz85EjR8LTrR2YK9IUFBRkZ2ezWCw+n29iYuLi4uLh4SFPB4+NjU1ZWRmNRgPrS6FQmJiYyGQy+Xy+g4PDhAkTwP5wOyASiZKTk/Py8qqqqqhUqouLy/Dhw5Ux9/rixYt//vmnurraxsZm1KhRCu4qK0lFRUV8fHxpaament6gQYO8vLw0a9KWdEnl8eLFi6ysrPLycqFQaGZmNrgFVQ0vd2CvEIlET58+zc/P53A4FhYWIP+thmpoaHjw4EFRUZGBgYGTk9PYsWNBkXv16lVXV+fi4vLs2bOOmhkQhKNy9+7d4KboyZMnNagXgM1mJyYmvn79WldX197e3tvb28BAojqkExawuLg4MTGxsrKyT58+Y8aMgYcm2qiApIeJxqcpBKIzgCTenoJiiXfXLh400oNAqENkZC/ZG8uyEu+bN6K+fZEegY4EJ9sgEF26V1RXV4NDpx9++OHNmzc7OjuId1i7du3vv/8OlJ/B87rdia5SQDRMED2WrqTGBqERfv2VT6VKBJIlS/ScnZt3WRMShNeuvdVQikCQ5tAhMYY1d7CrVxuTkyWfUZ4+xSuOrq0VIc15CARCeR4+fHjw4MHt27cTHs2Fto4mTpzY7llDNCv7tbOzw536hgA1xUZGRtD0a5ejqxQQDRMEghAk8fY4du/mw99eXjpA4kUgNM7ly03h4QQWmxAIBIIEeXl5UVFR7733HqGuWqA6SF9ff8WKFR2Ru57O2bNn2Wz2ypUrZZV4JyQk/PPPPxiGffbZZ7ir8l2IrlJANEwQCEKQxNtTiI2lNjbiT7DD482ffqrn44M6A0IDwMvPO3cafvst/saRqanE1dISbfB2DGw2u7a2FlzRBP8XFRUBpURQEymip9GFesWPP/7o5uYGtQ1jGMbj8TZu3Hjnzh0Mw8LCwpS5HoloC2praxcsWHDs2DHpPvP48WNg2GbAgAHbt2/HujJdqIBomCAQONA9XgQCgehBrFq1Kjw8XPZ5UFBQWFhYR+QI0fF0iV5x4cIFf39/sGgZPHjw0KFDTU1NS0tL4+Li2Gy2vr5+WFjYqlWrOjqbPRR3d/f09HRwsnfChAm2trYCgSAjIwNsfo4dO/b06dNqmrbuWLpKAdEwQSAIQRIvAoFA9CCuXr2anJws+9zLy0ueNRREt6er9Iri4uIrV64kJCT8+++/LBarvr6+d+/ejo6OkydPXrlyJdq26kCEQuG9e/du376dmppaUFBQU1OjpaVlZWXl6enp7+8/Y8YMrIvThQqIhgkCIQuSeBEIBAKBQCAQCAQC0T1BV+kQCAQCgUAgEAgEAtE9QRIvAoFAIBAIBAKBQCC6J0jiRSAQCAQCgUAgEAhE9wRJvAgEAoFAIBAIBAKB6J4giReBQCAQCAQCgUAgEN0TnY7OAKKdWLmyLi9PiHv4669GI0d20j7A44lPnmy8f7+ptFRkYECxsdHy9NT29dV1cNDu6Kx1Ovbs4V+82Ih7uGyZPp2u30E56rzcuHFj165d0k9OnTrVnaw11NXV4exkrF+/ftasWVgXYc+ePRcvXoR/mpubnz9/HutGqNlAly9f3r17d8sAX0an09smj9ijR4+qqqqmT5+ufJBuP7JIs2/fvjNnznRgl66qqpo3b17XnRNI0+0nEwQCoTydVNpBaJzkZEF6erPEa2urpf3/MmN9Pd421ZUrjcuW1fXpo3XlSi97+w6TLdPTBTNncouLRbq6mIuLNoaJr15tOngQ692bUl1t1lG56rRUVIiYTBH4XVsrZrObm3XSJF1Nxb9ixYrs7GxCp5iYGBsbG+kn8+bNKykpIfQcFxenp6eHdShcLpfJZGIYBqwUYhjG5/OxboRIJAIFrK2tZbPZGIYFBARgXYeKigqQ/1evXolEou4nMqnZQG/evHnw4EHLAJ/UFtnj8/lr1qw5fPjw77//rlLAbj+ySMNmszu2SwuFwraYEzgczqxZs9LT00NDQz/77DOs89HtJxMEAqE86FRzjyM52YTJNAX/fHzwQtGWLfUVFeLMTOH+/Q0dlEGsoUE8e3azuDtwoNbz570zM5v/JSebGBlJXB88aHrwoCk7W9BROexs7NhhBNt0505DjcfP5XKrW/jnn38et1BSUgKeiEQSSRtSU1MDnIDPx48fl5eXgydYu5Cbm/ughbq6OllXf39/ZgtTp07FuiNUKhUUcOfOnVgXZMeOHSD/VlZWWHekMzcQh8Px8fE5fPhwUFDQmjVrcK49fGSRZuvWrR3bpS0tLduiy508eTI+Pr6mpmbDhg1Yp6TbTyYIBEJ50B4v4h0GD9YGW8GDBnXYBu+5c40vXzbLUZs2GTo6SrLh4aHz0Ud6ly83H3KeOLEWw7A5c3RjYqgdlckexalTp8APR0fHoqIiDMNOnz49evRoQs937twBPwwMDBoamr+b3L1718HBod1yu2vXrqioKAzD0tLS3Nzc2i1dBKJL09jYOHfu3KdPn37yySdhYWGyHtDIQkgzaNAg8MPV1bWj84JAIBCtgCRexDscPmz8wQe61taUmTM77PRpfLxk89bd/R2p+8AB4927xbInsREIBAKhJiEhIffv3+/Xr9+ff/7Z0XlBdAHGjx8fHx+fmZm5aNGijs4LAoFAtAKSeBHvYGBAWb68g9UdlZdLDsr27k2Rft6rF6VXL0pREV7/FgKBQCDUobCwcMeOHS0nazZRqejsDEIpvFvo6FwgEAhE6yCJF9HpEPz//VyoYQuBQCAQrSIQCCorK8Fvc3NzXV1l1df9/vvvjY2NOjo6n3zySVtmEIFAIMiTmpqalZVVX1/v6Og4ceJEPT09sVjc2Nhsq0JbW1tHBwk1CLmgzoGQkJ4ukNasaWVF6d+fQOJMThbcudOUlyfi8cQmJhQXF20vL51Ro7S1tN7Zj5Xm2TNhbGxTXp6wpkZsYUEZMkR7+nS9vn3xWtMqKkT5+c27u0DVcMvUJiwtlfy2sKBoa2MslrikRLIDzGaLHz9+q7yKQsFGjdJ5/VpUXIzXpWRggLm5vdPVQcBRo7QplLfZfvVK+ObNO0em33tPy8LibT5zcoTx8U05OUI2W6yri9FoWl5eOtOm6errE5QdFgfi4aGtp0fh88VnzzampgpZLBGV2lyBc+bowuvKkIwMwfXrTQUFzfVsYUHx8GhOyNq6e6qaq62tvXHjRlJSEovFMjQ0tLOzmzx58pgxY6Rbp1WamppSUlJazgiUgycZGRnS2mLt7Oz69u0rL3hNTU10dHRmZiaPx3Nycpo7d67im4oZGRnXr18vKCjg8XgWFhYeHh7Tpk2ztraW9ZmWlgbuMwOsrKz69+8PDMBcuXLl1atXVCp19OjR8+fPNzQko3Wstrb2woULT58+5XA4NjY2Y8eOnTFjhjKijpLVXlhYyGKxcGH19fXd3d3Bb7FY/OTJE5wHT09PbalPVhppYlmePXsWGxubl5dXU1NjYWExZMiQ6dOny7Yyrgi6urrDhw8Hz8+ePVtQUMDn8+3t7efMmQOey4NcKUg3kKrw+fyPPvooNjYWw7DFixcfPXpUyYCNjY1//fUXhmFjx441MTHpKiNLHnw+Pz09XfrJ0KFDjYDmwxaSk5OFwrdnhQYOHGhmZqbB0ZqSknLx4sWXL18aGBj0799//vz5jo6OyuRc+Q4mL585OTnnz59nMplCodDGxmbkyJEfffSRvORgy+Jwdna2tLQEv1+9evXmzRtpVxsbG2Nj4/z8fOmHHh4eQA9/RUUFoZOq3UBeHaakpDQ1NUFv1tbWTk5OmHpwudz79++npqYWFRXx+XwTExNXV9epU6e6uLjIem7nAvbu3ZvD4ZDrzOQKqKmG0Pic//jx45UrV2ZlZcEnlpaW4eHh/fr18/LywjAsMDCQwWCQixzRIxAjegZubtUYVolhlaWlQkIPLi5VwAP4R6fX4jwUFQl8fDjAlUqtdHCo0tOTeLayYgcFcRsbRbggTKZg5swaGMTRscrAoPm3tnbl6tXc2tp3/EdG8qUzgPu3cGFtYCBXgQd9/UqxWLxtG0/WycWlSjqhJ0+awPOEhEbp58HBdbiAJ0/ygVNUFN/ZWVI/OjrNZbe2ZoM/LS3Zx45JvCkuDpMpSExspNEkAeG/sLB66YD5+YKpUyX1bGbGdnCo0tVt/q2nV7lhQ51sJeNgMOpB2G3beGJNAxVQJSUltepZX19yPJ7JZCrwtnfvXlNTU/CB1sHBwcLCAoRyc3NTJhVIaWmp4rkuJCRE2v+cOXNg9m7fvt27d2+c/6CgIMKE8vPzoTZaMzMzBwcHIL3o6elt2LChsbFRXqUB6HQ6n8/39/fHJWdra5uZmSlWkXPnzsG1KcTZ2TkjIwO++xkMhjrVHhgYKFuZDg4O0AOhEZrq6moSaUkDTInQaDRCVyaTOXPmTBAPlUp1dHQ0MDAASaxevbq2tlZBEWg0mkAg+Oabb2Sz/dFHH1VVvTNdqFkK0g0kDxhq27Zt0s+5XC60V7RixQqhkHieJwRqm9uwYUMXGlnyePbsGS7FtLQ0aQ+4LMXExGhqtLLZbEIJMzg4WCgUKu7SKnUw2Xw2NjYuX74cl27v3r2lQ+G6nLyWjYyMhEGCg4Nlmy8yMhL3EE7yhE4qdQNl6hASGBioRI+QO5mwWCx/f3/4+cnc3NzR0RGa0Js9e3ZZWRkuSDsXcOHChaQ7M7kCaqQhNPVah9y7d0/atCFcXWAY9u2336rUGRA9FiTx9hRalXhPnuQzGPWbN9cRSry1tSInp2aRb+TI6pSUJvBQKBTduNE4YIBEFKyufifmjIwmIN3Z2lZdu9YgFDaLany+KCKi3sio2b+HR3VFxdsgubkCBqOewagfNkyS1R07eOAJg1F/61ZjXFwjg1G/Y4dEph02rBq6Mhj1Bw82y43JyU0MRv348RKJMTCQy2DUQ8EVsGGDpIxBQVzp50lJzWG//LJZrp4/v5bBqM/LEwCnOXOa5XYzM3Z0NL+pSSJz5ucLAgJqQVTh4e9IrWKxOC9PEBnJj4zke3hIinPtWoOBQeXgwdVbttTt2VMPw0pLvGlpTZaWzZXm5FR1755khVdbKwoJ4VEozZ6nTuXADHQDiRdacVy3bh2bzQYPk5OTPTw8gLbnGzduKJk3Ho/HaAF87sUwbPPmzQwpUlNTCdflly5d0tPT8/HxCQkJCQsLW7JkCdycjIqKwqWSlpYGBBgnJ6d79+6Bh7W1tSEhIeDT9dSpU5uaJAMEEB0dzWAwNm/eDOKk0+kBAQGWlpYbNmyIiIjYtWvX4MGDgdOAAQOUX9aLxeITJ06ARI2NjUNCQrKysphMZmxs7AcffGBhYbF161Z5ApVK1R4XF8dgMKBq7oCAAAaDER0dDT0IBAJQw0B3608//cRgMBoaGkikJY0C8SAjIwO42traXrt2DUh3fD4/IiIC7H54eHhUVFTgisBgMMANVRqN9u2331Kp1F27dmVmZoJKmzBhAsinp6cnl/vOzEC6FKQbSFWJl8PhjB07Fjz/6quvRKJWvovh2LRpk6yo0/lHljyqqqpwGcYJCUeOHGEwGDNmzJAVEtQZrVwu19PTE7hOmjQpNjaWyWRmZmaGhIRQqdTvvvtOQZdWtYOdPXs2MjLyhx9+gPmk0+l6enpLly797bfftm/fbm9v36rEC1r2p59+Ag+pVOqBAwcYDEZubi4MkpSUxGAwNm7ciGHY6NGjGQzGw4cPc3NzQQ0PGzYMN8nLOoFuMHXq1LCwMAaDsWLFCnj0VLYbKFmHVCoVpBIXF6dMl5BX82lpaSAtf3//goIC8LChoeHEiRPAoJGLiwuHw5EO0s4FvHr1KunOTK6A6jeEBl/rAA6HA095LFmypLCwUCwW19TU/P777/r6+nDTGEm8CMUgiben0KrEC0hLayKUePfskchRBQUSIRCSlycwNsZLvByOqH//ZknY0LAyNxcf5MKFBhCbn1+N7OIMiJdgU1Q2h0ymALjOmVMjrxRnz0ri//JL/MpVLBY7OkpE9H792LKpr1vXLA9nZwtksxQbK1nESzN3brOTkVFleTlxxcLi9O9f9fXXXCD5A9au5UpLvByO5LOCsXFlYSG+7D//zFNGlG0fiXfPnj3XWwO+9eVJvH/88Qfw8OWXX+Kcqqqq+vTpA44tsVgslTJJp9MJVwY44Lrcycnpl19+kXY6fvw4cPLw8JB+zuFwwMEtY2Nj8NKV5ueff5YVRWRXHo6Oji4uLtKF4vP58ITwpUuXlCxmUVFRr169wBld3AcIkUj0n//8B35xwAlU5Kr90qVLINSHH35ImJ/Kykp9fX1cjanTxPIWqRwOBxzgNDQ0lF6aAy5cuABS9PPzkx3dIE4dHR1DQ8Pk5GRpJ6FQCDeNv/76a/VLQbqBVJV42Ww2XJtu2rRJrDqzZs0Cwe/evdvlRhbpDG/bto1QSCA9Wr/66ivwfM6cObi+l5ycbGhoCKZE2S5NepjAfDo5OdFotOzsbOj0+vVrIyMjxRIvBIgiGIYlJiYSVaQYHIiQnZ2k9/PlOTk5Oe3du1faCZq7w3UDdepQHYl37NixAgH+hZuSkqKl1XyNaOPGjYRxtnMByXVm0gVs/86sAPhlZ/bs2TgncB0DgCRehGKQxNtTUFPinT+/eUNSR6dSWmCDzJhRg5N44eli3D4qxNtbsg17+XKDxiXeujqRoWGzHxsbvEybnCwpIPiXlITfNLCzq8Kdgm75ZskdPfrtKU1pEhIaQVR//onf5sUVZ/DgaoHgncw8fdrk5lYdHS3Zgv7+e8nm88aNdbLxNDaKwPavkRF+O739JV6VIJR4ORwO2HAzMDCAn4Gl2bNnDwj+3XffqZRJVdflXl5esq7wXmJNzdtu9v3334OHhEuExsZGsEllZGQkfaYXtzbFMOz27ds414MHDwKn9evXK1nMVatWKXjNl5WVwZNs0qtb0tUuEAjs7OyA04sXL2QDhoaGYhh28OBB9dNSvEiFazt5hwah8tjLly8TxikvLJPJBJuQ2trar1+/VrMU5BpIVYmXxWINHToUPPnxxx/FpBg4cCCIISsrq8uNrDaVeJUfrcXFxaDz6OjovHr1Sja5r7/+GoTCdWl1hol0Pk+dOoVzXb58ube3tzISb0REBHi+ZMkS2Qzw+XwLCwtbW1tZqUkZiXfcuHGycfbr10+2G5Cuw1aRN5nk5OQ4ODicPHmSMNQHH3wAxDPCQxPtXEBynZlcATukMyvgvffeA6FkrxKIRCI4fSGJF6GY7qkIB6FxwGE0gQCLjX2rqwASHm6clmZCpUrOlojF4v37JVf7Fiwgtuu7aJHk+R9/EFwCVBMjI8r06c2rydJScWLiW+1WGIadPt2s02/1asnuypkzzX9CnjwRvHolmj8fn+eICOOkJPwtHcDAgZJzeklJ7yQky4oV+tra7+hs8PTUSUvrvXhxc2bEYvGBAxJNJAsXElSari7F17e5UDyepBQdyNy5cwNbA3w/lsexY8dqa2sxDJsyZYqspg0Mw+C+05EjR7C2ZOnSpbIPoQajwsJC8KOlgQ7Iu1sFtvJ8fX1bGoh3+vRpeclZW1tPnjwZ93DEiBHgB04nijwEAsGxY8fA748//pgwFbCa0VS1a2trf/755+C3rHYQsJg2MTEJCAhQPy0FtMwt+8HvBQsWEPqB1kHhboMsixcvln3o4OAApGWhUAirl1wpSDeQSrx588bHxyczMxPDsN9++23Lli3k4oH3OWXvInahkdUWKD9ajx07BhQIjR8/3tbWVjYqwm6gqWFiZmYme+Xy8OHD8fHxmBIsXrwYCCqnT5+Gur4hZ86cqaysDAwMlNZFpzyEBZftBurUIWlcXV2ZTCZhrwNaoICqKulM9oQCdmxnxlFaWpqXlwfm5yFDhuBcKRTK7NmzlYwK0cNBEi9CKby8JCdUFyzg7txZX1n5jhbifv203Nx0oLrmrCwhi9Ws9JhCwYYPJ9YHPmKE5Hl8vKCp6R0NyRoBSto4mfbs2cb339f6/ntDcPXj7Nl3XIEkKU9KB3A4osJCYW6u5B+TKakKFguvIxrHyJGKlgtZWcLy8uZ60NPD3N2JfQ4ZInkeH9+KdN3WbNq0idEairXR3r59G/yA15NwODs7g2OfJSUlihccagJP9EkDDl+BL/TgR1ZWFtBVq6enB4814oDvYwULTTc3N1lllTY2NrjkFJOens7lcsFveKJVmXKpU+0rV64EJ9n++usvaT2xGIbduXMnLy/vk08+MTY21kha8sjKygJalykUijy9ylAgiY+Pl9YmCqFQKPLUqI4aNQr8SEhIUKcUpBtIeQoLC8ePHw+0NI0ePXrdunWko6qrq5PVB9PlRlZboPxohRmDXUiZqDQ1TDw8PNSxy2JsbLxkyRKgtVtWM9OBAwe0tbVXrFhBLnLCNtVsHWoEgUBQUlLy/Pnz3P8HDmFZZfXdu4Ad25lxgC96QEm1vMwoEw8CgawTIZRi1Sr9Q4casrKEPB723Xf1//tf/ZQpunPn6s6erdenD/67yb//SnTlW1tTDAyIp28HB0mo+nqMyRQNGKBh27szZugZGNTx+c0y7Z49RmB2Tk0VFBSItm41sLHRGjdOJyFBUFQk+ucfARS/z55tHDBAa+hQgnGRlSXYs4cfG9tUUkIsn78rAhCg2LZQTo6k0oyMKH/8QRxXSorET1bWW2sEXZScnBzwIysr6/fffyf0o6enBySrrKws9U1QyENWlS44lAV+QMMPMMNGRkbyNg+hqQ9pCwrkklPM8+fPwQ8ajSbPSgqhQRd1qt3GxmbOnDnnzp1js9lnzpwBS2QA2HeF53jVT0se//77LywdrDQc8Ox9fX09k8kcMGAAzoOJiYk80Q7cEMYwLDc3V51SkG4g5YmKioK/Hz9+HB4eTqhVu1Wamppgr9OsNct2HlltgfKjFba4vG6sr69PpVJlP2lpZJio2ZcwDPviiy/ATvuBAwf++9//QnkmMzMzMTHR398ffqrohHWoDk1NTYcOHTp69GhKSgow6yoL7gNfty9gx3ZmHPDQgbweSLpnInoaSOJFKIW+PiU+nhocXH/kSINA0Hy8+fr1puvXm1av5k2apLNxoyE4cAuABnV79ZL7tRIegW6Z0cQyi1J1MTam+PnpXrjQ9Pq1+MkT4ejROnALFxxanj9fLyGheaf0zJlGIPE+fdosAG/eTLCM3rePHxTEEwqbT3dPm6br4aFtYiJZEvB44h9+UOpgtuLtE1hp1dXitWt5iqOqqND8rng7w2azwY+TLSj2XFFR0XY5kbZ5AJE9kg0zXF1dvXbtWtIZVjI5xVRXV4MfQDcSIYQCoZrV/sUXX5w7dw6IuFDiffPmzaVLl8aPHw/V2GokLUJgnAoKDs5nAiorK2UlXgU7mTDaqqoqdUpBuoFUwsDAYNu2bVu2bBEIBGvXrh03bpzsqb9W0dXVpVAozVo9WnaBsC47stoC5Uerki0uKyRoZJiovzk/ZMiQsWPHJiYm5ufn3759+8MPP5T+mLV69erOXIekKSsr8/X1Bdab7e3t/fz8bG1t4emkS5cuJSYm9sACdmxnxgE3ouV1cnJ27BE9ECTxIpTF1FQrPNz4p58MT51qPHmy8eHD5rWRWIzdvSu4e7eWTtc7csQYHGyG+wQK9quEwrcym8LTr+SZP1/vwoXmM41nzjQCiVd6C9ffXy8oqFmwPHOmMSTECCcPSxMX17RmTbNPU1PK3btUD493Rg2HI1JS4lUMrARbW60rV+S+ZgCkrlN1LuBLd8eOHdCygjygFpDOkGFbW9srV64o9kzuwpvywL04JfeENVXtkydPHjhw4PPnzx89epSRkQHscxw8eFAoFH7xxReaTYt0waWdFB+tVxAWBiRXCtINpDy9evW6cuUKMKq0adMmPp+/cOFCoEaVRFTg9p28LaBuObJEolbuoXSJIalBVq9eDeSf/fv3A4mXy+UeO3bsvffek73M3Ba0w6jBERAQAKTBlStXHjhwAHfGoaSkRBmJtzMUUF5nJlfATtWZ4YQmb6e9vr5epUwieixI4kWohpWV1po1BmvWGBQXi6KjG/78s6G4uHmqjYpqdHPTWbeuedfC0lLydZPDkbsVKe1kadkmF1dmztTT169raGgWdENDjdLTBXl5b7dw+/XTGjNG59Gj5nPOaWkCd3eds2cb+/fXcnfHD4o9eyQCbXCwAU7c1SCw0gQCsZtb9x+YlpaWb968AT+6xD0ceHRNIBB0eIbNzc3BDw6H0+rlTM1W++rVq8GV0QMtCIXCiIgIKysrWcU5bdHEsBUUFFzaifDAIY/HazUsrGFypSDdQMoTFBQExN0NGzZcv379/v37OTk5a9euDQ8PVzUqKysrIPHW1NS0/9eldhhZhAt3zS6Uzc3NS0pKOmRIaor58+cHBQWx2exLly69fv26X79+0dHRXC539erVbXe5VCN1SI6MjIx79+4BhW179+7V7JH+tiug8p2ZdAE7VWeGc2lZWRmhB3nPEQgcSHMVgiS2tlrBwYZ5eb3hpmhkpOQL3IgRks/wVVXiqiriT4/5+ZLnFhYUe/s26YdUqkS5cVGRKDlZIKuVSlq7VXKygMkk0NIsfXvW25vghdFyGFADwEorKxPzeF3+0HKrQPVCBQUFWJfKcFlZmQKRqX0Am6vg8C08SIbj9evXbVHtdDodHMcFajkvX7785s2b5cuXyx7ta4smhnFWtUDoB2rQtbCwsLe3l/XA5XLlnRuEF9hgDZMrBekGIrGdoqWldezYMaAZNSIi4uzZs6pGBc17AA1S3WZkwSU+YbRq1r+8Fn/x4gWhh5qaGkIhofPMhPr6+suWLQMbhocOHQKbvfr6+tAuTltDug7JAS+HjxgxgvBkBDjq30kKSKIzky5gp+rM8LKMvDv8ULUVAqEYJPEilGLLFt7ixZLbFNLo61MOHDD6/xMyEiHWzk570CCJ/AYOP8sCtQ37+TXfIiORJWVeRlCCPX268ezZRmfnZp3S0NXfX7JkPHOmUd6R5pazNJKUdHUJ8qlgH1sl7Oy0Bw9urjSxWJGho1mzam1sqn79tcsf44FHnh4+fCjPT1xcnI2NjaOjI7ndGM2uV+zs7MCrVywWJyUlyfM2a9YsGxubX3/9FWtLBgwYAI1GxMXFEfohzKT61W5mZgZsXXC53Ojo6P3791MoFEKdSW3RxHZ2doMGDVIcLVQ06ufnJ29uefz4MeHzBw8egB/QdBC5UpBuIHL069fv8OHD4PfKlSuLiopUCg6rtLi4uDuNLFNTUwXlevToEaY5YIeBXUjJLtcOM6HyQOVzERER8fHxGRkZ8+fPt7CwwNoF0nVIDnhKVt7dBwU7nO1fQBKdmXQBO1Vntre3BwdPCgoKgGp6HJcvX1YmHgQCSbwIpUhIEJw40QgOMOMwNqaAq1V9+77tTuvXSw4P//UXwdULoVD8998NOJ9KYmQkWcJKmx25erXR3Z2zbBleJp89W7LzFBHR8Pw5fgvXzk579OjmrL94IYqIaHB01IJKm6Xp318ivScnEwii9+9rTNfLN99IquLQIeL7Krm5witXmlgs8cyZiuwnKeDMmTNffvnltWvXsI5m7ty5QC/uw4cPoV5cHAcOHCgrK/Py8lLpaqKRkeQTjLRlmpkzZ7q7uz958kSdPH/zzTfgB9gAkSU3N/fKlSssFmvmzJlYGwOFTMJTrNnZ2YRrII1UO7yyu2vXrlu3bk2bNo1Q5WYbNfH69evBj7/++kvWVSgU/v333zifshw8eFD2YWJiIthGMDExgRYsSZeCXAORZt68eStXrgSr2ICAAJV0UMEFLlS12j1GlqurK87WFCQ2NlazNs8WLlxoYmICjpIS1kZEREQ7z4QkeO+996ZMmQLU0QFzyrL389sO0nVIDqiYPS0tTfaosEgk0rgpLHUKSKIzky5gZ+vM0Pzv999/j3M6ffp0dna2kvEgejpiRM/Aza0awyoxrLK0VKjAW1paE/BGp9dKP58wgYNhlcuWvfMQcOwYHwTZsYMHHwqFoilTmoNgWOWlSw24ID/8wANOGzfWyUY4Z04NcGUyBbKuIpGoV69m12HDquHDb7+tw7DKFSu4sv5nzJDEhmGV//zThHMNDZXkBMMqv/mGIDNisfj33+uBB1vbqjdv3qm9N2+EtrZVwHXCBA5hcMXFwRVt6lRJpZ0/j680Llc0bFi1vFaAMBiS3G7b9rY5AJcuXYIDPz4+Xqw60O5LUlJSq56hZkUmk0noIS4uDii0HDNmDI+Hzy2QWwwMDJ49e6ZSJkNDQ0G6Fy5cAE9qamrAl4/i4mLobc6cOQqyFxQUBFzv37//bgNNBc/Pnz+PC8LlcsFhsGXLlslGmJaWBgLS6XRZV6gbc8KECUoWk8vlOjo6glAHDhyQdqqqqvLw8IAGIRkMhsarXdrU6qVLl+R5UyctGo0GrPvgnguFQrAoJ0z6hx9+AE4bN26UF6eRkZGJiUlUVJS0E4vFcnFxIaxPcqUg3UCKYTAYINS2bdtwTnV1dbAImzdvVj5OLpcLRquvr2+XG1kKePnyJYjT2Nj4n3/+gc9TU1NpNJq3tzdwjYmJ0choBWqNgXBSUVEh7RQVFWViYgI+Gch2adLDRHE+FXQeBV0OKGMHDB06VHGECtqaRDdQpw4VQziZ8Pl88BzDsJ9++gkX5KeffoL1gMtkhxSQRGdWp4Dt35kVwGKx4Bb3F198UV5eLhaLge1oaQvwgYGByseJ6IEgibenoBGJF8Mq58+vvXWrsbhY+OaN8MmTpuDgOn395ufe3hw+XyQdhM0WjhvXHEpHp3Lz5rqMjKbSUmFSUhOdXguiWrastqnpbZCEhEY6vZZOr7Wzk8iQ/v414Mnu3e/Mmx9/LIkhKopfXCy8fLnBzIyNYZUPHjTKligqSiKQOzlVyboymQIo8T55gpeHAQ0NojFjJMU3NWXv3Mm7ebPx4cPG0FAejcb285MItDQaG+T22bNmyTY/XyCvOAkJBPkEVFUJfXya09LWrlyzhpuU1FRSIszIaDp4sN7BoTkeb28Ol/tOPSsv8W7evBm+G0JDQ8VK8+OPP9JbgG+X6dOngye4d6FYLF6/fj1wguYZ/P39wZOmJnwNnzx5EqyYXV1djx07VlBQUFxcfP/+/U8++YRCoejq6p45c0asIrm5ueAsq7e3d05OTl5eHrCjM2nSpJZ2yQeZsbOzk87e8ePHQXDgCj+o+/r60un0kJAQ4FpVVeXj4wN0xq5ZsyYpKamkpCQjI+PgwYPgc4C3tzeX+86Xl927d9Pp9FmzZoEInZ2dQRJgNRATE0On0wMCAoArjUYDrsosCNLS0sDtTbDVFhERceLEia1bt/bp02fo0KF79uwBTl5eXiBODoejqWqH3/jt7OwEAkWfclRNKyoqCuQW3BY2MDAAf8IGaplb2OPGjQN32zZv3pyRkVFaWpqUlAQvHC5btky2s0kvfMHCa9asWeHh4SdOnNiyZQtcGi5fvlwkwg8xcjVGuoHISbxisTglJQWcYKRQKHfu3BErDbjAaWhoWF9f31VGlvLlAtFOmDAhICBg3Lhx4Bz+tm3bgNOkSZPodPrKlSvVHK0ikWj58uXAycbGZuvWrSdOnAgPD589ezaGYdHR0aCPwS4t/c1F1Q4mL5/r16+XrQQOhwNcvby8cF1OViZpamqCBk73799PWKsJCQmEbf3jjz+q2Q2UrEMlJd5WJ5OLFy/Ciw9+fn7Hjx9/9OhRTEyMv78/lUoFkwwukx1YQFU7M7kCqp/PtnitX7p0Ceppp1AoNBoNflKHZ3mQxItQDJJ4ewpqSrzp6U1ffMHt169ZsMT9Mzdnb91aV19PIIbx+aJffuFZWOBDOTtXRUfzcZ4jIyWiqew/X98aaZ8lJcLhwyXFAf90dStDQ/FvbkBVlVBHp9nPhg3EW7iens1R2dsTyMOQ2lpRYCBXV/edXBkbN29rV1QIcbm9f79ZoE1KktSk7L/ISHzZpWloEIWG8iwt8ZVmYcHevp2H+6ygksSblJQEtF8YGhr++++/YqUZPXo0JgfZz9twH1gWPp+g4Glpab6+vrL3LSdOnJicnCwmxR9//IFTpOTm5vby5UsFFwWDgoJAWEJX6c2choaG0NBQWSXAFhYW27dvly2jr68vYZzV1c2HFOBKBQfhroIsz58/nzRpknRALS2tBQsWVFdXQ9EIUlpaqqlq53K5wOyt7NaBLCqlRXglWLqBAHw+/5dffpG9Yejs7BwdHS0vJ9KrtHPnzsGVPcDExOS3334TColnSHI1RrqByEm8YrEY3nTt06cP2AxRhszMTFC0yMjIrjKylIHP5y9btky61fT19Tdt2iQSiXBDT19fX/3RKhQKw8LCwIlQSN++fcGuOPyqQrhAV6mDycung4ODbCWUlpYSeoblwrF161awl1hT886bFxIZGUkY2+jRo9XvBorr0NraGshgyrS+MpPJrVu3oOY2yLhx4zIyMuA+rXQmO7CAqnZmcgXUSEO0xWv95s2buNWFiYnJ33//DVsESbwIxUjsziO6Pe7unPT05oscpaWmNJrc+9vp6QJ392YtpnS6XmQkgVXYggJhdraQxRLz+WITE4qLi7aHhzahSieISCR++lSYny/kcMQWFpTBg7UHD1bXDIBY3Bxndrawvl5sba3l46Njbd3ml9LZbFFiouD1a5GubrN+aW9vHQODtrLZIBKJk5OFeXnCqioxldpcz8OHt1LPgPBw/qpVzboct20z/N//8PdkcnJyHj16NHHiRGdnZ6wzUV5enpSUBFb8NBrN09NTTSspFRUV8fHxpaWlenp6gwYN8vLy0qyBDZFIlJycnJeXV1VVRaVSXVxchg8frqr1V03x4sWLf/75p7q62sbGZtSoUX379u2oam/ntEQi0dOnT/Pz8zkcjoWFxeAWFPi3sbEpKyuj0WhABhAKhYmJiUwmk8/nOzg4TJgwAe4baLYUpBuoPfnqq6/+/PNPFxeXjIwMWc3bXXpkFRcXJyYmVlZW9unTZ8yYMTjJU+M0NDQ8ePCgqKjIwMDAyclp7Nix8MBLpxqS8rh06dKcOXM+//xzEpau2roOe/XqBU7vEyoxIgeQ0DIzM7lcrrm5+ciRI9vh/Ui6gCQ6szoFVKchNN6ZhUJhXFxcdnZ2fX29k5OTn5+fsbHx48ePweGFwMBA2c+ICAQESbw9BSUl3tRUwfDhzRLvp5/q/fVXs8TL5YpYLNRJOiOOjlpaWpRWJd7GRrGeXntYU0QgOjk4iRchTW1t7dixY7OysoKDg0NCQjo6O4gO4z//+c+5c+dSU1Pd3d2xzkR1dTW4JvDhhx/evHkT63Z0lQJ2qnwiiRehJG1ucRvR2fj1Vz6VKpF/tLXFM2boeXi87Qa1tRLh1sJCIhVfutT08ccas4CH0CDV1aa9ezc35dWrjcnJEk2MT5/idbQWFgpdXNBIRyAQiqBSqdevX/f29v75559tbGzWrl3b0TlCdAAsFuvixYujR4/uEHH34cOHBw8e3L59O+HtGGjzZuLEiVjXpKsUsKvkE4FQHrQO7nHs3s2X/rOwUHT48NvTyxkZEsHJywv1jS7D5ctN4eHEBo0QCARCSfr165ecnLxo0aJ169b17t0baspBdGM+/fTTefPmQc3D+/btEwgEq1ev7pDM5OXlRUVFvffee1u2bJF1Bcre9PX1V6xYgXVNukoBu0o+EQjlQVJNTyE2ltrYiD+c7OjIOX26cetWoaNjsxI8Fkv0++/N8rCTk9bs2R1zIxFBgp07Db/9Fm/W2NQUnWRGIJphs9m1tbXgGhj4v6ioCCg+gbqUEQALC4ubN2+ePn1aJCKwvo7ofkRFRb148WLmzJna2tovXrzYs2dPv379oD7qDuHHH390c3ODmqgxDOPxeBs3brxz5w6GYWFhYW19E7ut6SoF7Cr5RCCUAUm8PYU+fYjv7nK52LBhnOnT9bS0sLt3m8rKxDY2lJiYXvDm5+LF+osXt6LNBdGxmJtrmZvLdUVHmhE9nM2bN0vr4KmoqACWcoOCgsLCwjo0a50RCoWycOHCjs4Fov1ITEx0cXFxdHR89OhRfX39sWPHFKgua1NMTEwoFEpjY+Ps2bMHDx48dOhQU1PT0tLSuLg4Nputr68fFha2atUqrMvSVQrYVfKJQCgP0lzVoykoEB4+3JCQICgqEjU0iO3ttaZN0/36awN4iReBQCC6OlevXk1OTpZ97uXlJc/KCwLRQ/jyyy+fPHny5s0bHR2dQYMGbdiwYfLkyR2Yn+Li4itXriQkJPz7778sFqu+vr53796Ojo6TJ09euXJlN9hU7CoF7Cr5LCoqAqesx40bN3/+/I7ODqLzgiReBAKBQCAQCAQCgUB0T9BWHgKBQCAQCAQCgUAguidI4kUgEAgEAoFAIBAIRPcESbwIBAKBQCAQCAQCgeieIIkXgUAgEAgEAoFAIBDdEyTxIhAIBAKBQCAQCASie4IkXgQCgUAgEAgEAoFAdE90OjoDCASiy5CWllZQUPDRRx9hnZUbN27s2rVL+smpU6c6j+XAzsmePXsuXrwI/zQ3Nz9//jyJeHg83smTJ+/fv19aWmpgYGBjY+Pp6enr6+vg4KDR/HY3OnOnbYs27czl7eRDDIFAIBDkQBJvT4HD4cyaNSs9PT00NPSzzz7DuilHjx4NCgp6//33r169am5u3tHZ6W7U1NT4+/tPnjz5xIkT1tbWmo38xYsXS5cuJR08Li5OT0+Py+UymUwMw1gsVn19PYZhfD5fo9nshlRUVIBKe/XqlUgkIid7pKenz5w5s7i4WFdX18XFBcOwq1evHjx4sHfv3tXV1W2Q6+5Dp+20bdSmnba8nXyIIRAIBII0FLFYTD40ousQHh6+atUqDMO69wLUxsamrKwMw7CwsLCgoCBpp4aGhqSkJAzDLC0tBw8eLC+G3Nzc0tJSDMM8PT2NjY3bJdddiYiIiFWrVvXt2/fevXsDBgzQYMzp6enu7u6kg/P5fH19ffjn3LlzwaYKk8lEe4wqDR8ajQaGgPI0NDQMHDjw5cuXAwcOvHHjhqOjI4Zhqamp3t7eurq63XjC0SydqtOq06ZKzqKdqrydfIghEJ0BJddRCEQnBN3j7SkMGjQI/HB1dcW6L3AKli1maWnpxBa+++47BTHs2rULeMvLy2vLnHZVPv/8819++eX169e+vr4sFkvj8c+cOZMvw5IlS4Drjz/+KOuqWcEbQYJz5869fPkSw7BNmzYB0QjDMA8Pj858AB7Rdm2KZlEEolui5DoKgeiEIIm3pzB+/Pj4+Pj9+/dfu3YN677ExMQwGIw7d+5MnTq1o/PSbVm/fv24ceMKCwtXr16t8ci1tbX1ZdDW1gauurq6sq5aWmge62Di4+PBD9wu/YEDB54/f95BmUKoBWpTBAKBQHQb0D3eHoR3C1i3hkqlBgYGdnQuujkUCuXHH3+cPHny+fPnY2Nj/fz8OjpHiA6mvLwc/Ojdu7f0814tdFCmEGqB2hSBQCAQ3Qa0N4JAIFRm0qRJ/fv3xzDs119/1VScFhYWgYGB06ZNUzXgwoULAwMD4T4wov0RCATgB2qFbgNqUwQCgUB0G9Aeb/enoqIiPz9f+omHh4eenh7OW01NzeXLl//555+KigotLa0+ffq4u7tPnjzZyspKmVRev35dXFyMe2hgYODm5ib95PHjxxiGjRo1ikKhwIevXr168+aNtLf33ntPLBYTZpvP5589ezY1NZXFYlGpVBcXlzlz5jg6OqalpTU0NEDPVlZWQCTDMKywsJDFYpWUlIA/2Ww2yAaAQqGMGjWqqakpJSVFemcjIyNDWoOonZ1d3759cQWsra29ceNGUlISi8UyNDS0s7ObPHnymDFjpEsHkJe9R48eXbly5dWrV1QqdfTo0fPnzzc0NMRI8ezZs9jY2Ly8vJqaGgsLiyFDhkyfPl02z5rKzLRp0/bv33/v3r3c3Fygx1VNbG1tGQwGiYDbt29v1U9NTU10dHRmZiaPx3Nycpo7dy6uZ+LIyMi4fv16QUEBj8ezsLDw8PCYNm2amuqpU1JSLl68+PLlSwMDg/79+8+fPx9cj0xJSWlqaoLerK2tnZycyLUshMvl3r9/PzU1taioiM/nm5iYuLq6Tp06VSMtJTu3sNls8CQ1NRWq5LGwsHjvvfc020VzcnLOnz/PZDKFQqGNjc3IkSNVvSpMomVzcnLi4+NzcnLYbLauri6NRvPy8po2bZq0pjR58Hi827dvP3z4EGjUs7CwcHV1HT9+vDINoWqnVYySla9qm0pDbhYlXV4STUniNaf8JK8+Kg1beW92VatRyXmpd+/eHA5HOuDQoUONjIzgn8nJyUKhEP45cOBAMzMzdQqoqfmTRAt2tuWQhYWF+nWYnJx8586dvLw8Ho9nYmLi4uLi5eU1atQoJa8FKbOOkg1F4uWFQLQVYkR3JzIyEtfoTCYT5+fPP/8EGjW1tLT69u0LFw0UCmXChAn37t1rNZVt27bJ9i4XFxdpP0+ePAHPExISpJ8HBwfjAp48eZIw24mJibJ2HcLCwsRiMU7VJ51Oh/ErPuesr68vFotb1ZwZEhKCK/LevXtNTU3BHoiDgwN8J7m5uSUlJeE8y2aPz+f7+/vjUrG1tc3MzBSrCJPJnDlzJoiBSqU6OjoaGBiAjK1evbq2trYtMvP3338Db3v27BG3MXQ6XV4ryGPOnDkgCJPJvH37Nu5kJoZhQUFBhAHz8/PhJXAzMzMHBwddXV0Mw/T09DZs2NDY2Egi/2w2m1AwCw4OFgqFuC4dGBhIumXFYjGLxfL39wd5BpY/HR0d4Reu2bNnl5WVycsnyAmNRlOyXLKDVJqFCxdqsIs2NjYuX74cl0Tv3r2VzCq5lo2KinJ2dgZBdHR0HBwc4NxoaWl57NgxxSkyGAxLS0swkfbr10962Tpw4MDffvtNJBJppNMqRqXKV75NZVF1Fm3nQUriNafSJK8M8oYYiWFL+IpUqRpVmpcWLlyI85aWliYdGy7dmJgYNQuo/vxJrgU74XJIzTosKiry8fEB3qhUqoODAwxlZWUVFBSkzHtNmXWUNCReXghEm4Ik3u5Pbm4uo4Vhw4YRSrz79+8Hs/nu3bu5XC54WF5evm7dOuWXWcnJyQwGY/z48fCtw2Aw4EwN2LBhA2GESUlJDAbjyy+/xDBs/vz5DAYjr4XIFjw8PECoa9euGRgYDB48eMuWLXv27AkICJCWeKOjoxkMxubNm2Ul3ri4OAaDsWPHDuA0bNgwhhQHDx4Ui8U8Hg/86eXlBbxt3rxZ2ltqaqp0nqFN43Xr1rHZbFgJILcGBgY3btyQ9i+bvYCAAEtLyw0bNkREROzatQtqmR4wYIBKYlVGRgZ45dva2l67dk0oFIrFYj6fHxERAT7Ae3h4VFRUaDwzYDMHwzA/Pz9xJ5Z4L126pKen5+PjExISEhYWtmTJEnhKMyoqChcqLS0NiChOTk5wZVNbWxsSEgI+w0+dOrWpqUmlzHO5XE9PT5DipEmTYmNjmUxmZmZmSEgIlUr97rvvQPNRqVTQ0+Li4ki3LCgCSMvf37+goAA8bGhoOHHiBNigcHFx4XA4GpF4ZeeWHTt2wCFz69Yt0gU5e/ZsZGTkDz/8ALsonU7X09NbunTpb7/9tn37dnt7e5UkXnItC3qRmZlZdHQ0dM3Pz4eTT3h4eKsLxM8//7ykpAQ8LC8vDw4OhpsqfD5f/U6rGFUrX8k2JUTVWbQ9BymJ15yqk7wyyBtiJIatbEuBapw6dWpYWBiDwVixYoWOjo68alR1Xrp69SqucXES75EjRxgMxowZMwglXtLzEun5k1wLds7lkDp1WFtbCza9R44cmZKSAh4KhcIbN25AMwfV1dWtFkqZdRSE3MsLgWhTkMTbg5D+oA4fNjU1ga+eS5culQ0CTPgqv7Fw9uxZkMSXX34p6wpNXPTr1w+3uSEWi8EbJTs7W162+/fv//XXX4OpE7B27Voo8eJeCdISL4DJZAKnOXPmKCNc4V7n0vzxxx/yillVVdWnTx+wBcRisXCuMHuOjo4uLi7SHvh8PtSJeunSJbFycDgccNrT0NAwNzcX53rhwgUQoZ+fn2yFq5mZiooK4MHe3l7ciSVeJyenX375Rdrp+PHjwMnDw0P6OYfDASsDY2PjwsJCXIQ///wzCLVt2zaVMv/VV1/BjodrheTkZENDQ7AqxS2CSbcsaNaxY8cKBAJcqJSUFCBrbdy4USMSr+K5RYNd1MnJiUajSU8Or1+/NjIyUlLiJd2yoFyxsbGycc6dOxfDMCMjo/LycgVTxLJly2RdYYryJF7lO22rBSdd+QratFWUmUXbc5CSeM2RnuTVkXjJDVvpaty7d6+006lTp+R1G3LzUquNC7c3CSVeEgUknU8SLdjJl0Pk6nDPnj0gISgkQ/Ly8sButjISr/LrKHWmHQSi7UASbw+CcAWTk5MDHv7www+yQZKTk1Wa4uvq6sDNTxsbG9mXEyaF7IEiOzs73LEfXLYHDx6Mm+ifPn3q5uYWHR3dnhIvh8OhUqngCzH8bEz4gvnuu+9wTjB7GIbdvn0b53rw4EHgtH79erFywOWFvDaC2rkvX76s2cyIRCK4D8Pj8cSdVeL18vKSdYX3iGpqauDD77//HjwkXHg1NjaCnSUjIyPl1wfFxcWglnR0dF69eiXr4euvvwaJ4lZspFs2JyfHwcEBt58A+eCDD8A6j3Cp0RYSr6a66KlTp3Cuy5cv9/b2ViZ7pFv2s88+Gz16NGGcCQkJIM4///xT3hShp6dHeM6Qz+eDI6DyJF7lO61i1Kn89pR423qQqvqaU2eSV4y8IabOsIXVOG7cOFnXfv36yVYj6XmJtMRLroCk80muBTv5cohcHc6fPx9UoPRuAQTsyWtW4lVn2kEg2g6kq7mnA4WWK1euSKudALi7u6elpW3cuFHJ2IyMjKZPnw7MlCcmJko7nT59GsMwaMH1zJkz0q5Pnjx59eoVmJrlsWLFCpzWUE9Pz7S0tMWLF2PtyLFjx2prazEMmzJliqxmDgzDZs2aBX4cOXJEXiTW1taTJ0/GPRwxYgT4gdNHIg94BAvDsAULFhD6WbRoEfgBP3hrKjMUCgUsKaQV1XRCli5dKvtw+PDh4EdhYSH4IRaLDxw4IO/GGjAF7OvrC8R70JmV4dixY2BYjR8/3tbWVtbDxx9/rNmWdXV1ZTKZhEUA10eBzhtY8DZFU13UzMxM9iLf4cOHoc1YxXkg3bIRERFJSUkKahKsVuVNERMmTCBUpKSvr+/n5yd731LVTts+ld8NBqmqrzmNTPIqoZFhSziZEHYbcvNS+xeQdD7JtWAnXw6Rq0NQKIFAEBsbKxsqPDw8LS0NvsrVpwtNO4ieBpJ4ezrOzs7gGM+TJ08mTZr04MEDaVdtbW03NzeVFOvBOQ43iZ89e/b999///vvvwVUreOBH+gUgb34EjBw5EusE3L59G/yA15lwODs7AyWuJSUl8hYobm5usooibWxswI+amhplcpKVlcVisYDwCZc18gTX+Ph4aYWWGskM1FXL5XKxzgq8By4NONImXbqsrCwgt+vp6cET3TiGDBkCfigjaOF8EuqxlFf5mmpZgUBQUlLy/Pnz3P8HthSIv63RVEE8PDzgjUQSedBIy3I4nMLCQliTcK9DtibhFAGLJsuJEyeqq6vlaXtWstO2T+V3g0Gq6mtOI5M8aUgPW8I6IZzJyc1L7V9A0vkk14JdaDmkfB3CGliwYMHOnTsrKyulXfv16+fm5qakuuZuNu0gehrIOlFPR1tbe+/eveBDaXx8/MSJEx0cHObNmzd37lxvb28SlhhnzJhhYGAAbAjt2bMHTOipqakFBQVbt261sbEZN25cQkJCUVHRP//8Aye+s2fPDhgwYOjQoQpiVtM2jKaAB5+ysrJ+//13Qj96enrAtkpWVhbOUgIAHL3DATQZYhgm+3WZkH///Rf8sLa2hmFxQJ239fX1TCYTaqrQSGagvkcej4d1VpQsHWxWIyMjeR+eobKurKwsJVN//vw5+EHYDcBXAyqVipNh1GzZpqamQ4cOHT16NCUlpbGxkTC4tO2ftkNTXVSdsa9my2ZlZe3Zsyc2Nhaa5Wi1JmGp4VU9VelU80M3GKSqvuY0MsmrivrDVvluQ25eav8Cks4nuRbs/MshEnW4atWqQ4cOZWVl8Xi877777n//+9+UKVPmzp07e/Zs+FFJg3ShaQfR00ASLwJbvHhx7969169fn5ubi2FYUVFRWAvW1tbLly/fsGGDubm58rEZGxv7+flduHDh9evXT548GT16NPxmCU7pzJ8/H1yBO3PmDJjinz59WlRUBFUHy0MZ65ftADRTebIFxZ6heiccsvaQgS0Ecjnp1auXPD/Sp5UqKysJXy2kMwO/zpK2IdwOKFk6WJnV1dVAIxqJZpWlurq61TYyMDDArdjUadmysjJfX9/09HSgVMzPz8/W1hYatLh06RLufF2boqkuqs7YV6dl9+3bFxQUJBQKtbW1p02b5uHhYWJiApatPB4PqpImUWrFdKr5oXsMUpVecxqZ5FVCI8NW+W5Dbl5q/wKSzifpFuzMyyFydaivrx8fHx8cHHzkyBFBC9dbWL169aRJkzZu3AguAmiKLjTtIHoaSOJFNDNjxozp06fHxcUdP3783Llz4NwLi8UKCQk5dOjQlStXwEytJPPnzwfq+M6cOQMCSn+z9Pf3DwoKAq4hISG4F0DnB75gduzYAS0xyANqDWkL4DlPBXs+0k4w55oCfksmvbLvPMDKsbW1vXLlimLPyn/sV6aNNNuyAQEBYEm0cuXKAwcO4A4Dl5SUtKfE2+FdVJ2WjYuLW7NmDYZhpqamd+/exZ285XA48iReco3eLSu/Uw1S5V9z7T/Jt/OwbbsuKhKJNFhA0vlUpwU77XKIdCcxNTUNDw//6aefTp06dfLkyYcPH4ILt3dboNPpR44c0dTB5u437SC6DUjiRWDS1tUnTJiwb9++O3fuREREnD9/Hnz+nDt3bn5+PrCipgwzZ87U19dvaGg4e/ZsaGhoenp6Xl4e/GbZr1+/MWPGPHr0qKCgIC0tzd3d/ezZs/3795d3L6uzYWlp+ebNG/DDzc2tY3MCfnA4HHl+pJ0Iz7ypA7w4BO4+dWlg5QgEAg02q7m5OTgNq6CN6urqNNWyGRkZ9+7dA4Zq9+7dS/rua7fpouq0LNTmGhwcTHjRtNUpQrOHQrti5Xe2Qarka66dJ/n2H7bk5iUchCJNfX29BgtIOp9qtmAnXA6p30msrKzWtFBcXBwdHf3nn38WFxcDW81ubm7Q4LCadL9pB9FtQJqrEHh0dHR8fX3PnTv38OFDcA2jtLT05s2bysdApVLBOZmioqLk5GRZNQzS6hySk5OZTGZX2eCVVrpQUFDQSXJS1QKhH6hp2cLCwt7eXoOpV1dXg1PNffr06QZ7vLAyy8rKNHgtediwYeDHixcvCD3U1NTIrthItyy8xDhixAjCo+bNJul6TBdVs2VhZUJbGkrWJEwxLy8P6zg6Q+V32kGq+DXXzpN8+w9bcvMSAMpahE3w+vVrDRaQdD411YKdZzmkwU5ia2sbHBycl5cHE4qMjMQ0RPebdhDdBiTx9nSys7Pnzp17+fJlWaexY8euXLkS/JantUUecCY9ffr02bNnnZ2dpb+z+vv7gx9nzpxp/yPNSr4Y5HmDR6TA0SBC4uLibGxsHB0dCT94awo7O7tBgwYpzgzUdenn56dZ3Zvg8zAwmYB1fezs7AYPHgzaXZ5BGmDTwsbG5tdff1UyWmAjEcMwnNpPyOPHjzXYsvCcubyjYgq+u3e/LqpmyyquTAU1CUySYBim4CTqlClTHB0dNbjQ7JyVr1lRjXRTqvqaa+dJvv2HLbl5CWBqaop7BUjz6NEjDRaQdD7JtWBnXg6RrsMtW7YQWnDU19eHtr5ULZGCod0Zph0EghAk8fZ0KioqLl68GBMTQ+hqYmICfqikkR/DsNmzZwMtGhEREc+fP8fN4HZ2duBCy4sXLyIiIhwdHRWY8dAU8BiStDb8q1evuru7L1u2TLG3mTNnuru7P3nyBMOwuXPn9u/fH8zmQLmFLAcOHCgrK/Py8mprlU7r168HP/766y9ZV6FQ+Pfff+N8aors7GzwY8qUKbKupaWlmzZt2rp1q7yvvJ2Qb775Bvw4dOgQoYfc3NwrV66wWKyZM2cqGefChQvBIMrIyAD9B0dERIQGWxb0TAzD0tLSZM8cikQi5e0qdYMuqmbLwspMTk6WDXL//n15yc2bNw9oaX769CnUXCpNTk7OnTt3Xr16NWnSJKw7Vn6rs2g7N6Wqr7l2nuTbf9iSnpekP3EClUvSxMbGEtpqIl1A0vkk14KdeTlEug4TEhJOnDhB+HnC2NgYXHdXvkTKrKM6w5yPQBAgRvQY5syZAxqdyWTCh2DdZmho+O+//+L883g8YNvQ1NS0trZW1eSk1UX8888/ONfQ0FDo+s0336iabXmkpaUBz3Q6HeckEonA4dthw4bBh99++y2GYStWrJDN2IULF8CTmpoa8LoqLi4GT+Li4oCahzFjxvB4PFxCYDY3MDB49uyZ8tkTi8VQL+WECRPEyiEUCqHAeenSJZwr1KyzceNG2bBqZga+q1JSUmRd4b3HDz74QKw2dDodxBYSEqJkEMXdBigLAXILfCgSiaZOnQqenz9/HheEy+WCI3bLli1TKfP79+8Hcbq6ulZUVEg7RUVFmZiYgDUEjUZTv2X5fD6NRgNOP/30Ey7UTz/9BAeddMEhICwuJ2rWdtt1UeUh17LQqImtre2bN2+knd68eWNra6tggNy7dw9MET4+Po2NjdJOjY2NYIErPe2Q7rSKUafyVZp4cSgzi7bnICXxmiM9ySuGcIipOWzJdRty85JYLH758iUIaGxsLP1mT01NpdFo8ApATEyMRgpIOp8kWrAzL4dI1+GECRPkvbaOHTsGguzYsUPJgiizjlJn2kEg2g4k8XZ/EhIS6C3Y2dmBicbf359Op//4449wigcvjD/++CM7O5vFYuXm5p45c2bkyJHgHgtctahEVFQUiNnJyUnWlclkwgn6yZMnsh7y8/MJs02n0xMSEmT9r1+/nk6nz5o1C3h2dnYGnjMzM6EfYGcPqGooLi6+fPmymZkZODEF/eTm5oJjNt7e3jk5OXl5eUuWLMEwbNKkSdLJnTx5EizgXF1djx07VlBQUFxcfP/+/U8++YRCoejq6p45c0ba/+7duwmzB97EMTExdDo9ICAAtgVwVWY5xWazx40bB1pq8+bNGRkZpaWlSUlJUEpctmxZU1OTxjMDXv8jRoyQzZK0nUBjY2MxWc6cOQOSdnZ2BrENHz5cQR9Q0G2OHz8OPABXuE3h6+tLp9OhIF1VVeXj4wMUva5ZsyYpKamkpCQjI+PgwYPAhKC3tzeXy1WpFCKRaPny5SA5GxubrVu3njhxIjw8fPbs2RiGRUdHy5MzSbSsWCy+ePEiPCfm5+d3/PjxR48excTE+Pv7U6lUECGu4FFRUaBawEU1AwMD8CesNFXnFjqdvnv37rboouvXrxeTgkTLNjQ0jBkzBmTA1NR0586dN2/efPjwYWhoKI1G8/PzUzxAjh07Bs4fenp6Xrx48dWrV8+fPz9z5gzQ0erp6VlTU6ORTqsYVStfyTZVjOJZtP0HKbnXnKqTvAJaHWIkhq2a1Uh6XhKLxXA3T1tbe8KECQEBAePGjaNQKIGBgdu2bQNOkyZNotPpK1euJF1A9fOpagt22uWQOnUIJF5wWPrWrVvFxcVv3rx58uRJcHAwsPrm7e3N5/OVL4sy6yhyLy8Eok1BEm/3R95VsdGjR4Mvl4cPH544cSKh6j8fH5/Hjx+TS7eqqgrEuWHDBkIPnp6ewKwcoauCa1qRkZGy/qFNcxzXr1+HfkpKSoYPHy7tqqurGxoaiovqjz/+wBk2dHNze/nyJc5bWlqar6+v7C2UiRMnJicn4zzLM3lXXV0tFovhKgGHkps5fD7/l19+kVWY7OzsHB0dLetf/cw8ffoUPJQnFMEjherszgUHB6vUBxR0m6CgIOCB0FV6m66hoSE0NFRWgaSFhcX27dtVWhlAhEJhWFgYPBQH6Nu3L1g8WVtbg8Wc+i0LuHXr1sCBA3FBxo0bl5GRATd8pAseGBiouNLkoeAaqq+vb1t0UQcHBzFZSLRsbW1tYGAg7uKcsbHxjh07ZK2wyo7W1NTUDz/8EOfNwMDg66+/lhbJ1O+0ilGp8pVvU8UomEXbf5CSfs2pNMkrQJkhpuqwVb8a1ZmXli1bJl0t+vr6mzZtEolEuNeHvr4+6QKqn09VW7DTLofUqcP09PQvvviC0IaWubn51q1b6+vrVSqLkusoci8vBKLtoLSz6k5Ep6Wuri4zMzMvL6+mpkZXV9fGxmb48OFtak62QwDSWnZ2dn19vbW1tY+PD3hf4qioqIiPjy8tLdXT0xs0aJCXl5c8/Qrl5eVJSUmlpaXgxJqnp2dHVZpIJHr69Gl+fj6Hw7GwsBjcQhulNWvWrCtXrvj4+Ny/f5+wZpqams6fP6+npzdnzhxNGfprT0QiUXJycl5eXlVVFZVKdXFxGT58uJqWAxsaGh48eFBUVGRgYODk5DR27FhQM7169aqrq3NxcXn27JmmWhYs9TIzM7lcrrm5+ciRI+E+eQfSnl1Ugy3LZrMTExNfv36tq6trb2/v7e0NduqUhMVigSmCQqE4ODh4eXnh1u7dtfKVn0XbrSnJvebabZLvkGFLel4qLi5OTEysrKzs06fPmDFj4JnbNiog6XySaMHOvBwiXYcFBQVg15rP55uYmLi4uHh4eJB7qSm5juokcz4CAUASLwKBUI3o6OglS5ZYWFg8fvy4M8hRXZrq6mpwJOzDDz9UyegFAoFA9PB5qavkE4FAdDhdb+8FgUB0ILGxscuXL6dSqVevXkXirjI8fPjw008/LSoqkucKfkycOLF984VAIHouXWVe6ir5RCAQnRwk8SIQCGV5+vTpzJkznZ2dnz59CvTNIlolLy8vKioK2mPAsWfPHnDbbcWKFe2eNQQC0UPpKvNSV8knAoHo5CCJF4FAKItAIAgNDU1LS3NxcenovHQxfvzxx8uXL0s/4fF4a9asuXPnDoZhYWFhytyCQyAQiB44L3WVfCIQiE4LgT46BAKBIGRMCx2diy6GiYkJhUJpbGycPXv24MGDhw4dampqWlpaGhcXx2az9fX1w8LCVq1a1dHZRCAQPYiuMi91lXwiEIhODtJchUAgEG1LcXHxlStXEhIS/v33XxaLVV9f37t3b0dHx8mTJ69cuRLtTiAQiPanq8xLXSWfCASiM4MkXgQCgUAgEAgEAoFAdE/QPV4EAoFAIBAIBAKBQHRPkMSLQCAQCAQCgUAgEIjuCZJ4EQgEAoFAIBAIBALRPUESLwKBQCAQCAQCgUAguidI4kUgEAgEAoFAIBAIRPcE2ePt/uzZs+fixYvwT3Nz8/Pnz2M9mEWLFpWWlsI//fz8goODOzRHCGLq6upmzJgh/WT9+vWzZs1quxT37dt35syZdhgsN27c2LVrl/STU6dOITMbiE5Famrq6dOns7Oz6+vrraysHB0dp0yZ4u3traen19FZQ3Q8K1fW5eUJcQ9//dVo5MiOWVju2cO/eLER/mluTjl/ntrh2QAsW6ZPp+tjXR+0fEJ0XZDE2/2pqKhgMpkYhr169UokEhGuqo8ePRoUFPT+++9fvXrV3Ny8rbPE4XBmzZqVnp4eGhr62WefYe1LcQuNjY0lJSUYhjk6OrZzBhBKIhKJQNetra1ls9kYhgUEBLRpimw2u9XBohG4XC5ICJiXxDCMz+e3UVoIBAmCgoL27t2LYZi1tbWDg0NaWlpFRcWuXbvCwsKCgoJUimrdunWPHj3CMOzMmTN2dnbyvCUlJa1du1ZBPFpaWiYmJk5OThMnTpw7d66+/jsixIoVK7KzswkDxsTE2NjYqJTn+vr6KVOmCIXC4ODgefPmqVk0Qvbv33/06FELC4urV68q8KZOEm1KcrIgPb1Z4rW11dLWljysr+8wg5cVFSImU9Qye4tEIoxGo3RsNlreXGI2u7lCJk3SxboFaPmE6MKIET0GsHyn0WjynDAMCwsLa4ecMBgMkFzv3r1xTnw+/34LWVlZ5CJXMoa0tDSQBzqdLu5JPHv2DNQPl8sVdxFgh2EwGB0+WDTLnDlzQNGYTKa4B6P+wO9mdGyFHDhwAHTLXbt2gSeNjY2ffPIJiXdEeXm5rq5kuf/DDz8o8BkfH+/SApROjYyMwBMXF5eBAwf26dMHLl2srKxOnz4tHXzBggXAp46O5FO+vb09ePL69WtVayAmJgZEUlhYqH7RCHFzc2v1BaRmEm2Km1s1hlViWGVpqVDcmaDR2BhWSaOxOzojYgajHlTRtm28LvGaRssnRDcGSbw9CAWL+MmTJ4P568aNG+2Qk7i4OJCcl5cXzglsfGEYNmfOHHKRKxlDj52y6XQ6KHhaWpq4i4Ak3m6P+gO/m9GxFfLee+8BiVH6YX5+PgmJd8+ePVBMdXR0FIlErQaJjIwE/n19fXFOb968Wb9+PYxw3759ssEdHByAa1JSkpgsQLx3c3PTbNEghYWFIGBMTEwbJdHWIIm37STejnpNo+UTohuDNFchmomJiWEwGHfu3Jk6dWo7JDd+/Pj4+Pj9+/dfu3atHZJDIBAIhJKUl5fn5eUBeU/6ef/+/UtLS1W9h3L48GH4m8lk3r9/X5289enTJzQ0dOfOneDPoKCg58+fY5pGIBBcvnwZw7CPPvqojYp24cIFDMMMDQ0Vv3M1WHtHjx5dtWrVjh07SMeAQCAQXRck8SKaoVKpgYGBcKe3HfD29l69erWZmVm7pYhAIBCIVmGxWOBH7969cU40Gs3IyEj5qJ4+fZqVlTV9+nRXV1fw5NChQ+rncP369RYWFkA0hQewNUh8fHxVVRWGYQpu8KpZNCDxTps2zdDQsI2SwHH37t3w8HBpzXwIBALRc0ASLwKBQCAQCAkCgQD80Ib6iMgCtihXtgCenDt3rrq6Ws1o9fT0xowZA37DOzIaBGhod3JyGjp0aFsUrby8/OHDh4ol6rarPQQCgeiBIF3NPZ20tLSGhgb4p5WVVf/+/RU73b9/PzY2lsVi2dvbz5gxY9SoUdCPUCg8c+ZMUlJSVVWVvb39vHnzhg8fLp1cRUUFuAwG8fDwALYuCgsLWSwWUAAItOY+fvwYeqNQKNIJEaJmDI8ePbpy5cqrV6+oVOro0aPnz5+v4Os7hmEZGRnXr18vKCjg8XgWFhYeHh7Tpk2ztrbG1ECZOBsbG1NTU2XDgprk8XiZmZk4J09PT5FIlJKSAhZbMC1p/cB2dnZ9+/bFBaytrb1x40ZSUhKLxTI0NLSzs5s8efKYMWMoFLwaTHm9RaVara2tvXDhwtOnTzkcjo2NzdixY2fMmAEVtyhA+XziSElJuXjx4suXLw0MDPr37z9//nz1lU/yeLzbt28/fPiwrKwMwzALCwtXV9fx48e7uLi0GrampiY6OjozM5PH4zk5Oc2dOxd3slSanJyc+Pj4nJwcNputq6tLo9G8vLymTZuG02GruIFycnLOnz/PZDKFQqGNjc3IkSNxJzm5XO79+/dTU1OLior4fL6JiYmrq+vUqVOVKY4yVUFu2Co/+kgXXAE1NTWXL1/+559/KioqtLS0+vTp4+7uPnnyZCsrK/W7qPozIY5nz57Fxsbm5eXV1NRYWFgMGTJk+vTpsoMd1hU8J1xeXi6dtJubm4GBgfLp1tfXnzhxwsrKaubMmdXV1cHBwQKBoKGh4eTJk6tWrcLUA1Y1nNA0CFBbpUAcVbNoly9fFolE2traM2fObKMkOhVcrvj+/abUVGFRkYjPF5uYUFxdtadO1XVxIfikUlgoZLHeKnzW1cWGD29eqRYWCs+ebSwoaI7B3l5rzhw98FwZ8vKElZVv4zQzowwc+Dbp0lJRUZFEu3KLvjRs6FCCmJOTBXfuNOXliXi85iK4uGh7eemMGqWtpaUxpdBNTU0kXtPS06yurm7fvn0nT57s7e2t0herbrB8QiBaoaMvEiPaD0JlPFDJh6weAlknPp8vuygMCAgQCARisbigoGDgwIE413Xr1hGqJIFAhT2BgYEKOqq+vn6rBVQpBmnVC3w+39/fH+ff1tY2MzOTMKH8/Hx4+crMzMzBwQFIZXp6ehs2bGhsbFSxZVSLE+qWIKxJWC5pqqurpW3oERISEoLL0t69e01NTcFWj4ODAzhGCBa+siphCHuLSrV67tw5S0tLnH9nZ+eMjAzFmqtUyieEzWYTSjjBwcFCoZC05ioGgwFKQaFQ+vXrBzODYdjAgQN/++03nO4Zac1Vt2/flj1HGhQUJJtKVFSUs7Mz8KCjo+Pg4ADXCpaWlseOHZMNIttAjY2Ny5cvxyUnrT6dxWL5+/vDLw7m5uaOjo7QFuvs2bPLysrUrwpVB76qo49EwRXz559/GhsbA2M5ffv2hTVPoVAmTJhw7949Nbuo+jMhhMlkQpmKSqU6OjoCkVVbW3v16tW1tbWK6wrHs2fPlE9aLBb//fffGIb997//BX9CAXLEiBGkNVdB5s+fD/wMHjxYs5qrkpOTQfD4+HiNFw0AzIxPnjxZgR81k5CnDEmxLi6Na65isYT+/jW6us3eMKzS3Jzt6Filpyf5c/bsmrIyfNjAQC5wBf9oNLZAIPrmmzrph+DfRx/VVFUJldFctXBhrXTAOXNqpP2HhUn0S4F/bm7VuAiLigQ+PhzgSqVWOji8LYKVFTsoiNvYKNKI5ioSr+nw8HAwzWppadna2kK7Gy4uLjdv3hQrTZdePiEQyoAk3h4E4SI+OjqawWBs3rwZzl/Q6ezZs5GRkT/88AN0Wrx4sbW19TfffLN3797//ve/8Bbu+vXrORyOvb39wIEDv//++99//3358uVwoXz8+HEYZ25uLqOFYcOG4STeuLg4BoMB9WoMGzaMIcXBgwdbLaBKMUhP2QEBAaampl999dXevXu///57KLcPGDBAdv5NS0sDLxgnJye4uq2trQ0JCQHbNVOnTm1qalKpaVSKs7a2lsFg7Nu3D0pHAQEBDAYDrF8rKioYDMaGDRuka6ChoYHH44HfXl5eINTmzZul6yc1NVU6S1A/zbp169hsydIhOTnZw8MDwzADAwOcWm/ZjhQQEGBpablhw4aIiIhdu3YNHjxYQa2eOHEClNTY2DgkJCQrK4vJZMbGxn7wwQcWFhZbt26VJ/Gqmk8Al8v19PQEASdNmhQbG8tkMjMzM0NCQqhU6nfffUdO4oWLhs8//7ykpAQ8LC8vDw4O1tKSXCHh8/mEEu+lS5f09PR8fHxCQkLCwsKWLFkCv9BHRUXhEgKhzMzMoqOjYcfIz8+H9orDw8NxQWSHM51O19PTW7p06W+//bZ9+3Z7e3uc4AfHiL+/f0FBAXjY0NAAtp7AoorD4ahZFaoOW1VHH4mCK2D//v1AuN29ezc0HFJeXr5u3Tp5XyhU7aLqz4SAjIwM0I1tbW2vXbsmFDbLBnw+PyIiAtzF9fDwqKioUDCKvby8pJOuqqoSq8LEiRPBXjr4U9rqbHp6upoSr5OTE/CzZMkSzUq8oPhWVlagxjRbNNBdwSmMP//8U4E3dZLoPBJvWloT8OPvX1NQIPj/OUR04gTfyqpZLnVxqeJw3hEX4+IaGYx6BqOeSpVIvN9+W0elVu7axcvMbGIyBbGxDRMmSORPT89qLlfUqsR761ZznDt28Agl3oyMJpAiocRbWytycqrCsMqRI6tTUiRzi1AounGjccCA5ucYVlldLdSIxKvqa/qLL74A3latWlVaWgoePnv2bMqUKUAGPnTokDLpdunlEwKhJEji7UEoWMQr0DUPnZycnFxdXaVXSLm5ueDNbWxsvGLFihkzZjQ0NEBXcBUKHKlV3ihL+1sncnR0dHZ2fvPmDXSqr6+HAvmlS5ekQ3E4HLDSMjY2lrXT+PPPP4NQ27ZtUz7DpOM8ffo0cLKxsSkvL4fPm5qaRo8ebWRkRLgno4zZgz/++AP4+fLLL3FOVVVVwCqmpaUli8VSUKsuLi7SHvh8vru7O2GtFhUV9erVq+UAmy5ukSoSif7zn//AY7o4iZd0Pr/66ivYSXCbrsnJyYaGhsCkp0oSL8zMsmXLZF1hO8qTeJ2cnH755Rdpp+PHjwMnDw8PXGwgVGxsrGxCc+fOBYZMpbsE4XCm0WjZ2dnQ6fXr10ZGRrIS79ixY8EhDmlSUlKA4Lpx40aNVIUyw1ad0adSweXR1NQEtmeXLl0q6wrOmuIkXtJdVM2ZkMPhgMPbhoaGubm5OFegNgnDMD8/P1mDNxoxPQJur0jbnxMIBPBAJuHJBeUlXvhywTDszp07mpV4Bw0aBG7PtkXRxGIx1B316tWrNkqis0m8Y8dyBAJ8N0tJadLSag6+cWMdYVgguOroVBoaViYnvyMFCYWimTNrQOpff81V0joRkykglHghhBLvnj0SqRVK7JC8PIGxsSYlXpVe0/v27QN+li9fjnNqaGgYOXIkOM2RkJDQjZdPCITyIIm3B6GmxAuUPeJcFy5cCJz09PTgTg7OqCO49tZpJV4Mw65fv45zjYiIAE7r16+Xfv7999+D54QL/cbGRvD90sjIqLoafzJKHurEuWLFChB2+vTp8OG3334LtHqSe5VyOBwqlQp2n+CWFKGJyO+++05Brd6+fRvnevDgQcJahdfSAgMDZZMDd5NkJV7S+SwuLgbbpzo6OoSLzq+//hoEVF7ihZnR09MjPOvL5/PBnrw8iVfWNrVYLIZrXNwI+uyzz0aPHk2Yk4SEBBCEcAdJuoFOnTqFc12+fLm3tzf8Mycnx8HB4eTJk4QJffDBB0Baw4lM5KpCmWGrzkhRqeDyyMnJATH88MMP8k7DSksj6gwlNWfCbdu2KZaOvL29gYfLly+3hcS7ZcsW2VkI7h6bm5tLfx5VSeK9ePEiPN5CmEN1JF54h/nq1attUTSxWAwOYhB+CNZUEp1H4s3JETg4VJ08+c6kB/ngg+atWktLNqGdYSC4YlhlUBBepgXiq7Z2s6u2duXr18K2k3jnz28+Ea2jUykUEmRyxoyaDpF4W51m79y5A2IYPnx4N14+IRDKg3Q1I5SFRqOBc1bSQMVUEydOtLGxkedaUFCAdVasrKxkLSKOGDEC/JDWsyUWi6ElDCjqS6Orq+vr6ws0ScANWMWoGefevXuBEqBr167t3bsXfJUICQmZP38+FIZV5dixY7W1tRiGTZkyhdB81KxZs8CPI0eOyIvE2tpa1tgVYa0KBIJjx46B3x9//DFhVEC40lQ+jx07JhQKgV1oW1tb2YCE2VAMzMyECRMI1W/o6+v7+fnJXtOFLF26VPYhHEGFhYXSzyMiIpKSkgjjgYfK5HkAmJmZyV5jPnz4cHx8PPzT1dWVyWQSdkuYUEVFBS5v6lcFIZoafcoUXB7wnPmVK1dAF5LG3d09LS1t48aNmh1KJICnrzEMW7BgAaGfRYsWgR9wF1qDiESiyMhIIyMjXEvBSYnNZl+6dKnVeLKzs1f9P4GBgYsWLRo4cOCcOXM4HA6GYV988YVGbB1JA3a/e/XqRTjnqF+0pqYmcD5ZgZo0dZIA+3uEgB4rEonkeRCJ3mpv0hSurtpMpunChfpy5pDmAVVRIS4sVJT04sUEwR0ctL29m0/iCIXYsWNvVdNpHDDoBQIsNrZJ1jU83DgtzYRK1ZjyKiWBc4uPjw/hNDtx4kRw9yQlJUXxu6DrLp8QCJVAEi9CWdzc3GTVipqbm4Mf8MCqNFBBC5iaOyfu7u6y5QKnDcHeGnyYlZUFNCjq6ekRlhfDsCFDhoAfyiyg1Y/TyMjo1KlTQJnQhg0bbt26tWTJEjs7O/iRlQS3b98GP+BVIhzOzs7gmHFJSQlO2lHcW+A3EelaTU9P53K54De8W4sD3HjUVD5hNcpTPkmYecXAzMCXvSwnTpyorq4mVKQsr4yE/RAHh8MpLCzM/X/gR3poVVVecuDktpIIBIKSkpLnz5/DhGCr4RJSvyoI0dToU7Xg0jg7O4M57cmTJ5MmTXrw4IG0q7a2tpubm7QmVY0MJRJkZWWBRqFQKDht+RDYOvHx8U1NBEt5dbh161ZxcfHChQvBbQVI//794WdTYHpHMcXFxeH/T0RExKlTp169euXq6hoYGJiSkrJv3z7STalY4p0+fbq8zqlm0e7duwfGsgJF0OokkZGRYSAH8GExMzNTngegK6vtEAjEJSWi58+FubmSf1yuRH+ytHJmHBQK5uZGrHN41ChJ6yckSOxptQVeXpJUFizg7txZX1n5jnDer5+Wm5uOBtU1KwmcW+S9NLW0tOA7Be73drPlEwKhEsg6EUJZpFWtQuBxU1ktu2BqAz9k90M6D4Q5h0Y4pHMOzzQaGRnJ2xgBpgXA/K5M6urH6ebm9ssvv6xdu7axsXHq1KlaWlpxcXFAMSw5YJaysrJ+//13Qj96enrA4ktWVhZUIUOuVuExQhqNJs+eAeE3bNL5hCkS5hxsQlKpVAVCpiz//vsv+EHauJHyNQbIysras2dPbGwstCeBQ9okjyxK2oFoamo6dOjQ0aNHU1JSGhsblUlI/aogRFOjTx0DGNra2nv37gVHAOLj4ydOnOjg4DBv3ry5c+cS2gLRyFAiAWwCa2trefaE4NHf+vp6JpM5YMAATHMAeYzwmMmKFSvu37+PYdiNGzeKi4sJD1lApkyZcuXKFfinlpaWMrbKSFNSUgJ2wxSIo2oWDdxAHjhw4Pvvv99GSXQ2mprEhw41HD3amJIikDOFYA0NciVeExOKvj6xPNm/v2TPJje3DRcYq1bpHzrUkJUl5PGw776r/9//6qdM0Z07V3f2bL0+fTps00iZaRaO8ezs7G65fEIgVAJJvAhlgeIrCdfODGHOoTpZadhsNvhRXV29du1axdFWVFQok7pG4gwKCrp58+a1a9fASd1x48Ypk3SrWTrZArksKV+r1dXV4AduQ0MawlU76XwqmaJKEi/MjII4FaN8jWEYtm/fvqCgIKFQqK2tPW3aNA8PDxMTE/CtncfjQb3EClBmf7WsrMzX1zc9PR3DMHt7ez8/P1tbWyhyXLp0KTExsS2qghBNjT6VNpZlWbx4ce/evdevX5+bm4thWFFRUVgL1tbWy5cv37BhAzz2oqmhRAJlmgBcAgRUVlZqUOKtrKyMiYmxsLBoamrCbYODL6c6OjpAF1pUVNR3332nICptbW0120slLl68CD7jTp8+vS2KBi4hK5ao1UyiX79+YWFhhDFHR0c/ffq0b9++0gfvpVHVzrMylJWJfH1r09ObJR97ey0/P11bWy341eLSpabExFa2ZxW0f69eEkm4qkquwKw++vqU+HhqcHD9kSMNAkHz8ebr15uuX29avZo3aZLOxo2Gvr5t+BVGI2O8srKyWy6fEAiVQBIvAqEscK1va2srvfNAiJLG3zUV57Rp04DE++DBg+joaBI3UWWztGPHDmA3UgH9+vXD1AOeS1T1IADpfJJOUQFtEac84uLi1qxZg2GYqanp3bt3ccehORyOMhKvMgQEBABxd+XKlQcOHMCdIC0pKSGUeNuoKtpi9JFjxowZ06dPj4uLO378+Llz58BqksVihYSEHDp06MqVK6NHj+6QoaRSE0g7aXbjFFjMqqysnDRpkmKfhw8f3rx5s6o3CNoOcKT5gw8+MDExaYuiPX78GBhcVXCJV80kLC0tg4KCCP2npqY+ffrUyspKnoe2ICCAC8TdlSv1Dxww0tF5J7clJaJWJV4FwC7clhv/zZiaaoWHG//0k+GpU40nTzY+fNicZ7EYu3tXcPduLZ2ud+SIcTsfbFZpjLfpyYguN4EjeixI4kUgVD7AIxAI3NzcOk+c//77b3Bw8IABA/Ly8oDqYy8vL2dnZ9JZevPmDfihqWIqAO6JAW00hNTV1Wkwn+bm5uAksKopKgBmRqWdYXJABb/BwcGEt381QkZGxr1794Ch2r179yp/YbKNqqItRh9pKBTKhBb27dt3586diIgIcFq1oqJi7ty5+fn5wOBtOw8l2bpS0MOlnQiPJpLm8OHD2traBw4ckHfw5/Xr12BzsrCwMC4ubsKECVgngMPh3L17t9UjzeoUDXSSPn36AMsxbZFEpyIjQ3DvXrNw2Ls3Ze9evLirJDye3P1bDkfiZG6u2uliQiGxvr6VjWIrK601awzWrDEoLhZFRzf8+WdDcXHznd6oqEY3N51164ivD7QRcG5RZoxrdoB3gwkc0TNBEi8CoSxQ10tZWRmPxwOL2g6Ps6GhYdGiRTo6Ojdu3Dh8+PCOHTu4XO6iRYsSExPJfdkdMWJERkZGu2nYhrb7qqqq2Gy29KFQyOvXrzWYz2HDhoF7TS9evCD0UFNTo6rECzOTl5eHtTHwshM0MCNNi40NTaYyYsQIwvvV8hJqo6poi9GnPjo6Or4tJCYmfvDBB3w+v7S09ObNm8AqcjsPJdm6qmqBUE00VKNqYWFhb2+vqaT/+eefjIyMWbNmffbZZwq8RUZGgtF36NChjpLZ7t279/vvvwcEBADNsVevXhUIBBQKBRoM03jRwB7y3Llz5W1rd6HaU4aUFIlkOWKEtqEhQZGVmau4XKymRmxiQhD8+XNJ/MOGKbUlCEVuQin69WtlVVXb2moFBxuuXWuwdGndmTPNV5MjIxvaWeJVZpqFY1zBF5Z2o3NO4IgeBdLVjOikqL9w19TSH2JnZzd48GAQswJ1/7NmzbKxsfn111/bJ84NGzZkZGREREQ4OTlt37597NixGIYlJycDi44k6gcev3z48KG8sHFxcTY2No6OjvX19Zh6DBgwAOpfiYuLI/RDWDOk8wntjshekwM8fvwYUxF48Y/woC9gypQpjo6O0NYoaaCmKMIvGgo++WswFQUJqVkV8rplW4w+VcnOzp47d+7ly5dlncaOHbty5UrwG+oS08hQIjGP2dnZDRo0SHHSUBuqn5+fBs8VK9C6JM3y5cvBj7Nnz7bDsQhCXr58efHixWfPnkmLo2PGjAGG6zVetJycHCCcKDjS3IVqTxmgPipdXYriTVrFPH5MfPL5wQPJ8w8+UOrbrqmpJBtgbxaHvPPVW7bwFi+W6KWXRl+fcuCARGwrKdG8YSfFwx9Os9AAOw4+nw8shAO71ppKlzSdYQJH9HCQxIvoXMAvf9IGM65everu7r5s2bL2iUEB33zzDfghzw5kbm7ulStXWCzWzJkz2yHOK1eu/PHHH8uWLQPWNbW1tY8fPw4snf7yyy+3bt1Ssn5mzpzp7u7+5MkTsAXRv39/sFYG6nlkOXDgQFlZmZeXlzztyioRGBgIfoSHh8u6ZmdnP3r0SPY56XwuXLgQ3NPLyMgARcZBwrbTvHnzgM7Mp0+fQi2a0uTk5Ny5c+fVq1etXs9rFVBq8F1D1hWoclUfmEpaWprsVTGRSCTPgAS5qlBm2LbF6FOJioqKixcvxsTEELrCy5/QQJE6Q0nNeWz9+vXgx19//SXrKhQKoSka6FN9+Hz+8ePHrays5Gl+gnzyySdAvQ2fz29Vp1c70NDQEBsbq+BIs/pFAxJ179695e3Kdt3ak0f//pKt17Q0gVCIl6BEInF8vFKXeA8eJFA7n5jYlJXVPC+ZmFAWLlRKcaaxMaVfv2ah98ULUXn5OzKqWCzet49PGCohQXDiRCOhkGxsTAEXTvv21fBautXXNJxmU1JSwGYvjjNnzoCPaHPnzn3vvffUSbczL58QCOVBEi+ic2FpaQl0D0ofZH348GF6erqSygzUj0EBdDod2Fs/ceIEWMFIU1dXt2DBAgzDPv30U1dX17aO882bN59++qmLi8uff/4JHzo4OEBTjUuXLgUW8KSB93th/dTW1t66dSs9PR3oztHW1o6MjNTS0hKLxcuWLZPdejp27NjJkycNDAy2b9+OaYJ169aBl/f169cZDIa0U3V19dKlS6EhX2lI57NXr14hISHg96efforTY3n06NGbN2+qeuZKW1v7r7/+AsvQVatW4QycNjU1gW2ZZcuWQYsRpAFfNzAMCwkJwZkmKikpaXVvX0l8fHzAZldZWRmsLsiuXbvkndQlVxXKDNu2GH0kOHHiBNwYhNTX11+6dAmoE4OHCNQZSmrOY59++umUKVPA3VHZTemdO3eC/caNGzfKs41JgvPnz3M4nKVLl7Z6n6Jv375w30ne8rc9uXXrFrjIIE/iVb9o4BLvzJkz5cXQdWtPHj4+OjRas4RZViYOCcHLk7t28QsKWt8aNTLCbtxoOnr0HaG3vFy0fLnk4snPPxsaGyt7SGHatGbZWCzGvvmGJxBIhPCmJvFXX/H09BRF8v33PNmH5841go+BCxZo2FaFMq9p6WkWZyKupKRk06ZNQGmFPFNA3WP5hECogBjR3YmKiqK3AEy8GBgYgD+PHz8uFovXr19Pp9NnzZoF+oOzszNwzczM3L17N6ETj8cTi8Vbt26l0+nQEM7IkSPpdPr69etBosAnnLZ8fX3pdPqPP/6YkJAAnOzs7ICTv78/cIIZhnqGo6KiiouLL1++DO6hPXjwQMkiK45BcbliYmLodHpAQABwpdFowPXZs2cg8qqqKh8fH/DKWbNmTVJSUklJSUZGxsGDB8EK3tvbm8vlqtRGqsYJKh+Yax87diydTn/8+DFwCgkJodPpYJsXGIin0+khISEwbG5uLjjE6O3tDQ7aLVmyBMOwSZMmSWfp5MmTQHWKq6vrsWPHCgoKiouL79+//8knn1AoFF1d3TNnzkj7V7NW09LS4G3DmTNnRkREnDhxYuvWrX369Bk6dCjU1eTl5QUCcjgccvkEiEQieDLQxsZm69atJ06cCA8Pnz17NlCXCoQ9OFiioqKUacdjx46B1aqnp+fFixdfvXr1/PnzM2fODB06FDysqakBPvPz8wkHAhiV8kYQaMeGhoYxY8aA56ampjt37rx58+bDhw9DQ0NpNJqfnx9hJctrIDhmZbl48SI87+rn53f8+PFHjx7FxMT4+/tTqVQ49qXzRqIqVBr4JEYfiYLLA+6f02i0P/74Izs7m8Vi5ebmnjlzBtyU09HRuXDhAi4UuS6q/kzIZrNBG+no6GzevDkjI6O0tDQpKYlOp4Noly1b1tTUJB1E3uuATqfn5+crSGvv3r10Oh0s0z/44AM6nb579255nr/++ms6ne7p6QnXIQEBAXQ6/ejRoyAt2LX69u0LMwDnCnn8+OOPwKexsTEc2g7yARbmt23bJhaLwWwwZMiQNirauXPnwJ/nzp1royQSEhIU1w9odzc3N7GGcHOrxrBKDKssLRXK83PxYgOF0uwHwyr9/GqOH+c/etQUE9Pg719DpVaOG8cBTr6+NXR6bUhI88sCQqOxMaySRmP//TcfwypnzaoJD68/cYK/ZUsdcMKwyuXLa0UiEfAfFcWn02vp9FoDg2YnA4NK8Ofx43wY5/PnAn19SX5sbav8/Ws++qiGRmP37s3+918BeG5mxgYBr15tEIvFEyZIMjl/fu2tW43FxcI3b4RPnjQFB9eBqLy9OXy+JA84GIx6EHbbtneK1ipKvqbhNDt8+PCLFy8WFxcXFhb+9ddfQCq2tLSECwPl6XLLJwRCSZDE2/2BR0ZxBAUFicVieTtO169fl3f3o7q6uuVtR6Btz8HBASRKGHD06NHyLjGOHj0aZrikpGT48OHSrrq6uqGhocoXWXEMisu1bds2Qtf79+/D+BsaGkJDQ2X1H1pYWGzfvp3Pf/t+VR6V4pSt/JMnTwInwiNzEyZMkA7+xx9/4BSBurm5vXz5EpeltLQ0X19f2Tt+EydOTE5OxnlWv1afP3+OO/GrpaW1YMGC6upq3MYvhmGlpaXk8gkRCoVhYWE4MyR9+/YFEgvuLl9gYKCS7Ziamvrhhx/icmJgYPD1119Lv8jlXWQCo1LeCILtWFtbGxgYiNsLMjY23rFjh6wlQ1DJ8hoIjllCbt26NXDgQFyQcePGZWRk4Gyc4PqY8lWh6sBXdfSRKzghPB7v8OHDEydOJNRc7ePjI299Sa6Lqj8T8vn8X375BYh20jg7O0dHR8v6V3AAISkpSUFCstqefH195XmWd1FW8flq6bmCEGgUSiW2bdsmFApBd9qyZUsbFQ1IEfr6+oQ9XyNJREZGdkKJt2UOaRw4sAr4hP/GjeNkZDQFBXGlH06YIPmOiZN4xWLxuXMNffpIpFzwz8SE/dtv9ULhW1EzMPCd2OC/oKB36vzOnUY7u3fyM3RodUZG86cfXEAggaenN33xBbdfv3dSB//Mzdlbt9bV1xOLu+pIvMq/pgmnWV1d3aVLl7569UrVRLvo8gmBUAaKxq+nIxDqIxaLnz59mp2dXV9fb21t7ePjY21t3c4xtIpIJEpOTs7Ly6uqqqJSqS4uLsOHD1fT8F1bxElIRUVFfHx8aWmpnp7eoEGDvLy85GmvKS8vT0pKAhImjUbz9PTUoOFQWV68ePHPP/9UV1fb2NiMGjUKXolsFXL5bGhoePDgQVFRkYGBgZOT09ixY8E5MTVhsVggMxQKxcHBwcvLS56FT3Vgs9mJiYmvX7/W1dW1t7f39vYG5zg0CxDYMjMzuVyuubn5yJEjVTJ8pVJVKD9s222kEFJXV5eZmZmXl1dTU6Orq2tjYzN8+PBW+xuJLqqReUwkEj19+jQ/P5/D4VhYWAxuQdVIujHQxk9KSkobmfuaNGnS/fv3Z82aBY6+dw/c3TnA1m5pqSmNptXaHCLMzBRyuWJzc8rIkTrOzq0fkbWxqSorE9NolNLS5j1GoVCcmChgMkV8vtjBQXvCBB19fZIa15qaxI8eCfLyms9Uv/++1tixSs0bBQXC7GwhiyXm85t1R7u4aHt4aMtTygUID+evWtV8HHrbNsP//c+w7V7TcJrV1dXt27fvuHHjwOFkcnTR5RMCoRgk8SIQCAQCgeihrFu3LiwszN7evqioqC3iZ7PZVlZWIpHor7/++vTTT7GeIfG+fi18926psjg6amlpUWQlXgzDiopkleh1FqytKb16abUq8TY2ihVfGEYgEG0EsseLQCAQCASih5KUlESj0RYvXtxG8d+/f9/KyopCoXRXDbS//sqnUiVS3JIlemD/duHCuocPlVLFjKO62rR3b2KZcPz42lev2soOkJpERxsvXqzfotm4MTlZIpc/fYqvgYIC0fvvq6sCCoFAkABJvAgEAoFAIHoohMbPNMhHLWDdl9273+ph9vJS6sRyN+by5abwcFK72wgEoi1BEi8CgUAgEAgEQgViY6mNjfhrcYov9CpDVZWouro5WnCAWShsPswM7O5iXYGdOw2//RavT8HUtGtkHoHoxqB7vAgEAoFAIBCIjmfVqjrCPdKgIP2wMIndKQQCgVAVtMeLQCAQCAQCgeh4Zs3S7dOHYKPYywutVxEIBHnQHi8CgUAgEAgEAoFAILonGrA8iUAgEAgEAoFAIBAIRCcESbwIBAKBQCAQCAQCgeieIIkXgUAgEAgEAoFAIBDdEyTxIhAIBAKBQCAQCASie4IkXgQCgUAgEAgEAoFAdE+QxItAIBAIBAKBQCAQiO4Jsm+GIIlYLC4pKeFwOBiG9e7d28bGRktL5Q8oDQ0N5eXlHA6HSqVaWVkZGhpiXY0bN27s2rVL+smpU6doNFrH5QiBUItFixaVlpbCP/38/IKDgzs0RwiNgeYrHKi3IxAIRE8ASbw9mnXr1j169AjDsDNnztjZ2SkTRCwWnzx5MjIyMjExkcvlwud6enoDBgwYNWrUuHHjpk6dqji2jIyMyMjI2NjYZ8+eST/v37//iBEjfH19p02b1q9fP2mnpKSktWvXEsY2c+bMLVu2gN8rVqzIzs4m9BYTE2NjY4NpGi6Xy2QyMQxjsVj19fUYhvH5fI2ngkDIY/r06Ww2G8Owv//+e8CAAYR+wsLCTp48iWFYr169/v777z59+iiIsLiFxsbGkpISDMMcHR3bLO+I9gbNVzhQb29POBzOrFmz0tPTQ0NDP/vsM6yncvTo0aCgoPfff//q1avm5uYdnR0EokeAJN6eS0VFxb59+5qamjAMi4yM3Lp1a6tBWCzWnDlzkpKSMAwbNGjQ5MmT7ezsKBQKi8VKTk6Oi4vLzs7+66+/MAzbu3fvV199JRtDeXn52rVrjx8/jmFYnz59li9f7uDgYGhoyGazMzMz7969e6YFDMMmTpz42WefLV68GAQUCATV1dXglQk+yRsZGQG5uq6uDsbP5XKBt/z8fIFAgGGYvb092DoWiURYG+DfAoZhc+fOvXjxYlsk0bVoaGgAPcTS0nLw4MEdnZ3uXyEpKSllZWUYhvF4PEIPBw4cWLduHYZhBgYGsbGxisVdDMMSEhIwDEtPT3d3d9d4bhFtTW5uLpghPT09jY2Nca5ovsKBent7cvLkyfj4eAzDNmzYICvxKu663Wm237hxY3V1dVJS0t9//x0UFNS+eUQgeipiRE9lz549sBs4OjqKRCLF/puamtzc3DAM09XVPXbsmKyH58+fAw8YhoWEhMh6yMnJAV/Qzc3N//77b9kUORxOcHAwhUIBkdBoNNlIIiMjgauvr6+C3Do4OABvSUlJ4nZhzpw5IEUmkynuwYAdJAzD5syZ09F56REVAo+kpqWlyboePXoUuOrq6l67dk35aNPS0kBAOp2u0fwi2hY6na6gP0DQfCUN6u3tQ1xcHKhnLy8v0l23G8z2kydPBt5u3LjRjrlDIHo0aI+353L48GH4m8lk3r9/f9KkSQr8//XXX+np6RiGbdq06eOPP5b1MGDAgNjYWBcXl9raWlnX169f+/j4VFRUmJmZPXjwYMiQIbJ+TExMQkJCnJycVq1aRbZYCARCwvnz5z/99NNmFYVaWidPnvTz8+voHCEQiJ7L+PHj4+PjMzMzFy1ahPVgYmJijh8/PmDAACj6IhCItgbpau6hPH36NCsra/r06a6uruDJoUOHFAe5cOEC+DF//nx5fvr06UMoDAuFwgULFlRUVGAYtm/fPkJxFxIYGIiW5giEmly/fn3RokXgMH9UVNRHH33U0TlCIBA9HW9v79WrV5uZmWE9GCqVGhgYiMRdBKI9QRJvj97gXdkCeHLu3DlwA1YehYWF4IeRkZECbxMnTpR9ePr06cTERAzD3NzcAgICWs3ehg0bWvWDQCDk8eDBg3nz5oFb+gwGY8mSJR2dIwQCgUAgEIiOAZ1q7onU19efOHHCyspq5syZ1dXVwcHBAoGgoaHh5MmTyhwnzsnJcXZ2lue6sAXcw507d4IfSq68fXx8TExMsI6Gx+Pdvn374cOHQDOQhYWFq6vr+PHjXVxcWg1bU1MTHR2dmZnJ4/GcnJzmzp0LLznLkpOTEx8fn5OTw2azdXV1aTSal5fXtGnT9PX1ZT2npaU1NDTAP62srPr37w8iOX/+PJPJFAqFNjY2I0eOxG3rqZQKiaooLCxksVhA5SmGYWw2+/Hjx9CVQqGMGjVKNuaMjIzr168XFBTweDwLCwsPD49p06ZZW1trsOAKqKmpuXz58j///FNRUaGlpdWnTx93d/fJkydbWVnJC1JbW3vjxo2kpCQWi2VoaGhnZzd58uQxY8bA++dqVoj6PHnyZObMmUAHb2hoaGBgoEaiffTo0ZUrV169ekWlUkePHj1//nx55sS4XO79+/dTU1OLior4fL6JiYmrq+vUqVNbHTjJycl37tzJy8vj8XgmJiYuLi5eXl6jRo0iYfkM6PS6ePHiy5cvDQwM+vfvP3/+fKBHICUlBXwLAFhbWzs5Ocnr7bq6un379p08ebK3t7e2traSfVL5ulJ1FMijqakpJSUFaAeEcUrrYbazs+vbty/p+aqioiI/P1/6iYeHh56eHp/PP3v2bGpqKovFolKpLi4uc+bMkdV4/OzZs9jY2Ly8vJqaGgsLiyFDhkyfPl02P3l5eZWVlfBPMzOzgQMHwj9LS0uLiorgn0ZGRkOHDtVs00NUbUFl6qq6ujoqKiorK8vQ0HDIkCEff/yxtH79xekuAAEAAElEQVSm/Pz8kydP5uXlGRgYjBo1auHChfI+LmvkfaGggLAv4XB2dra0tAS/X7169ebNG2lXGxsbqD5D+Toh3XWVn4dJvzhUmseUnO3lZUaW9pyFSLwHEYiuR0dfJEZ0AH///TeGYf/973/Bn/PmzQOdYcSIEQpCTZ8+HXgbPnx4Y2Oj8slJmyDKzMxUMlRDQwOfz+9AzVUMBgO83SkUSr9+/SwsLGApBg4c+Ntvv+E0b0lrgrl9+3bv3r1xYy0oKEg2laioKPj5QEdHx8HBAS5zLS0tCTWE4VYVdDq9sbFx+fLluOR69+6tTiokqkKxZKWvr4+LNj8/f+rUqcDVzMzMwcFBV1cXWLrasGGDbB8jUXDF/Pnnn2DFqaWl1bdvX1gnFAplwoQJ9+7dkw2yd+9eU1NTDMO0tbUdHBxgVbi5ucn2NFUrRCOaq9LT00EOMQzbvn27RnT58Pl8oOBXGltbW9nhzGKx/P39QTsCHXWOjo5gXYth2OzZs8vKygiTKyoq8vHxAd6oVKqDgwMMZWVlFRQUpNKcw2azCb96BAcHC4VCnPnZwMBA6bDh4eGgt2tpadna2kLPLi4uN2/ebLVPKl9X5EaBPKSNyhKC0yao6nwFJ14Ik8lMTEyUteUbFhYmHZDJZM6cORO2rKOjo4GBARhBq1evrq2tlfaM+1qKU/8TFhYm7erm5qappifX2+VBWFe3b9/Gfca1sLCIi4sDQX744QecJGNra5uTk9MW74tWCyivL0VGRsJoZa0WE77gFNeJ4uQgsoowVZqHSbw4SMxjSs72spkhrK72nIVIvAcRiK4Iknh7IuDgMXybXr16Fc6J6enp8kLt378fevP09FR+Hjxw4AAIpaOjo9KylZD2kXjh2+vzzz8vKSkBD8vLy4ODg+F2E04ghyvIS5cu6enp+fj4hISEhIWFLVmyBC5loqKi/o+98wCL4mgf+NIRpAjIoSKgqMSKGI1EiYpRsaEoseCnOVsiJkaSWDC2aGwk0UhsHGiMJCAabKAGa6I0UQkiLaKAoEiXXo5y3P+R8T/ffrt7x91e4YD39/j4HDtlp7xT3p2Zd4T/CwrVrVu34ODgxsZG9DAzMxPv/fb396cEOXfu3KlTp7777js8vHG5XG1t7SVLlvz00087d+60srKijN8s3sKiKCIjI3k83p49e9DDYcOG8UgcP36cHG1iYiIa0fv06YNlqaqqysfHB32knzJlCk4q64yLAcmzmpragQMHqqurcb7QRT6MEzh8ncZXX31VWlqKHsbHxzs4OKC7fyiGN6UqELlovOnp6fir/Pr162WJlqwDeHh4GBsbf/HFF4cOHdq+fTteduvfvz+lReNQ7u7uWVlZ6GF9fT3aVIJmbBUVFZR3VVVVoaW2UaNGJSQkoIcCgeD69ev4huHy8nIJU15dXT1y5EgUytnZOSIiIjs7Ozk52cfHx8DAYMuWLajEDAwMUEVgrUMoFH722WcooKenZ0FBAXr45MmTSZMmoRnhiRMnyO8KDg7m8XibN28ml5WZmdmGDRsCAgL27duHbyihlxW7ViCK2tpalB1HR0f0xs2bN5Pl7dGjR7L0VxkZGadaQNJOEMSff/6pq6s7ePDgrVu3Hjx4EHcmZI03KSkJlbalpeWff/4pEAiEQiGfzw8ICEALmA4ODiUlJdj/zZs3yU2GovEmJSWhvIjSeFlXPTtpFwW9rC5fvqyjozN16tT9+/f/+OOP+ACngYHBq1evfH19NTQ0Fi9e7Ovru3v3bmznYuDAgZTaZ9GTsxBRJEu7d+/GifTz8+PxeOnp6TjauLg4Ho+3ceNGgiBGjx7N4/FiYmLElEl6ejoq82HDhlE0XmlFV9p+mMXAwaIfk7C3p1cHvayU2QuxGAcBoJ0CGm+nA+0sIt8N0NTUhLcMiendamtrKZt5Bg4cuGPHDjFKMgLvlLa1tZU9/UrQeA8fPozCLlu2jO76/fffi9d4+/Tp88MPP5Cd0P3DaHpHiQ2FioiIoL/Izc0N7dwrLi6mu+IhuU+fPhwOJzU1FTu9evVKT0+PrvGyeAuLopDkeoaKigqk4ejr6z9//lxUtDt27JAx46JobGxEywJLliwRJbGUtoCL4vPPP6f4LysrQ5fcmpmZFRUVtdXtRJcuXbK0tES/x4wZI2O0uJxtbGxsbW3z8vKwU11dHZ62hoeH00ONGTOmqamJEmFCQgL6RLJx40ZRN6XhySUmIyMDrT9IrvHim8Bnz55N2YgRHx/fpUsXTU1NxsvPjh49igIuX76c4lRfXz9q1Ci0phQdHS2mrOzs7MgywOfz8UWvlLKSpRXI8XYiqforcsC+ffuuXbsWKbGIL7/8kqzxVlRUoN2VXbp0IStLCGwKcdq0aZRqarXJiNJ4WVc9O2lvFXIhHzt2jOy0bNky5LRixYpu3bqRvyDX19djvf3q1avyHS+kElGsscfGxjJmcP369dIWi5hrsSQRXdb9sFQDB7t+TPLeXsxtWMrshViMgwDQfgGNt9OxdetWZJmZ/BB/HTQxMamvrxcVNicnB4/9ZHr37r169eq///6bPPvBfPTRR2LmT6qm8VZUVBgYGKBdhYw7MPl8PtoBKErjZbxpEH9TqKysJD//5JNPRo8ezZiS6OhoFOTIkSN0Vzy8EQRx9uxZiuvy5cudnJxkfAu7opBkyN++fTvywzhpaGhoQAtfenp6dD1HqoyLIi0tDcXw3Xff0V3j4+MpIz0uCl1dXbyqwKizbdmypa00XpRChJqamvgll1Yhl/O1a9corgEBAchp3bp15OdpaWnW1tZnzpxhjPPDDz9E81GKNoLMv2tqajJ2IDNmzJBc483NzUVLlJqami9fvqR7WLt2LUo5Re1pVdpv376NAo4YMUJMWd26dYvievz4ccaykqUVyFHjlaq/IgccPHgwRR94+PChvb19cHAw+nPHjh3Ip6hJs5OTE/Jw+fJl2TVe1lXPWtpbBZfVBx98IOawzxdffEFxDQ4OZnyjXMYLyUUUZ3zx4sX0OPl8vqmpqaWlJV0tVJDGK0s/LNXAwa4fk13jVXIvJO04CADtGtB4OxcCgcDS0lJPT49yeopsUiI0NFRMDI2NjYcPHxZloMLGxobH41GmrWgrDrqWQPU1XvyFdfLkyaL8LFy40MjISJTGe/ToUXoQfJKt1SVxTFFRkZjZBh7eunXrJuG+R2nfwq4oWh3ym5ub8c7bf/75h9EPvuMqICBAERlPT09Hkbz33nv06VpTU1NiYuKrV6/oRTFz5kzGCDMyMpCHHj16tJXGi9sg+tGvX7+amhrW0eJy7t69O31i988//yBXNzc3yeNcvXo1CpWZmUl+ji/nvHLlCj1Ubm5uYmIiozJMx8fHB0Xl7OzM6AGbk6GoPbiKJ02axBhQIBBgub137x5jWZmbm9PLChsBIpeVjK1AjhqvtP0VDvjTTz+Jib+5uRkfCBT18eXIkSPIw5QpU2TXeFlXvYKknVxWfn5+FKfm5mZsRogiTkKh8N9//5W205BwvJBcRNEucayAkTefkw2C7Nq1SygNsmi8svTD8hoxxfRjsmu8Su6FpB0HAaBdA7cTdS5u3ryZm5u7YMGCrl27kp/37dsX3yqELi4Shaam5po1a54/fx4ZGfnFF19QbHJmZ2d7enqOHz++tLQUP8TvIltfVFlu3bqFfrz77rui/ISEhJSXl4sycYx3gpFBu63QmomoaCsqKp4/f57+/+CxE09lRL0ObdWTEMnfIntRMJKSkoJscmpra+OtVhTwSbaoqCh5ZZyMra0t2s314MEDZ2fnu3fvkl01NDTs7e3J1kFxUeCTZvQIUSHk5+fje7yUj7u7e0pKCjp5mJGRQbcuw4Lhw4fTzZ9KIs9NTU35+flPnz7FwlZdXc0obLhU58+fv3fvXrK1XoIgevXqZW9vL6G5Ziwwouxg29vb07NDrmK8oZSCuro6btp4pUWSyC0sLOhlJa9WIDus+yu0wVIUKSkpqJbV1NRGjBjB6Ad3LFFRUWQTyuxgXfVykfZWo6U8UVNTw3fS0s34Y1NMVVVV8h0vJBdRtN8eXa/Q0NBANz3l5+enoaGxYsUKQlnIpR+WduCQvB+THSX3QtKOgwDQroHbiToXSJtlHKJWrFhx584dgiCuX7+em5uLDwQyoqam9kELhw4dSk1NvXjxYnBwMN6mFR0d7eHhcf36dfQnvs9AzOCtOuCP6/QLNiQE55cMMk9KEIRAIKA4paSkHDx4MCIiAl9sQIF88QAdCa8wYfEW2YuCEbyTSk9PDx/KooA/SKekpIiKR6q7WyhoaGgcOnQIraFFRUVNmDDB2tp6zpw5bm5ujNc/4DSnpKT8/PPPjHFqa2ujMkxJSRF15YlCmTJlyunTp7W1tU+ePIn2ix45cmTu3LnOzs6yRCutPDc2Np44ceK3335LSEhoaGiQRNg8PT1PnDiRkpJSW1u7ZcuWb7/9dtKkSW5ubrNmzcLKhoQ8ffoU/RBVBTo6OgYGBnTVRRJpxztHUlNTZSwrebUC2ZG2fiVsgLg8zc3NcWyiyrOuri47OxtbKWMH66qXS2mIh2zfHoNMAXdpgeKEzQLLfbyQNoOfffYZsj3p5+f39ddfY1UqOTk5NjbW3d1d2hYqC3LphyUcOFj0Y7Kj5F5I2nEQANo1oPF2Il6/fn3p0iVTU9PGxkbKxzw0JGtqaqKdLYGBgVu2bJEw2sEtbN269caNG2vWrHn27BlBEDdu3IiNjR0zZgzaXYl85ubmCoXCVr+yty14dZqyDC45eLJCRtQK1dGjR728vAQCgYaGxtSpUx0cHAwNDVER1dbWYvOSYpBkfZXdW2QvCvHRlpeXI1M3YigpKRHlJNXCMp1FixYZGRmtW7cO7ezKycnxbcHc3Hz58uUbNmwwMTGhp/lMC6zTrFB8fHyQ7I0dO/bzzz9HG+SWLl2akpJCPuKrUHkuLCx0cXF5/PgxQRBWVlbTpk2ztLTEl3yEh4fHxsbSQ+no6ERFRXl7e588ebKphWstrF692tnZeePGjS4uLhKmtry8vFWh1dXVpas9kkg7LkbKKjSLspJXK5AdqepX8gYoVXmiIpVR42Vd9XIpDfEwRtuqkyLGC2kzOGTIkDFjxsTGxmZmZt66dWvy5MnoObLxi/f3Kge59MOSDBzs+jHZUXIvJO04CADtGtB4OxHoPoPXr1+3uubzyy+/bN68WVrVdMqUKZGRkQMGDEBruTdv3kQaLzLzQBBETU3NixcvxFxSrwrg/U6sP+dLTmRk5Jo1awiCMDY2/uuvvyjbCysqKiSZwSjuLQoqCjxvsLS0vHLlinjPCv3MPGPGjOnTp0dGRp4+ffr8+fNoAlFUVOTj43PixIkrV66MHj2akuY9e/YgQ0pi6NWrF9EWkOc0Pj4+ly9fftHC119/jc2WKBoPDw80TVy5cqWfnx9l92B+fr6omaKxsbG/v//u3bvPnj175syZmJgYdF38Xy1wudyTJ09KoniwFlpJAmInLA8doBUoCKnKUy5Fqsyuu01QznhBZ/Xq1ajZHjt2DGm81dXVQUFB/fr1w9csKQel9cOs+zEZUXIvJO04CADtGtB4OxG//PKLhoaGn5+fqI/Kr169Qku76Jju+PHjya5paWmvXr0aM2YMuiyEEQsLiwULFpw4cQLFhh6OGDHCwsIC3TL/999/L126tNWkNjc3o2NdGhoarM9qssPMzCwvL0+WI1uSgw1Lent7M56ma9u3KKgo8J6rpqYm+gE2JaOmpja+haNHj96+fTsgIODChQtofcDNzS0zMxPdGoqLwszMrM3TLAldu3Y9ceLElClTkGH2uXPnTps2TdEvTUpK+vvvv9HNlocOHWLRcrt3776mhdzc3ODg4CNHjuTm5qKLYe3t7fEVkWIwMTFBuz0rKipE+ampqaE/xFUsJiB2Ytw32H5bgSLAGZSkPEUVKeO8v66uTr5V315QznhBZ968eV5eXqWlpeHh4a9everVq1dwcHB1dfXq1auVvGNLOf2w7P0Ya5TcC0k7DgJAuwYsV3UW/vnnn6SkpOnTp3/yySdcEWzevBnvK0NaK5lDhw5NmTKFbAGfEVtbW/QDd5Hq6uqbNm1Cv1vdiYTw8fHRbeHy5cuEcsHGVLDVR8WBz+nhWzrIYJOkbfUWBRUFjrawsLC2tpZQDTQ1NV1cXM6fPx8TE4OOPBUUFNy4cYOS5qysLKKdMHnyZPx1acWKFXjPp+LAkvbuu+/SjyZKJdKWlpbe3t4ZGRno4iKCIOiGcxjB16eh4xV0KisrGdUeSaQd27QXb7Sp/bYCOYIzWNaC+PI0NTW1srLCz7GOwVgy+FuqvKq+vaCc8YKOjo4Ouj24ubkZTQyOHTumo6ODTSsrDeX0w3Lsx6RFyb2QtOMgALRrQOPtLIixWUVm+fLl6Me5c+cYV/bwPQ2tHp7Bqi+yTIMsMVy/fj0uLk58DHw+H5nKsLS0xJdkKI3p06ejH2K2LU2aNMnGxkbCKbgYsN0Lxu1JYr7yKuctMhaFqGlB7969Bw8ejDyIEQZXV1cLC4sff/yRUACpqalubm6M31PGjBmzcuVK9BvbhsE76NBuW0YiIyMtLCxsbGxErUEpbp4kioMHDyITnfn5+V988YWiXyde0sQI29atWxctWkR/rqOjg7oCcl2IB5+hoJsqQOArakRJO77XlAKfz0cXVKKr0QjZUEIrUL68kendu/egQYPEtxpsXXnatGnk1UJjY2P0A63wUxDVHbGu+vaCcsYLRjw9PdGPgICAqKiopKSkefPmMZrjkguiRFcu/bDi+jHZW5+SeyFpx0EAaNeAxtsp4PP5p0+f7t69O+5PRfHxxx+jw3J8Pp9xPdbf31/MCZPGxsawsDC0SYZ8zEZHR+fSpUto1bfV5SZvb2800Tlw4IC8TqpIzpw5c5By/vDhQ2w4kUxaWtrt27dfvnwpowlcdCkU+oHHMDLIdLbssH4Lu6LAa/vk60auXr06fPhwtFBAEMT69etFbSVApKenX7lypaioSEGfPEpKSsLCwi5dusToamhoiH7gixnc3NxQMcbExOA7DCn4+fkVFhY6OjpSlgUkKRD0KX3Tpk3btm0TtSDGAmNjY6wxBgUFicqvvMCShq7Ppbg2NzeLumUnOjo6JCSEUb3R19dHp1glvCRjwYIFqPqSkpIePHhA9xAQECBe2hMSEpKSkugeQkND0Rzazc0NW+OTBQW1AkZ5mzlz5vDhwxkLRHGsW7cO/fj111/prgKBAF3oSvaJ0NfXR4cwnz17hu5wwpDvLJVX1bcXlDNeMNKvX79JkyYRBJGXl7dkyRJkw1nub2lVdGXph5XQj0ne24tCyb2QtOMg4vr169+3oFAb8gAgd0Dj7RRcuHChoqJiyZIlrSqQPXv2xB8OGedhaWlpy5cvZzTKX19fv2rVKrQbZ8WKFXjYQNjb2589e7ZLly5paWmTJk3CN0mQ4fP5X3755aFDhwiCWLNmzfz58wmlo6Gh8euvvyK139PTk3JLZGNjI1oGX7ZsmewmuBYuXIh++Pj4UD6j5ufnb926Vcb4ZXwLu6IwMzNDdibJmw9jYmIeP36MDfBwuVx0xDQkJOTixYuU99bU1KCqX7p06cCBAwmFERISgq/UwtTV1YWHhyN1Ea8aaWhonDp1Sl1dXSgULlu2jL56EBQUdObMGV1d3Z07d1KcJCkQ9HX/+++/3717N97HKxfc3NxwhJ9++qlCrf6OGzeOw+Ggnbo+Pj4U13379onfi7h9+3b6w/Pnz6NJp4S9QdeuXfGrly5dSjFn+ttvv924cYPxTBpF2ildXH5+PjqaYWJiIuoyIWlRUCvAm2uwvFVVVd28efPx48dKtqm2dOlSpCZduHCBvo60d+9eNFhs3LiRfl3t1KlTkX67fv36pqYm9LCxsfGLL74QZYeCddW3F5QzXogCm2XOyckZOnTo+++/L/dXtCq6svTDyunHJOztRaH8XkiqcRARHBy8qQW5X0cMAIpFCHRoDh06xOVy0UDy4YcfcrncAwcOiPK8du1aLpdLvvrcw8ODy+VGR0cLhULyN10rK6stW7aEh4fHtRAeHr5161as9sycOZPP5zO+IiEhASVGW1t7/vz5gYGBf//99/3798PDw7/55hs0qqmrq2/btq25uZkcMDk5GR02Hjt2LHpLz5490ZMTJ05gb7t27UIPsXmt6dOnoyclJSWSl1tQUBD6OjBy5MiwsLCXL18+ffo0NDR06NCh6GFlZSXymZmZieLv3bs3eqO7uzuXyz19+jTygFzxnNXFxYXL5fr4+AiFwvr6ejxvMDY23rt3740bN2JiYvbv38/hcLCpIQ6HgyJ58uSJUCg8cOAAl8t1dXVFrra2tsh13bp1jHlh9xYWRYFB9/shg0O5ubmXL1/u1q0b2m2I/ZSVlY0bNw6N8WvWrImLi8vPz09KSjp+/DgSJCcnp+rqanK00mZcDHg9hMPhHD58ODU1taioKD09PTQ0FB2O0tTUvHjxIiXUmTNn0Gx74MCBQUFBWVlZubm5d+7c+fjjj9XU1LS0tEJDQxlf12qBkO971NfXlyovaHKGViQYPRQWFuIbJtzd3VuNUFQ519bWCoXCS5cucblcDw8PRrEJCwvD21OnTZt2+vTpe/fuXbp0yd3d3cDAADdecisQCoXYSN68efNu3ryZm5ubl5f34MEDb29vdJWIk5OTqC6FTnNzMz6dYWFhsW3btpCQEH9//1mzZqHpGioxDodDD4ulfcSIEWFhYbm5uc+fP//1119R12RmZnb//n15lRW7VtAq6enpqAqcnJzS0tIyMjIWL15MEISzs7Ms/ZWogHiAYKS0tBRVuqam5ubNm5OSkgoKCuLi4vAR0GXLljU2NtIDPn36FN8iY2lp6e7uPnfuXA6HY2RkhPebdOvWDSXg6tWrrKtexhpkRHwhJyQkkAcpLS0tcjGKemNycrJ8xwtpM9jY2Iiv3j127JhUMikUCqOjoxnLZNeuXRKKLut+mMXAwa4fk6S3X7duHWNikpOTld8LsRsH0Xc6giBevHghrRgAQBsCGm8HZ/bs2XgmjfvoVqfOFE6dOoUGvBs3bqxateqdd95h9EYQxOjRo4OCgsQnqaGhwd/fn9HQoq6u7sKFC5OSkuihrl27JuqlXC4XexNjRj87O1uqonv06BG+e5CcwrVr15LnoKLO4Hl5eSEPjK7jx49HrlVVVatWraKsvevr6+/Zs4e+HHfnzh2hUCjq9I61tbWovLB4C4uiwOTn548YMYLsWUtLa//+/RRv9fX1+/fvpxucNDU13blzJ13DYZFxUdTW1v7yyy8TJkxgtMM5btw4ypQCk5iY6OLiQrdQOmHChPj4eFGvk6RA8M5VsjzLReNFUyj86pCQEPERiirn8vJyoVC4Y8cORlcsNjdv3hwwYADFdezYsUlJSV5eXoyt4PHjx5999hnjCqSJicm2bdvq6uqkKhOBQODr64t35SF69uyJZm/m5uZII2IMyyjtWlpaS5YsefnypXzLikUrkITDhw9TFkLt7e3R9JR1fyXmsDEaIETB5/N/+OEH+plPW1vb4OBgMQFv376NtSPE0KFD0ehAiYqsckhb9bLXIB3xhSxqEykqRlFvvHbtmnzHCxYZ3LZtG3od/Stnq4gyezF69GgJRZd1P8xu4GDRj0nS24vaGobqV8m9EItxsKmpCbXloUOHiq1wAFA51NrWuAXQTikrK0tPT8/Ozq6srGxqajIwMOjZs6e9vb1U5vLz8vIeP35cWFhYV1dnZGTUr1+/YcOGIfOAqkNRUVFcXFxBQYGampq1tbWjoyNlLiUXSktLY2NjX716paWlZWVl5eTkpIhykPEtUhWFUCh8+PBhampqXV2dubn5uHHj0FyTTnNzc3x8fEZGRllZmYGBgZ2d3YgRI5R2frumpiY5OTkjI6OyslJLS8vCwmLEiBGtbv4sLi5GRYEUzpEjR7YapNUCaWxsvHDhgra29uzZsyW5eFaVQVPS5OTk6upqExOTUaNGke3YiSErKwutM/D5fENDQzs7OwcHB9bCUF9ff/fu3ZycHF1d3T59+owZMwYVbNeuXWtqauzs7Oh7+ejSrqWl1bNnz7Fjx6LNigpC7q2gpKQkKiqqoKBAW1t70KBBjo6OSr5IhkJzc/PDhw8zMzMrKipMTU0Ht9BqqMbGxnv37qHNz++88w664F3RVa/6KGe8oBMeHj579uxPP/3U399fcW+RXHRZ9MPK6cckH/7Eo7ReSPJx8Nq1a2g3gb+//6effqqIxACAggCNFwAAAOgslJeXo02GkydPhls3OhVQ9TLy0UcfnT9//tGjR/Rz10BngM/nDxs27NmzZ0OGDImPj8fnDgCgXdC+VxIAAAAAgExMTMzSpUtzcnJEuaIfEyZMUG66AIUDVa84ioqKwsLCRo8eDepu56SqqmratGnPnj3r0aNHeHg4qLtAuwM0XgAAAKDjkJGRERgYiG++oXDw4EF0X1qrl5MD7Q6oejmydOlSdNcg4ujRo01NTdhiM9DZqK+vLykpee+99+7fv9+nT5+2Tg4ASA1ovAAAAEBHY9euXZQbcWpra9esWXP79m2CIHx9fUUZ6gPaO1D1ciEwMPCHH35Ad4M9e/bs4MGDvXr1wiZ/gc6GmZlZdHR0bGwsxZ4cALQXGOyzAQAAAEA7xdDQUE1NraGhYdasWYMHDx46dKixsXFBQUFkZGRpaamOjo6vr6+np2dbJxOQP1D18iU2NtbOzs7GxubevXt1dXVBQUGiLkMGOgNGRkZtnQQAYA9YrgIAAAA6FLm5uVeuXImOjv7333+LioqQNXgbG5uJEyeuXLkSlvg6MFD18uLzzz9/8OBBXl6epqbmoEGDNmzYMHHixLZOFAAAAEtA4wUAAAAAAAAAAAA6JnCOFwAAAAAAAAAAAOiYgMYLAAAAAAAAAAAAdExA4wUAAAAAAAAAAAA6JqDxAgAAAAAAAAAAAB0T0HgBAAAAAAAAAACAjgncxwuoBAsXLiwoKMB/Tps2zdvbm2hvHD16NDQ0FP9pYmJy4cIFQsUoKyubM2cO+cm6detcXV3R74MHD4aFhal4FjoGjx49+uOPP1JTU+vq6rp3725jYzNp0iQnJydZbrzsGO0IUH0EAkFRUVF5eXn37t1NTU3V1NSIjoj43pJCbW3tmTNn7ty5U1BQoKura2FhMXLkSBcXF2tra6JjAcMEoFJ0nqYHyIQQAFSAsWPHWltb9+jRA4kll8sVtkO+++476xbU1d/snuBwOBQPgYGBxsbGjo6Or1+/VkJ6ysvLP/jgA0NDw4CAAPywuLgYJdLExASVNo/Hw66bN28WnwVFo+QiaivWrl2LCt/c3HzUqFFmZmboT19fX1mi7RjtSMXpJCIqiszMzKVLlxoYGOBZRI8ePdatW1dWVtbxClN8b0kmMTHR0tKSIAgtLa0hLaAu1MjIqF2XACNtPkwAgOxND+hsgMYLqBCJiYkdY6bO4XAY5wHoueyKjVAofPLkyZ0WqqurRfnh8XjodYxdP3ZlnMOJygJr+Hw+SnBKSooYb3IsIpXFz88P5XHfvn3oSUNDw8cff9xqriUsww7TjlSTziCioggPD9fX12f8em5paSleLKUtTAmlXTmI7y35fL6VlRVBEAMGDHj+/Dl6mJCQoKen1+q0u12Lk9yHCUB2VKrhKBpZmh7Q2YBzvACgPAYPHox+DBw4UMao9u3bN6GFjIwMUX4GDRokr9fJTkFBAUrwli1blFNEKsuBAwcIgrCystq0aRN6oqWl9e2338qrDAGF0hlElJGkpKQFCxbU1NQQBDFs2LCDBw+eOXNm165daIElNzd35syZZWVl8irMdiTt58+ff/HiBUEQmzZtsrGxQQ8dHBzmzp3bathOK06AgmhHDadtmx7Q2YBzvACgPC5dunT69On+/ftPnDhRCa/74IMPoqKikpOTFy5cSLQTlFxEyqe4uBh9pLC3tyc/79u3b0FBAXmzKKCadHgRFcX69evr6uoIgpg9e3ZoaKiWlhZ6/tlnn40fPz4lJSU7O3v//v179uzpbIUZFRWFfgwfPpz83M/PD33e6vAlAADtrukBnQ3QeAFAeRgYGKxatUqZb3RqgWg/KL+IlExRURH6YWRkRHHC+xsBVabDiygjSUlJN2/eJAhCV1f3xIkTWN1Fhot4PB7qZw4dOrRt2zZdXd1OVZjFxcWMjbprC52hBACg3TU9oLMBu5oBAACUR1NTE/qhoaHR1mkBAEm5fPky+jFr1ixsaA0zduzY/v37EwRRXV39999/E50MaNQA0CZA0wMkB9Z4Ox1VVVXXr1+Pi4srKirq0qVL7969J06c+P7774u5XqK6uvrOnTuPHj3Kycnh8/mGhoYDBw6cMmWKnZ2dJG988uRJRERERkZGRUWFvr6+tbX18OHDJ0yYoKen12rYe/fuXbly5eXLlwYGBqNHj543b16XLl2kzLGs6RdDQkJCWFjYixcvdHV1+/btO2/ePHyShEJiYmJ9fT3+s3v37n379qV7i4+Pv337dkZGRm1traGhoZ2dnaOj43vvvYdsDxIE0djYmJCQQP60mZSUxOfzcQy9e/fu2bNnSUlJZmYmOWYHBwdZrr2hkJaWFhUVlZaWVlpaqqWlxeFwHB0dp06dqqOjQ/f8/PnzoqKi/Px89Gdpaen9+/exq5qa2nvvvSd5EaGrCG7duhUTE1NYWKilpdWzZ8+JEyc6OTnRxzxRccpFrijiXVlZaWpqOmTIkOnTp/fs2ZPuEyXm6dOn6M/i4mJyOdjb24tZGZOwDEUhVX5ZdBGiEoz/1NLSGjFiBHp+7ty5rKwsZHFk9uzZ6DlGlOjy+fxz5849evSoqKjIwMDAzs5u9uzZ9OaWlJR07dq1rKys2tpaU1NTBweHqVOnmpubk/3gRkTB1tYW63IvX77My8sju1pYWJSVlclXRPl8/uPHj8lPhg4dSu4Y4+PjBQIB/nPAgAHdunWjvKuysvLy5cv//PNPSUmJurp6jx49hg8fPnHixO7duxPyAy3wEgQxbtw4Rg8ffPDBs2fPCIK4cePGtGnTWo1QTHuXVtpZlIBchBzLamlpKXry6NEjfD2Yqalpv3792JWALFlT/jgo+zBB6S4QOjo6eKuqUCh88OABxcPIkSPJDUryOpWxkxFD245N7IYJCYcw1l26IkpPxqYHdFLa2nQWoFQOHTpkbGyMvodZW1ubmpoiMbC3t4+Li6P7Lyoqcnd3xxvYTExMbGxssOI0a9aswsJCMa97/vz5zJkzkeeuXbtaW1trar79yKKjo7Nw4cLk5GRRNmb5fL67uztFXC0tLSlBxCNj+sVQWlrKaBrB29tbIBDQLVhS7oWjG9HNycnBU0kDAwNra2uczu7du3t5eTU0NAiFQvJtq4z4+PgIhcJTp05RnmdnZ8vFVnNgYKCtrS0KqKmpaW1tjdUJMzOzoKAgelTi9+zp6OhIWEQIf39/pJaoq6tbWlrincB2dnY3btygeKbHKRe5QmRnZ2PxNjAwsLGxQSqrhobG6tWrq6qqxCeGwpMnT8S8S8IylL0dSdtFSJhgDofT1NS0fv16euLnzp1LvtiGUXRjY2PpW74ptm0zMzOnTJmCnLp162ZtbY0avra29oYNG1DzQYhqRKdOncJ+6PcYe3l5yV1Enzx5QnlLYmIi2QNlq96lS5co7zpy5Agynqyurt6zZ0/cGNXU1MaPH//3338L5QSO+e7du4wefH19kYepU6dKEqGYwpRK2lmUAAshZ+wt6bJKZsGCBaxLgHXWlDwOymuYYKxxa2tr7IH8VRdTXl7Ork5ZdzLiafOxSaqGI+0QxrpLV0Tpydj0gM4JaLydiE8++QR1B1999VVpaSl6GB8f7+DggE5nXb9+nRIET53d3d2zsrLQw/r6+pCQEPSN2c7OrqKigvF1iYmJaJDr1avXlStXBAKBUChsamq6devWkCFDULTe3t6Mr+NyuR4eHsbGxl988cWhQ4e2b98+YMAA5NS/f3/y5FU8sqRfDNXV1SNHjkQxOzs7R0REZGdnJycn+/j4GBgYbNmyhT4PCA4O5vF4mzdvxhkkR1hVVdWnTx+CIEaNGpWQkIAeCgSC69evo72CeHSvra3lteDo6Iieb968mUfi0aNHQqEwPT0d/Tls2DD5aryzZ89GGkVwcHBjYyN6mJmZ6eHhgWLz9/enBImMjOTxeNiezbBhw8gJPn78uCRFhPjss8+Qq6enZ0FBAXr45MmTSZMmoZHyxIkTZP/0OD08PMzMzDZs2BAQELBv3z5sKFUquRIKhUlJSaiILC0t//zzTyTefD4/ICAArdE5ODiUlJSISYyjoyO5HMRPESQsQxnbEYsuQnyCeTwessXF4XC++eYbAwODffv2JScnZ2dnR0REjB8/Hr1u5MiR+JKtjIyMUy2glxIE8eeff+rq6g4ePHjr1q0HDx7EkkaejCYmJqLZUp8+fbAmUFVV5ePjg1Z4pkyZgsUVNaLdu3ejeAwMDPz8/Hg8Xnp6Oo4wLi6Ox+Nt3LiRIIjRo0fzeLyYmBi5i2hZWRmlOVM03pMnT/J4vBkzZjBqvMeOHUP6z4EDB3ABFhcXf/XVV8i/l5eXUB5UVlbi2WRGRgajnz/++AN5sLW1lSROMYUpubSzKAF2Qs7YW9K72T179uB03rx5k3UJyLdyFTQOynGYQDU+evRo5Orh4cHj8YKDg7GHpqYmVKroAoLdu3fzeLz6+np2dcqukxGPKoxNUg0T0g5hrLt0RZSejE0P6JyAxttZOHz4MOoXPv/8c4pTWVlZjx490MfXoqIi+kg5ZsyYpqYmSqiEhAS01Xbjxo3011VUVCAVrkuXLvTFK/xGURqvjY2Nra1tXl4edqqrq8NdW3h4uIS5Zp1+8XzxxRcoJbNnz25ubiY7xcfHd+nSBS1l0+cBoi5KPXjwIHqOpyOYjIwM9Jmf/D1bKBRyuVzGKTLjzEPuGm9ERAQ9iJubG0EQenp6xcXFdNfs7GxcaOzukj169ChyWr58OcWpvr5+1KhR6ON0dHS0qDhtbGzs7OzIQs7n8/HGOcnlqqKiAu1A69KlC1lNQly8eBFFOG3aNIp4yHhZrrRlKFU7YtdFtAoSJE1NzS5dusTHx5OdBAIBXmFYu3atKNHt27fv2rVr0YQM8eWXX5Ino7i30dfXx1cyYr7//nsUz44dOyhOeL4bGxvLmHi0gnH58mVFi6j45rxjxw66xtvY2IgWspYsWUIP4unpKUeNNysrCyWA3hFh8PFdqa7BFFOYrUo7ixJgLeTie0sx3Sy7EpBv5SpoHJT7MBEWFoaKYvLkyYyve/36tY6OjoODg7w6Lsk7GfGoztgk4TAhyxDGukuXe+nJ2PSAzgZovJ2CiooK9FlOV1cXfwFl1Li2bNlCfp6WlmZtbX3mzBnGaD/88EM0ltD7xO3bt6MIRY3KaBoqSuMlCOLatWuUIAEBAchp3bp1kuWbffrFkJubi06VaGpqvnz5ku5h7dq1KJ2Sa7zz5s1DEZJHXAxa4VERjfeTTz4ZPXo047uio6NRhEeOHJG7xotlWFtbm3EP3u3bt1HAESNGiIqTIIhbt25RXI8fPy6tXGENRJR4Y/vYFGVJyRqv5O2IdRfRKnhzGmNZZWdno9akoaHx6tUrRtEdPHgwZab+8OFDe3t7vASEexvGWXtDQwNa/tXT06M0IlwUixcvpgfk8/mmpqa9e/emtEpFiCgLjTctLQ09/O677+hB4uPj5ajxJicnY4ni8/mMfu7du4c8aGhoKEfjlbYEZBFyJWu88q1cRYyDihgmmpqa0N3OBEE8e/aMHnb//v0EQZDXKmXsuCTvZMSgUmOThMOELEMY6y5d7qUHGi8gFWCruVMQFBRUVVVFEMSkSZPohk8IgnB1dUU/Tp48SX4+cODA7OzsBQsWMEaLdkiWlJQ8f/6c/FwoFPr5+aHfosJOnTrVyMhIlEmG7t274yN5mHfffRf9oNicEAO79IsnKCgI2ZL54IMP8PBM5j//+Q8hJWiEaGpqioiIoLv6+/snJiaqyE2tAQEBcXFxjE54x6woD3KR4XHjxlEMESEmTJiAduglJCSISoC5uTn90ktp5QpvOCQIYv78+Yx+8AXIeP2hTZC8HbHuIiRn0aJF9IfW1tZoaiUQCIKCghgDrlixgmK5ZOTIkYmJiSjCVnsbLS0tFxcXZBYF77zFSTI0NCQI4o8//nj9+jUlYGho6OvXr1etWoXtxilBRCUHlwk6M0JxHT58eGJiItqVLTvoGl6EKAN4+LlAIGhsbCQUj7QloAQhlxfyrVxFjIOKGCY0NDQ+/fRT9Bt/YsCg7w4GBgZ4y7Ec61R8J9NexiYJkdcQxrpLb8NuE+jMgMbbKbh16xb6gU+LUbC1tUXmE/Pz80UNe01NTfn5+U+fPk3/f6qrq5ETxcpiSkoKsiSspqaG9w1SGDZsWHl5+bfffsvoOnz4cLp9RbQ9CZmvJKRH8vRLeOO5KOu49vb2Uhn8JNfL/Pnz9+7dS5l89+rVy97eXsJptzKpqKh4/vw5Lk/8aVmq8pRWhvEJagrq6upY2PBXYUmqxsLCQiq5SklJQRlUU1MTZZQSz1SioqKUM/uXsR3JpYsQg5qamr29PaMTbkd48YcC2tUmCtzbaGtr402AFLDhANx4Efr6+kuWLCEIoqGhgW4Kxc/PT1NTc8WKFYQSRVRybG1t0cbXBw8eODs73717l+yqoaFhb2/PaDOcBWTjuvg6EArk59hCoUKRtgQULeRyRHGVK69xUEHDxMqVK5Hm+euvv5JNGaMmk5GRsWTJEnTMR751Kr6TaS9jk4TIZQiTpUtvw24T6MzA7USdArxFKiUl5eeff2b0o62tjQaYlJQUdCgO0djYeOLEid9++y0hIaGhoYExLGVk+vfff9EPc3NzMReuiIF+3yPatoR+0L95i4FF+sWDb5chlxIZHR0dAwMDqYYoT0/PEydOpKSk1NbWbtmy5dtvv500aZKbm9usWbOwfqI6pKSkHDx4MCIiAt+CIEt5SggWKjF3RWDrl6mpqYqTK0nEG6ekrq4uOzsbmx9TMpLnV5YuQhIMDQ0Zb65CJ+jQj/T0dEYPjB/+6SnX09MTtRyB7yJKSUmhOK1evRqdIvPz8/v666/xpDM5OTk2Nvajjz7Ck07liKjkaGhoHDp0CO0oiYqKmjBhgrW19Zw5c9zc3Bjv85AF8oVJ9fX12OovGWxNV1tbW9pPfsopAUULuRyRe+XKfRxU0DDRo0eP2bNnX7hwobS0NDQ0dPHixdgJLUuuXr1aEXUqvpNpL2OThMhlCJOlS2/DbhPozIDG2ynAV5adaUG855KSEvy7sLDQxcUF3RhpZWU1bdo0S0tLPN0JDw+PjY0V87quXbuySzDjxjkWi5zs0i+e8vLyVnOnq6srlcaro6MTFRXl7e198uTJphautbB69WpnZ+eNGzeibZmqwNGjR728vAQCgYaGxtSpUx0cHAwNDdEEt7a29rvvvlPQeyURKrzxm75DVY5yJVVKUGLaSuOVPL+suwgJETU3IhdjWVmZtGHJKS8vL0fGZqRK+eDBg52cnKKjozMzM2/dujV58mTy9BpbEFWaiErFokWLjIyM1q1bh2aWOTk5vi2Ym5svX758w4YNJiYmsr+FIAh07wuirKyMMYO4Y5RFeVBoCShayOWLHCtXEeOg4oaJ1atXX7hwAbVBrPHm5eWFh4ePHTsW79eQb52K72Tay9ikzCFMli69bbtNoNMCGm+nAI9te/bswRddiKJXr174t4eHBxomV65cifb4kX3m5+czjpTYm3w/TLKAXfrFo6DcGRsb+/v77969++zZs2fOnImJiUHnbf5qgcvlnjx5ss03NkdGRq5Zswal9q+//qJsWa+oqFCcxitJsWMnxjWoNkmJohPT5l2E7MhYaziUpaXllStXxHtmXBz77LPP0O67Y8eOIY23uro6KCjIzs7O2dlZFUS0ublZlNOMGTOmT58eGRl5+vTp8+fPoxlhUVGRj4/PiRMnrly5gm98kQUzMzMDAwN03C4vL6937950P3gpT15bqSVE8hJoQyFnh7wqVxHjoOKGiQ8//LBfv34ZGRn37t1LSkpCtuWPHz8uEAgoC7wqUqeqMzapyBAmVWbbXekB7RfQeDsFZmZmeXl56Ieooxd0kpKS0IUTRkZGhw4dkvxoFt6fI9/DJ9LCOv3iMTExQXO7iooKUX5qamrYRd69e/c1LeTm5gYHBx85ciQ3N5cgiMDAQHt7e3wTY1uB7V56e3uLOqGtaBkWU+zYiXGHmBxTQnmdmJQoOjFt20VITm1tbatlxW5BEhdvU1MTu5S7u7ubmZmVlJSEh4e/evWqV69ewcHB1dXV9Om1EkSUcdpHNhxFR01NbXwLR48evX37dkBAAFoiKykpcXNzy8zMJO9JZs2AAQP++ecftFORUdHCuxOHDh1KKBcJS0DRQq4IZK9cBY2Dihsm1NTUPD090cVgfi0IBIKAgABTU9OPPvqI4lkV6lR1xiZlDmHy6tLbXekB7ReVs4UDKAJshIB8rWKr4MNv7777LqNR5TfXW4l9XWlpqZheTNGwTr948HWmz549Y/RQWVnJWuPFWFpaent7Z2RkoIuLCIKgW9ZpwyLFVxfIXp4SgoUqIyNDlB9s0FIWMySSp6SsBfEpMTU1tbKyIjpoFyE51dXVor5/4YPxuGWxS3lhYaGYSZgYtLW1ly9fjpZST5w4gRZ7dXV1P/74Y6WJKNZDGLPw6tUrSRKgqanp4uJy/vz5mJgYdDyvoKDgxo0bhDwYN24c+oFvIaJw//598TaElID4ElC0kCsU1pWroHFQocPE0qVL0S5fZMj38uXLeXl5y5Yto++kVYU6VZ2xSZlDmLy69HZXekD7BTTeTgHe7YP2yjISGRlpYWFhY2OD1xOwYQlRO0lEabO9e/ceNGgQ+i1qu9TVq1dtbGzQVfKEYmCdfvGg2wsJgqDYz6TP/CRn69atjIb+dXR08M0roux/KFTPlKpIJSxPdgmePn26ePOPfD4fXVNJEIRCjz2TxVtUg8I2gadNm6YIKz5yr3R2XYRUiGoXuB3hliUVvXv3Hjx4MCoTMXdXuLq6WlhY/Pjjj4yunp6eqJoCAgKioqKSkpIWLlzIeNmJgkQUH5RFezooMCqZqampbm5uly9fpjuNGTNm5cqV4vsN1hJy/vx5uu3WnJwcXPitbi6Vl7RLWwJKEHJ5IcfKVdA4yPqNkrzO1NQUfeqtrq4ODg5Gh+pXrVpF96kKdao6Y5OEDUdeQ5hcunSVLT2g4wEab6fAzc0NWc+LiYkRZT3Pz8+vsLDQ0dERfwbGBvcSExPpe+2am5spV32QWbduHfoRGBjI6OHUqVM5OTkjRoxQnFVPWdIvhgULFqA7PJOSkh48eED3EBAQIG2c0dHRISEhjJNdfX19dPiQcjoOb2Yjzz5nzpw5fPhwxlTJt0jxCETmzp07YsIyJvjq1avDhw9ftmxZq6+eM2cOsuWYkJCQlJRE9xAaGoomNG5ubv369SMUCRbvX3/9le4qEAh+//13ik+5IGMZyr2LkIrjx4/TH8bGxiL7yYaGhqLuC20VtAGSIAi0QksnPT39ypUrRUVFM2fOZPTQp08fNJfKy8tD9xVJZbNKdhEdOHCgqGlfREQE460qJSUlYWFhly5dYkwM6qPo/UZoaOjnn3/+559/Spk5wtnZGSWyuLh4165dZCehUIhthrm5ucnLvHyr0i5tCShByOUFu8pV5jiooGECgxvgvn37bt68OXnyZMZeXRXqVKXGJgmHCbkMYXLp0lWt9ICOjBDoHERGRiK7R++//35tbS3FFfVuurq6T548wQ/5fD6Hw0Fysnv3bkqQ3bt3Yym6c+cOxVUgEEyaNAmdyfnzzz8pruHh4eh1z549Iz9PTExEEXK5XHoWsC3Q8ePHS5JlWdIvHnx7+8CBA0tKSshOgYGBhoaGaMjhcDiUgKIyOH78eIIgli1bRn8XvsN9z5495Of79+9Hzy9evIieVFZWop1gubm52Nvs2bORt+zsbErMPB4POfF4PPp7UdFRsoCvf7C0tMzLyyM75eXlWVpaiqmg5uZmZIxx2LBh+OE333xDEMSKFStaLSKhUPj3339jGebz+ZS3o8mfiYnJy5cvKQHlK1dk8UaWTimu2C7Lxo0b6WHFJ0Y8spehmPyy6CIkAQmSnp6eoaFhYGAg2amoqMjOzg4lxs/PjxJQjOhSaG5unjJlCvJ84cIFimt1dTXaXMfYvjBhYWG4Q0B7T0ShCBF98eIFilNfX/+ff/7Bzx89esThcPDu0EuXLmEnpDl06dLl33//pcRWW1uLTNoaGxtXVVVROl5EVFSUUErIReTp6ZmQkJCfnx8ZGYnX2XR0dNLS0qSKU0xhtirtLEqAtZCL7y0ll1UJS4BF1pQ/DipimCBDNstMb9dy6bhkqTjVHJskHCZkGcJYd+lyLz051iDQGQCNtxNx5swZpBENHDgwKCgoKysrNzf3zp07H3/8sZqampaWVmhoKCVIWFgYXoOdNm3a6dOn7927d+nSJXd3dwMDg7FjxyInFxcXLpfr4+NDDltaWoo8aGlpbdmyJSkpKT8//969e19//bWWlpa6unpQUBD2fODAAS6X6+rqiiK0tbXltoAGsEuXLnG5XA8PD+TK4XCQa6uTb1nSL4bm5mZ08A/dEb9t27aQkBB/f/9Zs2YRBBEcHIyGBF1dXZTOwMDAdevWMWYwOTkZa7wEQcybN+/mzZu5ubl5eXkPHjzw9vZGJ5ecnJwoI0F6ejrKmpOTU1paWkZGBrrIwdnZWSgURkdHo/ixVVV3d3cul7tr166KigrkhI/bOTo64tIODAxEv9FRMZyF06dPC4XC+vr6999/H4UyNjbeu3fvjRs3YmJi9u/fz+Fwpk2bJr6C0PWSaOU/Nzf38uXLaOPo3bt3hUKh+CJCBAUFoZ1yI0aMCAsLy83Nff78+a+//oqMcJqZmd2/f5/8RgXJFVm8NTU1N2/enJSUVFBQEBcXx+VyUWzLli1rbGwkBxGVQS6Xm5mZKaHsiS9DGfPLoouQfE6Mpp6urq7+/v4hISFbt27FE/Hly5c3Nzcj/5mZmYyiy+Vyo6OjRb2lrKwMHTTV0NBYs2ZNXFxcfn5+UlLS8ePH0V2OTk5O1dXVYtLZ1NSE5+LHjx9n9KMIEcXg5RcNDY3x48d7eHiMHTtWTU1t1apVO3bsQE7Ozs5cLnflypVYKUJle/jw4dTU1KKiovT09NDQUHTaTVNTE38OQ2zevBmrEPv37xdKz/bt2wkRqKurBwcHSx6VJIUpXtpZlIC0Qi6+txTVzXK53AMHDshSAuyyprRxUKHDBAZdlI0u6aX0pRSk7bjYdTLiUZ2xqdWGw3oIY9elK6L0ZGx6QOcENN7ORWJioouLC30j8YQJE+Lj4xmD3Lx5c8CAART/Y8eOTUpK8vLyIj+kf4bk8/k//PCDqakpJfjQoUP/+usvsk9RxzPKy8uFQiGe8FGQ5Ju0LOkXg0Ag8PX1xbvLED179kSzENzvI1atWoWvUKdw7do1oVD4+PHjzz77jPHuBBMTk23bttXV1dHTcPjwYcolfvb29i9evBAKhaLMXI0ePbqgoIDRCZU241kpgiC8vLzQS6uqqlatWkU5oKWvr79nzx76bYeUCsrPzx8xYgTZg5aWFp55iy8izKNHj/ClqeR4lixZQv8GrDi5EiPetra2jFN/URkkCCIuLk6SN7ZahrLnl0UXIfkq0Pnz5ylbXg0NDX/66SeBQID9izmLe+rUKTEvqq+v379/P92Yp6mp6c6dOykfjBhBm3UNDQ1F6caKEFEMn89ftmwZueR1dHQ2bdrU3NxMqTgdHR201vfLL79MmDCB0fruuHHj6Kp1XFwc8sy4eCghoaGhffr0obxOW1v777//lioeSQpTvLSzKAFphVx8bynGmqCLi4ssJcA6a8oZBxU6TGAqKyv19fUJgti+fXurSZKq42LdyYhHdcYm8Q2H9RDGrktXROnJ2PSAzomaMs3eACpCcXFxXFxcQUEB6rxGjhwp/p46NJwkJydXV1ebmJiMGjXK1tZW8tc1Nzc/fPgwMzOzvLzc2Nh4+PDh2GqCcpAx/WKor6+/e/duTk6Orq5unz59xowZI+OVuVlZWehzPp/PNzQ0tLOzc3BwEHMHXUlJSVRUVEFBgba29qBBgxwdHRV3LppMaWlpbGzsq1evtLS0rKysnJyc0Mf+VhEKhQ8fPkxNTa2rqzM3Nx83bpy5uTmLBBQVFSEZ1tLS6tmz59ixY8XcX69QsHhXVFSYmpoObkGhb5RXGcqxixCDhYVFYWEhh8NByoNAIIiNjc3Ozubz+dbW1uPHj6fbX5WF5ubm+Pj4jIyMsrIyAwMDOzu7ESNGtMktjuxENDc3NzY29vXr1z169Hj//fcp384YqampSU5OzsjIqKys1NLSsrCwGDFihKj6SktLu3fv3oQJE2TsA//5559nz569fv362LFjaWlpBEEsXLjw999/l/vlN5JIu1QloAghVxzssqbkcVDuwwTGwcEhKSkpJycH779Q/TpVkbFJ8mFC2iFMoV26ipQe0CEBjRcAAABQFJTpEdDBKCgocHJyQteHuLq6hoaGyvcTBtBpSU1NHTJkyKxZs8gHyIE2B7p0oJ0CtpoBAAAAAGCDhYXFX3/9hW7svHz58saNG9s6RUAHAd16wMJqOgAAAB3QeAEAAAAAYImVlRVSerdv345tyAOAVISFhSFzR+jPioqKU6dO9enTB5thBwAAkAU5H7kBAAAAgNLS0qqqKnTKC/2fk5OD7Jogq6FAR8LW1jYzM1Puh3iBzkNiYuKvv/66YMECZNLpm2++qays3Ldvn3IsUwCtAl060N6BNV4AAABAzmzevNmmBWSataSkBP25c+fOtk4aoBBA3QVkZ9asWR9++OHgwYP9/PwcHR0//fTTtk4R8Bbo0oH2DgxRAAAAgJxxdXWl3FqBwPeaAgAAYJycnFxdXf/999/k5GQLC4tvvvlm06ZN8BlFdYAuHWjvgK1mAAAAAAAAAAAAoGMCu5oBAAAAAAAAAACAjglovAAAAAAAAAAAAEDHBDReAAAAAAAAAAAAoGMCGi8AAAAAAAAAAADQMQGNFwAAAAAAAAAAAOiYgMYLAAAAAAAAAAAAdEzgrjPgLQsXLiwoKMB/Tps2zdvbu01TRFy+fPnAgQMEQSxbtozL5bZJGg4ePBgWFob/NDExuXDhQpukBFBZrl+/vm/fPvKTs2fPcjgcQjXoADJcVlY2Z84c8pN169a5urq2XYo6GjU1NTNmzGBRwqwDdh6OHj0aGhoqxwaouOYADY010BAAQMUBjRd4S24LDQ0N+fn5BEHY2Ni0dYqIvLy8u3fvEgTh7OwsY1QVFRVubm51dXUEQQwePPiXX36RMGBJSUl2djZBEC9fvmxublYdNQaQC8+ePVuyZAnr4JGRkdra2tXV1UhIioqKkIzx+XzJI/ntt9+8vLzeeeedq1evmpiYEPKmA8iwQCBAWaiqqiotLSUIwsPDo60T1aFobm5mV8KsA3YeSktL5dsA5dIcKioqXF1dHz9+vH///k8++UTymBXdX7VToCEAgKojBDoHfD7/TgspKSlivCUmJiLB4HK5wraGx+OhxOzYsUPGqD799FMs86NHj2YRA5qmcDgcGVMCqBRY4NnB5/PJsc2ePRs9z87OljwNeAbs6+urgCyqkAxL2AtJ0ifweDx5pw6QqYShapTfAGUpcxzWyMhIqpjF9FeyN/AOADQEAFBN4BxvZ6GgoGBCC1u2bCE6GdHR0QEBAW2dCkB1mTlzJp/G4sWLkeuuXbvorv3795fX2wcPHox+DBw4kOjQdOZeCABUikGDBrHrdsT0V9DAAQBQWWBXM9DBaWhoQFu2XFxcrl+/3tbJAVQRDQ0NHR0d+kP0Q0tLi+6qri63z4WXLl06ffp0//79J06cKK84AQAAxPDBBx9ERUUlJycvXLhQqoDQXwEA0B4BjRfo4Ozbt+/JkydDhgxZs2YNaLyACmJgYLBq1aq2TgUAAJ0LpxakDQX9FQAA7RHQeIH2SlNT0+vXr9FvExMTLS0tup8nT57s2bMHWctEJoUAgIypqemqVauGDx8ubcAFCxYUFhbidWAAAAAAAABANQGNt+Pz/PnzoqIiZIEZ2Y28f/8+dlVTU3vvvffEBL93796VK1devnxpYGAwevToefPmdenSRZTnqqqq69evx8XFFRUVdenSpXfv3hMnTnz//ffV1NTkmqc3FoPmzp0bERFBEMSiRYt+++03uh+hUPjJJ580NjYuWrRo3LhxCl3gra6uvnPnzqNHj3Jycvh8vqGh4cCBA6dMmWJnZ8foPzExsb6+Hv/ZvXv3vn37SlvaCQkJYWFhL1680NXV7du377x585CF7YSEhMbGRuzN3NxcIBDgrwMEQXTr1m3AgAH4z4KCgpycHPynnp7e0KFDZcwgmaqqqosXLz58+LCiosLCwmLMmDEzZszQ0tIqKip6/vw52eeIESPIXy6UIE6WlpbY0IhU7Ny5s1U/lZWVwcHBycnJtbW1ffr0cXNzs7e3l0QMKMTHx9++fTsjI6O2ttbQ0NDOzs7R0fG9996T485qWapYkuTJ2AtJTlpaWlRUVFpaWmlpqZaWFofDcXR0nDp1Kn1fOkoS5aGOjg7+/CEUCh88eEDxMHLkSPJnDslFtKSkJDMzk/zEwcFBW1ubz+efO3fu0aNHRUVFBgYGdnZ2s2fPltxUvuT5lbBVtvpGdgFllGEZSy8pKenatWtZWVm1tbWmpqYODg5Tp041NzcX80ZZejxRPbOCqhLT2Nh49erV2NjYgoICIyOjUaNGzZkzx8DAQMLCbDV+Mf1Vqw3cwcEhISGBHqetra2ZmRn6/fLly7y8PLKrhYWFtbW1BFmXrvRElUCrPbZcWhAAAG1DW5vOAhSO+A1IOjo6omw18/l8d3d3in9LS8vk5GTGFx06dMjY2BgdgLS2tjY1NUVB7O3t4+Li5Girubq6Gt9XtGLFCoFAwBjc39+fIIiuXbvm5eUJhcJr164pwlZzUVGRu7s7HudMTExsbGzw7GHWrFmFhYX02CijuLSlXVpaOnfuXHptent7CwQCyu0Xq1atWrBgAfnJ7NmzybH5+vqSXe3t7WXPIOb8+fN4QoOxtbVNSkqiq5oFBQWKEydpwVdA+/j4SBiEbKv51q1bRkZGlAx6eXmJFwNKhDk5OePGjUOuBgYG1tbWuOS7d+/u5eXV0NDQVjIsVfKk6oXY2UENDAy0tbVFrpqamtbW1lilMTMzCwoKovhnTJK1tTX2wHjFVHl5OTsRPXXqFCWq7Ozs2NhY+l01Eprslja/0rZKRkuzLALKRYZZl15mZuaUKVOQU7du3aytrZGca2trb9iwgfHVsvR4kvTM9AbIuirJZf748eM+ffpQ3mtmZnb+/HlJClNMzJL0V6028IKCAkanU6dO4Ui8vb3Fd5iMsCg9xhKQpMeWvQUBANBWgMbb8YmMjOTxeGhzL0EQw4YN45E4fvy4KI3Xw8PD2Nj4iy++OHTo0Pbt2/GqYP/+/ekTBXyh31dffVVaWooexsfHOzg4EAShq6t7/fp1uWi8FRUVY8aMQc+/+OKL5uZmxrD5+flo9Nq/fz96oiCNF5eYu7t7VlYWelhfXx8SEtK9e3eCIOzs7CoqKiihgoODeTze5s2byaVtZma2YcOGgICAffv2YXuY9NKurq4eOXIkcnV2do6IiMjOzk5OTvbx8TEwMNiyZQtKqoGBAariyMjImzdvkmWAovGiQRqXNkXjZZdBREhICFrs0tfX9/HxSUlJyc7OjoiI+PDDD01NTbdt24Zi9vDwQAmora1VnDgpU+MNDw/X1tYeN26cj4+Pr6/v4sWL8cJgYGCgGDEgx1ZVVYWmsKNGjUpISEAPBQLB9evXsaVosgKmZBmWKnlS9UJiEDObRIXfrVu34ODgxsZG9DAzMxPfiunv70/2j5I0evRoshAGBwdjD01NTSh5yKrt7t27eTxefX09OxHNyMg41QLyQBDEn3/+qaurO3jw4K1btx48eBCnU0KNV9r8Stsq6SXMIqC8ZJhd6SUmJiK1pE+fPn///TdOko+PD8rIlClTcNHJ3uNJ2DPTGyDrqsTNYdu2bSYmJhMnTvzzzz/RS/fu3aunp4fWV8+cOUMOlZ6ejgR72LBhUmm8YvqrVht4bW0tj8fbvXs38mBgYODn58fj8dLT03EkcXFxPB5v48aNaJjm8XgxMTGMGZex9OglgHrsKVOm+Pr68ni8FStWaGpq0ntsGVsQAABtCGi8nQV0Nzpd2xE12NvY2Nja2qLVUURdXR15eCCHOnz4MHr++eefUyIsKyvr0aMH+tpaVFQko8ZbWlqKpxSbNm0SExatlw4cOBAPgQrVeMeMGdPU1ERxSkhIQHv2Nm7c2Gpp29nZkcuHz+fj3ZWU0v7iiy9wVVIU/vj4+C5duqChmp7UVmVAjMbLIoM5OTldu3ZFto4pS17Nzc0fffQR3m9GmRkoSJyUqfH26dPnhx9+IDudPn0aOTk4OEh4CfbBgwfRczztxmRkZOjr68tX45W2ilkkT8JeSBaNNyIigh7Kzc0NbdcvLi6mOIWFhaEIJ0+ezPjG169f6+joUGpNFhHFQtK3b9+1a9eSt6h8+eWX0mq80uaXdatkF1DuMix56VVUVCBlW19f//nz55R4vv/+e8rgInuPx7pnZleV5Oago6Pz0UcfUV4aExOD3ti1a9cXL17Qg4u5P1xMQxPVX0nYwPE3i9jYWEYP69evp496YmBdepQe+9ChQ2Sns2fPMvbYrFsQAABtC2i8nQVpNV6CIK5du0Zxxbfarlu3Dj+sqKhAJ4V0dXXxWgcZPOnZsmWLLBpvUVERPl+6a9cuMQHDw8ORt9u3b+OHCtJ409LSrK2tKR/RMR9++CGa+zKuRZNL+9atWxTX48eP00s7NzcXrRZqamq+fPmSHufatWtRKHlpvKwz6OnpiSJctWoVPWBhYSHeN0ieGShOnJSp8To6OtJde/bsiVwrKyslmUHOmzcPVTTjvv0ZM2bIS+NlV8UskqdQjfeTTz4R1bSjo6NRqCNHjlCcmpqaLC0tkeuzZ8/oYffv308QBHkVWkYRxUIyePBgik718OFDe3t78jqzGNjll12rZB1Q7jIseelt374d+WTUThsaGtDyr56eHiUB7JqDLD0zu6okNwdtbW3GvdYrV65EHlavXq0iGi+eRSxevJjuyufzTU1NLS0t6Z8bRMG69MglMHbsWLprr1696D026xYEAEDbIk/DJ0BHonv37vj4E+bdd99FP8hWH4KCgqqqqgiCmDRpUrdu3ehRubq6oh8nT55knZ68vLxx48YlJycTBPHTTz9t3bpVlM+qqqrVq1cTBDF//nwlXBg4cODA7OxsykFZDNoKXlJSQjHRRMHc3JyeVFGlLRAI0G2KeKZO5j//+Q+hAhlsamoKCgoSkyRzc3M0d6SgHHFSNEuWLKE/HDFiBPohXhgwaALd1NSELLRR8Pf3T0xMpJulUVoVKy15EhIQEBAXF8fohE9k0D1oaGh8+umn6Df9YDma+hsYGOAdknIU0RUrVlBsfY8cOTIxMXHRokWEYvLLulWyDqg4IRFfekKh0M/PDz1nFGwtLS0XFxeCIGpra//44w/Zm4MsPTM70SUzceJERkNcixcvxslramoiVIBFixahGv/jjz/I9hQRoaGhr1+/XrVqleRm8GUvPVG1Q++xWTcEAADaHNB4AWaGDx9ONzeKduuhT5744a1bt9APR0dHxqhsbW3RPp/8/HwJ5/oUnj9//sEHHzx58gSt0H711VdiPG/evPnVq1f6+vo//fQToVyampry8/OfPn2a/v9UV1cjJ7pVWDL29vb00rawsKCXdlRUFPohyrYtY1TKz+Djx4+xE96ITgFvbyOjBHFSAoxZY2w+YsAlMH/+/L1791Jmh7169bK3t5evuWapqrhNkichFRUVz58/x1nAS0+MzXDlypVoev3rr7+STdGiTSIZGRlLlixB+2/lK6KjRo0ilJtf1q2SdUDFCYn40ktJSSkuLkaLn6LuHhsyZAilU5WlOcirZ5ZKdOm6mahSqqqqQt+L2xx9fX2khzc0NNAtSPn5+WloaKxYsYJd5OxKD0146A/pQzDrhgAAQJsDtxMBzNDtEKJdfOgH+piNSEtLQz9SUlJ+/vlnxti0tbXRVDIlJYVuT7JVAgMD8e/79+/7+/uLsgx5//79o0ePEgSxfft2vCVJ0TQ2Np44ceK3335LSEhoaGhg9EOZSbMu7adPn6IfoopRR0fHwMBAQp1KcRnE6eRwOKIuWGJclFCCOCkByStUDJ6enidOnEhJSamtrd2yZcu33347adIkNze3WbNmYeW5DatYmcmTkJSUlIMHD0ZEROBbUiRphj169Jg9e/aFCxdKS0tDQ0PxshhBEMeOHUM7QhUhouJvx1FEflm3StYBFSck4ksP15Genh4+dE0BX5aTkpIixx6PXc/MTnRbLQ09PT1zc3Ok76Wnp6uIMvbZZ5+hFXg/P7+vv/4afwhITk6OjY11d3eXVjZkLD3Je2zWDQEAgDYHNF6AGcbb+Rg/xpeWlqIfZ1oQH21JSQm79Ojq6u7YsWPr1q1NTU1ffvnl2LFj8Rd6Mui0kp2dnfh1YDlSWFjo4uLy+PFjgiCsrKymTZtmaWmJT/KEh4fHxsbKsbTLy8vRD2Q8gxFdXV05arzsMihhOttKnBSN5BUqBh0dnaioKG9v75MnTza1cK2F1atXOzs7b9y4EW3LbKsqVlryJOTo0aNeXl4CgUBDQ2Pq1KkODg6GhoZoMl1bW/vdd9+JCbt69eoLFy4gFRdrvHl5eeHh4fSuRl4iKvk9q/LKL+tWyTqg4oREfOnhOiovL0cWrSSvI4X2eIw9syyi22ppdO3aFWm8ZWVlhGowZMiQMWPGxMbGZmZm3rp1a/LkyWI+MLWK7KUneY/NuiEAANDmgMYLyAqeCuzZswdZIhEDu3XXrl27XrlyZfz48chEM5/PX7BgAbJ+SfGZlZWFdkGjayTINDY2oh8PHz5Et2gOHTpUzH42CfHw8EBzo5UrV/r5+eErDRD5+fmSaLySg+OXcJ1QdthlkHU6lSBO7QhjY2N/f//du3efPXv2zJkzMTEx6IziXy1wudyTJ0/KvnOYtQwrJ3mSEBkZuWbNGpSkv/76i7KWVVFRIX7i++GHH/br1y8jI+PevXtJSUnIKP3x48cFAgF9/q0KIsouv6xbpSzdTpsICa4jS0vLK1euiPdMOTKq5B5PRtFtFZweXCaqwOrVq1ExHjt2DGm81dXVQUFB/fr1k8r6hqJLr83HXwAA5AVovICsmJmZ5eXloR/29vaKeIWXlxdSdzds2HDt2rU7d+6kpaV9+eWX/v7+jP4bWhAVW3Nzc0VFBTraJGPCkpKS/v77b4IgjIyMDh06RJkbKQITExO0cQtlgZGamhrxkTCO1nV1dXLMoImJCfohbTqVIE7tju7du69pITc3Nzg4+MiRI7m5uWi3v729vYzbGWSXYYUmT0KweWRvb28WWzfV1NQ8PT3RtSh+LQgEgoCAAFNT048++kgFRZRdflm3StYB20pI8CbVpqYmqepIlh6PXc8so+giamtrRTnh9OBKVAXmzZvn5eVVWloaHh7+6tWrXr16BQcHV1dXr169Wio7FHIpPcmRvSEAANBWgOUqQFawSWG0vqoI8MdpdXX1oKAgZB81ICDg3LlzFJ+rV6/2EgG+h4DD4aAn5AN77MAnwd59913GUz34yh95ga9EfvbsGaOHyspKUSMunr0xTo9evXolxwzidJaVleEdhpK8UQni1H6xtLT09vbOyMhAl74QBEE3/dKGMqyI5EmbCycnJ3ZZWLp0KdrZiEwxX758OS8vb9myZfT9oqogouzyy7pVsg7YVkKC66iwsFCMNqiIHk/anll20SUIAn0+oPP69Wu8ERenUBXQ0dFZtmwZ+gB94sQJtNiro6OD74STELmUnuTIsSEAAKBkQOPtdMh9DMD7+tB2NUYiIyMtLCxsbGwYFxKlolevXr/88gv6vXLlypycHLLrvn37fEWAdyfa2NigJ2hJRxawPQxRG8bEfAlmB7754O7du4we7t+/Lyos2sstanrEuFWPdQb79++Pr+iIjIxk9MN4Y4SSxUmV2bp1K+NFNTo6OvjmFVGWWiSHdRXLkjy590LicyFJMzQ1NUU6WHV1dXBwMDpSyGghTxVElF1+WbdK1gGVI8N0evfuPXjwYCRpYm6mcXV1tbCw+PHHH2VvDqx7ZtlFV8ztOzgxlpaW/fr1I5SFJA0cX2wbEBAQFRWVlJQ0b948U1NTqV4kl9KTHNYNAQCANgc03s6Cnp4e5TgrQRBXr14dPnw4+tTKGjc3t759+6L5X3p6OqMfPz+/wsJCR0dHUeYNpWLOnDkrV65E45mHh0cbXjOIMk4QRGJiIn2rcHNzs+znhCksWLDA0NAQ7b578OAB3UNAQICosPr6+uhU4bNnz9DVHRihUIhsXMsxg1hbYNx8npqaeu/ePbmLU2ho6Oeff/7nn38S7Z/o6OiQkBDGzxP6+vro8GHPnj1lfAvrKmaRPMX1QjgX8fHxdNc7d+5IEslnn32Gfuzbt+/mzZuTJ09mVBKU3+PJMb/sWiXrgMqRYUbwB020hEgnPT39ypUrRUVFM2fOlL05sO6Z5SK69+7dS01NpT/HnxWweqlQpGrg/fr1mzRpEjIRhy4wxw1QcuRSelLBugUBANC2gMbbWTAzM0PWBclbbmJiYh4/fiz5Ve+MaGhonDp1Sl1dXSgULlu2jL6mERQUdObMGV1d3Z07dxJy4ueff7azs0Mj/bfffku0EePGjeNwOGjvnI+PD8V13759ct/32LVrV/yipUuXUu63/O23327cuIGnHXSmTp2K9Nv169fjLwWNjY1ffPEFo7FKWTL41Vdf2djYEARx7do1Ho9HdiovL1+yZAm+7VBe4nT58uX58+cfO3ZsxowZ0dHRRIdg+/bt9Ifnz59H0/H58+e3rQxLlTzF9UILFy5EP3x8fChrhvn5+Vu3bpUkkjFjxiCzzC9evBBjM7ZNejx55Zddq5QloBJkmBEulztlyhSCIEJCQi5evEhxrampQe9dunTpwIEDZW8OrHtmuYiuhYXFkiVL8AZmxOHDh9Hd0TY2Nso5Ti9tA8dNLCcnZ+jQoe+//760b5RL6UmFLA0BAIC2RAh0Gv7zn/+gSg8MDMzNzb18+TI6EHv37l2hUHjgwAEul+vq6or82Nracluora0VCoWXLl3icrkeHh7IlcPhINcnT56gyM+cOYNUpoEDBwYFBWVlZeXm5t65c+fjjz9WU1PT0tIKDQ2VNsF4ONmxYwfdNSEhAW1kUlNTu337dquxXbt2DcU2evRoydMQGBiIcoquHNDV1UV/nj59GnkICwvDljamTZt2+vTpe/fuXbp0yd3d3cDAYOzYscjJxcWFy+X6+PigULKUdnNz8/Lly5GThYXFtm3bQkJC/P39Z82aRRBEcHAwmrFxOBx6dp4+fYrPJVpaWrq7u8+dO5fD4RgZGf3777/oebdu3dDrrl69yjqDiMTERCRjBEHMnDkzICAgJCRk27ZtPXr0GDp0KDY6wuPxKOlkJ06bN2/GPdv+/fuFrAgNDUXZt7W1RVGNGDECPYmOjmYMkpmZiTz07t0bBXF3dycLCXLFE2tcVuvWrWMUg+TkZKFQiKy1ISsvN2/ezM3NzcvLe/Dggbe3N6pEJycnPp/fVjLMLnnieyFRVFRUoDQ7Ojqi4I6OjuQmU19fj6fLxsbGe/fuvXHjRkxMzP79+zkczrRp00R1XBTwTocePXo0NjaKSZK0IipKSMTIlRhkya+ErRKXcEVFBeuA8pJhdqVXVlY2btw49JFizZo1cXFx+fn5SUlJx48ft7a2Rm+vrq6mhGLd40nYM+MGGBgYyK4q6c3h4MGDQ4YM6dGjx9atW0NCQgICAvDee2Nj40ePHpEzGB0dzViYu3btEt/QxPdXLBp4Y2Mjvnr32LFjQulh1xBY99gytiAAANoQ0Hg7Efn5+SNGjMAqATr6ghUDUfcilpeXC4XCHTt2MLreuXMHx5+YmOji4kI3tDhhwoT4+HgWCRav8QqFQnz+qkePHsXFxYrQeBkP8iHz0djPzZs3BwwYQPEwduzYpKQkLy8v8sPx48fLpbQFAoGvry/aRIfp2bPnxYsXhUKhubk5mnIx5uj27dt4mEcMHTo0KSmJfvIKD/AsMoh5+vSps7Mz2Y+6uvr8+fPLy8vxjjt/f396OlmIU1xcHLLO1aVLl3///VfICm9vb8bCRyZ2RL1XvJAwuo4fPx5Nu+lcu3ZNKBQ+fvz4s88+Y7zexsTEZNu2bXV1dW0ow+ySJ74XEkVBQQFjFnCTEQqFVVVVq1atohzn09fX37NnD/1SXHLHRaayslJfXx8tS7ZasFKJqJjTfaLkSjyy5FdMq6QsWxEEUVBQwDqgvGSYdenV19fv378fm27GmJqa7ty5U5SyzbrHE98zI40Xs2rVKnZVSW8OPB6vrKzso48+okjjhAkT0tPTKbkTZSps9OjR4hua+P6KXQPftm0bymxlZaWQFSwaAuseW/YWBABAW6EmdwsigCojFAofPnyYmppaV1dnbm4+btw4pB3JkeLi4ri4ONTFczickSNHdvhLU1HBJiYmJicnV1dXm5iYjBo1Cq8QKo76+vq7d+/m5OTo6ur26dNnzJgx6FrLrl271tTU2NnZPXnyhDFgY2PjvXv3MjIyCIJ45513xowZo+gMPnv27J9//ikvL7ewsHjvvffQyb0DBw6gs3ZnzpxZsGCBXMQpLS3t3r17EyZMUEL5K42srKzU1NSioiI+n29oaGhnZ+fg4CD32zVZV7G0yVNoL1RaWhobG/vq1SstLS0rKysnJye0si05Dg4OSUlJOTk52ESNKvd4suSXsVUqKKByZFgUzc3N8fHxGRkZZWVlBgYGdnZ2I0aMEP92WXo8UT2zokUXbSd++PBhQUGBsbHxu+++279/f0LpSNXAw8PDZ8+e/emnn4q6a1BC5FJ60sK6BQEAoHxA4wWADkV5eTnacDV58uQbN24QKsyXX375888/IzPRLE5wAYDcSU1NHTJkyKxZs8LCwto6LQDQ8fnoo4/Onz//6NGj4cOHt3VaAADoyIDlKgBoZ8TExCxdupRyLRPZFf2YMGEC0dasX78e6bSMIONSenp6+PJMAGhbkEFdFjZjAQCQlqKiorCwsNGjR4O6CwCAogGNFwDaGRkZGYGBgb///jujKzKboaOjs2LFCqKtOXfu3LZt22pqauhO0dHR//zzD0EQn3zyCaOZaABQNGFhYcuXL29ubkZ/VlRUnDp1qk+fPsjGLwAA8mXp0qXk3RNHjx5tamoSZRQdAABAjoDGCwDtkl27dl2+fJn8pLa2ds2aNbdv3yYIwtfXl2Ilpa2oqqqaP39+WVkZ+eH9+/fR1SD9+/dX3A0uACCexMTEX3/99ebNm+jPb775prKycv369XRjVAAAyE5gYOAPP/yAbqV69uzZwYMHe/XqhW8lAAAAUBxv7JoCANCOMDQ0VFNTa2homDVr1uDBg4cOHWpsbFxQUBAZGVlaWqqjo+Pr6+vp6UmoAMbGxjk5OX/++aelpeX48eMtLS2bmpqSkpLQ6u6YMWP++OMPIyOjtk4m0KmZNWuWk5NTQUFBWlqao6Pjp59+2tYpAoAOS2xsrJ2dnY2Nzb179+rq6oKCgmCPDwAASgAsVwFA+yM3N/fKlSvR0dH//vtvUVFRXV2dkZGRjY3NxIkTV65cqSKruwRBCASCv//++9atW48ePcrKyqqsrFRXV+/evfvIkSPd3d3xjZEA0Cbcvn37559//vfffysqKiwsLGbOnLlp0ybK1TIAAMiLzz///MGDB3l5eZqamoMGDdqwYcPEiRPbOlEAAHQKQOMFAAAAAAAAAAAAOiZwjhcAAAAAAAAAAADomIDGCwAAAAAAAAAAAHRMQOMFAAAAAAAAAAAAOiag8QIAAAAAAAAAAAAdE9B4AQAAAAAAAAAAgI4J3Mfb2Tl69GhoaCj+08TE5MKFC4SqUlZWNmfOHPKTdevWubq6tl2KAAAAgLesXFmTkSGgPPzxR71Ro95MNsrKmufMqSY7rVun6+raea9jPXiQHxbWQHm4bJkOl6vTRinqmBw8eDAsLIxxngOTig48YwQAMqDxdnZKS0uzs7MJgnj58mVzc7PqXOXKiEAgQKmtqqoqLS0lCMLDw6OtEwUAANA2XLx48fvvvycIYty4cT/88AOjn/z8/I8//riqqoogiIULF3755Zfo+YIFC3JycsRELiZOUcTHNz1+/EbjtbRU19B4+7Cu7u0liAIBkZ3d3NKBC0tL3zz08HjzZ6elpKQZFQi5TJydtdo6XR2NkpISUfMcmFR04BkjAJABjbezs60FgiAsLCwKCwvlGHN6enpBQQFBECNHjtTX15dLnGZmZqi39ff39/T0lEucANCBqa+vj4uLQ21n8ODBbZ2cToeiy7+oqOj+/fuoA2f08Pr160mTJqWlpREE4erqumbNGuz0+PHj9PR0MZGLilMS4uMNORzqsSkzM/XsbOOWDpzv6VnLOvIOw549env26KHfUCaKY08LjPMcmFSoyIwRABQNaLyAoti3b19gYCBBEImJifb29m2dHADojBQUFEyYMIEgiNmzZ1+6dKmtk9PpaNvyr6ysnDJlClJ3P/zww9DQUE1NhkFfVP/cp08fxacRAAAAABQOaLwAAAAA0NGora2dPn16QkICQRBjxowJDw/X0WE4Haqjo5OYmNgWCQQAAAAAJQG2mgEAAACgQ1FfXz9r1qyYmBiCIEaMGBEREaGn93b3LAAAAAB0NkDjBQAAAICOQ1NT07x5827fvk0QxODBg2/cuGFoaNjWiQIAAACANgN2NXc6EhISwsLCXrx4oaur27dv33nz5tnY2IgPUl1dfefOnUePHuXk5PD5fENDw4EDB06ZMsXOzo7uubGxEe2jKy4uRk+SkpL4fD720Lt37549e5KDpKWlRUVFpaWllZaWamlpcTgcR0fHqVOnMu7BY6SxsfHq1auxsbEFBQVGRkajRo2aM2eOgYGBmCDsXlpZWXn58uV//vmnpKREXV29R48ew4cPnzhxYvfu3cWESkpKunbtWlZWVm1trampqYODw9SpU83NzQlpSExMrK+vx3927969b9++BEHcuXMnIiKiqKjIyspqxowZ7733HvYjEAhCQ0Pj4uLKysqsrKzmzJkzYsQI2atYTGLu3bt35cqVly9fGhgYjB49et68eV26dGGMQZZKFyXDCQkJjY2N2Ju5uTnlIKLkFaHQ0pYqMSUlJZmZmeQnDg4O2tralZWVwcHBycnJtbW1ffr0cXNzo5zGfP78eVFRUX5+PvqztLQUmThCqKmpkRPfKvHx8bdv387IyKitrTU0NLSzs3N0dHzvvffU1d9+NuXz+Y8fPyYHGTp0KHldMT4+XiD47701AwYM6NatG04nfq6lpYXK7fnz5+fOncvKyuLz+VZWVrNnz6aUJ+uAFJ48eRIREZGRkVFZWWlqajpkyJDp06dT+ijxUpGWlnbhwoXs7GyBQGBhYTFq1Ki5c+fKt/wlp7m5ecmSJZcvXyYIol+/frdu3TI1NSXaA42NwoQE6s1GBEEMGqRRUtJcVCQk1TUxYsSb2cvz54Jz5xqyspr5fKGVlfrs2droOSNpaYKoqMa0NEFpqVBLi+Bw1B0dNadO1dLRUaN7TkxsIlU10b27Wt++b2xPp6UJLlxoyM5uFgiEFhbqo0Zpzp1LvV2ptlZ461ZjTExTYeEbO8ympuoDB6p/8IGWnd3/W69WItL27ZIg4TioUmOWXKiqqrp+/XpcXFxRUVGXLl169+49ceLE999/X01NTZa+QsK3K3+YZjdjBAAVRQh0GkpLSxn7Vm9vb4FAgKzMczgccpCioiJ3d3ctrbeXJZiYmNjY2Ghrvx3gZ82aVVhYSHkLss8sBh8fH+w5MDDQ1tYWPdfU1LS2tsYzfjMzs6CgIFF54fF4yBuPx3v8+DHdwoqZmdn58+cZw7J+6ZEjR5DRaXV19Z49e+JQampq48eP//vvv+lBMjMzp0yZgrx169bN2toaFaa2tvaGDRsaGhqEEmNtbU3OIJfL5fP59Ar18PBoamoSCoVZWVkDBgyguH711VeUaFlUsajEuLu7U15naWmZnJwsr/KXUIYxq1atYl0RCiptFok5deoUJdrs7Oxbt24ZGRlRnnt5eZEDrlq1ihCNjo6OUDJycnLGjRuHQhkYGFhbW2Px6N69u5eXF0rwkydPKK9ITEwkx0NJ8KVLlxjTyeFwmpqa1q9fT0/z3Llzy8rKRGVQ8oCY7OzsmTNn4qzZ2Njo6uoSBKGhobF69eqqqqpWpaKhoWH58uWU1xkZGcmx/MWDe8LZs2ejJytWrEBPevfunZOTIyYsmijjlNTU1DQ3N8uYHnv7coJ4TRCvCwoEYpNdh7zxeHX4YUGBAD2k/Ltzp2HVqmryEw6ntKmpef36GrrnuXMry8qorw4M5NvaliEPmpqvra3LzM1L0Z9mZqVBQXx6Cq2t3/pH/7jcqoaG5uXLqyivMzIqpWfNzOxN5Gpqr3v1KjU1ffsigng9YEDZTz/ViSpkXCY7dtQK5QG7vr1VJB8HVWrMQjDOc+iTCsawhw4dMjZ+Y2lcQ0PD2toaf0iyt7ePi4uTpa9oFeUP0+xmjACgyoDG21morq4eOXIk6rCcnZ0jIiKys7OTk5N9fHwMDAy2bNnC2H9hiybu7u5ZWVnoYX19fUhICPqaa2dnV1FRQQ5SW1vLa8HR0RGF3bx5M4/Eo0ePsOfZs2ejSX9wcHBjYyN6mJmZiS/E8/f3Z8wOHpy2bdtmYmIyceLEP//8E+Vo7969aGVJTU3tzJkz9LDsXnrs2DEU54EDB6qrq9HD4uLir776ilHfQKVnZmaGTJ7ieUBVVZWPjw/6JDxlyhScgFY5d+7cqVOnvvvuOzx6LVq0yNzcfP369YcOHfr666/RihlBEOvWrauoqLCyshowYMD27dt//vnn5cuX48Hy9OnTMlaxUCgMDg7m8XibN2/GifHw8DAzM9uwYUNAQMC+ffvwRSz9+/enqHCsK11CGTYwMECSFhkZyboiFFTaLBKTnp6OsjNs2DAUZ3h4uLa29pQpU3x9fXk83ooVK7AB3sDAQBwwMjKSx+OhOzkIghg2bBi5GR4/flwCoXuTMPQ5adSoUQkJCeihQCC4fv16//79Uczl5eVCobCsrIzS8Cka78mTJ3k83owZMygaL0onj8dDmzI4HM4333xjYGCwb9++5OTk7OzsiIiI8ePHo1AjR47ErY91QERSUhISGEtLyz///FMgeKMm8fn8gIAA1IE4ODiUlJSIlwoul6utrb1kyZKffvpp586dVlZWeBYrl/KXVuP18vJCf1pYWDx79kx8WKTxqqurOzs7I1VfXV3d2tp6+fLl5F5aaRpvbW0zj1e3Z0+ttvZrdfXXW7fW8Hh1PF5dXp4gMrIB/TYweKvxfvNNjYHB6337apOTG7OzmyIi6sePr0BxjhxZXl39P1rl7NmVBPG6W7fS4GB+Y+Nbp8zMJg+Ptxqsv/9/k4E4d67+1Cn+d9/VYo2Xy63S1n69ZEnVTz/V7dxZa2VVRtd4sWb+6afV+flvS6C4WODtXaOu/lbv5fOVpPGy69vFI9U4qFJjlowa7yeffIJcv/rqq9LSt5UeHx/v4OBAEISuru7169dZ9xWtovxhmt2MEQBUGdB4OwtffPEFnhhRvjHHx8d36dIFTZoZNd4xY8agT7BkEhIS0IbGjRs3Mr6Ry+UyTnzpyk9ERATdyc3NjSAIPT294uJiMYOTjo7ORx99RMlRTEwMyk7Xrl1fvHgh+0sbGxvRB90lS5bQQ6FL/Cgab0VFBVIV9PX1nz9/Tgny/fffo/Tv2LFDKA145OvTp8/AgQPJM/L09HS0JVhfX3/FihUzZsyor6/HrhcuXMBTf3lVMU6MjY2NnZ1dUVERduLz+cOHD8camlwqnZ0My1IRci9tWRKDyg0l5tChQ2Sns2fPIicHBwdKKHTVJHkNUCoOHjyIguNpFiYjIwMt9SCNV8KGv2PHDorGi0FTKE1NzS5dusTHx5OdBAIBXoxdu3at7AErKirQBr8uXbqkp6dTIrx48SIKMm3aNPqKHFkqOBxOamoqdnr16pWenh55Fitj+Uul8W7duhX9Jgjixo0brYYVv/9z7dq1kn+Pk4vGKxQKc3MFgwaVa2u/vnDhv62JDIfzZslUU/N1ly6v4+P/J3kCQfPMmW80W4J4vXZtNV3jjYhgiNPN7Y2Tnt7r4mKGBCcmNqII+/Qp43BKU1P/20m+eiXQ0/sfjffw4beZWraMujugpXXXtonGy65vZ4TFOKhqYxY7jffw4cPI6fPPP6c4lZWV9ejRA21QIo+ALPoKMSh/mGY32gKAKgMab6cgNzdXQ+PNCSJNTc2XL1/SPaxduxb1bpT+Ky0tzdramnGlVCgUfvjhh6ijZ9ymJYnG+8knn4wePZrRKTo6GgU/cuSImMFJW1ubcT/PypUrkYfVq1fL/lJ0oSVBEN999x09VHx8PH2k3759OwrCOA41NDSghT49PT2KwiAe8j0if/31F8V1wYIFuFjy8/Mprv369UOulZWVcqlicmJu3bpFcT1+/DhyWrduneyVzlqGZakIuZe2LInBGu/YsWPpYXv16kV/newa17x581CZoyVQCmjBVr4aL+OkGWUECYCGhsarV69kDIiTwRhEKBQ6OTkhD5cvXxYjFWfPnqW4Ll++3MnJSV7l3yq4J6SYLXBxcZFQ43VwcPj444+//vrrzz///MMPP8RbJQmCWLFihTI13qdPm6ysyvT1X9++LfK4B9J4CeK1l9f/6LSI7OwmDY03rhoar1+9+m8CPvmkevRo5m42OroBRXjkSJ0YjZcgXp89S938vHx5lZPT24W1iopmtP6srf26sJAh73x+s5FRqTI1Xln6dlERSjsOqtqYxULjraioQI1LV1cXr+4yfhbcsmWLLH2FGJQ8TLMebQFAlQGNt1Pg4+ODuidnZ2dGD9ikilT91+rVq1GozMxMdhqvGLBNmsWLF4sZnKZOncoY/M6dO3giKPlKhaiXpqeno+fvvfce/SNrU1NTYmIieRbe3NyMbXj8888/jO/6z3/+gzwEBARImDzy6MXhcOjDG14knDJlCj3s/Pnzpa0R8VWME2Nubk5PDDJgRhCEm5ub7JXOToZlrAj5lraMicEa77Fjx+gBXV1dkevjx4/Jz2XUuBYuXIiCX7lyhe6am5ubmJhIUYZl13jv37/PmBi8Rfn777+XJWBzczM+fBgTE8MY5MiRI6IqF0tFt27dWu1blKbxIoxaQL9b3Th9/PjxvLw8ysOCgoI5c+bgCOkKv4I03oSExu7dS01MSh88EFekWOO9f5/ZG97b/P33EumNRUVvDw8vXlwlRuPt1q0Ub4dm5OjRtzmaPFnkPuGFC6uMjEqVpvHK0rczIu04qIJjFguN9+jRo+j5zJkzGd+YkZGBPPTo0UOWvoI1ch+mFTRjBIC2BW4n6hRERUWhH6Ksg9rb29ONDVJoamrKz89/+vRp+v9TXV2NnMgWU1lTUVHx/PlzHDmeKYqPXJQhx1GjRqEfVVVVycnJMr7U1tYW7eZ68OCBs7Pz3bt3ya4aGhr29vZk464pKSnIVLW2tjbeNURhyJAhlNqRCsYqMzExQT8YX4otbVRVVcm3ihkTY2FhgX5UVlbKXunsZFheFSGX0pZXYhjDSlLaLMCHcufPn793797Xr1+TXXv16mVvb4/NNcsFNTU1itFpDK56vBeAXcCUlBQkYGpqaqI6kHfffRf9iIqKIhsAJ+Pg4IBPUKsCenp6EREReMXpq6++ysnJEeN/5cqVaEMmGQ6Hc+7cORcXF/QnnvsqlLt3G8ePr1RTI6KiDEeNar1I1dQIe3tmu8fvvfc2eHR0E6OHiorm588F6elv/2VnN/9/n/P2ByMODhqamuKGyFu33grJu++KTH9ISNfy8m6MpqEVjVyGb2nHQVUesyTn1q1blM6Qgq2tLdqbnZ+f//z5c0X3FUoYpuUyYwQAVUOFRmtAcTx9+hT9oNs0Rujo6BgYGDDOlRsbG0+cOPHbb78lJCQ0NDQwBidbwJeWlJSUgwcPRkRE4Gs8pIpc1B0/enp65ubmaABIT09H5iVYv1RDQ+PQoUNo/S0qKmrChAnW1tZz5sxxc3NzcnJC+3/I4N1fenp6+AgQBfxtNSUlhZAexhtHsKkPtDmWAt6vSL4kRi5VzPg6ZAuH/jp2lc5OhuVVEXIpbXklRtrSlgVPT88TJ06kpKTU1tZu2bLl22+/nTRpkpub26xZs+jKklwwNDQUdUMVOnmLWrQsAf/991/0p7m5OS43CtjMaV1dXXZ2NjbTRUbaC8YUira2dlhY2PsthISE3Lx5s7q6eunSpX/99Ze0c1N1dfUff/zx+vXrBEHExsaWl5cjE7UKIjy8Yf786vp6QiAQ0rpSZgwN1UTpjX37vv3+kp7+Pw0hJaXp4EF+RERjfv5/bzkiI34QMzdv5bPOv/++fZ2NjQotJMh3+JZ2HFTlMUtycL+dkpLy888/M/rR1tZGr0tJSWEcoWTvK5Q5TMsyYwQAlQU03k5BeXk5+tG1a1dRfnR1den9V2FhoYuLC7pm08rKatq0aZaWlniICg8Pj42NlSVhR48e9fLyEggEGhoaU6dOdXBwMDQ0RPOz2tpabOdQDGKub+3atSvSeMvKymR/6aJFi4yMjNatW4cmzTk5Ob4tmJubL1++fMOGDfhbNbp7E/0oLy//8ssvxWehpKSEkB7ycTtpXeVexYyvE7X0x6782cmwvCpCLqWt0MTId6EVo6OjExUV5e3tffLkyaYWrrWwevVqZ2fnjRs34sVAOb5RlBOuekqLljYgrggxskQ+Fvv69WtGjVfyC8OVgIuLy6RJk9Dv48ePDx48uKam5s6dO0eOHMFGaCRn6NChFhYWBQUFaC/r6NGjCcXwxx8Nd+40GRmp1dcLa2uJhQur79831NZuRUUXU/Bdu74NW1b2X8326FG+l1etQEBoaBBTp2o5OGj8f5fz5u7c777773XxLN6IKC0VUhLQ5ihi+JZqHFTlMUtycHdxpgV2/baMfYWSh2nWM0YAUGVA4+0U4O000q7/eHh4oE525cqVfn5+lG05+fn5sgwtkZGRa9asIQjC2Nj4r7/+oizDVlRUSKLxigFnFg8MMr50xowZ06dPj4yMPH369Pnz59EOz6KiIh8fnxMnTly5cgXPC/EbLS0tr1y5Ij6drX4aVygKrWI6rMufnQyrVEWoVGIkx9jY2N/ff/fu3WfPnj1z5kxMTAy6yP2vFrhc7smTJyXXt5ubxe0dZdGiWQSURJbITtK+rk0gV4G1tbWPjw9SdL29vadOncqosYunR48e6HJ1ylZ2+fLXX00TJ2qeO9fVxaXq4UNBYqJg06a6n356czsUO3C94UqLjGxcs6a2RZLV/vrLwMHhf7q4iopmSTTeVsEdp1z3WKhi3y75ONgxxizc/Pfs2YMvVxMFtiDYrrPMesYIAKoMaLydAhMTE7R9tKKiQpSfmpoaypOkpKS///4bWUM5dOiQ3E+s4fNm3t7eFM1Hcmpr30xlGMGZJX91lvGlampq41s4evTo7du3AwIC0A0KJSUlbm5umZmZ6CZPvH2oqalJ1NlCVUDRVUyHdfmzk2GVqgiVSoy0dO/efU0Lubm5wcHBR44cyc3NRTcA29vb49s4yTDOlurq6uTbolkExBUhRpbIToy7AVWczz//HH2eqKur43K50dHR0u4CwK1JzDqP7EyfrnXhQlcdHbUzZ7oOH15RVUUcPMifPFlz2jRxK361tULRFffWycTkbX4PHnyr0Hp761LUXTliZqael/dG4CsrRaatw/TtEo6DHWPMMjMzy8vLQz/apN9WfpbZjbYAoOKo0IETQHEMGzYM/Xj27Bmjh8rKSnr/hY8Uvvvuu126dKGHemPsWwZw/PgiEBaRo2k3ndevX+OdOTj78nop+gjq4uJy/vz5mJgYdBKmoKDgxo0bFLM3hYWFYibibY6iq1jMG6Utf3YyrFIVoVKJYY2lpaW3t3dGRga6uIggiFOnTpE94AkZYx5fvXolPv7q6mpRm+Xw6TJyi2YREFdEWQuMQTIzM9EPU1NTKysror2hpqZ28uRJtJfy3r17Bw4ckCp4VVUVLoHevXsTCmPWLC10IrdvXw0e7831zgRBcLk1BQXi9gJUV4tULJ8+ffudZdiwt7skEhLePnFyYlAV5NXDvfvu29dlZAg6T98ufhzsGGMW7i6ysrKItkD5WWY32gKAigMab6cAXdfWYhLzf4wrYrCteUYrCKI29Yn5/idJdyw+fgkjj4uLY3yOc2ppaYnv9GP90tTUVDc3t8uXL9OdxowZg+/+xXaYevfuPXjwYJR3USkkCMLV1dXCwuLHH38k2gh5VbG83ijmdexkWKUqom0Tw25WtHXr1kWLFtGf6+jo+Pn5od8U82PYyhHj16h79+61+lLGqiRXPRYGdgF79+49aNAg9ARt0qaDrZVOmzZNLlZJ5T4rbZUBAwbs3LkT/d66dWtqaqrkYY8fP46W6K2srERZr5E7ixbpcLlvlnaLi4Uff/zmul0xnu/fZzbFfPfu2+cffvi2h6mvfxuPlpaamDVhGZk+/e2idGwsc8IIgpg0qdLGpvzUKflYVFJ+3y7tONgxxiy8k1lUX4FO61hYWNjY2LS6h6VdZJndaAsAKg5ovJ2CBQsWGBoaou0xDx48oHsICAgQY+AUXblJcW1ubhZ/rQ7e10S+22PmzJnDhw9HacDxo5vrKeALdcVz7949xpkcno57enoyZkqql5aUlISFhV26dInRFZUtQRDkixnWr1+Pfpw4cYIxVHp6+pUrV4qKimbOnEm0ETJWsSxvlLbS2cmwqlWE8hPD2AyvXr06fPjwZcuWtRo8Ojo6JCSEUXfV19dHh40p95EMHDgQh6UEiYiIEHV7B5njx4/TH8bGxiL71YaGhgsWLJAx4Lp169CPX3/9lR5EIBD8/vvvFJ8KLf+CgoJNmzZt27ZN1JozO9avX4+uX2poaPj444+bmv6rjP3666+irOzcunVr8+bN6Pfnn39OKJGjR/X7938zLbl5s+mnn8Qdrz1+nEFvjI1tTEl5048ZGqotWPBWBe3b9+3qa3w8gy56545IBVUq5szRQlaaHz4UYLvNZNLSBLdvN7182ezszGZX6vXr179vQULb/oro21mMgx1gzHJzc0MvjYmJYbQSj+YbhYWFjo6OjGuw7S7LrEdbAFBlQOPtFHTt2hVfq7h06VKKJZLffvvtxo0b9IM348aNQ9e1FxYW0m9l3Ldvn/hNPra2tpR9jFVVVTdv3nz8+DGy7rBw4UL03MfHh/JVOD8/f+vWrZJkzcLCYsmSJXgDM+Lw4cPoDj0bGxvKCUNZXhoSEvLkyRPKw7q6uvDwcLS0RV564nK5U6ZMQaEuXrxICVVTUzN//nxUHVhDUD4yVjELWJc/OxlWtYpQfmLMzMzQOUzyduKYmJjHjx9Lbhxr+/bt9Ifnz59H0y+UZgzKINrtjPfjoenasmXLGHezk9HT07t+/fpvv/1GflhcXLx8+XL0+/vvv9fX15cx4NKlS5Fl4wsXLtDXrPbu3ZuRkUEQxMaNG0XdnCzf8p8+ffr333+/e/duvFdcLmhoaPz6669on3lCQsK+ffuw088//9yrVy9XV9dDhw799ddfSUlJ//zzzx9//LFw4cIpU6agZaVhw4axsPMsC/r6bw70oqWsTZvq/vmHWR3V0yOuX2/87bf/UXqLi5uXL3+70/L777vo679d0V248K3q6+PDz8//n83S+fnNW7fKZ1FOQ0Pt11/10VlpT8+axsb/WTpubBQuX/7m0tRly3SsrdkYpQsODt7UgoTXzCqub5dqHOwAY5aGhsapU6fU1dWFQuGyZcvoq7hBQUFnzpzR1dXFWyrae5ZZj7YAoNIIgc5Bc3MznvlZWFhs27YtJCTE399/1qxZaDRFXaquri63hcDAQKFQGBYWhnf0TZs27fTp0/fu3bt06ZK7u7uBgcHYsWORk4uLC5fL9fHxIb8xPT0dhXVyckpLS8vIyFi8eDFBEM7OzshDfX39+++/j2IwNjbeu3fvjRs3YmJi9u/fz+Fwpk2bhpw4HA5K0pMnTyoqKtBvfBf8wYMHhwwZ0qNHj61bt4aEhAQEBOA9SMbGxo8ePaKUA4uXCoVCvPbI4XAOHz6cmppaVFSUnp4eGho6atQodJzp4sWLlHeVlZWNGzcODZlr1qyJi4vLz89PSko6fvw4uu3TycmpuvrN5j1JOHDgAJfLdXV1RSmxtbVFKaytrRUKhdu2beNyubhGRo0axeVy161bh8Iin1iJQvW1a9cu1lUsPjGXLl3icrkeHh70wmRX/lLJMIfDkb0iFFTaLBKTmZmJIsTHKd3d3blc7unTp8W8jtwY0f2ZyMpUbm7u5cuXu3XrhnastSp148ePR2HnzZt38+bN3NzcvLy8Bw8eeHt7ozOiTk5OfD6fEgqvXmpoaIwfP97Dw2Ps2LFqamqrVq3asWMHcnJ2duZyuStXrsShcPWh9VVXV1d/f/+QkJCtW7ciJ4Igli9f3tzcTHkdu4ClpaWoBjU1NTdv3pyUlFRQUBAXF8flclGQZcuWNTY2SiIVuOoZabX8ybdr6uvrC6WBx+OhgLNnzxblB39I0tTUTEhIQA9btcEzbNiwly9fSpWYlmjLCeI1QbwuKBAweli9uprLrXJ0rEDeHB0ruNyq1avfCvymTTVcbpWVVRlytbIq43KruNyq/Py3sXE4pQTxmsMp/f13PkG8dnWt9PevCwnhb91ag5wI4vXy5VXkuq6vb37//bevMzYu3bu39saNhpiYhv37azmc0mnTKpETh1OK3vXkSVNLXddyuVWurm9dbW3fpmTduhox2Q8K4mtpvfE/cmR5WFj9y5eCp0+bQkPrhw59UywjR5ZXVlKlF8Pj1aF37djxppOhgD8kvXjxQsK6kGX4ZkTacVB1xqzAwEAUITpsjOc5p0+fpk8qHB0dyelEnDlzBt3uM3DgwKCgoKysrNzc3Dt37nz88cdqampaWlqhoaGy9xXyrUrWwzTrGSMAqDKg8XYiBAKBr68v3nqE6NmzJxqi8NQQsWrVKhTq5s2bAwYMoEyGxo4dm5SU5OXlRX44fvx4yhsPHz5MuQLO3t6ePGBXVVWtWrWKcjpFX19/z5499B13d+7cQbdlkOHxeGVlZR999BHlrN2ECRPS09MZy0HalwqFwtra2l9++WXChAmMZhLHjRt3//59xnfV19fv37+fbuvV1NR0586ddFVBDKIuPi0vLxc1f7W2tkZhGQOOHj2adRWLTwzWahgLk0X5SyjD5ubmaHiWvSIUV9rSJkbUiV8vLy8xryM3xvz8fLS1FaOlpbV//35JpO7x48efffYZ45UbJiYm27Ztq6uro4fi8/nLli0jN0kdHZ1NmzY1NzdTZENHRweHIn+wOH/+fI8ePcg+DQ0Nf/rpJ4GAQY9iHZDP5//www+mpqaUrNna2gYHB9P9i5IKXPWMSFL+eBM7l8sVylvjra+vx5rDkCFD6uvrhULhd999J+omFQ6Hs2fPHsaalV3jNTJ6q5eS/xkZlSJXO7u3ui7lH9JCyRpvS13X9+jxP7EZGpb+9FOdQEDVKquqmletqka6KP6nr/96z57akhIB5V137jS01PVbXZfyz9q6THwJPHrUOHnyWwUb/9PVfb12bXV1tUh1V7zG29TUhKR06NChQmmQZfimI+04qDpj1qpVqxgj9PLyok8qKOnEJCYmuri40E/1T5gwIT4+Xi59hXyrUpZhmvWMEQBUFjXlm9MA2pb6+vq7d+/m5OTo6ur26dNnzJgxrd5agfr65OTk6upqExOTUaNG4R3LrVJSUhIVFVVQUKCtrT1o0CBHR0f6gFFaWhobG/vq1SstLS0rKysnJyf0IVYqXr169fDhw4KCAmNj43fffbfV+yfZvbSmpiY5OTkjI6OyslJLS8vCwmLEiBGtXsHX3NwcHx+fkZFRVlZmYGBgZ2c3YsQIlbrkU5YqZocslS5Khrt27VpTU2NnZ0ffdKeCFaHMxAiFwocPH6amptbV1Zmbm48bNw59HZCcrKwstKTD5/MNDQ3t7OwcHBzEpzY3Nzc2Nvb169c9evR4//33KTMkOhYWFoWFhRwOB81BBQJBbGxsdnY2n8+3trYeP348WlWWY0BEc3Pzw4cPMzMzKyoqTE1NB7dAKLf8GxsbL1y4oK2tPXv2bGmvEZKFV69epaen5+bmIsurpqamgwYNGjx4MGtjXcOHVzx+/Gave0GBMYcj/4xYWJQVFgo5HLWCgjfr5AKBMDa2KTu7mc8XWltrjB+viSw/M1Ja2hwb2/TqVbOWlpqVlbqTk6aurhxskjFSVNQcF9dUUNCspkZYW2s4OmoaGrbyLn9/vqfnG/PmO3Z0+fbb/zkOeu3aNbT/xd/f/9NPP23zvp3dONjexyxEcXFxXFxcQUEB0vpGjhyptIy3SZZZzBgBQDUBjRcAgI5AeXk52iw6efJkhV6PASgIiuKqhICA3BGv8b58KSAZ8JICbH2KovESBPH8uaDdzWKsrNQ1NdVa1XgbGoTa2mp8Pn/YsGHPnj0bMmRIfHy8+M83AAAAACMKv8kaAABALsTExBw/fnznzp3ovCvdFf2YMGGC0pMGAMD/8OOPfAODt0rd4sXatrZvVNbp06uRLWVpEQpNRDkNH14p6m5elSUnx8jK6k2BXL3aEB//tkAePqSa6UpPF9jY1M2aNevZs2c9evQIDw8HdRcAAIAdoPECANA+yMjICAwM7NevH6NJ54MHD6JzoStWrGiL1AEA8F8OHPjv3UKOjppI4wUoXL7c6O8v7nre+vr6kpKS995779y5c9h2HQAAACAtoPECANCe2LVrl729PbY/SRBEbW3txo0bb9++TRCEr69vq+dFAZWitLS0qqoKnb9F/+fk5CCLU2ibutwDAoojIsKgoYG64ir7gd7S0uaqqjfRoutIBQIiJ+ftvbtEe2bv3i7ffEO1X2Bs/N9MmZmZRUdHd+3aVfK7xAAAAAA6cI4XAID2wcWLF93d3VGXNXjw4KFDhxobGxcUFERGRpaWluro6Pj6+np6erZ1MgHp8PT09Pf3pz/38vLy9fVVRECg3eHpWcO4FurlpePry3A5MwAAAACQgTVeAADaB3PmzHnx4sWVK1eio6P//fff6Ojouro6IyOj4cOHT5w4ceXKlbC62x5xdXWl3CeEwNdjyj0g0O5wddXq0YNhodjREeYwAAAAQOvAGi8AAAAAAAAAAADQMYFrtQAAAAAAAAAAAICOCWi8AAAAAAAAAAAAQMcENF4AAAAAAAAAAACgYwIaLwAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TOAuu05HbW3tmTNn7ty5U1BQoKura2FhMXLkSBcXF2tr67ZOGgDIxKNHj/7444/U1NS6urru3bvb2NhMmjTJyclJW1tbTKi5c+eWlpYSBHHnzh0lJhZolxw8eDAsLAz/aWJicuHChQ7wLkBBlJWVzZkzh/xk3bp1rq6ubZcigKipqZkxYwb5CVQKAHR4QOPtXDx+/HjmzJm5ublaWlp2dnYEQVy9evX48eNGRkbl5eVtnTpAIfz2229eXl7vvPPO1atXTUxMiA6Kl5fXoUOHCIIwNze3trZOTEwsKSnZt2+fr6+vl5eXmICxsbGFhYVKS2cnqY6OSklJSXZ2NkEQL1++bG5u5nA4HeNdFCoqKlxdXR8/frx///5PPvmEUGFUvEEJBAJUiVVVVejLmoeHR1snqrPT3NwMlQIAnQ3Y1dyJqK+vnzVrVm5u7oABA54+fZrcQnx8vJ6enjLTcLeF1NRUpb20k7Nx48by8vK4uLjff/+d6KDweDyk7u7bt6+wsPDBgwd5eXkff/wxoXp0hupo16Snp6M+qqamhu66Z8+e7Ba6d++u6JQo810Uzpw5ExUVVVlZuWHDBkK1UfEGZWZmhipx7969bZ2WdtniFIGBgQFUCgB0NkDj7UScP3/+xYsXBEFs2rTJxsYGPXRwcJg7d67S0lBQUDChhS1btijtpZ2cwYMHox8DBw4kOigHDhwgCMLKymrTpk3oiZaW1rfffkuoHp2hOto1+/btQ31URkYG0VkZNGhQe5FSaFDtHWhxAAAoAdjV3ImIiopCP4YPH05+7ufnhxQGoENy6dKl06dP9+/ff+LEiURHpLi4GE2V7O3tyc/79u1bUFBgYGBAqBIdvjqADsAHH3wQFRWVnJy8cOFCQrWBBgUAAAC0Cmi8nYji4mL0w8jIiPy8awttlChA4RgYGKxatYrouBQVFTEKNkEQyjz6KCEdvjqAjoFTC4TKAw0KAAAAaBXQeDsRTU1N6IeGhkZbpwUA2odgl5eX19fXEwShra3drVs3uccPAAAAAAAAKBTQeDs+JSUlmZmZBEEgm4ToEpeCggL029TUtF+/fthzWlpaVFRUWlpaaWmplpYWh8NxdHScOnWqjo6OmFdUVlZevnz5n3/+KSkpUVdX79Gjx/DhwydOnEg2uPL8+fOioqL8/Hz0Z2lp6f3797Grmprae++9R485KSnp2rVrWVlZtbW1pqamDg4OU6dONTc3p/tMTExEmgmie/fuffv2RTm6cOFCdna2QCCwsLAYNWqUmHPLjY2NCQkJ9Oe2trZmZmbo98uXL/Py8siuFhYWlLudlJDs+Pj427dvZ2Rk1NbWGhoa2tnZOTo6vvfee+rq6q1GTqe2tvbWrVsxMTGFhYVaWlo9e/acOHGik5MTXYfE4oRxcHDQ1taurKwMDg5OTk6ura3t06ePm5sbZY+x5EieGJTBp0+foj+Li4vJQmVvb6+rq0vIwPXr193c3Ph8vpGR0bVr1xwdHWWJTcLqkKRm2RUmau8DBw784IMPkKl2REZGxuvXr/Gf3bp1GzBgAP6zoKAgJycH/6mnpzd06FDxwsDn88+dO/fo0aOioiIDAwM7O7vZs2fb2NjI0kirqqquX78eFxdXVFTUpUuX3r17T5w48f3331dTU5OLiOK2j/fCJCUl8fl87KF37949e/ZUdNchCc+fPz937lxWVhafz7eyspo9e/aIESNaDSVhpySq9NBvUTV47969K1euvHz50sDAYPTo0fPmzevSpYuolCQkJISFhb148UJXV7dv377z5s1DdiUSEhIaGxuxN3Nz8z59+rBrUKKc7ty5ExERUVRUZGVlNWPGDPKgIxAIQkND4+LiysrKrKys5syZQylVNIThP7W0tJAHdtXBiORCrogMyj0x4qWCXYuTPFWUUBcvXnz48GFFRYWFhcWYMWNmzJihpaUlJggAAB0NIdDROXXqlBgBWLBgAfIWGBhoa2uLHmpqalpbW+PJkJmZWVBQkKj4jxw5oq+v/8YMmrp6z549cSg1NbXx48f//fffyJv4jWc6OjqUaDMzM6dMmYJcu3XrZm1tjcYnbW3tDRs2NDQ0UPxTJo5cLrehoWH58uWUFxkZGYkpK/whgMKpU6ewH29vb4qrl5eXMpOdk5Mzbtw49NzAwMDa2hrPR7t37+7l5YXfQo+cMdf+/v5oUq6urm5paYl3AtvZ2d24caNVccrOzr516xZ9RzG5WCRHqsSI1xaePHkiyRvxKyjPL126hOrO1NQ0ISGBRV7Ep5ZeHZLXrITweDxUmGpqar169TI1NcVvHzBgwE8//dTc3CwUChcsWEBO2OzZs8mR+Pr6kl3t7e3FC0NsbCx9M7mvr68sjfTQoUPGxsZoGd/a2hpnxN7ePi4uTi4iKqrtY3x8fMhvQXnkcDjy6jrEgN/V1NS0fv16+lvmzp1bVlYmKrhUnRJj6WFXeg3y+Xx3d3dKEEtLy+TkZHpKSktLGT84ent7CwQCitisWrWKdYNiTCf91R4eHk1NTUKhMCsri/yVB/HVV1+RX0cZwqStDh6Ph1x5PB5jdqQSckVkUL6JaVUqpG1x0qYKc/78efzVCWNra5uUlNRqpQAA0GEAjbfjk56ezmth2LBhqHPfs2cPesLj8W7evIm8zZ49G82HgoODGxsb0cPMzEx8T52/vz898mPHjqH59IEDB6qrq9HD4uLir776ijKli4yM5PF4e/bsQc+HDRuG08Dj8Y4fP06ONjExEQ1Rffr0wTpzVVWVj48P+pQ7ZcoUnEjEuXPnTp069d133+FBl8vlamtrL1my5Kefftq5c6eVlVWrGm9tbS2Px9u9ezeKxMDAwM/Pj8fjpaenYz9xcXE8Hm/jxo0EQYwePZrH48XExCgt2VVVVWjdY9SoUVgNEwgE169f79+/P4qkvLwcPQ8ODubxeJs3b8aR07P82WefIVdPT8+CggL08MmTJ5MmTUJq54kTJ8SLU3h4uLa29pQpU3x9fXk83ooVKzQ1324eCQwMFFPasieGkkFHR0eyUInRAVrVeM+cOYOWlDkcTkpKilAeiK8OqWpWEvAE/dNPP83Pz0cPi4uLvb298XIxn88XCoU3b94kt02KxovmhXhqSNZ4MzIyTrXg4OCAXP/8809dXd3Bgwdv3br14MGDuPdAGi+7Rorvg/3qq69KS0vRw/j4ePRSXV3d69evyy6iqO3zeDy8kr9582ayOD169EiMxitj1yEe/K5vvvnGwMBg3759ycnJ2dnZERER48ePR28cOXIk7oHJSNsp0UuPrPHSZdjDw8PMzGzDhg0BAQH79u3DlpP79+9P0aWrq6tHjhyJXJ2dnSMiIrKzs5OTk318fAwMDLZs2YKyaWBggBIQGRnJukHRJW3RokXm5ubr168/dOjQ119/jU8orFu3rqKiwsrKasCAAdu3b//555+XL1+OV/9Onz6N40RDGI/HQ8bwpK0O8cqVtEKuiAyyTgw7qZC2xUmbKkRISAiSc319fR8fn5SUFFRTH374oamp6bZt28RUCgAAHQnQeDsRSKelzGAorhEREXQnNzc3tJuxuLiY/LyxsRF9ZF2yZAk9lKenJ30RA137Tp9Vk6moqEBTf319/efPn1Ncv//+exTDjh076GETExORa58+fTgcTmpqKnZ69eqVnp6eeI0Xg2fwsbGxjB7Qp/3Lly8rOdkHDx5EPrOysiiRZGRkoMV2il6EI6drvEePHkVOy5cvpzjV19ePGjUKfU2Pjo4WI059+vQ5dOgQ2ens2bPIycHBQSgxrBMjJoPsNN5Tp04hndDS0vLp06dCuSIqtSxqVgyHDx9GsS1btozuiqURabwStk26xksXhr59+65du1YgEGCnL7/8Emu8LBopzsjnn39OeWlZWVmPHj3QJpSioiJ5iSiXy0VOiYmJQtFQNF5pu47w8HAxkTO+S1NTs0uXLvHx8WQngUAwc+ZM9Ma1a9dSAsrSKYkZL3AN2tjY2NnZkQufz+fjuwAoefziiy+wgKHNBZj4+PguXbqgzxD0IhWPmOZPlrSBAweWlJRgp/T0dHRUR19ff8WKFTNmzKivr8euFy5cQAFHjhwpr+oQo/GyFnJFZFD2xEglFRK2OHapysnJQVY5tbS0KIvAzc3NH330ET6uBRovAHR4QOPtRIjXeD/55JPRo0czBoyOjkYBjxw5Qn6elpaGnn/33Xf0UPHx8ew03u3btyM/GzdupLs2NDSgJQs9PT26AoAHXYIgzp49S3Fdvny5k5OTUAICAgJQJIsXL6a78vl8U1PT3r17k2f2ykn2vHnz0GSL/GrMjBkzJNd4Kyoq0GKFtrZ2YWEhPbbbt2+jgCNGjBAjTmPHjqW79urVC7lWVlYKJUCWxMhX4/Xz80N/9u3bl7GlyIio1LKoWdaFiU4mK0LjHTx4MNpFiXn48KG9vX1wcDALaccZ0dXVxas6jJ8JtmzZIi8RlVHjlaTrsLS0pJSShCLKuAs6Ozsb7UfQ0NB49eoV2UmWTkkSjZcgiFu3blFcjx8/jpzWrVuHH+bm5qJEampqvnz5kp6YtWvXolCK0HgJgvjrr78orngzv7a2Nt4EgcHmLeg9GLvqEKXxyiLkcs+gvBIjoVRI2OJYpwp9dhe1Qx7ZiWCsFAAAOh5sTKEAHZKAgIC4uDhGJ3z+h+IBWxK6cuWKQCCghBo+fHhiYiLawic5ZJWDcrwQoaWl5eLigkzy/PHHH6Li6datG/1Q0y+//IIvJRbPokWLDA0NCYL4448/yEZ9EKGhoa9fv161ahXeHaq0ZKMyb2pqioiIoAf39/dPTEyU8AbaoKCgqqoqgiDGjRvHaFVrwoQJyPZYQkKCKNkgCOI///kP/SG2ifL8+XNlJkZGDh48uHr1aoIg3nnnnaioKBZWhVijiJodP348Y2Hq6OhMmzaNfq5VdlasWEExMDZy5MjExMRFixaxkHackUmTJjEaynZ1dUU/Tp48KSZVchFRCVm0aBGqJvFdBzu74ozFaG1tja4REggEQUFB+Lm8OiUxmJub02/Bfffdd9EPsgWsoKAgNEZ88MEHlpaWEtaRvOBwOBMmTBAlABMmTLCwsBDlmpWVJZfqEIVchFxeGZRLYiSXCglhl6qmpiZc/ozSZW5u/uGHH0qbGAAA2img8QIMVFRUPH/+PP3/wYs/ZEuVyPYD2tX84MEDZ2fnu3fvkl01NDTs7e3FWDdlJCUlBVlu1NbWxvugKAwZMgT9EKO+Ojg44KN6LNDX11+yZAlBEA0NDXRTLn5+fpqamitWrFB+svGRp/nz5+/du5cype7Vq5e9vb2ERn1v3bqFfuDDdRTU1dXxFk28xEqHMb94glVZWanMxMjCnj17vv76a/Tb19dXWtGVEUXULJ5l0gkJCSkvLxdvg50FaPO5hLQq7Tgjoqxk29raoizk5+eLUVzlIqISoq+vv3jxYjFdh4aGBrnrkBw1NTVR9s+xSV68H0eOnZIY7O3t6TZyGQsWx89ok19UVPKCMXITExP0g7FwsFUkpGvJXh0KFXJ5ZVBxiZGlubFL1ePHj6urq8UPK3hMAQCgwwO3EwH/JSUl5eDBgxEREfgOIQrkGwiQTnvo0CH09TQqKmrChAnW1tZz5sxxc3NjvEtGEvBOaT09PXx0hwK+BSQlJUVUPIxLW1KxevVqdLLUz8/v66+/xkN4cnJybGzsRx99RP5qrrRke3p6njhxIiUlpba2dsuWLd9+++2kSZPc3NxmzZqFzjJJzr///ot+oKtBGMGLnKmpqaL80M1gou1n6Ad98V+hiZGFrVu34t+ff/55YmIiOgOmHJRcswpCqnbXqmfcrFJSUn7++WdGP9ra2qhfSklJEXWZjVxEVHI+++wztLjK2HW4u7tLW6EIQ0NDUV8o8K086enpcu+UxCB5weIrxETVkY6OjoGBgXy/PmDIVsoxeEcrYy6wmXRR4iFtdShUyOWVQbkkRu7NjV2qsMhxOBxRd2XJPk8AAKC9ABov8JajR496eXkJBAINDY2pU6c6ODgYGhqiuVptbS22CUlh0aJFRkZG69atQ0N7Tk6Obwvm5ubLly/fsGED/swsIfjS4PLycmTzRgwlJSWinGRfvBo8eLCTk1N0dHRmZuatW7cmT56MniPz1NiqsJKTraOjExUV5e3tffLkyaYWrrWwevVqZ2fnjRs3om2KkoDTLEavw9to6fsz6TMnMtJeHiuvxMjIlClTdHR0Ll++nJmZuXr16t9//51QFkquWQUhVbtr1TPOyJkWWDcruYio5AwZMmTMmDGxsbGMXQfaNs8CMcWFK7qsrEzunZIYJC/Y8vJySlLp6OrqKkjjZUynhK7yqg6FCrm8Mqi4xMjS3NilSkKRY50qAADaF6DxAm+IjIxcs2YNQRDGxsZ//fUXZatPRUWFKI2XIIgZM2ZMnz49MjLy9OnT58+fR9pIUVGRj4/PiRMnrly5Mnr0aMlTgj9LW1paXrlyRbxndsvIkvPZZ5+hbWnHjh1D09bq6uqgoCA7OztnZ+e2SraxsbG/v//u3bvPnj175syZmJgYdGbvrxa4XO7JkyclmV7gDaViPrpjJ5xBBaEKiXF3dz99+nR1dfXQoUPz8vKCgoKmTJmCNrcrB2XWbLsAV/SePXuQ7S4xYEtUqsDq1atjY2PpXUe/fv3oRxxlh7FpqFRf2mFkUhKk6qlUSshVKjEypqpTiRwAAK0CGi/wBmzq0Nvbm8XJFjU1tfEtHD169Pbt2wEBAejyg5KSEjc3t8zMTD09PQmjwhuimpqaRJ2SUhru7u5mZmYlJSXh4eGvXr3q1atXcHBwdXU1fZVG+cnu3r37mhZyc3ODg4OPHDmSm5uL7he1t7fH9yGLwczMLC8vD33REOUHOzFuVJMjqpCYs2fPamhomJiY/P7775MmTRIKhatXr3Z0dMTX4SoHOdYsuxUzxgliXV0doXRwRszMzNq8N5CKefPmeXl5lZaW0rsO1qdVa2trW20a5D01KtWXmpiYoMMyYhp4TU0N0X6QtjrahZCrVGJkTBUu/A4jcgAAyAJYrgL+5zQXMjJJAV9M0iqampouLi7nz5+PiYlB+4UKCgpu3LgheUqwrZ3CwkIxUwrloK2tvXz5coIgmpubT5w4gVZsdHV1P/74Y9VJtqWlpbe3d0ZGBrrehiAIur0cRnCaMzIyRPnBdjWlskjEAlVIDF7mmjhx4oYNG9B8aMGCBQ0NDURboNCapYOXRBgF+NWrV4TSwRkRYy9XNdHR0Vm2bBml69DR0cEXsbCgurpa1CcMfGRx2LBhqtmX4oQ9e/aM0UNlZWX7Uj+krY52IeQqlRgZU4ULv6ysDO+LVoVuDQCANgE0XuB/TFIx7sIS9Yk0NTXVzc3t8uXLdKcxY8asXLkS/Wa0gyVKi+7du/fgwYORBzGX0Li6ulpYWPz444+EgvH09ERrMgEBAVFRUUlJSQsXLqRfkKC0ZG/dupXxSgwdHR18E4kow2MUpk+fLt6gKJ/PR5cqEwQh+SFSdqhUYgiC2L17N5pmPXr0yNvbW9GvU1DNoo21jEyaNMnGxoasQhsbG6MfaEmZgpioFAfewYg2eDMSGRlpYWFhY2Mj91Voyb/0MYLvAsVdx7x58xgtDEnO/fv3GZ9jO/nk21ZUqi/FCaOY9G81a6qMVNWhmkLeLlocu1T1798f34MVGRnJGEpxF90BAKBqgMYL/I9tSaxUkLlz5w5jqJKSkrCwsEuXLjG6ovtsCYIg3/KCtzc3Njbih1evXh0+fDhaEiEIYv369egHWhuhk56efuXKlaKiopkzZxIKpk+fPki/ysvLQ0c6KTarMMpJdnR0dEhICKNOoq+vj1YpJbxWZ86cOciWb0JCQlJSEt1DaGgomj24ubn169ePdZrbXWLQp5+QkBAkrr6+vn/++SfFQ01Nzfct8Hg8ubxRETX78OFDbLeZTFpa2u3bt1++fEk+jq6vr4+OwD179gzdaoMRCoXIbrmScXNzQ11TTEyMKLO3fn5+hYWFjo6OosyxSgtjHzVz5szhw4c/ePBA8nj69es3adIkSboOyTl+/Dj9YWxsLLK0bGhoSLl3V3X60gULFqARISkpibEYAwICiPaGtNWhOkLevloc61StWrUK/fD396cHSU1NvXfvnqhUFRQUbNq0adu2bZKYHwMAQPUBjRd4w8KFC9EPHx8fyjpSfn4++dYWOiEhIU+ePKE8rKurCw8PRwtH5O/cZmZmyHAieTdRTEzM48eP8Z5SLpc7ZcoUFPPFixcpMdfU1MyfP58giKVLlw4cOJBQPPjUbk5OjoODg6gttcpM9vbt2+kPz58/j05gohe1ioaGxq+//oosIXl6elKunsrPz9+0aRM6DSXqahM5olKJQfTv3x+/i8vlUtpFUVHRphaCg4Pl+FJF1Cx5HommlWiv/rJly/CFT4ipU6ci/Xb9+vVNTU3Y/xdffMHOnq2MaGhonDp1Sl1dXSgULlu2jL6mFBQUdObMGV1d3Z07d8rrpba2tugH7qOqqqpu3rz5+PFjaU31kLuOoUOHvv/++7IkTE9P7/r167/99hv5YXFxMapNgiC+//57fX19sqvq9KVdu3b18fFBv5cuXUoxt/7bb7/duHFDcnMPqgCL6lAdIW9fLY51qr766iv07e/atWuUT5Pl5eVLliwhXzFIYfr06d9///3u3bvxoRIAANo3QqCjEx0dzW2hd+/eqNLd3d3RkwMHDiA/9fX1eDZmbGy8d+/eGzduxMTE7N+/n8PhTJs2DTlxOBwU8MmTJ0KhEK/9cjicw4cPp6amFhUVpaenh4aGIrVQU1Pz4sWLlPSg+3uRJZ7c3NzLly+jTcJ3797FfsrKysaNG4eGujVr1sTFxeXn5yclJR0/fhzN0Z2cnKqrq8nRHjhwgMvlurq6oshtbW1RUtetWydjATY1NeHNUcePHxfjUwnJHj9+PPI5b968mzdv5ubm5uXlPXjwwNvbG92W4eTkxOfzked169YxRp6cnIwjDAoKQlvZR4wYERYWlpub+/z5819//RVNNczMzO7fv09OQGZmJqM4nT59GnlArngC7eLiwuVyfXx8JClqaRMjKoNcLjczM1OSNwqFQg6HI6YzdHd3R67Ozs4CgQA/x4sDy5Ytk/BF4qtDqpqVqjBHjhwZFhb28uXLp0+fhoaGDh06FD2srKykBHn69Cm+c8XS0tLd3X3u3LkcDsfIyAivFXfr1g0l++rVq6KEgcvlRkdH05PErpGeOXMG6dsDBw4MCgrKysrKzc29c+fOxx9/rKampqWlFRoaKkcRTU9PRwcZnJyc0tLSMjIyFi9ejARAKBQGBgai4MhOga6uLvoTR06msbERX7177NgxoZRQ3sXhcNB1Wa6urv7+/iEhIVu3bsXSu3z58ubmZtk7JVHjxa5du8TUYG1trVAovHTpEpfL9fDwYBwvmpubsTZoYWGxbdu2kJAQf3//WbNmEQQRHByM8sLhcGRvUOLTuW3bNi6XO3bsWOQ6atQoshAyigfKPgKnU5LqqKioQBE6OjoiJ0dHR3Ji2Am5QjMo38SIl4pWWxzrVCESExPxKaSZM2cGBASEhIRs27atR48eQ4cOxTY7caVUVFQIhUKy7QZ9fX0JBRIAAFUGNN6OjxhrNy4uLthbVVXVqlWrKOd49fX19+zZQ792786dO0KhsLa29pdffpkwYQK2eUNm3LhxFP0EkZ+fP2LECLJPLS2t/fv3U7zV19fv37+fbpXX1NR0586d9Km/qLOd1tbWspfhrl270C41ir5KR9HJfvz48Weffca41mRiYrJt27a6ujrsmbKCh7l27Ro5zkePHuErQ8mVsmTJkpcvX1ISIOrgk5eXF/LA6Dp+/HgJi1qqxIjKIDqgJReNt7S0FH/v2Lt3L37+888/o4cXLlyQ8EXiq0OqmpWlMHV1ddeuXStKkm/fvo1VHcTQoUOTkpLoNevj4yPmFNypU6fokbNupImJiS4uLnQrxxMmTIiPj5e7iB4+fJiypm1vb//ixQuhUIj3SYqKnMK2bdtQR0r/vtAqlHchVfD8+fNYi0YYGhr+9NNP5M8xsnRKosaL0aNHi6nB8vJyoVC4Y8cORlc0XgiFQoFA4Ovriw+8IHr27Ik+jJqbmyNlWPYGJT6djPZ+sRCKyT6CrJm3Wh0FBQWMEeLEsBNyhWZQvolpVSrEtzjWqcI8ffqUcpugurr6/Pnzy8vL6WdSCgoKUCi8z5/L5bYmiQAAtAPUZDTOAXQwSktLY2NjX716paWlZWVl5eTkJMkV7TU1NcnJyRkZGZWVlVpaWhYWFiNGjBCzA1AoFD58+DA1NbWurs7c3HzcuHForkOnubk5Pj4+IyOjrKzMwMDAzs5uxIgRir4bVnaUkOysrCy0qM7n8w0NDe3s7BwcHGR5RVFRUVxcXEFBgZaWVs+ePceOHYv2n7cJKpUYRkaPHv3gwQNLS8vs7Gz53mWquJpVU1OztrZ2dHSkqBwUGhsb7927h+w8v/POO2PGjCFUg+LiYpQRpHWMHDlScTeClpSUREVFFRQUaGtrDxo0yNHRkd2tQuHh4bNnz/70008ZTxKyQyAQxMbGZmdn8/l8a2vr8ePH45V5MahOX1pfX3/37t2cnBxdXd0+ffqMGTMG7cDv2rVrTU2NnZ0d/ZiMSmFhYVFYWMjhcJA2y646VEHI22mLY5eqZ8+e/fPPP+Xl5RYWFu+9916rNhEaGxsvXLigra09e/ZsSW5BBwBAxQGNFwAAQDpOnjy5YsUKgiBOnz6Nd+sBAJ2PPvro/Pnzjx49Gj58eFunRaUpLy9Hu08nT54s1YV2ba7xAgAAAKoPfLgCAACQgvPnzyOLRJs2bQJ1FxBDUVFRWFjY6NGjQd1FFgqXLl2ak5MjyhX9mDBhgnLTBQAAAHR8QOMFAACQguLiYjU1tUOHDu3bt6+t0wKoFkuXLg0LC8N/Hj16tKmpCVts7uRkZGQEBgYia090kA0hHR0dtHsCAAAAAOQI7GoGAACQjtevX5uamrZ1KgCVQ01NbcyYMZGRkRoaGs+ePXv33XcNDQ2zsrLa5G4nVSMwMHDp0qXa2trnzp3Ddn0Jgqitrd24cSO68NnPz8/T05NQSUpLS6uqqpCd85KSEjMzM3R9vaGhIbYGDAAAAKgmoPECAAAAgBxAtnZsbW1tbGzu3btXV1d36dIldPsOcPHiRXd3dzTlGDx48NChQ42NjQsKCiIjI0tLS3V0dHx9fVVW3UVXWzOaH/Py8vL19W2LFAEAAACSAhovAAAAAMiBzz///MGDB3l5eZqamoMGDdqwYcPEiRPbOlEqRG5u7pUrV6Kjo//999+ioqK6ujojIyMbG5uJEyeuXLkS3xOmmly9ehUt6lJwdHQUdT0PAAAAoCKAxgsAAAAAAAAAAAB0TMByFQAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TEDjBQAAAAAAAAAAADomoPECAAAAAAAAAAAAHRPQeAEAAAAAAAAAAICOCWi8AAAAAAAAAAAAQMcENF4AAAAAAAAAAACgYwIaLwAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TEDjBQAAAAAAAAAAADomoPECAAAAAAAAAAAAHRPQeAEAAAAAAAAAAICOCWi8AAAAAAAAAAAAQMcENF4AAAAAAAAAAACgYwIaLwAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TEDjBQAAAAAAAAAAADomoPECAAAAAAAAAAAAHRPQeAEAAAAAAAAAAICOCWi8AAAAAAAAAAAAQMcENF4AAAAAAAAAAACgYwIaLwAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TEDjBQAAAAAAAAAAADomoPECAAAAAAAAAAAAHRPQeAEAAAAAAAAAAICOCWi8AAAAAAAAAAAAQMcENF4AAAAAAAAAAACgYwIaLwAAAAAAAAAAANAxAY0XAAAAAAAAAAAA6JiAxgsAAAAAAAAAAAB0TEDjBQAAAAAAAAAAADomoPECAAAAAAAAAAAAHRPNtk4A0A64fv36vn37yE/Onj3L4XDaLkWdjrKysjlz5pCfrFu3ztXVte1S1PE5ePBgWFgY/tPExOTChQttmqL2R21t7ZkzZ+7cuVNQUKCrq2thYTFy5EgXFxdra2vWcUJ3BABKA4YeQL4cPXo0NDQU/wkDK6A0QOPt4Dx79mzJkiWsg0dGRmpra1dXV2dnZxMEUVRUVFdXRxAEn8+XazKBVhAIBKgKqqqqSktLCYLw8PBo60R1cEpKSlCZv3z5srm5GXQqaXn8+PHMmTNzc3O1tLTs7OwIgrh69erx48eNjIzKy8tZRwvdEdCR+O2337y8vN55552rV6+amJgQKgYMPYB8KS0thYEVaBPUhEJh27wZUAqPHz8ePnw46+B8Pl9HRwf/6ebmhla9srOzZVmlAVjj7+/v6elJEASPx1u1apVc4kxPTy8oKCAIYuTIkfr6+nKJsyNhYWFRWFjI4XBQKQGSUF9fP2DAgBcvXgwYMOD69es2NjYEQTx69MjJyUlLS0u8xiuhQEJ3BHSY7oUgCF9fXy8vL6IzDT1AZwYGVkDJwDneTsHMmTP5NBYvXoxcd+3aRXft379/W6caUBL79u2b0EJGRkZbpwXoIPwfe28eFsWxBXw3++awy6CySpDghhgXXOJCDIorikswmolLLprEEK/rjZprEheSaCQm6oDGiBfECO4aXKMiICoBBCSigKAgiwgMIA7LMN/zed63vv66e5qengWE+v3BM3R1dZ/aTtXpqjp1/PjxJ0+eEASxfv16MHcJgvD29p41a1abcXGFxHQd+vXrBz88PT3bWxYMBoPptOBVzV0CPT098lQtugg/DAwM6KG6uvhrCAaD4cnNmzfhB2WNyb59+3bu3NlOQmEwHY5Tp04dOXLE3d3d19e3vWXBYDCYTgu2eDEYDAajZp4/fw4/LCwsyNe7vaadhMJgOhwCgQAvEsZgMBhNgy3eTo6NjU1wcDCPrbzz5s0rLy9H88AYDAbDnZaWFvjRpXSIRCK5cePGs2fPLCwshg0b5ubmRhBEc3Nza2srQRD0pTQYDAaDwWC0ALZ4OzkODg5isZhHxG+++abNe2pra6Ojo7OyshoaGlxdXQMCAry8vFjuz8zMvHDhQkFBQUNDg42Njbe396RJk+zs7AgVePDgQXx8fF5enkQiMTMzc3Z2HjRo0Lhx40xNTRVFaWhouHLlSlJSUnl5uYGBQc+ePX19fUePHk0fmmdkZDQ2NqJ/u3fv3rt3b4Igrl+/Hh8fX1FR4eTkNGXKlGHDhqF7ZDJZbGxsSkpKdXW1k5PTzJkzBw8ejEKbm5vT0tLIr3B1dbWzs2tubj5//nxycnJZWZmFhcXQoUNnzpwpEAj45UldXd3FixdTUlIqKipMTEwcHR19fX1HjBiho6NDvg0Jg6bjMjMzyW5vHR0de/bsye/h7Dx+/LiiogL9a2BgALn0+PHjuLi4goICqVTq5OQ0Y8YMcu5RyMnJuXnzZk5OTlVVlYGBgVAo9PHxmTRpEhe7gke1YU8CYG5uTt6MV19ff/369fT09KKiIqlUCqF+fn7guJidurq6kydP3r17VyKR2Nvbjxw5csqUKQYGBhUVFY8fPybfOXjwYAMDA/UWEEuO1dbW2tjY9O/ff/LkyfTqUVlZmZ+fDw454Up6ejpyTGJjY/PWW28pegW/CtlB1FFjY+PGjRt3797d1NSELs6cOfPgwYMffPDBxYsXCYIoKyvj4piUd+tQpK9ycnJOnDhRWFgok8ns7e2HDh1K303NXStSSEtLO3369JMnT4yNjXv37j1nzhzYtp2Wltbc3Ixus7Ozk0gk/MRTqh2hGojw9vY2NDSsqamJjIzMzs42MTHp37//hx9+SHaKlp+ff/To0by8PGNj42HDhs2bN4+sCjTxTJbyYgm6devWuXPnnj59KhAIhg8fPmfOHBMTE7XrEH4opZC1nEBzc/Pa2lr0r5WVVZ8+fdC/ZWVlRUVF6F9TU9MBAwaomEB1FYR61ZSyXZJaikmRisBgtI0c01URiURQB0JDQzlGmTFjBkQpLCy8cuUKZb0iQRAhISGMEfPz8/38/OAeKysrZ2dnUOuGhoZr1qxpamriIf/jx4+nTp0Kz+zWrZuzs7O+/v/5gmNkZPTBBx9kZWXRY4WHh9va2sJGZQcHBzQA9fDwuHTpEuVmigNYkUgklUrpg8WgoKCWlha5XF5QUEDuR4GVK1eiB9J9EorF4nv37rm6ulKu29raHj9+nC4/+n4hFosZs2X37t2WlpYwt+bs7GxjYwP3e3l5paSkkO9s00EivWJwfzg7lFV8QqGwpaVl9erVdBlmzZpVXV1NiR4ZGQmzZ//vRzt9fWdnZzQCsLW1jYqKUm+1gUoiFApZkgCMHTsWQisqKgIDA9HYxdra2sXFxdDQEP6dPn16eXk5i5DHjx+HWkrGzc0tMzOT/gGrrKxM7QVEprCwEOWYQCBwcXExNjaGVyxfvryuro5886FDh1hq1Lx581hepGyF7DjqqLm52d/fH71XR0cHFf3w4cPR/kxySWmiddD1VVNT0+LFiymxLCwsVNGKiKqqKkY/ZOvWrZPJZBTbPjg4mId4PNoRvQZC9TA3NydftLGxSUhIgCjffvstxbB3cHDIycnR6DMZy4slSCqVBgYGUsRwcHBg7OZU0SGKYOl6eChkLScQ6Qr0L/lRYWFh5FAvLy/VE6h6QahXTfHrklQsJi4qgtKxYjCaA1u8XRdVLN4zZ84YGhqOGTMmNDQ0LCxswYIFqHePjIykxMrIyACN7+rqeu3aNbhYV1cXGhoK805+fn7Nzc1KCZ+RkQFdTq9evc6dOyeTyeRyeUtLy5UrV/r374+0KiXWp59+CkHLli1DXcuDBw8mTJgAo70DBw6Q74+Lizt06NC3336L1P38+fPt7OxWr169e/fuf//731ZWVhC0atUqiUTi5OTUp0+fr7/++ueff168eDHqXY4cOQIPbGhoEL8GHWm4adMma2trX1/fP//8s7CwMCsra9u2bTAVoKOjc/ToUaUs3k8++QRCV65cWVVVBRdTU1O9vb0JgjA2Nr548SK6GQnj4+MDsb766isxifT0dN4PZychIQFeAfPYQqHwP//5j0Ag2L59e1ZWVmFhYXx8/NixY+F1Q4YMqa+vp9dDKyur6OhoVHPy8/NRroaHh6ux2jB2zJCEcePGgYSQnDNnzqAXwdMCAwMLCgrgYmNjY0xMTPfu3cGWkEgkjELGxMRAuzAzMwsNDc3OzoYMee+992xsbDZt2gRPDgoKgpc2NDSovYAQmZmZkHwHB4c///wTckwqlUZEREAt9fb2rqysRPfn5uaCVAMHDgRhtm7dimrU5cuXWd6lbIXsOOooNDQUXmdnZxcbGwuDUTiKCRoyfTiridZB11cikcjQ0HDhwoU//fTTN9984+TkRLd4ldWKQH19/ZAhQyDi+PHj4+PjQX2FhoYKBIINGzZAtREIBJCWhIQEHuLxaEd5eXmHXgPVniCIs2fPGhkZTZo0aceOHT/++CP6ACEQCEpKSsLCwvT09BYsWBAWFrZlyxakBzw9PVE10MQz5XJ5dHS0WCz+6quvUIawBAUFBdna2q5ZsyYiImL79u3Iw7O7uzvd+OGtQ1hg6Xp4KGQtJ/DcuXNisXjr1q2MFi8YnyiBdIuXd4/DuyDUrqb4dUmqFBNHFYEtXozWwBZv10UVi9fV1fWHH34gBx05cgSCvL29ydclEglMYJqZmT1+/JjywO+//x5ibd68mbvk6JkmJiYPHjyghFZXV/fo0YNuuuzZswfetXjxYkqUxsbGoUOHwrRVYmKioq7C1dXV09OTMr6HFU1mZmZLliyZMmVKY2MjCj1x4gQalVKeiTpXIyOj2bNnt7a2kkOTkpJg4rFbt25PnjzhOOz45ZdfIOizzz5TlCe2trYVFRWKakJGRgYlSPWHswN9nr6+vomJSWpqKjlIJpOhqcUvvviCXg/j4+PpDwwICIBlac+fP1dLtVFk8crl8p9++gn6cso8J6ozI0eOhMl/MmlpaeAIfe3atXT5i4qKwLGTgYEBZVa2tbV19uzZaAUdpQJoooAkEgmsYTMxMcnNzaWEnjx5Et7o7+9PqcCUCVi5knCpkB1HHdXX10OR6ejo3L17lxz08uXLt99+G57J3eJVsXWQ9ZVQKLx//z4KKikpMTU1JZuUvLXiihUrkPFAKf3U1FQTExPQYPRWo5R4vNsRpXrs3buXHLRo0SIIWrJkiZWVFbIoINVomH7+/HktPBNlCNnipQS5uLh4eHiQG69UKkXuOdCHNhV1iIoWr7IKWfsJLCwsRJWWMY3sFq+yCeQtpybUlCpNiV8x8VYRGIyGwBZv10UVi9fHx4ceirbY1dbWootff/01XGRUpk1NTfAh09TUtKamhqMY6JmKVi1Cl0A2XSQSCUyYGBoaMq7euXr1Kjxz8ODBitQ9QRB//fUXJXTevHkQZGhoWFpaSglFuxbJeUIePSiSZ+nSpXDD8uXLGSPS+0hIoLGxMZrfI7Nr1y6IuGHDBmUNDFUezg5a+shYlIWFhTBZp6enV1JSgq5/8sknw4cPZ3xgYmIiPPDXX39VvdqQhaR0zPDZOyAgQCqV0h+Vk5Pj7OxMn6IH3nvvPbA/6YbismXLQMjg4GB6RNhjSa8AGiqgzZs3s+cYzGHClFc7Wrztq46io6PhmbNmzWIJ5W3xKts6yPrqjz/+oMRavHjx6NGjVdSKxcXF8Gp9ff2nT5/SI37xxRcQkcXibVM8VdoRuXq8++67lKAHDx4gGVasWKGoyFatWqWFZ3KxeAmCuHLlCiV0//79jM/kp0NUsXj5KWTtJ5C3xcsvgbzl1ISaUqUp8SgmVVQEBqMh8JmrGD4sXLiQfhG5UUHOGORy+b59++A3sgzJGBgYTJw4EfymHDt2jMur23wmQRCTJk2ysLAgu1KIioqqq6sjCGLMmDGMXh/GjRsHa3vS0tJSUlIYHysUCmEVK2Oqx40bZ29vryi0oKCA8Zm+vr6M8ixYsABJjtzesoASOGHCBLTWmsy0adPgx8GDB9t8mjYfDsyfP59+0dnZGWwqmUwWFRWFrkdERCgqI7SPmnIDv2rDSGtra3Bw8LZt2z7++OO4uDhGtyWenp6FhYWKXgRCVlZWUtyWtLS0oGR++OGH9Ih2dnYwNNFCAcnl8r1798LvuXPnMt7zwQcfwA80w9zV1BFBEDdu3IAf06dPp4dOmzZN9bPNlWodCCsrK/omut9++w0dlcxbK0ZFRclkMjD8HBwc6BEZa6+y4vFuR23mXp8+fVAzp4eimpOXl6fNZ7JgZ2dHP633nXfegR9kr1q8dYgq8FDInT6BvOXUkJpSS1PiXkxqUREYjHrBFi+GD2g7ExlYOQmTKvAjOzsb3K4aGhoqOiEJ7XEiD3RYQM/U0dFhFIMgiIEDB9bU1Pz3v/9FV65cuQI/0OoyCrq6uuhpaGaDgpeXF93hrbW1NfxgTCByHQQjSzqKfBHDekKImJWVRbQFSiDaA0nBzc0NbLPS0lL2Xk3LD4eiVORWF/nBRp/SKUgkksePH+f+X9BXfIojZX7Vhk5TU9O8efMiIiJWrFhx8OBBLkfvtLS0lJaWPnz4EAlZX1/PKOS9e/dQkKKKyii8JgooOzsbxNPR0VFUS9FY5+bNm2THvF1HHREEgZono39X8PVFqADv1uHt7Y28sjHCWyuizCG7qW9TVSorHu92RIFe1jo6OujDED1v21TaGnomC4z5iT6wkr0Q89Yh6oKjQu70CeQtp4bUlFqaEvdiUouKwGDUCz6dCMMHuu9BWFEJP+DbHnjzhx+mpqaKZoHQaT3Z2dlcXv3PP//ADzs7O/RG7rFYRp/ILeH9+/cZb0CjFjJoYRJjniBfiChPKCg6ZsDU1NTOzg66n9zc3Da7cJTV2dnZP//8M+M9hoaGcNJAdnY23Tt0ez0cjo5QdMADOq4jNzeXfD07O3vXrl3x8fGlpaWMEclnKvCuNhRevnwZEBAAdkJDQwN7h93c3HzgwIHDhw+npaWRT6xhEfLhw4fwQygUKppqZqwwmiggLjmGmsyrV68KCwvd3d2JLqaOCIJ48eIFxcam0KNHD0VLPDTUOoA2jzDhrRVRRVVUkYyMjAQCAXkEzEM83u2Iu942eY2ySltDz1S9hquiQ1REWYXc6ROoujJXr5pSS1PiUUyqqAgMRr1gixfDB9R/k6Ev3kNnctbU1Hz55Zfsz6ysrOTyavRM8AnBES6x0Pm3aAjLJdUcQxXBcpRft27dwOKtrq7mnsCjr1FLVmvn4W1mAvwgZ8KePXtCQkJkMpment6kSZO8vb3Nzc3B/mxoaEDOYFWvNmSkUqmvr29qaqpAIKirq/vtt98mTpw4Z84cxpvLy8snTpx47949giCcnJz8/f0dHBzQx5EzZ84kJyfTY9XU1LQpJKPxqYkCUqrJQKtpL4u3HdURHHHJXo3bXCev3tbBJaKKWpFjRWUfznI5N5tfO+KumfkpbQ09U9nXMa6W561DVIGHQu70CVRdmatXTWmuKalSTNjixWgTbPFiNAjSpw4ODufOnWO/mcsCUXCEwONjOZdYKIhyBHx7oZQ86J6tW7dOmTKF/eZevXopJYlGH65sJiQkJHz++ecEQVhaWv7111+U2W+JRMI4/uBXbShPzsjIOHHihI6ODjiw+eSTT4YNG0Y5sRAICgqCscXSpUv37dtHWb1ZWlrKOLzgLaQmCkipJtNxWo2W1RHZoFU0PfLq1StCM6iosnhrRdVbE0f4taOujNaKBsFPIXf6BKquzNWrprTclLRfTBhMm2CLF6NB0BqYlpYWRVvReD9Tqa+Dtra2z549g/5J0T0oiHHpjoZoaGhoUx60VZhLAm1tbdWV1dp5uLKZgNwOr1u3jvt+LX7VhoyBgUF8fDz47fj000/37t0rkUjmz5+fkJBAGXZkZmZeu3YNThbdvXs3982KKI0stfTly5faKSCUY1yajJZbTcdRR1Bq4LKlvLyccWFzeXl5R1ARatSK1tbWsLZT2YqqFLzbUVeGtw7hDT+F3L4JZDTDFH2Z4pdAVZS52tWU9puSdlQEBqMU2HMVRoMgxzbl5eUs4zZ+z6yqqmJRpopisbjKRJ4GkdcoLVBcXMx4/cWLF2hd0MCBA7knUJUdg+3ycFgXqsgQRduBUCagLUzoaBwy6IQJtVQbMtbW1shN5c6dO8FNUXJyMv0DP5LwnXfeYVzRqkhIlMbq6mq0to1CSUmJdgoIPbP6NexNxsbGxsnJieh66oggiH79+rHsqXv58iUPX268W4dS8NaK6HWPHj1ijFVbW6v6cJZ3O+rK8NYhvOGnkNslgcjSY2z+imLxS6DqylyNakr7TUk7KgKDUQps8WI0iKOjIwwH5XI5y+EE06ZNs7e3//HHHzk+s2/fvvBb0Tqc8+fPu7i4eHt7Iz0+efJkdpe/Uqk0NTUVfoPrf+2gKFvQkScODg7oUF8W0FrWpKQkRfckJCTY29u7uLgo+pitqNtTy8PZuX37Nns+oIMc0NpRxpWciqxZftVGEcbGxn/88QcMHbZs2UJxmMkuIYuQ7u7u6CCHhIQE7hVGEwVEzjFFj0UJ9/f314TjTfWOwzShjsjjYMYliBcuXFB9XR/31qEUvLUieh0SgKPASsG7HXVleOsQ3vBTyO2SQEtLS5YPzYr6BX4J5C2nJtSU9puSdlQEBqMU2OLFaJbVq1fDjwMHDjDekJube+7cuYqKiqlTp3J85qpVq+BHZGQk4w2HDh0qKioaPHgwGoXPnDkT/JGmpaVlZmbSo8TGxoIlEBAQwMXCVBe3bt1idA2NTuRDp9izExAQAI5bk5KSGB23wjPLy8t9fHwoX3lNTU3hB/mAmalTpw4aNOjOnTsqPpwj6BR7MsnJyTBvZm5ujg4SRP5p0ViczPXr19VYbVjw9PQEr8itra3z588nz4IiCTMyMujWTmtrK8uREsHBwfAjPDycHnr//v1bt27Rr2uogFCO/f777/RQmUz2v//9j3KnWmizQnYodRQYGAhOmOLi4igHiTU1NX333XeEynBvHUrBWyvOmzfP3NwcVksylkhERAShMqq0o64MPx3CG94KWfsJNDMzAy8Gjx49ghOAEHK5fM+ePepNIG851a6mtN+UtKMiMBjlkGO6KiKRCOpAaGgoxyjgsIcgiMLCQnpoSEgIhF6/fh1dbG1t9fPzg+snTpygRKmvr4fVL4sWLeIuuUwmmzBhAhyB+Oeff1JCz5w5A7Nwjx49Il+/du0aOBUcMWKEVColBz179qxnz56wcvXp06eUB2ZkZID8IpGILsyhQ4cgNCwsjGOeyOVysVgM1+3t7b29vaurq8mhu3fvhlAXF5eXL18yRhSLxZR3JSQkoAQ2NDRQQsE4MTY2fvDgASVox44d8MyTJ0/CldraWvDKWFxcrOLD2REKhWDhmJubR0ZGkoMqKio8PDxAsH379qHr6PQdBweHZ8+ekaM8e/YMfVYfO3asWqoNElIoFNLlnz17Nrxu5syZ6KJUKoUoMANMibJlyxakfim1AloEOiqGnGq5XF5dXe3t7Y0OP6RUAE0UEMoxcOZJCUXLudeuXausrmCHS4XsOOpILpd/9dVXqE5eunSptbVVLpfn5+dPmjSJ3NuWlZVpunW0qa8o8NaKe/fuhbd4enpWVlaSgyIjI83NzeGzBb3VcBdPlXbUZvUAh3MWFhb0ILSdhK5DNPFMlgxhzytFz+StQ9hR1PXwVsjtksAlS5ZA0EcffdTc3AwXm5qaPvvsM7RYw8vLSy0J5C2n2tWUik2JXzHxVhEYjIbAFm+XIzY2VvQaNzc30EeDBw+GK4mJiYxR8vPz4QZHR0eIEhgYKBKJjhw5AjdAqKenJ4ROnDhRJBIhQ7q6unrMmDHgV/Dzzz9PSUkpLS3NzMzcv38/DBFGjx5dX1+vVCqqqqpGjRoFq3Q2bNiQmZlZWlp669atf//73wYGBrq6ulFRUfRYUVFRsKpn8ODBp0+fLi4ufvz48e+//w7ffW1tbW/fvk2+f+fOnSKRaNq0aZAuNzc3SClYFJs2bRKJRCAG7HMTiUSrVq1iyZPvvvuOMnrYtWtX//79e/TosXHjxpiYmIiICLRC1dLSMj09He6XSCTwQB8fHwj18fEhCwMcPXoUDANPT8+oqKiCgoLi4uLr169/9NFHOjo6BgYGsbGx9GzJzc2FWc3Ro0fn5OTk5eUtWLCAIIjx48eTb+P3cHaQMQkm2bRp08LDw2NiYjZu3Ih66MWLF4MJATQ2No4YMQJl0bZt2y5dupSUlLRjxw6hUOjv7w9BQqEQ8ods4ylVbS5dugRPgDMkjI2N4d9Lly7J5fLbt2+LRKLp06ejscL06dNFIhGMbE6fPo0miv39/Y8cOXLr1q1Tp04FBgYKBAJUZygtBcjIyLCysoIbpk6dGhERERMTs2nTph49egwYMAC5UaEP5jRRQCjH9PX1v/rqq8zMzLKyspSUFPS9bNGiRWjgKJfLExMTGXWFSCTauXMnx5eyV8gOqI5evXr17rvvoppgZmaG3M94e3uPGzdOFYuXe+tQpK+QUmJEWa0ItLa2Ll68GF5kb2+/adOmmJiY8PBwaBHR0dH070Q8xOPRjtirR1paGoSamZmBHiD3fadOnRKJREFBQRQd8ueff6r9mVlZWatWrWLMkKysLPauR9Ezka7jrUPotNn18FPI7ZXAhw8fomOxHBwcAgMDZ82aJRQKLSws0PHUVlZW8Lrz58+r2OPwllPtaopfl6RKMXFUEahjpXzUw2DUDrZ4uxzr1q0jFHDo0CHGKIo2k4SEhMANjKHkD36NjY07duyge3O1sbH55ptvKHMLHJFKpT/88IONjQ3lmQMGDPjrr78UxUpPT3///fcpUQwMDBYuXEifx1C0obempkYulzP6UXR2dmbJk+HDh9O/l1dXV8+ePZuyknbcuHG5ublIkrKyMsYHImEQGRkZEydOpK/LHTduXGpqqqJs+eWXXyhH7Xl5eT158oRyG7+Hs0AeFh8/fpzi6tbc3Pynn36SyWSUWHV1dcHBwZQtSWZmZlu3bqWfT0j5aM292oSFhTFmOEzmKzr2dt68eRD98uXLffr0oYSOGjUqMzMTTT8qmhx4+PDh+PHjyffo6urOnTu3pqYGLXcPDw+n56faC4glx9zc3KKjoxUteaAzceJE7i9lqZAdUx3V1dV98sknlJyfOHFiRUUFUiO8LV6OrUORvkJKSS1aESGTycLCwmDtIqJnz54wM29nZwcjXRXFU7YdsVePU6dOsfR9mzdvZgxVpApUeeaFCxcYDzaDIPauR9EzybqOtw6hwKXr4aGQ2zGBV69eRV8ugAEDBmRmZtJVBzL8VOlxeMupdjXFo0tSsZjYVQT6bAcEBwcrmyIMRil0sLdDjNZobW1NTU3Ny8urrq4WCAQeHh6DBw9W8RjP1tbWu3fv5ufn19TUWFpaDho0CLnbYaGioiIlJaWsrMzAwKBnz56jRo1iOSddE4SHh8MGXbFYDLt9SkpK7t69W1ZWZmlp+c4777i7u6vy/OfPn0MCoV8ZMmRIm6ewVlZW3rx5s6yszNDQsG/fvj4+Poq2s/J4uCLs7e3Ly8uFQiGMq2QyWXJycmFhoVQqdXZ2Hjt2LPoeT6eqqio5ObmkpMTAwMDJyWn06NEwGau5aqMsYIJmZWXV19dbW1sPHToULazgwqNHj/7++++amhp7e/thw4bBEtOdO3fCLq+jR48q2r2pxgKi55hEIrGxsen3GkKTcK+QHUcdlZaWXr58ubS01NLS0sfHBz6KTZo06eLFi2DxUgZ5mmsdPOCnFRsbG2/cuFFUVGRsbOzq6jpy5EhYJt2tW7eXL196eHg8ePCgfdtRV4a3DuGBKgpZywlsbm6+desWuCh/++23R44cqekE8i4I9aqpdmlKilQEBqNlsMWLwbQDdIu3a0IZ02Pa5Msvv4R9ZcnJyWitHaYjoy6L9w2ipqYGFnO+//77ly5dam9xMF1Lh7wpCXxT5MRgOgf4QwsGg8F0IFavXo18pdCBg2RMTU3RsY0YjPZJSkr6+OOPi4qKFIXCD7SHGaNNOr0OeVMS+KbIicF0BbDFi8FgMB2IuLi4TZs2vXz5kh6UmJj4999/EwTxySefULa5YjDaJC8vLzIyEh1PRQFc8hgZGSHXuBht0ul1yJuSwDdFTgymK4AtXgxGe7S2tha95sWLF3DlxYsXcKVL7S+oqqqCVMPZgDKZDP4ln2rblamrq5s7dy4lN27fvj137lyCINzd3b/55pv2kw6jWd6g1vHdd9+dPXuWfKWhoeHzzz+/evUqOHxSahU3Ro10eh3ypiTwTZETg+n04H28GIz2KC8vR0fwUaipqbGwsCC6BsuWLQsPD6dfDwkJUeQWteswaNCge/fuwWq3sWPHOjg4tLS0ZGZmwoTAyJEjjx07pronKkyH3cf7RrSOkydPBgYGwvihX79+AwYMsLS0LCsrS0hIqKqqMjIyCgsLA1cFGO3T6XXIm5LAN0VODKYrgC1eDEZ7vHz5cseOHYxB69evV6/n1Y7M+fPnU1NT6dd9fHwUHYfQdZDJZNeuXbty5Up6enpBQUFtba2urm737t2HDBkSGBiIjmvGvCmEh4fDUZ/fffedQCDoNK2juLj43LlziYmJ//zzT0VFxatXrywsLFxcXHx9fZcuXYpnd9uRTq9D3pQEvilyYjBdAWzxYjAYDAaDwWAwGAymc4L38WIwGAwGg8FgMBgMpnOCLV4MBoPBYDAYDAaDwXROsMWLwWAwGAwGg8FgMJjOCbZ4MRgMBoPBYDAYDAbTOcEWLwaDwWAwGAwGg8FgOif67S0ApqPwwQcflJWVoX/9/f3XrVtHdDxevnxJ8em/atWqadOmER2VXbt2nT59Gv1rbW194sSJdpUIg8HwJz09/dixY/fv33/16lX37t1dXFwmTJgwevRoQ0PD9hYNg/n/UV1dPXPmzDeou8Rw5OzZszt37iQIYtGiRSKRSL3PpFeSPXv2xMbGEgTx888/e3l5qeV1GIyWwRYv5v9Q/JqmpqbS0lKCIFxcXIgOSWtra2FhIUEQdXV1VVVVBEEEBQURHZjKykoQ+OnTp62trfiYSgxGo0gkkmnTpt27d2/Hjh2ffPKJeh8eEhKye/dugiDs7OycnZ0zMjIqKyu3b98eFhYWEhKi3ndhugKHDx8OCQl5++23z58/b21trd6Hy2SyN6u7xHDk2bNnN27cIAhi/Pjxan8mvZI8evQIgmpqatT1OgxGy+BVzV2FxsbGG6+5f/8+4w2JiYmFhYXx8fFEx0YgEBS+Ztu2bVrOIn5s3boVBO7evbsaH4vBdFZyc3OhJb58+ZJH9KNHj968ebO2tnbNmjXqFUwsFoO5u3379vLy8jt37jx79uyjjz4iOm9mtjtvuvxtsnbt2pqampSUlP/9739qf7itra2GuksMBoN5s8AWb1ehrKxs3Gs2bNjQ3rJ0UHAWYTAdge3bt0NLzMvL4xG9b9++8MPT01O9gsGSPycnp/Xr18MVAwOD//73v0Tnzcx2502Xv0369eunoeqKwWAwGARe1YzBYDCYzsO777578+bNrKysDz74QI2Pff78ORhdlG1svXv3LisrEwgEanwXputw6tSpI0eOuLu7+/r6trcsGIyWqKqq+uqrrwiCWL58Od4YjNEO2OLFYDAYTKdi9GvU+8yKigr4YWFhQQnCm/MxvBEIBMHBwe0tBQajVerq6sLDw8FJKrZ4MdoBW7wYDAaDwbRBS0sL/NDT02tvWTAYDEYhLS0tL168gN/W1tYGBgaUG169enX58mVYtNKnTx8/Pz+lXM03NDTEx8cXFBQYGRl5enqOHz9eXx9bE5iODq6jnZ/Hjx9XVFSAB2ZYTHL79m0UqqOjM2zYMJbot27dOnfu3NOnTwUCwfDhw+fMmWNiYqLo5rq6uosXL6akpFRUVJiYmDg6Ovr6+o4YMUJHR4e3/HV1dSdPnrx7965EIrG3tx85cuSUKVPoGpxCTk7OzZs3c3JyqqqqDAwMhEKhj4/PpEmTjIyMVM+i+vr669evp6enFxUVSaVSc3NzT09PPz8/Dw8P7ul6/PhxXFxcQUGBVCp1cnKaMWPG4MGDWe7n/dLU1NSrV6/m5eU1NDSYm5t7eHj4+PgMGzZMV1fhNv7MzMwLFy4UFBQ0NDTY2Nh4e3tPmjTJzs5OWSfV+fn55Cve3t6GhoY1NTWRkZHZ2dkmJib9+/f/8MMPzczM0D35+flHjx7Ny8szNjYeNmzYvHnzTE1NVS/ijIyMxsZG9G/37t179+6tVPVWpdDT0tJOnz795MkTY2Pj3r17z5kzB3yhp6WlNTc3o9vs7OxcXV35NShFCbx+/Xp8fHxFRYWTk9OUKVPINVkmk8XGxqakpFRXVzs5Oc2cOZO9BqouDHtuNzc3p6WlwfphuJKZmSmVStENjo6OPXv25FHlVJEKRXz48CH8+/z5c7J+8PLyevDgAeOTc3JyTpw4UVhYKJPJ7O3thw4dOmvWLN51GFFbW3v27Nm///67srJSV1e3R48egwYN8vX1JfvG45iZinJMKpXGxcWlp6dXVFQIBAIPD48ZM2bY29vfu3ePfPOAAQPIzTM1NVUmk6F/+/TpY2VlRZe/oaHhypUrSUlJ5eXlBEHY2Nh4enq+++675KbEUf68vDw0sicIwsrKqk+fPujfsrKyoqIi9K+pqemAAQPYK0ObRabGbk6RDMqWNW9QJlPo27evQCBQXWdSytrAwKBnz56+vr6jR4+mfzYitynEW2+9ZWNjg/4tLi4uKSnp2bOno6MjuiiXy+/cuUOOZWxs7OXlpRb5FcG7O9BogQJSqXTWrFnghXT+/PmHDx+m3BAREbFmzZra2lp0RSgURkVFcXx+VFTUZ599Ro7eo0eP8PBwfOoVpqMjx3R22FdMGRkZkW/OyMiA6yKRSCqVBgYGUu53cHDIyspifNHu3bstLS1hDsTZ2Rl1VF5eXikpKfyEP378uK2tLUUGNze3zMxMsVgM/4rFYnKUyMhINzc3CNLX13d2dkammq2tbVRUlCpZVFFRERgYiOxta2trFxcXNKSePn16eXm5orTA0kehUNjS0rJ69Wr6i2bNmlVdXU2PyPulRUVFY8aMgdsEAoGzszOK1b1795CQkKamJkqU/Px8Pz8/uMfKysrZ2Rnea2houGbNGvr9LBw6dIiSwMLCwitXrpibm5Mv2tjYJCQkQJRvv/2WMhJycHDIycmhPJlHETs7O5Mfq1T1VqXQq6qq6CNmgiDWrVsnk8koq2GDg4N5NyjGBNJfHRQU1NLSIpfLCwoKyLYBsHLlSkUJUV2YNnObfB44I6GhoXLlq5zqdYASkcKDBw/oT25qalq8eDHlTgsLC1XqMPDrr7/CFyJdXd2ePXuiWDo6OmPHjr127ZpSmcmYY8nJyfR12mFhYQ8ePKBczMjIIMtGWe996tQpuvxisRhUuo6OTq9evcj2TJ8+fX766afW1lbu8s+bN498ccaMGeR3hYWFkUO9vLxYKkObRab2bo4uA7+y5gJjd6kok69fv66izgTCw8OhrHV1dR0cHFCl8vDwuHTpEuVmRkmOHj1Kvsff358giPfee498kfwdBD1fLfIzokp3oIkC3bx5M/l6fX09Oq9oyZIlMpmMEvHbb79FaTc0NLS3t4c+18DAAJ3lRhlTyeVydPTa559/Dj+MjIxQXEhCTEwMd/nh0CxFWgKD0QTY4u38JCQkiMXirVu3gn4ZOHCgmMT+/fsVWbxBQUGWlpYrVqzYvXv3119/jcbH7u7udMsH6cqVK1dWVVXBxdTUVG9vb/jmevHiRWUlj4mJga/mZmZmoaGh2dnZcH7Se++9Z2Njs2nTJkbtPGPGDLDWoqOjm5ub4WJ+fj46Yi48PJx3FqH8CQwMLCgogIuNjY0xMTHwjdbDw0MikbBbvP/5z38EAsH27duzsrIgRWPHjoXHDhkypL6+nhKR30vr6upgwnDo0KFpaWlwUSaTXbx40d3dHR5YU1NDeREMUFxdXVHvW1dXFxoaCgXh5+eHsrRN8vLyDr0G6gAccG9kZDRp0qQdO3b8+OOPyFOLQCAoKSkJCwvT09NbsGBBWFjYli1b+vfvD6Genp6Ul/Io4ujoaLFYDK4yUPW2tbVds2ZNRETE9u3bkcdUevXmXej19fVDhgyBuOPHj4+Pjy8sLMzKygoNDRUIBBs2bIAqIRAIoKYhy59Hg4qLizt06BAazYhEovnz59vZ2a1evXr37t3//ve/0WzbqlWrJBKJk5NTnz59vv76659//nnx4sVoAHfkyBF6QpQVhl9uNzQ0QD74+PhA6FdffUVuienp6exVLjc3F+4cOHAg3eLlXQcoEX18fMhSVVdX0zNfJBIZGhouXLjwp59++uabb5ycnCjmE486LJfL9+7dC4PLnTt3IkXx/PnzlStXQqyQkBClMpPeSP/8809jY+N+/fpt3Lhx165dSJ6wsLDq6mrKMykW78GDB8Vi8ZQpUxSNZdG3xX/961+lpaVI/nXr1qElJ1KplLv8ly9fJqtuisULH0aRbUC2eHkUmdq7OXqF5FfWvC1eyOStW7caGhrq6upu3LgRsuvZs2cq6ky5XP7pp59C6LJly8rKyuDigwcPJkyYACbfgQMHKBL+8MMPEKVXr14gSV5eHrqhpqYG1JSuru7z58/R9ZaWFrjZ2dnZxMRk3759YCerKL8ieHcHGipQssUrkUhGjhwJ11esWAEfj8gkJSVBqIGBwS+//PLq1SuI9fXXX8N1eiUByIeNm5iYRERENDY2yuXy6upq5LjezMysuLiYo/zY4sVoH2zxdhWQfqGMCRRpcxcXFzc3N+j5gFevXqFx5JkzZ8ixfvnlF7j+2WefUR5YXV3do0cPmLioqKjgLnBRUVG3bt1ANVO+nbe2ts6ePRst/GO0eOPj4+nPDAgIgLVt5P5SqSyC/Bk5ciRMlJFJS0uDQdvatWsZ44J5o6+vb2JikpqaSg6SyWRTp06Ft3/xxRdqeemuXbvggahXRuTl5cGXZrLFK5FIwEI2MzN7/PgxJcr3339P7185AiUChvTevXvJQYsWLYKgJUuWWFlZkT9yNzY2InPx/PnzailicvX28PAgV0ipVDpo0CDG6s270FesWIFqFGXwkZqaamJiAnufhEIhJSLvBoUS6Orq6unpWVlZiYJyc3OhyZiZmS1ZsmTKlCkwZAFOnDgBEYcMGaJ2YZTKbblcLhKJGA0qHlWObPGqKBX5ayDjS8mZLxQK79+/j4JKSkpMTU3pFq9Sdbi5uRlmFBcuXEiPtWzZMsZBM8fMRDnWu3fvL774gjw19OWXX4LFy/GZmzdvZhzLooq0aNEieiykYcDiVUr+NlU33eLlUWSa6OYU1St+Zc2CoiVRxcXFffv2NTQ0PHHiBLt4SrWXPXv2wPXFixdTHtjY2Dh06FCYJE9MTKSEghWqq6tLnymNjIyEZxIEQbGW5XL5ixcv9PX1Z8+erRb5WeDXHWiuQFGPXFVVhXrM9evXM8YaN24c3PDzzz9Tgsjrztgt3sOHDyv6kvXpp59ylB9bvBjtgy3eroKyFi9BEBcuXKCERkREQNCqVavQRYlEAidzGBsbo8/ejKbXhg0buAsMfQB9qScAm4IYtfMnn3wyfPhwxmcmJiZClF9//ZVfFuXk5Dg7O1OWWiHee+89GPTQv60ii1dRx1ZYWAgLhPT09EpKSlR/6Zw5c8DApq9rksvlMA9DtnjRV15G462pqQmmf01NTSkzw22CBtPvvvsuJYi8TnLFihWU0OjoaHp9U6WIydX7ypUrlND9+/czvo5f/hcXF0OB6uvrP336lB7xiy++gNdRLF5VGhQ5gX/99RclFC0BNTQ0RDNsiLfeegtCa2tr1S4M99zWmsWrrFTcLV6CIP744w9K6OLFi0ePHq1KHc7JyYHr3377LT1WamqqWizefv36UYbyd+/e9fLyio6OVsXiRRXJ0NCQcdmnVCqFRdHtYvG2WWQa6uYU1St+Za2sxfvw4UMnJyczM7OrV6+2KR739tJmWV+9ehViDR48WFHloRtdaO0AQRATJ06khP7222+Mhci7vSuCX3eguQIFi7eiogLtUf/uu+8YoxQXF8MN3bt3p89p19TUGBsbt2nx9unThz68KSkpgVVgVlZWHFeBYYsXo30Uuq7BdHG6d++O9nMi3nnnHfhBdnYSFRVVV1dHEMSECRMY/ZQgfwYHDx7k+PaWlhbkR+HDDz+k32BnZwddC52IiIiUlBTGILQwW9ENbeLp6VlYWEjZPEZ5fmVl5ePHj1keMn/+fPpFZ2dnOE9FJpNRfEjweymYWy0tLeDBgkJ4eHhGRgY6RFQul+/btw9+M77IwMBg4sSJ4Ink2LFjBC/oCe/Tpw/yGkIPRY6UwKWkGovYzs6OfvolY/Xmnf9RUVHgxefdd991cHCgR2Ss2OpqUEKhEH3Op+fnuHHj7O3tFYUWFBSoVxilcltraE4qKysr+g7q33777ebNm6rUYbRl7ty5c2QHUcCgQYMyMjLWrl1LqMaSJUsoe+mHDBmSkZHBqLW4gyrS2LFjGX3gGRkZ+fv7009+0g5tFpkmujkWtFDW6enpo0aNqq+vv3btGpejgLm3F5RXY8aMYSzrcePGwQLgtLQ0SiWfPXs2/IiNjSVfl0gkly5dmjlzJjzw6tWr1dXV5BtiY2ONjY3JVjFv+dlRpTvWUIE+e/ZszJgxWVlZBEH89NNPGzduZLwNLWn28/Oj+/60sLBAu6tYmDJlCt1DW8+ePWFhf3V1NWW3f3Nzc6MC4IampibG0KamJmXyAINpG2zxYpgZNGgQXa/Bwi2YBUIXr1y5Aj/QhisKbm5usJyytLSU3RRE3Lt3r76+Hn6jhToU0MYzFiQSyePHj3P/L+izIjpaUxVaWlpKS0sfPnyIno9kZnm+jo6OotPnkB9dNMmjyktRccydO3fbtm1kj6awUcrLywvtncvOzgafqIaGhmihFwW0sZY8cFcK+pN1dHTQ8JGeLcgrDIyf1FjEXl5e9OqNjEBy9ead/yiXFPlCZ5RBXQ2K8eHW1tbwg7GIGXNbc8JwyW2NojmpvL29lTqrg2MddnNzgzK6c+fO+PHjb9y4QQ7V09Pz8vJi92XNBVhxqnZQRUI2Bp2YmJiamhp2P9Uaos0i00Q3x4Kmy/rGjRtjx47V0dG5efMmxxLn3l5QXinqu3V1dVH3jeZ7gX79+r399tsEQVy7dq2yshJdP3v2bHNzc1BQEHyYaGlpOXPmDAqtrq6+cuWKv78/2e0/b/m5w7070FyBPn78+N133wU7c/jw4WhXMJ3s7GxKV04BzRKzgLa2UUCbotFbgDlz5hgzgZxaz507l/EGumNFDEZF8OlEGGboHpJhQRf8IH+kRMt1srOzf/75Z8anGRoawie97OxsyvkrjKCDQIRCoaKTA1gOy8nOzt61a1d8fDw6cIgC+dACZWlubj5w4MDhw4fT0tIUfYZkeb65ubmiIR06miI3N1f1ly5btuzAgQPZ2dkNDQ0bNmz473//O2HChICAgOnTp6MvF/RCNDU1RdvVKKBzLChdGnfIflkR8LHZ5DWUIOQAk/5RXMUi5l69eec/qsOKKryRkZFAIKCPtNTSoFiyWlHyGXNbLcIom9vaQXNScTzHS9k6rKent3v3blgacPPmzXHjxjk7O8+cOTMgIIDxuBeNCq8s//zzD/yAc7k6Gm2mWhPdHAsaLeszZ87MnTu3sbFRJpNxfxT39sKlrJEj5fv371OCZs+evWXLltbW1tOnTy9ZsgQuHjt2zNjYePLkyTY2NrCgNzY2Fq14P336dEtLC2zkUV3+NuHRHWiuQMnbm2/fvh0eHq7o7Imqqir4QffEDtAX/tBRFBe1IPQWDKajgS1eDDOMx5EznuCKFNzR17A/lvzVloWamhr4Ac6rGEF9FYU9e/aEhIRAXz5p0iRvb29zc3P4uNvQ0EB2zc+D8vLyiRMnwqGUTk5O/v7+Dg4OyJA4c+ZMcnIy+xNYZjBQYinrtfi91MjI6ObNm+vWrTt48GDLay68Zvny5ePHj1+7di2sUqYUYk1NDTiqUb0Q6bCccc8SpIki5l69eec/xzpMt3jV0qDY85N7bmtOGJbjoLWD5qTiMkvJrw7Pnz/fwsJi1apV8FGsqKgo7DV2dnaLFy9es2YNmsbXqPA8QBWJpTm0I22mWhPdHDsaKutjx45dv37dwsKisbGxoaHhgw8+uH37NheFwGNIwFLWaEMNZfERTPpt2bIFbFqweOEA5ClTppiZmY0dO9bW1raysvLSpUsSiQSWwR87dszIyAh5f1RRfg2NATTXeI2NjTdv3rxx48aWlpYvv/xy1KhRjLO4r169Yq/tXM4lbjNuQ0MD+frSpUvRaUlkXrx48d1334FvM8Z5Y8ophhiM6mCLF6MqSNdv3bqVZRcN0KtXLy7PRAvMlJ1pSUhIgPPiLC0t//rrL8rKZ4lEoqLFGxQUBF3d0qVL9+3bR1kIV1pa2qbFywJKLGWPDe+XWlpahoeHb9my5Y8//jh69Chs45HL5X+9RiQSHTx4ELp89EYHB4dz586xy6mu2SR+aLqI6fDLf951WBMNijcdSphOgyp1eMqUKZMnT05ISDhy5Mjx48fBYKioqAgNDT1w4MC5c+eGDx9OtCutra1qbA4dhHZpCJoo67/++svX1zcuLm7ixIl3797NyMhYv379Tz/9RKgPLmWtqLODtbXu7u6PHj2CzbpWVlZnz55tamqaO3cu9D4zZ87cv39/c3Pz2bNnFyxYUFNTA0uakRWtUVQZA2iiQLt163bu3DnYgrt+/XqpVDpv3jw4C4B+J/sCKGQSs0A//ZgSl1IKij5DFBUVgcU7ffp05DYPg9Eo2OLFqIqtre2zZ8/gh6IdqsqCPnZKJBJF97x8+ZJ+ETnMXLduHZeNvkqRmZl57do18PGwe/dupbbqIShfQMmgxJK/9ar+0u7du3/+muLi4ujo6F9//RV8NkZGRnp5ecG2H7Tiq6WlRV2FqCE0WsR0eOe/tbU1rFZVtg5rokHxpkMJ02lQsQ7r6OiMfc2ePXuuXr0aEREBh0tVVlYGBATk5+ebmpoSWoHRpGEcN6OKpNFt29zleVMagtrLevLkySdOnDAyMjp69OigQYPq6up27dr1/vvv+/v7q0tmlFcsqg8FMS42njNnzrZt22Czrkgkgilc9KFhzpw54GM5NjZ2wYIFp0+fbm5uBntY06jeHau9QENCQsDcXbNmzYULF65fv56Tk/Pll1+Gh4dT7gRvYWCWMz4KSo2dsrIy9uuMBYrBdASw5yqMqiBPJGQXryqCVrlUV1cr2hZSUlLCstcU/B5TQMdU8AM9/J133mFc/8Pl+fX19YrGfGjnJ3mRj1peCjg4OKxbty4vLw/tdzp06BB6OPwoLy9nsck7AhotYpbXKZv/qBAfPXrEeENtbS2jxauJBsWbDiVMp0FddVhfX3/ixInHjx9PSkqCXR5lZWWXLl1Sq7DM74UfjLqCUTOjikTxu95e8rxxDUFdZT19+nRYmNq7d290wo1IJFJkyfCAS1kj38iMfrNQD3Xs2LH6+voLFy5MmjQJTR6OHz8ePgpfvHixrq7u2LFjBgYGyFe2RlFjd6yuAkWT5Lq6ulFRUeAJMiIiIi4uTpFjqszMTMZHwdw1O+np6YzXwVM0i2srDKbdwRZvl0PtJgH68op839NJSEiwt7d3cXHh+Lnd3d0dHeiSkJDAeA/j2R5ouQ59rRT7J2cuWcT+cO7Pv337NuN15L+RfPAS75du3LiR8UARIyMjdBAR+tbr6OgIvhblcjnLuT7Tpk2zt7f/8ccfifZDLUWsrtexvBEVIsUtZ5vVQBMNijftK4zalVUHgV8dvn//fkBAwNmzZ+lBI0eOXLp0KfsEjhoz09LSEn6gEz7J3Lp1i35x8uTJ8INlzeeECRNcXFzQZzju8rPLo8pOk/ZqCCqWNUfmz58Pzp+eP3/+0UcfqauGoLJWdOiAVCqFE2jhZF36DYMGDXJzcyMI4vLly1FRUY2NjWSvVPr6+gEBAdCOoqOjL1++7Ofnp51tn7y7A+0UaK9eveBcYlh0XVRURA4dNWoU7Ei6dOkSfXFyZWWlorEWmbNnz9JXUhQWFoIV3aNHD3SuOwbT0cAWb1cBLZVpbm5GF8+fPz9o0KBFixap8uSAgABwMpyUlER3Mgzs27evvLzcx8eHi2sEAPkbpC/Ogf6DcVyF3B2jDpXM9evXVcki9PCMjAy60m9tbeV4bA869Z5McnIy+EA2Nzcnn/XH+6WJiYkxMTGMQ0AzMzPo+cjHIaxevRp+HDhwgPGBubm5586dq6ioYHcQomlUKWJVXqds/s+bNw8GYZmZmXfu3KHfEBERoc0GxY92EYaxJU6dOnXQoEGMOfnGwa8OV1ZWnj59+tSpU4yhaMRPOeNEE5np6empyKSJj49nPJtn5syZ4Ln37t27yJcvmZycnKtXrz59+pTi54aL/GZmZrB19tGjR3DKGkIul+/Zs4d40xoCv7LmwZ49e9zd3cG2VNduXlTWaWlpjNOJsbGx8FEgICBAkYEEB/M2NzevX7/e0NCQMoWL1jCvX79ea0uaVekOtFagM2fOBPtZIpEEBQW1tLSgIFtbW1i7Xl1dvXPnTkrEjRs3kpuYIoqKiuhDsg0bNsCPhQsXMh65p0YuXrz4/Wt4nxmB6bJgi7erYGtrC34LyEu8kpKS7t27p6IjIj09vUOHDunq6srl8kWLFtE/b0dFRR09etTY2Pibb77h/tiVK1dCr3nhwgW0+AqoqalZuHAhoyf9Dz74AH6EhoZSPpeWlpYqOpmdYxaNGTMGXPOXl5eHhoZSom/fvp3LgjdTU9OLFy8ePnyYfPH58+eLFy+G399//z35UEEVX/r111/TLx4/fhx6a/JAQSQS+fn5wamYJ0+epER5+fIl3Pzxxx+j8W67oEoR84B3/nfr1g3d//HHH1Nckh4+fPjSpUuMW7Y01KD40S7CwPQOuSXW1dVdvnz53r17ncM5lip1OCYmBs7eJPPq1Ss4ntTS0pK8QkRDmQmKArZFoHWeYAYsWrSIcam2np7e77//Dn7yli1bRhlbNzc3gwJctGgROrdGKfknTZoE9u3q1avRKL+5uXnFihVK+YHvUA1B2bLmgZmZ2dGjR2HGcv369X///beKD6SXNcVPUmlp6fr168HTgaKT8MgLmyUSCX0K19fXF5bvSiQSfX396dOnE1pBxe5YCwVKEMTPP/8Mp93eunXrv//9Lzlo27ZtMJj5+uuvv/32W9gyVlJSsmLFivDwcC7Gqo6OTkhIyPfffw+HETx9+vRf//rXkSNHoEDXrVtHaJjo6Oj1r6GceIzBtI0c02WAs+DAZVFxcfHZs2ehz7hx44ZcLt+5c6dIJEJfUt3c3ESvaWhokMvlp06dEolEQUFBECoUCiH0wYMH8PCjR4/CwMLT0zMqKqqgoKC4uPj69esfffSRjo6OgYFBbGyssgJnZGSAhPBRPyIiIiYmZtOmTT169BgwYADy/uLj4wPCSCSSxsbGESNGwHVLS8tt27ZdunQpKSlpx44dQqEQOeegy88li+Ry+enTp1Gv4O/vf+TIkVu3bp06dSowMFAgEIwaNQqCJk6cKBKJQkND5XJ5ZGQkvAv26giFwv/973+wQjg8PDwmJmbjxo3ojLvFixe3trZS8oHHS+VyOXizgKHD5cuXi4uLnz17dufOnXXr1sE+rtGjR0ulUvKLqqurx4wZA0OWzz//PCUlpbS0NDMzc//+/TAMHT16dH19Pcfiy8/Ph4Q7OjqCJIGBgSKR6MiRI3K5PC0tDULBvDcwMIB/ExMTWepbVlYWvyJWpXrzy3+5XN7a2oo+ZNjb22/atCkmJiY8PBzGZ9HR0VDuQqGQnnvKNij2BG7atEkkEiFRhw4dKhKJVq1aBXHhTvQhAxLy3XffaUiYNpVJbm4uZPjo0aNzcnLy8vIWLFgA+/fYq1xiYiJjlYO08JZq1apVjBFFIlF+fj7Lk1EOU+BXh9Hcr1Ao/OWXX+7fv19RUZGbmxsbGwubIfX19U+ePEl5F3tmKmqkqCUqAq0M0tPTGzt2bFBQ0KhRo3R0dIKDgzdv3gxB48ePF4lES5cuRbGioqLAuBoyZMjp06efPn368OHD2NhY2GE4ZMiQ2tpapeRHPHz4EJ2b4uDgEBgYOGvWLKFQaGFhgaaUraysIGnnz59Xtsg00c0pqldZWVn8ypqR5cuXi0QiHx8fcne5fPlyCF2/fr1IJHJycoJQJycnkKG0tFTFVozKevDgwadPny4uLn78+PHvv/8O3ylsbW1v377NLjk6zvfw4cP00I8//hjpZMboKsqvCH7dgRoLFEDTAJs3b6aHpqWlQebr6OhcvXqVHLR3716CBGo1pqamISEh8FssFlMeiILgawUlLvTgFy9e5C5/YWEhRDx16hT3WHK5HH1ue/LkiVIRMRhs8XYhSktLBw8eTFZ2BgYGO3bsgFDG7TQwoSqXy9EghsL169fR8zMyMiZOnEj/TDhu3LjU1FR+Mj98+JCyyE1XV3fu3Lk1NTWUiV9w/CCXy+vq6oKDgynbbMzMzLZu3Uo/JpEsf5tZBFy+fLlPnz6U54waNSozMxP1CsDYsWPlcjnlOHgwb44fP96jRw/ydXNz859++kkmkzHmg7Ivlcvl9+7d+/TTTxmncaytrTdt2vTq1Sv6ixobG3fs2EF3t2hjY/PNN99QLGR2FO0HDgkJgQEHY+ihQ4dY6tuFCxf4FbGK1ZtH/gMymSwsLIwyQdGzZ08Y3NjZ2YExzJiBSjUo9gQyepd1dnaGuIwRhw8friFhuCiTX375hTI15+Xl1eYQR9EWUEgLb6kos45kUlJSWJ6McpgOjzrc0NDw22+/jRs3jtFD7JgxYxSZECyZybJpH1qiIqRS6aJFi8j1wcjIaP369a2trZScNDIyIkdMT09///33Ke8yNjb+4osvFH1N41gZrl69iux2YMCAAZmZmfQaHhoayqPI1N7NKapXFy5c4F3WdODEWgoWFhYQCpOBdB48eKB6K2YsawMDg4ULFz59+rRNyWGjjYGBQXV1NT30/Pnz8MCDBw8yRlddfkXw6A7UWKBcLF65XI7cbfTo0eP58+fkoLi4OMryaU9Pz7///hs9k8XivX79+vnz5ymjF09PT/YPZOqyeFtaWmxsbKBpK/U6DEYul+t0VtcgGEbkcvndu3fv37//6tUrOzu7MWPGwJhbjTx//jwlJQWMT6FQOGTIENUXIj569Ojvv/+uqamxt7cfNmwYl70uVVVVycnJJSUlBgYGTk5Oo0ePhilWtWQRjHuysrLq6+utra2HDh2Klt5xRyaTJScnFxYWSqVSZ2fnsWPHKjrbXcWXFhQUwBdlqVRqbm7u4eHh7e2tyPEG0NrampqampeXV11dLRAIPDw8Bg8ezB5F+/AuYn6oUuiNjY03btwoKioyNjZ2dXUdOXIkLPnr1q3by5cvPTw86EvdNNqgeKNNYSorK2/evFlWVmZoaNi3b18fHx9N7xB7U+rwy5cvs7Ky8vLyamtrDQwM7O3tBw8ezF4QGsrM4uLi5OTkFy9e9OjRY8SIEWitSptUVFRARdLR0XF2dvbx8WH3PMRR/ubm5lu3boGL4LfffnvkyJHEG94QeJR1RwOVtYGBQc+ePUeNGoUOhn1z4d0ddJACbW1tTU5OhnME3n77bbTkhCMtLS0JCQn5+fnGxsb9+vWjzBNojgsXLsASmPDw8H/961/aeSmm04AtXgwGg2kHampqYM38+++/r4UTZTAYDAaDeUORSqUDBw589OhR//79U1NT2WcIMBg62HMVBoPBaISkpKSPP/6YckQEORR+jBs3TrtyYTAYDAbzxlBXV+fv7//o0aMePXqcOXMGm7sYHmCLF4PBYDRCXl5eZGQkOCqjA67XjIyMlixZonXRMBgMBoN5M2hsbKysrBw2bNjt27ddXV3bWxzMGwnDHnoMBoPBqIvvvvvOy8uLfJ5kQ0PD2rVrr169ShBEWFgY992PGAwGg8F0NWxtbRMTE7t166biaZqYrgy2eDEYDEYjmJub6+joNDU1TZ8+vV+/fgMGDLC0tCwrK0tISKiqqjIyMgoLC1u2bFl7i4nBYDAYTIeG0es4BsMd7LkKg8FgNEVxcfG5c+cSExP/+eefioqKV69eWVhYuLi4+Pr6Ll26FM/uYjAYDAaDwWgabPFiMBgMBoPBYDAYDKZzgj1XYTAYDAaDwWAwGAymc4ItXgwGg8FgMBgMBoPBdE6wxYvBYDAYDAaDwWAwmM4JtngxGAwGg8FgMBgMBtM5wRYvBoPBYDAYDAaDwWA6J9jixWAwGAwGg8FgMBhM50S/vQXAdC1evnw5ZcoU8pVVq1ZNmzat/STCdIki6xypwHBnz549sbGx6F9ra+sTJ060GWvXrl2nT59WNhZGLpeXlpZKJBKCICwsLOzt7XV18fd0DKbj8uLFixMnTty5c6e0tFQqlVpZWdnY2Lz11ls+Pj5DhgwxNjZubwExGDWDLV6MVmltbS0sLCQIoq6urqqqiiCIoKAg7tEPHz4cEhLy9ttvnz9/3traWpOSYtRTZB2EzpEKDHeqqqqgxJ8+fdra2ioUCrnEqqys5BFLcyxZsuT+/fuMQadOnbK3t4fff/zxx65du9jv0QRyufzo0aOHDh1KTk6ur69H1w0NDd3d3YcNGzZq1Cg/Pz9HR0fNyYDhztq1axMSEvjF/eijjz799FN1S4RpB+Ry+ZbXNDU16ejoeHh4WFtbP3v27PHjx1KplCAIT0/PnJyc9hYTg1Ez2OLFaBWBQAADyvDw8GXLlikbfe3atTU1NSkpKf/73/9CQkI0IyNGnUXWQegcqXhDyc3NLSsrIwhiyJAhZmZm2nnpptcQBGFvb19eXs4x1tbXKBtLc9TX19fU1BAEkZ+f39LSQhCEk5OTiYkJfMRBtzU2NtbU1Mhksry8PIIgbG1tbWxsKPeonYqKihkzZqSkpBAE0bdvX19fX0dHRx0dnYqKitTU1ISEhPv37//+++8EQezevXvFihWEFmlsbATBbG1t+/Xrp81Xd2QePnx4+/ZtfnHHjRtHdApw3Vi3bt2PP/5IEMSiRYu2b9+OvuvV1tZ+++23O3fu1Kje6FDdBKZLgS1ezJtEv379YBjq6enZ3rJgMBhObN++PTIykiCIjIwMLy+v9hbnTeKPP/6AHy4uLkVFRQRBHDt2bPjw4ZTbPvroozlz5syfPz8vL2/s2LGnTp2ytLTUqGAtLS1+fn737t0zMDD4/fffP/zwQ8oNjx49mjNnzr179wiCaGhoILRLWVkZWGgzZsw4deqUlt/ewbl9+zalGRYVFXl4eMDkfG1tLeX+Y8eOffTRR0RnoYvXjUePHu3cuZMgCF9f34MHD5KDzM3Nd+zYceXKFZjp1TK4m8BoGmzxYt4kTp06deTIEXd3d19f3/aWBYPBYDoElZWV06ZNS0lJ+eCDDyIjIw0NDTX9xt9//x2s2fXr19PNXYIg3N3d4+PjPTw86urqNC0MRimMXkO5Aj90dHQoQWAGa1E6jGY5ceIETOEGBwcz3rB3797nz59rXS4MRuNgixfzJiEQCBSpaQwGg+mC5OfnT5o0KS8vb+3ataGhoTo6Olp46cmTJ+HHnDlzFN3To0ePDz/8UCwWa0EeDAbDhX/++Qd+KFrRPXLkSO1KhMFoCexNEYPBYDCYN5I7d+74+PgUFBTs3bv3+++/1465SxDE48eP4YepqWlX2PzZOZg0aVJwcDDs8eaOm5tbcHCwj4+PxuTCaA/wC0AQBN4ri+lq4DnerkVOTs7NmzdzcnKqqqoMDAyEQqGPj8+kSZPoC5lgN0VjYyP6t3v37r179yYI4tatW+fOnXv69KlAIBg+fPicOXPAkwojdXV1J0+evHv3rkQisbe3Hzly5JQpUwwMDJSVXJEwFFJTU69evZqXl9fQ0GBubu7h4eHj4zNs2DB+R2U0NDRcuXIlKSmpvLzcwMCgZ8+evr6+o0eP1tPTI99WUlJSXFxMiWtsbEzZiwIuQ4YNG0YelT59+vTZs2fk29566y25XJ6fn0++6O3tDTusoqOjs7KyGhoaXF1dAwIC2Le71NXVXbx4MSUlpaKiwsTExNHR0dfXd8SIEezDYnUVWeeoeIja2tqzZ8/+/ffflZWVurq6PXr0GDRokK+vb/fu3dE9eXl5L168QP9aWVn16dMH/VtWVgZbMQFTU9MBAwbA78ePH1dUVKAgAwODwYMHw/W4uLiCggKpVOrk5DRjxgy4DjQ3N6elpZGFdHV1tbOza25uPn/+fHJycllZmYWFxdChQ2fOnCkQCFhS9+DBg/j4+Ly8vNraWhsbm/79+0+ePLlnz56U2yorKxlrplQqjYuLS09Pr6ioEAgEHh4eM2bM6NWrF4iH1shlZmaSd4g5OjrSX8Gv0hIEkZaWdvr06SdPnhgbG/fu3XvOnDkuLi6EmmAvCMayANzc3GxtbRU1dnt7e2dnZ95SnTlz5oMPPoDt1NHDygABAABJREFUHoqO2iooKKCvUURt6uHDh9XV1aqIlJOT4+bmpih03mvUlUVc2iA0pdLSUvi3qqqK7KtJR0dn2LBhdBkyMzMvXLhQUFDQ0NBgY2Pj7e09adIkOzs77trp+vXr8fHxFRUVTk5OU6ZMIb9FJpPFxsampKRUV1c7OTnNnDmTUnkQXBKoCvyc9g15DY+eUSkUaeyKigr0eQUYPHgwWZNz1xj86obqalMqlcIWAMSAAQPIn4pSU1NlMhn6t0+fPlZWVsrqW3Z1hx4FRxVATWZxzkfJDUXVPicn58SJE4WFhTKZzN7efujQobNmzVJqSIbUglLdBAbDBzmmaxAZGYnGJfr6+s7Ozqg7t7W1jYqKokehjHtEIpFUKg0MDKRUIQcHh6ysLMaXHj9+HA1lEG5ubpmZmWipm1gs5iI/XRjKDUVFRWPGjIFQgUDg7OyMdh917949JCSkqalJqRwLDw8H4XV1dR0cHJA/Qw8Pj0uXLpHv3Lx5M71leXh4kO+5c+cOXE9MTCRfX7duHSUinPZBuVhYWHjlyhULCwvK9ZCQEEXy7969G7zX6OnpOTs7o+/6Xl5eKSkpimKpscg6R8UDfv31V/girqur27NnT5QEHR2dsWPHXrt2DW5Dg3tgxowZ5IeEhYWRQ728vFAQZa2+UChsaWlZvXo1JQkEQcyaNau6uhpigWdLMmKx+N69e66urpTrtra2x48fZ0xaYWHh1KlT4TaBQODi4gInMerp6S1fvryuro58M2PNTE5Opp/iExYWRhePQmhoqFoqbVVVFWWYBaxbt04mk4FsQqGQe3HL5XIUi0tBMJYFcOjQIZbGztJ+FTUKlA979uzR1dXt3r37nTt3WCKKRCK6VEh/zpgxg59IkydPhvsHDx7MUbWqmEUc2yD7thcjIyOKVPn5+X5+fhBqZWXl7OwM1pShoeGaNWvoSWPUTvTqFxQU1NLSIpfLCwoKyJ+9gJUrV9Lzh2MCNQH4sWfMH1V6Ru5w0diIsrIyfhpD2brBglJq88GDB5R3ZWRkkG+g9OynTp3ioW/ZBaY/ih1KbtCrfVNT0+LFiymxLCwslB2S8egmMBh+YIu3qwAjGysrq+jo6ObmZriYn5+PTiUNDw+nRImOjhaLxV999RXScUFBQba2tmvWrImIiNi+fTvaB+Lu7k4fGcTExMBHVjMzs9DQ0Ozs7MLCwvj4+Pfee8/GxgYODuFueNCFIYfW1dXBKH/o0KFpaWlwUSaTXbx40d3dHaLU1NRwzy508OCyZctQ//rgwYMJEyZAT3/gwAF0c2pqqlgsfvfddyFKcHCwWCw+evQo+YFr1qxhHFCmpKSIxeLPPvsMdsSJxeK8vLzc3FzxawYOHAixzpw5Y2ho6OfnFxYWJhaLlyxZoq//fxZoREZG0uX/5JNPIHTlypVVVVVITm9vb5h/vnjxIj2Weousc1Q8uVy+d+9eGHfu3Lmzvr4eLj5//nzlypWUMr18+bJYLIbjbegWL4ze0ACObPEmJCRAEMzECoXC//znPwKBYPv27VlZWSD/2LFjIeKQIUNAjIaGBoiFMnPTpk3W1ta+vr5//vlnYWFhVlbWtm3bYDJBR0eHUidBJBg8OTg4/PnnnzKZTC6XS6XSiIgIiOXt7V1ZWYnuz8vLO/QaqEgEQfz555/Gxsb9+vXbuHHjrl27kCRhYWFIPLQe8quvvhKTSE9PV73S1tfXowmo8ePHx8fHQ8JDQ0MFAsGGDRtUtHi5FAQqiy1btqAR3r59+8RicW5uLqWxr127liCI4cOHi8XipKQkHhZva2sr6BN3d/f8/Hz2iNeuXROLxTAVTBCEpaXlnj17kPl04cIFsVjct29fgiD+85//cBcJGgXKBy72mCpZxL0NQlNCbXDgwIHkKrd//36ySBkZGWBoubq6oiTU1dWh7dB+fn5IawFxcXGHDh369ttvkXaaP3++nZ3d6tWrd+/e/e9//xtm5wiCWLVqlUQicXJy6tOnz9dff/3zzz8vXrwYTU4eOXKEnp9cEti+Fq9SPSNHOGrsoKAgKMSGhgZ+GkOpusGCsmqzurqaogkpFu/BgwfFYvGUKVMoFq9S+pZdZvqgYuvWrWIm4FMLpSbQq71IJDI0NFy4cOFPP/30zTffODk5kS1e7kMyZbsJDIY32OLtKoDhER8fTw8KCAiANZbPnz+nh2ZkZIAacnFx8fDwqKioQEFSqXTQoEEQeubMGXKsoqKibt26wfpMyqfW1tbW2bNno+WsSplPSBiKxbtr1y64XlBQQImSl5cHH865W7x79uyBpy1evJgS1NjYOHToUPiUS5mtjYuLg1ifffYZ/ZloxVGvXr1aW1spoTCsuX//PuU6moFxdXXdvXs3OQgdW+Lt7U2J9csvvyiSpLq6ukePHjDpRy5KzRXZm17xmpubYd5g4cKF9FBYJUgZjKLhI8XiRdAtXgQMpPT19U1MTFJTU8lBMpkMzSp88cUX5CBkRRsZGc2ePZtSwZKSkuD7SLdu3Z48eYKuSyQSWJlmYmJCtjoA5JrI39+fXmNRzezdu/cXX3wBYz7gyy+/pIzA0DQjZZyneqWVy+XooNcZM2ZQ5ExNTTUxMYG087N4lS0IuVyOxqbJycmMT4YZY0q95W7x3rhxA5YSjBgxgjyqZqexsRE1ma1bt5KDzp49y6jr2GloaIDzbBCenp6bN2++d+9em3GVzSJNtEGo/zAoNzMze/z4MSX0+++/hyds3ryZRTu5urp6enqSCyI3NxeUjJmZ2ZIlS6ZMmdLY2IhCT5w4ARGHDBmCLvJIYLtYvPx6RnZ4a2zeGoNL3WBBFbXJrgnRYjFk8fLTt+ygRxUWFjLeAO2asSaQq71QKCSPWEpKSkxNTZHFy2NIxqWbwGBUAVu8XYVPPvlk+PDhjEGJiYmgaH799VcWHUcQxJUrVyih+/fvh6BVq1aRr6P9QsHBwfRnwuYfpQwPdosX/IXq6+uTewIEfDrlaPFKJBKYZzM0NCwvL6ffcPXqVZBh8ODB5OsvX76EbaX29vb0kTd5aEhfbeXo6EhZBU3pnEaNGkUP7dWrF4TW1tbS5Tc2NkafvcmgrmjDhg1aKLI3veLl5OTA/d9++y09FEpW7RavogFuYWEh7JTT09MrKSmhW7yKKu3SpUvhhuXLl9MHWIoG06NHj4Ybzp49q6hm9uvXD1ZvIu7evevl5RUdHc19KMO70hYXF0OG6OvrP336lB7xiy++gIj8LF5lC0Iul0dEREDEBQsW0CNKpVIbGxsHBwdKpnG3eGEuxdTUlLy2kwu5ubkwAaWnp4dMzZKSEhsbmz59+qB5Re4UFRWh+SIyjo6Oy5cvv3btGqM25pFFmmiDcrn866+/hnvWrl1LD21qaoLpX1NTU3rfQdZOf/31FyUU7W4wNDQsLS2lhL711lsUvc0jgdq3eHn3jOzw09i8NYbqFq8qalN1i5eLvtWCxQtHhVNCFy9ePHr0aN5DMmzxYjQNtngxcuQyh3H8gXScnZ0d/Zsl8kQSEBCALjY3N8NXW4IgEhISGF86adIkejfG2+JFa/bOnTtHj1VcXJyRkaFo+KXoM/aECRMYb5DJZMiPyK1bt8hBaK8p5SM3LNJbvnw5o5EGzjM2btzI0jnt3buXHop81ZDnVZD8U6dOZZQ/Ly8PbujRo4cWiuxNr3i5ublw/7Bhw+hWSktLS0ZGBsXmUYvFe/v2bca4aEnt999/T7d4J02axBjr+vXrcINAIIBVmq2trWijoKKFrL/++ivc4Ofnp6hm/vTTT/K2aHMow6/SyuXy0NBQuD5+/HjGiMgzDW+LV6mCgFXWyDCgz8H+73//Iwjiu+++U0oY+j46qJBK7dSQy+W//fYbxHV2dq6pqZHJZOPHjzcwMEDLDpWlubn5l19+UeTpysXFRSwW0xWvslmkiTbY2tqK1Pjff//NeA86ZzgiIkKRdhIKhXTthOaH6Q1HLpfPnTuX0hx4JFD7Fq8qPaMieGts3hpDRYtXRbWpusXLRd9qweK1srKirPanwGNIhi1ejKbBpxN1RSQSyePHj3P/L6gDIHuLpePl5UV3fmhvbw8/amtr0cV79+7V19fDb4qPRwRa2KYW0A6QuXPnbtu2jewvFxYSe3l5cXTXfOXKFXbJdXV1kfDoqzZ6O/yIjY0lX4+Li3v77be//vpryEC0/hk4duwYOS4jaEVim5mP5Fd0mISbmxusEystLUU+MLVTZG9ixXNzc4MFh3fu3Bk/fvyNGzfIoXp6el5eXmr3JKmjo6PICzfyn4lmyMko8gELCw7Br2lWVhZBENnZ2ZDtOjo6imK988478OPmzZvNzc3sT1YFfpUWBIMfipysMlYejRaEmZnZggULCIJoamqie4vZt2+fnp7ekiVLeIuEPqvduXPHz89PIpFwj7t48WLQM0VFRZ988kloaOi1a9d++OEH3k1bX1//888/f/z4cUJCwooVKyjeYgsLC5ctWzZ27FjkHpZfFmmiDWZnZ4NvWENDQ0btShBE//79KdWMYwWztraGH4xPRt6V6urq2lHJKIsqPaMieGts3hpDRdSlNnmjFn2rOt7e3siTiKaHZBiMusCnE3UhsrOzd+3aFR8fj7zzUyB7n6dDd6UIa4rgB9m3/sOHD+GHUChUdH4M48EPvFm2bNmBAweys7MbGho2bNjw3//+d8KECQEBAdOnT4f9PDzOZ2fx9Y/mNO7fv0++PmXKFGNjYzg5YNeuXTASSk9PLygo2LRpk729/ahRoxITE4uKiv7++2/UL8bFxbm7u6ODalTMfLRALjs7++eff2Z8mqGhIZR1dnY27GTTaJG90RVPT09v9+7dMNtz8+bNcePGOTs7z5w5MyAgQMXTOFgwNzdnPLcJ9nHBDzQvxCV1pqamdnZ2MFbLzc319vZG9dzOzg5lpqJ6/urVq8LCQuRxhMsblYJfpSWXON09NWBkZCQQCMifRbRQEJ9++um+ffvAePv3v/+NLKKsrKzk5OTAwEBllRKZNWvWDBky5D//+Q8yei9dukT34q6IiIiI27dvFxUVxb5m0qRJISEhhGro6Oi8+5rdu3ffv3//5MmT0dHRyD9tYmJiUFDQxYsXeWeRJtogqnKmpqZoRygFtJAkOztb0XMYz7ZFC3EZdRfyWIt0V7soGWVRpWdUBG+NzVtjqIi61CZv1Dtw0pwYahySYTDqAlu8XYU9e/aEhITIZDI9Pb1JkyZ5e3ubm5vDOKOhoQG54GMB9dNkGL/SoSPO0YIlOop6C34YGRndvHlz3bp1Bw8ebHnNhdcsX758/Pjxa9eunThxIsdHoekIFuHR0aaUL5dmZmb+/v4nT54sKSm5c+fO8OHD0RQubGuZM2cOzAjFxsaCxXv37t2ioiLkl1j1zEfyH30N+2MrKys1XWSdoOLNnz/fwsJi1apVYNsUFRWFvcbOzm7x4sVr1qxBUzrqQpGVRU4a5RhVLhHB4oWIStVzqOqMQzeWN3KHX6XlXuK8LV5+BdG/f/+RI0cmJyfn5+dfuXLl/fffh+vgjxftbuDN+vXrwbUyD6PXwsIiJibm3XffBXNr/fr1qsyB0+n3mo0bN166dOnzzz9/9OgRQRCXLl1KTk4eOXIk7yxSextEVa6mpgZ8/3Cscly0E8fQ9lUyyqJKz6gI3hqbt8ZQEXWpTd6oRd9qQQw1DskwGHWBLd4uQUJCwueffw5HU/z111+UZUISiYSL4cEdtNyFPP+maSwtLcPDw7ds2fLHH38cPXo0KSkJjpv+6zUikejgwYNcVtFwER4FoW/5iDlz5oC3xtjYWLB4yVO4gYGBMKMSGxsLWxDJ9rBaQCJt3boVnXagCOT7SkNF1mkq3pQpUyZPnpyQkHDkyJHjx4/DeK6ioiI0NPTAgQPnzp2DstYCLHVPqYhK1XMer9NCpW0vVUN5I2POLF++PDk5GUw4MOfq6+ujoqLeeustX19f1d+uitE7cODAnj17Pn36lCCIzz///O7du+r9/gj4+fklJCT06dMH1u5evnyZbPHyyCL1tkFUag4ODufOnWO/WTuzrB1HyWiiZ+T9TPVqDBXRqNpsbW0lOhHqGpJhMOoCW7xdAuS3cN26derdQMsI+hrNssfs5cuXmnh19+7dP39NcXFxdHT0r7/+WlxcDIfWenl5obMNWbC1tX327Bm78CiIvmht6tSpRkZGjY2NcXFxO3bsuHfvXl5eHprC7dWr14gRI27dulVQUJCRkTFo0KC4uLjevXsr2kjGAyS/ra2toi2IWiuyzlTxdHR0xr5mz549V69ejYiIgINGKisrAwIC8vPzwREuGcZR0atXr9p8V0NDg6IglDTGOR/uEVHV5VLPFa3PbN9KC2mBpfIaUjW8C2LOnDkhISFVVVVnzpwpKSnp1atXdHR0fX398uXL1TWnytvo/fzzz58+ferh4ZGbm5udnb1q1SrkB4g7OTk5JSUlI0eOhINGGLG3t583b96BAwcIgigpKVE9i3i0QUWg+tzS0qJUldMoakyg2lGxZ1SvxuatMVREXWqTd9fwxqH6kAyDURf4+0qXAO1HQn7zySDnseoCHVlRXV1N8VmCoA+A1IuDg8O6devy8vLQ9CndRQojaHstcvZIJz8/X5EbCYFAAMt1ioqKUlNT6V6pyN6tUlNTCwsL1TjBS5a/oKCg3YusU1Y8fX39iRMnHj9+PCkpCSbHysrKLl26RL6BxV7iIkB9fb2ihbho5xvjwTAwmKDz4sULtIAQIqJ6Uv0a9npuY2MDh+JoCH6VlpwJsHqWTm1trSoWL++CMDIyWrRoEczbgMm3d+9eIyMj5I9ULaxfv3779u1KObI6evTooUOHPv/882vXrsFwfO/evadPn1b21bt37/bz8yOfVsKIm5sb/KCbaqpkUZttkHuVKy8vZ/mu0V6onkC1o2LPqF6NzVtjqIiKalP1ruHNhfeQDINRF9ji7RIgz0CMa2yU8vbJBXd3dwcHB/idkJDAeE9KSooa37hx48b58+fTrxsZGYF/FPDZyOVRkydPZvGFSxCEVCpF5+sy7kVBCv3YsWNxcXFubm7kj9DI1WpsbKzalzTD0jj4AYuIGElISLC3t3dxcUEflTVUZJ2g4t2/fz8gIODs2bP0oJEjR6Jzbsm1y9LSksX+hJWcbYKO1aGA/Li+99573FOHYjk4OMBxoI6Ojn379mWvKshFrb+/v1pmJhV94+BXacmZQHFv22Y2codfQYDvFvgRERFx8+bNzMzMOXPmMDo60prR+/jx4+Dg4IEDB+7YsaNHjx6HDx+G64sWLVL0rYSdv//+m+MWSmT68sgiHm2wzSrn6OjYr18/uIFFJ0ybNs3e3v7HH38kNIkqCdQaqveMatTYvDWGip9cVVSb7F3DrVu3iM6CKkMytX8Kx2AAbPF2CZBbUdQhkUFndaqR4OBg+BEeHk4PvX//vnqVe2JiYkxMDGMvYmZmBruwOJ7uMHPmTPBFmZaWlpmZSb8hNjYWetCAgAAwHihMnz4dHJZEREQ8fPiQYtA6OjrCdqxHjx5FRES4uLigz8ZqISAgAIo7KSmJ0Z0v+EctLy/38fEhu8fURJF1gopXWVl5+vTpU6dOMYaam5vDD3LtMjMzg51jjx49ghNQEOSTJNnZv38//WJycjK4jTU3N583bx79hlu3bjF6SUWDDGRjwLnQ8OP333+nR5HJZHAyKvlOfqD5PfJZHVOnTh00aNCdO3dUqbTz5s2DIsjMzIRHUYiIiFBFct4FQRDEW2+9NWHCBIIgnj17tnDhQnBQTGgAjkZvS0tLUFBQc3PzH3/8AY5n/P39wWlTdXX1hx9+yGMbYXh4OMuGxubmZpg91tHRYdxsyTGLeLRBxip3/vz5QYMGwcQyQRCrV6+GHzDDTCc3N/fcuXMVFRVTp04lNAmPBEJP9Nlnn/3555+EVlC9Z1SjxuatMTjWDRZUUZuenp6KvhrEx8er8RSldofHkKzNbgKDURWNn/iL6QAg9/0ODg7Pnj0jBz179gx9ZB07diw9Llq3JhKJ6KFoqSQlbn19PTrDYN++feSg6upqb29vdJ4q+Vj5NlEkzNixY2Gmgh4lKioKomzdupXjW65duwYOFUaMGCGVSslBz549AzVtbW399OlTRU8gD+/+/vtvSuiOHTtQ6OrVq3kfFo+OFbl+/Tr5ekJCApK/oaGBEgv6Y2Nj4wcPHmi6yDpBxQOz3MTE5J9//qEENTQ0wImdlpaWdXV15CB0muhHH33U3NwMF5uamj777DO0wNvLy4v+OqFQCH2/ubl5ZGQkOaiiosLDw4MxaWKxGK7b29t7e3tXV1eTQ3fv3g2hLi4uL1++RNdlMhnYGwRBnDlzhiIJciq2du1aZWumogp/8uRJuFJbWwtfhYqLi1WptHK5HLz7wmiysrKSHBQZGWlubg4DKaFQKFcGfgVB4fjx46ilDxgwQK4C6MiTlJQUxhuQ0QtnBdfU1FBugB2/v/32G/liY2MjOlb0u+++4y4PMlQ++ugjipIEpFIpsh+WLl2qShbxaIOtra3gTXfgwIGUHFiyZAm6x8/PD1594sQJypPr6+thzS1jt8KundByzbCwMC56m0cCz5w5g/Lt5s2bctVAR6MbGRlptGekw1tj89YYXOoGC6qozSdPnkComZkZeWCQnp4uFApR13Dq1ClV9C07bT4KlBtjTWCv9ioOybh0ExiMKmCLt0vQ2Ng4YsQI0CaWlpbbtm27dOlSUlLSjh07hEKhv78/BAmFQtFroJPYuXOnSCSaNm0ahLq5uUEo9C6nTp0SiURBQUGMcUE5WllZQejUqVMjIiJiYmI2bdrUo0ePAQMGIJ9GPj4+EFEikbAkYdWqVYzCZGVlIfUKK4QvX75cXFz87NmzO3furFu3DmYzRo8ezTgsU0RUVBQsxB08ePDp06eLi4sfP378+++/w9ydra3t7du3WaJHRkaCPK6urizDC5iTod+Qn58PqXN0dITbAgMDRSLRkSNH4AYIRR+MJ06cKBKJQkND0ROOHj0KXYWnp2dUVFRBQUFxcfH169c/+ugjHR0dAwOD2NhY+nvVW2Sdo+KhiWihUPjLL7/cv3+/oqIiNzc3NjYW9qrp6+ujHhrx8OFDdH6Dg4NDYGDgrFmzhEKhhYUFOtHRysoKBDh//jzF0BIKhTBimzZtWnh4eExMzMaNGyGIIIjFixe3trYyWry7du3q379/jx49Nm7cGBMTExERgT6+WFpapqenU+SsqqoaNWoUpOKrr77KzMwsKytLSUlBeykXLVqELHaWmikSiRITExXlYW5uLqzuGz16dE5OTl5e3oIFCwiCGD9+PPk2fpW2tbV18eLFIIy9vf2mTZtiYmLCw8OnT59OEER0dDTkm7GxMchJMV8pREZGwm2weVLZgqDQ3NyMDp/cu3evXHm+++47kAc5iJo8eTJcoZj3FKO3f//+cNuRI0dEItH8+fN1dHRMTU0/+uij9evXw/0PHjwQiURIeerq6i5YsIDclFggT8Y6OTlt2LDhzJkzKa85c+bMxo0bkYk+depUFt3LJYv4tUE43hZ85BQXF589exbUwo0bN9A91dXVY8aMAW/Mn3/+eUpKSmlpaWZm5v79+0H+0aNH19fXkx/Lrp02bdokEomgTcF2VpFItGrVKha9/d133/FIIPlAux07drRZXooyH0RCe210dXXhCpJZvT0jIxw1Nv0bJT+NwbFusKCs2iSDPgPp6emNHTs2KCho1KhROjo6wcHBmzdvhqDx48eLRKKlS5fy07eMJCYmMj4KfeeKjY2FG2BNAaoJBw4cYKn2iuoJjyEZx24Cg+ENtni7CnV1dcHBwZTtlGZmZlu3bqWfVgffnhVtxYHZA6SdGeMCDx8+HD9+PDlUV1d37ty5NTU1aIyOKCsrY5EfjZ8oXLhwQS6X37t379NPP2U8hMDa2nrTpk2vXr1SNsfS09PRKZEIAwODhQsXtvkNu7q6GnxUrFmzhvGGIUOGwEiRMVTRvrKQkBC4gTGUMtuZkZExceJE+vbLcePGpaamKpJcjUXWOSpeQ0PDb7/9Nm7cOOR0hMyYMWMUjfCuXr2KxhbAgAEDMjMz6cVH/lSBLF6Y/kLGAGBubv7TTz/JZDLKu1CixGJxdXX17NmzKeU+bty43NxcRjmlUukPP/xA3zzp5uYWHR1NuZllx+OhQ4dYsvGXX36hnE3q5eX15MkTym38Kq1MJgsLC0OLP4GePXuCkYAMVCA4OJjL1CWgbEHQ2bRpE1T42tpaufKwHEjDOEVDNnoBmLwi4+HhATcr2lZAWTPCSHNz86VLl4KDg99++21FEg4fPjwqKkr1LOLXBktLS9H0NWBgYEA3DhsbG3fs2EH3qWtjY/PNN9/QbXV27cToN9jZ2RniKsolHglMSUmBmxlnhjkilUoVlR2SWb09oyJYNDbakREeHk6PyE9jcKwbLCilNikRFy1aRBbYyMho/fr1ra2tlK7NyMiIt76lo8hN1PDhw+GGdevWMd4A07mKqr2iesJvSMaxm8Bg+KGD94h3KaqqqpKTk0tKSgwMDJycnEaPHq2JkxgpPHr06O+//66pqbG3tx82bBjH/bT8KCgogA/kUqnU3Nzcw8PD29tblaNEKyoqUlJSysrKDAwMevbsOWrUKJaj5zsgz58/B/lh6D9kyBAuhxOqvcg6QcV7+fJlVlZWXl5ebW2tgYGBvb394MGD2TOzubn51q1b4Nr07bffppxHyoi9vX15eblQKCwrK4NdYcnJyYWFhVKp1NnZeezYsWjqmEx4eDhs0BWLxWCzlZSU3L17t6yszNLS8p133nF3d2d/b2tr6927d/Pz8yUSiY2NTb/XEGqlsrLy5s2bZWVlhoaGffv29fHxUeQNi1+lbWxsvHHjRlFRkbGxsaur68iRI9V42CPHgqBz5syZGTNm/Otf/2Lcptg5qK6uzs3NLSwsrK2tbWlpEQgEPXv29PLy4nhEDfcsUrYNyuXyu3fv3r9//9WrV3Z2dmPGjLGzs2O8s7W1NTU1NS8vr7q6WiAQeHh4DB48WKNnUKuewJycnFu3bo0bN47RK5im0UTPyKixd+7cCTuujx49qmjPPA+Nwb1uaEJtFhcXJycnv3jxokePHiNGjKB8letMKDsk495NYDDKgi1eDAaD6ShQLF6O0C1eTAdh9uzZx48fT09PV+OZ250MnEUYFr788kvwB5GcnIz2yGAwGIyyYF/NGAwGg8Gon4qKitOnTw8fPhzbcorAWYRZvXo18nFIB9wam5qaqvdQAwwG09XAFi8Gg8FgMGrg448/hvN4gD179rS0tCxfvrxdhepY4CzCUIiLi9u0adPLly/pQYmJiXDm8yeffELZ4YnBYDBKweAmAYPBYDDapKqqqq6uDvaLwt+ioiLwkIS8mNJpbW19+vQpQRAvXryAKy9evICITk5OePuT9omMjHz06NHUqVP19PQePXq0a9euXr16Ib/iGJxFGEbq6urmzp0bFRVFVne3b9+eO3cuQRDu7u7ffPNNuwqIwWDeePA+XgwGg2lnli1bxui2JyQkJCwsTFGs8vJydFglhZqaGgsLC7XKiGkb+Mrg5ubm4uJy69atV69enTp1Cs5JwgA4izAUBg0adO/ePVi6PHbsWAcHh5aWlszMTJjdHTly5LFjx7j4rsNgMBgWsMWLwWAw7cz58+dTU1Pp1318fBQdCwGeXXfs2MEYtH79eo7OhDFq5LPPPrtz586zZ8/09fX79u27Zs0aX1/f9haqY4GzCENBJpNdu3btypUr6enpBQUFtbW1urq63bt3HzJkSGBgIDpRHIPBYFQBW7wYDAaDwWAwGAwGg+mcYM9VGAwGg8FgMBgMBoPpnGCLF4PBYDAYDAaDwWAwnRNs8WIwGAwGg8FgMBgMpnOCLV4MBoPBYDAYDAaDwXROsMWLwWAwGAwGg8FgMJjOiX57C4DBYDCc2LNnT2xsLPrX2tr6xIkT7SoRBqNOqqurZ86cSb6yatWqadOmsQfxICEh4cqVKzk5ORKJxNDQ0MbGRigUvvPOOz4+Pi4uLqolAtPVNVsnSw5CvW1Qo7x8+ZJyqpMaRb148eL27dvJV/744w+hUKiWh2MwmgNbvBgM5s2gqqqqsLCQIIinT5+2trbiLpYgCIlEMm3atHv37u3YseOTTz5pb3EwKhWcTCaDGl5XV1dVVUUQRFBQUJtBSpGTk7Nw4cK0tDSCIKysrN566y2CIDIyMp49ewY3HDt2bM6cOepLKKbLabZOlhyEutqgFmhtbdWcqPX19fDwioqKV69eEQQhlUrV9XAMRnPgVc0YDObNYNOmTYWv6d69e3vL0lE4evTozZs3a2tr16xZ096yYFQtOFtbW6jh27Zto9zPEsSdoqKisWPHpqWlCYXCc+fOvXjx4s5rSkpKUlJSHB0dYaxMaJfGxsYbr7l//z7RJVFFs3XA3OusilotbVA7CAQCVUTNzc2FSvXy5Ut6aGBgIDzcz89PHcJiMFoCW7wYDAbzptK3b1/44enp2d6yYDp6wW3cuLGyspIgiNjY2ClTpujo6KCg4cOH//LLL0R7UFZWNu41GzZsaBcB3mhw7mHUzvbt26FS5eXltbcsGIzawKuaMRgM5k3l3XffvXnzZlZW1gcffNDesmA6dMG1tLScOnWKIIi333773Xffpd/w3nvvHT58ePjw4dqRB4PBYDAYrYEtXgwGg3mDGf2a9pYC09ELrqSkpL6+niCIfv36Md7QrVu3hQsXak0eDAaDwWC0Bl7VjMFgMBhMJ6empgZ+mJmZtbcsGAwGg8FoFTzH2/l5/PhxRUUF+tfAwGDw4MFwPS4urqCgQCqVOjk5zZgxA64jMjIyGhsb0b/du3fv3bs3ePs8ceJEYWGhTCazt7cfOnTorFmz6O998OBBfHx8Xl5ebW2tjY1N//79J0+e3LNnT3Zp09LSTp8+/eTJE2Nj4969e8+ZMwdOy0hLS2tubka32dnZCQSC/Px8clxvb29DQ0OpVBoXF5eenl5RUSEQCDw8PGbMmEE+cqO+vv769evp6elFRUVSqdTc3NzT09PPz8/Dw4MuT2VlJeNbampqIiMjs7OzTUxM+vfv/+GHH5LHkfn5+UePHs3LyzM2Nh42bNi8efNMTU0JDkil0nv37pGvDBgwgBw3NTVVJpOhf/v06WNlZUUQRHNzM/hfRbi6utrZ2TU3N58/fz45ObmsrMzCwmLo0KEzZ84UCASEkiiVaSyV59atW+fOnXv69KlAIBg+fPicOXNMTEyUrQxKoagEFdWTvLy8Fy9eoJutrKz69OmD/i0rKysqKkL/mpqaDhgwQMUk84uoKF0qCsOvMbq6uhLKU1JSUlxcTLlobGzs5eVFvnL79m2CIIYNG0bed/r06VPkXhh46623bGxsyFfq6uouXryYkpJSUVFhYmLi6Ojo6+s7YsQI8nO0L6RcLmcpOE0AleHhw4fwb2VlJUirCEdHR6SoefcCtbW1Z8+e/fvvvysrK3V1dXv06DFo0CBfX1+yNyPom0pLS+HfqqoqsmA6OjrDhg1jT5qiVlBbWxsdHZ2VldXQ0ODq6hoQEEApLwqZmZkXLlwoKChoaGiwsbHx9vaeNGmSnZ0d+9t5R1SLZuOXe/z6ZQ0lh6MwWmuDylYbFhoaGq5cuZKUlFReXm5gYNCzZ09fX9/Ro0fr6emxxMrJybl582ZOTk5VVZWBgYFQKPTx8Zk0aZKRkRH76+rq6k6ePHn37l2JRGJvbz9y5MgpU6YYGBgoJTMaRTx//hyuZGZmkv0wkzUDHWVzTy36GYNRAjmmsxMcHEwucaFQ2NLSsnr1anplmDVrVnV1NYro7OxMDhWJRE1NTYsXL6bEsrCwoLyxsLBw6tSpECoQCFxcXIyNjQmC0NPTW758eV1dHaOcVVVVjJbzunXrZDIZ5YSD4ODgQ4cOUe4sLCxMTk6mn4UQFhYGr6ioqAgMDETdgLW1tYuLCxprTp8+vby8nCIV41uuXLlibm5OvmhjY5OQkABRvv32W0qv5uDgkJOTw6WwHjx4QHldRkYG+QYLCwty6KlTp+B6WVkZJaJYLL537x7dFLG1tT1+/DgXYXhnGmPlkUqlgYGBFGEcHByysrL4VQahUMhFfmXrybx588gXZ8yYQX5aWFgYOdTLy0v1JPOLyJgubeY/Ijg4WM6LzZs301/h4eFBvufOnTtwPTExkXx93bp1lIhHjx4l37B7925LS0tQO87OzsgY9vLySklJaUch2QsOEIvFECQWi7kHKYJSGdokNDRUxV7g119/hS+Aurq6PXv2RBagjo7O2LFjr127xtg3UTAyMmozaYr0M0VPEgQREhLC+IT8/HzkctbKysrZ2Rl0naGh4Zo1a5qamhS9ml9ENWo2ZXOPX7/MDu/kKCWMdtog92rTZhsMDw+3tbWF+u/g4IAUpoeHx6VLlxijREZGurm5wW36+vrOzs6o1dja2kZFRbGUwvHjx+F1ZNzc3DIzM5VSF/RRBItmkMvlM2bM4JF76tXPGAx3sMXb+UlISBC/Bmb2hELhf/7zH4FAsH379qysrMLCwvj4+LFjx4K6GTJkSH19PUSMi4s7dOjQt99+C0Gi1xgaGi5cuPCnn3765ptvnJyc6GOdzMxM0O8ODg5//vmnTCaTy+VSqTQiIgLmKr29vSsrKylC1tfXDxkyBF40fvz4+Pj4wsLCrKys0NBQgUCwYcMGeKZAIIC0JCQk5OXlHXqNt7c3RPzzzz+NjY379eu3cePGXbt2oQPokMWbkZEBVwIDAwsKCuBiY2NjTEwMzDx4eHhIJBKyYPS3nD171sjIaNKkSTt27Pjxxx99fX3hukAgKCkpCQsL09PTW7BgQVhY2JYtW/r37w+hnp6ezc3NbRZWdXU1JNDHx4fR4j148KBYLEaHyyOLt6GhASKiVG/atMna2trX1/fPP/+EzNy2bRsUgY6ODsU8YIFHpsnl8ujoaLFY/NVXX6HKExQUZGtru2bNmoiIiO3bt6PNhO7u7pTRIcfKwHFcqGw9uXz5slgs3rp1K6PFC2MINIwgW7y8k8wvYm5uLkgycOBANOzQZv6TG6OcF6mpqWKxGHlRCg4OFovFlJqJDu+hDJ5SUlLEYvFnn31GEMScOXPEYnFeXh4KRSfcrly5sqqqCr0O6oCxsfHFixfbS0j2gtOExUupDD4+PmImkB1LHtfy6AX27t0LSmbnzp2oN3n+/PnKlSspuQR9E2prAwcOJMuzf//+NpNGz8wzZ84YGhr6+fmFhYWJxeIlS5bo6/+ftWyRkZGU6BkZGWAquLq6Iju8rq4uNDQUJpr8/PwY9Ta/iOrVbErlHr9+mR3eyVFWGC20QaWqDXsb/PTTTyF02bJlZWVlcPHBgwcTJkwAG/jAgQP0WGA9WllZRUdHo5qTn5+Puqfw8HDGUoiJiYEqZ2ZmFhoamp2dDYO69957z8bGZtOmTdzVBRpFoOHHV199Ra5U6enpdJlR7o0ZMyY0NDQsLGzBggXooz8999SrnzEY7mCLtwsBfYy+vr6JiUlqaio5SCaToQ+uX3zxBaPB4+rqKhQK79+/j4JKSkpMTU3JYx2JRAJr3kxMTHJzcykCnDx5Eh7l7+/f2tpKDlqxYgUEzZgxgxKUmppqYmIC3Q/jUACp3d69e3/xxRfQfQJffvkl3eIdOXJkS0sL5SFpaWm6uv/vtva1a9cy5h56i6ur6969e8lBixYtgqAlS5ZYWVmhARBYhmhMcP78eTlnRCIRo8VL+eaNLF56Z2xkZDR79mxKZiYlJUFOduvW7cmTJ1wkUSXTUOVxcXHx8PCoqKhAQVKpdNCgQai/VFdlYIF7PYEpCCQD49PoFq8qSVYlIvlDe0fOf0XExcXB6z777DN6KFoe2atXL4owcrkcjCiyUpLL5eiUHfoDq6ure/ToAdMm5NzQvpDsBadei5dSGUQiEeMNR48eZZzJUaoXaG5uhumahQsX0l+xbNkyuk3SZlvjAlk/7969mxz0xx9/QJC3tzf5ukQigSUwZmZmjx8/pjzw+++/h1ibN2+mBPGOqImWxSX3ePfL7PBLDm9hNNoGuVcb9ja4Z88eCFq8eDElqLGxcejQoTCrSZmIRpLEx8fTkxYQEAA7aJ4/f04JKioq6tatG+xWo0yNtra2zp49Gy2HVkpdsA8/GHPvhx9+IAcdOXJEUe5pQj9jMFzAFm8XAi2tYVxqUlhYCJ/l9PT0SkpK6GMdgiD++OMPSqzFixePHj2abokpWs2CfJOePXsWXSwuLoZX6+vrP336lB7riy++gFjsFm+/fv0oVtndu3e9vLyio6Ph35ycHGdnZ0XTm++99x6oWsZeH73l3XffZVmKvGLFCkpodHQ0BK1atUquRYvX0NCQcb3x0qVL4Ybly5dzkUSVTCNXnitXrlBC9+/fT88ZFSsDC9zriVosXu5JVjEiF4u3I+S/Il6+fAl7ie3t7enjZiQ/QRD01W6Ojo6UxY0SiQQWsxgbG6PZAzK7du2Cp23YsKG9hHxzLd42e4GcnBy47dtvv6W/AvJKoxbvqFGj6KG9evWC0NraWnTx66+/houMH+yamppgFtfU1LSmpoYcxC+ihloWl9zj1y+zwzs5vIXRaBvkXm1Y2iBSPoo636tXr0LEwYMHU4I++eST4cOHM2ZIYmIixPr1118ZPyEp2loCW4i1YPH6+PjQQ9GOX3LuaUg/YzBcwL6auyLz58+nX3R2doaeRiaTRUVF0W+wsrKi79j57bffbt68Cb/RejaCIObOncv4anT4JPrORxBEVFQUeGN69913HRwc6LE+/PBDLulasmQJZQPtkCFDMjIyUHo9PT0LCwspGzUR4KCosrLy8ePHSuVenz59kPsfeijyB6blw9x9fX0ZHagsWLAAfkRFRbW0tLT5HLVkmp2dHVr+jXjnnXfgB9mJiLoqgyr1RC1wT7K6Ir4p+U/B1NR08uTJ4BUsOTmZHHTs2DH4NAP/xsbGkkPv3Lnz9OnTOXPmkC9GRUXV1dURBDFhwgRw6kZh2rRp8OPgwYPtJeSbS5u9AGpZ586dI/vYAwYNGpSRkbF27VrNSchYP5ESRmpKLpfv27cPfjMqNwMDg4kTJ4ILIihiFSNqv2Wp2C+zwy85qgij0TbIsdqwg5TPmDFjGDvfcePGwVagtLS0lJQUclBERATlCgK5TqTc0NLSgoZqjPLb2dnBJ2lNw3iqGWPuaUg/YzBcwBZvl0NHR0eRAz3k2hF9UyTj7e2NdrYwkp2dDU6hdXR0KG6f6YPsmzdvInevaLSkyDOnl5cXF/d9sGSIIy0tLaWlpQ8fPsz9v8BhlQRBkF1b00FrQRE6OjpId9PzFrlkAEWvNRQVAcqlurq6rKwspZ7JO9MYS9De3h5+1NbWoovqqgzqqie84Z5kdUV8U/KfDhr7UoaqcXFxb7/99tdffw1vRMsaycNcyrj5ypUr8ANtRaPg5uYGK/1KS0s5DmTVLuSbS5u9gJubG2i8O3fujB8//saNG+RQPT09Ly8vFT0Ds0PXz4xVPTs7GxzSGhoaMkYhCAJ5YUCNQpWI7dKyVOmX2eGXHBWF0Vwb5Fht2EHKB21loqCrq4vcSaD5XjoSieTx48eok0XT+JRO9t69e6j/VfRG9DqNwvgWWJ9MyT3N6WcMpk3w6URdDnNzc0We7mF3DUEQubm59NA2T1z4559/0J3gd5EO8vz56tWrwsJCd3d3giDQsRmKzjgxMjISCARt9jpcDpNobm4+cODA4cOH09LSmpqaGO8hn8ZBh3ICCgBrh0xeQwlCbo3pMx4aRVFumJqa2tnZQd+Zm5vLpUdUPdPoniRhXRM9Z9RVGVSsJ6rDPcnqivim5D+dKVOmGBsbw3lRu3btgmFrenp6QUHBpk2b7O3tR40alZiYWFRU9Pfff6MBcVxcnLu7OzodCkCrarOzs3/++WfG1xkaGkJ1zc7O5n6ukhqFfHNps+3o6ent3r0bZpxu3rw5btw4Z2fnmTNnBgQEtHk0i1rgWNVRPTE1NVU0sYnOe8vOzkYXeUdsl5alSr/MDr/kqCiM5tqgWrQuSh3L4Uwodffv36cEZWdn79q1Kz4+Hp04xd7JoiIQCoWKDpnraJ2d5vQzBtMm2OLtcrAc7AYuEAiCqK6uVioiUFVVRXkOHfJJsC9evIDOrKamps2IxsbGbQ4F2pSwvLx84sSJcOCtk5OTv7+/g4MD2uhy5swZylopRlhOztTooZrqLWiweBkLWmuZBl6vKKirMqhST9QC9ySrK+Kbkv90zMzM/P39T548WVJScufOneHDh6OZGViLOGfOHFh4EhsbCwPZu3fvFhUVIf/DdC109DXs762srGwXId9cuLSd+fPnW1hYrFq1Cr6cFhUVhb3Gzs5u8eLFa9assba21pyEHKs6qic1NTXguI5jPeEdsV1alir9Mjv8kqOiMJprg2rRukqljnzqO0EQe/bsCQkJkclkenp6kyZN8vb2Njc3B5O+oaEBOUvnUQSE5uGee5rTzxhMm2CLF/P/gT7FKXtwOYBWu7F8ECUHobdwiagWgoKCwHJbunTpvn37KMvzSktLuRhvHYHW1latFbSWM01rlQHTofJ/zpw54KY1NjYWBrLkmZnAwMCQkBAIDQ0NpQxzyaAqvXXrVnSIlyKQZxotC9npmTJlyuTJkxMSEo4cOXL8+HEY3FdUVISGhh44cODcuXOQe+0IqicODg7nzp1jv5k8Nc07Ynu1LN79suqP1YQwHbkNKpU6ctISEhI+//xzgiAsLS3/+usvysIriUTCaPG+iX2lRvUzBsMOtni7HA0NDYqCJBIJ/OD3DR6tbEHPYXkF+X5ra2tYxsMS8eXLl4RqZGZmXrt2DY6O3L17N/tutI4DY2f26tUr7RS09jNNO5VBC/n/htJe+T916lQjI6PGxsa4uLgdO3bcu3cvLy8Pzcz06tVrxIgRt27dKigoyMjIGDRoUFxcXO/evem772xtbZ89ewY/FDksaHchuwI6OjpjX7Nnz56rV69GREScOHEC5m0CAgLy8/Ph5NX2AvU+LS0tStUT3hHbq2Xx7pc1kRzVhenIbRApHy6pIycNOShet24d9523qPvuIH0lFzSqnzEYdrDnqi5HfX29onVTaFsIOpZdKdC2merXMN6DvMLa2Ng4OTlRXvfo0SPGWLW1taorbrS36p133mHc9IKOnOkIINuS0XAtKSlp8wnFxcWM11+8eIFWQ7VZ0NrPNO1UBi3k/xtKe+W/QCAAD7dFRUWpqal0ZzNkpzWpqamFhYWM8zZICxUUFHRYIbsU+vr6EydOPH78eFJSEqyxLCsru3TpUvtKhepJeXk5y8dBNUZsr5bFu1/WRHJUF6Yjt0GUOpZzGVDqyA4UUT+LTmbi0smiIqiurkarhTt4V6VR/YzBsIMt3q7I7du3Ga8jv5r8PNo7Ojr27dsXficlJbE7ePT390eOHNHrKI492xRYKZDXB0Wrtlg+lGofS0tLFsP11q1bbT5B0VEHKJMdHBzeeuutjpZp2qkMKub/m7L6/c3KfzQwPXbsWFxcnJubG3kSIDAwEH7ExsayrFREK+UUqSBYQ2hvb+/i4sJjrl4tQnZi7t+/HxAQcPbsWXrQyJEj0WHgjL55tPnN0dHRsV+/fvBSRaoSzkqxt7f/8ccfVY+o6ZalKPd498vs8EuOWoTpsG0QDk9SdNoFQRBSqRQdHQx2O5d+VlEn6+7ujs6FSkhIYLyHpYpyQe1NUtP6GYNhAVu8XZH9+/fTLyYnJ4NjSXNzc0WHr7bJqlWr4Mfvv/9OD5XJZP/73/8od8Kphubm5rCG9s6dO/SIERERhMogT9QZGRn0paqtra3kkyTaHU9PT0V9Z3x8PBev/bdu3aJ7gyQIAh0miQ6v71CZpp3K0CZmZmawiejRo0dwGAlCLpfv2bOH6KSomP8XL178/jVkL7UcmT59OnhAiYiIePjwIWWc6ujoCNv2Hj16FBER4eLigqYLyAQEBEClTUpKYvQ5D02gvLzcx8dHkYNTTQvZiamsrDx9+vSpU6cYQ6FqEQRBPqAILW8mH0Vz/vz5QYMGLVq0SHOirl69Gn4cOHCA8Ybc3Nxz585VVFRMnTpV9Yga0mxcco9fv8wO7+SoLkyHbYMzZ84EL81paWmZmZn0G2JjY8GKCwgIIH9uRv0ssofJXL9+XdEbg4OD4Ud4eDg99P79+1w+jnOsVFOnTh00aBBjWXNH0/oZg2EBW7xdDlNT04sXLx4+fJh88fnz54sXL4bf33//vZmZGb+Hf/zxxxMmTCAI4sSJE/TP/Nu2bYPVPmvXriXvq+nWrRs4mYAnUHwYHj58+NKlS6pv+hozZoxQKITVaOh1iO3bt3eoZTZ+fn7w49ChQ2jJE1ieixYtYlz7RMHe3n7hwoVoATPwyy+/wIF4Li4uK1eu7ICZpp3KwIVJkyaBfbt69eqWlha42NzcvGLFig7llLtD5X90dPT617Cfz8yIubn5+++/j+Y06DMz6IpEIpk9ezbjQ/T09A4dOqSrqyuXyxctWkSfJYiKijp69KixsfE333yjrITqErLTExMT8+DBA8rFV69enTlzBhZQkJcR2dragrNZ8grMpKSke/fuafQ0I5FIBGo2JiYGnCGRefnyJayP/fjjj9H3R1Uiakizcck9fv0yO7yTo7owHbYN6unp/f777+CjeNmyZZTDhEpLS9evXw/7bynnWn3wwQfwIzQ0lLL8obS0dOPGjYreuHLlSrCxL1y4IBaLyUE1NTULFy5ERworhZubG/xAlaquru7y5cv37t1T0ZuUpvUzBsOGHNNlANNFKBTCN9Rp06aFh4fHxMRs3LgRggiCWLx4cWtrK9y/c+dOkUg0bdo0CHJzcxO9ZtWqVSxvqaqqGjVqFGzf+uqrrzIzM8vKylJSUkQiETxn0aJFzc3NlFitra3I5La3t9+0aVNMTEx4ePj06dNhGI2ER1Hy8/NBHkdHR4gYGBgIVxITExllO336NFol5e/vf+TIkVu3bp06dSowMFAgEIDYsNxIJBKFhoayvOXIkSNyuTwtLQ1C4RuBgYEBWYBTp06JRKKgoCCIKBQKITQrK4tLeaEv9Hp6emPHjg0KCho1apSOjk5wcPDmzZshaPz48SKRaOnSpSgW6vZ27drVv3//Hj16bNy4MSYmJiIiAi0osrS0TE9P5yIDv0xjqTwNDQ0sOfPgwQPulcHY2BhiRUZGssjPo54ADx8+RGexODg4BAYGzpo1SygUWlhYoHMXrays4FHnz5/nnWR+EY8cOcKYru+++047+U9ujAj0pebJkydy5YmMjITorq6u9NDCwkLUc925c4flOUePHoWvEp6enlFRUQUFBcXFxdevX//oo490dHQMDAxiY2N5iKcWIRMTExUVnEQigSAfHx8I8vHxgStlZWWKgqBMWVi1ahVjZQBF1NzcDP+OGTMGbhg8eDBcqaysVLYXQPNRQqHwl19+uX//fkVFRW5ubmxsLGxc1NfXP3nyJCUWnN9LEERkZGRxcfHZs2etrKxgxSx70tj1s1wuh1BkeVLUVHV1NaRaT0/v888/T0lJKS0tzczM3L9/P5ybOnr06Pr6evp7+UVUr2ZTKvf49cvs8E6O6sKo2Ab5VZvNmzdzaYNRUVGwOHnw4MGnT58uLi5+/Pjx77//Draira3t7du3KfI0NjaOGDECnmlpablt27ZLly4lJSXt2LFDKBT6+/szKmogIyMDihumYSMiImJiYjZt2tSjR48BAwYgn1hIVIlE0mbJ5ubmQqc/evTonJycvLy8BQsWwHhD9Uanaf2MwSgCW7xdCPI49fjx4z169KB8N/3pp59kMhm6n7zPhIyzszP7i6RS6Q8//GBjY0OJ6ObmFh0drSiWTCYLCwtDy96Anj17wvAIDlK3t7dH97NsUDl06JCit1y+fLlPnz6U+0eNGpWZmQmnGiDGjh3L8paQkBCwHFgEQHYphQsXLnApL6lUumjRIvJGJiMjo/Xr17e2tlKebGRkRLd4xWJxdXX17NmzKVuhxo0bl5uby0UA3pnGUnlqampYcub69etcKgP6QAMEBwezCM+vngBXr15FnTowYMCAzMxM+u6m0NBQ3knmFxGmC+gMHz5c0/lPb4xAS0sLtPoBAwbIeVFdXQ0+w9asWcN4w5AhQ+Bc6DYflZGRMXHiRPo+wHHjxqWmpvITTy1CHjp0SFHBlZWVMQaR3QoqKlMWwAZTpIikUqmiJxcWFirbCzQ0NPz222/jxo1j9Os+ZswY+nBfLpeXlpYOHjyYfKeBgcGOHTvaLAt2/axoFyJSU2Bs7Nixg+4T2MbG5ptvvpFKpYpezS+iGjWbsrnHr19mh3dyVBRGxTbIr9ogo7TNNpieng6z0JRCWbhw4dOnTxlFqqurCw4OpuzjNTMz27p1K/1YWqSogYcPH44fP558g66u7ty5c2tqaigTv+A3rs3slcvlv/zyC2Upk5eXF3zHVL3RaVQ/YzCK0OlQ/mkxGsXe3r68vFwoFMK4SiaTJScnFxYWSqVSZ2fnsWPHohkttdDa2nr37t38/HyJRGJjY9PvNW3GamxsvHHjRlFRkbGxsaur68iRI2GNULdu3V6+fOnh4UFfLKcsoG2zsrLq6+utra2HDh2K1vB0QIqLi5OTk1+8eNGjR48RI0ZQxhB0wsPDYYOuWCyGTT4lJSV3794tKyuztLR855133N3d35RMU1QZtElzc/OtW7dgod3bb789cuRIosugbGO8cOECTEeEh4f/61//IjoAz58/T0lJgUGeUCgcMmQIPuNRO7x8+TIrKysvL6+2ttbAwMDe3n7w4MEsmS+Xy+/evXv//v1Xr17Z2dmNGTMGPqxoh9bW1tTU1Ly8vOrqaoFA4OHhMXjwYC4n0/KLqHbNxj33+PXLGkqOJoTpOFRUVIDyMTAw6Nmz56hRo2D9OQtVVVXJycklJSUGBgZOTk6jR48G9+ZcePTo0d9//11TU2Nvbz9s2DDyVnl+VFZW3rx5s6yszNDQsG/fvj4+Phy9mnEH62eMNsEWb9e1eN8gampqYN3O+++/3+7HWnRw6BYvBqOFxiiVSgcOHPjo0aP+/funpqaq9/MZBoPBYDAYDG+w5ypMhyApKenjjz8uKipSFAo/xo0bp125MJguB4/GWFdX5+/v/+jRox49epw5cwabuxgMBoPBYDoO2OLFdAjy8vIiIyPRsQQUwPuCkZHRkiVLtC4aBtO14NEYGxsbKysrhw0bdvv2bVdXVy0Ki8FgMBgMBtMGDL4lMJ2Mqqqquro62LgLf2H2xtzcHLn46yB89913Xl5eyC8oQRANDQ1r1669evUqQRBhYWFt7mLtsrS2tj59+pQgCHRKxIsXL6CgnZyc1L79BtPpUaox2traJiYmduvWTaPHyWAwGAwGg8HwAO/j7fwsW7aM8XTykJCQsLAwomNw8uTJwMBAqI39+vUbMGCApaVlWVlZQkJCVVWVkZFRWFgYbE/FMFJeXq7o5L2amhoLCwutS4R5U8GNEYPBYDAYTGcCW7ydn/Pnz6emptKv+/j4KDp5ol0oLi4+d+5cYmLiP//8U1FR8erVKwsLCxcXF19f36VLl+LZXXZevny5Y8cOxqD169fjfZUYpcCNEYPBYDAYTKcBW7wYDAaDwWAwGAwGg+mcYM9VGAwGg8FgMBgMBoPpnGCLF4PBYDAYDAaDwWAwnRNs8WIwGAwGg8FgMBgMpnOCLV4MBoPBYDAYDAaDwXROsMWLwWAwGAwGg8FgMJjOCbZ4MRgMBoPBYDAYDAbTOdFvbwEw2qahoeHo0aPXr18vKyszNja2t7cfMmTIxIkTnZ2d21s0DIaorq6eOXMm+cqqVaumTZum1EM++OCDsrIy9K+/v/+6deuIToQWEpienn7s2LH79++/evWqe/fuLi4uEyZMGD16tKGhoboKVC1ljemw7Nq16/Tp0+hfa2vrEydOcIyL60Y76rGLFy9u376dfOWPP/7Ap3DzYM+ePbGxsfyaAAaDUS/Y4u1a3Lt3b+rUqcXFxQYGBh4eHgRBnD9/fv/+/RYWFjU1Ne0tHYY4fPhwSEjI22+/ff78eWtra6ITkZOTs3jxYoIg/Pz8vv32W0W3yWSywsJCgiDq6uqqqqoIgggKClL2XcWvaWpqKi0tJQjCxcWF6FxoOoEhISG7d+8mCMLOzs7Z2TkjI6OysnL79u1hYWEhISFKPYqlQNVS1pgOq7gqKyuhfJ8+fdra2qqUydRp6oYqKr299Fh9fT1kfkVFxatXrwiCkEql2nl1J6Oqqop3E2gXJBLJtGnT7t27t2PHjk8++aS9xcFg1Ioc02WQSqVOTk4EQfTp0+fx48dwMS0tzdTU1MLCor2lw/y/oB4xLCxM3rn48ssvIWndunWrr69v836xWAz3i8ViSpBUKr3+muzsbJYnZGRkwBNEIpG8M6KhBO7btw8eu337drjS1NT00UcfqVgtWQqUJQjTvnBsa+yKC0KFQiEPAd70usGSM+2oxx48eACvZlfFM2bMgFcXFhaq69VdE1WagDYLHTU3PCbEdD7wPt4uxPHjx588eUIQxPr169HXYm9v71mzZrW3aJj/Q79+/eCHp6cn0Ylobm6OioqC3/X19XFxcao8raysbNxrNmzYoCYBMf8fO3fuJAjCyclp/fr1cMXAwOC///1ve8uFaQc4trXOqrhUhyVn2lGPbd++HV6dl5en5Vdj2gsuhd63b1/4gRsypvOBVzV3IW7evAk/Bg0aRL6+b98+GONi2p1Tp04dOXLE3d3d19eX6EScPXu2srIS/fvbb7+JRKJ2lQjDzPPnz2E85OXlRb7eu3fvsrIygUDQfqJhOi6dVXGpDs4ZzBvEu+++e/PmzaysrA8++KC9ZcFg1Ay2eLsQz58/hx8WFhbk691e005CYf5/CASC4OBgotNx4MABgiDWrFnz448/wseXR48eubu7t7dcGCoVFRWMWgKW5LWHRJg3gM6quFQH5wzmzWL0a9pbCgxG/eBVzV2IlpYW+KGnp9fesmC6EM+ePbt48WL//v23bNmCfLccPHiwveXCMIC1BAaDwWAwmE4GnuPt/FRWVubn54PbQLiSnp6OzjywsbGxtLSEGxDe3t6GhoZSqTQuLi49Pb2iokIgEHh4eMyYMYPuLjIzM/PChQsFBQUNDQ02Njbe3t6TJk2ys7Njl6quru7ixYspKSkVFRUmJiaOjo6+vr4jRozQ0dHhmK7m5ua0tDT6dTc3N1tbW/j99OnTZ8+ekUPt7e0p5zBxlz8jI6OxsRH927179969e4MX4hMnThQWFspkMnt7+6FDh1K2Rqempl69ejUvL6+hocHc3NzDw8PHx2fYsGG6urptPpxOQ0PDlStXkpKSysvLDQwMevbs6evrO3r0aLqJouiZt27dOnfu3NOnTwUCwfDhw+fMmWNiYkJojMjIyNbW1qVLlxoaGi5YsACcAEdGRm7ZskVZs+rx48cVFRXguRSq9O3bt1Gojo7OsGHDWKIrlXDu+ZyXl/fixQv0r5WVVZ8+fdC/ZWVlRUVF6F9TU9MBAwbQX1dXV3fy5Mm7d+9KJBJ7e/uRI0dOmTLFwMCgoqLi8ePH5DsHDx5sYGCgegIZa8vDhw/h3+fPn5Pz1sPDIzc3l3z/gAEDTE1N0b+pqakymQz926dPHysrK4IvUNCUi0ZGRmhHhlwuv3PnDuWGIUOGcK9RDx48iI+Pz8vLk0gkZmZmzs7OgwYNGjduHDlRam96169fj4+Pr6iocHJymjJlCrm6ymSy2NjYlJSU6upqJyenmTNnDh48mEXdubq62tnZNTc3nz9/Pjk5uayszMLCYujQoTNnzlS0+Ly+vv769evp6elFRUVSqdTc3NzT09PPzw/89vNra9wVF/nJcXFxBQUF4ExxxowZ5JTygF8fRIGcOsRbb71lY2OD/i0uLi4pKenZs6ejoyO6SK+KxsbGXl5eLDmjTT1GBtUitOArMzOT7IfZ0dGxZ8+eiqLX1tZGR0dnZWU1NDS4uroGBARQ9j5oolwoqsDAwABqS5u1iHd/rVRLp5CWlnb69OknT54YGxv37t17zpw5jB62pVLpvXv31KJO29RjHAsdDRQp40D2l9bW1trY2PTv33/y5Mn0mqPomcpWJAxGPbS36yyMxjl06BBLBZg3bx79hsLCwuTkZPoiRoq3yfz8fD8/PwiysrJydnaGgbihoeGaNWuampoUibR7925LS0uYR3J2dkZDCi8vr5SUFI7pIh9USObQoUPoHvrphSEhIbzlp5jKIpGoqakJTtwhQ3ZyWFRUNGbMGLguEAicnZ1RF9K9e/eQkBD0FvrDGVMdHh4O9ryurq6DgwMqIw8Pj0uXLrUpsFQqDQwMpAjs4OCQlZUl1xhubm4GBgaVlZVyuTwzMxO999y5c8r6aGVfH2hkZKTIx6myCVcqn+fNm0d+7IwZM8ihYWFh5FAvLy/6644fP44+0yDc3NwyMzNRPiDKyspUTyAd9hO54+PjKVcyMjLI0SmroE+dOqWKr2bGgnZ2dkZRGI9Lqamp4ZLSx48fT506FaJ069bN2dlZX///fPw1MjL64IMPGDNN9aZHH1gHBQW1tLTI5fKCggLyVxJg5cqVLOpOLBbfu3fP1dWVct3W1vb48eMUeSoqKgIDA9GHEmtraxcXF6SLpk+fXl5eTonCsa1xUVzIUW1LS8vq1avpT5s1a1Z1dTUPX828+yA6jMk8evQo+R5/f3+CIN577z3yRXpV9PDwYM8Zrekxjp0mIjQ0VJGv5itXrtB3OpD7Uw2VCyWvuNciHv01j5aOqKqqYnQCum7dOplMRvHV/ODBAxXVKXc9xrHQGceB9JcWFhailwoEAhcXF2NjYxjLLV++vK6ujnwz4zOVqkgYjBrBFm/nJzc3V/yagQMHgnLZunUrXBGLxZcvX87Lyzv0Gm9vb7jhzz//NDY27tev38aNG3ft2oUOQiRbvBkZGdAruLq6Xrt2DS7W1dWFhobCPK2fn19zczNdHnTI28qVK6uqquBiamoqvN3Y2PjixYtc0tXQ0CAWi7ds2YKU7759+8RicW5uLronJSVFLBavXbuWIIjhw4eLxeKkpCTe8sfFxR06dAidJSt6jaGh4cKFC3/66advvvkGDn9CPWhdXR2MR4cOHZqWlgYXZTLZxYsX0RZWNEaPjo4Wi8VfffUVejg9yZ9++imELlu2DJk9Dx48mDBhAnTPBw4cIN9Pf2ZQUJCtre2aNWsiIiK2b9+O/Ii6u7srNQrhzo0bNwiCmDNnDroyZMgQeOnMmTNZIjKOdBMSEsRi8datWyFo4MCBqCaLxeL9+/crGikGBQVZWlquWLFi9+7dX3/9NbIuGBOubD5fvnyZLBXF4gWrFSWHbvHGxMRAlTMzMwsNDc3Ozi4sLIyPj3/vvfdsbGw2bdoEEYOCguA5DQ0NKiaQEUpt8fHxIedtYWEh/PDx8WEcoh08eFAsFk+ZMkUtFi8U9PDhw8lpj46ORlFaWlpAHnAuumXLFrFY3NjY2GYyMzIyYJapV69e586dk8lk8LQrV670798fXrdu3ToVqwRdV8yfP9/Ozm716tW7d+/+97//jWZsVq1aJZFInJyc+vTp8/XXX//888+LFy9GpumRI0fI6k4sFiNtvGnTJmtra19f3z///LOwsDArK2vbtm0wsaOjo0Mx1VBVCQwMLCgogIuNjY0xMTHdu3eH0bxEIiFH4djWuCguNNz/z3/+IxAItm/fnpWVBZV87NixEHHIkCGMh6awVBvefRAjYrH4hx9+gHf16tULkpmXl4duqKmpgXLR1dV9/vw5vSo6OzubmJjs27cPMp8lZ7Sjx+igWoRa8VdffUV+dXp6OqPFe+bMGUNDwzFjxoSGhoaFhS1YsADNdkZGRmq0XCCvxGIxrFzgXouU7a/5tXSgvr4e9Wvjx4+Pj4+HJhkaGioQCDZs2ECxeKurq1VUp9z1GMdCpw8U6RZvZmYmJMTBweHPP/+El0ql0oiICNA83t7e8GkboD8TKpKfn19YWJhYLF6yZAmy0ukVCYNRL9ji7UK0ebYeuqF3795ffPEFqDPyYarI4pVIJGDLmZmZoaN9Ed9//z08Z/PmzZSgX375BYI+++wzSlB1dXWPHj1gjqKiooJ7upChnpyczHgDfA8+e/YsusJbfvL4w9XVVSgU3r9/HwWVlJSQDzfetWsX3ImGmIi8vDwzMzP6rBTL0Yt79uyBoMWLF1OCGhsbhw4dCt9ZExMTFQns4uLi4eFBzlupVIqWiZ45c0auAeAcV/JXDDSE1dfXZylolpFuYWEho23JknA3N7dnz56hoFevXpH7YLXkc5tSMVq8RUVF4DfOwMCAssChtbV19uzZRkZGLCN+Hglkp83DP5GTbcoQDdi8ebOiIRqP83hPnz4N199//31GYV68eGFkZOTt7c0xdajhm5iYPHjwQJEKoli8qjc9V1dXT09PylgQStbMzGzJkiVTpkwhm+snTpxAI3hFeWVkZDR79uzW1lZyaFJSEowgu3Xr9uTJE4okI0eOhCllMmlpabC9Yu3atfQcU7atsVi8+vr6JiYmqamp5CCZTIamjL744gt6XEV1QxUdzgJ8BNTV1aVPekdGRpJd8VFCX7x4oa+vP3v2bO45o1E9xg57K6YPCVxdXX/44Qdy0JEjRyCI0vo0VC68axH3/lqVlr5ixQpUlJQmmZqaamJiAq2Sfh4vP3XKT48pW+iUgaJEIoFl4SYmJuR5BeDkyZMQy9/fn5IDlIq0e/ductAff/zBWJEwGLWDLd4uBHeLt1+/fpSB0d27d728vNAcy9dffw13Mg6Smpqa4BOvqakp2aKTSCTwmdbY2BjN7pJBJuKGDRu4pysiIgJiLViwgB4qlUptbGwcHR3JBjw/+Sk9KEEQf/zxByV08eLFo0ePht9z5syBHpr8agR8vuVo8aKsMzQ0pA/F5HL51atXIeLgwYNZBL5y5QoldP/+/RC0atUqubqpra2FTdrkHJBIJGjX2U8//aQFi5cgiAsXLiiqNuSEq5LP/CzeZcuWwfXg4GB6FNhFpigfeCTwzbJ4W1paHBwcIOjRo0f01+3YsYMgCMqcGAuo4StaRAcjcvJIUV1N76+//lK0GN7Q0LC0tJQS+tZbb0FobW0tY14pkmfp0qVww/Lly9HFnJwcZ2dnysQv4r333oNPjfShqhotXkXZXlhYCBOGenp6JSUlHOuGKjqcBVSB6bUUTbgRBDFx4kRK6G+//cbYI6jR4lVjM1fW+PHx8aGHon2b5CqqoXLhXYu499e8W3pxcTG8Wl9f/+nTp/SIX3zxBURUl8XLQ4+pbvEiYRS9FHl4Js8uUJ45atQoesRevXox6joMRr1gX80YBpYsWULx0DBkyJCMjIz58+fD3u99+/bBdcoORsDAwGDixIng/uHYsWPoelRUVF1dHUEQEyZMYHTDMG3aNB6OfOfPn29ubk4QxLFjx8gOhIDY2NgXL14EBwcjN1G85adgZWVF37fz22+/oXOPIQ9bWlroeyAJgggPD8/IyOB4wCnKujFjxjB6/hg3bhysTkxLS0tJSWF8iJ2dHf1MyHfeeQd+UDxMqIWjR4++evVq0aJFZB9d5ubms2fPJp9apGm6d++ONpWxJ1wt+cydlpaWqKgo+P3hhx/Sb7CzswNrRF0JfLPQ09P717/+Bb/p+5nBHBIIBGihLzttNnyCICZNmmRhYUH2A6SWKiEUCseNG0e5iBztjBs3zt7eXlFoQUEB4zN9fX0Z5VmwYAGSHHne9vT0LCwsVJRqWBxbWVlJ8ZGmdqAHoeDs7AxjZZlMhpoDO+rS4XSQaoqNjSVfl0gkly5dmjlzJuT51atXq6uryTfExsYaGxuTrWK1047NfOHChfSLqIqiaqO5clG9FrXZX/Nu6VFRUeBl6t1330Vf6Mgw6nbe8NNjqr9079698Hvu3LmM96AjfNFSPo5ZQa9IGIwmwBYvhgFYvaOI7OxscPpnaGiI1sRSQDtJUHcCE4zwA+0noeDm5gYr/UpLS7nrPjMzM+iPm5qa6J4S9u3bp6+vv2TJEtXlp+Dt7Y22oDCCkjl37txt27ZRrPFevXp5eXmRTUEWUNahzUIUdHV10epu9CmagpeXF90VNhpq19bWEuoG5j3ozkLQNFROTg7d467aGTRoED3hsO6LknC15DN37t27V19fz/5G9Dq1JPCNY+nSpfDl6Pfffyd7XoX8z8vLW7hwIWwQaBPU8HV0dBTl6sCBA2tqav773/9qoemhk7oYtRDy5wejcDqK/Bsj7V1XV5eVlUW/oaWlpbS09OHDh7n/F1QJ6f6x1YiOjo4ij6zINXFiYiKXR6lLh9Pp16/f22+/TRDEtWvXKisr0fWzZ882NzcHBQWB1dTS0nLmzBkUWl1dfeXKFX9/f45VkR/t2MwZ2wv91ZorF9VrUZv9Ne+WjhKiyMM2Y/PnDT89pvpLQTno6Ogo0jzo48vNmzebm5sZ72GsFRodhGAwCHw6EYYB9vMDcnJy4Iepqamij3noII3s7Gx6xOzs7J9//pkxoqGhIYxrs7Oz6W5IFbF8+XLYgbNv375///vfqHfJyspKTk6ePXs2eQqFt/wU2jxlYdmyZQcOHMjOzm5oaNiwYcN///vfCRMmBAQETJ8+HY0VOPLPP//AD8ajDgDkmvL+/fuMN9C9AcMKc/hBPgtBLeTk5Ny+ffu9996jOwEeM2bMW2+9lZeXB1Yx+1EcqsM94WrJZ+6go4CEQqGi7/FcDvPQcslqkx49esyYMePEiRNVVVWxsbFoApMgCJhzWL58OcdHocK1s7NDmcM9lipVgnzCDQKtV2csPuRIWVHxKaoYpqamdnZ2MDzNzc1FY+Lm5uYDBw4cPnw4LS2tqamJMS7lm4J6MTc3R5vSKaBjeygnYClCXTqckdmzZ2/ZsqW1tfX06dPoU+mxY8eMjY0nT55sY2MDyw1iY2PRMtHTp0+3tLTANhbN0Y7NnOOrNVouKtaiNhUp75aO1LiiEYuRkZFAIFCXOcdPj2nhpShzXr16VVhYiNxzdpGuCtPxwRYvhgFFPQqAzvWtqakBj1YskD+To4hHX8M9Ypv069dv9OjRiYmJ+fn5V65cef/998ljYuR9UUX5lcoluOHmzZvr1q07ePBgy2suvGb58uXjx49fu3YtrO/iApIZvBwxghZI05d2A4xn63GcZOY9wTto0CBw10xh2LBhYPHGxMTs2rWL5RBU1eGecLXkM3dqamrafB2XMY2WS1bLLF++HDw57d27F1m8z549O3PmzKhRo9CUUZtwKVxtNj2OoTz0T7du3cDiRStvy8vLJ06cCEeAOjk5+fv7Ozg4IJP7zJkzycnJPGRQo8Dwg7JUWBHq0uGMzJ07F44AiI2NBYsXTo+fMmWKmZnZ2LFjbW1tKysrL126JJFI4JyVY8eOGRkZIedJGqIdmznHV2u0XFSsRW3217xbOkc1ri6Ll58e08JLyVu0Xrx4wWjxdu6uCtPBwRYvRmnQOMnBweHcuXPsN5P3A6OIW7dubXO/E3JmwJFPP/0U1jLt3bsXLN76+vqoqCgPD4/x48erRX4eWFpahoeHb9my5Y8//jh69GhSUhJsifnrNSKR6ODBg1zUPVqOxfIRFAWhBLYjzc3N//vf/wiC2Pkaljvr6uqOHz/OuE9M+2g5n7m87s2itbVV7c987733YEXArVu3MjMzwTnt/v37ZTIZ9wle3rn9xjU9RnmCgoLA3F26dCls9CDfX1paqgWLlwVlM1CjOnzAgAHu7u6PHj2CzbpWVlZnz55tamqC7Yt6enozZ87cv39/c3Pz2bNnFyxYUFNTA0uaOTpl6MRos29VezPk3dI1p8YZ1Wm79BpKZU7H0YQYDBls8WKUBq1LaWlpUbSjRlHEZ8+ewQ+lInIhMDAQPr2fOXOmpKSkV69e0dHR9fX19DExb/l50717989fU1xcHB0d/euvvxYXF8MBdF5eXitXruSedRKJRNE9KIhx4ZCWOX/+/PPnz6dPn053FoL49ddfU1NTYTa4g1i8aslnxjHBq1ev6BfRTk6W1718+ZLokHBPporo6OgsW7YMzhjb9xqZTBYREWFjY4P8DHEBlZdSky0dtuk1NDS0KQ9UsMzMzGvXrsHRo7t372bfzdgRBG4TTevwOXPmbNu2DTbrikQimMJFX2nnzJkDLu5hmf3p06ebm5sVufPpUmihb1VjLVJXS7e2ti4tLVVRjXNXp/z0mIqgl3LJnA4yCMFgKOC1BBilQf4JysvLWbofloiKvI+qgqGhIXhIam1tBQ/Ae/fuNTY2hvNg1SK/6jg4OKxbty4vLw/t+KK72mIEyQwrgRlBvjrZHY9pByiCzZs3ixSDTP0bN26wpEubqJLPyJBgrFQlJSX0i+gszerqarRsjEvEdoRHMlXn448/huVw4E/17Nmzz549W7RoUZsrFRkLt6qqimXc9qY0PfhqRufFixdomSVUMLRz8p133mHcLo6OztIo9fX1isboaCckahHsaFqHI/187Nix+vr6CxcuTJo0CU3hjh8/Hmyqixcv1tXVHTt2zMDAAB000JXRQt+qxlqkrpaOXvfo0SPGWLW1tYosXh7qlJ8eUxH00urXsGeOjY2Nk5OTdgTDYLiDLV6M0jg6Ovbr1w/GSSwHtEybNs3e3v7HH39EV9A3cljcy0hCQoK9vb2LiwuPyaJly5aBz6qIiIibN29mZmZ+8MEH9GOQeMuvLBs3bmQ8R8HIyAidLgDfhttk8uTJ7L5MpVIpzJfCWZFEu1JaWhofHz9w4EB2P8OzZs2CXXDgiZfHi9Q+Ulclny0tLVlMEcZVo+7u7ug0i4SEBMY3qn4GknphT+atW7c08VIbGxswQurr66Ojo2F/fnBwsFIPcXR07Nu3L/xWtIj3/PnzLi4u3t7eqGp12KanqGKgbfMODg5wqC/yR6VoqSGXcbNa2trt27fZZeZyFpcWdPigQYPc3NwIgrh8+XJUVFRjYyPZK5W+vn5AQABkbHR09OXLl/38/OCEPH5o54uDFl6tnb5VXbWIAu+Wjl7H6LGCRWB+6pSfHlOx0MkvVTR+Qz6r/f391eibGoNRF9jixfABVhiynKeam5t77ty5iooKsjOPgIAA8KaYlJSkyCfnvn37ysvLfXx8eBwl5+rqCv3Qs2fPYJUsxWeVivIrS2JiYkxMDGNPZmZmBruYevbsyeVRM2fOBAeSaWlpmZmZ9BtiY2PhG0FAQAAMc1WnrKxs/fr/h70/j6sx/QP/8fu0LyoqLUSlIdmSsYQoxkiITINhcIRBM2hmsm/vMWNpZiwNg1MMZUoII6FsY0kLkvYRlSJapF2dlnPO7/FxfT7X9/7d9zmn+5xzn9bX869z7mu9r/11X9f1em3ctm0bQ3UymFOnTgmFQrJFKLFoaWlhC35BQUHMbyVhNVdkEwhXr14dOnSol5cXoQCKlLOuri66fP7ixQtkPQIjEomQLnE6WGwLCAigu2ZkZChJhpQbOzs7SevCqKgo5RlUxH15z549N2/e/Pzzz+Vo576+vuhHcHCwWA9BQUH5+fnDhg3DK7ZW6XpMiI+PF6saGn9NW7lyJUWHbXJyMr2XCYVCKXZi2O1r6DAwhbi4OKS2V19fX5J90ZYfw9GB+cbGxo0bN2poaFC2cPEZ5o0bN8p9pFl545h8SU+fPn3o0KEKmotrgbmVxVZERu6ePnfuXPS9IzU1VWzpBQYGsjucyjGOKV7pOFGxn6cFAgHS3EH2CQBtCpB4AXngcrmTJ09Ginb/+ecfiuuHDx/QCmDx4sV4QEeaKoKCglRUVEQikZeXF30XNyQk5MyZM1paWjt27JAvY/jWbn5+voODg6RDhvLlXz62b99Of3jhwgW09GS4VFJVVT158iTScbVy5UqKEZHCwsKNGzeiC0VSjL/LytSpU3/99dedO3fKanXjr7/+UldXF2trngKWit++fXvjxg2G8RsbGyONkeRDX7GxsSkpKQpqQ1GwnKdMmYLk27Vr1zY1NaGHjY2Nq1evlqSP94cffkDLrOjoaGT1BFNRUbFw4UKyYa22AOo4aFGFj8siacrLy8vJyUlJ6Y4ZMwapZX716pVMRonILF68eNKkSei0alRUFMU1MjLy/PnzWlpamzZtat2uxwQzM7OFCxfiA8yIQ4cOIbOiVlZW+NbA+PHjTU1N0VlTPz8/Sjx79uyRcs2Exb6mo6Nz/fr1U6dOkR++e/cO2+v+9ddfmduzVfYYjge9yspK+hbuxIkT0emhyspKNTW1GTNmyJGE8saxZkE72OSkq6urb968mZKSIqvOyBauF3ZbERm5e3qXLl1wt1q8eDFFYfupU6du3LghyRiBfMOpHOOY4pWOE7148WJkZCTFdffu3eg0+Pr16yWZYgaAVkYEdHQePHiArk326tULVbqnpyd6sm/fPpFIlJOTI8nDgwcPJEVbXl4+fvx4NE+sWrUqISGhsLAwNTX12LFjyCybk5NTTU0NPeCZM2fQ6t/Ozi4kJCQ3N7egoODu3buLFi3icDjq6urh4eFyv2xTUxM+Jnrs2DEpPuXI/759+7hcLv7Yb2Njg0rJ19dXbBLOzs7I5+zZs2/evFlQUPD27dtHjx5t2LAB3T90cnLi8/nIs6+vr9jI09LScIQhISHoXOKwYcMiIiIKCgpevnx58uRJNF0ZGxs/fPiQSYZra2tFItGlS5e4XO68efOQq6mpKXJ99uyZSCQiW+zU1dVlUvivXr3icrmenp7oGCqKLScnR6znO3fucLncRYsW4YtMdnZ2XC531apVKKCjoyN67ujoSM42AovTwcHBBQUFkZGRaAF67949BV9cjnLGPH/+HN8stbCw8PT0/OKLL0xNTQ0MDLA9w27duqHkrl69ikIlJyfjs/fTp08PDAwMCwvbtm2bubn54MGDDxw4gJx4PB4rNSsJSS2QXol4A0pVVdXZ2XnevHljx47lcDgrVqz46aefkNOECRO4XO6yZcsqKyslVWhRURGTusbgfXJzc/PGxkaRXJSVlY0dOxYd8d2yZUtqamphYWF8fPyPP/6orq6uoqISEhJCD8Vu19u2bRuXy0XZQHcCycMI8onlAVdXVy6X+8svvyBX/FnkwIEDgwYNMjc337p1a1hYWGBgIL420rVr16dPn5LzExERgXd73NzcTp8+HR8ff+nSJU9PTz09PZwTlJafnx85rPS+JmXgCg4ORr+RhS1TU1O0C+Tu7h4QEBAWFrZ161YkihMEsWTJEqFQiBOV0mxw25B7DmIItst66tQpuuvixYtxeYoNzmRIV+o4JoWsrCzUHpycnDIzM7Ozs5HdrwkTJkhZEpw+fVpKE8XNRkn1gpoK81Yk63ytyOAvFAqxyG1mZrZt27awsLCAgAD0KSQ0NBTlUEtLC+UhODhYvuFUkXFMeqVLWijikYecqJqa2ubNm1NTU4uKihISErBhai8vL/LIrGBDAgB2AYm34yNFN5Krq6v0+zZBQUFSYq6vr9+7dy9dKZ+RkdGOHTuwLEcnOTnZ1dWVftPDxcUlMTFRwff95Zdf0NGmZudUWfMv6ZKepaWl2PhTUlK+/fZbsV9PDQ0Nt23bVldXhz1j6+0UoqOjyXE+ffoUWxvGqKurL1y48PXr1wwzXFFRIRKJ8GxK4e7duyg4PnXG5XKZlHxycjI9toSEBLGeKfuZGPzBQlK2EYWFhcOGDaMUwt69e1l5cVnLmczt27fx7I4YPHhwamoq/eoUeV5//vw5xYaWiorKnDlzKioq8CHVgIAAtmpWLJJaIL0S+Xy+l5cXuf9qampu3LhRKBRSktbU1CwqKpIULdY0I+lFKFRVVaHdm+3bt4sUgM/n//bbb0ZGRpREBw8e/O+//0oKxWLXE6vGFg8jYgOOGjWK0nF4PF55efmXX35JGUhdXFyysrLo+b9582a/fv0o0Y4dOzY1NdXHx4f80NnZmRxQel+TMnBRLlqbmpqKRKILFy6Ym5uTn+vr6+/fv18gEJATldJsyG1D7jmICeiArrq6enl5Od316tWrKK0TJ06IDc5kSFf2OCaFQ4cOUQ6e2Nvbv3r1SsqSwMfHB4UV60puNsqoFyzxMmxFss7XCg7+AoHA39+fchagR48e//zzD848ZsWKFfINpwqOY1IqXdJCEY880hO1sbEJDQ2lJKd4QwIAFuG0osoEoGMgFAoTExOzs7PLy8v19PRsbW2HDRvGxBrbu3fvEhISioqK0HwwfPhwBc9TtXD+mZObm5uRkVFSUsLn8/X19W1tbR0cHBRJoqSkBBWdurp6jx49xo4dqwxj9I2NjRcvXtTQ0Jg5c2YbtBEvEokeP36ckZFRV1dnYmIyfvx4ExMTdpOQr5wbGxvj4+PREa/+/fuPGTOGYXIvXrx48uRJRUWFmZnZyJEj0R3vffv2oZX3mTNn5LufpiQKCgri4uLev39vbm4+evRoypJOSTg4OKSmpubn50v5MsIQoVD4+PHjnJycioqKrl27Dh06FKtmafWuJ4WAgAB0QZfH4yGR8s2bN48fPy4qKurateunn37at29fSWHRZ6m0tLSamhpDQ8MRI0bgg44t2dcEAkFcXFxeXh6fz7e0tHR2dpZJ53arjOHtehyTRGlpaUxMTFFRkYaGxoABAxwdHdlVOMRuvZiZmRUXF5uamqKvIay3IlZ6en19/b179/Lz87W0tKytrceMGcNw6pR7OJV1HGOl0nGilZWVRkZGAz8iayQA0MKAxAsAANB2+f777//44w+kmmX06NFEJyYjI2PQoEEzZsyIiIggOit0iRcAOgMUiRcAAEAm2ty+DQAAQKdi7dq1SKYVC9LhqaOjgy0idlqQylNJCtgBAAAAAADEAhIvAABAa3L+/Plt27Z9+PCB7vTgwYMnT54QBPHNN99I0vbcUYmIiEB6aNDfysrKoKAga2trrN0UAAAAAACACSDxAgAAtDLV1dVz5syh2D1++PAhsuTRt29fue11tV+Sk5NPnjx58+ZN9HfTpk1VVVVr165l96phe0EoFOZ/BNs+ef/+PXoCV5OADkxZWRlq58ien0AgQH9ltRIPAEAnB+7xAgAAtCZDhw5NSUlBR5ednZ0tLCyamppSU1PR7u6YMWPOnTvXKkrdWpcdO3b89NNPGhoaTk5ORUVFmZmZjo6OMTEx2JxVp6K4uFiSZeaKigoDA4MWzxEAtAQrV64MCAigP/fx8fH392+NHAEA0C7pjEsHAACAtsOTJ0/u3Llz69atp0+fInXNKioq3bt39/Ly8vT0xEZWOxtOTk7u7u7//fdfWlqamZnZpk2bNm7c2DnFXYIgunTpIskaDbJ2CwAdEnd3d4ohIgQ21AwAAMAE2OMFAAAAAAAAAAAAOiZwjxcAAAAAAAAAAADomIDECwAAAAAAAAAAAHRMQOIFAAAAAAAAAAAAOiYg8QIAAAAAAAAAAAAdE5B4AQAAAAAAAAAAgI5JJ7X0AABAO+LAgQMRERH4r6Gh4cWLF1s1R52rrBSJs7y8fNasWeQnvr6+7u7uREtRW1t75syZu3fvFhUVaWlpmZmZDR8+3NXV1dLSkmhLNDQ0vHnz5sOHDzo6Oubm5tra2szD1tXVFRUV1dbW6uvr9+jRQ1VVVe5sQF+Tg+vXr+/Zs4f85OzZs6ampq2XI6AjAO0KAFgEJF6gnVFZWenu7p6SkrJ3795vvvmGaJ+cOnXKx8enf//+V69eNTQ0ZDfyjlFEZEpLS/Py8giCeP36tVAohClfSitSRlkpEqdAIEBhq6ury8rKCIKYN28e0VKkpKRMnz69oKBAXV3d1taWIIirV68eO3bMwMCgoqKCaG3q6+uvX79+7dq1e/fuPX/+XCgUoucqKiqDBw9euHDht99+K0X0TU5ODg0NjY6OzszMxGG1tbXHjBmzbNmyuXPncjgcWbPESvtR6vjWBqmpqUGFVlJSUldXRxAEn8/vzCM2QBDE+vXr79+/L1/YRYsWffvtt9CuAIBNRADQruDxeKjpGhgYiNoteB3p7+9PceLz+Xc/kp6e3pmLSEq5mZqatnZG2norUlJZKRInbpY8Hk/UIvD5/N69exME0a9fv5cvX6KHSUlJOjo6baRrGBsbozLR1tZeuXLlkSNHzp07d+DAgbFjx6LnNjY2OTk59IBv3751cXFBfoyNjb///vtTp06dO3fu119/HTx4MHo+bty4d+/etUpdS2mZz549Q+NbTU2NqMMxc+ZM9OJ5eXlsjdhtrcTaWn7afmOQgw0bNii7XQFAZwPu8QLtjAEDBqAfdnZ2RLtl4MCBkt6iqKjI5SNbtmzpzEUEKNKKAIIgLly48OrVK4IgNm7caGVlhR46ODh88cUXRNugurqaIIg+ffrk5OQcPXrU29t79uzZ33///YMHD3bs2EEQRE5OzrRp0xoaGigBX716dffuXYIgHB0ds7KyDhw4sHDhwtmzZ69fvz4lJWXVqlUEQcTExLi6ujY2Nraplrlnzx40vmVnZ7d8xtom0kfstlZibS0/bZyHDx/y///JyspCThoaGhQnPp9/6tQptpKGlQAAkAGJF2hnjBs3LiYm5siRI9euXSPaLZcuXeLxeLdv3548eTLrkXeMIgJatxV1AGJiYtCPoUOHkp8fPXr0+fPnRJshODjY3Nyc8nDbtm1onfrs2bPIyEixAdXU1MLCwijHhjkcjr+/P9rpTUpKCgwMJFocaJkyASN2B0ZTHMiJw+HQnTQ0NNhKGtoVAJCBe7xA+8PpI0R7Rk9Pb8WKFcqLvwMUEdDqrai98+7dO/TDwMCA/LzLR4i2gZGRET7DTIbD4UyePPm///4jCCIuLs7T05PuZ8KECXjvmoyqqqqXl9ePP/5IEMTp06e/++47omWBlikrMGIDygDaFQBgQOIFAAAAOiBNTU3ohyK6i5XKo0ePtLW1JemXMjIyIh9+pjjNnTt3+vTpkmIeNGgQ+pGZmclefgEAYMqUKVPMzMxwL2aIjY3NihUrHB0dlZYvAOikgMTbwXn58mVJSQnloaamJj7mJxKJHj16RPEwfPhw8hqxurr6+vXrCQkJJSUl2travXr1mjhx4ujRo+kLtdLS0pycHPITBwcHdFnl/PnzT58+LSkp0dPTs7W1nTlzJnl3oqqqKjIy8smTJ6WlpSoqKubm5kOHDp04cWL37t2bjVzsiz979iwqKio7O7uqqsrIyGjQoEFTp07t0aMHwwxXVVWFhoampaXV1tZaW1t7eHjY29sTbJCcnFxfX4//du/evU+fPuTKKiwsRH/LysoePnyIfXI4nJEjR0qPnGERMSltmWit0maleUshMzMzJiYmMzOzrKxMXV3d1NTU0dFxypQp+FgaorGxMSkpiR7cxsYGqyZ6/fr127dvya5mZmbYQE5NTc3du3efPn2an5/P5/P19fXt7OwmT56M1AvL1IoYwvDVpPPy5cvz58/n5uYiHVEzZ84cNmwYoQCpqanR0dG5ubm1tbVGRkYODg5TpkwxMTGRKRLczJBqaIIgnj59WlRUhH4bGRl98skncrReKcWemZl58eLFvLw8gUBgZmY2YsQIhleFhwwZIsUVDwU2NjYUp08++eTMmTNSwqqp/d/Jvba2lmADhnUtqYhwH8Eb76mpqWTFs7169RJb5mJhq78wqbja2tpbt27FxsYWFxej9mNnZzdu3DhJaZFpdmSTMmLLV2LMJ2sKuBdUVlbq6upaWloOHTrUxcVFR0cHeWCYn+zs7Pfv3+OH3bp169evH/5bVFSUn5+P/+ro6GBFa3IvHuQeOlifBymsXLlSjlDDP6K8dtWSJQAAbYvWVp0FKBexR8ssLS2xB7HK7isqKrCHgwcPdu3aFe2TWFpa4g+W9vb2CQkJlOSCgoIoUeXl5cXFxdFNXJB1eP7555+6urrIJkePHj3wLMXhcJydne/cuSMlcvor5+Xl4a0PPT09KysrLS0tlH9vb+/q6upmM3zr1i3KMUiCIHx8fFipEYoVUC6Xi52knwPU1NRsNnImRcSwtBnSwqVN0R+rePOWRHBwMBYz1NTULC0tcUEZGxuHhISQPWNpikJQUBD2s2HDBrHvWFJS4unpqa6ujh4aGhpaWVnhpcmMGTOKi4tlakWSykq+V5MUZ1NT09q1a+mv/MUXX5SXl8uhqzknJwff+ezWrZulpSUqEw0NjXXr1jU0NIgYQ29mZObOnStf6xVb7A0NDUuWLKEkwYpm1IaGBrSsV1VVFauumWEhDBo0SL4MyFfXklqmpD6C8fPzY5IrtvoLw4rj8XjooxWHw+nZsyd5v65fv3779+8XCoWSdOoyGdmkjNhylJhMkzXm5cuXuBd06dLF0tISfy7R1NT86quv0tLSmOdn7ty55IczZ84kp+Xv7092tbe3V3DxIPfQwe48KBPI4BDDOZ31dtUWSgAAWgWQeDs49+/f5/F4o0aNQmPZvHnzeDxeaGgo9tDU1MT7CFLrt3PnTh6PV19fj1yxDbcffvihrKwMPUxMTHRwcCAIQktL6/r16+TksrOzgz6CPBAEce3aNS0trYEDB27duvXAgQPYFCeetI4cOYIG2X379mFrB+/evfvhhx8oQ3lWVhbKKt4YoQ/iqampaIK0sLC4du2aQCBAYk9gYCD6Vu3g4FBaWor90+O8fPmyhobG5MmT/f39eTze0qVL8fQfHByseI2EhobyeLzNmzfTZRVUWbt27UJOQ4YM4ZE4duxYs5E3W0TMS5sJLV/aFClOwebd7AqjW7duoaGhjY2N6GFOTg5uwAEBAdhzbW0tj8fbuXMnctLT0zt69CiPx8vKysJ+EhISeDze+vXrCYIYNWoUj8eLjY0ViUTJyckolKenZ25uLvJcX18fFhaGPrTb2tpWVlYyb0WSykq+V5MU56ZNm/T09Pbs2ZOWlpaXlxcVFeXs7IyCDx8+XKzZEikSb3JyMpIrrK2t8Uqrurraz88P7U1NnjwZZ7VZ6M1s165duB/dvHlTvtYrEonOnz8fFBT0888/42LncrkaGhoLFy7cv3//jh07kDEkxSVegUCA9C0TBPH777/LEYOPjw8K/tNPP8mXB/nqWlLLRH2Ex+Ph45qbN28mj29Pnz5lkiv5+ot8FYc/qC1fvrywsBA9fPfu3YYNG1RU/q/WTz6fL1YyQSPb+PHj/fz8/P39FyxYgM+VkEc2KSO2rCUm62SNyxOJOj179rxy5QrqBU1NTbdu3cIH45GlHIb5uXnzJnkWo0i8qampyDNd4pVj8SD30MHuPNiSEq/i7aotlAAAtAog8XYKLl++jEaxzz//XKyH9+/fa2pqOjg4kB8eOnQIhfruu+8o/svLy5FyUWNj45KSEikDdJ8+fdasWYPmUcT333+PJ63Gxkb0HXrhwoX0SNChIPrIK8k2XWVlJTqrpq2tTRY2EP/88w8K5ebmRvkwT47T2tr64MGDZKezZ88iJ0r5KAJet9FlFTwdUtYKMiG2iOQrbUm0SmmLleIiIiLkaN7SQTmMioqiO3l4eKDzeHRjp3itFhcXJzZatFcWGRlJaQljxoxpamqieE5KSkIL6/Xr18vaipqVeGV9NXKcampq2traiYmJZCeBQIB3itasWcNc4q2srLS2tiYIQldXF1vNxfz6669yS25SjFgq0npxsVtbW5uammZkZGCnN2/eyG3st6ys7MWLF/Hx8X/++Sc6lm9kZEQ+JsCcxsZGJMZ06dJFbpO8itS1lJbJ5XKRU3Jyshy5YqW/MKk4PP15eXnRo8LNUpLEa21t/dtvv5GdTp8+LWVkk9JWmZSYfJM17nra2trPnj2TFJBiG5ZJfpqdxegSr6yLB7mHDnbnwRaWeFlpV61eAgDQKoDE2yloamrq1asXGvhevHhB97B3716CIMi7iJWVlXp6eujbMP5gTObAgQMowi1btkgZZwcOHEhZmjx+/Nje3h5txGGtKj///DM9ksTERJkk3p9++gk9lzRYY6WFZJGDEufYsWPpAXv27Ilcq6qqRO1W4pWvtCXRKqUtVopramqysLCQqXk3yzfffDNq1CixTg8ePEBp/fnnnxQnbAlmwYIF9IB8Pt/IyKhXr17kNVxmZqalpeWZM2fEpvXZZ5+hpSpd7pJb4pXv1chxSqr0vLw8tOGgqqr65s0bhhLv9u3b0XOxgkpDQwPaw9HR0WFyHJ2hFKFI68XFThDE2bNnKa5LlixxcnISKbAriw5kLl++XOzAywRs0vOPP/6QLwYF61p5Ei8r/aXZisPTn4aGhthj0nw+H50slSTxOjo60kPha7f0kU0RiVfuyRp3PUm9AAmNrSXxSl88yD10sDsPtrDEy0q7avUSAIBWAezxdgpUVVWXL1+OfuN1JwYtRvX19fGpIYIgQkJCkILQSZMmdevWjR6nu7s7+nHixAkpSS9dupSiJWj48OHJycnz588n61BF56koYYcOHZqcnIwOgjYLPqhDEMScOXPE+vnqq6/QD/xFnM7XX39Nf4h1tLx8+ZJot3TU0mbSvPX09MjNu1kCAwMTEhLEOmFFLHQP8+fP19fXJwji3LlzZPUtiPDw8Pfv369YsQIfiSQIws7OLi8vj3L5jZJWaWkpiw1PvlejgPovBUtLSyQoCgSCkJAQJpkRiURHjx5Fv8UWgrq6uqurK1IgdO7cOSZxtljr7datG13R0V9//YXtAMvEF198ceDAgV27di1durR79+6BgYFWVlYbN2788OGDTPG8f/9+3bp1SFXs6tWrCYVhq65ZgZX+0mzF4enP2dlZrPYjTU1NNzc3+nVKzMKFC1tsHpFvsm6266EmZGBgoK2tTbQG0hcPcg8dLM6DLQ8r7apdlwAAyA1IvJ2FZcuWoRuSJ0+eJGutJAji9u3b2dnZixYtQmoMELdu3UI/JGnJt7GxQWpdCwsLpYyzI0aMkJIrGxsbdLrm0aNHEyZMuHfvHtlVVVXV3t6eoQLP9PR0pLaXw+FIUhj76aefoh8xMTGNjY1i/WA1v2TMzMzQj6qqKqLd0oFLe9myZWgWl9S8Fy5cSG7eMlFZWfny5cus/wf+Qk9XE62rq4tWJA0NDXTdIUePHlVTU1u6dKmkhJqamgoLC58/f47TqqmpkZQWKzB/NTIcDkeSMm2sThxvF0snPT0dqX7V0NAQ2xjIhnbkkySV13odHBzwtXPFGT9+/Pfff7958+bjx4/n5eX5+flVVVX9+uuvTk5O5eXlDCMRCAQLFiwoLi7u379/WFhYsxp6m4XFumYduftLsxWHpz/cDOiEhYVVVFRI0m2OLziQQYeEWZ9H5JuscdfjcDhic4t0SVRUVPzvf/8jWgPpiwe5hw4W58GWh5V21a5LAADkBqwTdRbMzMxmzpx54cKFsrKy8PDwBQsWYCe03UHRpI/PvaSnp//xxx9i49TQ0EDSRXp6OrpOQ0e6eQBVVdWDBw+ijb6YmBgXFxdLS8tZs2Z5eHg4OTnJZEXzv//+wykihat0sMbOurq6vLy8vn370v1gczJkcIT0D6LtiA5c2ubm5jNnzrx48aKk5u3t7U3ISHp6+oEDB6KiorCRGAoU0Rrh7e19+PBhJN/++OOPWORIS0uLi4v78ssvsTyPaWxsPH78+KlTp5KSkhoaGpinJTfyvRpGX19f0kIfG0nKyspikhM8zujo6EjaTcWWn9LT0wk2YKv1ymo2iTlqamobNmx4//7977//npyc/M0335w/f55JwNWrV0dHR/fq1ev69etIbS+F8vLyHTt20J8PGTKErruY3bpmC8X7S7MVh1sI3QoOQ1pyHpFvsmbSC1oX6dUk99DB4jzY8rDSrtp1CQCA3IDE24n49ttvL1y4gGQALBK8ffv28uXL48aNGzhwINkzNmV55iPSYy4tLZXk1Kx5z/nz5xsYGPj6+qJlU35+vv9HTExMlixZsm7dOkNDQyZvhzPcpUsXSX7QZSfE+/fvxa5ixRr4JR9Dbdd04NL29va+ePGi2OY9duxY/LGfIYcPH/bx8REIBKqqqlOmTHFwcNDX10fia21tLVb6SmfgwIFOTk4PHjzIycm5devW559/Tha8v/32W4r/4uJiV1fXlJQUgiB69+7t5uZmYWGBja9cvnw5Li5OxpJQ1qsx6dS4PTDclsQNqaKiAqmlkW+ckQm2Wq9MtovlYNOmTf7+/o2NjRcuXHj27Fn//v2l+1+/fv3Ro0d79ux5584dpHyYTlVVlVihaObMmWIlXhbrmhVY6S/NVhyTFiKdlpxH5JusFX9HZSO9mhQZOtiaB1settpV+y0BAJAbkHg7ERMnTuzXr9/z58/j4+NTU1OR2vpjx44JBAL6QhyvIXbt2jVt2jTpMWNVQ/Ixbdq0qVOn3r9///Tp0xcuXEAXIEtKSvz8/I4fP37lyhVsfkYK+JSalM+cZCf8gp2Njlran3322SeffJKdnU1v3rJu8N6/fx/Zhunateu///5LOUhWWVkpXSz89ttv0TnPI0eOIIm3pqYmJCTE1tZ2woQJFM/z5s1Dy/dly5ahY89k18LCQnYlXgVfrVlwpTOscezNwsLiypUr0j2ztfnQBluvWLp16zZ06NDHjx+jk6vSJd4NGzb8/vvvPXv2vHfvHra3TEdDQ0PsKWVJh3RYrGtWaJn+wqSFtB3km6zb1zuyPnSwMg+2a6AEgM4GSLydC29vb2Rv7ehHBAJBYGBg9+7d6Wo8jI2N3759i35IusfFIsjoubOz8+HDh2/fvh0YGIj260pLSz08PHJycpCFTCanfSorKyX5ITuJPR3USeiQpc3hcFauXInM/5Cbt5GR0ZdffilTVFi16YYNGyTdcJOCp6ensbFxaWnp5cuX37x507Nnz9DQ0JqaGrrgnZqaeufOHWQI9ODBgyxeClXSqyFqa2ubrXSGWwS4YTQ1NbXAONNmW68k8G26169fS/G2YcOG3377rVlxF53/J6ssbsm6VpwW6y94+msXihvkm6xxq1bqO4oVp+vq6hSPWfGhQ/F5sL0DJQB0KjrIWU2AIVwuF135QNodIyMj3759u2TJEvpRGayxIzc3tyVzqKam5urqeuHChdjYWJTVoqKiGzduNBsQZ7j8I2L95OTkoB9GRkaSTv11KjpYaS9evBi1ZHLz9vLykvX0Kb79hU3UkMGmNSShoaGBDogKhcLjx4+jzV4tLa1FixZJSujTTz8VqxC12bRkRcFXQ9TU1EhaJT9//hz9QHvszBtScXGxFOGKXdpI6z1//vzGjRulHwnGSrOk3LSUIu6+ePEiIiKiqKhI7kyyWNeK02L9BbeQ7Oxsos0j32SNQ5WVlUn59CMf+GOE2E795s0bxZNgceiQex7sMEAJAJ0BkHg7F926dUN6/GtqakJDQ48cOcLhcFasWEH3iQ9HxcbGSort/v37ZmZmVlZWcn+yzcjI8PDwiIyMpDuNGTNm2bJl6Lck/TpkevXqNWDAAOl5xgob3dzcFNdiqmxYl3Y6fGkbGRnNnj2b3LwJghDbvKWD1d6IPa7JZHW4cuVK9MqBgYExMTGpqalfffUV3XCI9IQYptXCr4Z4+PCh2OdY7SeyjNosvXr1QhoERCKRFJNI7u7uZmZmv//+O8PstYvWe+XKlV9//fXp06dS/GRkZKAfn3zyiRy7uxcvXvTw8JBUWS1c14qPby3WX6ZOnYp+SDkjPWnSJCsrK7pKduUhqcTkm6zJvUDSa169etXKysrBwUFs0lJqEGtNKygooLuycvJc7qGDxXmwnQIlAHROQOLtdOAru3v27Ll58+aUKVPE3uDy8PBAqjhjY2MlqeI8evRocXGxo6Oj3Pb6SktLIyIiLl26JNYVmTYlH+2Tjq+vL/px8uRJuqtAIPj7778pPhXn+vXrv36ELUWy+BwR2SbK1atXhw4d6uXlpUjMHaC0ZW3en3/+uSRRQQpYCW1iYiLd9e7du83GYG1tjUxBvn37Ftkrol+VJyeUnJxMP/4nFArZssfD4qshjh07Rn8YFxeHeoG+vr4kC5900EF0giDQfjidrKysK1eulJSUTJ8+nWCJttN6T58+Lcnp33//zc/PRwLelClTFDnMrAgs1rWk8W369OlDhw599OiR9LAt1l9mzZqFtDQ/fvwY6zQmk5mZefv27devX9Nv5rNOsyUm92SN23ZwcLDYUEFBQfn5+cOGDSN/9GFSg7q6uujC8IsXL5ANIYxIJELa7BVHvqFDvnkwPDz8u+++u3btGtH+YXclAADtBZB4Ox0jR45E9/devXolxWqLqqpqUFCQioqKSCTy8vKi7+KGhIScOXNGS0tLrK0LmQgLC3v27BnlYV1d3eXLl9HXYoZ7CIsXL540aRLa2aB/v9y9ezc6orZ+/XpJ5vvkIDQ0dONH2LKYamxsjJRnko9+xcbGpqSksKK5p12XdrOMGTMGqWWW3ryl89VXX6Effn5+lO/chYWFW7duZRIJTjo/P9/BwUGsbcnx48ebmpqig3l+fn4U1z179rB+p4CVV9PR0bl+/fqpU6fID9+9e4eV/f7666/MrR9zudzJkyejlvnPP/9QXD98+DBnzhzU3uzs7AiWaDut9+TJk2KXnq9fv8bluXbt2u7du4sVdwmCcHFxCQkJ2SGOmzdvKpg9dusa2QJFP/D4Vl1dffPmzZSUlGY1ILZYf1FVVT158iRSgbty5UqKQebGxkb0+l5eXtiKlfJotsTknqxxLzh37lxUVBQlVGRk5Pnz57W0tDZt2iRTfhDoG41IJFq7dm1TUxN62NjYuHr1arEKh+VAkaFDpnkwMjJyzpw5R44cmTZtWmtZn2YdtlYCANBuEAGdj8DAQFT7vXr1ampqkuLzzJkzaHKys7MLCQnJzc0tKCi4e/fuokWLOByOurp6eHg42X9OTg73I7169UJJeHp6oicPHjygx4/3lExNTQ8dOpSRkVFSUpKVlRUeHo4kBDU1tX/++Qd5fvDggdjIf/nlFxxhWVnZ2LFjUcDNmzenpqYWFRUlJCRwuVwUxMvLq7GxsdkMnz59GnlArni+dHV15XK5fn5+OAY04yIRi0nh+/r6crlcd3d3FMrGxgYlkZaWhv0gQ3no03tBQUFkZCQ6EHvv3j3pkUsvIplKmwktVtrBwcHICV0x0tLSQn9xQDJ4A8Hc3JycOnPq6+tHjx6NIunatevu3btv3LgRGxu7d+9eU1NTNzc3XIwoG8+ePaNH0tTUZGFhgXweO3ZMUloRERF4/8TNze306dPx8fGXLl3y9PTU09NDxUtveFJakfSyku/VKHGampqiLVB3d/eAgICwsLCtW7ciUYQgiCVLlgiFQvyClZWVKKyjoyPy4OjoiJ7U1tYiP+Xl5ePHj0dr91WrViUkJBQWFqamph47dgxJFE5OTjU1NQyrT1Iv4HK5+/btk7v1ikSiffv2iS12X19fkeyQj2wsWLAgKioqPz+/pKQkOTl59+7dWB3U4sWLBQIBJSxSMMOQS5cuMc+VInXNZHzLyspCDd7JySkzMzM7OxvZEpswYQKT7MnXX+SruJCQEHR8evjw4REREa9fv37+/Hl4ePjgwYPRw6qqKgVHNiaTGsMSk3WypvQCdXX1LVu2pKamFhYWxsfH//jjj+rq6ioqKiEhIZQgDPPz/PlzrEDBwsLC09Pziy++MDU1NTAwwNvm3bp1Q69/9epVWRcPcg8dcsyDmzdvxr1p7969IrlobGxEr+Pp6YmiUlFRkd4OldSuWF8JAEC7ACTezkhNTQ2yNrlz585mPScnJ7u6utJvsrm4uCQmJlI8S7lOExQURI+8trb2r7/+cnFxEat1c/z48Q8fPsSeJd2YGjVqFDlOPp//22+/GRkZUbzZ2NiEhoYyzLCPjw/yINbV2dkZuTY1NaGEBg8ezLDwJe0JREdHYz+FhYXDhg0ju6qrqzOZaKUXkUylzZCWKW1Jd3FxQDJVVVVo02n79u0ieamurl6xYgXluqCuru6uXbvoVmHv3r0rNpJffvkFHRKTLq3dvHmzX79+lDjHjh2bmprq4+NDKYpmW1GzZSXHq1HiNDU1FYlEFy5cMDc3Jz/X19ffv38/RTyTojapoqICe6uvr9+7dy9dK7KRkdGOHTv4fD7zupNytdLV1VXu1isSidBJdTqWlpbMs0dO/fTp0+7u7pL2SJ2dnS9fvizrOyoo8SpS1wzHt0OHDlF2+ezt7Rl+MZSvv8hdcU+fPsUmtTFaWlpr1qwhd2q5RzaGkxrDEpNpsm62FwwePPjff/8VG4Rhfm7fvo0lLhxnamoqvUD8/PxkXTzIPXTIMQ8mJCQgz9ra2v/9959ILvh8vqQXlNQOldSulLESAIC2D4d17ThAh+Tdu3cJCQlFRUUikcjU1HT48OEK2uCl8OHDh7S0tOzs7KqqKnV1dTMzs2HDhimShFAofPz4cU5OTmVlpZGR0cCPEGwTHR2NtsUCAgKWL1/OYswikejx48cZGRl1dXUmJibjx483MTHp5KXNHAcHh9TU1Pz8fLzLKh9lZWVxcXFv3rxRV1fv3bu3k5OTFJW5ioBWq2lpaTU1NYaGhiNGjFDetUwWX00gEMTFxeXl5fH5fEtLS2dnZ1nVYlMQCoWJiYnZ2dnl5eV6enq2trbDhg1TtrnXVm+9jY2Nz58/f/bsWXl5eUNDg76+fo8ePYYOHdpiVn9avq5LS0tjYmKKioo0NDQGDBjg6Ogok3qwFu4vJSUlaPrjcDiWlpaOjo74rmOLwbzE5JuscS+oqKjo2rXr0KFDsV4rRfLT2NgYHx+P7gj0799/zJgxhHKQY+iQaR7MzMyMj493cXFR9sjckrC+EgCAtgxIvAAgJ3w+f8iQIS9evBg0aFBiYqKCa32ALTIyMgYNGjRjxoyIiIjWzgsAAAAAAADQyoDmKgCQh+rqajc3txcvXpibm1++fBnE3bYDuqYuVjcyAAAAAAAA0NkAiRcA5KG+vr60tHTkyJEPHz4Ua94JaBkiIiKQ+hz0t7KyMigoyNraGmsUAwAAAAAAADozIPECgDwYGxs/ePAgLi6OopkDaGGSk5NPnjyJrbBs2rSpqqpq7dq1Ml0LBAAAAAAAADoqYhS1AQDABAMDg9bOAvB/mTFjhpOTU1FRUWZmpqOjI7taxAAAAAAAAID2C+zxAgDQjnFycnJ3d+/du3daWpqqquqmTZuuX78u1ugCAAAAAAAA0AkBXc0AAAAAAAAAAABAxwT2eAEAAAAAAAAAAICOCUi8AAAAAAAAAAAAQMcEJF4AAAAAAAAAAACgYwISLwAAAAAAAAAAANAxAYkXAAAAAAAAAAAA6JiAxAsAAAAAAAAAAAB0TMBqZcfnwIEDERER+K+hoeHFixdbNUftievXr+/Zs4f85OzZs6ampq2XIwAAAGk0NjZmZmb+H/ODHM6QIUNkDV5TU1NaWvrhwwc9Pb3u3btra2srJ5tAB0QZ643y8vJZs2aRn/j6+rq7uys7bGdGSj3CkhJop4DE2/EpLS3Ny8sjCOL169dCoVCstHbq1CkfH5/+/ftfvXrV0NBQ2VmqrKx0d3dPSUnZu3fvN998Q7RhampqUOmVlJTU1dURBMHn81s3S+2o9AAAaHl++QhBEJqamgzHK4FAcO7cuYiIiNu3b5eWlpKdevfuPXTo0EmTJk2ZMqVv376UgAkJCd9//730yDU1Nbt27Tpw4MApU6aMGzeOw+EQrCIlD9OnT9+6dSuLacHwK70omKw3ZEUgEKA4q6ury8rKCIKYN29eC4TtzEipR2VUMQC0AByRSNQS6QBtADMzs+LiYlNT06KiIrFOBEH4+/v7+PgoOycBAQErV64kCMLAwKCiooLsVF9fn5CQQBCEsbHxwIEDlZ0TgiCysrJQgQwfPlxXV1eSNw8PD/RdMy8vz9LSkmg9pJQeAAAtD8MxpGVIS0sbNmxYU1MTc4n30qVL69aty87OJghi6NChY8eONTc3V1dXLy0tTUpKunfvHoqNIAgHB4cff/xxwYIFOOyDBw+WLVuG5B9UCDo6Or169UKuQqHww4cPhYWFeKUxcuTIsLCwPn36sPjKUvIwa9Ys8iEdxecXGH4ZFoWU9YbiKfJ4vBUrVrRY2M5Ms+tGdqsYAJQH7PEC/4eBAwciidfOzq4FkhswYAD6QU+uqKjIxcWFIIiZM2deunSpBTKzZ8+e4OBggiCSk5Pt7e2JNo+U0gMAoOVpO2OIUChcunQpFlCbRSQSbdu2bdeuXQRBTJw48dChQ3h4wRQXF69duzYkJIQgiKdPn4aEhJAlXicnp2fPnhEEERwcvHjxYoIgxo0bFx0dTY6hpqbm4sWLa9eufffu3aNHjyZMmJCenq6np8fGGzPNA1vzCwy/GCgKAADaESDxAv+HS5cunT59um/fvhMnTmyB5MaNGxcTE5OWlvbVV1+1QHIdDCg9AADE8scffzx+/Hj06NHx8fFM/G/ZsgVtgX799denTp1SURGjzNLU1PTvv/82MjL6448/5MtVly5dFi1aNGjQoOHDh4tEolevXh06dGjz5s1EOwSGXwwUBQAA7QiQeIH/g56eXguf83H6SEum2JGA0gMAgMLLly+3bNmir6//559/fvrpp836v3LlChJ3+/Xrd+LECbHiLua33367evUqOvksH8OGDRs9enRcXBxBENeuXWunEi8Mv2SgKAAAaC+AdSIAAAAAaPcsW7asrq7u999/79mzZ7OehULhjz/+iH7v2bNHQ0NDun8NDY01a9YomEOs+KqgoEDBqAAAAACAObDH29lJTk6ur6/Hf7t37451ikhyunv3blRUVElJSe/evadNmzZy5EjsRyAQhIeHJyQklJeX9+7de9asWcOGDSMnV1pampOTQ37i4OCAFlsvX74sKSkpLCxEz8vKyh4+fIi9cTgcckIEQVRVVUVGRj558qS0tFRFRcXc3Hzo0KETJ07s3r07kxdvbGxMSkoiCOLdu3foSWpqKlnLS69evXr06CEpeFVVVWhoaFpaWm1trbW1tYeHh/T7e9XV1devX09ISCgpKdHW1u7Vq9fEiRNHjx4tk9pSKaUnpb7i4+OvXLny+vVrPT29UaNGzZ49WyZzI6he8F91dXVUpy9fvjx//nxubi6fz+/du/fMmTMZ1jWfzz9//vzTp09LSkr09PRsbW1nzpxpZWVFSffZs2dRUVHZ2dlVVVVGRkaDBg2aOnWqlBpB1NbW3rp1KzY2Ft1LNzIysrOzGzdunK2trZRQqamp0dHRubm5tbW1RkZGDg4OU6ZMMTExkRIkMTHx9u3b2dnZtbW1+vr6tra2jo6OI0eOlLRRJqt/CpIKs6KiIjg4OD09XVtbe9CgQV9//TVZc1JOTs6ZM2eys7O1tLRGjhw5d+5cHR0dxZuoMkYGKfWorq7eo0ePiRMnOjk5qaqqMsxMZmbmxYsX8/LyBAKBmZnZiBEjHBwcyC0ZoampOXToUPRbJBI9evSI4mH48OH0RBUZQ5i/mkycPHny33//HT9+/DfffEN/TToXLlx48eIFQRBdu3adPn06kySmTZumoNCLa6pZAZt1ZJ1fZB1+2erpZDIzM2NiYjIzM8vKytTV1U1NTR0dHadMmaKpqSn27RRp28zTYl4UUqipqbl79+7Tp0/z8/P5fL6+vr6dnd3kyZOlD9QUGhsbr169GhcXV1RUZGBgMGLEiFmzZilyP5yVaVru/i6pVGVdbEhCpioGgA6ICOg0ICXypqam5IcUtcNcLleKE5/P/+KLLyhNaN68eU1NTSKRKDc3t1+/fhTXH374gZxcUFAQxUNeXh5ykn6sWlNTkxzPn3/+iVb2KioqPXr0wMIJh8Nxdna+c+dOs6XRrHZBPz8/sv+ZM2fiDN+6dcvAwIDi38fHR1JaBw8e7Nq1K0EQqqqqlpaWRkZGKIi9vX1CQgKDqmu+9CTVl6enJyWIhYVFWloa80Qp9WJqatrU1LR27Vp6iX3xxRfl5eXScxsXF0c3ZuDv709OMS8vDy/B9fT0rKystLS0UOl5e3tXV1dLyiqPxzM2NkbNoGfPnric0bnN/fv3C4VCSpCcnJzJkycjP926dbO0tFRXV0cr8nXr1jU0NNBTyc/PHz9+PM6epaUlXup1797dx8eHEkpW/2IRW5i3bt3S19cnPzQyMrp//z4K8vPPP1MWVRYWFpmZmYo3UWWMDGQCAgJQPaqoqFhYWOAGY2tre+PGjWYz09DQsGTJEkpyBgYGYkcYS0tLHJVYtcYVFRVsjSGyvhpzCgsLu3btqqmpmZWVRc4YZdgkM2fOHOTniy++YJ4Qn8+X1FxxE3V1dRXrQSgU4s+pCxcuFCkBKXmQaX6RHrnY4Zetno4IDg62sbFBYdXU1CwtLfEcZ2xsHBISwuTtGLZtWdNiUhSS1hsikaikpMTT0xMNs8iaq5WVFS6oGTNmFBcXSyoWHo+HvPF4vJSUFGtra0o2jI2NL1y40GxYpU7Tcvd3SYO8TIsNschRxc3Wo3QnAGiDgMTbiRA7PIWGhvJ4PHyliizxnj9/Pigo6Oeff8ZO8+fPNzExWbt27cGDB3/88cdu3bohJ19f38rKyt69e/fr12/79u1//PHHkiVL8JR2+vRpHGdWVhbvI0OGDKHMlPfv3+fxeEhrKEEQQ4YM4ZE4duwYjuTIkSNIqtm3b19NTQ16+O7dux9++IH5fFBbW4tidnR0RKE2b95MTvHp06diJd7Lly9raGiMHz/ez8/P399/wYIFWK4IDg6mJ4QNFf7www9lZWXoYWJiooODA0EQWlpa169fZ1iDUkpPbFXOmzfP2Nh43bp1gYGBe/bswdY4+vbty3ztheqFx+Ohb+empqabNm3S09Pbs2dPWlpaXl5eVFSUs7Mzinn48OG4RrKzs4M+gt4UXd7T0tIaOHDg1q1bDxw4gO0ikiXe1NRU1FAtLCyuXbsmEAjQci0wMBDtTzo4OJSWltLzidd8y5cvR9ZQUKvYsGED3l3h8/nkIMnJyWg5Ym1tjb+SVFdX+/n5oY/6kydPbmxsJAeprq5Gy6wRI0YkJSWhhwKB4Pr16/jEJllGktW/JOiFGRkZqampOWXKlL179/7+++9Y55yent6bN2/8/f1VVVUXLFjg7++/c+fOQYMGIVc7OzvKG8nRRJUxMmC+/fZb5Lpy5cqioiL08NmzZ5MmTUILx+PHj0vPDJfL1dDQWLhw4f79+3fs2NG7d28k8aKWPGrUKORz3rx5PB4vNDQUR9XU1ISaOlJCu3PnTh6PV19fz9YYIuurMQd9bti9ezf6y0TixWdhduzYIWKDZiVerPhKS0srIyODlUSZ54H5/CLf8MtWTydPN926dQsNDcUdNicnB4+ZAQEB9LeTr23LmlazRSFdHEpOTkZBPD09c3Nz0cP6+vqwsDDUJm1tbSsrK6VLrdu2bTM0NJw4ceK1a9fy8vLS0tJ2796NJggOh3PmzBlZJV4Wp2m5+zu9VNFiY/Lkyf7+/jweb+nSpWpqalIWG5KQo4oxIPECHQaQeDsRUoYnPAmRJV6Kk7W1tZ2dHVnYyMrKQudhdHV1ly5dOm3aNPLq8OLFi1gKoqdI3jIlP0eWzZH1CLFv0djYiD6+it0lQAb3ZPoCyuVyUYrJyclSvOEMW1tb//bbb2Sn06dPIycHBwdKqEOHDiGn7777juJUXl5ubm6OPrKWlJQwz7CU0iPXl5WVla2tLTlmPp+PD7ldvnxZvvajpqamra2dmJhIdhIIBHhXds2aNZJy26dPnzVr1iAhFvH999+TJd7Kykq0C6StrY12q8j8888/KB43NzfKbi0uZy8vL3rOf/31V7rEW1lZiVaourq6L1++lBTkp59+Ij8/cOAAeo7Xapjs7Gx07oC8rpXVf7OQ2+GRI0fITl5eXshp6dKl3bp1I590qK+vHz58OHK9evUqK01UGSPD4cOHkdOSJUsoTvX19SNGjEA7MA8ePJCSGVNTU7JA9ebNGx0dHQMDA/QXWdUmCOLzzz8XW8Lv37/X1NSk92UFxxC5X61ZLly4gEQ4vJZtVuIl705L3+GRQ9ocO3bss/9HZmbmo0ePQkJC3N3dkaulpeXdu3dZSVEOqbvZ+UXu4Zfdno6SiIqKojt5eHggg8Pv3r2jOF2+fFmOti1fWuSwcki8Y8aMQQdAyCQlJaGvk+vXrxebHJZaNTU1v/zyS8osEBsbiwTCLl26vHr1irnEq4xpWpH+Th7kDx48SHY6e/aspMWGFBSpYpB4gQ4DSLydCAUlXoIg/v33X4rr3LlzkZOGhgbeWMN88sknyLWqqootiTczMxN5+Pnnn+muiYmJypZ4HR0d6a74th75TSsrK9G+qJaWFv5sTAYvkrZs2cK6xEsQxK1btyiux44dQ06+vr7ytR9JxZuXl4f2ulVVVd+8eSM2twMHDqSsch4/fmxvb4/3In766ScpSYhEIqwXNDIykl7OGhoaYk/E8fl8dDCMLPFu374dRSV2ddXQ0IC2f3V0dMjr1NmzZyOxnyy3Y6ZNm0ZZ18rqv1lwYY4bN47ihEySIlavXk1xDQ0NpVe9Ik2U9ZGh2Xq8ffs2CjVs2DApmTl79izFdcmSJU5OTuh3U1OThYUF8vnixQt6Knv37iUIgsmmH/MxRJFXk055ebmZmZmKisrjx4/xw2Yl3oyMDFxccnz8Egv9TCYFKyurvXv3Mj9d0r4kXnZ7+jfffDNq1CixTg8ePECp//nnnxSnpqamXr16ydq25UtLbok3MzPT0tJS7DasSCT67LPPkHhJv4FCllol9aNly5YhD97e3gwlXmVM0wr2d1yqY8eOpbtivXT0ZZUkFKlikHiBDgPoagaYYmpq6uLiQnmI1c+4uLiYmZlJcs3NzWUrG/gI8ZUrVwQCAcV16NChycnJ69evJ5TGwoUL6Q/xm758+RI/DAkJqa6uJghi0qRJ+JwnGbzvceLECdbzaWJiQreujG2WUDRkyMT8+fPpDy0tLZE4KhAIQkJCxAZcunQp5Wbp8OHDk5OTUYT4vDpBEPiSIQVs+BF/lSeXs7Ozs1h1U5qamm5ubuTbUCKR6OjRo+g3ls3IqKuru7q6Ir0j586dw89R/puamqKiouihAgICkpOTyapTZPWvSC3069cP6ySju+ImSjYww0oTZWtkwJkZP3682Hp0cXFB5x6TkpISEhLEZqZbt270G8V//fVXTEwM+q2qqrp8+XL0Gy+CMWhlrKenh8/7sQIrryYWX1/foqKi77//Hu/hM6G8vBz/lqLMTD769u3rR2Lnzp0//vjjxIkTX716tXbt2sGDB+NDMR0Jdnt6YGCgpGaAr8TTPTBp2/r6+pS2LV9acmNnZ5eXlyd21MUplpaWkmdSOhMnThTbjxYsWIB+hISENDU1McmPMqZptvr7119/zXCxIZ0WrmIAaJuAxAswxd7enq6x0NDQEP3Ax2XJYN0PaPRnBRsbGxTto0ePJkyYcO/ePbKrqqqqvb19sxp9FQFfpCSDDj6hz6744a1bt9APfM2Pgo2NDTr8WVhYyHz2UqS+sOxBzqdMcDgcSYoisbJT/NmYAjrKJYn09HSkbpTD4UhS5Isl9piYmMbGRko5S7FBGhYWVlFRgZVSpqenI/26GhoaYpsuQRD47isWlshVOWfOnN27d79//54cpGfPnvb29mSlrLL6Zw492xwOB6/Y6HUktjOy0kTZGhlwZiQJbyoqKrj34U0SCg4ODviqmySWLVuG5JOTJ0+S9TyjaLOzsxcuXEhWea04rLwanX///ffEiRNWVla//PKLTPnp0qUL/i1WpxHm9OnTATSePHkiJUifPn02kNiyZcu+fftu3779/Plze3v7rKysr7/+evXq1UTHQnk9vbKy8uXLl1n/D7xNLVYj97Jly1D7l9S2Fy1aJKVty5SW4jQ1NRUWFj5//hynWFNTwyRFSRMEnmKqq6vT0tKY5EEZ0zRb/V3s4KngJN7CVQwAbQewTgQwhaz5FoOV0KAjoBSwAkb6ZqzcqKqqHjx4EH37jImJcXFxsbS0nDVrloeHh+IWPpgg9k2RMmHKm+ID2Onp6VhrCwUNDQ20LklPT6drnmyBfJaXl+/YsYPuc8iQIXSFtwRB6OvrSzJmgBWxZmVlifUg3d7Pf//9h73hfFLAinnr6ury8vKQShgckG7iSBK4anR0dMjbxWSQ4RlUNfjhypUrjx8/np6eXltbu2XLlv/973+TJk3y8PCYMWMG/upBRlb/rPRH7Y8w6YysNFG2RgYm9YgbAPlcLvM2hjA3N585c+bFixfLysrCw8PxvhBBEOiUgbe3N8EqrLwahdraWnSG89ixY7Lu05KrTPq6efPmzfn5+ZSHP/30k5SvS5KwsbGJjIz85JNPGhoa/vzzz3Hjxkk6ytEeYb2np6enHzhwICoqCltUokARaBFmZmYzZ868cOGCpLaNVF2wkpbcNDY2Hj9+/NSpU0lJSQ0NDXKkKKmb6+jomJiYIOEtKytL7OdpCsqYptnq78wXG83SwlUMAG0QkHgBpki3tteS9hXnz59vYGDg6+uLJKv8/Hz/j5iYmCxZsmTdunV4f0kZiH1TsR/vy8rK0I8zH5EebWlpKdEa+ayqqhI7zc+cOVOsxCvFdh/eOCKfmWQYllxc5A0oCuRjge/fv0cSL5OAktKqqKhA2rMYVo2mpmZMTMyGDRtOnDjR9JHoj3h7e0+YMGH9+vXoLLTc/pkjpccx74ysNFG2RgaZGgBlDw3D0Lakt7c3UqB15MgRLBW8ffv28uXLY8eOxdv7bMHKq1HYtm3by5cvuVwuUv0qE2ZmZjo6OrW1tQRBvHr1SorPS5cu4aWwn5/fpUuXCAXo1auXm5sbUh7m7+/fkSRednv64cOHfXx8BAKBqqrqlClTHBwc9PX10UmK2tparJlcLN9++y1SZkZv2+PGjcMa+1lJSw6Ki4tdXV1TUlIIgujdu7ebm5uFhQX+QHb58uW4uLhmI5E+DSGJV9I01ALTNFv9nfliQzotXMUA0DYBiRdol0ybNm3q1Kn3798/ffr0hQsX0JxRUlLi5+d3/PjxK1euYDsNrQiexXft2oU0l0gBq6NoYTQ0NMSeUpZjwxl/csYvLhP4MKqUT9dkJ5wKk4AUcFgLC4srV65I90w5ONC1a9eAgICdO3eePXv2zJkzsbGx6I7cvx/hcrknTpwgL0pk9d9pm6hMDUC+Nob57LPPPvnkk+zs7Pj4+NTUVGQO5NixYwKBgPUNXmW8WkNDg7+/P0EQz549mzJlCsUVy6gNDQ1k1//973+jR49G+Rk3btz169cJgkCyB5NzlXRL2nIwZMgQJPEiVVv08/DtF7Z6+v3791etWoUi/PfffykblZWVldJFlIkTJ/br1+/58+f0to3t5bCVlhzMmzcPNblly5YdPXqUcgehsLCQicQrBVmHCGWMgS05lDVLy1cxALRNQOIF2iscDsf5I4cPH759+3ZgYCDatCktLfXw8MjJyWFdI4usGBsbv337Fv2QdPe11TE3NyfruW0WtC8klsrKSvRDvj12fIILxyMlCbJ/XM7M7zXhsE1NTfJVTffu3Vd9pKCgIDQ09M8//ywoKEBmEu3t7bFpaLn9d8ImijPDpAGIPe/HHA6Hs3LlyrVr1xIEcfQjAoEgMDDQyMjoyy+/JNr8q2GDuvgantjFNEWLNTn1adOmIYn3zp07aPOHaBH09fXRj6amprq6ulYfpVlH8Z6OlQNv2LCByblcOt7e3ighctvu3r07Xamb4mnJRGpq6p07d5B97IMHDzZ75b4FpiFljIEtOZQ1SwtXMQC0WUBzFdDuUVNTc3V1vXDhQmxsLLriUlRUdOPGjdbO1/+nSIlFVdWtTk1NjSTB8vnz5+gH2lWQu7jKPyLWD1YxbWRk1Lt3b0pAshZihmkVFxdLWTwxwcLCYsOGDdnZ2cg8CUEQ0s20yOq/8zRRJvWIG4B0LWhMWLx4MTo0iBSrRkZGvn371svLi+G56NZ9NU1NzSLJ4JvnFG/k/d4lS5ag27xFRUXMdWUpDj7Dqamp2fHEXVZ6OtYggI2xkfk/ViWbg8vloqmQ3LaXLFlCPyWreFoygZP79NNP6boGmKeIPiLQef/+fUVFhUzTkDLGwBYeyqTTwlUMAG0WkHiBNoqkgTgjI8PDwyMyMpLuNGbMGGyOT5J6BjlSlBt8RAodbxPL/fv3zczMrKys6urqiHbCw4cPxT7HerORTUVZ6dWr14ABA6SXGFab7Obmhs9DTp06Ff2Qchxu0qRJVlZWeMXZq1cvdJ9NJBJJscrg7u5uZmb2+++/4ydbt24Va5xJU1MTmzsitz1Z/bcwbaqJ4nqUpOubz+cjg9vI4KqCyRkZGSFRpKamJjQ0FOn1WbFihSJxShpDWvjVmKCrq7t161b0e/PmzUKhsAUSRTr20Y/W3W5ifbRnsafjQ+liz7tK2TbEdOvWDZn/wW2bw+GIbduKpyUT0pNjnqKkQRvPQRYWFtjod8uPgW2qv7dwFQNAmwUkXqBtgb/6Y9szBEFcvXp16NChXl5e6NByRESEJAUq+MgccwNFYlOcPn360KFD8eJMPjw8PJD64tjYWEnqi48ePVpcXOzo6Cj2g3fb5NixY/SHcXFxaGdJX19fkq3FZvH19UU/Tp48SXcVCAR///03xSdBELNmzUIqMR8/foyVZJLJzMy8ffv269evJ0yYgB+iE60EQRw/flxsZrKysq5cuVJSUjJ9+nT88MGDB2FhYWJ3GHR1ddHRUHLbk9V/C9Ommiiux6SkpNTUVLqH8PBwtOL08PBguJyVDr7WuGfPnps3b37++efyRdvsGNLyr8YEHx+fmTNnEgTx5MmTLVu2tECKT548+ffff6UYNg8PD//uu++uXbvWWvOL3LDY07HSeywUkbl7964cbXvKlCliVTOwkhZzcHLJycn0O65CoZBsCk4K8fHxYlUc448LYlVSt9gY2Kb6ewtXMQC0WUDiBdoWxsbGSL3hmzdv8MPY2NiUlBTyTbOwsLBnz55RwtbV1V2+fBlpaGC+zWhjY4N+4BSrq6tv3ryZkpKioKoeVVXVoKAgFRUVkUjk5eVF/zwcEhJy5swZLS0tsfaB2iY6OjrXr18/deoU+eG7d++wYudff/1VblumixcvRopnL168SN/G3717Nzoktn79erJCHVVV1ZMnTyKVMCtXriSvZdHSFuXNy8sLG4RAB/8mT56M2tI///xDSevDhw9IkezixYvt7Owortu3b6dn/sKFC2gNR9dAK6v/FqNNNVFKPVKsZRQWFm7cuBFdz5NkUEpWxowZg9QyI33FcuusanYMaflXYwKHw/n7778///xzpIfZ29tb0oWFDx8+HDhw4Pz583KnJRKJrl69ij8ejRkzZvny5RQ/kZGRc+bMOXLkyLRp0yRtjrXM/CI3rPT0r776Cv3w8/OjbAsXFhbinXnpjBw5Eu2iS2/brKTFnPHjxyP9Z8XFxX5+fhTXPXv2MDxabGZmtnDhQnyAGXHo0CFkCNfKyoq5ZgRljIFtqr+3cBUDQNtFBHR0goODuR9BF3u0tLTQ39OnT4tEIl9fXy6X6+7ujtqDjY0Nck1LS9u3b59Yp9raWpFItG3bNi6XO3bsWOQ6YsQILpfr6+uLEkU+sajg6urK5XJ/+eWXBw8eIKdevXohJ09PT+SEM4xs7SJVHwUFBZGRkd26dUMHlkQiEf4kaWpqeujQoYyMjJKSkqysrPDwcHQfRk1N7Z9//mFePllZWeh8rJOTU2ZmZnZ2NrLoMGHCBJFIlJOTIzbDqPQkvamfnx+O/8yZM+j2lJ2dXUhISG5ubkFBwd27dxctWsThcNTV1cPDwxlmVXrpSa+vS5cucbncefPm4dJDrs+ePWOYOlqpmJqaoo1Wd3f3gICAsLCwrVu3YiWuS5YsEQqFyL+kouNyuQ8ePJCUSllZGWpUampqmzdvTk1NLSoqSkhI4HK5KBIvL6/GxkZ6wJCQEHRqa/jw4REREa9fv37+/Hl4ePjgwYPRw6qqKkqQ8vLy8ePHowXKqlWrEhISCgsLU1NTjx07hmRjJyenmpoachBnZ2eUjdmzZ9+8ebOgoODt27ePHj3asGEDuv/p5OTE5/Pl9i8J6e0wKSkJuaJvDerq6uRyllT1aWlp8jVRZYwM9HocNmxYREREQUHBy5cvT548iURHY2Pjhw8fMskMTlE6hw8fRgHNzc3FtivFxxC5X01W/Pz80LtjyUpFRQU94XK5x48fFxuqsbHxxx9/RDqEjI2Nly9fHhYWdu/evYcPH0ZHRx84cMDT0xNvbWlqan777bcFBQU4eFpaGoof13iPHj1wolwu9+uvv3ZzcyPbpF24cGF1dTU9J5s3b8Z+9u7dy/zFpeSB/tbS5xe5h1+2erpIJKqvr0cqtdHX2927d9+4cSM2Nnbv3r2mpqZubm4Mx/DAwEDks1evXk1NTSymJaUopK83RCJRREQEvpDi5uZ2+vTp+Pj4S5cueXp66unp4Rokz6SVlZUoEkdHR+R64MCBQYMGmZubb926NSwsLDAwEB9O7tq169OnT/EL0sM6OjqSxyvWp2m5+7viiw0Wq1hKPTZbxQDQNgGJt+Mj6Waaj4+PSCQi73qRiY6OlnS9pKKiQiQSidVqaGlpiRIVG3DUqFGSVHeMGjUKZ7iwsHDYsGFkV3V1dbwAqq2t/euvv1xcXMSqeRw/frwcq8ZDhw5RVHrY29u/evVKyiVPVHqS3tTZ2Zkcf3JysqurK90Oh4uLS2JiIvN8Si896fX1008/iXW9e/eurBKvSCS6cOECeQmLDjPv379fIBBg/1LuxwYFBUlJiM/n//bbb0itDhkbG5vQ0FApAZ8+fYo2rMhoaWmtWbOGIrhi6uvr9+7dS9eWaWRktGPHDvoKNSUl5dtvvxW7+W9oaLht27a6ujpF/EtCejuUdMgflbOkqo+OjpaviSpjZGi2HtXV1RcuXPj69WuGmcEpSqeqqgp9Jti+fbtIAaSMIXK/mqxgoUssXC5XSticnJxly5ZJsj+kq6v7+eef83i84uJiSsDo6GgpiSKp28DAwMrKys3N7eeff5byiS0hIQGN6tra2v/99x/zF5eSB/pbS59f5B5+2erpiOrq6hUrVlAuXurq6u7atYtuElbSGF5TU4OMvu7cuZPdtKQUhfT1BuLmzZv9+vWjeBg7dmxqaqqPjw99Ji0qKqJ45vF45eXlX375JWXIcnFxycrKIr8dPSxlvGJ9mpa7v7Oy2GCriqXUI5MqBoA2CAcUtQFtEJFI9Pjx44yMjLq6OhMTk/Hjx5uYmFD8fPjwIS0tLTs7u6qqSl1d3czMbNiwYXKfQy4tLY2JiSkqKtLQ0BgwYICjoyPrhiLfvXuXkJBQVFSEpMfhw4e3lg1e+TAzMysuLjY1NUVrCIFAEBcXl5eXx+fzLS0tnZ2d2VVyKxQKHz9+nJOTU1lZaWRkNPAjTAKWlJSgcuZwOJaWlo6Ojvh2t5S0EhMTs7Ozy8vL9fT0bG1thw0bJt1MYm5uLjpfwOfz9fX1bW1tHRwcpASR1X+r0KaaKK5HdXX1Hj16jB07Fp1HZR0HB4fU1NT8/HwLCwtF4mE+hrTYq8mKSCTKyMjIy8tDDdXAwKBr1662trY2NjYtYzg3MzMzPj7excUFHxRvrflFbljs6WVlZXFxcW/evFFXV+/du7eTkxPaVVMGLZkWtpuVlpZWU1NjaGg4YsQI+Wr8zZs3jx8/Lioq6tq166efftq3b982OAa2kf7ewlUMAG0NkHgBAJBH4gWADkBGRsagQYNmzJgRERHR2nkBAAAAAEApgOYqAAAAoJOC7jpixbYAAAAAAHQ8QOIFAAAAOgURERFIuRr6W1lZGRQUZG1tjbR2AwAAAADQIQGJFwAAaZSVleV/BBnYEAgE6G95eXlrZw0AZCM5OfnkyZM3b95Efzdt2lRVVbV27dqWuaQKAAAAAECrIEbbLQAAAGbz5s0BAQH4b2lpqZWVFVLM6O/v36pZAwB5mDFjhpOTU1FRUWZmpqOjI90wLAAAAAAAHQmQeAEAkIa7uzvFEBECmzcEgPaCk5OTu7v7f//9l5aWZmZmtmnTpo0bN4q1cwYAAAAAQIcBdDUDAAAAAAAAAAAAHRO4xwsAAAAAAAAAAAB0TEDiBQAAAAAAAAAAADomIPECAAAAAAAAAAAAHROQeAEAAAAAAAAAAICOCUi8AAAAAAAAAAAAQMcErDIAQJvm8OHD4eHh+K+hoeHFixdbMgMHDhyIiIhoxQy0fdpOET19+vTcuXMZGRl1dXXdu3e3srKaNGmSk5OThoZGq+QH6MxDB9DxqKmpKSkpqa2t1dHRMTEx6dKlC4uRl5eXz5o1i/zE19fX3d2dxSSAFhsrhEJhWVlZaWmplpaWiYmJjo5OW2tvQGcDJF4AaNOUlZXl5eURBPH69WuhUGhqatrCGSgtLW3dDLR92kgR+fj4HDx4kCAIExMTS0vL5OTk0tLSPXv2+Pv7+/j4tEqW2gW3bt3aunUr/bmGhsb9+/cpDz98+DBp0iSRSOTq6rpjxw6Ka0NDw/jx4ykPFy1a9O2336LflZWV7u7uKSkpe/fu/eabb4gOPXS0HRISEr7//nuxTtOnTxdb+xROnTrl4+PTv3//q1evGhoaEp2MvLy8P//8MyIiIjs7m/zcxMTE3t5+1KhREydOHDt2rIJf1gQCAWqx1dXVZWVlBEHMmzePaCU6VY2zOFY0NDT8/fffFy9evHv3bm1tLX7es2fPKVOmfP311xMmTGgj7Q3obIA9XgBoH5iZmRUXF5uamhYVFbWjDNTX1yckJBAEYWxsPHDgQKJDw3odMS89Ho/n7e1NEMSePXs2btxIEERjY+OyZctOnToFEq90rl279uOPPwoEAry6sra21vhIamoqxfOVK1fQplOPHj3evHlDcW1oaBgyZAhaQb57987CwkJXV3f58uU//vgj8hAQELBy5UqCIAwMDCoqKjrJ0NHqPHjwYNmyZeiLAyoEHR2dXr16EQQxa9asPXv2MCxDgiA6YW86duzYmjVr+Hy+tra2q6vrkCFD9PX1a2trs7Ozb968WVhYiLwZGhq+f/+elRRxN+HxeCtWrCBag85Z4wqOFZcvX169evWrV684HM7o0aNHjhxpZmbG5/NfvXp148aNgoICgiAmTZp0+PDhfv36tZ32BnQWRAAAtAfQZ1dTU9P2lQH05ZggiJkzZ4o6OqzXEfPS++STTwiC6N27N/lhTk4OWrGxlZ8ODHlnIyIiQpI3vFtLEERaWpokb2iZ/vbtW8pzvGns6Ogo6jRDR9shKCgIlb+rq6tMASdOnIgCXr9+XdSZOHfuHHpxFxeXoqIiimtTU9Pvv/+OPGhqarKVKI/HQ3HyeDxRK9E5a1yRsQKfeZkyZUpOTg7dw/nz583NzQmC6Nq16927d9tOewM6CaC5CgAAoH3z7t07tD9pb29Pft6nT5+ioiJln57tGHA4HFdXV/Q7KipKkrfr16/j31K8RUdH29vbo+UdmXHjxsXExBw5cuTatWts5BpoIS5dusTj8W7fvj158mSi0yAUCn/44QeCIPT19S9evEg/7Kqqqrp27VpfX1+iw9E5a1xu/P39//e//xEEweVyr1271qdPH7ofT0/P+Ph4CwuLiooKV1fXp0+fUjx05vYGtAAg8QIAALRvSkpK0A8DAwOKk6mpqXwqQzohbm5u0kXZnI8YGRlJ9/b8+fP8/PwpU6aIdXVycvL29u7WrRtLuQZaAj09vRUrVuB9v07CkydP0NH9zz77TEqLXbt2LYfDIToWnbPG5ePevXtICrW1tT127JiUxmBpaRkaGoou7Hz55ZfV1dVk187c3oAWACReAACA9k1TUxP6oaqq2tp5acd8/vnnaCGVn5+flZVF9xAdHU0QBD689+DBg5qaGknesPwMAO2Uly9foh/Sv5qZmZlJuZYJdGxEItH3338vFAoJgti9e7e6urp0/+PHj586dSpBELm5uUjVIgbaG6BUQFdzp6O2tvbWrVuxsbFIK4ORkZGdnd24ceNsbW2ZBFFXV+/Ro8fEiROdnJzoy+vS0lJ0dRDj4OCgoaFRUVERHBycnp6ura09aNCgr7/+WldXF/vJyck5c+ZMdna2lpbWyJEj586dSx7vlBEn6y9YVVUVGhqalpZWW1trbW3t4eFBOV/KnKSkpIiIiFevXmlpafXp02f27NlWVlZMAqampkZHR+fm5tbW1hoZGTk4OEyZMsXExERKkKqqqsjIyCdPnpSWlqqoqJibmw8dOnTixIndu3dnmNuXL1/iDUaMvr6+nZ0dcsJ6JsrKyh4+fIj9cDickSNH0iN89uxZVFRUdnZ2VVWVkZHRoEGDpk6d2qNHD+npqqurDxs2DD0/f/58bm4un8/v3bv3zJkz0XM53oWVOMnU1NTcvXv36dOn+fn5fD4fldLkyZPFdj2GpZecnFxfX//8+XP0/N27d2Rv9vb2WlpachQvjhn/7d69OzqolpmZefHixby8PIFAYGZmNmLEiC+++ELZnTQxMfH27dvZ2dm1tbX6+vq2traOjo4jR45UUWHzo62RkdHIkSNRAUZHR9PrJSoqSl1dffHixYcPH/7vv/8aGxv//fffGTNm0L116dJlzJgx5IeSiojFUUXuoYNhq3jz5g3SPUNGS0uLkitUgCNHjiTvw7x+/frt27dkb5988gneLW+xKpYDSR1BkYrLzs4mK93p1q0beQVfVFSUn5+P/+ro6AwePBhJCO/evaNkD+fn+fPn5eXlZCczMzNLS0uCDTIzM6V7ePbsmRRX5jMs8/zExMRkZmaWlZWpq6ubmpo6OjpOmTJFU1NTwaFMeo2zOHXKNy9IyV58fPyVK1dev36tp6c3atSo2bNna2trsz5W0ImIiEhOTkYnjKZPn84kyKJFi9C1Dn9//x9//JGeTwXbGwCIp7UvEgMtCo/HMzY2Rivmnj17khcc/fr1279/v1AopAQJCAhAQVRUVCwsLPDNCltb2xs3bkjSC4LJy8u7deuWvr4++aGRkdH9+/dRkJ9//pky7VlYWGRmZio1TtZfkH6a1MfHR9baKSsrQzMuhQ0bNggEAikqJXJycvBdo27dullaWqLvrBoaGuvWrWtoaBCb3J9//onEDxUVlR49emDZmMPhODs737lzh+JfbAbEKtJ0dnaW5IShq53Iy8vD86Wenp6VlRWS1lRVVb29vaurq6Wka2pq2tTUtHbtWnpCX3zxRXl5OZPyVzxOSXVUUlLi6emJP34bGhpaWVlhywozZswoLi6WnhlJpSd9Rfvs2TP5ipceM5fLbWhoWLJkCSUJAwMDpXbS/Px8bO9HT0/P0tISl1v37t19fHwkNW/5+OmnnyRpNuLz+To6OhMnThSJROiyGUEQK1eupHirq6vT0tLy8PCgPBdbRGyNKnIPHTK1Clw4ZGxtbcl+Hj16hJ4/ePCA/HzDhg2UgGfOnGn5KpZDcxW9I9Bjk7Xi5s6dS3al6KXz9/cnu9rb26PnXC6XXv44PzNnzpSeqBw8fvwYx3bhwgX5IpFphm1Wc1VwcLCNjQ1yVVNTs7S0xDOXsbFxSEgIPTaZhjLpNS7f1CkJOeYFsdnj8/menp6U17GwsBCrWk/usUISX3/9NYph1qxZDINUVlbidKOjo9ltbwAgCZB4OxF4Db18+fLCwkL08N27dxs2bMDf0fl8vljFpCtXrsR68549ezZp0iQ03B8/fpzsPzs7O+gjDg4OKGBkZKSmpuaUKVP27t37+++/41sxenp6b9688ff3V1VVXbBggb+//86dOwcNGoRc7ezsGhsblRen3C+YlZXF+wiyQYLU8WtoaEyePNnf35/H4y1dulRN7f8enQgODmZeOzU1NcOHD0cBJ0yYEBUVlZeXl5aW5ufnp6ent2XLFklTUXJyMlpPWFtb47m2urraz88P7bFMnjyZ/uJHjhxBM/S+fftqampwY8BLefpqSWwG7t+/z+PxXFxcCIIYPnw4KpzLly9jp127dqEIhwwZwiNx7NgxcjypqakofgsLi2vXrgkEAiRjBAYGon0/BweH0tJSSro8Hk9PTw/latOmTXp6env27ElLS8vLy4uKinJ2dkZJDx8+HL+jFBSPU0odoVCenp65ubnoYX19fVhYGNoTsLW1rayspGem2dILDQ3l8XibN29G3hwdHcnesFgua/EivZpBQUE///wzXldxuVwNDY2FCxfu379/x44dvXv3xstEJXXS6upqa2trgiBGjBiRlJSEHgoEguvXr/ft2xcFqaioELEHsgWFvinU1taSnW7dukUQxO+//y4SiW7cuIG8WVpaUmJAqq0CAgIoz+lDB5Z4FRxV5B46ZG0ViYmJPB5v3LhxKK0VK1bweDwsuCLWrVsndgBJSEjg8XjfffcdQRCzZ8/m8XjZ2dktX8VySLyULkaWf+SuuJs3b5J7N0XiTU1NRdFSJN47d+7weLyvvvoKPe/atevhw4fxmB8dHc3j8QYMGEAQxKZNm3g8XmxsrILF1djYiLWvqaurb9u2raysTKYYZJ1hm5V4kWDfrVu30NBQPFbk5ORgy730rifTUCa9xuWbOiUhx7wgNnvz5s0zNjZet25dYGDgnj17sB27vn37Ur4WyT1WSAF/wvjpp5+Yh0JljiRtFtsbAEgBJN7OwqFDh9A44uXlRXf99ddf6RLv4cOH0cMlS5ZQ/NfX148YMQJtBVC+5VO+N1tbWx85coTs5OXlhZyWLl3arVs38gfR+vp6PBxfvXpV2XGy9YIHDx4kO509exY5OTg4iBizevVqvPqh7LQnJiZqa2ujlRNlKqqsrETrRV1d3ZcvX0qqVspU1NjYiLb3Fy5cSM8JMoTIUOIViUT79+9H0yd9n5ChfZ3Kykp0LktbWzsrK4vi+s8//6AY3Nzc6GcQUK7U1NS0tbUTExPJTgKBAO9frVmzRsQYueOULvGOGTOmqamJ4pSUlIS+N61fv15u60R45UTfjlCweHHM1tbWpqamGRkZ2OnNmzc6Ojp4maiMTnrgwAH0EC8HMdnZ2WibhSIOCYXCU6dObd26lZxV5ggEAkNDQ/rmg0gkQqpZ0LYJshVJ30hHV9rI0iwdXER0P/KNKnIPHfK1ivPnzyOn7777jv52+Gxkz5496c0JSQXkqpGjilvFOpH0LiZfxTXbuykSL6K+vn7o0KHIadeuXWSnyMhIsdOZIpw4cYIgoampOWfOnHPnztElMTpyz7DNSrxRUVH05Dw8PNAh8Hfv3tFdZR3KxNa4fFOnJOSeF8jZs7KysrW1LSkpwU58Ph+3EPT1WcGxQgrkY/ZiN9glMWHCBBRqypQpbLU3AJAOSLydgsrKSrRtpaGhIfacDJ/PRwexsMTbbJDbt2+jIWnYsGFSVgDjxo2jOJEvYKxevZriivT4EQTh6+ur1DjZesGxY8fSXXv27Ilcq6qqRAwoKChAJzzV1NRev35N97BmzRoUIWUq2r59O3oudl5saGhA2786OjrkVSO+JPPzzz/TQyUmJjKXeNGXZg8PD8rpAJlkNnxaUtJawcnJCXmIjIwUmytJYfPy8lDBqqqqvnnzRlIG2IpTksSbmZlpaWlJ2Q3DfPbZZ+hIHl1CYEXiVaR4ccwEQZw9e5biumTJEicnJ+V10tmzZ6NOgbYfKUybNo0uDvn5+aF49PT0xPbrZsF7aJQvGgMHDuzRowf+ixVTHThwgOytf//+dnZ2UuJnIvEyH1XkHjrkbhUfPnxA0r6ZmRl90UxerSYkJFDi7NWrF+UUtBxV3JYlXpmmA/kkXrS3jDbhVVVV4+Li0MM3b94YGRn169ePyXkWmdi7dy/eqcaoqal99tlnhw4dohtNVXyGlSLxfvPNN6NGjRKb4oMHD1CoP//8k+4q61AmtsblmzolIfe8QHmdW7duUVyPHTtGH07lHiukvwLOBkW6lg7uMiNGjGClvQFAs4Cu5k5BSEgI0gLv7OwsVpWRpqamm5sb+fYRDjJ+/HixQVxcXNDBm6SkJHwUkM78+fMpT/r164e3R+iuWCcQsi+qvDjZekF8iUVsilj3oHRCQkIEAgGSEywsLBimIhKJjh49in5TLoYh1NXVkYnR2tpabNidrNH3ypUrKF0yQ4cOTU5OXr9+vfQ8C4XCFStW7N69e/HixefPnxerMoQJ+JwYQRBz5swR6wcLIfioAh16vaNDp2jhLhAIQkJCZM0bW3Ha2dnl5eWJrSPUepEWHIatpVWKt1u3bvTbX3/99VdMTIzyOilqqE1NTWLtAAUEBCQnJ6NVNeb+/fvoR3V1dWpqKiE7WJRFKpcRBQUFGRkZZINDYk0ZvXr16tmzZ5LsEjGH+agi99Ahd6vQ0dFBqlaLiori4uLITmiQ8fb2Rn/Dw8PJro8ePXr9+jUScRWp4rYMK9NBs/Tr1w9VikAgmDdvXmVlpVAoXLBgQVVV1ZkzZ8jK4VjB19c3OTl5zpw5ZC1iTU1Nt2/fXr16dY8ePb766qsXL15QQrE1w1IIDAyU5Blr/5Iem6xDGRlWpk525wUTExO6CaVPP/0U/SBrVpNvrJAOWVmaTA2vS5cu9BgUaW8A0Cwg8XYK0A008jhIJywsrKKiAsstOAg+bUhBRUUF39nDH2vp4NM1GA6Hgy2t0VWPYmVaFENtrMepvBdEux/oR1VVFcEAPNeKVV+MXopugC49PR2dKdLQ0BCbDYIg8A1J8nRuY2ODyuTRo0cTJky4d+8eOYiqqqq9vb1Y/b2YhoaGuXPnBgYGrl69+sSJE4oYxUlPT0cakjkcjiQdyLjdxsTENDY20j1wOBxJamxxkeIdAIYoI040cxcWFj5//jzr/4Et3NC1XisOK8WLzmTSv7tLgZVO6ujoiH7MmTNn9+7dZPW26Nysvb09RZcvFkSNjY3lU6mNPhIh5bd4rYlu55INDmGx9t69e7W1tZK8yQfzUUXuoUORVoGFZIpMe/78+f79+2/fvh2liM8/k+VhioAtRxW3ZViZDpiwZMkSVJL5+fnffPONn5/fnTt3fvvtNzxnscvAgQPPnj1bVFR05MgRV1dXsgUaoVB49uzZwYMHUz7/sTXDSqGysvLly5d4IMV75tIHUlmHMjKKT52szwtiOziLYwVDwRWdEGQeEHsW+z1LjvYGAM3SbiYSQBH+++8/9IO5AnomQbDOwIyMDEl+yOqgMWj80v4IxQkrKqR/QGU3TrZeEB0bpoBNwkh5CzLYugy6lEtHU1OTPjHgA0U6OjqHDh36QxxJSUnIT3p6Og6oqqqK7eDFxMS4uLhYWVn98MMP9+7dY5LhDx8+TJs2DS1na2trFbQFjyvCxMSEYkqHXhF1dXV4WUNGX19f0iYzNiwh1sKqFNiNs7Gx8ejRo6NHj9bV1e3Ro4etrW3//8fff/+N/JBtTrAFK8WLgsuULiuddOXKleiTTW1t7ZYtW8zMzNzc3AICArDRJjqrVq26cuXK/v37nzx5gm/kyoSpqSmWW5AEizZyVVRUkLodRN++fVEzqK+vxwvfqKgobW1trNtJbpiPKvINHQq2imnTpqFQ58+fx4dvnz59mpubO3v2bDMzs7FjxyJh7MmTJzjU+fPn+/btiwztKFLFbRlWpgOGBAYGojoKDw/fsmXLlClTfHx8CGXSvXt3b2/v6OjosrKy8+fPz507F4+Q9fX1XC43NjaW9RmWTnp6+tKlS3v06NG1a9c+ffrggRQLctIHUlmHMjIKTp3KmBeUPVZIh5y6lF0KOlgUl2LPSab2BgDNAvZ4OwVlZWX0D3KKB8GDI+XDvNiFrExO0mElTqW+oKybEhUVFc1mRktLi7JFgF+hoqIC6cuRQmlpKfnv/PnzDQwMfH19kcyWn5/v/xETE5MlS5asW7dOkrTA5/MnTpyYmJiop6dXXV39119/ubq6Uk4qyoRMFYHqAitxxUg5Uy3l9JR0WIyzuLjY1dU1JSWFIIjevXu7ublZWFjg79aXL1+mnA5lEVaKV3ppKK+TampqxsTEbNiw4cSJE00fif6It7f3hAkT1q9fj/djyUz7CKEAU6ZMQdfkoqKiVq5cKRAIbt26NXr06K5du1K8obPB165dc3Nza2pqunXrlouLiyQZkjnMRxUFhw75WoWurq6bm9s///zz5s2bR48ejRo1Cm/hoqFg9uzZ6PhDeHg42it+/Phxfn4+VjCrYBW3WViZDhhiYGAQFhY2btw4JNVs3LhRwY+PzOnSpYvnR96/f79z505kTkkoFP700083b95kd4alcPjwYR8fH4FAoKqqOmXKFAcHB319ffTitbW1WCGzFOS+gKPg1KmkeUHZY4V0TExMdHR00CGX169fMw+ILXtjW1MKtjcAaBaQeDsF+AwP88+QTIJgJ/KZk/ZCm3pBOSqInCsLC4srV65I90w/eDxt2rSpU6fev3//9OnTFy5cQGuOkpISPz+/48ePX7lyBS1kKVRWViYnJ1+8eJHD4SDlE998883IkSOlG4ZlqyLkqAtlVKKscc6bNw8ta5YtW3b06FHKmbrCwkLlSbzKLl5l07Vr14CAgJ07d549e/bMmTPoo75IJPr3I1wu98SJE6xLFFOnTkUasG7fvt3Q0JCYmFhZWUk/q+zm5oYkXnTjNz4+vrq6Gt1xbTHkGzoUbxWzZ89G+pzDw8PRQEHewvX09ET7jeHh4agkyfJwW6jijsGQIUN69OiBJI1Vq1Y9fvxY8a8tMmFkZHTgwAF1dfXff/8dnfBvbGxErUUZM+z9+/dXrVqF2sy///5LOcJdWVnJROJVHPmmzlafF+QbK5qN09nZGV3CT0tLYxiqoaEBbzhPnjyZlfYGAM0Cs0inAJ88Yf71Dgch2wqngJ3Enqtp47SpF8RfhaVk5sOHD5QnOFdNTU32zYEv9JLhcDjOzs4BAQFFRUXR0dFYn0dpaamHhwe+nUhGXV09Kipq5syZM2bMQLYWKysr58+fL/ckKlNFSKoLsVmlhJX1jCtbcaampt65cwftyRw8eFDuK2StWLytTvfu3VetWvXgwYPXr1/7+flhtSvBwcF//PEH68mNHj0a7T59+PAhNjYWrefo+qgmTJiAFlvZ2dk5OTmSvLXloUPuVjF9+nS0V4ZuN6SkpGRnZ2OBtmfPnqNHj0Y2h9Bu+fnz5/v06SNJ3UDLV3GbQuzgWVdX12zAVatWvX792tbWFp31RQa0WKShoeHGjRvNaoDDJ4waGxvxYSJlzLDYltWGDRuUdGOZIXJMna0+L8g3VjQLNtd39+5dhkFiY2NRm9fW1iar3VKkvQFAs4DE2ynAOkikKECWIwhWA4gM67Uv2tQLDhkyBP2QpIGwqqqKPhXhVyguLmYyxUpBTU3N1dX1woULsbGxaJegqKjoxo0bdJ+GhoZ4itq3bx/a0omLi5P74zp+i/KPSK8IIyMjbLmeTE1NjaSvOfhbMi5khrAVJ75K/emnn9Lvr6LtLEJpsFK8bQcLC4sNGzaQhStsb4ZF1NTU8JXdqKio6OhosXqwdHV18ZVddBbX2tr6k08+IVoQBYcOuVuFnp4eOm+cn5+fmJhI10pF1m6VmJiYl5fH8O5Dy1RxsyxfvhzZd1UeWMgRO3q/efNGevAzZ84EBQWtWrXqzp07SGI8cuRIREQEizksLy93dXX98ccfpXvr0aMHPluLzCYpaYbFYyk2ndViA6niU2erzwvyjRXN4uXlhRRlvXr1Kj4+nkmQ06dPox/e3t76+vqstDcAaBaQeDsF+KCdlEMykyZNsrKywmsLHESSNlo+n4+tL7avq1Zt8AWR5T10Skesh4cPH9If9urVa+DAgWhqlGKPwd3d3czMDJ0CQmRkZHh4eERGRtI9jxkzZtmyZeh3s8pjtLS0zp49i2brnTt3SrfuIGn+7tWr14ABA9BvSYoocMxubm6S7qqJLSJykeJCZg4rcWK9I5IOX0n54q746oet4m0Vtm7dKtZAlKamJrbLpSQVR/gM87lz5548eeLq6iq2ZLC3oKCgp0+fKq6lucWGDsVbBZZIz507d/78eRsbG7IKbk9PT/QjPDxcypHmVqxi6dy4cYNd6ZEOvhaO7zSSkX6i9eXLlytWrBgyZMjevXvNzc1PnTqFnnt5eYmNTRGePn0qFAqlePjw4UNDQwMy/INtHCpjhpU+ljIZSBWEramTrXmhBcaKZtHW1t6xYwf6vX379mb95+bmouZqYGCwYcMGttobADQLSLydglmzZiF9iY8fP8YaFMlkZmbevn379evXEyZMoARJSkoSe8gkPDwcHbvy8PBo4W0NVmhTLzh37lz0pTM1NfXRo0d0D4GBgWIDrl27Fv04fvy4WA9ZWVlXrlwpKSnBR4/QyauIiIhLly6JDYK/uTKxsmBnZ4fOHAqFwvnz59P3i/AnWLKBk6tXrw4dOtTLywv9xYfxTp48SU9CIBBgrZVSju0dO3aM/jAuLg4pqdbX15dk9lAKrMSJFTsnJyfTjy8KhUIpXwqYlF6zsFK8rcKDBw/CwsLEruB1dXXR1XRKK21qajp8+PCaNWvwFop84MPJ+fn5IpFIkiiLvaG1ewtf4lVk6FC8VcyYMQPttAQGBj5//pwi0Pbq1QvdZnzx4kVgYKCVlZVY23hyVPGHDx9+/QiPxyPaM7q6uj179kRFhOzMYUQi0eHDhyUFbGpqmjdvXmNj49mzZ9HZcjc3N3TUs7y8/Ouvv6YLDIoUWllZGcUMFQXs6u7urtQZFo+lWFQmw/xUrdywOHUqMi+08FjRLMuXL0e2fG/duoUNfYulrq6Oy+U2NDSoqKicO3dOrN5s+dobADSPCOgc3LlzByn/GD9+fENDA9mpoaEBLU2WLl0qNsjo0aP5fD7Z6e3bt2hMNzQ0fP36NT05pNOIIIi8vDy6K9JyZGBgQHfC6gSdnZ2VHafyXhBbibh7966IGXiesLOzKy0tJTsFBwfr6+sj4cfU1JTsJBQKseKHixcvUuKsqalBB5m8vLzIz9HKQFtb+7///qMEqa2tRTd+u3btWl1dTXYyNTWlZwDx5ZdfojzMmjWL4iQUCpFmyCFDhuCHmzZtIrc3gUCAD5FevnyZEgM+L71+/Xp60ihXOjo6+vr6wcHBZKeSkhJ0w40giKNHj4oYI3ecYouIz+ej52gnnBJk586deDSmtxYmpScSidBVSYIguFwu/XUUKV7pMdNht5M6OzvTWy8CG2PctWuX2NfR1dUtLCwUKQDeBUVqaSR5w6tbDQ2NmpoaRYpIvlFFvqFDkVaBIevEfvLkCcV179692HXt2rViY5CjinNzc9FzJycnkYzgQ0yurq7SfaK2yrAjyD0dLF26FDktWrSosbERPWxoaPjuu+/wwV17e3tKKDQC/PXXX+SH9fX1+OD9L7/8QgkiX6EVFRWhUF27do2PjxfrJz4+HtnZ1tTUzM7OZmWGxWI5j8cjP8c3ui0sLN6+fUuJEN/9pi8e5BjKxPqXb+oUiyLzQrOvI2nNI99YwYS6urrPP/8cd1jKIhORl5eH+ruKikpgYCDr7Q0ApAMSbyciJCQEnZ8ZPnx4RETE69evnz9/Hh4ejq5iDh8+vKqqSlKQYcOGRUREFBQUvHz58uTJk+jLtLGx8cOHD8n+c3JyuB/p1asXGrk8PT25XO7p06dFIlFSUhJy1dXVRYd50N8HDx6IRKJLly5xudx58+ahgKampsj12rVrrMeZlpamjBcUiUTI1c7ODq+ruFyun59fs7UjFAqXLFmCQpmZmW3bti0sLCwgIGDGjBkEQYSGhqLZUUtLCyWBJbHy8vLx48cjbcyrVq1KSEgoLCxMTU09duwYWrQ5OTlRFuL4W7ipqemhQ4cyMjJKSkqysrLCw8PRfSo1NbV//vkHeb5x4wZKEV1Swhm4ceOGSCR6+PAhl8tFmUTMmDGDy+WSpUH09RcpoSkoKIiMjEQz1r1797CfsrIyZMNTTU1t8+bNqampRUVFCQkJXC4XhfXy8sIrQrFCJtqScnd3DwgICAsL27p1K15PLFmyRCgUNlsFcscZHBwstohwq4iIiMDnQt3c3E6fPh0fH3/p0iVPT089PT304pJai/TS8/X15XK5+FO3jY0NSprL5ebk5ChSvPv27RMbs6+vL73ElNHx09LS0PIIHYi9efNmQUHB27dvHz16tGHDBrS15eTkRFlJk3dZb926JVIAfJ3s008/leINd9vPPvtMircHDx6ILaJffvlFwVFF7qFD7k6HCQ4ORj6tra3prmQrvo8ePRIbgxxVjO8KipWTxZKWlobeHfc1LS0tS6mg7WUpXSwtLU3x6eD58+fYWI6FhYWnp+cXX3xhampqYGCAT2N169YNxXPw4EEulzt//nwOh6Ojo7No0aKNGzeieJ49e8blcnFhqqioLFiwgMvlPnv2TO5CE4lExcXFuAZVVFQ8PDyOHTt29+7dxMTEu3fvHj9+fNasWWhk69KlS3R0ND0GmWbYyspK9KaOjo4oUUdHR/SktrYWSfVIIxoSinbv3n3jxo3Y2Ni9e/eamprigxh4DEGvL9NQJr3GZZo6m0W+eUHS66AikjScoqKQe6xgQlNTk6+vL/rG0adPn40bN166dCk+Pv7OnTunTp2aP38+ugBlYmJy8+ZNJbU3AJACSLydi6dPn+LvcBgtLa01a9ZI2p0QG0RdXX3hwoX0T7OSbpP6+PigsVisa1BQkEgk+umnn8S6Ittr7MZJHitZfEFJly3FfnKmIxAI/P39yYoc0PkoNINiWQuxYsUKHLC+vn7v3r10dZdGRkY7duygrBfR1+i//vrLxcVFrH7I8ePHk1chksrf399fJBKdOXNGrOvcuXNxDIWFhRStP+rq6nv37qXkis/n//bbb0ZGRpSobGxsQkNDJRUaeVv1woUL5ubm5LD6+vr79+8XCARMyl/uOFesWCG9VYhEops3b/br14/iYezYsampqXgLSGxrkV56UoxCJSQkKFK8km7WWVpa0j0ro+NHR0enpKR8++23aHFMwdDQcNu2bXV1dZSc/PXXX8hDz549KysrRQqALT1u2bJFijd8xI7epMlIUr80atQoxUcVuYcO+Todpry8HI0h69atE+th+PDhyNaopBjkqGK80Uc/1SIJZD5KDqR0sejoaFamg9u3b2OBGTF48ODU1FR68EWLFlGe2NraokgkHejF24NyFBri9evX+/fvd3V1lWTE1cDAYPny5QUFBZJiYD7D4i0+OhUVFchPdXX1ihUrKHdfdXV1d+3aRVfbi15fpqFMeo3LNHUyQY55QdLroCKSNJziliD3WMGQrKwsLpeLPstS6Nevn5+f34cPH5Ta3gBAEpxW0W4HtC4lJSUJCQlFRUUcDsfS0tLR0ZEy/EkJoq6u3qNHj7Fjx0oxYt4eaTsvWF9ff+/evfz8fC0tLWtr6zFjxjC0RSkUChMTE7Ozs8vLy/X09GxtbYcNGybdVN2HDx/S0tKys7OrqqrU1dXNzMyGDRsmdvWpICKR6PHjxxkZGXV1dSYmJuPHjxd7gQe9xePHj3NyciorK42MjAZ+RErMZmZmxcXFpqamaLUkEAji4uLy8vL4fL6lpaWzszPeQmGOMuJEhZCcnJyWllZTU2NoaDhixAgbGxt2S69ZZC3eNkJubi7aTuHz+fr6+ra2tg4ODpLa9oMHD168eDF9+vTu3bsTnQlFho5WbxXMq3jUqFGPHj2ysLDIy8ujmxlvjzQ2NsbHxyOdxv379x8zZgzrSSheaAKB4OXLl1lZWaWlpTU1NVpaWgYGBv0/wsSyDrszbFlZWVxc3Js3b9TV1Xv37u3k5NTChohZnDrlnhdaZaxgiFAoTEpKevXqVUlJiZaWVvfu3QcOHIjudbdMewMAOiDxAgDQjqFIp202TgAAFOfEiRPo7uvp06fx0U1AOlBoAAAAoKsZAAAAAIC2zoULF7y9vQmC2LhxI0huDIFCAwAA+D/X7Fs7AwAAAAAAAM3w7t07Dodz8ODB1atXt3Ze2g1QaAAAAHCqGQCAdklZWVl1dTXSMV5aWmpsbIwsNOrr64vVmdFacQIAwCLv37+n69kCpAOFBgAAABIvAADtj5UrVwYEBNCf+/j4SFIu3SpxAgAAAAAAAK0LnGoGAKD94e7uTjEahMCGHNtInAAAAAAAAEDrAnu8AAAAAAAAAAAAQMcEdDUDAAAAAAAAAAAAHROQeAEAAAAAAAAAAICOCUi8AAAAAAAAAAAAQMcEJF4AAAAAAAAAAACgYwISLwAAAAAAAAAAANAxAYkXAAAAAAAAAAAA6JiAxAsAAAAAAAAAAAB0TNRaOwOAcsnIyFi6dKlYp759+/7999/479SpU8vKyih+vvrqq++//17JeQQAAAAAAAAAAFAKIPF2cJqamioqKgiCePXqVV1dHXpoaWmppaVVXV1N9llVVVVRUSEUCl+8eMHhcPr160cQBA4CAAAAAAAAAADQ7uCIRKLWzgPQEpw5c2bevHno9/fff3/gwAGx3g4fPrxq1SpfX9+9e/e2bAYBAAAAAAAAAABYBiTeToSnp+fFixf/T61zODExMWPHjqV4ePHihb29vbW1dVJSkqamZitlEwAAAAAAAAAAgB1A4u1ElJSUDBgw4P379+gSb0pKira2NnYVCAROTk6JiYmPHj1ycHBo1ZwCAAAAAAAAAACwAOhq7kSYmJgcPnwY/X7x4sXWrVvJrr/99ltCQsL//vc/EHcBAAAAAAAAAOgYwB5vpz7bHBsbO3r0aIIgUlJSRowYMXTo0Pj4eFVV1dbOIwAAAAAAAAAAAAuAxNvpePfunZ2dHTrb3K9fv5SUFBUVleHDh7948SIlJQWpaAYAAAAAAAAAAOgAgHWiTkf37t2PHDkyd+5cgiCeP3++bds2VVXVtLS0Q4cOgbgLAAAAAAAAAEBHAvZ4OylffvnlhQsX0NlmDoczYcKEmzdvcjic1s4XAAAAAAAAAAAAa4DE20l59+7dgAEDSktL0d+srCzY4AUAAAAAAAAAoIMBupo7Kd27d/f398d/eTxeq2YHAAAAAAAAAACAfUDi7bzcv38f//b394+NjW3V7AAAAAAAAAAAALAMSLydlKioqMDAQDc3t+7duxMEIRKJFi9eXFdX19r5AgAAAAAAAAAAYA24x9sZKSsrGzhwoFAozMjIuH//vqenJ3r+/fffHzhwoLVzBwAAAAAAAAAAwA6wx9sZ8fb2LioqOn78uLGx8RdffPHVV1+h53/88ceDBw9aO3cAAAAAAAAAAADsAHu8nY6zZ89+9dVXXl5eJ06cQE/Kysrs7OxKSkoIgrCxsUlNTdXR0WntbAIAAAAAAAAAACgKSLydi7dv3w4aNEhPTy8tLU1fXx8/v3Tp0qxZs9DvNWvW/PHHH62XRwAAAAAAAAAAAHaAU82di6VLl5aXlwcFBZHFXYIgPDw85s+fj34fPHgwJiamlTIIAAAAAAAAAADAGiDxdiICAwOjo6N9fHwmTJhAdz106JCpqSn6vXjx4traWrqf8PDw77777tq1a8rPLAAAAAAAAAAAgKLAqebOQm5u7pAhQywsLJ4+faqtrS3Wz+XLl2fOnIl+r169+uDBg2TXyMjIGTNmoN8xMTFOTk7KzzUAAAAAAAAAAID8qCkQFmgHPH36FF3KffTo0YcPH7p27ert7U0QxPbt2/v06YO93bx5MzQ0lCAIPT296upqtOX7/v17dXX1iRMnLlq0iCCIhIQE7P/hw4cg8QIAAAAAAAAA0MaBPd4OTkREhIeHB/15QkLCqFGj8N8//vjj+++/FxvDihUreDwelnKbmpq0tbWTkpL69++vzIwDAAAAAAAAAAAoCki8gAxkZmbGx8e7uLjY2Ni0dl4AAAAAAAAAAACaASReAAAAAAAAAAAAoGMCupoBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHBCReAAAAAAAAAAAAoGMCEi8AAAAAAAAAAADQMQGJFwAAAAAAAAAAAOiYgMQLAAAAAAAAAAAAdExA4gUAAAAAAAAAAAA6JiDxAgAAAAAAAAAAAB0TkHgBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHBCReAAAAAAAAAAAAoGMCEi8AAAAAAAAAAADQMQGJFwAAAAAAAAAAAOiYgMQLAAAAAAAAAAAAdExA4gUAAAAAAAAAAAA6JiDxAgAAAAAAAAAAAB0TkHgBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHBCReAAAAAAAAAAAAoGMCEi8AAAAAAAAAAADQMQGJFwAAAAAAAAAAAOiYgMQLAAAAAAAAAAAAdExA4gUAAAAAAAAAAAA6JiDxAgAAAAAAAAAAAB0TkHgBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHBCReAAAAAAAAAAAAoGMCEi8AAAAAAAAAAADQMQGJFwAAAAAAAAAAAOiYgMQLAAAAAAAAAAAAdExA4gUAAAAAAAAAAAA6JiDxAgAAAAAAAAAAAB0TkHgBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHBCReAAAAAAAAAAAAoGMCEi8AAAAAAAAAAADQMQGJFwAAAAAAAAAAAOiYgMQLAAAAAAAAAAAAdExA4gUAAAAAAAAAAAA6JiDxAgAAAAAAAAAAAB0TkHgBAAAAAAAAAACAjglIvAAAAAAAAAAAAEDHRK21MwC0A65fv75nzx7yk7Nnz5qamrZejgDW+OKLL8rKygiCuHv3LltxRkZG7tu3jyAIX19fd3d3/PzDhw/Tpk0jCGLo0KH+/v5sJdchwWWFoRQm0JLU1taeOXPm7t27RUVFWlpaZmZmw4cPd3V1tbS0bO2sdQqgO7AITOjsUl5ePmvWLLkb54EDByIiIvBfQ0PDixcvEu0HaE5AewEk3g7OixcvFi5cKHfw+/fva2ho1NTU5OXlEQRRUlJSV1dHEASfz2c1m0CrERcXV1xczG6cb9++vXfvHkEQ8+bNIz9vampCz4FmEQqFqNNVV1ejTxKUwgRajJSUlOnTpxcUFKirq9va2hIEcfXq1WPHjhkYGFRUVLR27joFCnaHyspKd3f3lJSUvXv3fvPNN0TnBiZ0dhEIBIo0ztLSUhT89evXQqGwJWXFtrA+PHXqlI+PT//+/a9evWpoaCh3ZgCgeURAhyY5OZlQAD6fT45t5syZ6HleXl7rvRPAJnh+ZTFOHo+H4uTxeOTnWDxwdnZmMbmOjaTCBFoGPp/fu3dvgiD69ev38uVL9DApKUlHR8fAwIDP59/9SHp6emvntFMgX3fAoQwMDNjKSQeoepjQ29RYjeZiU1NTUWdaH+IViL+/vxJeEQD+P+Aeb6dg+vTpfBoLFixArr/88gvdtW/fvq2dawAAgFbmwoULr169Ighi48aNVlZW6KGDg8MXX3xBEERRUZHLR7Zs2dLaOQUkMmDAAPTDzs6OrTih6oGOQeuuDwcOHMh63wQAscCp5k6BqqqqpqYm/SH6oa6uTndVUYGvIUA7oKysbPPmzQRBeHt729vbt3Z2gI5GTEwM+jF06FDy86NHj+7btw+d4gPaOOPGjYuJiUlLS/vqq69aOy8A0LZo3fXhpUuXTp8+3bdv34kTJ7IVJwCIBSReAADaMdXV1QEBAQRBuLm5gcQLsM67d+/QDwMDA/LzLh/Jz89vpXwBsuH0kdbOBQAA/3/o6emtWLGitXMBdApA4u3gGBkZrVixgrI7wYS5c+cWFxfj73xA56SioqK+vp4gCA0NjW7dutE91NXV3bx5Mzs7G110nDx5soaGBvP409LS4uLiysvLzczMPvvss169erGafeD/8PTp0/T09Lq6OisrKxcXFw0NDZFI1NDQgD7kq6nBLCCNpqYm9AMGQwAAOhKwPgQ6FbDW6eBYWFhgbQoysWPHjmb9VFVVhYaGpqWl1dbWWltbe3h4SN9kS01NjY6Ozs3Nra2tNTIycnBwmDJliomJiUwZS05ORjIYonv37n369CEIIj4+/sqVK69fv9bT0xs1atTs2bO1tbXFxlBTU3P37t2nT5/m5+fz+Xx9fX07O7vJkycjLawUSktLc3JyyE8cHBw0NDQqKiqCg4PT09O1tbUHDRr09ddf6+rqYj85OTlnzpzJzs7W0tIaOXLk3LlzdXR02C2ZxMTE27dvZ2dn19bW6uvr29raOjo6jhw5ksXjRtevX/fw8ODz+QYGBtHR0Y6OjhQPgYGB69atq6qqwk9MTU1DQkKYRP7u3buFCxdev36d/PDrr7/+888/u3btSrQ2mZmZMTExmZmZZWVl6urqpqamjo6OU6ZMoZ/vktJIZOog1dXV//zzz+PHjysrK83MzMaMGTNt2jR1dXVF3uLhw4fLli1LT0/HT4yNjQMCAnr27Ilqc8WKFbKODzKVjKTempmZefHixby8PIFAYGZmNmLECHQtVhkjBoVnz55FRUVlZ2dXVVUZGRkNGjRo6tSpPXr0kFSnSPkq+nBQVFSEfhsZGamqqpaUlBQWFqInZWVlDx8+xME5HM7IkSMVeSPFBzoKfD4/JSWF/GTw4MHkcSkxMVEgEOC//fr1o3/kqqqqioyMfPLkSWlpqYqKirm5+dChQydOnNi9e3dJ6VZXV1+/fj0hIaGkpERbW7tXr14TJ04cPXo0h8ORklu2uoOkvqlIt3358qXyql5Srvh8/vnz558+fVpSUqKnp2draztz5kx8sRxTW1t769at2NhYpIHfyMjIzs5u3LhxYmc3CszHK5nmULYac1JSUkRExKtXr7S0tPr06TN79mz0+klJSY2NjdibiYmJtbW1gi1Q1hcUS2Nj49WrV+Pi4oqKigwMDEaMGDFr1iw9PT2GwVEzozzU1NTEAqpIJHr06BHFw/Dhw5kLoq27PpTUKlp+qQN0FkharIDOBZfLRW3Az8+PYRCyLr5bt25RjvkRBOHj4yM2YE5OzuTJk5Gfbt26WVpaorWLhobGunXrGhoamGebYgCTy+Xy+XxPT09KTiwsLNLS0ihhS0pKPD098bLJ0NDQysoK70nOmDGjuLiYEiQoKIgSM3p3fX198kMjI6P79++jID///DNlyrGwsMjMzGSrZPLz88ePH4+C6OnpWVpa4lfo3r27j4+PTOUpSVfzpUuXUE6MjIySkpLoAX/++Wf8ghoaGmZmZuit1dXVsf0PSbqaR48ePWzYMPTb2NiYXJgjRoyorq5mnn9kFwFdBxKxQXBwsI2NDYpTTU3N0tISr0qNjY1DQkLoQSQ1EuYd5MKFC8bGxhTPNjY2qampcuv/vHPnDnm/nSyRbtq0Cf1YsWKFUkuG3lsbGhqWLFlCeVO6Bl0WRwxMXl7e9OnTccexsrLS0tJCm7fe3t6UVkevUzJz586VfhJPU1NTwTdSZKATy7Nnzyhhk5OTyR4ozZXeof7880/0XU9FRaVHjx649jkcjrOz8507d+iJHjx4EH3AUlVVtbS0NDIyQkHs7e0TEhIkZZXF7iC2byrYbZVa9WJzFRcXRzdaQ9dty+PxULlxOJyePXvi0kbfL/bv3y8UChWc0OWYQxVvzGVlZWK/iG3YsEEgEFBKhjKmydoC5XtBXP7IG4/HS0lJoQjeaJy8cOECQ13NYpuZpaUl9i/WCFBFRYWonawP6a1CqUsdAACJt/OiyIh2+fJlDQ2N8ePH+/n5+fv7L1iwAMt4wcHBlFDJycloGra2tsarourqaj8/P/SRdfLkyY2NjQzzEBoayuPxkLIiNErOmzfP2Nh43bp1gYGBe/bswar/+vbtSxkQsS5+T0/P3Nxc9LC+vj4sLAztUdja2lZWVpKDZGdnB33EwcEBhY2MjNTU1JwyZcrevXt///13rG5BT0/vzZs3/v7+qqqqCxYs8Pf337lz56BBg5CrnZ0d/R3lKJnq6mo0j44YMQILogKB4Pr161h9okxznliJ98yZM6hCTU1NxdreiI2NRaHU1dUPHTpUV1cnEokqKyu3b99OnsMkSbyIzz777Pnz58gpJibmk08+ETsvtrDEixp5t27dQkNDceHn5ORgE4sBAQGUIFlZWbyPDBkyhNxBJk+e7O/vz+Pxli5dig8P0ztIWFgYqm5dXV0/P7/09PS8vLyoqKjPPvvMyMho27ZtYgtTOpWVlVggWbBgATKrU1VV9ccff2hqauLNDZkkXjlK5vz580FBQfjjCPcjGhoaCxcu3L9//44dO5DhH4rEy+6IgUhNTUVN3cLC4tq1awKBAC0ZAwMD0T6ng4NDaWmplDrdtWsXesLj8W7evHn//n0ej7dr1y7kOmTIEOzK4/GOHTum4BspMtCJpby8HOUNH9agSLwnTpzg8XjTpk0T26GOHDmCRKl9+/bV1NSgh+/evfvhhx8kdVv85euHH34oKytDDxMTE9FYqqWldf36dXo+2e0O9HrEEq/c3VapVU+fca5du6alpTVw4MCtW7ceOHAAdzeKxIsFpOXLlxcWFuIK2rBhA94Nk2ROhvmELsccqmBjrqmpGT58OHKdMGFCVFRUXl5eWlqan5+fnp7eli1bUL/W09ND5Y8/PcvXAuV7QYrEu23bNkNDw4kTJ167dg3ldvfu3Wic4XA4Z86cYSLxomY2atQoFOe8efN4PF5oaCj239TUhF4ZqSLfuXMnj8err68XtZP1Ib1VKHWpAwAg8XZeFBnRrK2tf/vtN7LT6dOnkZODgwP5eWVlJRq2dHV1sTVLzK+//opC/fTTTzJlHk9LVlZWtra2JSUl2InP5+NjP5cvX6aHGjNmTFNTEyXCpKQktCxYv359s+9+5MgRspOXlxdyWrp0abdu3ch7HfX19Xi2vnr1quIlc+DAAfQcT8aY7OxstAOjoMQbFBSEisLCwgJLpBRcXFxQqD/++IPitHbtWiYS74ABA5CcjMnNzcV7bnjF1loSb1RUFN3Jw8ODIAgdHZ13794120gOHjxIdjp79qzYDpKfn9+lSxf07YCy5yAUCr/88ku8NyuTxIuFzBkzZlCcTp48iWtBDolXjpLBvdXa2trU1DQjIwM7vXnzBhm2VeqIUVlZic7LaWtrZ2VlUVz/+ecfFKebmxtlE6xZI5O4+c2cOVNK6nK/kXwDHcORnyLxIn766Sd6h2psbESbYwsXLqQHWblyJV3iPXToEIrnu+++o/gvLy83NzdHW17kN1Jed5Bej3J02xaoepyrPn36rFmzBn2jQXz//fcUiReXtpeXFz0qnJAkiZf5hK7IHCpfY169ejUuZ0r3TExM1NbWRl8l6GZs5WuBirwglng1NTW//PJLSm5jY2NRVrt06fLq1SuG9ngjIiJQnJ9//rnYRN+/f6+pqUlvn+1ifUhuFRSJl/WlDgCAxNt5UWREc3R0pLviu3BVVVX4Id70EztJNDQ0oO/fOjo6Mg1eZMvpt27dorgeO3YMOfn6+pKfZ2ZmWlpaSvrC+tlnn6EpkL7qJb/7uHHjpBwXXL16NcU1NDRUbGbkK5nZs2ejM6XkBRAG7c8oIvEePXoUL7Mk2ZEvKChAfrp3707fXKqoqECCq3SJl/ytGrN8+XLkun///taSeL/55ptRo0aJdXrw4AFK688//xTrATeSsWPH0l179uxJ7yBIWpAkfBYXF+PzdTIt8fGGOf2UoFAo7Nevn5REWS8Zcm89e/YsxXXJkiVOTk5KHTGwFCfp+ADW4hsZGcm6xKvIG8k30LEu8WZmZqKHP//8Mz1IYmIipWwrKyvRfUUtLS28tyZ2ObtlyxbycyV1B4YSL/Nu2wJVj3M1cOBAivT1+PFje3t7PITi0tbQ0BB75hbpYpAi8TKf0BWZQ+VozAUFBWh7UE1N7fXr1/Q416xZg0JRBEW5W6AiL4glXkkVsWzZMuTB29ubocTb1NRkYWGBQr148YIeau/evQRBUE4WtJf1oRSJl/WlDgDAzW9AHhYuXEh/iG9mvnz5Ev0gS1Bz586lB1FXV3d1dUX6Ns6dOydHTkxMTOhm3D799FP0g6ICxM7OLi8vT2xO0E0npDgE518s8+fPpwfE+jborrhYkEJjBUsGTf9NTU1RUVH0UAEBAcnJycx1Y1A4cOCAt7c3QRD9+/ePiYmhXLPB4CPNkydPpuuSMTAwcHZ2bjYtfHiSjLu7O/qBJShMY2NjvQSQh4aGBrGuSCkxcwIDAxMSEsQ6YUFRkgfM119/zaSDNDU1YUVfYoOYmJigNZZMFBUVocZmaWmJz9VjOBzOjBkzZI2TlZLp1q0b/T7eX3/9hW3eKmPEwCdyCYKYM2eOWD/YTCveF2ILtt5IpoGOdfChxCtXrpC1WyGGDh2anJy8fv16/CQkJKS6upogiEmTJonV8Y57+okTJ/BDJXUH5jDsti1c9UuXLqUohhg+fHhycjKea3BpOzs7i9WCpqmp6ebmRr9XKeuEztYcyrwxh4SEoPY2btw4LPg1W2Vyt0C2XnDixIliK2LBggU4e1gJvHRUVVXxh2C6likkZuvp6eGz7m0B5s1JCkpd6gCdE5B4AXnAV4zIoGNC6Bse+pGeno6sWWpoaEjSgI9X5HjVKxP29vZ0jYtmZmaUnNBpamoqLCx8/vx51v+jpqYGOdEVJJKhvwiHw8FzKl25JVaVgSZgBUsG38GbM2fO7t27379/Tw7Ss2dPe3t7+XQY7tq168cff0S//f396dpryZmn5JDC4MGDpafVu3dvscsvfJuLrF4YMXv2bC1xYOWZc+bMEesBC2NyUFlZ+fLlS9xC8K6O9BYitpGIbZYpKSm41eHT70z6mnTS0tKkV4TihovlKxkHBwfpxpCUMWKkp6ejXHE4HLzqkrTajomJIet9VRy23kjugY4VbGxs0Dj26NGjCRMm3Lt3j+yqqqpqb29PHjFu3bqFftAVvOMI0fnkwsJCvAJWUndgDsNu28JVP2LECOkJ4dLGzZhOWFhYRUWFWIXqzCd0tuZQ5o0ZF4tY9deSopK7BbL1gpLGGVyV1dXVeJRulmXLliHx7+TJk2TlxgRBICXGCxcuJJuKaHXka04UlLfUATotYJ0IkAe6Ik10fAj9wJsA+Cycjo6OpM2TpKQkSUIOiznBNDY2Hj9+/NSpU0lJSZJ2/yiTCgWyAkwM2urU/gjFCWsXJGdG7pJZuXLl8ePH09PTa2trt2zZ8r///W/SpEkeHh4zZszAM4p8bN26Ff/+7rvvkpOT0YU6OtheC119KGXtIglJAfF3cZxEq5Cenn7gwIGoqChsgESmFsK8WT5//hz9MDU1lWSWQw5jPHhxIKlJyN1UFCyZZt9FGSPGf//9h1PHVUABH2eoq6vLy8vDmlEUh603knWgYxdVVdWDBw+i/bSYmBgXFxdLS8tZs2Z5eHg4OTnRraHgt05PT//jjz/ExqmhoYFaS3p6OrrsqqTuwBx2C5mtqm/2lXELpxsrUsaLKz6HMk8ONwm63mOEpqamnp4eXYiSrwWy9YKSqkxHR8fExARJy1lZWQw/35ibm8+cOfPixYtlZWXh4eF4o5ggCHR6BZ3Majuw0o+Ut9QBOi0g8QLyQLZ6gqF/b8NyS0VFBVK2IYXS0lLl5QRRXFzs6uqKjFL27t3bzc3NwsICn8u9fPlyXFycfCk268RWyWhqasbExGzYsOHEiRNNH4n+iLe394QJE9avX4+OycnH5MmTNTU1IyMjc3JyvL29//77b7He6urqcGbEemjWQGizAWtraylOy5YtmzBhAj3I+/fvf/nlF4IglixZgnWukqHYkWqWw4cP+/j4CAQCVVXVKVOmODg46Ovro22E2tpask0mxZslvtgs6eMCeaHAHLwRIXcFKalkJOVHqSMGjlNKIZNPx71//55FiZetN5JpoFMG8+fPNzAw8PX1zcrKIggiPz/f/yMmJiZLlixZt26doaEh/a3PfIThWyupOzCH3UJmq+qZ9xop5cbWiytvDhWbHMMmQZd45WuBbL2glCrr0qULknjLy8sJxnh7e1+8eBGJuFjiffv27eXLl8eOHSvpsFVrwUo/UupSB+icgMQLKBE8T1hYWFy5ckW6Z+Zm0+Vm3rx5aCZbtmzZ0aNHKQcsCwsLmUxmrV4yXbt2DQgI2Llz59mzZ8+cOYNu1YpEon8/wuVyT5w4IccqzdPT8/Tp0zU1NYMHD3779m1ISMjkyZPFXsjBiw9J37mxSCwJsYYEyQHp93OwJVUK+fn5SOKdMWMG1pwhN/fv31+1ahUq5H///ZfyDb6yspKhxMsQ3ALZ3aPDAq3cFdRaJaOMEYNJIZOd6FfTO9IY2CxCoVCS07Rp06ZOnXr//v3Tp09fuHABHSUoKSnx8/M7fvz4lStXsCUV/Na7du0Se2OfDFYNpaTu0Fq0WNW3ZLm18Bwq96vJ1wJb4AXxi8g0znz22WeffPJJdnZ2fHx8amoq+rZ77NgxgUDQ1jZ4WURJSx2g0wISL9ASh1uampoUvzqoIKmpqXfu3EGqlQ4ePCj9PmHbL5nu3buv+khBQUFoaOiff/6JVCgHBwfb29tjI5nMOXv2rKqqqqGh4d9//z1p0iSRSOTt7e3o6Ejf70JmCdH0Lzaqt2/fSk+rqKhI+nOxx6JaAKzAc8OGDUq9MYjA22KVlZWS/Hz48EHuaIuLi8V6kPS81UtGGSMGjlNKIZOd2G17bWoMpCBWipD+NYTD4Th/5PDhw7dv3w4MDERbT6WlpR4eHjk5OcjoqLGxMRoEjI2Nmb+1krpDa9FiVY9LW9nXuVt+DjU0NESzjKxNQr4WyNYL0s8oYfCLkM9ENAuHw1m5ciWy/Hf0IwKBIDAw0MjI6MsvvyQ6NKwvdYBOC3wdAZQIVqRRXFwsZQ5oGfCNqU8//VTsqc7/Y62rHZaMhYXFhg0bsrOzkTZ/giCCgoLkiAdvMkycOHHdunVoJTF37lz6RSasDyk1NVVsVOgbuRQKCgooiigQWJmH2PPJLdlIsLkapbYQ/Jrl5eWSri6/efNG1milKABDMFea0sIlo4wRA8dZ/hGxfrB6WCMjo969e7OSbhscAxF4HS82Pwzbm5qamqur64ULF2JjY9FJ46Kiohs3blDeOjc3t9W7Q2vRYlWPEyKbA+gYcyhuEi9evBDroaqqSqzEK18LZOsFsQE/Cu/fv8fntGWd4xYvXoxOCyM11JGRkW/fvvXy8mr20HuHga2lDtBpAYkXUCK9evVCi2+RSCTFbIm7u7uZmdnvv/+u1MzgE56SThNJ+Yrcdkpm69atdANI6NILtoQhaeuVOTt37kQrhqdPn27YsIHiOnbsWCQe37hxg34+ubS09P79+80mERERQX946dIl9IOJfaOWbySst5C+fftikxuSCq1ZS0h0evfujc7p5ebmko1FYyIjI9tmyShjxOjVq9eAAQMohrUoYJWwbm5uYlW/NoukpXCbGgMRXbt2lbIuj4+Ppz/MyMjw8PAQ22zGjBmDrYzikQefI5VU4KjBm5mZWVlZ4V1lJXUHZdPqVT916lT0Q8qB20mTJllZWSkoIbT8HIqNUVHUg2MePnwo9rl8LZCtF5RU3fgtLCwssMl0hhgZGSFJr6amJjQ0FOmsWrFiBdFBad/eh2AAAQAASURBVJmlDtCpAIkXUC7oHA5BEMePHxfrISsr68qVKyUlJZIuarJFnz590I/k5GT6cT6hUCifeaQWLpkHDx6EhYWJXarq6uoiQVSKYSGGqKurh4WFoQOK/v7+165dI7saGxu7ubmhrZh9+/ZRwm7dupWJfZddu3aRzTUh7ZqnT59Gmkgk2U1VNriRJCYm0l3v3r3Leop4yRIQEEB3zcjIECuBNAs2U7l9+3aK07lz5zIyMtpsyShjxPD19UU/Tp48SXcVCARYSRv2yRDUR5B+V/zw6tWrQ4cO9fLyamtjIMLOzk6S1euoqCixllpKS0sjIiLwBylJyuHwyOPh4YEaTGxsLNJ0Refo0aPFxcWOjo7kzTQldQdl0HaqftasWUhL8+PHj7HeZjKZmZm3b99+/fq1WOV/bXkOnTt3Lmpdqampjx49onsIDAwUG1C+FsjWC8bHx4sdY7GotnLlSkJ2vv32W/Rjz549N2/e/Pzzz8lic1FR0caNG7dt2yaTTqw2S8ssdYBOBUi8gHLhcrmTJ09G9gD/+ecfiuuHDx+QbLN48WK8DlMS48ePR0ZxiouL/fz8KK579uyR6fhT65YMXYwhCOLChQtokmZFXOzbty+2qMHlcikfU3fv3o2mnO3bt//888/oCOKbN29Wr14dEBDQ7C4Zh8PJzc397LPPHj16JBKJmpqaIiMjJ0+ejNaOGzduxPaNW5ivvvoK/fDz86O8cmFhIdmAE1v88MMPaLUaHR3N4/HIThUVFQsXLmzW1JNY1q5di7bywsPDv/vuO6SMtLGxMTg4eMmSJW25ZJQxYixevHjSpEkEQVy8eJG+Ubl79250HHT9+vWS7KZKwtjYGClyI5+2jY2NTUlJwdcE2s4YiECZQWcC8TFOtMr38vISe2odERYWRj8yUFdXd/nyZbR1jHfkVFVVg4KCVFRURCKRl5cX/W5wSEjImTNntLS0duzY0QLdQRm0napXVVU9efIkUuGzcuVKygfHxsZG1OW9vLywFa72Mod26dIFJ7R48WLKXZhTp07duHEDf3ogI18LZOsFzczMFi5ciA8wIw4dOoSsBFtZWcl3+3TMmDFILfOrV6/oRommTp3666+/7ty5Ex/67QC0wFIH6ESIgE5GeHg49yM2NjaoDQwbNgw9efDggdggOTk5yEOvXr1QEE9PTy6Xe/r0aeQBueI529XVlcvl+vn5Idfy8vLx48ejSWjVqlUJCQmFhYWpqanHjh1DE7CTk1NNTQ3D/O/bt4/L5bq7u6O0bGxsUOq1tbUikejSpUtcLnfevHnI1dTUFLk+e/ZMJBJFRERgYczNze306dPx8fGXLl3y9PTU09MbO3YsPf/S3z0pKQm5Ivvv6urq5JKUlJm0tDS5SwYf9509e/bNmzcLCgrevn376NGjDRs2oPs8Tk5OfD6feXvApnHFunp6eiLXCRMmCAQCshM6VYXBt4l0dHR8fHzQbx6PRw6CVwBjx45FL44uBJLVLX7++ef19fXM85+Xl4cCXrp0SaQw9fX1o0ePRhF27dp19+7dN27ciI2N3bt3r6mpKdrZprcrBTtIcnIylvCnT58eGBgYFha2bds2c3PzwYMHY5VRjo6OKJ7Kykom73L58mW88uZwOKampriO8E7mihUrlFoyknqrr6+vlLTYHTEQZWVlqIOrqalt3rw5NTW1qKgoISGBy+WivHl5eTU2NmL/Dx48EFunXC5337595JjxdnpwcHBBQUFkZCSqzXv37inyRooMdM2CNyFVVVWdnZ3nzZs3duxYDoezYsWKn376CXd5Lpe7bNkykUiE9/BNTU0PHTqUkZFRUlKSlZUVHh4+YsQIVKr//PMPJZUzZ86gm4d2dnYhISG5ubkFBQV3795dtGgRh8NRV1cPDw+n543d7iCpHn/55RcFu62Sql5SrqRM0IiQkBB0Fnf48OERERGvX79+/vx5eHg4UrswfPjwqqoq6UkweXE55lAFG7NQKMQf6czMzLZt2xYWFhYQEDBjxgyCIEJDQ9EUZmpqSi8TOVqgHC9YWVmJMuzo6IhcDxw4MGjQIHNz861bt4aFhQUGBuJT1l27dn369Ck5xeDgYBQc3YfX0tJCf3F1kDl8+DCKx9zcnDxekdVt6OrqitrD+tDX11dsq0ALJNaXOgAAEm+ng34tExMUFCQ2iKRLKT4+PsiDWFdnZ2ccQ319/d69e+lKUI2MjHbs2CHTsCXJCFtFRYVIJMLLNQp3795FwW/evNmvXz+K69ixY1NTU7GcRs6/9HeXdMwPlaSkzERHR8tdMikpKd9++y3ZmgLG0NBw27ZtdXV1sjSHZiTesrIyfLNu9+7dFNfz589TjhXZ2dk9efIEb85IknidnZ2rqqrmz59P3g3W0ND44Ycf0BqotSRekUhUXV29YsUKyj0uXV3dXbt20W1monaleAd5/vw55cChiorKnDlzKioqKDtd6PQaw3e5ceMGZVdHX1//77//xhlmLvHKVzKSequlpaX0tFgcMTB8Pv+3334zMjKixGljYxMaGkrxLOXGo6urK9lnYWHhsGHDyB7U1dX37t2r4BspONA1WxReXl7k3qepqblx40ahUEiJWVNTUyQS1dbW/vXXXy4uLmK1144fP/7hw4diE0pOTnZ1daUf+nBxcUlMTJSUPRa7g6R6HDVqlOLdVhlVL+XGr6QJGvP06dPPP/+cEkpLS2vNmjVkoVrBF5d1DlW8MQsEAn9/f4pl9R49eqCPLCYmJkgYZqsFyvqCdNMDPB6vvLz8yy+/pKTr4uKSlZVFSU7SXVxcHWSqqqrQ5/Xt27dTnPDBeC6XK2oP60NJJw7QAon1pQ4AcFpSPy3QyREKhYmJidnZ2eXl5Xp6era2tsOGDWPX+iUT0CyYlpZWU1NjaGg4YsQI/DmzHZVMbm4u2mnh8/n6+vq2trYODg4tX5hCoTAuLg4p0uzfvz/eBmRIfn7+w4cPy8vLzc3NnZ2dDQwMiLZBWVlZXFzcmzdv1NXVe/fu7eTkhD7AK5UXL148efKkoqLCzMxs5MiRrFxSEggE9+/fz8jIqKurs7a2dnNz09XVffjwIdqOWLFiBV2EaDslo4wRQygUPn78OCcnp7Ky0sjIaOBHFMynSCR6/PgxKmQTE5Px48ejVXibHQMRBQUFcXFx79+/Nzc3Hz16NP74JYUPHz6kpaVlZ2dXVVWpq6ubmZkNGzZM7KqUzLt37xISEpBoampqOnz48GaDKKk7sE4brPqSkhJU2hwOx9LS0tHRkSIrttM5tL6+/t69e/n5+VpaWtbW1mPGjEGHg7p06fLhwwdbW1uxWvrka4FsveCbN28eP35cVFTUtWvXTz/9lG7qTw4cHBxSU1Pz8/Pxx2hEY2PjxYsXNTQ0Zs6c2ZGs1LaRpQ7QAQCJFwAAoHOhiMQLAADQRqioqEAnyT///HNsHKsDk5GRMWjQoBkzZog1dgAAgBQ6zncgAAAAAAAAoMMQGxu7ePHi/Px8Sa7oh4uLC9EJQLqpsdJmAACYAxIvAAAAAAAA0ObIzs4ODg7G9sMoIE1mmpqaS5cuJTocERERS5YsEQqF6G9lZWVQUJC1tTVWtw4AAHNA4gUAAAAAAADaKL/88gvFrlhtbe2qVatu376NjMYzuYXe7khOTj558uTNmzfR302bNlVVVa1du7ZZ+38AANARo3cRAAAAAAAAAFoXfX19DofT0NAwY8aMgQMHDh48uGvXrkVFRffv3y8rK9PU1PT391+5ciXRcZkxY4aTk1NRUVFmZqajo+Py5ctbO0cA0C4BzVUAAACdi/z8fHQacOzYsbNnz27t7AAAAEikoKDgypUrDx48+O+//0pKSurq6gwMDKysrCZOnLhs2bIOubuLuH379h9//PHff/9VVlaamZlNnz5948aNrGveBoBOAki8AAAAAAAAAAAAQMcE7vECAAAAAAAAAAAAHROQeAEAAAAAAAAAAICOCUi8AAAAAAAAAAAAQMcEJF4AAAAAAAAAAACgYwISLwAAAAAAAAAAANAxAYkXAAAAAAAAAAAA6JiotXYGAKVz4MCBiIgI/NfQ0PDixYtEm6S8vHzWrFnkJ76+vu7u7spL8fr163v27CE/OXv2bAe27wcoqSu1fNPt5GNFi9ExalZWDh8+HB4ejv9CS+hgdM5W3eGB9QwASAEk3o5PaWlpXl4eQRCvX78WCoVtefgTCAQoq9XV1WVlZQRBzJs3T6kp1tTUoBSRXXuCIPh8vlJTBNoFlZWV7u7uKSkpe/fu/eabb5rtSi3fdDv5WNFidIyalZWysjLpLUFsB1Eqp06d8vHx6d+//9WrVw0NDYm2TRvPbeds1R0eWM8AgDREQKcBrVpMTU1FbR4ej4faJ4/Ha5kUZ86ciVLMy8trmRSBdtECDQwMZOpKLd90O/lY0WJ0jJplqyVI7yAywefz734kPT292ZwQBOHv7y9qPdpXbttmq3727Bkqw5qamhZLtGPAsOhgPQMAdOAeLwAAAJUBAwagH3Z2dq2dFwDoyB2kqKjI5SNbtmyR4m3gwIFspdh5cts22bNnDyrD7Ozs1s5LOwOKDgDkBk41AwAAUBk3blxMTExaWtpXX33V2nkBgDZHy3eQS5cunT59um/fvhMnTiTaPO0rtwAAAB0ekHgBAADE4PSR1s4FALRRWriD6OnprVixgmgntK/cAgAAdHjgVDMAAAAAAAAAAADQMYE93s7Ly5cvz58/n5uby+fze/fuPXPmzGHDhkkPUltbe+vWrdjY2OLiYnV19R49ekycONHJyUlVVVVJAck0NjYmJSXRnw8YMEBPT49glaqqqtDQ0LS0tNraWmtraw8PD3t7e8Vf8P/H3pnHRVWFD/+yDAwgKIuAyiopoSlgqKgoaCbiihEapo2ihlpJhltuWWlSaaKlDmgmBm7gAmi4b6wqIQKSKOAg+yIwgDgIw7yfn8/7nvf+7r0zzAoI5/sHn+Ge5Z7lOctzzznPKSkpKS4upoRls9mUyO/evUsQxKhRo9TU1NDDoqKi0tJSsrd33nnH2NiYEltmZualS5cKCgqampqMjY2dnZ2nTp1qampK9vPs2bPKykpKQG1tbScnJ/gtEonu3btH8eDi4kLOTkNDw+XLl1NTUysrK3V0dCwtLSdNmjRmzBhymoHq6ur8/HzyE2dnZy0tLYFAEB0d/eDBg8rKSn19fXt7+9mzZ9vY2BCyAGVFgVIyxcXFJSUl/fv3t7S0RA/peYSKEJdaQmVkZGQ0Nzejf/v27Ttw4ECCIG7duhUfH19ZWWllZTV9+vRRo0YhP0KhMCoqKjU1tba21srKas6cOeIab2Nj461btx48eFBYWCgQCAwMDBwcHKZMmWJvby9rOhnFBiKkPJReNqQkJycnISEhJyenpqaGxWKZmZm5urpOnTpVW1ubUABysyUIwtjY2MHBYfz48XIUjvStT5EKUl1TSk9Pj4mJef78OZvNHjhwoK+vr7jgUjaQ+vr6uLi4f//9t7q6Wl1dvV+/fk5OTpMmTerbty9FosrKyuDfmpoacnNWU1MDmRfXQCQkRtYO/PHjx/Hx8Xl5eXw+X09Pz9ra2snJycPDQ1dXV4mpFffS+vp6Y2Pj9957b9q0af3796f7FBdnSkrKhQsXioqK9PX1R48e7evrq6OjQyhAS0vLxYsXk5OTy8vLe/fuPXLkyDlz5rQ7vErZ3tEIXlVVBU8yMzPJxoQtLS379++v9C5d8UYqU0BlyaQcRScuuKyvlruIMJguDYM1K0x3t7rZ2tq6Zs0aujB89NFHtbW14oKHhoaamJj8z8YAdXULCwtki9Le3v7KlSsS3itHQEYDkuXl5YwyfOvWLZHCkG0bXrt2rXfv3pS3BAYGKp7Bbdu20dNvb29P9oPG7MTERPLz9evXUwKePHmS7CE/P3/KlCngZGhoaG1tzWKxCILQ0tJau3bt69evkU/G7XbW1tbIA+OVBnV1dcjDvn37+vTpQxCEhoaGtbU1mos4OjqmpqZSyufo0aOUqHg8XnJyMv3KEznsmjKKBKVkvLy8CIL44IMPyA/peYSKYEytSm01W1tbk1/H4XAEAsFHH31ESYafn19ra6tIJCooKBg8eDDFdfXq1ZRoKysrfXx8QAbgSlUbGxukmcyaNauiokJckhgzyCg27u7ulLAyyUa7hIeH29nZQQyamprW1tZo4mViYhIRESGSFy6XC81WTU1twIAB5Pn04MGDf/vtt7a2NulrVvrWp0gFqaIp1dTU0IWNIIj169cLhUK6JEjTQP744w89PT3oEvv374+qTE1Nzd3d/ebNm+BN8r5fbW1tcQ1EcmJk6sCfPXs2Y8YM8NOrVy9ra2tNzf+7EqCtrf3JJ59kZWUpK7UIHo+HXqqvr29jY8Nms6HJrFixoqGhQZouwsfHh5IGCwsLlFopIUv1w4cPbW1tKXGamJicOXNGQgzSt3dxIzgiODhYFV26Io1UjoCKyyQdKYtO8fmM3EWEwXR9sMbbg0Bzl2+//VZfX3/nzp1ZWVk8Hi8+Pt7d3R36OBcXF0ar9ytXrgQPy5cvLy8vh4ePHz+ePHkyTGsOHz7M+FL5AjJOLpuamrhc7o4dO7S0tNTV1Tdv3sx9Q2lpqeKFg0aI2NhYLS2tCRMmBAcHh4SELFiwAC1shoeHK5jBtLQ0Lpc7fvx4CBIQEMDlcilj+dq1axnHpNTUVC6X+8UXXxAE4evry+Vy8/LykGtGRgZM321tbdGEsqGhITg4GD60T5kypaWlBZ7fuXOHy+WOHj0aXuTn58flciMjI1Fsra2tULZgkXX79u1cLre5uRlc0fWbq1evrqmpQVlzdnaGz+qXL18mpzwvL+/oG8ADQRD//PMPm80eOnTo5s2b9+zZg66ClEPj5XK5v/zyCwQfMGAAJJtcMnV1dTBmq6urV1VV0fNobW2to6Nz8OBBqIjc3Fx4Pnz4cDRpUKnGGx0dffTo0R9++AECcjic+fPnm5qarlmzZt++fd98842hoSE4BQUF8fl8KyurwYMHb926de/evf7+/khlOn78ODnajIwMeO7j41NQUAAPm5ubT5w4Aets9vb2fD6fMUmMGQSx8fDwgI4CSik2NpbsR1bZkLJhGhoaRkZGIgHOz89HMhMaGiqSHaS9fP7552VlZfCwqqpq/fr16ur/97CPQCCQsmZlan2KVJDSm1JjY6OLiwsEmThxYnx8PI/Hy8rKCg4O1tfX37RpE10S2m0gBw4cAOV29+7daDSpqqpavXo1pWcDidqxYwc8Hz58OJfEoUOHwFtkZCSXy924cSNqIBISAx34lClTQkJCuFzukiVLkAZL78AzMjJAGx8wYMCFCxeEQiH0DNeuXXvvvfcg1Pr165WVWiAzMxNK1cLC4p9//oGXCgSCsLAwWFJ2dnaurq4mB6HH6efnZ2Jisnbt2rCwsJ07dyLT0IMGDZJJLUFSvWXLFiMjo0mTJv3zzz8gAz/99BOkR01NjTJIydfeYQTncrmurq4QauPGjeQyfPDggSq6dEUaqRwBFZRJRqQsOgXnM3IXEQbzVoA13h4EjLKampo6OjppaWlkJ6FQiD45r1q1ihJw//794OTv709xam5uHjlyJHzfpaxJKhJQ3OSyuLh4yJAhWlpaZ8+eFSkVNELY2tr+8ssvZKfjx4+Dk7Ozs1IyGB0dDaG++OILekrQZsIBAwZQVplEIhHMGh89ekR+yOfz4du8np7es2fPKEF+/vlniHDbtm3k57GxsfD8ww8/ZCyTFy9eaGtrU3L9+++/i0t8bW1tv379YFmgsrJSQiEPHDhw1apVMNUDvv76a0XuroQJn7q6On1ZLDw8HF5KEAT988qLFy80NTU//vhjCalVtcZL0X9sbW0dHBzIU97c3FzYvqunp7dkyZLp06ejrw8ikejs2bMQ0MXFhR7h2LFjYWWYTHp6Ouh169atY0yMuAz+9ttvoBrRl6EUlA1xQC3Ex8fTnby9vQmC0NXVJc96pQGlc/HixXRX1F6k1Hjla30KVpCymtJXX30F8cyePZvS26Slpeno6MDUnFHUGRtIS0sLrPItXLiQHmT58uX0b3k8Hg+lQZoGwrhqSu7A9+3bR3Y6deoUYweOKk5HR+fx48fiJBZpvEpJLZ/Phw3JOjo6ubm5lFDnzp2DUF5eXvTOH8VpY2Njb29PbkcCgQCdSaF8hJIMkmptbe2PP/6Y8tKkpCQQgF69ej1//lxZ7Z3D4UDAjIyMjunS5W6kcgeUTybbRZqik28+o0hOMZi3Aqzx9iDQzjfGDS08Hg8+/mloaJSUlKDnfD4fjvFoaWkxboO8fv06RDtixAjyc7kDiptcPnnyxMrKSk9P7/r16yJlg0YIV1dXuis6IVNfX694Bl++fAmnrczNzemzTDSWEwRB3wVqaWlJ2aklEom2bt0K/hnnx69fv4YPt7q6uuSdya2tregQ1NOnT+kBd+3aRRAEWrsgZ5nNZqMv+mT27NkDEW7atElCIQ8dOpQyy79//76joyN5nVkm0HZxup45ffp0VJ6enp4U1z///JMgiFOnTnUdjZcgiBs3blBc582bB05aWlpoTRLxzjvv0OUzJyfH2tpa3OLMBx98APNR+sRaXAZhicnb25uiCipFNsSxbNmy0aNHMzolJiZChH/88Yf0EbbbbAUCAWwClFLjla/1KVhBSmlKxcXF0OdramoWFRXRPaxatQreIr3Gm5OTAw9/+OEHehDo31Sq8Y4bN47uOmDAAHoDQRUnbocnzPKVq/GinkrcS5H567i4OHFxEgRx7do1iuuhQ4fAKSgoSCQ1SKrFNYelS5eChxUrViirvUujtim3S5e7kcodUD6ZVLrGK/18RpGcYjBvBdhWc09k/vz59IfW1tYw1gqFwoiICPQ8IiKioaGBIIgJEyYwmi7w8PCAPXjp6empqamKB2TkwYMH48aNa2xsvHnzpkpvOFy4cCH9ITIL9OzZM8UzqKurO23aNIIgysvLk5OTyUFOnz4Ncwv4Nyoqiux67969oqIiX19f8kORSHTw4EH4jfQiMiwWy9PTE+z0QPyAhobG559/Dr/RvIccLZfLNTAwQPskyVmePHky2mpLZubMmfDjyJEjhHiWLFlCsenl4uKSkZHBKJnS8PHHHzOWGJ/Pv3Llypw5c6CCrl+/XltbS/YQFRXFZrPJU6hOx8zMDHYOM0qgh4eHubm5ONeCggL00MHBgcfjMYoEHFUFIytkkRZHW1tbQEDATz/9tGjRoujoaEZ7UcqSDQphYWHiOgd0mLnd3oMxne7u7ozNVltb28vLi37yjRG5W5+yKkiRphQRESEUCuFyXQsLC7qHTz/9lJARlBjYJExxdXJyysjIWLduHaEyGNNM78DbrTiCIKZOndq7d28FbUGRQVu+CYKYO3cuox90vzFaQaVjampKHwTff/99+EExmyQlkyZNYmwOCxYsgB8RERGtra2qbu+q6NLlbqSKtG45ZLIT5zPKyikG05XBGm+PQ01NTZyZPmQMFi2ewLdk+IGOe1FQV1dHh8rQqqYiAencvn3b3d1dTU0tISEBtgqrDpQkMrBBC76JKiWDaLpDGc6jo6PffffdrVu3wrEZtP8ZgJGGMlXKzs4G+41aWlpoYxsFdCYtISGB/Hzp0qWwae2vv/4i2wKFBOfl5X322WdggYaSZXSaiIKdnR2oQ2VlZRIGcqVX4tChQ999912CIG7evFldXY2ex8XFtbS0+Pn5gW2e1tZWtJebIIja2tpr1655eXmR89jpODo60m0aGxkZwQ/GKkbWYmAOSqe1tbWsrOzJkye5/4/GxkZwoptfpvD69et58+aFhYV99dVXR44cEWdfXVmyIQE+n//s2TOUBbTa1m4WGNOJNAQ6J06cqKurk8YQtCKtTykVpEhTQukhmwFvVxQlY2dnB9J47969iRMn3r59m+yqoaHh6Ogowais4jDWAvpIhDpwVHFqamqMfT6c1K2rq/vuu++Ulbbs7GyoTTU1NXHG1ZFYJiQktLS0SF8v9DzKhLj0IAFraGjIysrqsPauxC5d7kaqrNYtpUx24nxGWTnFYLoy+HaiHoeBgYG4mRy6RCE3Nxc9/O+//+CHhLsukCXJR48eKR6QQmxs7Ny5c5ubm4VCoUy3GckHbN2hAIY0YQFcKRmcPn06m82GO0X27NkD05cHDx4UFBRs2bLF3Nx83LhxiYmJhYWF//77L5oDRUdHDxo0aNiwYeSo0DZCXV1dccsC6Fan7Oxs8nNzc/PZs2efOXOmpqYmKioKfc4nCALWIuDcHf1d2dnZe/fuZXyXlpYWKM/Z2dl0y5+AKu45+Pjjj7dv397W1hYTE7NkyRJ4ePr0aTabPW3aNGNjY1jHjoqKQhvDYmJiWltbKWvmnQ79xin4xC5BPpGBX8qqWktLy+HDh48dO5aenv769WvG11G+dFB4+fKlt7c3zG6bmpok6D/Kkg062dnZe/bsiY+PRxfDyJQFCtI0W+lRpPUppYIUaUpPnjyBH+LqQltbW19fX6YZuYaGxr59+2BRKyEhwcPDw9raes6cOd7e3rJeR6fSDhyJgampKXJVNdK8FA0Zr1694vF4gwYNUmSQkh5xgqSrq2tqagqKem5uLtKgVNfeld6ly91IFWzdKq0vKZHy1crKKQbTlcEab49DwsJFr1694Ad5m1BNTQ3FlQ66r+/FixeKByRz+vTpW7du9e7du7m5uamp6ZNPPrl7965KL0dljByZbyWjSAb19PS8vLzOnTtXUlJy7949MJsMS7gwWvv6+sJKe1RUFGi89+/fLywsROY66cmoq6sDozUSIH8sB1auXHnmzBlQcZHGW1paGhsbO378eGQClPKuk2+Q9V0IBa9RZWTu3Lnbt2+HEoPpEdwSOX36dD09PXd3dxMTk+rq6itXrvD5fNizevr0aW1tbWSzrYsgWbylF/6KigpPT8+HDx8SBGFlZeXl5WVhYYE059jYWMqOejoCgWDSpElpaWn6+voNDQ1//vmnp6enuA8EypINCvv37w8MDISvXVOnTnV2djYwMADFu6mpCRm4lh5pmq0cscnR+hSvIAWbUl1dXbtFwWazZV2Dmj9/fu/evYOCguDLaWFhYcgbTE1N/f39165dizYsdGIHrlwxkBKZhgwYNRg1XukHKWVNDEDjZZwYKLe9q6JLl7uRKji2qrS+VNQcFMwpBtOVwRov5v+DPvihWRcYNaG4qjogmRs3bkyaNCk6OtrT0/P+/fsZGRkbNmwAg7GdjoIZ9PX1BcucUVFRoPGSl3B9fHwCAwPBNTg4mKIPk0ExW1hYXLhwQXKa6WsskyZNGjx48JMnT1JSUjIzM+FChUOHDgmFQnTxEv1dO3bsaPfsK7LM0TEMGzZs0KBBT58+hZNdhoaGcXFxr1+/hk3gGhoac+bMOXToUEtLS1xc3IIFC+rq6mD/G3mK2Z3w8/MDbWrp0qUHDx5E4gqUlZW1q1Dx+fyMjIyzZ8+qqamBKZRly5aNGjWKcjuo6mTjzp07X375JUEQffr0uXHjBmWHHp/Pl0PjlabZSo8irU/xClIQ5RYFmenTp0+bNu3OnTvHjx8/c+YMfO+rrKwMDg4+fPjwhQsX0NVonYXq8q7gS8lO4obFDoZxFOuAsUBZXbrcjVTBsfUtoufkFNOTwRpvj6OpqUmcE5/Phx/kb/AmJialpaVkVwkByVto5A5IZtq0aWfPntXW1j558qSTk1NDQ8OePXs+/PBDuIC+c1EwgzNmzNDW1m5ubo6Ojt61a9fDhw/z8vLQEu6AAQPGjBmTkpJSUFCQkZHh5OQUHR09cOBA+hkbFHNra6u4E9qSWbFiBVx6dPANQqEwLCysb9++cFCKMcsmJibyvUul+Pr6/vTTT3Cyi8PhwPd+NBvz9fUFc6awfzsmJqalpUWc/Zi3nczMzJs3bxIE0bt373379lG0KSlhsVjx8fFgI2flypUHDhzg8/nz58+/c+cOfdKjCtlA5l7Xr18v7rClrKB0KuX4nNytTykVpCBGRkawUVxCD/by5Uv5IldTU3N/w/79+69fvx4WFgbXaFVXV3t7e+fn58Ndr50FqjiVnqIU91JphgwJw2KXmhiodCxQSpcudyNVfGx9W+g5OcX0ZLDlqh5HY2OjuDEeHetCN6eTDWnk5eWJixMZhySbUZE7IJlZs2bBbquBAwcie8IcDqe8vJzobBTMoL6+Phg/LCwsTEtLo1ulIlu3SktL4/F4jBtKUTIqKiokzFokwOFw4GAPmN+Mi4srLS319/enb4hC7yLbBO46oPI5ffp0Y2PjpUuXpk6dir73T5w4EWZsly9fbmhoOH36NIvFQgZFuxnozNX777/PaGz2f+6maw8jIyNkEnb37t2w+yA5OZlxZVUVsoFyga5skTUL8jVbOWKTtfUppYIUBPXzT58+ZfRQX18vt8aL0NTU9PT0PHPmTFJSEvQz5eXlV65cIToVVHE1NTUS9E8VvbT2DZKHDGNjYysrq45JGEEQxcXFjM9fvHiBdr8zTgxUOhYopUuXu5EqPra+LfScnGJ6Mljj7YncvXuX8TmyqwlXQQJwjw7FgDMZgUCAbpEFFU7BgOKYP38+GKioqqr67LPPOmBGKBnFM0gezqOjo+3s7MifV318fOBHVFSUuC3NBEFYWlrCaVuRSCThmpaZM2eam5v/+uuvdCdDQ0O4kKCxsTEyMvLAgQNqamoBAQF0n+jjelJSkrgX3blzx9zc3MbG5tWrV0TH4uTkZGdnRxDE1atXIyIimpubySWmqanp7e0NpoAiIyOvXr06ZcoUAwMDojuCzB2J2xgp6yyfzWafOnUKdLPt27fTzXWqQjYk50I+RQU1Wwl7hidPnmxjY3P06NF2Y5O79Sm9guQA9fMUi8rtjhQSePTokbe3d1xcHN1p7Nix6HJXRiNkHdmlW1paDhkyRLIkXLx40cbGxtnZmTFhcqSW/FJxzQS1LC8vL1kNZSuCOOlFsmFhYYHu/VZWe2+3DJXSpcvdSBUfW1WHchtLV84pBqMssMbbE0FX1ZNJTk4GE3wGBgbkC9nmzJkDRk3T09MzMzPpAaOiomA88/b2Jo+IcgeUwP79+8GSx9WrVxlP8758+fLnN9AvmFU6imdw1qxZsI4aFhb25MkTikJraWkJp92ePn0aFhZmY2Mj7j6VNWvWwI/Dhw8zesjNzb1w4UJlZaU4K03oyO7OnTuvXr06depURtOa3t7eYNA7KSmJbNCbzMGDBysqKlxdXeW7x1LBGoRbHFtaWjZs2KClpUX53o+WzTds2NCNtzST7a5nZGTQDw22tbXJccOEg4MDGGVta2ubP38+ZZFKFbKBcoG+HJG5deuWIs32/v37yHYumZycnOvXrxcVFU2cOFGaCOVrfaqoIFmZN28eqAeZmZn37t2jewgLC5M1zurq6piYmPPnzzO6Im2EfEER2t5Mvozn4sWLTk5OixcvJlRGUFAQ/AgPD2f0cPTo0cLCwhEjRpA1TwVTi176119/0V2FQuHff/9N8dkxpKSkMN6YgK5ppdjtV6S9M5bhjBkznJyc6HKolC5d7iFS8bFVuchUdDLR1XKKwSgfEabHYGZmBj2mgYFBeHg42amystLe3h5E4uDBg5SAN2/eBON+Y8aMEQgEZKfS0lKYuxgZGRUVFSkrINJ2uFwuxenff/+FVRFNTc20tDSKK9ph5ebmJkvZiMAwD0EQPB6P7gpGpGCSrZQMIsg2P/7991+K665du5DrmjVrxEXS1tY2ZcoU8Hb27FmKa2NjI+xGW7x4sYQSIJ+TjI2NFeftzp07KMtNTU0UV5iusdnsx48fy1rICtYgQFaNZsyYQXF9/fq1oaEhuGpqatbW1kqISkJqoSmZmZnRQ0kQXclkZGRAQA6HQ3dF640hISHSyKdAIIBEwpIsxT9YQGUU6XYzCBNQUB2VKBuMoFtPLCwsSktLyU6lpaUWFhbg6u7uLpIF1GwnTJjw+vVrstPr16/hM9OSJUukrFn5Wp+CFSRNU5IGuIQMPmdUV1eTncLDww0MDGCGzSgJjGmAzxA6Ojr//fcfxX9TUxNc6dmnT5+Ghgb0vK2tDWwXDx8+HD389ttvKbUguYHI0YELhcLJkyfDkeN//vmHEgRueWWz2U+fPiU/VzC16KWM3Sw6L7Bu3Tp6LiSXANp7LFNzQFJtbm7u7OxM6RL37dsHrjY2Ni9fvlRWe0fj2rlz5+BJfX09fPwtLi5WRZcu9xCpyNgq36RCMlIWnRyvVsosAoPpymCNt/sTHh7OeQOcoTIzM4OhaObMmaGhoSdOnNi8eTOae/n7+7e1tdEjiYiIAD1zxIgRMTExxcXFz549++uvv8AGo4mJyd27dxnfLmvAFStWcDgcdKm9q6srh8NZsWIFuG7YsIHD4aDTTVZWVpC1srIy8JCSkgJOUvbL+fn5EIOlpSUE9PHx4XA4x48fBw/g6uDgAK6enp4cDic4OFjxkkG1AzHb2trSXXk8Hhrs7927JyGe2traCRMmgB3FL7/8MjU1taysLDMz89ChQ2BZ183NrbGxUUIMaD3H0tKytbVVgs+TJ0/CEOvg4BAREVFQUFBcXHzr1q3PPvtMTU2NxWJFRUVJU8gcDicxMZESuaw1SAfds3rs2DG666JFi8DVy8uLMXhiYiJjan/88UdKU2Kz2fDv8ePH+Xw+/KaILofDoc8FKezevZvD4aC1Czs7O3LALVu2cDiccePGgevIkSM5HE5QUJAE+fzxxx9FIlFMTAxam/Ly8jp+/HhKSsr58+d9fHz09fVRhGSRvnLlCmMGr1y5IhKJ7t69y+FwZs2ahWRy1qxZHA6H/I1MVtmQTHNz85gxY+Bdffr0+emnn65cuZKUlLRr1y4zMzNkvs7MzAzSKb0ujZqti4tLTExMUVHRkydPoqKi4Kyyi4tLfX09+JSmZuVrfXJUkExNSRra2tr8/f0hKnNz8y1btpw4cSI0NBRqOTIyEoYGJAnh4eESGgjSeKFSfv/990ePHlVWVubm5kZFRYEtA01NTTRZR8D9vbDcWlxcHBcXB2rM7du3RSJRUFAQYwPJyspSsAOvqamBcmaxWJs2bcrMzCwrK0tJSfnmm29YLJa6unpERAS90OROLeWlmpqaGzduzMzMLC8vT01NRZfKLl68uKWlRfou4vz58xwOx8/PT/rmQJfqPXv2vPfee/369du8efOJEyfCwsLQ19g+ffo8ePCAMR752ntubi5IvpubW05OTl5eHlyMN3HiRFV06QoOkbIGVHxSIQHJRafgqxWfRWAwXRms8XZ/KAcy4Wv9mTNn+vXrR35uYGDw22+/CYVCcfE8ePDgww8/JAeBicLChQslrGHKGhBu1aPQu3dvcEUL0RTQ0I4WhegfKRkRd2QlMDAQPDC6Uj6iy10yMMaAmda1a9cyenBxcQHdvt28NDc379q1i27e09jY+Pvvv6csQdNpbGwEiyD0FSc6GRkZnp6e9GNmHh4e9IV3CeeCjh49SvEsaw3Sgd1ZLBaL8Xv/xYsXIf4jR44wBhd3enP06NGMZ5tBWiSYUqurq5OcYHGH2CEgo+VMa2trCCsuqeB69erVwYMHU1zHjRuXmZmJPvOTRTokJIQxQlhYFnfr5rx58+SWjXZpaGgICAigHHbV09PbsWMH/VpImVZLGJstm81etWoVeVYnZc3K1/pkrSCZmpKUCIXCkJAQyunH/v37g16KPoYCAQEBEhoILOT++eefHh4ejNanJ0yYwPgFsKysbMSIEWSfLBZr165d4Mp4GxZBEJcuXVK8AxcIBL/88ouxsTHFz7Bhw27cuMFYYnKntt2X2tnZRUZGytpFbNu2jdFVQnOgSzWXy62trf34448pLdfDwyM3N1eC/MjX3n///XeKZURHR8fnz5+roktXfIiUKaBSJhUSkFB0ir9awVkEBtOVUet08z+YzkIoFCYnJ/N4PIFAYG1t7e7uLuEOekRlZWVqamp5eTmLxerfv/+4ceNgi5fqAsrE6NGj7927Z2FhwePxOvjWuI7JYLu0tbWlpaXl5eXV1tbq6+vb29uPGDFCRfc6VlVVQZZhZuzi4qL4HbydWIPdEpiSZmVlNTY2GhkZjRw5EizBqBrlykZNTU1ycnJJSQmLxbKysnJzc4NVaCU2WzU1NWtra1dXV0WMmcnR+jqrgig0Nzffvn27sLCQzWbb2tqOHTsWNqzKzcuXL7OysvLy8urr61kslrm5+YgRIyTIgEgkun///qNHj169emVqajphwgRTU1Oio2hra7t//35+fn5dXV2fPn2cnJyQiSnVpRa9lM/nGxsbD30D0dmUlJTcv3+/vLy8T58+77//PhjOUEV7r66uTkhIKC8v19LSGjJkiKura8dY6pJ7iOzIsbVzi67r5BSDUSJY48V0H44cObJkyRKCII4fP462eGHeInANYjAYDAaDwWCUC7bVjOkmnDlzZsWKFWCzEStLbyO4BjEYDAaDwWAwSofhpA0G8zZSVVWlpqa2b9++r776qrPTgpEHXIMYDAaDwWAwGKWDdzVjug8vXryg2wLBvEXgGsRgMBgMBoPBKBes8WIwGAwGg8FgMBgMpnuCz/FiMBgMBoPBYDAYDKZ7gjVeDAaDwWAwGAwGg8F0T7DGi8FgMBgMBoPBYDCY7gnWeDEYDAaDwWAwGAwG0z3BGi8Gg8FgMBgMBoPBYLonWOPFYDAYDAaDwWAwGEz3BGu8GAwGg8FgMBgMBoPpnmh2dgIwGNXS2NhYVlamqanZr18/NptNdGH27NkTExOD/jUyMjp79iz8rq2tnTNnDtlzUFDQzJkzOyUxmE6kqanp5MmTt27dKi8vZ7PZ5ubmLi4unp6e1tbWnZ20rsvly5d37txJfnLq1CkzM7POSxEG0yXo+JEFg8FgOgWs8WK6JyKR6PDhw1wuNz09HZ6oq6tPmjTpm2++8fLy6uzUEceOHQsMDHz33XcvXrxoZGQED6urq3k8HkEQRUVFbW1t5Bm5UCgEp4aGhpqaGoIg/Pz8VJpCCYnBdBYPHz6cMWNGcXExi8Wyt7cnCOLixYuHDh3q3bt3XV1dZ6eu69LY2AjCXFlZ+erVK4IgBAJBZycK0yNg7Oq7Dh0/smA6Hj6fP3PmzIcPH+7atWvZsmWdnRwMpnNQE4lEnfRqTIfS3NycmppKEISJicnQoUOJbo1AIJg9e/aVK1cYXb/++us9e/YQnYq5uXlFRQVBECEhIYGBgYyuZmZm5eXlFKfQ0NDly5cTBMHlcgMCAjosqYyJwXQkzc3NgwcPfv78+eDBgy9fvmxjY0MQxIMHD9zc3FgsVlfQeDuxk8nNzQX5dHFx0dPTE+fN29sbdi7weDy8Ko7p9K6+69DxIwum4yuX8duolJ0nBvO2g8/x9hTKy8s93rBp0yaiu7N06VJQd7W1tZcvX/7333//+eefH3/8MbiGhITs3bu3c1OI9AEHB4fOTQnmbeHMmTPPnz8nCGLDhg2g7hIE4ezs/NFHHxFET+9kdu7cCa/Oy8vr4FdjMBLAXT2m0xkyZIgEIcSdJ6aHgHc1Y7obKSkpkZGRBEGwWKwbN26MHTsWnvv7+x8+fBi29GzevHnhwoWduMfs/Pnzx48fHzRo0KRJkzorDZi3i4SEBPjh5OREfn7w4MHdu3d3UqIwGIwkcFeP6XTGjx+fkJCQlZX1ySefdHZaMJhOA6/xYrobv/zyC/wIDAxE6i6wdOnSDz74AM71cblcovPQ19cPCAjAcyCM9FRVVcGP3r17k5/36tXL1NS0kxKFwWAkgbt6TFfAzc1txYoVhoaGnZ0QDKbTwBovplvR3NyMju8uWbKE7gE9PH/+fMcmDYNRiNbWVvihoaHR2WnBYDAYDAaDeWvAu5q7P8+ePausrCwrK4N/a2pq7t69i1zV1NRGjRpVUlJSXFxMCchmsx0dHclPIOCoUaPU1NTQw6KiotLSUrK3d955x9jYmPykqanp2rVrSUlJFRUVLBarf//+kyZNcnNzU/rcPTU1tampiSAIY2Pjd999l+5h/Pjx8OP+/ft1dXV9+vSRHCG5rMRlsLi4uKSkpH///paWluihSCS6d+8evTwzMjKam5vRw759+w4cOJDoEHJychISEnJycmpqalgslpmZmaur69SpU7W1tWWKR6XSImUiW1pakBVuMnZ2diYmJuLeZW5uTrZXlJaWdv369by8vKamJgMDA3t7e1dX11GjRqmrS/UpsLq6Oj8/n/zE2dlZS0tLIBBER0c/ePCgsrJSX1/f3t5+9uzZ6OQtIjMz89KlSwUFBU1NTcbGxs7OzlOnTqWv1qK3gCVVsFaFrIgZGxu/8847ZP8NDQ2XL19OTU2trKzU0dGxtLScNGnSmDFjyLWglPTL2snQQz1+/Dg+Pj4vL6++vt7Y2Pi9996bNm1a//79CalBYoAWwDMzM8l2mC0tLSVEWF9fHxkZmZWV1dTUZGtr6+3tTZFhCtKXbbtlhf5lsVgjRoyA59HR0QUFBQKBwMrKavbs2fAcIa7ryMnJOXv2LI/HEwqF5ubmI0eOZDzaLV9pp6enx8TEPH/+nM1mDxw40NfXFyQhPT29paUFeTM1NdXX15dPnBobG2/duvXgwYPCwkKBQGBgYODg4DBlyhSwRi6l0NbV1YWHh2dnZ+vo6Lz33nuffvop2QZPfn7+yZMn8/Ly2Gz2qFGj5s2bp6urK03Z3rp1Kz4+vrKy0srKavr06WQxFgqFUVFRqamptbW1VlZWc+bMkbK+JORCJoFsaGg4d+7c/fv3+Xy+ubn52LFjp0+fzmKxKisrnz17RvY5YsQIFotFdODw0cEZHDJkSE5ODvnJsGHDyFWclpYmFArRv4MHD6avdioyPkrfTGxtbeUYBeRGXEXI13kqOGJiMJ2MCNPdkWx3UVtbWyQSbdu2je5kb29Pjgfpb4mJieTn69evpwQ8efIk2UNoaCgoIerq6hYWFuieG3t7+ytXrig3swcPHoTIPTw8xPlBm0Lv3r3bboSMhUbJIFx39MEHH5Af0q8/gfKkWIjlcDj0l0IRmZmZ0Z3QZmwulyuSmvDwcDs7OwioqalpbW2NxlQTE5OIiAgJYemJUZG0yJRIcYajjx49KuFdgYGB4FRYWDhhwgR4qK+vb21tDZMAmJgGBga+fv263VI9evQoJX4ej5ecnEy/ySkkJIQcMD8/f8qUKeBkaGhobW0N81EtLa21a9dSXk1/C5l58+aRPe/btw8+4mhoaFhbW6NPCY6OjqmpqcpKv3ydDBkejzdjxgxU/jY2NnBXtoaGxooVKxoaGkTS0a798ODgYLL/2bNno5xeu3aNsj+cLCF0ZCpb6cvKzMystbV1zZo19MR/9NFHtbW1KCC963j9+rW/vz8lVO/evZVS2jU1NYya8/r164VCIUVIAgIC5BCnyspKHx8fpIwZGRnZ2Nigljhr1qyKigpKqhjfcu3aNQMDA/JDY2PjO3fuQJAffviB8mnVwsIiJyeHHC29bAUCAT37fn5+ra2tIpGooKBg8ODBFNfVq1dLjrPdXEgvkGfOnEGf9hB2dnaZmZn0Azvl5eXtiqWEkUWO4aODM5iYmEh5kpGRQY6N8t7z588rmEG5m4l8o4DcMFaEHJ2nUkZMDKZzwRpv9+fOnTtcLnfHjh3QPQ0fPpxL4tChQyKRKC0tjcvlovXPgIAALpdL0evWrl3LOESlpqZyudwvvviCIAhfX18ul5uXl4dcV65cCaGWL1+Oxt3Hjx9PnjwZdODDhw8rMbOrV6+G13366afi/CBzhZJHMoDL5aKDwQMGDIBCI2ewrq4OBip1dfWqqir0vLW1FTxbW1vr6OgcPHgQyjMyMpLL5W7cuLEjNV6Y6BsaGkZGRra0tMDD/Px8dPViaGiouLD0xKhIWmRKZFNTE5fL3b59OxqDDx48yOVyc3NzKe9at24dQRCjR4/mcrlJSUkikaihoQE+tI8cOTI9PR08C4XCy5cvDxo0CCKsq6trt1Tz8vKOvsHZ2RlC/fPPP2w2e+jQoZs3b96zZw9KOVljzMjIgJmcra3tzZs34WFDQ0NwcDAsFU6ZMgVlXyQS5ebmgiANHz4cYtuxYwdqv1evXkU+0UWLq1evrqmpQZUFyWOz2ZcvX1Y8/XJ3MojMzEwQKgsLi3/++UcoFMIXorCwMFiWcXZ2rq6ubrf8kRhwuVxXV1d49caNG8mvfvDgAaPGGxsbq6WlNWHChODg4JCQkAULFiClKDw8nP4iWcu23bLicrn6+vrQsr799lt9ff2dO3dmZWXxeLz4+Hh3d3d4nYuLS2NjIwSMjo4+evToDz/8gLoODoejpaW1cOHC33777fvvv7eysqJrvPKVdmNjo4uLC7xo4sSJ8fHxPB4vKysrODhYX19/06ZNEKe+vj7k5c6dO3KIU0ZGBjzx8fEpKCiAh83NzSdOnOjbty98R+Pz+eSE0d8SFxenra09derUXbt2/frrr+jErL6+fklJSUhIiIaGxoIFC0JCQrZv3/7ee++Bq4ODA7mV0ct2/vz5pqama9as2bdv3zfffIOWBIOCgvh8vpWV1eDBg7du3bp3715/f3+ktB8/fhzFKaGrpzdqEMgpU6aEhIRwudwlS5ZoamqKE8gTJ05AX6GnpxccHJydnQ1i88EHHxgbG2/ZsgUC+vn5wVuampraFUsJI4scw0cHZ7C0tJTSD1A03iNHjnC53OnTpzNqvHKPj3I0E/lGAbmhVwTSeKXvPJU1YmIwnQvWeHsKcMs8QRCzZ88W5yc6Ohr8fPHFF3RXtA9twIABbW1tjKrmo0ePyA/3798PQfz9/Sn+m5ubR44cCesMlGVARVi4cGG7azXoU2W783gE3DChrq5OX3MIDw+H2AiCoGvvL1680NTU/PjjjynP0VSvIzXe+Ph4upO3tzdBELq6umR1XZrEKF1a5EskmvgmJyczph9Wz2JjY9ETdBszmmQj8vLyYDOkTOM30qMGDhy4atUqUCqAr7/+mixpfD4fpg56enrPnj2jxPPzzz9DPNu2bZPwFjRlIfP777+Lq47a2tp+/frBekVlZaUi6Ve8k+Hz+bC3U0dHh/x5Ajh37hzE4OXlRRcbCXA4HMaZrric2tra/vLLL2Sn48ePg5Ozs7MSy1YC0LI0NTV1dHTS0tLITkKhEK3Krlq1irHrsLW1NTMzIzeikpISXV1dssYrd2l/9dVXqCopTmlpaTo6OqCuMPZR0osT5GXs2LGwcEomPT0dtkquW7eu3ao8cOAA2Wnx4sXgtGTJEkNDQ6RRwLiDVJSLFy9S4iSXrYODA/lDQG5uLuxu1dPTW7JkyfTp05ubm5Hr2bNnIaCLi4tMXT05F/v27SM7nTp1ilEgCwsLe/XqBfvhKZsL2traPv74Y7QLV6Yxol2NV77ho4MzKLkfQLuTGDVeOTIoXzNRZBSQGwnDR7udp9JHTAymU8Aab09Bmsnoy5cvdXR04LgjvfsmSNB38VlaWlL2tfL5fFjE0NLSoiuKIpHo+vXrENuIESNESgLtL1q/fr04P2gr0Y4dO6SMFo2U9CEWfTYmCMLT05Pi+ueffxIEcerUqc7VeJctWzZ69GhGJ7Qf7I8//mD0IC4xypUWuRMZFhYGTgsWLKAHFAgExsbGFhYW5Cm1r68vaBrkuTilQuXTeIcOHUqZu9+/f9/R0TEyMhL+3bp1K/hknMe/fv0aPvzr6urSEyBhyoLaGpvNRiuQjFOWTZs2KZJ+xTsZ1JTEfZNyc3MDD3FxcSKVabyurq50V3Rorb6+XlllKwG045GxKHg8Hiw7a2holJSU0LsOxo7F39/fzc1NwdIuLi6GV2tqahYVFdFDrVq1CkJJ1njbFaecnBxra2vK9hAE2NU3MTFh/PaB3jJ+/HiK0+PHj1ERffXVVxRXuLsOVmspTuSyvXHjBsV13rx54KSlpVVWVkZxRcfpycIjvcY7btw4uuuAAQPocS5fvpy+RRYBljLkGCMkjCyKDB8dnEH5NF75Mih3M1FkFOgUjVfpIyYG0yng4+aY/4+uru60adPg2E9ycjLZ6fTp0wRBrFixAv6Niooiu967d6+oqAi6RURERERDQwNBEBMmTGC0xODh4QFb19LT01NTU5WShVevXsEPdMiEDnJqbGyUMtqPP/6YMeN8Pv/KlStz5syBDF6/fr22tpbsISoqis1mk7XiTiEsLExcCaPTaLJWgXKlRe5Ezp8/HxSS06dPv3jxguIaFRX14sWLgIAA8kE++N3a2hofH09/V2hoaEZGBsQpK0uWLKGcGHRxccnIyJg/fz4YTUDnzNHsmQyLxfL09ARLb1CGUoLa2uTJkxnvn5g5cyb8OHLkiNzpVxyRSHTgwAH4PXfuXEY/6MZItLKqCtBmEDLI8hDZLo6yylYCjMVrbW0N6qhQKIyIiKB7MDQ0pB8g/PPPP9G9zXKXdkREBJj5GT9+vIWFBT3Up59+Kk2+2hUnBwcHHo/H2BZQq6+urqaYKWq39AYPHgwf4xhdUS3n5eWJi9PMzMzDw0NcQA8PD3Nzc3GuBQUFhOwwFildIFtbW5EwMAYxNTWFLwVdbfjofhmUr5mobhRQHaobMTGYjgRrvJj/BZoYUbSU6Ojod999d+vWrXDIBO1oBaBfpkyqrl27Bj/QLjIK6urqaEsqWu9VELTfCV3lQgc5SW++cujQoWD5+ebNm9XV1eh5XFxcS0uLn58fTD1bW1tjY2ORa21t7bVr17y8vMhWQzsdPp//7Nmz3P8HWpcj24/teGmRO5F6enoLFiwgCOL169d0Kx0HDx7U0NCg3FOFji3NnTv3p59+oujJAwYMcHR0lM/4JGzUF0d2djZYxdTS0nJycmL0g84ZIr1FGlBbQ1mjYGdnB02jrKxMgv4gOf2Kk52dDTWopqZGMWyLeP/99+FHQkIC2cypckE9DxnYnwwrTkovW3GoqamJM1eLLAPTDfNAFtBJSOWWNpI9RgvbYKxLGvPUMolTa2trWVnZkydPUKtHXyQld030pqSmpoa+TdDLFpkcgw8Z0mfQyMhI3BuljFYCjHEivRoJ5MOHD1GxiBtYGWW704eP7pdB+ZqJ6kYB1aG6EROD6Ujw7USY/8X06dPZbDbcJ7Fnzx7orx88eFBQULBlyxZzc/Nx48YlJiYWFhb++++/aLYUHR09aNCgYcOGkaP677//4IeEe02QNctHjx4pJf3oQgLytRAUkBVltA4gDR9//PH27dvb2tpiYmKQBnX69Gk2mz1t2jRjY2PYFRYVFYX2CMXExLS2ttIXMzuF7OzsPXv2xMfHoytkKEgosQ6QFkUSuXLlSvhqfvDgwW+++QZNMrKyspKTk318fJAmAyxfvvzw4cPZ2dlNTU2bNm367rvvJk+e7O3tPWvWLIpPWZF8qwS6P0NXV1fcAia6cik7O1v696KYs7Oz9+7dy+hHS0sLSi87O5tyQ4aU6Vcc1CeYmpqCuWAJfcKrV694PB6yjKJc6GZgYd8y/CBfZKKsshWHgYGBuOtP0GU2ubm5clSW3KX95MkTeCguL9ra2vr6+uTvAnKLU0tLy+HDh48dO5aenv769Ws5uibKTXjkr5k6bxC3x4dcy9LHKU54pIlWcYFEVWNmZiZu/FJFK1Z8+Oh+GZSvmahuFFAdqhsxMZiOBGu8mP+Fnp6el5fXuXPnSkpK7t27N3r0aLQoB5qbr68vLDhERUWBDnP//v3CwkJkkRKBrg8FKxSMoJ0w9P2o8oHu16XsLiZTV1cnx8A5d+5csAwcFRUFGi9czjl9+nQ9PT13d3cTE5Pq6uorV67w+Xy4C+H06dPa2trIAk0nsn///sDAQKFQqKGhMXXqVGdnZwMDA9AMm5qakIXSTpQWRRL53nvvjR07Njk5OT8//9q1ax9++CE8hy2daHM1QltbOyEhYf369UeOHGl9w6U3rFixYuLEievWrYNNZXIg+eZG1CLq6urAhI8EyFsJ2gXFfPINcscs683MsiJTnwDdgoo0XsZTD4zLFMoqWznKHJUSY2/WbmXJXdqoh5QQkM1mt6vxtpvCiooKT0/Phw8fEgRhZWXl5eVlYWGBFMvY2FjKcQlGpDnAIiuSA8odreICKWXVdMHho/tlUL5morpRQHWobsTEYDoSrPFiqPj6+oINz6ioKNBhyItyPj4+gYGB4BocHEzRcMigHXcSvnkjJ+k3GEsGmQ8pLS0V5wd9xKXcri6ZYcOGDRo06OnTp3BY19DQMC4u7vXr17A7V0NDY86cOYcOHWppaYmLi1uwYEFdXR1sae708y137tz58ssv4XPAjRs3KFvC+Hy+3BqvEqVFwUSuWLECJscHDhwAjbexsTEiIuKdd95Bt5WQ6dOnT2ho6Pbt20+dOnXy5MmkpCQ4YXXjDRwO58iRI0rfpoWE3MLC4sKFC5I9Uw5AShnzjh072j00jqzFdDwy9QlK7BYUoRPLVsHuUe7SliagUvDz8wN1d+nSpQcPHqRs0i4rK5NG4+1RdFjVdMzw0cEZbGtrU2IG5Uuq6kYBldIpIyYGo1ywxouhMmPGDG1t7ebm5ujo6F27dj18+DAvLw8tyg0YMGDMmDEpKSkFBQUZGRlOTk7R0dEDBw6kn0gxMTEBtZPP54t7F3Ji3PIkB8jOBOM+QPiwWlFRAb8ZN9ZKwNfX96effoLDuhwOB5Zw0STY19f30KFDoN0tWLAgJiampaVF8mnVjgHZkl2/fr3ST0ApS1oUTKSvr29gYGBNTU1sbGxJScmAAQMiIyMbGxtXrFgh4cBh3759v3xDcXFxZGTkH3/8UVxcDPdDOjo6orudlQUS8tbWVnFHN+WOGdqaiYmJcmNWUQlI0ycosVvoymXb1NTUblGgE6QdU9pGRkbwWVBCwJcvXxKKkZmZefPmTbhAeN++fZLPJGMokqDSqumw4UN1GWTUQpFhS6VkUL5morpRoAPo4BETg1Eu+JMMhoq+vj7sUSksLExLS6PbGSLbK0pLS+PxeIxHVdG5TQkmMfPz85VrMmfs2LHwoZHH4yHNlsy9e/fgR//+/WVdkEHZPH36dGNj46VLl6ZOnYqWcCdOnAij9eXLlxsaGk6fPs1isZAd104EHQpCN5GQ+Z87yrqAtCiYSG1tbbiEs62t7fDhw7DYq62tjc5US8bCwmL9+vV5eXkobXQjWIqDWkRFRYUEPUeRmOWzE9thoHTWvkFyn2BsbGxlZUV0Nqou28bGRnHbg9FBweHDh3dkaaPXPX36lDFUfX294moVavLvv/8+44lNBbumbgmqmtraWrQ/lkJJScnbMnwoPYPouwljB8sYUO4MytdMVDcKdCQdM2JiMMoFa7w9DmmGKLJqFx0dbWdnR/4Y6ePjAz+ioqLEbVIlCAKurhFnaBQsSKGLW5V1DsTQ0HDMmDHwm/HQ3YkTJ+CHHLqok5OTnZ0dQRBXr16NiIhobm4mZ1xTUxNuq29ubo6MjLx69eqUKVMMDAyIzgaZ3GDcGynh+7SUKEVaFE8kusUxLCwsISEhMzPT19eX0QLN5s2bGe+D0dbWRvdGiLNfogiWlpZDhw6FNijhMo+ZM2eam5v/+uuv0seMNhrAZjNG7ty5Y25ubmNjw7jQ0TGdjKWl5ZAhQyQnFZkn9fLyksYgsJSvlpsOKNu7d+8yPr99+zb8kO86FrlLG70OJUDKBMuE5CavlK6p+zFo0CB0Ec6dO3cY/Sjrqr+OGT6Um0FkyAPWHimkpKQoMYPyNRPVjQKKI67z7KwRE4NRLljj7SkgI8bkCz8uXrzo5OQEi2NkZs2aBXYmwsLCnjx5QlFRLC0t4cTm06dPw8LCbGxs0GdLMnPmzAErzenp6ZmZmXQPUVFRMEH09vZG52+B8vLyDRs2bNmyRYIBKnF89dVX8GPHjh2UZd60tLS///4bftMNGkl/MW9LS8uGDRu0tLQoajNaz9ywYUMX2dJMtviKvi+QuXXrloLxK0VaFE/kO++8M3nyZDjCDbetrly5ktFnYmLiiRMnGKdEenp6cHRKpjPe0rNmzRr4AQvRdHJzcy9cuFBZWSmTwTNvb28owKSkJHH7+Q8ePFhRUeHq6iqTiXKldzJBQUHw46+//qLHIBQKUQtFPuV+9YwZM5ycnNC2DvnogLKF0xAUkpOTwVKrgYGBuBtr20W+0p43bx58qsvMzGQsvbCwMEJhUJPPyMig70Fta2vrIlezdDUCAgLgR2hoKN310aNHjHpdlx0+lJtBBwcHcd/Z4+PjGS8PkzuDcjcTRUaBly9f/vwGuBtCKbTbeXbiiInBKBGs8fYUTExMwKIgeWNPUlLSw4cP6dYRDAwMwPwPfOCkL8qhJ3w+H5RAOhoaGn/99RfsMV6+fDnFuH9ZWdmGDRvgMAzdRv+0adN+/vnn7du3y3G1j6+vL+hUVVVVY8aMOXXqVFFRUX5+/v79+z/44AOYWi1cuFC+IzTkjNOXcCdNmgT3QPL5fE1NzVmzZhFdgE8++QR+BAcHUz7ElpWVbd68WcH4lSItSkkk+opRWFg4bNgwtNrPyNatW+kPz5w5AxKioq8VHA5nypQpsNcALH6RefnyJbx30aJFaOomDRoaGkePHlVXVxeJRIsXL6avNEZERJw8eZLNZn///fdEp3YyixYtgg8TZ8+ejYuLo8Tw008/wSGIdevWibuskhHYfEF+dUNDw9WrVx8+fKigNSlVl62uru7ly5ePHTtGflhVVeXv7w+/f/75Z7kv9JavtHv16gV25iAGiiH9Y8eOXblyBc2S5WbChAlmZmawvRO9DrFz584uvkW/s1i9ejV8Sr506RJF7amrq1u4cCG65PatGD6Um0HoXWGTLdquDF9VFi9ezLhvWe4Myt1MFBkFKisrN7whMjKSUBJSdp6dMmJiMMpEhOkxfPrpp1Dp4eHhxcXFcXFxoJ7dvn2b7jk8PBw829ra0l3RtexwMlbCSyMiImCz0IgRI2JiYoqLi589e/bXX39BT2piYnL37l1KEPKtjHp6enLktKioSMI0d9SoUXw+XyQv6HrhY8eO0V0XLVoErl5eXozBg4KCOBwOWhy2s7PjvCErKys8PBx+w+0LbDYb/j1+/Difz4ff6C54V1dXeNLU1CQ5wc3NzUj369Onz08//XTlypWkpKRdu3aZmZl5eXmBk5mZGUT4+PFjEABxiVGFtMiXSAotLS3oesADBw6IKxB3d3fw4+vre/Xq1eLi4tLS0nv37q1fvx7uU3FzcxMIBJJLVSQS5efnQ2IsLS0hQh8fH3iSmJgoLlRtbe2ECRNAlfryyy9TU1PLysoyMzMPHToEl6O6ubk1NjYi/4mJieLesnv3bnLMJ0+ehMV2BweHiIiIgoKC4uLiW7duffbZZ2pqaiwWKyoqSvH0K97J1NTUjBs3Dg4CbNy4MTMzs7y8PDU1FR26Xrx4cUtLi0zvzc3NhU25bm5uOTk5eXl5CxYsgNP1EnKKhBlc0fzS09OTw+EEBwfLXbbSAPqemZkZLLTOnDkzNDT0xIkTmzdvBieCIPz9/dva2sD/7t27GbuOoKAgCW+Rr7Tb2tqQym1ubr5ly5YTJ06EhobCV7zIyEiUeEXEKSYmBm2l9vLyOn78eEpKyvnz5318fPT19SHZlOqQXJXp6engCt8IWCwWOQHnz5/ncDh+fn6UziQrK0tc2ULvumXLFg6Hg9IzcuRIcrEzCs+PP/4ooatXUCAzMjKgWcFaXFhY2IkTJ7Zs2dKvX79hw4YhU0xcLrddIWx3ZJGvZ+7EDKLtJBoaGu7u7n5+fuPGjVNTUwsICNi2bRs4TZw4kcPhLF26VMGhR45mIt8ogEDr24sXL263ciUMHz/++KOUnacSR0wMpnPBGm8PoqysbMSIEQQJFou1a9cuRs+1tbVgBGLt2rWMHlxcXOASxXbf++DBA3RFKvnVCxcuLCoqYgyCNvNwOByRXFRXV8+fP59+Msfb2/vly5ciBYAtSSwWq7a2lu568eJFeNGRI0cYg8N4RufSpUtoNxeFwMDA8vJyRif47N1umhsaGgICAiiloaent2PHDvqNf7du3RKJRBISoyJpkSORdLZs2QKh6uvrxb3o4cOHK1euZPwmYmRktGXLllevXrVbpJJPYR09elRCwObm5l27dtENERsbG3///feUqYMEiyCenp6UmDMyMjw9PenHXz08PNLS0pSVfsU7GYFA8Msvv9BPWdvZ2UVGRsr36t9//51y56ejo+Pz588l5BQJM6Oru7u73GUrDeTZ8JkzZ9DHGsDAwOC3334TCoXIvzhjB9bW1pJfJF9pC4XCkJAQyjaW/v37nzt3TiQSwWXm5ubmCorT1atXkYF9xLhx4zIzM+FiM0p1SK7K8+fPS0gAUngoXLp0SVzZQu/KuCEIFTtjwNGjR0vo6hUXyCdPnkycOJHsqq6uPnfu3Lq6OnS0MjQ0tF0hlGZkkaNn7sQMCgSCxYsXk9uptrb2hg0b2traKAKgra0tdwblbibyjQKIvXv3grezZ8+2W7kSho/Ro0dL2XkqccTEYDoXNWwOsUchEonu37//6NGjV69emZqaTpgwAXrkDqCysjI1NbW8vJzFYvXv33/cuHES7m1vaWk5e/aslpbW7NmzFbnkraamJiUlpbS09MmTJ7t27YJ5ZHx8/NixY4meR01NTXJycklJCYvFsrKycnNzg/Xb7pTI2NjY2bNnf/7554xnwCgUFBQ8evSosrJSIBAYGBjY29s7Ozt32B2wbW1taWlpeXl5tbW1+vr69vb2I0aMUMrbq6qqoK2BWuXi4tKRd/BK38m0tbXdv38/Pz+fz+cbGxsPfYMir66urk5ISCgvL9fS0hoyZIirq6sctq86rGzNzc0rKirMzMxA6xAKhcnJyTweTyAQWFtbu7u7w/qJspCvtJubm2/fvl1YWMhms21tbZEx/F69er18+dLe3v7x48cKJgy+JmRlZTU2NhoZGY0cORJts8RI5unTp//++29dXZ25ufmoUaPgLOXu3bvhs+zJkyflPgHeRYYPuTNYXFycnJz84sWLfv36jRkzBm2aUFEG5W4mso4Co0ePvnfvnoWFBY/HU+5tvdJ0np07YmIwCoI1XkxPAQ2Turq6MTExcLwN0834+OOPz5w58+DBA5lOgWIwHQ9F432LqKurg02nH3744ZUrVzo7OZj/xddffw0rgcnJyZJtGbylvC0ZVHozOXLkyJIlSwiCOH78ONqcj8FgpARbrsL0FIKCgsC0TFNTk7e3d1FRUWenCKNkKisrY2JiRo8ejdVdDEYRkpKSFi1aVFhYKM4Vfnh4eHRsujD/w5o1a9DuVjpgplhXV5fRKv5bwduSwY5sJmfOnAHTjBs2bMDqLgYjB1jjxfQgtm7dunbt2uHDhycmJiJDDpi3l0WLFsXExKB/9+/f39raKt+9UxgMBpGXlxceHo7uLqIApoO0tbVhxQnTwURHR2/ZsuXly5d0p8TExH///ZcgiGXLllFOZr5FvC0Z7MhmUlVVpaamtm/fvp07dyoeGwbTE+nkc8QYTIcjqxlYTJeFIIixY8e2traCpRN9ff0BAwY0Nzd3drowGLG8ePGC9wYwWmNiYgL/1tTUiLoMYPBGS0srNjaW/Pzly5dffPEFTB4OHjzYeQns0YBNrGnTplFkJjU1FeyfDRo0SBqLhl2WtyWDHdxMqqurlRUVBtMDwed4MRjM2wqY1rCzs7OxsUlJSXn16tX58+e7yDXIGAwjy5cvZzSrFhgYGBISQnQNzp075+PjA9ODoUOHDhs2rE+fPuXl5Xfu3KmpqdHW1g4JCVm+fHlnJ7OH4uTk9PDhQ9jZ6+7ubmFh0drampmZCYufY8eOPX36dEcaq+uxGcTNBIN5i8AaLwaDeVv54osv7t27V1paqqmpOWTIkLVr106aNKmzE4XBSOLixYtpaWn0566uruLuyOkUiouLL1y4kJiY+N9//1VWVr569ap37942NjaTJk1aunSpNMZvMSpCKBTevHnz2rVrDx48KCgoqK+vV1dX79u3r4uLi4+Pz/Tp04m3nLcog7iZYDBvC1jjxWAwGAwGg8FgMBhM9wRbrsJgMBgMBoPBYDAYTPcEa7wYDAaDwWAwGAwGg+meYI0Xg8FgMBgMBoPBYDDdE6zxYjAYDAaDwWAwGAyme4I1XgwGg8FgMBgMBoPBdE+wxovBYDAYDAaDwWAwmO6JZmcnAIPBKJn9+/dHRUWhf42MjM6ePdupKcJgMD2FpqamkydP3rp1q7y8nM1mm5ubu7i4eHp6WltbSwgVFxe3e/dugiAWL17M4XCUlZiPPvqopqaG3geiTnLv3r2Ojo5ET6W2tnbOnDnkJ0FBQTNnzoTfe/bsiYmJeVuGEvkEr4dz+fLlnTt3kp+cOnUKXyOM6ZZgjReD6W7U1NTweDyCIIqKitra2mQdvY4dOxYYGPjuu+9evHjRyMhIZcnEYNrn1KlTe/bsoTzcsmXL9OnTpYyhqalp+vTpr169Ij9cv349ZaKPUQoPHz6cMWNGcXExi8Wyt7cnCOLixYuHDh3q3bt3XV2dhIClpaW3b98mCGLixIlKTE9ycnJFRQW9D3z69Cm8TnKquhn0vl0oFMJg0dDQUFNTQxCEn58f8l9dXa3IUPJWCF4Pp7GxEaq4srISOkmBQNDZicJgVALe1YzpfHJzc2+/4eXLl52dlu7Ali1beG/o27evHMHXrVtXV1eXmpr6999/U5xwTXUuzc3NUP6PHj0iegbNzc11bygsLLz7/9i4caNIJJIyhtDQ0Fu3bkHAwsJCiO3169cqTnhPpLm5edasWcXFxYMHD37y5EnWG9LS0nR1dTs7aRjmvt3ExAQGi59++onuf8eOHYoMJR1G1xe8Tuy6JY/aPj4+UMVTpkzp4IRhMB0M1ngxnc/OnTs93pCXl9fZacEQQ4cOhR8ODg4UJ1xTnUt5eTmU/6ZNm4iewWefffb4DcHBwehhZmZmbGysNMEFAsHPP/+M/g0ODobY5s2bp5r09mjOnDnz/PlzgiA2bNhgY2MDD52dnT/66KPOThqmnb79rabrC14ndt141MZgAKzxYjCY/8X58+e5XO7169fxR19MV0NNTQ1+fP/999L4DwsLq6ioUFfHI11HkJCQAD+cnJzIzw8ePPjkyROiu3Ps2LHly5fv2LGD6Kp01769hwseBoORBjwPwGAw/wt9ff2AgIBJkyZ1dkIwGCq+vr6g9D548ODixYuSPTc3NwcHB/fr12/8+PEdlcAeTVVVFfzo3bs3+XmvXr1MTU2J7s6NGzdCQ0PJVgO7Gt21b+/hgofBYKQBW67CYDAYzNvBkCFD5s6de+rUKYIgtm3bJtl+1eHDh8vKyvbu3fvPP/90YBp7Lq2trfBDQ0ND6TG/ePECfhsZGbFYLLqfx48fJyQkVFdX9+3b18PD45133pE+/qampvj4+IKCAm1tbQcHh4kTJ2pq4tnRW4PqBA+DwXQbcJ/es0hLS7t+/XpeXl5TU5OBgYG9vb2rq+uoUaNg119LS0t6ejo9lJ2dnYmJCfwuKioqLS0lu5qbm9fW1jY3N6Mnffv2HThwIEEQKSkpFy5cKCoq0tfXHz16tK+vr46ODvKGXoc+0GZmZpLtBFpaWvbv35/8rpycnISEhJycnJqaGhaLZWZm5urqOnXqVG1tbUqaCwoKULT0hD158qS2tpaSC6XcYdDY2Hjr1q0HDx4UFhYKBAIDAwMHB4cpU6aA9Ug6GRkZchQdhfT09JiYmOfPn7PZ7IEDB/r6+qKzTDIhLjFy1JRkSZOVpqama9euJSUlVVRUsFis/v37T5o0yc3NjT6/efbsWWVlJfqXxWKNGDECnkdHRxcUFAgEAisrq9mzZ8NzcWRmZl66dKmgoKCpqcnY2NjZ2Xnq1KmMywXiCi0nJ+fs2bM8Hk8oFJqbm48cOZJyqEx6YUb5Kisrg39ramru3r2LXNXU1EaNGkUP9fjx4/j4+Ly8vPr6emNj4/fee2/atGmUmgKLrPn5+eQnzs7OWlpaAoEgOjr6wYMHlZWV+vr69vb2s2fPJotWfX19XFzcv//+W11dra6u3q9fPycnp0mTJqnUzs2WLVtA401LS7t06dLUqVMZvb1+/Xrnzp1mZmbLli0Tp/HK3eNJ6Cvy8vKQbkYQhKGh4eDBg9G/5eXlhYWF6F9dXd1hw4ZRYpCvVKWXWOmRVX7A2C+swJeXl8NvY2NjmZRPOgKB4KOPPoqPjycIYv78+ceOHaN4eP78+bJly65cuUJ+uGDBgtDQUGnij4iI+OKLL+rr69GTfv36hYaGokt6OpiSkpLi4mLKQzabTblFCXqAUaNGoa3+jOL6zjvvGBsbi+umVITcXYpMwiyr4DU0NFy+fDk1NbWyslJHR8fS0nLSpEljxowhF6BS0t9hXbcE5Bi1ydTX10dGRmZlZTU1Ndna2np7e0u+xEsV/Q8Go2REmJ5BYWHhhAkToNL19fWtra21tLTg3759+wYGBr5+/RoNFRSOHj2K4lm/fj3FNTAwkDL/43A4AoHAx8eH4tPCwiIrKwtFJe51iODgYOQ5PDzczs4OnmtqalpbW6PO1MTEJCIigpJfxhsdORwOuM6ePZueCwVLuLKy0sfHBy0+GBkZ2djYoEKeNWtWRUUFPZR8RYeoqalhNM6xfv16oVAIl0mYmZlJmQV6YuSoKWkkTaaCDQ0NBfVDXV3dwsIC3ZBhb29/5coViueAgABywszMzFpbW9esWUNP80cffVRbW0t/XX5+PjrkZmhoaG1tDXWqpaW1du1aeuLphfb69Wt/f3/K63r37i23MNPzRUFbW5vin8fjzZgxA9WCjY0Nm82GNZAVK1Y0NDSQPR89epQSIY/HS05Opl9GEhISgkL98ccfenp6UC/9+/dHWVBTU3N3d79586ZIqUAit23bJhKJUAMZPXq0OP9cLpcgiN27d4tEIk9PT3pXJkGw2+3xJKSTYhNr9uzZZNeQkBCyq6OjIyW4HKUqq8RKg4LyQ2bevHnSvBHqC1UxorGxEd1XtGTJEqFQSAlYVFRkaWmJXmdsbIy2tvr4+EAB0vvAwMBA8PPll1/CD21tbXNzc/QRTU1N7cSJEzIVGgw69DqVlW3bttGL0d7enuzn3r178DwxMZH8nC6uJ0+elNC308ufy+XSkyTrUCJflyKrMMskePv27evTpw/IsLW1tbGxMXhzdHRMTU1VVvo7uOuWgEyjNnlSxOPxrl27RtkfLqHfU0X/g8GoAqzx9ggaGhpsbW0Jghg5cmR6ejo8FAqFly9fHjRoEHRVdXV1TU1NXC53+/btqLc9ePAgl8vNzc1FUaWmpnK53HXr1sF0k8vlJiUlRUZGcrncjRs3QkAOh+Pn52diYrJ27dqwsLCdO3ciE5GDBg1CPSC8jsvlurq6guvGjRu5JB48eEDpjg0NDSMjI1taWuBhfn4+ujwwNDSUnOWbN29yudxPPvkEXPv06bN//340X7x06RKXyx0yZAhBEN9++y3kQsFCzsjIgHf5+PgUFBTAw+bm5hMnTsDijL29PZ/Pp4SSr+iAxsZGFxcXcJ04cWJ8fDyPx8vKygoODtbX19+0aZOs0xR6YmStKSklTfpSXblyJYRavnx5eXk5PHz8+PHkyZNBKzh8+DDZ/507dyBJ+vr6kPdvv/1WX19/586dWVlZPB4vPj7e3d0d4nRxcWlsbCQHz8jIAO3a1tYWSUtDQ0NwcDCsA0yZMgWJHxAdHX306NEffvgBFRqHw9HS0lq4cOFvv/32/fffW1lZUTReWYUZ5QsZxRk+fDi5/A8dOkT2nJmZCVVvYWHxzz//gJIgEAjCwsLgug5nZ+fq6mrkPy8v7+gbnJ2dIf5//vmHzWYPHTp08+bNe/bsQQlD07sDBw6AVrB7925UhlVVVatXr5Y8PVKKxvvw4UM0D7t69Srd8+vXr62srExMTF6+fClB45W7x5OQzqtXr5JriqLxZmZmQpWBK0U7kqNU5ZDYdpFVfnJzcyFTw4cPh3Tu2LEDCSdjBUmp8fL5/LFjx8Lzr776qq2tjR4QzbbHjh376NEjeJiSkkI2RyxB4yUIQkdHJywsrLm5WSQS1dbWbtiwAZ7r6ekVFxd3vMablpbG5XLR4fOAgAAulwuKK2Lt2rWMIgHi+sUXX8Chdy6Xm5eXJ6FvV5HGK0eXIocwSy94y5YtAw+rV6+uqalB5QzJY7PZly9fVjz9jKi065aATPMrssYbGxurpaU1YcKE4ODgkJCQBQsWoM9A4eHhHdD/YDAqAmu8PYI9e/ZAh4U0MUReXh4sKZD1ENTLJycnM0YIi2axsbGMKp+NjY29vX1lZSVyEggEyIgiJRR5PTYjI0NcFqA7jo+Ppzt5e3vD/sCqqiqKU3NzM3rvjh07yE5xcXEEQfj7+4uUBGR/7Nixra2tFKf09HTYzbtu3ToJYWUtuq+++grNqilzwbS0NB0dHTiKJv00hZIY+qyo3ZqSVdIks3//foiNXk3Nzc0jR46EL9+UVQ4A5g2ampo6OjppaWlkJ6FQiD6ir1q1Cj3n8/mgruvp6T179owSIbrkhrIGRSk0W1tbMzMzNPMWiUQlJSW6urp0jVdWYYbP/4x6FBk+nw/7FXV0dMiaG3Du3DmIwcvLi64/oEnPwIEDV61aRV5P+/rrr9H0rqWlBVZIFi5cSE/A8uXLVa3xkpM6btw4uudDhw4RBPHzzz/Dv+I0XgV7PAm0W1PgStaO5ChVRSRWpfLD4/FEMkLXeGtqatAXvQ0bNjCGun37NniwsrKifE8sKSlB61SSNd5jx46JW5dbuXJlx2u8QHR0NKThiy++oLuinbQDBgygVwR8IiH3Qu327crVeGXtUhQUZsmC9/vvv4srydra2n79+sHmGvKwK0f6JaPqrlsC0syvyDm1tbX95ZdfyE7Hjx8HJ2dnZ1X3PxiM6sAab4/A19cXZv/0LWEikQisv5D1kLCwMOiqFixYQPcvEAiMjY0tLCwoqh0aTQmCuHbtGuMclCCIoKAgOXrkZcuWidvBmJiYCMH/+OMPumtubi58HNXQ0EDT2ZKSEmNj48GDB1OW+BQhJyfH2tqa8iUe8cEHH8CwyjhWyVF0xcXF8OVVU1OzqKiIHueqVavEzfZUp/HKKmkS4PP5sE6rpaXFuCH8+vXrkJgRI0bQXdH2M0bVi8fjQelpaGiUlJTAw61bt0IQxg8Tr1+/ho/Zurq69CyQa/DUqVMUV39/fzc3N8WFWZppE9oSKU7ndHNzAw9xcXHiJj1Dhw6ltO779+87OjpGRkaCqIO3H374gR5/WlpaB2i8//77LyrwGzdukH22tLTY2NgYGRmhHYDtarzy9XjK1XjlKFVFJFal8qO4xltZWYlOOP/444/iQi1duhT87N27l+6KVmslaLyDBw+m98klJSWwQmVoaCj9CpVyNd6XL1+C7QZzc3P6B00k/ARB0DflWlpaUnZBd7rGK7lLUVCYJQgeGkfYbDZa3WX8Srtp0yZF0i8ZVXfdStR4XV1d6a7oxG99fb1K+x8MRnXg24l6BDC5b21tBeMfFEJDQzMyMmBUAObPnw//nj59mmyFBYiKinrx4kVAQIA4u4impqb0+w/ef/99+EExCCElYWFhqampjE7IMAyjh8GDB8MnXqFQ6Ofnx+fz29raFixYUF9ff/LkSVh1VAoODg48Ho9yio+SyOrq6mfPnkmIRPqii4iIEAqFBEGMHz/ewsKCHtWnn35KdHlJk0BERERDQwNBEBMmTGA0gOHh4QHbxdPT08XJBggz/aG1tTXMHoRCYUREBFg0OHjwILgyViKLxQLFqamp6fTp0+JeZ2hoSD9Z/eeff6IbIxUR5nZBO2MJgpg7dy6jH7TVHy190FmyZAmldbu4uGRkZEBhIqcLFy6AEJJxcnLKyMiAbcCqY8SIEchQM+Vu3oiICB6PFxQU1KtXLyljU7DHUwqylqqyJFYV8qMgpaWlEyZMyMrKIgjit99+27x5szif6AsRo9Vu2DEhmenTp9MNF/Xv3x+W/Wtrax8/fkx2gg0mjECttbW1ifPQ1tYmdRn8j54wbdo0sHaWnJxMdoLaXLFiBfxLuQ/p3r17RUVF8PGx6yC5S1GFMFPGkcmTJxsaGtI9IPtkR44ckTv9itNFmh7sMaE/RIYe0QRGdVWGwagIrPH2CNBBjrlz5/7000+UKd2AAQMcHR3JRnT19PQWLFgA9k7pJhwOHjyooaGxZMkSca9zdHSkzyHMzc3hB9kkpnzw+fxnz57l/j/Q11OykV4y/v7+MIQUFhYuW7YsODj45s2bv/zyC9rKqHRaW1vLysqePHmCEtnY2Cg5kbIWHdKgGC09iouqq0maBK5duwY/0M5GCurq6qgG0XovBTU1NXEWJlG5waQ5OzsbbFpqaWmhbeQU3nvvPfhBVl8pODs7y3SviazCLJns7GwIqKamJs4YNfqAkpCQ0NLSwugHdoyLw87ODvbf3rt3b+LEiWhnKaChoeHo6CiTWVH5+O677+DH7du379y5A7+FQuH27dv79OmDLBJJg4I9nlKQtVSVJbGqkB9FePbs2fjx40HPHD16NDrDTKe1tfXJkyewfMdoeRhlXwLoCCgFZEAhOzub/DwzM5MtBvh2lpWVJc7D33//TcgC0nwoOm10dPS77767detW6OHR/mcAtAtxWlNnIblLUYUwU8YRNDZRsLOzA/P4ZWVlEr5HS06/4nSFpgcwzotg7zd5EqK6KsNgVAS+nahHsHz58sOHD2dnZzc1NW3atOm7776bPHmyt7f3rFmzUEdGYeXKlfAB7+DBg9988w3SnbKyspKTk318fMQFhL279IdgbxCmpPLlIjs7e8+ePfHx8cjQPwXy7QsUwsLC7t69W1hYGPWGqVOnks9xKYuWlpbDhw8fO3YsPT399evXsiZSpqKDqR6cumGMSltbW19fX/HvC6qWNHH8999/8EPC3Q/IAOmjR48YPRgYGDBe9gPnsuBHbm4u3BUE/+rq6or7go5usqFMgslIeR+DIsIsTaGZmpoisRFXaK9eveLxeMiimPS50NDQ2LdvH2wiSEhI8PDwsLa2njNnjre3N+OVUSpi5MiRnp6ely9fhmVe+Opx/Pjx/Pz877//3sDAQKbYFOnxlIKspaosiVWF/ChCeHg4+n337t3Q0FBx1m5hww4YgWf8uqf3hpcvX0p4Hd36LqUJoJtvOp7p06ez2Wy4EWfPnj2QxwcPHhQUFGzZssXc3HzcuHGJiYmFhYX//vsvUoeio6MHDRpEv/Wqc5HcpahCmCkxZ2dn7927l9GPlpYW9LfZ2dnixlNVX7TTFZqeTJMQ1VUZBqMisMbbI9DW1k5ISFi/fv2RI0da33DpDStWrJg4ceK6devQOTfEe++9N3bs2OTk5Pz8/GvXrn344YfwHDbeoP1UjKDbaMjIdxErYv/+/YGBgUKhUENDY+rUqc7OzgYGBjADaGpqQpZyxdG7d+8TJ06MHz8e+usNGzYoff2zoqLC09MTrMhaWVl5eXlZWFigy4piY2MpO9MULLq6ujr4IWHrJpvN7mCNVw5JEweaaErIINogTd+JitIjLiyKFm5mRq+rq6sDkyQSqK6uFuck4Y3KEmZlFRqUG+O0qd1czJ8/v3fv3kFBQfC9oLCwMOQNpqam/v7+a9euNTIyIlTPd999BxrvjRs3kpKSxowZs337dgMDA3SIXXoU6fGUhUylqiyJVYX8KAibzd62bdvmzZtbW1u//vrrcePGMa7Wvnr1ql1x1dHRkazxiguL7j9vamoiPx8wYADliilEZGTk/fv3+/fvL25Lv7j9OOLQ09Pz8vI6d+5cSUnJvXv3Ro8ejZZwYdOyr68vbFGJiooCjff+/fuFhYXIJnPXQXKXogphpsR88g0q7dgVoYs0PeknIaqrMgxGRWCNt6fQp0+f0NDQ7du3nzp16uTJk0lJSXAS48YbOBzOkSNHKJ3aihUrQEk7cOAAzP8aGxsjIiLeeecd+llTlXLnzh3Yo9inT58bN25Qdt3w+XxplIThw4f379+/qKgI7mC8f/++uC+p8uHn5wfq7tKlSw8ePEjZ2lpWViaNxis9KH6518y7jqTJnUHkhL4sSA8lLIrBwsLiwoULksMqsoypFGFWSqHJV26I6dOnT5s27c6dO8ePHz9z5gx8dKisrAwODj58+PCFCxdggq5SxowZ88EHH8Dq7g8//LBo0aInT55s3rwZLt6Ula7Q40lfqqqQ2I6UH3H06tXrwoULcIXYhg0bBALBvHnzwPg83We7GyKQViwOgUAgOSDF7oCJiYm4/UEPHjy4f/8+3DpOKAlfX18w0hsVFQVVT17C9fHxgXdFRUUFBwdT9OG3CNV1vyjmHTt2MB72JjNgwACik+gKTU8mOmzExGCUBdZ4exZ9+/b98g3FxcWRkZF//PFHcXExbCRzdHSknJjy9fUNDAysqamJjY0tKSkZMGBAZGRkY2PjihUrOviAKLKmuH79erkP33755ZdFRUX29va5ubnZ2dlBQUHo8hvFyczMvHnzJiwm79u3T6aTnPJhZGQEG2L5fL44P5IXN7qOpDFiYmJSWloqOYPIiXEjFn19hjEsrJuhGFpbW8Ud/e06wiwOlAtpCk1CuUmJmpqa+xv2799//fr1sLCws2fPwhd9b2/v/Px8MJOuUr777jvQeK9cuZKRkdGrVy9ppIsRVfR4jPNXyWqYlKWqContYPlhJDAwENTdtWvXXrp06datWzk5OV9//XVoaCjFp76+PovFamlpqaioaGtro39Ha2hoaLcPLC8vl/xcFXmUnhkzZmhrazc3N0dHR+/atevhw4d5eXloCXfAgAFjxoxJSUkpKCjIyMhwcnKKjo4eOHCguHOVXRbVdb9oHDExMVFpx94Nmp5MdNiIicEoC2y5qodiYWGxfv36vLw89DGYbq9FW1t78eLFYHzy8OHDsPShra2NjN13GOg0CLLOTwZd9SGBkydPHj169Msvv7x58yb01AcOHIiJiVF6Ct9//336WoSUiZQJZHDl6dOnjB7q6+s7UeOVSdIYQcfS8vLyxPlBxqvFmRVpbGwUt68bHYSGkkSvq6iokKAndwVhlgDKRe0bJBeasbGxlZUVoQw0NTU9PT3PnDmTlJQEWyfKy8uvXLlCqJ7x48eDggRroV9++aXcG6qV2OOhb16MslRSUqJ4qapCYjtLfhjXjtTV1SMiIsC+blhYGMU+EywcDRkyBOyNMXaDmZmZ7b7uwYMHjM/BUrQE01Ydg76+PpwEKSwsTEtLo1ulIlu3SktL4/F4b90Cr0q7XxRzQUEB0YXpCk1PJjpsxMRglAXWeHsEmzdvZrShr62tjezLM1rQWb58OfwICwtLSEjIzMz09fUFg6KqQNx0H21aY9zJI+GbKPDs2bOAgIDhw4fv2rWrX79+x44dg+eLFy+GhUfFkZxCaRIpK3DBLxiqZfRw9+5dQmWIqym5JY0O3MxBvoCEgkAgQPdSSjgeLK4cULlBSVpaWoJ1VpFIJOFmoJkzZ5qbm//666+EvCgozJLL39LSEnQAgiBgPzkdZDbTy8tLvqXLR48eeXt7x8XF0Z3Gjh2LrkiVsqKVaLRZV1c3KChIkaiU1eOhbdWMPQzjAQdZS1UVEtsx8iM9AwYM+PPPP+H30qVLCwsLKR7Qxw7Gz5dnzpxp9xVxcXH0dXgejwfacr9+/d555x2iU0Ea7OnTp6Ojo+3s7MhLaj4+PvAjKirqLd3SrNLuF+1kFifPcNLE3Nzcxsam3T3witOJXbdyP7t32IiJwSgLrPH2CBITE0+cOME499LT04MjFoy3ibzzzjuTJ0+GCxLhlraVK1cqPXlo6yPZ4P6MGTOcnJzu3btHNquLNBwyt27dkhB5a2urn59fS0vLqVOnwPiEl5cXGFqora399NNPGe9IvHz58s9vkNLGIEphRkYGff7U1tamdOv88+bNA2u0mZmZUEoUwsLCOr6m5JY0OnPmzAErzenp6YxrNVFRUTBB8fb2ljArPXToEP1hcnIy1KyBgQG6S3DNmjXwA9b36OTm5l64cKGysnLGjBmEvCgizIzlf/HiRScnJ1icJAgCqXx//fUXPQahUIiuSJFbOayuro6JiTl//jyjKzKSTKno8vLyDRs2bNmyRdwKhtxMnDjx66+/njdv3q5duxTc7KesHk9PTw/OBD59+hTu8ECIRCLG8xRylKoqJLYD5Ecm5syZA9o+n8/38/NrbW0lu6Ll999++41iHSc/P5++EZpOYWEh3dumTZvgx8KFCzv+jjcKs2bNAmNCYWFhT548oSi0lpaWcL736dOnYWFhNjY2aPHt7UJF3a+3tzd0uUlJSWAQjs7BgwcrKipcXV0Z92cphU7sutsdteWmY0ZMDEZpiDA9APgQvnjxYroTXCEIdh0Yw5I/kw8bNkzCWzIyMsAbh8OhuyLbwu7u7hSnXbt2gdO5c+fgSX19PYzxxcXFIpEIXSpgYWFRWlpKDltaWmphYSEuZpFI9O233xIE8eeff5IfNjc3oyvvfvzxR3oodAn79evXRVIgEAjQLRfbt2+nuG7fvh2V4a1bt5RVdOjCegcHh+rqarJTeHi4gYEBDHVmZmbSZEGaxLRbU4pIGp2bN2/C2bwxY8YIBAKyU2lpKUz9jYyMioqK6GGhOnR1dQ0MDMLDw8lOlZWV9vb2kJiDBw+i521tbVOmTIHnZ8+epUTY2NgI+xsZcye5BskoIsxtbW1grWf48OEUCV+yZAn8KxQKQWcDC+GUGJBZrHXr1tHjnz17NrjyeDwJWQC1XEdH57///qM4NTU1gVndPn36NDQ0kJ3QoeUPPvhAJDuwGX7btm1yhEVbAI4ePdquZ+l7PMmg+3s/++yzlpYWePj69esvvvgCbWh3dHRUpFQVkVhxdID8MMLlciEsvYpfvnyJGuzGjRsprkgDHDZsWFJSklAobG1t/eeff+AqF9BX6X0gMi6lpqamqakZHBxcW1srEomeP3++bNkycDIyMnrx4oX0WQD1m1ynyoJscunff/8V1y2DEiIhHgndFCp/LpcrrjuVdSiRSSQUEWbJb7lz5w4aR5qamiiuoEay2ezHjx8rkv52c6fSrlsC7Y7a0uQUtRfyBEYV/Q8GozqwxtsjQFu/fH19r169WlxcXFpaeu/evfXr18Oyp5ubG0WjQLS0tKCLKA8cOMDoZ/fu3RwOZ+bMmeDNzs6O8wYYXc6fP8/hcPz8/MDVzMwMXNEAk5ubC/MSNze3nJycvLy8BQsWwNINeGhubh4zZgwE79Onz08//XTlypWkpKRdu3aZmZl5eXnRY05PT+dwOPPnz1dTU9PV1f3ss882bNgAsT1+/JjD4aAyUVdXX7BgATk9IpEI9ePPnz+XspBjYmLQaoCXl9fx48dTUlLOnz/v4+Ojr68/btw4cPL09ORwOMHBwYoXXVtbm7+/PziZm5tv2bLlxIkToaGhs2bNgqsyYJrCZrMhFEXxoxMUFMSYmKysLClrShFJYyQiIgJ2/44YMSImJqa4uPjZs2d//fUXLKCZmJjcvXuXMSCaosGEZubMmaGhoSdOnNi8eTP6NuHv79/W1kYOVVtbO2HCBDgi+OWXX6amppaVlWVmZh46dAgm0G5ubo2NjeQg4mowKCiIMWFyCDM5ONzXCjbAiouL4+Li4KDj7du3kZ+amhqQN01NzY0bN2ZmZpaXl6empqIFscWLFyMdTCQS5efnw7ssLS3Bg4+PDzxJTEykZwEtRJuZmf3++++PHj2qrKzMzc2NioqCA9WamppodgWQr6fW09MTSU1WVhakBHLk6OgI/968ebPdsIcPHwbPaF103LhxFJGWr8eThidPnqAbTSwsLHx8fD766CMzM7PevXujuzcNDQ0hPRcvXpSjVOWT2HaRVX4SExPFyc/u3bsV13hFIlF6ejr0A2pqapSvkNXV1Q4ODki6NDU1kQmrJUuWiFPV0Ax+w4YNjDfQsFisy5cvy1RuqtN40R3Ftra2dFcej4eSfe/ePZn69pSUFPjh6uoKTq6urmgMCg8Ph99wjBwNJcePH5ecYFm7FPmEWXrBO3nyJOh4Dg4OERERBQUFxcXFt27d+uyzz9TU1FgsVlRUlOLpl4wqum5pkDxqi8spqmJwRU2MMoFRRf+DwagIrPH2CB4+fLhy5UpGy/tGRkZbtmx59eqVhOBbtmyBeWp9fT2jB3GnKOvq6kQi0bZt2xhdyR8Lf//9d8otcI6OjmRts6GhISAggHL0UU9Pb8eOHfSr3m7dukXfHGhvbw9Rids4itLT2toKJ/dkXeG5evXq4MGDKdGOGzcuMzOTcl8FWsFTsOiEQmFISAja8Qj0798fZsZItQMCAgIkpx9dcE/h0qVLUtaUgpLGyIMHD9DlqAgWi7Vw4ULG1V2APNM9c+YM0mEAAwOD3377TSgU0gM2Nzczbo41Njb+/vvv6eq6uBq0trYWlzZZhZkctqysDG1PQEWxa9cuyisEAsEvv/xCP4BqZ2cXGRlJ8SzhFBbjomhTU9Off/7p4eHBaJN8woQJjJ8h0Ma2dpfByVy6dIkxYYwrURQkWJwii7QcPZ6UXL9+Hc0jgWHDhmVmZtIP1AUHB8tXqnJIrDTIJD8SbNF5enoqReMViUToKGC/fv2qqqrITlVVVZ988gl5+zGLxVqzZk1LS0u7Gu+tW7cuXrxI6R8cHBzkUGxUp/HW1taCVKxdu5bRg4uLC9wDL2vffuLECXF1V1dXFxAQwOgUGBgoOcGydinyCbNMgpeRkeHp6Unfo+7h4ZGWlqas9EtAFV23lEgYtcXlFFUxoyt5C5Iq+h8MRhWoKd2ELKYrU1BQAEsHAoHAwMDA3t7e2dm53YvdYmNjZ8+e/fnnn0tzLEpuqqurExISysvLtbS0hgwZ4urqSh+campqkpOTS0pKWCyWlZWVm5ubcu/UBS5dugRLbaGhoZ9//rlMYWFkzcrKamxsNDIyGjlypJ2dHaFimpubb9++XVhYyGazbW1tx44dK82FtyqtKfkkTQKVlZWpqanl5eUsFqt///7jxo1Dt3EyYm5uXlFRYWZmBreMCIXC5ORkHo8nEAisra3d3d3J6zl02tra0tLS8vLyamtr9fX17e3tR4wYodwrEOUWZpFIdP/+/UePHr169crU1HTChAmmpqbicnH//v38/Hw+n29sbDz0DUrMwsuXL7OysvLy8urr61kslrm5+YgRI8TdadnS0nL27FktLa3Zs2erVD4VR4k9XktLS0pKCtgbf/fdd8eOHavcUlWpxKpafpRLWVlZUlJSdXU1NAqZTnS3trbeuXMnPz+fzWYPHTqUoplgOhjVdb9VVVUwjsBXURcXl468g7cTu25pRm1F6IARE4NREKzxYtrn448/PnPmzIMHD966W/7kQCAQDB8+/OnTp++9915aWppkvQjTZaFovBiM9PSoHg+DwWAwmG5Pl/7QjukKVFZWxsTEjB49uidM/hoaGry8vJ4+fdqvX7/Y2Fis7mIwPY0e1eNhMBgMBtMTwBovhsqiRYvIdxvu37+/tbV1xYoVRA+gubm5urp61KhRd+/etbW17ezkYDAYldOTezwMBoPBYHoCeFczhoqamtrYsWPv3LmjoaHx9OnT999/38DAoKCggGL5oLvC5/N79eoFN8di3jpqamoaGhoIgnBxcamurjYxMYFrbw0MDMAwJgZDoYf3eBgMBoPBdHuwxouhAvYM7OzsbGxsUlJSXr16df78ebjwBoPp4ixfvpzR2lBgYGBISEhnpAjT1cE9HgaDwWAw3Rus8WKofPHFF/fu3SstLdXU1BwyZMjatWsnTZrU2YnCYKTi4sWLsKhLwdXVVdw1QpgeDu7xMBgMBoPp3mCNF4PBYDAYDAaDwWAw3RNsuQqDwWAwGAwGg8FgMN0TrPFiMBgMBoPBYDAYDKZ7gjVeDAaDwWAwGAwGg8F0T7DGi8FgMBgMBoPBYDCY7gnWeDEYDAaDwWAwGAwG0z3R7OwEYDAqoba2ds6cOeQnQUFBM2fO7LwUYTCYt4w9e/bExMSgf42MjM6ePavSN+7fvz8qKqoj36h0Ll++vHPnTvKTU6dOmZmZdV6KMBgMBtPTwRovpnsiFAp5PB5BEA0NDTU1NQRB+Pn5dXaiegR8Pn/mzJkPHz7ctWvXsmXLOjs5GCWzZMmSR48eMTqdP3/e3Nxcie86duxYYGDgu+++e/HiRSMjI6LDqa6uhm6kqKiora2tA9S2mpqaDn6j0mlsbIQsVFZWvnr1iiAIgUDQuUnCnRJGDlJTU7/++mtGpxkzZmzevLnDU4TBYOQH38eL6eaEhoYuX76cIAgulxsQEKCUOJubm1NTUwmCMDExGTp0qFLi7H4F3rt377q6us5OTk8kNze3vLycIAgXFxc9PT3lRj5v3ryHDx8SBJGfn9/a2koQhJWVlY6ODkEQN27c6N+/vxKTYW5uXlFRQRBESEhIYGCgUvMhT0rMzMwgR93yjdIjZc16e3vDCjmPx7O2tia6V6eER4FuX1aJiYlLly6FLyYg8Lq6upaWlgRBzJkzh7KRoQv21RgMhgxe48VgZKa8vNzDw4MgiNmzZ58/f76zk9O1GDJkCPxwcHDo7LT0UHbu3BkeHk4QREZGhqOjo3IjP3XqFPywsbEpLCwkCOL06dOjR49WRTKGDh0KGi+WpZ4jYG9Lp4RHgW5fVm5ubo8fPyYIIjw8fNGiRQRBjB8//tKlSz25KWEwby9Y48VgMMpk/PjxCQkJWVlZn3zySWenBfN2c/78+ePHjw8aNGjSpEmdnRbMWwzulDAYDKaHgzVeDAajZNze0NmpwLz16OvrK+skAqaHgzslDAaD6cng24kwGAwGg8FgMBgMBtM9wWu8PY6mpqZr164lJSXBATljY2MHB4fx48fb29tLE4TFYvXv33/SpElubm4aGhoUn9XV1fn5+eQnzs7OWlpadXV14eHh2dnZOjo677333qeffko20pCfn3/y5Mm8vDw2mz1q1Kh58+bp6uoi12fPnlVWVqJ/WSzWiBEj4Hl0dHRBQYFAILCyspo9ezY8l4OGhobLly+npqZWVlbq6OhYWlpOmjRpzJgxampqFJ+QmLKyMvi3pqbm7t27yFVNTW3UqFH0+DMzMy9dulRQUNDU1GRsbOzs7Dx16lRTU1P5UitTnOJqpL6+PjIyMisrq6mpydbW1tvbm3yIiFLmgLa2tpOTE/wWiUT37t2jeLCxsQEbrZR3we+MjIzm5mbk1Ldv34EDBxIEkZOTc/bsWR6PJxQKzc3NR44c+dFHHyldAiXnV0Lybt26FR8fX1lZaWVlNX36dHL9CoXCqKio1NTU2tpaKyurOXPmSJZA6cVMXGJSUlIuXLhQVFSkr68/evRoX19fMBkFtLS0pKenEwRRVVUFTzIzM8lmci0tLcmWpVSEUpIhrgQUqWIKjx8/jo+Pz8vL4/P5enp61tbWTk5OHh4e5M5HAnl5eS9evED/GhoaDh48GP1bXl4Oh5wBXV3dYcOGMcaTnp4eExPz/PlzNps9cOBAX19fGxsbaRIgR69SX18fFxf377//VldXq6ur9+vXz8nJadKkSX379u2AmpW1gpTSbYqTFkUESaWjgLhUCQSC6OjoBw8eVFZW6uvr29vbz54928bGRu7xUZEOuYuMmLKWFaEC5JMi+ZqS9MXeFUoGg+lyiDA9CS6Xa2JiAiPNgAEDjI2NkSQMHjz4t99+a2trowQJDQ2FIOrq6hYWFui2DHt7+ytXrlA8Hz16lCJgPB7v2rVrBgYG5IfGxsZ37tyBID/88ANFb7GwsMjJyUFxUrY1mpmZtba2rlmzhi7MH330UW1tLT3L4MrlchnLZN++fX369CEIQkNDw9raGpWJo6NjamoqxbPkPZba2toU//n5+VOmTAFXQ0NDa2trFotFEISWltbatWtfv34tS+3JE6e4GunduzfleWBgoORsWltbIw+M140cOHCA/i4UhGKslcPhvH792t/fnxKkd+/eqpBAyfllTJ5AIKBP9fz8/FpbW0UiUUFBAVnDAVavXi2u1mQSM8bE+Pj4UF5nYWGRlZWFQrVr1Dc4OFikPFAiKelXSjLoJaB4FSOePXs2Y8YM8NOrVy9ra2tNzf/78VdbW/uTTz4hlyoAUmdmZoaezJs3j/yu2bNnk/2HhISQXR0dHenJqKmpoQsYQRDr168XCoX0NyrYq/zxxx/wnVFdXb1///5If1BTU3N3d79582Z7dSJzzc6ePVu+ClJit8koLRKcpEmnSkcBxlQlJyfT76kKCQlRZHyUu0PuOiOmrGUlN+hFnp6e4pxkkiI5OkmZir3DSgaDeYvAGm8PAo09n3/+eVlZGTysqqpav369uvr/3d8uEAjIQVauXAnPly9fXl5eDg8fP348efJkmDkdPnyY7D8vL+/oG5ydnSFgXFyctrb21KlTd+3a9euvvyILNPr6+iUlJSEhIRoaGgsWLAgJCdm+fft7770Hrg4ODi0tLRDnnTt3uG/Q19eHEf3bb7/V19ffuXNnVlYWj8eLj493d3eHgC4uLo2NjdJrvOhuxtWrV9fU1MDDtLQ0SD+bzb58+TLZPyRmx44dEGr48OFcEocOHSJ7zsjIAFXN1tYWTSgbGhqCg4Pho+yUKVNQNqVE1jhzc3MhbcOHD4c0x8bGamlpTZkyJSQkhMvlLlmyBE33w8PDydlEBnj9/Py4XG5kZCSKtrW1FaIFI6jbt2/ncrnZ2dmUd5E13ujo6KNHj/7www/gxHmDlpbWwoULf/vtt++//97Kyoo+wZJVAuXLL2Py5s+fb2pqumbNmn379n3zzTeGhobgFBQUxOfzraysBg8evHXr1r179/r7+8O0jCCI48ePKy5mkZGRXC5348aNKDF+fn4mJiZr164NCwvbuXMnuuFj0KBBaBbY1NQEeXd1dQXXjRs3kuXzwYMHMgmbfBqvUpJBLwHFqxjIyMgAZW/AgAEXLlwQCoUgz9euXUP9z/r16ymh6Prn1atXyV0BRePNzMyERKJZKSXCxsZGFxcXcJ04cWJ8fDyPx8vKygoODtbX19+0aZM4jVe+XgW+Rqmpqe3evRv1kFVVVatXr5asfCpSs0jjhQqaMGFCcHBwSEjIggUL0FdOxgpSYrdJlxbUKcktSCodBehj6D///MNms4cOHbp58+Y9e/agi+VBV5F7fJSvQ+5SI6asZaUKjVc+KZK1Kcla7B1WMhjMWwTWeHsKv//+O3Rwixcvprv+/PPPdI13//798NDf35/iv7m5eeTIkfC5MTExkR4hmuvY2toeOHCA7LR48WJwWrJkiaGhIXltobm5Gc0CL168SIkTpoCampo6OjppaWlkJ6FQiBZtVq1aJaXGi8rkiy++oDjV1tb269cP7g+srKykuKK9u5RpLhk+n29ra0sQhJ6e3rNnz8QV+LZt28TFoNw4yTWyb98+shO6b8bZ2Zn8PDY2Fp5/+OGHjOl58eKFtrY2JRRlbYfilJGRgZJhZmb26NEj5FRSUqKrq0ueYClLAqXMLyV5Dg4O1dXVyCk3N1dbWxsKf8mSJdOnT29ubkauZ8+eRXNKZYkZSoyNjY29vT3Zg0AgQDvMY2NjKQE5HA44ZWRkiFSGOI1XiclAJUDWeBWpYtSCdHR0Hj9+LK46pNF4pewKxGm8X331FQpI2VmTlpamo6MDs2TKG+XrAVpaWmBFaOHChfQUwkW10mi8stYsuYJ++eUXstPx48clV5ASu812OyX5+gpVjwIoVQMHDly1ahV8mgG+/vpruq4i3/goU4fcZUdMWctKiRqvglIkTVOSu9g7oGQwmLcIrPH2CPh8PnwA1tLSqqiooHsQCASwCQdpvO0GuX79OvSkI0aMkNDPjh8/nuIEF9wBX331FcU1MjISnIKCgihOaEMO4+SMx+PBuoGGhkZJSUm7Gi/KIJvNRh9NyezZswcCbtq0SY7xe+vWreBn3bp1dNfXr1/Dx2xdXd26ujpxkSgxTlQj48aNo4cdMGAAuNbX16OHra2tlpaW8Pzp06f0ULt27SIIgvKdXkqNF252pbj6+/u7ubkpVwKlzy8leTdu3KCEQhtZtbS00C4JxDvvvEOPUxExIyfm2rVrFNdDhw6Jayk9TeOVvopRCxKn4MHEWtUab3FxMXRWmpqaRUVF9FCrVq2CgJQ3ytcD5OTkQKgffviBHiotLU3VGq+rqyvdFR1TZKwgJXab0mu8MvUVqh4FUKqGDh0KJykQ9+/fd3R0JG+6kXt8lKND7oIjpqxlpVKNVyYparcpKVLsHVAyGMxbBLbV3COIiIhoaGggCMLd3Z3R8oe2traXlxf55AkKMmHCBMYgHh4eYO8kPT09NTVV3Kvnz59PeTJ48GBkbofuiqxr5OXlSR8nnDKFyyeEQmFERATRHiiDkydPRhtWycycORN+HDlyhJARkUh08OBB+E057wewWCxPT0+wyXT69OmOjPPTTz+lP0TF/uzZM/RQQ0Pj888/h9/owwE5PVwu18DAAO2PkglDQ0P6IcY///wzISFBuRIofX7JmJmZeXh4iAvl4eFhbm4uzrWgoEC5YmZqakq/kPb999+HHxQLJT0QKau43RZEEMTUqVN79+5NtgemCiIiIoRCIXwQtLCwkDJHcvcAaAsx7OKmhHJycsrIyFi3bh2hMhYuXKiUCpKj25QJ+foKcSgrO0uWLKGYunBxccnIyGAcB+UeH6XvkLvyiClrWakC5UqRsoq9K5QMBtO5YI23R3Dt2jXKLJnOiRMn6urqYN8mOQjaZkxBXV0dHRFBq2100N5LhJqaGuq46bY6kT0G6OXpqKmpibPwiaw+JiYmEu2BMogO0lCws7OD0igrK5N1lMrOzgYbjFpaWvQSANChQTSl6Jg4GcMi/a2+vp78fOnSpbC78q+//iIb9oRKz8vL++yzz8hmt6XH2dkZnW5iRHUSKCG/CEdHR7oBTCMjIwlxMoquUsSMMTHtZqHnIGUVoxakpqaGJIfC8OHD6+rqvvvuO1Wm9/83T0ZDteJqXO4ewM7ODoTz3r17EydOvH37NjmIhoaGo6OjSo14M5Y27MZkrCAldpsyIV9fIQ5lZQeOb0iJ3OOj9B1yVx4xZSorFaFcKVJWsXeFksFgOhd8O1GP4L///oMf0puhlyYI2tb46NEjcX7I5qARYOZH5w0UJ3SZDX0tAjAwMEBqOQV0f0lubi7RHminX3Z29t69exn9aGlpgZqXnZ0NR4ykBEWuq6uLDuFQgMsJIPKOjBP2hlFgs9mMxW5ubj579uwzZ87U1NRERUUtWLAAOYEtHDgEKAft3jKiLAmUKb/SyK24OBlFVyliJl8Weg5Slg+SKFNTU+TaKTx58gR+iOtVtLW19fX1KZNjuXsADQ2Nffv2wdJTQkKCh4eHtbX1nDlzvL29Ga/46qwKUkW3qYp0SomysiPThUxyj4/tvuWtGDEVvPOvK0uRgsUuuWROnDhBvjUKsW7dug640A6D6RiwxtsjqKmpgR+9evVSYhA4XkIQBPleSnFqgExOEhA3nJOTWltbK30GT75Bsufq6mqZEokir6urA/sQikeurDgZix0Z66azcuXKM2fOgIqLNN7S0tLY2Njx48cjo8FKrMcOkEAJ+ZUQSkpXpYuZfFnoOUhZPnJ0gyqirq6u3ZSw2WyKxqtIDzB//vzevXsHBQWBtlNYWBjyBlNTU39//7Vr16L9C12hgpTYbcqEchuasrLTbleplPFR+g65K4+YMpWVilCRFClY7JJL5vLly+Hh4fTnixcvxhovptuANd4eAdqtJP33RWmCICe09tW5yJQe5GfHjh3Tp0+X7BmZnZASFLmFhcWFCxcke5ZyjUUVcUrDpEmTBg8e/OTJk5SUlMzMTLiD4dChQ0KhEF0dpAreRgnsYDHDqLob7FIpUbAHmD59+rRp0+7cuXP8+PEzZ87AR6LKysrg4ODDhw9fuHAB3UbWWXRWF9dDsqNgb/nWjZjdg44ZQaysrBg3w6vaogEG05FgjbdHYGJiUlpaKtMZEhSEz+eL84OcGLfxqIimpqZ20yPNegXKoImJibiDT3KDCqS1tVVZkasiTilZsWIF3Nt58A1CoTAsLKxv3750SydKpMtKoEyoVMwwMoGERBUnnxl111evXjF6NjIyKisrkyzbL1++VHoPoKam5v6G/fv3X79+PSwsDG7Vqq6u9vb2zs/P19XVJTqPTuziuk12lDU+doMRs3vQMSPID29QUeQYTBcB74vrESCDVRIMIMsRBBmJ7UijCI2NjeImrOh0HLoLXpoMki3rKgsUeUVFhYQpSKfHKSUcDgeOIYHdyLi4uNLSUn9/f/n2pb/tEigTKhUzjHx1UVNTI0HVlG+1lrFJlpSUMIZCHdTTp08ZPdTX19M1XiX2AJqamp6enmfOnElKSoKmXV5efuXKFaJT6cQurttkR1njYzcYMbsHeATBYJQF1nh7BNOmTYMfycnJ4vxMnjzZxsYG3TuHgoizeywQCOAiR7ikjuhAGE0sEASBbJB+8MEH7UaCNgglJSWJ83Pnzh1zc3MbGxtxazXovk0KlpaWcMBVJBJJuDhn5syZ5ubmv/76a7upVVGcUmJoaAg3RjQ2NkZGRh44cEBNTS0gIIBQJV1ZAqVHKWImN+Lks4PpIsmwtLQcMmSI5J7w4sWLNjY2zs7OUqa5T58+8KO4uJjuKu4tqIOimE2W3MXJ3QM8evTI29s7Li6O7nns2LFLly6F37Ds3Ik124ldnCJ05CjQYeNjNxgx3y7ElUznjiAYTHcCa7w9gjlz5oDB2/v37yODpWRycnKuX79eVFQ0ceJESpD09PTMzEx6kKioKOhevb2933nnHaIDOXToEP1hcnIymHA0MDAQd9kmGW9vb7BdmZSUJM6288GDBysqKlxdXSmnWdDev5aWFvTw4sWLTk5Oixcvhn/XrFkDPw4fPswYeW5u7oULFyorK2fMmNFualUXp5SgI7s7d+68evXq1KlTZTLFKQddWQKlRxExkxtG+ZwxY4aTk9O9e/fQk6ioqC+++OKff/5RykvlTkZHEhQUBD8YzbQQBHH06NHCwsIRI0bQLwdiRE9PD87OPX36FK5XQYhEov379zOGmjdvnoGBAUEQmZmZjEURFhamxB6guro6Jibm/PnzjEEgJQRBSG+iRnU124ldnKx01ijQMeNj9xgxybx8+fLnN9Dvlu9E2m1KnTKCYDDdEqzx9gg0NDT++usvsBa4fPlyct8KXa2/vz/Y5UPXvVCCUO5iLSsr27BhA5wIEneXgIrQ1dW9fPnysWPHyA+rqqogCwRB/Pzzz9LcEKuhoXH06FF1dXWRSLR48WL6x9GIiIiTJ0+y2ezvv/+e4mRiYgJ2L8m7FpOSkh4+fIiManA4nClTpoDd/3PnzlFiePny5dy5cwmCWLRokYODg5R5V0WcUjJq1Ci4VPP58+dwspdQMV1WAmVCETGTGzs7O/iB5LOhoeHq1asPHz5Epk3i4uLmzp174MCB6dOnS3N/tYqS0cEsWrRo8uTJBEGcPn06Pj6e4hoXFxcdHc1ms7/99lvp45w6dSrot2vWrGltbYWHLS0tX331lbht/7169QoODkZJolgaP3bs2JUrVxiP1CrSA5w4ceLx48eUh69evYqNjYXFaumX/lRXs53YxclKZ40CHTM+do8Rk0xlZeWGN0RGRhJdhnabUqeMIBhM90SE6TFERESA3T8XF5eYmJiioqInT55ERUUNGzYMHtbX14sLMmLEiJiYmOLi4mfPnv3111/QF5uYmNy9e5fsPz8/n/MGS0tLEDAfHx8Oh3P8+HGRSJSeng6uMOKyWCz4NzExUSQSnT9/nsPh+Pn5QUAzMzNwzcrKgsjNzMzg+d9//w0bnEJDQ0+cOLF582ZwIgjC39+/ra1NJBLx+XwIju5td3V1hSdNTU0owSdPnoRZqYODQ0REREFBQXFx8a1btz777DM1NTUWixUVFcVYmHC5JSwWFRcXx8XFGRoaws4x5Ke2tnbChAkwaH355ZepqallZWWZmZmHDh2CLwtubm6NjY0yVaKscUquEZFIBK5oDuHp6cnhcIKDg+mvRutOlpaWra2tdA+JiYmM7/rxxx9FItHu3bs5HM7MmTPByc7ODjwHBQVJyK9yJVBCfsUlD6Rly5YtHA5n3Lhx4Dpy5EhyyhnjhFzLJ2aSEyOupTx+/BiC5+bmwhKlm5tbTk5OXl4eXCs1ceJE9IqNGzeiUWDXrl0iqfnxxx/JrRj2n8OT6upqsk9pkiGOoKAgxhLIyspSUKRramqgHlks1qZNmzIzM8vKylJSUr755hsWi6Wurh4REYGSER4eDrHBYVc2mw3/oneJRKInT56gmz8sLCx8fHw++ugjMzOz3r17ow01hoaGEPDixYsQqq2tDSkh5ubmW7ZsOXHiRGho6KxZswiCiIyMhD4NvTE8PFzuXuXWrVtIVH7//fdHjx5VVlbm5uZGRUXBAXhNTc1z585JLwOSa1bBClJutymhU1K8b1TFKCAuVWigFIdM46PcHXKXGjFlKquUlBTws3jxYpF0ZGVlQWyo5+/fvz88OXz4sOQ0SClFUnaSsha73FKEwXRjsMbbs3jw4MGHH35I/G/YbPaqVavEzSEYg7BYrIULFxYVFVE8izuBExgYCDN1RtejR4+KRKJt27Yxul66dIkyootEojNnzvTr14/szcDA4LfffhMKheC5vLycMTa48Y+c5oyMDE9PT/omRg8Pj7S0NHElWVZWNmLECEqZ0DWH5ubmXbt20S0JGxsbf//99wKBQI5KlClOyTUi7uyQu7s7/b2NjY1w/+327dsZE4YOgVMYPXq0SCQSd9TW2tpacn6VKIES8isueSAtjEYyUcol5Fo+MZOcGHEt5datWyiG33//nbLA6Ojo+Pz5c3JBgdUlHR2d//77TyQ1Eu6w4fF4FM/tJkMcaLMJhUuXLiku0gKB4JdffjE2Nqb4GTZs2I0bN8jJEHdYHb0LuH79OppZoqgyMzPpiSHrS0KhMCQkBG0qBvr37w/KJ9JSgICAALl7laampj///NPDwwPZ2SIzYcIEymcjaZBQs4pXkBK7TQmdkuLpVMUoIOEUKwyU4pBpfFSkQ+46I6ZMZbV3715wOnv2rEg6Ll26JC5+DocjOQ3SS5GUnaRMxS63FGEw3Ri1LmJTBNORVFZWpqamlpeXq6mpWVtbu7q6UmZdEoKwWKz+/fuPGzcOXWffYZibm1dUVJiZmYE2KxQKk5OTeTyeQCCwtrZ2d3dX5Pb5qqoqyCBMHVxcXNrdnicSie7fv//o0aNXr16ZmppOmDDB1NSU0WdbW1taWlpeXl5tba2+vr69vf2IESMUvEJWFXF2ZbqCBCqOHGImN9XV1QkJCeXl5VpaWkOGDHF1daXMlnJyclJSUjw8PNDOuk5JRmfR1tZ2//79/Pz8urq6Pn36ODk5IbtWctDS0pKSkgJ2xd99992xY8dKGbC5ufn27duFhYVsNtvW1nbs2LGwk18VPcDLly+zsrLy8vLq6+tZLJa5ufmIESPklkBV1+xb0cV17ijQYeNjNxgxR48efe/ePQsLCx6P19Vu9JW+KXXkCILBdDOwxot5a6CM6BgMBoPBYPD4KJkjR44sWbKEIIjjx4+j8yAYDKZHgS1XYTAYDAaDwWC6IWfOnAFTixs2bMDqLgbTY2E41YPBYDAYDAaDwbztVFVVqamp7du376uvvurstGAwmE4Da7yYrk5NTU1DQwMcTIK/hYWFYIoDjD1iMBgMBtMDweNjuyxfvtzX15duqQ6DwfQo8K5mTFdn48aNNm+orq4GGw/wL759DoPBYDA9GTw+SgNWdzEYDF7jxXR1Zs6cSbloAUAX7WIwGAwG0wPB4yMGg8FIA7bVjMFgMBgMBoPBYDCY7gne1YzBYDAYDAaDwWAwmO4J1ngxGAwGg8FgMBgMBtM9wRovBoPBYDAYDAaDwWC6J1jjxWAwGAwGg8FgMBhM9wRrvBgMBoPBYDAYDAaD6Z5gjReDwWAwGAwGg8FgMN0TfB8vBtMlaG5urqqq4vP5+vr6ffv21dHR6ewUYTDdhJcvX06fPp38JCgoaObMmZ2XIoxs7NmzJyYmBv1rZGR09uxZ+F1bWztnzhxxlSshYJfibUlnt6F7iA0Gg5EerPH2CJYsWfLo0SMJHthstrGxsYuLi7e3t4ODQwcmraeTmZl59OjR+Pj4x48fk58PHDjw/fff9/T0nDp16oABAzovgT0FPp8/c+bMhw8f7tq1a9myZUTX5u1KbafT1tbG4/EIgmhoaKipqSEIws/Pr7MThZGB6upqqMGioqK2tjYzMzPkJBQKJVSuhIBdircinampqV9//bUcAbdu3Tpt2jT077FjxwIDA999992LFy8aGRkRnUH3EBsMBiM9aiKRSAbvmLeTefPmPXz4kCCI/Pz81tZWgiCsrKzQKmJLS0tZWdmrV6/gXx8fHy6Xa2Ji0qlJ7v5UVVV9/fXXx48fJwiiX79+Xl5e1tbWOjo6NTU1WVlZN27cQDXi4eGxbNmy+fPnd3aSuzOhoaHLly8nCKJ37951dXWdmJLc3Nzy8nKCIFxcXPT09Lp4at8uULlxudyAgIDOTk7n09zcnJqaShCEiYnJ0KFDiS6Publ5RUWFmZkZtBHpK1dCwC5FV05nYmLi0qVL4YubTMk7evQoh8Oh5JEgiJCQkMDAQKJT6R5ig8Fg2gWv8fYITp06BT9sbGwKCwsJgjh9+vTo0aORB6FQeP369VWrVuXm5p45c+bRo0eJiYnGxsadl+Ruzn///Tdt2jQej2dkZLR3795PP/1UTU2N7KG+vv6nn3765ZdfRCLRrVu3/vvvP6zxqpQhQ4bAj07f47Bz587w8HCCIDIyMhwdHbt4ajFvNeXl5R4eHgRBzJ49+/z5852dHEyXxs3NDfYihYeHL1q0CL7Gnjx5UkKQX3/9dffu3ZSHQ4cOBY0Xd18YDKbDwBov5n/Q0NCYMmVKYmKio6NjaWnp48ePv/nmG5h2Y5ROSUnJhAkTqqurDQ0Nb9++/d5779H9GBgYBAcH29rawudnjKoZP358QkJCVlbWJ598QnR53q7UYjCYbom2trbkHb/6+vr0h+fPnz9+/PigQYMmTZqkytRhMBjM/wfbasb8f0xMTL755hv4HRERAYdbMMpFKBTOnTu3urqaIIj9+/czqruIgIAALy+vDkxdj8bNzW3FihWGhobE28DblVoMBoMB9PX1AwICsLqLwWA6EqzxYv4XEydOhB9tbW3JycmdnZxuyOnTp6FgHR0dpTGfs3bt2g5JFwaDwWAwymTBggWXLl368MMPOzshGAymp4N3NWP+F3379kW/q6qqqqur8/PzyR6cnZ21tLQEAkF0dPSDBw8qKyv19fXt7e1nz55tY2NDia2pqenatWtJSUkVFRUsFqt///6TJk1yc3PT0NCQnIzHjx/Hx8fn5eXx+Xw9PT1ra2snJycPDw9dXV1xQRoaGi5fvpyamlpZWamjo2NpaTlp0qQxY8ZQzseSqa+vj4uL+/fff6urq9XV1fv16+fk5DRp0iRyIZBJS0u7fv16Xl5eU1OTgYGBvb29q6vrqFGj1NVl+HL0008/wY8FCxZI43/ChAkGBgbSlFV9fb2xsfF77703bdq0/v37031mZGQ0Nzejf/v27Ttw4ECCIG7duhUfH19ZWWllZTV9+vRRo0YhP0KhMCoqKjU1tba21srKas6cOSNGjFBpnAKBAKysIYYNG0au97S0NKFQiP4dPHgwWucUl5iUlJQLFy4UFRXp6+uPHj3a19eXfPmTOCFXXDIbGxtv3br14MGDwsJCgUBgYGDg4OAwZcoUe3t7uueWlpb09HRod/AkMzNTIBAgD5aWlv3795cvtZJlQ1yc9fX1kZGRWVlZTU1Ntra23t7e4s4VSyYnJychISEnJ6empobFYpmZmbm6uk6dOlVbW5vuWSmJaWhoOHfu3P379/l8vrm5+dixY6dPn85iseRIvKydDKpHCnZ2dsgcYFFRUWlpKdnV3Nzc2tqa/CQzM/PSpUsFBQVNTU3GxsbOzs5Tp041NTWlxyyf2D979qyysrKsrAz+rampuXv3LnJVU1Mjt1lpIPf2BEEYGxs7ODiMHz+eUdplbR1K59mzZ9HR0QUFBQKBwMrKavbs2ZSeTREZVrBkGFNbWVlJeQglpvQRSinw+fy6ujoTExO7N7Qrq0pp+B0gUYwVoa2t7eTkBL9FItG9e/coHlxcXNqd82AwGJUjwvQk0KQqNTWV0UNOTg6Sjejo6KNHj1IEhsfjJScn04/uhISEUKIKDQ2FGZ66urqFhQUKYm9vf+XKFXEpfPbs2YwZM8Bnr169rK2tNTX/73cZbW3tTz75JCsrix5q3759ffr0gQPJ1tbWyOaWo6OjuJz+8ccfYAhXXV29f//+aCqppqbm7u5+8+ZNsufCwsIJEyaAB319fWtra6Rj9O3bNzAw8PXr19KUP/kKIsaMMNLc3CwQCOjPeTweKit9fX0bGxs2mw2FsGLFioaGBop/ypSaw+EIBIKPPvqIUpV+fn6tra0ikaigoGDw4MEU19WrV6s0TsotTTBJIr+xd+/eZNfz589LToyPjw8lQgsLC3LhMwq5gpJZWVnp4+ODVCwjIyMbGxskM7NmzaqoqKDE364t0ODgYOlTK5NsMMZ57do1SlETBBEYGCiShfDwcDTf1dTUtLa2Rg3NxMQkIiKCHkTxxJw5c4Zuat7Ozi4zM5PL5cK/XC5XpoxI38mIq8ejR48iP+vXr5eQl/z8/ClTpsBzQ0NDa2trECQtLa21a9fSuxr5xF6yqWptbW2ZCgeZ91dTUxswYADZ6uHgwYN/++23trY2RVoHAsYRMzMzxjRIqFwUsLW1dc2aNfQsf/TRR7W1tUqRYblLRlwGGSvL3d1d6SOUlKBG6unpyehh27ZtFJkXJ6v0OOVo+IpIlJRiI6EirK2tkX/yN0pEXV2ddOWKwWBUCNZ4exbtarzHjh1D3XR+fn5eXt7RNzg7O8PDf/75h81mDx06dPPmzXv27EH7cika78qVK+H58uXLy8vL4eHjx48nT54MSubhw4fpb8/IyIDJxIABAy5cuCAUCkUiUWtr67Vr19B51/Xr11NCoftIV69eXVNTAw/T0tIgzWw2+/Lly5QgBw4cgCnI7t27Gxsb4WFVVdXq1avpY2pDQ4OtrS1BECNHjkxPT4eHQqHw8uXLgwYNkmlIO3jwIPjX1NRUcAqSmZkJg7GFhcU///wDZSUQCMLCwmC90dnZubq6mhwEPmH88MMPaLYxf/58U1PTNWvW7Nu375tvvkGLpUFBQXw+38rKavDgwVu3bt27d6+/vz+aTxw/flx1cdbW1nLf4OrqyqjxHjlyhMvlTp8+na7xRkZGcrncjRs3osT4+fmZmJisXbs2LCxs586d6P6VQYMGofLPzc2FNw4fPhzNtBSUzIyMDHjo4+NTUFAAD5ubm0+cOAE7COzt7fl8PvkVTU1NlIxv3LiRS+LBgwdSplZW2aDHGRsbq6WlNWXKlJCQEC6Xu2TJEqTeh4eHSy+ls2fPBrUtMjKypaUFHubn56N+IzQ0lBJEwcScOHECVlz19PSCg4Ozs7N5PF58fPwHH3xgbGy8ZcsWCbNbCUjfyUA9bt++Hfzr6+sfPHiQy+Xm5uai2FJTU7lc7rp16wiCGD16NJfLTUpKAqeMjAxQkGxtbdF3t4aGhuDgYMjXlClTUEkqIvZ37tzhcrk7duwAp+HDh5OF7dChQ9IXDlIDPv/887KyMnhYVVW1fv16tLpI/mYnR+tQosb77bff6uvr79y5MysrC2TD3d0dArq4uKDhQBEZlrtkxGUQKgusaru4uEAdxcbGKn2EUrXGS5dVpTR8RSRKJo0XKgLdc+Hn58flciMjI5H/1tZWyAWY09++fTuXy21ubpa6aDEYjKrAGm/PQrLG29LSgnZ2ubm50Ud9giAGDhy4atUqmEMDcCU9WePdv38/ePb396e8orm5eeTIkbBOkpiYSHbi8/kwbOvo6Dx+/JgSsLa2tl+/fnSN9/fff4d3ffHFF+KCmJiYVFZWkrMJH9oXLlxILwSwjUzWePfs2QOvQEMpIi8vDxaKpZxPIMPLdnZ2IgXg8/mwGUxHR4c8kwbOnTsHb/Hy8qIsIJAnB7a2tg4ODhTNBzbp6enpLVmyZPr06eSh+uzZs2he2AFxovsbKRoveUZF0XgpibGxsbG3tydXvUAgQNvP0HyRLuQUHVIOyYQ0jB07Fla2yaSnp8Nkd926dfR8tZtxaVIrt2ygOG1tbfft20d2QjecOTs7S0gVY4Tx8fF0J29vb4IgdHV1q6qqJGdQ+sQUFhb26tWLIAgWi0Xp4tra2j7++GO0B1UmjVeOTkYkEqGvhMnJyYzRwkpjXFwcXdL09PSePXtG8f/zzz9DhNu2baPHJp/Y83g8eD579myRXKDCWbx4Md0VpZmu8crXOhTUeDU1NXV0dNLS0shOQqEQbYhYtWqVsmRYjpKRkMHffvsNDG3QN+8ocYSSVeMdMWLEJSY+/fRTRo2XIqtkjVeRhq+IRMmk8QIxMTEQ5MMPP2SM88WLF9ra2jJ1lRgMRtVgjbdnIUHjra6u/vjjj8FVX18/MzOTcRAaOnQoZVC5f/++o6Mj+szJ5/PhQgItLS3GrUTXr19HgyX5+datWyVvVoQpAlmvQO9is9lo4YVxKrBp0yb6zu0ffviBHiQtLY2SBl9fX5gqkfV8BCw2SjmfQCWs4FiI9D1xZeXm5gYeyPNpymyDIIgbN25QXOfNmwdOWlpaaFEC8c4774BrfX29quNUXOMlCOLatWsU10OHDoFTUFCQlDqkHJKZk5NjbW198uRJRv8ffPAB6Eh0nVNxjVcR2UBxjhs3jh5wwIABjDUlgWXLlo0ePZrRKTExEWL7448/JGdQ+sSgL0oBAQH0IGBNQMLslhH5OhmRSBQWFgbPFyxYQA8lEAiMjY0tLS3JvQqSNMbZ+evXr2H5V1dXl97hyCf2Cmq87fb2AoEAdqWS9TpFWoeCGq+4dsHj8eCkpYaGRklJieIyLF/JiMsgLIp6e3szHm9R4gglJfQdyIwoqPFK3/AVkSg5NN7W1lYLCwsI9fTpU3qoXbt2EQQh00YJDAajarCt5h5KcHDw8v+Hv7//hx9+aGlpGR0dDYdSrl69OmzYMMaAS5YsodhgcHFxycjImD9/PvwbERHR0NAAJpcY7ax4eHjARqP09PTU1FR4SN7xixQkClOnTu3duzfZ+Ap61+TJkxmvaZk5cyb8OHLkCHqI0g/bUylBnJycMjIyYMMh2X9ra2t8fDz9FaGhoRkZGYy3DtKpq6uDH/DdXT7QrmyCIObOncvoB13TitYZ6JiZmcE2OTJokd/Dw8Pc3Fyca0FBQYfFKTempqb0CzDef/99+EGxkiIO+STTwcGBx+OJ8w8nmaurq589e0YoFWXJBizRiKsp6ZMdFhaG2jgFdJxbnAdZE9Pa2hoRESEhiKmpKcx9ZUK+ToYgiPnz54PNudOnT7948YISKioq6sWLFwEBAWh3a7uSxmKxPD09wRLS6dOnVSr2shaOu7s7Y2+vra3t5eVFOYrZWa0DQEMVGWtra/gSJBQKkRQpIsPylQydtra2gICAn376adGiRdHR0YyGspQ4QsmKhYVFABNI3hRB+l6ogyVKQ0Pj888/h99IYUaAFq2vry/NXQwYDKbDwLaaeyjnz58n/6umpmZsbDx+/Pg5c+Z89tlnEkwiw55kCVy7dg1+uLi4MHpQV1d3dna+cuUKQRDXr1+HU4vZ2dlgolZNTQ3tBqQwfPhwpDFS3oWOPlKws7PT1tZubm4uKyt79uwZ7Bi0s7MzNjZ+8eLFvXv3Jk6c+OOPP6JzXDCYUUxBurq6njx5ElSITZs2BQQEkK2PDHgDIR2w5RK+6xPykp2dDeYi1dTUxNkXRROOhISElpYWRiu1jo6OdEPWRkZG8ANtgySDMg6TuY6JU24YE4NU7vr6emkikU8yybS2tlZVVcFeRHjS2NgIPyorK5GpUqWgLNlgrClZi44Cn8+vqal5/fo1JRK67VP5EvPw4UNUsOI6H2dn50uXLsmUbPk6GfiqtXDhwv37979+/fro0aNBQUHkUAcPHtTU1FyyZAld0rS0tBizTBAEOjSekJCAjharQuxlLRwJGs6JEyckxNCRrQPahThLv6NGjbp9+zZBEImJieQvnvLJsOIlQxDE69evP/300+jo6K+++mrv3r3i7h1Q4gglK0OHDqWrfARBfP/99//++6+CkcvXC3WMRC1duvT7778XCoV//fXXjh07yF8iwFz2ypUrFfmujcFglA7WeHsot2/fRtYXYI4l4RYfMoyfq8n8999/8IN+WRECba5+9OgRJZSpqSkYlZUGtD85Ozt77969jH60tLTgOoTs7GyYjGpoaOzbtw++HyckJHh4eFhbW8+ZM8fb25vx5qTly5cfPnw4Ozu7qalp06ZN33333eTJk729vWfNmgVH+KQHmZBVRLuTpqxQCb969YrH4yH7JWTIsyIE0n/o1m6hMOEHfW1cdXHKDePrUIlJ+Tr5JBNuqTl8+PCxY8fS09PRFJkC+aIOpaAs2VBK0QHZ2dl79uyJj49HF+HIWghSJubJkyfww8zMjLzeLlP3paxOBlixYgUYNTh48OA333yD+tisrKzk5OSPP/6YvOUBvUhXV1fc8ju69yg7O1tcgpVYd+0iTW/fdVoH3Ogj7j4hpAvl5uYqLsNylwzi5cuX3t7eoDk3NTVJGKCVOEJ1KWSS5A6WqH79+s2ePfvs2bM1NTVRUVHkuwZhl82KFSuU9S4MBqMUsMbbQ9F+g3wBJXuoqamhrGfSQTus0GY/aUJJeNfJN0j2XF1djX7Pnz+/d+/eQUFBMLkpLCwMeYOpqam/v//atWvRsiRkOSEhYf369UeOHGl9AxjnWLFixcSJE9etWwdbDaUBnVktLi4WiURSfmVQpIShkBm1GnGXuErjKl8o+eKUG8bXyXo1pXySWVFR4enpCRcLW1lZeXl5WVhYIM0/NjY2OTlZpmR0BdmQ41bP/fv3BwYGCoVCDQ2NqVOnOjs7GxgYgNg3NTUhE9+SkTIxaJldQt5l+mahYCcDK2Bubm6JiYn5+fnXrl378MMPyXNiZNCe8qK6ujowByj9i1RRd92vdUgev1AWamtrFZdh+UoGIRAIJk2alJaWpq+v39DQ8Oeff3p6esJ5XcZMKWuEUhZTp07t06ePrFc6yy3JnSJRK1asAMuLBw4cQBpvaWlpbGzsuHHj0HYMDAbTRcAaL0bJoPsDJCwmICc0JkkTig4KvmPHDnRdjTgoO7umT58+bdq0O3fuHD9+/MyZM6B7V1ZWBgcHHz58+MKFC+Q18D59+oSGhm7fvv3UqVMnT55MSkqC4zo33sDhcI4cOSLNnBIdI3z58uXz588plxOqooTJpdSdaGtr65gXySeZfn5+MP1aunQp7F8lu5aVlaloTt+lZOPOnTtffvklNJ8bN25Q9oTz+XwpNV6V1pRKOxlQa8G+0YEDB0DjbWxsjIiIsLe3nzhxIuOLLCwsLly4IPlF9K0oncLb1TokQx+VFJFhBaWRz+dnZGScPXtWTU0NLDktW7Zs1KhR4oYMZY1QymL0GzrsdZ0iUR988ME777yTl5eXkpKSmZkJlyodOnRIKBTiBV4MpguCNV6MkjExMSktLYUxW5wf5IS2LaEfMh0zQ+8yMTERdzpLAmpqau5v2L9///Xr18PCwuCTbXV1tbe3d35+PuU8c9++fb98Q3FxcWRk5B9//FFcXAx3Azo6OqK7fCUwYsQIc3Pz8vJygiBu3ry5aNGidoO0tbW1tLTAHBcGclRW0pSwuL1hbxGMU8ZXr151zNvlkMzMzMybN28SBNG7d+99+/ZRpl8qpUvJBjJivH79enFHoJUI2pchIe8vX76UNVoFOxkfHx8TE5Pq6urY2NiSkpIBAwZERkY2NjbS58SoLlpbW+V4UaeACuetaB2wKivOCYkNeYOP3DIsR8mQYbFY8fHxYIFs5cqVBw4c4PP58+fPv3PnjoSPHYqPUG8jnSVRampqy5cvhzvGDr5BKBSGhYUZGxujSxkwGEzXAdtqxigZZKgjLy9PnB9kLxTZwUKhampqJExYxb1LQTO/mpqanp6eZ86cSUpKgn2P5eXlYFuLEQsLi/Xr1+fl5aFtZlLe1qCurr5hwwb43e4OSSA4OJj9hri4OEqua98guYSNjY2trKyItxA0cWGcpJaUlHRMMuSQTHTY8v3332c8UIpMqiidLiUbqBzQfUgqLQRYY4G8oz2liouNgp2MlpaWv78/fLo6fPgwLPay2ezPPvtM3IsqKiokKGZvXW/fdVoHLLCLU0HROXAkSIrIsBwlQ8bIyAgZ3N69ezdcnZCcnCzltgi5R6i3kU6UqEWLFsHWazDNHRcXV1paunjxYvmOjGEwGJWCNV6Mkpk2bRr8QHcVUhAIBHDnLUEQ6HyRpaXlkCFD4Le4DUgXL160sbGBm2zhCdpkCJu4GLlz5465ubmNjQ1aFXz06JG3tzdSIMmMHTt26dKl8BsZKdm8eTPjhRba2troNhFxFk3oLF++HGyZXL58ud17WQQCAbzCwsJixowZ9LISl/GEhAT44eXlJd9p4U6nT58+8AOWKSikpKR0TDLkkExkH0XcnmEpNWc5JmpdSjYkl4P0H7akZNCgQeiSzDt37jD6abfF0ZGvkyGzfPlyKOewsLCEhITMzMxPPvmEftGRpaXl0KFDod4lpHPmzJnm5ua//voroVTk0wpQby9h1+jkyZNtbGyQxqWs1iE3d+/eZXwOhprJZ08UkWE5SkYcbDb71KlToMtt374dtV+Eckeot45OlChjY2P4ptDY2BgZGQnn8wMCAlT0OgwGowhY48UomTlz5oBGl56enpmZSfcQFRUF80Jvb29kyYkgCHR7R3h4OGPMR48eLSwsHDFiBJqme3t7g4HNpKQkuoFN4ODBgxUVFa6urujrb3V1dUxMDOV+JgRcoUkQRP/+/eFHYmLiiRMnGPUuPT092GOGPLeLtrb2+fPnYb/0kiVLJNxqA1vp4L27d+8mD+eorP766y96KKFQ+Pfff1N8vnU4ODiI+3QSHx+vors6GZFVMpHR14yMDPqW7La2NvqclQzaSw+72YEZM2Y4OTndu3dP+tR2umygckBfuMjcunVL6W9Ec83Q0FC666NHj+T4UCJfJ0PG1tYWPu2VlpYuXLiQbrMKATskCYKA1WA6ubm5Fy5cqKysRN+/FIRR2C5evOjk5LR48WLpe/v79+8j68RkcnJyrl+/XlRUhA4tK9g6FOfQoUP0h8nJyWD+2sDAgHytq9wyLEfJSMDBwQHshLe1tc2fP5+yfUOOEaq8vHzDhg1btmwRtxPkLaJzJQq15Z07d169evXDDz8kz2pevnz58xsY73DCYDAdCdZ4MUpGQ0Pjr7/+AiMZy5cvp9wHUFZWBtt6jYyMKDdwLFq0aPLkyQRBnD59Oj4+nhJtXFxcdHQ0m83+9ttvye86evSourq6SCRavHgxfYElIiLi5MmTbDb7+++/pzidOHHi8ePHlIevXr2KjY2FBUbyl36CILZu3UrP7JkzZ2CInTt3LiE1jo6O8M0+Jydn8uTJaDcdGYFA8PXXX+/bt48giC+//JISPyqrs2fP0herf/rpJ9hKt27dOnEXe3Z9pkyZAj+OHj2K9q3BtGbx4sWMmwxVhKySOWHCBDMzM9ieGhwcTPG/c+dOyftj7ezsKFtwGxoarl69+vDhQ2nu1ew6svHJJ5/Aj+DgYMoSU1lZ2ebNm5X+xtWrV4OacenSJcoUs66ubuHCheTbgKREkU4GgU7tFhYWOjs7i7vVnMPhgNifOHHi3LlzFNeXL19CP7Bo0SL0PUhBTExMwJgweb93UlLSw4cPpTGORentyWozaNGwo3vx4sXI5JKCrUNBdHV1L1++fOzYMfLDqqoqSCdBED///DP5GlW5ZViOkpHMsmXL4HRocXEx+Rpn+UaoadOm/fzzz9u3bxdn//ktonMlauzYsWCW+fnz5/RLiSorKze8ITIyUnVpwGAwUiHC9AB+/PFHzhvQWD5t2jR4EhwcLCFgfn4+eLO0tISAPj4+8CQxMVFCwIiICFiTHDFiRExMTHFx8bNnz/766y+YspuYmNy9e5ceqqamZty4cbA9adOmTZmZmWVlZSkpKd988w2LxVJXV4+IiKCHOnnyJJylcXBwiIiIKCgoKC4uvnXr1meffaampsZisaKiosj+0Yd5MzOz33///dGjR5WVlbm5uVFRUTAT1dTUPHfuHPLv7u4O/n19fa9evVpcXFxaWnrv3r3169fDcR03NzeBQCCSkfT0dNBttLS05s6dGx4efvPmzbt378bGxn777bdQUOrq6lu2bGlra5NQVpqamhs3bszMzCwvL09NTeVwOJDaxYsXt7S0kIPs3r2bw+HMnDkTPNjZ2UFVNjU1iUSiLVu2cDgciBOOWHM4nKCgIAgLPtE829PTk8Ph/Pjjj6qIEyUYrTJpaGi4u7v7+fmNGzdOTU0tICBg27Zt4DRx4kQOh7N06dJ2M3j+/HkOh+Pn54dqH1yPHz/OKOTklMgqmTExMWgngpeX1/Hjx1NSUs6fP+/j46Ovr48KBLJMaYO5ubkQ1s3NLScnJy/v/7R353FVVfvj/zcigxIoooKKopmSU4gXlRLHzKGcymtl5SW1crgVt+vUoI0OVJZcGwSs1K44pJZjzn1MFFFJEdQcEDFREJVBEEGG83t8XZ/v+p7fmTycgWHzev7B47Dnvfbaa+/33muvlSK6vujfv79Gozlw4ID5W2tm3jB2mq9atcrEkTJddGg0muLi4kcffVTM0rBhw/nz5+/atevgwYMLFy709vYeOnSozoE4c+aM9RuTmJgoKwwPGzYsOjp69erVc+bMadasWZcuXWRDRMHBwWI5eXl5GjNUtJDRUVpaKmtcL1261MSUOTk5ffr0EXn+9ddfj4+Pz8jISEpKWrp0qQiNQkJCCgoKtGexLNuL1NZoNKJnclGFIT09fcuWLSIBf//9d3NSRru0DwoK2rRp0+XLl8+dO7du3Trx9WlQUNCtW7esPDtWrFghNlu0s+Dq6ipP3ry8PPE7ODhY5+AWFhbqzOjt7S3qOAwfPjwqKmr16tWzZ88W8ZKiKBMmTNApbC3LwxakzK5duwzu4K5duzQazeHDh0NDQ0eMGCHv3EaMGBEaGrpkyRILrlDa3dW6ubmZeZQ1Gk1ycrLYKnmMmjdvLobc95ZAmDZtmsG8mpycbM2Jb0GOqlC20c5v+jsl+twWnfTqXHNlpZLx48ebn84A7IGIt1Yw0U9A3759Tcxo4nOy5cuXm17p8ePHZf+TkpOT07hx4y5fvmxsrqKios8++8zLy0tnxi5duvz222/G5kpMTBw8eLD+R4n9+vVLSEjQmbiwsPD777/v16+fwUYd+/TpoxONnzhxYurUqQZfrzVq1GjOnDl37tzRWOTu3btRUVEG22V1dXV9/vnnk5KSTMxuLK3atm0bExOjP72xXhlzc3M1Go3BzfDz8xPzGpyxZ8+e9lim9g6OHz9e+7C6uLi8/fbb5eXlMuKVw++7gzqzSLItMRNbYkHO3L17d/v27XUm7tWrV1JSUlhYmOlz8KuvvtLpizIgIOCvv/7SaDTGvvozc2sN5g1jp3lYWJiJI2W66BDy8/MnTZqk832dm5vbvHnz9HuU3bdvn0025ty5czo1RevUqfPss8/m5ubq1y3MzMzUmKdChYy+Tz75RFSa1YlX9RUXFy9cuFC/GW0vL6+PPvpI/+GaZdlepLZGo8nIyOjWrZv2KCcnp4ULF2oqwmBp7+rq+uabbxrc34qeHca+jQwLCxNN3xtLAZ0Zvb29NRrNhg0bmjVrpj3cw8Pjyy+/LCsrs0ketiBlIiIiDO5CRESEeOBicOxzzz1n2RVK1ooPDQ01/yjv2LHDWFKbc0ug0WiMvdDesWOHlSd+RXNUhbKN/sZou3XrlniX8P777+uMEnXRRY0b89MZgD042LVdRCArKys+Pj4zM9PJyal58+a9evUSlehMKy8vP3r06IULF3Jzcxs2bNi1a1fZHo8J169fF+vSaDTe3t5BQUGma4Hevn07OTk5JSXl1q1bTk5OPj4+3bp1MzFLamqqeCFcVFTk4eHh7+8fGBhokx5Nr169euLEiWvXrt25c6dBgwYPPfTQI488Ip4um59WeXl5Xl5ene5RVCQ9PT0uLu7mzZvNmjV79NFH5QuZKlGhnCnCpOTk5IKCgkaNGnXv3l3WWL6vGzduxMbGZmZmOjs7d+zYMTg42IJWpqpJ3sjOzo6Li7ty5YqTk1OrVq1CQkLMzNvWOH/+/B9//JGbm+vj49OjRw/zv7S3bSFjsfLy8oSEhJSUlJycHHd3d39//27dutmp/2SNRnP06NFTp07duXOnadOmffr0adq0qTWlvYODg5+fX3BwsGwWwbZnh/XKysri4uLS0tKKior8/Pz69u1run1dK/NwhVLGYuZfoUpKSn7++WdnZ+eRI0dWZj+9dlWFOSowMDApKenSpUuyKofQs2fPI0eO+Pr6pqWlVZM+tIFai4gXAAAAqLBTp0517tx5xIgRmzZt0h7+ww8/iC+uV61aJT8rAFBVVPJsDwAAAKhM0dHR+g2wb9iwQbRi9fbbbxPuAtUBES8AAABwH5s2bRItnIl/8/Lyli9f3qZNG9m5gHD9+nUHB4fFixcvWLCgirYUwP8PES8AAABwH4mJicuWLdu9e7f495133rl169b06dN12lmYPHnylStX3njjjSraTAC6DLRVCwAAAEDfiBEjQkJCMjMzT58+HRwc/Nprr+lPo99UPoAqxDteAAAA4D5CQkKGDx/eqlWr5ORkR0fHd955Z+fOnQZ7OgRQrdBWMwAAAABAnXjHCwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdaJFdRiWk5Pz9NNPaw+ZNm3a8OHDK7SQ559/PjMzU/47dOjQWbNmKSpSVTu4c+fOBQsWaA9Zu3att7d3JawagPrcvn37qaeesrLAr5Djx4//9NNPp06dunPnTpMmTVq3bj1w4MCQkBBnZ2f7rRQAUDvxjheGlZWVpd2TnJz8+z1Xr16t6ELS09PT0tLOnTsnlvDnn38q6lJVO1hQUCCOzpEjR8Sqi4qKKmfVsN7atWuD75FD5s6dGxwcPG7cuCrdLlTMwIEDg4ODv//+e/FvZmamOKz79+9Xapry8nJrCvyKJkVYWFi3bt3Cw8MPHz6cl5e3e/fuBQsWPP7440uWLFHUIi8vr0+fPg0aNFi6dGlVb4uq8mqNUK2OPgDe8cKoxo0bp6WlKYoSFRU1efJkg9MUFxfHx8eLiTt16qQ/wYEDBxRFOXHiRNeuXRU1st8Onj17Vrw9DgoKcnNz0xk7+h5FUUaNGrVp0yalGrhvZoCUmZl5+PBh7SEpKSmHDx/msYWV50UlS0hIyMvLGzp0qPi3uLhYHNacnBylpnF3d79vgW+rpIiMjFy8eLGiKAsWLHj77bcVRSkpKXnllVd+/PFHRUX5cM2aNbGxsYqizJgx49VXX1WqlJryao1g+uhXq3IMqCV4xwvLZWZm9rvnvffeq+ptUZsFCxaItE1JSVFqAjIDKkGNOy+g74svvlAUpVWrViLcVRTFycnpgw8+UNSVDzt27Ch+dOjQoRI3DdWC6aNPOQZUPt7xAgCAynD9+nVxlx8QEKA9/MEHH8zMzHR3d1fUonfv3rGxscnJyc8//3xVbwsqG0cfqG6IeAEAQGXIysoSPxo0aKAzSn1t74XcU9VbgarB0QeqFWo1AwCAylBaWip+ODo6VvW2AABqC97x1i6nT5+OjY09ffp0dna2k5OTt7d3cHDwkCFDXFxcKrScixcvZmVlZWRkiH+zs7O1W+JxcHDo0aOHidkPHTq0devWy5cvu7u79+zZc8yYMfXq1TMx/ZkzZ7Zv356SknLr1i0vL6/OnTs/+eSTzZs315ksJSXl5s2b8l9PT8/27dvLfzMzMy9duiT/rV+/fpcuXQyu7tixY5s2bfrrr79cXV0ffPDBMWPGtG7dWgwvKSmRkzVt2rRNmzY22UGppKTk2LFjou6fGJKUlKTdoFHLli31d1y6detWTExMcnJyYWFhmzZtRo0apVN1UEd+fv7OnTvj4+OzsrLq1avXsmXLAQMGPProow4ODoqdM0NSUtKOHTtSU1MLCwu9vLwCAwOHDBnStGlT/SkTExOLi4vlv02aNHnwwQdFZv7555/T0tLKysp8fHy6d+/+zDPP3Lhx48KFC9qzBwYGOjs75+bmrlix4uTJk/Xq1evcufOLL76o3V7IhQsX1qxZk5KS4urq2qNHj+eee65+/foGdzYhIWHv3r0pKSmFhYUeHh7+/v7BwcE9evSoU8e+Tw8LCwv37Nlz8ODBa9euOTk5NW/efMCAASEhIfphgzgc8l8nJ6du3bqJ4evXr09NTS0qKmrVqtXIkSPFcGPsdIAsK44sOy/MTzRj2aaoqGj9+vXHjx/Pyspyd3f39/cfOXKkKA2qsGQ2trUVOv3z8/N/+eWXo0eP5uXl+fj4PPbYY0899ZSTk5NiNyKfnDt3Tvx7/fp17YLC39//7Nmz2tN36dJF+zRMSEgoKyuT/7Zv397T01N7yfo5sELlsHZuURTFy8urQ4cOvXv39vf3r2g+NHaATK/Usixa0TK/muRVM88s80shMxnL9llZWRcvXtSesmPHjqdPn7YgQ5o4+paVYza5TANQNKgdVqxY0bZtW3HQ69at6+fnJy8bjRs3XrlypbEZIyMjxWSRkZFy4KRJk0xkKhcXF+0lJCYmiuGhoaFFRUWikWFtvr6+ycnJBteelpY2bNgwMZm7u3vr1q1dXV3F+4EpU6bk5+drT/zcc89pL3bkyJHaYyMiIrTHBgQE6K8uOztb56ZcmDVrVllZmU6lu0mTJlm/gzq0e/c1KDw8XHv6kSNHiuFpaWl79uzRrygYFhZmbF2LFy9u2LChSEw/Pz8vLy+ZMvHx8RqzVSgzaDSaCxcuDBo0SIz19PT08/MT99nOzs4zZsy4e/euzvR+fn7aCwwNDb179+6ECRN0VtSgQQONRrN8+XKd4SJlPDw8tAd6eXnt379fLP/jjz/Wub/09fU9ffq0zmZcunSpT58+YgJ3d3c/Pz95C9ukSZOwsDD9LTdGZkU5JDQ01Fie1Gg0UVFRjRs3/j91curU8fX1lfnQ399/165dpg+Ht7d3aWnp9OnT9Q/NM888k5OTo786ux4gy4qjip4XFU00g9kmLi5Ov55tRESEnEucbh9++KH4V7R1rCjKxo0bNfYsmY1lcvNP/w0bNojE0da2bdukpCSDBf59mZMUOvlEx/bt23WGJCYm6q9CMrFkC8rhyMhIkSAODg4tWrSQhaGIZL788svy8nLz86HBA6S/UuuzqPkHvVrl1fueWRaUQuYwJ9vrdMRgQYY0cfQtKMdsdZkGQMRbW4jQyNPTMyYmpqSkRAy8cOHC2LFjRQEaFRVlcEaDN0D79++PjIycN2+eGPXII49Ealm6dKn2ErQDwrFjxzZs2PCNN95YvHjx+++/L9/BtmvXTv8alpSUJK6Lvr6+v/76a1lZmUajKSoqio6OFo9aAwMDb9y4IaffvXu39lbpRLziqiZ3Rz+6KCgoCAoKEmP79++/fft20TtleHi4u7v7e++9JzbG3d1dLEeGTBbvoL7CwkKxcNlZ67vvvqudtsePH9c/rIqibN682dnZuU+fPuHh4RERES+99JKM4lasWKG/ItlfwltvvZWdnS0GJiQkBAYGKori6uq6c+dOjXkqmhnEPUebNm3+53/+RwzMz88PDw8XT6wHDRok86ewfv365cuXf/zxxzKRQ0NDnZ2dx40b9+WXX3700UetWrWSAVVKSsrye8SOKIqyZcsWFxeXIUOGLFy48PPPPx8wYIAY7u7ufuXKlYiICEdHx5deeikiImLu3LmdO3cWYzt06KC9Gfn5+eJ9fvfu3Y8dOyYGlpWV7dy5s127dmKW3NxcM1Nsy5YtI++RQxYvXjxy5Mh//etf+hNPnTpVLH/y5MmZmZli4JkzZwYOHCjulb/77jv9wxEZGSkaAfL29n7nnXfc3d0XLFiQnJyclpa2ffv2vn37imUGBQUVFBRU5gGyrDiq6HlR0UTTzza//vqrq6trp06dZs+evWjRIrlh2vflL7zwwsiRI9esWSP+zcrKEof18OHDGnuWzGfPnhV7/cgjj2if/oMGDYqIiIiMjJw4cWLdunWNnf6rV68Wh9LNzS08PPzkyZMiVzz++ONeXl5z5szRL/Dvy5ykiImJiYyMfPfdd8Xyg4ODtY9gWlqaziHWCTB++OGHyMjIp556Sj9U01myKIcbN248Y8aM6OjoBQsWyP7SDJbD8iHRa6+9lpGRIQZev3591qxZsu5GUVGR+flQ/wDpR7wVzaJWHvSqyquWnVkWlEL3ZWa2Hzt2rEjnq1evWpYhTRz9ipZjNrxMAyDirS3EtWr79u36o0aNGiVq+V6/fl1/rIlH/vI5sU5sqUMGhK1bt27btu3Vq1flqDt37mhfv7XnysvLEzXT6tWrd/bsWZ1l/vLLL2KuoUOHiqfv5m+VsYj3jTfekDPqLDMhIaFevXrifsLb29smO2iaeOmnf5XVISPeNm3afPbZZ9qjVq1aJUYFBgbqzPXVV1+JUf/85z91RuXk5DRr1kw8s8/KyjJ/g83JDHl5eSJudHNzu3jxos7YTz/9VCxBvogwmMht2rTx9vY+deqUHHXlypX69etrB1Q6KfPtt99qjxo/frwYNXHiRE9PT3lHpdFoiouL5VOPbdu2yeGLFi0SA1NTU3U2LCUlRVSQNj/iNd8333wj1jthwgSdUcXFxd27dxfP/g8cOKA/r3hAU7du3Xr16iUkJGiPKisrk1Un3nzzzco/QBYXR+acF9Ykmsw2Dz744Jtvvimesgn/+te/9N9EWc/ipNDJ5IsXL9YetXbtWoOn/6VLlx544AFR3V3nHVF5efnf//53WTe1QhGv+bSfDxqcwPQh/vDDD3UCDP0lt27d2t/fX7v4Kioqkl2m65TDsjAcP368/upknhcRr5kbabAOjs2zqPkHvVrl1fueWdaUQsZYk+0tzpDGjr6Z+ccel2mgNiPirS1effXVnj17Ghwla+98/fXXdo14FUXZsWOHztjo6Ggxatq0aQYvJMYq5slWELds2VKhrTIY8aanp4uXonXr1r18+bL+XG+++aaY0UTEW6EdNK2id1TBwcH6Y+UXQbdu3ZID8/LyxNs/V1dX+dhYm4zu3nvvPfM32JzM8P7774tpZs6cqT/27t274rl+/fr19aNH7UReu3atztgJEyaEhIQYTJnevXvrTHzmzBm5qDfeeENnbExMjP7xGjNmjMgb2jdqknjMb/OIVx4pZ2fna9eu6U+wd+9esandunXTHyvrDRo8g9LS0kSGd3R0vHLlSiUfIIuLo/ueF1Ymmsw2nTp1Ki0t1R519OjRgICAmJgYjU1ZnBTaW9urVy/9sS1atNA//SdPnqzzUYY28TWpsQK/pkS8iqLs2bNHZ+zSpUv1z+v75paioiJRedWGEa+tsqj5B71a5dX7nlnWlELGWJPtqyTitdNlGqjNaKu5toiOjo6Pjzc4Sta8NTaBrTRp0kR+mSP97W9/Ez+0G3vQaDTffvut+P3ss88aXJrs5k4+CrXGypUrRSsUvXv39vX11Z/gxRdftOEO2ty4ceP0B8qmibTb5Fi5cmV+fr6iKAMHDpRNv2gbPny4+PHDDz/YcAs1Gs2SJUvEb50vrgUnJ6fBgweL1lx++uknY8vx9PTU/9b6+++/j42NNTj9Cy+8oDOkffv2sgEb/bEy0USvoYIIDktLS/W/NhR1+RITE23elag8Un369DHYWEu/fv2aNGki2lQzcfLq76OiKH5+fuKZUVlZ2cqVKyv5ANmvOLJVok2cOFHn6+6goKDExESDiWkNmySFwdJJ//QvLS0Vx9rYLE2bNn388ceVGq5p06by4wXT5bDMLX379jWYW1xcXIYOHar/raw1bJVFzTzo1S2vmj6zbFUKaauJ2b6qLtOAihHx1kZ5eXkXL148+3/Jt3PaTbzaQ9euXfVbFxSVc8QzaTnw5MmTYmMcHByMtSgr72BiY2O1m1C2jLwdN9bKdEBAwH2bRjR/B21OfiV131Xv2bNH/JCfEulo27atqOKVkZFhw9umkydPigYqnZ2dZQ1DHfIzWmPhq9hT+bmaOfTX5eDgIO8h9Ns1lU2DiBsOnbR69tln58+fr90kuKIoLVq0CAgIsHlzzfJIyYrWOurUqSOPu3wvpMPBwcFY260yq4v3M1V1gGxbHNkk0cQH20qlszgpDB4vHx8fndP/xIkTBQUFptPHYElSsxgsq/VTQzu3yKuJvtWrV+fm5la0O4NKyKJmHvTqlldNn1m2KoW01cRsX1WXaUDF6J2oFjl58uSiRYu2b98uO5LRod3Bgz3oN5MoKu2IH9oN/f/555/iR9OmTeUEOmT7nHfu3ElLS5MNCFlG9plhrMMhFxcXd3d307cR5u+gzZm/atnjwsmTJ//zn/8YXJqzs7PIDCdPnjSWIBUl11u/fn1jr+VFzw1ivcaWU9GuKbSbXZVEHbZ69+iMki0wayfa5MmTv/vuu5MnTxYWFr733nsffPDBwIEDR40aNWLECPlYwebkWWCiOxx5Fpw6dcrgBB4eHsZu1sV38oqiiF5hKvkA2ak4skmiWZDNrGF9Uph5+stSztvb21g/PZW549XnQmOPHqfsnUWr5HJjfV41ncFsVQppq4nZvqou04CKEfHWFt98801YWFhZWZmjo+OQIUMCAwM9PDzEg/DCwkLZzqpdGeyQ0OCbsezsbPFDtDZhkHYl0ps3b1oZ8ebm5t53ja6urqYjXvN3sDqk7Zp7TC/2xo0bNtrA/7fe3Nxc0VSJZeut6MsWgylz31H6K42NjZ01a9YPP/xQes+Oe6ZMmdK/f/+ZM2eKina2VaGzQOe1s/aWG5tXLjYnJ6eSD5D9iiObJJoF2cxiNkkKM09/M0s5pYaz7YXG5myVRSv/cmOTvGr6zLJVKVTTs31VXaYBFSPirRX279//+uuvK4rSsGHD3377TacCT15eXuVEvOaTtSJNPKjWHiWbnbDrGtVBptW8efNkzwrGyHZQbLheX1/frVu3mp5Y50Ov6qBhw4ZRUVFz585du3btmjVrDh48KL46++2e0NDQH374wba3mxU6Cyw4BXTmrbQDZNfiyN6JVqNLZhWUcuXl5TU9QWpWFq3kvGqPUsiuR9m2GbLKL9OAihHx1gqyWb9Zs2ZVt+9VTNfXysvLMzaN9iiD9bsMXt7u3LljcGmNGjUS1bRMrPH27dtKzde4ceOrV6+KH8a+8LTTesWP0tLSylyvbTVp0uT1e9LT02NiYr7++uv09HTRAWZAQMBbb71ljyNlzllg8BQQ717uO2+jRo0q8wDZtTiySaKptWQWB7qmlHIVKsCtzC32/uq15mbRSs6r9iiFbJXtKyFDVvllGlAxWq6qFeR3L7JHH22yw57qQ7YjknOPwWlkk5teXl6tWrXSf6Br8F7/ypUrBpcme809f/68wQlu3bpVfe4FbZK2qampVbLea9eumQjDagpfX99Zs2alpKSIjosURVm+fLmdUky71WhjZ4Gx9mAKCgqM3c3Lz9tE5q+0A2TX4sgmiabWklmWcjk5ObLapJklZKWxrAC3X26xuZqVRSs5r9qjFLIy21dmhqzyyzSgYkS8tYJsTMJgFSkTDz7NZPM7s5YtW3bs2FH8FtVH9cl2GocOHardMmfDhg3FD/HyTUdcXJzBpcnOCX7//XeDExw+fFipCjZPW1lFyljCigpsPj4+rVu3tuABtrENbtmyZadOncQEJnqwGD58uI+Pz+eff65UJ7NnzzbYLY2Li4vsS8NYUy4We/LJJ8UP2deljqKiooSEBPHbxIfExrKuzOoi81faAbJJcWQsm9kq0dRRMuto166d7Hpt//79Bqexdx9192W6AD906JAN1yVzi7HrgugepnXr1saeZ1lQPtesLFrJedUepZCV2d6uGdJY/rH3ZRqohYh4awXZKKu8jmrbt2+fZYutX7+++KHdOdC2bdu6du06fvx4xTrTpk0TP5YtW6Y/tqys7L///a/OlIKbm5v4rOX8+fOinwNJo9F88803Blf33HPPeXh4KIqSlJR05MgR/Qmio6OVSmQwbYcNG9a1a1eDm2e+UaNGifxw8OBB0UivviVLlly7di04ONhYy5aWZYbp06eLH999953BhZw9e3br1q1ZWVnDhg1TqpMDBw6sXr3a4B2Pm5ub+JysefPmtl3p008/LVpzPXbsWFJSkv4E69atE/c6o0aNeuihh4wtZ+nSpfoD4+LiREunHh4est/LyjlA1hRH9z0vbJVoNbpkNmHSpEniR1RUlP7YU6dO2TaktECHDh2MBYTbt2+3bUcsMrccPXpUNqGs7fTp03v37r18+XL//v1tVT7XrCxa+XnVHqWQNdneHhnyvvnHTpdpoDYj4q0Vnn/+efEjPDxc501URkbG7NmzLVts48aNReOH2hV7Dh48eOLECetbHnr55ZcHDhyoKMrPP/+8ZcsWnbHz588XVcJmzpyp32vfkCFDRHw7ffr00tJSMbCkpOSNN94w1jzvAw88EB4eLlet00Lmjz/+uGvXLnmVqgRt27YVP2Ta5ufn7969+8SJE1Y2U+Ho6Lh8+fI6depoNJrx48frPx5euXLlmjVrXF1dP/roI9tmhtDQ0EGDBokuLn/55RedJdy+ffvZZ58V6S9vMqqV999/X3/ghg0bxPddYuNtyNHRcdmyZaI1rMmTJ+t0+5GRkfH222+Lr9SMdeMhbq127tz5448/ag+8fv36hAkTxO9PP/3Uzc2tMg+QNcXRfc8LmyRaTS+ZTXjrrbdEuLVjx47IyEjtUbm5uePGjZMdulYVkQPFZwKyJq2iKImJiePHjzdYpdZiOrlFp1/3kpIScZqMHz9edhdkfflcs7Jo5edVe5RC1mR7e2RIc8oxe1ymgVpNg1qguLj40UcfFUe8YcOG8+fP37Vr18GDBxcuXOjt7T106FAxytvbO/SeM2fO5OXlid+yA/Tg4GAxpLCwUC75xRdfFGNXrFiRnp6+ZcsWT09PUWFSo9F88cUXoaGhw4cPF9O0bdtWewkbN24MDQ0dO3as/trFwrOzs3v16iU+pHn33XeTkpIyMzPj4+NDQ0PFLOPHjy8pKdHf33PnzskuEHx9fUePHv3MM894e3s3aNBAPsj39PQUq9u2bZuYq7y8XIYBPj4+c+bMWb16dVRU1IgRIxRFiYmJ8fb2FtspV2TlDppw9uxZUVU7JCTk9OnTKSkpL730kqIo/fv312g0Fy5cEItq2bKlWPjo0aNDQ0NXrVolZhdj5Q3B4MGDQ0NDw8PD5fLXrFkjgv8OHTqsXLkyNTU1PT193759//jHPxwcHJycnNatW1fRbGY6Mwg5OTl9+vQRV/TXX389Pj4+IyMjKSlp6dKl4p4yJCSkoKBAe7HGEnnatGn622A6ZY4dOybGihjPyclJ/HvgwAETxys5Oblv375i4JgxY3bv3p2enn716tUjR47MmjVL5LSQkJCioiKNHaxcuVJUI+zWrdumTZvS09MvXry4bNkycWPUuHHjw4cPG5xRZldRG2L48OFRUVGrV6+ePXu2GKUoyoQJE8rLy7XnsvcBsqw4MvO8sDjRjGUbmTfsxLKksPL0T0xMFCemeK0UHR29evXqOXPmNGvWrEuXLrKBIlng5+Xl2WRnp02bZjCfhIaGXrhwQXtKWSvE0dGxb9++Y8eO7dWrl4ODw6RJkz788EMxqn///qGhoa+88or15bDMLUFBQZs2bbp8+fK5c+fWrVvXpUsXMfDWrVs6+2I6Hx44cMDgAfrkk09snkXNL/OrVV41fWZZUArdl5nZPjIyUn/eCmVIc46+meWYPS7TQK1FxFtb5OfnT5o0SecLHDc3t3nz5ul35rZv377MzEzFiNzcXLnYjIyMbt26aY91cnJauHChGGvsGySxBHmp0F+7XH5RUdFnn33m5eWlM03btm1jYmJM7O/evXvl9Ubo0qVLUlKS/mcz2vcEZWVlERERonqz1Lx5819++UWj0YhO6n18fOT01u+gCV999ZXOG+mAgIC//vrLxAdOYWFhYl6DY/v27au9/MTExMGDB2t/Ai3069cvISFBU3GmM4NUXFy8cOFC/TZIvby8PvroI/240Vgi+/n56W+D6ZTZuHGjwbHLly83cbx27Nhx4sSJqVOnGnx706hRozlz5ty5c0djN8ePH3/iiSd01uvk5DRu3LjLly8bm0v7Ac2GDRuaNWumPbuHh8eXX35ZVlamP6NdD5BlxZGZ54XFiWbiKz6RN+zHgqSw/vQ/d+6cTjXdOnXqPPvss7m5uTpvwBRFyczMtMme6rwm1RYfH689ZVFR0fjx47WLJhcXl7fffru8vFznJHVxcbFJOWwwt7i6ur755pvGIisT+dDYR789e/a0eRatUJlfffLqfc+sipZC5jAn2xuMeCuUIc08+maWYza/TAO1lkM1bKcX9pOdnR0XF3flyhUnJ6dWrVqFhIRY3/G6RqM5evToqVOn7ty507Rp0z59+ojI0IbKy8uPHj164cKFvLw8Ly+vTvfcd66SkpJDhw6Jys8PP/zwY489ZubqiouLf//990uXLrm6urZp0+axxx4TNdAeeOCB27dv+/v7nzlzRqkUN27ciI2NzczMdHZ27tixY3BwsP6Vz0rXr1+Pj48XN7Xe3t5BQUHW1Jo2PzOUl5cnJCSkpKTk5OS4u7v7+/t369at+nQ+aUxqauqpU6eysrKKioo8PDz8/f0DAwMrZ7OzsrLEkXJycmrevHmvXr1ENXJjfHx8rl275u3tLZ5elZWVxcXFpaWlFRUV+fn59e3bV9aDqKoDZHFxZP55UdFEU1PJfF/nz5//448/cnNzfXx8evToYfMP0a2Unp4eFxd38+bNZs2aPfroo7Jigv3I3OLg4ODn5xccHKzz9NMe5XNNyaJVklftUQoZzPZRUVGTJ08WEa/86NfeGdL8/GPbyzRQOxHxAmbJzc0VdaKeeOKJXbt2VfXmAPehE/ECAAwyJ+IFUKPRchXwvw4ePPjyyy9funTJ2Fjxo1+/fpW7XQAAAAAsRMQL/K+UlJQVK1bITo90iJYtXFxcJk6cWOmbBgAAAMASdS2aC1CtTz75JCAgQDb7qShKYWHhzJkz9+7dqyhKREREJXxOBlgsOzs7Pz9ffLgr/opqCx4eHrKpUgCARqP566+/FEWR/RHevHlTFJgtW7YU7XcAUAe+4wX+1y+//DJ69GhxRnTq1KlLly4NGzbMzMzcv39/dna2i4tLRESE+NQHqLYmT54cFRWlPzwsLCwiIqIqtggAqqO8vLyGDRsaHJWZmcnTbUBNeMcL/K+nn376r7/+2rp164EDB/78888DBw7cuXOnQYMGXbt2HTBgwCuvvML1D9Xf8OHDdToiEmTH2gAA0QGVsc6rqnmL2QAqine8AAAAAAB14isFAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECd6I8X1VdOTs7TTz+tPWTatGnDhw+vui2qRcm7aNGiTZs2yVGNGjX6+eefK30bYUc7d+5csGCB9pC1a9fS6TRQfRQWFq5Zs2bfvn2ZmZmurq4+Pj5BQUGDBw/28/Or6k1TDxIZqA2IeGHYjz/+GBYW9vDDD2/btq1Ro0b2Xl1eXt7w4cNPnDixcOHCV199VQwsKytLS0tTFCU/Pz87O1tRlLFjxyrV3sSJE0+dOmVw1MaNG318fCp9iyxJ3hs3boixly9fLi8vJxBSn4KCAnGIs7Ky7ty5oyhKUVFRVW9U7bV27dpFixYpihIfHy+GzJ07d+vWre3atfvvf/9b1VsHcw0cOLCgoODVV1+dOHGioiiZmZmjRo1SFOWzzz7r06dPhRZ14sSJYcOGpaenOzk5+fv7K4qybdu2pUuXNmjQIDc31257ULvUhkQ2eAMA1DbUaoZhM2fOzM3NjY+Pr5ybrTVr1sTGxt66dWvGjBlyYOPGjdPumT9/vlJzFBQU5N7zxx9/HL4nIyNDDCkvL6+STbIgeefNmyfGNmnSpHI3FjZz9uzZ3++5ffu2/tjRo0eLQzxo0CCleiguLhYbbOyZkYplZmaK4kIOSUlJOXz4cHJycpVuVw1QrbJNQkLC4cOH09PTxb/FxcXisObk5FRoOcXFxSNGjEhPT2/fvv25c+eS70lISKhfv759Nrw2UkEimy7kTdwAALUNES8M69Spk/jRoUOHSlhdx44dK3N1drV27doz97Ro0UIM+emnn8SQ5s2bV8kmqSl5Yb4FCxb0uyclJUWpCTIzM8UGv/fee1W9LagxVJltNmzY8NdffymK8vbbb7du3VoMDAwMfOaZZ6p609RDBYlsTiHPDQBArWYYtXHjxlWrVrVr127AgAGVsLrevXvHxsYmJyc///zzlbC62obkBYAaJDY2Vvzo2rWr9vAlS5Z88cUXVbRRalNLEpkbAICIF0a5u7tPmjSpMtcYck9lrrFWIXkBoKa4fv26+NGgQQPt4Q/cU0UbpTa1J5G5AQCo1QwAAFCNlJaWih+Ojo5VvS2qRSIDtQfveGuXhISEvXv3pqSkFBYWenh4+Pv7BwcH9+jRo06d//fsIzExsbi4WP7bpEmTBx98UPy+cePGhQsXtBcYGBjo7Oycm5u7YsWKkydP1qtXr3Pnzi+++KKbm5uc5sKFC2vWrElJSXF1de3Ro8dzzz2n3SyEsWVWaL9Onz4dGxt7+vTp7OxsJycnb2/v4ODgIUOGuLi46E9sbAdPnz79888/p6WllZWV+fj4dO/evfI/5rly5Yps8kRydXUNCAjQHiKat+nRo4eDg4McePny5atXr2pP9tBDD2k0GuuTt0KsTN6kpKQdO3akpqYWFhZ6eXkFBgYOGTKkadOmVuZqi9di/u4EBgZmZWXpzO7i4iLry2k0miNHjuhMEBQUpHOzZUEK6CgpKTl27Jj2G4ykpCTtdphbtmxp4pPyW7duxcTEJCcnFxYWtmnTZtSoUTrZT4f1G6woysWLF7OysjIyMsS/2dnZ2m04OTg49OjRw+JVGytkioqK1q9ff/z48aysLHd3d39//5EjR7Zu3drYQd+3b9/27duzsrJatWr11FNPaW9SWVnZunXr4uPjc3JyWrVq9fTTT3fr1k2xs8LCwj179hw8ePDatWtOTk7NmzcfMGBASEiI/u27SF75r5OTk9i8ixcvrl+/PjU1taioqFWrViNHjjS92fY4cXTKgQoV5pZlmzNnzmzfvj0lJeXWrVteXl6dO3d+8skn9c+IimYbxRbkSkX7+YqiHD9+PDMzU/z28vJ66KGHLMsDdtodm1x8Dx06tHXr1suXL7u7u/fs2XPMmDH16tXTKc10tG3btnHjxsaufT4+Pib6FrpvIiuKcvPmTTm9p6dn+/bt5b+ZmZmXLl2S/9avX79Lly4W76BBMovm5eW5ubn5+fl17dq1X79+8t7JzEK+QvdXVp4XFb1wAJVNg9rh0qVLsmsEd3d3Pz8/Weo1adIkLCzs7t27Ykqd60RoaKhcyPLly3XyT1pa2p49ezw8PLQHenl57d+/X8zy8ccf61x6fX19T58+bXqZOhsfGRkpRkVGRuqMWrFiRdu2bcXYunXr+vn5yduvxo0br1y5Uj8p9Hfw7t27EyZM0NmMBg0aWJnmckXx8fFmzvLhhx/qn6T+/v7a08io6cCBA9rDZ82apTPjmjVrrExejUYj+iXy9vau6F5XNHkvXLggGw329PT08/NzcnJSFMXZ2XnGjBkyf1qWqy1ei/m7Y/ArAD8/P7kog33/5ObmWpMCBslbN2PCw8O1px85cqTMG3v27NGp4KcoSlhYmMEV2WqDNRqN6W8oXFxcrFm1wbMgLi5Ov8+tiIgIgwe9qKhI/wHN2LFjS0tLNRpNamqq9g2x8NZbb5m/+xqNJiIiQswoh4SGhiqKEhAQYHD6qKgoccdfp04dX19fuS/+/v67du0ynbze3t6lpaXTp0/XT+pnnnkmJydHf3X2O3GsKcwrmm3S0tKGDRsmxrq7u7du3drV1VW84psyZUp+fr412UYQp8+HH34o1yim2bhxo8YM+ivV9txzz1mcByzbHRNscvEtKioaPXq0zgb4+vomJyebLs2WL19u4tpnrMgyM5Gfe+457SEjR440eKoK2meoBTuo4+LFizKLPvDAA35+fnXr/u+rKRcXl+eff17MaGYhb84NgE3OiwpdOIAqQcRbK+Tn57dp00ZRlO7dux87dkwMLCsr27lzZ7t27XTuvGNiYiIjI999911ZZMvlpKSkLL8nMDBQjN2yZYuLi8uQIUMWLlz4+eefy2au3N3dr1y5EhER4ejo+NJLL0VERMydO7dz585ibIcOHUpKSsQyz549G3nPI488YkFIJm7WPT09Y2Ji5DIvXLggu5aNiorSmWX9+vXLly//+OOP5Q6GhoY6OzuPGzfuyy+//Oijj1q1alVVEW9CQkJkZGTv3r3FjJMmTYqMjFyzZo32NLKDAZ3LSXx8fGRk5D//+U9FUcaMGRMZGZmSkmJl8loQ8VqWvImJieLWrU2bNv/zP/8jBubn54eHh4v32IMGDZLH14JcbfFazN+d/fv3R0ZG9uzZU0w5duzYyMjImJgYuajS0lJxLETLmXPnzo2MjCwuLrZ424wpLCwUKwoODhYb8+6770ZqOX78uMGId/Pmzc7Ozn369AkPD4+IiHjppZfk46oVK1borMWGG6zRaETqzZs3T6zukUce0d7gpUuXWrNq/YLr119/dXV17dSp0+zZsxctWiSLC3Gvr3/QX3jhhaZNm06fPn3x4sX//ve/PT09xahp06bl5eW1atWqffv277///n/+858JEyaIUFBRlFWrVpm5+xqNZsuWLSPvkUMWL148cuTIf/3rX/oTT506Vaxi8uTJmZmZYuCZM2cGDhwo4p/vvvtOP3kjIyPd3d3F6fzOO++4u7svWLAgOTk5LS1t+/btffv2FcsMCgoqKCiwJsEtKwcsKMwrlG2SkpJEaebr6/vrr7+WlZWJ51DR0dHi1VlgYOCNGzcszjbCCy+8MHLkSFloZ2VlicN6+PBhjRn0S+x58+bJPdq9e7fFecCy3THBguOlf3cxduzYxo0bz5gxIzo6esGCBbKTiHbt2onHKKI0mzt3rry1WLJkSWRk5NmzZ3WufTNnzlQUpWfPnpGRkQcPHrQmkXfv3q2dr3Qi3qSkJDGlfsRrwQ5qS0xMFE8NWrRosXXrVpFFS0tL9+zZI2+fZs2aZX4hb84NQEXPC/1ligvHoEGDIiIiIiMjJ06cKKN0/QsHUFWIeGuFRYsWidInNTVVZ1RKSoqogawfG8giW3+B8ha5TZs23377rfao8ePHi1ETJ0709PSUt0cajaa4uDgoKEiM3bZtm7FlWhDxbt++XX8jR40aJWocXb9+XX+s3ME2bdp4e3ufOnVKjrpy5Ur9+vWrJOIV1q9fL2b85z//qT9W1jdr0aJFeXm5zti33npLURTt3bEmeS2IeC1I3ry8PBG7urm5Xbx4UWdRn376qViUfG1iWa62bC0V3Z3NmzeLKZ944gmDKXPz5k0XF5fAwEDtgdZsmwniJaGoa2diMu3T+bPPPtMetWrVKjGqcjZYvhDTucW01arlnj744INvvvmmuLcT/vWvf+nc62sf9A4dOujc84lKm25ubhMnTnzqqafkkwuNRvPzzz+LGYOCgjR28M0334jlT5gwQWdUcXFx9+7dxcsZnTog2qdz3bp169Wrl5CQoD2qrKxMvud58803K/nEsaYwNzPbiPql9erV0w6WhF9++UUsYejQofqFaoWyja2YKLGtzAO22h3rL76tW7f29/fPysqSo4qKiuRnIJs3b9aeSwbqcXFxBrdH1FnQmcucXTDx5tN0vhJj9WthWLaD8kSrV6/emTNndJaZk5PTrFkzGfFaXMjr7KlNzos2bdosXrxYe9TatWsNXjiAKkTEWyuMGTNG3OVoX9ukp556yuKIt3fv3jqjzpw5I0YpivLGG2/ojI2JiRGjpk2bZpOQ7NVXX+3Zs6fBvT5w4ICY6+uvv9YfK3dQ9KCrM3bChAkhISGaKop4b9++LT7y8fHx0bnMJCQkyM02uOSWLVvq1IKu2ojXnOR9//33xZQzZ87UX9Tdu3fF+6X69etr59KK5mrL1lLR3SktLW3ZsqWY8vz58/orWrhwoaIoOm+frNk2Eyp6MxQcHKw/Vn7HdevWLXtvsDmhizWrlnvaqVMnUSFZOnr0aEBAgPY7ee2D/ttvv+ksStZ7dHZ2zsjI0BkrP7bUTjSbyMvLE+9pnZ2dr127pj/B3r17xaq7deumP1ZWYTVY4TAtLU281Xd0dLxy5UplnjjWFObmZBv5wYixmpayJdstW7ZYk21sxUSJbWUesNXu2OTiu2fPHp2xS5cuNXiTEB0dLYa/9NJL+sssKiry8vLy9fXV2aOqjXgrtIPyRDOWRcXTJdtGvDY5L3r16qU/Y4sWLexUBgKWoa3mWkHcxJSWlm7fvl1/bFRUVGJioriCVtQLL7ygM6R9+/aySQb9sbJZFBO9pVdIdHR0fHy8wVHyyzpjEwienp76X+h9//33sqe+yle/fv0nn3xStJARFxenPeqnn35SFGXKlCni33Xr1mmPPXLkyOXLl0UoWE3cN3k1Gs2SJUvEb52vpwQnJ6fBgweLNlrE7luQqy1eS0V3x9HR8bXXXhO/5aMESTxf8PDwkBX/bLht1hs3bpz+QHnOXrx4sco32Farnjhxok77AkFBQYmJifpFlnjc069fP2PJ0q9fPx8fH2NjU1NTFZtauXJlfn6+oih9+vQx2GRUv379mjRpoijKsWPHTBR9BvfUz89P3OCWlZWtXLmyMk8cmxTmxmg0mm+//Vb8fvbZZw1OI7sq/eqrr2ySbezHVnnAyt2x/ng1bdpUfgkl/e1vfxM/dJpHeuGFF0R5/tNPP2k3KyWsW7fu5s2bkyZNqlatLpu/g/c90RRFGTJkSIMGDUw3eVUl58WLL75ozoUDqFpEvLWC/NLj2WefnT9/vs7VokWLFgEBASYatjVBp9920Tym/MhNv6U+0Qqioijigm1beXl5Fy9ePPt/yQe0+i3oagsMDJTfnFQf8vKjE9OuX7/+4Ycffv/998Xnc7L+syDuOI1duqrEfZP35MmTorVJZ2dn/ewkyE+YtO+PK5SrLV5LRXdHUZRXXnlFTLNs2TLtdjsVRRFtSv/jH//QbszcVttmPVlvUJuoSice1Vf5Bttq1aLap5kCAgK0G0UXGjVqJH4Y3Az7FXR79uwRP+QXIjrq1Kkjj6N816fDwcHBWDOqsnFj8ZquMk8c6wtzY06ePClmdHBwMNYYtYxDYmNjS0pKrM829mOTPGDb3bHseBk8s+TzI1ngCG5ubi+99JKiKHfv3tVvPGnJkiWOjo4TJ05UqhPzd1CeaA4ODgbLYfGZem5u7gcffGCrzbPVeWGwZDB2HIGqUu1u9GEPkydP/u67706ePFlYWPjee+998MEHAwcOHDVq1IgRI+TtrGXkjZ020XBLvXt0RsmmdMvKyhQbOXny5KJFi7Zv3y77qNChE3XoqGg3KpXjqaeecnV1Ff1GLFq0SFw1jx8/npqaOmfOHB8fn169eh04cODSpUt//PGHvCatX7++Xbt2sqeE6uC+yXv69Gnxo379+saeIsveKU6ePGlZrrZ4LRXdHXGlHzly5IYNG7Kzs9etWyfu0gTxQH3y5Mn22Dbryd4+tIlGO7XP2Src4Mo8juaUcsYSzR4FnfDnn3+KHyb6j5HfU5w6dcrgBB4eHgY7jxHfdoofZ8+erfwEt7Iwv2+iNW3aVOZnY4l2586dtLQ02fpdNbxY2CQP2GR3rDxeZhY40tSpU8WL0CVLlvz73/+WwWRycnJcXNzo0aOtvJ+xOfN30JwsanO2Oi8qehyBKkHEWyu4uLjExsbOmjXrhx9+KL1nxz1Tpkzp37//zJkzRbU0C5jo2dWunb5K33zzTVhYWFlZmaOj45AhQwIDAz08PMSFsLCwULYUaoKxO7+q5ebmNnTo0F9++eXKlStHjhwRLQCLV7ii0vKYMWPES5h169aJiPfo0aOXLl2SrURWE/dNXtkjYm5urmg3xYQbN25YlqstXktFd0eYOnXqhg0bRIgrI96rV69u3ry5d+/esrlO226b9Qyes/q1P6pwgyv5OJpTlFVOQaefAg888ICxaWRlfv3Kn/fdfbnYnJycSk5w6wtzmySaSDeDd/bV5GJhkzxg/e5Yf7zMLHCkzp07P/bYY3FxcRcuXNizZ88TTzyh/SRRfuxTfZi/g+YcU5uz1XlR0eMIVAki3tqiYcOGUVFRc+fOXbt27Zo1aw4ePCi+4vjtntDQ0B9++KHGlVD79+9//fXXxd799ttvOnWB8vLyrLlJqnJjxowRLSWuW7dORLzar3BHjx4dFhYmxoaHh+vEwzWIfFfm6+u7detW0xPrfKNlfq62Zi0WGDBgQPv27c+dO3fo0KGkpCTRi8PSpUvLyspknyJSJW+b9apwg2tcWtmcrBts4s2JHCWTy3w681Zagtu1MK9QolmWbmrKA9X54jtlyhTRtsW3334rIt6CgoKVK1c+9NBD+l/M1iDmHNMqWWkNOi8A04h4a5cmTZq8fk96enpMTMzXX3+dnp4u+kwLCAgQHdvUILJ/mlmzZhn79KXmGjZsmIuLS3Fx8fr16xcuXHjixImUlBT5CrdFixaPPvrooUOHUlNTExMTu3btun79+gcffNDYt3bVlqwQVVpaauzbQutztfVrqagpU6aIVS+5p6ysLDo6ukmTJvrt91T+tlmpCje4xqWVzTVu3Pjq1asiqDA2jRxlsLaheAV333nFh8qVluB2LczlXpiTaCbSTU15oIZefMeMGRMWFpadnb158+YrV660aNEiJiamoKBgypQp+l/M2orBgPDOnTs2XIU8TJX51avKzgvAtBr2Tg+24uvrO2vWrJSUFPlKUL8piOpPfj8mG9DXJjsPqKHc3d1FvdxLly4lJCTot0ql3bpVQkJCWlpajXvBq90wxrVr10zciFuZq224FjOFhoaKD5lEw6pbtmy5evXqhAkT9CuAVf62WakKN7jGpZX9UsBEc/eyDVhjTRMVFBQYu7E+d+6c+CEqJlRagtu1MJd7kXOP6UTz8vJq1aqVovY8UEMvvi4uLuPHj1cUpby8/LvvvhMve11cXGQnPfZ4BWow51+5csUexzQ7O9tE/GlbKjsvANOIeGuF2bNnG+xvwMXFRTaIb6zliepMtophsLJNpV027EdGbj/99NP69evbtm2r/Zpl9OjR4se6detqaJVmRVFatmwpvmvVaDQmurIYPny4j4/P559/blmutngtFvP09BSdTBQUFMTExHz77bcODg6TJk3Sn7ISts22N6BVuMGVfxyrG9FvmWxLWV9RUZHstdtEAw2HDx82OPz3338XPx5//PHKTHCbFOYmsk3Hjh3Fb/Htgz7Z0PTQoUPt97awWuWBGnrxlS3/RUdHx8bGJiUljRkzxmDzclZq2LCh+CEqDenQ6TjQStpZ1NiSt23b1rp168DAQIP53IJCXmXnBWAaEW+tcODAgdWrVxsstd3c3MTHV82bN1dqGtmsqLy6a9u3b5/1q9i5c+en99i1jVxjRowYIV4JRkdHnzt3Tiegbdmypfi+9/z589HR0a1bt5aPbGuW6dOnix/imb2+s2fPbt26NSsra9iwYRbnasvWYg35ye6CBQt27949ZMiQNm3aGJzSTttWv3598UO7V4lhw4Z17dr1yJEj5i+najd427ZtXbt2FS92quQ4VitPP/20aKH32LFjSUlJ+hOsW7dO1LccNWrUQw89ZGw5S5cu1R8YFxcnCjoPDw/ZKWjlJLg1hbk52WbatGnix7Jly/SXUFZW9t///ldnStXngWp+8TXmoYceGjhwoGgLUHQhrt84gk24ubm1aNFCXGFF10GSRqP55ptvbLs6mfFWrFhhcILly5dfunSpW7du2pGnlYW8ms4LwDQi3lrk/fff1x+4YcMG8Y1KterE1Uyyb/Tw8HCdd9QZGRmzZ8+2fhUxMTFv32NZP5BW8vDwEI1ziEfm+q9w5ZC8vLy///3vSs0UGho6aNAgRVFWr14tGuvSdvv2bZE5X3755Q4dOlicq61Zi2V69OghvnD766+/TDclaqdta9u2rU4FvPz8/N27d584cULcyVnMThvcuHFj0Wqodo3BgwcPnjhxQraKVPnHsVpxdHRctmyZaI9t8uTJOr2/ZGRkvP322+IrXGOdCYm75J07d/7444/aA69fvz5hwgTx+9NPP5VdRldOgltTmJuTbV5++WURJv38889btmzRWcL8+fNFDeGZM2dW/6YQbJIHqv/F1wRZll66dKlLly6PPvqonVY0ZMgQEd9Onz69tLRUDCwpKXnjjTds3ki7zKI//fTT9u3bdcZu2bJl/fr1rq6u77zzjg0LeTWdF8B9aFAL9O3bVxzuMWPG7N69Oz09/erVq0eOHJk1a5bonyAkJKSoqEhMPG3atNDQ0OHDh4tZ2rZtG3pPcnLyhQsXxO+WLVuKsaNHjw4NDV21apVGozl27JgYK26VnJycxL8HDhzQaDQbN24MDQ0dO3asmNHb21uM/fHHHw0u85NPPsnLyxOjgoODxajg4GAxpLCwUKPRFBcXy0tdw4YN58+fv2vXroMHDy5cuNDb23vo0KE66zpz5oxGo/niiy8M7uC0adP0k07c6omgxczU/uSTT7TTQVRCE0Nu3LhR0WMnH/e2adNGf2xaWpo8l48cOaI/wYEDByxL3hUrVojf4mNUV1dX8a841iZUKHmlnJycPn36iJu5119/PT4+PiMjIykpaenSpaI/wJCQkIKCAotztcVrsWx3pOjoaDFjy5YtS0tLbZsC93X27FnxNiAkJOT06dMpKSmiq6T+/ftrNBrTp7NGoxFjZRgzePDg0NDQ8PBw+22wRqN58cUXxepWrFiRnp6+ZcsWT09PUdvW4rQytqeydNJh7KCLYmfOnDmhoaG9evUSY7t3766dHwwm2ieffKKxqZUrV4rapN26ddu0aVN6evrFixeXLVsm7nEbN258+PBhgzN6e3uLIlG8uhk/T5kPAAAK+UlEQVQ+fHhUVNTq1atnz54tRimKMmHChPLy8ko+cSwrzCuUbbKzs8VRq1u37rvvvpuUlJSZmRkfHy8/AR0/fnxJSYnF2cYmjJXYoaGhX3zxhTV5wLa7Y9uLrzizjN0k6BxrjUZTUlIiu9799ttv7ZfI586dk304+fr6jh49+plnnvH29m7QoIHszNbT01PMu23bNit3UGZRJyen9957LykpKSMj49ChQ//+97+dnJzq1KmzcuXKChXyJm4AbH5emHnhAKoKEW+tcOLEialTpxp84NeoUaM5c+bcuXNHTiw7HNexY8cOY99xhYWFidLc4Njly5drNJoPP/zQ4FhjVWV69uyZmZlpcJToHFJsbX5+/qRJk3Q+JXJzc5s3b55+55D79u3TaDTGvmvy8/PTSbfS0lLxdVCXLl3MT21R09igtLS0ih67nJwc0X7GjBkzDE4QFBSkKEqrVq0MjjXWINl9k9fgF6fyWJtgfvLqKC4uXrhwoX5rkF5eXh999JFO7FrRXG3xWizeHaGgoED0Zzh37tz7TlzRbTPHV199pfMuIiAgQDy+MX06G/sqrG/fvnbd4IyMjG7dumkvzcnJaeHChdaklYkPUEXpZOZBF8WOwSaLZX4wOGPPnj01tnb8+HHZH6l2Wo0bN+7y5cvG5pIRr0aj2bBhgwwbBA8Pjy+//LKsrKxKThwLCvOKZpuioqLPPvtM/5vPtm3bxsTE6Exc0WxjEyaakBw8eLA1ecDmu2PDi684s4zdJOgca2HOnDlidbdu3bJrIu/du1eGdkKXLl2SkpL0T/bw8HDrd9BYFu3Spctvv/1W0ULexA2Azc8L8y8cQJVwqOnt2aJCUlNTT506lZWVVVRU5OHh4e/vHxgYqII+1rKzs+Pi4q5cueLk5NSqVauQkBDxZtJKO3bsEM+qo6KiXnvtNVtsKe6jvLw8ISEhJSUlJyfH3d3d39+/W7duprOoBbnagrVUGptv240bN2JjYzMzM52dnTt27BgcHGzbBkhsvsEajebo0aOnTp26c+dO06ZN+/Tp07Rp08pZdY2TlZUVHx+fmZnp5OTUvHnzXr16ifq9xvj4+Fy7ds3b21s88CorK4uLi0tLSysqKvLz8+vbt698o1VVCW5xYV6hbHP06NELFy7k5eV5eXl1ukepNXmgRlx872vz5s0jR4587bXXoqKi7L2ukpKSQ4cOifq9Dz/88GOPPWbvNcosmpub27Bhw65du8ompuxXyKvsvAB0EPEChhUVFT3yyCPnz5/v3LlzQkKC6RtBAKj+dCJeoIb6+9//vmHDhuPHj/N9KQBz0HIVYEB+fv7QoUPPnz/frFmzzZs3E+4CAFAdZGVlbdq0qWfPnoS7AMxExAsYUFxcfOPGjR49ehw+fNhYjzIAAMDeXn755U2bNsl/v/nmm9LSUhOt3wOADmo1A4bl5eU98MADsnMLAKihsrOz8/PzFUUJCgq6ceNG48aNRTeqHh4eok1joDpzcHB47LHH9u/f7+joeP78+b/97W8eHh6pqak27yIIgFoR8QIAoGaTJ0822MBPWFhYREREVWwRUAGiHaa2bdu2bt360KFDd+7c2bhx44gRI6p6uwDUGP+n1xMAAKBWw4cP1+mISJB9cQPV2dSpU48cOXL16tXz58/36dNnxowZAwYMqOqNAlCT8I4XAAAAAKBOtFwFAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAOpExAsAAAAAUCciXgAAAACAOhHxAgAAAADUiYgXAAAAAKBORLwAAAAAAHUi4gUAAAAAqBMRLwAAAABAnYh4AQAAAADqRMQLAAAAAFAnIl4AAAAAgDoR8QIAAAAA1ImIFwAAAACgTkS8AAAAAAB1IuIFAAAAAKgTES8AAAAAQJ2IeAEAAAAA6kTECwAAAABQJyJeAAAAAIA6EfECAAAAANSJiBcAAAAAoE5EvAAAAAAAdSLiBQAAAACoExEvAAAAAECdiHgBAAAAAIoq/X+lBf5otl4zDwAAAABJRU5ErkJggg==\"\n        media_type \"image/png\"\n    }\n    }\n  }",
-    "segmentation_chunk.baml": "class Chunk {\n  chunk_text string @description(\"A sub-segment of text representing a coherent unit of information.\")\n}\n\nclass DemoExample {\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n  chunks Chunk[]\n}\n\nclass DemoExampleV2 {\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n  chunks string[]\n}\n\ntemplate_string RenderDemoExample(demo: DemoExample) #\"\n  Segment Type: {{ demo.segment_type }}\n  Segment Text:\n  ---\n  {{ demo.segment_text }}\n  ---\n  {{ demo.chunks }}\n  --- End Example ---\n\"#\n\ntemplate_string RenderDemoExampleV2(demo: DemoExampleV2) #\"\n  Segment Type: {{ demo.segment_type }}\n  Segment Text:\n  ---\n  {{ demo.segment_text }}\n  ---\n  {{ demo.chunks }}\n  --- End Example ---\n\"#\n\nfunction ChunkSegment(instruction_text: string, demos: DemoExample[], input_segment: SegmentRaw) -> Chunk[] {\n  client GeminiFlash2\n\n  prompt #\"\n    {{ instruction_text }}\n\n    --- Few-Shot Examples ---\n    {% for demo in demos %}\n      {{ RenderDemoExample(demo) }}\n    {% endfor %}\n\n    --- Current Task ---\n    Segment Type: {{ input_segment.segment_type }}\n    Segment Text:\n    ---\n    {{ input_segment.segment_text }}\n    ---\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction ChunkSegmentV2(instruction_text: string, demos: DemoExampleV2[], input_segment: SegmentRaw) -> string[] {\n  client GeminiFlash2\n\n  prompt #\"\n    {{ instruction_text }}\n\n    --- Few-Shot Examples ---\n    {% for demo in demos %}\n      {{ RenderDemoExampleV2(demo) }}\n    {% endfor %}\n\n    --- Current Task ---\n    Segment Type: {{ input_segment.segment_type }}\n    Segment Text:\n    ---\n    {{ input_segment.segment_text }}\n    ---\n\n    {{ ctx.output_format }}\n  \"#\n}\n\n\n\n\ntest TestChunkTextBlockMultiSentence {\n  functions [ChunkSegment]\n  args {\n    instruction_text #\"\n      ** Decompose the provided segment text into semantically meaningful chunks, optimized for downstream tasks like embedding and summarization.\n      **Purpose:** High-quality chunking ensures effective information retrieval and accurate flashcard generation.\n      **Role:** You are an expert in document structure and semantic analysis. Carefully consider the 'Segment Type' to guide your chunking strategy. For example, preserve code structure in 'CODE_BLOCK' segments and list formatting in 'LIST_ITEM' segments. Maintain original formatting (newlines, indentation, list markers) within each chunk.\n    \"#\n    demos [\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n        // Define the 'chunks' list for this demo\n        chunks [\n          {\n            chunk_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n          }\n        ]\n      },\n      {\n        segment_type HEADING\n        segment_text \"Q Tip 2.3. Include sample code in your source files\"\n        chunks [\n          {\n            chunk_text \"Q Tip 2.3. Include sample code in your source files\"\n          }\n        ]\n      }\n    ]\n    input_segment {\n      segment_type TEXT_BLOCK\n      segment_text \"The first principle is encapsulation. It involves bundling data and methods within a class. The second principle is inheritance, allowing classes to inherit properties. Polymorphism is the third principle, enabling objects to take multiple forms.\"\n    }\n  }\n}\n\ntest TestChunkTextBlockMultiSentenceV2 {\n  functions [ChunkSegmentV2]\n  args {\n    instruction_text #\"\n      ** Decompose the provided segment text into semantically meaningful chunks, optimized for downstream tasks like embedding and summarization.\n      **Purpose:** High-quality chunking ensures effective information retrieval and accurate flashcard generation.\n      **Role:** You are an expert in document structure and semantic analysis. Carefully consider the 'Segment Type' to guide your chunking strategy. For example, preserve code structure in 'CODE_BLOCK' segments and list formatting in 'LIST_ITEM' segments. Maintain original formatting (newlines, indentation, list markers) within each chunk.\n    \"#\n    demos [\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n        // Define the 'chunks' list for this demo\n        chunks [\n          \n            \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n          \n        ]\n      },\n      {\n        segment_type HEADING\n        segment_text \"Q Tip 2.3. Include sample code in your source files\"\n        chunks [\n          \n             \"Q Tip 2.3. Include sample code in your source files\"\n          \n        ]\n      }\n    ]\n    input_segment {\n      segment_type TEXT_BLOCK\n      segment_text \"The first principle is encapsulation. It involves bundling data and methods within a class. The second principle is inheritance, allowing classes to inherit properties. Polymorphism is the third principle, enabling objects to take multiple forms.\"\n    }\n  }\n}\n",
+    "segmentation_chunk.baml": "class Chunk {\n  chunk_text string @description(\"A sub-segment of text representing a coherent unit of information.\")\n}\n\nclass DemoExample {\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n  chunks Chunk[]\n}\n\nclass DemoExampleV2 {\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n  chunks string[]\n}\n\ntemplate_string RenderDemoExample(demo: DemoExample) #\"\n  Segment Type: {{ demo.segment_type }}\n  Segment Text:\n  ---\n  {{ demo.segment_text }}\n  ---\n  {{ demo.chunks }}\n  --- End Example ---\n\"#\n\ntemplate_string RenderDemoExampleV2(demo: DemoExampleV2) #\"\n  Segment Type: {{ demo.segment_type }}\n  Segment Text:\n  ---\n  {{ demo.segment_text }}\n  ---\n  {{ demo.chunks }}\n  --- End Example ---\n\"#\n\nfunction ChunkSegment(instruction_text: string, demos: DemoExample[], input_segment: SegmentRaw) -> Chunk[] {\n  client GeminiFlash2\n\n  prompt #\"\n    {{ instruction_text }}\n\n    --- Few-Shot Examples ---\n    {% for demo in demos %}\n      {{ RenderDemoExample(demo) }}\n    {% endfor %}\n\n    --- Current Task ---\n    Segment Type: {{ input_segment.segment_type }}\n    Segment Text:\n    ---\n    {{ input_segment.segment_text }}\n    ---\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction ChunkSegmentV2(instruction_text: string, demos: DemoExampleV2[], input_segment: SegmentRaw) -> string[] {\n  client GeminiFlash2\n\n  prompt #\"\n    {{ instruction_text }}\n\n    --- Few-Shot Examples ---\n    {% for demo in demos %}\n      {{ RenderDemoExampleV2(demo) }}\n    {% endfor %}\n\n    --- Current Task ---\n    Segment Type: {{ input_segment.segment_type }}\n    Segment Text:\n    ---\n    {{ input_segment.segment_text }}\n    ---\n\n    {{ ctx.output_format }}\n  \"#\n}\n\n\nclass SegmentInBatch {\n  segment_index int @description(\"Position of the segment in this batch.\")\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n}\n\nclass SegmentChunks {\n  segment_index int @description(\"The segment_index of the input segment these chunks belong to.\")\n  chunks string[]\n}\n\nfunction ChunkSegmentsBatch(instruction_text: string, demos: DemoExampleV2[], input_segments: SegmentInBatch[]) -> SegmentChunks[] {\n  client GeminiFlash2\n\n  prompt #\"\n    {{ instruction_text }}\n\n    --- Few-Shot Examples ---\n    {% for demo in demos %}\n      {{ RenderDemoExampleV2(demo) }}\n    {% endfor %}\n\n    --- Current Task ---\n    Chunk each of the segments below on its own, exactly as in the examples. Never merge text from different segments.\n    Return one entry per segment with its Segment Index, covering every segment once.\n\n    {% for segment in input_segments %}\n    Segment Index: {{ segment.segment_index }}\n    Segment Type: {{ segment.segment_type }}\n    Segment Text:\n    ---\n    {{ segment.segment_text }}\n    ---\n    {% endfor %}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\n\n\n\ntest TestChunkTextBlockMultiSentence {\n  functions [ChunkSegment]\n  args {\n    instruction_text #\"\n      ** Decompose the provided segment text into semantically meaningful chunks, optimized for downstream tasks like embedding and summarization.\n      **Purpose:** High-quality chunking ensures effective information retrieval and accurate flashcard generation.\n      **Role:** You are an expert in document structure and semantic analysis. Carefully consider the 'Segment Type' to guide your chunking strategy. For example, preserve code structure in 'CODE_BLOCK' segments and list formatting in 'LIST_ITEM' segments. Maintain original formatting (newlines, indentation, list markers) within each chunk.\n    \"#\n    demos [\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n        // Define the 'chunks' list for this demo\n        chunks [\n          {\n            chunk_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n          }\n        ]\n      },\n      {\n        segment_type HEADING\n        segment_text \"Q Tip 2.3. Include sample code in your source files\"\n        chunks [\n          {\n            chunk_text \"Q Tip 2.3. Include sample code in your source files\"\n          }\n        ]\n      }\n    ]\n    input_segment {\n      segment_type TEXT_BLOCK\n      segment_text \"The first principle is encapsulation. It involves bundling data and methods within a class. The second principle is inheritance, allowing classes to inherit properties. Polymorphism is the third principle, enabling objects to take multiple forms.\"\n    }\n  }\n}\n\ntest TestChunkTextBlockMultiSentenceV2 {\n  functions [ChunkSegmentV2]\n  args {\n    instruction_text #\"\n      ** Decompose the provided segment text into semantically meaningful chunks, optimized for downstream tasks like embedding and summarization.\n      **Purpose:** High-quality chunking ensures effective information retrieval and accurate flashcard generation.\n      **Role:** You are an expert in document structure and semantic analysis. Carefully consider the 'Segment Type' to guide your chunking strategy. For example, preserve code structure in 'CODE_BLOCK' segments and list formatting in 'LIST_ITEM' segments. Maintain original formatting (newlines, indentation, list markers) within each chunk.\n    \"#\n    demos [\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n        // Define the 'chunks' list for this demo\n        chunks [\n          \n            \"This forms the foundation of meta-programming and is used in the section called \\\"Instrumenting Functions\\\" to dynamically redefine the definition of functions.\"\n          \n        ]\n      },\n      {\n        segment_type HEADING\n        segment_text \"Q Tip 2.3. Include sample code in your source files\"\n        chunks [\n          \n             \"Q Tip 2.3. Include sample code in your source files\"\n          \n        ]\n      }\n    ]\n    input_segment {\n      segment_type TEXT_BLOCK\n      segment_text \"The first principle is encapsulation. It involves bundling data and methods within a class. The second principle is inheritance, allowing classes to inherit properties. Polymorphism is the third principle, enabling objects to take multiple forms.\"\n    }\n  }\n}\n",
     "segmentation_merge.baml": "class SegmentRaw {\n  segment_type SegmentType @description(\"The type of the content in this segment.\")\n  segment_text string @description(\"The extracted text content of the segment, or a description if it's an image.\")\n}\n\nfunction CheckMergeAcrossPageBreak(context_before_page_break: SegmentRaw[], context_after_page_break: SegmentRaw[]) -> bool {\n  client GeminiFlash2\n\n  prompt #\"\n    Analyze the boundary between the text segments provided before and after a potential page break.\n    Focus EXCLUSIVELY on the relationship between the **VERY LAST segment BEFORE** the break and the **VERY FIRST segment AFTER** the break. The surrounding segments are provided for context only.\n\n    Context Before Potential Break (ends with the last segment before):\n    ---\n    {{ context_before_page_break }}\n    ---\n\n    Context After Potential Break (starts with the first segment after):\n    ---\n    {{ context_after_page_break }}\n    ---\n\n    Your task is to determine if the **very first segment AFTER** the break MUST be joined with the **very last segment BEFORE** the break into ONE single segment. This should only happen if the page break interrupted the flow *mid-sentence*, *mid-paragraph-thought*, *mid-list-item*, or *mid-code-structure* within that boundary pair.\n\n    - Output **true** ONLY if the first segment AFTER the break directly completes an obviously incomplete sentence, thought, list item, or code block started at the very end of the last segment BEFORE the break. Think: Was the last segment before the break cut off unnaturally mid-flow?\n\n    - Output **false** in all other cases, **especially** if the first segment AFTER the break starts something logically distinct from the end of the last segment BEFORE the break, even if they are the same segment type (e.g., TEXT_BLOCK to TEXT_BLOCK, CODE_BLOCK to CODE_BLOCK). Examples of when to output **false**:\n        - The first segment AFTER starts a new paragraph (look for paragraph structure, indentation, or a complete thought ending the last segment BEFORE).\n        - The first segment AFTER starts a new, complete code statement, function definition, or logical block relative to the end of the segment BEFORE.\n        - The first segment AFTER represents a natural transition or next step, rather than a direct continuation of an interrupted element from the segment BEFORE.\n        - The last segment BEFORE ends with clear sentence-ending punctuation (. ! ?) and the first segment AFTER starts a new thought.\n\n    Focus strictly on whether an **interruption** occurred *between the last segment before and the first segment after* that necessitates merging these two specific segments. Do **not** merge across standard paragraph breaks or logical code separations just because the topic is related or the segment types match.\n\n    Respond ONLY with the boolean value: true or false.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest CheckMergeAcrossPageBreakFalse {\n  functions [CheckMergeAcrossPageBreak]\n  args {\n    context_before_page_break [\n      {\n        segment_type CODE_BLOCK\n        segment_text \"$ rlwrap $QHOME/m32/q\\nq)\"\n      },\n      {\n        segment_type HEADING\n        segment_text \"Configuration\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"There are two important files in the installation. The first file is the q binary itself. It is located in the platform specific folder with a name like w32, s32, v32 or 132. The second file, q.k, is the file that defines many of the q operators. As previously mentioned, q is implemented as a mix of C, k, and q itself. The q.k file includes the implementation for many operators defined in k and q. Over time, a few of the operators previously implemented in q. k have been rewritten directly in C to increase performance. The complete list of operators defined in C can be found in the .Q.res variable.\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"q).Q.res\\n`in within like bin binr`ss`if do while ex\\nec`select`insert`update`delete`av..\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"The installation directory also contains another file named s.k which is used to implement an SQL interface for ODBC clients. It also provides an example of how to define other languages on top of k.\\nOn startup, the q binary must load the q. k file to pick up the q definitions. For the q binary to find this file, you must first set the QHOME environment variable to the full path of the directory holding q.k. Once you have become more familiar with the q language, you can obtain a deeper understanding, and perhaps pick up a few coding pointers, by reading the q.k file.\"\n      }\n    ]\n\n    context_after_page_break [\n      {\n        segment_type HEADING\n        segment_text \"Running q\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"Now that the binary is installed, and the QHOME environment variable is configured, we can start the kdb+ process. Here is an example of running q on my laptop. [1]\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"$ ./m32/q\\nKDB+ 3.2 2015.03.04 Copyright (C) 1993-2015 Kx Systems\\nm32/4() core 2048MB nick nicks-macbook.local 192.168.1.103 NONEXPIRE\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"There are few points to highlight here. On the first line of the banner, the 3.2 refers to the kdb+ version. This is followed by the q binary release date. On the second line, the m32 matches the architecture used to start the binary. 4() core indicates that kdb+ is capable of seeing 4 cores on my machine. If you purchase a production license, the number of licensed cores would appear within the parentheses. If you do not plan on using multiple cores per kdb+ instance, it is possible to reduce the number of cores visible to the q binary on *nix machines by changing the CPU affinity with the taskset utility. The number of available cores is followed by the system\\'s available memory, login ID, machine name, IP address, an optional company name and license expiration date (\\\"NONEXPIRE\\\" in the case of the free 32-bit version).\"\n      },\n      {\n        segment_type HEADING\n        segment_text \"Customization\"\n      }\n    ]\n  }\n}\n\ntest CheckMergeAcrossPageBreakTrue {\n  functions [CheckMergeAcrossPageBreak]\n  args {\n    context_before_page_break [\n      {\n        segment_type HEADING\n        segment_text \".stat.pctile\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"pctile:{[p;x]x iasc [x] -1+ceiling p*count x}\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"can be equivalently defined in k. [2]\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"k)pctile:{[p;x]x(<x) -1+--p*#x}\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"Another place the single backslash comes in handy is when q throws an exception. Q operators do their best to return the most appropriate value depending on the type and value of all parameters passed to them. For some combinations, however, there is no valid result. In these cases, an\"\n      }\n    ]\n\n    context_after_page_break [\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"exception is thrown. When this happens, the calling function is suspended and the prompt is changed to display its directory and another layer of parentheses.\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"q)1 mod `\\nk){x-y*x div y}\\n'type\\ndiv\\n1\\nq.q))\"\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"This indicates that q has entered the debugger. If we type another invalid statement, another layer of debugging is entered and another level of parentheses is displayed at the prompt. We will talk more about directories in Section 5.3 and the debugger in Chapter 13. Ctrl-c will not exit the debugger, and Ctrl-d and \\\"\\\\\\\" will quit the application. One way to return to the q) prompt is to type a single backslash \\\"\\\\\\\". This will exit one layer of debugging. Remember to type a single backslash for each level. Trying to exit multiple levels by typing a double backslash will exit the program, not the debugger.\" // Note: Escaped backslashes here\n      },\n      {\n        segment_type TEXT_BLOCK\n        segment_text \"A single backslash can also be used in a q source file. Used as the only character on a line, a forward slash begins a multi-line comment. The multi-line comment continues until the end of file or a closing backslash is found. At any other location, a space followed by a forward slash comments the remainder of the line.\"\n      },\n      {\n        segment_type CODE_BLOCK\n        segment_text \"/\\nall text following a single forward slash\\nis ignored until the end of a file\"\n      }\n    ]\n  }\n}",
     "segmentation_topics.baml": "function IdentifyMultipleTopicBoundaries(segments: Segment[]) -> int[] {\n  client GeminiFlash2\n\n  prompt #\"\n    **ROLE:** Act as an expert structural analyst for a critical AI knowledge processing pipeline.\n    **PURPOSE:** Your primary goal is to accurately identify the starting points of major thematic and structural sections within the provided text segments. This grouping is ESSENTIAL for downstream tasks like hierarchical summarization, accurate context retrieval for RAG systems, and effective knowledge structuring. Errors in identifying these major sections will lead to fragmented understanding and severely degrade the quality of the final knowledge base, potentially impacting significant research or project outcomes.\n    **TASK:** Identify the starting point (**0-based index**) of every major **structural or thematic section** within this segment sequence. A new section begins when there's a significant shift in the primary subject matter OR when the document's organizational pattern fundamentally changes (e.g., moving from definitions to extended examples, or from problem setup to detailed solution).\n\n    The input is a sequence of document segments provided in order. Analyze this entire sequence holistically.\n\n    **Analysis Instructions:**\n    1.  First, perform a preliminary analysis of the entire sequence to understand:\n        *   The inferred high-level organization and logical flow.\n        *   Recurring structural units or presentation patterns (e.g., repeating sequences of concept explanation -> code example -> output discussion).\n        *   **Synthesize the core purpose or theme** of consecutive groups of segments to grasp the larger structure. This synthesis is key to avoiding premature splits.\n    2.  Identify the `segment_number` (**0-based index within this sequence**) of the **first** segment that marks the beginning of each new major section, prioritizing based on this hierarchy:\n        *   **MAJOR BOUNDARIES (Highest Priority):** Mark the start when there's a shift to a significantly different subject domain OR a fundamental change in the *type* or *purpose* of the content (e.g., finishing background theory and starting practical applications). These represent the most critical divisions.\n        *   **MEDIUM BOUNDARIES:** Mark the start if the *approach* changes substantially (e.g., broad overview shifts to deep technical detail on the same general topic), representing a distinct new phase of discussion. Evaluate carefully if this truly constitutes a *major* section start for the project's purpose.\n        *   **MINOR BOUNDARIES (Ignore):** Do *not* mark a start for simple elaborations, continuation of examples/lists, or new paragraphs discussing the same core point within the same approach. Incorrectly marking minor boundaries fragments crucial context.\n    3.  The very first segment (segment number 0 relative to this sequence) always starts the first section.\n    4.  Compile the `segment_number` (**0-based index**) values for the start of each identified **major section** into a single list of integers.\n\n    **Specific Guidelines:**\n    *   Evaluate segment types (e.g., `CODE_BLOCK`, `TEXT_BLOCK`, `LIST_ITEM`) based on their role *within the context* of surrounding segments. Resist splitting based on type alone; consider the functional relationship.\n    *   Group segments forming a cohesive functional pattern together. Over-splitting these functional units is a critical error.\n    *   A break in a *repeating structural pattern* is a stronger indicator of a potential major boundary than minor variations in content within that pattern.\n    *   Focus on the **scale and significance** of the change relative to the overall document structure and the **purpose** of downstream knowledge processing. Only mark starts for genuinely new, high-level blocks.\n    \n\n    Input Sequence of Segments:\n    ---\n    {{ segments }}\n    ---\n    \n    {{ ctx.output_format }}\n  \"#\n}\n\n\ntest IdentifyMultipleBoundaries_ExpectedTrue {\n  functions [IdentifyMultipleTopicBoundaries]\n  args {\n    segments [\n      {\n        segment_number 0\n        segment_type TEXT_BLOCK\n        segment_text \"The installation directory also contains another file named s.k which is used to implement an SQL interface for ODBC clients. It also provides an example of how to define other languages on top of k.\"\n      },\n      {\n        segment_number 1\n        segment_type TEXT_BLOCK\n        segment_text \"On startup, the q binary must load the q.k file to pick up the q definitions. For the q binary to find this file, you must first set the QHOME environment variable to the full path of the directory holding q.k.\"\n      },\n      {\n        segment_number 2\n        segment_type TEXT_BLOCK\n        segment_text \"Once you have become more familiar with the q language, you can obtain a deeper understanding, and perhaps pick up a few coding pointers, by reading the q.k file.\"\n      },\n      {\n        segment_number 3\n        segment_type HEADING\n        segment_text \"Running q\" \n      },\n      {\n        segment_number 4\n        segment_type TEXT_BLOCK\n        segment_text \"Now that the binary is installed, and the QHOME environment variable is configured, we can start the kdb+ process. Here is an example of running q on my laptop. [1]\"\n      },\n      {\n        segment_number 5\n        segment_type CODE_BLOCK\n        segment_text \"$ ./m32/q\\nKDB+ 3.2 2015.03.04 Copyright (C) 1993-2015 Kx Systems\\nm32/4() core 2048MB nick nicks-macbook.local 192.168.1.103 NONEXPIRE\"\n      },\n      {\n        segment_number 6\n        segment_type TEXT_BLOCK\n        segment_text \"There are few points to highlight here. On the first line of the banner, the 3.2 refers to the kdb+ version. This is followed by the q binary release date. On the second line, the m32 matches the architecture used to start the binary...\" // Truncated for brevity\n      },\n      {\n        segment_number 7\n        segment_type HEADING\n        segment_text \"Customization\"\n      },\n      {\n        segment_number 8\n        segment_type TEXT_BLOCK\n        segment_text \"You can customize the q startup process by creating a file named q.q in the QHOME directory. This file, if it exists, is loaded after q.k but before the prompt is displayed.\"\n      },\n       {\n        segment_number 9\n        segment_type TEXT_BLOCK\n        segment_text \"This allows you to define custom functions or load additional libraries automatically upon startup.\"\n      }\n    ]\n  }\n}",
     "topics_summarization.baml": "function GenerateTopicSummary(segments: SegmentRaw[]) -> string {\n    client GeminiFlash2\n    \n    prompt #\"\n    **Task:** Generate a very concise summary for a sequence of document segments that constitute a single topic. Avoid generic phrasing that could apply to multiple topics.\n    **Purpose:** To capture the core theme or main idea of the topic block succinctly. This summary will later provide context within a RAG system and serve as a standalone topic identifier.\n    **Role:** Act as an expert content analyst skilled at identifying the central concept of a text block and expressing it in a brief, informative phrase.\n    \n    **Summary Creation Guidelines:**\n    1. Include key terminology or specific concepts that define the topic. Technical precision with domain-specific terms is essential for distinguishing between related concepts.\n    2. Structure summaries consistently using established patterns appropriate to the content:\n       - Action-oriented: '[Action]: [subject] and [purpose]'\n       - Feature-focused: '[Component/Feature]: [primary function]'\n       - Concept-centered: '[Concept]: [defining characteristics]'\n    3. Prioritize terms and phrases users would likely search for when seeking this information. Focus on distinctive terminology that differentiates this topic from similar ones in the document.\n    4. Adapt summary style based on content type: For procedural content, emphasize actions and methods; for conceptual content, emphasize definitions and relationships; for example-based content, indicate the illustrative purpose.\n    5. Prioritize information density over grammatical completeness. Use noun phrases, specialized terminology, and precise verbs rather than complete sentences when appropriate.\n    \n    `segments`: {{ segments }}\n\n    {{ ctx.output_format }}\n    \"#\n}\n\nfunction GenerateContextualTopicSummary(\n    previous_topic_summary: string, \n    next_topic_summary: string, \n    segments: SegmentRaw[]) -> string {\n    \n    client GeminiFlash2\n\n    prompt #\"\n    **Task:** Synthesize the core purpose and theme of the **current topic segments** into a highly concise and informative summary, leveraging the context of adjacent topic summaries.\n    **Purpose:** This summary acts as a critical contextual header that represents the core content. Its quality directly determines how effectively the content can be identified, retrieved, and utilized.\n    **Role:** Act as an expert document analyst and content writer specializing in semantic synthesis. You must distill the essence of content while understanding its structural role within the document flow.\n\n    **Contextual Information:**\n    - The `previous_topic_summary` describes the content immediately preceding this topic block.\n    - The `next_topic_summary` describes the content immediately following this topic block.\n    - Use these to understand the current topic's relationship to surrounding material - whether it builds on previous content, introduces new information, provides supporting details, or transitions to different subject matter.\n\n    **Analysis & Synthesis Instructions:**\n    1.  **Analyze Segments:** First, analyze the provided `topic_segments`. Identify the primary subject matter, key domain-specific terms, and the overall function (e.g., explaining a concept, providing examples, presenting evidence, describing processes).\n    2.  **Synthesize Core Theme:** Determine the single most important idea or purpose represented by the *combination* of these segments.\n    3.  **Incorporate Context:** Evaluate how the `previous_topic_summary` and `next_topic_summary` frame the current topic. Does the context suggest this topic is continuing an established thread, introducing a new concept, or serving as a bridge between related ideas? Let this inform the nuance of your summary.\n    4.  **Generate Summary:** Create a single very concise summary (4-15 words) that:\n        *   Accurately captures the core essence identified in step 2.\n        *   Reflects the topic's role (using appropriate framing words if they add clarity, but always prioritizing conciseness and informativeness).\n        *   Uses precise terminology found within the segments where possible.\n        *   Is clear, unambiguous, and maximally useful for distinguishing this topic's content during retrieval. Avoid generic phrasing.\n    \n    **Note: The summary should be adaptable to the document's domain - whether technical documentation, academic text, narrative content, or instructional material. Use terminology and framing appropriate to the content's domain.\n    **Content Type Guidance: Consider the type of content in the segments (conceptual explanations, procedural instructions, examples, definitions, etc.) and ensure the summary reflects the predominant content type.\n\n    `previous_topic_summary`: {{ previous_topic_summary }}\n\n    `next_topic_summary`: {{ next_topic_summary }}\n    \n    `topic_segments`: {{ segments }}\n\n    {{ ctx.output_format }}\n    \"#\n}\n\ntest InitialSummary {\n    functions [GenerateTopicSummary]\n    args {\n        segments [\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"The installation directory also contains another file named s.k which is used to implement an SQL interface for ODBC clients. It also provides an example of how to define other languages on top of k.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"On startup, the q binary must load the q.k file to pick up the q definitions. For the q binary to find this file, you must first set the QHOME environment variable to the full path of the directory holding q.k.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"Once you have become more familiar with the q language, you can obtain a deeper understanding, and perhaps pick up a few coding pointers, by reading the q.k file.\"\n            },\n            {\n                segment_type HEADING\n                segment_text \"Running q\" \n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"Now that the binary is installed, and the QHOME environment variable is configured, we can start the kdb+ process. Here is an example of running q on my laptop. [1]\"\n            },\n            {\n                segment_type CODE_BLOCK\n                segment_text \"$ ./m32/q\\nKDB+ 3.2 2015.03.04 Copyright (C) 1993-2015 Kx Systems\\nm32/4() core 2048MB nick nicks-macbook.local 192.168.1.103 NONEXPIRE\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"There are few points to highlight here. On the first line of the banner, the 3.2 refers to the kdb+ version. This is followed by the q binary release date. On the second line, the m32 matches the architecture used to start the binary...\" // Truncated for brevity\n            },\n            {\n                segment_type HEADING\n                segment_text \"Customization\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"You can customize the q startup process by creating a file named q.q in the QHOME directory. This file, if it exists, is loaded after q.k but before the prompt is displayed.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"This allows you to define custom functions or load additional libraries automatically upon startup.\"\n            }\n        ]\n    }\n}\n\ntest ContextualSummary {\n    functions [GenerateContextualTopicSummary]\n    args {\n        previous_topic_summary \"N/A\"\n        next_topic_summary \"N/A\"\n        segments [\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"The installation directory also contains another file named s.k which is used to implement an SQL interface for ODBC clients. It also provides an example of how to define other languages on top of k.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"On startup, the q binary must load the q.k file to pick up the q definitions. For the q binary to find this file, you must first set the QHOME environment variable to the full path of the directory holding q.k.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"Once you have become more familiar with the q language, you can obtain a deeper understanding, and perhaps pick up a few coding pointers, by reading the q.k file.\"\n            },\n            {\n                segment_type HEADING\n                segment_text \"Running q\" \n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"Now that the binary is installed, and the QHOME environment variable is configured, we can start the kdb+ process. Here is an example of running q on my laptop. [1]\"\n            },\n            {\n                segment_type CODE_BLOCK\n                segment_text \"$ ./m32/q\\nKDB+ 3.2 2015.03.04 Copyright (C) 1993-2015 Kx Systems\\nm32/4() core 2048MB nick nicks-macbook.local 192.168.1.103 NONEXPIRE\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"There are few points to highlight here. On the first line of the banner, the 3.2 refers to the kdb+ version. This is followed by the q binary release date. On the second line, the m32 matches the architecture used to start the binary...\" // Truncated for brevity\n            },\n            {\n                segment_type HEADING\n                segment_text \"Customization\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"You can customize the q startup process by creating a file named q.q in the QHOME directory. This file, if it exists, is loaded after q.k but before the prompt is displayed.\"\n            },\n            {\n                segment_type TEXT_BLOCK\n                segment_text \"This allows you to define custom functions or load additional libraries automatically upon startup.\"\n            }\n        ]\n    }\n}",
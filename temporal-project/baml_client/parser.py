@@ -115,6 +115,32 @@ class LlmResponseParser:
 
       return cast(List[str], parsed)
     
+    def ChunkSegmentsBatch(
+        self,
+        llm_response: str,
+        baml_options: BamlCallOptions = {},
+    ) -> List[types.SegmentChunks]:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      parsed = self.__runtime.parse_llm_response(
+        "ChunkSegmentsBatch",
+        llm_response,
+        types,
+        types,
+        partial_types,
+        False,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+      )
+
+      return cast(List[types.SegmentChunks], parsed)
+    
     def GenerateContextualTopicSummary(
         self,
         llm_response: str,
@@ -386,6 +412,32 @@ class LlmStreamParser:
 
       return cast(List[Optional[str]], parsed)
     
+    def ChunkSegmentsBatch(
+        self,
+        llm_response: str,
+        baml_options: BamlCallOptions = {},
+    ) -> List[partial_types.SegmentChunks]:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      parsed = self.__runtime.parse_llm_response(
+        "ChunkSegmentsBatch",
+        llm_response,
+        types,
+        types,
+        partial_types,
+        True,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+      )
+
+      return cast(List[partial_types.SegmentChunks], parsed)
+    
     def GenerateContextualTopicSummary(
         self,
         llm_response: str,
@@ -60,6 +60,15 @@ class Segment(BaseModel):
     segment_type: Optional[types.SegmentType] = None
     segment_text: Optional[str] = None
 
+class SegmentChunks(BaseModel):
+    segment_index: Optional[int] = None
+    chunks: List[str]
+
+class SegmentInBatch(BaseModel):
+    segment_index: Optional[int] = None
+    segment_type: Optional[types.SegmentType] = None
+    segment_text: Optional[str] = None
+
 class SegmentRaw(BaseModel):
     segment_type: Optional[types.SegmentType] = None
     segment_text: Optional[str] = None
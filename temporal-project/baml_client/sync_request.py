@@ -106,6 +106,29 @@ class HttpRequest:
         False,
       )
     
+    def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      return self.__runtime.build_request_sync(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,"demos": demos,"input_segments": input_segments,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        False,
+      )
+    
     def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
@@ -347,6 +370,29 @@ class HttpStreamRequest:
         True,
       )
     
+    def ChunkSegmentsBatch(
+        self,
+        instruction_text: str,demos: List[types.DemoExampleV2],input_segments: List[types.SegmentInBatch],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      return self.__runtime.build_request_sync(
+        "ChunkSegmentsBatch",
+        {
+          "instruction_text": instruction_text,"demos": demos,"input_segments": input_segments,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        True,
+      )
+    
     def GenerateContextualTopicSummary(
         self,
         previous_topic_summary: str,next_topic_summary: str,segments: List[types.SegmentRaw],
@@ -22,7 +22,7 @@ from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIM
 class TypeBuilder(_TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["Chunk","DemoExample","DemoExampleV2","Flashcard","Segment","SegmentRaw","StudyInput","TopicSummaryWithSegments",]
+          ["Chunk","DemoExample","DemoExampleV2","Flashcard","Segment","SegmentChunks","SegmentInBatch","SegmentRaw","StudyInput","TopicSummaryWithSegments",]
         ), enums=set(
           ["FlashcardType","SegmentType",]
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
@@ -48,6 +48,14 @@ class TypeBuilder(_TypeBuilder):
     def Segment(self) -> "SegmentAst":
         return SegmentAst(self)
 
+    @property
+    def SegmentChunks(self) -> "SegmentChunksAst":
+        return SegmentChunksAst(self)
+
+    @property
+    def SegmentInBatch(self) -> "SegmentInBatchAst":
+        return SegmentInBatchAst(self)
+
     @property
     def SegmentRaw(self) -> "SegmentRawAst":
         return SegmentRawAst(self)
@@ -286,6 +294,94 @@ class SegmentProperties:
 
     
 
+class SegmentChunksAst:
+    def __init__(self, tb: _TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("SegmentChunks")
+        self._properties: typing.Set[str] = set([ "segment_index",  "chunks", ])
+        self._props = SegmentChunksProperties(self._bldr, self._properties)
+
+    def type(self) -> FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "SegmentChunksProperties":
+        return self._props
+
+
+class SegmentChunksViewer(SegmentChunksAst):
+    def __init__(self, tb: _TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
+        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class SegmentChunksProperties:
+    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties
+
+    
+
+    @property
+    def segment_index(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("segment_index"))
+
+    @property
+    def chunks(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("chunks"))
+
+    
+
+class SegmentInBatchAst:
+    def __init__(self, tb: _TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("SegmentInBatch")
+        self._properties: typing.Set[str] = set([ "segment_index",  "segment_type",  "segment_text", ])
+        self._props = SegmentInBatchProperties(self._bldr, self._properties)
+
+    def type(self) -> FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "SegmentInBatchProperties":
+        return self._props
+
+
+class SegmentInBatchViewer(SegmentInBatchAst):
+    def __init__(self, tb: _TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
+        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class SegmentInBatchProperties:
+    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties
+
+    
+
+    @property
+    def segment_index(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("segment_index"))
+
+    @property
+    def segment_type(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("segment_type"))
+
+    @property
+    def segment_text(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("segment_text"))
+
+    
+
 class SegmentRawAst:
     def __init__(self, tb: _TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
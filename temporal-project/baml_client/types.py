@@ -83,6 +83,15 @@ class Segment(BaseModel):
     segment_type: "SegmentType"
     segment_text: str
 
+class SegmentChunks(BaseModel):
+    segment_index: int
+    chunks: List[str]
+
+class SegmentInBatch(BaseModel):
+    segment_index: int
+    segment_type: "SegmentType"
+    segment_text: str
+
 class SegmentRaw(BaseModel):
     segment_type: "SegmentType"
     segment_text: str
@@ -6,6 +6,94 @@ POCKETBASE_URL = os.getenv("POCKETBASE_URL", "http://127.0.0.1:8090")
 PB_APP_USER_EMAIL = os.getenv("PB_APP_USER_EMAIL", "tempbot@memcard.com")
 PB_APP_USER_PASSWORD = os.getenv("PB_APP_USER_PASSWORD", "password2")
 
+# Bumped whenever GenerateFlashcardsWorkflow changes in a way old histories can't replay,
+# workers for the previous queue keep running until its workflows drain (see readme)
+TEMPORAL_TASK_QUEUE = os.getenv("TEMPORAL_TASK_QUEUE", "general-work-queue-v2")
+
+# Shared HTTP connection pool used for every PocketBase call in the process
+POCKETBASE_POOL_SIZE = int(os.getenv("POCKETBASE_POOL_SIZE", "100"))
+POCKETBASE_POOL_SIZE_PER_HOST = int(os.getenv("POCKETBASE_POOL_SIZE_PER_HOST", "50"))
+POCKETBASE_KEEPALIVE_TIMEOUT = float(os.getenv("POCKETBASE_KEEPALIVE_TIMEOUT", "30"))
+POCKETBASE_REQUEST_TIMEOUT = float(os.getenv("POCKETBASE_REQUEST_TIMEOUT", "300"))
+
+# Superuser tokens are refreshed this many seconds before they expire
+POCKETBASE_TOKEN_REFRESH_MARGIN = float(os.getenv("POCKETBASE_TOKEN_REFRESH_MARGIN", "300"))
+
+# Must not exceed the server's batch.maxRequests setting (see pocketbase_files/migrations)
+POCKETBASE_BATCH_MAX_REQUESTS = int(os.getenv("POCKETBASE_BATCH_MAX_REQUESTS", "200"))
+
+# Seconds between rate limiter stats log lines on the worker, 0 turns them off
+RATE_LIMIT_STATS_INTERVAL = float(os.getenv("RATE_LIMIT_STATS_INTERVAL", "60"))
+
+# Where rate limit buckets live - local (per process), sqlite (shared by workers on one host)
+# or coordinator (shared by the whole fleet through rate_limit_coordinator.py)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "local")
+RATE_LIMIT_SQLITE_PATH = os.getenv("RATE_LIMIT_SQLITE_PATH", "/tmp/memcard_rate_limits.sqlite3")
+RATE_LIMIT_COORDINATOR_URL = os.getenv("RATE_LIMIT_COORDINATOR_URL", "http://127.0.0.1:8095")
+# Seconds to use local buckets after the coordinator fails a request, before trying it again
+RATE_LIMIT_COORDINATOR_COOLDOWN = float(os.getenv("RATE_LIMIT_COORDINATOR_COOLDOWN", "30"))
+
+# Grow limiter rates while Gemini accepts calls and back off on 429/503, up to these ceilings
+ADAPTIVE_RATE_LIMIT = os.getenv("ADAPTIVE_RATE_LIMIT", "true").lower() == "true"
+LLM_MAX_TPS = float(os.getenv("LLM_MAX_TPS", "200"))
+EMBEDDING_MAX_TPS = float(os.getenv("EMBEDDING_MAX_TPS", "200"))
+# Throttled LLM and embedding calls are retried this many times, waiting THROTTLE_BACKOFF * 2^attempt seconds
+# between tries on top of the cut rate. A call still throttled after that fails its activity attempt
+THROTTLE_RETRIES = int(os.getenv("THROTTLE_RETRIES", "4"))
+THROTTLE_BACKOFF = float(os.getenv("THROTTLE_BACKOFF", "1"))
+
+# Embedding requests in flight at once per worker, they share one pooled genai client
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "20"))
+
+# gemini or local (sentence-transformers on CPU, needs `pip install sentence-transformers`).
+# Vectors from different backends don't mix, recreate the Qdrant collection after switching
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "gemini")
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+LOCAL_EMBEDDING_BATCH_SIZE = int(os.getenv("LOCAL_EMBEDDING_BATCH_SIZE", "32"))
+# 0 encodes on a single thread in the worker, more spreads batches over that many processes
+LOCAL_EMBEDDING_PROCESSES = int(os.getenv("LOCAL_EMBEDDING_PROCESSES", "0"))
+
+# Per-document coordinate indexes kept in the worker for document walks, 0 turns the cache off
+DOCUMENT_INDEX_CACHE_SIZE = int(os.getenv("DOCUMENT_INDEX_CACHE_SIZE", "8"))
+DOCUMENT_INDEX_CACHE_TTL = float(os.getenv("DOCUMENT_INDEX_CACHE_TTL", "600"))
+
+# Processes used to rasterize PDF pages for segmentation, shared by every job on the worker
+RENDER_PROCESSES = int(os.getenv("RENDER_PROCESSES", str(min(4, os.cpu_count() or 1))))
+
+# Chunking packs consecutive segments into one ChunkSegmentsBatch call, up to this many estimated tokens of segment text
+CHUNKING_BATCHED = os.getenv("CHUNKING_BATCHED", "true").lower() == "true"
+CHUNKING_BATCH_TOKEN_BUDGET = int(os.getenv("CHUNKING_BATCH_TOKEN_BUDGET", "3000"))
+CHUNKING_BATCH_MAX_SEGMENTS = int(os.getenv("CHUNKING_BATCH_MAX_SEGMENTS", "30"))
+
+# Headings, footers, captions, lists, code and anything under CHUNK_TARGET_CHARS are chunked by rules, without the LLM
+CHUNKING_LOCAL_RULES = os.getenv("CHUNKING_LOCAL_RULES", "true").lower() == "true"
+CHUNK_TARGET_CHARS = int(os.getenv("CHUNK_TARGET_CHARS", "500"))
+
+# Per chunking activity: LLM workers, segments fetched at a time, and chunk records per bulk save
+CHUNKING_WORKERS = int(os.getenv("CHUNKING_WORKERS", "8"))
+CHUNKING_FETCH_GROUP_SIZE = int(os.getenv("CHUNKING_FETCH_GROUP_SIZE", "50"))
+CHUNKING_SAVE_BATCH_SIZE = int(os.getenv("CHUNKING_SAVE_BATCH_SIZE", "100"))
+
+# Local caches (embeddings, ...) live here, point it at a volume so they survive restarts
+CACHE_DIR = os.getenv("CACHE_DIR", "/tmp/memcard_cache")
+
+# Embeddings keyed by hash(model, task type, text), capped on disk with an in-memory LRU in front
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", os.path.join(CACHE_DIR, "embeddings.sqlite3"))
+EMBEDDING_CACHE_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(2 * 1024**3)))
+EMBEDDING_CACHE_MEMORY_ITEMS = int(os.getenv("EMBEDDING_CACHE_MEMORY_ITEMS", "20000"))
+
+# SegmentPageImage results keyed by hash(rendered image, function, prompt version), so re-rendered pages skip the LLM
+SEGMENTATION_CACHE_ENABLED = os.getenv("SEGMENTATION_CACHE_ENABLED", "true").lower() == "true"
+SEGMENTATION_CACHE_PATH = os.getenv("SEGMENTATION_CACHE_PATH", os.path.join(CACHE_DIR, "segmentation.sqlite3"))
+SEGMENTATION_CACHE_MAX_BYTES = int(os.getenv("SEGMENTATION_CACHE_MAX_BYTES", str(512 * 1024**2)))
+SEGMENTATION_CACHE_MEMORY_ITEMS = int(os.getenv("SEGMENTATION_CACHE_MEMORY_ITEMS", "1000"))
+
+# Downloaded PDFs, streamed to disk so later activities on the worker open them from here
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(CACHE_DIR, "pdfs"))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(10 * 1024**3)))
+PDF_DOWNLOAD_CHUNK_SIZE = int(os.getenv("PDF_DOWNLOAD_CHUNK_SIZE", str(1024**2)))
+
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "add_an_api_key_from_gemini")
 
 if GEMINI_API_KEY == "add_an_api_key_from_gemini" or not GEMINI_API_KEY:
@@ -1,42 +1,63 @@
+from functools import partial
 from baml_client.async_client import types, b
 from baml_py import Image as BamlImage
 from database.tps_utils import rate_limit
+from config import ADAPTIVE_RATE_LIMIT, LLM_MAX_TPS, THROTTLE_RETRIES
 
-@rate_limit("baml", 100)
+# Every function below calls the GeminiFlash2 client (see baml_src), so they share its quota through one
+# bucket keyed by the client. Calls in flight per process on that client
+LLM_MAX_CONCURRENCY = 50
+# Most of those slots one function can hold, so a busy stage can't starve the others
+LLM_FUNCTION_MAX_CONCURRENCY = 20
+
+gemini_flash_2_limit = partial(rate_limit, "baml", 100, burst=100, max_concurrency=LLM_MAX_CONCURRENCY,
+                               scope="GeminiFlash2", adaptive=ADAPTIVE_RATE_LIMIT, max_tps=LLM_MAX_TPS,
+                               throttle_retries=THROTTLE_RETRIES)
+
+
+# Pages are segmented before anything else in a job runs, so this one may use the whole client
+@gemini_flash_2_limit()
 async def segment_page_image(page_image: BamlImage):
     return await b.SegmentPageImage(page_image)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def chunk_segment(instruction_text: str, 
                         demos: list[types.DemoExampleV2], 
                         input_segment: types.SegmentRaw) -> list[str]:
     return await b.ChunkSegmentV2(instruction_text, demos, input_segment)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
+async def chunk_segments_batch(instruction_text: str,
+                               demos: list[types.DemoExampleV2],
+                               input_segments: list[types.SegmentInBatch]) -> list[types.SegmentChunks]:
+    return await b.ChunkSegmentsBatch(instruction_text, demos, input_segments)
+
+
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def identify_topic_bounds(segments: list[types.Segment]) -> list[int]:
     return await b.IdentifyMultipleTopicBoundaries(segments)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def generate_topic_summary(segments: list[types.SegmentRaw]) -> str:
     return await b.GenerateTopicSummary(segments)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def generate_contextual_topic_summary(prev_summary: str, 
                                             next_summary: str, 
                                             segments: list[types.SegmentRaw]) -> str:
     return await b.GenerateContextualTopicSummary(prev_summary, next_summary, segments)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def generate_document_summary(summaries: list[str]) -> str:
     return await b.GenerateDocumentSummary(summaries)
 
 
-@rate_limit("baml", 20)
+@gemini_flash_2_limit(max_in_flight=LLM_FUNCTION_MAX_CONCURRENCY)
 async def generate_flashcards(study_input: types.StudyInput) -> list[types.Flashcard]:
     return await b.GenerateFlashcardsDetailed(study_input)
 
@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+
+# --- HELPFUL TYPES ---
+CacheKey = str
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
+    memory_items: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# --- Helpful Functions ---
+def make_cache_key(*parts: str | bytes | memoryview) -> CacheKey:
+    """sha256 over the parts, length-prefixed so ("ab", "c") and ("a", "bc") don't collide."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class PersistentCache:
+    """
+    Content-addressed key/value store on disk (SQLite) with an in-process LRU in front.
+    The disk store is capped at max_bytes, least recently used entries are evicted first.
+    All SQLite work runs on one dedicated thread so it never competes with the default executor.
+    """
+
+    def __init__(self,
+                 name: str,
+                 path: str,
+                 max_bytes: int,
+                 memory_items: int = 10_000,
+                 evict_to: float = 0.9):
+        self.name = name
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.evict_to = evict_to
+
+        self._memory: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"cache-{name}")
+        self._conn: sqlite3.Connection | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    # --- Disk store, only called on the cache thread ---
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_many_sync(self, keys: list[CacheKey]) -> dict[CacheKey, bytes]:
+        conn = self._connect()
+        found: dict[CacheKey, bytes] = {}
+
+        # Stay under SQLite's bound parameter limit
+        for idx in range(0, len(keys), 500):
+            chunk = keys[idx: idx + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, value in conn.execute(f"SELECT key, value FROM entries WHERE key IN ({placeholders})", chunk):
+                found[key] = value
+
+        if found:
+            now = time.time()
+            conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?", [(now, key) for key in found])
+            conn.commit()
+        return found
+
+    def _set_many_sync(self, items: dict[CacheKey, bytes]):
+        conn = self._connect()
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+            [(key, value, len(key) + len(value), now) for key, value in items.items()])
+        conn.commit()
+        self._evict_sync(conn)
+
+    def _evict_sync(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Drop the oldest entries until we're back under evict_to of the cap
+        to_free = total - int(self.max_bytes * self.evict_to)
+        freed = 0
+        evicted: list[CacheKey] = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            evicted.append(key)
+            freed += size
+            if freed >= to_free:
+                break
+
+        conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in evicted])
+        conn.commit()
+        logger.info(f"Cache {self.name} evicted {len(evicted)} entries ({freed} bytes)")
+
+    def _close_sync(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- In-process LRU ---
+    def _remember(self, key: CacheKey, value: bytes):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # --- Public API ---
+    async def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, bytes]:
+        """Returns the cached values for the keys that are present, misses are left out."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[CacheKey, bytes] = {}
+        missing: list[CacheKey] = []
+        for key in unique_keys:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            try:
+                from_disk = await self._run(self._get_many_sync, missing)
+            except sqlite3.Error as e:
+                logger.warning(f"Cache {self.name} read failed, treating as misses - {e}")
+                from_disk = {}
+
+            for key, value in from_disk.items():
+                self._remember(key, value)
+            found.update(from_disk)
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    async def get(self, key: CacheKey) -> bytes | None:
+        return (await self.get_many([key])).get(key)
+
+    async def set_many(self, items: dict[CacheKey, bytes]):
+        if not items:
+            return
+
+        for key, value in items.items():
+            self._remember(key, value)
+
+        try:
+            await self._run(self._set_many_sync, items)
+        except sqlite3.Error as e:
+            # The cache is only an optimization, a failed write shouldn't fail the caller
+            logger.warning(f"Cache {self.name} write failed - {e}")
+
+    async def set(self, key: CacheKey, value: bytes):
+        await self.set_many({key: value})
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.name, self.hits, self.misses, len(self._memory))
+
+    async def close(self):
+        await self._run(self._close_sync)
+        self._executor.shutdown(wait=False)
+
+
+async def close_cache_singleton(get_cache) -> None:
+    """Closes the PersistentCache behind an alru_cache getter if this process opened it, the next call opens a new one."""
+    if get_cache.cache_info().currsize == 0:
+        return
+
+    cache: PersistentCache = await get_cache()
+    get_cache.cache_clear()
+    await cache.close()
@@ -26,6 +26,8 @@ class UserPdfRecord(TypedDict):
     original_filename: str
     pdf_document: str
     user: str
+    # sha256 of the file, filled in on first download, empty until then
+    content_sha256: str
 
 
 PDF_HIGHLIGHTS = "pdf_highlights"
@@ -1,105 +1,183 @@
-from config import POCKETBASE_URL, PB_APP_USER_EMAIL, PB_APP_USER_PASSWORD
-import aiohttp
-from async_lru import alru_cache
-from typing import Any
+from config import POCKETBASE_URL, POCKETBASE_BATCH_MAX_REQUESTS
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
 from urllib.parse import quote
-from async_lru import alru_cache
 from database.tps_utils import rate_limit
+from database.pocketbase_client import get_pocketbase_client
 
 import time
 import asyncio
+import aiohttp
 
 # --- HELPFUL TYPES ---
 PocketBaseToken = str
+RecordId = str
+RecordIdWithFields = tuple[RecordId, Any]
+BatchRequest = dict[str, Any]
+Page = dict[str, Any]
+
+# PocketBase caps perPage at 1000
+POCKETBASE_MAX_PER_PAGE = 1000
+# Ids per `id='...' || ...` filter, keeps the request URL well under common 8KB limits
+RECORDS_BY_IDS_CHUNK_SIZE = 100
+
+
+@dataclass
+class BatchItemResult:
+    index: int  # position of the item in the list passed to the bulk function
+    status: int  # 0 when the request never got a response
+    body: Any
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
 
 
 # --- Helpful Functions ---
-@alru_cache(maxsize=1)
 async def get_pocketbase_auth_token() -> PocketBaseToken:
-    async with aiohttp.ClientSession() as session:
-        payload = {
-            "identity": PB_APP_USER_EMAIL,
-            "password": PB_APP_USER_PASSWORD,
-        }
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
-        async with session.post(f'{POCKETBASE_URL}/api/collections/_superusers/auth-with-password', headers=headers, json=payload) as response:
-            admin_auth_record = await response.json()
-            return admin_auth_record['token']
+    return await get_pocketbase_client().token_manager.get_token()
 
 
 async def get_record[T](collection_name: str,
                         record_id: str,
                         options: dict[str, Any] = {}) -> T:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f'{POCKETBASE_URL}/api/collections/{collection_name}/records/{record_id}',
-            headers={
-                "Accept": "application/json",
-                "Authorization": await get_pocketbase_auth_token(),
-            },
-            params=options
-        ) as response:
-            data = await response.json()
-            return data
+    _, data = await get_pocketbase_client().request(
+        "GET",
+        f'/api/collections/{collection_name}/records/{record_id}',
+        params=options
+    )
+    return data
 
 
-async def get_all_records[T](collection_name: str, options: dict[str, Any] = {}) -> list[T]:
-    all_records: list[dict[str, Any]] = []
-    current_page = 1
-    at_end_of_items = False
-
-    async with aiohttp.ClientSession() as session:
-        while not at_end_of_items:
-            params = {
-                **options,
-                "perPage": 30,
-                "page": current_page,
-                "skipTotal": "true"
-            }
-
-            async with session.get(
-                f'{POCKETBASE_URL}/api/collections/{collection_name}/records',
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": await get_pocketbase_auth_token(),
-                },
-                params=params
-            ) as response:
-                data = await response.json()
-                if len(data.get("items", [])) != 0:
-                    all_records.extend(data["items"])
-                    current_page += 1
-                else:
-                    at_end_of_items = True
-
-    return all_records  # type: ignore
-
-@rate_limit(key="pocketbase", tps=200)
-async def get_first_matching_record[T](collection_name: str, options: dict[str, Any] = {}) -> T | None:
-    async with aiohttp.ClientSession() as session:
+def _filter_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return "'" + value.replace("'", "\\'") + "'"
+    return value
+
+
+def _keyset_filter(options: dict[str, Any], keyset_field: str, last_value: Any) -> str:
+    last_value = _filter_value(last_value)
+
+    keyset_condition = f"{keyset_field}>{last_value}"
+    if options.get("filter"):
+        return f"({options['filter']}) && {keyset_condition}"
+    return keyset_condition
+
+
+async def _fetch_page(collection_name: str, params: dict[str, Any]) -> Page:
+    _, data = await get_pocketbase_client().request(
+        "GET",
+        f'/api/collections/{collection_name}/records',
+        params=params
+    )
+    return data
+
+
+async def iter_records[T](collection_name: str,
+                          options: dict[str, Any] = {},
+                          page_size: int = POCKETBASE_MAX_PER_PAGE,
+                          keyset_field: str | None = None) -> AsyncIterator[T]:
+    """
+    Yields every matching record while the next page is fetched in the background.
+    With keyset_field, pages are walked with `keyset_field > last_value` instead of page offsets,
+    so the field has to be unique within the filter (e.g. segment_index_in_document for one PDF).
+    """
+    if keyset_field is not None and "fields" in options and keyset_field not in options["fields"].split(","):
+        raise ValueError(f"keyset_field '{keyset_field}' must be part of the requested fields")
+
+    def params_for_next_page(page_number: int, last_record: dict[str, Any] | None) -> dict[str, Any]:
         params = {
             **options,
-            "perPage": 30,
-            "page": 1,
+            "perPage": page_size,
             "skipTotal": "true"
         }
-        async with session.get(
-            f'{POCKETBASE_URL}/api/collections/{collection_name}/records',
-                headers={
-                    "Accept": "application/json",
-                    "Authorization": await get_pocketbase_auth_token(),
-            },
-                params=params
-        ) as response:
-            data = await response.json()
-            if len(data.get("items", [])) != 0:
-                return data["items"][0]
-            else:
-                return None
+
+        if keyset_field is None:
+            params["page"] = page_number
+            return params
+
+        params["page"] = 1
+        params["sort"] = keyset_field
+        if last_record is not None:
+            params["filter"] = _keyset_filter(options, keyset_field, last_record[keyset_field])
+        return params
+
+    page_number = 1
+    next_page_task = asyncio.ensure_future(
+        _fetch_page(collection_name, params_for_next_page(page_number, None)))
+
+    try:
+        while next_page_task is not None:
+            data = await next_page_task
+            next_page_task = None
+            items = data.get("items", [])
+
+            # A short page is the last one, skip the extra empty request
+            if len(items) == page_size:
+                page_number += 1
+                next_page_task = asyncio.ensure_future(
+                    _fetch_page(collection_name, params_for_next_page(page_number, items[-1])))
+
+            for item in items:
+                yield item
+    finally:
+        if next_page_task is not None:
+            next_page_task.cancel()
+
+
+async def get_all_records[T](collection_name: str, options: dict[str, Any] = {}) -> list[T]:
+    return [record async for record in iter_records(collection_name, options)]  # type: ignore
+
+
+async def get_records_by_ids[T](collection_name: str,
+                               record_ids: list[RecordId],
+                               options: dict[str, Any] = {},
+                               chunk_size: int = RECORDS_BY_IDS_CHUNK_SIZE) -> list[T]:
+    """
+    Fetches records with one `id='a' || id='b' ...` query per chunk of ids, chunks run concurrently.
+    Returns them in the order of record_ids and raises if any id wasn't found.
+    """
+    if "fields" in options and "id" not in options["fields"].split(","):
+        raise ValueError("'id' must be part of the requested fields")
+
+    unique_ids = list(dict.fromkeys(record_ids))
+
+    async def fetch_chunk(ids: list[RecordId]) -> list[T]:
+        id_filter = " || ".join(f"id={_filter_value(record_id)}" for record_id in ids)
+        if options.get("filter"):
+            id_filter = f"({options['filter']}) && ({id_filter})"
+        return await get_all_records(collection_name, {**options, "filter": id_filter})
+
+    chunks = await asyncio.gather(*[
+        fetch_chunk(unique_ids[idx: idx + chunk_size]) for idx in range(0, len(unique_ids), chunk_size)
+    ])
+    records_by_id = {record['id']: record for chunk in chunks for record in chunk}  # type: ignore
+
+    missing = [record_id for record_id in unique_ids if record_id not in records_by_id]
+    if len(missing) != 0:
+        raise Exception(f"{len(missing)} records not found in {collection_name} - {missing[:5]}")
+
+    return [records_by_id[record_id] for record_id in record_ids]
+
+
+@rate_limit(key="pocketbase", tps=200, burst=50)
+async def get_first_matching_record[T](collection_name: str, options: dict[str, Any] = {}) -> T | None:
+    params = {
+        **options,
+        "perPage": 30,
+        "page": 1,
+        "skipTotal": "true"
+    }
+    _, data = await get_pocketbase_client().request(
+        "GET",
+        f'/api/collections/{collection_name}/records',
+        params=params
+    )
+
+    if len(data.get("items", [])) != 0:
+        return data["items"][0]
+    else:
+        return None
 
 
 def construct_file_url(record, filename_in_pb) -> str:
@@ -114,47 +192,110 @@ def construct_file_url(record, filename_in_pb) -> str:
     return "/".join(parts)
 
 
-async def download_file(file_url: str) -> bytes:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(file_url) as response:
-            return await response.read()
-
-
 async def save_record[T](collection_name: str, record: Any) -> T:
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f'{POCKETBASE_URL}/api/collections/{collection_name}/records',
-            headers={
-                "Accept": "application/json",
-                "Authorization": await get_pocketbase_auth_token(),
-            },
-            json=record
-        ) as response:
-            data = await response.json()
-            return data
+    _, data = await get_pocketbase_client().request(
+        "POST",
+        f'/api/collections/{collection_name}/records',
+        json=record
+    )
+    return data
 
 
 async def delete_record(collection_name: str, record_id: str):
-    async with aiohttp.ClientSession() as session:
-        async with session.delete(
-            f'{POCKETBASE_URL}/api/collections/{collection_name}/records/{record_id}',
-            headers={
-                "Accept": "application/json",
-                "Authorization": await get_pocketbase_auth_token(),
-            }
-        ) as response:
-            return response.status
+    status, _ = await get_pocketbase_client().request(
+        "DELETE",
+        f'/api/collections/{collection_name}/records/{record_id}'
+    )
+    return status
 
 
 async def update_record[T](collection_name: str, record_id: str, record: Any) -> T:
-    async with aiohttp.ClientSession() as session:
-        async with session.patch(
-            f'{POCKETBASE_URL}/api/collections/{collection_name}/records/{record_id}',
-            headers={
-                "Accept": "application/json",
-                "Authorization": await get_pocketbase_auth_token(),
-            },
-            json=record
-        ) as response:
-            data = await response.json()
-            return data
+    _, data = await get_pocketbase_client().request(
+        "PATCH",
+        f'/api/collections/{collection_name}/records/{record_id}',
+        json=record
+    )
+    return data
+
+
+# --- Bulk Functions ---
+async def _send_batch_chunk(requests: list[BatchRequest]) -> tuple[list[tuple[int, Any]], set[int]]:
+    """Sends one /api/batch transaction, returns per-request (status, body) and the indexes that caused a rollback"""
+    try:
+        status, data = await get_pocketbase_client().request(
+            "POST",
+            "/api/batch",
+            json={"requests": requests}
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return [(0, str(e)) for _ in requests], set()
+
+    if status == 200:
+        return [(item['status'], item.get('body')) for item in data], set()
+
+    # The batch is one transaction, so every request was rolled back.
+    # PocketBase only reports the requests that actually failed.
+    failed_requests: dict[str, Any] = ((data or {}).get('data') or {}).get('requests') or {}
+    failed_indexes = {int(idx) for idx in failed_requests.keys()}
+
+    results = []
+    for idx in range(len(requests)):
+        if idx in failed_indexes:
+            failed_response = failed_requests[str(idx)].get('response') or {}
+            results.append((failed_response.get('status', status), failed_requests[str(idx)]))
+        else:
+            results.append((status, data))
+
+    return results, failed_indexes
+
+
+async def _send_batch(requests: list[BatchRequest]) -> list[BatchItemResult]:
+    results: list[BatchItemResult] = []
+
+    for start in range(0, len(requests), POCKETBASE_BATCH_MAX_REQUESTS):
+        chunk = requests[start: start + POCKETBASE_BATCH_MAX_REQUESTS]
+        chunk_results, failed_indexes = await _send_batch_chunk(chunk)
+
+        # Resend the requests that were only rolled back because a sibling failed
+        if len(failed_indexes) != 0 and len(failed_indexes) != len(chunk):
+            retry_indexes = [idx for idx in range(len(chunk)) if idx not in failed_indexes]
+            retry_results, _ = await _send_batch_chunk([chunk[idx] for idx in retry_indexes])
+            for idx, retry_result in zip(retry_indexes, retry_results):
+                chunk_results[idx] = retry_result
+
+        for offset, (status, body) in enumerate(chunk_results):
+            results.append(BatchItemResult(index=start + offset, status=status, body=body))
+
+    return results
+
+
+async def save_records(collection_name: str, records: list[Any]) -> list[BatchItemResult]:
+    return await _send_batch([
+        {
+            "method": "POST",
+            "url": f'/api/collections/{collection_name}/records',
+            "body": record
+        }
+        for record in records
+    ])
+
+
+async def update_records(collection_name: str, records: list[RecordIdWithFields]) -> list[BatchItemResult]:
+    return await _send_batch([
+        {
+            "method": "PATCH",
+            "url": f'/api/collections/{collection_name}/records/{record_id}',
+            "body": record
+        }
+        for record_id, record in records
+    ])
+
+
+async def delete_records(collection_name: str, record_ids: list[RecordId]) -> list[BatchItemResult]:
+    return await _send_batch([
+        {
+            "method": "DELETE",
+            "url": f'/api/collections/{collection_name}/records/{record_id}'
+        }
+        for record_id in record_ids
+    ])
@@ -0,0 +1,216 @@
+from config import (
+    GEMINI_API_KEY,
+    ADAPTIVE_RATE_LIMIT,
+    EMBEDDING_BACKEND,
+    EMBEDDING_MAX_TPS,
+    EMBEDDING_MAX_CONCURRENCY,
+    THROTTLE_RETRIES,
+    LOCAL_EMBEDDING_MODEL,
+    LOCAL_EMBEDDING_BATCH_SIZE,
+    LOCAL_EMBEDDING_PROCESSES
+)
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Literal
+from database.tps_utils import rate_limit
+
+import google.genai as genai
+from google.genai import types as genai_types
+
+import asyncio
+import multiprocessing
+
+
+# --- Helpful Types ---
+EmbedType = Literal["RETRIEVAL_QUERY",
+                    "RETRIEVAL_DOCUMENT", "CODE_RETRIEVAL_QUERY",
+                    "CLUSTERING"]
+Vector = list[float]
+
+
+class EmbeddingBackend(ABC):
+    """Turns texts into vectors. `model` is part of the embedding cache key, so it must name the model exactly."""
+    name: str
+    model: str
+    # Max texts per embed call
+    max_batch_size: int
+
+    @abstractmethod
+    async def embed(self, text_lst: list[str], embed_type: EmbedType) -> list[Vector]:
+        ...
+
+    @abstractmethod
+    async def dimension(self) -> int:
+        ...
+
+    async def close(self):
+        pass
+
+
+# --- Gemini ---
+@rate_limit("embedding", tps=50, burst=50, max_concurrency=EMBEDDING_MAX_CONCURRENCY,
+            adaptive=ADAPTIVE_RATE_LIMIT, max_tps=EMBEDDING_MAX_TPS, throttle_retries=THROTTLE_RETRIES)
+async def _gemini_embed_content(client: genai.Client,
+                                model: str,
+                                text_lst: list[str],
+                                embed_type: EmbedType) -> list[genai_types.ContentEmbedding]:
+    result = await client.aio.models.embed_content(
+        model=model,
+        contents=text_lst,  # type: ignore
+        config=genai_types.EmbedContentConfig(task_type=embed_type))
+
+    if result is None or result.embeddings is None:
+        raise Exception("Embedding API returned no embeddings")
+    return result.embeddings
+
+
+class GeminiEmbeddingBackend(EmbeddingBackend):
+    """Gemini embedding API through one pooled client, limited by the shared "embedding" rate limit."""
+    name = "gemini"
+
+    def __init__(self, model: str = "models/text-embedding-004", dimensions: int = 768, api_key: str = GEMINI_API_KEY):
+        self.model = model
+        self.max_batch_size = 100
+        self._dimensions = dimensions
+        self._api_key = api_key
+        self._client: genai.Client | None = None
+
+    def _get_client(self) -> genai.Client:
+        if self._client is None:
+            self._client = genai.Client(api_key=self._api_key)
+        return self._client
+
+    async def embed(self, text_lst: list[str], embed_type: EmbedType) -> list[Vector]:
+        embeddings = await _gemini_embed_content(self._get_client(), self.model, text_lst, embed_type)
+
+        vectors: list[Vector] = []
+        for text, embedding in zip(text_lst, embeddings):
+            if embedding.values is None:
+                raise Exception(f"Embedding API returned an empty vector - {text[:50]}")
+            vectors.append(embedding.values)
+        return vectors
+
+    async def dimension(self) -> int:
+        return self._dimensions
+
+    async def close(self):
+        client = self._client
+        self._client = None
+
+        # aclose only exists on newer google-genai releases
+        aclose = getattr(client.aio, "aclose", None) if client is not None else None
+        if aclose is not None:
+            await aclose()
+
+
+# --- Local CPU model ---
+# One model per process, shared by the thread executor or loaded once in each pool process
+_LOCAL_MODELS: dict[str, Any] = {}
+
+
+def _load_local_model(model_name: str) -> Any:
+    if model_name not in _LOCAL_MODELS:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "EMBEDDING_BACKEND=local needs sentence-transformers, install it with "
+                "`pip install sentence-transformers`") from e
+        _LOCAL_MODELS[model_name] = SentenceTransformer(model_name, device="cpu")
+    return _LOCAL_MODELS[model_name]
+
+
+def _local_encode(model_name: str, text_lst: list[str], batch_size: int) -> list[Vector]:
+    model = _load_local_model(model_name)
+    # Normalized so dot product (the Qdrant distance) behaves like cosine, same as Gemini's vectors
+    vectors = model.encode(text_lst, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True)
+    return vectors.tolist()
+
+
+def _local_dimension(model_name: str) -> int:
+    return int(_load_local_model(model_name).get_sentence_embedding_dimension())
+
+
+class LocalEmbeddingBackend(EmbeddingBackend):
+    """
+    sentence-transformers model on the worker's CPU, no external quota.
+    Encodes on one dedicated thread by default, or on a pool of processes when processes > 0.
+    The model ignores the task type.
+    """
+    name = "local"
+
+    def __init__(self,
+                 model: str = LOCAL_EMBEDDING_MODEL,
+                 batch_size: int = LOCAL_EMBEDDING_BATCH_SIZE,
+                 processes: int = LOCAL_EMBEDDING_PROCESSES):
+        self.model = model
+        self.batch_size = batch_size
+        self.max_batch_size = batch_size * max(processes, 1) * 4
+        self.processes = processes
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.processes > 0:
+                # spawn like the render pool, forking a worker that is running an event loop and client threads isn't safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_local_model, initargs=(self.model,))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-embedding")
+        return self._executor
+
+    async def embed(self, text_lst: list[str], embed_type: EmbedType) -> list[Vector]:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+
+        # Spread one call over the pool so every process gets a share
+        step = self.batch_size if self.processes > 0 else len(text_lst) or 1
+        batches = await asyncio.gather(*[
+            loop.run_in_executor(executor, _local_encode, self.model, text_lst[idx: idx + step], self.batch_size)
+            for idx in range(0, len(text_lst), step)
+        ])
+        return [vec for batch in batches for vec in batch]
+
+    async def dimension(self) -> int:
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), _local_dimension, self.model)
+
+    async def close(self):
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Lifecycle ---
+_EMBEDDING_BACKEND: EmbeddingBackend | None = None
+
+
+def create_embedding_backend(kind: str = EMBEDDING_BACKEND) -> EmbeddingBackend:
+    match kind:
+        case "gemini":
+            return GeminiEmbeddingBackend()
+        case "local":
+            return LocalEmbeddingBackend()
+        case _:
+            raise ValueError(f"Unknown embedding backend '{kind}', expected gemini or local")
+
+
+def get_embedding_backend() -> EmbeddingBackend:
+    global _EMBEDDING_BACKEND
+    if _EMBEDDING_BACKEND is None:
+        _EMBEDDING_BACKEND = create_embedding_backend()
+    return _EMBEDDING_BACKEND
+
+
+def set_embedding_backend(backend: EmbeddingBackend | None):
+    global _EMBEDDING_BACKEND
+    _EMBEDDING_BACKEND = backend
+
+
+async def close_embedding_backend():
+    global _EMBEDDING_BACKEND
+    backend = _EMBEDDING_BACKEND
+    _EMBEDDING_BACKEND = None
+    if backend is not None:
+        await backend.close()
@@ -0,0 +1,172 @@
+from config import PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+from weakref import WeakValueDictionary
+from database.database_models import UserPdfRecord
+from database.database_utils import construct_file_url
+from database.pocketbase_client import get_pocketbase_client
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+
+# --- HELPFUL TYPES ---
+META_SUFFIX = ".meta"
+PART_SUFFIX = ".part"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedFile:
+    path: str
+    size: int
+    sha256: str
+
+
+# --- Helpful Functions ---
+def pdf_cache_path(record: UserPdfRecord, cache_dir: str = PDF_CACHE_DIR) -> str:
+    # PocketBase gives every upload a new file name, so a cached file never goes stale
+    return os.path.join(cache_dir, record['id'], record['pdf_document'])
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024**2) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_meta(cached: CachedFile):
+    # The file's mtime says whether it changed since it was hashed, so hits don't have to hash it again
+    with open(cached.path + META_SUFFIX, "w") as f:
+        json.dump({"size": cached.size, "sha256": cached.sha256, "mtime_ns": os.stat(cached.path).st_mtime_ns}, f)
+
+
+def _verify_cached(file_path: str) -> CachedFile | None:
+    """
+    Returns the cached file if it is still the size and hash recorded when it was downloaded.
+    The stored hash is trusted while size and mtime are unchanged, otherwise the file is hashed again.
+    """
+    try:
+        with open(file_path + META_SUFFIX, "r") as f:
+            meta = json.load(f)
+        stat = os.stat(file_path)
+        if stat.st_size != meta["size"]:
+            return None
+
+        cached = CachedFile(file_path, meta["size"], meta["sha256"])
+        if stat.st_mtime_ns != meta.get("mtime_ns"):
+            if file_sha256(file_path) != meta["sha256"]:
+                return None
+            _write_meta(cached)
+
+        # The .meta file's mtime is the LRU clock for eviction, the file's own has to stay put
+        os.utime(file_path + META_SUFFIX)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return cached
+
+
+def _evict(cache_dir: str, max_bytes: int, keep: set[str]):
+    """
+    Deletes the least recently used entries (one dir per record) until the cache fits in max_bytes.
+    Entries in keep are never deleted, but their size still counts.
+    """
+    entries: list[tuple[float, int, str]] = []
+    keep_size = 0
+    for entry in os.scandir(cache_dir):
+        if not entry.is_dir():
+            continue
+        files = [f for f in os.scandir(entry.path) if f.is_file()]
+        size = sum(f.stat().st_size for f in files)
+        if entry.path in keep:
+            keep_size += size
+            continue
+        entries.append((max((f.stat().st_mtime for f in files), default=0.0), size, entry.path))
+
+    total = keep_size + sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        logger.info(f"Evicted {path} from the file cache ({size} bytes)")
+
+
+# One download per file at a time, concurrent activities for the same PDF wait and reuse it
+_DOWNLOAD_LOCKS: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+# Entries still being read in this process, e.g. by render processes, eviction skips them
+_IN_USE: Counter[str] = Counter()
+
+
+async def fetch_file_to_cache(file_url: str,
+                              cache_path: str,
+                              expected_sha256: str | None = None,
+                              max_bytes: int = PDF_CACHE_MAX_BYTES) -> CachedFile:
+    """
+    Returns the local copy of file_url, downloading it first if it isn't cached yet or fails verification.
+    The download streams to disk, so the file is never held in memory.
+    """
+    lock = _DOWNLOAD_LOCKS.get(cache_path)
+    if lock is None:
+        lock = _DOWNLOAD_LOCKS[cache_path] = asyncio.Lock()
+
+    async with lock:
+        cached = await asyncio.to_thread(_verify_cached, cache_path)
+        if cached is not None and expected_sha256 in (None, cached.sha256):
+            return cached
+
+        await asyncio.to_thread(os.makedirs, os.path.dirname(cache_path), exist_ok=True)
+        part_path = cache_path + PART_SUFFIX
+        try:
+            size, sha256 = await get_pocketbase_client().download(file_url, part_path)
+            if expected_sha256 is not None and sha256 != expected_sha256:
+                raise Exception(f"Downloaded {file_url} has sha256 {sha256}, expected {expected_sha256}")
+
+            cached = CachedFile(cache_path, size, sha256)
+            await asyncio.to_thread(os.replace, part_path, cache_path)
+            await asyncio.to_thread(_write_meta, cached)
+        finally:
+            if os.path.exists(part_path):
+                await asyncio.to_thread(os.remove, part_path)
+
+        cache_dir = os.path.dirname(os.path.dirname(cache_path))
+        keep = {os.path.dirname(cache_path), *_IN_USE}
+        await asyncio.to_thread(_evict, cache_dir, max_bytes, keep)
+        return cached
+
+
+@asynccontextmanager
+async def use_cached_file(file_url: str,
+                          cache_path: str,
+                          expected_sha256: str | None = None,
+                          max_bytes: int = PDF_CACHE_MAX_BYTES) -> AsyncIterator[CachedFile]:
+    """fetch_file_to_cache for callers that read the file afterwards, it isn't evicted until the block exits."""
+    entry = os.path.dirname(cache_path)
+    _IN_USE[entry] += 1
+    try:
+        yield await fetch_file_to_cache(file_url, cache_path, expected_sha256, max_bytes)
+    finally:
+        _IN_USE[entry] -= 1
+        if _IN_USE[entry] <= 0:
+            del _IN_USE[entry]
+
+
+async def fetch_pdf(record: UserPdfRecord, expected_sha256: str | None = None) -> CachedFile:
+    return await fetch_file_to_cache(
+        construct_file_url(record, record['pdf_document']), pdf_cache_path(record), expected_sha256)
+
+
+def use_pdf(record: UserPdfRecord, expected_sha256: str | None = None):
+    """The cached PDF, kept on disk until the block exits."""
+    return use_cached_file(
+        construct_file_url(record, record['pdf_document']), pdf_cache_path(record), expected_sha256)
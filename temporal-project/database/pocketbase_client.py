@@ -0,0 +1,305 @@
+from config import (
+    POCKETBASE_URL,
+    PB_APP_USER_EMAIL,
+    PB_APP_USER_PASSWORD,
+    POCKETBASE_POOL_SIZE,
+    POCKETBASE_POOL_SIZE_PER_HOST,
+    POCKETBASE_KEEPALIVE_TIMEOUT,
+    POCKETBASE_REQUEST_TIMEOUT,
+    POCKETBASE_TOKEN_REFRESH_MARGIN,
+    PDF_DOWNLOAD_CHUNK_SIZE
+)
+from typing import Any
+
+import aiohttp
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+
+
+# --- HELPFUL TYPES ---
+StatusCode = int
+ResponseWithStatus = tuple[StatusCode, Any]
+PocketBaseToken = str
+# (bytes written, sha256 hex digest)
+SizeAndDigest = tuple[int, str]
+
+# Used when the token can't be decoded, so we still refresh every so often
+FALLBACK_TOKEN_LIFETIME = 15 * 60
+
+logger = logging.getLogger(__name__)
+
+
+# --- Helpful Functions ---
+def decode_token_expiry(token: PocketBaseToken) -> float | None:
+    """Returns the `exp` claim of a JWT as a unix timestamp, without verifying the signature."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class PocketBaseTokenManager:
+    """
+    Keeps a valid superuser token around for the whole process.
+    Refreshes in the background before the token expires and lets concurrent
+    callers share one in-flight auth request.
+    """
+
+    def __init__(self,
+                 client: 'PocketBaseClient',
+                 identity: str = PB_APP_USER_EMAIL,
+                 password: str = PB_APP_USER_PASSWORD,
+                 refresh_margin: float = POCKETBASE_TOKEN_REFRESH_MARGIN):
+        self.client = client
+        self.identity = identity
+        self.password = password
+        self.refresh_margin = refresh_margin
+
+        self._token: PocketBaseToken | None = None
+        self._expires_at = 0.0
+        self._refresh_task: asyncio.Future | None = None
+        self._background_task: asyncio.Task | None = None
+
+    def _needs_refresh(self) -> bool:
+        return self._token is None or time.time() >= self._expires_at - self.refresh_margin
+
+    async def get_token(self) -> PocketBaseToken:
+        if self._needs_refresh():
+            return await self.refresh()
+        return self._token  # type: ignore
+
+    async def refresh(self, stale_token: PocketBaseToken | None = None) -> PocketBaseToken:
+        # Another caller already replaced the token that got rejected
+        if stale_token is not None and self._token is not None and self._token != stale_token:
+            return self._token
+
+        loop = asyncio.get_running_loop()
+        if self._refresh_task is None or self._refresh_task.done() or self._refresh_task.get_loop() is not loop:
+            self._refresh_task = asyncio.ensure_future(self._authenticate())
+
+        # shield so one cancelled waiter doesn't cancel the refresh for everyone else
+        return await asyncio.shield(self._refresh_task)
+
+    async def _authenticate(self) -> PocketBaseToken:
+        status, admin_auth_record = await self.client.request(
+            "POST",
+            "/api/collections/_superusers/auth-with-password",
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            json={
+                "identity": self.identity,
+                "password": self.password,
+            },
+            authorized=False
+        )
+
+        if status != 200 or 'token' not in (admin_auth_record or {}):
+            raise Exception(f"Failed to authenticate with PocketBase - {status} - {admin_auth_record}")
+
+        token: PocketBaseToken = admin_auth_record['token']
+        expires_at = decode_token_expiry(token)
+
+        self._token = token
+        self._expires_at = expires_at if expires_at is not None else time.time() + FALLBACK_TOKEN_LIFETIME
+        self._schedule_background_refresh()
+
+        return token
+
+    def _schedule_background_refresh(self):
+        loop = asyncio.get_running_loop()
+        self._cancel_background_refresh(loop)
+        self._background_task = loop.create_task(self._refresh_before_expiry())
+
+    def _cancel_background_refresh(self, loop: asyncio.AbstractEventLoop):
+        # A task left on a previous (possibly closed) loop can't be cancelled from here
+        if self._background_task is not None and self._background_task.get_loop() is loop:
+            self._background_task.cancel()
+        self._background_task = None
+
+    async def _refresh_before_expiry(self):
+        delay = max(0.0, self._expires_at - self.refresh_margin - time.time())
+        await asyncio.sleep(delay)
+
+        try:
+            await self.refresh()
+        except Exception as e:
+            # The next caller will retry the refresh on demand
+            logger.warning(f"Background PocketBase token refresh failed - {e}")
+
+    def invalidate(self):
+        self._token = None
+        self._expires_at = 0.0
+
+    async def close(self):
+        self._cancel_background_refresh(asyncio.get_running_loop())
+        self._refresh_task = None
+        self.invalidate()
+
+
+class PocketBaseClient:
+    """Process-wide HTTP client for PocketBase backed by one pooled, keep-alive session."""
+
+    def __init__(self,
+                 base_url: str = POCKETBASE_URL,
+                 pool_size: int = POCKETBASE_POOL_SIZE,
+                 pool_size_per_host: int = POCKETBASE_POOL_SIZE_PER_HOST,
+                 keepalive_timeout: float = POCKETBASE_KEEPALIVE_TIMEOUT,
+                 request_timeout: float = POCKETBASE_REQUEST_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+        self.token_manager = PocketBaseTokenManager(self)
+
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+
+        # A session is bound to the loop it was created on, so recreate it
+        # if the loop changed (e.g. pytest runs each test on a fresh loop).
+        # Close the old one first or its connector and pooled sockets leak
+        if self._session is not None and self._session_loop is not loop:
+            await self._close_session()
+
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            self._session_loop = loop
+
+        return self._session
+
+    async def start(self):
+        await self.get_session()
+
+    async def _close_session(self):
+        session = self._session
+        self._session = None
+        self._session_loop = None
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def close(self):
+        await self.token_manager.close()
+        await self._close_session()
+
+    def url_for(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    async def _send(self,
+                    method: str,
+                    path: str,
+                    headers: dict[str, str],
+                    params: dict[str, Any] | None,
+                    json: Any) -> ResponseWithStatus:
+        session = await self.get_session()
+        async with session.request(
+            method,
+            self.url_for(path),
+            headers=headers,
+            params=params,
+            json=json
+        ) as response:
+            if response.status == 204:
+                return response.status, None
+            return response.status, await response.json(content_type=None)
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      headers: dict[str, str] | None = None,
+                      params: dict[str, Any] | None = None,
+                      json: Any = None,
+                      authorized: bool = True) -> ResponseWithStatus:
+        if not authorized:
+            return await self._send(method, path, headers or {}, params, json)
+
+        token = await self.token_manager.get_token()
+        status, data = await self._send(
+            method, path, {"Accept": "application/json", **(headers or {}), "Authorization": token}, params, json)
+
+        # Token was revoked or expired early, re-auth once and retry
+        if status == 401:
+            token = await self.token_manager.refresh(stale_token=token)
+            status, data = await self._send(
+                method, path, {"Accept": "application/json", **(headers or {}), "Authorization": token}, params, json)
+
+        return status, data
+
+    async def read(self, url: str) -> bytes:
+        session = await self.get_session()
+        async with session.get(url) as response:
+            return await response.read()
+
+    async def download(self, url: str, file_path: str, chunk_size: int = PDF_DOWNLOAD_CHUNK_SIZE) -> SizeAndDigest:
+        """
+        Streams the response body into file_path chunk by chunk, hashing as it goes, so the file is never held in memory.
+        Raises if the response isn't a 200 or the body is shorter or longer than Content-Length.
+        """
+        session = await self.get_session()
+        digest = hashlib.sha256()
+        size = 0
+
+        # Big files can take longer than the total request timeout, only time out on a stalled read
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.request_timeout, sock_read=self.request_timeout)
+        async with session.get(url, timeout=timeout) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to download {url} - {response.status}")
+
+            with open(file_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(f.write, chunk)
+
+            if response.content_length is not None and size != response.content_length:
+                raise Exception(f"Downloaded {size} bytes of {url}, expected {response.content_length}")
+
+        return size, digest.hexdigest()
+
+
+# --- Lifecycle ---
+_POCKETBASE_CLIENT: PocketBaseClient | None = None
+
+
+def get_pocketbase_client() -> PocketBaseClient:
+    global _POCKETBASE_CLIENT
+    if _POCKETBASE_CLIENT is None:
+        _POCKETBASE_CLIENT = PocketBaseClient()
+    return _POCKETBASE_CLIENT
+
+
+async def init_pocketbase_client() -> PocketBaseClient:
+    client = get_pocketbase_client()
+    await client.start()
+    return client
+
+
+async def close_pocketbase_client():
+    global _POCKETBASE_CLIENT
+    if _POCKETBASE_CLIENT is not None:
+        await _POCKETBASE_CLIENT.close()
+        _POCKETBASE_CLIENT = None
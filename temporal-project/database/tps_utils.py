@@ -1,45 +1,574 @@
 import asyncio
+import logging
+import re
+import sqlite3
 import time
 import functools
-from typing import Literal
+import threading
+import aiohttp
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Literal, AsyncIterator
+from baml_py.errors import BamlClientHttpError
+from google.genai.errors import APIError
 
-TPS_STATE = {}
+from config import (
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_SQLITE_PATH,
+    RATE_LIMIT_COORDINATOR_URL,
+    RATE_LIMIT_COORDINATOR_COOLDOWN,
+    THROTTLE_BACKOFF
+)
 
 TpsKey = Literal["embedding", "baml", "pocketbase"]
 
-def rate_limit(key: TpsKey, tps: int):
-    if tps <= 0:
-        raise ValueError("TPS must be positive")
+THROTTLE_STATUS_CODES = {429, 503}
+# google-genai APIError.status for the same push back
+THROTTLE_STATUSES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE"}
+# BAML http errors sometimes only say why the provider refused in their message
+THROTTLE_MESSAGE_PATTERN = re.compile(r"\b(429|503)\b|\bRESOURCE_EXHAUSTED\b|Too Many Requests", re.IGNORECASE)
+
+
+def is_throttle_error(e: BaseException) -> bool:
+    """True for provider push back - 429/503 responses, RESOURCE_EXHAUSTED and timeouts."""
+    if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
+        return True
+
+    # BAML http errors expose status_code, google-genai APIError exposes code
+    for attr in ("status_code", "code"):
+        if getattr(e, attr, None) in THROTTLE_STATUS_CODES:
+            return True
+
+    if isinstance(e, APIError):
+        return e.status in THROTTLE_STATUSES
+
+    if isinstance(e, BamlClientHttpError):
+        return THROTTLE_MESSAGE_PATTERN.search(str(e.message or e)) is not None
+
+    return False
+
+
+logger = logging.getLogger(__name__)
+
+
+def take_token(tokens: float, last_refill: float, now: float, rate: float, burst: int) -> tuple[float, float]:
+    """Refills a bucket up to now and takes one token from it. Returns (tokens left, seconds to wait)."""
+    tokens = min(float(burst), tokens + max(0.0, now - last_refill) * rate) - 1
+    return tokens, (0.0 if tokens >= 0 else -tokens / rate)
+
+
+# --- Shared budget backends ---
+class RateLimitBackend(ABC):
+    """
+    Keeps the token buckets somewhere every worker can see them, so a budget
+    holds across the fleet instead of per process.
+    """
+
+    @abstractmethod
+    async def reserve(self, name: str, rate: float, burst: int) -> float:
+        """Takes a token from the named bucket and returns how long to wait for it."""
+
+    async def refund(self, name: str, burst: int):
+        pass
+
+    def available(self) -> bool:
+        """False while the backend is known to be down, limiters use their local bucket instead."""
+        return True
+
+    async def close(self):
+        pass
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Buckets in a SQLite file, for workers on the same host. BEGIN IMMEDIATE serializes the reservations.
+    Runs on its own threads, each with one connection, so waiting on the file lock never holds up the
+    default executor that file, spool and cache work runs on.
+    """
+
+    def __init__(self, path: str = RATE_LIMIT_SQLITE_PATH, timeout: float = 30.0, max_workers: int = 2):
+        self.path = path
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rate-limit-sqlite")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only used from this thread, close() runs after the executor has stopped
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, last_refill REAL NOT NULL)")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _reserve_sync(self, name: str, rate: float, burst: int) -> float:
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT tokens, last_refill FROM buckets WHERE name = ?", (name,)).fetchone()
+            tokens, last_refill = row if row is not None else (float(burst), now)
+
+            # Reservations can run ahead of now when the bucket is in debt
+            tokens, wait = take_token(tokens, last_refill, now, rate, burst)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, last_refill) VALUES (?, ?, ?)",
+                (name, tokens, max(now, last_refill)))
+            conn.execute("COMMIT")
+            return wait
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def _refund_sync(self, name: str, burst: int):
+        self._connection().execute(
+            "UPDATE buckets SET tokens = MIN(?, tokens + 1) WHERE name = ?", (float(burst), name))
+
+    async def reserve(self, name: str, rate: float, burst: int) -> float:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._reserve_sync, name, rate, burst)
+
+    async def refund(self, name: str, burst: int):
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._refund_sync, name, burst)
+
+    async def close(self):
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+
+class CoordinatorRateLimitBackend(RateLimitBackend):
+    """
+    Buckets held by rate_limit_coordinator.py, for workers spread over several hosts.
+    After a failed request the coordinator is skipped for `cooldown` seconds, so an outage
+    costs one short timeout instead of one per call.
+    """
+
+    def __init__(self,
+                 base_url: str = RATE_LIMIT_COORDINATOR_URL,
+                 request_timeout: float = 1.0,
+                 connect_timeout: float = 0.25,
+                 cooldown: float = RATE_LIMIT_COORDINATOR_COOLDOWN):
+        self.base_url = base_url.rstrip("/")
+        self.request_timeout = request_timeout
+        self.connect_timeout = connect_timeout
+        self.cooldown = cooldown
+        self._unavailable_until = 0.0
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(
+                total=self.request_timeout, sock_connect=self.connect_timeout))
+            self._session_loop = loop
+        return self._session
+
+    def available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    async def _post(self, path: str, payload: dict) -> dict:
+        try:
+            async with self._get_session().post(f"{self.base_url}{path}", json=payload) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Rate limit coordinator unavailable, skipping it for {self.cooldown}s - {e!r}")
+            self._unavailable_until = time.monotonic() + self.cooldown
+            raise
+
+    async def reserve(self, name: str, rate: float, burst: int) -> float:
+        data = await self._post("/acquire", {"name": name, "rate": rate, "burst": burst})
+        return float(data["wait"])
+
+    async def refund(self, name: str, burst: int):
+        await self._post("/refund", {"name": name, "burst": burst})
+
+    async def close(self):
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+
+# None keeps every bucket in process memory
+_BACKEND: RateLimitBackend | None = None
+
+
+def create_rate_limit_backend(kind: str = RATE_LIMIT_BACKEND) -> RateLimitBackend | None:
+    match kind:
+        case "local":
+            return None
+        case "sqlite":
+            return SQLiteRateLimitBackend()
+        case "coordinator":
+            return CoordinatorRateLimitBackend()
+        case _:
+            raise ValueError(f"Unknown rate limit backend '{kind}', expected local, sqlite or coordinator")
+
+
+def set_rate_limit_backend(backend: RateLimitBackend | None):
+    global _BACKEND
+    _BACKEND = backend
+
+
+def get_rate_limit_backend() -> RateLimitBackend | None:
+    return _BACKEND
+
+
+async def init_rate_limit_backend() -> RateLimitBackend | None:
+    set_rate_limit_backend(create_rate_limit_backend())
+    return _BACKEND
+
+
+async def close_rate_limit_backend():
+    backend = _BACKEND
+    set_rate_limit_backend(None)
+    if backend is not None:
+        await backend.close()
+
+
+@dataclass
+class LimiterStats:
+    name: str
+    rate: float
+    burst: int
+    max_concurrency: int | None
+    in_flight: int
+    queue_depth: int
+    total_calls: int
+    total_wait_time: float
+    max_wait_time: float
+    throttled_calls: int
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.total_calls if self.total_calls else 0.0
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket that refills at `rate` tokens per second up to `burst` tokens,
+    plus an optional cap on how many calls can be in flight at once.
+
+    Tokens come from the shared backend when one is set, the concurrency cap is always per process.
+
+    When adaptive, the rate follows AIMD between min_rate and max_rate: it grows by
+    `increase_step` for every `adjust_interval` seconds of successful calls and is
+    multiplied by `decrease_factor` when the provider throttles us.
+    """
+
+    def __init__(self,
+                 name: str,
+                 rate: float,
+                 burst: int = 1,
+                 max_concurrency: int | None = None,
+                 adaptive: bool = False,
+                 min_rate: float | None = None,
+                 max_rate: float | None = None,
+                 increase_step: float | None = None,
+                 decrease_factor: float = 0.5,
+                 adjust_interval: float = 1.0):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+
+        self.name = name
+        self.rate = float(rate)
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+
+        self.adaptive = adaptive
+        self.min_rate = min_rate if min_rate is not None else self.rate / 10
+        self.max_rate = max_rate if max_rate is not None else self.rate
+        self.increase_step = increase_step if increase_step is not None else max(self.rate / 20, 0.1)
+        self.decrease_factor = decrease_factor
+        self.adjust_interval = adjust_interval
+        self.config = (self.rate, burst, max_concurrency, adaptive, self.min_rate, self.max_rate)
+
+        if not self.min_rate <= self.rate <= self.max_rate:
+            raise ValueError("Rate must be between min_rate and max_rate")
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._last_adjustment = float("-inf")
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._total_calls = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._throttled_calls = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _reserve_local(self) -> float:
+        """Takes a token, going into debt if needed, and returns how long to wait for it."""
+        now = time.monotonic()
+        self._tokens, wait = take_token(self._tokens, self._last_refill, now, self.rate, self.burst)
+        self._last_refill = now
+        return wait
+
+    async def _reserve(self, backend: RateLimitBackend | None) -> float:
+        if backend is None or not backend.available():
+            return self._reserve_local()
+
+        try:
+            return await backend.reserve(self.name, self.rate, self.burst)
+        except Exception as e:
+            # Better to run on the local budget than to stall every call while the backend is down
+            logger.warning(f"Rate limit backend unavailable for {self.name}, using local bucket - {e}")
+            return self._reserve_local()
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        if self.max_concurrency is None:
+            return None
+
+        # Semaphores bind to the first loop they wait on, tests use a fresh loop each time
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _refund(self, backend: RateLimitBackend | None):
+        if backend is None or not backend.available():
+            self._tokens = min(float(self.burst), self._tokens + 1)
+            return
+
+        try:
+            await backend.refund(self.name, self.burst)
+        except Exception as e:
+            logger.warning(f"Failed to refund token for {self.name} - {e}")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        start = time.monotonic()
+        semaphore = self._get_semaphore()
+        backend = get_rate_limit_backend()
+        self._queue_depth += 1
+
+        try:
+            # Take the concurrency slot first so tokens aren't burned while waiting for it
+            if semaphore is not None:
+                await semaphore.acquire()
+
+            try:
+                wait = await self._reserve(backend)
+                if wait > 0:
+                    try:
+                        await asyncio.sleep(wait)
+                    except asyncio.CancelledError:
+                        await asyncio.shield(self._refund(backend))
+                        raise
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+        finally:
+            self._queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self._total_calls += 1
+        self._total_wait_time += waited
+        self._max_wait_time = max(self._max_wait_time, waited)
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def record_success(self):
+        if not self.adaptive:
+            return
+
+        now = time.monotonic()
+        if now - self._last_adjustment >= self.adjust_interval:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+            self._last_adjustment = now
+
+    def record_throttle(self):
+        self._throttled_calls += 1
+        if not self.adaptive:
+            return
+
+        # Calls that were already in flight when we got throttled tend to fail together,
+        # only cut once per interval so one bad burst doesn't floor the rate
+        now = time.monotonic()
+        if now - self._last_adjustment >= self.adjust_interval:
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_adjustment = now
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            name=self.name,
+            rate=self.rate,
+            burst=self.burst,
+            max_concurrency=self.max_concurrency,
+            in_flight=self._in_flight,
+            queue_depth=self._queue_depth,
+            total_calls=self._total_calls,
+            total_wait_time=self._total_wait_time,
+            max_wait_time=self._max_wait_time,
+            throttled_calls=self._throttled_calls,
+        )
+
+
+class ConcurrencyCap:
+    """At most `max_in_flight` calls at once, for one caller under a bucket shared with others."""
+
+    def __init__(self, max_in_flight: int):
+        if max_in_flight < 1:
+            raise ValueError("Max in flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphore_loop = loop
+
+        async with self._semaphore:
+            yield
+
+
+LIMITERS: dict[str, TokenBucketLimiter] = {}
+
+
+def limiter_name(key: TpsKey, scope: str | None = None) -> str:
+    return key if scope is None else f"{key}:{scope}"
+
+
+def get_limiter(key: TpsKey,
+                tps: float,
+                burst: int | None = None,
+                max_concurrency: int | None = None,
+                scope: str | None = None,
+                adaptive: bool = False,
+                min_tps: float | None = None,
+                max_tps: float | None = None) -> TokenBucketLimiter:
+    """
+    Returns the process-wide limiter for key/scope, creating it on first use.
+    Limiters live for the life of the worker process, so an adaptive rate learned in one
+    activity carries over to the next.
+    """
     if not key:
         raise ValueError("Key must be a non-empty string")
-    
-    min_interval = 1.0 / tps
-
-    if key not in TPS_STATE:
-        TPS_STATE[key] = {
-            'lock': asyncio.Lock(),
-            'last_call_time': 0.0,
-            'min_interval': min_interval,
-        }
-    else:
-        TPS_STATE[key]['min_interval'] = min_interval
+
+    name = limiter_name(key, scope)
+    burst = burst if burst is not None else 1
+
+    limiter = LIMITERS.get(name)
+    candidate = TokenBucketLimiter(name, tps, burst, max_concurrency,
+                                   adaptive=adaptive, min_rate=min_tps, max_rate=max_tps)
+    if limiter is None:
+        LIMITERS[name] = candidate
+        return candidate
+
+    if limiter.config != candidate.config:
+        raise ValueError(
+            f"Rate limiter '{name}' is already configured with different settings. "
+            f"Use a separate scope for an independent bucket.")
+
+    return limiter
+
+
+def rate_limit(key: TpsKey,
+               tps: float,
+               burst: int | None = None,
+               max_concurrency: int | None = None,
+               scope: str | None = None,
+               adaptive: bool = False,
+               min_tps: float | None = None,
+               max_tps: float | None = None,
+               throttle_retries: int = 0,
+               throttle_backoff: float = THROTTLE_BACKOFF,
+               max_in_flight: int | None = None):
+    """
+    Limits the decorated coroutine to `tps` calls per second, allowing bursts of up to `burst` calls
+    and at most `max_concurrency` calls in flight. Decorators with the same key and scope share one bucket.
+    With adaptive, the rate moves between min_tps and max_tps based on throttling errors from the call.
+    `max_in_flight` caps this coroutine alone, so one caller can't take the whole shared bucket.
+
+    A throttled call is retried up to `throttle_retries` times, backing off `throttle_backoff * 2^attempt`
+    seconds without holding its slot. Only use retries on calls that are safe to repeat.
+    """
+    if tps <= 0:
+        raise ValueError("TPS must be positive")
+    if throttle_retries < 0:
+        raise ValueError("Throttle retries can't be negative")
+
+    limiter = get_limiter(key, tps, burst, max_concurrency, scope,
+                          adaptive=adaptive, min_tps=min_tps, max_tps=max_tps)
 
     def decorator(func):
+        cap = ConcurrencyCap(max_in_flight) if max_in_flight is not None else None
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            state = TPS_STATE[key]
-            lock = state['lock']
-
-            async with lock:
-                effective_min_interval = state['min_interval']
-                current_time = time.monotonic()
-                time_since_last_call = current_time - state['last_call_time']
-
-                if time_since_last_call < effective_min_interval:
-                    await asyncio.sleep(effective_min_interval - time_since_last_call)
-                
-                state['last_call_time'] = time.monotonic()
-            
-            return await func(*args, **kwargs)
+            for attempt in range(throttle_retries + 1):
+                # Wait on our own cap first so the shared slot and token aren't held while queued behind it
+                async with cap.hold() if cap is not None else nullcontext(), limiter.acquire():
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as e:
+                        if not is_throttle_error(e):
+                            raise
+                        limiter.record_throttle()
+                        if attempt == throttle_retries:
+                            raise
+                    else:
+                        limiter.record_success()
+                        return result
+
+                delay = throttle_backoff * 2 ** attempt
+                logger.info(f"{func.__name__} throttled on {limiter.name}, retry {attempt + 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def get_rate_limit_stats() -> dict[str, LimiterStats]:
+    return {name: limiter.stats() for name, limiter in LIMITERS.items()}
+
+
+async def log_rate_limit_stats(logger: logging.Logger, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        for stats in get_rate_limit_stats().values():
+            if stats.total_calls == 0 and stats.queue_depth == 0:
+                continue
+            logger.info(
+                f"Rate limiter {stats.name} - rate {stats.rate:.2f}/s - in flight {stats.in_flight} - "
+                f"queued {stats.queue_depth} - calls {stats.total_calls} - throttled {stats.throttled_calls} - "
+                f"avg wait {stats.avg_wait_time:.3f}s - max wait {stats.max_wait_time:.3f}s")
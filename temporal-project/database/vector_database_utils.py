@@ -1,24 +1,25 @@
-from config import QDRANT_URL, GEMINI_API_KEY
+from config import (
+    QDRANT_URL,
+    DOCUMENT_INDEX_CACHE_SIZE,
+    DOCUMENT_INDEX_CACHE_TTL,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_CACHE_MAX_BYTES,
+    EMBEDDING_CACHE_MEMORY_ITEMS
+)
 from database.database_models import VECTORS_FOR_PB_DATA, VectorMetadata
 from async_lru import alru_cache
-from typing import Literal
-from async_lru import alru_cache
 from qdrant_client import models, AsyncQdrantClient
-import google.genai as genai
-from google.genai import types as genai_types
 from dataclasses import dataclass
-from database.tps_utils import rate_limit
-from typing import Any
+from database.embedding_backends import EmbedType, Vector, get_embedding_backend
+from database.cache_utils import PersistentCache, make_cache_key, close_cache_singleton
+from typing import Any, Callable
 
 import asyncio
+import numpy as np
 
 
 # --- Helpful Types ---
-EmbedType = Literal["RETRIEVAL_QUERY",
-                    "RETRIEVAL_DOCUMENT", "CODE_RETRIEVAL_QUERY",
-                    "CLUSTERING"]
-
-
 @dataclass(order=True)
 class DocumentCoordinate:
     segment_index: int
@@ -31,36 +32,104 @@ class DocumentCoordinate:
         return DocumentCoordinate(self.segment_index + 1, 0)
 
 
+# Max searches per query_batch_points call
+MAX_BATCH_SIZE_FOR_SEARCH = 100
+
+# Points fetched per scroll request when loading a range of the document
+COORDINATE_SCROLL_PAGE_SIZE = 256
+
+
+PointId = models.ExtendedPointId
+
+
+@dataclass
+class DocumentCoordinateIndex:
+    """
+    Qdrant point ids for (part of) a document keyed by coordinate, so walks happen in memory.
+    Payloads aren't kept, a walk fetches only the points it visits.
+    """
+    source_pdf: str
+    by_coordinate: dict[tuple[int, int], PointId]
+
+    @staticmethod
+    def from_points(source_pdf: str, points: list[tuple[DocumentCoordinate, PointId]]) -> 'DocumentCoordinateIndex':
+        by_coordinate: dict[tuple[int, int], PointId] = {}
+        for coordinate, point_id in points:
+            by_coordinate.setdefault((coordinate.segment_index, coordinate.chunk_index), point_id)
+        return DocumentCoordinateIndex(source_pdf, by_coordinate)
+
+    def get(self, coordinate: DocumentCoordinate) -> PointId | None:
+        return self.by_coordinate.get((coordinate.segment_index, coordinate.chunk_index))
+
+    def step(self, coordinate: DocumentCoordinate) -> tuple[DocumentCoordinate, PointId] | None:
+        """Next chunk in the same segment, otherwise the first chunk of the next segment."""
+        for next_coord in [coordinate.next_chunk(), coordinate.next_segment()]:
+            point_id = self.get(next_coord)
+            if point_id is not None:
+                return next_coord, point_id
+        return None
+
+
 # --- Helpful Functions ---
 @alru_cache(maxsize=1)
 async def get_qdrant_client() -> AsyncQdrantClient:
     return AsyncQdrantClient(QDRANT_URL)
 
 
-def _sync_embed_batch(text_lst: list[str], embed_type: EmbedType) -> list[genai_types.ContentEmbedding]:
-    client = genai.Client(api_key=GEMINI_API_KEY)
+@alru_cache(maxsize=1)
+async def get_embedding_cache() -> PersistentCache:
+    return PersistentCache("embeddings", EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_BYTES, EMBEDDING_CACHE_MEMORY_ITEMS)
 
-    result = client.models.embed_content(
-        model="models/text-embedding-004",
-        contents=text_lst,  # type: ignore
-        config=genai_types.EmbedContentConfig(task_type=embed_type))
 
-    if result is None or result.embeddings is None:
-        raise Exception("Embedding API returned no embeddings")
-    return result.embeddings
+async def close_embedding_cache():
+    await close_cache_singleton(get_embedding_cache)
 
-@rate_limit("embedding", tps=50)
-async def text_to_vec(text_lst: list[str], embed_type: EmbedType) -> list[genai_types.ContentEmbedding]:
-    embeddings = await asyncio.to_thread(_sync_embed_batch, text_lst, embed_type)
-    return embeddings
 
+def embedding_cache_key(model: str, text: str, embed_type: EmbedType) -> str:
+    return make_cache_key(model, embed_type, text)
+
+
+async def embed_in_batches(text_lst: list[str], embed_type: EmbedType) -> list[Vector]:
+    backend = get_embedding_backend()
+    batches = await asyncio.gather(*[
+        backend.embed(text_lst[idx: idx + backend.max_batch_size], embed_type)
+        for idx in range(0, len(text_lst), backend.max_batch_size)
+    ])
+    return [vec for batch in batches for vec in batch]
 
-async def perform_vector_search_within_document(collection_name: str, query_text: str, source_pdf_id: str, limit=7) -> list[models.ScoredPoint]:
-    embeddings = await text_to_vec([query_text], "RETRIEVAL_QUERY")
-    vec_of_text = embeddings[0].values
 
-    if vec_of_text is None:
-        raise Exception(f"Failed to generate vector - {query_text}")
+async def text_to_vec(text_lst: list[str], embed_type: EmbedType) -> list[Vector]:
+    """Embeds each text with the configured backend, only the ones missing from the embedding cache are computed."""
+    if not EMBEDDING_CACHE_ENABLED:
+        return await embed_in_batches(text_lst, embed_type)
+
+    model = get_embedding_backend().model
+    cache = await get_embedding_cache()
+    keys = [embedding_cache_key(model, text, embed_type) for text in text_lst]
+    cached = await cache.get_many(keys)
+
+    # Identical texts in one batch are only embedded once
+    misses: dict[str, str] = {}
+    for key, text in zip(keys, text_lst):
+        if key not in cached and key not in misses:
+            misses[key] = text
+
+    vectors: dict[str, Vector] = {
+        key: np.frombuffer(value, dtype=np.float32).tolist() for key, value in cached.items()}
+
+    if misses:
+        new_vectors = await embed_in_batches(list(misses.values()), embed_type)
+        new_entries: dict[str, bytes] = {}
+        for key, vec in zip(misses.keys(), new_vectors):
+            vectors[key] = vec
+            new_entries[key] = np.asarray(vec, dtype=np.float32).tobytes()
+        await cache.set_many(new_entries)
+
+    return [vectors[key] for key in keys]
+
+
+async def perform_vector_search_within_document(collection_name: str, query_text: str, source_pdf_id: str, limit=7) -> list[models.ScoredPoint]:
+    vec_of_text = (await text_to_vec([query_text], "RETRIEVAL_QUERY"))[0]
 
     client = await get_qdrant_client()
     matches = await client.search(
@@ -87,12 +156,52 @@ async def perform_vector_search_within_document(collection_name: str, query_text
     return matches
 
 
-async def perform_vector_search(collection_name: str, query_text: str, limit=20) -> list[models.ScoredPoint]:
-    embeddings = await text_to_vec([query_text], "RETRIEVAL_QUERY")
-    vec_of_text = embeddings[0].values
+async def perform_batch_vector_search_within_document(collection_name: str,
+                                                      query_texts: list[str],
+                                                      source_pdf_id: str,
+                                                      limit=7) -> list[list[models.ScoredPoint]]:
+    """Same as perform_vector_search_within_document for many queries, returns one list of matches per query."""
+    vecs = await text_to_vec(query_texts, "RETRIEVAL_QUERY")
+
+    query_filter = models.Filter(
+        must=[
+            models.FieldCondition(
+                key='source_pdf',
+                match=models.MatchValue(value=source_pdf_id)
+            )
+        ]
+    )
+    search_params = models.SearchParams(
+        quantization=models.QuantizationSearchParams(
+            ignore=False,
+            rescore=True,
+            oversampling=2.0
+        )
+    )
+
+    client = await get_qdrant_client()
+    responses = await asyncio.gather(*[
+        client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=vec,
+                    filter=query_filter,
+                    params=search_params,
+                    limit=limit,
+                    with_payload=True
+                )
+                for vec in vecs[idx: idx + MAX_BATCH_SIZE_FOR_SEARCH]
+            ]
+        )
+        for idx in range(0, len(vecs), MAX_BATCH_SIZE_FOR_SEARCH)
+    ])
+
+    return [response.points for batch in responses for response in batch]
 
-    if vec_of_text is None:
-        raise Exception(f"Failed to generate vector - {query_text}")
+
+async def perform_vector_search(collection_name: str, query_text: str, limit=20) -> list[models.ScoredPoint]:
+    vec_of_text = (await text_to_vec([query_text], "RETRIEVAL_QUERY"))[0]
 
     client = await get_qdrant_client()
     matches = await client.search(
@@ -138,70 +247,173 @@ async def check_coordinate(source_pdf_id: str, coordinate: DocumentCoordinate) -
     return metadata
 
 
-async def traverse_document_from_coordinate(source_pdf: str, start: DocumentCoordinate, max_depth=10) -> list[VectorMetadata]:
-    # Check if given coordinate is valid
-    metadata = await check_coordinate(source_pdf, start)
-    if metadata is None:
-        raise Exception(
-            f"Invalid starting coordinate - {source_pdf} - {start}")
+def document_filter(source_pdf_id: str, *conditions: models.FieldCondition) -> models.Filter:
+    return models.Filter(
+        must=[
+            models.FieldCondition(
+                key="source_pdf", match=models.MatchValue(value=source_pdf_id)),
+            *conditions
+        ]
+    )
 
-    current_coordinate = start
-    current_depth = 1
 
-    results = [metadata]
+async def fetch_document_coordinates(source_pdf_id: str,
+                                     start_segment: int,
+                                     end_segment: int) -> list[tuple[DocumentCoordinate, PointId]]:
+    """Coordinate and point id of every chunk with start_segment <= segment_index_in_document <= end_segment."""
+    client = await get_qdrant_client()
+    scroll_filter = document_filter(
+        source_pdf_id,
+        models.FieldCondition(
+            key="segment_index_in_document", range=models.Range(gte=start_segment, lte=end_segment)))
+
+    results: list[tuple[DocumentCoordinate, PointId]] = []
+    offset = None
+    while True:
+        points, offset = await client.scroll(
+            collection_name=VECTORS_FOR_PB_DATA,
+            scroll_filter=scroll_filter,
+            limit=COORDINATE_SCROLL_PAGE_SIZE,
+            offset=offset,
+            with_payload=["segment_index_in_document", "chunk_index_in_segment"],
+            with_vectors=False
+        )
+        for point in points:
+            payload: dict = point.payload  # type: ignore
+            results.append((
+                DocumentCoordinate(payload['segment_index_in_document'], payload['chunk_index_in_segment']),
+                point.id))
+        if offset is None:
+            break
 
-    while current_depth < max_depth:
-        found_next = False
+    return results
 
-        for next_coord in [current_coordinate.next_chunk(), current_coordinate.next_segment()]:
-            metadata_at_next_coord = await check_coordinate(source_pdf, next_coord)
 
-            if metadata_at_next_coord:
-                found_next = True
-                results.append(metadata_at_next_coord)
-                current_coordinate = next_coord
-                current_depth += 1
-                break
+async def count_document_points(source_pdf_id: str) -> int:
+    client = await get_qdrant_client()
+    result = await client.count(
+        collection_name=VECTORS_FOR_PB_DATA,
+        count_filter=document_filter(source_pdf_id),
+        exact=True
+    )
+    return result.count
 
-        if not found_next:
-            break
+
+async def fetch_points(point_ids: list[PointId]) -> list[VectorMetadata]:
+    """Payloads of point_ids in the same order, points that no longer exist are left out."""
+    client = await get_qdrant_client()
+    points = await client.retrieve(
+        collection_name=VECTORS_FOR_PB_DATA,
+        ids=point_ids,
+        with_payload=True,
+        with_vectors=False
+    )
+    payload_by_id = {str(point.id): point.payload for point in points}
+    return [payload_by_id[str(point_id)] for point_id in point_ids if str(point_id) in payload_by_id]  # type: ignore
+
+
+async def load_document_coordinate_index(source_pdf_id: str,
+                                         start_segment: int = 0,
+                                         end_segment: int | None = None) -> DocumentCoordinateIndex:
+    points = await fetch_document_coordinates(
+        source_pdf_id, start_segment, end_segment if end_segment is not None else 2**31 - 1)
+    return DocumentCoordinateIndex.from_points(source_pdf_id, points)
+
+
+@alru_cache(maxsize=max(DOCUMENT_INDEX_CACHE_SIZE, 1), ttl=DOCUMENT_INDEX_CACHE_TTL)
+async def _get_cached_document_coordinate_index(source_pdf_id: str, point_count: int) -> DocumentCoordinateIndex:
+    return await load_document_coordinate_index(source_pdf_id)
+
+
+async def get_document_coordinate_index(source_pdf_id: str,
+                                        start_segment: int,
+                                        end_segment: int) -> DocumentCoordinateIndex:
+    # The whole document is cached so later walks over the same PDF are served from memory. Re-vectorizing
+    # adds points, so keying by the point count lets the API and every worker see it without being told.
+    # Without the cache only the segments the walk can reach are loaded
+    if DOCUMENT_INDEX_CACHE_SIZE > 0:
+        point_count = await count_document_points(source_pdf_id)
+        return await _get_cached_document_coordinate_index(source_pdf_id, point_count)
+    return await load_document_coordinate_index(source_pdf_id, start_segment, end_segment)
+
+
+async def walk_document(source_pdf: str,
+                        start_segment: int,
+                        end_segment: int,
+                        walk: Callable[[DocumentCoordinateIndex], list[PointId]]) -> list[VectorMetadata]:
+    """Runs walk over the coordinate index of start_segment..end_segment and fetches the points it visits."""
+    index = await get_document_coordinate_index(source_pdf, start_segment, end_segment)
+    point_ids = walk(index)
+    results = await fetch_points(point_ids)
+
+    # Points were deleted after the index was cached, walk a fresh one
+    if len(results) != len(point_ids):
+        index = await load_document_coordinate_index(source_pdf, start_segment, end_segment)
+        point_ids = walk(index)
+        results = await fetch_points(point_ids)
 
     return results
 
 
-async def traverse_document_to_coordinate(source_pdf: str, start: DocumentCoordinate, end: DocumentCoordinate, cutoff=100) -> list[VectorMetadata]:
-    # Check if given coordinate is valid
-    metadata = await check_coordinate(source_pdf, start)
-    if metadata is None:
-        raise Exception(
-            f"Invalid starting coordinate - {source_pdf} - {start}")
+async def traverse_document_from_coordinate(source_pdf: str, start: DocumentCoordinate, max_depth=10) -> list[VectorMetadata]:
+    def walk(index: DocumentCoordinateIndex) -> list[PointId]:
+        # Check if given coordinate is valid
+        point_id = index.get(start)
+        if point_id is None:
+            raise Exception(
+                f"Invalid starting coordinate - {source_pdf} - {start}")
+
+        current_coordinate = start
+        current_depth = 1
 
-    current_coordinate = start
-    current_depth = 1
+        results = [point_id]
+
+        while current_depth < max_depth:
+            next_step = index.step(current_coordinate)
+            if next_step is None:
+                break
 
-    results = [metadata]
+            current_coordinate, point_id_at_next_coord = next_step
+            results.append(point_id_at_next_coord)
+            current_depth += 1
 
-    while current_depth < cutoff and current_coordinate != end:
-        found_next = False
+        return results
 
-        for next_coord in [current_coordinate.next_chunk(), current_coordinate.next_segment()]:
-            metadata_at_next_coord = await check_coordinate(source_pdf, next_coord)
+    # Each step moves at most one segment forward
+    return await walk_document(source_pdf, start.segment_index, start.segment_index + max_depth, walk)
 
-            if metadata_at_next_coord:
-                found_next = True
-                results.append(metadata_at_next_coord)
-                current_coordinate = next_coord
-                current_depth += 1
+
+async def traverse_document_to_coordinate(source_pdf: str, start: DocumentCoordinate, end: DocumentCoordinate, cutoff=100) -> list[VectorMetadata]:
+    def walk(index: DocumentCoordinateIndex) -> list[PointId]:
+        # Check if given coordinate is valid
+        point_id = index.get(start)
+        if point_id is None:
+            raise Exception(
+                f"Invalid starting coordinate - {source_pdf} - {start}")
+
+        current_coordinate = start
+        current_depth = 1
+
+        results = [point_id]
+
+        while current_depth < cutoff and current_coordinate != end:
+            next_step = index.step(current_coordinate)
+            if next_step is None:
                 break
 
-        if not found_next:
-            break
+            current_coordinate, point_id_at_next_coord = next_step
+            results.append(point_id_at_next_coord)
+            current_depth += 1
 
-    if current_depth >= cutoff:
-        raise Exception(
-            f"Max depth reached without finding coordinate. Last coordinate - {current_coordinate} ")
+        if current_depth >= cutoff:
+            raise Exception(
+                f"Max depth reached without finding coordinate. Last coordinate - {current_coordinate} ")
 
-    return results
+        return results
+
+    # Load what cutoff steps can reach, not just up to end: an end that doesn't exist
+    # is walked past until cutoff, like the walk over check_coordinate did
+    return await walk_document(source_pdf, start.segment_index, start.segment_index + cutoff, walk)
 
 
 async def get_matching_records(collection_name: str, key_name: str, key_value: Any, limit = 200) -> list[models.Record]:
@@ -7,9 +7,18 @@ import asyncio
 
 from actions.generate_meta_document import get_metadocument_for_query
 from workflows.generate_flashcards import GenerateFlashcardsWorkflow, GenerateFlashcardsParameters
+from page_rendering import PageRenderSettings
+from activity.topic_bounds_activites import TopicWindowSettings
+from topic_segmentation import TopicSegmentationSettings
+from database.pocketbase_client import init_pocketbase_client, close_pocketbase_client
+from database.tps_utils import init_rate_limit_backend, close_rate_limit_backend
+from config import TEMPORAL_TASK_QUEUE
 
 class GenerateFlashcardsRequest(BaseModel):
     generate_flashcards_job_id: str
+    page_render_settings: PageRenderSettings = PageRenderSettings()
+    topic_window_settings: TopicWindowSettings = TopicWindowSettings()
+    topic_segmentation_settings: TopicSegmentationSettings = TopicSegmentationSettings()
 
 class GenerateMetadocumentRequest(BaseModel):
     query: str
@@ -30,6 +39,10 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Connects to Temporal on application startup and stores the client."""
+    await init_pocketbase_client()
+    # Vector search and PocketBase lookups share the fleet-wide budget with the workers
+    await init_rate_limit_backend()
+
     temporal_url = os.getenv("TEMPORAL_SERVER_URL", "localhost:7233")
     max_retries = 10
     retry_delay = 5
@@ -49,6 +62,13 @@ async def startup_event():
                 raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Closes the pooled PocketBase connections and the rate limit backend."""
+    await close_rate_limit_backend()
+    await close_pocketbase_client()
+
+
 def get_temporal_client(request: Request) -> Client:
     """Retrieves the Temporal client from the FastAPI app state via the request."""
     client = getattr(request.app.state, 'temporal_client', None)
@@ -63,14 +83,19 @@ def get_temporal_client(request: Request) -> Client:
 @app.post("/generate-flashcards-job")
 async def trigger_generate_flashcards_endpoint(payload: GenerateFlashcardsRequest, request: Request):
     temporal_client = get_temporal_client(request)
-    job_params = GenerateFlashcardsParameters(job_record_id=payload.generate_flashcards_job_id)
+    job_params = GenerateFlashcardsParameters(
+        job_record_id=payload.generate_flashcards_job_id,
+        page_render_settings=payload.page_render_settings,
+        topic_window_settings=payload.topic_window_settings,
+        topic_segmentation_settings=payload.topic_segmentation_settings
+    )
     workflow_id = f"generate-flashcards-job-{payload.generate_flashcards_job_id}"
 
     await temporal_client.execute_workflow(
         GenerateFlashcardsWorkflow.run,
         job_params,
         id=workflow_id,
-        task_queue="general-work-queue"
+        task_queue=TEMPORAL_TASK_QUEUE
     )
 
     print(f"Successfully triggered workflow '{workflow_id}' for job record '{payload.generate_flashcards_job_id}'")
@@ -2,6 +2,7 @@ import asyncio
 from qdrant_client import models
 
 from database.vector_database_utils import get_qdrant_client
+from database.embedding_backends import get_embedding_backend, close_embedding_backend
 from database.database_models import VECTORS_FOR_PB_DATA
 
 
@@ -13,10 +14,14 @@ async def setup_qdrant():
         if await client.collection_exists(collection_name=VECTORS_FOR_PB_DATA):
             return
 
+        backend = get_embedding_backend()
+        vector_size = await backend.dimension()
+        print(f"Sizing vectors for the {backend.name} embedding backend ({backend.model}) - {vector_size}")
+
         await client.create_collection(
             collection_name=VECTORS_FOR_PB_DATA,
             vectors_config=models.VectorParams(
-                size=768, distance=models.Distance.DOT),
+                size=vector_size, distance=models.Distance.DOT),
             quantization_config=models.BinaryQuantization(
                 binary=models.BinaryQuantizationConfig(
                     always_ram=False,
@@ -44,6 +49,7 @@ async def setup_qdrant():
         raise
     finally:
         await client.close()
+        await close_embedding_backend()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+from config import CHUNK_TARGET_CHARS
+
+import re
+
+
+# --- HELPFUL TYPES ---
+Chunks = list[str]
+
+# Always a single chunk, whatever their length
+SINGLE_CHUNK_TYPES = {"HEADING", "FOOTER", "FIGURE_CAPTION"}
+
+LIST_MARKER = re.compile(r"^\s*([-*•▪◦‣]|\d+[.)]|[a-zA-Z][.)])\s+")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+BLANK_LINES = re.compile(r"\n\s*\n")
+
+
+# --- Helpful Functions ---
+def pack_pieces(pieces: list[str], target_chars: int, separator: str) -> Chunks:
+    """Joins consecutive pieces while the result stays within target_chars, a piece over the target stays on its own."""
+    chunks: Chunks = []
+    current = ""
+    for piece in pieces:
+        if len(current) != 0 and len(current) + len(separator) + len(piece) > target_chars:
+            chunks.append(current)
+            current = ""
+        current = piece if len(current) == 0 else current + separator + piece
+
+    if len(current) != 0:
+        chunks.append(current)
+    return chunks
+
+
+def split_sentences(text: str) -> list[str]:
+    return [sentence.strip() for sentence in SENTENCE_END.split(text) if len(sentence.strip()) != 0]
+
+
+def split_list_items(text: str) -> list[str]:
+    """A line starting with a list marker opens a new item, any other line continues the current one."""
+    items: list[str] = []
+    for line in text.splitlines():
+        if len(line.strip()) == 0:
+            continue
+        if LIST_MARKER.match(line) or len(items) == 0:
+            items.append(line.rstrip())
+        else:
+            items[-1] += "\n" + line.rstrip()
+    return items
+
+
+def chunk_list(text: str, target_chars: int) -> Chunks:
+    # One chunk per item, long items are split on sentences
+    chunks: Chunks = []
+    for item in split_list_items(text):
+        if len(item) <= target_chars:
+            chunks.append(item)
+        else:
+            chunks.extend(pack_pieces(split_sentences(item), target_chars, " "))
+    return chunks
+
+
+def chunk_code(text: str, target_chars: int) -> Chunks:
+    # Blank lines separate blocks, blocks over the target are split on lines, indentation is kept
+    pieces: list[str] = []
+    for block in BLANK_LINES.split(text):
+        block = block.strip("\n")
+        if len(block.strip()) == 0:
+            continue
+        if len(block) <= target_chars:
+            pieces.append(block)
+        else:
+            pieces.extend(pack_pieces([line for line in block.splitlines() if len(line.strip()) != 0], target_chars, "\n"))
+    return pack_pieces(pieces, target_chars, "\n\n")
+
+
+def chunk_locally(segment_type: str, segment_text: str, target_chars: int = CHUNK_TARGET_CHARS) -> Chunks | None:
+    """
+    Chunks segments that don't need the LLM: headings, footers, captions, anything within target_chars,
+    and lists and code, which split on their own structure. Returns None for long prose, that goes to the LLM.
+    """
+    text = segment_text.strip()
+    if len(text) == 0:
+        return []
+
+    if segment_type in SINGLE_CHUNK_TYPES or len(text) <= target_chars:
+        return [text]
+
+    match segment_type:
+        case "LIST_ITEM":
+            return chunk_list(text, target_chars)
+        case "CODE_BLOCK":
+            return chunk_code(segment_text.strip("\n"), target_chars)
+        case _:
+            return None
@@ -0,0 +1,198 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Literal
+from PIL import Image as PILImage
+
+from spool import write_spool
+
+import asyncio
+import io
+import multiprocessing
+import os
+
+import fitz
+
+
+# --- HELPFUL TYPES ---
+ImageFormat = Literal["png", "jpeg", "webp"]
+# (first page, second page), the second page is past the end for the last page of an odd document
+PagePair = tuple[int, int]
+# Spool path of the rendered image, see spool.py
+PagePairFilePath = str
+ProgressCallback = Callable[[int, int], None]
+
+MIME_TYPES: dict[ImageFormat, str] = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+
+@dataclass
+class PageRenderSettings:
+    """How pages are rasterized for segmentation, set per job."""
+    dpi: int = 72
+    grayscale: bool = False
+    image_format: ImageFormat = "png"
+    # Only used by jpeg and webp
+    quality: int = 85
+
+    def __post_init__(self):
+        if not 36 <= self.dpi <= 600:
+            raise ValueError(f"DPI must be between 36 and 600 - {self.dpi}")
+        if self.image_format not in MIME_TYPES:
+            raise ValueError(f"Unsupported image format - {self.image_format}")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"Quality must be between 1 and 100 - {self.quality}")
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.image_format]
+
+
+# --- Helpful Functions ---
+def page_pairs(page_count: int) -> list[PagePair]:
+    return [(page_idx, page_idx + 1) for page_idx in range(0, page_count, 2)]
+
+
+def page_pair_file_name(pair: PagePair) -> str:
+    return f"page_{pair[0]}_{pair[1]}"
+
+
+def page_range_of(pair: PagePair) -> float:
+    return float(f"{pair[0]}.{pair[1]}")
+
+
+def render_page(document: fitz.Document, page_idx: int, settings: PageRenderSettings) -> fitz.Pixmap:
+    page = document.load_page(page_idx)
+    colorspace = fitz.csGRAY if settings.grayscale else fitz.csRGB
+    return page.get_pixmap(dpi=settings.dpi, colorspace=colorspace, alpha=False)  # type: ignore
+
+
+def stack_pixmaps(top: fitz.Pixmap, bottom: fitz.Pixmap) -> fitz.Pixmap:
+    """Copies both pages' samples straight into one pixmap, bottom page under the top one on a white background."""
+    combined = fitz.Pixmap(top.colorspace, fitz.IRect(0, 0, max(top.width, bottom.width), top.height + bottom.height), False)
+    combined.clear_with(255)
+
+    top.set_origin(0, 0)
+    combined.copy(top, top.irect)
+    bottom.set_origin(0, top.height)
+    combined.copy(bottom, bottom.irect)
+
+    return combined
+
+
+def encode_pixmap(pix: fitz.Pixmap, settings: PageRenderSettings) -> bytes:
+    """The one encode per output image."""
+    match settings.image_format:
+        case "png":
+            return pix.tobytes("png")
+        case "jpeg":
+            return pix.tobytes("jpeg", jpg_quality=settings.quality)
+        case "webp":
+            # MuPDF can't write WebP, hand the raw samples to PIL without copying them
+            mode = "L" if pix.n == 1 else "RGB"
+            img = PILImage.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1)
+            buffer = io.BytesIO()
+            img.save(buffer, format="WEBP", quality=settings.quality)
+            return buffer.getvalue()
+
+
+def render_page_pair(document: fitz.Document, pair: PagePair, settings: PageRenderSettings) -> bytes:
+    curr_page_idx, next_page_idx = pair
+    pix = render_page(document, curr_page_idx, settings)
+
+    # When the number of pages is odd the last pair is a single page
+    if next_page_idx < document.page_count:
+        pix = stack_pixmaps(pix, render_page(document, next_page_idx, settings))
+
+    return encode_pixmap(pix, settings)
+
+
+def render_page_pairs(pdf_path: str,
+                      output_dir: str,
+                      pairs: list[PagePair],
+                      settings: PageRenderSettings) -> list[PagePairFilePath]:
+    """Runs in a pool process: opens the PDF itself, renders each pair and writes it to its own file."""
+    file_paths: list[PagePairFilePath] = []
+
+    with fitz.open(pdf_path) as document:
+        for pair in pairs:
+            file_path = write_spool(
+                os.path.join(output_dir, page_pair_file_name(pair)),
+                render_page_pair(document, pair, settings),
+                {"mime_type": settings.mime_type, "page_range": page_range_of(pair), "pages": list(pair)}
+            )
+            file_paths.append(file_path)
+
+    return file_paths
+
+
+def _get_page_count(pdf_path: str) -> int:
+    with fitz.open(pdf_path) as document:
+        return document.page_count
+
+
+# --- Process pool ---
+_RENDER_POOL: ProcessPoolExecutor | None = None
+
+
+def get_render_pool(processes: int) -> ProcessPoolExecutor:
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        # spawn, forking a worker that is running an event loop and client threads isn't safe
+        _RENDER_POOL = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+    return _RENDER_POOL
+
+
+def close_render_pool():
+    global _RENDER_POOL
+    pool = _RENDER_POOL
+    _RENDER_POOL = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def render_pdf_page_pairs(pdf_path: str,
+                                output_dir: str,
+                                settings: PageRenderSettings,
+                                processes: int,
+                                on_progress: ProgressCallback | None = None) -> list[PagePairFilePath]:
+    """
+    Renders every page pair of the PDF into output_dir, spreading contiguous page ranges over a process pool.
+    Returns the file paths in page order. on_progress gets (pairs done, total pairs) as ranges finish.
+    """
+    page_count = await asyncio.to_thread(_get_page_count, pdf_path)
+    pairs = page_pairs(page_count)
+    if not pairs:
+        return []
+
+    # A few ranges per process so a slow range doesn't leave the others idle
+    num_ranges = min(len(pairs), processes * 4)
+    range_size = -(-len(pairs) // num_ranges)
+    ranges = [pairs[idx: idx + range_size] for idx in range(0, len(pairs), range_size)]
+
+    loop = asyncio.get_running_loop()
+    pool = get_render_pool(processes)
+    futures = [
+        loop.run_in_executor(pool, render_page_pairs, pdf_path, output_dir, pair_range, settings)
+        for pair_range in ranges
+    ]
+
+    done = 0
+    try:
+        for finished in asyncio.as_completed(futures):
+            done += len(await finished)
+            if on_progress is not None:
+                on_progress(done, len(pairs))
+    except BrokenProcessPool:
+        # A render process died (e.g. OOM), start a fresh pool for the next attempt
+        close_render_pool()
+        raise
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+    return [os.path.join(output_dir, page_pair_file_name(pair)) for pair in pairs]
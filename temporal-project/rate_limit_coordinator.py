@@ -0,0 +1,68 @@
+from aiohttp import web
+from database.tps_utils import take_token
+
+import logging
+import os
+import time
+
+
+# --- HELPFUL TYPES ---
+# name -> (tokens, last refill)
+BucketState = dict[str, tuple[float, float]]
+
+BUCKETS = web.AppKey("buckets", BucketState)
+
+
+# --- Handlers ---
+async def acquire(request: web.Request) -> web.Response:
+    """Takes a token from the named bucket and tells the worker how long to wait for it."""
+    body = await request.json()
+    name, rate, burst = body["name"], float(body["rate"]), int(body["burst"])
+    if rate <= 0 or burst < 1:
+        return web.json_response({"error": "rate must be positive and burst at least 1"}, status=400)
+
+    buckets: BucketState = request.app[BUCKETS]
+    now = time.monotonic()
+    tokens, last_refill = buckets.get(name, (float(burst), now))
+    tokens, wait = take_token(tokens, last_refill, now, rate, burst)
+    buckets[name] = (tokens, now)
+
+    return web.json_response({"wait": wait})
+
+
+async def refund(request: web.Request) -> web.Response:
+    """Gives back a token from a call that was cancelled while waiting."""
+    body = await request.json()
+    name, burst = body["name"], int(body["burst"])
+
+    buckets: BucketState = request.app[BUCKETS]
+    if name in buckets:
+        tokens, last_refill = buckets[name]
+        buckets[name] = (min(float(burst), tokens + 1), last_refill)
+
+    return web.json_response({})
+
+
+async def stats(request: web.Request) -> web.Response:
+    buckets: BucketState = request.app[BUCKETS]
+    return web.json_response({name: {"tokens": tokens} for name, (tokens, _) in buckets.items()})
+
+
+async def health(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+def create_app() -> web.Application:
+    # Handlers never await between reading and writing a bucket, so the event loop serializes them
+    app = web.Application()
+    app[BUCKETS] = {}
+    app.router.add_post("/acquire", acquire)
+    app.router.add_post("/refund", refund)
+    app.router.add_get("/stats", stats)
+    app.router.add_get("/health", health)
+    return app
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(create_app(), port=int(os.getenv("RATE_LIMIT_COORDINATOR_PORT", "8095")))
@@ -1,12 +1,12 @@
 import concurrent.futures
-import aiohttp
 import asyncio
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 
 from activity.util_activites import (
-    set_job_request_status
+    set_job_request_status,
+    cleanup_job_files
 )
 
 from activity.extract_highlights_activites import (
@@ -30,6 +30,7 @@ from activity.segment_chunking_activites import (
 from activity.topic_bounds_activites import (
     fetch_segment_info_and_save_batch,
     get_topic_bounds_for_batch,
+    get_topic_bounds_by_embedding,
     get_last_segment_index_of_document,
     reduced_topic_bounds_and_save,
 )
@@ -52,6 +53,7 @@ from activity.data_vectorization_activites import (
 from activity.generate_cards_activities import (
     get_all_highlights,
     get_matches_for_highlight,
+    get_matches_for_highlights,
     generate_and_save_flashcards_from_group
 )
 
@@ -61,6 +63,23 @@ from activity.cluster_cards_activites import (
 
 from workflows.generate_flashcards import GenerateFlashcardsWorkflow
 
+from database.pocketbase_client import (
+    init_pocketbase_client,
+    close_pocketbase_client
+)
+
+from database.embedding_backends import close_embedding_backend
+from database.vector_database_utils import close_embedding_cache
+from activity.pdf_segmentation_activites import close_segmentation_cache
+from page_rendering import close_render_pool
+
+from database.tps_utils import (
+    log_rate_limit_stats,
+    init_rate_limit_backend,
+    close_rate_limit_backend
+)
+from config import RATE_LIMIT_STATS_INTERVAL, TEMPORAL_TASK_QUEUE
+
 import logging
 import os
 
@@ -83,14 +102,23 @@ async def main():
                 print(f"Error occurred - {e}")
                 raise
 
-    async with aiohttp.ClientSession() as session:
+    await init_pocketbase_client()
+    await init_rate_limit_backend()
+
+    stats_task = None
+    if RATE_LIMIT_STATS_INTERVAL > 0:
+        stats_task = asyncio.create_task(
+            log_rate_limit_stats(logging.getLogger("rate_limit"), RATE_LIMIT_STATS_INTERVAL))
+
+    try:
         worker = Worker(
             client,
-            task_queue="general-work-queue",
+            task_queue=TEMPORAL_TASK_QUEUE,
             workflows=[GenerateFlashcardsWorkflow],
             activities=[
                 # Utils
                 set_job_request_status,
+                cleanup_job_files,
                 # Highlights
                 check_if_pdf_already_processed,
                 delete_all_old_highlights,
@@ -106,6 +134,7 @@ async def main():
                 # Topic bounds
                 fetch_segment_info_and_save_batch,
                 get_topic_bounds_for_batch,
+                get_topic_bounds_by_embedding,
                 get_last_segment_index_of_document,
                 reduced_topic_bounds_and_save,
                 # Topic summaries
@@ -120,6 +149,7 @@ async def main():
                 # Flashcard generation
                 get_all_highlights,
                 get_matches_for_highlight,
+                get_matches_for_highlights,
                 generate_and_save_flashcards_from_group,
                 # Flashcard Clustering
                 cluster_generated_cards
@@ -127,6 +157,15 @@ async def main():
         )
         print("Starting the worker...")
         await worker.run()
+    finally:
+        if stats_task is not None:
+            stats_task.cancel()
+        await close_rate_limit_backend()
+        await close_embedding_backend()
+        await close_embedding_cache()
+        await close_segmentation_cache()
+        close_render_pool()
+        await close_pocketbase_client()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import json
+import mmap
+import os
+import shutil
+
+
+# --- HELPFUL TYPES ---
+# A spool entry is `<base>.bin` with the raw payload plus a small `<base>.hdr` JSON header next to it
+SpoolPath = str
+SpoolHeader = dict[str, Any]
+
+PAYLOAD_SUFFIX = ".bin"
+HEADER_SUFFIX = ".hdr"
+
+
+# --- Helpful Functions ---
+def job_spool_dir(job_id: str) -> str:
+    return f"/tmp/{job_id}"
+
+
+def spool_path(job_id: str, name: str) -> SpoolPath:
+    return os.path.join(job_spool_dir(job_id), name)
+
+
+def _write_atomic(file_path: str, data: bytes):
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def write_spool(path: SpoolPath, payload: bytes, header: SpoolHeader) -> SpoolPath:
+    """The header is written last, so a readable header means the payload is complete."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _write_atomic(path + PAYLOAD_SUFFIX, payload)
+    _write_atomic(path + HEADER_SUFFIX,
+                  json.dumps({**header, "size": len(payload)}, separators=(",", ":")).encode())
+    return path
+
+
+def read_spool_header(path: SpoolPath) -> SpoolHeader:
+    with open(path + HEADER_SUFFIX, "rb") as f:
+        return json.loads(f.read())
+
+
+@contextmanager
+def open_spool(path: SpoolPath) -> Iterator[tuple[SpoolHeader, memoryview]]:
+    """Maps the payload read-only, the view is only valid inside the with block."""
+    header = read_spool_header(path)
+
+    with open(path + PAYLOAD_SUFFIX, "rb") as f:
+        if header["size"] == 0:
+            yield header, memoryview(b"")
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) != header["size"]:
+                raise ValueError(f"Spool payload is {len(mapped)} bytes, header says {header['size']} - {path}")
+
+            view = memoryview(mapped)
+            try:
+                yield header, view
+            finally:
+                view.release()
+
+
+def remove_spool(path: SpoolPath):
+    for suffix in (PAYLOAD_SUFFIX, HEADER_SUFFIX):
+        file_path = path + suffix
+        if os.path.isfile(file_path):
+            os.remove(file_path)
+
+
+def cleanup_job_spool(job_id: str):
+    """Removes everything the job left in its temp dir."""
+    shutil.rmtree(job_spool_dir(job_id), ignore_errors=True)
@@ -1,9 +1,16 @@
+import re
 import pytest
 from temporalio.testing import ActivityEnvironment
+import activity.segment_chunking_activites as segment_chunking_activites
 from activity.segment_chunking_activites import (
     fetch_segment_ids_and_save_batch,
     fetch_segment_batch_and_chunk,
+    pack_segments,
+    chunk_segment_pack,
 )
+from baml_client import types
+from database.database_utils import BatchItemResult
+from utils import save_json
 from database.database_models import (
     PDF_CHUNKS, JOB_REQUESTS, JobRequestsRecord
 )
@@ -33,4 +40,102 @@ async def test_chunking_activites(run_around_tests):
                 "filter": f"segment='{segment_id}'"
             })
         
-            assert len(records) != 0
\ No newline at end of file
+            assert len(records) != 0
+
+
+def make_segment(idx: int, text: str) -> dict:
+    return {
+        "id": f"seg{idx}",
+        "source_pdf": "pdf",
+        "segment_index_in_document": idx,
+        "segment_type": "TEXT_BLOCK",
+        "segment_text": text
+    }
+
+
+def test_pack_segments_respects_token_budget():
+    # 40 characters ~ 11 tokens each
+    segments = [make_segment(idx, "x" * 40) for idx in range(5)] + [make_segment(5, "y" * 400)]
+    packs = pack_segments(segments, token_budget=25, max_segments=10)  # type: ignore
+
+    assert [[s["id"] for s in pack] for pack in packs] == [["seg0", "seg1"], ["seg2", "seg3"], ["seg4"], ["seg5"]]
+    assert len(pack_segments(segments[:5], token_budget=1000, max_segments=3)) == 2  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_chunk_segment_pack_falls_back_for_segments_the_batch_missed(monkeypatch):
+    single_calls = []
+
+    async def fake_chunk_segments_batch(instructions, demos, input_segments):
+        # Segment 1 is left out and segment 2 comes back empty
+        return [
+            types.SegmentChunks(segment_index=0, chunks=["first"]),
+            types.SegmentChunks(segment_index=2, chunks=[" "]),
+        ]
+
+    async def fake_chunk_segment(instructions, demos, input_segment):
+        single_calls.append(input_segment.segment_text)
+        return [input_segment.segment_text.upper()]
+
+    monkeypatch.setattr(segment_chunking_activites, "chunk_segments_batch", fake_chunk_segments_batch)
+    monkeypatch.setattr(segment_chunking_activites, "chunk_segment", fake_chunk_segment)
+
+    pack = [make_segment(0, "zero"), make_segment(1, "one"), make_segment(2, "two")]
+    chunks = await ActivityEnvironment().run(chunk_segment_pack, pack)
+
+    assert chunks == [["first"], ["ONE"], ["TWO"]]
+    assert sorted(single_calls) == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_chunking_pipeline_saves_local_and_llm_chunks(tmp_path, monkeypatch):
+    segments = {f"seg{idx}": make_segment(idx, f"Sentence {idx}. " * 60) for idx in range(7)}
+    segments["seg3"]["segment_type"] = "HEADING"
+    # Left by an earlier attempt that timed out after saving seg0
+    saved = [{"id": "old0", "segment": "seg0", "chunk_text": "llm chunk"}]
+    deleted = []
+
+    async def fake_get_records_by_ids(collection_name, record_ids, options={}):
+        return [segments[record_id] for record_id in record_ids]
+
+    async def fake_chunk_segments_batch(instructions, demos, input_segments):
+        return [types.SegmentChunks(segment_index=s.segment_index, chunks=["llm chunk"]) for s in input_segments]
+
+    async def fake_save_records(collection_name, records):
+        saved.extend(records)
+        return [BatchItemResult(idx, 200, {"id": str(idx)}) for idx in range(len(records))]
+
+    async def fake_get_all_records(collection_name, options={}):
+        segment_ids = re.findall(r"segment='([^']+)'", options["filter"])
+        return [record for record in saved if record["segment"] in segment_ids]
+
+    async def fake_delete_records(collection_name, record_ids):
+        deleted.extend(record_ids)
+        saved[:] = [record for record in saved if record.get("id") not in record_ids]
+        return [BatchItemResult(idx, 204, None) for idx in range(len(record_ids))]
+
+    monkeypatch.setattr(segment_chunking_activites, "get_records_by_ids", fake_get_records_by_ids)
+    monkeypatch.setattr(segment_chunking_activites, "chunk_segments_batch", fake_chunk_segments_batch)
+    monkeypatch.setattr(segment_chunking_activites, "save_records", fake_save_records)
+    monkeypatch.setattr(segment_chunking_activites, "get_all_records", fake_get_all_records)
+    monkeypatch.setattr(segment_chunking_activites, "delete_records", fake_delete_records)
+    monkeypatch.setattr(segment_chunking_activites, "CHUNKING_WORKERS", 3)
+    monkeypatch.setattr(segment_chunking_activites, "CHUNKING_FETCH_GROUP_SIZE", 2)
+    monkeypatch.setattr(segment_chunking_activites, "CHUNKING_SAVE_BATCH_SIZE", 2)
+    monkeypatch.setattr(segment_chunking_activites, "CHUNKING_BATCH_MAX_SEGMENTS", 2)
+
+    segment_batch_path = str(tmp_path / "segment_0_200.json")
+    save_json(segment_batch_path, list(segments))
+
+    heartbeats = []
+    env = ActivityEnvironment()
+    env.on_heartbeat = lambda *details: heartbeats.append(details)
+    assert await env.run(fetch_segment_batch_and_chunk, segment_batch_path) == list(segments)
+
+    chunks_by_segment = {record["segment"]: record["chunk_text"] for record in saved}
+    # The earlier attempt's chunk was replaced, not duplicated
+    assert deleted == ["old0"]
+    assert len(saved) == 7
+    assert chunks_by_segment["seg3"] == segments["seg3"]["segment_text"].strip()
+    assert all(chunks_by_segment[f"seg{idx}"] == "llm chunk" for idx in (0, 1, 2, 4, 5, 6))
+    assert heartbeats[-1] == ("Chunked 7/7 segments",)
@@ -1,12 +1,16 @@
 import pytest
+from qdrant_client import models
+from temporalio.converter import default as default_converter
 from temporalio.testing import ActivityEnvironment
 from activity.generate_cards_activities import (
     get_all_highlights,
-    get_matches_for_highlight,
+    get_matches_for_highlights,
     transform_matches_into_groups,
     generate_and_save_flashcards_from_group,
-    MetadataWithHighlight
+    HighlightMatch,
+    HIGHLIGHT_SEARCH_BATCH_SIZE
 )
+import activity.generate_cards_activities as generate_cards_activities
 
 from database.database_utils import (
     get_all_records
@@ -31,16 +35,11 @@ async def test_generate_flashcards_activites(run_around_tests):
     highlights = await env.run(get_all_highlights, source_pdf_id)
     assert len(highlights) != 0
 
-    highlight_vector_fetch_handles = []
-    for highlight in highlights:
-        handle = env.run(get_matches_for_highlight, (highlight, source_pdf_id))
-        highlight_vector_fetch_handles.append(handle)
-    
-    all_matches: list[list[MetadataWithHighlight]] = await gather(*highlight_vector_fetch_handles)
+    all_matches: list[list[HighlightMatch]] = await env.run(get_matches_for_highlights, (highlights, source_pdf_id))
 
-    assert len(all_matches) != 0
+    assert len(all_matches) == len(highlights)
 
-    groups = transform_matches_into_groups(all_matches)
+    groups = transform_matches_into_groups(highlights, all_matches)
     assert len(groups) != 0
 
     flashcard_generate_handles = []
@@ -55,3 +54,32 @@ async def test_generate_flashcards_activites(run_around_tests):
     })
     assert len(flashcards) != 0
 
+
+
+@pytest.mark.asyncio
+async def test_a_full_batch_of_matches_fits_in_a_temporal_payload(monkeypatch):
+    # Chunks and summaries as long as they get, none of it should reach the result
+    payload = {
+        "source_pdf": "5u67g97440v3x03",
+        "chunk_id": "c" * 15, "segment_id": "s" * 15, "topic_id": "t" * 15,
+        "segment_index_in_document": 12345, "chunk_index_in_segment": 12, "topic_number": 321,
+        "chunk_text": "x" * 20_000, "summary_text": "y" * 20_000, "segment_type": "TEXT_BLOCK"
+    }
+
+    async def fake_search(collection_name, query_texts, source_pdf_id, limit=7):
+        return [[models.ScoredPoint(id=f"00000000-0000-4000-8000-{idx:012d}", version=1, score=0.87654321, payload=payload)
+                 for idx in range(limit)] for _ in query_texts]
+
+    monkeypatch.setattr(generate_cards_activities, "perform_batch_vector_search_within_document", fake_search)
+
+    highlights = ["h" * 2_000] * HIGHLIGHT_SEARCH_BATCH_SIZE
+    matches = await ActivityEnvironment().run(get_matches_for_highlights, (highlights, "5u67g97440v3x03"))
+
+    assert len(matches) == HIGHLIGHT_SEARCH_BATCH_SIZE and all(len(m) == 4 for m in matches)
+    assert "chunk_text" not in matches[0][0] and "highlight_text" not in matches[0][0]
+
+    size = len(default_converter().payload_converter.to_payloads([matches])[0].data)
+    assert size < 256 * 1024
+
+    groups = transform_matches_into_groups(highlights, matches)
+    assert groups[0][0]["highlight_text"] == highlights[0]
@@ -1,6 +1,7 @@
 import pytest
 import os
 from temporalio.testing import ActivityEnvironment
+import activity.pdf_segmentation_activites as pdf_segmentation_activites
 from activity.pdf_segmentation_activites import (
     fetch_job_record,
     fetch_pdf_and_split_into_image_strs,
@@ -8,6 +9,11 @@ from activity.pdf_segmentation_activites import (
     save_segments_to_db,
 )
 from asyncio.tasks import gather
+from baml_client.async_client import types
+from database.cache_utils import PersistentCache
+from page_rendering import PageRenderSettings
+from spool import write_spool
+from utils import read_json
 from database.database_utils import get_all_records, delete_record
 
 from database.database_models import PDF_SEGMENTS, PdfSegmentsRecord
@@ -22,7 +28,7 @@ async def test_segmentation_activites(run_around_tests):
     assert job_record['id'] == "6q744g5gnpji19l"
     assert job_record['source_pdf'] == "5u67g97440v3x03"
 
-    img_strs_file_paths = await env.run(fetch_pdf_and_split_into_image_strs, job_record)
+    img_strs_file_paths = await env.run(fetch_pdf_and_split_into_image_strs, (job_record, PageRenderSettings()))
     assert len(img_strs_file_paths) == 14
 
     segments_generate_handles = []
@@ -41,7 +47,40 @@ async def test_segmentation_activites(run_around_tests):
     assert records != 0
 
     files = os.listdir(f"/tmp/{job_record['id']}")
-    assert 'page_0_1.json' not in files
-    assert 'page_2_3.json' not in files
+    assert 'page_0_1.bin' not in files
+    assert 'page_2_3.bin' not in files
     assert 'segment_0_1.json' not in files
     assert 'segment_2_3.json' not in files
+
+
+@pytest.mark.asyncio
+async def test_segmentation_cache_skips_llm_for_identical_images(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_segment_page_image(page_image):
+        calls.append(page_image)
+        return [types.Segment(segment_number=1, segment_type=types.SegmentType.TEXT_BLOCK, segment_text="Hello")]
+
+    cache = PersistentCache("segmentation", str(tmp_path / "segmentation.sqlite3"), max_bytes=1024**2)
+    monkeypatch.setattr(pdf_segmentation_activites, "SEGMENTATION_CACHE_ENABLED", True)
+    monkeypatch.setattr(pdf_segmentation_activites, "segment_page_image", fake_segment_page_image)
+    monkeypatch.setattr(pdf_segmentation_activites, "get_segmentation_cache", lambda: _as_awaitable(cache))
+
+    # Same rendered image in two different documents
+    for name, page_range, pages in (("page_0_1", 0.1, [0, 1]), ("page_6_7", 6.7, [6, 7])):
+        write_spool(str(tmp_path / "job" / name), b"same image bytes", {"mime_type": "image/png", "page_range": page_range, "pages": pages})
+
+    env = ActivityEnvironment()
+    first = await env.run(get_segments_given_page_image, str(tmp_path / "job" / "page_0_1"))
+    second = await env.run(get_segments_given_page_image, str(tmp_path / "job" / "page_6_7"))
+    await cache.close()
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.endswith("segment_0_1.json") and second.endswith("segment_6_7.json")
+    assert read_json(first)[0] == read_json(second)[0]
+    assert read_json(second)[1] == 6.7
+
+
+async def _as_awaitable(value):
+    return value
@@ -1,12 +1,21 @@
 import pytest
+import numpy as np
 from temporalio.testing import ActivityEnvironment
+from baml_py.errors import BamlClientHttpError
 from activity.topic_bounds_activites import (
     fetch_segment_info_and_save_batch,
     get_topic_bounds_for_batch,
+    get_topic_bounds_by_embedding,
     get_last_segment_index_of_document,
     reduced_topic_bounds_and_save,
-    TopicBoundary
+    segment_windows,
+    write_segment_store,
+    read_segment_store,
+    TopicBoundary,
+    TopicWindowSettings
 )
+import activity.topic_bounds_activites as topic_bounds_activites
+from topic_segmentation import TopicSegmentationSettings
 from tests.test_setup_cleanup_fixture import (
     run_around_tests
 )
@@ -27,7 +36,7 @@ async def test_topic_bounds_activites(run_around_tests):
     job_record: JobRequestsRecord = await get_record(JOB_REQUESTS, "k2j4q17558q9b7d")
     source_pdf_id = job_record['source_pdf']
 
-    segment_info_batch_file_paths = await env.run(fetch_segment_info_and_save_batch, job_record)
+    _, segment_info_batch_file_paths = await env.run(fetch_segment_info_and_save_batch, (job_record, TopicWindowSettings()))
     assert len(segment_info_batch_file_paths) != 0
 
     all_topic_boundaries_found: list[list[TopicBoundary]] = []
@@ -59,3 +68,62 @@ async def test_topic_bounds_activites(run_around_tests):
     })
 
     assert len(records) != 0
+
+
+def test_segment_windows_slide_and_stop_at_the_end():
+    assert segment_windows(100, TopicWindowSettings(60, 30)) == [(0, 60), (30, 90), (60, 100)]
+    assert segment_windows(40, TopicWindowSettings(60, 30)) == [(0, 40)]
+    assert segment_windows(0, TopicWindowSettings()) == []
+    with pytest.raises(ValueError):
+        TopicWindowSettings(window_size=10, slide_size=20)
+
+
+def test_segment_store_reads_windows_by_position(tmp_path):
+    segments = [(idx + 5, "TEXT_BLOCK", f"Segment {idx}\nwith \"quotes\"") for idx in range(10)]
+    store_path = write_segment_store(str(tmp_path / "topic_segments"), segments)  # type: ignore
+
+    assert read_segment_store(store_path, 3, 6) == segments[3:6]
+    assert read_segment_store(store_path) == segments
+
+
+@pytest.mark.asyncio
+async def test_topic_bounds_by_embedding_returns_segment_indices(tmp_path, monkeypatch):
+    # Two topics of 8 segments, the second opening with a heading
+    directions = np.eye(16)
+    segments = [(idx + 100, "HEADING" if idx == 8 else "TEXT_BLOCK", f"topic {idx // 8}") for idx in range(16)]
+    store_path = write_segment_store(str(tmp_path / "topic_segments"), segments)  # type: ignore
+
+    embedded = []
+
+    async def fake_text_to_vec(text_lst, embed_type):
+        embedded.append((len(text_lst), embed_type))
+        return [list(directions[int(text.split()[-1])] + 0.01 * idx) for idx, text in enumerate(text_lst)]
+
+    monkeypatch.setattr(topic_bounds_activites, "text_to_vec", fake_text_to_vec)
+
+    settings = TopicSegmentationSettings(mode="embedding", block_size=3, min_topic_length=2, max_topic_length=16)
+    bounds = await ActivityEnvironment().run(get_topic_bounds_by_embedding, (store_path, settings))
+
+    assert bounds == [100, 108]
+    # The whole document is embedded in one call
+    assert embedded == [(16, "CLUSTERING")]
+
+
+@pytest.mark.asyncio
+async def test_topic_bounds_fall_back_on_failures_but_not_on_throttling(tmp_path, monkeypatch):
+    segments = [(idx + 40, "TEXT_BLOCK", f"Segment {idx}") for idx in range(6)]
+    store_path = write_segment_store(str(tmp_path / "topic_segments"), segments)  # type: ignore
+    errors = [BamlClientHttpError("GeminiFlash2", "Invalid response", 400)]
+
+    async def failing_identify_topic_bounds(segments_baml):
+        raise errors[0]
+
+    monkeypatch.setattr(topic_bounds_activites, "identify_topic_bounds", failing_identify_topic_bounds)
+
+    # A bad response becomes one topic spanning the window
+    assert await ActivityEnvironment().run(get_topic_bounds_for_batch, (store_path, 0, 6)) == [40, 46]
+
+    # Throttling fails the activity so Temporal retries it later
+    errors[0] = BamlClientHttpError("GeminiFlash2", "429 Too Many Requests", 429)
+    with pytest.raises(BamlClientHttpError):
+        await ActivityEnvironment().run(get_topic_bounds_for_batch, (store_path, 0, 6))
@@ -2,7 +2,8 @@ import pytest
 from temporalio.testing import ActivityEnvironment
 from activity.data_vectorization_activites import (
     fetch_chunk_ids_and_save_batch,
-    process_chunk_batch
+    process_chunk_batch,
+    TopicIntervals
 )
 from database.vector_database_utils import (
     perform_vector_search_within_document,
@@ -45,3 +46,19 @@ async def test_clean_all_vectors_for_source_pdf(run_around_tests):
 
     record_ids = [r.id for r in records]
     await delete_records_by_id(VECTORS_FOR_PB_DATA, record_ids)
+
+
+def test_topic_intervals_map_segments_to_topics():
+    topics = [
+        {"id": "t2", "start_indx": 5, "end_indx": 9},
+        {"id": "t1", "start_indx": 0, "end_indx": 5},
+    ]
+    intervals = TopicIntervals.from_topics(topics)  # type: ignore
+
+    assert intervals.find(0)['id'] == "t1"  # type: ignore
+    assert intervals.find(3)['id'] == "t1"  # type: ignore
+    # Shared boundary goes to the topic starting there
+    assert intervals.find(5)['id'] == "t2"  # type: ignore
+    assert intervals.find(9)['id'] == "t2"  # type: ignore
+    assert intervals.find(10) is None
+    assert intervals.find(-1) is None
@@ -0,0 +1,61 @@
+import pytest
+from async_lru import alru_cache
+
+from database.cache_utils import PersistentCache, make_cache_key, close_cache_singleton
+
+
+@pytest.mark.asyncio
+async def test_values_survive_a_new_cache_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = PersistentCache("test", path, max_bytes=1024**2)
+    await cache.set_many({"a": b"1", "b": b"2"})
+    await cache.close()
+
+    reopened = PersistentCache("test", path, max_bytes=1024**2)
+    assert await reopened.get_many(["a", "b", "c", "a"]) == {"a": b"1", "b": b"2"}
+    stats = reopened.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Every entry is 1 byte of key + 100 bytes of value, so only a few fit
+    cache = PersistentCache("test", str(tmp_path / "cache.sqlite3"), max_bytes=350, memory_items=1)
+    await cache.set_many({"a": b"x" * 100})
+    await cache.set_many({"b": b"x" * 100})
+    await cache.set_many({"c": b"x" * 100})
+
+    # Touch "a" on disk so "b" becomes the oldest
+    await cache.get_many(["a"])
+    await cache.set_many({"d": b"x" * 100})
+
+    assert set(await cache.get_many(["a", "b", "c", "d"])) == {"a", "c", "d"}
+    await cache.close()
+
+
+def test_cache_key_parts_do_not_run_together():
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+    assert make_cache_key("model", "task", "text") == make_cache_key("model", "task", "text")
+
+
+@pytest.mark.asyncio
+async def test_close_cache_singleton_only_closes_an_opened_cache(tmp_path):
+    opened = []
+
+    @alru_cache(maxsize=1)
+    async def get_cache() -> PersistentCache:
+        opened.append(PersistentCache("test", str(tmp_path / "cache.sqlite3"), max_bytes=1024**2))
+        return opened[-1]
+
+    # Never opened, nothing to create just to close it
+    await close_cache_singleton(get_cache)
+    assert opened == []
+
+    cache = await get_cache()
+    await cache.set("a", b"1")
+    await close_cache_singleton(get_cache)
+    assert cache._conn is None
+
+    assert await get_cache() is not cache
+    await close_cache_singleton(get_cache)
@@ -0,0 +1,124 @@
+import re
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import database.database_utils as database_utils
+import database.pocketbase_client as pocketbase_client
+from database.database_utils import get_records_by_ids, save_records, update_records, delete_records
+from database.pocketbase_client import PocketBaseClient, close_pocketbase_client
+
+
+@pytest.mark.asyncio
+async def test_get_records_by_ids_chunks_filters_and_keeps_order(monkeypatch):
+    records = {f"rec{idx}": {"id": f"rec{idx}", "segment_text": f"text {idx}"} for idx in range(7)}
+    filters = []
+
+    async def fake_fetch_page(collection_name, params):
+        filters.append(params["filter"])
+        ids = re.findall(r"id='([^']+)'", params["filter"])
+        # PocketBase returns matches in its own order
+        return {"items": [records[record_id] for record_id in sorted(ids, reverse=True) if record_id in records]}
+
+    monkeypatch.setattr(database_utils, "_fetch_page", fake_fetch_page)
+
+    wanted = ["rec5", "rec0", "rec3", "rec6", "rec1", "rec0"]
+    fetched = await get_records_by_ids("pdf_segments", wanted, options={"filter": "source_pdf='pdf'"}, chunk_size=2)
+
+    assert [record["id"] for record in fetched] == wanted
+    # Duplicates are fetched once, 5 unique ids in chunks of 2
+    assert len(filters) == 3
+    assert filters[0] == "(source_pdf='pdf') && (id='rec5' || id='rec0')"
+
+    with pytest.raises(Exception):
+        await get_records_by_ids("pdf_segments", ["rec1", "missing"])
+
+
+@asynccontextmanager
+async def batch_server(monkeypatch):
+    """A PocketBase /api/batch that rolls back the whole transaction when any request body has `fail`."""
+    stored: dict[str, dict] = {}
+    batches: list[int] = []
+
+    async def auth(request: web.Request) -> web.Response:
+        return web.json_response({"token": "token"})
+
+    async def batch(request: web.Request) -> web.Response:
+        requests = (await request.json())["requests"]
+        batches.append(len(requests))
+
+        failed = {
+            str(idx): {"code": "batch_request_failed", "response": {"status": 400, "message": "bad record"}}
+            for idx, item in enumerate(requests) if (item.get("body") or {}).get("fail")
+        }
+        if len(failed) != 0:
+            return web.json_response(
+                {"status": 400, "message": "Batch transaction failed.", "data": {"requests": failed}}, status=400)
+
+        results = []
+        for item in requests:
+            record_id = item["url"].split("/records")[1].strip("/")
+            match item["method"]:
+                case "POST":
+                    record = {"id": f"rec{len(stored)}", **item["body"]}
+                    stored[record["id"]] = record
+                    results.append({"status": 200, "body": record})
+                case "PATCH":
+                    stored[record_id].update(item["body"])
+                    results.append({"status": 200, "body": stored[record_id]})
+                case "DELETE":
+                    stored.pop(record_id)
+                    results.append({"status": 204, "body": None})
+        return web.json_response(results)
+
+    app = web.Application()
+    app.router.add_post("/api/collections/_superusers/auth-with-password", auth)
+    app.router.add_post("/api/batch", batch)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(pocketbase_client, "_POCKETBASE_CLIENT", PocketBaseClient(str(server.make_url(""))))
+    try:
+        yield stored, batches
+    finally:
+        await close_pocketbase_client()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_functions_split_into_batches(monkeypatch):
+    monkeypatch.setattr(database_utils, "POCKETBASE_BATCH_MAX_REQUESTS", 2)
+    async with batch_server(monkeypatch) as (stored, batches):
+        results = await save_records("pdf_chunks", [{"chunk_text": f"chunk {idx}"} for idx in range(5)])
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert all(result.ok for result in results)
+        assert batches == [2, 2, 1]
+        assert len(stored) == 5
+
+        results = await update_records("pdf_chunks", [("rec0", {"chunk_text": "changed"}), ("rec3", {"chunk_text": "x"})])
+        assert all(result.ok for result in results)
+        assert stored["rec0"]["chunk_text"] == "changed"
+
+        results = await delete_records("pdf_chunks", ["rec1", "rec2", "rec4"])
+        assert all(result.ok for result in results)
+        assert sorted(stored) == ["rec0", "rec3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_item_rolls_back_batch_and_siblings_are_resent(monkeypatch):
+    async with batch_server(monkeypatch) as (stored, batches):
+        records = [{"chunk_text": "a"}, {"chunk_text": "b", "fail": True}, {"chunk_text": "c"}]
+        results = await save_records("pdf_chunks", records)
+
+        # First transaction rolled back, then only the two good records were resent
+        assert batches == [3, 2]
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].status == 400
+        assert [result.body["chunk_text"] for result in (results[0], results[2])] == ["a", "c"]
+        assert sorted(record["chunk_text"] for record in stored.values()) == ["a", "c"]
+
+        # Every item failing isn't retried
+        results = await save_records("pdf_chunks", [{"fail": True}, {"fail": True}])
+        assert batches == [3, 2, 2]
+        assert not any(result.ok for result in results)
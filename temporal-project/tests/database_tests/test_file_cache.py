@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import database.file_cache as file_cache
+from database.file_cache import fetch_file_to_cache, use_cached_file, file_sha256
+from database.pocketbase_client import close_pocketbase_client
+
+
+PDF_BYTES = b"%PDF-1.7 " + os.urandom(300_000)
+
+
+@asynccontextmanager
+async def file_server():
+    hits = []
+
+    async def serve(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        return web.Response(body=PDF_BYTES, content_type="application/pdf")
+
+    app = web.Application()
+    app.router.add_get("/api/files/{collection}/{record}/{name}", serve)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield server, hits
+    finally:
+        await close_pocketbase_client()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_download_streams_to_cache_and_is_reused(tmp_path, monkeypatch):
+    hashed = []
+
+    def counting_sha256(file_path):
+        hashed.append(file_path)
+        return file_sha256(file_path)
+
+    async with file_server() as (server, hits):
+        url = str(server.make_url("/api/files/user_pdfs/rec1/book.pdf"))
+        cache_path = str(tmp_path / "rec1" / "book.pdf")
+
+        cached = await fetch_file_to_cache(url, cache_path)
+        assert cached.size == len(PDF_BYTES)
+        assert cached.sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+        with open(cache_path, "rb") as f:
+            assert f.read() == PDF_BYTES
+
+        # Second activity on the same worker reads the cached copy, trusting the stored hash
+        monkeypatch.setattr(file_cache, "file_sha256", counting_sha256)
+        assert (await fetch_file_to_cache(url, cache_path)).sha256 == cached.sha256
+        assert len(hits) == 1
+        assert hashed == []
+
+        # A corrupted copy has a new mtime, fails verification and is downloaded again
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+        with open(cache_path, "r+b") as f:
+            f.write(b"garbage")
+        os.utime(cache_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        await fetch_file_to_cache(url, cache_path)
+        assert len(hits) == 2
+        assert hashed == [cache_path]
+
+
+@pytest.mark.asyncio
+async def test_download_rejects_wrong_hash_and_evicts_old_files(tmp_path):
+    async with file_server() as (server, _):
+        url = str(server.make_url("/api/files/user_pdfs/rec1/book.pdf"))
+
+        with pytest.raises(Exception):
+            await fetch_file_to_cache(url, str(tmp_path / "rec1" / "book.pdf"), expected_sha256="0" * 64)
+        assert os.listdir(tmp_path / "rec1") == []
+
+        # Room for one file, the older one goes when the second is cached
+        await fetch_file_to_cache(url, str(tmp_path / "rec2" / "book.pdf"), max_bytes=len(PDF_BYTES) + 1000)
+        await fetch_file_to_cache(url, str(tmp_path / "rec3" / "book.pdf"), max_bytes=len(PDF_BYTES) + 1000)
+        assert not (tmp_path / "rec2").exists()
+        assert (tmp_path / "rec3" / "book.pdf").exists()
+
+
+@pytest.mark.asyncio
+async def test_files_in_use_are_not_evicted(tmp_path):
+    async with file_server() as (server, _):
+        url = str(server.make_url("/api/files/user_pdfs/rec1/book.pdf"))
+        room_for_one = len(PDF_BYTES) + 1000
+
+        async with use_cached_file(url, str(tmp_path / "rec1" / "book.pdf"), max_bytes=room_for_one) as pinned:
+            # Over budget, but rec1 is still being read
+            await fetch_file_to_cache(url, str(tmp_path / "rec2" / "book.pdf"), max_bytes=room_for_one)
+            assert os.path.exists(pinned.path)
+
+        # Released, so the next download can evict it
+        await fetch_file_to_cache(url, str(tmp_path / "rec3" / "book.pdf"), max_bytes=room_for_one)
+        assert not (tmp_path / "rec1").exists()
@@ -0,0 +1,162 @@
+import asyncio
+import base64
+import json
+import time
+import pytest
+from contextlib import asynccontextmanager
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import database.pocketbase_client as pocketbase_client
+from database.pocketbase_client import (
+    PocketBaseClient,
+    decode_token_expiry,
+    get_pocketbase_client,
+    init_pocketbase_client,
+    close_pocketbase_client,
+    FALLBACK_TOKEN_LIFETIME
+)
+
+
+def make_token(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@asynccontextmanager
+async def auth_server(tokens: list[str], auth_delay: float = 0.0):
+    """Hands out `tokens` in order, /api/health only accepts the one issued last unless it was revoked."""
+    auth_requests = []
+    state = {"valid": None}
+
+    async def auth(request: web.Request) -> web.Response:
+        auth_requests.append(await request.json())
+        await asyncio.sleep(auth_delay)
+        state["valid"] = tokens[len(auth_requests) - 1]
+        return web.json_response({"token": state["valid"]})
+
+    async def health(request: web.Request) -> web.Response:
+        if request.headers.get("Authorization") != state["valid"]:
+            return web.json_response({"message": "The request requires valid record authorization token."}, status=401)
+        return web.json_response({"code": 200})
+
+    app = web.Application()
+    app.router.add_post("/api/collections/_superusers/auth-with-password", auth)
+    app.router.add_get("/api/health", health)
+    server = TestServer(app)
+    await server.start_server()
+    client = PocketBaseClient(str(server.make_url("")))
+    try:
+        yield client, auth_requests, state
+    finally:
+        await client.close()
+        await server.close()
+
+
+def test_decode_token_expiry():
+    assert decode_token_expiry(make_token({"exp": 1750000000, "type": "auth"})) == 1750000000
+    assert decode_token_expiry("not-a-jwt") is None
+    assert decode_token_expiry(make_token({"type": "auth"})) is None
+
+
+@pytest.mark.asyncio
+async def test_token_expiry_comes_from_jwt_or_fallback():
+    expires_at = time.time() + 3600
+    async with auth_server([make_token({"exp": expires_at}), "opaque-token"]) as (client, _, _):
+        await client.token_manager.refresh()
+        assert client.token_manager._expires_at == expires_at
+
+        # Undecodable tokens still get refreshed after the fallback lifetime
+        before = time.time()
+        assert await client.token_manager.refresh() == "opaque-token"
+        assert before + FALLBACK_TOKEN_LIFETIME <= client.token_manager._expires_at <= time.time() + FALLBACK_TOKEN_LIFETIME
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_auth_request():
+    token = make_token({"exp": time.time() + 3600})
+    async with auth_server([token], auth_delay=0.05) as (client, auth_requests, _):
+        tokens = await asyncio.gather(*[client.token_manager.refresh() for _ in range(20)])
+
+        assert tokens == [token] * 20
+        assert len(auth_requests) == 1
+
+        # A valid cached token needs no request at all
+        assert await client.token_manager.get_token() == token
+        assert len(auth_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_reauthenticates_once_on_401():
+    revoked, fresh = make_token({"exp": time.time() + 3600, "n": 1}), make_token({"exp": time.time() + 3600, "n": 2})
+    async with auth_server([revoked, fresh]) as (client, auth_requests, state):
+        await client.token_manager.get_token()
+        # Revoked server side, the request re-auths once and retries with the fresh token
+        state["valid"] = None
+        status, _ = await client.request("GET", "/api/health")
+
+        assert status == 200
+        assert client.token_manager._token == fresh
+        assert len(auth_requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_pooled_session():
+    peers = set()
+
+    async def echo(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(0.01)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/echo", echo)
+    server = TestServer(app)
+    await server.start_server()
+    client = PocketBaseClient(str(server.make_url("")), pool_size=4, pool_size_per_host=4)
+    try:
+        session = await client.get_session()
+        assert session.connector.limit == 4 and session.connector.limit_per_host == 4
+
+        for _ in range(3):
+            results = await asyncio.gather(*[client.request("GET", "/echo", authorized=False) for _ in range(12)])
+            assert results == [(200, {"ok": True})] * 12
+
+        # Every request went through the same session and its kept-alive sockets
+        assert await client.get_session() is session
+        assert len(peers) <= 4
+    finally:
+        await client.close()
+        await server.close()
+
+    assert session.closed
+    assert client._session is None
+
+
+def test_loop_change_closes_the_old_session():
+    client = PocketBaseClient("http://pocketbase.invalid")
+
+    first = asyncio.run(client.get_session())
+    second = asyncio.run(client.get_session())
+
+    assert first is not second
+    assert first.closed and not second.closed
+    asyncio.run(client.close())
+    assert second.closed
+
+
+@pytest.mark.asyncio
+async def test_init_and_close_the_process_wide_client(monkeypatch):
+    monkeypatch.setattr(pocketbase_client, "_POCKETBASE_CLIENT", None)
+
+    client = await init_pocketbase_client()
+    assert get_pocketbase_client() is client
+    session = client._session
+    assert session is not None and not session.closed
+
+    await close_pocketbase_client()
+    assert session.closed
+    assert pocketbase_client._POCKETBASE_CLIENT is None
+    # Closing twice is a no-op, the next caller gets a fresh client
+    await close_pocketbase_client()
+    assert get_pocketbase_client() is not client
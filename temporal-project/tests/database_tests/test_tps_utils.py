@@ -0,0 +1,274 @@
+import asyncio
+import time
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+from baml_py.errors import BamlClientHttpError
+from google.genai.errors import APIError
+
+from rate_limit_coordinator import create_app
+from database.tps_utils import (
+    TokenBucketLimiter,
+    rate_limit,
+    get_limiter,
+    get_rate_limit_stats,
+    is_throttle_error,
+    set_rate_limit_backend,
+    close_rate_limit_backend,
+    RateLimitBackend,
+    SQLiteRateLimitBackend,
+    CoordinatorRateLimitBackend
+)
+
+
+@pytest.mark.asyncio
+async def test_burst_is_not_throttled():
+    limiter = TokenBucketLimiter("test-burst", rate=5, burst=10)
+
+    async def call():
+        async with limiter.acquire():
+            pass
+
+    start = time.monotonic()
+    await asyncio.gather(*[call() for _ in range(10)])
+    assert time.monotonic() - start < 0.1
+
+    # The next call has to wait for a token to refill
+    start = time.monotonic()
+    await call()
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_caps_in_flight_calls():
+    limiter = TokenBucketLimiter("test-concurrency", rate=1000, burst=1000, max_concurrency=3)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def call():
+        nonlocal in_flight, max_in_flight
+        async with limiter.acquire():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*[call() for _ in range(20)])
+    assert max_in_flight == 3
+    assert limiter.stats().total_calls == 20
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scopes_get_independent_buckets():
+    @rate_limit("baml", 100, burst=1, scope="test-fast")
+    async def fast():
+        return "fast"
+
+    @rate_limit("baml", 1, burst=1, scope="test-slow")
+    async def slow():
+        return "slow"
+
+    assert await fast() == "fast"
+    assert await slow() == "slow"
+
+    stats = get_rate_limit_stats()
+    assert stats["baml:test-fast"].rate == 100
+    assert stats["baml:test-slow"].rate == 1
+
+
+@pytest.mark.asyncio
+async def test_functions_on_one_client_share_its_bucket_under_their_own_caps():
+    in_flight = {"page": 0, "chunk": 0}
+    peaks = {"page": 0, "chunk": 0}
+
+    def call(kind):
+        async def func():
+            in_flight[kind] += 1
+            peaks[kind] = max(peaks[kind], in_flight[kind])
+            await asyncio.sleep(0.02)
+            in_flight[kind] -= 1
+        return func
+
+    shared = dict(burst=100, max_concurrency=6, scope="test-client")
+    page = rate_limit("embedding", 100, **shared)(call("page"))
+    chunk = rate_limit("embedding", 100, max_in_flight=2, **shared)(call("chunk"))
+
+    await asyncio.gather(*[page() for _ in range(10)], *[chunk() for _ in range(10)])
+
+    stats = get_rate_limit_stats()["embedding:test-client"]
+    assert stats.total_calls == 20
+    assert peaks["chunk"] == 2
+    assert peaks["page"] <= 6
+
+
+def test_conflicting_config_for_same_bucket_raises():
+    get_limiter("pocketbase", 10, burst=5, scope="test-conflict")
+    assert get_limiter("pocketbase", 10, burst=5, scope="test-conflict") is not None
+
+    with pytest.raises(ValueError):
+        get_limiter("pocketbase", 20, burst=5, scope="test-conflict")
+
+
+def test_throttle_errors_are_recognised():
+    class FakeApiError(Exception):
+        def __init__(self, code):
+            super().__init__("boom")
+            self.code = code
+
+    assert is_throttle_error(FakeApiError(429))
+    assert is_throttle_error(APIError(400, {"error": {"status": "RESOURCE_EXHAUSTED", "message": "quota exceeded"}}))
+    assert is_throttle_error(BamlClientHttpError("GeminiFlash2", "Request failed with status 503 UNAVAILABLE", 2))
+    assert is_throttle_error(asyncio.TimeoutError())
+    assert not is_throttle_error(FakeApiError(400))
+    assert not is_throttle_error(ValueError("bad input"))
+
+    # Only BAML http errors are read, and only whole status codes count
+    assert not is_throttle_error(Exception("503 UNAVAILABLE"))
+    assert not is_throttle_error(ValueError("Missing record rec4291503x - rate limit field invalid"))
+    assert not is_throttle_error(BamlClientHttpError("GeminiFlash2", "Invalid segment id 15031", 400))
+
+
+def test_adaptive_rate_backs_off_and_recovers():
+    limiter = TokenBucketLimiter("test-aimd", rate=10, burst=10, adaptive=True,
+                                 min_rate=2, max_rate=12, adjust_interval=0)
+
+    limiter.record_throttle()
+    assert limiter.rate == 5
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.rate == 2
+
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.rate == 12
+    assert limiter.stats().throttled_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_rate_is_shared_by_the_decorated_function():
+    attempts = 0
+
+    @rate_limit("embedding", 10, burst=10, scope="test-adaptive", adaptive=True)
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise BamlClientHttpError("GeminiFlash2", "429 Too Many Requests", 429)
+        return "ok"
+
+    with pytest.raises(Exception):
+        await flaky()
+    assert await flaky() == "ok"
+
+    # A later lookup of the same bucket sees the rate it learned
+    limiter = get_limiter("embedding", 10, burst=10, scope="test-adaptive", adaptive=True)
+    assert limiter.rate == 5
+
+
+@pytest.mark.asyncio
+async def test_throttled_calls_are_retried_after_the_rate_is_cut():
+    attempts = []
+
+    @rate_limit("embedding", 10, burst=10, scope="test-retry", adaptive=True,
+                throttle_retries=2, throttle_backoff=0.01)
+    async def throttled_twice(fail_times: int, error: Exception):
+        attempts.append(error)
+        if len(attempts) <= fail_times:
+            raise error
+        return "ok"
+
+    throttle = BamlClientHttpError("GeminiFlash2", "429 Too Many Requests", 429)
+    assert await throttled_twice(2, throttle) == "ok"
+    assert len(attempts) == 3
+    limiter = get_limiter("embedding", 10, burst=10, scope="test-retry", adaptive=True)
+    assert limiter.rate == 5
+    assert limiter.stats().throttled_calls == 2
+
+    # Out of retries, the throttle surfaces to the caller
+    attempts.clear()
+    with pytest.raises(BamlClientHttpError):
+        await throttled_twice(3, throttle)
+    assert len(attempts) == 3
+
+    # Anything else fails straight away
+    attempts.clear()
+    with pytest.raises(ValueError):
+        await throttled_twice(1, ValueError("bad input"))
+    assert len(attempts) == 1
+
+
+async def _timed_calls(limiters: list[TokenBucketLimiter], calls_each: int) -> float:
+    async def call(limiter):
+        async with limiter.acquire():
+            pass
+
+    start = time.monotonic()
+    await asyncio.gather(*[call(limiter) for limiter in limiters for _ in range(calls_each)])
+    return time.monotonic() - start
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_shares_budget_between_workers(tmp_path):
+    # Two limiters with the same name stand in for the same bucket in two worker processes
+    workers = [TokenBucketLimiter("test-shared", rate=10, burst=4) for _ in range(2)]
+    backend = SQLiteRateLimitBackend(str(tmp_path / "buckets.sqlite3"), max_workers=2)
+    set_rate_limit_backend(backend)
+    try:
+        # 4 burst tokens across both workers, the other 2 calls wait ~0.1s each
+        assert await _timed_calls(workers, 3) >= 0.15
+        # One connection per backend thread, not one per reservation
+        assert 1 <= len(backend._connections) <= 2
+    finally:
+        await close_rate_limit_backend()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backend_shares_budget_between_workers():
+    server = TestServer(create_app())
+    await server.start_server()
+
+    workers = [TokenBucketLimiter("test-coordinated", rate=10, burst=4) for _ in range(2)]
+    set_rate_limit_backend(CoordinatorRateLimitBackend(str(server.make_url(""))))
+    try:
+        assert await _timed_calls(workers, 3) >= 0.15
+
+        # docker-compose's healthcheck
+        async with aiohttp.ClientSession() as session, session.get(server.make_url("/health")) as response:
+            assert response.status == 200
+    finally:
+        await close_rate_limit_backend()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_backend_falls_back_to_local_bucket():
+    limiter = TokenBucketLimiter("test-fallback", rate=10, burst=4)
+    backend = CoordinatorRateLimitBackend("http://127.0.0.1:9", request_timeout=1, cooldown=60)
+    set_rate_limit_backend(backend)
+    posts = 0
+    post = backend._post
+
+    async def counting_post(path, payload):
+        nonlocal posts
+        posts += 1
+        return await post(path, payload)
+
+    backend._post = counting_post  # type: ignore
+    try:
+        assert await _timed_calls([limiter], 4) < 1
+        # The failure opens the breaker, later calls go straight to the local bucket
+        assert not backend.available()
+        posts_while_up = posts
+        await _timed_calls([limiter], 4)
+        assert posts == posts_while_up
+    finally:
+        await close_rate_limit_backend()
+
+
+def test_backends_must_implement_reserve():
+    class IncompleteBackend(RateLimitBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()  # type: ignore
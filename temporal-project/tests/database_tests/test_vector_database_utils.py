@@ -0,0 +1,145 @@
+import pytest
+
+import database.vector_database_utils as vector_database_utils
+from database.vector_database_utils import (
+    DocumentCoordinate,
+    DocumentCoordinateIndex,
+    get_document_coordinate_index,
+    traverse_document_from_coordinate,
+    traverse_document_to_coordinate,
+    text_to_vec
+)
+from database.embedding_backends import EmbeddingBackend, LocalEmbeddingBackend, set_embedding_backend
+
+
+class FakeEmbeddingBackend(EmbeddingBackend):
+    name = "fake"
+    model = "fake-model"
+    max_batch_size = 2
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def embed(self, text_lst, embed_type):
+        self.calls.append(text_lst)
+        return [[float(len(text))] for text in text_lst]
+
+    async def dimension(self) -> int:
+        return 1
+
+
+def make_points(coords: list[tuple[int, int]]) -> list[tuple[DocumentCoordinate, str]]:
+    return [(DocumentCoordinate(*coord), f"{coord[0]},{coord[1]}") for coord in coords]
+
+
+def test_coordinate_index_steps_like_the_document_walk():
+    # Segment 1 is missing chunk 1, so the walk jumps to segment 2 after (1, 0) just like check_coordinate did
+    coords = [(2, 0), (0, 0), (0, 1), (1, 0), (1, 2), (4, 0)]
+    index = DocumentCoordinateIndex.from_points("pdf", make_points(coords))
+
+    walk = []
+    current = DocumentCoordinate(0, 0)
+    while (next_step := index.step(current)) is not None:
+        current, point_id = next_step
+        walk.append(point_id)
+
+    assert walk == ["0,1", "1,0", "2,0"]
+    assert index.get(DocumentCoordinate(1, 2)) is not None
+    assert index.get(DocumentCoordinate(3, 0)) is None
+
+
+class FakeDocument:
+    """Stands in for the document's points in Qdrant."""
+
+    def __init__(self, monkeypatch, coords: list[tuple[int, int]]):
+        self.points = dict((point_id, coordinate) for coordinate, point_id in make_points(coords))
+        self.loads: list[tuple[int, int | None]] = []
+        monkeypatch.setattr(vector_database_utils, "load_document_coordinate_index", self.load)
+        monkeypatch.setattr(vector_database_utils, "count_document_points", self.count)
+        monkeypatch.setattr(vector_database_utils, "fetch_points", self.fetch)
+
+    async def load(self, source_pdf_id, start_segment=0, end_segment=None):
+        self.loads.append((start_segment, end_segment))
+        in_range = [(coordinate, point_id) for point_id, coordinate in self.points.items()
+                    if start_segment <= coordinate.segment_index <= (end_segment if end_segment is not None else 2**31)]
+        return DocumentCoordinateIndex.from_points(source_pdf_id, in_range)
+
+    async def count(self, source_pdf_id):
+        return len(self.points)
+
+    async def fetch(self, point_ids):
+        return [{"chunk_id": point_id} for point_id in point_ids if point_id in self.points]
+
+
+@pytest.mark.asyncio
+async def test_document_index_cache_is_keyed_by_point_count(monkeypatch):
+    document = FakeDocument(monkeypatch, [(0, 0), (1, 0)])
+
+    first = await get_document_coordinate_index("pdf-cache-test", 0, 10)
+    assert await get_document_coordinate_index("pdf-cache-test", 0, 10) is first
+    assert len(document.loads) == 1
+
+    # Re-vectorizing adds points, every process sees the new count and reloads
+    document.points["2,0"] = DocumentCoordinate(2, 0)
+    assert await get_document_coordinate_index("pdf-cache-test", 0, 10) is not first
+    assert len(document.loads) == 2
+
+
+@pytest.mark.asyncio
+async def test_walk_to_a_missing_end_runs_to_the_cutoff(monkeypatch):
+    monkeypatch.setattr(vector_database_utils, "DOCUMENT_INDEX_CACHE_SIZE", 0)
+    document = FakeDocument(monkeypatch, [(segment, 0) for segment in range(20)])
+
+    walk = await traverse_document_to_coordinate("pdf", DocumentCoordinate(2, 0), DocumentCoordinate(5, 0), cutoff=8)
+    assert [metadata["chunk_id"] for metadata in walk] == ["2,0", "3,0", "4,0", "5,0"]
+
+    # (5, 3) doesn't exist, so the walk carries on past segment 5 like it did without the index
+    with pytest.raises(Exception, match="Max depth"):
+        await traverse_document_to_coordinate("pdf", DocumentCoordinate(2, 0), DocumentCoordinate(5, 3), cutoff=8)
+    assert document.loads[-1] == (2, 10)
+
+
+@pytest.mark.asyncio
+async def test_walk_reloads_the_index_when_cached_points_are_gone(monkeypatch):
+    document = FakeDocument(monkeypatch, [(0, 0), (0, 1), (1, 0), (2, 0)])
+    await get_document_coordinate_index("pdf-deleted-test", 0, 10)
+
+    # Same count, different points, the cached index still points at (0, 1)
+    del document.points["0,1"]
+    document.points["3,0"] = DocumentCoordinate(3, 0)
+
+    walk = await traverse_document_from_coordinate("pdf-deleted-test", DocumentCoordinate(0, 0), max_depth=3)
+    assert [metadata["chunk_id"] for metadata in walk] == ["0,0", "1,0", "2,0"]
+    assert len(document.loads) == 2
+
+
+def test_embedding_backends_must_implement_embed_and_dimension():
+    class IncompleteBackend(EmbeddingBackend):
+        async def embed(self, text_lst, embed_type):
+            return []
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()  # type: ignore
+
+
+def test_local_backend_pool_spawns_its_processes():
+    executor = LocalEmbeddingBackend(processes=2)._get_executor()
+    try:
+        # Workers start on first submit, so this doesn't load a model
+        assert executor._mp_context.get_start_method() == "spawn"  # type: ignore
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_text_to_vec_splits_calls_by_backend_batch_size(monkeypatch):
+    monkeypatch.setattr(vector_database_utils, "EMBEDDING_CACHE_ENABLED", False)
+    backend = FakeEmbeddingBackend()
+    set_embedding_backend(backend)
+    try:
+        vectors = await text_to_vec(["a", "bb", "ccc", "dddd", "eeeee"], "CLUSTERING")
+    finally:
+        set_embedding_backend(None)
+
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert [len(call) for call in backend.calls] == [2, 2, 1]
@@ -4,7 +4,8 @@ from temporalio.worker import Worker
 from temporalio.testing import WorkflowEnvironment
 
 from activity.util_activites import (
-    set_job_request_status
+    set_job_request_status,
+    cleanup_job_files
 )
 
 from activity.extract_highlights_activites import (
@@ -27,6 +28,7 @@ from activity.segment_chunking_activites import (
 from activity.topic_bounds_activites import (
     fetch_segment_info_and_save_batch,
     get_topic_bounds_for_batch,
+    get_topic_bounds_by_embedding,
     get_last_segment_index_of_document,
     reduced_topic_bounds_and_save,
 )
@@ -49,6 +51,7 @@ from activity.data_vectorization_activites import (
 from activity.generate_cards_activities import (
     get_all_highlights,
     get_matches_for_highlight,
+    get_matches_for_highlights,
     generate_and_save_flashcards_from_group
 )
 
@@ -72,6 +75,7 @@ async def test_generate_flashcards_workflow():
             activities=[
                 # Utils
                 set_job_request_status,
+                cleanup_job_files,
                 # Highlights
                 check_if_pdf_already_processed,
                 delete_all_old_highlights,
@@ -87,6 +91,7 @@ async def test_generate_flashcards_workflow():
                 # Topic bounds
                 fetch_segment_info_and_save_batch,
                 get_topic_bounds_for_batch,
+                get_topic_bounds_by_embedding,
                 get_last_segment_index_of_document,
                 reduced_topic_bounds_and_save,
                 # Topic summaries
@@ -101,6 +106,7 @@ async def test_generate_flashcards_workflow():
                 # Flashcard generation
                 get_all_highlights,
                 get_matches_for_highlight,
+                get_matches_for_highlights,
                 generate_and_save_flashcards_from_group,
                 # Flashcard clustering
                 cluster_generated_cards
@@ -0,0 +1,38 @@
+from local_chunker import chunk_locally
+
+
+def test_short_and_structural_segments_are_single_chunks():
+    assert chunk_locally("HEADING", "  Chapter 3. Functions  ", target_chars=10) == ["Chapter 3. Functions"]
+    assert chunk_locally("TEXT_BLOCK", "A short paragraph.", target_chars=100) == ["A short paragraph."]
+    assert chunk_locally("FOOTER", "") == []
+
+
+def test_long_prose_goes_to_the_llm():
+    prose = "The first principle is encapsulation. " * 20
+    assert chunk_locally("TEXT_BLOCK", prose, target_chars=100) is None
+    assert chunk_locally("TABLE", prose, target_chars=100) is None
+
+
+def test_lists_split_per_item_and_long_items_on_sentences():
+    text = (
+        "- Atoms are the basic data type\n"
+        "  and can be nested\n"
+        "- Lists are ordered collections of atoms. They can hold mixed types. Each element keeps its own type.\n"
+        "2) Dictionaries map keys to values"
+    )
+    chunks = chunk_locally("LIST_ITEM", text, target_chars=60)
+
+    assert chunks == [
+        "- Atoms are the basic data type\n  and can be nested",
+        "- Lists are ordered collections of atoms.",
+        "They can hold mixed types. Each element keeps its own type.",
+        "2) Dictionaries map keys to values",
+    ]
+
+
+def test_code_splits_on_blank_lines_then_lines():
+    text = "q)a:1\nq)b:2\n\nq)\\d .bar\nq.bar)`. `a\nq.bar)`. [`a]\nq.bar)f:{x+y}"
+    chunks = chunk_locally("CODE_BLOCK", text, target_chars=30)
+
+    assert chunks == ["q)a:1\nq)b:2", "q)\\d .bar\nq.bar)`. `a", "q.bar)`. [`a]\nq.bar)f:{x+y}"]
+    assert "\n".join(chunks).replace("\n", "") == text.replace("\n", "")
@@ -0,0 +1,76 @@
+import io
+import fitz
+import pytest
+from PIL import Image as PILImage
+
+from page_rendering import (
+    PageRenderSettings,
+    render_pdf_page_pairs,
+    render_page_pair,
+    close_render_pool
+)
+from spool import open_spool
+
+
+def make_pdf(path: str, page_count: int):
+    document = fitz.open()
+    for page_idx in range(page_count):
+        page = document.new_page(width=200, height=100)
+        page.insert_text((20, 50), f"Page {page_idx}")
+    document.save(path)
+    document.close()
+
+
+@pytest.mark.asyncio
+async def test_render_pdf_page_pairs_in_process_pool(tmp_path):
+    pdf_path = str(tmp_path / "source.pdf")
+    make_pdf(pdf_path, 5)
+    settings = PageRenderSettings(dpi=144, grayscale=True, image_format="jpeg", quality=70)
+
+    progress = []
+    try:
+        file_paths = await render_pdf_page_pairs(
+            pdf_path, str(tmp_path), settings, processes=2, on_progress=lambda done, total: progress.append((done, total)))
+    finally:
+        close_render_pool()
+
+    assert [path.split("/")[-1] for path in file_paths] == ["page_0_1", "page_2_3", "page_4_5"]
+    assert progress[-1] == (3, 3)
+
+    with open_spool(file_paths[0]) as (header, image_bytes):
+        image = PILImage.open(io.BytesIO(image_bytes))
+        image.load()
+    assert (header["page_range"], header["mime_type"], header["pages"]) == (0.1, "image/jpeg", [0, 1])
+    # Two pages stacked, rendered at twice the default 72 DPI
+    assert image.size == (400, 400)
+    assert image.mode == "L"
+
+    with open_spool(file_paths[-1]) as (header, image_bytes):
+        assert PILImage.open(io.BytesIO(image_bytes)).size == (400, 200)
+    assert header["page_range"] == 4.5
+
+
+def test_render_settings_are_validated():
+    with pytest.raises(ValueError):
+        PageRenderSettings(dpi=2000)
+    with pytest.raises(ValueError):
+        PageRenderSettings(image_format="gif")  # type: ignore
+
+
+@pytest.mark.parametrize("image_format", ["png", "jpeg", "webp"])
+def test_page_pairs_are_stacked_into_one_image(image_format):
+    document = fitz.open()
+    for width in (200, 150):
+        page = document.new_page(width=width, height=100)
+        page.draw_rect(page.rect, color=(0, 0, 0), fill=(0, 0, 0))
+
+    image_bytes = render_page_pair(document, (0, 1), PageRenderSettings(image_format=image_format))
+    image = PILImage.open(io.BytesIO(image_bytes))
+    assert image.format == image_format.upper()
+
+    image = image.convert("L")
+    assert image.size == (200, 200)
+    # Both pages are black, the area right of the narrower bottom page is left white
+    assert image.getpixel((10, 10)) < 50
+    assert image.getpixel((10, 150)) < 50
+    assert image.getpixel((190, 150)) > 200
@@ -0,0 +1,44 @@
+import pytest
+
+import spool
+from spool import (
+    write_spool,
+    read_spool_header,
+    open_spool,
+    remove_spool,
+    cleanup_job_spool
+)
+
+
+def test_spool_round_trip(tmp_path):
+    path = write_spool(str(tmp_path / "page_0_1"), b"\x89PNG raw bytes", {"mime_type": "image/png", "pages": [0, 1]})
+
+    assert read_spool_header(path) == {"mime_type": "image/png", "pages": [0, 1], "size": 14}
+    with open_spool(path) as (header, payload):
+        assert header["mime_type"] == "image/png"
+        assert bytes(payload) == b"\x89PNG raw bytes"
+
+    remove_spool(path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_open_spool_rejects_truncated_payload(tmp_path):
+    path = write_spool(str(tmp_path / "page_0_1"), b"0123456789", {})
+    with open(path + spool.PAYLOAD_SUFFIX, "wb") as f:
+        f.write(b"01234")
+
+    with pytest.raises(ValueError):
+        with open_spool(path):
+            pass
+
+
+def test_cleanup_job_spool_removes_job_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(spool, "job_spool_dir", lambda job_id: str(tmp_path / job_id))
+    write_spool(spool.spool_path("job1", "page_0_1"), b"data", {})
+    write_spool(spool.spool_path("job2", "page_0_1"), b"data", {})
+
+    cleanup_job_spool("job1")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["job2"]
+    # Cleaning up twice (e.g. an activity retry) is fine
+    cleanup_job_spool("job1")
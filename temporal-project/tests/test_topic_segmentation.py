@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from topic_segmentation import TopicSegmentationSettings, gap_similarities, texttiling_boundaries
+
+
+def topic_vectors(lengths: list[int], seed: int = 0) -> np.ndarray:
+    """Segments scattered around one random direction per topic."""
+    rng = np.random.default_rng(seed)
+    vectors = []
+    for length in lengths:
+        centre = rng.normal(size=32)
+        vectors.extend(centre + 0.3 * rng.normal(size=32) for _ in range(length))
+    return np.array(vectors)
+
+
+def test_boundaries_fall_where_topics_change():
+    vectors = topic_vectors([10, 8, 12])
+    settings = TopicSegmentationSettings(mode="embedding", block_size=4, min_topic_length=3, max_topic_length=20)
+
+    assert texttiling_boundaries(vectors, ["TEXT_BLOCK"] * 30, settings) == [10, 18]
+    assert gap_similarities(vectors, 4).argmin() in (9, 17)
+
+
+def test_headings_pull_boundaries_and_lengths_are_enforced():
+    vectors = topic_vectors([30])
+    types = ["TEXT_BLOCK"] * 30
+    types[12] = "HEADING"
+
+    settings = TopicSegmentationSettings(mode="embedding", block_size=4, min_topic_length=5, max_topic_length=30)
+    assert texttiling_boundaries(vectors, types, settings) == [12]
+
+    # One long topic, split until every piece is within the limits
+    settings = TopicSegmentationSettings(mode="embedding", block_size=4, min_topic_length=4, max_topic_length=8)
+    bounds = [0] + texttiling_boundaries(vectors, ["TEXT_BLOCK"] * 30, settings) + [30]
+    lengths = np.diff(bounds)
+    assert lengths.min() >= 4 and lengths.max() <= 8
+
+
+def test_tiny_documents_and_bad_settings():
+    settings = TopicSegmentationSettings(mode="embedding")
+    assert texttiling_boundaries(topic_vectors([1]), ["TEXT_BLOCK"], settings) == []
+
+    with pytest.raises(ValueError):
+        TopicSegmentationSettings(mode="clustering")  # type: ignore
+    with pytest.raises(ValueError):
+        TopicSegmentationSettings(min_topic_length=10, max_topic_length=5)
+    # 10 can't be split into two topics of at least 6
+    with pytest.raises(ValueError):
+        TopicSegmentationSettings(min_topic_length=6, max_topic_length=10)
+
+
+def test_every_topic_fits_the_limits_at_the_tightest_settings():
+    vectors = topic_vectors([47])
+    settings = TopicSegmentationSettings(mode="embedding", block_size=4, min_topic_length=5, max_topic_length=10)
+
+    bounds = [0] + texttiling_boundaries(vectors, ["TEXT_BLOCK"] * 47, settings) + [47]
+    lengths = np.diff(bounds)
+    assert lengths.min() >= 5 and lengths.max() <= 10
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# --- HELPFUL TYPES ---
+TopicSegmentationMode = Literal["llm", "embedding"]
+# Position in the document's segment list where a new topic starts
+BoundaryPosition = int
+
+
+@dataclass
+class TopicSegmentationSettings:
+    """
+    How topic bounds are found, set per job. "llm" asks IdentifyMultipleTopicBoundaries over sliding windows,
+    "embedding" runs TextTiling over segment embeddings locally, with no LLM calls.
+    """
+    mode: TopicSegmentationMode = "llm"
+    # Segments averaged on each side of a gap when comparing them
+    block_size: int = 6
+    # Topic length limits in segments, only used by "embedding". max must be at least 2 * min
+    min_topic_length: int = 3
+    max_topic_length: int = 40
+    # Added to the depth score of the gap before a HEADING segment
+    heading_boost: float = 1.0
+    # Shallower dips are noise within one topic, whatever TextTiling's cutoff says
+    min_depth: float = 0.1
+
+    def __post_init__(self):
+        if self.mode not in ("llm", "embedding"):
+            raise ValueError(f"Unknown topic segmentation mode - {self.mode}")
+        if self.block_size < 1:
+            raise ValueError(f"Block size must be at least 1 - {self.block_size}")
+        # A topic over max has to split into two halves of at least min each
+        if not 1 <= self.min_topic_length or self.max_topic_length < 2 * self.min_topic_length:
+            raise ValueError(
+                f"Topic length limits must satisfy 1 <= min and 2 * min <= max - "
+                f"{self.min_topic_length}, {self.max_topic_length}")
+
+
+# --- Helpful Functions ---
+def gap_similarities(vectors: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    Cosine similarity between the mean of the block_size segments before each gap and the block_size after it.
+    Gap i sits between segment i and i + 1, so there are n - 1 of them.
+    """
+    n = len(vectors)
+    cumulative = np.vstack([np.zeros((1, vectors.shape[1])), np.cumsum(vectors, axis=0)])
+
+    gaps = np.arange(1, n)
+    left = cumulative[gaps] - cumulative[np.maximum(gaps - block_size, 0)]
+    right = cumulative[np.minimum(gaps + block_size, n)] - cumulative[gaps]
+
+    norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+    return np.einsum("ij,ij->i", left, right) / np.maximum(norms, 1e-12)
+
+
+def depth_scores(similarities: np.ndarray, block_size: int) -> np.ndarray:
+    """How far each gap dips below the highest similarity within block_size gaps on either side."""
+    padded = np.pad(similarities, block_size, mode="edge")
+    windows = sliding_window_view(padded, block_size + 1)
+    left_peaks = windows[:len(similarities)].max(axis=1)
+    right_peaks = windows[block_size:].max(axis=1)
+    return (left_peaks - similarities) + (right_peaks - similarities)
+
+
+def local_minima(similarities: np.ndarray) -> np.ndarray:
+    """Gaps whose similarity is no higher than either neighbour."""
+    padded = np.pad(similarities, 1, constant_values=np.inf)
+    return np.flatnonzero((similarities <= padded[:-2]) & (similarities <= padded[2:]))
+
+
+def place_boundaries(depths: np.ndarray,
+                     candidates: list[int],
+                     segment_count: int,
+                     min_topic_length: int,
+                     max_topic_length: int) -> list[BoundaryPosition]:
+    """
+    Takes candidate gaps deepest first while every topic stays at least min_topic_length long,
+    then splits any topic over max_topic_length at its deepest allowed gap.
+    """
+    # Gap i starts a topic at segment i + 1
+    boundaries = [0, segment_count]
+    for gap in sorted(candidates, key=lambda g: -depths[g]):
+        position = gap + 1
+        if all(abs(position - b) >= min_topic_length for b in boundaries):
+            boundaries.append(position)
+    boundaries.sort()
+
+    idx = 0
+    while idx < len(boundaries) - 1:
+        start, end = boundaries[idx], boundaries[idx + 1]
+        if end - start <= max_topic_length:
+            idx += 1
+            continue
+
+        # Deepest gap that leaves both halves at least min_topic_length long
+        first, last = start + min_topic_length, end - min_topic_length
+        if first > last:
+            idx += 1
+            continue
+        position = first + int(np.argmax(depths[first - 1: last]))
+        boundaries.insert(idx + 1, position)
+
+    return boundaries[1:-1]
+
+
+def texttiling_boundaries(vectors: np.ndarray,
+                          segment_types: list[str],
+                          settings: TopicSegmentationSettings) -> list[BoundaryPosition]:
+    """
+    TextTiling over segment embeddings: a topic starts at the deepest dips in similarity between neighbouring blocks.
+    Returns the positions of the segments that start a new topic, the first topic's start (0) is left out.
+    """
+    segment_count = len(vectors)
+    if segment_count < 2:
+        return []
+
+    vectors = np.asarray(vectors, dtype=np.float64)
+    similarities = gap_similarities(vectors, settings.block_size)
+    depths = depth_scores(similarities, settings.block_size)
+
+    # TextTiling's cutoff, a boundary dips deeper than the mean minus half a standard deviation
+    cutoff = max(depths.mean() - depths.std() / 2, settings.min_depth)
+
+    # Headings are strong hints that a topic starts right there
+    is_heading_after_gap = np.array([segment_type == "HEADING" for segment_type in segment_types[1:]])
+    depths = depths + settings.heading_boost * is_heading_after_gap
+
+    candidates = sorted(
+        set(int(gap) for gap in local_minima(similarities) if depths[gap] > cutoff)
+        | set(int(gap) for gap in np.flatnonzero(is_heading_after_gap) if depths[gap] > cutoff))
+
+    return place_boundaries(
+        depths, candidates, segment_count, settings.min_topic_length, settings.max_topic_length)
@@ -5,7 +5,7 @@ import os
 
 def save_json(file_path: str, data_item):
     with open(file_path, "w") as f:
-        json.dump(data_item, f, indent=2)
+        json.dump(data_item, f, separators=(",", ":"))
 
 def read_json(file_path: str) -> Any:
     with open(file_path, "r") as f:
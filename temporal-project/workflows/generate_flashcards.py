@@ -1,8 +1,9 @@
 from datetime import timedelta
 from temporalio import workflow
 from temporalio.common import RetryPolicy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from asyncio.tasks import gather
+import asyncio
 from functools import reduce
 
 
@@ -29,9 +30,11 @@ with workflow.unsafe.imports_passed_through():
     from activity.topic_bounds_activites import (
         fetch_segment_info_and_save_batch,
         get_topic_bounds_for_batch,
+        get_topic_bounds_by_embedding,
         get_last_segment_index_of_document,
         reduced_topic_bounds_and_save,
-        TopicBoundary
+        TopicBoundary,
+        TopicWindowSettings
     )
 
     from activity.topic_summaries_activites import (
@@ -51,8 +54,9 @@ with workflow.unsafe.imports_passed_through():
 
     from activity.generate_cards_activities import (
         get_all_highlights,
-        get_matches_for_highlight,
+        get_matches_for_highlights,
         transform_matches_into_groups,
+        HIGHLIGHT_SEARCH_BATCH_SIZE,
         generate_and_save_flashcards_from_group
     )
 
@@ -61,15 +65,28 @@ with workflow.unsafe.imports_passed_through():
     )
 
     from activity.util_activites import (
-        set_job_request_status
+        set_job_request_status,
+        cleanup_job_files
     )
 
+    from page_rendering import PageRenderSettings
+    from topic_segmentation import TopicSegmentationSettings
+
 
 @dataclass
 class GenerateFlashcardsParameters:
     job_record_id: str
+    page_render_settings: PageRenderSettings = field(default_factory=PageRenderSettings)
+    # Chunking activities (one per segment batch) allowed to run at the same time
+    max_concurrent_chunk_batches: int = 4
+    # Larger windows with less overlap mean fewer topic bound calls on big documents
+    topic_window_settings: TopicWindowSettings = field(default_factory=TopicWindowSettings)
+    # "embedding" finds topic bounds locally from segment embeddings instead of LLM calls per window
+    topic_segmentation_settings: TopicSegmentationSettings = field(default_factory=TopicSegmentationSettings)
 
 
+# Histories started on an older TEMPORAL_TASK_QUEUE replay on that queue's workers only.
+# Small changes to the command sequence go behind workflow.patched, incompatible ones bump the queue.
 @workflow.defn
 class GenerateFlashcardsWorkflow:
     @workflow.run
@@ -149,18 +166,18 @@ class GenerateFlashcardsWorkflow:
 
             highlight_vector_fetch_handles = []
 
-            for highlight in highlights:
+            for idx in range(0, len(highlights), HIGHLIGHT_SEARCH_BATCH_SIZE):
                 handle = workflow.start_activity(
-                    get_matches_for_highlight,
-                    (highlight, processed_pdf_id),
+                    get_matches_for_highlights,
+                    (highlights[idx: idx + HIGHLIGHT_SEARCH_BATCH_SIZE], processed_pdf_id),
                     schedule_to_close_timeout=long_timeout,
                     retry_policy=few_shot
                 )
                 highlight_vector_fetch_handles.append(handle)
 
-            all_matches = await gather(*highlight_vector_fetch_handles)
+            all_matches = [matches for batch in await gather(*highlight_vector_fetch_handles) for matches in batch]
 
-            groups = transform_matches_into_groups(all_matches)
+            groups = transform_matches_into_groups(highlights, all_matches)
 
             flashcard_generate_handles = []
             for selected_group in groups:
@@ -226,7 +243,7 @@ class GenerateFlashcardsWorkflow:
 
         image_str_file_paths = await workflow.start_activity(
             fetch_pdf_and_split_into_image_strs,
-            job_record,
+            (job_record, job_parameters.page_render_settings),
             start_to_close_timeout=long_timeout,
             retry_policy=few_shot
         )
@@ -269,14 +286,20 @@ class GenerateFlashcardsWorkflow:
             retry_policy=few_shot
         )
 
-        for segment_batch_path in segment_batch_file_paths:
-            # Fetch the ids for that batch and process in one go
-            _ = await workflow.start_activity(
-                fetch_segment_batch_and_chunk,
-                segment_batch_path,
-                start_to_close_timeout=long_timeout,
-                retry_policy=few_shot
-            )
+        chunk_batch_slots = asyncio.Semaphore(max(job_parameters.max_concurrent_chunk_batches, 1))
+
+        async def chunk_batch(segment_batch_path: str):
+            async with chunk_batch_slots:
+                # Heartbeats after every pack, an activity that stops reporting is retried
+                await workflow.start_activity(
+                    fetch_segment_batch_and_chunk,
+                    segment_batch_path,
+                    start_to_close_timeout=long_timeout,
+                    heartbeat_timeout=timedelta(minutes=5),
+                    retry_policy=few_shot
+                )
+
+        await gather(*[chunk_batch(segment_batch_path) for segment_batch_path in segment_batch_file_paths])
 
         await workflow.start_activity(
             set_job_request_status,
@@ -290,30 +313,40 @@ class GenerateFlashcardsWorkflow:
         workflow.logger.info(
             f"Topic bounds started - {job_parameters.job_record_id}")
 
-        segment_info_batch_file_paths = await workflow.start_activity(
+        segment_store_path, segment_windows = await workflow.start_activity(
             fetch_segment_info_and_save_batch,
-            job_record,
+            (job_record, job_parameters.topic_window_settings),
             start_to_close_timeout=long_timeout,
             retry_policy=few_shot
         )
 
         topic_boundaries_found: list[list[TopicBoundary]] = []
 
-        for idx in range(0, len(segment_info_batch_file_paths), 10):
-            current_mini_batch = segment_info_batch_file_paths[idx: idx + 10]
-
-            topic_bounds_fetch_handles = []
-            for segment_info_batch_path in current_mini_batch:
-                handle = workflow.start_activity(
-                    get_topic_bounds_for_batch,
-                    segment_info_batch_path,
-                    start_to_close_timeout=long_timeout,
-                    retry_policy=few_shot
-                )
-                topic_bounds_fetch_handles.append(handle)
-            
-            current_topic_bounds_found: list[list[TopicBoundary]] = await gather(*topic_bounds_fetch_handles)
-            topic_boundaries_found.extend(current_topic_bounds_found)
+        if job_parameters.topic_segmentation_settings.mode == "embedding":
+            # The whole document is segmented in one pass over the store
+            embedding_topic_bounds: list[TopicBoundary] = await workflow.start_activity(
+                get_topic_bounds_by_embedding,
+                (segment_store_path, job_parameters.topic_segmentation_settings),
+                start_to_close_timeout=long_timeout,
+                retry_policy=few_shot
+            )
+            topic_boundaries_found.append(embedding_topic_bounds)
+        else:
+            for idx in range(0, len(segment_windows), 10):
+                current_mini_batch = segment_windows[idx: idx + 10]
+
+                topic_bounds_fetch_handles = []
+                for segment_window in current_mini_batch:
+                    handle = workflow.start_activity(
+                        get_topic_bounds_for_batch,
+                        segment_window,
+                        start_to_close_timeout=long_timeout,
+                        retry_policy=few_shot
+                    )
+                    topic_bounds_fetch_handles.append(handle)
+
+                current_topic_bounds_found: list[list[TopicBoundary]] = await gather(*topic_bounds_fetch_handles)
+                topic_boundaries_found.extend(current_topic_bounds_found)
 
         last_segment_index = await workflow.start_activity(
             get_last_segment_index_of_document,
@@ -439,6 +472,14 @@ class GenerateFlashcardsWorkflow:
             retry_policy=few_shot
         )
 
+        # Nothing after vectorization reads the job's temp files
+        await workflow.start_activity(
+            cleanup_job_files,
+            job_record['id'],
+            start_to_close_timeout=short_timeout,
+            retry_policy=few_shot
+        )
+
         workflow.logger.info(
             f"Vectorization ends - {job_parameters.job_record_id}")
         workflow.logger.info(
@@ -463,18 +504,18 @@ class GenerateFlashcardsWorkflow:
         
 
         highlight_vector_fetch_handles = []
-        for highlight in highlights:
+        for idx in range(0, len(highlights), HIGHLIGHT_SEARCH_BATCH_SIZE):
             handle = workflow.start_activity(
-                get_matches_for_highlight,
-                (highlight, job_record['source_pdf']),
+                get_matches_for_highlights,
+                (highlights[idx: idx + HIGHLIGHT_SEARCH_BATCH_SIZE], job_record['source_pdf']),
                 schedule_to_close_timeout=long_timeout,
                 retry_policy=few_shot
             )
             highlight_vector_fetch_handles.append(handle)
 
-        all_matches = await gather(*highlight_vector_fetch_handles)
+        all_matches = [matches for batch in await gather(*highlight_vector_fetch_handles) for matches in batch]
 
-        groups = transform_matches_into_groups(all_matches)
+        groups = transform_matches_into_groups(highlights, all_matches)
 
         flashcard_generate_handles = []
         for selected_group in groups: